@@ -0,0 +1,105 @@
+import os
+import re
+import shutil
+import threading
+import time
+
+
+class BrowserProfiles:
+    """持久化浏览器用户数据目录（HTTP 缓存、Service Worker、Cookie）的管理。
+
+    每个 key（站点域名或自定义名称）对应 root 下一个子目录；同一目录同一时刻只允许一个浏览器使用，
+    已被占用时 acquire 返回 None，调用方退回一次性 context。
+    目录总大小超过 max_bytes 时，按最近使用时间淘汰未被占用的目录。
+    """
+
+    MARKER_FILE = ".last_used"
+    _in_use = set()
+    _lock = threading.Lock()
+
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+
+    @staticmethod
+    def safe_key(key):
+        text = re.sub(r"[^a-z0-9._-]+", "_", str(key or "").strip().lower()).strip("._")
+        return text[:80] or "default"
+
+    def acquire(self, key):
+        name = self.safe_key(key)
+        path = os.path.join(self.root, name)
+        with self._lock:
+            if path in self._in_use:
+                return None
+            self._in_use.add(path)
+        try:
+            os.makedirs(path, exist_ok=True)
+        except OSError:
+            self.release(path)
+            return None
+        self._touch(path)
+        return path
+
+    def release(self, path):
+        self._touch(path)
+        with self._lock:
+            self._in_use.discard(path)
+
+    def _touch(self, path):
+        try:
+            with open(os.path.join(path, self.MARKER_FILE), "w", encoding="utf-8") as f:
+                f.write(str(time.time()))
+        except OSError:
+            pass
+
+    @classmethod
+    def _last_used(cls, path):
+        try:
+            return os.path.getmtime(os.path.join(path, cls.MARKER_FILE))
+        except OSError:
+            try:
+                return os.path.getmtime(path)
+            except OSError:
+                return 0.0
+
+    @staticmethod
+    def _dir_size(path):
+        total = 0
+        for current, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(current, name))
+                except OSError:
+                    continue
+        return total
+
+    def evict(self):
+        """返回 (淘汰的目录名列表, 淘汰后的总字节数)。"""
+        try:
+            names = [name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name))]
+        except OSError:
+            return [], 0
+        entries = []
+        for name in names:
+            path = os.path.join(self.root, name)
+            entries.append([self._last_used(path), self._dir_size(path), path, name])
+        total = sum(entry[1] for entry in entries)
+        evicted = []
+        for _, size, path, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            with self._lock:
+                if path in self._in_use:
+                    continue
+                # 删除期间占位，避免同时被 acquire
+                self._in_use.add(path)
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                with self._lock:
+                    self._in_use.discard(path)
+            if not os.path.exists(path):
+                total -= size
+                evicted.append(name)
+        return evicted, total
@@ -0,0 +1,278 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlparse
+
+import m3u8
+import requests
+
+from ProxyPool import ProxyPool
+
+
+class CandidateTriage:
+    """下载前的候选分拣：并发取回所有候选播放列表，抽样下载分片，按真实质量与健康度排序。
+
+    每个候选：
+    - 取回播放列表并解析分片数、总时长、码率（主播放列表取码率最高的子播放列表）与加密方式
+    - 抽样下载首、中、尾三个分片（各读取至多 SAMPLE_BYTES），加密时同时取回密钥
+    - 播放列表取不到、解析失败、没有分片或抽样全部失败的候选判为失效并丢弃
+    - 分片路径（忽略查询参数）完全相同的候选视为同一视频流，只保留排名最高的一个
+    - 分片文件名与时长序列一致、且抽样内容相同的候选互为镜像（不同 CDN 节点），供下载器分流与失败切换
+    排序依次比较：抽样成功率、时长（按分钟取整，正片优先于广告/预告）、码率、原始顺序。
+    """
+
+    PLAYLIST_TIMEOUT = (4, 8)
+    SAMPLE_TIMEOUT = (4, 8)
+    SAMPLE_BYTES = 512 * 1024
+    MAX_WORKERS = 8
+
+    def __init__(self, proxy_config=None, session_hints=None, stop_checker=None):
+        self.proxies = self._build_proxies(ProxyPool.resolve_config(proxy_config))
+        self.session_hints = session_hints if isinstance(session_hints, dict) else {}
+        self.stop_checker = stop_checker if callable(stop_checker) else None
+
+    @staticmethod
+    def _build_proxies(proxy_config):
+        # proxy_config 为 _build_proxy_config 的结果
+        if not isinstance(proxy_config, dict) or not proxy_config.get("enabled"):
+            return {}
+        auth = ""
+        username = str(proxy_config.get("username", "") or "")
+        password = str(proxy_config.get("password", "") or "")
+        if username or password:
+            auth = f"{quote(username)}:{quote(password)}@"
+        proxy_url = f"http://{auth}{proxy_config['address']}:{proxy_config['port']}"
+        return {"http": proxy_url, "https": proxy_url}
+
+    def _stop_requested(self):
+        if self.stop_checker is None:
+            return False
+        try:
+            return bool(self.stop_checker())
+        except Exception:
+            return False
+
+    def referer_for(self, url):
+        referer_map = self.session_hints.get("referer_map", {})
+        if isinstance(referer_map, dict) and referer_map.get(url):
+            return referer_map[url]
+        return self.session_hints.get("final_url", "") or self.session_hints.get("source_url", "") or url
+
+    def _session(self):
+        session = requests.Session()
+        session.trust_env = False
+        if self.proxies:
+            session.proxies.update(self.proxies)
+        for cookie in self.session_hints.get("cookies", []):
+            try:
+                session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                )
+            except (KeyError, TypeError):
+                continue
+        return session
+
+    def _headers(self, referer):
+        headers = {"accept": "*/*", "accept-language": "zh-CN,zh;q=0.9,en;q=0.8", "referer": referer}
+        if self.session_hints.get("user_agent"):
+            headers["user-agent"] = self.session_hints["user_agent"]
+        parsed = urlparse(referer)
+        if parsed.scheme and parsed.netloc:
+            headers["origin"] = f"{parsed.scheme}://{parsed.netloc}"
+        return headers
+
+    def _load_playlist(self, session, url, referer):
+        response = session.get(url, headers=self._headers(referer), timeout=self.PLAYLIST_TIMEOUT)
+        response.raise_for_status()
+        try:
+            return m3u8.loads(response.text, uri=url)
+        except TypeError:
+            return m3u8.loads(response.text)
+
+    def _sample(self, session, url, referer):
+        """读取分片开头至多 SAMPLE_BYTES，返回 (是否成功, 字节数, 耗时秒, 前 SAMPLE_BYTES 字节的 sha1)。"""
+        started_at = time.perf_counter()
+        received = 0
+        digest = hashlib.sha1()
+        try:
+            with session.get(url, headers=self._headers(referer), timeout=self.SAMPLE_TIMEOUT, stream=True) as response:
+                if response.status_code not in (200, 206):
+                    return False, 0, time.perf_counter() - started_at, ""
+                content_type = str(response.headers.get("content-type", "")).lower()
+                for chunk in response.iter_content(64 * 1024):
+                    if received == 0 and ("text/html" in content_type or chunk.lstrip()[:1] == b"<"):
+                        # 错误页或防盗链页面
+                        return False, 0, time.perf_counter() - started_at, ""
+                    digest.update(chunk[: max(0, self.SAMPLE_BYTES - received)])
+                    received += len(chunk)
+                    if received >= self.SAMPLE_BYTES or self._stop_requested():
+                        break
+        except Exception:
+            return False, 0, time.perf_counter() - started_at, ""
+        return received > 0, received, time.perf_counter() - started_at, digest.hexdigest()
+
+    @staticmethod
+    def _new_report(url, index):
+        return {
+            "url": url,
+            "index": index,
+            "playlist_url": url,
+            "alive": False,
+            "reason": "",
+            "segments": 0,
+            "duration": 0.0,
+            "bandwidth": 0,
+            "resolution": "",
+            "encryption": "NONE",
+            "samples": 0,
+            "samples_ok": 0,
+            "sample_kbps": 0.0,
+            "fingerprint": "",
+            "layout": "",
+            "sample_digests": {},
+            "mirrors": [],
+        }
+
+    def probe(self, url, index=0):
+        """分拣单个候选，返回报告（dict）。"""
+        report = self._new_report(url, index)
+        if self._stop_requested():
+            report["reason"] = "interrupted"
+            return report
+        referer = self.referer_for(url)
+        session = self._session()
+        try:
+            try:
+                playlist = self._load_playlist(session, url, referer)
+                if len(playlist.segments) == 0 and len(playlist.playlists) > 0:
+                    variant = max(
+                        playlist.playlists,
+                        key=lambda item: int(getattr(item.stream_info, "bandwidth", 0) or 0),
+                    )
+                    variant_url = getattr(variant, "absolute_uri", "") or variant.uri
+                    report["playlist_url"] = variant_url
+                    report["bandwidth"] = int(getattr(variant.stream_info, "bandwidth", 0) or 0)
+                    resolution = getattr(variant.stream_info, "resolution", None)
+                    if resolution:
+                        report["resolution"] = f"{resolution[0]}x{resolution[1]}"
+                    playlist = self._load_playlist(session, variant_url, referer)
+            except Exception as exc:
+                report["reason"] = f"playlist: {exc}"
+                return report
+            segments = playlist.segments
+            if len(segments) == 0:
+                report["reason"] = "empty playlist"
+                return report
+
+            report["segments"] = len(segments)
+            report["duration"] = round(sum(float(segment.duration or 0) for segment in segments), 3)
+            paths = "\n".join(urlparse(segment.absolute_uri).path for segment in segments)
+            report["fingerprint"] = hashlib.sha1(paths.encode("utf-8")).hexdigest()
+            # 镜像比对用：只看分片文件名与时长，不同 CDN 的路径前缀可以不同
+            layout = "\n".join(
+                f"{urlparse(segment.absolute_uri).path.rsplit('/', 1)[-1]}:{float(segment.duration or 0):.3f}"
+                for segment in segments
+            )
+            report["layout"] = hashlib.sha1(layout.encode("utf-8")).hexdigest()
+
+            sample_urls = []
+            keys = [key for key in playlist.keys if key is not None and key.method and key.method != "NONE"]
+            if keys:
+                report["encryption"] = keys[0].method
+                if keys[0].absolute_uri:
+                    sample_urls.append(keys[0].absolute_uri)
+            sample_positions = [None] * len(sample_urls)
+            for position in sorted({0, len(segments) // 2, len(segments) - 1}):
+                sample_urls.append(segments[position].absolute_uri)
+                sample_positions.append(position)
+
+            segment_bytes = 0
+            segment_seconds = 0.0
+            for sample_url, position in zip(sample_urls, sample_positions):
+                if self._stop_requested():
+                    break
+                ok, received, elapsed, digest = self._sample(session, sample_url, referer)
+                report["samples"] += 1
+                if ok:
+                    report["samples_ok"] += 1
+                    if position is not None:
+                        segment_bytes += received
+                        segment_seconds += elapsed
+                        report["sample_digests"][position] = digest
+            if segment_seconds > 0:
+                report["sample_kbps"] = round(segment_bytes * 8 / 1000 / segment_seconds, 1)
+            if report["samples"] > 0 and report["samples_ok"] == 0 and not self._stop_requested():
+                report["reason"] = "all samples failed"
+                return report
+            report["alive"] = True
+            return report
+        finally:
+            session.close()
+
+    @staticmethod
+    def rank_key(report):
+        health = report["samples_ok"] / report["samples"] if report["samples"] else 0.0
+        return (
+            -health,
+            -int(report["duration"] // 60),
+            -report["bandwidth"],
+            report["index"],
+        )
+
+    @staticmethod
+    def is_mirror(report, other):
+        """两个候选的分片序列一致，且共同抽样成功的分片内容相同（至少一个）。"""
+        if report["layout"] == "" or report["layout"] != other["layout"]:
+            return False
+        common = set(report["sample_digests"]) & set(other["sample_digests"])
+        if len(common) == 0:
+            return False
+        return all(report["sample_digests"][position] == other["sample_digests"][position] for position in common)
+
+    def triage(self, urls):
+        """返回 (排序后的报告列表, 被丢弃的报告列表)；丢弃原因写在 reason 中。"""
+        urls = list(urls)
+        if len(urls) == 0:
+            return [], []
+        reports = [None] * len(urls)
+        lock = threading.Lock()
+
+        def run(index, url):
+            try:
+                report = self.probe(url, index)
+            except Exception as exc:
+                report = self._new_report(url, index)
+                report["reason"] = f"probe: {exc}"
+            with lock:
+                reports[index] = report
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(urls))) as executor:
+            for index, url in enumerate(urls):
+                executor.submit(run, index, url)
+
+        alive = sorted((report for report in reports if report["alive"]), key=self.rank_key)
+        dropped = [report for report in reports if not report["alive"]]
+        ranked = []
+        seen = {}
+        for report in alive:
+            duplicate_of = seen.get(report["fingerprint"])
+            if duplicate_of is not None:
+                report["reason"] = f"duplicate of {duplicate_of}"
+                dropped.append(report)
+                continue
+            seen[report["fingerprint"]] = report["url"]
+            ranked.append(report)
+        for report in ranked:
+            # 重复的候选同样可以作为镜像
+            report["mirrors"] = [
+                other["playlist_url"]
+                for other in alive
+                if other is not report
+                and other["playlist_url"] != report["playlist_url"]
+                and self.is_mirror(report, other)
+            ]
+        return ranked, dropped
@@ -0,0 +1,241 @@
+import os
+import socket
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# 以下依赖 urllib3 / requests 的内部接口（按 requirements.txt 中固定的版本范围验证）：
+# 建连时替换 HTTPConnection._dns_host 并调用 _new_conn；预热时用 _get_conn / _put_conn 取放连接位。
+# 接口不存在时退化为普通 HTTPAdapter（没有 DNS 缓存与建连计时，预热只解析 DNS），下载本身不受影响。
+_CONNECTION_HOOKS = hasattr(HTTPConnection, "_new_conn") and hasattr(HTTPConnection("localhost"), "_dns_host")
+_POOL_HOOKS = hasattr(HTTPConnectionPool, "_get_conn") and hasattr(HTTPConnectionPool, "_put_conn")
+
+
+class ConnectionWarmer:
+    """下载器的连接预热与复用：进程内 DNS 缓存、共用的长连接会话，以及 DNS / 建连耗时统计。
+
+    - DNS：主机名解析一次后缓存全部地址 DNS_TTL 秒（进程内共用），建连时按解析顺序逐个尝试，全部失败时丢弃该主机的缓存
+    - 会话：一个任务的全部请求共用一个 requests.Session，连接池大小等于并发数，分片之间复用长连接
+    - 预热：下载开始前并发解析所有分片/密钥主机，并向分片最多的主机预先建立若干条长连接（含 TLS 握手）
+    - 统计：新建连接的 DNS 耗时与建连耗时（TCP + 代理隧道 + TLS）按线程归属到当前请求，与传输耗时分开统计
+    """
+
+    DNS_TTL = 300
+    DEFAULT_WARM_CONNECTIONS = 8
+
+    _dns_cache = {}
+    _dns_lock = threading.Lock()
+
+    def __init__(self, pool_size=10):
+        self.pool_size = max(1, int(pool_size))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stats = {
+            "dnsLookups": 0,
+            "dnsCacheHits": 0,
+            "dnsSeconds": 0.0,
+            "connections": 0,
+            "connectSeconds": 0.0,
+            "warmed": 0,
+        }
+
+    @staticmethod
+    def warm_count(thread_num):
+        """预热连接数：环境变量 M3U8_WARM_CONNECTIONS，默认 min(8, 并发数)，0 表示只预解析 DNS。"""
+        raw = os.getenv("M3U8_WARM_CONNECTIONS", "").strip()
+        try:
+            count = int(raw) if raw != "" else ConnectionWarmer.DEFAULT_WARM_CONNECTIONS
+        except ValueError:
+            count = ConnectionWarmer.DEFAULT_WARM_CONNECTIONS
+        return max(0, min(count, int(thread_num)))
+
+    # ---- DNS ----
+
+    @staticmethod
+    def _is_ip(host):
+        for family in (socket.AF_INET, socket.AF_INET6):
+            try:
+                socket.inet_pton(family, host)
+                return True
+            except (OSError, ValueError):
+                continue
+        return False
+
+    def resolve(self, host, port):
+        """返回可直接连接的地址列表（按 getaddrinfo 的顺序去重）；IP 与无法解析的主机名原样返回，由连接时报告错误。"""
+        if not host or self._is_ip(host) or host == "localhost":
+            return [host]
+        key = (host, port)
+        now = time.monotonic()
+        with self._dns_lock:
+            cached = self._dns_cache.get(key)
+        if cached is not None and cached[1] > now:
+            self._add_stats(dnsCacheHits=1)
+            return cached[0]
+        started_at = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except OSError:
+            return [host]
+        finally:
+            elapsed = time.perf_counter() - started_at
+            self._add_stats(dnsLookups=1, dnsSeconds=elapsed)
+            self._local.dns = getattr(self._local, "dns", 0.0) + elapsed
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if not addresses:
+            return [host]
+        with self._dns_lock:
+            self._dns_cache[key] = (addresses, now + self.DNS_TTL)
+        return addresses
+
+    def forget(self, host, port):
+        with self._dns_lock:
+            self._dns_cache.pop((host, port), None)
+
+    # ---- 会话与连接 ----
+
+    def _add_stats(self, **amounts):
+        with self._lock:
+            for key, amount in amounts.items():
+                self.stats[key] += amount
+
+    def _timed_connection(self, base):
+        warmer = self
+
+        def _new_conn(conn):
+            # 按顺序尝试缓存的地址建 TCP 连接（与 urllib3 逐个尝试解析结果相同）；host（SNI、证书校验、Host 头）保持原主机名
+            host = conn._dns_host
+            addresses = warmer.resolve(host, conn.port)
+            try:
+                for i, address in enumerate(addresses):
+                    conn._dns_host = address
+                    try:
+                        return base._new_conn(conn)
+                    except Exception:
+                        if i == len(addresses) - 1:
+                            warmer.forget(host, conn.port)
+                            raise
+            finally:
+                conn._dns_host = host
+
+        def connect(conn):
+            dns_before = getattr(warmer._local, "dns", 0.0)
+            started_at = time.perf_counter()
+            try:
+                base.connect(conn)
+            finally:
+                elapsed = time.perf_counter() - started_at - (getattr(warmer._local, "dns", 0.0) - dns_before)
+                warmer._local.connect = getattr(warmer._local, "connect", 0.0) + elapsed
+                warmer._add_stats(connections=1, connectSeconds=elapsed)
+
+        return type(f"Timed{base.__name__}", (base,), {"_new_conn": _new_conn, "connect": connect})
+
+    def _adapter(self):
+        if not _CONNECTION_HOOKS:
+            return HTTPAdapter(pool_connections=8, pool_maxsize=self.pool_size)
+        pool_classes = {
+            "http": type(
+                "TimedHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": self._timed_connection(HTTPConnection)}
+            ),
+            "https": type(
+                "TimedHTTPSConnectionPool",
+                (HTTPSConnectionPool,),
+                {"ConnectionCls": self._timed_connection(HTTPSConnection)},
+            ),
+        }
+
+        class TimedAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                super().init_poolmanager(*args, **kwargs)
+                self.poolmanager.pool_classes_by_scheme = pool_classes
+
+            def proxy_manager_for(self, proxy, **proxy_kwargs):
+                manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+                if proxy.lower().startswith("http"):
+                    manager.pool_classes_by_scheme = pool_classes
+                return manager
+
+        return TimedAdapter(pool_connections=8, pool_maxsize=self.pool_size)
+
+    def mount(self, session):
+        adapter = self._adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def take_request_timings(self):
+        """返回并清零当前线程自上次调用以来新建连接的 (DNS 秒, 建连秒)；复用连接时均为 0。"""
+        dns = getattr(self._local, "dns", 0.0)
+        connect = getattr(self._local, "connect", 0.0)
+        self._local.dns = 0.0
+        self._local.connect = 0.0
+        return dns, connect
+
+    def warm(self, session, urls, proxies=None, count=0, timeout=5, stop_checker=None):
+        """并发解析 urls 中的全部主机，再向请求最多的主机预先建立 count 条长连接；返回成功建立的连接数。"""
+        targets = Counter()
+        first_url = {}
+        for url in urls:
+            parsed = urlparse(url)
+            if parsed.hostname is None:
+                continue
+            key = (parsed.hostname, parsed.port or (443 if parsed.scheme == "https" else 80))
+            targets[key] += 1
+            first_url.setdefault(key, url)
+        if len(targets) == 0:
+            return 0
+        if not proxies:
+            # 经代理时由代理解析目标主机，本地只需要解析代理本身（建连时完成）
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                list(executor.map(lambda key: self.resolve(*key), targets))
+        if count <= 0 or not _POOL_HOOKS or (stop_checker is not None and stop_checker()):
+            return 0
+
+        url = first_url[targets.most_common(1)[0][0]]
+        adapter = session.get_adapter(url)
+        # 与 Session.request 相同地合并环境变量中的代理与证书设置，否则取到的连接池与实际请求使用的不是同一个
+        settings = session.merge_environment_settings(url, proxies or {}, None, session.verify, session.cert)
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            request = requests.Request("GET", url).prepare()
+            pool = adapter.get_connection_with_tls_context(
+                request, settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+            )
+        else:
+            # requests < 2.32.2
+            pool = adapter.get_connection(url, proxies=settings["proxies"])
+
+        # 先从连接池取出 count 个连接位（取出的是空位或空闲连接），并发建连后再放回，池中即有 count 条可复用的长连接
+        conns = [pool._get_conn() for _ in range(count)]
+
+        def open_one(conn):
+            if conn.sock is not None:
+                return False
+            if stop_checker is not None and stop_checker():
+                return False
+            conn.timeout = timeout
+            try:
+                conn.connect()
+            except Exception:
+                conn.close()
+                return False
+            return True
+
+        try:
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                warmed = sum(1 for ok in executor.map(open_one, conns) if ok)
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        self._add_stats(warmed=warmed)
+        return warmed
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.stats)
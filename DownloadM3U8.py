@@ -1,4 +1,5 @@
 import os
+import random
 import shutil
 import subprocess
 import threading
@@ -11,9 +12,18 @@ import requests
 
 from TimerTimer import TimerTimer
 from RandomHeaders import RandomHeaders
+from ConnectionWarmer import ConnectionWarmer
+from HostCircuitBreaker import HostCircuitBreaker
+from IdentityPool import IdentityPool
+from ProxyPool import ProxyPool
+from TransferScheduler import TransferScheduler
 
 
 class DownloadM3U8:
+    MAX_MIRRORS = 4
+    MAX_PARKS = 8  # 单个分片因限流（429/503）停靠等待的最多次数，超过后按失败处理
+    MIRROR_EWMA_ALPHA = 0.3
+
     def __init__(
         self,
         folder,
@@ -23,11 +33,19 @@ class DownloadM3U8:
         session_hints=None,
         progress_callback=None,
         stop_checker=None,
+        temp_name="",
+        connection_budget=None,
+        mirrors=None,
+        priority=1,
+        thread_initializer=None,
     ):
-        # 文件夹
+        # 文件夹；同时下载多个候选时各用独立的临时目录（.TEMP-<temp_name>），互不清理
         self.fileDir = folder
-        self.tempDir = os.path.join(self.fileDir, ".TEMP")
+        self.temp_name = str(temp_name or "").strip()
+        self.tempDir = os.path.join(self.fileDir, f".TEMP-{self.temp_name}" if self.temp_name else ".TEMP")
         self.prepareFolder()
+        # 分片下载等内部线程池的线程启动时调用（调用方用它把这些线程的输出归到所属任务的日志）
+        self.thread_initializer = thread_initializer
 
         # 下载列表
         self.URL = URL.strip()
@@ -37,7 +55,12 @@ class DownloadM3U8:
 
         self.proxy_config = self._normalize_proxy_config(proxy_config)
         self.proxy_url = self._build_proxy_url(self.proxy_config)
-        if self.proxy_config["enabled"]:
+        # 代理池（config/proxy.pool.json）启用时，分片请求按延迟分摊到池中健康的代理上
+        self.proxy_pool = ProxyPool.for_task(self.proxy_config)
+        self.proxy_stats = {}  # 代理 -> 本任务经由该代理的成功/失败次数、字节数与耗时
+        if self.proxy_pool is not None:
+            print(f"[download][proxy] pool size={len(self.proxy_pool.proxies)}")
+        elif self.proxy_config["enabled"]:
             print(
                 f"[download][proxy] using {self.proxy_config['address']}:{self.proxy_config['port']} "
                 f"user={self.proxy_config['username'] or '(none)'}"
@@ -75,14 +98,36 @@ class DownloadM3U8:
         self.timeout_last_eval_failures = 0
         self.timeout_last_adjust_ts = 0.0
         self.session_hints = self._normalize_session_hints(session_hints)
-        self.identity_pool = self._build_identity_pool(pool_size=3)
-        self.active_identity_index = 0
+        # 每个分片请求按健康度选择身份，被拦截的身份隔离，健康身份不足时补充
+        self.identity_pool = IdentityPool(self._build_identity_pool(pool_size=3), factory=self._new_identity)
         self.progress_callback = progress_callback if callable(progress_callback) else None
         self.stop_checker = stop_checker if callable(stop_checker) else None
         self._manual_stop_requested = False
         self.download_interrupted = False
         self._stop_logged = False
         self.completedNameSet = set()
+        # 多个下载器共用的并发请求预算（threading.Semaphore），为 None 时只受 threadNum 限制
+        self.connection_budget = connection_budget
+        # 进程内共用的传输调度：每主机并发连接上限与带宽令牌桶，priority 越高分到的连接与带宽越多
+        self.scheduler = TransferScheduler.shared()
+        self.transfer_job = self.scheduler.open_job(self.URL, priority=priority)
+        # 全部请求共用一个长连接会话；DNS 解析缓存，新建连接的 DNS/建连耗时与传输耗时分开统计
+        self.warmer = ConnectionWarmer(pool_size=self.threadNum)
+        self.session = self._new_session()
+        self.request_timings = {"requests": 0, "dnsSeconds": 0.0, "connectSeconds": 0.0, "transferSeconds": 0.0}
+        self.parked_segments = {}  # 主机 -> 因限流停靠等待、未计为失败的分片请求数
+        self.breaker_hosts = set()  # 本任务遇到过熔断的主机
+        self._first_byte_emitted = False
+        # 镜像播放列表（分片序列相同的其他 CDN 地址）：按实测吞吐分流，失败的分片优先换到其他镜像
+        self.mirror_candidates = []
+        for mirror_url in mirrors or []:
+            mirror_url = str(mirror_url or "").strip()
+            if mirror_url != "" and mirror_url != self.URL and mirror_url not in self.mirror_candidates:
+                self.mirror_candidates.append(mirror_url)
+        self.mirror_candidates = self.mirror_candidates[: self.MAX_MIRRORS]
+        self.mirrors = []  # 下标 0 为主播放列表
+        self.segment_mirror_urls = {}  # 分片文件名 -> 各镜像上的地址（下标与 self.mirrors 对应）
+        self.segment_failed_mirrors = {}  # 分片文件名 -> 该分片已失败过的镜像下标
         print(f"[download][init] identity_pool_size={len(self.identity_pool)}")
 
         self.prepareDownload()  # 对index.m3u8初步解析，填充上面两个列表，不做任何下载
@@ -232,19 +277,25 @@ class DownloadM3U8:
             unique_pool.append(headers)
         return unique_pool if unique_pool else pool[:1]
 
-    def _set_active_identity(self, index):
-        if len(self.identity_pool) == 0:
-            self.active_identity_index = 0
-            return
-        self.active_identity_index = max(0, int(index)) % len(self.identity_pool)
-
-    def _active_identity_headers(self):
-        if len(self.identity_pool) == 0:
+    def _new_identity(self):
+        referer = self._resolve_referer_for(self.URL)
+        generated = RandomHeaders.GenHeadersList(1, [referer])
+        return self._sanitize_download_headers(generated[0] if generated else {}, referer=referer, origin=self.origin)
+
+    def _identity_headers(self, identity=None):
+        # identity 为 None 时使用当前最健康的身份
+        if identity is None:
+            identity = self.identity_pool.best()
+        headers = self.identity_pool.headers(identity)
+        if not headers:
             return self._sanitize_download_headers({}, referer=self._resolve_referer_for(self.URL), origin=self.origin)
-        return dict(self.identity_pool[self.active_identity_index])
+        return headers
+
+    def get_identity_stats(self):
+        return self.identity_pool.stats()
 
-    def _build_request_headers(self, target_url, for_playlist=False):
-        headers = self._active_identity_headers()
+    def _build_request_headers(self, target_url, for_playlist=False, identity=None):
+        headers = self._identity_headers(identity)
         headers["referer"] = self._resolve_referer_for(target_url)
         if self.origin != "":
             headers["origin"] = self.origin
@@ -270,24 +321,26 @@ class DownloadM3U8:
             except Exception:
                 continue
 
-    def _new_session(self, headers=None):
+    def _new_session(self):
         session = requests.Session()
         # 避免被系统代理环境变量接管
         session.trust_env = False
-
-        if self.proxy_url != "":
-            session.proxies.update(
-                {
-                    "http": self.proxy_url,
-                    "https": self.proxy_url,
-                }
-            )
-
-        if headers:
-            session.headers.update(headers)
+        self.warmer.mount(session)
         self._apply_session_cookies(session)
         return session
 
+    def _request_proxies(self, proxy_url=None):
+        # 会话共用，代理按请求指定
+        if proxy_url is None:
+            # 播放列表等单次请求使用代理池中当前最优的代理
+            proxy_url = self.proxy_pool.best()["url"] if self.proxy_pool is not None else self.proxy_url
+        if proxy_url == "":
+            return {}
+        return {
+            "http": proxy_url,
+            "https": proxy_url,
+        }
+
     @staticmethod
     def clearFolder(folder_path):
         """
@@ -392,7 +445,7 @@ class DownloadM3U8:
     def _run_download_tasks(self, download_items):
         if len(download_items) == 0:
             return
-        executor = ThreadPoolExecutor(max_workers=max(1, int(self.round_threads)))
+        executor = ThreadPoolExecutor(max_workers=max(1, int(self.round_threads)), initializer=self.thread_initializer)
         pending_futures = set()
         try:
             for name, url in download_items:
@@ -461,6 +514,7 @@ class DownloadM3U8:
             self._stop_logged = False
             self.failedNameList.clear()
             self.failedUrlList.clear()
+            self.segment_failed_mirrors.clear()
 
     def get_failed_segments(self):
         with self.state_lock:
@@ -477,43 +531,14 @@ class DownloadM3U8:
         self.printInfo("getting", "*.m3u8", self.URL)
         if self._is_stop_requested():
             return
+        if self.proxy_pool is not None:
+            self.proxy_pool.probe(self.URL)
         try:
-            headers = self._build_request_headers(self.URL, for_playlist=True)
-            with self._new_session(headers=headers) as session:
-                if self._is_stop_requested():
-                    return
-                timeout_seconds = self._get_timeout_snapshot()
-                response = session.get(self.URL, timeout=(timeout_seconds, timeout_seconds))
-                response.raise_for_status()
-                try:
-                    playlist = m3u8.loads(response.text, uri=self.URL)
-                except TypeError:
-                    playlist = m3u8.loads(response.text)
-
-                # 主播放列表场景：自动跟进到首个子播放列表，避免 total=0
-                if len(playlist.segments) == 0 and len(playlist.playlists) > 0:
-                    variant = playlist.playlists[0]
-                    variant_url = getattr(variant, "absolute_uri", "") or ""
-                    if variant_url == "" and getattr(variant, "uri", ""):
-                        variant_url = variant.uri
-                    if variant_url != "":
-                        if self._is_stop_requested():
-                            return
-                        headers = self._build_request_headers(variant_url, for_playlist=True)
-                        timeout_seconds = self._get_timeout_snapshot()
-                        variant_resp = session.get(
-                            variant_url,
-                            timeout=(timeout_seconds, timeout_seconds),
-                            headers=headers,
-                        )
-                        variant_resp.raise_for_status()
-                        try:
-                            playlist = m3u8.loads(variant_resp.text, uri=variant_url)
-                        except TypeError:
-                            playlist = m3u8.loads(variant_resp.text)
-
-                if len(playlist.segments) == 0:
-                    raise ValueError("empty m3u8 playlist")
+            playlist = self._fetch_playlist(self.session, self.URL)
+            if playlist is None:
+                return
+            if len(playlist.segments) == 0:
+                raise ValueError("empty m3u8 playlist")
         except Exception as e:
             print(f"[error] m3u8 read error: {e}")
             raise ValueError("m3u8 read error")
@@ -529,48 +554,470 @@ class DownloadM3U8:
                 self.fileNameList.append(key.uri)
 
         # 获取ts文件名和地址
+        layout = self._segment_layout(playlist)
         for i, segment in enumerate(playlist.segments):
             self.fileUrlList.append(segment.absolute_uri)
             segment.uri = f"{i}.ts"
             self.fileNameList.append(segment.uri)
 
-    def __downloadSingle(self, fileName, fileUrl):
+        self._prepare_mirrors(layout)
+        self._warm_up()
+
+    def _warm_up(self):
+        """下载开始前预解析分片、密钥与镜像主机，并预先建立长连接，避免所有线程同时解析 DNS 与握手。"""
         if self._is_stop_requested():
             return
-        file_path = os.path.join(self.tempDir, fileName)
+        count = ConnectionWarmer.warm_count(self.threadNum)
+        if self.scheduler.host_connections > 0:
+            count = min(count, self.scheduler.host_connections)
+        urls = list(self.fileUrlList)
+        for mirror_urls in list(self.segment_mirror_urls.values())[:1]:
+            urls.extend(mirror_urls[1:])
+        started_at = time.perf_counter()
         try:
-            headers = self._build_request_headers(fileUrl)
+            warmed = self.warmer.warm(
+                self.session,
+                urls,
+                proxies=self._request_proxies(),
+                count=count,
+                timeout=self._get_timeout_snapshot(),
+                stop_checker=self._is_stop_requested,
+            )
+        except Exception as exc:
+            print(f"[download][warmup] skipped: {exc}")
+            return
+        stats = self.warmer.snapshot()
+        print(
+            f"[download][warmup] dns_lookups={stats['dnsLookups']} dns={stats['dnsSeconds']:.3f}s "
+            f"connections={warmed}/{count} in {time.perf_counter() - started_at:.2f}s"
+        )
 
-            with self._new_session(headers=headers) as session:
+    def _fetch_playlist(self, session, url):
+        """取回并解析播放列表；主播放列表自动跟进到首个子播放列表。中断时返回 None。"""
+        if self._is_stop_requested():
+            return None
+        headers = self._build_request_headers(url, for_playlist=True)
+        timeout_seconds = self._get_timeout_snapshot()
+        proxies = self._request_proxies()
+        response = self._scheduled_get(
+            session, url, timeout=(timeout_seconds, timeout_seconds), headers=headers, proxies=proxies
+        )
+        if response is None:
+            return None
+        response.raise_for_status()
+        try:
+            playlist = m3u8.loads(response.text, uri=url)
+        except TypeError:
+            playlist = m3u8.loads(response.text)
+
+        # 主播放列表场景：自动跟进到首个子播放列表，避免 total=0
+        if len(playlist.segments) == 0 and len(playlist.playlists) > 0:
+            variant = playlist.playlists[0]
+            variant_url = getattr(variant, "absolute_uri", "") or ""
+            if variant_url == "" and getattr(variant, "uri", ""):
+                variant_url = variant.uri
+            if variant_url != "":
+                if self._is_stop_requested():
+                    return None
+                headers = self._build_request_headers(variant_url, for_playlist=True)
                 timeout_seconds = self._get_timeout_snapshot()
-                with session.get(fileUrl, timeout=(timeout_seconds, timeout_seconds), stream=True) as response:
-                    response.raise_for_status()  # 检查请求状态码，非 2xx 会抛出异常
-
-                    # 分块下载，允许在分片下载中快速响应中断。
-                    with open(file_path, "wb") as file:
-                        for chunk in response.iter_content(chunk_size=64 * 1024):
-                            if self._is_stop_requested():
-                                try:
-                                    file.close()
-                                    if os.path.exists(file_path):
-                                        os.remove(file_path)
-                                except OSError:
-                                    pass
-                                return
-                            if chunk:
-                                file.write(chunk)
-
-                # 打印
-                with self.state_lock:
-                    self.connections = self.connections + 1
-                    self.completedNameSet.add(fileName)
-                    completed_count = len(self.completedNameSet)
-                    total_count = len(self.fileNameList)
-                self.printInfo("completed", fileName, fileUrl, response.elapsed.total_seconds())
-                self._emit_progress("segment_done", done=completed_count, total=total_count, file=fileName)
+                variant_resp = self._scheduled_get(
+                    session,
+                    variant_url,
+                    timeout=(timeout_seconds, timeout_seconds),
+                    headers=headers,
+                    proxies=proxies,
+                )
+                if variant_resp is None:
+                    return None
+                variant_resp.raise_for_status()
+                try:
+                    playlist = m3u8.loads(variant_resp.text, uri=variant_url)
+                except TypeError:
+                    playlist = m3u8.loads(variant_resp.text)
+        return playlist
+
+    def _scheduled_get(self, session, url, **kwargs):
+        """经传输调度的整段 GET（播放列表等小文件）；等待连接位时被中断返回 None。"""
+        with self.scheduler.slot(self.transfer_job, url, self._is_stop_requested) as granted:
+            if not granted:
+                return None
+            try:
+                response = session.get(url, **kwargs)
+            except requests.RequestException as exc:
+                self._report_host(url, False, error=exc)
+                raise
+            self._report_host(url, response.ok, response.status_code, response.headers)
+            self.scheduler.consume(self.transfer_job, len(response.content), self._is_stop_requested)
+            return response
+
+    def _report_host(self, url, ok, status_code=None, headers=None, error=None):
+        # 连接错误与超时计入目标主机的熔断器；连不上代理是代理的问题，由代理池处理
+        connection_error = isinstance(error, (requests.ConnectionError, requests.Timeout)) and not isinstance(
+            error, requests.exceptions.ProxyError
+        )
+        if self.scheduler.report(url, ok, status_code, headers, connection_error) > 0:
+            with self.state_lock:
+                self.breaker_hosts.add(self.scheduler.host_of(url))
+
+    def get_connection_stats(self):
+        """成功分片请求的 DNS / 建连 / 传输耗时合计（秒），以及连接复用与预热情况。"""
+        stats = self.warmer.snapshot()
+        with self.state_lock:
+            timings = dict(self.request_timings)
+        return {
+            "requests": timings["requests"],
+            "dnsSeconds": round(timings["dnsSeconds"], 3),
+            "connectSeconds": round(timings["connectSeconds"], 3),
+            "transferSeconds": round(timings["transferSeconds"], 3),
+            "dnsLookups": stats["dnsLookups"],
+            "dnsCacheHits": stats["dnsCacheHits"],
+            "connections": stats["connections"],
+            "warmed": stats["warmed"],
+        }
+
+    def get_breaker_stats(self):
+        with self.state_lock:
+            hosts = set(self.breaker_hosts)
+            parked = dict(self.parked_segments)
+        if len(hosts) == 0:
+            return []
+        stats = self.scheduler.breaker.stats(hosts)
+        for item in stats:
+            item["parked"] = parked.get(item["host"], 0)
+        return stats
+
+    @staticmethod
+    def _segment_layout(playlist):
+        # 分片文件名与时长序列；不同 CDN 的路径前缀与查询参数可以不同
+        return [
+            (urlparse(segment.absolute_uri).path.rsplit("/", 1)[-1], round(float(segment.duration or 0), 3))
+            for segment in playlist.segments
+        ]
+
+    @staticmethod
+    def _new_mirror(url, referer):
+        return {
+            "url": url,
+            "host": urlparse(url).netloc,
+            "referer": referer,
+            "ok": 0,
+            "failed": 0,
+            "bytes": 0,
+            "ewma_kbps": None,
+        }
+
+    def _prepare_mirrors(self, layout):
+        self.mirrors = [self._new_mirror(self.URL, "")]
+        if len(self.mirror_candidates) == 0:
+            return
+        segment_names = [name for name in self.fileNameList if name.endswith(".ts")]
+        segment_urls = self.fileUrlList[len(self.fileNameList) - len(segment_names):]
+
+        def load(mirror_url):
+            try:
+                return self._fetch_playlist(self.session, mirror_url)
+            except Exception as exc:
+                print(f"[download][mirror] skip {mirror_url}: {exc}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.mirror_candidates), initializer=self.thread_initializer
+        ) as executor:
+            playlists = list(executor.map(load, self.mirror_candidates))
+
+        mirror_segment_urls = []
+        for mirror_url, playlist in zip(self.mirror_candidates, playlists):
+            if playlist is None:
+                continue
+            if self._segment_layout(playlist) != layout:
+                print(f"[download][mirror] skip {mirror_url}: segment layout mismatch")
+                continue
+            self.mirrors.append(self._new_mirror(mirror_url, self._resolve_referer_for(mirror_url)))
+            mirror_segment_urls.append([segment.absolute_uri for segment in playlist.segments])
+        if len(self.mirrors) <= 1:
+            return
+        for index, name in enumerate(segment_names):
+            self.segment_mirror_urls[name] = [segment_urls[index]] + [urls[index] for urls in mirror_segment_urls]
+        print(
+            f"[download][mirror] mirrors={len(self.mirrors)} "
+            f"hosts={','.join(mirror['host'] for mirror in self.mirrors)}"
+        )
+
+    def _failover_choices(self, fileName, exclude):
+        """该分片尚未失败过、主机未熔断且不是 exclude 的镜像下标（失败后立即换镜像重试的候选）。"""
+        urls = self.segment_mirror_urls.get(fileName)
+        if not urls:
+            return []
+        with self.state_lock:
+            failed = set(self.segment_failed_mirrors.get(fileName, ()))
+        return [
+            index
+            for index in range(len(urls))
+            if index != exclude
+            and index not in failed
+            and not self.scheduler.breaker.is_open(self.scheduler.host_of(urls[index]))
+        ]
+
+    def _choose_mirror(self, fileName, fileUrl, exclude=None):
+        """按各镜像的吞吐（EWMA）加权随机选择，跳过该分片已失败过的镜像；返回 (镜像下标, 请求地址)。
+
+        exclude 不为 None 时只在 _failover_choices 中选择（没有可选镜像时退回正常选择）。
+        """
+        urls = self.segment_mirror_urls.get(fileName)
+        if not urls:
+            return 0, fileUrl
+        failover = self._failover_choices(fileName, exclude) if exclude is not None else []
+        with self.state_lock:
+            excluded = self.segment_failed_mirrors.setdefault(fileName, set())
+            choices = failover or [index for index in range(len(urls)) if index not in excluded]
+            if len(choices) == 0:
+                # 所有镜像都失败过一次，重新轮一遍
+                excluded.clear()
+                choices = list(range(len(urls)))
+            measured = [mirror["ewma_kbps"] for mirror in self.mirrors if mirror["ewma_kbps"] is not None]
+            best = max(measured) if measured else 1.0
+            weights = []
+            for index in choices:
+                ewma = self.mirrors[index]["ewma_kbps"]
+                # 未测量的镜像按当前最好的吞吐估计，保证先各试一次；慢镜像保留少量流量以便恢复后重新分流
+                weights.append(max(best if ewma is None else ewma, best * 0.05, 0.001))
+        index = random.choices(choices, weights=weights)[0]
+        return index, urls[index]
+
+    def _record_mirror_result(self, fileName, index, ok, received=0, elapsed=0.0):
+        if len(self.mirrors) <= 1:
+            return
+        with self.state_lock:
+            mirror = self.mirrors[index]
+            alpha = self.MIRROR_EWMA_ALPHA
+            if ok:
+                mirror["ok"] += 1
+                mirror["bytes"] += received
+                kbps = received * 8 / 1000 / max(0.001, elapsed)
+                if mirror["ewma_kbps"] is None:
+                    mirror["ewma_kbps"] = kbps
+                else:
+                    mirror["ewma_kbps"] = (1 - alpha) * mirror["ewma_kbps"] + alpha * kbps
+            else:
+                mirror["failed"] += 1
+                if mirror["ewma_kbps"] is not None:
+                    mirror["ewma_kbps"] = (1 - alpha) * mirror["ewma_kbps"]
+                self.segment_failed_mirrors.setdefault(fileName, set()).add(index)
+
+    def get_mirror_stats(self):
+        with self.state_lock:
+            return [
+                {
+                    "host": mirror["host"],
+                    "url": mirror["url"],
+                    "ok": mirror["ok"],
+                    "failed": mirror["failed"],
+                    "bytes": mirror["bytes"],
+                    "kbps": round(mirror["ewma_kbps"] or 0.0, 1),
+                }
+                for mirror in self.mirrors
+            ]
+
+    def _acquire_proxy(self):
+        if self.proxy_pool is None:
+            return None
+        return self.proxy_pool.acquire()
+
+    def _release_proxy(self, entry, ok, received=0, elapsed=0.0, latency=None, error=None, status_code=None):
+        if entry is None:
+            return
+        # 连接不上代理、连接超时或代理要求认证才算代理故障；目标站点的 4xx/5xx 与读超时不影响代理健康
+        proxy_failure = status_code == 407 or isinstance(error, requests.exceptions.ConnectionError)
+        self.proxy_pool.release(entry, ok, latency=latency, proxy_failure=proxy_failure)
+        with self.state_lock:
+            stats = self.proxy_stats.setdefault(
+                entry["label"], {"proxy": entry["label"], "ok": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+            )
+            if ok:
+                stats["ok"] += 1
+                stats["bytes"] += received
+                stats["seconds"] += elapsed
+            else:
+                stats["failed"] += 1
+
+    def get_proxy_stats(self):
+        with self.state_lock:
+            return [
+                {
+                    "proxy": stats["proxy"],
+                    "ok": stats["ok"],
+                    "failed": stats["failed"],
+                    "bytes": stats["bytes"],
+                    "kbps": round(stats["bytes"] * 8 / 1000 / stats["seconds"], 1) if stats["seconds"] > 0 else 0.0,
+                }
+                for stats in self.proxy_stats.values()
+            ]
+
+    def _acquire_connection_slot(self):
+        if self.connection_budget is None:
+            return True
+        while not self.connection_budget.acquire(timeout=0.2):
+            if self._is_stop_requested():
+                return False
+        return True
+
+    def _release_connection_slot(self):
+        if self.connection_budget is not None:
+            self.connection_budget.release()
+
+    def _emit_first_byte(self):
+        # 首个视频字节到达时通知一次，用于统计任务的首字节耗时
+        with self.state_lock:
+            if self._first_byte_emitted:
+                return
+            self._first_byte_emitted = True
+        self._emit_progress("first_byte")
+
+    def release_temp(self):
+        """删除独立临时目录（被取消的候选），共用的 .TEMP 保持原样。"""
+        if self.temp_name == "":
+            return
+        shutil.rmtree(self.tempDir, ignore_errors=True)
+        print(f"[file] released temp_folder={self.tempDir}")
+
+    def __downloadSingle(self, fileName, fileUrl):
+        if self._is_stop_requested():
+            return
+        if not self._acquire_connection_slot():
+            return
+        try:
+            self.__downloadSingleWithSlot(fileName, fileUrl)
+        finally:
+            self._release_connection_slot()
+
+    def __downloadSingleWithSlot(self, fileName, fileUrl):
+        file_path = os.path.join(self.tempDir, fileName)
+        # fileUrl 为主播放列表中的地址，失败记录始终使用它；实际请求的镜像地址为 request_url
+        mirror_index, request_url = self._choose_mirror(fileName, fileUrl)
+        parks = 0
+        failed_over = False
+        while True:
+            # 目标主机的连接位满或熔断时在这里排队，排队时间不计入分片耗时
+            with self.scheduler.slot(self.transfer_job, request_url, self._is_stop_requested) as granted:
+                if not granted:
+                    return
+                result = self.__transferSegment(
+                    fileName,
+                    fileUrl,
+                    file_path,
+                    mirror_index,
+                    request_url,
+                    can_park=parks < self.MAX_PARKS,
+                    can_failover=not failed_over,
+                )
+            if result == "parked":
+                parks = parks + 1
+                mirror_index, request_url = self._choose_mirror(fileName, fileUrl)
+            elif result == "failover":
+                # 每个分片每轮只立即换一次镜像，仍失败时再记为失败交给重试轮次
+                failed_over = True
+                mirror_index, request_url = self._choose_mirror(fileName, fileUrl, exclude=mirror_index)
+            else:
+                return
+
+    def __transferSegment(
+        self, fileName, fileUrl, file_path, mirror_index, request_url, can_park=False, can_failover=False
+    ):
+        """下载一个分片；成功或记为失败时返回 None。
+
+        - 被主机限流（429/503）时返回 "parked"，由调用方停靠到熔断恢复后重新请求，不计为失败
+        - 请求失败且还有其他健康镜像时返回 "failover"，由调用方立即换镜像重试一次，不计为失败
+        """
+        identity = self.identity_pool.choose()
+        proxy_entry = self._acquire_proxy()
+        started_at = time.perf_counter()
+        received = 0
+        try:
+            headers = self._build_request_headers(request_url, identity=identity)
+            if mirror_index > 0 and self.mirrors[mirror_index]["referer"] != "":
+                headers["referer"] = self.mirrors[mirror_index]["referer"]
+
+            proxy_url = proxy_entry["url"] if proxy_entry is not None else self.proxy_url
+            self.warmer.take_request_timings()  # 清零本线程的建连计时，之后新建连接的耗时归属本次请求
+            timeout_seconds = self._get_timeout_snapshot()
+            with self.session.get(
+                request_url,
+                headers=headers,
+                proxies=self._request_proxies(proxy_url),
+                timeout=(timeout_seconds, timeout_seconds),
+                stream=True,
+            ) as response:
+                response.raise_for_status()  # 检查请求状态码，非 2xx 会抛出异常
+
+                # 分块下载，允许在分片下载中快速响应中断。
+                with open(file_path, "wb") as file:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if self._is_stop_requested():
+                            try:
+                                file.close()
+                                if os.path.exists(file_path):
+                                    os.remove(file_path)
+                            except OSError:
+                                pass
+                            self._release_proxy(proxy_entry, False)
+                            return
+                        if chunk:
+                            file.write(chunk)
+                            received += len(chunk)
+                            self.scheduler.consume(self.transfer_job, len(chunk), self._is_stop_requested)
+                            if not self._first_byte_emitted and fileName.endswith(".ts"):
+                                self._emit_first_byte()
+
+            elapsed = time.perf_counter() - started_at
+            dns_seconds, connect_seconds = self.warmer.take_request_timings()
+            with self.state_lock:
+                self.request_timings["requests"] += 1
+                self.request_timings["dnsSeconds"] += dns_seconds
+                self.request_timings["connectSeconds"] += connect_seconds
+                self.request_timings["transferSeconds"] += max(0.0, elapsed - dns_seconds - connect_seconds)
+            self._report_host(request_url, True, response.status_code, response.headers)
+            self._record_mirror_result(fileName, mirror_index, True, received, elapsed)
+            self.identity_pool.record(identity, True, latency=response.elapsed.total_seconds())
+            self._release_proxy(
+                proxy_entry, True, received, elapsed, latency=response.elapsed.total_seconds()
+            )
+            # 打印
+            with self.state_lock:
+                self.connections = self.connections + 1
+                self.completedNameSet.add(fileName)
+                completed_count = len(self.completedNameSet)
+                total_count = len(self.fileNameList)
+            self.printInfo("completed", fileName, request_url, response.elapsed.total_seconds())
+            self._emit_progress("segment_done", done=completed_count, total=total_count, file=fileName)
 
         except requests.RequestException as e:
             status_code = getattr(getattr(e, "response", None), "status_code", None)
+            self._report_host(request_url, False, status_code, getattr(getattr(e, "response", None), "headers", None), e)
+            self._record_mirror_result(fileName, mirror_index, False)
+            self._release_proxy(proxy_entry, False, error=e, status_code=status_code)
+            if (
+                can_park
+                and HostCircuitBreaker.is_throttle(status_code)
+                and self.scheduler.breaker.is_open(self.scheduler.host_of(request_url))
+            ):
+                # 主机级限流，与请求身份无关：不隔离身份、不计入失败与重试轮次
+                self.identity_pool.record(identity, False)
+                host = self.scheduler.host_of(request_url)
+                with self.state_lock:
+                    self.connections = self.connections + 1
+                    self.parked_segments[host] = self.parked_segments.get(host, 0) + 1
+                    self.breaker_hosts.add(host)
+                self.printInfo(f"parked[{status_code}]", fileName, request_url)
+                return "parked"
+            # 429/503 是主机级信号（已交给熔断器），即使熔断器尚未 open 也不计为身份被拦截
+            identity_status = None if HostCircuitBreaker.is_throttle(status_code) else status_code
+            self.identity_pool.record(identity, False, status=identity_status)
+            if can_failover and len(self._failover_choices(fileName, mirror_index)) > 0:
+                with self.state_lock:
+                    self.connections = self.connections + 1
+                self.printInfo(f"failover[{status_code}]", fileName, request_url)
+                return "failover"
             # 捕获网络请求异常并记录
             with self.state_lock:
                 self.failedNameList.append(fileName)
@@ -581,14 +1028,17 @@ class DownloadM3U8:
                     self.blocking_failures = self.blocking_failures + 1
             # 打印
             stage = f"failed[{status_code}]: {e}" if status_code is not None else f"failed: {e}"
-            self.printInfo(stage, fileName, fileUrl)
+            self.printInfo(stage, fileName, request_url)
         except Exception as e:
+            self._record_mirror_result(fileName, mirror_index, False)
+            self.identity_pool.record(identity, False)
+            self._release_proxy(proxy_entry, False)
             with self.state_lock:
                 self.failedNameList.append(fileName)
                 self.failedUrlList.append(fileUrl)
                 self.connections = self.connections + 1
                 self.total_failures = self.total_failures + 1
-            self.printInfo(f"failed: {e}", fileName, fileUrl)
+            self.printInfo(f"failed: {e}", fileName, request_url)
 
     def RetryFailed(self, retries=10):
         if self._is_stop_requested():
@@ -616,11 +1066,10 @@ class DownloadM3U8:
                 current_failed_count = len(self.failedNameList)
             if current_failed_count == 0:
                 break
-            self._set_active_identity(attempt + 1)
             timeout_now = self._get_timeout_snapshot()
             print(
                 f"[retry] attempt={attempt + 1}/{max_retry_rounds} failed={current_failed_count} "
-                f"identity={self.active_identity_index + 1}/{len(self.identity_pool)} "
+                f"identities={self.identity_pool.healthy_count()}/{len(self.identity_pool)} "
                 f"threads={self.round_threads} timeout={timeout_now}s"
             )
             # 临时存储本次重试开始前的状况
@@ -687,7 +1136,6 @@ class DownloadM3U8:
         # 启动定时器
         self._reset_download_runtime_state()
         self.round_threads = self.threadNum
-        self._set_active_identity(0)
         self.completedNameSet.clear()
         total_segments = len(self.fileNameList)
         self._emit_progress("start", done=0, total=total_segments)
@@ -712,6 +1160,42 @@ class DownloadM3U8:
         finally:
             # 结束定时器
             self.timeoutTimer.StopTimer()
+            for identity in self.get_identity_stats():
+                if identity["requests"] > 0:
+                    print(
+                        f"[download][identity] identity={identity['identity']} requests={identity['requests']} "
+                        f"ok={identity['ok']} blocked={identity['blocked']} latency_ms={identity['latencyMs']} "
+                        f"quarantines={identity['quarantines']}"
+                    )
+            if len(self.mirrors) > 1:
+                for mirror in self.get_mirror_stats():
+                    print(
+                        f"[download][mirror] host={mirror['host']} ok={mirror['ok']} "
+                        f"failed={mirror['failed']} kbps={mirror['kbps']}"
+                    )
+            timing = self.get_connection_stats()
+            print(
+                f"[download][timing] requests={timing['requests']} dns={timing['dnsSeconds']}s "
+                f"connect={timing['connectSeconds']}s transfer={timing['transferSeconds']}s "
+                f"connections={timing['connections']} warmed={timing['warmed']} "
+                f"dns_lookups={timing['dnsLookups']} dns_cache_hits={timing['dnsCacheHits']}"
+            )
+            for breaker in self.get_breaker_stats():
+                print(
+                    f"[download][breaker] host={breaker['host']} state={breaker['state']} trips={breaker['trips']} "
+                    f"recovery_s={breaker['recoverySeconds']} parked={breaker['parked']}"
+                )
+            if self.transfer_job["waited"] > 0.05:
+                print(
+                    f"[download][scheduler] priority={self.transfer_job['priority']:g} "
+                    f"host_wait={self.transfer_job['waited']:.2f}s bytes={self.transfer_job['bytes']}"
+                )
+            for proxy in self.get_proxy_stats():
+                print(
+                    f"[download][proxy] proxy={proxy['proxy']} ok={proxy['ok']} failed={proxy['failed']} "
+                    f"bytes={proxy['bytes']} kbps={proxy['kbps']}"
+                )
+            self.session.close()  # 释放连接池中的长连接
             self._emit_progress(
                 "done",
                 done=len(self.completedNameSet),
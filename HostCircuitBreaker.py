@@ -0,0 +1,162 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+class HostCircuitBreaker:
+    """每个主机一个熔断器（closed / open / half-open），由状态码、连接错误与限流响应头驱动。
+
+    - closed：正常放行；连续 FAILURE_THRESHOLD 次连接错误、超时或 5xx 后转为 open
+    - 429，以及带 Retry-After 的 503：立即转为 open；Retry-After（秒数或 HTTP 日期）与
+      X-RateLimit-Remaining=0 时的 X-RateLimit-Reset / RateLimit-Reset 决定 open 时长，没有时按退避时长
+    - open：不放行，请求在 TransferScheduler 中排队等待；退避时长 OPEN_SECONDS 起每次翻倍，不超过 MAX_OPEN_SECONDS
+    - half-open：open 到期后只放行一个试探请求，成功则 closed（记录恢复耗时），失败则再次 open
+    """
+
+    FAILURE_THRESHOLD = 5
+    FAILURE_STATUS = (500, 502, 503, 504)
+    THROTTLE_STATUS = (429, 503)
+    OPEN_SECONDS = 5
+    MAX_OPEN_SECONDS = 300
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hosts = {}
+
+    def _host_locked(self, host):
+        state = self.hosts.get(host)
+        if state is None:
+            state = {
+                "state": "closed",
+                "failures": 0,
+                "opens": 0,
+                "open_until": 0.0,
+                "probing": False,
+                "outage_started": 0.0,
+                "trips": 0,
+                "recoveries": [],
+            }
+            self.hosts[host] = state
+        return state
+
+    @staticmethod
+    def retry_after(headers, now=None):
+        """从响应头读出服务器要求的等待秒数；没有时返回 None。"""
+        if not headers:
+            return None
+        now = time.time() if now is None else now
+        raw = str(headers.get("Retry-After", "") or "").strip()
+        if raw != "":
+            try:
+                return max(0.0, float(raw))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(raw).timestamp() - now)
+            except (TypeError, ValueError, IndexError, OverflowError):
+                pass
+        remaining = str(headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining", "")) or "").strip()
+        reset = str(headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset", "")) or "").strip()
+        if remaining == "0" and reset != "":
+            try:
+                value = float(reset)
+            except ValueError:
+                return None
+            # 大于 1e9 的是 Unix 时间戳，否则是剩余秒数
+            return max(0.0, value - now if value > 1e9 else value)
+        return None
+
+    @classmethod
+    def is_throttle(cls, status):
+        return status in cls.THROTTLE_STATUS
+
+    def is_open(self, host):
+        with self._lock:
+            state = self.hosts.get(host)
+            return state is not None and state["state"] != "closed"
+
+    def allow(self, host):
+        """是否放行一个请求；open 到期时转为 half-open 并只放行这一个试探请求。"""
+        with self._lock:
+            state = self.hosts.get(host)
+            if state is None or state["state"] == "closed":
+                return True
+            if state["state"] == "open":
+                if time.monotonic() < state["open_until"]:
+                    return False
+                state["state"] = "half-open"
+                state["probing"] = False
+                print(f"[breaker] half-open host={host}")
+            if state["probing"]:
+                return False
+            state["probing"] = True
+            return True
+
+    def release(self, host):
+        # 试探请求没有报告结果（被中断）时，允许下一个请求继续试探
+        with self._lock:
+            state = self.hosts.get(host)
+            if state is not None and state["state"] == "half-open":
+                state["probing"] = False
+
+    def _open_locked(self, host, state, seconds, reason):
+        now = time.monotonic()
+        if state["state"] == "closed":
+            state["outage_started"] = now
+            state["trips"] += 1
+        state["opens"] += 1
+        if seconds is None:
+            seconds = self.OPEN_SECONDS * 2 ** (state["opens"] - 1)
+        seconds = min(self.MAX_OPEN_SECONDS, max(0.0, seconds))
+        state["state"] = "open"
+        state["probing"] = False
+        state["failures"] = 0
+        state["open_until"] = now + seconds
+        print(f"[breaker] open host={host} for {seconds:.1f}s ({reason})")
+        return seconds
+
+    def record(self, host, ok, status=None, headers=None, connection_error=False):
+        """报告一次请求结果；返回本次导致熔断的 open 秒数（未熔断为 0）。"""
+        wait = self.retry_after(headers)
+        with self._lock:
+            state = self._host_locked(host)
+            if state["state"] == "open":
+                # open 期间仍在途的请求陆续返回，不重复计算
+                if not ok and self.is_throttle(status) and wait is not None:
+                    state["open_until"] = max(state["open_until"], time.monotonic() + min(wait, self.MAX_OPEN_SECONDS))
+                return 0
+            failed = not ok and (connection_error or status in self.FAILURE_STATUS or status == 429)
+            if not failed:
+                if state["state"] == "half-open":
+                    recovered = time.monotonic() - state["outage_started"]
+                    state["recoveries"].append(recovered)
+                    print(f"[breaker] closed host={host} recovered in {recovered:.1f}s")
+                state["state"] = "closed"
+                state["failures"] = 0
+                state["opens"] = 0
+                state["probing"] = False
+                if ok and wait is not None and wait > 0:
+                    # 限流配额已用完：在重置前不再发出请求
+                    return self._open_locked(host, state, wait, "rate limit exhausted")
+                return 0
+            if state["state"] == "half-open":
+                return self._open_locked(host, state, wait, f"probe failed status={status}")
+            if status == 429 or (status == 503 and wait is not None):
+                return self._open_locked(host, state, wait, f"status={status}")
+            state["failures"] += 1
+            if state["failures"] >= self.FAILURE_THRESHOLD:
+                return self._open_locked(host, state, wait, f"{state['failures']} consecutive failures")
+            return 0
+
+    def stats(self, hosts=None):
+        with self._lock:
+            return [
+                {
+                    "host": host,
+                    "state": state["state"],
+                    "trips": state["trips"],
+                    "recoverySeconds": [round(value, 2) for value in state["recoveries"]],
+                }
+                for host, state in self.hosts.items()
+                if hosts is None or host in hosts
+            ]
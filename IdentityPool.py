@@ -0,0 +1,175 @@
+import random
+import threading
+import time
+from collections import deque
+
+
+class IdentityPool:
+    """下载器的请求头身份池：按健康度为每个分片请求挑选身份。
+
+    每个身份记录最近 WINDOW 次请求的成败、响应延迟（EWMA）与被拦截（401/403）次数：
+    （429/503 是主机级限流，由 HostCircuitBreaker 处理，不计入身份）
+    - 选择权重 = 平滑成功率² / (0.2 + 延迟秒)，健康且响应快的身份承担更多请求
+    - 连续被拦截 QUARANTINE_AFTER 次的身份隔离一段时间（每次隔离时长翻倍，有上限），到期后重新参与
+    - 未隔离的身份少于 MIN_HEALTHY 个时，调用 factory 生成新身份，池大小不超过 MAX_SIZE
+    """
+
+    WINDOW = 30
+    LATENCY_ALPHA = 0.3
+    BLOCKING_STATUS = (401, 403)
+    QUARANTINE_AFTER = 3
+    QUARANTINE_SECONDS = 30
+    MAX_QUARANTINE_SECONDS = 300
+    MIN_HEALTHY = 2
+    MAX_SIZE = 8
+
+    def __init__(self, headers_list, factory=None):
+        self.factory = factory if callable(factory) else None
+        self._lock = threading.Lock()
+        self.identities = []
+        for headers in headers_list:
+            self._append(headers)
+
+    def __len__(self):
+        return len(self.identities)
+
+    def _append(self, headers):
+        self.identities.append(
+            {
+                "headers": dict(headers),
+                "outcomes": deque(maxlen=self.WINDOW),
+                "requests": 0,
+                "ok": 0,
+                "blocked": 0,
+                "latency": None,
+                "consecutive_blocks": 0,
+                "quarantines": 0,
+                "quarantined_until": 0.0,
+            }
+        )
+
+    @staticmethod
+    def _success_rate(identity):
+        outcomes = identity["outcomes"]
+        return (sum(outcomes) + 1) / (len(outcomes) + 2)
+
+    def _weight(self, identity, default_latency):
+        latency = identity["latency"] if identity["latency"] is not None else default_latency
+        return self._success_rate(identity) ** 2 / (0.2 + latency)
+
+    def _healthy_indexes(self, now):
+        return [index for index, identity in enumerate(self.identities) if identity["quarantined_until"] <= now]
+
+    def _grow_locked(self, now):
+        # 调用方持有锁；返回新增的身份数
+        added = 0
+        while (
+            self.factory is not None
+            and len(self._healthy_indexes(now)) < self.MIN_HEALTHY
+            and len(self.identities) < self.MAX_SIZE
+        ):
+            try:
+                headers = self.factory()
+            except Exception:
+                break
+            if not headers:
+                break
+            self._append(headers)
+            added += 1
+        return added
+
+    def _weights_locked(self, indexes):
+        measured = [self.identities[index]["latency"] for index in indexes if self.identities[index]["latency"] is not None]
+        default_latency = sum(measured) / len(measured) if measured else 1.0
+        return [self._weight(self.identities[index], default_latency) for index in indexes]
+
+    def choose(self):
+        """按权重随机选择一个未隔离的身份；全部隔离时返回最早解除隔离的身份。"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self.identities) == 0:
+                return -1
+            added = self._grow_locked(now)
+            size = len(self.identities)
+            healthy = self._healthy_indexes(now)
+            if len(healthy) == 0:
+                index = min(range(size), key=lambda item: self.identities[item]["quarantined_until"])
+            else:
+                index = random.choices(healthy, weights=self._weights_locked(healthy))[0]
+        if added > 0:
+            print(f"[download][identity] pool grow +{added} size={size}")
+        return index
+
+    def best(self):
+        """当前权重最高的未隔离身份（用于播放列表等单次请求）。"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self.identities) == 0:
+                return -1
+            healthy = self._healthy_indexes(now) or list(range(len(self.identities)))
+            weights = self._weights_locked(healthy)
+            return healthy[max(range(len(healthy)), key=lambda item: weights[item])]
+
+    def headers(self, index):
+        with self._lock:
+            if index < 0 or index >= len(self.identities):
+                return {}
+            return dict(self.identities[index]["headers"])
+
+    def healthy_count(self):
+        with self._lock:
+            return len(self._healthy_indexes(time.monotonic()))
+
+    def record(self, index, ok, latency=None, status=None):
+        quarantine_seconds = 0
+        with self._lock:
+            if index < 0 or index >= len(self.identities):
+                return
+            identity = self.identities[index]
+            identity["requests"] += 1
+            identity["outcomes"].append(1 if ok else 0)
+            if ok:
+                identity["ok"] += 1
+                identity["consecutive_blocks"] = 0
+                if latency is not None:
+                    if identity["latency"] is None:
+                        identity["latency"] = float(latency)
+                    else:
+                        alpha = self.LATENCY_ALPHA
+                        identity["latency"] = (1 - alpha) * identity["latency"] + alpha * float(latency)
+            elif status in self.BLOCKING_STATUS:
+                identity["blocked"] += 1
+                identity["consecutive_blocks"] += 1
+                if identity["consecutive_blocks"] >= self.QUARANTINE_AFTER:
+                    identity["quarantines"] += 1
+                    identity["consecutive_blocks"] = 0
+                    quarantine_seconds = min(
+                        self.MAX_QUARANTINE_SECONDS,
+                        self.QUARANTINE_SECONDS * 2 ** (identity["quarantines"] - 1),
+                    )
+                    identity["quarantined_until"] = time.monotonic() + quarantine_seconds
+        if quarantine_seconds > 0:
+            print(
+                f"[download][identity] quarantine identity={index + 1} status={status} "
+                f"for {quarantine_seconds}s"
+            )
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "identity": index + 1,
+                    "userAgent": identity["headers"].get("user-agent", ""),
+                    "requests": identity["requests"],
+                    "ok": identity["ok"],
+                    "blocked": identity["blocked"],
+                    "successRate": (
+                        round(sum(identity["outcomes"]) / len(identity["outcomes"]), 4) if identity["outcomes"] else None
+                    ),
+                    "latencyMs": round(identity["latency"] * 1000) if identity["latency"] is not None else None,
+                    "quarantines": identity["quarantines"],
+                    "quarantined": identity["quarantined_until"] > now,
+                }
+                for index, identity in enumerate(self.identities)
+            ]
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from datetime import datetime
 
 # discarded = {'discarded':True} # 定义一个用于填充，需要丢弃的默认参数
@@ -53,9 +54,15 @@ class JsonProcessor:
     def write(self):
         # 创建文件夹
         os.makedirs(self.fileDir, exist_ok=True)
-        # 'w'模式下 文件存在会覆盖 文件不存在会新建
-        with open(self.filePath, 'w', encoding='utf-8') as file:
-            json.dump(self.data, file, ensure_ascii=False, indent=4)
+        # 先写同目录下的临时文件再替换，写到一半中断或多个线程同时写时不会留下残缺的文件
+        temp_path = f'{self.filePath}.tmp-{os.getpid()}-{threading.get_ident()}'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self.data, file, ensure_ascii=False, indent=4)
+            os.replace(temp_path, self.filePath)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
     def __getitem__(self, item):
         if item not in list(self.data.keys()):
@@ -71,6 +78,75 @@ class JsonProcessor:
     def __str__(self):
         return str(self.data)
 
+# config/cache 下按键存放的小型 JSON 存储（监测计时画像、策略胜场、监测结果缓存）的公共部分
+class JsonStore:
+    """同一子类、同一路径在进程内共用一个实例（shared）；修改后置 _dirty，flush() 时经 JsonProcessor 写回。
+
+    子类只提供条目格式与合并逻辑：_parse_entry 校验读入的每个条目（不合法返回 None），
+    _entry_time 给出条目的时间戳，条目数超过 MAX_ENTRIES 时写回前淘汰最旧的。
+    """
+
+    MAX_ENTRIES = 0  # 0 表示不限
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._data = self._load()
+
+    @classmethod
+    def shared(cls, path):
+        key = (cls.__name__, os.path.normcase(os.path.abspath(path)))
+        with cls._instances_lock:
+            instance = JsonStore._instances.get(key)
+            if instance is None:
+                instance = cls(path)
+                JsonStore._instances[key] = instance
+            return instance
+
+    @staticmethod
+    def _parse_entry(entry):
+        return entry if isinstance(entry, dict) else None
+
+    @staticmethod
+    def _entry_time(entry):
+        return entry.get("updated", 0)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            payload = JsonProcessor(self.path, cover=False).data
+        except ValueError:
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        data = {}
+        for key, entry in payload.items():
+            parsed = self._parse_entry(entry)
+            if parsed is not None:
+                data[str(key)] = parsed
+        return data
+
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            if self.MAX_ENTRIES > 0 and len(self._data) > self.MAX_ENTRIES:
+                ordered = sorted(self._data.items(), key=lambda item: self._entry_time(item[1]), reverse=True)
+                self._data = dict(ordered[: self.MAX_ENTRIES])
+            payload = json.loads(json.dumps(self._data))
+            self._dirty = False
+        try:
+            JsonProcessor(self.path, payload)
+        except OSError:
+            with self._lock:
+                self._dirty = True
+
+
 class ConfigJson(JsonProcessor):
     def __init__(self):
         config_dir = os.path.join(os.getcwd(), 'config')
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import time
+
+from JsonProcessor import JsonStore
+
+
+class MonitorCache(JsonStore):
+    """页面 URL → 监测结果（有序的 possible / predicted 与会话信息）的磁盘缓存。
+
+    键为规范化页面 URL 与配置指纹（规则文件、递归深度、无界面等）的摘要，配置变化后自然失效。
+    过期时间在读取时按调用方给出的 ttl 判断，调整 ttl 对已有条目立即生效。
+    条目数超过 MAX_ENTRIES 时淘汰最早写入的。
+    """
+
+    MAX_ENTRIES = 1000
+
+    @staticmethod
+    def make_key(url, fingerprint):
+        return hashlib.sha1(f"{url}\n{fingerprint}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _parse_entry(entry):
+        if not isinstance(entry, dict):
+            return None
+        if not isinstance(entry.get("possible"), list) or not isinstance(entry.get("predicted"), list):
+            return None
+        if not isinstance(entry.get("stored"), (int, float)):
+            return None
+        return entry
+
+    @staticmethod
+    def _entry_time(entry):
+        return entry["stored"]
+
+    def get(self, key, ttl_seconds):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry["stored"] > ttl_seconds:
+                del self._data[key]
+                self._dirty = True
+                return None
+            return json.loads(json.dumps(entry))
+
+    def put(self, key, url, possible, predicted, session_hints):
+        entry = {
+            "url": url,
+            "stored": time.time(),
+            "possible": list(possible),
+            "predicted": list(predicted),
+            "session_hints": session_hints if isinstance(session_hints, dict) else {},
+        }
+        with self._lock:
+            self._data[key] = json.loads(json.dumps(entry))
+            self._dirty = True
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self._dirty = True
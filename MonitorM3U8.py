@@ -1,16 +1,27 @@
-import base64
-import fnmatch
+import hashlib
 import json
 import os
 import random
 import re
+import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import parse_qs, quote, unquote, urldefrag, urljoin, urlparse, urlunparse
 
 import requests
 from playwright.sync_api import sync_playwright
 
+from BrowserProfiles import BrowserProfiles
+from LruCache import LruCache
+from MonitorCache import MonitorCache
+from ProxyPool import ProxyPool
+from RuleIndex import RuleIndex
+from StrategyStats import StrategyStats
+from TimingProfiles import TimingProfiles
+from TransferScheduler import TransferScheduler
+from UrlExtractor import UrlExtractor
+
 
 class MonitorInterrupted(BaseException):
     pass
@@ -53,6 +64,398 @@ class MonitorM3U8:
         "config",
         "monitor.rules.json",
     )
+    # 监测过程产生的本地数据（耗时画像等），可用 M3U8_MONITOR_CACHE_DIR 覆盖
+    DEFAULT_CACHE_DIR = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "config",
+        "cache",
+    )
+    TIMING_PROFILE_FILE = "timing.profiles.json"
+    BROWSER_PROFILE_DIR = "profiles"
+    STRATEGY_STATS_FILE = "strategy.stats.json"
+    RESULT_CACHE_FILE = "monitor.results.json"
+    RESULT_CACHE_TTL_SECONDS = 1800
+    BROWSER_PROFILE_MAX_MB = 1024
+    # 内置 probe_player_ready 的等待预算；播放器就绪明显更快的站点按比例缩短规则中的随机等待
+    PLAYER_READY_REFERENCE_MS = 2800
+    RULE_WAIT_SCALE_MIN = 0.35
+    RULE_WAIT_FLOOR_MS = 60
+    PAGE_HOOK_BINDING = "__m3u8HookReport"
+    # 页面内钩子：在页面触达播放列表的第一时间上报 URL，只有命中的 URL 会经过 Playwright 通道
+    PAGE_HOOK_SCRIPT = r"""
+        (() => {
+            if (window.__m3u8HookInstalled) return;
+            window.__m3u8HookInstalled = true;
+            const bindingName = "__m3u8HookReport";
+            const urlHint = /m3u8/i;
+            const textPattern = /(?:https?:\\?\/\\?\/|\/)[^\s'"<>()]*?\.m3u8[^\s'"<>()]*/gi;
+            const maxScanChars = 524288;
+            const seen = new Set();
+            const queue = [];
+            let flushTimer = null;
+
+            const flush = () => {
+                flushTimer = null;
+                const fn = window[bindingName];
+                if (typeof fn !== "function") {
+                    flushTimer = setTimeout(flush, 100);
+                    return;
+                }
+                while (queue.length) {
+                    const item = queue.shift();
+                    try { fn(item[0], item[1], location.href); } catch (e) {}
+                }
+            };
+            const report = (kind, raw) => {
+                if (raw === undefined || raw === null) return;
+                const url = String(raw);
+                if (kind !== "ready" && kind !== "mse" && !urlHint.test(url)) return;
+                if (url.startsWith("blob:") || url.startsWith("data:")) return;
+                const key = kind + "|" + url;
+                if (seen.has(key)) return;
+                seen.add(key);
+                queue.push([kind, url]);
+                if (flushTimer === null) flushTimer = setTimeout(flush, 0);
+            };
+            const scanBody = (kind, text) => {
+                if (typeof text !== "string" || text === "") return;
+                const head = text.length > maxScanChars ? text.slice(0, maxScanChars) : text;
+                if (!urlHint.test(head)) return;
+                for (const match of head.matchAll(textPattern)) {
+                    report(kind, match[0].replace(/\\\//g, "/"));
+                }
+            };
+
+            const origFetch = window.fetch;
+            if (typeof origFetch === "function") {
+                window.fetch = function (input, init) {
+                    try {
+                        report("fetch", input && typeof input === "object" && "url" in input ? input.url : input);
+                    } catch (e) {}
+                    const promise = origFetch.apply(this, arguments);
+                    promise.then((resp) => {
+                        try {
+                            const ct = (resp.headers.get("content-type") || "").toLowerCase();
+                            const len = Number(resp.headers.get("content-length") || 0);
+                            if (len > maxScanChars) return;
+                            if (ct === "" || /mpegurl|json|text|javascript|xml/.test(ct)) {
+                                resp.clone().text().then((t) => scanBody("fetch", t)).catch(() => {});
+                            }
+                        } catch (e) {}
+                    }).catch(() => {});
+                    return promise;
+                };
+            }
+
+            const XHR = window.XMLHttpRequest;
+            if (XHR && XHR.prototype) {
+                const origOpen = XHR.prototype.open;
+                const origSend = XHR.prototype.send;
+                XHR.prototype.open = function (method, url) {
+                    try { report("xhr", url); } catch (e) {}
+                    return origOpen.apply(this, arguments);
+                };
+                XHR.prototype.send = function () {
+                    try {
+                        this.addEventListener("load", () => {
+                            try {
+                                const rt = this.responseType;
+                                if (rt === "" || rt === "text") {
+                                    scanBody("xhr", this.responseText);
+                                }
+                            } catch (e) {}
+                        });
+                    } catch (e) {}
+                    return origSend.apply(this, arguments);
+                };
+            }
+
+            const hookSrc = (proto, kind) => {
+                if (!proto) return;
+                const desc = Object.getOwnPropertyDescriptor(proto, "src");
+                if (!desc || typeof desc.set !== "function") return;
+                Object.defineProperty(proto, "src", {
+                    configurable: true,
+                    enumerable: desc.enumerable,
+                    get: desc.get,
+                    set(value) {
+                        report(kind, value);
+                        return desc.set.call(this, value);
+                    },
+                });
+            };
+            hookSrc(window.HTMLMediaElement && HTMLMediaElement.prototype, "media");
+            hookSrc(window.HTMLSourceElement && HTMLSourceElement.prototype, "source");
+            const origSetAttribute = Element.prototype.setAttribute;
+            Element.prototype.setAttribute = function (name, value) {
+                try {
+                    if (
+                        String(name).toLowerCase() === "src"
+                        && ((window.HTMLMediaElement && this instanceof HTMLMediaElement)
+                            || (window.HTMLSourceElement && this instanceof HTMLSourceElement))
+                    ) {
+                        report("media", value);
+                    }
+                } catch (e) {}
+                return origSetAttribute.apply(this, arguments);
+            };
+
+            if (window.MediaSource && MediaSource.prototype && MediaSource.prototype.addSourceBuffer) {
+                const origAddSourceBuffer = MediaSource.prototype.addSourceBuffer;
+                MediaSource.prototype.addSourceBuffer = function (mime) {
+                    report("mse", String(mime || ""));
+                    return origAddSourceBuffer.apply(this, arguments);
+                };
+            }
+
+            const wrapHls = (Hls) => {
+                try {
+                    const proto = Hls && Hls.prototype;
+                    if (proto && typeof proto.loadSource === "function" && !proto.__m3u8HookWrapped) {
+                        const origLoadSource = proto.loadSource;
+                        proto.loadSource = function (src) {
+                            report("hls.js", src);
+                            return origLoadSource.apply(this, arguments);
+                        };
+                        proto.__m3u8HookWrapped = true;
+                    }
+                } catch (e) {}
+                return Hls;
+            };
+            let hlsRef = wrapHls(window.Hls);
+            try {
+                Object.defineProperty(window, "Hls", {
+                    configurable: true,
+                    get() { return hlsRef; },
+                    set(value) { hlsRef = wrapHls(value); },
+                });
+            } catch (e) {}
+
+            const scanStaticMedia = () => {
+                try {
+                    document.querySelectorAll("video[src], audio[src], source[src]").forEach((el) => {
+                        report("media", el.getAttribute("src"));
+                    });
+                } catch (e) {}
+            };
+            document.addEventListener("DOMContentLoaded", scanStaticMedia, { once: true });
+            report("ready", location.href);
+        })();
+    """
+    # 只回传 DOM 中与 m3u8 / player_ 参数块相关的片段，避免整页序列化跨进程传输
+    PAGE_SNIPPET_SCRIPT = r"""
+        () => {
+            const root = document.documentElement;
+            const html = root ? root.outerHTML : "";
+            const pattern = /m3u8|player_[a-z0-9_]+\s*=/gi;
+            const radius = 512;
+            const blockLimit = 16384;
+            const totalLimit = 262144;
+            const snippets = [];
+            let lastEnd = -1;
+            let total = 0;
+            let match;
+            while ((match = pattern.exec(html)) !== null) {
+                let start = Math.max(0, match.index - radius);
+                let end = Math.min(html.length, match.index + radius);
+                if (match[0].toLowerCase().startsWith("player_")) {
+                    const close = html.indexOf("</script>", match.index);
+                    start = match.index;
+                    end = Math.min(close === -1 ? html.length : close, match.index + blockLimit);
+                }
+                if (start <= lastEnd && snippets.length > 0) {
+                    if (end > lastEnd) {
+                        snippets[snippets.length - 1] += html.slice(lastEnd, end);
+                        total += end - lastEnd;
+                        lastEnd = end;
+                    }
+                } else {
+                    snippets.push(html.slice(start, end));
+                    total += end - start;
+                    lastEnd = end;
+                }
+                if (pattern.lastIndex < end) pattern.lastIndex = end;
+                if (total > totalLimit) break;
+            }
+            return snippets;
+        }
+    """
+    # 批量选择器探测：一次 evaluate 返回每个选择器的 [匹配数量, 前 limit 个元素的可见位图]。
+    # 非标准 CSS（text=、xpath、:has-text 等）或只在 shadow DOM 中命中的选择器返回 null，交回 Playwright 逐个查询。
+    # 已发现的 shadow root 缓存在页面上（window.__m3u8ShadowRoots）：首次全量遍历，之后只遍历 MutationObserver
+    # 记录的新增节点；attachShadow 挂到已有元素上不产生 DOM 变动，最多每 SHADOW_RESCAN_MS 全量补查一次。
+    # 只有 document 中没有匹配的选择器才会用到这份缓存。
+    SELECTOR_PROBE_FUNCTION = r"""
+        (selectors, limit) => {
+            const SHADOW_RESCAN_MS = 1000;
+            const SHADOW_MAX_PENDING = 2000;
+            const shadowRoots = () => {
+                let cache = window.__m3u8ShadowRoots;
+                if (!cache) {
+                    cache = window.__m3u8ShadowRoots = { roots: [], known: new WeakSet(), added: [], scannedAt: 0 };
+                    cache.observer = new MutationObserver((records) => {
+                        for (const record of records) {
+                            for (const node of record.addedNodes) {
+                                if (node.nodeType === 1) cache.added.push(node);
+                            }
+                        }
+                        if (cache.added.length > SHADOW_MAX_PENDING) {
+                            // 长时间没有探测而页面持续变动：丢弃记录，下次探测时全量遍历
+                            cache.added = [];
+                            cache.scannedAt = 0;
+                        }
+                    });
+                }
+                const visit = (start) => {
+                    const pending = [start];
+                    while (pending.length) {
+                        const root = pending.pop();
+                        const found = root.shadowRoot ? [root.shadowRoot] : [];
+                        const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+                        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+                            if (node.shadowRoot) found.push(node.shadowRoot);
+                        }
+                        for (const shadow of found) {
+                            if (cache.known.has(shadow)) continue;
+                            cache.known.add(shadow);
+                            cache.roots.push(shadow);
+                            cache.observer.observe(shadow, { childList: true, subtree: true });
+                            pending.push(shadow);
+                        }
+                    }
+                };
+                const now = Date.now();
+                if (now - cache.scannedAt >= SHADOW_RESCAN_MS) {
+                    cache.observer.disconnect();
+                    cache.roots = [];
+                    cache.known = new WeakSet();
+                    cache.added = [];
+                    cache.observer.observe(document, { childList: true, subtree: true });
+                    visit(document);
+                    cache.scannedAt = now;
+                } else {
+                    // 回调是异步的，先同步取出尚未派发的变动记录
+                    cache.observer.takeRecords().forEach((record) => {
+                        for (const node of record.addedNodes) {
+                            if (node.nodeType === 1) cache.added.push(node);
+                        }
+                    });
+                    const added = cache.added;
+                    cache.added = [];
+                    for (const node of added) {
+                        if (node.isConnected) visit(node);
+                    }
+                }
+                return cache.roots.filter((root) => root.host && root.host.isConnected);
+            };
+            let roots = null;
+            const visible = (el) => {
+                const rect = el.getBoundingClientRect();
+                if (!(rect.width > 0 && rect.height > 0)) return false;
+                const style = window.getComputedStyle(el);
+                return !style || style.visibility !== "hidden";
+            };
+            return selectors.map((selector) => {
+                let items;
+                try {
+                    items = document.querySelectorAll(selector);
+                    if (items.length === 0) {
+                        if (roots === null) roots = shadowRoots();
+                        for (const root of roots) {
+                            if (root.querySelector(selector)) return null;
+                        }
+                    }
+                } catch (e) {
+                    return null;
+                }
+                let mask = 0;
+                const upper = Math.min(items.length, limit);
+                for (let i = 0; i < upper; i++) {
+                    if (visible(items[i])) mask |= 1 << i;
+                }
+                return [items.length, mask];
+            });
+        }
+    """
+    SELECTOR_PROBE_SCRIPT = "(args) => (" + SELECTOR_PROBE_FUNCTION.strip() + ")(args[0], args[1])"
+    # 选择器变化监听：MutationObserver 发现探测结果与 baseline 不同即 resolve，超时 resolve changed=false。
+    # 条件本身仍由 Python 侧判断（跨 frame 的 any/all 与定时器），页面只负责“何时值得再查一次”。
+    SELECTOR_WATCH_SCRIPT = (
+        """
+        (args) => new Promise((resolve) => {
+            const [selectors, limit, baseline, timeoutMs] = args;
+            const probe = """
+        + SELECTOR_PROBE_FUNCTION.strip()
+        + """;
+            const expected = JSON.stringify(baseline);
+            // 连续变动（动画、懒加载列表）时两次探测至少间隔 MIN_CHECK_INTERVAL_MS
+            const MIN_CHECK_INTERVAL_MS = 50;
+            let lastCheckAt = 0;
+            let done = false;
+            let queued = false;
+            let observer = null;
+            let interval = null;
+            let timer = null;
+            const finish = (changed) => {
+                if (done) return;
+                done = true;
+                if (observer) observer.disconnect();
+                clearInterval(interval);
+                clearTimeout(timer);
+                window.removeEventListener("resize", schedule, true);
+                document.removeEventListener("transitionend", schedule, true);
+                document.removeEventListener("animationend", schedule, true);
+                resolve({ changed, firedAt: Date.now() });
+            };
+            const check = () => {
+                queued = false;
+                if (done) return;
+                lastCheckAt = Date.now();
+                let current = null;
+                try {
+                    current = JSON.stringify(probe(selectors, limit));
+                } catch (e) {}
+                if (current !== expected) finish(true);
+            };
+            const schedule = () => {
+                if (queued || done) return;
+                queued = true;
+                const wait = lastCheckAt + MIN_CHECK_INTERVAL_MS - Date.now();
+                if (wait > 0) setTimeout(check, wait);
+                else Promise.resolve().then(check);
+            };
+            observer = new MutationObserver(schedule);
+            observer.observe(document.documentElement || document, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+            });
+            window.addEventListener("resize", schedule, true);
+            document.addEventListener("transitionend", schedule, true);
+            document.addEventListener("animationend", schedule, true);
+            // 图片加载等布局变化不产生 DOM 变动，低频补查（页面内执行，不产生 IPC）
+            interval = setInterval(schedule, 250);
+            timer = setTimeout(() => finish(false), timeoutMs);
+            check();
+        })
+    """
+    )
+    SELECTOR_WATCH_CHUNK_MS = 500
+    NORMALIZE_CACHE_SIZE = 8192
+    # 响应体扫描：只扫允许的类型与大小，正则匹配放到有界线程池，避免阻塞 Playwright 事件回调
+    RESPONSE_SCAN_MAX_BYTES = 2 * 1024 * 1024
+    PROBE_TRANSFER_PRIORITY = 2
+    RESPONSE_SCAN_WORKERS = 4
+    RESPONSE_SCAN_MAX_PENDING = 32
+    RESPONSE_SCAN_PROFILE_LIMIT = 500
+    RESPONSE_SCAN_CONTENT_TYPES = ("html", "javascript", "ecmascript", "json", "mpegurl", "xml", "text/plain")
+    RESPONSE_SCAN_EXTENSIONS = {"", "htm", "html", "php", "asp", "aspx", "jsp", "js", "mjs", "json", "m3u8", "txt", "xml"}
+    # 进程级分层统计：http=仅 requests 命中，browser=浏览器命中，fallback=浏览器失败后兜底命中，none=均未命中
+    _tier_stats = {"http": 0, "browser": 0, "fallback": 0, "none": 0}
+    _tier_stats_lock = threading.Lock()
+    # 进程内编译后的规则缓存：rules_path -> ((mtime_ns, size), compiled)，递归子监测与批量任务共用
+    _compiled_rules_cache = {}
+    _compiled_rules_lock = threading.Lock()
 
     @staticmethod
     def _default_user_agent():
@@ -109,7 +512,7 @@ class MonitorM3U8:
         )
         has_range = self._action_has_arg(action, min_key) or self._action_has_arg(action, max_key)
         if not has_range:
-            return base_value
+            return self._scale_rule_wait(base_value)
 
         lower = self._to_int(
             self._action_arg(action, min_key, base_value),
@@ -125,7 +528,7 @@ class MonitorM3U8:
         )
         if lower > upper:
             lower, upper = upper, lower
-        return random.randint(lower, upper)
+        return self._scale_rule_wait(random.randint(lower, upper))
 
     @staticmethod
     def _to_text_list(value):
@@ -158,6 +561,7 @@ class MonitorM3U8:
         monitor_config=None,
         progress_callback=None,
         stop_checker=None,
+        normalize_cache=None,
     ):
         self.URL = URL
         self.possible = set()
@@ -165,25 +569,89 @@ class MonitorM3U8:
         self.page_candidates = set()
         self.url_hints = {}
         self.lock = threading.Lock()
+        # 规范化结果缓存，递归子监测共用同一个实例
+        self.normalize_cache = normalize_cache if isinstance(normalize_cache, LruCache) else LruCache(
+            self.NORMALIZE_CACHE_SIZE
+        )
+        self.url_extractor = UrlExtractor(self._normalize_url)
         self.recursion_enabled = self._to_bool(recursion_enabled, True)
         self.recursion_depth = self._normalize_recursion_depth(
             recursion_depth,
             self.recursion_enabled,
         )
-        self.proxy_config = self._normalize_proxy_config(proxy_config)
+        # 代理池启用时浏览器与探测请求使用池中当前最优的代理
+        self.proxy_config = self._normalize_proxy_config(ProxyPool.resolve_config(proxy_config))
         self.monitor_config = self._normalize_monitor_config(monitor_config)
         self.headless = self.monitor_config["headless"]
         self.interaction_enabled = self.monitor_config["interaction_enabled"]
         self.monitor_tries = self.monitor_config["tries"]
+        self.http_probe_first = self.monitor_config["http_probe_first"]
         self.monitor_headers = self._build_monitor_headers()
         self.verbose_log = self._to_bool(os.getenv("M3U8_MONITOR_VERBOSE", ""), False)
+        self.selector_batch_enabled = self._to_bool(os.getenv("M3U8_MONITOR_SELECTOR_BATCH", "1"), True)
+        self._selector_probe_stats = {"evaluate": 0, "fallback": 0}
+        self.selector_watch_enabled = self._to_bool(os.getenv("M3U8_MONITOR_SELECTOR_WATCH", "1"), True)
+        self.adaptive_timing_enabled = self._to_bool(os.getenv("M3U8_MONITOR_ADAPTIVE_TIMING", "1"), True)
+        self.timing_profiles = TimingProfiles.shared(os.path.join(self._resolve_cache_dir(), self.TIMING_PROFILE_FILE))
+        self.timing_domain = self._domain_key(self.URL)
+        self._attempt_timing = None
+        self._adaptive_timing_active = True
+        self._rule_wait_scale = self._compute_rule_wait_scale()
+        # 持久化浏览器目录（默认关闭）：site=按域名各用一个目录，其它值=使用该名称的共享目录
+        self.persistent_profile = str(os.getenv("M3U8_MONITOR_PERSISTENT_PROFILE", "")).strip()
+        if self.persistent_profile.lower() in {"", "0", "off", "false", "no"}:
+            self.persistent_profile = ""
+        self.browser_profiles = BrowserProfiles(
+            os.path.join(self._resolve_cache_dir(), self.BROWSER_PROFILE_DIR),
+            self._to_int(
+                os.getenv("M3U8_MONITOR_PROFILE_MAX_MB", ""),
+                self.BROWSER_PROFILE_MAX_MB,
+                64,
+                1024 * 1024,
+            )
+            * 1024
+            * 1024,
+        )
+        # 策略竞速（默认关闭）：first-pass 与 retry-pass 在同一浏览器的不同 context 中同时运行
+        self.race_enabled = self._to_bool(os.getenv("M3U8_MONITOR_RACE", ""), False)
+        self.strategy_stats = StrategyStats.shared(os.path.join(self._resolve_cache_dir(), self.STRATEGY_STATS_FILE))
+        self._race_children = []
+        self.log_tag = ""
+        # 内部线程池每个线程启动时调用（调用方用它把这些线程的输出归到所属任务的日志）
+        self.thread_initializer = None
+        # 监测结果缓存（秒，0 为关闭）：有效期内复用同一页面上次的候选，复用前先请求一次播放列表确认仍可用
+        self.result_cache_ttl = self._to_int(
+            os.getenv("M3U8_MONITOR_RESULT_TTL", ""),
+            self.RESULT_CACHE_TTL_SECONDS,
+            0,
+            7 * 24 * 3600,
+        )
+        self.result_cache = MonitorCache.shared(os.path.join(self._resolve_cache_dir(), self.RESULT_CACHE_FILE))
+        self.result_cache_status = "off"
         self.progress_callback = progress_callback if callable(progress_callback) else None
         self.stop_checker = stop_checker if callable(stop_checker) else None
         self._manual_stop_requested = False
+        self._early_stop = False
         self._stop_logged = False
         self._interrupt_check_interval_ms = 120
         self.last_monitor_error = ""
         self.last_blocked_by_client = False
+        self._page_hook_ready = False
+        self._chromium_executable_logged = False
+        self._page_hook_stats = {"reports": 0, "mse": 0}
+        self._scan_executor = None
+        self._scan_futures = set()
+        self._scanned_response_keys = set()
+        self.response_scan_profile = []
+        self._response_scan_stats = {
+            "scanned": 0,
+            "skipped_type": 0,
+            "skipped_size": 0,
+            "dedup": 0,
+            "inline": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+        }
         self.session_hints = {
             "source_url": self.URL,
             "final_url": self.URL,
@@ -242,11 +710,18 @@ class MonitorM3U8:
 
         rules_path = str(data.get("rules_path") or "").strip()
 
+        # 先走纯 HTTP 探测，命中强候选即跳过浏览器；可用环境变量整体关闭
+        http_probe_first = MonitorM3U8._to_bool(data.get("http_probe_first"), True)
+        env_http_first = str(os.getenv("M3U8_MONITOR_HTTP_FIRST", "")).strip()
+        if env_http_first != "":
+            http_probe_first = MonitorM3U8._to_bool(env_http_first, http_probe_first)
+
         return {
             "headless": headless,
             "interaction_enabled": interaction_enabled,
             "tries": tries,
             "rules_path": rules_path,
+            "http_probe_first": http_probe_first,
         }
 
     def _playwright_proxy(self):
@@ -279,7 +754,7 @@ class MonitorM3U8:
         return f"{value:.1f}s"
 
     def _log_monitor(self, message):
-        print(f"\t[monitor] {message}")
+        print(f"\t[monitor] {self.log_tag}{message}")
 
     def _emit_progress(self, event, **kwargs):
         if self.progress_callback is None:
@@ -293,22 +768,38 @@ class MonitorM3U8:
 
     def request_stop(self):
         self._manual_stop_requested = True
-
-    def _is_stop_requested(self):
-        external_requested = False
+        for child in list(self._race_children):
+            child.request_stop()
+
+    def request_early_stop(self):
+        """调用方已拿到足够的候选（例如下载成功数已达标）：提前结束监测，已收集的结果照常缓存、计时照常记录。"""
+        self._early_stop = True
+        for child in list(self._race_children):
+            child.request_early_stop()
+
+    def _is_user_stop(self):
+        # 用户中断（request_stop 或 stop_checker），区别于 request_early_stop
+        if self._manual_stop_requested:
+            return True
         if self.stop_checker is not None:
             try:
-                external_requested = bool(self.stop_checker())
+                return bool(self.stop_checker())
             except Exception:
-                external_requested = False
-        return self._manual_stop_requested or external_requested
+                return False
+        return False
+
+    def _is_stop_requested(self):
+        return self._early_stop or self._is_user_stop()
 
     def _raise_if_stopped(self):
         if not self._is_stop_requested():
             return
         if not self._stop_logged:
             self._stop_logged = True
-            self._log_monitor("interrupt requested, stop probing")
+            if self._is_user_stop():
+                self._log_monitor("interrupt requested, stop probing")
+            else:
+                self._log_monitor("enough candidates collected, stop probing early")
         raise MonitorInterrupted("monitor interrupted")
 
     def _log_verbose(self, message):
@@ -1126,13 +1617,17 @@ class MonitorM3U8:
             path = f"sites[{index}]"
             if not isinstance(site, dict):
                 raise ValueError(f"{path} must be object")
-            extra_site = sorted(set(site.keys()) - {"name", "enabled", "match", "actions", "chains"})
+            extra_site = sorted(
+                set(site.keys()) - {"name", "enabled", "force_browser", "match", "actions", "chains"}
+            )
             if extra_site:
                 raise ValueError(f"{path} has unsupported fields: {extra_site}")
             if "name" in site and not isinstance(site.get("name"), str):
                 raise ValueError(f"{path}.name must be string")
             if "enabled" in site and not isinstance(site.get("enabled"), bool):
                 raise ValueError(f"{path}.enabled must be bool")
+            if "force_browser" in site and not isinstance(site.get("force_browser"), bool):
+                raise ValueError(f"{path}.force_browser must be bool")
 
             match = site.get("match", {})
             if not isinstance(match, dict):
@@ -1232,14 +1727,60 @@ class MonitorM3U8:
             "host_patterns": [item.lower() for item in self._to_text_list(host_value)],
             "url_contains": [item.lower() for item in self._to_text_list(contains_value)],
             "url_regex": url_regex,
+            "force_browser": self._to_bool(source.get("force_browser", False), False),
             "actions": actions,
             "chains": chains,
         }
 
+    @staticmethod
+    def _rules_file_signature(rules_path):
+        try:
+            stat = os.stat(rules_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_monitor_rules(self):
         rules_path = self._resolve_rules_path(self.monitor_config.get("rules_path", ""))
         self._ensure_rules_file(rules_path)
 
+        signature = self._rules_file_signature(rules_path)
+        with self._compiled_rules_lock:
+            cached = self._compiled_rules_cache.get(rules_path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+
+        compiled, loaded_ok = self._compile_monitor_rules(rules_path)
+        # 读取失败会修复并改写文件，此时不缓存，下次按新文件重新编译
+        if loaded_ok and signature is not None and signature == self._rules_file_signature(rules_path):
+            with self._compiled_rules_lock:
+                self._compiled_rules_cache[rules_path] = (signature, compiled)
+        return compiled
+
+    @classmethod
+    def clear_compiled_rules_cache(cls):
+        with cls._compiled_rules_lock:
+            cls._compiled_rules_cache.clear()
+
+    def _compile_action_plan(self, actions):
+        # 预先解析动作类型与 when 条件，执行时只做整数比较
+        plan = []
+        for action in actions:
+            if not isinstance(action, dict):
+                continue
+            args = action.get("args", {})
+            args_when = args.get("when", "") if isinstance(args, dict) else ""
+            plan.append(
+                {
+                    "type": str(action.get("type", "")).strip().lower(),
+                    "when": self._normalize_action_when_tokens(action.get("when", args_when)),
+                    "action": action,
+                }
+            )
+        return plan
+
+    def _compile_monitor_rules(self, rules_path):
+        loaded_ok = True
         payload = {}
         try:
             with open(rules_path, "r", encoding="utf-8") as f:
@@ -1248,13 +1789,16 @@ class MonitorM3U8:
         except Exception as exc:
             self._log_monitor(f"rules load failed: {exc}")
             payload = self._repair_rules_file(rules_path)
+            loaded_ok = False
 
         default_global = {
             "name": "global",
             "host_patterns": [],
             "url_contains": [],
             "url_regex": "",
+            "force_browser": False,
             "actions": [],
+            "plan": [],
             "chains": {},
         }
         normalized = {
@@ -1262,10 +1806,11 @@ class MonitorM3U8:
             "chains": self._normalize_chain_map(payload.get("chains", {})),
             "global": default_global,
             "sites": [],
+            "site_index": RuleIndex([]),
         }
 
         if not isinstance(payload, dict):
-            return normalized
+            return normalized, loaded_ok
 
         global_source = payload.get("global")
         if not isinstance(global_source, dict):
@@ -1276,6 +1821,7 @@ class MonitorM3U8:
             global_rule["host_patterns"] = []
             global_rule["url_contains"] = []
             global_rule["url_regex"] = ""
+            global_rule["force_browser"] = False
             merged_global_chains = dict(normalized["chains"])
             merged_global_chains.update(global_rule.get("chains", {}))
             global_rule["chains"] = merged_global_chains
@@ -1283,6 +1829,7 @@ class MonitorM3U8:
                 global_rule.get("actions", []),
                 merged_global_chains,
             )
+            global_rule["plan"] = self._compile_action_plan(global_rule["actions"])
             normalized["chains"] = merged_global_chains
             normalized["global"] = global_rule
 
@@ -1298,41 +1845,11 @@ class MonitorM3U8:
                         normalized_site.get("actions", []),
                         merged_site_chains,
                     )
+                    normalized_site["plan"] = self._compile_action_plan(normalized_site["actions"])
                     normalized["sites"].append(normalized_site)
 
-        return normalized
-
-    def _rule_matches_url(self, rule, url):
-        if not isinstance(rule, dict):
-            return False
-
-        normalized_url = self._normalize_url(url) or str(url or "")
-        lowered_url = normalized_url.lower()
-        parsed = urlparse(normalized_url)
-        host = (parsed.hostname or "").lower()
-
-        host_patterns = rule.get("host_patterns", [])
-        host_match = None
-        if host_patterns:
-            host_match = any(fnmatch.fnmatch(host, pattern) for pattern in host_patterns)
-
-        url_contains = rule.get("url_contains", [])
-        contains_match = None
-        if url_contains:
-            contains_match = any(keyword in lowered_url for keyword in url_contains)
-
-        url_regex = str(rule.get("url_regex", "")).strip()
-        regex_match = None
-        if url_regex != "":
-            try:
-                regex_match = re.search(url_regex, normalized_url, flags=re.IGNORECASE) is not None
-            except re.error:
-                regex_match = False
-
-        checks = [value for value in (host_match, contains_match, regex_match) if value is not None]
-        if len(checks) == 0:
-            return True
-        return any(checks)
+        normalized["site_index"] = RuleIndex(normalized["sites"])
+        return normalized, loaded_ok
 
     def _resolve_active_interaction_rule(self, target_url):
         global_rule = self.monitor_rules.get("global", {})
@@ -1341,12 +1858,19 @@ class MonitorM3U8:
             "source": self.monitor_rules.get("source", ""),
             "matched_sites": [],
             "matched_site_details": [],
+            "force_browser": False,
             "actions": list(global_rule.get("actions", [])),
+            "plan": list(global_rule.get("plan", [])),
         }
 
-        for site_rule in self.monitor_rules.get("sites", []):
-            if not self._rule_matches_url(site_rule, target_url):
-                continue
+        normalized_url = self._normalize_url(target_url) or str(target_url or "")
+        host = (urlparse(normalized_url).hostname or "").lower()
+        sites = self.monitor_rules.get("sites", [])
+        site_index = self.monitor_rules.get("site_index")
+        if site_index is None:
+            site_index = RuleIndex(sites)
+        for index in site_index.match(host, normalized_url, normalized_url.lower()):
+            site_rule = sites[index]
             site_name = site_rule.get("name", "site")
             active["matched_sites"].append(site_name)
             active["matched_site_details"].append(
@@ -1355,10 +1879,14 @@ class MonitorM3U8:
                     "host_patterns": list(site_rule.get("host_patterns", [])),
                     "url_contains": list(site_rule.get("url_contains", [])),
                     "url_regex": str(site_rule.get("url_regex", "")),
+                    "force_browser": bool(site_rule.get("force_browser", False)),
                     "actions_count": len(site_rule.get("actions", [])),
                 }
             )
+            if site_rule.get("force_browser", False):
+                active["force_browser"] = True
             active["actions"].extend(site_rule.get("actions", []))
+            active["plan"].extend(site_rule.get("plan", []))
 
         if active["matched_sites"]:
             active["name"] = ",".join(active["matched_sites"])
@@ -1438,6 +1966,14 @@ class MonitorM3U8:
             return ""
 
     def _normalize_url(self, url, base_url=""):
+        if not isinstance(url, str) or not isinstance(base_url, str):
+            return self._normalize_url_uncached(url, base_url)
+        return self.normalize_cache.get_or_compute(
+            (url, base_url),
+            lambda: self._normalize_url_uncached(url, base_url),
+        )
+
+    def _normalize_url_uncached(self, url, base_url=""):
         if not isinstance(url, str):
             return ""
 
@@ -1544,6 +2080,8 @@ class MonitorM3U8:
         with self.lock:
             candidate_added = candidate not in self.possible
             self.possible.add(candidate)
+            if candidate_added:
+                self._mark_attempt_timing("first_m3u8_at")
             if referer:
                 self.url_hints[candidate] = referer
                 self.session_hints["referer_map"][candidate] = referer
@@ -1566,10 +2104,14 @@ class MonitorM3U8:
             predicted_count = len(self.predicted)
 
         if candidate_added or predicted_added:
+            # url/strong/referer 供调用方在监测结束前先行下载强候选
             self._emit_progress(
                 "candidate",
                 possible=possible_count,
                 predicted=predicted_count,
+                url=candidate if candidate_added else "",
+                strong=candidate_added and self._m3u8_priority(candidate) >= 10,
+                referer=referer,
             )
 
         # 兼容解析页格式：?url=https://real.cdn/xx/index.m3u8
@@ -1595,98 +2137,8 @@ class MonitorM3U8:
                         self.url_hints[nested] = referer
                         self.session_hints["referer_map"][nested] = referer
 
-    def _extract_urls_from_text(self, text, base_url):
-        found = set()
-        if not isinstance(text, str) or text == "":
-            return found
-
-        absolute_urls = re.findall(r"https?://[^\s\'\"<>()]+", text, flags=re.IGNORECASE)
-        escaped_urls = re.findall(r"https?:\\\\/\\\\/[^\s\'\"<>()]+", text, flags=re.IGNORECASE)
-        relative_m3u8 = re.findall(r"[\"']([^\"'\s]+?\.m3u8[^\"'\s]*)[\"']", text, flags=re.IGNORECASE)
-
-        for raw_url in absolute_urls + escaped_urls:
-            normalized = self._normalize_url(raw_url.replace("\\/", "/"), base_url)
-            if normalized != "":
-                found.add(normalized)
-
-        for raw_url in relative_m3u8:
-            normalized = self._normalize_url(raw_url, base_url)
-            if normalized != "":
-                found.add(normalized)
-
-        return found
-
-    @staticmethod
-    def _decode_player_url(raw_url, encrypt_value="0"):
-        value = str(raw_url).strip()
-        if value == "":
-            return ""
-        encrypt = str(encrypt_value).strip()
-        try:
-            if encrypt == "1":
-                return unquote(value)
-            if encrypt == "2":
-                b64_source = value
-                if "%" in value:
-                    b64_source = unquote(value)
-                padded = b64_source + "=" * ((4 - len(b64_source) % 4) % 4)
-                decoded = base64.b64decode(padded).decode("utf-8", errors="ignore")
-                return unquote(decoded)
-        except Exception:
-            return value
-        return value
-
-    def _extract_player_config_candidates(self, text, base_url):
-        found = set()
-        if not isinstance(text, str) or text == "":
-            return found
-
-        # 常见 MacCMS/XGPlayer 参数块：player_xxx = {...}
-        for block in re.findall(r"player_[a-z0-9_]+\s*=\s*(\{.*?\})\s*;", text, flags=re.IGNORECASE | re.DOTALL):
-            encrypt_match = re.search(
-                r"[\"']encrypt[\"']\s*:\s*[\"']?([0-9]+)[\"']?",
-                block,
-                flags=re.IGNORECASE,
-            )
-            encrypt = encrypt_match.group(1) if encrypt_match else "0"
-
-            for url_match in re.findall(
-                r"[\"']url[\"']\s*:\s*[\"']([^\"']+)[\"']",
-                block,
-                flags=re.IGNORECASE,
-            ):
-                decoded = self._decode_player_url(url_match, encrypt)
-                normalized = self._normalize_url(decoded, base_url)
-                if normalized != "":
-                    found.add(normalized)
-
-            for parse_match in re.findall(
-                r"[\"']parse[\"']\s*:\s*[\"']([^\"']+)[\"']",
-                block,
-                flags=re.IGNORECASE,
-            ):
-                normalized = self._normalize_url(parse_match, base_url)
-                if normalized != "":
-                    found.add(normalized)
-
-        # 兜底：只要出现 url/source/src 变量，尝试解析
-        for field_match in re.findall(
-            r"(?:url|source|src)\s*[:=]\s*[\"']([^\"']+?)[\"']",
-            text,
-            flags=re.IGNORECASE,
-        ):
-            if ".m3u8" not in field_match.lower() and "http" not in field_match.lower():
-                continue
-            normalized = self._normalize_url(field_match, base_url)
-            if normalized != "":
-                found.add(normalized)
-
-        return found
-
     def _extract_candidate_urls_from_text(self, text, base_url):
-        found = set(self._extract_urls_from_text(text, base_url))
-        found.update(self._extract_player_config_candidates(text, base_url))
-        return found
+        return self.url_extractor.extract(text, base_url)
 
     def _extract_script_sources(self, text, base_url):
         found = []
@@ -1698,67 +2150,135 @@ class MonitorM3U8:
                 found.append(normalized)
         return list(dict.fromkeys(found))
 
-    def _fallback_probe_with_requests(self):
+    def _build_probe_session(self):
+        session = requests.Session()
+        session.trust_env = False
+        if self.proxy_config["enabled"]:
+            auth = ""
+            if self.proxy_config["username"] or self.proxy_config["password"]:
+                auth = f"{self.proxy_config['username']}:{self.proxy_config['password']}@"
+            proxy_url = f"http://{auth}{self.proxy_config['address']}:{self.proxy_config['port']}"
+            session.proxies.update({"http": proxy_url, "https": proxy_url})
+        return session
+
+    def _collect_probe_candidates(self, body, base_url):
+        for found_url in self._extract_candidate_urls_from_text(body, base_url):
+            self._raise_if_stopped()
+            if self._is_m3u8_url(found_url):
+                self._add_m3u8_candidate(found_url, referer=base_url)
+            else:
+                self._add_page_candidate(found_url)
+
+    def _probe_with_requests(self, tier="fallback"):
+        """纯 HTTP 探测：抓取页面 HTML 及其外链脚本（并发），从文本中提取候选。
+
+        tier="http" 用于浏览器之前的快速探测，tier="fallback" 用于浏览器全部失败后的兜底。
+        """
         self._raise_if_stopped()
         if len(self.possible) > 0:
             return 0
+        label = f"{tier}(requests)"
         before = len(self.possible)
         started_at = time.perf_counter()
-        self._log_monitor("fallback(requests) start")
+        self._log_monitor(f"{label} start")
         script_probe_limit = 10
-        try:
-            session = requests.Session()
-            session.trust_env = False
-            if self.proxy_config["enabled"]:
-                auth = ""
-                if self.proxy_config["username"] or self.proxy_config["password"]:
-                    auth = f"{self.proxy_config['username']}:{self.proxy_config['password']}@"
-                proxy_url = f"http://{auth}{self.proxy_config['address']}:{self.proxy_config['port']}"
-                session.proxies.update({"http": proxy_url, "https": proxy_url})
+        script_workers = 6
+        scripts_fetched = 0
+        session = None
+        # 与下载器共用每主机连接上限与带宽；页面与脚本请求量小但决定监测耗时，优先级高于下载
+        scheduler = TransferScheduler.shared()
+        transfer_job = scheduler.open_job(f"monitor {self.URL}", priority=self.PROBE_TRANSFER_PRIORITY)
+
+        def scheduled_get(url, timeout):
+            with scheduler.slot(transfer_job, url, self._is_stop_requested) as granted:
+                if not granted:
+                    self._raise_if_stopped()
+                    raise MonitorInterrupted("monitor interrupted")
+                resp = session.get(url, headers=headers, timeout=timeout)
+                scheduler.consume(transfer_job, len(resp.content), self._is_stop_requested)
+                return resp
 
+        try:
+            session = self._build_probe_session()
             headers = dict(self.monitor_headers)
             headers["referer"] = self.URL
             self._raise_if_stopped()
-            response = session.get(self.URL, headers=headers, timeout=(4, 5))
+            response = scheduled_get(self.URL, (4, 5))
             response.raise_for_status()
             body = response.text
+            final_url = self._normalize_url(response.url) or self.URL
 
-            for found_url in self._extract_candidate_urls_from_text(body, self.URL):
-                self._raise_if_stopped()
-                if self._is_m3u8_url(found_url):
-                    self._add_m3u8_candidate(found_url, referer=self.URL)
-                else:
-                    self._add_page_candidate(found_url)
+            self._collect_probe_candidates(body, final_url)
 
-            for script_url in self._extract_script_sources(body, self.URL)[:script_probe_limit]:
-                self._raise_if_stopped()
+            script_urls = self._extract_script_sources(body, final_url)[:script_probe_limit]
+
+            def _fetch_script(script_url):
+                if self._is_stop_requested():
+                    return ""
+                js_resp = scheduled_get(script_url, (3, 4))
+                js_resp.raise_for_status()
+                return js_resp.text
+
+            if script_urls:
+                executor = ThreadPoolExecutor(
+                    max_workers=min(script_workers, len(script_urls)),
+                    initializer=self.thread_initializer,
+                )
                 try:
-                    script_headers = dict(headers)
-                    script_headers["referer"] = self.URL
-                    js_resp = session.get(script_url, headers=script_headers, timeout=(3, 4))
-                    js_resp.raise_for_status()
-                    js_body = js_resp.text
-                except Exception:
-                    continue
-                for found_url in self._extract_candidate_urls_from_text(js_body, script_url):
-                    self._raise_if_stopped()
-                    if self._is_m3u8_url(found_url):
-                        self._add_m3u8_candidate(found_url, referer=script_url)
-                    else:
-                        self._add_page_candidate(found_url)
+                    futures = {executor.submit(_fetch_script, url): url for url in script_urls}
+                    for future in as_completed(futures):
+                        self._raise_if_stopped()
+                        try:
+                            js_body = future.result()
+                        except Exception:
+                            continue
+                        scripts_fetched += 1
+                        self._collect_probe_candidates(js_body, futures[future])
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
+
+            # 跳过浏览器时，下载阶段仍需要页面下发的 cookie
+            cookies = []
+            for cookie in session.cookies:
+                cookies.append(
+                    {
+                        "name": cookie.name,
+                        "value": cookie.value,
+                        "domain": cookie.domain or "",
+                        "path": cookie.path or "/",
+                    }
+                )
+            self.session_hints["final_url"] = final_url
+            self.session_hints["cookies"] = self._merge_cookies(self.session_hints.get("cookies", []), cookies)
+            merged_referer = dict(self.session_hints.get("referer_map", {}))
+            merged_referer.update(self.url_hints)
+            self.session_hints["referer_map"] = merged_referer
         except MonitorInterrupted:
             raise
         except Exception as exc:
-            self._log_monitor(f"fallback(requests) failed: {exc}")
+            self._log_monitor(f"{label} failed: {exc}")
         finally:
+            if session is not None:
+                session.close()
             elapsed = time.perf_counter() - started_at
             added = max(0, len(self.possible) - before)
             self._log_monitor(
-                f"fallback(requests) done in {self._fmt_seconds(elapsed)} "
-                f"new_m3u8={added} total={len(self.possible)}"
+                f"{label} done in {self._fmt_seconds(elapsed)} "
+                f"scripts={scripts_fetched} new_m3u8={added} total={len(self.possible)}"
             )
         return max(0, len(self.possible) - before)
 
+    @classmethod
+    def _record_tier(cls, tier):
+        with cls._tier_stats_lock:
+            cls._tier_stats[tier] = cls._tier_stats.get(tier, 0) + 1
+            return dict(cls._tier_stats)
+
+    @classmethod
+    def get_tier_stats(cls):
+        with cls._tier_stats_lock:
+            return dict(cls._tier_stats)
+
     @staticmethod
     def _is_wrapper_candidate(url):
         lowered = str(url).lower()
@@ -1821,11 +2341,26 @@ class MonitorM3U8:
         except Exception:
             return False
 
+    def _page_text_for_extraction(self, page):
+        # 不需要递归页面链接时，只取页面内筛出的相关片段；失败再回退到整页 DOM
+        if self.recursion_depth <= 1:
+            try:
+                snippets = page.evaluate(self.PAGE_SNIPPET_SCRIPT)
+                if isinstance(snippets, list):
+                    return "\n".join(item for item in snippets if isinstance(item, str))
+            except MonitorInterrupted:
+                raise
+            except Exception as exc:
+                self._log_verbose(f"page snippet scan failed, fallback to content(): {exc}")
+        return page.content()
+
     def _extract_candidates_from_page(self, page):
         self._raise_if_stopped()
         try:
             page_url = self._normalize_url(page.url) or self.URL
-            body = page.content()
+            body = self._page_text_for_extraction(page)
+        except MonitorInterrupted:
+            raise
         except Exception:
             return
 
@@ -1871,6 +2406,174 @@ class MonitorM3U8:
             except Exception:
                 pass
 
+    def _on_page_hook_report(self, source, kind, raw_url, frame_url=""):
+        if self._is_stop_requested():
+            return
+        kind = str(kind or "")
+        if kind == "ready":
+            self._page_hook_ready = True
+            return
+        with self.lock:
+            self._page_hook_stats["reports"] += 1
+            if kind == "mse":
+                self._page_hook_stats["mse"] += 1
+        if kind == "mse":
+            return
+        base_url = str(frame_url or "")
+        try:
+            base_url = source["frame"].url or base_url
+        except Exception:
+            pass
+        base_url = self._normalize_url(base_url) or self.URL
+        candidate = self._normalize_url(str(raw_url or ""), base_url)
+        if candidate == "" or not self._is_m3u8_url(candidate):
+            return
+        self._log_verbose(f"page hook kind={kind} url={candidate}")
+        self._add_m3u8_candidate(candidate, referer=base_url)
+
+    def _install_page_hook(self, context):
+        # 每次尝试新建 context，钩子状态与统计随之重置
+        self._page_hook_ready = False
+        with self.lock:
+            self._page_hook_stats = {"reports": 0, "mse": 0}
+        try:
+            context.expose_binding(self.PAGE_HOOK_BINDING, self._on_page_hook_report)
+            context.add_init_script(self.PAGE_HOOK_SCRIPT)
+        except Exception as exc:
+            self._log_verbose(f"page hook unavailable, keep response scanning: {exc}")
+
+    def _response_scan_allowed(self, response_url, content_type):
+        if content_type != "":
+            if "css" in content_type:
+                return False
+            return any(token in content_type for token in self.RESPONSE_SCAN_CONTENT_TYPES)
+        # 未声明类型时按扩展名判断，避免把字体、图片、分片之类的二进制拉回来
+        path = urlparse(response_url).path.lower()
+        ext_match = re.search(r"\.([a-z0-9]{1,8})$", path)
+        ext = ext_match.group(1) if ext_match else ""
+        return ext in self.RESPONSE_SCAN_EXTENSIONS
+
+    @staticmethod
+    def _charset_from_content_type(content_type):
+        match = re.search(r"charset=([\w.-]+)", str(content_type or ""), flags=re.IGNORECASE)
+        return match.group(1) if match else "utf-8"
+
+    def _bump_scan_stat(self, key, amount=1):
+        with self.lock:
+            self._response_scan_stats[key] = self._response_scan_stats.get(key, 0) + amount
+
+    def _mark_response_scanned(self, key):
+        with self.lock:
+            if key in self._scanned_response_keys:
+                return False
+            self._scanned_response_keys.add(key)
+            return True
+
+    def _submit_response_scan(self, body, charset, response_url, referer):
+        with self.lock:
+            pending = len(self._scan_futures)
+            if self._scan_executor is None:
+                self._scan_executor = ThreadPoolExecutor(
+                    max_workers=self.RESPONSE_SCAN_WORKERS,
+                    thread_name_prefix="m3u8-scan",
+                    initializer=self.thread_initializer,
+                )
+            executor = self._scan_executor
+        if pending >= self.RESPONSE_SCAN_MAX_PENDING:
+            # 队列已满时在回调线程直接扫描，作为背压
+            self._bump_scan_stat("inline")
+            self._scan_response_body(body, charset, response_url, referer)
+            return
+        future = executor.submit(self._scan_response_body, body, charset, response_url, referer)
+        with self.lock:
+            self._scan_futures.add(future)
+        future.add_done_callback(self._discard_scan_future)
+
+    def _discard_scan_future(self, future):
+        with self.lock:
+            self._scan_futures.discard(future)
+
+    def _scan_response_body(self, body, charset, response_url, referer):
+        if self._is_stop_requested():
+            return
+        started_at = time.perf_counter()
+        try:
+            text = body.decode(charset, errors="replace")
+        except LookupError:
+            text = body.decode("utf-8", errors="replace")
+        found_m3u8 = 0
+        for found_url in self._extract_candidate_urls_from_text(text, response_url):
+            if self._is_m3u8_url(found_url):
+                found_m3u8 += 1
+                self._add_m3u8_candidate(found_url, referer=referer)
+            elif self.recursion_depth > 1:
+                self._add_page_candidate(found_url)
+        elapsed = time.perf_counter() - started_at
+        with self.lock:
+            self._response_scan_stats["scanned"] += 1
+            self._response_scan_stats["bytes"] += len(body)
+            self._response_scan_stats["seconds"] += elapsed
+            if len(self.response_scan_profile) < self.RESPONSE_SCAN_PROFILE_LIMIT:
+                self.response_scan_profile.append(
+                    {
+                        "url": response_url,
+                        "bytes": len(body),
+                        "ms": round(elapsed * 1000, 3),
+                        "m3u8": found_m3u8,
+                    }
+                )
+
+    def _drain_response_scans(self, timeout=3.0):
+        deadline = time.perf_counter() + max(0.0, timeout)
+        while True:
+            with self.lock:
+                pending = list(self._scan_futures)
+            if not pending:
+                return
+            self._raise_if_stopped()
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                self._log_verbose(f"response scan drain timeout pending={len(pending)}")
+                return
+            for future in pending:
+                try:
+                    future.result(timeout=min(remaining, self._interrupt_check_interval_ms / 1000.0))
+                except Exception:
+                    pass
+                break
+
+    def _shutdown_response_scans(self):
+        with self.lock:
+            executor = self._scan_executor
+            self._scan_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _log_normalize_cache_stats(self):
+        if not self.verbose_log:
+            return
+        stats = self.normalize_cache.stats()
+        self._log_verbose(
+            f"normalize cache hits={stats['hits']} misses={stats['misses']} "
+            f"hit_rate={stats['hit_rate'] * 100:.1f}% size={stats['size']}/{stats['max_size']}"
+        )
+
+    def _log_response_scan_stats(self):
+        if not self.verbose_log:
+            return
+        with self.lock:
+            stats = dict(self._response_scan_stats)
+            profile = list(self.response_scan_profile)
+        self._log_verbose(
+            f"response scan scanned={stats['scanned']} bytes={stats['bytes']} "
+            f"cpu={self._fmt_seconds(stats['seconds'])} dedup={stats['dedup']} "
+            f"skipped_type={stats['skipped_type']} skipped_size={stats['skipped_size']} inline={stats['inline']}"
+        )
+        for item in sorted(profile, key=lambda entry: -entry["ms"])[:5]:
+            self._log_verbose(
+                f"response scan slow {item['ms']:.1f}ms bytes={item['bytes']} m3u8={item['m3u8']} url={item['url']}"
+            )
+
     def handle_response(self, response):
         if self._is_stop_requested():
             return
@@ -1900,27 +2603,42 @@ class MonitorM3U8:
             return
 
         content_type = str(headers.get("content-type", "")).lower()
-        text_like = (
-            content_type == ""
-            or "text" in content_type
-            or "json" in content_type
-            or "javascript" in content_type
-            or "xml" in content_type
-            or "mpegurl" in content_type
-        )
-        if not text_like:
+        if not self._response_scan_allowed(response_url, content_type):
+            self._bump_scan_stat("skipped_type")
+            return
+
+        try:
+            declared_length = int(headers.get("content-length", "") or 0)
+        except (TypeError, ValueError):
+            declared_length = 0
+        if declared_length > self.RESPONSE_SCAN_MAX_BYTES:
+            self._bump_scan_stat("skipped_size")
+            return
+
+        etag = str(headers.get("etag", "")).strip()
+        if etag != "" and not self._mark_response_scanned(f"etag:{response_url}:{etag}"):
+            self._bump_scan_stat("dedup")
             return
 
+        # Playwright 同步 API 非线程安全：响应体必须在回调线程读取，之后的解码与正则交给线程池
         try:
-            body_text = response.text()
+            body = response.body()
         except Exception:
             return
+        if len(body) > self.RESPONSE_SCAN_MAX_BYTES:
+            self._bump_scan_stat("skipped_size")
+            return
+        # 相同内容出现在不同地址时相对链接的基准不同，哈希去重同样按 URL 区分
+        if not self._mark_response_scanned(f"sha1:{response_url}:{hashlib.sha1(body).hexdigest()}"):
+            self._bump_scan_stat("dedup")
+            return
 
-        for found_url in self._extract_candidate_urls_from_text(body_text, response_url):
-            if self._is_m3u8_url(found_url):
-                self._add_m3u8_candidate(found_url, referer=referer or response_url or self.URL)
-            elif self.recursion_depth > 1:
-                self._add_page_candidate(found_url)
+        self._submit_response_scan(
+            body,
+            self._charset_from_content_type(content_type),
+            response_url,
+            referer or response_url or self.URL,
+        )
 
     def handle_request(self, request):
         if self._is_stop_requested():
@@ -1960,19 +2678,28 @@ class MonitorM3U8:
         click_timeout_ms=1400,
         wait_after_click_ms=250,
     ):
+        # 先一次 evaluate 取回全部选择器的可见位图，只对可见元素发起点击
+        probes = self._probe_selectors(target, selectors, limit=max_per_selector)
         for selector in selectors:
             self._raise_if_stopped()
+            probe = probes.get(selector)
             try:
                 locator = target.locator(selector)
-                count = min(locator.count(), max_per_selector)
+                if probe is None:
+                    self._selector_probe_stats["fallback"] += 1
+                    count = min(locator.count(), max_per_selector)
+                    indices = range(count)
+                else:
+                    count, mask = probe
+                    indices = [i for i in range(min(count, max_per_selector)) if mask & (1 << i)]
             except Exception:
                 continue
 
-            for i in range(count):
+            for i in indices:
                 self._raise_if_stopped()
                 try:
                     element = locator.nth(i)
-                    if not element.is_visible(timeout=visible_timeout_ms):
+                    if probe is None and not element.is_visible(timeout=visible_timeout_ms):
                         continue
                     element.click(timeout=click_timeout_ms)
                     if page_for_recover is not None:
@@ -2108,7 +2835,10 @@ class MonitorM3U8:
         args_when = args.get("when", "") if isinstance(args, dict) else ""
         raw_when = action.get("when", args_when)
         tokens = MonitorM3U8._normalize_action_when_tokens(raw_when)
+        return MonitorM3U8._when_tokens_allow(tokens, attempt=attempt, tries=tries)
 
+    @staticmethod
+    def _when_tokens_allow(tokens, attempt=1, tries=1):
         if tokens == {"always"}:
             return True
         if "never" in tokens:
@@ -2244,28 +2974,147 @@ class MonitorM3U8:
             return True
         return False
 
-    def _selector_condition_satisfied(self, page, selectors, state="visible", match_mode="any", target_mode="page"):
-        if len(selectors) == 0:
-            return False
-
-        targets = self._iter_action_targets(page, target_mode)
-
-        if match_mode == "all":
-            for selector in selectors:
-                if not any(
-                    self._selector_state_satisfied(target, selector, state)
-                    for target in targets
-                ):
-                    return False
-            return True
+    def _probe_selectors(self, target, selectors, limit=3, cache=None):
+        """一次 evaluate 取回 selectors 在 target 中的 (数量, 可见位图)；无法批量判断的选择器值为 None。
 
-        for selector in selectors:
-            if any(
-                self._selector_state_satisfied(target, selector, state)
-                for target in targets
-            ):
-                return True
-        return False
+        cache 为单次轮询内共享的 dict，同一 target 已探测过的选择器不再重复发送。
+        """
+        key = (id(target), limit)
+        entry = cache.get(key) if cache is not None else None
+        if entry is None:
+            entry = {}
+        missing = [selector for selector in selectors if selector not in entry]
+        if missing:
+            results = None
+            if self.selector_batch_enabled:
+                try:
+                    results = target.evaluate(self.SELECTOR_PROBE_SCRIPT, [missing, limit])
+                    self._selector_probe_stats["evaluate"] += 1
+                except MonitorInterrupted:
+                    raise
+                except Exception:
+                    results = None
+            if not isinstance(results, list) or len(results) != len(missing):
+                results = [None] * len(missing)
+            for selector, result in zip(missing, results):
+                if isinstance(result, list) and len(result) == 2:
+                    entry[selector] = (int(result[0]), int(result[1]))
+                else:
+                    entry[selector] = None
+        if cache is not None:
+            cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _selector_state_from_probe(probe, state):
+        count, mask = probe
+        # 与逐个查询保持一致：只看前 3 个元素的可见性
+        first_visible = (mask & 0b111) != 0
+        if state == "attached":
+            return count > 0
+        if state == "detached":
+            return count == 0
+        if state == "visible":
+            return count > 0 and first_visible
+        if state == "hidden":
+            return count <= 0 or not first_visible
+        return False
+
+    def _selector_condition_satisfied(
+        self,
+        page,
+        selectors,
+        state="visible",
+        match_mode="any",
+        target_mode="page",
+        cache=None,
+    ):
+        if len(selectors) == 0:
+            return False
+
+        targets = self._iter_action_targets(page, target_mode)
+        probes = [self._probe_selectors(target, selectors, cache=cache) for target in targets]
+
+        def _satisfied(selector):
+            for target, probe_map in zip(targets, probes):
+                probe = probe_map.get(selector)
+                if probe is None:
+                    self._selector_probe_stats["fallback"] += 1
+                    matched = self._selector_state_satisfied(target, selector, state)
+                else:
+                    matched = self._selector_state_from_probe(probe, state)
+                if matched:
+                    return True
+            return False
+
+        if match_mode == "all":
+            return all(_satisfied(selector) for selector in selectors)
+        return any(_satisfied(selector) for selector in selectors)
+
+    @staticmethod
+    def _new_wait_watch():
+        return {"fired": 0, "timeouts": 0, "polled": 0, "fired_at": None, "react_ms": [], "disabled": set()}
+
+    def _pick_watch_target(self, page, targets, cache, watch):
+        if not (self.selector_batch_enabled and self.selector_watch_enabled) or len(targets) == 0:
+            return None, None
+        # 多个 target 时监听主页面，其余 frame 仍按 poll_ms 节奏复查
+        target = page if any(item is page for item in targets) else targets[0]
+        entry = cache.get((id(target), 3))
+        if id(target) in watch["disabled"] or not entry:
+            return None, None
+        if any(probe is None for probe in entry.values()):
+            return None, None
+        return target, entry
+
+    def _wait_for_condition_change(self, page, targets, cache, max_wait_ms, poll_ms, watch):
+        """等到监听 target 的选择器结果发生变化或 max_wait_ms 用完；无法注入时退回固定间隔。"""
+        max_wait_ms = int(max_wait_ms)
+        if max_wait_ms <= 0:
+            return
+        target, entry = self._pick_watch_target(page, targets, cache, watch)
+        if target is not None:
+            chunk_ms = min(max_wait_ms, self.SELECTOR_WATCH_CHUNK_MS if len(targets) == 1 else poll_ms)
+            selectors = list(entry.keys())
+            baseline = [list(entry[selector]) for selector in selectors]
+            try:
+                result = target.evaluate(self.SELECTOR_WATCH_SCRIPT, [selectors, 3, baseline, chunk_ms])
+            except Exception:
+                # frame 导航或脚本被拦截：本次等待内不再对该 target 注入
+                watch["disabled"].add(id(target))
+            else:
+                if isinstance(result, dict) and result.get("changed"):
+                    watch["fired"] += 1
+                    watch["fired_at"] = result.get("firedAt")
+                else:
+                    watch["timeouts"] += 1
+                self._raise_if_stopped()
+                return
+        watch["polled"] += 1
+        self._pause(page, min(poll_ms, max_wait_ms))
+
+    @staticmethod
+    def _record_wait_react(watch):
+        # 页面内检测到变化 -> Python 确认条件满足并返回执行下一个动作 的间隔
+        fired_at = watch.get("fired_at")
+        if isinstance(fired_at, (int, float)):
+            watch["react_ms"].append(max(0.0, time.time() * 1000 - fired_at))
+        watch["fired_at"] = None
+
+    def _log_wait_polls(self, label, poll_times, watch=None):
+        if not self.verbose_log or len(poll_times) == 0:
+            return
+        average_ms = sum(poll_times) / len(poll_times) * 1000
+        message = (
+            f"{label} polls={len(poll_times)} avg={average_ms:.1f}ms max={max(poll_times) * 1000:.1f}ms "
+            f"evaluate_total={self._selector_probe_stats['evaluate']} "
+            f"fallback_total={self._selector_probe_stats['fallback']}"
+        )
+        if watch is not None:
+            message += f" watch fired={watch['fired']} timeouts={watch['timeouts']} polled={watch['polled']}"
+            if watch["react_ms"]:
+                message += f" react={watch['react_ms'][-1]:.1f}ms"
+        self._log_verbose(message)
 
     def _wait_for_selector_condition(
         self,
@@ -2278,26 +3127,45 @@ class MonitorM3U8:
         poll_ms=150,
     ):
         deadline = time.time() + timeout_ms / 1000.0
-        poll_seconds = max(0.05, self._to_int(poll_ms, 150, 50, 1000) / 1000.0)
-        while time.time() < deadline:
-            self._raise_if_stopped()
-            if self._selector_condition_satisfied(
+        poll_ms = self._to_int(poll_ms, 150, 50, 1000)
+        poll_times = []
+        watch = self._new_wait_watch()
+
+        def _check(cache):
+            poll_started_at = time.perf_counter()
+            satisfied = self._selector_condition_satisfied(
                 page,
                 selectors,
                 state=state,
                 match_mode=match_mode,
                 target_mode=target_mode,
-            ):
-                return True
-            self._pause(page, int(poll_seconds * 1000))
-        self._raise_if_stopped()
-        return self._selector_condition_satisfied(
-            page,
-            selectors,
-            state=state,
-            match_mode=match_mode,
-            target_mode=target_mode,
-        )
+                cache=cache,
+            )
+            poll_times.append(time.perf_counter() - poll_started_at)
+            if satisfied:
+                self._record_wait_react(watch)
+            else:
+                watch["fired_at"] = None
+            return satisfied
+
+        try:
+            while time.time() < deadline:
+                self._raise_if_stopped()
+                cache = {}
+                if _check(cache):
+                    return True
+                self._wait_for_condition_change(
+                    page,
+                    self._iter_action_targets(page, target_mode),
+                    cache,
+                    (deadline - time.time()) * 1000,
+                    poll_ms,
+                    watch,
+                )
+            self._raise_if_stopped()
+            return _check({})
+        finally:
+            self._log_wait_polls("wait_for_selector", poll_times, watch)
 
     def _resolve_mouse_coordinate(self, raw_value, fallback):
         if isinstance(raw_value, str) and raw_value.strip().lower() in {"center", "middle"}:
@@ -2320,6 +3188,83 @@ class MonitorM3U8:
                 time.sleep(chunk_ms / 1000.0)
             duration_ms -= chunk_ms
 
+    @classmethod
+    def _resolve_cache_dir(cls):
+        path = str(os.getenv("M3U8_MONITOR_CACHE_DIR", "")).strip()
+        if path == "":
+            return cls.DEFAULT_CACHE_DIR
+        return os.path.abspath(os.path.expanduser(os.path.expandvars(path)))
+
+    def _adaptive_timeout_ms(self, metric, default_ms, floor_ms):
+        # 本域名历史 p90 × 1.5，不低于 floor，不超过默认/规则值；重试时恢复完整预算
+        if not (self.adaptive_timing_enabled and self._adaptive_timing_active):
+            return default_ms
+        return self.timing_profiles.adaptive_ms(self.timing_domain, metric, default_ms, floor_ms)
+
+    def _compute_rule_wait_scale(self):
+        if not self.adaptive_timing_enabled:
+            return 1.0
+        ready_ms = self._adaptive_timeout_ms("player_ready", self.PLAYER_READY_REFERENCE_MS, 0)
+        return max(self.RULE_WAIT_SCALE_MIN, min(1.0, ready_ms / self.PLAYER_READY_REFERENCE_MS))
+
+    def _scale_rule_wait(self, wait_ms):
+        if self._rule_wait_scale >= 1.0 or not self._adaptive_timing_active or wait_ms <= self.RULE_WAIT_FLOOR_MS:
+            return wait_ms
+        return max(self.RULE_WAIT_FLOOR_MS, int(wait_ms * self._rule_wait_scale))
+
+    def _acquire_browser_profile(self):
+        if self.persistent_profile == "":
+            return None
+        key = self.timing_domain if self.persistent_profile.lower() == "site" else self.persistent_profile
+        profile_dir = self.browser_profiles.acquire(key or "default")
+        if profile_dir is None:
+            self._log_monitor(f"browser profile busy key={key}; using temporary context")
+        return profile_dir
+
+    def _evict_browser_profiles(self):
+        if self.persistent_profile == "":
+            return
+        evicted, total = self.browser_profiles.evict()
+        if evicted:
+            self._log_monitor(f"browser profiles evicted={','.join(evicted)}")
+        self._log_verbose(
+            f"browser profiles size={total / 1024 / 1024:.1f}MB cap={self.browser_profiles.max_bytes / 1024 / 1024:.0f}MB"
+        )
+
+    def _begin_attempt_timing(self):
+        self._attempt_timing = {
+            "goto_at": time.perf_counter(),
+            "dom_ready_at": None,
+            "first_m3u8_at": None,
+            "player_ready_ms": None,
+        }
+
+    def _mark_attempt_timing(self, key, value=None):
+        timing = self._attempt_timing
+        if timing is None or timing.get(key) is not None:
+            return
+        timing[key] = time.perf_counter() if value is None else value
+
+    def _finish_attempt_timing(self):
+        timing = self._attempt_timing
+        self._attempt_timing = None
+        if timing is None or timing["dom_ready_at"] is None:
+            return
+        dom_ready_ms = (timing["dom_ready_at"] - timing["goto_at"]) * 1000
+        first_m3u8_ms = None
+        if timing["first_m3u8_at"] is not None:
+            # 以 DOMContentLoaded 为起点，对应 goto 之后 networkidle 等待的预算
+            first_m3u8_ms = max(0.0, (timing["first_m3u8_at"] - timing["dom_ready_at"]) * 1000)
+        player_ready_ms = timing["player_ready_ms"]
+        self.timing_profiles.record(self.timing_domain, "dom_ready", dom_ready_ms)
+        self.timing_profiles.record(self.timing_domain, "first_m3u8", first_m3u8_ms)
+        self.timing_profiles.record(self.timing_domain, "player_ready", player_ready_ms)
+        self._log_verbose(
+            f"timing domain={self.timing_domain} dom_ready={dom_ready_ms:.0f}ms "
+            f"first_m3u8={'-' if first_m3u8_ms is None else f'{first_m3u8_ms:.0f}ms'} "
+            f"player_ready={'-' if player_ready_ms is None else f'{player_ready_ms:.0f}ms'}"
+        )
+
     def _responsive_timeout_ms(self, timeout_ms, interrupt_cap_ms):
         value = self._to_int(timeout_ms, interrupt_cap_ms, 100, 120000)
         if self.stop_checker is not None:
@@ -2453,13 +3398,15 @@ class MonitorM3U8:
             return
 
         timeout_ms = self._to_int(self._action_arg(action, "timeout_ms", 5000), 5000, 100, 60000)
+        timeout_ms = self._adaptive_timeout_ms("player_ready", timeout_ms, 1200)
         timeout_ms = self._responsive_timeout_ms(timeout_ms, 3500)
         state = self._wait_selector_state(self._action_arg(action, "state", "visible"), "visible")
         match_mode = self._match_mode(self._action_arg(action, "match", "any"), "any")
         target_mode = self._action_arg(action, "target", "page")
         poll_ms = self._to_int(self._action_arg(action, "poll_ms", 150), 150, 50, 1000)
 
-        self._wait_for_selector_condition(
+        started_at = time.perf_counter()
+        satisfied = self._wait_for_selector_condition(
             page,
             selectors,
             state=state,
@@ -2468,6 +3415,8 @@ class MonitorM3U8:
             timeout_ms=timeout_ms,
             poll_ms=poll_ms,
         )
+        if satisfied:
+            self._mark_attempt_timing("player_ready_ms", (time.perf_counter() - started_at) * 1000)
 
     def _compile_wait_group_items_from_actions(self, group_actions):
         compiled = []
@@ -2536,7 +3485,53 @@ class MonitorM3U8:
             for child in item.get("items", []):
                 self._prepare_wait_group_item_state(child, start_time)
 
-    def _wait_group_item_satisfied(self, page, item, now_time, group_start_time):
+    def _collect_pending_wait_group_selectors(self, items, done, pending):
+        for index, item in enumerate(items):
+            if index < len(done) and done[index]:
+                continue
+            kind = item.get("kind")
+            if kind == "selector":
+                selectors = pending.setdefault(item.get("target", "page"), [])
+                for selector in item.get("selectors", []):
+                    if selector not in selectors:
+                        selectors.append(selector)
+            elif kind == "group":
+                self._collect_pending_wait_group_selectors(item.get("items", []), item.get("_done", []), pending)
+
+    def _prefetch_wait_group_selectors(self, page, items, done, cache):
+        # 每轮把尚未满足的选择器按 target 合并，每个 frame 只发一次 evaluate；返回涉及的 target
+        pending = {}
+        self._collect_pending_wait_group_selectors(items, done, pending)
+        probed = []
+        for target_mode, selectors in pending.items():
+            for target in self._iter_action_targets(page, target_mode):
+                self._probe_selectors(target, selectors, cache=cache)
+                if not any(item is target for item in probed):
+                    probed.append(target)
+        return probed
+
+    def _next_wait_group_timer_ms(self, items, done, now_time, group_start_time):
+        # 尚未到期的 wait 子项中最近的剩余时间，事件等待不能越过它
+        nearest = None
+        for index, item in enumerate(items):
+            if index < len(done) and done[index]:
+                continue
+            kind = item.get("kind")
+            remaining = None
+            if kind == "timer":
+                remaining = (item.get("delay_s", 0.0) - (now_time - group_start_time)) * 1000
+            elif kind == "group":
+                remaining = self._next_wait_group_timer_ms(
+                    item.get("items", []),
+                    item.get("_done", []),
+                    now_time,
+                    item.get("_start_time", group_start_time),
+                )
+            if remaining is not None and (nearest is None or remaining < nearest):
+                nearest = remaining
+        return nearest
+
+    def _wait_group_item_satisfied(self, page, item, now_time, group_start_time, cache=None):
         kind = item.get("kind")
         if kind == "selector":
             return self._selector_condition_satisfied(
@@ -2545,6 +3540,7 @@ class MonitorM3U8:
                 state=item.get("state", "visible"),
                 match_mode=item.get("match", "any"),
                 target_mode=item.get("target", "page"),
+                cache=cache,
             )
         if kind == "timer":
             return (now_time - group_start_time) >= item.get("delay_s", 0.0)
@@ -2555,7 +3551,7 @@ class MonitorM3U8:
             for index, nested in enumerate(nested_items):
                 if index >= len(nested_done) or nested_done[index]:
                     continue
-                if self._wait_group_item_satisfied(page, nested, now_time, nested_start):
+                if self._wait_group_item_satisfied(page, nested, now_time, nested_start, cache):
                     nested_done[index] = True
             if len(nested_done) == 0:
                 return False
@@ -2567,6 +3563,7 @@ class MonitorM3U8:
     def _action_wait_group(self, page, action, stable_url, before_count):
         self._raise_if_stopped()
         timeout_ms = self._to_int(self._action_arg(action, "timeout_ms", 8000), 8000, 100, 120000)
+        timeout_ms = self._adaptive_timeout_ms("player_ready", timeout_ms, 1200)
         timeout_ms = self._responsive_timeout_ms(timeout_ms, 5000)
         poll_ms = self._to_int(self._action_arg(action, "poll_ms", 150), 150, 50, 1000)
         mode = self._match_mode(self._action_arg(action, "mode", "all"), "all")
@@ -2580,27 +3577,47 @@ class MonitorM3U8:
         condition_done = [False] * len(compiled)
         for item in compiled:
             self._prepare_wait_group_item_state(item, start_time)
-        poll_seconds = max(0.05, poll_ms / 1000.0)
-
-        while time.time() < deadline:
-            self._raise_if_stopped()
-            now = time.time()
-            for index, condition in enumerate(compiled):
-                if condition_done[index]:
-                    continue
-                condition_done[index] = self._wait_group_item_satisfied(
-                    page,
-                    condition,
-                    now,
-                    start_time,
-                )
+        poll_times = []
+        watch = self._new_wait_watch()
 
-            if mode == "any" and any(condition_done):
-                return
-            if mode == "all" and all(condition_done):
-                return
+        try:
+            while time.time() < deadline:
+                self._raise_if_stopped()
+                now = time.time()
+                poll_started_at = time.perf_counter()
+                cache = {}
+                targets = self._prefetch_wait_group_selectors(page, compiled, condition_done, cache)
+                for index, condition in enumerate(compiled):
+                    if condition_done[index]:
+                        continue
+                    condition_done[index] = self._wait_group_item_satisfied(
+                        page,
+                        condition,
+                        now,
+                        start_time,
+                        cache,
+                    )
+                poll_times.append(time.perf_counter() - poll_started_at)
 
-            self._pause(page, int(poll_seconds * 1000))
+                if (mode == "any" and any(condition_done)) or (mode == "all" and all(condition_done)):
+                    self._record_wait_react(watch)
+                    if any(done and item.get("kind") != "timer" for item, done in zip(compiled, condition_done)):
+                        self._mark_attempt_timing("player_ready_ms", (time.time() - start_time) * 1000)
+                    return
+                watch["fired_at"] = None
+
+                pending = {}
+                self._collect_pending_wait_group_selectors(compiled, condition_done, pending)
+                if len(pending) == 0:
+                    # 只剩定时器，没有需要监听的选择器
+                    targets = []
+                max_wait_ms = (deadline - time.time()) * 1000
+                timer_ms = self._next_wait_group_timer_ms(compiled, condition_done, time.time(), start_time)
+                if timer_ms is not None:
+                    max_wait_ms = min(max_wait_ms, max(1, timer_ms))
+                self._wait_for_condition_change(page, targets, cache, max_wait_ms, poll_ms, watch)
+        finally:
+            self._log_wait_polls("wait_group", poll_times, watch)
 
     def _action_wait_for_load_state(self, page, action, stable_url, before_count):
         self._raise_if_stopped()
@@ -2703,12 +3720,13 @@ class MonitorM3U8:
         if message:
             self._log_verbose(f"rule log: {message}")
 
-    def _run_configured_interaction_action(self, page, action, stable_url):
+    def _run_configured_interaction_action(self, page, action, stable_url, action_type=None):
         self._raise_if_stopped()
         if not isinstance(action, dict):
             return
 
-        action_type = str(action.get("type", "")).strip().lower()
+        if action_type is None:
+            action_type = str(action.get("type", "")).strip().lower()
         if action_type == "":
             return
         handler = self.action_handlers.get(action_type)
@@ -2727,182 +3745,463 @@ class MonitorM3U8:
     def _try_trigger_player(self, page, interaction_stage=1, attempt=1, tries=1):
         self._raise_if_stopped()
         stable_url = self._normalize_url(page.url) or self.URL
-        actions = list(self.active_interaction_rule.get("actions", []))
-        if len(actions) == 0:
+        plan = list(self.active_interaction_rule.get("plan", []))
+        if len(plan) == 0:
             return
-        for action in actions:
+        for step in plan:
             self._raise_if_stopped()
-            if not self._action_enabled_for_interaction_stage(
-                action,
-                interaction_stage,
-                attempt=attempt,
-                tries=tries,
-            ):
+            if not self._when_tokens_allow(step["when"], attempt=attempt, tries=tries):
                 continue
-            self._run_configured_interaction_action(page, action, stable_url)
+            self._run_configured_interaction_action(page, step["action"], stable_url, step["type"])
         self._extract_candidates_from_page(page)
         self._recover_page_if_needed(page, stable_url)
 
-    def MonitorUrl(self):
-        def __launch_browser(playwright_driver, launch_kwargs):
-            self._raise_if_stopped()
-            last_error = None
-            try:
-                browser = playwright_driver.chromium.launch(**launch_kwargs)
-                return browser
-            except Exception as exc:
-                last_error = exc
-            if last_error is not None:
-                raise last_error
-            raise RuntimeError("failed to launch browser")
+    def _attempt_interaction_stage(self, attempt_no):
+        if not self.interaction_enabled:
+            return 0
+        return 1 if attempt_no == 1 else 2
+
+    def _attempt_strategy_name(self, attempt_no):
+        stage = self._attempt_interaction_stage(attempt_no)
+        if stage == 0:
+            return "disabled"
+        return "first-pass" if stage == 1 else "retry-pass"
+
+    def _attempt_run_order(self, tries):
+        # 本域名 retry-pass 胜场更多时先跑第 2 次尝试的策略；规则 when 仍按策略对应的尝试序号判断
+        order = list(range(1, tries + 1))
+        if not self.interaction_enabled or tries < 2:
+            return order
+        preferred = self.strategy_stats.order(self.timing_domain, ["first-pass", "retry-pass"])
+        if preferred[0] == "retry-pass":
+            order[0], order[1] = 2, 1
+            self._log_monitor(
+                f"strategy order retry-pass first "
+                f"domain={self.timing_domain} wins={self.strategy_stats.wins(self.timing_domain)}"
+            )
+        return order
 
-        chromium_executable_logged = False
+    def _record_strategy_win(self, winner, runs):
+        if winner == "" or runs < 2:
+            return
+        self.strategy_stats.record_win(self.timing_domain, winner)
+        self._log_verbose(
+            f"strategy winner={winner} domain={self.timing_domain} wins={self.strategy_stats.wins(self.timing_domain)}"
+        )
 
-        def __monitor_single(playwright_driver, interaction_stage=1, attempt=1, tries=1):
-            self._raise_if_stopped()
-            nonlocal chromium_executable_logged
-            launch_args = [
-                "--disable-blink-features=AutomationControlled",
-                "--autoplay-policy=no-user-gesture-required",
-                "--disable-extensions",
-                "--disable-component-extensions-with-background-pages",
-            ]
-            if self.verbose_log and not chromium_executable_logged:
-                try:
-                    self._log_verbose(
-                        f"playwright chromium executable={playwright_driver.chromium.executable_path}"
-                    )
-                except Exception:
-                    pass
-                chromium_executable_logged = True
-            launch_kwargs = {
-                "headless": self.headless,
-                "args": launch_args,
-            }
+    @staticmethod
+    def _free_local_port():
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def _new_race_child(self, attempt_no, race, race_lock):
+        strategy = self._attempt_strategy_name(attempt_no)
+        # 停止检查与父监测一致（超时上限也一致），竞速取消通过 request_stop 传递
+        child = MonitorM3U8(
+            self.URL,
+            recursion_enabled=self.recursion_enabled,
+            recursion_depth=self.recursion_depth,
+            proxy_config=self.proxy_config,
+            monitor_config=self.monitor_config,
+            stop_checker=self.stop_checker,
+            normalize_cache=self.normalize_cache,
+        )
+        child.log_tag = f"{self.log_tag}[{strategy}] "
+        child.thread_initializer = self.thread_initializer
+        # 被取消时不打印 “interrupt requested”，由父监测统一记录
+        child._stop_logged = True
 
-            proxy = self._playwright_proxy()
-            if proxy is not None:
-                launch_kwargs["proxy"] = proxy
-            else:
-                # 未显式配置代理时，固定关闭环境代理，保证行为可预测
-                launch_args.extend(["--no-proxy-server", "--proxy-bypass-list=*"])
+        def _on_progress(payload):
+            if payload.get("event") != "candidate":
+                return
+            if child._has_strong_candidate():
+                with race_lock:
+                    won = race["winner"] == ""
+                    if won:
+                        race["winner"] = strategy
+                if won:
+                    elapsed = time.perf_counter() - race["started_at"]
+                    self._log_monitor(f"race winner={strategy} in {self._fmt_seconds(elapsed)}; cancel others")
+                    for other in race["children"]:
+                        if other is not child:
+                            other.request_stop()
+            self._emit_progress(
+                "candidate",
+                possible=payload.get("possible", 0),
+                predicted=payload.get("predicted", 0),
+                url=payload.get("url", ""),
+                strong=payload.get("strong", False),
+                referer=payload.get("referer", ""),
+            )
 
-            browser = None
-            context = None
-            try:
-                self._raise_if_stopped()
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=1, steps=8, phase="launch")
-                browser = __launch_browser(playwright_driver, launch_kwargs)
-                self._log_verbose("launch browser actual=chromium")
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=2, steps=8, phase="browser")
-                self._raise_if_stopped()
-                context = browser.new_context(
-                    user_agent=self.monitor_headers.get("user-agent", self._default_user_agent()),
-                    locale="zh-CN",
-                    viewport={"width": 1366, "height": 768},
-                    ignore_https_errors=True,
-                )
-                context.add_init_script(
-                    """
-                        Object.defineProperty(navigator, 'webdriver', {
-                            get: () => undefined
-                        });
-                    """
+        child.progress_callback = _on_progress
+        return child
+
+    @staticmethod
+    def _run_race_child(child, attempt_no, tries, endpoint, adaptive, run_no):
+        # 工作线程内：每个线程单独的 Playwright 实例，经 CDP 连接共享浏览器
+        try:
+            with sync_playwright() as driver:
+                child._monitor_attempt(
+                    driver,
+                    interaction_stage=child._attempt_interaction_stage(attempt_no),
+                    attempt=attempt_no,
+                    tries=tries,
+                    adaptive=adaptive,
+                    cdp_endpoint=endpoint,
+                    run_no=run_no,
                 )
-                extra_headers = {k: v for k, v in self.monitor_headers.items() if k != "user-agent"}
-                if extra_headers:
-                    context.set_extra_http_headers(extra_headers)
+            return "done"
+        except MonitorInterrupted:
+            return "cancelled"
+        except Exception as exc:
+            child.last_monitor_error = str(exc)
+            return "failed"
+        finally:
+            child._shutdown_response_scans()
+
+    def _merge_race_child(self, child, is_winner):
+        with child.lock:
+            possible = set(child.possible)
+            predicted = set(child.predicted)
+            page_candidates = set(child.page_candidates)
+            url_hints = dict(child.url_hints)
+            referer_map = dict(child.session_hints.get("referer_map", {}))
+            scan_stats = dict(child._response_scan_stats)
+            scan_profile = list(child.response_scan_profile)
+        with self.lock:
+            self.possible.update(possible)
+            self.predicted.update(predicted)
+            self.page_candidates.update(page_candidates)
+            self.url_hints.update(url_hints)
+            self.session_hints["referer_map"].update(referer_map)
+            for key, value in scan_stats.items():
+                self._response_scan_stats[key] = self._response_scan_stats.get(key, 0) + value
+            self.response_scan_profile.extend(scan_profile)
+            del self.response_scan_profile[: -self.RESPONSE_SCAN_PROFILE_LIMIT]
+        self.session_hints["cookies"] = self._merge_cookies(
+            self.session_hints.get("cookies", []),
+            child.session_hints.get("cookies", []),
+        )
+        if is_winner or self.session_hints["final_url"] == self.URL:
+            self.session_hints["final_url"] = child.session_hints.get("final_url", self.URL)
+        for key, value in child._page_hook_stats.items():
+            self._page_hook_stats[key] = self._page_hook_stats.get(key, 0) + value
+        for key, value in child._selector_probe_stats.items():
+            self._selector_probe_stats[key] = self._selector_probe_stats.get(key, 0) + value
+        self._page_hook_ready = self._page_hook_ready or child._page_hook_ready
+        self.last_blocked_by_client = self.last_blocked_by_client or child.last_blocked_by_client
+        if child.last_monitor_error != "":
+            self.last_monitor_error = child.last_monitor_error
+
+    def _race_attempts(self, playwright_driver, attempts, tries):
+        """在同一浏览器的独立 context 中同时运行多个尝试策略。
+
+        先拿到强候选的策略胜出，其余被取消；所有策略找到的候选都会合并。
+        返回胜出的策略名（无则为空串）；共享浏览器启动失败时返回 None，由调用方改为依次执行。
+        """
+        launch_kwargs = self._browser_launch_kwargs()
+        port = self._free_local_port()
+        launch_kwargs["args"] = launch_kwargs["args"] + [
+            f"--remote-debugging-port={port}",
+            "--remote-debugging-address=127.0.0.1",
+        ]
+        endpoint = f"http://127.0.0.1:{port}"
+        names = [self._attempt_strategy_name(attempt_no) for attempt_no in attempts]
+        self._log_monitor(f"race start strategies={','.join(names)} channel=chromium")
+        race = {"winner": "", "started_at": time.perf_counter(), "children": []}
+        race_lock = threading.Lock()
+        children = [self._new_race_child(attempt_no, race, race_lock) for attempt_no in attempts]
+        race["children"] = children
+        self._race_children = children
 
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=3, steps=8, phase="context")
-                self._raise_if_stopped()
-                page = context.new_page()
-                page.set_default_timeout(self._responsive_timeout_ms(12000, 4000))
-                page.on("response", self.handle_response)
-                page.on("request", self.handle_request)
-                page.on("requestfailed", self.handle_request_failed)
-
-                def _on_popup(popup):
-                    if self._is_stop_requested():
-                        return
-                    popup.on("response", self.handle_response)
-                    popup.on("request", self.handle_request)
-                    popup.on("requestfailed", self.handle_request_failed)
-                    try:
-                        popup.wait_for_load_state(
-                            "domcontentloaded",
-                            timeout=self._responsive_timeout_ms(5000, 1800),
-                        )
-                    except MonitorInterrupted:
-                        raise
-                    except Exception:
-                        pass
-                    popup_url = self._normalize_url(getattr(popup, "url", ""))
-                    if popup_url != "":
-                        self._add_page_candidate(popup_url)
-                    try:
-                        popup.close()
-                    except Exception:
-                        pass
-                    self._recover_page_if_needed(page, self.URL)
+        try:
+            browser = self._launch_browser(playwright_driver, launch_kwargs)
+        except MonitorInterrupted:
+            raise
+        except Exception as exc:
+            self._race_children = []
+            self._log_monitor(f"race launch failed: {exc}; run attempts in turn")
+            return None
+        self._log_verbose(f"launch browser actual=chromium race endpoint={endpoint}")
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(children),
+                thread_name_prefix="monitor-race",
+                initializer=self.thread_initializer,
+            ) as executor:
+                futures = {}
+                for index, (attempt_no, child) in enumerate(zip(attempts, children)):
+                    run_no = index + 1
+                    self._emit_progress("attempt_start", attempt=run_no, tries=tries, done=run_no - 1)
+                    future = executor.submit(
+                        self._run_race_child,
+                        child,
+                        attempt_no,
+                        tries,
+                        endpoint,
+                        index == 0,
+                        run_no,
+                    )
+                    futures[future] = (run_no, names[index], child)
+                for future in as_completed(futures):
+                    run_no, name, child = futures[future]
+                    status = future.result()
+                    elapsed = time.perf_counter() - race["started_at"]
+                    detail = f": {child.last_monitor_error}" if status == "failed" else ""
+                    self._log_monitor(
+                        f"race {name} {status} in {self._fmt_seconds(elapsed)} new_m3u8={len(child.possible)}{detail}"
+                    )
+                    self._emit_progress(
+                        "attempt_done",
+                        attempt=run_no,
+                        tries=tries,
+                        done=run_no,
+                        success=status != "failed",
+                    )
+        except MonitorInterrupted:
+            raise
+        except Exception as exc:
+            self.last_monitor_error = str(exc)
+            self._log_monitor(f"race failed: {exc}")
+        finally:
+            self._race_children = []
+            try:
+                browser.close()
+            except Exception:
+                pass
+            for name, child in zip(names, children):
+                self._merge_race_child(child, name == race["winner"])
 
-                context.on("page", _on_popup)
+        winner = race["winner"]
+        elapsed = time.perf_counter() - race["started_at"]
+        self._log_monitor(
+            f"race done in {self._fmt_seconds(elapsed)} winner={winner or '(none)'} total={len(self.possible)}"
+        )
+        self._raise_if_stopped()
+        return winner
 
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=4, steps=8, phase="goto")
-                self._raise_if_stopped()
-                page.goto(
-                    self.URL,
-                    wait_until="domcontentloaded",
-                    timeout=self._responsive_timeout_ms(18000, 5500),
+    def _launch_browser(self, playwright_driver, launch_kwargs):
+        self._raise_if_stopped()
+        last_error = None
+        try:
+            browser = playwright_driver.chromium.launch(**launch_kwargs)
+            return browser
+        except Exception as exc:
+            last_error = exc
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("failed to launch browser")
+
+    def _browser_launch_kwargs(self):
+        launch_args = [
+            "--disable-blink-features=AutomationControlled",
+            "--autoplay-policy=no-user-gesture-required",
+            "--disable-extensions",
+            "--disable-component-extensions-with-background-pages",
+        ]
+        launch_kwargs = {
+            "headless": self.headless,
+            "args": launch_args,
+        }
+
+        proxy = self._playwright_proxy()
+        if proxy is not None:
+            launch_kwargs["proxy"] = proxy
+        else:
+            # 未显式配置代理时，固定关闭环境代理，保证行为可预测
+            launch_args.extend(["--no-proxy-server", "--proxy-bypass-list=*"])
+        return launch_kwargs
+
+    def _monitor_attempt(
+        self,
+        playwright_driver,
+        interaction_stage=1,
+        attempt=1,
+        tries=1,
+        adaptive=None,
+        cdp_endpoint="",
+        run_no=None,
+    ):
+        # attempt 决定规则 when 与策略；run_no 为实际执行顺序，只用于进度
+        # cdp_endpoint 非空时连接已启动的共享浏览器（策略竞速），只新建并关闭自己的 context
+        self._raise_if_stopped()
+        progress_attempt = attempt if run_no is None else run_no
+        if self.verbose_log and not self._chromium_executable_logged:
+            try:
+                self._log_verbose(
+                    f"playwright chromium executable={playwright_driver.chromium.executable_path}"
                 )
+            except Exception:
+                pass
+            self._chromium_executable_logged = True
+        launch_kwargs = self._browser_launch_kwargs()
+
+        context_kwargs = {
+            "user_agent": self.monitor_headers.get("user-agent", self._default_user_agent()),
+            "locale": "zh-CN",
+            "viewport": {"width": 1366, "height": 768},
+            "ignore_https_errors": True,
+        }
+
+        browser = None
+        owns_browser = True
+        context = None
+        profile_dir = None
+        try:
+            self._raise_if_stopped()
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=1, steps=8, phase="launch")
+            if cdp_endpoint != "":
+                browser = playwright_driver.chromium.connect_over_cdp(
+                    cdp_endpoint,
+                    timeout=self._responsive_timeout_ms(15000, 4000),
+                )
+                owns_browser = False
+                self._log_verbose(f"connect browser over cdp endpoint={cdp_endpoint}")
+            else:
+                profile_dir = self._acquire_browser_profile()
+            if profile_dir is not None:
                 try:
-                    page.wait_for_load_state(
-                        "networkidle",
-                        timeout=self._responsive_timeout_ms(8000, 2500),
+                    # 持久化目录保留 HTTP 缓存、Service Worker 与 Cookie，重复访问同一站点时免去重复下载与验证
+                    context = playwright_driver.chromium.launch_persistent_context(
+                        profile_dir,
+                        **launch_kwargs,
+                        **context_kwargs,
+                    )
+                    self._log_verbose(f"launch browser actual=chromium persistent profile={profile_dir}")
+                except MonitorInterrupted:
+                    raise
+                except Exception as exc:
+                    self._log_monitor(f"persistent profile launch failed: {exc}; using temporary context")
+                    self.browser_profiles.release(profile_dir)
+                    profile_dir = None
+            if context is None and browser is None:
+                browser = self._launch_browser(playwright_driver, launch_kwargs)
+                self._log_verbose("launch browser actual=chromium")
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=2, steps=8, phase="browser")
+            self._raise_if_stopped()
+            if context is None:
+                context = browser.new_context(**context_kwargs)
+            context.add_init_script(
+                """
+                    Object.defineProperty(navigator, 'webdriver', {
+                        get: () => undefined
+                    });
+                """
+            )
+            self._install_page_hook(context)
+            extra_headers = {k: v for k, v in self.monitor_headers.items() if k != "user-agent"}
+            if extra_headers:
+                context.set_extra_http_headers(extra_headers)
+
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=3, steps=8, phase="context")
+            self._raise_if_stopped()
+            page = context.new_page()
+            page.set_default_timeout(self._responsive_timeout_ms(12000, 4000))
+            page.on("response", self.handle_response)
+            page.on("request", self.handle_request)
+            page.on("requestfailed", self.handle_request_failed)
+
+            def _on_popup(popup):
+                if self._is_stop_requested():
+                    return
+                popup.on("response", self.handle_response)
+                popup.on("request", self.handle_request)
+                popup.on("requestfailed", self.handle_request_failed)
+                try:
+                    popup.wait_for_load_state(
+                        "domcontentloaded",
+                        timeout=self._responsive_timeout_ms(5000, 1800),
                     )
                 except MonitorInterrupted:
                     raise
                 except Exception:
                     pass
+                popup_url = self._normalize_url(getattr(popup, "url", ""))
+                if popup_url != "":
+                    self._add_page_candidate(popup_url)
+                try:
+                    popup.close()
+                except Exception:
+                    pass
+                self._recover_page_if_needed(page, self.URL)
 
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=5, steps=8, phase="extract")
-                self._raise_if_stopped()
-                self._extract_candidates_from_page(page)
-                if self.interaction_enabled:
-                    self._try_trigger_player(
-                        page,
-                        interaction_stage=interaction_stage,
-                        attempt=attempt,
-                        tries=tries,
-                    )
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=6, steps=8, phase="interaction")
+            context.on("page", _on_popup)
 
-                if self.recursion_depth > 1:
-                    self._raise_if_stopped()
-                    self._collect_recursive_candidates(page)
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=4, steps=8, phase="goto")
+            self._raise_if_stopped()
+            self._adaptive_timing_active = attempt <= 1 if adaptive is None else bool(adaptive)
+            self._begin_attempt_timing()
+            page.goto(
+                self.URL,
+                wait_until="domcontentloaded",
+                timeout=self._responsive_timeout_ms(self._adaptive_timeout_ms("dom_ready", 18000, 4000), 5500),
+            )
+            self._mark_attempt_timing("dom_ready_at")
+            try:
+                page.wait_for_load_state(
+                    "networkidle",
+                    timeout=self._responsive_timeout_ms(self._adaptive_timeout_ms("first_m3u8", 8000, 1500), 2500),
+                )
+            except MonitorInterrupted:
+                raise
+            except Exception:
+                pass
 
-                self._raise_if_stopped()
-                if self._is_blocked_page(page):
-                    self.last_blocked_by_client = True
-                    self.last_monitor_error = "ERR_BLOCKED_BY_CLIENT"
-                    self._recover_page_if_needed(page, self.URL)
-                    self._extract_candidates_from_page(page)
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=5, steps=8, phase="extract")
+            self._raise_if_stopped()
+            self._drain_response_scans(timeout=1.5)
+            self._extract_candidates_from_page(page)
+            if self.interaction_enabled:
+                self._try_trigger_player(
+                    page,
+                    interaction_stage=interaction_stage,
+                    attempt=attempt,
+                    tries=tries,
+                )
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=6, steps=8, phase="interaction")
 
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=7, steps=8, phase="hints")
+            if self.recursion_depth > 1:
                 self._raise_if_stopped()
-                self._update_session_hints(context, page)
-                self._emit_progress("attempt_step", attempt=attempt, tries=tries, step=8, steps=8, phase="done")
-            finally:
-                if context is not None:
-                    try:
-                        context.close()
-                    except Exception:
-                        pass
-                if browser is not None:
-                    try:
-                        browser.close()
-                    except Exception:
-                        pass
+                self._collect_recursive_candidates(page)
+
+            self._raise_if_stopped()
+            if self._is_blocked_page(page):
+                self.last_blocked_by_client = True
+                self.last_monitor_error = "ERR_BLOCKED_BY_CLIENT"
+                self._recover_page_if_needed(page, self.URL)
+                self._extract_candidates_from_page(page)
 
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=7, steps=8, phase="hints")
+            self._raise_if_stopped()
+            self._drain_response_scans(timeout=3.0)
+            self._update_session_hints(context, page)
+            self._finish_attempt_timing()
+            self._log_verbose(
+                f"page hook ready={self._page_hook_ready} reports={self._page_hook_stats['reports']} "
+                f"mse={self._page_hook_stats['mse']}"
+            )
+            self._emit_progress("attempt_step", attempt=progress_attempt, tries=tries, step=8, steps=8, phase="done")
+        finally:
+            if self._early_stop and not self._is_user_stop():
+                # 提前结束时本次尝试已测到的 DOM 就绪、首个 m3u8 耗时同样记入画像
+                self._finish_attempt_timing()
+            self._attempt_timing = None
+            if context is not None:
+                try:
+                    context.close()
+                except Exception:
+                    pass
+            if browser is not None and owns_browser:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            if profile_dir is not None:
+                self.browser_profiles.release(profile_dir)
+
+    def MonitorUrl(self):
         monitor_started_at = time.perf_counter()
         self._raise_if_stopped()
         self._log_monitor(f"start url={self.URL}")
@@ -2946,70 +4245,101 @@ class MonitorM3U8:
 
         tries = self.monitor_tries
         self._emit_progress("start", tries=tries, done=0)
+        force_browser = bool(self.active_interaction_rule.get("force_browser", False))
+        http_probed = False
+        http_added = 0
+        browser_added = 0
+        browser_skipped = False
         try:
-            with sync_playwright() as p:
-                try:
-                    self._log_monitor(f"chromium executable={p.chromium.executable_path}")
-                except Exception:
-                    self._log_monitor("chromium executable=(unknown)")
-                for attempt in range(tries):
-                    self._raise_if_stopped()
-                    attempt_no = attempt + 1
-                    attempt_started_at = time.perf_counter()
-                    before = len(self.possible)
-                    interaction_stage = 0
-                    if self.interaction_enabled:
-                        interaction_stage = 1 if attempt == 0 else 2
-
-                    stage_name = "first-pass" if interaction_stage == 1 else "retry-pass"
-                    if interaction_stage == 0:
-                        stage_name = "disabled"
-                    self._log_monitor(
-                        f"attempt {attempt_no}/{tries} start "
-                        f"strategy={stage_name} channel=chromium"
-                    )
-                    self._emit_progress("attempt_start", attempt=attempt_no, tries=tries, done=attempt_no - 1)
+            if self.http_probe_first and not force_browser:
+                http_probed = True
+                http_added = self._probe_with_requests(tier="http")
+                browser_skipped = self._has_strong_candidate()
+                if browser_skipped:
+                    self._log_monitor("http tier found strong candidate, skip browser")
+            elif self.http_probe_first:
+                self._log_monitor("http tier skipped: force_browser by site rule")
+
+            if not browser_skipped:
+                browser_before = len(self.possible)
+                with sync_playwright() as p:
                     try:
-                        __monitor_single(
-                            p,
-                            interaction_stage=interaction_stage,
-                            attempt=attempt_no,
-                            tries=tries,
+                        self._log_monitor(f"chromium executable={p.chromium.executable_path}")
+                    except Exception:
+                        self._log_monitor("chromium executable=(unknown)")
+                    run_order = self._attempt_run_order(tries)
+                    winner = ""
+                    next_run = 0
+                    if self.race_enabled and self.interaction_enabled and len(run_order) >= 2:
+                        winner = self._race_attempts(p, run_order[:2], tries)
+                        if winner is None:
+                            winner = ""
+                        else:
+                            # 竞速已拿到强候选时不再执行余下的尝试
+                            next_run = len(run_order) if winner != "" else 2
+                    for run_index in range(next_run, len(run_order)):
+                        self._raise_if_stopped()
+                        attempt_no = run_order[run_index]
+                        run_no = run_index + 1
+                        attempt_started_at = time.perf_counter()
+                        before = len(self.possible)
+                        had_strong = self._has_strong_candidate()
+                        stage_name = self._attempt_strategy_name(attempt_no)
+                        self._log_monitor(
+                            f"attempt {run_no}/{tries} start "
+                            f"strategy={stage_name} channel=chromium"
                         )
-                    except MonitorInterrupted:
-                        raise
-                    except Exception as exc:
-                        self.last_monitor_error = str(exc)
+                        self._emit_progress("attempt_start", attempt=run_no, tries=tries, done=run_no - 1)
+                        try:
+                            self._monitor_attempt(
+                                p,
+                                interaction_stage=self._attempt_interaction_stage(attempt_no),
+                                attempt=attempt_no,
+                                tries=tries,
+                                adaptive=run_index == 0,
+                                run_no=run_no,
+                            )
+                        except MonitorInterrupted:
+                            raise
+                        except Exception as exc:
+                            self.last_monitor_error = str(exc)
+                            elapsed = time.perf_counter() - attempt_started_at
+                            self._log_monitor(
+                                f"attempt {run_no}/{tries} failed in {self._fmt_seconds(elapsed)}: {exc}"
+                            )
+                            self._emit_progress(
+                                "attempt_done",
+                                attempt=run_no,
+                                tries=tries,
+                                done=run_no,
+                                success=False,
+                            )
+                            continue
+
+                        after = len(self.possible)
+                        new_candidates = max(0, after - before)
                         elapsed = time.perf_counter() - attempt_started_at
                         self._log_monitor(
-                            f"attempt {attempt_no}/{tries} failed in {self._fmt_seconds(elapsed)}: {exc}"
+                            f"attempt {run_no}/{tries} done in {self._fmt_seconds(elapsed)} "
+                            f"new_m3u8={new_candidates} total={after}"
                         )
+                        if winner == "" and not had_strong and self._has_strong_candidate():
+                            winner = stage_name
+                        if self.last_blocked_by_client:
+                            self._log_monitor("blocked-by-client detected; continue with retry strategy")
                         self._emit_progress(
                             "attempt_done",
-                            attempt=attempt_no,
+                            attempt=run_no,
                             tries=tries,
-                            done=attempt_no,
-                            success=False,
+                            done=run_no,
+                            success=True,
                         )
-                        continue
-
-                    after = len(self.possible)
-                    new_candidates = max(0, after - before)
-                    elapsed = time.perf_counter() - attempt_started_at
-                    self._log_monitor(
-                        f"attempt {attempt_no}/{tries} done in {self._fmt_seconds(elapsed)} "
-                        f"new_m3u8={new_candidates} total={after}"
-                    )
-                    if self.last_blocked_by_client:
-                        self._log_monitor("blocked-by-client detected; continue with retry strategy")
-                    self._emit_progress(
-                        "attempt_done",
-                        attempt=attempt_no,
-                        tries=tries,
-                        done=attempt_no,
-                        success=True,
-                    )
+                    self._record_strategy_win(winner, len(run_order))
+                browser_added = max(0, len(self.possible) - browser_before)
         except MonitorInterrupted:
+            self._shutdown_response_scans()
+            self.timing_profiles.flush()
+            self.strategy_stats.flush()
             monitor_elapsed = time.perf_counter() - monitor_started_at
             self._log_monitor(
                 f"interrupted in {self._fmt_seconds(monitor_elapsed)} "
@@ -3017,18 +4347,39 @@ class MonitorM3U8:
             )
             return list(self._ordered_m3u8_lists())
 
+        self._shutdown_response_scans()
+        self._log_response_scan_stats()
+        self._log_normalize_cache_stats()
+        self.timing_profiles.flush()
+        self.strategy_stats.flush()
+        self._evict_browser_profiles()
         self._raise_if_stopped()
         if len(self.possible) == 0 and self.last_monitor_error != "":
             self._log_monitor(f"ended with last error: {self.last_monitor_error}")
         fallback_added = 0
-        if len(self.possible) == 0:
-            fallback_added = self._fallback_probe_with_requests()
+        if len(self.possible) == 0 and not http_probed:
+            fallback_added = self._probe_with_requests(tier="fallback")
+
+        if browser_skipped:
+            tier = "http"
+        elif browser_added > 0:
+            tier = "browser"
+        elif fallback_added > 0:
+            tier = "fallback"
+        elif http_added > 0:
+            tier = "http"
+        else:
+            tier = "none"
+        tier_stats = self._record_tier(tier)
 
         monitor_elapsed = time.perf_counter() - monitor_started_at
         self._log_monitor(
             f"done in {self._fmt_seconds(monitor_elapsed)} "
             f"possible={len(self.possible)} predicted={len(self.predicted)} "
-            f"fallback_new={fallback_added}"
+            f"tier={tier} browser_skipped={browser_skipped} fallback_new={fallback_added}"
+        )
+        self._log_monitor(
+            "tier stats " + " ".join(f"{key}={value}" for key, value in tier_stats.items())
         )
         self._emit_progress(
             "done",
@@ -3037,6 +4388,7 @@ class MonitorM3U8:
             possible=len(self.possible),
             predicted=len(self.predicted),
             fallback_new=fallback_added,
+            tier=tier,
         )
         return list(self._ordered_m3u8_lists())
 
@@ -3102,6 +4454,7 @@ class MonitorM3U8:
                 proxy_config=self.proxy_config,
                 monitor_config=self.monitor_config,
                 stop_checker=self.stop_checker,
+                normalize_cache=self.normalize_cache,
             )
             child_possible, child_predicted = child.simple(run_recursive=False)
             possible.extend(child_possible)
@@ -3126,6 +4479,7 @@ class MonitorM3U8:
             f"recursion done processed={processed_nodes} queued_left={len(queue)} "
             f"cross_site_used={cross_site_used}"
         )
+        self._log_normalize_cache_stats()
         return possible, predicted
 
     def _print_candidate_preview(self, label, urls):
@@ -3145,12 +4499,119 @@ class MonitorM3U8:
             "referer_map": dict(self.session_hints.get("referer_map", {})),
         }
 
+    def _result_cache_key(self):
+        rules_path = self._resolve_rules_path(self.monitor_config.get("rules_path", ""))
+        fingerprint = json.dumps(
+            {
+                "rules": [rules_path, self._rules_file_signature(rules_path)],
+                "recursion_depth": self.recursion_depth,
+                "headless": self.headless,
+                "interaction": self.interaction_enabled,
+            },
+            sort_keys=True,
+        )
+        return MonitorCache.make_key(self._normalize_url(self.URL) or self.URL, fingerprint)
+
+    def _validate_cached_playlist(self, playlist_url, session_hints):
+        # 只读开头几个字节确认仍是播放列表，签名过期、链接失效时返回 False
+        session = self._build_probe_session()
+        try:
+            for cookie in session_hints.get("cookies", []):
+                try:
+                    session.cookies.set(
+                        cookie["name"],
+                        cookie["value"],
+                        domain=cookie.get("domain", ""),
+                        path=cookie.get("path", "/"),
+                    )
+                except (KeyError, TypeError):
+                    continue
+            headers = dict(self.monitor_headers)
+            if session_hints.get("user_agent"):
+                headers["user-agent"] = session_hints["user_agent"]
+            headers["referer"] = (
+                session_hints.get("referer_map", {}).get(playlist_url)
+                or session_hints.get("final_url")
+                or self.URL
+            )
+            with session.get(playlist_url, headers=headers, timeout=(3, 4), stream=True) as response:
+                if response.status_code != 200:
+                    return False
+                head = next(response.iter_content(256), b"")
+            return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"#EXTM3U")
+        except Exception:
+            return False
+        finally:
+            session.close()
+
+    def _load_cached_result(self):
+        if self.result_cache_ttl <= 0:
+            self.result_cache_status = "off"
+            return None
+        key = self._result_cache_key()
+        entry = self.result_cache.get(key, self.result_cache_ttl)
+        if entry is None:
+            self.result_cache_status = "miss"
+            return None
+        possible = [str(item) for item in entry["possible"]]
+        predicted = [str(item) for item in entry["predicted"]]
+        hints = entry.get("session_hints") if isinstance(entry.get("session_hints"), dict) else {}
+        age = time.time() - entry["stored"]
+        probe_url = (possible or predicted or [""])[0]
+        if probe_url == "" or not self._validate_cached_playlist(probe_url, hints):
+            self.result_cache.invalidate(key)
+            self.result_cache.flush()
+            self.result_cache_status = "stale"
+            self._log_monitor(f"result cache stale age={age:.0f}s playlist check failed; monitor again")
+            return None
+
+        self.result_cache_status = "hit"
+        with self.lock:
+            self.possible.update(possible)
+            self.predicted.update(predicted)
+        self.session_hints = {
+            "source_url": self.URL,
+            "final_url": str(hints.get("final_url") or self.URL),
+            "user_agent": str(hints.get("user_agent") or self.session_hints.get("user_agent", "")),
+            "cookies": [dict(item) for item in hints.get("cookies", []) if isinstance(item, dict)],
+            "referer_map": dict(hints.get("referer_map", {})),
+        }
+        self._log_monitor(
+            f"result cache hit age={age:.0f}s ttl={self.result_cache_ttl}s "
+            f"possible={len(possible)} predicted={len(predicted)}; skip browser"
+        )
+        self._emit_progress("done", tries=self.monitor_tries, done=self.monitor_tries, possible=len(possible))
+        return possible, predicted
+
+    def _store_result(self, possible, predicted):
+        if self.result_cache_ttl <= 0 or (len(possible) == 0 and len(predicted) == 0):
+            return
+        self.result_cache.put(
+            self._result_cache_key(),
+            self._normalize_url(self.URL) or self.URL,
+            possible,
+            predicted,
+            self.get_session_hints(),
+        )
+        self.result_cache.flush()
+
     def simple(self, run_recursive=True):
+        if run_recursive:
+            try:
+                self._raise_if_stopped()
+            except MonitorInterrupted:
+                return [[], []]
+            cached = self._load_cached_result()
+            if cached is not None:
+                return [list(cached[0]), list(cached[1])]
         try:
             self._raise_if_stopped()
             possible, predicted = self.MonitorUrl()
         except MonitorInterrupted:
-            return list(self._ordered_m3u8_lists())
+            possible, predicted = self._ordered_m3u8_lists()
+            if run_recursive and not self._is_user_stop():
+                self._store_result(possible, predicted)
+            return [list(possible), list(predicted)]
         if possible == [] and predicted == []:
             self._log_monitor("no resource found for current url")
         else:
@@ -3173,6 +4634,10 @@ class MonitorM3U8:
                     self._print_candidate_preview("possible", possible)
                     self._print_candidate_preview("predicted", predicted)
             except MonitorInterrupted:
-                return [list(dict.fromkeys(possible)), list(dict.fromkeys(predicted))]
+                possible = list(dict.fromkeys(possible))
+                predicted = list(dict.fromkeys(predicted))
 
+        # 提前结束（request_early_stop）时缓存已收集的结果，用户中断时不缓存
+        if run_recursive and not self._is_user_stop():
+            self._store_result(possible, predicted)
         return [possible, predicted]
@@ -0,0 +1,283 @@
+import json
+import os
+import random
+import threading
+import time
+from urllib.parse import quote
+
+from ConnectionTest import ConnectionTest
+
+
+class ProxyPool:
+    """多出口代理池（config/proxy.pool.json），分片请求按延迟分摊到健康的代理上。
+
+    文件格式：
+        {"enabled": true, "probeUrl": "", "proxies": [{"address": "10.0.0.2", "port": 8080,
+         "username": "", "password": "", "weight": 1}]}
+    - 选择：健康代理中 延迟(EWMA) × (在途请求数 + 1) / weight 最小者（加权最少延迟）
+    - 剔除：连续 EJECT_AFTER 次连接失败（代理不可达、连接超时、407）后剔除；到期后在后台用 ConnectionTest 复测，
+      通过则重新加入，否则剔除时长翻倍（不超过 MAX_EJECT_SECONDS）
+    - 设置中启用的单个代理同样加入代理池
+    同一文件在进程内共用一个实例；文件修改后自动重新读取，仍存在的代理保留统计。
+    """
+
+    DEFAULT_PATH = os.path.join("config", "proxy.pool.json")
+    LATENCY_ALPHA = 0.3
+    DEFAULT_LATENCY = 1.0
+    EJECT_AFTER = 3
+    EJECT_SECONDS = 30
+    MAX_EJECT_SECONDS = 300
+    PROBE_INTERVAL = 60
+    PROBE_TIMEOUT = (3, 5)
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self.enabled = False
+        self.probe_url = ""
+        self.proxies = []
+        self._last_probe = 0.0
+        self._last_target = ""
+        self.connection_test = ConnectionTest()
+
+    @classmethod
+    def shared(cls, path=None):
+        raw = str(path or os.getenv("M3U8_PROXY_POOL", "") or cls.DEFAULT_PATH).strip()
+        expanded = os.path.expanduser(os.path.expandvars(raw))
+        if not os.path.isabs(expanded):
+            expanded = os.path.join(os.getcwd(), expanded)
+        key = os.path.normcase(os.path.normpath(expanded))
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = cls(os.path.normpath(expanded))
+                cls._instances[key] = instance
+            return instance
+
+    @classmethod
+    def for_task(cls, proxy_config=None):
+        """代理池启用且至少有一个代理时返回共用实例，否则返回 None；设置中启用的代理会加入池中。"""
+        pool = cls.shared()
+        pool.reload()
+        if not pool.enabled:
+            return None
+        if isinstance(proxy_config, dict) and proxy_config.get("enabled"):
+            pool.add(proxy_config)
+        return pool if len(pool.proxies) > 0 else None
+
+    @classmethod
+    def resolve_config(cls, proxy_config):
+        """只走一条连接的请求（浏览器、页面与播放列表探测）所用的代理：代理池启用时取当前最优代理。"""
+        pool = cls.for_task(proxy_config)
+        if pool is None:
+            return proxy_config
+        entry = pool.best()
+        return {
+            "enabled": True,
+            "address": entry["address"],
+            "port": entry["port"],
+            "username": entry["username"],
+            "password": entry["password"],
+        }
+
+    @staticmethod
+    def _new_entry(address, port, username="", password="", weight=1.0, extra=False):
+        auth = ""
+        if username or password:
+            auth = f"{quote(username)}:{quote(password)}@"
+        return {
+            "address": address,
+            "port": port,
+            "username": username,
+            "password": password,
+            "weight": weight,
+            "extra": extra,
+            "label": f"{address}:{port}",
+            "url": f"http://{auth}{address}:{port}",
+            "latency": None,
+            "inflight": 0,
+            "ok": 0,
+            "failed": 0,
+            "consecutive_failures": 0,
+            "ejections": 0,
+            "ejected_until": 0.0,
+            "probing": False,
+        }
+
+    @staticmethod
+    def _parse_entry(item):
+        if not isinstance(item, dict):
+            return None
+        address = str(item.get("address", "")).strip()
+        port = str(item.get("port", "")).strip()
+        if address == "" or not port.isdigit():
+            return None
+        try:
+            weight = max(0.01, float(item.get("weight", 1) or 1))
+        except (TypeError, ValueError):
+            weight = 1.0
+        return address, port, str(item.get("username", "") or ""), str(item.get("password", "") or ""), weight
+
+    def reload(self):
+        try:
+            stat = os.stat(self.path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        with self._lock:
+            if signature == self._signature:
+                return
+            self._signature = signature
+            data = {}
+            if signature is not None:
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, ValueError) as exc:
+                    print(f"[warn][proxy] pool file ignored: {exc}")
+                    data = {}
+            if not isinstance(data, dict):
+                data = {}
+            self.enabled = bool(data.get("enabled", True)) and signature is not None
+            self.probe_url = str(data.get("probeUrl", "") or "").strip()
+            existing = {entry["label"]: entry for entry in self.proxies}
+            proxies = []
+            for item in data.get("proxies", []) if isinstance(data.get("proxies"), list) else []:
+                parsed = self._parse_entry(item)
+                if parsed is None:
+                    continue
+                address, port, username, password, weight = parsed
+                entry = existing.pop(f"{address}:{port}", None)
+                if entry is None or entry["username"] != username or entry["password"] != password:
+                    entry = self._new_entry(address, port, username, password, weight)
+                entry["weight"] = weight
+                entry["extra"] = False
+                proxies.append(entry)
+            # 设置中的代理不在文件里，重新读取时保留
+            proxies.extend(entry for entry in existing.values() if entry["extra"])
+            self.proxies = proxies
+            self._last_probe = 0.0
+
+    def add(self, proxy_config):
+        parsed = self._parse_entry(proxy_config)
+        if parsed is None:
+            return
+        address, port, username, password, _ = parsed
+        with self._lock:
+            if any(entry["label"] == f"{address}:{port}" for entry in self.proxies):
+                return
+            self.proxies.append(self._new_entry(address, port, username, password, extra=True))
+
+    def _score(self, entry, default_latency):
+        latency = entry["latency"] if entry["latency"] is not None else default_latency
+        return latency * (entry["inflight"] + 1) / entry["weight"]
+
+    def _default_latency_locked(self):
+        measured = [entry["latency"] for entry in self.proxies if entry["latency"] is not None]
+        return sum(measured) / len(measured) if measured else self.DEFAULT_LATENCY
+
+    def _pick_locked(self):
+        healthy = [entry for entry in self.proxies if entry["ejected_until"] == 0]
+        if len(healthy) == 0:
+            # 全部被剔除时仍需出口，使用最早到期的代理
+            return min(self.proxies, key=lambda entry: entry["ejected_until"])
+        default_latency = self._default_latency_locked()
+        scores = [self._score(entry, default_latency) for entry in healthy]
+        lowest = min(scores)
+        return random.choice([entry for entry, score in zip(healthy, scores) if score <= lowest * 1.0001])
+
+    def _due_readmissions_locked(self, now):
+        due = []
+        for entry in self.proxies:
+            if entry["ejected_until"] != 0 and entry["ejected_until"] <= now and not entry["probing"]:
+                entry["probing"] = True
+                due.append(entry)
+        return due
+
+    def best(self):
+        with self._lock:
+            return dict(self._pick_locked())
+
+    def acquire(self):
+        """为一次请求选择代理，返回代理条目（用完后交给 release）。"""
+        with self._lock:
+            entry = self._pick_locked()
+            entry["inflight"] += 1
+            due = self._due_readmissions_locked(time.monotonic())
+        for pending in due:
+            threading.Thread(target=self._readmit, args=(pending,), name="proxy-readmit", daemon=True).start()
+        return entry
+
+    def release(self, entry, ok, latency=None, proxy_failure=False):
+        ejected_for = 0
+        with self._lock:
+            entry["inflight"] = max(0, entry["inflight"] - 1)
+            if ok:
+                entry["ok"] += 1
+                entry["consecutive_failures"] = 0
+                if latency is not None:
+                    if entry["latency"] is None:
+                        entry["latency"] = float(latency)
+                    else:
+                        alpha = self.LATENCY_ALPHA
+                        entry["latency"] = (1 - alpha) * entry["latency"] + alpha * float(latency)
+                return
+            entry["failed"] += 1
+            if not proxy_failure:
+                return
+            entry["consecutive_failures"] += 1
+            if entry["consecutive_failures"] >= self.EJECT_AFTER and entry["ejected_until"] == 0:
+                ejected_for = self._eject_locked(entry)
+        if ejected_for > 0:
+            print(f"[proxy] eject {entry['label']} after {self.EJECT_AFTER} connection failures for {ejected_for}s")
+
+    def _eject_locked(self, entry):
+        entry["ejections"] += 1
+        entry["consecutive_failures"] = 0
+        seconds = min(self.MAX_EJECT_SECONDS, self.EJECT_SECONDS * 2 ** (entry["ejections"] - 1))
+        entry["ejected_until"] = time.monotonic() + seconds
+        return seconds
+
+    def _readmit(self, entry):
+        url = self.probe_url or self._last_target or None
+        ok, latency, detail = self.connection_test.probeProxies([entry["url"]], url, timeout=self.PROBE_TIMEOUT)[0]
+        with self._lock:
+            entry["probing"] = False
+            if ok:
+                entry["ejected_until"] = 0.0
+                entry["consecutive_failures"] = 0
+                entry["latency"] = latency
+            else:
+                seconds = self._eject_locked(entry)
+        if ok:
+            print(f"[proxy] readmit {entry['label']} latency={latency * 1000:.0f}ms")
+        else:
+            print(f"[proxy] {entry['label']} still unhealthy ({detail}); eject for {seconds}s")
+
+    def probe(self, target_url=""):
+        """并发测试所有代理的可用性与延迟（PROBE_INTERVAL 内只测一次），不可用的代理直接剔除。"""
+        now = time.monotonic()
+        with self._lock:
+            if target_url:
+                self._last_target = target_url
+            if self._last_probe and now - self._last_probe < self.PROBE_INTERVAL:
+                return
+            self._last_probe = now
+            entries = [entry for entry in self.proxies if entry["ejected_until"] == 0]
+        url = self.probe_url or target_url or None
+        results = self.connection_test.probeProxies([entry["url"] for entry in entries], url, timeout=self.PROBE_TIMEOUT)
+        for entry, (ok, latency, detail) in zip(entries, results):
+            seconds = 0
+            with self._lock:
+                if ok:
+                    entry["latency"] = latency
+                elif entry["ejected_until"] == 0:
+                    seconds = self._eject_locked(entry)
+            if ok:
+                print(f"[proxy] probe {entry['label']} ok latency={latency * 1000:.0f}ms")
+            else:
+                print(f"[proxy] probe {entry['label']} failed ({detail}); eject for {seconds}s")
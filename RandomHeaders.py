@@ -1,13 +1,17 @@
-import requests
 import random
-from fake_useragent import UserAgent
 
 from ConnectionTest import ConnectionTest
+from UserAgentSampler import UserAgentSampler
 class RandomHeaders:
     # 使用组合类，内部类
     class Config:
-        ua = UserAgent()  # 初始化 fake_useragent
-        ct = ConnectionTest()  # 初始化 连接测试
+        # User-Agent 数据与连接测试都在第一次使用时才初始化，导入本模块不读文件、不联网
+        ct = None
+        defaultUserAgent = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/139.0.0.0 Safari/537.36"
+        )
         refererExample = [
             "https://www.baidu.com",
             "https://kimi.moonshot.cn/?ref=aihub.cn",
@@ -92,17 +96,27 @@ class RandomHeaders:
         }
         return sec_fields
 
+    @staticmethod
+    def _connectionTest():
+        if RandomHeaders.Config.ct is None:
+            RandomHeaders.Config.ct = ConnectionTest()
+        return RandomHeaders.Config.ct
+
     @staticmethod
     # 生成完整的随机请求头；只返回一个头部列表，不会更改对象的存储内容
-    def GenHeadersList(num=1, rList=Config.refererExample):
+    def GenHeadersList(num=1, rList=Config.refererExample, device=None, browser=None):
         """
         :param num: 默认只生成一个请求头
         :param rList: 传入None或[]则表示请求头不使用referer字段，默认使用示例referer
+        :param device: User-Agent 的设备类型 desktop/mobile/tablet，默认按 UserAgentSampler.DEFAULT_DEVICE_MIX 的比例
+        :param browser: User-Agent 的浏览器家族（如 chrome、safari），默认不限
         """
         retList = []
+        sampler = UserAgentSampler.shared()
 
         for i in range(num):
-            user_agent = RandomHeaders.Config.ua.random  # 随机生成 User-Agent
+            # 按 src/browsers.jsonl 中的占比加权抽取 User-Agent
+            user_agent = sampler.sample(device=device, browser=browser) or RandomHeaders.Config.defaultUserAgent
 
             sec_fields = RandomHeaders.__ua2sec(user_agent)
             referer = random.choice(rList) if rList and isinstance(rList, list) else None
@@ -125,13 +139,13 @@ class RandomHeaders:
         """
         rightconnection = True
         for index, headers in enumerate(self.headersList):
-            if not self.Config.ct.connectionTest200(headers=headers):
+            if not self._connectionTest().connectionTest200(headers=headers):
                 flag = False  # temporory rightconnection
                 retries = 10
                 for attempt in range(retries):
                     rL = self.refererList if len(self.refererList) > 0 else RandomHeaders.Config.refererExample
                     headers = RandomHeaders.GenHeadersList(rList=rL)
-                    if self.Config.ct.connectionTest200(headers=headers):
+                    if self._connectionTest().connectionTest200(headers=headers):
                         self.headersList[index] = headers
                         flag = True
                         break
@@ -0,0 +1,293 @@
+import fnmatch
+import re
+
+
+class _PatternGroup:
+    """一组正则的批量判断。
+
+    能提取出必需字面量的正则按字面量中最少见的三字符片段建索引，文本只查自身出现过的片段，
+    再用字面量子串预检（不含则不可能命中）；其余按块合并成交替式，先整块判断，只对命中的块逐条确认。
+    """
+
+    CHUNK_SIZE = 32
+    MIN_LITERAL = 3
+    _BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+
+    def __init__(self, entries, flags=0):
+        # entries: [(pattern_text, index)]
+        self._gated = []
+        self._gram_index = {}
+        self._chunks = []
+        self._singles = []
+        combinable = []
+        for text, index in entries:
+            try:
+                compiled = re.compile(text, flags)
+            except re.error:
+                continue
+            literal = "" if compiled.flags & re.VERBOSE else self._required_literal(text)
+            if len(literal) >= self.MIN_LITERAL and literal.isascii():
+                self._gated.append((literal.lower(), compiled, index))
+            elif compiled.groups > 0 and self._BACKREF.search(text):
+                # 含反向引用，合并后分组编号会错位
+                self._singles.append((compiled, index))
+            else:
+                combinable.append((text, compiled, index))
+        for start in range(0, len(combinable), self.CHUNK_SIZE):
+            chunk = combinable[start:start + self.CHUNK_SIZE]
+            members = [(compiled, index) for _, compiled, index in chunk]
+            try:
+                combined = re.compile("|".join(f"(?:{text})" for text, _, _ in chunk), flags)
+            except re.error:
+                # 例如中途出现的全局内联标志，无法合并时退回逐条
+                self._singles.extend(members)
+                continue
+            self._chunks.append((combined, members))
+
+        gram_counts = {}
+        for literal, _, _ in self._gated:
+            for gram in self._grams(literal):
+                gram_counts[gram] = gram_counts.get(gram, 0) + 1
+        for entry in self._gated:
+            gram = min(self._grams(entry[0]), key=lambda item: gram_counts[item])
+            self._gram_index.setdefault(gram, []).append(entry)
+
+    @staticmethod
+    def _grams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def _skip_class(pattern, i):
+        # pattern[i] == "["，返回 "]" 之后的位置
+        i += 1
+        if i < len(pattern) and pattern[i] == "^":
+            i += 1
+        if i < len(pattern) and pattern[i] == "]":
+            i += 1
+        while i < len(pattern) and pattern[i] != "]":
+            i += 2 if pattern[i] == "\\" else 1
+        return i + 1
+
+    @classmethod
+    def _skip_group(cls, pattern, i):
+        # pattern[i] == "("，返回配对 ")" 之后的位置
+        depth = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "\\":
+                i += 2
+                continue
+            if char == "[":
+                i = cls._skip_class(pattern, i)
+                continue
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        return i
+
+    @classmethod
+    def _required_literal(cls, pattern):
+        """顶层必须出现的最长字面量；无法确定（顶层 |、只有分组/字符类等）时返回空串。"""
+        best = ""
+        run = ""
+        i = 0
+        length = len(pattern)
+        while i < length:
+            char = pattern[i]
+            atom = None
+            if char == "\\":
+                escaped = pattern[i + 1:i + 2]
+                if escaped != "" and not escaped.isalnum():
+                    atom = escaped
+                i += 2
+            elif char == "[":
+                i = cls._skip_class(pattern, i)
+            elif char == "(":
+                i = cls._skip_group(pattern, i)
+            elif char == "|":
+                return ""
+            elif char in ".^$":
+                i += 1
+            else:
+                atom = char
+                i += 1
+
+            quantifier = pattern[i:i + 1]
+            optional = False
+            repeated = False
+            if quantifier in {"?", "*"}:
+                optional = True
+                i += 1
+            elif quantifier == "+":
+                repeated = True
+                i += 1
+            elif quantifier == "{":
+                close = pattern.find("}", i)
+                body = pattern[i + 1:close] if close != -1 else ""
+                minimum = body.split(",")[0].strip()
+                if close != -1 and minimum.isdigit():
+                    optional = int(minimum) == 0
+                    repeated = not optional
+                    i = close + 1
+            if (optional or repeated) and pattern[i:i + 1] in {"?", "+"}:
+                i += 1
+
+            if atom is None or optional:
+                run = ""
+                continue
+            run += atom
+            if len(run) > len(best):
+                best = run
+            if repeated:
+                run = ""
+        return best
+
+    def collect(self, text, matched, anchored=False, lowered=None):
+        if self._gated:
+            # 大小写折叠只对 ASCII 文本与 lower() 一致，否则逐条判断
+            if lowered is not None and text.isascii():
+                candidates = []
+                for gram in self._grams(lowered):
+                    bucket = self._gram_index.get(gram)
+                    if bucket is not None:
+                        candidates.extend(item for item in bucket if item[0] in lowered)
+            else:
+                candidates = self._gated
+            for _, compiled, index in candidates:
+                if index in matched:
+                    continue
+                if (compiled.match(text) if anchored else compiled.search(text)) is not None:
+                    matched.add(index)
+        for combined, members in self._chunks:
+            hit = combined.match(text) if anchored else combined.search(text)
+            if hit is None:
+                continue
+            for compiled, index in members:
+                if index in matched:
+                    continue
+                if (compiled.match(text) if anchored else compiled.search(text)) is not None:
+                    matched.add(index)
+        for compiled, index in self._singles:
+            if index in matched:
+                continue
+            if (compiled.match(text) if anchored else compiled.search(text)) is not None:
+                matched.add(index)
+
+
+class RuleIndex:
+    """站点规则的匹配索引，替代对每条 site 规则逐个 fnmatch / re.search。
+
+    匹配语义与原实现一致：host / url_contains / url_regex 任一命中即匹配（OR），
+    三者都未配置的规则总是匹配；结果按规则在文件中的原始顺序返回。
+
+    - host 精确值：dict 直接查找
+    - host 为 “*.后缀” 且后缀不含通配符：按域名标签倒序建后缀树，沿主机名走一遍即可
+    - 其它 host 通配：fnmatch.translate 后按块合并为交替正则
+    - url_contains：全部关键字合并为一个预检正则，未命中时跳过逐个比较
+    - url_regex：忽略大小写；能提取必需字面量的先做子串预检，其余按块合并为交替正则；
+      以 ^ 开头的只在位置 0 尝试；非法正则视为不匹配
+    """
+
+    _GLOB_CHARS = set("*?[")
+
+    def __init__(self, sites):
+        self.size = len(sites)
+        self._always = []
+        self._exact_hosts = {}
+        self._suffix_trie = {}
+        self._contains = []
+        self._contains_prefilter = None
+        host_globs = []
+        regexes = []
+
+        keywords = set()
+        for index, site in enumerate(sites):
+            host_patterns = site.get("host_patterns", [])
+            url_contains = site.get("url_contains", [])
+            url_regex = str(site.get("url_regex", "")).strip()
+            if not host_patterns and not url_contains and url_regex == "":
+                self._always.append(index)
+                continue
+
+            for pattern in host_patterns:
+                self._add_host_pattern(pattern, index, host_globs)
+            for keyword in url_contains:
+                self._contains.append((keyword, index))
+                keywords.add(keyword)
+            if url_regex != "":
+                regexes.append((url_regex, index))
+
+        self._host_globs = _PatternGroup(host_globs)
+        # 以 ^ 开头的正则只可能在位置 0 命中，单独成组用 match，避免合并后逐位置试探
+        anchored = [item for item in regexes if self._anchored_at_start(item[0])]
+        floating = [item for item in regexes if not self._anchored_at_start(item[0])]
+        self._anchored_regexes = _PatternGroup(anchored, re.IGNORECASE)
+        self._regexes = _PatternGroup(floating, re.IGNORECASE)
+        if keywords:
+            self._contains_prefilter = re.compile("|".join(re.escape(item) for item in sorted(keywords)))
+
+    @staticmethod
+    def _anchored_at_start(pattern):
+        if not pattern.startswith("^"):
+            return False
+        # 顶层出现 | 时其它分支不受 ^ 约束
+        depth = 0
+        in_class = False
+        escaped = False
+        for char in pattern:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif in_class:
+                in_class = char != "]"
+            elif char == "[":
+                in_class = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                return False
+        return True
+
+    def _add_host_pattern(self, pattern, index, host_globs):
+        if not any(char in self._GLOB_CHARS for char in pattern):
+            self._exact_hosts.setdefault(pattern, []).append(index)
+            return
+        suffix = pattern[2:] if pattern.startswith("*.") else ""
+        if suffix != "" and not any(char in self._GLOB_CHARS for char in suffix):
+            node = self._suffix_trie
+            for label in reversed(suffix.split(".")):
+                node = node.setdefault(label, {})
+            node.setdefault("", []).append(index)
+            return
+        host_globs.append((fnmatch.translate(pattern), index))
+
+    def _match_host(self, host, matched):
+        matched.update(self._exact_hosts.get(host, ()))
+        labels = host.split(".")
+        node = self._suffix_trie
+        for depth in range(len(labels) - 1, 0, -1):
+            node = node.get(labels[depth])
+            if node is None:
+                break
+            # “*.后缀” 至少还要剩一个标签（fnmatch 的 * 可以跨越多个标签）
+            matched.update(node.get("", ()))
+        self._host_globs.collect(host, matched, anchored=True)
+
+    def match(self, host, url, lowered_url):
+        """返回命中的规则下标（升序）。host / lowered_url 为小写，url 为规范化后的原始大小写 URL。"""
+        matched = set(self._always)
+        self._match_host(host, matched)
+        if self._contains_prefilter is not None and self._contains_prefilter.search(lowered_url):
+            for keyword, index in self._contains:
+                if index not in matched and keyword in lowered_url:
+                    matched.add(index)
+        self._anchored_regexes.collect(url, matched, anchored=True, lowered=lowered_url)
+        self._regexes.collect(url, matched, lowered=lowered_url)
+        return sorted(matched)
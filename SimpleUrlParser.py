@@ -1,6 +1,5 @@
 
 import re
-from itertools import product
 
 class SimpleUrlParser:
     def __init__(self):
@@ -39,9 +38,9 @@ class SimpleUrlParser:
 
             # 判断是范围还是列表
             if '-' in value_spec and re.match(r'^\d+-\d+$', value_spec):
-                # 范围解析: "1-10"
+                # 范围解析: "1-10"，保留 range 对象，超大范围也不占内存
                 start, end = map(int, value_spec.split('-'))
-                replacements_data[key] = list(range(start, end + 1))
+                replacements_data[key] = range(start, end + 1)
             else:
                 # 列表解析: "item1,item2,item3"
                 replacements_data[key] = [item.strip() for item in value_spec.split(',')]
@@ -72,27 +71,7 @@ class SimpleUrlParser:
             # 如果没有需要替换的占位符，或没有提供替换规则，则直接返回原始 URL 模板
             return [url_template]
 
-        # 按模板中的占位符顺序取值；若某占位符缺失规则，则保留原文占位符。
-        ordered_value_lists, _ = self._build_ordered_value_lists(placeholders_in_template, replacements_data)
-
-        # 生成所有组合
-        for combo in product(*ordered_value_lists):
-            current_url = url_template
-            # 遍历占位符，按顺序替换
-            for i, ph_value in enumerate(combo):
-                placeholder_key = placeholders_in_template[i]
-
-                # 动态填充逻辑 (可选):
-                # 如果是数字，且是范围生成，可以根据最大值进行填充
-                ph_str_val = str(ph_value)
-                if isinstance(ph_value, int):
-                    # 查找这个 key 对应的所有值中最大的数字的位数，进行填充
-                    if placeholder_key in replacements_data and isinstance(replacements_data[placeholder_key][0], int):
-                        max_val_in_range = max(replacements_data[placeholder_key])
-                        padding_len = len(str(max_val_in_range))
-                        ph_str_val = str(ph_value).zfill(padding_len)
-
-                current_url = current_url.replace(f"{{{{{placeholder_key}}}}}", ph_str_val, 1) # 只替换一次，防止多重替换错误
+        for current_url, _ in self.iter_urls_with_match_strings(url_template, replacements_data, placeholders_in_template):
             generated_urls.append(current_url)
 
         return generated_urls
@@ -106,7 +85,7 @@ class SimpleUrlParser:
         placeholders_with_rules = {}
         for ph in placeholders_in_template:
             values = replacements_data.get(ph)
-            if isinstance(values, list) and len(values) > 0:
+            if isinstance(values, (list, range)) and len(values) > 0:
                 ordered_value_lists.append(values)
                 placeholders_with_rules[ph] = True
                 continue
@@ -119,47 +98,101 @@ class SimpleUrlParser:
             placeholders_with_rules[ph] = False
         return ordered_value_lists, placeholders_with_rules
 
-    def generate_urls_with_match_strings(self, url_template, replacements_data, placeholders_in_template):
+    def _padding_widths(self, placeholders_in_template, replacements_data):
         """
-        根据 URL 模板、替换数据和占位符顺序生成最终 URL 列表，
-        同时为每个 URL 生成一个匹配字符串 (例如: idx_1_epi_2)。
-        返回一个 (url, match_string) 元组的列表。
+        数字范围按最大值的位数左侧补零；每个占位符只计算一次。
+        """
+        widths = {}
+        for placeholder_key in placeholders_in_template:
+            values = replacements_data.get(placeholder_key)
+            if isinstance(values, (list, range)) and len(values) > 0 and isinstance(values[0], int):
+                widths[placeholder_key] = len(str(max(values)))
+        return widths
+
+    def count_combinations(self, url_template, replacements_data, placeholders_in_template):
+        """
+        组合总数（不生成任何 URL）。
+        """
+        if not placeholders_in_template or not replacements_data:
+            return 1
+        total = 1
+        for ph in placeholders_in_template:
+            values = replacements_data.get(ph)
+            if isinstance(values, (list, range)) and len(values) > 0:
+                total *= len(values)
+        return total
+
+    def iter_urls_with_match_strings(self, url_template, replacements_data, placeholders_in_template, start_index=0):
+        """
+        按与 itertools.product 相同的顺序逐个产出 (url, match_string)，不预先生成整个列表。
+        start_index 为要跳过的组合数（从 0 开始），按混合进制直接定位，恢复中断的批量任务时无需逐个跳过。
         """
-        generated_results = []
         if not placeholders_in_template or not replacements_data:
             # 如果没有需要替换的占位符，或没有提供替换规则
             # match_string 为空
-            return [(url_template, "")]
+            if start_index <= 0:
+                yield (url_template, "")
+            return
         ordered_value_lists, placeholders_with_rules = self._build_ordered_value_lists(
             placeholders_in_template,
             replacements_data,
         )
-        # 生成所有组合
-        for combo in product(*ordered_value_lists):
+        widths = self._padding_widths(placeholders_in_template, replacements_data)
+        # 每个占位符的取值预先转成字符串（范围很大时按需转换）
+        rendered_lists = []
+        for i, values in enumerate(ordered_value_lists):
+            width = widths.get(placeholders_in_template[i], 0)
+            if isinstance(values, range):
+                rendered_lists.append((values, width))
+            else:
+                rendered_lists.append(([self._render_value(value, width) for value in values], -1))
+
+        sizes = [len(values) for values, _ in rendered_lists]
+        total = 1
+        for size in sizes:
+            total *= size
+        if start_index >= total:
+            return
+        # 起始组合的各位（最后一个占位符变化最快）
+        digits = [0] * len(sizes)
+        remainder = max(0, int(start_index))
+        for position in range(len(sizes) - 1, -1, -1):
+            remainder, digits[position] = divmod(remainder, sizes[position])
+
+        for _ in range(total - max(0, int(start_index))):
             current_url = url_template
             match_parts = [] # 用于构建匹配字符串的部件列表
-            # 遍历占位符，按顺序替换
-            for i, ph_value in enumerate(combo):
+            for i, digit in enumerate(digits):
+                values, width = rendered_lists[i]
+                ph_str_val = values[digit] if width < 0 else self._render_value(values[digit], width)
                 placeholder_key = placeholders_in_template[i]
-                # 动态填充逻辑 (可选):
-                # 如果是数字，且是范围生成，可以根据最大值进行填充
-                ph_str_val = str(ph_value)
-                if isinstance(ph_value, int):
-                    # 查找这个 key 对应的所有值中最大的数字的位数，进行填充
-                    if placeholder_key in replacements_data and isinstance(replacements_data[placeholder_key][0], int):
-                        max_val_in_range = max(replacements_data[placeholder_key])
-                        padding_len = len(str(max_val_in_range))
-                        ph_str_val = str(ph_value).zfill(padding_len)
                 current_url = current_url.replace(f"{{{{{placeholder_key}}}}}", ph_str_val, 1) # 只替换一次，防止多重替换错误
 
                 # 为匹配字符串添加部件
                 if placeholders_with_rules.get(placeholder_key, False):
                     match_parts.append(f"{placeholder_key}_{ph_str_val}")
+            yield (current_url, "_".join(match_parts))
+
+            # 进位
+            for position in range(len(digits) - 1, -1, -1):
+                digits[position] += 1
+                if digits[position] < sizes[position]:
+                    break
+                digits[position] = 0
 
-            # 构建最终的匹配字符串
-            match_string = "_".join(match_parts)
-            generated_results.append((current_url, match_string))
-        return generated_results
+    @staticmethod
+    def _render_value(value, width):
+        if isinstance(value, int) and width > 0:
+            return str(value).zfill(width)
+        return str(value)
+
+    def generate_urls_with_match_strings(self, url_template, replacements_data, placeholders_in_template):
+        """
+        根据 URL 模板、替换数据和占位符顺序生成最终 URL 列表，
+        同时为每个 URL 生成一个匹配字符串 (例如: idx_1_epi_2)。
+        返回一个 (url, match_string) 元组的列表；组合很多时请使用 iter_urls_with_match_strings。
+        """
+        return list(self.iter_urls_with_match_strings(url_template, replacements_data, placeholders_in_template))
 
 # --- 使用示例 ---
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+import time
+
+from JsonProcessor import JsonStore
+
+
+class StrategyStats(JsonStore):
+    """按域名统计各探测策略（first-pass / retry-pass 等）率先拿到强候选的次数。
+
+    order() 按胜场从高到低排列给定策略，胜场相同保持调用方的默认顺序。
+    某域名的总胜场超过 MAX_WINS 时全部减半，让近期表现占主导（网站改版后能较快纠正）。
+    """
+
+    MAX_WINS = 40
+    MAX_ENTRIES = 500
+
+    @staticmethod
+    def _parse_entry(entry):
+        if not isinstance(entry, dict) or not isinstance(entry.get("wins"), dict):
+            return None
+        wins = {
+            str(name): int(count)
+            for name, count in entry["wins"].items()
+            if isinstance(count, (int, float)) and count > 0
+        }
+        return {"updated": float(entry.get("updated", 0) or 0), "wins": wins}
+
+    def record_win(self, domain, strategy):
+        if not domain or not strategy:
+            return
+        with self._lock:
+            entry = self._data.setdefault(domain, {"updated": 0.0, "wins": {}})
+            wins = entry["wins"]
+            wins[strategy] = wins.get(strategy, 0) + 1
+            if sum(wins.values()) > self.MAX_WINS:
+                entry["wins"] = {name: count // 2 for name, count in wins.items() if count // 2 > 0}
+            entry["updated"] = time.time()
+            self._dirty = True
+
+    def wins(self, domain):
+        with self._lock:
+            return dict(self._data.get(domain, {}).get("wins", {}))
+
+    def order(self, domain, strategies):
+        wins = self.wins(domain)
+        return sorted(strategies, key=lambda name: -wins.get(name, 0))
@@ -0,0 +1,69 @@
+import time
+
+from JsonProcessor import JsonStore
+
+
+class TimingProfiles(JsonStore):
+    """按域名记录监测各阶段的实际耗时，并据此推导更紧的超时。
+
+    每个域名、每项指标只保留最近 MAX_SAMPLES 个样本（毫秒），样本不足 MIN_SAMPLES 时不做调整。
+    推导值 = p90 × FACTOR，不低于 floor，不高于调用方给出的默认值（规则文件/内置预算为上限）。
+    域名数超过 MAX_ENTRIES 时淘汰最久未更新的。
+    """
+
+    MAX_SAMPLES = 20
+    MIN_SAMPLES = 3
+    MAX_ENTRIES = 500
+    FACTOR = 1.5
+    PERCENTILE = 0.9
+
+    @staticmethod
+    def _parse_entry(entry):
+        if not isinstance(entry, dict):
+            return None
+        raw_samples = entry.get("samples")
+        if not isinstance(raw_samples, dict):
+            raw_samples = {}
+        metrics = {}
+        for metric, samples in raw_samples.items():
+            if isinstance(samples, list):
+                metrics[str(metric)] = [float(v) for v in samples if isinstance(v, (int, float)) and v >= 0]
+        return {"updated": float(entry.get("updated", 0) or 0), "samples": metrics}
+
+    def record(self, domain, metric, value_ms):
+        if not domain or value_ms is None:
+            return
+        try:
+            value = max(0.0, float(value_ms))
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            entry = self._data.setdefault(domain, {"updated": 0.0, "samples": {}})
+            samples = entry["samples"].setdefault(metric, [])
+            samples.append(round(value, 1))
+            del samples[: -self.MAX_SAMPLES]
+            entry["updated"] = time.time()
+            self._dirty = True
+
+    def percentile(self, domain, metric, q=None):
+        q = self.PERCENTILE if q is None else q
+        with self._lock:
+            samples = list(self._data.get(domain, {}).get("samples", {}).get(metric, []))
+        if len(samples) < self.MIN_SAMPLES:
+            return None
+        samples.sort()
+        position = min(len(samples) - 1, max(0, int(round(q * (len(samples) - 1)))))
+        return samples[position]
+
+    def adaptive_ms(self, domain, metric, default_ms, floor_ms):
+        """默认值为上限；样本不足时原样返回默认值。"""
+        p90 = self.percentile(domain, metric)
+        if p90 is None:
+            return int(default_ms)
+        return int(min(default_ms, max(floor_ms, p90 * self.FACTOR)))
+
+    def summary(self, domain):
+        with self._lock:
+            samples = self._data.get(domain, {}).get("samples", {})
+            counts = {metric: len(values) for metric, values in samples.items()}
+        return {metric: (count, self.percentile(domain, metric)) for metric, count in counts.items()}
@@ -0,0 +1,249 @@
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from HostCircuitBreaker import HostCircuitBreaker
+
+
+class TransferScheduler:
+    """进程内所有 HTTP 传输共用的调度：带宽令牌桶（全局 + 每个任务）与每个主机的并发连接上限。
+
+    - 每个下载器（以及监测的纯 HTTP 探测）注册为一个任务（open_job），带优先级 priority
+    - 主机连接：同一主机同时进行的请求不超过 host_connections；有空位时，在等待的任务中选
+      已获得连接数 / priority 最小者（加权公平），同一任务内先到先得
+    - 带宽：全局令牌桶限制总速率；每个任务另有令牌桶，速率为 全局速率 × 本任务 priority / 活跃任务 priority 之和
+      （再受每任务上限约束），读到的字节先扣令牌，令牌不足时等待
+    - 熔断：每个主机一个 HostCircuitBreaker，熔断（open）期间该主机的请求停在 acquire 中排队，到期后只放行一个试探请求
+    环境变量：M3U8_BANDWIDTH_LIMIT（全局，字节/秒，可带 K/M 后缀）、M3U8_JOB_BANDWIDTH_LIMIT（每个任务）、
+    M3U8_HOST_CONNECTIONS（每主机并发连接，0 表示不限）。
+    """
+
+    DEFAULT_HOST_CONNECTIONS = 32
+    BURST_SECONDS = 1.0
+    ACTIVE_SECONDS = 2.0
+    STALE_SECONDS = 60.0
+    POLL_SECONDS = 0.2
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, global_rate=0, job_rate=0, host_connections=DEFAULT_HOST_CONNECTIONS):
+        self.global_rate = max(0, int(global_rate or 0))
+        self.job_rate = max(0, int(job_rate or 0))
+        self.host_connections = max(0, int(host_connections or 0))
+        self._cond = threading.Condition()
+        self._jobs = {}
+        self._job_ids = itertools.count(1)
+        self._arrivals = itertools.count()
+        self._host_active = {}
+        self._waiting = {}
+        self._global_bucket = {"tokens": float(self.global_rate * self.BURST_SECONDS), "updated": time.monotonic()}
+        self.breaker = HostCircuitBreaker()
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                try:
+                    host_connections = int(os.getenv("M3U8_HOST_CONNECTIONS", str(cls.DEFAULT_HOST_CONNECTIONS)))
+                except ValueError:
+                    host_connections = cls.DEFAULT_HOST_CONNECTIONS
+                cls._shared = cls(
+                    global_rate=cls.parse_rate(os.getenv("M3U8_BANDWIDTH_LIMIT", "")),
+                    job_rate=cls.parse_rate(os.getenv("M3U8_JOB_BANDWIDTH_LIMIT", "")),
+                    host_connections=host_connections,
+                )
+                if cls._shared.global_rate or cls._shared.job_rate or cls._shared.host_connections:
+                    print(
+                        f"[scheduler] bandwidth={cls._shared.global_rate or 'unlimited'} "
+                        f"job_bandwidth={cls._shared.job_rate or 'unlimited'} "
+                        f"host_connections={cls._shared.host_connections or 'unlimited'}"
+                    )
+            return cls._shared
+
+    @staticmethod
+    def parse_rate(text):
+        """'2M' -> 2097152，'500K' -> 512000，'1000' -> 1000（字节/秒）；空、0 或无法解析时返回 0（不限）。"""
+        raw = str(text or "").strip().upper()
+        if raw.endswith("/S"):
+            raw = raw[:-2]
+        if raw.endswith("B"):
+            raw = raw[:-1]
+        if raw == "":
+            return 0
+        scale = 1
+        if raw[-1] in "KMG":
+            scale = 1024 ** ("KMG".index(raw[-1]) + 1)
+            raw = raw[:-1]
+        try:
+            return max(0, int(float(raw) * scale))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def host_of(url):
+        return urlparse(str(url or "")).netloc.lower()
+
+    # ---- 任务 ----
+
+    def open_job(self, name, priority=1):
+        now = time.monotonic()
+        with self._cond:
+            self._prune_locked(now)
+            # 新任务从当前最小的虚拟时间开始，不会因为起步晚而长期独占连接
+            virtual = min((job["virtual"] for job in self._jobs.values()), default=0.0)
+            job = {
+                "id": next(self._job_ids),
+                "name": str(name),
+                "priority": max(0.1, float(priority or 1)),
+                "virtual": virtual,
+                "connections": 0,
+                "bytes": 0,
+                "waited": 0.0,
+                "last_active": now,
+                "bucket": {"tokens": 0.0, "updated": now},
+            }
+            job["bucket"]["tokens"] = float(self._job_rate_locked(job, now) * self.BURST_SECONDS)
+            self._jobs[job["id"]] = job
+            return job
+
+    def _prune_locked(self, now):
+        for job_id, job in list(self._jobs.items()):
+            if job["connections"] == 0 and now - job["last_active"] > self.STALE_SECONDS:
+                del self._jobs[job_id]
+
+    def set_priority(self, job, priority):
+        with self._cond:
+            job["priority"] = max(0.1, float(priority or 1))
+
+    # ---- 主机连接 ----
+
+    def _next_waiter_locked(self, host):
+        waiters = self._waiting.get(host, [])
+        if len(waiters) == 0:
+            return None
+        return min(waiters, key=lambda waiter: (waiter["job"]["virtual"], waiter["arrival"]))
+
+    def acquire(self, job, url, stop_checker=None):
+        """占用目标主机的一个连接位；stop_checker 返回 True 时放弃等待并返回 False。"""
+        host = self.host_of(url)
+        started_at = time.monotonic()
+        with self._cond:
+            waiter = {"job": job, "arrival": next(self._arrivals)}
+            waiters = self._waiting.setdefault(host, [])
+            waiters.append(waiter)
+            try:
+                while True:
+                    if stop_checker is not None and stop_checker():
+                        return False
+                    free = self.host_connections <= 0 or self._host_active.get(host, 0) < self.host_connections
+                    if free and self._next_waiter_locked(host) is waiter and self.breaker.allow(host):
+                        self._host_active[host] = self._host_active.get(host, 0) + 1
+                        job["connections"] += 1
+                        job["virtual"] += 1.0 / job["priority"]
+                        job["last_active"] = time.monotonic()
+                        job["waited"] += job["last_active"] - started_at
+                        return True
+                    self._cond.wait(self.POLL_SECONDS)
+            finally:
+                waiters.remove(waiter)
+                if len(waiters) == 0:
+                    self._waiting.pop(host, None)
+                # 自己放弃或取走连接位后，让下一个等待者重新判断
+                self._cond.notify_all()
+
+    def release(self, job, url):
+        host = self.host_of(url)
+        with self._cond:
+            active = self._host_active.get(host, 0) - 1
+            if active > 0:
+                self._host_active[host] = active
+            else:
+                self._host_active.pop(host, None)
+            job["connections"] = max(0, job["connections"] - 1)
+            job["last_active"] = time.monotonic()
+            self.breaker.release(host)
+            self._cond.notify_all()
+
+    def report(self, url, ok, status=None, headers=None, connection_error=False):
+        """把请求结果交给目标主机的熔断器；返回导致熔断的 open 秒数（未熔断为 0）。"""
+        seconds = self.breaker.record(self.host_of(url), ok, status, headers, connection_error)
+        with self._cond:
+            self._cond.notify_all()
+        return seconds
+
+    @contextmanager
+    def slot(self, job, url, stop_checker=None):
+        """with scheduler.slot(job, url, stop) as granted: ...；granted 为 False 表示等待时被中断。"""
+        granted = self.acquire(job, url, stop_checker)
+        try:
+            yield granted
+        finally:
+            if granted:
+                self.release(job, url)
+
+    # ---- 带宽 ----
+
+    def _job_rate_locked(self, job, now):
+        rate = 0.0
+        if self.global_rate > 0:
+            active = [
+                other["priority"]
+                for other in self._jobs.values()
+                if other is not job and now - other["last_active"] < self.ACTIVE_SECONDS
+            ]
+            rate = self.global_rate * job["priority"] / (job["priority"] + sum(active))
+        if self.job_rate > 0:
+            rate = self.job_rate if rate == 0 else min(rate, self.job_rate)
+        return rate
+
+    def _take_locked(self, bucket, rate, amount, now):
+        # 令牌可以透支：本次读到的字节已经到达，透支部分由下一次等待偿还；返回需要等待的秒数
+        bucket["tokens"] = min(rate * self.BURST_SECONDS, bucket["tokens"] + (now - bucket["updated"]) * rate)
+        bucket["updated"] = now
+        bucket["tokens"] -= amount
+        return -bucket["tokens"] / rate if bucket["tokens"] < 0 else 0.0
+
+    def consume(self, job, amount, stop_checker=None):
+        """记录读到的 amount 字节，超出带宽时等待；等待中被中断返回 False。"""
+        if amount <= 0:
+            return True
+        now = time.monotonic()
+        with self._cond:
+            job["bytes"] += amount
+            job["last_active"] = now
+            delay = 0.0
+            if self.global_rate > 0:
+                delay = self._take_locked(self._global_bucket, self.global_rate, amount, now)
+            job_rate = self._job_rate_locked(job, now)
+            if job_rate > 0:
+                delay = max(delay, self._take_locked(job["bucket"], job_rate, amount, now))
+        if delay <= 0:
+            return True
+        deadline = now + delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if stop_checker is not None and stop_checker():
+                return False
+            time.sleep(min(self.POLL_SECONDS, remaining))
+
+    def stats(self):
+        with self._cond:
+            return {
+                "hosts": dict(self._host_active),
+                "jobs": [
+                    {
+                        "name": job["name"],
+                        "priority": job["priority"],
+                        "connections": job["connections"],
+                        "bytes": job["bytes"],
+                        "waitedSeconds": round(job["waited"], 3),
+                    }
+                    for job in self._jobs.values()
+                ],
+            }
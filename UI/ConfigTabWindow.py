@@ -59,6 +59,18 @@ class Ui_ConfigWindow(object):
         spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
         self.horizontalLayout_4.addItem(spacerItem)
         self.verticalLayout_2.addLayout(self.horizontalLayout_4)
+        self.horizontalLayout_resume = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_resume.setObjectName("horizontalLayout_resume")
+        self.batchResumeCheckBox = QtWidgets.QCheckBox(self.generalTab)
+        font = QtGui.QFont()
+        font.setFamily("Microsoft YaHei UI")
+        font.setPointSize(10)
+        self.batchResumeCheckBox.setFont(font)
+        self.batchResumeCheckBox.setObjectName("batchResumeCheckBox")
+        self.horizontalLayout_resume.addWidget(self.batchResumeCheckBox)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_resume.addItem(spacerItem1)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_resume)
         self.line = QtWidgets.QFrame(self.generalTab)
         self.line.setFrameShape(QtWidgets.QFrame.HLine)
         self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
@@ -127,8 +139,8 @@ class Ui_ConfigWindow(object):
         self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
         self.line_2.setObjectName("line_2")
         self.verticalLayout_2.addWidget(self.line_2)
-        spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_2.addItem(spacerItem1)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem2)
         self.tabWidget.addTab(self.generalTab, "")
         self.saveTab = QtWidgets.QWidget()
         self.saveTab.setObjectName("saveTab")
@@ -228,8 +240,8 @@ class Ui_ConfigWindow(object):
         self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
         self.line_5.setObjectName("line_5")
         self.verticalLayout_6.addWidget(self.line_5)
-        spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_6.addItem(spacerItem2)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_6.addItem(spacerItem3)
         self.tabWidget.addTab(self.saveTab, "")
         self.downloadTab = QtWidgets.QWidget()
         self.downloadTab.setObjectName("downloadTab")
@@ -270,8 +282,8 @@ class Ui_ConfigWindow(object):
         self.deepSpinBox.setProperty("value", 2)
         self.deepSpinBox.setObjectName("deepSpinBox")
         self.horizontalLayout_9.addWidget(self.deepSpinBox)
-        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_9.addItem(spacerItem3)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem4)
         self.verticalLayout_4.addLayout(self.horizontalLayout_9)
         self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_11.setObjectName("horizontalLayout_11")
@@ -296,8 +308,8 @@ class Ui_ConfigWindow(object):
         self.attemptSpinBox.setProperty("value", 2)
         self.attemptSpinBox.setObjectName("attemptSpinBox")
         self.horizontalLayout_11.addWidget(self.attemptSpinBox)
-        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_11.addItem(spacerItem4)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_11.addItem(spacerItem5)
         self.verticalLayout_4.addLayout(self.horizontalLayout_11)
         self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_8.setObjectName("horizontalLayout_8")
@@ -309,8 +321,8 @@ class Ui_ConfigWindow(object):
         self.interactionCheckBox.setChecked(True)
         self.interactionCheckBox.setObjectName("interactionCheckBox")
         self.horizontalLayout_8.addWidget(self.interactionCheckBox)
-        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_8.addItem(spacerItem5)
+        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_8.addItem(spacerItem6)
         self.verticalLayout_4.addLayout(self.horizontalLayout_8)
         self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_7.setObjectName("horizontalLayout_7")
@@ -322,8 +334,8 @@ class Ui_ConfigWindow(object):
         self.headlessCheckBox.setChecked(True)
         self.headlessCheckBox.setObjectName("headlessCheckBox")
         self.horizontalLayout_7.addWidget(self.headlessCheckBox)
-        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_7.addItem(spacerItem6)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_7.addItem(spacerItem7)
         self.verticalLayout_4.addLayout(self.horizontalLayout_7)
         self.line_3 = QtWidgets.QFrame(self.downloadTab)
         self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
@@ -362,8 +374,8 @@ class Ui_ConfigWindow(object):
         self.downloadModeCombo.addItem("")
         self.downloadModeCombo.addItem("")
         self.horizontalLayout_5.addWidget(self.downloadModeCombo)
-        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_5.addItem(spacerItem7)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_5.addItem(spacerItem8)
         self.verticalLayout_4.addLayout(self.horizontalLayout_5)
         self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_3.setObjectName("horizontalLayout_3")
@@ -380,20 +392,81 @@ class Ui_ConfigWindow(object):
         self.concurrentSpinBox.setProperty("value", 100)
         self.concurrentSpinBox.setObjectName("concurrentSpinBox")
         self.horizontalLayout_3.addWidget(self.concurrentSpinBox)
-        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_3.addItem(spacerItem8)
+        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_3.addItem(spacerItem9)
         self.verticalLayout_4.addLayout(self.horizontalLayout_3)
+        self.horizontalLayout_pipeline = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_pipeline.setObjectName("horizontalLayout_pipeline")
+        self.pipelineLabel = QtWidgets.QLabel(self.downloadTab)
+        font = QtGui.QFont()
+        font.setFamily("Microsoft YaHei UI")
+        font.setPointSize(10)
+        self.pipelineLabel.setFont(font)
+        self.pipelineLabel.setObjectName("pipelineLabel")
+        self.horizontalLayout_pipeline.addWidget(self.pipelineLabel)
+        self.pipelineMonitorSpinBox = QtWidgets.QSpinBox(self.downloadTab)
+        self.pipelineMonitorSpinBox.setMinimum(0)
+        self.pipelineMonitorSpinBox.setMaximum(4)
+        self.pipelineMonitorSpinBox.setProperty("value", 0)
+        self.pipelineMonitorSpinBox.setObjectName("pipelineMonitorSpinBox")
+        self.horizontalLayout_pipeline.addWidget(self.pipelineMonitorSpinBox)
+        self.pipelineDownloadLabel = QtWidgets.QLabel(self.downloadTab)
+        font = QtGui.QFont()
+        font.setFamily("Microsoft YaHei UI")
+        font.setPointSize(10)
+        self.pipelineDownloadLabel.setFont(font)
+        self.pipelineDownloadLabel.setObjectName("pipelineDownloadLabel")
+        self.horizontalLayout_pipeline.addWidget(self.pipelineDownloadLabel)
+        self.pipelineDownloadSpinBox = QtWidgets.QSpinBox(self.downloadTab)
+        self.pipelineDownloadSpinBox.setMinimum(1)
+        self.pipelineDownloadSpinBox.setMaximum(4)
+        self.pipelineDownloadSpinBox.setProperty("value", 1)
+        self.pipelineDownloadSpinBox.setObjectName("pipelineDownloadSpinBox")
+        self.horizontalLayout_pipeline.addWidget(self.pipelineDownloadSpinBox)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_pipeline.addItem(spacerItem10)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_pipeline)
+        self.horizontalLayout_speculative = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_speculative.setObjectName("horizontalLayout_speculative")
+        self.speculativeLabel = QtWidgets.QLabel(self.downloadTab)
+        font = QtGui.QFont()
+        font.setFamily("Microsoft YaHei UI")
+        font.setPointSize(10)
+        self.speculativeLabel.setFont(font)
+        self.speculativeLabel.setObjectName("speculativeLabel")
+        self.horizontalLayout_speculative.addWidget(self.speculativeLabel)
+        self.speculativeSpinBox = QtWidgets.QSpinBox(self.downloadTab)
+        self.speculativeSpinBox.setMinimum(1)
+        self.speculativeSpinBox.setMaximum(5)
+        self.speculativeSpinBox.setProperty("value", 1)
+        self.speculativeSpinBox.setObjectName("speculativeSpinBox")
+        self.horizontalLayout_speculative.addWidget(self.speculativeSpinBox)
+        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_speculative.addItem(spacerItem11)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_speculative)
+        self.horizontalLayout_streaming = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_streaming.setObjectName("horizontalLayout_streaming")
+        self.streamingCheckBox = QtWidgets.QCheckBox(self.downloadTab)
+        font = QtGui.QFont()
+        font.setFamily("Microsoft YaHei UI")
+        font.setPointSize(10)
+        self.streamingCheckBox.setFont(font)
+        self.streamingCheckBox.setObjectName("streamingCheckBox")
+        self.horizontalLayout_streaming.addWidget(self.streamingCheckBox)
+        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_streaming.addItem(spacerItem12)
+        self.verticalLayout_4.addLayout(self.horizontalLayout_streaming)
         self.line_4 = QtWidgets.QFrame(self.downloadTab)
         self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
         self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
         self.line_4.setObjectName("line_4")
         self.verticalLayout_4.addWidget(self.line_4)
-        spacerItem9 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.verticalLayout_4.addItem(spacerItem9)
+        spacerItem13 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_4.addItem(spacerItem13)
         self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_12.setObjectName("horizontalLayout_12")
-        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_12.addItem(spacerItem10)
+        spacerItem14 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_12.addItem(spacerItem14)
         self.savePresetButton = QtWidgets.QPushButton(self.downloadTab)
         font = QtGui.QFont()
         font.setFamily("Microsoft YaHei UI")
@@ -421,8 +494,8 @@ class Ui_ConfigWindow(object):
         self.resetButton.setFont(font)
         self.resetButton.setObjectName("resetButton")
         self.horizontalLayout_controlbar.addWidget(self.resetButton)
-        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout_controlbar.addItem(spacerItem11)
+        spacerItem15 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_controlbar.addItem(spacerItem15)
         self.confirmButton = QtWidgets.QPushButton(self.centralwidget)
         font = QtGui.QFont()
         font.setPointSize(10)
@@ -458,6 +531,8 @@ class Ui_ConfigWindow(object):
         self.stopModeCombo.setItemText(0, _translate("ConfigWindow", "阶段停止"))
         self.stopModeCombo.setItemText(1, _translate("ConfigWindow", "强制重启"))
         self.stopModeCombo.setItemText(2, _translate("ConfigWindow", "强制退出"))
+        self.batchResumeCheckBox.setToolTip(_translate("ConfigWindow", "开启后，相同的批量输入从上次中断的集数继续；关闭时每次从第一集开始。"))
+        self.batchResumeCheckBox.setText(_translate("ConfigWindow", "批量任务断点续传"))
         self.proxyCheckBox.setText(_translate("ConfigWindow", "使用代理"))
         self.proxyAddressLabel.setText(_translate("ConfigWindow", "地址"))
         self.proxyPortLabel.setText(_translate("ConfigWindow", "端口"))
@@ -491,6 +566,14 @@ class Ui_ConfigWindow(object):
         self.downloadModeCombo.setItemText(2, _translate("ConfigWindow", "下载前5个"))
         self.downloadModeCombo.setItemText(3, _translate("ConfigWindow", "下载所有"))
         self.concurrentLabel.setText(_translate("ConfigWindow", "最大并行数量："))
+        self.pipelineLabel.setText(_translate("ConfigWindow", "批量流水线：预先探测"))
+        self.pipelineMonitorSpinBox.setToolTip(_translate("ConfigWindow", "批量任务下载当前集时，同时在浏览器中探测后续集数的数量（也是同时运行的浏览器上限）；0 为逐集执行。"))
+        self.pipelineDownloadLabel.setText(_translate("ConfigWindow", "同时下载"))
+        self.pipelineDownloadSpinBox.setToolTip(_translate("ConfigWindow", "流水线开启时同时下载的集数。"))
+        self.speculativeLabel.setText(_translate("ConfigWindow", "同时下载候选数"))
+        self.speculativeSpinBox.setToolTip(_translate("ConfigWindow", "“下载首个”“下载前5个”模式下同时下载的候选数，共用并发数预算；1 为逐个下载。"))
+        self.streamingCheckBox.setToolTip(_translate("ConfigWindow", "“下载首个”“下载前5个”模式下，监测出现首个强候选即开始下载，监测在后台继续收集备选。"))
+        self.streamingCheckBox.setText(_translate("ConfigWindow", "边探测边下载"))
         self.savePresetButton.setText(_translate("ConfigWindow", "保存下载预设"))
         self.loadPresetButton.setText(_translate("ConfigWindow", "加载下载预设"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.downloadTab), _translate("ConfigWindow", "下载"))
@@ -1,10 +1,15 @@
 # python库
+import itertools
 import json
 import os
+import queue
 import re
 import sys
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 
 # ui
@@ -20,6 +25,8 @@ from JsonProcessor import ConfigJson, DownloadJson, ReadDownloadJson
 from MonitorM3U8 import MonitorM3U8
 from DownloadM3U8 import DownloadM3U8
 from SimpleUrlParser import SimpleUrlParser
+from UrlPatternLearner import UrlPatternLearner
+from CandidateTriage import CandidateTriage
 
 
 FILE_EXT_OPTIONS = [".mp4", ".mov", ".avi", ".m4a", ".flv", ".mkv"]
@@ -28,6 +35,8 @@ STOP_MODE_OPTIONS = ["阶段停止", "强制重启", "强制退出"]
 DEFAULT_PROXY_ADDRESS = "127.0.0.1"
 DEFAULT_PROXY_PORT = "7897"
 PRESET_DIR = os.path.join(os.getcwd(), "config", "preset")
+# 后来新增的配置项：旧配置文件中缺少时按默认值补齐，而不是把整份配置判为无效
+ADDED_CONFIG_KEYS = {"batchResume", "pipelineMonitors", "pipelineDownloads", "speculativeDownloads", "streamingDownload"}
 WINDOWS_RESERVED_NAMES = {
     "CON",
     "PRN",
@@ -80,6 +89,11 @@ def default_config():
         "maxParallel": 100,
         "monitorHeadless": True,
         "monitorRulesPath": "config/monitor.rules.json",
+        "batchResume": False,
+        "pipelineMonitors": 0,
+        "pipelineDownloads": 1,
+        "speculativeDownloads": 1,
+        "streamingDownload": False,
     }
 
 
@@ -311,7 +325,7 @@ def _validate_config_payload(payload):
         raise ValueError("config must be object")
     expected = _config_schema_keys()
     actual = set(payload.keys())
-    missing = sorted(expected - actual)
+    missing = sorted(expected - actual - ADDED_CONFIG_KEYS)
     extra = sorted(actual - expected)
     if missing or extra:
         raise ValueError(f"config schema mismatch missing={missing} extra={extra}")
@@ -323,6 +337,8 @@ def _validate_config_payload(payload):
         "downloadList",
         "proxyEnabled",
         "monitorHeadless",
+        "batchResume",
+        "streamingDownload",
     }
     int_ranges = {
         "fileExt": (0, len(FILE_EXT_OPTIONS) - 1),
@@ -332,6 +348,9 @@ def _validate_config_payload(payload):
         "stopMode": (0, len(STOP_MODE_OPTIONS) - 1),
         "listMode": (0, 2),
         "maxParallel": (1, 999),
+        "pipelineMonitors": (0, 4),
+        "pipelineDownloads": (1, 4),
+        "speculativeDownloads": (1, 5),
     }
     str_keys = {
         "folder",
@@ -348,10 +367,14 @@ def _validate_config_payload(payload):
     }
 
     for key in bool_keys:
+        if key in ADDED_CONFIG_KEYS and key not in payload:
+            continue
         if not isinstance(payload.get(key), bool):
             raise ValueError(f"config value type invalid: {key} must be bool")
 
     for key, (min_value, max_value) in int_ranges.items():
+        if key in ADDED_CONFIG_KEYS and key not in payload:
+            continue
         value = payload.get(key)
         if isinstance(value, bool) or not isinstance(value, int):
             raise ValueError(f"config value type invalid: {key} must be int")
@@ -396,6 +419,11 @@ def normalize_config_dict(data):
     monitor_rules_path = _to_text(merged.get("monitorRulesPath"), defaults["monitorRulesPath"])
     if monitor_rules_path == "":
         monitor_rules_path = defaults["monitorRulesPath"]
+    batch_resume = _to_bool(merged.get("batchResume"), defaults["batchResume"])
+    pipeline_monitors = _to_int(merged.get("pipelineMonitors"), defaults["pipelineMonitors"], 0, 4)
+    pipeline_downloads = _to_int(merged.get("pipelineDownloads"), defaults["pipelineDownloads"], 1, 4)
+    speculative_downloads = _to_int(merged.get("speculativeDownloads"), defaults["speculativeDownloads"], 1, 5)
+    streaming_download = _to_bool(merged.get("streamingDownload"), defaults["streamingDownload"])
 
     raw_folder = _normalize_path_text(merged.get("folder"))
     if raw_folder == "" or not _is_structurally_valid_path(raw_folder):
@@ -437,6 +465,11 @@ def normalize_config_dict(data):
         "maxParallel": max_parallel,
         "monitorHeadless": monitor_headless,
         "monitorRulesPath": monitor_rules_path,
+        "batchResume": batch_resume,
+        "pipelineMonitors": pipeline_monitors,
+        "pipelineDownloads": pipeline_downloads,
+        "speculativeDownloads": speculative_downloads,
+        "streamingDownload": streaming_download,
     }
     if "URL" in incoming:
         normalized["URL"] = _to_text(incoming.get("URL"), "")
@@ -474,10 +507,29 @@ def ensure_normalized_config(config):
 class EmittingStream(QObject):
     textWritten = pyqtSignal(str)
     coverLine = pyqtSignal(str)
-    rawWritten = pyqtSignal(str)
+    rawWritten = pyqtSignal(str, str)  # 文本, 所属任务的日志路径（空串为当前前台任务的日志）
+
+    # 每个线程当前所属任务的日志路径：流水线中多个任务同时输出时各自写入自己的 Data/*.log
+    _task_log = threading.local()
+
+    @classmethod
+    def bind_task_log(cls, log_path):
+        """把当前线程之后的输出归到 log_path 对应的任务日志，返回之前的绑定。"""
+        previous = getattr(cls._task_log, "path", "")
+        cls._task_log.path = str(log_path or "")
+        return previous
+
+    @classmethod
+    @contextmanager
+    def task_log(cls, log_path):
+        previous = cls.bind_task_log(log_path)
+        try:
+            yield
+        finally:
+            cls.bind_task_log(previous)
 
     def write(self, text):
-        self.rawWritten.emit(str(text))
+        self.rawWritten.emit(str(text), getattr(self._task_log, "path", ""))
         if "\r" in text:
             text = text.rsplit("\r", 1)[-1]  # 分割文本，获取最后一个\r后的内容
             self.coverLine.emit(str(text))
@@ -496,6 +548,9 @@ class Worker(QThread):
     logFileReady = pyqtSignal(str)
     runCompleted = pyqtSignal(bool)
 
+    _output_paths_lock = threading.Lock()
+    _reserved_output_paths = set()
+
     def __init__(self, config, monitor=True):
         super().__init__()
         self.URL = config["URL"]
@@ -541,11 +596,22 @@ class Worker(QThread):
         if not self.monitorTryEnabled:
             self.monitorConfig["tries"] = 1
 
+        # 批量任务断点续传（默认关闭）：开启后相同输入从任务日志记录的位置继续
+        self.batchResume = _to_bool(config.get("batchResume", False), False)
+        # 批量流水线（默认关闭）：预先探测的集数与同时下载的集数
+        self.pipelineMonitors = _to_int(config.get("pipelineMonitors", 0), 0, 0, 4)
+        self.pipelineDownloads = _to_int(config.get("pipelineDownloads", 1), 1, 1, 4)
+        # 首个/前5个模式下同时下载的候选数（默认 1，逐个下载）
+        self.speculativeDownloads = _to_int(config.get("speculativeDownloads", 1), 1, 1, 5)
+        # 首个/前5个模式下边探测边下载（默认关闭）
+        self.streamingDownload = _to_bool(config.get("streamingDownload", False), False)
+
         self.monitor = monitor  # 是否进行监测（是否使用加载的列表）
         self._is_interrupted = False  # 退出标志
-        self._active_monitor = None
+        # 流水线模式下可能同时有多个监测器/下载器在运行，中断时需全部通知
+        self._active_monitors = set()
         self._active_monitor_lock = threading.Lock()
-        self._active_downloader = None
+        self._active_downloaders = set()
         self._active_downloader_lock = threading.Lock()
         self._run_completed = False
         self.l = []  # 加载下载列表时使用
@@ -566,33 +632,37 @@ class Worker(QThread):
     def _stop_requested(self):
         return bool(self._is_interrupted)
 
-    def _set_active_downloader(self, downloader):
+    def _set_active_downloader(self, downloader, active=True):
         with self._active_downloader_lock:
-            self._active_downloader = downloader
+            if active:
+                self._active_downloaders.add(downloader)
+            else:
+                self._active_downloaders.discard(downloader)
 
-    def _set_active_monitor(self, monitor):
+    def _set_active_monitor(self, monitor, active=True):
         with self._active_monitor_lock:
-            self._active_monitor = monitor
+            if active:
+                self._active_monitors.add(monitor)
+            else:
+                self._active_monitors.discard(monitor)
 
     def _request_active_monitor_stop(self):
         with self._active_monitor_lock:
-            monitor = self._active_monitor
-        if monitor is None:
-            return
-        try:
-            monitor.request_stop()
-        except Exception:
-            pass
+            monitors = list(self._active_monitors)
+        for monitor in monitors:
+            try:
+                monitor.request_stop()
+            except Exception:
+                pass
 
     def _request_active_downloader_stop(self):
         with self._active_downloader_lock:
-            downloader = self._active_downloader
-        if downloader is None:
-            return
-        try:
-            downloader.request_stop()
-        except Exception:
-            pass
+            downloaders = list(self._active_downloaders)
+        for downloader in downloaders:
+            try:
+                downloader.request_stop()
+            except Exception:
+                pass
 
     @staticmethod
     def _try_load_latest_config_snapshot(retries=3, retry_interval=0.05):
@@ -672,21 +742,91 @@ class Worker(QThread):
         self.generalProgressChanged.emit(self._clamp_percent(percent))
 
     @staticmethod
-    def _task_output_paths():
+    def _find_batch_resume_index(url_input, total_tasks, max_logs=200):
+        """在最近的任务日志中查找同一输入的批量游标，返回 (起始下标, 日志路径)；无需恢复时为 (0, "")。
+
+        游标中的 doneThrough 表示序号 1..doneThrough 的任务都已结束；流水线模式下任务可能乱序结束，
+        因此取最近一批（batch 相同）日志中 doneThrough 的最大值。
+        """
+        data_dir = os.path.join(os.getcwd(), "Data")
+        try:
+            paths = [os.path.join(data_dir, name) for name in os.listdir(data_dir) if name.endswith(".json")]
+            paths.sort(key=os.path.getmtime, reverse=True)
+        except OSError:
+            return 0, ""
+        batch = None
+        start_index = 0
+        cursor_path = ""
+        for path in paths[:max_logs]:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    cursor = json.load(f).get("BatchCursor")
+            except Exception:
+                continue
+            if not isinstance(cursor, dict) or cursor.get("input") != url_input:
+                continue
+            if batch is None:
+                if cursor.get("total") != total_tasks:
+                    return 0, ""
+                batch = cursor.get("batch")
+            elif cursor.get("batch") != batch:
+                continue
+            done_through = _to_int(cursor.get("doneThrough"), 0, 0, total_tasks)
+            if done_through > start_index:
+                start_index = done_through
+                cursor_path = path
+        # 整批已完成时从头开始
+        if start_index >= total_tasks:
+            return 0, ""
+        return start_index, cursor_path
+
+    @staticmethod
+    def _mark_batch_cursor_done(json_path, done_through):
+        if not json_path or not os.path.exists(json_path):
+            return
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return
+        if not isinstance(data, dict) or not isinstance(data.get("BatchCursor"), dict):
+            return
+        data["BatchCursor"]["done"] = True
+        data["BatchCursor"]["doneThrough"] = done_through
+        DownloadJson(data, filePath=json_path).write()
+
+    @classmethod
+    def _task_output_paths(cls):
         data_dir = os.path.join(os.getcwd(), "Data")
         os.makedirs(data_dir, exist_ok=True)
         base_name = datetime.now().strftime("day-%y.%m.%d;time-%H.%M.%S")
         suffix = 0
-        while True:
-            if suffix == 0:
-                final_name = base_name
-            else:
-                final_name = f"{base_name}-{suffix}"
-            json_path = os.path.join(data_dir, f"{final_name}.json")
-            log_path = os.path.join(data_dir, f"{final_name}.log")
-            if not os.path.exists(json_path) and not os.path.exists(log_path):
-                return json_path, log_path
-            suffix += 1
+        # 流水线中多个任务可能在同一秒内取路径，文件写出前先登记，避免重名
+        with cls._output_paths_lock:
+            while True:
+                if suffix == 0:
+                    final_name = base_name
+                else:
+                    final_name = f"{base_name}-{suffix}"
+                json_path = os.path.join(data_dir, f"{final_name}.json")
+                log_path = os.path.join(data_dir, f"{final_name}.log")
+                if (
+                    json_path not in cls._reserved_output_paths
+                    and not os.path.exists(json_path)
+                    and not os.path.exists(log_path)
+                ):
+                    cls._reserved_output_paths.add(json_path)
+                    return json_path, log_path
+                suffix += 1
+
+    @staticmethod
+    def _env_enabled(name, default="1"):
+        return os.getenv(name, default).strip().lower() not in {"0", "false", "off", "no"}
+
+    @staticmethod
+    def _task_thread_initializer(log_path):
+        # 监测器/下载器内部线程池的线程启动时调用，使这些线程的输出也写入所属任务的日志
+        return lambda: EmittingStream.bind_task_log(log_path)
 
     def run(self):
         self._run_completed = False
@@ -694,576 +834,1246 @@ class Worker(QThread):
         self.downloadProgressChanged.emit(0)
         self.generalProgressChanged.emit(0)
         try:
-            url_input, folder, filename = self.URL, self.folder, self.filename
-            file_ext_text = self.fileExtText
-            recursion_enabled = self.recursionEnabled
-            recursion_depth = self.recursionDepth
-            download_list = self.downloadList
-            list_mode = self.listMode
-            list_mode_text = self.listModeText
+            url_input = self.URL
 
             # 开始下载数据
-            if url_input == "":
-                urls_and_strings = [("", "")]
-            else:
-                parser = SimpleUrlParser()
+            # 任务按需逐个生成，组合很多时也不会预先展开
+            parser = SimpleUrlParser()
+            url_template = ""
+            replacements_data = {}
+            placeholders = []
+            if url_input != "":
                 url_template, replacements_data, placeholders = parser.parse_input_string(url_input)
-                urls_and_strings = parser.generate_urls_with_match_strings(url_template, replacements_data, placeholders)
+            total_tasks = max(1, parser.count_combinations(url_template, replacements_data, placeholders))
+            self._total_tasks = total_tasks
+
+            # 开启断点续传时，同一输入的批量任务中途中断过则从任务日志记录的位置继续
+            start_index = 0
+            if total_tasks > 1 and self.batchResume:
+                start_index, cursor_path = self._find_batch_resume_index(url_input, total_tasks)
+                if start_index > 0:
+                    print(
+                        f"[task] resume batch at {start_index + 1}/{total_tasks} from {cursor_path} "
+                        "(turn off 批量任务断点续传 in settings to start over)"
+                    )
 
-            total_tasks = len(urls_and_strings)
-            if total_tasks <= 0:
-                urls_and_strings = [("", "")]
-                total_tasks = 1
+            def iter_tasks(first_index):
+                if url_input == "":
+                    return iter([("", "")])
+                return parser.iter_urls_with_match_strings(url_template, replacements_data, placeholders, first_index)
 
             if url_input != "":
-                total_targets = len(urls_and_strings)
+                total_targets = total_tasks
                 print(f"[task] parsed input: targets={total_targets}")
-                preview_count = min(5, total_targets)
-                for idx, (url, match_str) in enumerate(urls_and_strings[:preview_count], start=1):
+                preview_count = min(5, total_targets - start_index)
+                for idx, (url, match_str) in enumerate(
+                    itertools.islice(iter_tasks(start_index), preview_count),
+                    start=start_index + 1,
+                ):
                     suffix = f" match={match_str}" if match_str != "" else ""
                     print(f"[task] target {idx}/{total_targets}: {url}{suffix}")
-                if total_targets > preview_count:
-                    print(f"[task] ... {total_targets - preview_count} more targets")
-
-            def run_url(url, this_filename, task_index, task_total, task_runtime):
-                recursion_enabled = task_runtime["recursion_enabled"]
-                recursion_depth = task_runtime["recursion_depth"]
-                download_mode = task_runtime["download_mode"]
-                download_mode_text = task_runtime["download_mode_text"]
-                max_parallel = task_runtime["max_parallel"]
-                monitor_try_enabled = task_runtime["monitor_try_enabled"]
-                proxy_config = task_runtime["proxy_config"]
-                monitor_config = task_runtime["monitor_config"]
-                current_urls = []
-                monitor_session_hints = {}
-                json_path, log_path = self._task_output_paths()
-                self.logFileReady.emit(log_path)
-
-                task_phase = {
-                    "monitor": 0.0,
-                    "download": 0.0,
-                    "total": 0.0,
-                }
-                progress_weights = {
-                    "monitor": 0.25,
-                    "download": 0.75,
-                }
+                if total_targets > start_index + preview_count:
+                    print(f"[task] ... {total_targets - start_index - preview_count} more targets")
+
+            # 本批任务的监测结果缓存命中情况（hit=复用，stale=缓存失效后重新监测，miss=无缓存）
+            self._monitor_cache_counts = {"hit": 0, "stale": 0, "miss": 0}
+
+            # 批量游标：batch 区分不同批次，done_through 为已连续结束的任务序号（流水线中任务可能乱序结束）
+            self._batch_state = {
+                "id": datetime.now().strftime("%y%m%d%H%M%S%f"),
+                "done_through": start_index,
+                "finished": set(),
+                "ttfb": [],
+                "lock": threading.Lock(),
+            }
 
-                def set_progress_weights(monitor_weight, download_weight):
-                    monitor_value = max(0.0, float(monitor_weight))
-                    download_value = max(0.0, float(download_weight))
-                    total_weight = monitor_value + download_value
-                    if total_weight <= 0:
-                        progress_weights["monitor"] = 0.0
-                        progress_weights["download"] = 1.0
-                        return
-                    progress_weights["monitor"] = monitor_value / total_weight
-                    progress_weights["download"] = download_value / total_weight
-
-                def use_download_only_progress():
-                    # Monitoring was skipped for this task, so total progress should follow download progress only.
-                    set_progress_weights(0.0, 1.0)
-
-                def refresh_task_progress():
-                    combined = (
-                        task_phase["monitor"] * progress_weights["monitor"]
-                        + task_phase["download"] * progress_weights["download"]
-                    )
-                    if combined < task_phase["total"]:
-                        combined = task_phase["total"]
-                    task_phase["total"] = combined
-                    self._emit_general_progress(task_index, task_total, combined)
-
-                def set_monitor_ratio(value):
-                    clamped = max(0.0, min(1.0, float(value)))
-                    if clamped < task_phase["monitor"]:
-                        clamped = task_phase["monitor"]
-                    task_phase["monitor"] = clamped
-                    refresh_task_progress()
-
-                def set_download_ratio(value):
-                    clamped = max(0.0, min(1.0, float(value)))
-                    if clamped < task_phase["download"]:
-                        clamped = task_phase["download"]
-                    task_phase["download"] = clamped
-                    refresh_task_progress()
-
-                if url == "" and self.monitor:
-                    self.monitorProgressChanged.emit(100)
-                    self.downloadProgressChanged.emit(0)
-                    set_monitor_ratio(1.0)
-                    set_download_ratio(1.0)
-                    return
-
-                self.monitorProgressChanged.emit(0)
-                self.downloadProgressChanged.emit(0)
-                set_monitor_ratio(0.0)
-                set_download_ratio(0.0)
-                if self._stop_requested():
-                    print("[task] interrupted before task start")
-                    return
-
-                print("")
-                print(f"[task {task_index}/{task_total}] start")
-                print(f"[task] url={url}")
-                print(f"[task] output={os.path.join(folder, this_filename + file_ext_text)}")
-                print(f"[task] json={json_path}")
-                print(f"[task] log={log_path}")
+            # 模板批量任务：从前几集的监测结果学出页面到播放列表的规律，后续集数先用普通 HTTP 请求尝试
+            # 流水线中多个监测线程共用同一个学习器（学习器自带锁，页面与播放列表请求在锁外进行）
+            self._url_learner = None
+            if (
+                self.monitor
+                and self._env_enabled("M3U8_MONITOR_URL_SHORTCUT")
+                and total_tasks > 1
+                and len(placeholders) > 0
+            ):
+                self._url_learner = UrlPatternLearner(url_template)
+
+            # 同时下载的候选数（首个/前5个模式），1 为逐个下载
+            self._speculative_limit = self.speculativeDownloads
+            # 独立临时目录的名称（.TEMP-1、.TEMP-2 ...），用完归还以便复用
+            self._temp_names = set()
+            self._temp_names_lock = threading.Lock()
+
+            # 流式监测（首个/前5个模式）：出现强候选即开始下载，监测在后台继续收集备选
+            self._stream_enabled = self.streamingDownload
+            self._triage_enabled = self._env_enabled("M3U8_DOWNLOAD_TRIAGE")
+            # 候选分拣找到的镜像（分片序列与抽样内容相同的其他地址）交给下载器分流与失败切换
+            self._mirrors_enabled = self._env_enabled("M3U8_DOWNLOAD_MIRRORS")
+
+            # 流水线：监测阶段与下载阶段各用一个线程池，中间以按序号排列的有界队列衔接，
+            # 第 N 集下载时第 N+1..N+monitor_workers 集已在监测；pipelineMonitors 为 0（默认）时逐个执行
+            self._monitor_workers = self.pipelineMonitors
+            self._download_workers = self.pipelineDownloads
+            self._pipelined = self.monitor and self._monitor_workers > 0 and total_tasks - start_index > 1
+            # 同时运行的浏览器监测数：监测阶段与流式监测转入后台的监测共用这些名额
+            self._browser_slots = threading.BoundedSemaphore(max(1, self._monitor_workers))
+            self._stage_busy = {"monitor": 0.0, "download": 0.0, "wait": 0.0}
+
+            pending_tasks = enumerate(iter_tasks(start_index), start=start_index + 1)
+            batch_started_at = time.perf_counter()
+            if self._pipelined:
+                self._run_pipeline(pending_tasks)
+            else:
+                for task_index, (url, match_str) in pending_tasks:
+                    task = self._monitor_stage(self._start_task(task_index, url, match_str))
+                    self._download_stage(task)
+                    if self._stop_requested():
+                        break
+
+            if total_tasks - start_index > 1:
+                self._print_stage_utilisation(batch_started_at)
+            self._print_batch_summary()
+
+            if not self._stop_requested():
+                self._run_completed = True
+
+        except Exception as e:
+            print(f"[error][worker] {e}")
+        finally:
+            self.runCompleted.emit(self._run_completed)
+
+    # ---- 批量任务：流水线与统计 ----
+
+    def _add_stage_time(self, stage, started_at):
+        with self._batch_state["lock"]:
+            self._stage_busy[stage] += time.perf_counter() - started_at
+
+    def _start_task(self, task_index, url, match_str):
+        # 地址范围中的每个url 不是一个url中识别到的所有m3u8视频
+        task_runtime, used_latest_config = self._runtime_settings_for_task()
+        json_path, log_path = self._task_output_paths()
+        task = {
+            "index": task_index,
+            "total": self._total_tasks,
+            "url": url,
+            "filename": f"{self.filename}_{match_str}" if match_str != "" else self.filename,
+            "runtime": task_runtime,
+            "pipelined": self._pipelined,
+            "json_path": json_path,
+            "log_path": log_path,
+            "download": False,
+            # 只有前台任务（正在下载的任务）驱动进度条，后台预先监测的任务只记录进度
+            "foreground": False,
+            "percent": {"monitor": 0, "download": 0},
+            "phase": {"monitor": 0.0, "download": 0.0, "total": 0.0},
+            "weights": {"monitor": 0.25, "download": 0.75},
+            "current_urls": [],
+            "session_hints": {},
+            "triage_log": [],
+            "mirrors": {},
+            "early_monitor": None,
+            "ttfb": None,
+        }
+        with EmittingStream.task_log(log_path):
+            if used_latest_config:
                 print(
-                    f"[task] mode={download_mode_text} recursion={recursion_enabled} "
-                    f"depth={recursion_depth} save_list={download_list} parallel={max_parallel}"
+                    f"[task {task_index}/{self._total_tasks}] runtime config refreshed: "
+                    f"mode={task_runtime['download_mode_text']} "
+                    f"depth={task_runtime['recursion_depth']} "
+                    f"parallel={task_runtime['max_parallel']}"
                 )
+            else:
                 print(
-                    f"[task] monitor headless={monitor_config['headless']} "
-                    f"interaction={monitor_config.get('interaction_enabled', True)} "
-                    f"tries={monitor_config.get('tries', 1)}"
+                    f"[task {task_index}/{self._total_tasks}] runtime config refresh failed, "
+                    "continue with worker snapshot"
                 )
-                if monitor_config.get("rules_path", "") != "":
-                    print(f"[task] monitor rules={monitor_config['rules_path']}")
-                if proxy_config["enabled"]:
-                    print(
-                        f"[task] proxy=on {proxy_config['address']}:{proxy_config['port']} "
-                        f"user={proxy_config['username'] or '(none)'}"
-                    )
-                else:
-                    print("[task] proxy=off")
-
-                if not self.monitor:
-                    print(f"[task] list mode={list_mode_text}")
-                    sys.stdout.flush()  # 手动刷新缓冲区
-                    use_download_only_progress()
-                    current_urls = list(self.l)
-                    self.monitorProgressChanged.emit(100)
-                    set_monitor_ratio(1.0)
-                else:
-                    if ".m3u8" in url:
-                        # 给出m3u8的地址，直接开始下载
-                        print("[task] m3u8 url provided; skip monitor")
-                        use_download_only_progress()
-                        current_urls = [url]
-                        self.monitorProgressChanged.emit(100)
-                        set_monitor_ratio(1.0)
-                        monitor_session_hints = {
-                            "source_url": url,
-                            "final_url": url,
-                            "user_agent": "",
-                            "cookies": [],
-                            "referer_map": {url: url},
-                        }
-                    else:
-                        # 监测网址获取下载地址
-                        monitor_percent = {"value": 0}
-
-                        def monitor_progress(payload):
-                            if self._stop_requested():
-                                return
-                            event = str(payload.get("event", "")).strip()
-                            tries = max(
-                                1,
-                                _to_int(payload.get("tries", monitor_config.get("tries", 1)), 1, 1, 9999),
-                            )
-                            attempt = _to_int(payload.get("attempt", 1), 1, 1, tries)
-                            done = _to_int(payload.get("done", 0), 0, 0, tries)
-                            if event == "start":
-                                percent = 1
-                            elif event == "attempt_start":
-                                ratio = ((attempt - 1) + 0.02) / tries
-                                percent = int(round(ratio * 100))
-                            elif event == "attempt_step":
-                                step = _to_int(payload.get("step", 0), 0, 0, 9999)
-                                steps = max(1, _to_int(payload.get("steps", 1), 1, 1, 9999))
-                                ratio = ((attempt - 1) + (step / steps)) / tries
-                                percent = int(round(ratio * 100))
-                            elif event == "candidate":
-                                percent = monitor_percent["value"] + 1
-                            elif event == "attempt_done":
-                                ratio = max(0.0, (done / tries) - 0.01)
-                                percent = int(round(ratio * 100))
-                            elif event == "done":
-                                percent = 100
-                            else:
-                                return
-                            percent = self._clamp_percent(percent)
-                            if percent < monitor_percent["value"]:
-                                percent = monitor_percent["value"]
-                            if percent != monitor_percent["value"]:
-                                monitor_percent["value"] = percent
-                                self.monitorProgressChanged.emit(percent)
-                                set_monitor_ratio(percent / 100.0)
-
-                        monitor = MonitorM3U8(
-                            url,
-                            recursion_enabled=recursion_enabled,
-                            recursion_depth=recursion_depth,
-                            proxy_config=proxy_config,
-                            monitor_config=monitor_config,
-                            progress_callback=monitor_progress,
-                            stop_checker=self._stop_requested,
-                        )
-                        self._set_active_monitor(monitor)
-                        try:
-                            l1, l2 = monitor.simple()
-                        finally:
-                            self._set_active_monitor(None)
-                        if self._stop_requested():
-                            print("[task] interrupted during monitor stage")
-                            return
-                        monitor_session_hints = monitor.get_session_hints()
-                        current_urls = l1 + l2
-                        self.monitorProgressChanged.emit(100)
-                        set_monitor_ratio(1.0)
-
-                # 去重并保持顺序，避免重复下载
-                current_urls = list(dict.fromkeys(current_urls))
-
-                # 保存下载列表
-                completion_policy = {
-                    "maxMissingSegments": 2,
-                    "minSuccessRatio": 0.995,
+        return task
+
+    def _monitor_stage(self, task):
+        started_at = time.perf_counter()
+        try:
+            with EmittingStream.task_log(task["log_path"]):
+                if not task["pipelined"]:
+                    self._activate_task(task)
+                task["started_at"] = time.perf_counter()
+                task["download"] = self._monitor_task(task)
+        finally:
+            self._add_stage_time("monitor", started_at)
+        return task
+
+    def _download_stage(self, task):
+        started_at = time.perf_counter()
+        try:
+            if task["download"]:
+                with EmittingStream.task_log(task["log_path"]):
+                    self._activate_task(task)
+                    self._download_task(task)
+        finally:
+            self._add_stage_time("download", started_at)
+        if self._total_tasks > 1 and not self._stop_requested():
+            # 乱序结束的任务先记下，序号连续后再推进游标
+            batch_state = self._batch_state
+            with batch_state["lock"]:
+                batch_state["finished"].add(task["index"])
+                while batch_state["done_through"] + 1 in batch_state["finished"]:
+                    batch_state["done_through"] += 1
+                    batch_state["finished"].discard(batch_state["done_through"])
+                done_through = batch_state["done_through"]
+            self._mark_batch_cursor_done(task["json_path"], done_through)
+        return task
+
+    def _run_pipeline(self, pending_tasks):
+        monitor_workers = self._monitor_workers
+        download_workers = self._download_workers
+        print(f"[task] pipeline on: monitor workers={monitor_workers} download workers={download_workers}")
+        monitor_pool = ThreadPoolExecutor(max_workers=monitor_workers, thread_name_prefix="task-monitor")
+        download_pool = ThreadPoolExecutor(max_workers=download_workers, thread_name_prefix="task-download")
+        monitoring = deque()
+        downloading = set()
+        pipeline_ok = False
+        try:
+            while not self._stop_requested():
+                # 正在监测与监测完等待下载的任务合计不超过 monitor_workers 个
+                while len(monitoring) < monitor_workers:
+                    item = next(pending_tasks, None)
+                    if item is None:
+                        break
+                    task_index, (url, match_str) = item
+                    monitoring.append(monitor_pool.submit(self._monitor_stage, self._start_task(task_index, url, match_str)))
+                if not monitoring:
+                    break
+                if len(downloading) >= download_workers:
+                    finished, downloading = wait(downloading, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                    continue
+                wait_started_at = time.perf_counter()
+                task = monitoring.popleft().result()
+                self._add_stage_time("wait", wait_started_at)
+                if self._stop_requested():
+                    break
+                downloading.add(download_pool.submit(self._download_stage, task))
+            for future in wait(downloading).done:
+                future.result()
+            pipeline_ok = True
+        finally:
+            if not pipeline_ok:
+                self._request_active_monitor_stop()
+            monitor_pool.shutdown(wait=True, cancel_futures=True)
+            download_pool.shutdown(wait=True)
+
+    def _print_stage_utilisation(self, batch_started_at):
+        wall = max(0.001, time.perf_counter() - batch_started_at)
+        stage_busy = self._stage_busy
+        stage_workers = {
+            "monitor": self._monitor_workers if self._pipelined else 1,
+            "download": self._download_workers if self._pipelined else 1,
+        }
+        print(
+            f"[task] stage utilisation wall={wall:.1f}s "
+            f"monitor busy={stage_busy['monitor']:.1f}s "
+            f"util={stage_busy['monitor'] / (wall * stage_workers['monitor']) * 100:.0f}% "
+            f"workers={stage_workers['monitor']} "
+            f"download busy={stage_busy['download']:.1f}s "
+            f"util={stage_busy['download'] / (wall * stage_workers['download']) * 100:.0f}% "
+            f"workers={stage_workers['download']} "
+            f"download_wait={stage_busy['wait']:.1f}s"
+        )
+
+    def _print_batch_summary(self):
+        monitor_cache_counts = self._monitor_cache_counts
+        cache_lookups = sum(monitor_cache_counts.values())
+        if cache_lookups > 0:
+            print(
+                f"[task] monitor cache hits={monitor_cache_counts['hit']} "
+                f"stale={monitor_cache_counts['stale']} misses={monitor_cache_counts['miss']} "
+                f"hit_rate={monitor_cache_counts['hit'] / cache_lookups * 100:.1f}%"
+            )
+
+        if len(self._batch_state["ttfb"]) > 1:
+            ttfb = sorted(self._batch_state["ttfb"])
+            print(
+                f"[task] time to first video byte tasks={len(ttfb)} "
+                f"median={ttfb[len(ttfb) // 2]:.2f}s avg={sum(ttfb) / len(ttfb):.2f}s max={ttfb[-1]:.2f}s"
+            )
+
+        url_learner = self._url_learner
+        if url_learner is not None and url_learner.stats["tries"] > 0:
+            print(
+                f"[task] url pattern shortcut hits={url_learner.stats['hits']}/{url_learner.stats['tries']} "
+                f"learned_from={url_learner.stats['learned']}"
+            )
+
+    # ---- 单个任务：进度 ----
+
+    def _emit_task_progress(self, task, stage, percent):
+        task["percent"][stage] = percent
+        if task["foreground"]:
+            signal = self.monitorProgressChanged if stage == "monitor" else self.downloadProgressChanged
+            signal.emit(percent)
+
+    def _set_progress_weights(self, task, monitor_weight, download_weight):
+        monitor_value = max(0.0, float(monitor_weight))
+        download_value = max(0.0, float(download_weight))
+        total_weight = monitor_value + download_value
+        if total_weight <= 0:
+            task["weights"]["monitor"] = 0.0
+            task["weights"]["download"] = 1.0
+            return
+        task["weights"]["monitor"] = monitor_value / total_weight
+        task["weights"]["download"] = download_value / total_weight
+
+    def _use_download_only_progress(self, task):
+        # Monitoring was skipped for this task, so total progress should follow download progress only.
+        self._set_progress_weights(task, 0.0, 1.0)
+
+    def _refresh_task_progress(self, task):
+        phase = task["phase"]
+        combined = phase["monitor"] * task["weights"]["monitor"] + phase["download"] * task["weights"]["download"]
+        if combined < phase["total"]:
+            combined = phase["total"]
+        phase["total"] = combined
+        if task["foreground"]:
+            self._emit_general_progress(task["index"], task["total"], combined)
+
+    def _set_task_ratio(self, task, stage, value):
+        clamped = max(0.0, min(1.0, float(value)))
+        if clamped < task["phase"][stage]:
+            clamped = task["phase"][stage]
+        task["phase"][stage] = clamped
+        self._refresh_task_progress(task)
+
+    def _activate_task(self, task):
+        # 任务进入前台：接管进度条，未绑定任务的输出（批量汇总等）也写入该任务的日志
+        if task["foreground"]:
+            return
+        task["foreground"] = True
+        self.logFileReady.emit(task["log_path"])
+        self.monitorProgressChanged.emit(task["percent"]["monitor"])
+        self.downloadProgressChanged.emit(task["percent"]["download"])
+        self._refresh_task_progress(task)
+
+    # ---- 单个任务：监测阶段 ----
+
+    def _try_url_shortcut(self, url, proxy_config):
+        url_learner = self._url_learner
+        if url_learner is None:
+            return ""
+        started_at = time.perf_counter()
+        shortcut_url, rules = url_learner.shortcut(url, proxy_config)
+        if not rules:
+            return ""
+        elapsed = time.perf_counter() - started_at
+        if shortcut_url != "":
+            print(f"[task] url pattern shortcut hit rules={','.join(rules)} in {elapsed:.1f}s: {shortcut_url}")
+        else:
+            print(f"[task] url pattern shortcut failed rules={','.join(rules)} in {elapsed:.1f}s; monitor with browser")
+            if url_learner.disabled:
+                print(f"[task] url pattern shortcut disabled after {url_learner.failures} failures")
+        return shortcut_url
+
+    def _learn_url_pattern(self, url, possible, session_hints, proxy_config):
+        if self._url_learner is None or len(possible) == 0:
+            return
+        before, rules = self._url_learner.learn(url, possible[0], session_hints, proxy_config)
+        if rules != before:
+            print(f"[task] url pattern learned rules={','.join(rules) or '(none)'} from {url}")
+
+    def _triage_candidates(self, task, urls):
+        proxy_config = task["runtime"]["proxy_config"]
+        session_hints = task["session_hints"]
+        started_at = time.perf_counter()
+        triage = CandidateTriage(proxy_config, session_hints, stop_checker=self._stop_requested)
+        ranked, dropped = triage.triage(urls)
+        for report in ranked + dropped:
+            task["triage_log"].append(
+                {
+                    "url": report["url"],
+                    "playlistUrl": report["playlist_url"],
+                    "kept": report in ranked,
+                    "reason": report["reason"],
+                    "segments": report["segments"],
+                    "duration": report["duration"],
+                    "bandwidth": report["bandwidth"],
+                    "resolution": report["resolution"],
+                    "encryption": report["encryption"],
+                    "samples": f"{report['samples_ok']}/{report['samples']}",
+                    "sampleKbps": report["sample_kbps"],
+                    "mirrors": list(report["mirrors"]),
                 }
-                d_config = {
-                    "URL": url,
-                    "folder": folder,
-                    "filename": this_filename,
-                    "fileExtText": file_ext_text,
-                    "recursionEnabled": recursion_enabled,
-                    "recursionDepth": recursion_depth,
-                    "downloadList": download_list,
-                    "downloadMode": download_mode,
-                    "downloadModeText": download_mode_text,
-                    "listMode": list_mode,
-                    "listModeText": list_mode_text,
-                    "proxyEnabled": proxy_config["enabled"],
-                    "proxyAddress": proxy_config["address"],
-                    "proxyPort": proxy_config["port"],
-                    "proxyUser": proxy_config["username"],
-                    "proxyPassword": proxy_config["password"],
-                    "maxParallel": max_parallel,
-                    "monitorTryEnabled": monitor_try_enabled,
-                    "monitorTries": monitor_config.get("tries", 1),
-                    "monitorInteraction": monitor_config.get("interaction_enabled", True),
-                    "monitorHeadless": monitor_config["headless"],
-                    "monitorRulesPath": monitor_config.get("rules_path", ""),
-                    "segmentCompletionPolicy": completion_policy,
+            )
+        print(
+            f"[triage] candidates={len(urls)} kept={len(ranked)} dropped={len(dropped)} "
+            f"in {time.perf_counter() - started_at:.1f}s"
+        )
+        for rank, report in enumerate(ranked, start=1):
+            print(
+                f"[triage] #{rank} samples={report['samples_ok']}/{report['samples']} "
+                f"segments={report['segments']} duration={report['duration']:.0f}s "
+                f"bandwidth={report['bandwidth'] or '-'} {report['resolution']} "
+                f"enc={report['encryption']} {report['playlist_url']}"
+            )
+        for report in dropped:
+            print(f"[triage] drop {report['url']}: {report['reason']}")
+        if self._stop_requested() or len(ranked) == 0:
+            # 全部判为失效时可能只是网络抖动，仍交给下载器按原顺序尝试
+            if len(ranked) == 0:
+                print("[triage] no live candidate found; keep original order")
+            return urls
+        referer_map = session_hints.setdefault("referer_map", {})
+        for report in ranked + dropped:
+            if report["playlist_url"] != report["url"]:
+                # 主播放列表换成码率最高的子播放列表，沿用原地址的 referer（重复的候选可能作为镜像使用）
+                referer_map.setdefault(report["playlist_url"], triage.referer_for(report["url"]))
+            if self._mirrors_enabled and report["mirrors"]:
+                task["mirrors"][report["playlist_url"]] = list(report["mirrors"])
+                print(f"[triage] mirrors={len(report['mirrors'])} for {report['playlist_url']}")
+        return [report["playlist_url"] for report in ranked]
+
+    def _print_task_header(self, task):
+        runtime = task["runtime"]
+        proxy_config = runtime["proxy_config"]
+        monitor_config = runtime["monitor_config"]
+        print("")
+        print(f"[task {task['index']}/{task['total']}] start")
+        print(f"[task] url={task['url']}")
+        print(f"[task] output={os.path.join(self.folder, task['filename'] + self.fileExtText)}")
+        print(f"[task] json={task['json_path']}")
+        print(f"[task] log={task['log_path']}")
+        print(
+            f"[task] mode={runtime['download_mode_text']} recursion={runtime['recursion_enabled']} "
+            f"depth={runtime['recursion_depth']} save_list={self.downloadList} parallel={runtime['max_parallel']}"
+        )
+        print(
+            f"[task] monitor headless={monitor_config['headless']} "
+            f"interaction={monitor_config.get('interaction_enabled', True)} "
+            f"tries={monitor_config.get('tries', 1)}"
+        )
+        if monitor_config.get("rules_path", "") != "":
+            print(f"[task] monitor rules={monitor_config['rules_path']}")
+        if proxy_config["enabled"]:
+            print(
+                f"[task] proxy=on {proxy_config['address']}:{proxy_config['port']} "
+                f"user={proxy_config['username'] or '(none)'}"
+            )
+        else:
+            print("[task] proxy=off")
+
+    def _monitor_task(self, task):
+        """监测阶段：得到候选地址并完成分拣，返回是否需要进入下载阶段。"""
+        url = task["url"]
+        if url == "" and self.monitor:
+            self._emit_task_progress(task, "monitor", 100)
+            self._emit_task_progress(task, "download", 0)
+            self._set_task_ratio(task, "monitor", 1.0)
+            self._set_task_ratio(task, "download", 1.0)
+            return False
+
+        self._emit_task_progress(task, "monitor", 0)
+        self._emit_task_progress(task, "download", 0)
+        self._set_task_ratio(task, "monitor", 0.0)
+        self._set_task_ratio(task, "download", 0.0)
+        if self._stop_requested():
+            print("[task] interrupted before task start")
+            return False
+
+        self._print_task_header(task)
+        proxy_config = task["runtime"]["proxy_config"]
+
+        if not self.monitor:
+            print(f"[task] list mode={self.listModeText}")
+            sys.stdout.flush()  # 手动刷新缓冲区
+            self._use_download_only_progress(task)
+            task["current_urls"] = list(self.l)
+            self._emit_task_progress(task, "monitor", 100)
+            self._set_task_ratio(task, "monitor", 1.0)
+        elif ".m3u8" in url:
+            # 给出m3u8的地址，直接开始下载
+            print("[task] m3u8 url provided; skip monitor")
+            self._use_download_only_progress(task)
+            task["current_urls"] = [url]
+            self._emit_task_progress(task, "monitor", 100)
+            self._set_task_ratio(task, "monitor", 1.0)
+            task["session_hints"] = {
+                "source_url": url,
+                "final_url": url,
+                "user_agent": "",
+                "cookies": [],
+                "referer_map": {url: url},
+            }
+        else:
+            shortcut_url = self._try_url_shortcut(url, proxy_config)
+            if shortcut_url != "":
+                # 按已学规律得到的播放列表已验证可用，跳过浏览器监测
+                task["current_urls"] = [shortcut_url]
+                self._emit_task_progress(task, "monitor", 100)
+                self._set_task_ratio(task, "monitor", 1.0)
+                task["session_hints"] = {
+                    "source_url": url,
+                    "final_url": url,
+                    "user_agent": self._url_learner.user_agent,
+                    "cookies": [dict(item) for item in self._url_learner.cookies],
+                    "referer_map": {shortcut_url: url},
                 }
-                d = {"Config": d_config}
-
-                def build_candidate_log_item(candidate_url):
-                    return {
-                        "url": candidate_url,
-                        "completed": False,
-                        "completedByTolerance": False,
-                        "mergeCompleted": False,
-                        "hasMissingSegments": False,
-                        "segmentStats": {
-                            "total": 0,
-                            "downloaded": 0,
-                            "failed": 0,
-                        },
-                        "failedSegments": [],
-                        "status": "pending",
-                    }
-
-                # 中断检查
+            elif not self._run_browser_monitor(task):
+                return False
+
+        # 候选分拣：并发探测播放列表并抽样分片，丢弃失效与重复的候选，按质量与健康度排序
+        current_urls = list(dict.fromkeys(task["current_urls"]))
+        download_mode = task["runtime"]["download_mode"]
+        if self.monitor and self._triage_enabled and download_mode != 0 and len(current_urls) > 1:
+            current_urls = self._triage_candidates(task, current_urls)
+        task["current_urls"] = current_urls
+        return True
+
+    def _on_monitor_progress(self, task, monitor_state, payload):
+        if self._stop_requested():
+            return
+        event = str(payload.get("event", "")).strip()
+        streamed = monitor_state["streamed"]
+        if streamed is not None and event == "candidate" and payload.get("strong") and payload.get("url"):
+            streamed.put((payload["url"], str(payload.get("referer", "") or "")))
+        tries = max(
+            1,
+            _to_int(payload.get("tries", task["runtime"]["monitor_config"].get("tries", 1)), 1, 1, 9999),
+        )
+        attempt = _to_int(payload.get("attempt", 1), 1, 1, tries)
+        done = _to_int(payload.get("done", 0), 0, 0, tries)
+        if event == "start":
+            percent = 1
+        elif event == "attempt_start":
+            ratio = ((attempt - 1) + 0.02) / tries
+            percent = int(round(ratio * 100))
+        elif event == "attempt_step":
+            step = _to_int(payload.get("step", 0), 0, 0, 9999)
+            steps = max(1, _to_int(payload.get("steps", 1), 1, 1, 9999))
+            ratio = ((attempt - 1) + (step / steps)) / tries
+            percent = int(round(ratio * 100))
+        elif event == "candidate":
+            percent = monitor_state["percent"] + 1
+        elif event == "attempt_done":
+            ratio = max(0.0, (done / tries) - 0.01)
+            percent = int(round(ratio * 100))
+        elif event == "done":
+            percent = 100
+        else:
+            return
+        percent = self._clamp_percent(percent)
+        if percent < monitor_state["percent"]:
+            percent = monitor_state["percent"]
+        if percent != monitor_state["percent"]:
+            monitor_state["percent"] = percent
+            self._emit_task_progress(task, "monitor", percent)
+            self._set_task_ratio(task, "monitor", percent / 100.0)
+
+    def _run_browser_monitor(self, task):
+        """用浏览器监测网址获取下载地址；被中断时返回 False。
+
+        流式监测时出现首个强候选即返回，监测在后台线程中继续（task["early_monitor"]），由下载阶段等待或停止。
+        """
+        url = task["url"]
+        runtime = task["runtime"]
+        if not self._acquire_browser_slot():
+            print("[task] interrupted during monitor stage")
+            return False
+        streamed = None
+        if self._stream_enabled and runtime["download_mode"] in (1, 2):
+            streamed = queue.Queue()
+        monitor_state = {"percent": 0, "streamed": streamed}
+        try:
+            monitor = MonitorM3U8(
+                url,
+                recursion_enabled=runtime["recursion_enabled"],
+                recursion_depth=runtime["recursion_depth"],
+                proxy_config=runtime["proxy_config"],
+                monitor_config=runtime["monitor_config"],
+                progress_callback=lambda payload: self._on_monitor_progress(task, monitor_state, payload),
+                stop_checker=self._stop_requested,
+            )
+        except Exception:
+            self._browser_slots.release()
+            raise
+        if task["pipelined"]:
+            monitor.log_tag = f"[task {task['index']}] "
+        monitor.thread_initializer = self._task_thread_initializer(task["log_path"])
+        self._set_active_monitor(monitor)
+        first_candidate = None
+        early_monitor = None
+        if streamed is None:
+            try:
+                l1, l2 = monitor.simple()
+            finally:
+                self._set_active_monitor(monitor, active=False)
+                self._browser_slots.release()
+        else:
+            early_monitor = self._start_early_monitor(task, monitor, streamed)
+            while first_candidate is None and not self._stop_requested():
+                try:
+                    first_candidate = streamed.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if first_candidate is None:
+                    # 监测结束仍没有强候选，按完整结果处理
+                    break
+            if first_candidate is None:
+                l1, l2 = self._wait_early_monitor(early_monitor)
+                early_monitor = None
+        if self._stop_requested():
+            self._stop_early_monitor(early_monitor)
+            print("[task] interrupted during monitor stage")
+            return False
+        with self._batch_state["lock"]:
+            if monitor.result_cache_status in self._monitor_cache_counts:
+                self._monitor_cache_counts[monitor.result_cache_status] += 1
+        proxy_config = runtime["proxy_config"]
+        if early_monitor is None:
+            task["session_hints"] = monitor.get_session_hints()
+            self._learn_url_pattern(url, l1, task["session_hints"], proxy_config)
+            task["current_urls"] = l1 + l2
+            self._emit_task_progress(task, "monitor", 100)
+            self._set_task_ratio(task, "monitor", 1.0)
+        else:
+            first_url, first_referer = first_candidate
+            with monitor.lock:
+                task["session_hints"] = monitor.get_session_hints()
+            if first_referer:
+                task["session_hints"]["referer_map"].setdefault(first_url, first_referer)
+            self._learn_url_pattern(url, [first_url], task["session_hints"], proxy_config)
+            task["current_urls"] = [first_url]
+            task["early_monitor"] = early_monitor
+            print(
+                f"[task] first strong candidate after {time.perf_counter() - task['started_at']:.1f}s; "
+                f"start downloading while monitor continues: {first_url}"
+            )
+        return True
+
+    def _acquire_browser_slot(self):
+        # 名额被占满时等待（可被中断）；流式监测的名额随后台线程一起保留，监测结束才归还
+        while not self._stop_requested():
+            if self._browser_slots.acquire(timeout=0.2):
+                return True
+        return False
+
+    def _start_early_monitor(self, task, monitor, streamed):
+        # 调用方已取得浏览器名额，由后台线程在监测结束时归还
+        early_monitor = {"monitor": monitor, "result": None, "error": None}
+
+        def run_early_monitor():
+            EmittingStream.bind_task_log(task["log_path"])
+            try:
+                early_monitor["result"] = monitor.simple()
+            except Exception as exc:
+                early_monitor["error"] = exc
+            finally:
+                self._browser_slots.release()
+                streamed.put(None)
+
+        early_monitor["thread"] = threading.Thread(
+            target=run_early_monitor,
+            name=f"task-{task['index']}-monitor",
+            daemon=True,
+        )
+        early_monitor["thread"].start()
+        return early_monitor
+
+    def _wait_early_monitor(self, state):
+        # 等待后台监测结束，返回 [possible, predicted]
+        state["thread"].join()
+        self._set_active_monitor(state["monitor"], active=False)
+        if state["error"] is not None:
+            raise state["error"]
+        return state["result"] or [[], []]
+
+    def _stop_early_monitor(self, state, early=False):
+        # early=True：已达成功目标，监测提前结束但结果照常缓存；否则按用户中断处理
+        if state is None:
+            return
+        if state["thread"].is_alive():
+            if early:
+                state["monitor"].request_early_stop()
+            else:
+                state["monitor"].request_stop()
+            state["thread"].join()
+        self._set_active_monitor(state["monitor"], active=False)
+
+    # ---- 单个任务：下载阶段 ----
+
+    def _acquire_temp_name(self):
+        with self._temp_names_lock:
+            number = 1
+            while str(number) in self._temp_names:
+                number += 1
+            self._temp_names.add(str(number))
+            return str(number)
+
+    def _release_temp_name(self, name):
+        with self._temp_names_lock:
+            self._temp_names.discard(name)
+
+    def _build_task_log(self, task):
+        runtime = task["runtime"]
+        proxy_config = runtime["proxy_config"]
+        monitor_config = runtime["monitor_config"]
+        d_config = {
+            "URL": task["url"],
+            "folder": self.folder,
+            "filename": task["filename"],
+            "fileExtText": self.fileExtText,
+            "recursionEnabled": runtime["recursion_enabled"],
+            "recursionDepth": runtime["recursion_depth"],
+            "downloadList": self.downloadList,
+            "downloadMode": runtime["download_mode"],
+            "downloadModeText": runtime["download_mode_text"],
+            "listMode": self.listMode,
+            "listModeText": self.listModeText,
+            "proxyEnabled": proxy_config["enabled"],
+            "proxyAddress": proxy_config["address"],
+            "proxyPort": proxy_config["port"],
+            "proxyUser": proxy_config["username"],
+            "proxyPassword": proxy_config["password"],
+            "maxParallel": runtime["max_parallel"],
+            "monitorTryEnabled": runtime["monitor_try_enabled"],
+            "monitorTries": monitor_config.get("tries", 1),
+            "monitorInteraction": monitor_config.get("interaction_enabled", True),
+            "monitorHeadless": monitor_config["headless"],
+            "monitorRulesPath": monitor_config.get("rules_path", ""),
+            "segmentCompletionPolicy": task["completion_policy"],
+        }
+        d = {"Config": d_config}
+        if task["triage_log"]:
+            d["Triage"] = task["triage_log"]
+        if task["total"] > 1:
+            with self._batch_state["lock"]:
+                done_through = self._batch_state["done_through"]
+            d["BatchCursor"] = {
+                "input": self.URL,
+                "batch": self._batch_state["id"],
+                "index": task["index"],
+                "total": task["total"],
+                "done": False,
+                "doneThrough": done_through,
+            }
+        return d
+
+    @staticmethod
+    def _build_candidate_log_item(candidate_url):
+        return {
+            "url": candidate_url,
+            "completed": False,
+            "completedByTolerance": False,
+            "mergeCompleted": False,
+            "hasMissingSegments": False,
+            "segmentStats": {
+                "total": 0,
+                "downloaded": 0,
+                "failed": 0,
+            },
+            "failedSegments": [],
+            "status": "pending",
+        }
+
+    @staticmethod
+    def _candidate_log_item(i_url, outcome):
+        item = {
+            "url": i_url,
+            "completed": outcome["completed"],
+            "completedByTolerance": outcome["completed_by_tolerance"],
+            "mergeCompleted": outcome["merge_completed"],
+            "hasMissingSegments": outcome["has_missing_segments"],
+            "segmentStats": {
+                "total": outcome["total_segments"],
+                "downloaded": outcome["downloaded_segments"],
+                "failed": len(outcome["failed_segments"]),
+            },
+            "completionMetrics": {
+                "successRatio": round(outcome["success_ratio"], 6),
+                "missingRatio": round(outcome["missing_ratio"], 6),
+            },
+            "failedSegments": outcome["failed_segments"],
+            "status": outcome["status"],
+        }
+        if outcome["mirrors"]:
+            item["mirrors"] = outcome["mirrors"]
+        if outcome["identities"]:
+            item["identities"] = outcome["identities"]
+        if outcome["proxies"]:
+            item["proxies"] = outcome["proxies"]
+        if outcome["breakers"]:
+            item["breakers"] = outcome["breakers"]
+        if outcome["timings"]:
+            item["timings"] = outcome["timings"]
+        return item
+
+    def _record_candidate(self, task, i, i_url, outcome):
+        with task["log_lock"]:
+            if self.downloadList:
+                task["log"][str(i)] = self._candidate_log_item(i_url, outcome)
+            DownloadJson(task["log"], filePath=task["json_path"]).write()
+
+    def _mark_remaining(self, task, indexes, status):
+        d = task["log"]
+        with task["log_lock"]:
+            for idx in indexes:
+                key = str(idx)
+                if key in d and isinstance(d[key], dict) and d[key].get("status") == "pending":
+                    d[key]["status"] = status
+            DownloadJson(d, filePath=task["json_path"]).write()
+
+    def _push_download_ratio(self, task, value):
+        clamped = max(0.0, min(1.0, float(value)))
+        with task["progress_lock"]:
+            if clamped < task["download_ratio"]:
+                clamped = task["download_ratio"]
+            if clamped == task["download_ratio"]:
+                return
+            task["download_ratio"] = clamped
+        self._set_task_ratio(task, "download", clamped)
+
+    def _record_first_byte(self, task):
+        # 任务首个视频字节的耗时（自任务开始计），多个候选同时下载时只记录最早的一次
+        with task["first_byte_lock"]:
+            if task["ttfb"] is not None:
+                return
+            task["ttfb"] = time.perf_counter() - task["started_at"]
+        print(f"[task] time to first video byte={task['ttfb']:.2f}s")
+        with task["log_lock"]:
+            task["log"]["Metrics"] = {
+                "ttfbSeconds": round(task["ttfb"], 3),
+                "streamed": task["early_monitor"] is not None,
+            }
+            DownloadJson(task["log"], filePath=task["json_path"]).write()
+        with self._batch_state["lock"]:
+            self._batch_state["ttfb"].append(task["ttfb"])
+
+    def _download_task(self, task):
+        """下载阶段：逐轮下载候选，直到达到本模式的成功数目标。"""
+        # 去重并保持顺序，避免重复下载
+        task["current_urls"] = list(dict.fromkeys(task["current_urls"]))
+        download_mode = task["runtime"]["download_mode"]
+
+        # 保存下载列表
+        task["completion_policy"] = {
+            "maxMissingSegments": 2,
+            "minSuccessRatio": 0.995,
+        }
+        task["log"] = self._build_task_log(task)
+        task["log_lock"] = threading.Lock()
+        task["progress_lock"] = threading.Lock()
+        task["first_byte_lock"] = threading.Lock()
+        # 同名输出文件的编号在合并时确定，多个候选同时合并需排队
+        task["ffmpeg_lock"] = threading.Lock()
+        task["download_ratio"] = 0.0
+        success_target_map = {0: 0, 1: 1, 2: 5}
+        task["success_target"] = success_target_map.get(download_mode, None)
+        # candidates: 已登记的候选数（日志序号偏移）；planned/target_reached: 最近一轮的目标成功数与是否达标
+        task["download_state"] = {"successes": 0, "candidates": 0, "planned": 0, "target_reached": False}
+
+        early_monitor = task["early_monitor"]
+        if self._stop_requested():
+            self._stop_early_monitor(early_monitor)
+            print("[task] interrupted")
+            return
+
+        if early_monitor is None:
+            print(f"[task] detected m3u8 candidates={len(task['current_urls'])}")
+        else:
+            print("[task] detected first strong candidate, monitor still running")
+
+        success_target = task["success_target"]
+        download_state = task["download_state"]
+        try:
+            completed = self._download_round(task, task["current_urls"])
+            if completed and early_monitor is not None:
+                if success_target is not None and download_state["successes"] >= success_target:
+                    print("[task] success target reached before monitor finished, stop monitor")
+                    self._stop_early_monitor(early_monitor, early=True)
+                else:
+                    completed = self._download_late_candidates(task)
+            if not completed:
+                return
+        finally:
+            self._stop_early_monitor(early_monitor)
+
+        if download_state["candidates"] <= 0:
+            print("[task] no candidates, mark current target as completed")
+            self._set_task_ratio(task, "download", 1.0)
+            return
+
+        successful_videos = download_state["successes"]
+        if success_target is None:
+            print(f"[task] downloaded success videos={successful_videos} (mode=all)")
+        elif download_mode == 0:
+            print("[task] download mode=不下载, skip downloading candidates")
+        else:
+            planned_successes = download_state["planned"]
+            target_reached = download_state["target_reached"] or successful_videos >= planned_successes
+            if target_reached:
+                self._push_download_ratio(task, 1.0)
+            state = "reached" if target_reached else "not reached"
+            print(f"[task] downloaded success videos={successful_videos}/{planned_successes} target {state}")
+
+    def _download_late_candidates(self, task):
+        # 流式监测：首个强候选未能达标时，等待后台监测结束，再以新发现的候选下载一轮
+        early_monitor = task["early_monitor"]
+        print("[task] wait for monitor to collect more candidates")
+        l1, l2 = self._wait_early_monitor(early_monitor)
+        more_hints = early_monitor["monitor"].get_session_hints()
+        for candidate_url, referer in task["session_hints"].get("referer_map", {}).items():
+            more_hints["referer_map"].setdefault(candidate_url, referer)
+        task["session_hints"] = more_hints
+        self._emit_task_progress(task, "monitor", 100)
+        self._set_task_ratio(task, "monitor", 1.0)
+        with task["log_lock"]:
+            tried = {item["url"] for key, item in task["log"].items() if key.isdigit() and isinstance(item, dict)}
+        more = [candidate_url for candidate_url in dict.fromkeys(l1 + l2) if candidate_url not in tried]
+        if self._triage_enabled and len(more) > 1:
+            more = self._triage_candidates(task, more)
+            with task["log_lock"]:
+                task["log"]["Triage"] = task["triage_log"]
+        print(f"[task] monitor finished, more candidates={len(more)}")
+        if len(more) > 0 and not self._stop_requested():
+            return self._download_round(task, more)
+        return True
+
+    def _update_candidate_progress(self, task, round_state, index, ratio):
+        candidate_progress = round_state["progress"]
+        if len(candidate_progress) <= 0:
+            return
+        with task["progress_lock"]:
+            if index < 0 or index >= len(candidate_progress):
+                return
+            clamped = max(0.0, min(1.0, float(ratio)))
+            if clamped < candidate_progress[index]:
+                clamped = candidate_progress[index]
+            candidate_progress[index] = clamped
+            aggregate = sum(candidate_progress) / len(candidate_progress)
+        self._push_download_ratio(task, aggregate)
+
+    def _update_quota_progress(self, task, round_state, current_ratio):
+        if round_state["progress_planned"] <= 0:
+            self._push_download_ratio(task, 1.0)
+            return
+        clamped = max(0.0, min(1.0, float(current_ratio)))
+        ratio = (task["download_state"]["successes"] + clamped) / round_state["progress_planned"]
+        self._push_download_ratio(task, ratio)
+
+    def _download_round(self, task, round_urls):
+        # 下载一轮候选，中断时返回 False。流式监测时第一轮只有首个强候选，
+        # 监测结束后如仍未达标，再以新发现的候选下载一轮
+        download_state = task["download_state"]
+        download_mode = task["runtime"]["download_mode"]
+        max_parallel = task["runtime"]["max_parallel"]
+        success_target = task["success_target"]
+        offset = download_state["candidates"]
+        candidate_count = len(round_urls)
+        download_state["candidates"] += candidate_count
+        with task["log_lock"]:
+            for index, i_url in enumerate(round_urls):
+                task["log"][str(offset + index)] = self._build_candidate_log_item(i_url)
+            DownloadJson(task["log"], filePath=task["json_path"]).write()
+
+        target_reached = False
+        if download_mode == 0:
+            planned_successes = 0
+        elif success_target is None:
+            planned_successes = candidate_count
+        else:
+            planned_successes = max(1, min(success_target, download_state["successes"] + candidate_count))
+        download_state["planned"] = planned_successes
+        # 流式监测的第一轮之后可能还有候选，进度按完整的目标成功数计算
+        progress_planned = planned_successes
+        if task["early_monitor"] is not None and success_target:
+            progress_planned = success_target
+
+        # 投机下载：首个/前5个模式下同时下载排名靠前的 K 个候选，成功数达标后取消其余候选
+        speculative_k = 1
+        if success_target is not None and download_mode != 0 and candidate_count > 1:
+            speculative_k = min(candidate_count, self._speculative_limit)
+        speculative = speculative_k > 1
+        round_state = {
+            "offset": offset,
+            "planned": planned_successes,
+            "progress_planned": progress_planned,
+            "progress": [0.0] * candidate_count,
+            "speculative_k": speculative_k,
+            # 同时下载多个候选（投机下载或流水线多下载线程）时，各候选使用独立的临时目录
+            "private_temp": speculative or (task["pipelined"] and self._download_workers > 1),
+            # 投机下载的候选共用一份并发请求预算，总连接数与单个候选下载时相同
+            "connection_budget": threading.BoundedSemaphore(max_parallel) if speculative else None,
+            "cancelled": set(),
+        }
+
+        if download_mode == 0:
+            self._push_download_ratio(task, 1.0)
+
+        # 所有模式都先完成探测，然后进入下载阶段；
+        # 首个/前5个按“真实成功视频”数量计数，而不是按候选序号截断。
+        processed = set()
+        if not speculative:
+            for i, i_url in enumerate(round_urls):
                 if self._stop_requested():
                     print("[task] interrupted")
-                    return
-
-                print(f"[task] detected m3u8 candidates={len(current_urls)}")
-
-                candidate_count = len(current_urls)
-                for index, i_url in enumerate(current_urls):
-                    d[str(index)] = build_candidate_log_item(i_url)
-                DownloadJson(d, filePath=json_path).write()
-
-                if candidate_count <= 0:
-                    print("[task] no candidates, mark current target as completed")
-                    set_download_ratio(1.0)
-                    return
-
-                success_target_map = {0: 0, 1: 1, 2: 5}
-                success_target = success_target_map.get(download_mode, None)
-                successful_videos = 0
-                target_reached = False
-                candidate_progress = [0.0] * candidate_count
-                progress_lock = threading.Lock()
-                download_ratio_state = {"value": 0.0}
-
-                if download_mode == 0:
-                    planned_successes = 0
-                elif success_target is None:
-                    planned_successes = candidate_count
-                else:
-                    planned_successes = max(1, min(success_target, candidate_count))
-
-                def push_download_ratio(value):
-                    clamped = max(0.0, min(1.0, float(value)))
-                    with progress_lock:
-                        if clamped < download_ratio_state["value"]:
-                            clamped = download_ratio_state["value"]
-                        if clamped == download_ratio_state["value"]:
-                            return
-                        download_ratio_state["value"] = clamped
-                    set_download_ratio(clamped)
-
-                def update_candidate_progress(index, ratio):
-                    if candidate_count <= 0:
-                        return
-                    with progress_lock:
-                        if index < 0 or index >= candidate_count:
-                            return
-                        clamped = max(0.0, min(1.0, float(ratio)))
-                        if clamped < candidate_progress[index]:
-                            clamped = candidate_progress[index]
-                        candidate_progress[index] = clamped
-                        aggregate = sum(candidate_progress) / candidate_count
-                    push_download_ratio(aggregate)
-
-                def update_quota_progress(current_ratio):
-                    if planned_successes <= 0:
-                        push_download_ratio(1.0)
-                        return
-                    clamped = max(0.0, min(1.0, float(current_ratio)))
-                    ratio = (successful_videos + clamped) / planned_successes
-                    push_download_ratio(ratio)
-
-                if download_mode == 0:
-                    push_download_ratio(1.0)
-
-                # 所有模式都先完成探测，然后进入下载阶段；
-                # 首个/前5个按“真实成功视频”数量计数，而不是按候选序号截断。
-                processed_index = -1
-                for i, i_url in enumerate(current_urls):
-                    if self._stop_requested():
-                        print("[task] interrupted")
-                        DownloadJson(d, filePath=json_path).write()
-                        return
+                    DownloadJson(task["log"], filePath=task["json_path"]).write()
+                    return False
+
+                if success_target is not None and download_state["successes"] >= planned_successes:
+                    target_reached = True
+                    break
 
-                    if success_target is not None and successful_videos >= planned_successes:
+                self._record_candidate(task, offset + i, i_url, self._download_candidate(task, round_state, i, i_url))
+                processed.add(i)
+                if self._stop_requested():
+                    print("[task] interrupted, mark remaining candidates as skipped")
+                    self._mark_remaining(task, range(offset + i + 1, offset + candidate_count), "skipped_interrupted")
+                    return False
+        else:
+            print(
+                f"[download] speculative top={speculative_k} quota={planned_successes} "
+                f"shared_connections={max_parallel}"
+            )
+            candidate_pool = ThreadPoolExecutor(
+                max_workers=speculative_k,
+                thread_name_prefix="candidate",
+                initializer=self._task_thread_initializer(task["log_path"]),
+            )
+            running = {}
+            next_index = 0
+            try:
+                while not self._stop_requested():
+                    if download_state["successes"] >= planned_successes:
                         target_reached = True
                         break
+                    while len(running) < speculative_k and next_index < candidate_count:
+                        future = candidate_pool.submit(
+                            self._download_candidate, task, round_state, next_index, round_urls[next_index]
+                        )
+                        running[future] = next_index
+                        next_index += 1
+                    if not running:
+                        break
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        i = running.pop(future)
+                        self._record_candidate(task, offset + i, round_urls[i], future.result())
+                        processed.add(i)
+                if download_state["successes"] >= planned_successes:
+                    target_reached = True
+                # 成功数达标（或中断）后取消仍在下载的候选，下载器在下一次检查时停止
+                round_state["cancelled"].update(running.values())
+                for future in wait(running).done:
+                    i = running[future]
+                    self._record_candidate(task, offset + i, round_urls[i], future.result())
+                    processed.add(i)
+            finally:
+                candidate_pool.shutdown(wait=True)
+            if self._stop_requested():
+                print("[task] interrupted, mark remaining candidates as skipped")
+                self._mark_remaining(task, range(offset, offset + candidate_count), "skipped_interrupted")
+                return False
+
+        remaining = [offset + idx for idx in range(candidate_count) if idx not in processed]
+        if target_reached and remaining:
+            print(
+                f"[task] success target reached ({download_state['successes']}/{planned_successes}), "
+                f"skip remaining downloads={len(remaining)}"
+            )
+            self._mark_remaining(task, remaining, "skipped_target_reached")
+            self._push_download_ratio(task, 1.0)
+        download_state["target_reached"] = target_reached
+        return True
 
-                    completed = False
-                    merge_completed = False
-                    has_missing_segments = False
-                    completed_by_tolerance = False
-                    failed_segments_for_log = []
-                    total_segments = 0
-                    downloaded_segments = 0
-                    success_ratio = 0.0
-                    missing_ratio = 0.0
-                    status = "pending"
-                    if download_mode == 0:
-                        status = "skipped_no_download"
-                        update_candidate_progress(i, 1.0)
-                    else:
-                        self.downloadProgressChanged.emit(0)
-                        candidate_download_percent = {"value": 0}
-
-                        def on_download_progress(payload):
-                            if self._stop_requested():
-                                return
-                            event = str(payload.get("event", "")).strip()
-                            total = _to_int(payload.get("total", 0), 0, 0, 10**9)
-                            if total <= 0:
-                                percent = 0
-                            else:
-                                done = _to_int(payload.get("done", 0), 0, 0, total)
-                                percent = int(round(done * 100 / total))
-                            percent = self._clamp_percent(percent)
-                            if percent < candidate_download_percent["value"]:
-                                percent = candidate_download_percent["value"]
-                            if percent != candidate_download_percent["value"]:
-                                candidate_download_percent["value"] = percent
-                                self.downloadProgressChanged.emit(percent)
-                                if success_target is None:
-                                    update_candidate_progress(i, percent / 100.0)
-                                else:
-                                    update_quota_progress(percent / 100.0)
-
-                        print(f"[download] candidate {i + 1}/{len(current_urls)}")
-                        try:
-                            x = DownloadM3U8(
-                                folder,
-                                i_url,
-                                threadNum=max_parallel,
-                                proxy_config=proxy_config,
-                                session_hints=monitor_session_hints,
-                                progress_callback=on_download_progress,
-                                stop_checker=self._stop_requested,
-                            )
-                        except ValueError as e:
-                            if "m3u8 read error" not in str(e):
-                                raise e
-                            print(f"[warn] skip invalid m3u8: {i_url}")
-                            x = None
-
-                        if x is not None:
-                            self._set_active_downloader(x)
-                            try:
-                                x.DonwloadAndWrite()
-                            finally:
-                                self._set_active_downloader(None)
-
-                            total_segments = len(x.fileNameList)
-                            failed_segments_for_log = x.get_failed_segments()
-                            failed_segments_count = len(failed_segments_for_log)
-                            downloaded_segments = max(0, total_segments - failed_segments_count)
-                            has_missing_segments = failed_segments_count > 0
-                            if total_segments > 0:
-                                success_ratio = downloaded_segments / total_segments
-                                missing_ratio = failed_segments_count / total_segments
-                            if x.was_interrupted():
-                                status = "interrupted_during_segment_download"
-                                self._is_interrupted = True
-                                total_segments = 0
-                                downloaded_segments = 0
-                                failed_segments_for_log = []
-                                has_missing_segments = False
-                                success_ratio = 0.0
-                                missing_ratio = 0.0
-                                print(
-                                    "[task] interrupted during segment download, stop at video boundary"
-                                )
-                            else:
-                                success_segments = downloaded_segments
-                                if success_segments <= 0:
-                                    status = "no_downloadable_segments"
-                                    print("[warn][ffmpeg] skip: no downloadable segments")
-                                else:
-                                    print(f"[ffmpeg] start generating {file_ext_text}")
-                                    ffmpeg_ok = x.process_video_with_ffmpeg(this_filename, file_ext_text)
-                                    merge_completed = ffmpeg_ok
-                                    if ffmpeg_ok:
-                                        if has_missing_segments:
-                                            tolerable_missing = (
-                                                failed_segments_count <= completion_policy["maxMissingSegments"]
-                                                or success_ratio >= completion_policy["minSuccessRatio"]
-                                            )
-                                            if tolerable_missing:
-                                                completed = True
-                                                completed_by_tolerance = True
-                                                successful_videos += 1
-                                                status = "completed_with_tolerated_missing_segments"
-                                                print("[task] merged with tolerated missing segments; mark as completed")
-                                                print(
-                                                    f"[download] tolerated missing segments={failed_segments_count}, "
-                                                    f"success_ratio={success_ratio:.4f}, log={json_path}"
-                                                )
-                                            else:
-                                                status = "merged_with_missing_segments"
-                                                print(
-                                                    "[warn] merged but missing segments exceed tolerance; "
-                                                    "keep task as uncompleted"
-                                                )
-                                                print(
-                                                    f"[download] remaining failed segments={failed_segments_count}, "
-                                                    f"success_ratio={success_ratio:.4f}, log={json_path}"
-                                                )
-                                        else:
-                                            completed = True
-                                            successful_videos += 1
-                                            status = "completed"
-                                            print(f"[success][ffmpeg] {file_ext_text} completed generating")
-                                    else:
-                                        status = "ffmpeg_failed"
-                                        print("[warn][ffmpeg] failed; continue next candidate")
-                        else:
-                            status = "invalid_m3u8"
-                            if success_target is not None:
-                                update_quota_progress(0.0)
-
-                        if not self._stop_requested():
-                            if success_target is None:
-                                update_candidate_progress(i, 1.0)
-                            elif completed:
-                                push_download_ratio(successful_videos / planned_successes)
-
-                    if download_list:
-                        d[str(i)] = {
-                            "url": i_url,
-                            "completed": completed,
-                            "completedByTolerance": completed_by_tolerance,
-                            "mergeCompleted": merge_completed,
-                            "hasMissingSegments": has_missing_segments,
-                            "segmentStats": {
-                                "total": total_segments,
-                                "downloaded": downloaded_segments,
-                                "failed": len(failed_segments_for_log),
-                            },
-                            "completionMetrics": {
-                                "successRatio": round(success_ratio, 6),
-                                "missingRatio": round(missing_ratio, 6),
-                            },
-                            "failedSegments": failed_segments_for_log,
-                            "status": status,
-                        }
-                    DownloadJson(d, filePath=json_path).write()
-                    processed_index = i
-                    if self._stop_requested():
-                        print("[task] interrupted, mark remaining candidates as skipped")
-                        for idx in range(processed_index + 1, candidate_count):
-                            key = str(idx)
-                            if key in d and isinstance(d[key], dict):
-                                d[key]["status"] = "skipped_interrupted"
-                        DownloadJson(d, filePath=json_path).write()
-                        return
-
-                if target_reached and processed_index + 1 < candidate_count:
-                    print(
-                        f"[task] success target reached ({successful_videos}/{planned_successes}), "
-                        f"skip remaining downloads={candidate_count - (processed_index + 1)}"
-                    )
-                    for idx in range(processed_index + 1, candidate_count):
-                        key = str(idx)
-                        if key in d and isinstance(d[key], dict):
-                            d[key]["status"] = "skipped_target_reached"
-                    DownloadJson(d, filePath=json_path).write()
-                    push_download_ratio(1.0)
+    def _download_candidate(self, task, round_state, i, i_url):
+        download_state = task["download_state"]
+        download_mode = task["runtime"]["download_mode"]
+        success_target = task["success_target"]
+        completion_policy = task["completion_policy"]
+        offset = round_state["offset"]
+        cancelled_candidates = round_state["cancelled"]
+        speculative_k = round_state["speculative_k"]
+        file_ext_text = self.fileExtText
+        outcome = {
+            "completed": False,
+            "merge_completed": False,
+            "has_missing_segments": False,
+            "completed_by_tolerance": False,
+            "failed_segments": [],
+            "total_segments": 0,
+            "downloaded_segments": 0,
+            "success_ratio": 0.0,
+            "missing_ratio": 0.0,
+            "mirrors": [],
+            "identities": [],
+            "proxies": [],
+            "breakers": [],
+            "timings": {},
+            "status": "pending",
+        }
+        if download_mode == 0:
+            outcome["status"] = "skipped_no_download"
+            self._update_candidate_progress(task, round_state, i, 1.0)
+            return outcome
 
+        self._emit_task_progress(task, "download", 0)
+        candidate_download_percent = {"value": 0}
+
+        def on_download_progress(payload):
+            if payload.get("event") == "first_byte":
+                self._record_first_byte(task)
+                return
+            if self._stop_requested() or i in cancelled_candidates:
+                return
+            total = _to_int(payload.get("total", 0), 0, 0, 10**9)
+            if total <= 0:
+                percent = 0
+            else:
+                done = _to_int(payload.get("done", 0), 0, 0, total)
+                percent = int(round(done * 100 / total))
+            percent = self._clamp_percent(percent)
+            if percent < candidate_download_percent["value"]:
+                percent = candidate_download_percent["value"]
+            if percent != candidate_download_percent["value"]:
+                candidate_download_percent["value"] = percent
+                self._emit_task_progress(task, "download", percent)
                 if success_target is None:
-                    print(f"[task] downloaded success videos={successful_videos} (mode=all)")
-                elif download_mode == 0:
-                    print("[task] download mode=不下载, skip downloading candidates")
+                    self._update_candidate_progress(task, round_state, i, percent / 100.0)
                 else:
-                    state = "reached" if target_reached or successful_videos >= planned_successes else "not reached"
-                    print(
-                        f"[task] downloaded success videos={successful_videos}/{planned_successes} "
-                        f"target {state}"
-                    )
+                    self._update_quota_progress(task, round_state, percent / 100.0)
+
+        def candidate_stop_requested():
+            return self._stop_requested() or i in cancelled_candidates
 
-            for task_index, (url, match_str) in enumerate(urls_and_strings, start=1):
-                # 地址范围中的每个url 不是一个url中识别到的所有m3u8视频
-                task_runtime, used_latest_config = self._runtime_settings_for_task()
-                if used_latest_config:
+        print(f"[download] candidate {offset + i + 1}/{download_state['candidates']}")
+        temp_name = self._acquire_temp_name() if round_state["private_temp"] else ""
+        try:
+            try:
+                x = DownloadM3U8(
+                    self.folder,
+                    i_url,
+                    threadNum=task["runtime"]["max_parallel"],
+                    proxy_config=task["runtime"]["proxy_config"],
+                    session_hints=task["session_hints"],
+                    progress_callback=on_download_progress,
+                    stop_checker=candidate_stop_requested,
+                    temp_name=temp_name,
+                    connection_budget=round_state["connection_budget"],
+                    mirrors=task["mirrors"].get(i_url, []),
+                    # 投机下载时排名靠前的候选分到更多连接与带宽
+                    priority=max(1, speculative_k - i) if speculative_k > 1 else 1,
+                    thread_initializer=self._task_thread_initializer(task["log_path"]),
+                )
+            except ValueError as e:
+                if "m3u8 read error" not in str(e):
+                    raise e
+                print(f"[warn] skip invalid m3u8: {i_url}")
+                x = None
+
+            if x is None:
+                outcome["status"] = "invalid_m3u8"
+                if success_target is not None:
+                    self._update_quota_progress(task, round_state, 0.0)
+                elif not self._stop_requested():
+                    self._update_candidate_progress(task, round_state, i, 1.0)
+                return outcome
+
+            self._set_active_downloader(x)
+            try:
+                x.DonwloadAndWrite()
+            finally:
+                self._set_active_downloader(x, active=False)
+
+            if x.was_interrupted():
+                if i in cancelled_candidates and not self._stop_requested():
+                    # 其他候选已凑够成功数，本候选被取消
+                    outcome["status"] = "skipped_target_reached"
                     print(
-                        f"[task {task_index}/{total_tasks}] runtime config refreshed: "
-                        f"mode={task_runtime['download_mode_text']} "
-                        f"depth={task_runtime['recursion_depth']} "
-                        f"parallel={task_runtime['max_parallel']}"
+                        f"[download] candidate {offset + i + 1}/{download_state['candidates']} "
+                        "cancelled: success target reached"
                     )
+                    x.release_temp()
                 else:
-                    print(
-                        f"[task {task_index}/{total_tasks}] runtime config refresh failed, "
-                        "continue with worker snapshot"
-                    )
-                run_url(
-                    url,
-                    f"{filename}_{match_str}" if match_str != "" else filename,
-                    task_index,
-                    total_tasks,
-                    task_runtime,
-                )
-                if self._stop_requested():
-                    break
+                    outcome["status"] = "interrupted_during_segment_download"
+                    self._is_interrupted = True
+                    print("[task] interrupted during segment download, stop at video boundary")
+                return outcome
+
+            total_segments = len(x.fileNameList)
+            failed_segments_for_log = x.get_failed_segments()
+            failed_segments_count = len(failed_segments_for_log)
+            downloaded_segments = max(0, total_segments - failed_segments_count)
+            outcome["total_segments"] = total_segments
+            outcome["failed_segments"] = failed_segments_for_log
+            outcome["downloaded_segments"] = downloaded_segments
+            if len(x.mirrors) > 1:
+                outcome["mirrors"] = x.get_mirror_stats()
+            outcome["identities"] = [item for item in x.get_identity_stats() if item["requests"] > 0]
+            outcome["proxies"] = x.get_proxy_stats()
+            outcome["breakers"] = x.get_breaker_stats()
+            outcome["timings"] = x.get_connection_stats()
+            outcome["has_missing_segments"] = failed_segments_count > 0
+            if total_segments > 0:
+                outcome["success_ratio"] = downloaded_segments / total_segments
+                outcome["missing_ratio"] = failed_segments_count / total_segments
+            success_ratio = outcome["success_ratio"]
+            tolerable_missing = (
+                failed_segments_count <= completion_policy["maxMissingSegments"]
+                or success_ratio >= completion_policy["minSuccessRatio"]
+            )
+            if downloaded_segments <= 0:
+                outcome["status"] = "no_downloadable_segments"
+                print("[warn][ffmpeg] skip: no downloadable segments")
+            else:
+                # 同名输出文件的编号在合并时确定，多个候选同时合并需排队；
+                # 成功数在锁内累加，排队期间其他候选已凑够成功数时不再合并
+                with task["ffmpeg_lock"]:
+                    quota_met = success_target is not None and download_state["successes"] >= round_state["planned"]
+                    if i in cancelled_candidates or quota_met:
+                        outcome["status"] = "skipped_target_reached"
+                        print(
+                            f"[download] candidate {offset + i + 1}/{download_state['candidates']} "
+                            "not merged: success target reached"
+                        )
+                        x.release_temp()
+                        return outcome
+                    print(f"[ffmpeg] start generating {file_ext_text}")
+                    ffmpeg_ok = x.process_video_with_ffmpeg(task["filename"], file_ext_text)
+                    if ffmpeg_ok and (not outcome["has_missing_segments"] or tolerable_missing):
+                        with task["progress_lock"]:
+                            download_state["successes"] += 1
+                outcome["merge_completed"] = ffmpeg_ok
+                if not ffmpeg_ok:
+                    outcome["status"] = "ffmpeg_failed"
+                    print("[warn][ffmpeg] failed; continue next candidate")
+                elif outcome["has_missing_segments"]:
+                    if tolerable_missing:
+                        outcome["completed"] = True
+                        outcome["completed_by_tolerance"] = True
+                        outcome["status"] = "completed_with_tolerated_missing_segments"
+                        print("[task] merged with tolerated missing segments; mark as completed")
+                        print(
+                            f"[download] tolerated missing segments={failed_segments_count}, "
+                            f"success_ratio={success_ratio:.4f}, log={task['json_path']}"
+                        )
+                    else:
+                        outcome["status"] = "merged_with_missing_segments"
+                        print("[warn] merged but missing segments exceed tolerance; keep task as uncompleted")
+                        print(
+                            f"[download] remaining failed segments={failed_segments_count}, "
+                            f"success_ratio={success_ratio:.4f}, log={task['json_path']}"
+                        )
+                else:
+                    outcome["completed"] = True
+                    outcome["status"] = "completed"
+                    print(f"[success][ffmpeg] {file_ext_text} completed generating")
 
             if not self._stop_requested():
-                self._run_completed = True
-
-        except Exception as e:
-            print(f"[error][worker] {e}")
+                if success_target is None:
+                    self._update_candidate_progress(task, round_state, i, 1.0)
+                elif outcome["completed"]:
+                    self._push_download_ratio(task, download_state["successes"] / round_state["progress_planned"])
+            return outcome
         finally:
-            self.runCompleted.emit(self._run_completed)
+            if temp_name != "":
+                self._release_temp_name(temp_name)
 
     def interrupt(self):
         """用于外部请求中断该线程"""
@@ -1371,6 +2181,10 @@ class MyConfigWindow(QMainWindow):
             "downloadMode": self.ui.downloadModeCombo.currentIndex(),
             "downloadModeText": self.ui.downloadModeCombo.currentText().strip(),
             "maxParallel": self.ui.concurrentSpinBox.value(),
+            "pipelineMonitors": self.ui.pipelineMonitorSpinBox.value(),
+            "pipelineDownloads": self.ui.pipelineDownloadSpinBox.value(),
+            "speculativeDownloads": self.ui.speculativeSpinBox.value(),
+            "streamingDownload": self.ui.streamingCheckBox.isChecked(),
         }
 
     def _apply_download_preset(self, payload):
@@ -1387,6 +2201,10 @@ class MyConfigWindow(QMainWindow):
         self.ui.headlessCheckBox.setChecked(normalized["monitorHeadless"])
         self.ui.downloadModeCombo.setCurrentIndex(normalized["downloadMode"])
         self.ui.concurrentSpinBox.setValue(normalized["maxParallel"])
+        self.ui.pipelineMonitorSpinBox.setValue(normalized["pipelineMonitors"])
+        self.ui.pipelineDownloadSpinBox.setValue(normalized["pipelineDownloads"])
+        self.ui.speculativeSpinBox.setValue(normalized["speculativeDownloads"])
+        self.ui.streamingCheckBox.setChecked(normalized["streamingDownload"])
         self.on_recursionCheckBox_toggled(normalized["recursionEnabled"])
         self.on_attemptCheckBox_toggled(normalized.get("monitorTryEnabled", True))
 
@@ -1424,12 +2242,17 @@ class MyConfigWindow(QMainWindow):
             self.ui.interactionCheckBox.setChecked(config.get("monitorInteraction", True))
             self.ui.downloadModeCombo.setCurrentIndex(config["downloadMode"])
             self.ui.stopModeCombo.setCurrentIndex(config["stopMode"])
+            self.ui.batchResumeCheckBox.setChecked(config["batchResume"])
             self.ui.proxyCheckBox.setChecked(config["proxyEnabled"])
             self.ui.proxyAddressEdit.setText(config["proxyAddress"])
             self.ui.proxyPortEdit.setText(config["proxyPort"])
             self.ui.proxyUserEdit.setText(config["proxyUser"])
             self.ui.proxyPasswordEdit.setText(config["proxyPassword"])
             self.ui.concurrentSpinBox.setValue(config["maxParallel"])
+            self.ui.pipelineMonitorSpinBox.setValue(config["pipelineMonitors"])
+            self.ui.pipelineDownloadSpinBox.setValue(config["pipelineDownloads"])
+            self.ui.speculativeSpinBox.setValue(config["speculativeDownloads"])
+            self.ui.streamingCheckBox.setChecked(config["streamingDownload"])
             self.ui.headlessCheckBox.setChecked(config["monitorHeadless"])
             self.on_recursionCheckBox_toggled(config["recursionEnabled"])
             self.on_attemptCheckBox_toggled(config.get("monitorTryEnabled", True))
@@ -1467,12 +2290,17 @@ class MyConfigWindow(QMainWindow):
         self.ui.interactionCheckBox.setChecked(config["monitorInteraction"])
         self.ui.downloadModeCombo.setCurrentIndex(config["downloadMode"])
         self.ui.stopModeCombo.setCurrentIndex(config["stopMode"])
+        self.ui.batchResumeCheckBox.setChecked(config["batchResume"])
         self.ui.proxyCheckBox.setChecked(config["proxyEnabled"])
         self.ui.proxyAddressEdit.setText(config["proxyAddress"])
         self.ui.proxyPortEdit.setText(config["proxyPort"])
         self.ui.proxyUserEdit.setText(config["proxyUser"])
         self.ui.proxyPasswordEdit.setText(config["proxyPassword"])
         self.ui.concurrentSpinBox.setValue(config["maxParallel"])
+        self.ui.pipelineMonitorSpinBox.setValue(config["pipelineMonitors"])
+        self.ui.pipelineDownloadSpinBox.setValue(config["pipelineDownloads"])
+        self.ui.speculativeSpinBox.setValue(config["speculativeDownloads"])
+        self.ui.streamingCheckBox.setChecked(config["streamingDownload"])
         self.ui.headlessCheckBox.setChecked(config["monitorHeadless"])
         self.on_recursionCheckBox_toggled(config["recursionEnabled"])
         self.on_attemptCheckBox_toggled(config["monitorTryEnabled"])
@@ -1500,12 +2328,17 @@ class MyConfigWindow(QMainWindow):
         updated["downloadModeText"] = self.ui.downloadModeCombo.currentText().strip()
         updated["stopMode"] = self.ui.stopModeCombo.currentIndex()
         updated["stopModeText"] = self.ui.stopModeCombo.currentText().strip()
+        updated["batchResume"] = self.ui.batchResumeCheckBox.isChecked()
         updated["proxyEnabled"] = self.ui.proxyCheckBox.isChecked()
         updated["proxyAddress"] = self.ui.proxyAddressEdit.text().strip()
         updated["proxyPort"] = self.ui.proxyPortEdit.text().strip()
         updated["proxyUser"] = self.ui.proxyUserEdit.text().strip()
         updated["proxyPassword"] = self.ui.proxyPasswordEdit.text().strip()
         updated["maxParallel"] = self.ui.concurrentSpinBox.value()
+        updated["pipelineMonitors"] = self.ui.pipelineMonitorSpinBox.value()
+        updated["pipelineDownloads"] = self.ui.pipelineDownloadSpinBox.value()
+        updated["speculativeDownloads"] = self.ui.speculativeSpinBox.value()
+        updated["streamingDownload"] = self.ui.streamingCheckBox.isChecked()
         updated["monitorHeadless"] = self.ui.headlessCheckBox.isChecked()
 
         self.ui.folderEdit.setText(updated["folder"])
@@ -1575,6 +2408,7 @@ class MyWindow(QMainWindow):
         # stdout 回调可能在配置初始化期间触发，先准备日志字段
         self._active_log_path = ""
         self._log_file_handle = None
+        self._task_log_handles = {}  # 后台任务（流水线中预先监测的任务）的日志文件
         self._ui_line_buffer = ""
 
         # 重定向
@@ -1638,6 +2472,14 @@ class MyWindow(QMainWindow):
         self._log_file_handle = None
         self._active_log_path = ""
 
+    def _close_task_logs(self):
+        for handle in self._task_log_handles.values():
+            try:
+                handle.close()
+            except Exception:
+                pass
+        self._task_log_handles = {}
+
     def _set_active_log_file(self, log_path):
         path = str(log_path or "").strip()
         if path == "":
@@ -1646,10 +2488,23 @@ class MyWindow(QMainWindow):
         if path == self._active_log_path and self._log_file_handle is not None:
             return
         self._close_log_file()
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        self._log_file_handle = open(path, "a", encoding="utf-8")
+        handle = self._task_log_handles.pop(path, None)
+        if handle is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            handle = open(path, "a", encoding="utf-8")
+        self._log_file_handle = handle
         self._active_log_path = path
 
+    def _log_handle_for(self, log_path):
+        if log_path == "" or log_path == self._active_log_path:
+            return self._log_file_handle
+        handle = self._task_log_handles.get(log_path)
+        if handle is None:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            handle = open(log_path, "a", encoding="utf-8")
+            self._task_log_handles[log_path] = handle
+        return handle
+
     def _attach_worker(self, worker):
         self.worker = worker
         self.worker.started.connect(self.on_worker_started)
@@ -1852,6 +2707,11 @@ class MyWindow(QMainWindow):
             "monitorInteraction": config.get("monitorInteraction", True),
             "monitorHeadless": config["monitorHeadless"],
             "monitorRulesPath": config.get("monitorRulesPath", ""),
+            "batchResume": config.get("batchResume", False),
+            "pipelineMonitors": config.get("pipelineMonitors", 0),
+            "pipelineDownloads": config.get("pipelineDownloads", 1),
+            "speculativeDownloads": config.get("speculativeDownloads", 1),
+            "streamingDownload": config.get("streamingDownload", False),
         }
 
         self._attach_worker(Worker(passing_dict))
@@ -1879,6 +2739,7 @@ class MyWindow(QMainWindow):
         self.ui.folderEdit.setReadOnly(False)
         self.ui.openFolderButton.setEnabled(True)
         self._close_log_file()
+        self._close_task_logs()
         self.ui.clearButton.setVisible(True)
         # 释放 worker 引用，方便下次启动新任务
         self.worker = None
@@ -1933,11 +2794,13 @@ class MyWindow(QMainWindow):
     def on_worker_run_completed(self, completed):
         self._last_worker_completed = bool(completed)
 
-    def on_stdout_raw_written(self, text):
-        log_file_handle = getattr(self, "_log_file_handle", None)
-        if log_file_handle is None:
+    def on_stdout_raw_written(self, text, log_path=""):
+        if getattr(self, "_log_file_handle", None) is None and log_path == "":
             return
         try:
+            log_file_handle = self._log_handle_for(log_path)
+            if log_file_handle is None:
+                return
             log_file_handle.write(text)
             log_file_handle.flush()
         except Exception:
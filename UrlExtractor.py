@@ -0,0 +1,173 @@
+import base64
+import re
+from urllib.parse import unquote
+
+
+class UrlExtractor:
+    """候选 URL 提取引擎，替代原先对同一段文本的五次独立 re.findall。
+
+    覆盖的形式与原实现一致：绝对 URL、双重转义 URL、引号内的相对 m3u8、
+    url/source/src 赋值字段，以及 player_xxx = {...} 参数块中的 url/parse。
+
+    做法：
+    - 子串预检（m3u8/http/player_），都不含时直接返回，并据此裁剪需要的分支
+    - 字段与 URL 合并为一个预编译交替正则，在小写副本上单次扫描（不带 IGNORECASE，
+      每个分支以字面量开头，可走正则引擎的首字符快速跳过），命中位置回到原文取值
+    - player_ 参数块只在文本含 “player_” 时才扫描
+    - 引号内的相对 m3u8 以 “.m3u8” 字面量为锚点向两侧扩展，不再从每个引号起试探匹配
+    - 被整段吞掉的字段值/URL 在片段内补查其余形式；原始命中先去重，再统一规范化
+    """
+
+    _FIELD_TAIL = r"\s*[:=]\s*[\"']([^\"']+?)[\"']"
+    _FIELD_BRANCHES = ["url" + _FIELD_TAIL, "source" + _FIELD_TAIL, "src" + _FIELD_TAIL]
+    _URL_BRANCH = r"https?:(?://|\\\\/\\\\/)[^\s'\"<>()]+"
+
+    _ABSOLUTE_PATTERN = re.compile(r"https?://[^\s'\"<>()]+", re.IGNORECASE)
+    _ESCAPED_PATTERN = re.compile(r"https?:\\\\/\\\\/[^\s'\"<>()]+", re.IGNORECASE)
+    _PLAYER_PATTERN = re.compile(r"player_[a-z0-9_]+\s*=\s*(\{.*?\})\s*;", re.DOTALL)
+    _PLAYER_PATTERN_IGNORECASE = re.compile(r"player_[a-z0-9_]+\s*=\s*(\{.*?\})\s*;", re.DOTALL | re.IGNORECASE)
+    _M3U8_ANCHOR = re.compile(r"\.m3u8")
+    _M3U8_ANCHOR_IGNORECASE = re.compile(r"\.m3u8", re.IGNORECASE)
+    _ENCRYPT_PATTERN = re.compile(r"[\"']encrypt[\"']\s*:\s*[\"']?([0-9]+)[\"']?", re.IGNORECASE)
+    _PLAYER_URL_PATTERN = re.compile(r"[\"']url[\"']\s*:\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+    _PLAYER_PARSE_PATTERN = re.compile(r"[\"']parse[\"']\s*:\s*[\"']([^\"']+)[\"']", re.IGNORECASE)
+    _QUOTE_CHARS = "\"'"
+    _MAX_QUOTED_RUN = 4096
+
+    _compiled = {}
+
+    def __init__(self, normalize):
+        # normalize(url, base_url) -> str，通常为 MonitorM3U8._normalize_url
+        self.normalize = normalize
+
+    @classmethod
+    def _pattern_for(cls, has_url, ignore_case):
+        key = (has_url, ignore_case)
+        if key not in cls._compiled:
+            # 分组 1~3 为字段值；无分组命中即 URL
+            parts = list(cls._FIELD_BRANCHES)
+            if has_url:
+                parts.append(cls._URL_BRANCH)
+            cls._compiled[key] = re.compile("|".join(parts), re.IGNORECASE if ignore_case else 0)
+        return cls._compiled[key]
+
+    @staticmethod
+    def decode_player_url(raw_url, encrypt_value="0"):
+        value = str(raw_url).strip()
+        if value == "":
+            return ""
+        encrypt = str(encrypt_value).strip()
+        try:
+            if encrypt == "1":
+                return unquote(value)
+            if encrypt == "2":
+                b64_source = value
+                if "%" in value:
+                    b64_source = unquote(value)
+                padded = b64_source + "=" * ((4 - len(b64_source) % 4) % 4)
+                decoded = base64.b64decode(padded).decode("utf-8", errors="ignore")
+                return unquote(decoded)
+        except Exception:
+            return value
+        return value
+
+    def _collect_url_hit(self, raw_url, raw_hits):
+        raw_hits.add(raw_url.replace("\\/", "/"))
+        # 绝对 URL 与双重转义 URL 原本是两次独立扫描，互相包含时补查另一种
+        if raw_url[5:6] == "\\" or raw_url[6:7] == "\\":
+            inner = self._ABSOLUTE_PATTERN.findall(raw_url)
+        else:
+            inner = self._ESCAPED_PATTERN.findall(raw_url)
+        for item in inner:
+            raw_hits.add(item.replace("\\/", "/"))
+
+    def _collect_field_value(self, value, raw_hits):
+        lowered = value.lower()
+        if ".m3u8" in lowered or "http" in lowered:
+            raw_hits.add(value)
+        for item in self._ABSOLUTE_PATTERN.findall(value):
+            raw_hits.add(item.replace("\\/", "/"))
+        for item in self._ESCAPED_PATTERN.findall(value):
+            raw_hits.add(item.replace("\\/", "/"))
+
+    def _collect_player_block(self, block, raw_hits):
+        encrypt_match = self._ENCRYPT_PATTERN.search(block)
+        encrypt = encrypt_match.group(1) if encrypt_match else "0"
+        for url_value in self._PLAYER_URL_PATTERN.findall(block):
+            raw_hits.add(self.decode_player_url(url_value, encrypt))
+        for parse_value in self._PLAYER_PARSE_PATTERN.findall(block):
+            raw_hits.add(parse_value)
+
+    def _scan(self, text, scan_text, pattern, raw_hits):
+        for match in pattern.finditer(scan_text):
+            for group in (1, 2, 3):
+                if match.start(group) != -1:
+                    self._collect_field_value(text[match.start(group):match.end(group)], raw_hits)
+                    break
+            else:
+                self._collect_url_hit(text[match.start():match.end()], raw_hits)
+
+    def _scan_player_blocks(self, text, scan_text, ignore_case, raw_hits):
+        pattern = self._PLAYER_PATTERN_IGNORECASE if ignore_case else self._PLAYER_PATTERN
+        for match in pattern.finditer(scan_text):
+            self._collect_player_block(text[match.start(1):match.end(1)], raw_hits)
+
+    def _collect_quoted_m3u8(self, text, scan_text, anchor, raw_hits):
+        # 等价于 ["']([^"'\s]+?\.m3u8[^"'\s]*)["']：以 .m3u8 为锚点向两侧扩展到引号/空白
+        length = len(scan_text)
+        run_end = -1
+        for match in anchor.finditer(scan_text):
+            index = match.start()
+            if index < run_end:
+                continue
+            start = index
+            floor = max(0, index - self._MAX_QUOTED_RUN)
+            while start > floor and not self._is_run_boundary(scan_text[start - 1]):
+                start -= 1
+            end = match.end()
+            ceiling = min(length, end + self._MAX_QUOTED_RUN)
+            while end < ceiling and not self._is_run_boundary(scan_text[end]):
+                end += 1
+            run_end = end
+            if start == 0 or end >= length:
+                continue
+            if start == index and anchor.search(scan_text, index + 1, end) is None:
+                # 引号后直接是 .m3u8：正则要求 .m3u8 前至少一个字符，串内还有后续 .m3u8 时才算命中
+                continue
+            if scan_text[start - 1] in self._QUOTE_CHARS and scan_text[end] in self._QUOTE_CHARS:
+                raw_hits.add(text[start:end])
+
+    @classmethod
+    def _is_run_boundary(cls, char):
+        return char in cls._QUOTE_CHARS or char.isspace()
+
+    def extract(self, text, base_url):
+        found = set()
+        if not isinstance(text, str) or text == "":
+            return found
+
+        lowered = text.lower()
+        has_m3u8 = "m3u8" in lowered
+        has_http = "http" in lowered
+        has_player = "player_" in lowered
+        if not (has_m3u8 or has_http or has_player):
+            return found
+
+        # 个别字符转小写后长度会变化，此时退回在原文上做忽略大小写匹配
+        ignore_case = len(lowered) != len(text)
+        scan_text = text if ignore_case else lowered
+
+        raw_hits = set()
+        if has_m3u8 or has_http:
+            self._scan(text, scan_text, self._pattern_for(has_http, ignore_case), raw_hits)
+        if has_player:
+            self._scan_player_blocks(text, scan_text, ignore_case, raw_hits)
+        if has_m3u8:
+            anchor = self._M3U8_ANCHOR_IGNORECASE if ignore_case else self._M3U8_ANCHOR
+            self._collect_quoted_m3u8(text, scan_text, anchor, raw_hits)
+
+        for raw_url in raw_hits:
+            normalized = self.normalize(raw_url, base_url)
+            if normalized != "":
+                found.add(normalized)
+        return found
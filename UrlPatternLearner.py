@@ -0,0 +1,335 @@
+import html
+import re
+import threading
+from urllib.parse import unquote
+
+import requests
+
+from ProxyPool import ProxyPool
+
+
+class UrlPatternLearner:
+    """模板批量任务（如 `https://site/play/{{ep}}.html {{ep:1-50}}`）的“页面 → 播放列表”捷径。
+
+    前几集照常用浏览器监测，成功后用 learn() 记录（页面 URL、占位符取值、播放列表 URL），学出两类规则：
+    - page：播放列表地址直接写在页面 HTML 中（原样、`\\/` 转义或百分号编码），记录地址前面一段不含数字的固定文本，
+      之后的集数只需普通 GET 页面并按这段文本截取地址；需另一集的页面按同一规则截出该集的地址才启用
+    - template：播放列表地址中含有占位符取值（原样或去掉前导零），把该位置换成占位后，需另一集验证一致才启用
+    shortcut() 依次尝试已启用的规则，并用一次播放列表 GET（开头为 #EXTM3U）确认；连续失败 MAX_FAILURES 次后本批停用。
+    流水线中多个监测线程共用一个学习器：规则只在锁内读写，页面与播放列表请求在锁外进行。
+    """
+
+    CONTEXT_CHARS = 32
+    MIN_CONTEXT_CHARS = 4
+    MAX_TEMPLATES = 16
+    MAX_FAILURES = 3
+    PAGE_TIMEOUT = (4, 6)
+    PLAYLIST_TIMEOUT = (3, 4)
+    _URL_END = re.compile(r"[\"'<>\s\\]")
+    # JSON 转义的地址中反斜杠属于 "\/"，只在引号、空白处结束
+    _JSON_URL_END = re.compile(r"[\"'<>\s]")
+
+    def __init__(self, url_template, user_agent=""):
+        self.url_template = str(url_template or "")
+        self._lock = threading.Lock()
+        self.user_agent = user_agent
+        self.cookies = []
+        self.disabled = False
+        self.failures = 0
+        self.stats = {"tries": 0, "hits": 0, "learned": 0}
+        self._page_rule = None
+        self._page_examples = 0
+        self._templates = []
+        self._template_examples = 0
+        self._value_pattern = self._compile_value_pattern(self.url_template)
+
+    @staticmethod
+    def _compile_value_pattern(url_template):
+        parts = re.split(r"\{\{\w+?\}\}", url_template)
+        if len(parts) < 2:
+            return None
+        return re.compile("^" + "(.+?)".join(re.escape(part) for part in parts) + "$")
+
+    def template_values(self, page_url):
+        """从页面 URL 反推各占位符的取值（按模板中出现的顺序）。"""
+        if self._value_pattern is None:
+            return []
+        match = self._value_pattern.match(str(page_url or ""))
+        return list(match.groups()) if match else []
+
+    @property
+    def active_rules(self):
+        with self._lock:
+            return self._active_rules_locked()
+
+    def _active_rules_locked(self):
+        rules = []
+        if self._page_examples >= 2 and self._page_rule is not None:
+            rules.append("page")
+        if self._template_examples >= 2 and self._templates:
+            rules.append("template")
+        return rules
+
+    def _request_context_locked(self, proxy_config):
+        # 锁内取出本次请求用到的会话信息，请求本身在锁外进行
+        return {"proxies": self._proxies_for(proxy_config), "user_agent": self.user_agent, "cookies": list(self.cookies)}
+
+    def _session(self, context):
+        session = requests.Session()
+        session.trust_env = False
+        if context["proxies"]:
+            session.proxies.update(context["proxies"])
+        for cookie in context["cookies"]:
+            try:
+                session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                )
+            except (KeyError, TypeError):
+                continue
+        return session
+
+    @staticmethod
+    def _headers(context, referer):
+        headers = {"accept-language": "zh-CN,zh;q=0.9,en;q=0.8", "referer": referer}
+        if context["user_agent"]:
+            headers["user-agent"] = context["user_agent"]
+        return headers
+
+    def _fetch_page(self, session, context, page_url):
+        try:
+            response = session.get(page_url, headers=self._headers(context, page_url), timeout=self.PAGE_TIMEOUT)
+            response.raise_for_status()
+            return response.text
+        except Exception:
+            return ""
+
+    def _is_playlist(self, session, context, playlist_url, referer):
+        try:
+            with session.get(
+                playlist_url,
+                headers=self._headers(context, referer),
+                timeout=self.PLAYLIST_TIMEOUT,
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    return False
+                head = next(response.iter_content(256), b"")
+            return head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"#EXTM3U")
+        except Exception:
+            return False
+
+    # ---- template 规则 ----
+
+    @staticmethod
+    def _value_variants(value):
+        variants = [(value, "raw")]
+        if value.isdigit() and str(int(value)) != value:
+            variants.append((str(int(value)), "int"))
+        return variants
+
+    @staticmethod
+    def _bounded_spans(text, token):
+        # 前后不能紧挨字母数字，避免把 "1" 匹配进 "2019" 或哈希里
+        spans = []
+        start = text.find(token)
+        while start != -1:
+            end = start + len(token)
+            before = text[start - 1] if start > 0 else ""
+            after = text[end] if end < len(text) else ""
+            if not before.isalnum() and not after.isalnum():
+                spans.append((start, end))
+            start = text.find(token, start + 1)
+        return spans
+
+    def _template_candidates(self, playlist_url, values):
+        candidates = []
+        for index, value in enumerate(values):
+            if value == "":
+                continue
+            for token, mode in self._value_variants(value):
+                spans = self._bounded_spans(playlist_url, token)
+                options = [[span] for span in spans]
+                if len(spans) > 1:
+                    options.append(spans)
+                for chosen in options:
+                    parts = []
+                    cursor = 0
+                    for start, end in chosen:
+                        parts.append(playlist_url[cursor:start])
+                        parts.append((index, mode))
+                        cursor = end
+                    parts.append(playlist_url[cursor:])
+                    candidates.append(tuple(parts))
+        return list(dict.fromkeys(candidates))[: self.MAX_TEMPLATES]
+
+    @staticmethod
+    def _render_template(template, values):
+        text = []
+        for part in template:
+            if isinstance(part, str):
+                text.append(part)
+                continue
+            index, mode = part
+            if index >= len(values):
+                return ""
+            value = values[index]
+            if mode == "int":
+                if not value.isdigit():
+                    return ""
+                value = str(int(value))
+            text.append(value)
+        return "".join(text)
+
+    # ---- page 规则 ----
+
+    @staticmethod
+    def _encodings(playlist_url):
+        return [
+            ("raw", playlist_url),
+            ("html", playlist_url.replace("&", "&amp;")),
+            ("json", playlist_url.replace("/", "\\/")),
+            ("percent", re.sub(r"[:/?&=]", lambda m: "%{:02X}".format(ord(m.group(0))), playlist_url)),
+        ]
+
+    @staticmethod
+    def _decode(text, encoding):
+        if encoding == "json":
+            return text.replace("\\/", "/")
+        if encoding == "percent":
+            return unquote(text)
+        if encoding == "html":
+            return html.unescape(text)
+        return text
+
+    def _extract_with_rule(self, page_html, rule):
+        prefix, encoding = rule
+        start = page_html.find(prefix)
+        if start == -1:
+            return ""
+        start += len(prefix)
+        end_pattern = self._JSON_URL_END if encoding == "json" else self._URL_END
+        end_match = end_pattern.search(page_html, start)
+        end = end_match.start() if end_match else len(page_html)
+        return self._decode(page_html[start:end], encoding)
+
+    def _learn_page_rule(self, page_html, playlist_url):
+        for encoding, encoded in self._encodings(playlist_url):
+            position = page_html.find(encoded)
+            if position <= 0:
+                continue
+            context = page_html[max(0, position - self.CONTEXT_CHARS):position]
+            # 只保留最后一段不含数字与换行的文本，集数、时间戳等变化部分不进入规则
+            prefix = re.split(r"[\d\r\n]", context)[-1]
+            if len(prefix) < self.MIN_CONTEXT_CHARS:
+                continue
+            rule = (prefix, encoding)
+            if self._extract_with_rule(page_html, rule) == playlist_url:
+                return rule
+        return None
+
+    # ---- 对外接口 ----
+
+    @staticmethod
+    def _proxies_for(proxy_config):
+        # proxy_config 为 _build_proxy_config 的结果；每个任务的运行时配置可能不同
+        proxy_config = ProxyPool.resolve_config(proxy_config)
+        if not isinstance(proxy_config, dict) or not proxy_config.get("enabled"):
+            return {}
+        auth = ""
+        if proxy_config.get("username") or proxy_config.get("password"):
+            auth = f"{proxy_config.get('username', '')}:{proxy_config.get('password', '')}@"
+        proxy_url = f"http://{auth}{proxy_config['address']}:{proxy_config['port']}"
+        return {"http": proxy_url, "https": proxy_url}
+
+    def _set_session_hints_locked(self, session_hints):
+        if not isinstance(session_hints, dict):
+            return
+        if session_hints.get("user_agent"):
+            self.user_agent = session_hints["user_agent"]
+        cookies = session_hints.get("cookies")
+        if isinstance(cookies, list):
+            self.cookies = [dict(item) for item in cookies if isinstance(item, dict)]
+
+    def _learn_template_locked(self, values, playlist_url):
+        candidates = self._template_candidates(playlist_url, values) if values else []
+        if self._template_examples > 0 and self._templates:
+            consistent = [item for item in self._templates if self._render_template(item, values) == playlist_url]
+            if consistent:
+                self._templates = consistent
+                self._template_examples += 1
+                return
+        self._templates = candidates
+        self._template_examples = 1 if candidates else 0
+
+    def _learn_page_locked(self, page_html, playlist_url):
+        if self._page_rule is not None and self._extract_with_rule(page_html, self._page_rule) == playlist_url:
+            self._page_examples += 1
+            return
+        # 第一集，或与已有规则不一致：从本集重新学习，等下一集验证
+        self._page_rule = self._learn_page_rule(page_html, playlist_url)
+        self._page_examples = 1 if self._page_rule is not None else 0
+
+    def learn(self, page_url, playlist_url, session_hints=None, proxy_config=None):
+        """记录一集的监测结果；返回 (学习前, 学习后) 启用的规则类型列表。"""
+        with self._lock:
+            before = self._active_rules_locked()
+            if self.disabled or not playlist_url:
+                return before, before
+            self._set_session_hints_locked(session_hints)
+            context = self._request_context_locked(proxy_config)
+
+        session = self._session(context)
+        try:
+            page_html = self._fetch_page(session, context, page_url)
+        finally:
+            session.close()
+
+        values = self.template_values(page_url)
+        with self._lock:
+            self._learn_template_locked(values, playlist_url)
+            if page_html:
+                self._learn_page_locked(page_html, playlist_url)
+            self.stats["learned"] += 1
+            return before, self._active_rules_locked()
+
+    def shortcut(self, page_url, proxy_config=None):
+        """按已学规则推出播放列表地址并验证；返回 (播放列表地址, 尝试的规则)，失败时地址为空串，由调用方改用浏览器监测。"""
+        with self._lock:
+            rules = self._active_rules_locked()
+            if self.disabled or not rules:
+                return "", rules
+            self.stats["tries"] += 1
+            template = self._templates[0] if "template" in rules else None
+            page_rule = self._page_rule if "page" in rules else None
+            context = self._request_context_locked(proxy_config)
+
+        values = self.template_values(page_url)
+        found = ""
+        session = self._session(context)
+        try:
+            candidates = []
+            if template is not None and values:
+                candidates.append(self._render_template(template, values))
+            if page_rule is not None:
+                page_html = self._fetch_page(session, context, page_url)
+                if page_html:
+                    candidates.append(self._extract_with_rule(page_html, page_rule))
+            for candidate in dict.fromkeys(candidates):
+                if candidate and self._is_playlist(session, context, candidate, page_url):
+                    found = candidate
+                    break
+        finally:
+            session.close()
+
+        with self._lock:
+            if found != "":
+                self.failures = 0
+                self.stats["hits"] += 1
+            else:
+                self.failures += 1
+                if self.failures >= self.MAX_FAILURES:
+                    self.disabled = True
+        return found, rules
@@ -0,0 +1,167 @@
+import json
+import os
+import random
+import threading
+from array import array
+
+
+class UserAgentSampler:
+    """基于 src/browsers.jsonl 的离线 User-Agent 加权抽样。
+
+    数据在第一次抽样时读取一次，存为紧凑数组（User-Agent 文本列表 + 权重/类型/浏览器编号数组）；
+    每种过滤条件（设备类型、浏览器家族）第一次使用时按 percent 建一张别名表（Vose alias method），
+    之后每次抽样 O(1)。不做任何网络请求。
+
+    不指定设备类型时，先按 device_mix 抽取设备类型，再在该类型内按 percent 抽样，
+    各类型所占比例因此不随数据文件的行数变化。
+    """
+
+    DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "browsers.jsonl")
+    # 默认设备类型比例：与原先 fake_useragent UserAgent().random 在同一份数据上的比例一致（其默认过滤条件下各行等概率）
+    DEFAULT_DEVICE_MIX = {"mobile": 0.841, "desktop": 0.149, "tablet": 0.010}
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path=None, device_mix=None):
+        self.path = path or self.DATA_PATH
+        self.device_mix = dict(self.DEFAULT_DEVICE_MIX if device_mix is None else device_mix)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.user_agents = []
+        self.weights = array("d")
+        self.device_codes = array("B")
+        self.browser_codes = array("H")
+        self.device_names = []
+        self.browser_names = []
+        self._tables = {}
+
+    @classmethod
+    def shared(cls):
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def _code(names, value):
+        try:
+            return names.index(value)
+        except ValueError:
+            names.append(value)
+            return len(names) - 1
+
+    def _load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            item = json.loads(line)
+                            user_agent = str(item["useragent"]).strip()
+                            weight = float(item.get("percent", 0) or 0)
+                        except (ValueError, KeyError, TypeError):
+                            continue
+                        if user_agent == "" or weight <= 0:
+                            continue
+                        self.user_agents.append(user_agent)
+                        self.weights.append(weight)
+                        self.device_codes.append(self._code(self.device_names, str(item.get("type", "")).lower()))
+                        self.browser_codes.append(self._code(self.browser_names, str(item.get("browser", ""))))
+            except OSError as exc:
+                print(f"[warn][headers] user agent data unavailable: {exc}")
+            self._loaded = True
+
+    @staticmethod
+    def _build_alias(weights):
+        # Vose alias method：prob[i] 为落在第 i 格时直接取 i 的概率，否则取 alias[i]
+        count = len(weights)
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        prob = array("d", [0.0] * count)
+        alias = array("I", [0] * count)
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            prob[less] = scaled[less]
+            alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        for index in small + large:
+            prob[index] = 1.0
+        return prob, alias
+
+    def _table(self, device, browser):
+        key = (device, browser)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                return table
+            device_code = self.device_names.index(device) if device in self.device_names else None
+            browser_codes = None
+            if browser is not None:
+                # 浏览器家族按名称包含匹配，例如 chrome 匹配 Chrome、Chrome Mobile、Chrome Mobile iOS
+                browser_codes = {code for code, name in enumerate(self.browser_names) if browser in name.lower()}
+            if (device is not None and device_code is None) or browser_codes == set():
+                indexes = array("I")
+            else:
+                indexes = array(
+                    "I",
+                    (
+                        index
+                        for index in range(len(self.user_agents))
+                        if (device_code is None or self.device_codes[index] == device_code)
+                        and (browser_codes is None or self.browser_codes[index] in browser_codes)
+                    ),
+                )
+            if len(indexes) == 0:
+                table = (indexes, array("d"), array("I"))
+            else:
+                table = (indexes,) + self._build_alias([self.weights[index] for index in indexes])
+            self._tables[key] = table
+            return table
+
+    def _pick_device(self, rng):
+        total = sum(weight for weight in self.device_mix.values() if weight > 0)
+        if total <= 0:
+            return None
+        point = rng.random() * total
+        for device, weight in self.device_mix.items():
+            if weight <= 0:
+                continue
+            point -= weight
+            if point < 0:
+                return device
+        return device
+
+    def sample(self, device=None, browser=None, rng=None):
+        """按 percent 加权抽取一个 User-Agent；没有符合条件的数据时返回空字符串。
+
+        :param device: desktop / mobile / tablet，None 表示按 device_mix 抽取设备类型
+        :param browser: 浏览器家族（如 chrome、safari、firefox、edge），None 表示不限
+        """
+        self._load()
+        rng = rng or random
+        device = str(device).strip().lower() if device else None
+        browser = str(browser).strip().lower() if browser else None
+        indexes = ()
+        if device is None:
+            mixed_device = self._pick_device(rng)
+            if mixed_device is not None:
+                indexes, prob, alias = self._table(mixed_device, browser)
+        if len(indexes) == 0:
+            # 指定了设备类型，或抽到的类型下没有符合条件的数据（如按浏览器过滤后为空）时不再按比例
+            indexes, prob, alias = self._table(device, browser)
+        if len(indexes) == 0:
+            return ""
+        slot = rng.randrange(len(indexes))
+        if rng.random() >= prob[slot]:
+            slot = alias[slot]
+        return self.user_agents[indexes[slot]]
+
+    def __len__(self):
+        self._load()
+        return len(self.user_agents)
@@ -0,0 +1,183 @@
+"""候选 URL 提取基准：旧版多次 re.findall 与 UrlExtractor 单次扫描对比。
+
+用法（仓库根目录）：python bench/bench_extractor.py [--rounds 20]
+语料位于 bench/corpus，可用 bench/make_corpus.py 重新生成。
+输出每个语料文件的吞吐（MB/s）与两种实现的结果是否一致。
+"""
+
+import argparse
+import base64
+import os
+import re
+import sys
+import time
+from urllib.parse import unquote
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from MonitorM3U8 import MonitorM3U8  # noqa: E402
+from UrlExtractor import UrlExtractor  # noqa: E402
+
+CORPUS_DIR = os.path.join(ROOT, "bench", "corpus")
+BASE_URL = "https://www.yhdm.example/vodplay/12345-1-1.html"
+
+
+class LegacyExtractor:
+    """改造前 MonitorM3U8 中 _extract_urls_from_text + _extract_player_config_candidates 的实现（基线）。"""
+
+    def __init__(self, normalize):
+        self._normalize_url = normalize
+
+    def _extract_urls_from_text(self, text, base_url):
+        found = set()
+        if not isinstance(text, str) or text == "":
+            return found
+
+        absolute_urls = re.findall(r"https?://[^\s\'\"<>()]+", text, flags=re.IGNORECASE)
+        escaped_urls = re.findall(r"https?:\\\\/\\\\/[^\s\'\"<>()]+", text, flags=re.IGNORECASE)
+        relative_m3u8 = re.findall(r"[\"']([^\"'\s]+?\.m3u8[^\"'\s]*)[\"']", text, flags=re.IGNORECASE)
+
+        for raw_url in absolute_urls + escaped_urls:
+            normalized = self._normalize_url(raw_url.replace("\\/", "/"), base_url)
+            if normalized != "":
+                found.add(normalized)
+
+        for raw_url in relative_m3u8:
+            normalized = self._normalize_url(raw_url, base_url)
+            if normalized != "":
+                found.add(normalized)
+
+        return found
+
+    @staticmethod
+    def _decode_player_url(raw_url, encrypt_value="0"):
+        value = str(raw_url).strip()
+        if value == "":
+            return ""
+        encrypt = str(encrypt_value).strip()
+        try:
+            if encrypt == "1":
+                return unquote(value)
+            if encrypt == "2":
+                b64_source = value
+                if "%" in value:
+                    b64_source = unquote(value)
+                padded = b64_source + "=" * ((4 - len(b64_source) % 4) % 4)
+                decoded = base64.b64decode(padded).decode("utf-8", errors="ignore")
+                return unquote(decoded)
+        except Exception:
+            return value
+        return value
+
+    def _extract_player_config_candidates(self, text, base_url):
+        found = set()
+        if not isinstance(text, str) or text == "":
+            return found
+
+        for block in re.findall(r"player_[a-z0-9_]+\s*=\s*(\{.*?\})\s*;", text, flags=re.IGNORECASE | re.DOTALL):
+            encrypt_match = re.search(
+                r"[\"']encrypt[\"']\s*:\s*[\"']?([0-9]+)[\"']?",
+                block,
+                flags=re.IGNORECASE,
+            )
+            encrypt = encrypt_match.group(1) if encrypt_match else "0"
+
+            for url_match in re.findall(
+                r"[\"']url[\"']\s*:\s*[\"']([^\"']+)[\"']",
+                block,
+                flags=re.IGNORECASE,
+            ):
+                decoded = self._decode_player_url(url_match, encrypt)
+                normalized = self._normalize_url(decoded, base_url)
+                if normalized != "":
+                    found.add(normalized)
+
+            for parse_match in re.findall(
+                r"[\"']parse[\"']\s*:\s*[\"']([^\"']+)[\"']",
+                block,
+                flags=re.IGNORECASE,
+            ):
+                normalized = self._normalize_url(parse_match, base_url)
+                if normalized != "":
+                    found.add(normalized)
+
+        for field_match in re.findall(
+            r"(?:url|source|src)\s*[:=]\s*[\"']([^\"']+?)[\"']",
+            text,
+            flags=re.IGNORECASE,
+        ):
+            if ".m3u8" not in field_match.lower() and "http" not in field_match.lower():
+                continue
+            normalized = self._normalize_url(field_match, base_url)
+            if normalized != "":
+                found.add(normalized)
+
+        return found
+
+    def extract(self, text, base_url):
+        found = set(self._extract_urls_from_text(text, base_url))
+        found.update(self._extract_player_config_candidates(text, base_url))
+        return found
+
+
+def _load_corpus():
+    corpus = []
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        path = os.path.join(CORPUS_DIR, name)
+        if not os.path.isfile(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            corpus.append((name, f.read()))
+    return corpus
+
+
+def _measure(extract, text, rounds):
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        extract(text, BASE_URL)
+    return (time.perf_counter() - started_at) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    monitor = MonitorM3U8(BASE_URL, recursion_enabled=False)
+    # 不走规范化缓存，只比较扫描本身
+    normalize = monitor._normalize_url_uncached
+    legacy = LegacyExtractor(normalize)
+    current = UrlExtractor(normalize)
+
+    total_bytes = 0
+    total_legacy = 0.0
+    total_current = 0.0
+    print(f"{'file':<20}{'KB':>9}{'legacy MB/s':>14}{'new MB/s':>12}{'speedup':>10}{'urls':>7}  same")
+    for name, text in _load_corpus():
+        size = len(text.encode("utf-8"))
+        legacy_found = legacy.extract(text, BASE_URL)
+        current_found = current.extract(text, BASE_URL)
+        legacy_seconds = _measure(legacy.extract, text, args.rounds)
+        current_seconds = _measure(current.extract, text, args.rounds)
+        total_bytes += size
+        total_legacy += legacy_seconds
+        total_current += current_seconds
+        same = legacy_found == current_found
+        print(
+            f"{name:<20}{size / 1024:>9.1f}"
+            f"{size / legacy_seconds / 1e6:>14.1f}{size / current_seconds / 1e6:>12.1f}"
+            f"{legacy_seconds / current_seconds:>9.2f}x{len(current_found):>7}  {same}"
+        )
+        if not same:
+            print(f"    only legacy={sorted(legacy_found - current_found)[:5]}")
+            print(f"    only new={sorted(current_found - legacy_found)[:5]}")
+    print(
+        f"{'total':<20}{total_bytes / 1024:>9.1f}"
+        f"{total_bytes / total_legacy / 1e6:>14.1f}{total_bytes / total_current / 1e6:>12.1f}"
+        f"{total_legacy / total_current:>9.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
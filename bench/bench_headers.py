@@ -0,0 +1,94 @@
+"""请求头生成基准：RandomHeaders 的导入耗时与 User-Agent 抽样耗时、设备类型比例。
+
+用法（仓库根目录）：python bench/bench_headers.py [--rounds 5] [--samples 100000]
+- 导入耗时：每轮新开一个解释器，预先导入 requests 后计时 `import RandomHeaders`，取中位数
+- 已安装 fake_useragent 时，同样计时改造前类定义时执行的 `UserAgent()` 构造与 `.random`，作为对照
+- 抽样：首次抽样（读取数据 + 建别名表）、之后每次抽样的耗时，以及默认设备类型比例与 DEFAULT_DEVICE_MIX 的对照
+"""
+
+import argparse
+import collections
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from UserAgentSampler import UserAgentSampler  # noqa: E402
+
+IMPORT_SNIPPET = """
+import sys, time
+sys.path.insert(0, {root!r})
+import requests
+started_at = time.perf_counter()
+{statement}
+print(time.perf_counter() - started_at)
+"""
+
+
+def _import_ms(statement, rounds):
+    samples = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET.format(root=ROOT, statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=ROOT,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--samples", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'item':<40}{'value':>14}")
+    print(f"{'import RandomHeaders':<40}{_import_ms('import RandomHeaders', args.rounds):>11.1f} ms")
+    legacy = importlib.util.find_spec("fake_useragent") is not None
+    if legacy:
+        statement = "from fake_useragent import UserAgent; UserAgent()"
+        print(f"{'import fake_useragent + UserAgent()':<40}{_import_ms(statement, args.rounds):>11.1f} ms")
+
+    sampler = UserAgentSampler()
+    started_at = time.perf_counter()
+    sampler.sample()
+    print(f"{'first sample (load + alias table)':<40}{(time.perf_counter() - started_at) * 1000:>11.1f} ms")
+
+    started_at = time.perf_counter()
+    for _ in range(args.samples):
+        sampler.sample()
+    print(f"{'sample':<40}{(time.perf_counter() - started_at) / args.samples * 1e6:>11.2f} us")
+
+    if legacy:
+        from fake_useragent import UserAgent
+
+        user_agent = UserAgent()
+        count = max(1, min(args.samples, 200))
+        started_at = time.perf_counter()
+        for _ in range(count):
+            user_agent.random
+        print(f"{'fake_useragent .random':<40}{(time.perf_counter() - started_at) / count * 1e6:>11.2f} us")
+
+    device_of = {}
+    with open(sampler.path, "r", encoding="utf-8") as f:
+        for line in f:
+            item = json.loads(line)
+            device_of[str(item["useragent"]).strip()] = str(item.get("type", "")).lower()
+    counts = collections.Counter(device_of.get(sampler.sample(), "") for _ in range(args.samples))
+    print()
+    print(f"{'device':<12}{'sampled':>10}{'mix':>10}")
+    for device, weight in sampler.device_mix.items():
+        print(f"{device:<12}{counts[device] / args.samples:>10.1%}{weight:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""整页候选提取耗时基准：_normalize_url 不缓存 vs LRU 缓存。
+
+用法（仓库根目录）：python bench/bench_normalize.py [--attempts 3] [--rounds 5]
+模拟一次监测会话：每个语料文件按尝试次数重复提取（同一页面在多次尝试、页面内容与响应体中反复出现），
+缓存版本每轮使用新的缓存实例，统计包含冷启动未命中的开销。
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from LruCache import LruCache  # noqa: E402
+from MonitorM3U8 import MonitorM3U8  # noqa: E402
+from UrlExtractor import UrlExtractor  # noqa: E402
+
+CORPUS_DIR = os.path.join(ROOT, "bench", "corpus")
+BASE_URL = "https://www.yhdm.example/vodplay/12345-1-1.html"
+
+
+def _load_corpus():
+    corpus = []
+    for name in sorted(os.listdir(CORPUS_DIR)):
+        path = os.path.join(CORPUS_DIR, name)
+        if os.path.isfile(path):
+            with open(path, "r", encoding="utf-8") as f:
+                corpus.append((name, f.read()))
+    return corpus
+
+
+def _session_seconds(extractor, text, attempts, rounds, reset=None):
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        if reset is not None:
+            reset()
+        for _ in range(attempts):
+            extractor.extract(text, BASE_URL)
+    return (time.perf_counter() - started_at) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--attempts", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    monitor = MonitorM3U8(BASE_URL, recursion_enabled=False, normalize_cache=LruCache(MonitorM3U8.NORMALIZE_CACHE_SIZE))
+    uncached = UrlExtractor(monitor._normalize_url_uncached)
+    cached = UrlExtractor(monitor._normalize_url)
+
+    total_uncached = 0.0
+    total_cached = 0.0
+    print(f"{'file':<20}{'uncached ms':>13}{'cached ms':>11}{'speedup':>10}{'hit rate':>10}")
+    for name, text in _load_corpus():
+        uncached_seconds = _session_seconds(uncached, text, args.attempts, args.rounds)
+        monitor.normalize_cache.clear()
+        cached_seconds = _session_seconds(
+            cached,
+            text,
+            args.attempts,
+            args.rounds,
+            reset=monitor.normalize_cache.clear,
+        )
+        stats = monitor.normalize_cache.stats()
+        total_uncached += uncached_seconds
+        total_cached += cached_seconds
+        print(
+            f"{name:<20}{uncached_seconds * 1000:>13.1f}{cached_seconds * 1000:>11.1f}"
+            f"{uncached_seconds / cached_seconds:>9.2f}x{stats['hit_rate'] * 100:>9.1f}%"
+        )
+    print(
+        f"{'total':<20}{total_uncached * 1000:>13.1f}{total_cached * 1000:>11.1f}"
+        f"{total_uncached / total_cached:>9.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""持久化浏览器目录基准：冷启动 vs 热启动的首个候选耗时（time-to-first-candidate）。
+
+用法（仓库根目录，需要已安装 Playwright Chromium）：
+    python bench/bench_profile.py [--rounds 3] [--latency-ms 250]
+
+在本机起一个模拟影视站（http.server，不访问外网）：
+- 首次访问返回反爬验证页：脚本写入 Cookie 后延迟刷新
+- 播放页加载约 1.5MB 的播放器脚本与样式（Cache-Control 可缓存，附 ETag），每个资源附加固定延迟
+- 播放器脚本运行后请求接口取得 m3u8 地址再请求播放列表（地址在运行时拼接，HTTP 预探测拿不到）
+
+分别测量：不使用持久化目录、持久化目录冷启动（空目录）、持久化目录热启动（沿用上一轮目录），
+每种方式运行 rounds 次取中位数。
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from MonitorM3U8 import MonitorM3U8  # noqa: E402
+
+PLAYER_JS = (
+    "/* bundled player */\n"
+    + "var __pad = '" + ("x" * 1500 * 1024) + "';\n"
+    + """
+(function () {
+  fetch('/api/source?id=12345').then(function (r) { return r.json(); }).then(function (data) {
+    var url = ['', data.dir, data.name + '.' + ['m', '3', 'u', '8'].join('')].join('/');
+    return fetch(url);
+  });
+})();
+"""
+)
+SITE_CSS = "body{margin:0}" + (".c{color:#000}" * 20000)
+CHALLENGE_HTML = """<html><head><title>checking</title></head><body>
+<script>setTimeout(function(){document.cookie='bench_clearance=ok; path=/; max-age=86400';location.reload();},800);</script>
+</body></html>"""
+PLAY_HTML = """<html><head><link rel="stylesheet" href="/static/site.css"></head><body>
+<div class="player"><video width="640" height="360"></video></div>
+<script src="/static/player.js"></script>
+</body></html>"""
+PLAYLIST = "#EXTM3U\n#EXT-X-TARGETDURATION:4\n#EXTINF:4,\nseg0.ts\n#EXT-X-ENDLIST\n"
+
+
+def _make_handler(latency_ms):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body, content_type, headers=None):
+            time.sleep(latency_ms / 1000.0)
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _static(self, body, content_type):
+            etag = f'"{len(body)}"'
+            if self.headers.get("If-None-Match") == etag:
+                time.sleep(latency_ms / 1000.0)
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(200, body, content_type, {"Cache-Control": "public, max-age=86400", "ETag": etag})
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/vodplay/12345-1-1.html":
+                if "bench_clearance=ok" not in str(self.headers.get("Cookie", "")):
+                    self._send(200, CHALLENGE_HTML, "text/html; charset=utf-8")
+                else:
+                    self._send(200, PLAY_HTML, "text/html; charset=utf-8")
+            elif path == "/static/player.js":
+                self._static(PLAYER_JS, "application/javascript")
+            elif path == "/static/site.css":
+                self._static(SITE_CSS, "text/css")
+            elif path == "/api/source":
+                self._send(200, '{"dir": "hls/12345", "name": "index"}', "application/json")
+            elif path.endswith(".m3u8"):
+                self._send(200, PLAYLIST, "application/vnd.apple.mpegurl")
+            else:
+                self._send(404, "not found", "text/plain")
+
+    return Handler
+
+
+class TimedMonitor(MonitorM3U8):
+    def __init__(self, *args, **kwargs):
+        self.first_candidate_at = None
+        super().__init__(*args, **kwargs)
+
+    def _add_m3u8_candidate(self, raw_url, referer=""):
+        before = len(self.possible)
+        super()._add_m3u8_candidate(raw_url, referer)
+        if self.first_candidate_at is None and len(self.possible) > before:
+            self.first_candidate_at = time.perf_counter()
+
+
+def _run_once(url):
+    monitor = TimedMonitor(url, recursion_enabled=False, monitor_config={"headless": True, "tries": 1})
+    started_at = time.perf_counter()
+    monitor.MonitorUrl()
+    total = time.perf_counter() - started_at
+    first = None if monitor.first_candidate_at is None else monitor.first_candidate_at - started_at
+    return first, total
+
+
+def _measure(label, url, rounds, profile_mode, cache_dir, reset_each_round):
+    os.environ["M3U8_MONITOR_CACHE_DIR"] = cache_dir
+    os.environ["M3U8_MONITOR_PERSISTENT_PROFILE"] = profile_mode
+    firsts = []
+    totals = []
+    for _ in range(rounds):
+        if reset_each_round:
+            cache_dir = tempfile.mkdtemp(prefix="m3u8-profile-")
+            os.environ["M3U8_MONITOR_CACHE_DIR"] = cache_dir
+        first, total = _run_once(url)
+        if first is not None:
+            firsts.append(first)
+        totals.append(total)
+    first_text = f"{statistics.median(firsts) * 1000:.0f}ms" if firsts else "-"
+    print(f"{label:<20}first_candidate={first_text:>8}  total={statistics.median(totals) * 1000:.0f}ms  runs={rounds}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=int, default=250)
+    args = parser.parse_args()
+
+    os.environ["M3U8_MONITOR_HTTP_FIRST"] = "0"
+    os.environ["M3U8_MONITOR_ADAPTIVE_TIMING"] = "0"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/vodplay/12345-1-1.html"
+
+    try:
+        _measure("temporary context", url, args.rounds, "", tempfile.mkdtemp(prefix="m3u8-profile-"), True)
+        _measure("persistent cold", url, args.rounds, "site", "", True)
+        warm_dir = tempfile.mkdtemp(prefix="m3u8-profile-")
+        os.environ["M3U8_MONITOR_CACHE_DIR"] = warm_dir
+        os.environ["M3U8_MONITOR_PERSISTENT_PROFILE"] = "site"
+        _run_once(url)  # 预热
+        _measure("persistent warm", url, args.rounds, "site", warm_dir, False)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""站点规则加载与匹配基准：每次构造重新编译 + 逐条匹配 vs 进程内缓存 + RuleIndex。
+
+用法（仓库根目录）：python bench/bench_rules.py [--sites 1500] [--urls 2000] [--rounds 5]
+在临时目录生成合成规则文件（固定随机种子；host 精确值 / “*.后缀” / 其它通配 / url_contains / url_regex 混合），
+不改动 config/monitor.rules.json。输出：
+- 加载：冷编译耗时与缓存命中耗时
+- 匹配：旧版逐条 fnmatch + re.search 与 RuleIndex 的单 URL 平均耗时，并校验两者命中结果一致
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from urllib.parse import urlparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from MonitorM3U8 import MonitorM3U8  # noqa: E402
+
+SEED = 20240611
+WORDS = ["anime", "video", "play", "tv", "dm", "yun", "movie", "film", "cloud", "vod", "hd", "box", "live", "fun"]
+TLDS = ["com", "net", "org", "cc", "tv", "me", "xyz", "top"]
+
+
+def _host(rng):
+    return f"{rng.choice(WORDS)}{rng.choice(WORDS)}{rng.randint(1, 999)}.{rng.choice(TLDS)}"
+
+
+def make_rules(site_count, rng):
+    base = MonitorM3U8._builtin_default_rules()
+    sites = []
+    for index in range(site_count):
+        host = _host(rng)
+        kind = index % 10
+        match = {}
+        if kind < 5:
+            match["host"] = [host, f"www.{host}"]
+        elif kind < 8:
+            match["host"] = [f"*.{host}"]
+        elif kind == 8:
+            match["host"] = [f"{host.split('.')[0]}*.{host.split('.')[1]}"]
+            match["url_contains"] = [f"/{rng.choice(WORDS)}play{index}/"]
+        else:
+            match["url_regex"] = rf"^https?://([a-z0-9-]+\.)?{re.escape(host)}/vodplay/\d+"
+        sites.append(
+            {
+                "name": f"site_{index}",
+                "enabled": True,
+                "match": match,
+                "actions": [{"type": "chain", "args": {"name": "monitor_first_pass"}, "when": "1"}],
+            }
+        )
+    base["sites"] = sites
+    return base
+
+
+def make_urls(rules, url_count, rng):
+    urls = []
+    sites = rules["sites"]
+    for _ in range(url_count):
+        if rng.random() < 0.6:
+            match = rng.choice(sites)["match"]
+            host = (match.get("host") or [""])[0].replace("*.", "m.").replace("*", "x")
+            if host == "":
+                host = re.sub(r"\\(.)", r"\1", match["url_regex"].split(")?")[1].split("/")[0])
+            urls.append(f"https://{host}/vodplay/{rng.randint(1, 99999)}-1-{rng.randint(1, 40)}.html")
+        else:
+            urls.append(f"https://{_host(rng)}/vodplay/{rng.randint(1, 99999)}-1-1.html")
+    return urls
+
+
+def legacy_rule_matches_url(monitor, rule, url):
+    """改造前 MonitorM3U8._rule_matches_url 的实现（基线）。"""
+    normalized_url = monitor._normalize_url(url) or str(url or "")
+    lowered_url = normalized_url.lower()
+    host = (urlparse(normalized_url).hostname or "").lower()
+
+    host_patterns = rule.get("host_patterns", [])
+    host_match = None
+    if host_patterns:
+        host_match = any(fnmatch.fnmatch(host, pattern) for pattern in host_patterns)
+
+    url_contains = rule.get("url_contains", [])
+    contains_match = None
+    if url_contains:
+        contains_match = any(keyword in lowered_url for keyword in url_contains)
+
+    url_regex = str(rule.get("url_regex", "")).strip()
+    regex_match = None
+    if url_regex != "":
+        try:
+            regex_match = re.search(url_regex, normalized_url, flags=re.IGNORECASE) is not None
+        except re.error:
+            regex_match = False
+
+    checks = [value for value in (host_match, contains_match, regex_match) if value is not None]
+    if len(checks) == 0:
+        return True
+    return any(checks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sites", type=int, default=1500)
+    parser.add_argument("--urls", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(SEED)
+    rules = make_rules(args.sites, rng)
+    urls = make_urls(rules, args.urls, rng)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rules_path = os.path.join(temp_dir, "monitor.rules.json")
+        with open(rules_path, "w", encoding="utf-8") as f:
+            json.dump(rules, f, ensure_ascii=False, indent=4)
+        config = {"rules_path": rules_path}
+
+        MonitorM3U8.clear_compiled_rules_cache()
+        started_at = time.perf_counter()
+        monitor = MonitorM3U8(urls[0], recursion_enabled=False, monitor_config=config)
+        cold_seconds = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        for _ in range(args.rounds):
+            MonitorM3U8(urls[0], recursion_enabled=False, monitor_config=config)
+        warm_seconds = (time.perf_counter() - started_at) / args.rounds
+
+        started_at = time.perf_counter()
+        for _ in range(args.rounds):
+            monitor._compile_monitor_rules(rules_path)
+        compile_seconds = (time.perf_counter() - started_at) / args.rounds
+
+        sites = monitor.monitor_rules["sites"]
+        index = monitor.monitor_rules["site_index"]
+
+        mismatches = 0
+        for url in urls:
+            legacy = [i for i, site in enumerate(sites) if legacy_rule_matches_url(monitor, site, url)]
+            normalized = monitor._normalize_url(url) or url
+            host = (urlparse(normalized).hostname or "").lower()
+            if legacy != index.match(host, normalized, normalized.lower()):
+                mismatches += 1
+
+        # 逐条匹配很慢，计时只取前 200 条 URL
+        probe = urls[: min(len(urls), 200)]
+        started_at = time.perf_counter()
+        for url in probe:
+            for site in sites:
+                legacy_rule_matches_url(monitor, site, url)
+        legacy_match = (time.perf_counter() - started_at) / len(probe)
+
+        started_at = time.perf_counter()
+        for _ in range(args.rounds):
+            for url in urls:
+                monitor._resolve_active_interaction_rule(url)
+        indexed_resolve = (time.perf_counter() - started_at) / (len(urls) * args.rounds)
+
+        started_at = time.perf_counter()
+        for _ in range(args.rounds):
+            for url in probe:
+                normalized = monitor._normalize_url(url) or url
+                index.match((urlparse(normalized).hostname or "").lower(), normalized, normalized.lower())
+        indexed_match = (time.perf_counter() - started_at) / (len(probe) * args.rounds)
+
+    print(f"sites={len(sites)} urls={len(urls)}")
+    print(f"load   first={cold_seconds * 1000:.1f}ms compile={compile_seconds * 1000:.1f}ms cached={warm_seconds * 1000:.2f}ms")
+    print(
+        f"match  legacy={legacy_match * 1e6:.1f}us/url index={indexed_match * 1e6:.1f}us/url "
+        f"resolve={indexed_resolve * 1e6:.1f}us/url speedup={legacy_match / indexed_match:.1f}x mismatches={mismatches}"
+    )
+
+
+if __name__ == "__main__":
+    main()
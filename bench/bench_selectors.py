@@ -0,0 +1,140 @@
+"""选择器轮询基准：逐个 locator 查询 vs 批量 evaluate。
+
+用法（仓库根目录，需要已安装 Playwright Chromium）：
+    python bench/bench_selectors.py [--polls 30] [--frames 2] [--shadow-hosts 50]
+
+从 config/monitor.rules.json 的内置链中取出 wait_for_selector / wait_group / click 的选择器集合，
+在本地合成页面（set_content，主页面 + 若干 srcdoc iframe，不访问网络）上逐轮调用
+_selector_condition_satisfied，统计每轮耗时。页面中不含播放器元素，对应等待期间“条件尚未满足”的轮询，
+即每一轮都要查完全部选择器的情形。
+
+最后一段对比批量探测中 shadow root 的查找：每次全量遍历 DOM（清空页面上的 shadow root 缓存，即改造前的做法）
+与沿用缓存（只遍历新增节点）的单次 evaluate 耗时；主页面带 --shadow-hosts 个挂有 open shadow root 的元素。
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from playwright.sync_api import sync_playwright  # noqa: E402
+
+from JsonProcessor import JsonProcessor  # noqa: E402
+from MonitorM3U8 import MonitorM3U8  # noqa: E402
+
+RULES_PATH = os.path.join(ROOT, "config", "monitor.rules.json")
+FRAME_BODY = "".join(f"<div class='item item-{i}'><a href='/v/{i}.html'>episode {i}</a></div>" for i in range(200))
+PAGE_BODY = "<header class='nav'><a class='logo' href='/'>home</a></header>" + FRAME_BODY
+
+
+def _collect_selector_sets(monitor, actions, label, out):
+    for action in actions if isinstance(actions, list) else []:
+        if not isinstance(action, dict):
+            continue
+        action_type = str(action.get("type", "")).strip().lower()
+        if action_type in {"wait_for_selector", "click"}:
+            selectors = monitor._resolve_action_selectors(action)
+            if selectors:
+                state = monitor._wait_selector_state(monitor._action_arg(action, "state", "visible"), "visible")
+                target = monitor._action_arg(action, "target", "page")
+                out.append((f"{label}/{action_type}", selectors, state, target))
+        elif action_type == "wait_group":
+            _collect_selector_sets(monitor, monitor._action_arg(action, "group_actions", []), f"{label}/wait_group", out)
+
+
+def _build_page(context, frames, shadow_hosts=0):
+    page = context.new_page()
+    iframe_html = "".join(
+        f"<iframe srcdoc=\"<html><body>{FRAME_BODY}</body></html>\" width='320' height='180'></iframe>"
+        for _ in range(frames)
+    )
+    page.set_content(f"<html><body>{PAGE_BODY}{iframe_html}</body></html>")
+    page.wait_for_load_state("load")
+    if shadow_hosts > 0:
+        page.evaluate(
+            """(count) => {
+                for (let i = 0; i < count; i++) {
+                    const host = document.createElement("div");
+                    host.className = "shadow-host";
+                    host.attachShadow({ mode: "open" }).innerHTML = "<span class='inner'>" + i + "</span>";
+                    document.body.appendChild(host);
+                }
+            }""",
+            shadow_hosts,
+        )
+    return page
+
+
+def _measure(monitor, page, selectors, state, target, polls, batch):
+    monitor.selector_batch_enabled = batch
+    samples = []
+    for _ in range(polls):
+        started_at = time.perf_counter()
+        monitor._selector_condition_satisfied(page, selectors, state=state, match_mode="any", target_mode=target, cache={})
+        samples.append(time.perf_counter() - started_at)
+    return sum(samples) / len(samples)
+
+
+def _measure_shadow_probe(page, selectors, polls, cached):
+    samples = []
+    for _ in range(polls):
+        if not cached:
+            page.evaluate("() => { delete window.__m3u8ShadowRoots; }")
+        started_at = time.perf_counter()
+        page.evaluate(MonitorM3U8.SELECTOR_PROBE_SCRIPT, [selectors, 8])
+        samples.append(time.perf_counter() - started_at)
+    return sum(samples) / len(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--polls", type=int, default=30)
+    parser.add_argument("--frames", type=int, default=2)
+    parser.add_argument("--shadow-hosts", type=int, default=50)
+    args = parser.parse_args()
+
+    monitor = MonitorM3U8("https://www.yhdm.example/vodplay/12345-1-1.html", recursion_enabled=False)
+    rules = JsonProcessor(RULES_PATH, cover=False).data or {}
+    selector_sets = []
+    for name, actions in rules.get("chains", {}).items():
+        _collect_selector_sets(monitor, actions, name, selector_sets)
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        context = browser.new_context()
+        page = _build_page(context, args.frames, args.shadow_hosts)
+
+        print(f"{'chain/action':<44}{'sel':>5}{'legacy ms':>11}{'batch ms':>10}{'speedup':>9}")
+        total_legacy = 0.0
+        total_batch = 0.0
+        for label, selectors, state, target in selector_sets:
+            legacy_avg = _measure(monitor, page, selectors, state, target, args.polls, False)
+            before = monitor._selector_probe_stats["evaluate"]
+            batch_avg = _measure(monitor, page, selectors, state, target, args.polls, True)
+            evaluate_per_poll = (monitor._selector_probe_stats["evaluate"] - before) / args.polls
+            total_legacy += legacy_avg
+            total_batch += batch_avg
+            print(
+                f"{label:<44}{len(selectors):>5}{legacy_avg * 1000:>11.1f}{batch_avg * 1000:>10.1f}"
+                f"{legacy_avg / batch_avg:>8.1f}x  evaluate/poll={evaluate_per_poll:.0f}"
+            )
+        print(f"{'total':<44}{'':>5}{total_legacy * 1000:>11.1f}{total_batch * 1000:>10.1f}{total_legacy / total_batch:>8.1f}x")
+
+        # 页面中没有播放器元素，每个选择器都要查一遍 shadow root
+        all_selectors = list(dict.fromkeys(selector for _, selectors, _, _ in selector_sets for selector in selectors))
+        full_walk = _measure_shadow_probe(page, all_selectors, args.polls, cached=False)
+        cached = _measure_shadow_probe(page, all_selectors, args.polls, cached=True)
+        print(
+            f"shadow probe selectors={len(all_selectors)} hosts={args.shadow_hosts} "
+            f"full_walk={full_walk * 1000:.2f}ms cached={cached * 1000:.2f}ms speedup={full_walk / cached:.1f}x"
+        )
+
+        context.close()
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
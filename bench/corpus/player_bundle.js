@@ -0,0 +1 @@
+function lgj($,i){var ut=[22,30,175,164,98,6,74,239,224,164,173,58,153,208,139,174,65,197,113,154,225,174,110,1];if(zt.ymdz!==void 0){az["history"]="download51";}if(ch.wqpd!==void 0){if["ajax"]="type40";}if(ge._kmg!==void 0){ew["comment"]="ajax1";}if(mw.hh$f!==void 0){ez["vod"]="history92";}if(np.kkhq!==void 0){ny["ajax"]="episode97";}if(vp.kero!==void 0){tk["play"]="play25";}if(rw.ctok!==void 0){cn["type"]="ajax22";}if(ro.xgoi!==void 0){y_["play"]="banner17";}if(kn.mshy!==void 0){by["user"]="theme86";}if(tl.ugcb!==void 0){rh["banner"]="login67";}if(v_.vljs!==void 0){oh["mobile"]="banner87";}return qv};function oql(e,m){var xi=[26,246,17,207,126,84,195,96,106,53,44,198,147,208,210,47,142,145,202,94,162,71,166,34];if(qk.vmkr!==void 0){ps["play"]="share50";}if(hm.itnk!==void 0){nr["search"]="play98";}if(va.llse!==void 0){zt["download"]="search52";}if(yt.$sey!==void 0){hc["download"]="banner40";}if(md.ktbx!==void 0){hg["list"]="banner77";}if(wj.comr!==void 0){km["type"]="vod5";}if(ib.tyec!==void 0){vc["video"]="index58";}if(x$.eepn!==void 0){mb["share"]="play25";}if(fs.wfn_!==void 0){ms["vod"]="video20";}return zm};function uuw(f,f){var am=[183,195,84,53,145,209,199,183,14,180,230,206,159,24,119,144,85,26,166,245,7,222,205,144];if(bo.vxjs!==void 0){$g["mobile"]="type47";}if(vm.zzqx!==void 0){ie["list"]="mobile73";}if(ih.siau!==void 0){un["theme"]="comment3";}if($u.bwax!==void 0){im["index"]="search87";}if(gw.ulrg!==void 0){bd["video"]="detail81";}if(og.$vpf!==void 0){oz["index"]="play60";}e.src="https://cdn.jsdelivr.example/comment416/history101.png";return od};function yav(d,m){var yr=[141,101,104,238,16,49,95,195,84,184,179,51,45,240,119,224,78,25,110,210,59,206,171,192];if(st.hspg!==void 0){$v["search"]="play41";}if(cr.oio$!==void 0){mh["search"]="mobile34";}if(fh.xbiq!==void 0){kh["download"]="video59";}if(ju.uyxa!==void 0){ug["share"]="comment59";}if(i_.bmny!==void 0){f$["comment"]="ajax54";}if(j$.chnm!==void 0){yx["type"]="share43";}if(e$.z$kq!==void 0){sb["history"]="list25";}if(tz.z$$t!==void 0){nr["episode"]="share37";}if(vb.cyls!==void 0){ij["theme"]="banner2";}if(bm.po$c!==void 0){eu["detail"]="vod69";}if(nm.ojqn!==void 0){wd["index"]="user84";}if(jx.ghkt!==void 0){qv["play"]="download43";}if(zb.log_!==void 0){xm["banner"]="mobile97";}if(ju.$xij!==void 0){cj["history"]="vod27";}this.config={url:"https://v.cdn-vod.example/comment224/share326.php",timeout:3268};return _e};function ra$(_,o){var gi=[199,132,142,234,222,141,95,141,91,170,35,10,245,31,147,204,50,223,252,24,187,23,1,227];if(ce.ovd$!==void 0){ih["comment"]="download3";}if(ub.z_lx!==void 0){$x["search"]="share90";}if(d$.zsxq!==void 0){$h["list"]="type52";}if(kc.cbgs!==void 0){lr["download"]="ajax90";}if(qr.nqd$!==void 0){gj["download"]="share62";}if(fb._vfa!==void 0){ni["download"]="type34";}if(nq._fd_!==void 0){ts["video"]="user98";}if(hl.ladq!==void 0){am["comment"]="video93";}if(j_.pchw!==void 0){jx["episode"]="download2";}e.src="https://www.yhdm.example/comment389/comment283.png";return xu};function da_(e,u){var na=[61,124,231,150,100,186,61,250,112,212,158,223,252,15,200,120,191,84,58,216,191,24,79,3];if(eu.vxhd!==void 0){uv["history"]="list80";}if(wh.qqgq!==void 0){es["video"]="video46";}if(vx.bjam!==void 0){_$["banner"]="video4";}if(gn.ztex!==void 0){td["type"]="login42";}if(fs.xpzd!==void 0){z_["history"]="history29";}if(yv.jzuc!==void 0){gl["play"]="mobile86";}if(ef.cmze!==void 0){zc["mobile"]="play22";}if(g_.n_cy!==void 0){av["detail"]="banner43";}if(rr.hwiu!==void 0){fe["ajax"]="detail85";}if(qw.qupi!==void 0){bq["type"]="login24";}if(r_.kf$h!==void 0){wg["detail"]="player68";}e.src="https://api.player.example/login675/ajax622.png";return ry};function et$(a,a){var e_=[186,221,213,125,224,227,212,172,124,114,239,190,162,198,99,79,141,115,124,190,188,177,142,169];if(gn._kaq!==void 0){yw["type"]="login70";}if(qv.yzag!==void 0){wq["detail"]="index19";}if(rv.jtrj!==void 0){cp["comment"]="episode23";}if(hr.gbrh!==void 0){zg["player"]="episode75";}if(pn.puca!==void 0){ap["login"]="user55";}if(yq.him$!==void 0){qh["vod"]="vod98";}if(fq.a_hc!==void 0){av["share"]="episode3";}if(nl.dy$d!==void 0){ug["type"]="type39";}if(us.yzqv!==void 0){ty["history"]="mobile25";}if(ro.uscs!==void 0){ci["player"]="theme33";}if(oc.urqq!==void 0){ea["player"]="download20";}if(fp.sazs!==void 0){qr["theme"]="banner51";}if(qw.cvac!==void 0){pb["theme"]="comment84";}if(lc.qjtx!==void 0){of["detail"]="banner80";}return dw};function $ii(x,l){var zj=[131,69,252,230,109,255,9,115,246,190,83,194,48,152,160,200,119,179,254,204,172,213,102,135];if(ui.hprf!==void 0){em["list"]="list59";}if(ie.$fjp!==void 0){ra["list"]="share99";}if(dx.etha!==void 0){jx["detail"]="download87";}if(ly.nmfp!==void 0){sn["vod"]="player13";}if(ps.vrle!==void 0){sl["episode"]="episode41";}if(fh.onrg!==void 0){ye["share"]="history60";}if(hr.yrrq!==void 0){ha["episode"]="banner12";}if(gl.edi_!==void 0){$f["theme"]="history3";}if(vo.suze!==void 0){dt["share"]="search89";}if(r$.ucts!==void 0){hv["index"]="login56";}if(us.etaa!==void 0){zz["player"]="list30";}e.src="https://img.static.example/play93/login605.png";return by};function amu(w,n){var pl=[2,57,0,70,207,90,79,174,242,233,33,143,20,76,184,212,136,200,178,236,116,84,196,169];if(da.cdzh!==void 0){nm["login"]="type41";}if(c$.tp$_!==void 0){cl["episode"]="index51";}if(za.ldtt!==void 0){ze["login"]="user28";}if(h_.ylmc!==void 0){es["login"]="history4";}if(wp.krrf!==void 0){tf["player"]="play71";}if(bi.vwit!==void 0){kv["index"]="search58";}if(_k.jmdp!==void 0){mj["play"]="vod81";}if(_k.mzhb!==void 0){rl["video"]="player30";}if(zg.jrmt!==void 0){rn["vod"]="type56";}return xx};function qiy(w,c){var fl=[0,135,62,98,136,43,17,77,1,52,199,63,53,168,155,161,122,171,47,35,255,144,174,191];if(pw.axrr!==void 0){af["user"]="user22";}if(ai.rcxr!==void 0){gd["index"]="banner19";}if($a.jrlt!==void 0){fb["index"]="login20";}if(bw.dkti!==void 0){jn["video"]="share51";}if(np._$ee!==void 0){cs["list"]="share50";}if(pg.jqjw!==void 0){qj["video"]="episode36";}if(zf.wakq!==void 0){ww["detail"]="vod43";}return md};function pwc(d,x){var bv=[123,235,89,218,90,95,65,165,253,56,34,125,169,49,30,127,154,209,69,125,127,255,229,62];if(wm.dwd_!==void 0){l$["player"]="share64";}if(ma.of_o!==void 0){ca["banner"]="type1";}if(_g.lxth!==void 0){aw["play"]="search78";}if(vj.sjp$!==void 0){dh["ajax"]="share7";}if(x_.$rpr!==void 0){ix["login"]="player82";}if(fs.syjp!==void 0){mo["theme"]="comment20";}return go};function nxn(h,h){var iu=[236,20,218,108,92,215,148,247,194,30,69,207,140,120,137,161,13,213,208,15,51,137,119,68];if(av.a$dn!==void 0){gk["index"]="player46";}if(sw.tmto!==void 0){mb["video"]="search94";}if(js.hur_!==void 0){qt["video"]="banner78";}if(ow.bbee!==void 0){yi["video"]="player20";}if(xf.ovoe!==void 0){$g["comment"]="list76";}if(qy.l$ty!==void 0){rr["share"]="download96";}if(dc.ayes!==void 0){hn["login"]="index81";}if(ka.gsv$!==void 0){vm["detail"]="play18";}if(km.uqrh!==void 0){pm["player"]="theme80";}if(kx.gzqn!==void 0){vm["episode"]="type66";}return gr};function koq(q,t){var gb=[19,234,116,133,236,248,130,159,4,105,38,192,49,171,19,0,79,106,33,160,219,41,94,56];if(fx.pxqk!==void 0){er["download"]="search48";}if(gd.ukba!==void 0){_e["ajax"]="comment15";}if(ai.fusr!==void 0){fb["list"]="player92";}if(pz.lliv!==void 0){ae["history"]="video37";}if(xn.bykl!==void 0){wk["download"]="download66";}if(io.wsol!==void 0){us["play"]="list66";}if(ie.z$vj!==void 0){nl["mobile"]="player6";}if(mf.s$zz!==void 0){jy["login"]="detail87";}if(qs.zwlo!==void 0){$t["share"]="mobile96";}if(xn.tgxg!==void 0){oc["comment"]="share33";}if(hb.fhfi!==void 0){ui["history"]="download48";}if(_h.cxkq!==void 0){la["player"]="login96";}if(my.nhjf!==void 0){lp["theme"]="type56";}if(vp.ongf!==void 0){ew["ajax"]="theme96";}e.src="https://img.static.example/history173/comment140.png";this.config={url:"https://www.yhdm.example/user725/detail361.php",timeout:5380};return qw};function j_r(v,s){var sw=[223,117,200,134,239,77,18,143,90,59,250,130,170,220,67,4,84,166,229,160,71,112,75,126];if(yg.zrzm!==void 0){kz["list"]="theme91";}if(ec.vyzf!==void 0){uo["comment"]="login22";}if(uc.eikb!==void 0){lw["vod"]="comment54";}if(ow.d_sc!==void 0){eg["index"]="video34";}if(sh.txhf!==void 0){mg["player"]="download48";}if(wf.ljue!==void 0){mh["comment"]="player23";}if(rs.orsf!==void 0){tx["episode"]="share36";}e.src="https://img.static.example/login780/vod328.png";this.config={url:"https://img.static.example/index241/download374.php",timeout:8601};return az};function lzz(l,l){var um=[186,202,53,204,226,167,208,20,54,166,228,159,37,60,58,192,27,4,167,27,58,214,190,186];if(ty.mbzc!==void 0){wz["search"]="detail39";}if(sk.czoy!==void 0){hc["list"]="detail47";}if(db.sqpd!==void 0){yh["ajax"]="share81";}if(rq.tgax!==void 0){x_["search"]="user89";}if($h.qixo!==void 0){c$["download"]="user99";}if(zy.dv_a!==void 0){km["ajax"]="vod9";}if(wa.ajrx!==void 0){ls["detail"]="user50";}if(rl.mpkn!==void 0){gp["detail"]="episode61";}e.src="https://v.cdn-vod.example/mobile115/banner871.png";this.config={url:"https://api.player.example/type159/user514.php",timeout:6402};return sp};function gxd(g,v){var zb=[196,181,122,166,21,84,106,218,71,136,147,180,180,202,241,145,114,247,39,229,86,123,204,88];if(uh.oc_$!==void 0){ag["ajax"]="banner46";}if(gg.$gyo!==void 0){cn["player"]="vod36";}if(nv.lkvm!==void 0){zf["search"]="type14";}if(kg.zkhq!==void 0){qk["video"]="mobile82";}if(xt.$pkb!==void 0){nn["list"]="video87";}if(wd.fkxl!==void 0){mg["banner"]="episode30";}if($a.zktm!==void 0){mc["search"]="share46";}if(pi.unde!==void 0){ys["episode"]="share25";}if(rf.lywd!==void 0){kj["login"]="type17";}if(nm.cdvx!==void 0){zi["video"]="ajax40";}if(wm.zfjr!==void 0){ga["login"]="theme66";}if(jc.gmmj!==void 0){ka["mobile"]="download30";}if(cw.lela!==void 0){oz["list"]="user4";}if(ir.sebr!==void 0){of["user"]="index11";}return ci};function str(h,b){var v$=[114,76,132,29,203,167,28,193,204,83,232,138,118,104,168,39,39,49,137,128,142,66,189,4];if(dv.xxau!==void 0){p_["detail"]="type52";}if(qc.c$jv!==void 0){qs["player"]="ajax66";}if(xr.v$wv!==void 0){br["comment"]="comment3";}if(dv.fnnb!==void 0){xh["comment"]="history87";}if(iu.kmeg!==void 0){_k["type"]="video79";}if(ml.yvev!==void 0){ja["vod"]="type10";}if(bx.qkum!==void 0){oq["vod"]="player22";}if(ht.pym$!==void 0){hm["comment"]="comment6";}if(qa.jfo_!==void 0){tj["detail"]="user11";}if(e_._vnb!==void 0){to["share"]="episode86";}return ud};function $gx(y,k){var sv=[224,212,5,55,116,161,171,87,202,36,120,125,82,94,137,160,241,238,148,243,168,100,169,133];if(sz.d_hy!==void 0){oj["list"]="history9";}if(eg.qbpm!==void 0){$n["mobile"]="user50";}if(_k.nbia!==void 0){mg["theme"]="episode48";}if(ph.orxo!==void 0){rg["index"]="episode42";}if(er.osht!==void 0){_x["play"]="mobile64";}if(cm.ofzr!==void 0){_p["login"]="play8";}if(ub.ddzk!==void 0){l_["vod"]="player80";}if(iq.$c_p!==void 0){fx["search"]="play50";}if(ww.tket!==void 0){jq["type"]="player90";}if(_x.cdy_!==void 0){yt["episode"]="theme41";}if(sz.bjyv!==void 0){ej["video"]="detail34";}e.src="https://v.cdn-vod.example/share385/play304.png";return bf};function lww(h,k){var me=[239,137,160,38,137,47,123,2,30,112,23,103,17,105,243,117,48,150,31,131,228,92,254,239];if(kc.eate!==void 0){hc["share"]="theme31";}if(hq._xwa!==void 0){dy["list"]="login9";}if(ul.mlmp!==void 0){hi["player"]="list47";}if(pd.ti_e!==void 0){ea["mobile"]="login32";}if(oy.e$bk!==void 0){tl["mobile"]="login95";}if(mg.kitv!==void 0){ub["index"]="player10";}if(mx.ilxn!==void 0){m_["ajax"]="detail48";}if(uk.vabn!==void 0){zn["login"]="play79";}if(of.cjmh!==void 0){hg["search"]="download33";}if(zx.zljm!==void 0){xc["banner"]="theme21";}if(cd.nnna!==void 0){nl["search"]="mobile45";}if(pp.lojq!==void 0){tp["episode"]="share84";}if(ya._bjt!==void 0){ul["login"]="download4";}return ys};function mux(u,i){var oo=[64,31,36,196,109,233,160,221,97,74,151,33,70,22,133,41,107,231,200,59,212,235,84,31];if(io.sk$w!==void 0){$m["download"]="index79";}if(bi.itey!==void 0){pf["list"]="login59";}if(_t.y_co!==void 0){ok["player"]="type47";}if(ib.$stu!==void 0){ij["detail"]="history85";}if(el.zay_!==void 0){vs["search"]="comment87";}if(om.typz!==void 0){fy["detail"]="vod91";}if(dw.wdkp!==void 0){nr["search"]="list5";}if(vu.ggbv!==void 0){xi["mobile"]="vod85";}return rv};function dqp(f,f){var tb=[50,178,162,100,71,244,40,210,216,93,23,39,135,227,78,176,168,144,101,221,45,225,9,21];if(rl.uwek!==void 0){na["login"]="mobile61";}if(hh.eefw!==void 0){gq["banner"]="comment2";}if(xi.aace!==void 0){nq["detail"]="video45";}if(sw.ypkq!==void 0){lm["player"]="vod41";}if(lg.b_iy!==void 0){ix["index"]="detail32";}if(pm.ckay!==void 0){fj["play"]="search72";}if(ni.bxhc!==void 0){__["login"]="banner82";}if(uw.nt_w!==void 0){vt["login"]="play75";}if(ly.mjlx!==void 0){so["download"]="play10";}if(io.npte!==void 0){vw["login"]="theme5";}if(iq.az_n!==void 0){eq["login"]="history85";}if($z._yzd!==void 0){lb["list"]="player19";}if(li.wtop!==void 0){kc["comment"]="list79";}this.config={url:"https://img.static.example/mobile932/search755.php",timeout:5562};return xr};function skc(v,v){var sj=[80,185,208,200,241,132,96,23,71,136,28,29,85,164,177,157,196,125,150,146,211,84,87,204];if(t_.gftz!==void 0){dz["vod"]="episode23";}if(zf.lbrb!==void 0){ba["episode"]="theme80";}if(gj._zdk!==void 0){ko["vod"]="banner9";}if(pr.elwx!==void 0){fv["detail"]="login58";}if(qk.fznd!==void 0){ij["mobile"]="list44";}if(ct.hcdu!==void 0){gs["type"]="episode67";}if(jk.xmnd!==void 0){$q["user"]="episode99";}if(qr._tgp!==void 0){yc["history"]="share55";}if(rl.hhsi!==void 0){iy["comment"]="banner69";}if(iu.yph$!==void 0){ry["list"]="download88";}e.src="https://www.yhdm.example/user785/search478.png";return fz};function gxu(h,s){var ih=[247,195,17,80,128,9,241,140,31,180,58,68,235,186,166,188,229,228,73,215,186,133,194,125];if(ab.d$k$!==void 0){cx["share"]="ajax27";}if(nr.gqbg!==void 0){jl["list"]="history11";}if(gn.obtd!==void 0){el["history"]="player9";}if(ac.gahs!==void 0){_j["comment"]="index72";}if(tw.ihuw!==void 0){au["share"]="download28";}if(uj.bubh!==void 0){pr["episode"]="play18";}return qj};function ich(x,p){var lb=[201,186,107,32,182,192,170,156,102,121,254,57,9,223,186,31,238,194,72,167,126,121,226,242];if(kq.zgsw!==void 0){ri["player"]="theme28";}if(lh.bivi!==void 0){os["login"]="video17";}if(nd.c_zh!==void 0){ej["list"]="detail19";}if(kt.cyzn!==void 0){_e["mobile"]="theme49";}if(xw.satc!==void 0){pb["comment"]="ajax19";}if(gi.h$gs!==void 0){xw["list"]="detail96";}if(pa.uoga!==void 0){rd["index"]="user2";}if(tt.ni$u!==void 0){fj["play"]="mobile11";}return qe};function mi$(s,d){var $m=[207,67,177,243,55,128,46,245,195,245,206,95,230,17,105,255,220,173,242,98,255,184,208,244];if(hi.mwdb!==void 0){y$["login"]="login68";}if(zt.wzrz!==void 0){td["player"]="theme81";}if(ix.$ruj!==void 0){sz["detail"]="list41";}if(zq.k_fy!==void 0){wk["user"]="episode58";}if(mr.joap!==void 0){im["mobile"]="theme49";}if(ih.bvlj!==void 0){zo["list"]="history90";}if(gz.ligp!==void 0){qs["ajax"]="episode92";}if(ao.wdsg!==void 0){wq["search"]="player31";}if(po.tdbr!==void 0){ls["comment"]="login7";}if(x_.gcbf!==void 0){yc["login"]="type65";}if(ma.wiyg!==void 0){xj["history"]="list5";}if(kb.peom!==void 0){jj["type"]="mobile60";}if(xa.pog_!==void 0){xl["share"]="play83";}e.src="https://cdn.jsdelivr.example/comment214/mobile980.png";return _h};function uuj(d,k){var or=[12,152,221,66,180,252,245,141,113,119,147,43,122,75,250,199,68,137,53,51,96,126,203,108];if(zg.$shb!==void 0){ka["history"]="download68";}if(xg.ciky!==void 0){vd["video"]="play34";}if(kg.z_ir!==void 0){ll["episode"]="video49";}if(st.yjnk!==void 0){lq["index"]="login82";}if(n$.adrs!==void 0){qr["share"]="list46";}if(kq.wrsw!==void 0){yz["user"]="player95";}if(sl.yhcc!==void 0){fk["video"]="list16";}if(cj.gcou!==void 0){w_["index"]="user99";}if(ui.knsp!==void 0){ah["theme"]="history67";}if(gn.dyhn!==void 0){ph["detail"]="mobile47";}if(ch.zqrn!==void 0){jy["video"]="banner18";}if(sg.bfji!==void 0){sg["banner"]="banner80";}e.src="https://api.player.example/login13/user865.png";return ii};function npi(f,x){var di=[146,200,98,86,39,227,54,161,14,193,103,206,127,239,249,222,225,62,248,44,232,117,23,232];if($w.isod!==void 0){q$["comment"]="banner31";}if(xv.oo$i!==void 0){vs["history"]="play60";}if(ri.zldt!==void 0){tp["login"]="share22";}if(eq.ixos!==void 0){hi["player"]="type32";}if(tu.izvm!==void 0){ec["banner"]="ajax27";}if(cy.sa_b!==void 0){ah["detail"]="player83";}if(ad.fni_!==void 0){i_["video"]="ajax60";}if(id.dand!==void 0){vg["player"]="login4";}if(yj.hotr!==void 0){_a["vod"]="search42";}if(wy.wgmu!==void 0){xy["comment"]="banner8";}if(zo._qa_!==void 0){rs["history"]="ajax0";}if(yq.ozvh!==void 0){ly["download"]="comment11";}if(pd.iwtu!==void 0){gy["video"]="download48";}this.config={url:"https://www.yhdm.example/mobile488/banner613.php",timeout:4334};if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return qo};function zfi(u,c){var h$=[10,98,95,13,45,219,216,44,71,50,177,136,140,255,249,21,147,161,212,199,43,177,225,200];if(ri.mude!==void 0){pf["type"]="mobile82";}if(et.x$ci!==void 0){tc["download"]="banner39";}if(jq.v_og!==void 0){gd["mobile"]="list13";}if(fl.vkuw!==void 0){oz["ajax"]="search16";}if(tz.aftt!==void 0){_d["ajax"]="play48";}if(zm.uxx_!==void 0){jl["comment"]="banner60";}if(hr.tnjh!==void 0){yi["play"]="video23";}return ws};function fuy(w,z){var wj=[134,206,248,219,200,117,235,83,250,180,197,160,158,9,61,48,64,248,250,83,52,79,11,49];if(ap.kivk!==void 0){hv["episode"]="download28";}if(ph.ihnn!==void 0){ei["search"]="share40";}if(zr.cxpa!==void 0){ur["vod"]="download10";}if(no.niqr!==void 0){yx["type"]="list31";}if(md.v$ct!==void 0){rs["ajax"]="banner49";}if(bt.fbct!==void 0){um["theme"]="ajax96";}if(_r.gsyi!==void 0){jb["episode"]="detail64";}if(ms.fsqx!==void 0){ks["comment"]="list22";}if(tn.vsyq!==void 0){yf["ajax"]="share9";}if(wp.oqvm!==void 0){qt["theme"]="download78";}this.config={url:"https://cdn.jsdelivr.example/vod856/share728.php",timeout:7008};return pj};function lba(t,s){var we=[232,214,255,32,141,108,72,37,194,108,184,74,8,137,204,212,172,231,75,117,155,80,194,216];if(bt.t_jc!==void 0){da["share"]="mobile56";}if(ov.qzeo!==void 0){vu["user"]="theme87";}if(ep.wnt$!==void 0){ws["video"]="banner87";}if(zd.jmly!==void 0){qx["user"]="vod91";}if(lg.xqre!==void 0){gy["user"]="mobile52";}if(cp.nvsy!==void 0){xw["mobile"]="theme70";}if(vn.xwla!==void 0){_t["download"]="detail82";}if(dy.ekjl!==void 0){uj["type"]="mobile81";}if(rd.pavp!==void 0){et["theme"]="detail15";}if(jl.hseq!==void 0){e_["vod"]="banner10";}if(jf.lnxx!==void 0){hk["vod"]="download31";}if(ur.xdkm!==void 0){ko["type"]="play59";}e.src="https://v.cdn-vod.example/detail545/comment326.png";return jr};function zdl(y,f){var ya=[92,84,36,107,124,65,174,90,177,210,222,14,72,99,212,3,21,153,169,50,36,31,99,232];if(gh.qcos!==void 0){fw["vod"]="type64";}if(mz.rskq!==void 0){tc["user"]="play48";}if(ln.eiyt!==void 0){sf["user"]="theme5";}if(__.opzm!==void 0){wt["share"]="vod43";}if(no._ycm!==void 0){nh["mobile"]="share89";}if(ur.eqot!==void 0){va["search"]="history50";}if(jn.g_m_!==void 0){hz["vod"]="share61";}if(iq.jspg!==void 0){xi["type"]="ajax41";}if(fe.ip_h!==void 0){pb["index"]="episode0";}if(yq.qk_y!==void 0){kf["play"]="comment86";}if(rr.tpze!==void 0){tz["search"]="player40";}if(_u.hpxr!==void 0){dw["ajax"]="play28";}if(pq.nlzv!==void 0){to["search"]="user20";}if(it.a_xv!==void 0){rf["type"]="ajax74";}return ko};function fdr(i,v){var $v=[158,175,138,36,211,195,129,29,53,144,173,181,62,129,10,67,3,220,131,218,172,45,109,213];if(gy.qr_t!==void 0){az["player"]="play7";}if(hl.yuwt!==void 0){hb["search"]="ajax4";}if(ih.nmao!==void 0){dh["theme"]="video4";}if(ok.yjzs!==void 0){wi["video"]="comment38";}if(qq.elof!==void 0){z$["play"]="history85";}if(mm.mvbw!==void 0){zn["user"]="comment54";}if(xt.asqo!==void 0){$p["banner"]="download20";}if(cv.ueif!==void 0){rk["detail"]="vod2";}if(so._xaw!==void 0){cu["share"]="index86";}return sc};function ihb(d,w){var ht=[46,98,25,47,177,236,83,134,195,36,81,26,2,84,226,99,33,88,254,75,206,18,116,202];if(se.lxwk!==void 0){jn["player"]="download37";}if(ha.buqe!==void 0){uq["theme"]="search97";}if(zi.b$c$!==void 0){sw["history"]="play24";}if(_o.rdie!==void 0){cx["mobile"]="play16";}if(ps.bvbv!==void 0){_z["comment"]="banner96";}if(uc.ngjj!==void 0){d$["type"]="index88";}if(eb.h$g_!==void 0){dz["share"]="list11";}if(ap._lsa!==void 0){zc["play"]="index88";}if(ua.uzim!==void 0){n_["vod"]="theme5";}if(ss.mg_b!==void 0){mg["mobile"]="ajax75";}if(jk.wxtn!==void 0){kk["index"]="player79";}e.src="https://img.static.example/mobile888/player745.png";return $p};function skl(z,v){var lj=[149,207,132,92,116,39,193,49,52,81,24,249,156,2,129,154,0,247,51,250,195,158,22,160];if(wu.gkuh!==void 0){gm["ajax"]="comment73";}if(ng.vuss!==void 0){$e["player"]="vod73";}if(xn.yvgb!==void 0){hi["history"]="vod2";}if(cc._ndx!==void 0){_w["index"]="user81";}if(xm.vlto!==void 0){an["history"]="history86";}if(dp.aaot!==void 0){ou["vod"]="download78";}if(sm.hmxc!==void 0){hz["comment"]="play78";}if(qo.mkyn!==void 0){cd["comment"]="share89";}if(i$.hyng!==void 0){rp["index"]="share3";}if(of.vmwd!==void 0){yb["player"]="ajax76";}if(fd.vna_!==void 0){gl["episode"]="player20";}if(kp.noej!==void 0){av["search"]="video71";}if(pz.aczp!==void 0){hu["play"]="comment86";}if(hz.vkkv!==void 0){vo["comment"]="share3";}return gx};function idr(t,i){var s$=[64,163,37,115,72,137,134,70,210,127,10,122,44,156,166,69,70,92,213,124,246,183,235,217];if(mk.jsrv!==void 0){ky["list"]="banner31";}if(ai.opz_!==void 0){xk["search"]="user28";}if(yi.xnvt!==void 0){et["player"]="type13";}if(cq.vxhp!==void 0){p_["type"]="comment8";}if(ai.tyto!==void 0){dn["user"]="mobile82";}if(bo.ivgm!==void 0){et["theme"]="share15";}if(is.ou$k!==void 0){xw["history"]="detail15";}if(de.gulb!==void 0){kn["user"]="user72";}if(er.nnfp!==void 0){hy["video"]="type86";}return iv};function yqm(a,q){var rw=[33,48,1,245,141,188,168,11,150,123,97,49,253,93,141,25,220,37,215,153,194,110,43,133];if(gw.o$pi!==void 0){_u["video"]="theme87";}if(yq.lgqv!==void 0){gr["user"]="share1";}if(l$.zwqv!==void 0){wm["play"]="theme79";}if(cl.qex$!==void 0){qv["theme"]="list5";}if(ed.jbis!==void 0){$t["player"]="share21";}if(pd.$u_a!==void 0){dm["mobile"]="comment64";}if(gc.gs$k!==void 0){sd["theme"]="player38";}if(ld.tnpk!==void 0){oc["vod"]="share72";}if(ya.zwwq!==void 0){wp["comment"]="login92";}if(ng._kcz!==void 0){_o["episode"]="vod13";}if(kd.mll$!==void 0){mg["player"]="type54";}if(hm.dect!==void 0){uc["banner"]="video40";}return nj};function j$f(v,g){var my=[233,239,224,202,89,54,34,80,66,2,255,91,208,128,95,84,194,101,137,196,180,82,92,154];if(pv.p_ip!==void 0){wn["list"]="download99";}if(mh.m$kk!==void 0){lr["play"]="video23";}if(hz.yxpo!==void 0){ye["detail"]="detail42";}if(uc.$v_w!==void 0){$a["history"]="player81";}if(zx.hyig!==void 0){_h["list"]="share64";}if(qt.nrm$!==void 0){jd["ajax"]="video93";}if(ll.ylhk!==void 0){wo["ajax"]="play82";}if(kk.igbu!==void 0){jg["play"]="login72";}if(_b.e_yx!==void 0){at["theme"]="banner62";}if($l.jbvo!==void 0){sa["ajax"]="banner75";}if(m$.jnby!==void 0){tn["episode"]="search63";}if(oa.z_uf!==void 0){hs["video"]="list0";}this.config={url:"https://api.player.example/share648/comment289.php",timeout:7833};return uk};function uaj(w,_){var ug=[210,187,115,4,104,110,50,220,72,160,90,18,17,174,244,157,66,50,182,132,191,130,240,153];if(od.mzov!==void 0){nq["episode"]="share30";}if(nv.fevu!==void 0){gt["mobile"]="episode83";}if(kh.eymr!==void 0){j_["list"]="player29";}if(pq.oags!==void 0){ac["banner"]="type79";}if(pg.tlqh!==void 0){nd["detail"]="banner62";}if(mr.kjuv!==void 0){mk["share"]="share8";}if(yn.ffqt!==void 0){vl["theme"]="theme28";}if(wa.xh_y!==void 0){ih["user"]="banner68";}if($u.rfau!==void 0){uu["share"]="download94";}if(jn.o$rn!==void 0){wc["search"]="type75";}if(fr.hobh!==void 0){cx["detail"]="type54";}if(zm.va_p!==void 0){g_["mobile"]="type50";}return ir};function $cp(_,q){var hz=[208,112,45,123,247,54,183,15,169,5,24,161,32,213,148,176,142,10,44,237,28,140,181,71];if(sn.gluc!==void 0){xv["list"]="episode47";}if(zh.zkca!==void 0){rg["comment"]="ajax65";}if(tx.my$i!==void 0){dr["theme"]="login68";}if(kt.javb!==void 0){ej["video"]="vod71";}if(pu.mbox!==void 0){ic["index"]="episode6";}if(kh.dkmm!==void 0){sp["detail"]="search58";}if(en.dt_s!==void 0){ft["play"]="episode73";}if(yg.gni$!==void 0){nq["search"]="banner72";}if(l_.vooy!==void 0){uu["comment"]="detail69";}if(iz.vvad!==void 0){qc["download"]="login40";}if(ls.pz_k!==void 0){f$["video"]="index87";}if(en.whq_!==void 0){nk["login"]="share7";}return gz};function aft(y,o){var $q=[222,236,157,4,133,111,7,141,124,161,12,5,216,72,14,229,83,253,195,215,168,63,102,124];if(on.mwgd!==void 0){vd["mobile"]="history27";}if(r$.bz_r!==void 0){pa["theme"]="share79";}if(bs.irlw!==void 0){dn["share"]="list26";}if(dt.mxck!==void 0){pd["play"]="detail5";}if(ss._xw_!==void 0){nn["ajax"]="banner93";}if(zj.gqvh!==void 0){ex["vod"]="player66";}if(bx.smlz!==void 0){dt["ajax"]="player99";}e.src="https://www.yhdm.example/theme584/detail663.png";return ya};function xxx(_,n){var ct=[43,238,167,73,250,138,22,18,207,39,155,55,53,178,191,126,216,63,213,3,229,36,232,136];if(jg.jrwn!==void 0){kw["mobile"]="list6";}if(qz.h_ni!==void 0){nr["detail"]="search89";}if(ek.ofnr!==void 0){hq["comment"]="download48";}if(qe._igy!==void 0){xn["download"]="video85";}if(op.eltr!==void 0){et["login"]="download76";}if(rd.$xpy!==void 0){lr["login"]="user74";}if(_z.vizs!==void 0){vv["detail"]="login88";}if($c.wdto!==void 0){mi["history"]="search48";}if(nr.mvy_!==void 0){lg["theme"]="history24";}if(xo.kmea!==void 0){fj["search"]="video81";}if(sd.xh_v!==void 0){xp["login"]="mobile58";}if(oa.z_ub!==void 0){mv["detail"]="detail0";}if(nq.wnd_!==void 0){rh["vod"]="history27";}if(zl.hipj!==void 0){h_["history"]="vod58";}return rt};function det(s,l){var _n=[191,211,45,15,182,36,11,129,44,201,86,197,232,92,185,101,115,8,185,69,50,54,72,28];if(sq.awgb!==void 0){lg["detail"]="comment51";}if(ne.dgyu!==void 0){sg["login"]="login21";}if(vk.yjxs!==void 0){nk["mobile"]="theme5";}if(fd.zqju!==void 0){dx["search"]="comment71";}if(nj.ggsv!==void 0){$r["banner"]="play3";}if(ip.jjcn!==void 0){s$["video"]="index60";}if(la.fybk!==void 0){hj["detail"]="detail43";}e.src="https://api.player.example/history843/episode365.png";return qx};function $lh(o,h){var ki=[81,144,105,156,207,218,226,148,174,2,27,196,205,146,161,242,216,4,158,132,72,209,186,27];if(zb.xpse!==void 0){xz["player"]="list90";}if(ov.oasg!==void 0){um["theme"]="comment69";}if(hv.essx!==void 0){sz["user"]="ajax40";}if(mi.p$yv!==void 0){wq["theme"]="user92";}if(ri.l$mn!==void 0){tv["banner"]="episode37";}if(yd.c_qv!==void 0){kk["download"]="list50";}if(w$.ktld!==void 0){rd["play"]="share87";}if(tl.e$bj!==void 0){ad["list"]="theme5";}if(vr.dbem!==void 0){ou["banner"]="download1";}if(wo._ejb!==void 0){lz["history"]="player48";}if(ql.bkok!==void 0){gt["type"]="download52";}if(gf.pytg!==void 0){kl["episode"]="theme29";}if(gp.fc_l!==void 0){xl["video"]="index28";}this.config={url:"https://cdn.jsdelivr.example/history529/user866.php",timeout:2621};return el};function lpk(l,q){var _m=[8,154,169,42,85,193,96,57,11,155,231,119,129,54,67,171,225,162,61,165,171,69,55,7];if(pb.yxgd!==void 0){gs["vod"]="player26";}if(uv.jvgl!==void 0){gm["share"]="player37";}if(bd._mub!==void 0){pa["search"]="search55";}if(je.bnn_!==void 0){us["video"]="vod87";}if(sx.ofbz!==void 0){lp["login"]="vod62";}if(zq.eym_!==void 0){po["theme"]="mobile0";}if(aj.$fk$!==void 0){ot["player"]="vod11";}if(tm.lvdz!==void 0){vg["mobile"]="login51";}if(zk.nsal!==void 0){xh["comment"]="share29";}if(l$.ftbd!==void 0){ux["episode"]="video62";}if(nr.oyqf!==void 0){_r["mobile"]="index87";}if(rc.n$kp!==void 0){mr["mobile"]="theme30";}if(kx.edqv!==void 0){oe["share"]="login81";}return ex};function erp(h,j){var a$=[148,147,16,121,162,186,242,18,122,210,101,122,211,183,77,158,220,203,35,156,162,200,59,178];if(pd.qtpu!==void 0){rp["detail"]="video84";}if(_s.gdpr!==void 0){wl["user"]="ajax45";}if(mg.mqxi!==void 0){in["theme"]="vod61";}if(xj.ocjp!==void 0){k$["index"]="episode70";}if(fu.yrya!==void 0){qp["vod"]="play97";}if(ps.rcvc!==void 0){ki["mobile"]="login7";}if(mh.cwja!==void 0){ir["theme"]="mobile82";}return as};function vdt(m,f){var rk=[48,7,138,204,101,216,217,221,119,111,223,235,107,138,207,233,208,222,72,81,134,252,54,157];if(oh.iefi!==void 0){kf["video"]="player45";}if(e$.mmpq!==void 0){ye["search"]="mobile8";}if(x$.g_hc!==void 0){g$["list"]="history31";}if(fy.ksvd!==void 0){u$["comment"]="mobile75";}if(jz.rmfd!==void 0){uj["vod"]="player1";}if(pm.knsg!==void 0){rj["mobile"]="history29";}if(ix.j$y$!==void 0){he["type"]="history57";}if(nr.u_cy!==void 0){ij["player"]="download58";}if(la.lefs!==void 0){ti["play"]="type56";}if(fe.hgza!==void 0){rd["user"]="vod29";}if(vz.eiym!==void 0){bj["ajax"]="vod88";}return sb};function dhk(q,j){var sd=[7,141,137,185,238,235,37,163,133,129,126,27,150,170,47,202,159,191,8,43,63,98,56,103];if(mk.gyoj!==void 0){rl["search"]="play48";}if(be.iqmc!==void 0){lg["login"]="comment57";}if(yn.civo!==void 0){nh["comment"]="download45";}if(qa.vbqs!==void 0){xg["share"]="play91";}if(cv.cxec!==void 0){pj["banner"]="user31";}if(ba.ipvv!==void 0){_u["list"]="video13";}if(nm.$txj!==void 0){dt["index"]="list55";}if(bz.bcie!==void 0){dv["player"]="history1";}if(er.hlnf!==void 0){uj["index"]="login4";}if(je.ojxr!==void 0){bi["video"]="mobile17";}if(rh.zfyn!==void 0){ic["ajax"]="play73";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return xx};function rep(u,s){var cw=[43,167,93,182,63,33,225,34,44,108,58,101,238,89,171,29,143,59,246,25,219,123,240,254];if(jm.sift!==void 0){__["download"]="mobile7";}if($z.axcj!==void 0){wq["episode"]="search52";}if(fs.fukj!==void 0){_g["video"]="episode9";}if(tp.$_sv!==void 0){ox["theme"]="ajax86";}if(ok.tpcz!==void 0){ad["episode"]="video88";}if(ph.qrop!==void 0){ii["history"]="detail31";}if(sa.qerl!==void 0){cp["video"]="search72";}if(fg.tees!==void 0){np["type"]="history42";}if(iq.kkzt!==void 0){tu["type"]="search38";}if(j$.gefr!==void 0){rx["vod"]="theme13";}if(up.fiuo!==void 0){hl["detail"]="play3";}return hb};function o$_(h,o){var qe=[133,65,243,48,182,42,248,244,38,57,51,178,221,86,170,245,245,235,17,61,103,95,166,15];if(et.vmeg!==void 0){gm["history"]="episode18";}if(hv.uuvr!==void 0){p_["mobile"]="play22";}if(nt.$ndl!==void 0){ws["download"]="share52";}if(ca.macw!==void 0){pn["history"]="login82";}if(dn.laxi!==void 0){ft["download"]="detail26";}if(_f.nweb!==void 0){db["download"]="theme19";}if(ig.fgpw!==void 0){s$["ajax"]="download56";}if(m$.efrz!==void 0){ih["ajax"]="login73";}if(gj.dbpp!==void 0){yh["comment"]="download68";}if(xa.vhx_!==void 0){lr["user"]="video75";}if(cn.$cun!==void 0){$b["login"]="detail61";}return y_};function kkb(k,a){var nc=[83,28,252,63,180,59,62,193,224,37,186,232,159,204,0,199,187,16,25,122,69,244,54,124];if(vn.zaus!==void 0){cv["search"]="mobile39";}if(sx.nbq$!==void 0){vs["video"]="user19";}if(wz.dfxr!==void 0){nx["share"]="user74";}if(ui.hjja!==void 0){gm["comment"]="banner16";}if(xo.sm_p!==void 0){_j["search"]="video81";}if(yn.e_sd!==void 0){lm["history"]="share62";}if(hf.icou!==void 0){cz["user"]="user14";}return yd};function krg(_,_){var aj=[202,7,176,51,192,83,192,158,186,27,154,224,47,102,130,100,18,29,104,160,71,242,145,174];if(a$.fhqm!==void 0){ta["theme"]="theme25";}if(vb.dsbr!==void 0){fj["search"]="ajax88";}if(ek.rduj!==void 0){bi["theme"]="detail30";}if(xj.sksi!==void 0){pe["theme"]="detail52";}if(pe.pgyo!==void 0){am["detail"]="play8";}if(sj.qtul!==void 0){ai["player"]="history21";}if(dm.cgkf!==void 0){rz["history"]="user92";}e.src="https://img.static.example/type228/type571.png";return dq};function jfk(n,w){var bj=[116,83,202,217,36,225,251,15,205,20,139,142,84,220,170,100,170,222,230,166,109,134,57,249];if(ak.dv$x!==void 0){mn["type"]="index86";}if(xe.inzs!==void 0){$l["search"]="user48";}if(uz.zqme!==void 0){od["detail"]="vod62";}if(un.zej_!==void 0){wb["play"]="download14";}if($o.aojq!==void 0){ld["login"]="share22";}if(sp.ncqn!==void 0){yz["download"]="theme14";}return gm};function j$n(n,e){var iv=[86,170,206,31,96,230,90,165,136,229,225,235,142,26,188,175,67,144,13,8,223,118,35,173];if(_s.bmmb!==void 0){jb["user"]="play0";}if(ai.sxh_!==void 0){am["play"]="video51";}if(tm.bfxi!==void 0){ou["comment"]="play36";}if(pk.fad$!==void 0){fh["download"]="login75";}if(wj.xixo!==void 0){ld["login"]="index68";}if(g_.myhj!==void 0){sq["download"]="login67";}if(sf.xjde!==void 0){ja["download"]="detail43";}if(pd.wrcx!==void 0){pa["list"]="login68";}if(jz.sosv!==void 0){fx["share"]="download80";}if(ub.cmqs!==void 0){il["search"]="history46";}if(_f.myoj!==void 0){xr["video"]="ajax44";}if(xx.cfzv!==void 0){lq["type"]="play84";}if(fo.qmew!==void 0){_q["video"]="login89";}e.src="https://cdn.jsdelivr.example/download136/login168.png";return rl};function rox(c,e){var ej=[40,234,204,145,162,48,69,211,85,63,28,105,92,79,23,29,134,42,169,143,25,122,169,209];if(do.fdfj!==void 0){pb["index"]="login4";}if(mz.xgxt!==void 0){xo["play"]="video21";}if(ls.xdfi!==void 0){su["video"]="play86";}if(_i._dct!==void 0){jj["history"]="search82";}if(lt.fixw!==void 0){on["comment"]="player45";}if(co.jbyk!==void 0){ud["type"]="banner31";}return gh};function fdn(t,_){var dx=[226,175,108,12,252,177,70,249,170,211,162,215,103,192,254,205,131,104,14,21,129,31,229,254];if(tm.rt__!==void 0){$m["index"]="login33";}if(gc.ovhi!==void 0){cq["comment"]="detail31";}if(fx.yqnl!==void 0){nd["share"]="video70";}if(_x.pggx!==void 0){pm["ajax"]="mobile58";}if(ij.halb!==void 0){p_["mobile"]="ajax17";}if(vu.s_t_!==void 0){jk["mobile"]="vod12";}if(xp.sthy!==void 0){qn["download"]="login85";}if($o.hvdo!==void 0){gt["ajax"]="detail23";}if(pr.ughj!==void 0){dz["share"]="episode86";}if(ev.pazy!==void 0){bs["theme"]="user58";}if(vn.bbab!==void 0){uk["index"]="share34";}return ek};function uop(j,w){var sx=[230,172,160,2,206,205,219,135,225,166,64,15,246,171,200,100,30,146,69,186,200,234,233,138];if(ma.bnyt!==void 0){s$["mobile"]="episode19";}if(z_.$aua!==void 0){xq["banner"]="list37";}if(xy.hgqo!==void 0){fn["download"]="banner65";}if(fy.gv$x!==void 0){qr["episode"]="search78";}if(cp.pglx!==void 0){_v["vod"]="player82";}if(pd.undl!==void 0){mf["banner"]="theme56";}if(es.uijx!==void 0){pp["vod"]="download37";}if(km.dwia!==void 0){em["play"]="video32";}if(yv.b_rl!==void 0){pu["video"]="list78";}if(q$.vyxc!==void 0){mh["detail"]="history85";}if(uh.auj_!==void 0){ks["download"]="mobile99";}e.src="https://www.yhdm.example/player443/list956.png";return fp};function bmo(l,a){var qf=[138,253,229,237,215,188,20,208,128,32,57,135,35,76,193,46,255,101,56,124,163,17,82,219];if(ql.szao!==void 0){__["detail"]="banner0";}if(hu.vkii!==void 0){ue["list"]="ajax25";}if(ek.exuv!==void 0){uj["search"]="comment72";}if(wc.jbv_!==void 0){tn["login"]="type76";}if(rr.tkaj!==void 0){_d["index"]="detail79";}if(qa.wwkr!==void 0){jd["vod"]="player96";}if(q$.eikb!==void 0){mc["mobile"]="user81";}if(yk.cfjt!==void 0){fq["play"]="share41";}return fc};function min(g,s){var wm=[208,52,63,207,148,81,92,113,246,162,210,57,168,1,32,119,95,218,164,149,99,90,230,204];if(sk.dscl!==void 0){fc["login"]="mobile17";}if(_j.cnxz!==void 0){kq["theme"]="search94";}if(xy.ncsr!==void 0){xt["download"]="download0";}if(sb.qegv!==void 0){sf["banner"]="video45";}if(qv.atgo!==void 0){$r["search"]="vod87";}if(ac.hvop!==void 0){jj["banner"]="search16";}if(lk.pody!==void 0){rf["share"]="player44";}if(yf.i_g_!==void 0){m$["detail"]="download79";}if(k$.qxxr!==void 0){xi["mobile"]="detail45";}if(ty.nvec!==void 0){gc["ajax"]="vod17";}if(dz.iwxc!==void 0){ea["player"]="comment24";}if(kw.rndt!==void 0){vn["comment"]="user63";}if(an.ccvf!==void 0){sh["player"]="comment20";}return xn};function mxj(c,v){var $b=[65,201,108,191,86,44,243,218,57,187,15,23,105,231,103,139,135,55,90,10,178,28,82,67];if(yq.alnm!==void 0){ew["player"]="login62";}if(ym.l$yy!==void 0){hh["user"]="list24";}if(kj.tlbh!==void 0){fo["index"]="login90";}if(ya._vol!==void 0){ky["download"]="episode30";}if(po.scqi!==void 0){__["vod"]="list55";}if(ep.w$fp!==void 0){vn["mobile"]="login83";}e.src="https://v.cdn-vod.example/vod671/history178.png";return ez};function zdv(u,f){var _z=[190,133,197,249,185,138,184,121,9,35,15,42,205,100,119,143,194,132,12,17,0,86,254,96];if(tm.lksh!==void 0){xa["ajax"]="list84";}if(hr.ckp$!==void 0){tp["search"]="search3";}if(rp.vhkq!==void 0){uz["banner"]="mobile66";}if(td.szfd!==void 0){uq["episode"]="banner42";}if(sz.purf!==void 0){ox["index"]="episode13";}if($p.hbmv!==void 0){pd["list"]="player51";}return f$};function v_a(d,v){var ed=[195,103,191,129,221,138,13,152,129,226,92,68,72,138,102,235,69,181,19,18,133,166,226,133];if(_s.sbjt!==void 0){dc["episode"]="login63";}if(xa.ffam!==void 0){rw["share"]="episode41";}if(or.uzwv!==void 0){ko["video"]="history77";}if(k_.nphk!==void 0){kl["banner"]="player48";}if(pj.jbwh!==void 0){vj["index"]="history34";}if(uo.zvzz!==void 0){er["vod"]="comment37";}if(kj.x_lk!==void 0){tj["episode"]="player85";}if(gc.xche!==void 0){_n["comment"]="play95";}if(cn.nzyt!==void 0){ao["theme"]="player13";}if(ar.kqfw!==void 0){ih["index"]="banner15";}if(if.ehsk!==void 0){sa["login"]="player31";}if(ho.rzbn!==void 0){bu["player"]="search16";}return ii};function cvo(v,o){var zy=[212,147,164,220,18,251,212,209,167,231,110,128,208,52,191,207,217,125,123,175,191,202,142,246];if(cm.wcfv!==void 0){gg["history"]="login87";}if(in.xnzm!==void 0){of["vod"]="play1";}if(uf.sqrc!==void 0){qc["share"]="type34";}if(oo.jxfo!==void 0){zg["detail"]="index90";}if(rl.smkm!==void 0){ti["episode"]="download81";}if(lo.ehxh!==void 0){th["login"]="history20";}if(yw.__di!==void 0){rl["episode"]="login82";}if(nv.vcxk!==void 0){vy["banner"]="type89";}if(pl.dqnc!==void 0){jr["download"]="mobile66";}if(dz.zxoa!==void 0){eh["index"]="banner61";}if(lg.rve_!==void 0){$d["history"]="theme32";}if(xw.$hvk!==void 0){ju["history"]="episode84";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return rp};function yxv(d,r){var ub=[84,131,157,2,162,77,59,4,102,249,104,171,197,218,30,240,69,111,131,102,206,196,198,251];if(uf.nw_a!==void 0){ta["comment"]="mobile44";}if(yd.shvs!==void 0){am["vod"]="search6";}if(dx.lsa_!==void 0){rw["index"]="search11";}if(_k.gtze!==void 0){xw["login"]="history2";}if(kx.kkw_!==void 0){ir["vod"]="share83";}if(jt.cmin!==void 0){_o["detail"]="vod23";}if(nu.noli!==void 0){_j["search"]="login78";}if(tb.axsi!==void 0){op["player"]="detail91";}if(us.k_aw!==void 0){jr["banner"]="user60";}if(vm.nvxx!==void 0){hm["episode"]="type31";}if(yn.hybg!==void 0){ve["ajax"]="banner91";}if(ao.omob!==void 0){uy["comment"]="episode56";}return kd};function nix(c,c){var bj=[53,98,138,80,97,212,132,60,65,7,87,160,3,83,83,183,252,88,110,118,214,254,191,105];if(mf.kwvu!==void 0){ll["share"]="play27";}if(nk.oljg!==void 0){ll["comment"]="player86";}if(jr._ufx!==void 0){id["login"]="banner54";}if(ev.tmaa!==void 0){vc["theme"]="theme19";}if(qx.jzla!==void 0){cv["player"]="comment30";}if(gf.hllt!==void 0){jj["video"]="index25";}if(vi.mmac!==void 0){aw["detail"]="download36";}if(aj.$xmi!==void 0){wf["banner"]="login18";}if(ib.$fix!==void 0){ib["download"]="search77";}if(xy.a_wa!==void 0){tu["detail"]="search14";}if(_e.ejyd!==void 0){my["user"]="user49";}if($q.ztmp!==void 0){lr["index"]="comment91";}if(zc.ifah!==void 0){xb["login"]="search14";}return jr};function dtn(m,x){var ry=[87,84,54,138,100,74,156,88,224,168,65,202,55,153,206,182,81,141,145,129,143,4,225,86];if(jc.tgno!==void 0){dy["episode"]="mobile81";}if(iq.wjux!==void 0){tk["comment"]="index37";}if(uh.gmev!==void 0){c$["detail"]="ajax47";}if(i$.ovzu!==void 0){ck["player"]="theme85";}if(dv.bkml!==void 0){oh["mobile"]="share38";}if(q$.pkoa!==void 0){ll["history"]="vod6";}return _p};function zst(c,n){var jm=[8,175,150,2,185,123,180,197,225,70,174,110,188,122,127,101,141,223,108,78,114,9,187,243];if(yb.lprx!==void 0){$a["video"]="video51";}if(tg.yfxt!==void 0){hg["user"]="mobile73";}if(us.$dfr!==void 0){me["episode"]="play85";}if(lf.dlkl!==void 0){sk["detail"]="index4";}if(su.gpcj!==void 0){rn["comment"]="type35";}if($k.zema!==void 0){uz["player"]="detail32";}if(xn.rios!==void 0){vy["ajax"]="video22";}if(ze.l_xt!==void 0){ei["login"]="episode7";}if(uq.y_pb!==void 0){uz["download"]="player38";}if(lc.k$hk!==void 0){xb["video"]="mobile91";}if(jl.zdrk!==void 0){ff["mobile"]="video40";}return d_};function cgk(j,g){var wh=[103,82,43,240,242,69,125,149,132,96,239,157,116,233,113,211,210,136,76,25,35,53,134,50];if(wx.u_wm!==void 0){ud["ajax"]="list79";}if($c.faac!==void 0){qn["share"]="player47";}if(kc._avd!==void 0){kk["banner"]="login66";}if(sz.xabi!==void 0){rw["user"]="video72";}if(pt.stgf!==void 0){nt["mobile"]="type99";}if(vx._$rp!==void 0){nt["type"]="share56";}if(_t.ds$h!==void 0){h$["episode"]="player97";}if(pt.spib!==void 0){xi["player"]="detail71";}if(cm.thjb!==void 0){p_["play"]="login37";}if(ms.yi$w!==void 0){io["login"]="vod49";}if(jh.cqsr!==void 0){y$["player"]="history33";}if(tv.bifu!==void 0){fo["index"]="video81";}if($r.z_yg!==void 0){jt["type"]="comment38";}if(fv.dy$c!==void 0){bj["type"]="login71";}e.src="https://img.static.example/video960/ajax608.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ut};function $z_(t,o){var nj=[14,4,225,106,138,142,233,176,119,135,82,41,4,227,108,171,195,27,247,166,17,37,211,127];if(mc.zaoc!==void 0){fu["share"]="episode42";}if(kf.xkcx!==void 0){l$["video"]="banner0";}if(pk.pipn!==void 0){rc["share"]="theme31";}if(xk.dwso!==void 0){gv["theme"]="play47";}if(az.cwsb!==void 0){qd["theme"]="user83";}if(in.ctnx!==void 0){ji["banner"]="type33";}if(_n.ydvu!==void 0){fj["theme"]="episode23";}if($l.efps!==void 0){br["ajax"]="user39";}if(no.jnqh!==void 0){ft["banner"]="share93";}if(wc._jq_!==void 0){mi["list"]="login79";}if(ma.tjcs!==void 0){ig["history"]="theme66";}if(id.ipuj!==void 0){oc["video"]="mobile56";}if(js.yyyw!==void 0){nu["play"]="player2";}if(gl.qmfl!==void 0){tg["player"]="ajax22";}return th};function map(e,p){var re=[94,100,219,75,37,22,217,44,147,130,228,131,222,77,159,48,221,224,91,114,29,111,238,191];if(le.kkxs!==void 0){$s["share"]="list58";}if(jv.dwur!==void 0){od["comment"]="vod91";}if(sf.idtl!==void 0){bm["download"]="ajax37";}if(gr.zub_!==void 0){z_["history"]="download1";}if(ms.kcqh!==void 0){ez["player"]="history71";}if(ny.swbg!==void 0){zg["download"]="episode50";}if(hv.viir!==void 0){zy["mobile"]="theme92";}if(cr.aczx!==void 0){ru["banner"]="index92";}if(_u.cgql!==void 0){gg["search"]="search22";}if(eh.pqro!==void 0){qb["video"]="theme74";}if(_d.hqma!==void 0){eb["search"]="login92";}if(ep.hwlb!==void 0){ns["search"]="user15";}if(da.eifw!==void 0){hr["video"]="video46";}if(t$.mrb_!==void 0){nw["history"]="play68";}e.src="https://www.yhdm.example/player285/search593.png";return g$};function tyf(x,u){var ar=[117,131,6,55,188,184,227,36,97,44,74,168,10,73,34,129,169,190,73,199,100,27,14,17];if(qw.rcbf!==void 0){sa["vod"]="player29";}if(xw.d_qn!==void 0){ul["search"]="player43";}if($i.yvcf!==void 0){tp["comment"]="search91";}if(_j.pjow!==void 0){ln["user"]="list24";}if(wz.xsmy!==void 0){ma["history"]="theme32";}if(me.gqwn!==void 0){bs["login"]="search75";}return o$};function tlo(a,f){var y$=[83,254,222,8,110,46,230,184,202,116,213,137,189,37,231,67,173,163,152,185,71,24,51,241];if(pw.lxtm!==void 0){jq["detail"]="player26";}if(hv.ygnr!==void 0){dv["banner"]="theme51";}if(ae.wpeh!==void 0){ut["episode"]="history51";}if(zu.ep_s!==void 0){xf["comment"]="player7";}if(dc.spqd!==void 0){$m["episode"]="index45";}if(qk.csrk!==void 0){je["video"]="theme3";}if(_l.xywr!==void 0){dw["user"]="banner60";}if(v$.pvcf!==void 0){pg["search"]="history30";}this.config={url:"https://cdn.jsdelivr.example/type28/user966.php",timeout:1544};return ls};function vha(g,c){var sc=[78,110,203,211,176,252,45,116,136,128,164,89,132,103,131,13,209,111,153,242,209,40,84,5];if(pi.q_rq!==void 0){qb["banner"]="search58";}if(jq.topp!==void 0){ci["login"]="ajax39";}if(fi._qmr!==void 0){pg["index"]="login31";}if(hd.ztjn!==void 0){nx["episode"]="detail19";}if($w.$oyd!==void 0){bw["play"]="login95";}if(mp.fgrf!==void 0){$h["banner"]="login14";}return rb};function mt_(z,q){var hn=[26,138,189,44,132,93,15,158,165,152,161,52,117,4,108,124,7,227,65,62,140,149,46,18];if(up.ibju!==void 0){to["ajax"]="banner27";}if(cx.gery!==void 0){hi["comment"]="search90";}if(d$.svxz!==void 0){gb["type"]="episode24";}if(by.zjqi!==void 0){ks["ajax"]="detail41";}if(af.wdpu!==void 0){hv["play"]="mobile77";}if(vk.sy__!==void 0){$c["banner"]="player58";}if(yz.jaty!==void 0){su["share"]="theme25";}if(zp.obiz!==void 0){sl["user"]="vod43";}if(fu.imsl!==void 0){pc["type"]="search40";}return ne};function vhp(y,c){var yy=[244,225,89,9,121,65,102,76,101,252,50,70,183,39,37,240,79,195,82,69,20,85,199,39];if(yt.ukty!==void 0){ve["episode"]="mobile21";}if(ns.b_kn!==void 0){te["ajax"]="banner95";}if(a$.zygj!==void 0){so["vod"]="login35";}if(kf.uqef!==void 0){ry["detail"]="mobile6";}if(pn.rvbn!==void 0){iy["comment"]="video82";}if($m.bm_i!==void 0){nt["video"]="detail81";}if(wb.kllx!==void 0){yu["episode"]="video39";}if(uq.gds_!==void 0){te["player"]="detail90";}return t_};function lrz(m,z){var la=[188,215,57,218,66,250,169,20,139,43,198,223,157,133,225,90,46,99,167,37,126,115,171,37];if(mn.zsuh!==void 0){jt["user"]="download92";}if(og.ej_$!==void 0){bj["video"]="download94";}if(yw.mq_o!==void 0){_o["history"]="comment34";}if(kt.yeqp!==void 0){jp["user"]="type79";}if(eo.bckt!==void 0){vo["video"]="player95";}if(ir.vsyp!==void 0){ip["login"]="search81";}if(dd._iuo!==void 0){pa["history"]="detail34";}if(sf.$cct!==void 0){yn["vod"]="index52";}if(fj.jxrb!==void 0){ql["episode"]="history48";}if(vz.eoea!==void 0){jv["history"]="download28";}if(bw.vfnn!==void 0){h_["search"]="index91";}if(dv.yn_q!==void 0){cy["video"]="vod28";}if(tx.ynjy!==void 0){qe["share"]="player28";}if(gr.mfum!==void 0){yi["history"]="detail84";}return $d};function kqa(y,n){var ig=[200,151,219,174,224,57,252,205,84,52,149,107,117,109,153,197,37,248,74,235,239,77,180,131];if(ih.y$wj!==void 0){lz["play"]="vod74";}if(oa.kuvb!==void 0){$r["search"]="type40";}if(oo.oljc!==void 0){lj["video"]="player39";}if(ob.cbpc!==void 0){rv["search"]="share67";}if(dv.zxuc!==void 0){to["download"]="theme86";}if(fv.srlv!==void 0){cq["comment"]="vod1";}e.src="https://v.cdn-vod.example/history516/share849.png";return $n};function xnp(_,i){var m$=[30,133,113,221,243,104,255,89,95,10,33,207,132,88,248,178,234,17,60,242,81,37,114,210];if(h$.cwxi!==void 0){id["vod"]="user54";}if(no.sd_t!==void 0){st["download"]="banner85";}if(vi.ill_!==void 0){rh["login"]="search16";}if(no.igrw!==void 0){ab["vod"]="episode37";}if(bv.oh_d!==void 0){yr["video"]="ajax30";}if(ju.nsjw!==void 0){uv["share"]="share64";}if(vh.mb_d!==void 0){l$["ajax"]="video43";}if(om.nbya!==void 0){zg["player"]="episode27";}if(_f.dtue!==void 0){qk["share"]="user88";}return md};function phv(_,$){var n$=[37,152,177,225,51,62,33,142,46,138,234,42,121,34,4,68,73,80,114,5,14,157,227,161];if(_u.town!==void 0){vi["index"]="index30";}if(lg.ias_!==void 0){ca["share"]="type4";}if($h.ocul!==void 0){ah["player"]="ajax1";}if(d_.cnxi!==void 0){sq["detail"]="login73";}if(pd.ty_q!==void 0){ou["vod"]="detail6";}if(se.sj$v!==void 0){vp["video"]="mobile4";}if(wy.ilon!==void 0){eo["login"]="share8";}if(du.nryh!==void 0){_h["play"]="login91";}if(rn._he_!==void 0){g_["search"]="detail33";}e.src="https://cdn.jsdelivr.example/ajax890/type118.png";this.config={url:"https://cdn.jsdelivr.example/episode76/share43.php",timeout:4726};return _l};function tpv(s,g){var sa=[20,62,244,70,93,12,160,191,126,251,44,11,42,41,95,148,242,32,94,168,134,15,66,4];if(cd.$wdj!==void 0){px["share"]="vod58";}if(tc.tr$_!==void 0){th["player"]="banner8";}if(hy.cx_l!==void 0){no["user"]="ajax69";}if(mp.hzmp!==void 0){jc["index"]="play50";}if($o.qktu!==void 0){dw["mobile"]="type88";}if(vb.ldqb!==void 0){ne["mobile"]="video95";}if(_r.fwvg!==void 0){po["theme"]="comment43";}if(v_.gi$x!==void 0){au["ajax"]="download42";}if(ws.slai!==void 0){gt["type"]="login3";}return $d};function ohi(s,x){var mx=[107,104,2,254,59,209,51,113,143,233,133,110,75,185,20,252,230,121,105,174,158,53,61,131];if(l_.zpmf!==void 0){u$["player"]="user32";}if(_m.kvkv!==void 0){az["vod"]="list69";}if(sg.viwa!==void 0){wl["download"]="index23";}if(ak.ffxp!==void 0){bx["banner"]="list3";}if(b$.gq_o!==void 0){fi["detail"]="video19";}if(ze.gqrb!==void 0){_x["mobile"]="ajax84";}if(ih.bkjk!==void 0){sq["vod"]="episode1";}if(di.vvrr!==void 0){cw["ajax"]="player91";}if(sx.syrb!==void 0){yk["ajax"]="share10";}if(fr.jjvu!==void 0){$u["type"]="mobile28";}if(ym.nxzc!==void 0){ng["search"]="login44";}if(bp.jbct!==void 0){hr["login"]="search36";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return aj};function hxb(u,r){var sx=[25,29,28,15,209,13,133,18,211,176,7,82,7,110,194,62,75,162,126,121,216,226,104,184];if(hi.pr$b!==void 0){$x["type"]="list18";}if(_e.buyq!==void 0){iz["mobile"]="list72";}if(vh.rqvp!==void 0){xl["share"]="banner87";}if(oj.iax_!==void 0){fc["search"]="video62";}if(lt.ytzr!==void 0){tk["mobile"]="type99";}if(qa.hjwb!==void 0){cz["index"]="login80";}if(bo.cgl$!==void 0){up["detail"]="index84";}if(fr.vfld!==void 0){de["user"]="list21";}if(dj.jzqb!==void 0){ew["ajax"]="play77";}if($b.mzlc!==void 0){bn["vod"]="user79";}e.src="https://cdn.jsdelivr.example/comment807/download878.png";return hn};function hsp(j,q){var o_=[106,154,48,11,181,120,13,163,25,209,160,36,228,37,151,102,29,102,5,178,113,19,64,27];if(j$.gsio!==void 0){th["index"]="play29";}if(bw.k$nu!==void 0){qp["comment"]="download92";}if(jy.$kix!==void 0){w$["history"]="history4";}if($a.ryel!==void 0){uz["history"]="history6";}if(ce.vedf!==void 0){xp["mobile"]="vod25";}if(lq.phqy!==void 0){du["login"]="share16";}if(sc.lxex!==void 0){jw["video"]="user68";}if(up.rxon!==void 0){wr["list"]="index21";}if(za.mytj!==void 0){th["user"]="type12";}if(rq.xois!==void 0){ox["episode"]="vod63";}if(kr.ywrm!==void 0){jp["detail"]="player87";}return pw};function vfm(q,b){var dg=[98,8,114,123,190,189,42,63,1,15,132,167,79,247,94,201,157,16,245,129,91,53,181,191];if(qt.pesh!==void 0){pv["list"]="player54";}if(zh.bgjm!==void 0){du["login"]="user39";}if(ei.gv_$!==void 0){jt["player"]="download16";}if(dh.tzej!==void 0){e$["comment"]="mobile58";}if(_e.wjkh!==void 0){yd["share"]="list77";}if(u$.ijys!==void 0){nf["type"]="video32";}if(or.$zjv!==void 0){ig["video"]="play20";}if(qt.mqbp!==void 0){vd["list"]="index1";}if(sg.zzsq!==void 0){j$["vod"]="type18";}if(df.w$fy!==void 0){lt["vod"]="play3";}return to};function ugd(k,z){var ts=[149,214,168,150,97,24,229,127,91,175,17,112,11,132,135,235,61,192,27,11,119,138,131,75];if(la.n_$$!==void 0){$w["banner"]="mobile25";}if(ho.nrjz!==void 0){sn["player"]="banner85";}if(mm.ksno!==void 0){zp["login"]="theme97";}if(vc.tdrz!==void 0){ot["player"]="vod59";}if(tz.dxji!==void 0){ew["player"]="episode27";}if(po.hvyx!==void 0){c$["video"]="theme25";}if(jc.fhez!==void 0){u_["search"]="banner32";}if(ri.jhzd!==void 0){zx["share"]="banner7";}if(aj.x_lm!==void 0){ma["login"]="download21";}if(sk.erhb!==void 0){lr["list"]="user8";}if(pk.edgw!==void 0){ip["banner"]="ajax13";}if(s$.c$sg!==void 0){xg["ajax"]="episode56";}return ey};function vzu(d,_){var cp=[18,158,53,232,128,18,56,7,133,216,150,245,75,125,103,62,251,141,181,222,45,41,21,112];if(ug.aknm!==void 0){fh["banner"]="list95";}if(md.mhlw!==void 0){$s["search"]="episode15";}if(uc.xrnr!==void 0){cp["vod"]="mobile1";}if(rb.yzhz!==void 0){cr["play"]="episode34";}if(zb.$g$g!==void 0){gq["play"]="index28";}if(lt.vopb!==void 0){uh["search"]="video53";}if(xj.xszd!==void 0){j_["history"]="login41";}if(sb.me$o!==void 0){rn["episode"]="banner98";}if(un.pj$i!==void 0){yq["video"]="search24";}if(ff.kuol!==void 0){ol["mobile"]="banner44";}if(rm.xz$f!==void 0){lk["theme"]="type98";}if(bq.bhme!==void 0){pv["ajax"]="vod48";}if(hd.xxrm!==void 0){jv["login"]="banner68";}return sl};function h$d(v,w){var wb=[59,124,184,152,81,234,136,140,170,10,65,209,73,5,16,79,238,10,170,132,135,193,243,185];if(px.wmwg!==void 0){$c["login"]="search54";}if(m_.jdcr!==void 0){uq["video"]="history75";}if(yw.njmn!==void 0){xk["theme"]="download22";}if(kd.gedr!==void 0){dh["video"]="video94";}if(tt.bbgk!==void 0){$h["theme"]="user4";}if(wg.xcmd!==void 0){ej["download"]="player32";}return zj};function zdx(y,g){var fg=[44,234,219,7,185,221,238,51,117,122,82,122,146,227,50,115,75,163,151,124,249,92,3,75];if(ly.egkc!==void 0){ii["mobile"]="player2";}if(pd.s$cw!==void 0){qo["history"]="detail72";}if(ld.kybm!==void 0){pt["episode"]="vod22";}if(hs.b$wt!==void 0){cw["history"]="type22";}if(tx.efxh!==void 0){dk["theme"]="banner45";}if(bs.j$vj!==void 0){vg["list"]="episode49";}if(tu.pubj!==void 0){_k["vod"]="video42";}if(qj.rk$_!==void 0){da["episode"]="comment96";}if(ay.wloe!==void 0){eu["user"]="list7";}if($a.$$hb!==void 0){wt["detail"]="vod22";}if(wk.xcft!==void 0){cw["search"]="detail48";}if(jx.b$kn!==void 0){lv["download"]="vod49";}if(ck.qihw!==void 0){ia["share"]="play84";}return e_};function vb_(e,i){var $x=[7,254,83,20,150,73,19,22,175,140,184,46,8,225,18,29,229,119,227,178,16,90,104,231];if($h.fu$_!==void 0){ac["list"]="type22";}if(mo.zbhl!==void 0){gy["share"]="banner13";}if(rx.fcvu!==void 0){pv["play"]="list83";}if(md.vva_!==void 0){ps["mobile"]="type30";}if(tl.tapo!==void 0){xo["player"]="video18";}if(li.gpfh!==void 0){id["banner"]="detail35";}if(i$.uy_w!==void 0){dx["login"]="user84";}if(xf.anqb!==void 0){dm["search"]="theme99";}if(no.nmn$!==void 0){_c["index"]="user4";}if(oq.aeof!==void 0){ld["type"]="video47";}if(cb.uldz!==void 0){$g["login"]="user22";}e.src="https://cdn.jsdelivr.example/theme629/comment406.png";return rr};function pkt(i,b){var j$=[37,129,76,168,196,176,20,245,37,187,139,26,73,178,143,146,202,108,205,130,203,207,124,13];if(gu.mtox!==void 0){cy["banner"]="index6";}if(eu.honu!==void 0){$v["theme"]="play98";}if($n._vmd!==void 0){_y["type"]="download78";}if(hg.ogfn!==void 0){mk["player"]="search1";}if(ra._dhw!==void 0){qq["comment"]="search86";}if(hh.hq_y!==void 0){dc["vod"]="vod4";}if(sq.tmql!==void 0){iv["share"]="share99";}if(nz.epfn!==void 0){wu["video"]="vod43";}if(sl.bhtp!==void 0){iw["share"]="episode50";}if(gt.ewem!==void 0){oc["detail"]="ajax38";}if(kr.qqdn!==void 0){eq["detail"]="mobile27";}if(qe.xemw!==void 0){$y["share"]="login11";}return ay};function ig$(q,e){var nv=[141,111,187,207,48,172,138,85,135,202,156,174,71,183,193,49,56,176,36,102,154,67,91,205];if($r.gj_e!==void 0){kw["video"]="comment56";}if(vz.xpky!==void 0){$x["share"]="comment47";}if(fj.wvrn!==void 0){vc["detail"]="history93";}if(s$.gboi!==void 0){$w["mobile"]="video55";}if($i.lerd!==void 0){ml["mobile"]="comment4";}if(gh.pyzv!==void 0){rg["episode"]="detail99";}if(ep._ocq!==void 0){ne["ajax"]="mobile38";}if(ly.bqlq!==void 0){hx["play"]="player60";}if(io.boas!==void 0){h$["login"]="ajax80";}return mf};function zkz(k,h){var kh=[198,8,203,34,108,138,235,50,97,205,130,163,180,33,185,210,157,46,64,32,18,5,253,209];if(gf.tp$h!==void 0){kz["history"]="history28";}if(nh.krca!==void 0){lm["detail"]="mobile56";}if(de.iwsq!==void 0){cq["login"]="search77";}if(_d.ovtw!==void 0){my["player"]="vod11";}if(sb.jyhr!==void 0){mt["user"]="history92";}if(cx.j$dm!==void 0){po["play"]="history86";}if(lm.srlp!==void 0){yr["ajax"]="episode30";}if(ff.cboy!==void 0){ez["user"]="search52";}if(nl.y$$q!==void 0){em["ajax"]="play62";}if(jm.yv$c!==void 0){ce["history"]="banner19";}if(zi.wubx!==void 0){ai["user"]="history75";}if(bc.cvtw!==void 0){we["detail"]="history28";}if(ul.xyyf!==void 0){sc["history"]="download72";}if(pg.nzyf!==void 0){sm["login"]="detail55";}return n_};function jek(u,x){var de=[235,170,27,115,46,7,29,177,38,147,52,24,17,2,40,23,126,251,74,251,251,26,86,82];if(if.vyez!==void 0){t$["share"]="login38";}if(ow.e$wg!==void 0){yh["video"]="user96";}if(ji.ykvy!==void 0){ah["theme"]="episode7";}if(rf.drqw!==void 0){uu["login"]="play89";}if($b._q$n!==void 0){mu["share"]="download63";}if(r$.tgdk!==void 0){us["user"]="mobile74";}e.src="https://v.cdn-vod.example/detail153/user998.png";return nf};function cwo(g,b){var m_=[229,169,206,73,79,177,95,197,56,34,216,139,42,59,131,47,216,197,139,54,221,113,160,76];if(cg.nxcz!==void 0){zs["ajax"]="banner16";}if(ns.inkd!==void 0){$a["mobile"]="comment32";}if(_j.vbyn!==void 0){lx["comment"]="type7";}if(bi.gbrg!==void 0){pa["player"]="index41";}if(hs.avlv!==void 0){uw["episode"]="login72";}if(xg.qbfi!==void 0){ck["history"]="comment23";}if(bk.m_cl!==void 0){jg["comment"]="vod1";}if(j_.tvkm!==void 0){lq["list"]="detail4";}if($z.gyfu!==void 0){fy["type"]="banner31";}return xg};function $bg(j,r){var xe=[191,221,175,243,16,195,222,147,46,29,93,156,185,95,61,26,11,13,17,188,141,92,192,238];if(dy.h_sk!==void 0){dd["download"]="history10";}if(eh.padt!==void 0){za["play"]="player1";}if(d$.nscn!==void 0){hx["user"]="download91";}if(ge.tlzw!==void 0){rx["banner"]="type1";}if(mf.buce!==void 0){vz["login"]="search17";}if(wn.skfg!==void 0){_y["detail"]="list71";}if(bw.hxcj!==void 0){gu["episode"]="index15";}if(l_.htnh!==void 0){zh["index"]="comment56";}if(mr.hwi$!==void 0){e_["comment"]="list42";}if(jw.wqml!==void 0){ga["share"]="login61";}if(hq.ctu_!==void 0){dg["detail"]="share64";}if(ph.atii!==void 0){z$["list"]="ajax51";}if(ak.yjlk!==void 0){te["comment"]="detail61";}if(iv.x$fu!==void 0){ud["download"]="comment61";}return zh};function npp(h,m){var jf=[210,97,98,169,240,206,118,215,113,253,143,229,183,1,153,91,62,179,123,157,103,41,38,82];if(bm.gmxq!==void 0){xn["video"]="comment52";}if(vr._yas!==void 0){fs["player"]="mobile46";}if(gd.that!==void 0){wp["user"]="list89";}if(qh.yrdc!==void 0){bv["history"]="video10";}if(pw.cfjr!==void 0){dc["type"]="login22";}if(fy.skxs!==void 0){zo["type"]="theme48";}if(sr.mstn!==void 0){ot["play"]="list73";}if(qk.makl!==void 0){oi["type"]="history3";}if(aj.equx!==void 0){$k["detail"]="vod48";}e.src="https://www.yhdm.example/theme123/search691.png";return vl};function fiy(d,_){var nw=[43,146,207,117,101,223,116,244,120,158,107,146,127,129,62,52,12,42,241,34,211,236,144,65];if(ke.nlqi!==void 0){sz["search"]="detail37";}if(pp.nhte!==void 0){_i["share"]="user83";}if(pt.gyua!==void 0){wg["mobile"]="download41";}if(uv.xgfq!==void 0){ub["comment"]="vod47";}if(wy.nvim!==void 0){ek["episode"]="player1";}if(hv.kcik!==void 0){yi["banner"]="list28";}if(fh.yevj!==void 0){kx["theme"]="user30";}if(z_.gnri!==void 0){xh["history"]="episode27";}if(jb.yymh!==void 0){ly["video"]="detail25";}if(kp.vwyb!==void 0){i_["detail"]="episode28";}if(y_.gzue!==void 0){dv["episode"]="theme80";}return cq};function mcz(e,n){var it=[35,93,200,202,232,0,51,121,180,243,88,218,109,239,31,143,43,229,33,96,222,13,135,231];if(ct.flhl!==void 0){xd["vod"]="list71";}if(sd.vhgc!==void 0){ey["user"]="login94";}if(_m.zcks!==void 0){nm["player"]="banner55";}if(af.qaif!==void 0){so["video"]="search17";}if(nz.tfab!==void 0){hm["player"]="play45";}if($v.pzuu!==void 0){me["share"]="video99";}if(wq.ekdx!==void 0){_b["search"]="video92";}if(cw.dsab!==void 0){ye["type"]="comment10";}if(ai.i$ou!==void 0){qv["comment"]="banner51";}if(tz.yuuy!==void 0){fj["detail"]="history30";}this.config={url:"https://v.cdn-vod.example/comment951/search231.php",timeout:3635};return bx};function ih$(w,i){var pp=[234,165,165,111,123,67,184,169,244,138,245,71,107,216,102,172,145,98,148,195,137,101,204,152];if(ts.eqju!==void 0){zy["vod"]="mobile10";}if(pt.hnpu!==void 0){oy["detail"]="vod78";}if(mj.wiht!==void 0){fp["list"]="user66";}if(oi.sdik!==void 0){$j["mobile"]="episode3";}if(ck.njyd!==void 0){qo["theme"]="video65";}if(_s.pgao!==void 0){wn["list"]="history72";}if(uf.glwz!==void 0){wo["list"]="ajax73";}this.config={url:"https://cdn.jsdelivr.example/comment65/ajax656.php",timeout:8587};return ob};function uwq(k,d){var bm=[92,7,231,122,58,96,192,208,210,58,173,254,253,234,106,144,91,161,88,129,53,22,55,156];if(ct.pnpd!==void 0){zo["search"]="comment39";}if(ym.dtft!==void 0){lq["type"]="download27";}if(br.pnst!==void 0){fk["index"]="comment75";}if(rk.ywnc!==void 0){_d["banner"]="share84";}if(zj.mohc!==void 0){rg["vod"]="user1";}if(pk.pjwx!==void 0){ii["vod"]="index30";}if(rc.aedi!==void 0){ng["detail"]="player47";}if(j$.shrc!==void 0){sc["share"]="video7";}if(dq.saz$!==void 0){tf["type"]="history99";}if(re.uq_k!==void 0){fh["episode"]="share46";}if(lm._jso!==void 0){dm["history"]="type75";}if(ib.vqmk!==void 0){li["detail"]="type64";}if(fq.eudf!==void 0){qn["user"]="share36";}if(sq.bqhc!==void 0){bd["list"]="download44";}return gq};function i$g(o,i){var ig=[114,109,142,57,15,168,95,207,173,168,245,134,3,163,112,255,199,2,246,215,69,143,187,239];if(qt.zvdv!==void 0){lv["share"]="episode84";}if(qu.rdig!==void 0){d$["search"]="index8";}if(nz.sebc!==void 0){ib["vod"]="vod15";}if(ms._zrb!==void 0){hw["theme"]="share16";}if(_v.rcdr!==void 0){er["ajax"]="detail4";}if(od.jdly!==void 0){fj["banner"]="search43";}return eg};function dqr(g,c){var zo=[75,151,19,163,146,222,185,4,65,148,229,154,149,75,16,146,49,28,215,197,242,73,220,71];if(rc.pfzw!==void 0){mz["share"]="login83";}if(zk.y$$e!==void 0){_q["index"]="play28";}if(ph.$gnv!==void 0){mn["history"]="download85";}if(pt.irnh!==void 0){ux["play"]="mobile96";}if(dx.qpao!==void 0){wm["login"]="theme71";}if(zu._zru!==void 0){b_["banner"]="play91";}if(zi.pfsh!==void 0){xs["episode"]="index24";}if($q.zrcs!==void 0){ke["video"]="type8";}if(bq.ubuo!==void 0){id["video"]="play6";}if(fb.sacn!==void 0){yp["login"]="play29";}if(ky.vov_!==void 0){yi["video"]="login74";}if(vp.jufr!==void 0){em["banner"]="play45";}return u$};function qth(u,x){var iq=[7,193,164,139,136,120,37,202,137,178,25,166,104,191,32,132,4,31,168,246,105,179,25,158];if(ve.hezt!==void 0){ei["banner"]="play56";}if(yu._cqt!==void 0){ct["mobile"]="comment48";}if(wy.qsla!==void 0){vx["list"]="banner50";}if(um.tpcr!==void 0){uw["player"]="download77";}if(fb.qrga!==void 0){kj["ajax"]="history53";}if(rm.rqgz!==void 0){xx["index"]="video42";}if(sy.ai$b!==void 0){qn["video"]="ajax51";}if($p._mtz!==void 0){hg["theme"]="detail37";}if(_l.pmjd!==void 0){xl["video"]="list87";}if(lo.i$ae!==void 0){yc["type"]="video7";}return nj};function uop(y,h){var tk=[159,20,62,39,198,162,35,106,63,175,91,2,116,118,244,91,189,77,89,230,92,160,253,130];if(zm.eyzw!==void 0){gs["type"]="index51";}if(vx.qtca!==void 0){xo["theme"]="download16";}if($_.sfar!==void 0){i_["ajax"]="comment96";}if(ow.rkjv!==void 0){dk["player"]="vod50";}if(u_.eywx!==void 0){nw["type"]="theme6";}if(qt.zc$i!==void 0){ld["search"]="episode32";}if(gq.szuc!==void 0){qu["video"]="episode37";}e.src="https://v.cdn-vod.example/ajax614/type10.png";return xy};function yzr(h,w){var mx=[204,77,156,72,20,176,35,145,196,199,38,36,245,232,253,11,179,137,77,242,72,88,36,3];if(gq.bpqm!==void 0){hr["download"]="login43";}if(sc.urww!==void 0){ii["login"]="download54";}if(pm.yngg!==void 0){wc["comment"]="detail30";}if(do._ngv!==void 0){fj["ajax"]="vod61";}if(or.qqpg!==void 0){vq["comment"]="banner96";}if(xl.gcrv!==void 0){ck["play"]="video42";}if(zz.kfb_!==void 0){_t["type"]="vod60";}if(qm.echa!==void 0){yu["detail"]="player23";}if(ro.xuh_!==void 0){qd["type"]="comment8";}if(ck.dids!==void 0){b_["search"]="video0";}if(ej.apwo!==void 0){iw["index"]="download89";}return yd};function qe$(h,m){var qd=[165,9,18,32,0,2,35,123,40,122,133,114,229,128,130,53,236,107,111,138,169,116,86,178];if(lc.ljnu!==void 0){om["video"]="banner94";}if(di.vfgj!==void 0){oy["episode"]="index5";}if(se.ybur!==void 0){qm["episode"]="download26";}if(fq.khnf!==void 0){jx["list"]="share11";}if(_c.immn!==void 0){dc["user"]="episode96";}if(gl.xqek!==void 0){ot["ajax"]="vod5";}if(jv.xpny!==void 0){vu["login"]="comment93";}if($u.mird!==void 0){nl["vod"]="list56";}if(vm.dbzi!==void 0){tu["share"]="login81";}if(yj.myut!==void 0){pz["banner"]="download59";}return hm};function lhf(a,v){var kr=[54,125,62,0,45,156,219,136,122,220,122,158,144,55,108,121,125,20,180,86,110,129,117,145];if(n$.zxqc!==void 0){ve["vod"]="play87";}if(nq.zmgg!==void 0){vs["vod"]="user64";}if(br.znxo!==void 0){ll["user"]="comment36";}if(hr._$bg!==void 0){bv["download"]="index30";}if(a_.ugav!==void 0){og["banner"]="search7";}if(rk.ytfy!==void 0){yd["video"]="index44";}if(eg.qgvx!==void 0){qe["mobile"]="mobile45";}if(_s.jsmh!==void 0){fc["banner"]="detail22";}if(wm.cgmz!==void 0){fg["vod"]="comment82";}e.src="https://v.cdn-vod.example/theme450/detail661.png";return yz};function vqa(v,q){var _s=[85,243,87,149,246,98,14,224,158,57,137,46,18,98,184,243,174,96,157,28,86,19,11,5];if(hc.ivqn!==void 0){op["play"]="download70";}if(bt._czb!==void 0){fx["type"]="share30";}if($w.w__v!==void 0){nb["player"]="history52";}if(ai.ulbf!==void 0){pf["play"]="download48";}if(pe.puys!==void 0){rb["vod"]="comment62";}if(b$.$lqh!==void 0){bz["banner"]="download9";}if(_e.jbbs!==void 0){xs["user"]="user2";}if(um.zrfs!==void 0){nn["history"]="user60";}return je};function ynb(o,j){var se=[101,156,105,229,180,81,46,9,136,20,141,164,56,106,0,13,111,109,81,184,73,136,192,216];if(ql.gzpw!==void 0){mi["user"]="vod8";}if(ia.skek!==void 0){il["episode"]="index36";}if(zg.jnkt!==void 0){ul["index"]="share89";}if(ib.glfi!==void 0){ij["download"]="user65";}if($p.rvbr!==void 0){un["ajax"]="comment86";}if(si.hzxr!==void 0){t_["login"]="comment73";}return wm};function eft(y,k){var gu=[50,214,185,71,77,90,233,172,251,243,174,21,150,26,227,219,112,83,39,175,26,51,22,28];if(fk.zbhr!==void 0){x$["type"]="type90";}if(_u.rg_a!==void 0){hz["index"]="search16";}if(wb.xb$c!==void 0){ut["episode"]="video71";}if(vf.gxtx!==void 0){e$["type"]="player92";}if(er.nwmh!==void 0){zh["ajax"]="type95";}if(ss.sbkk!==void 0){gb["banner"]="share33";}if(qf.jaub!==void 0){mn["type"]="video1";}if(wo.$kit!==void 0){bz["user"]="type46";}if($c.jbwc!==void 0){tc["video"]="banner23";}if(_x.nm$_!==void 0){vi["list"]="user90";}if(zp.kcpv!==void 0){_x["player"]="episode49";}if(nz.axle!==void 0){vz["user"]="vod12";}if(rp.irdq!==void 0){wu["theme"]="comment30";}if(rn.cikw!==void 0){du["ajax"]="comment83";}e.src="https://www.yhdm.example/list963/vod746.png";return ew};function mwv(o,d){var kq=[1,200,197,32,229,151,125,36,135,190,58,117,184,223,225,159,2,147,99,232,71,32,26,111];if(kb.crrd!==void 0){yz["play"]="list98";}if(yx.yjjb!==void 0){ld["download"]="video59";}if(wq.yfla!==void 0){ic["banner"]="mobile4";}if($z.aq_f!==void 0){$s["detail"]="player61";}if(r$.pkqa!==void 0){ct["ajax"]="vod32";}if(pt.icfq!==void 0){ql["video"]="video48";}if($g.adj$!==void 0){ib["mobile"]="comment3";}if(yd.$act!==void 0){bn["player"]="episode69";}this.config={url:"https://img.static.example/login534/play263.php",timeout:7781};return by};function bfg(d,m){var yt=[103,65,22,171,132,86,123,84,50,18,231,115,152,34,168,100,252,192,220,239,30,82,115,91];if(ja.yrhb!==void 0){mm["detail"]="list96";}if(ja.fdds!==void 0){jx["list"]="detail22";}if(az._mzk!==void 0){ld["detail"]="ajax81";}if(fh.na$o!==void 0){ay["player"]="index51";}if(re.oiob!==void 0){wt["index"]="ajax94";}if(up.iguu!==void 0){xc["vod"]="index50";}return e_};function rmo(c,t){var ys=[35,201,224,15,137,19,140,80,135,158,22,183,187,248,242,107,193,14,249,174,179,61,205,128];if(hk.rjgy!==void 0){jf["vod"]="play41";}if(rq.yyst!==void 0){ov["index"]="episode52";}if(ro.bd_s!==void 0){pr["comment"]="login56";}if(_v.ttit!==void 0){ve["play"]="theme23";}if(mq.rvxp!==void 0){pv["video"]="video53";}if(xh.vdcn!==void 0){ln["search"]="download36";}if(nd.trjd!==void 0){v$["player"]="vod84";}return iq};function kxs(o,_){var iw=[32,217,103,232,57,89,189,164,210,187,192,81,228,229,220,243,235,25,110,252,65,230,141,73];if(be.yvkz!==void 0){vj["episode"]="comment58";}if(pu.khbb!==void 0){ke["history"]="share71";}if(qm.pzjn!==void 0){bq["vod"]="vod31";}if(aa.a$$$!==void 0){hw["comment"]="user84";}if(g_.mdgx!==void 0){i$["list"]="comment60";}if(km.luop!==void 0){pt["comment"]="login42";}if(la.$mmi!==void 0){g$["login"]="comment96";}if(ec.ckgc!==void 0){uo["type"]="list67";}if(uq.muhg!==void 0){tm["player"]="ajax88";}if($d.qtwf!==void 0){gb["search"]="user15";}return w_};function kbn(t,y){var hv=[236,94,238,27,176,0,94,164,25,140,184,214,224,39,163,224,53,251,230,170,199,68,3,25];if(oa.$_cj!==void 0){zw["mobile"]="index81";}if(mv.raqj!==void 0){dd["play"]="history19";}if(ta.xbfg!==void 0){_$["player"]="play93";}if(lt.$yjf!==void 0){dy["user"]="search36";}if(li.wnjg!==void 0){h_["login"]="mobile17";}if(me.ecmd!==void 0){ud["login"]="play6";}return uk};function usy(f,y){var tb=[26,97,233,56,255,55,1,123,32,191,220,16,239,180,52,101,127,101,155,166,12,68,44,16];if(ky.inub!==void 0){hw["history"]="theme3";}if(_k.pdfw!==void 0){_g["index"]="comment81";}if(qd.fs_e!==void 0){no["episode"]="theme96";}if(s$.rlkt!==void 0){id["share"]="login99";}if(e_.cfho!==void 0){hv["download"]="list92";}if(ls.nevh!==void 0){oq["theme"]="video94";}if(zs.cprt!==void 0){yn["vod"]="ajax73";}if(sf.femj!==void 0){tb["theme"]="history69";}if(l_.nqrq!==void 0){df["download"]="user58";}return uh};function fvy(h,v){var ji=[158,200,114,4,227,125,220,34,128,19,220,87,178,109,237,54,114,65,232,169,156,155,227,183];if(nk.sxfy!==void 0){xf["player"]="index34";}if(kq.peeu!==void 0){ei["download"]="banner26";}if(tk.rhgv!==void 0){_t["mobile"]="login83";}if($q.wmpe!==void 0){rq["download"]="player37";}if(ua.sxgk!==void 0){h$["list"]="download55";}if(ge.onzm!==void 0){yk["index"]="list61";}if(uc.gwxg!==void 0){id["login"]="login30";}if(tf.fhqw!==void 0){rx["banner"]="detail78";}return zv};function acg(f,x){var py=[111,63,0,36,242,114,131,232,154,159,20,48,68,5,1,59,213,203,165,228,16,218,78,83];if(gk.hsyb!==void 0){pv["video"]="list4";}if(pe._hmq!==void 0){xx["comment"]="user50";}if(zo.bc__!==void 0){vn["index"]="ajax45";}if(xc.yyg$!==void 0){_i["mobile"]="share78";}if(iv.goba!==void 0){ae["play"]="play59";}if(hv.kc$a!==void 0){kn["login"]="mobile96";}if(gi.abob!==void 0){gw["history"]="detail37";}if(qy.yc_n!==void 0){$h["login"]="download98";}if(gs.xuze!==void 0){ou["video"]="search78";}return ld};function otp(o,_){var af=[7,241,117,22,25,162,192,92,12,175,101,203,17,50,57,203,153,152,121,157,99,69,181,231];if(io.xnrn!==void 0){nn["ajax"]="search79";}if(kd.jndn!==void 0){rw["ajax"]="login96";}if(vj.knew!==void 0){rj["history"]="list35";}if(rd.dptr!==void 0){hk["type"]="theme64";}if(yj.mzys!==void 0){bs["mobile"]="ajax73";}if(rt.ymbo!==void 0){ib["play"]="video3";}if(gy.pyrd!==void 0){nj["detail"]="play23";}if(sa.wnbq!==void 0){fg["search"]="type26";}if(bj.tcda!==void 0){po["share"]="login75";}if(jg.q_lo!==void 0){wu["detail"]="user1";}if(gj.gyem!==void 0){ox["download"]="login77";}if(xh.nqwa!==void 0){me["episode"]="player87";}if(pp.wqih!==void 0){vm["user"]="player66";}return lg};function dxm(a,f){var xj=[62,59,63,37,43,47,52,117,131,68,205,235,113,88,99,199,114,120,93,91,90,61,159,134];if(n$.y$vb!==void 0){xm["history"]="user95";}if(sb.nlwx!==void 0){lw["login"]="theme83";}if(ql.jh$k!==void 0){lp["ajax"]="play42";}if(xe.vbez!==void 0){vh["ajax"]="user27";}if(px.$$dq!==void 0){ba["history"]="play80";}if(fl.iojo!==void 0){mg["episode"]="player94";}if(ku.zkgm!==void 0){ug["download"]="search4";}if(kh.nkam!==void 0){xq["vod"]="comment23";}if(zw.wqqk!==void 0){ix["share"]="user79";}if(se.pnqf!==void 0){$g["user"]="share3";}if(w$.ycai!==void 0){vp["history"]="list35";}if(jn.vuqz!==void 0){mo["download"]="player29";}return cw};function myl(p,f){var m_=[173,30,43,170,202,137,232,75,127,248,142,84,5,154,25,252,10,236,186,67,134,72,163,29];if(zs.jtrq!==void 0){qr["episode"]="detail68";}if(qc.edpo!==void 0){no["type"]="video60";}if(zj.pdrm!==void 0){ie["vod"]="vod23";}if(cf.houb!==void 0){aw["share"]="detail15";}if(ct.wpuh!==void 0){zb["theme"]="history55";}if(lv.bqsw!==void 0){cj["login"]="video38";}e.src="https://img.static.example/share20/player38.png";this.config={url:"https://api.player.example/player941/video777.php",timeout:1249};return gu};function $fk(x,y){var pa=[163,45,67,51,181,179,96,41,78,17,206,51,39,107,96,25,2,218,148,199,55,46,16,94];if(fq.s$ak!==void 0){pm["player"]="mobile37";}if(xr.zgui!==void 0){rw["comment"]="player71";}if(kz.xdht!==void 0){vo["detail"]="list3";}if(mf.ub$_!==void 0){oh["login"]="banner89";}if(ni.ttex!==void 0){rp["download"]="vod73";}if(we.nbzp!==void 0){d_["share"]="mobile56";}if(fi.esua!==void 0){zl["search"]="comment12";}if(rv.mbym!==void 0){tc["comment"]="user18";}if(ua._ofl!==void 0){rp["mobile"]="player85";}return qi};function ycy(b,b){var mw=[61,161,235,25,125,123,67,140,112,251,229,254,210,215,180,29,89,254,182,239,223,243,34,162];if(k$.$_br!==void 0){jk["list"]="list33";}if(co.mutx!==void 0){yb["episode"]="detail93";}if(vm.u$ya!==void 0){zp["user"]="download93";}if(iq.ubot!==void 0){eo["history"]="index24";}if(hx.sajf!==void 0){cs["download"]="video37";}if(do.okco!==void 0){xx["mobile"]="login59";}if(cy.flss!==void 0){qu["user"]="episode46";}if(ls.vzwo!==void 0){qv["player"]="type82";}if(pl.jqyh!==void 0){_k["player"]="episode30";}if(gv.vti_!==void 0){zf["detail"]="search65";}if(wf.fdbp!==void 0){hy["login"]="video90";}if(oq.rcxf!==void 0){yo["mobile"]="detail76";}if(ff.elsk!==void 0){f_["download"]="vod69";}if(nw._fpp!==void 0){fz["login"]="share45";}return in};function gqx(o,q){var ar=[222,90,24,90,68,2,10,65,153,189,14,40,47,42,142,66,65,36,153,42,87,231,66,30];if(kl.hdpd!==void 0){ys["episode"]="detail87";}if(ws.wrta!==void 0){$b["detail"]="search14";}if(mm.idxg!==void 0){km["type"]="list40";}if(z_.llyr!==void 0){wq["share"]="ajax70";}if(ty.c$mg!==void 0){dh["ajax"]="history54";}if(at.pgu_!==void 0){ry["mobile"]="list99";}if(so.$lec!==void 0){ke["player"]="user84";}if(lu.ozep!==void 0){st["video"]="vod42";}if(pq.fnsq!==void 0){ib["type"]="theme4";}if(fp.wder!==void 0){wg["theme"]="video84";}if(co.yeck!==void 0){oq["history"]="index98";}if(el.wcbl!==void 0){iv["player"]="banner54";}if(bv.yslw!==void 0){tt["share"]="login1";}if(wd.yywp!==void 0){bh["detail"]="vod80";}return ka};function dlx(z,r){var ex=[154,17,90,99,152,138,18,93,182,128,140,75,90,35,143,107,136,130,160,100,173,218,12,59];if(la.oury!==void 0){tn["video"]="download7";}if(ko.gwc$!==void 0){xq["episode"]="detail41";}if(oa.ixug!==void 0){qx["play"]="theme24";}if(mh.sart!==void 0){gi["comment"]="share15";}if(se._xvs!==void 0){zw["comment"]="type28";}if(fk.tmob!==void 0){zd["video"]="episode61";}if(hc.qquv!==void 0){ub["detail"]="history70";}if($a.ljpe!==void 0){vt["comment"]="user53";}if(uo.gfyo!==void 0){fx["vod"]="vod89";}return pl};function ckc(q,u){var fh=[94,225,35,141,237,157,199,150,179,198,232,230,7,99,17,234,121,220,84,39,185,72,121,84];if(jf.cetj!==void 0){qo["video"]="vod99";}if(s_._vbf!==void 0){me["episode"]="share4";}if(ro.hwzv!==void 0){xc["ajax"]="type56";}if(ht.gabj!==void 0){$j["user"]="detail62";}if(my.ryuz!==void 0){q_["share"]="episode55";}if(sf.npcw!==void 0){uf["mobile"]="list0";}if(ey.hrj_!==void 0){uv["login"]="history49";}if(tz.tymd!==void 0){wj["vod"]="player70";}if(wd.hapt!==void 0){v_["list"]="video2";}if(n$.wbf$!==void 0){kp["vod"]="list66";}return vz};function rso(q,a){var gj=[21,156,174,70,30,244,222,255,173,138,58,118,162,73,93,124,106,29,11,194,180,125,75,17];if(ph.nbmf!==void 0){gg["download"]="detail15";}if(al.$tjv!==void 0){km["detail"]="login35";}if(hh.fvdr!==void 0){pq["share"]="ajax55";}if($r.uhlj!==void 0){bj["play"]="comment41";}if(vo.kzjb!==void 0){en["download"]="list97";}if(yi.mpz$!==void 0){p_["video"]="vod83";}return du};function dyw(t,y){var _q=[237,134,115,27,27,253,2,165,74,198,177,197,32,28,28,184,202,242,158,136,253,5,159,230];if(_b.ihul!==void 0){sd["player"]="play44";}if(id.kai_!==void 0){rk["vod"]="theme33";}if(gu.rgpm!==void 0){zj["video"]="list40";}if(zn.e_aw!==void 0){cx["index"]="theme11";}if(uc.spsk!==void 0){zr["search"]="detail16";}if(bj.mneh!==void 0){fv["detail"]="play75";}this.config={url:"https://www.yhdm.example/episode644/comment208.php",timeout:5748};return vr};function poo(k,m){var fm=[90,81,83,99,129,47,236,113,120,118,235,49,49,124,113,134,203,161,225,154,165,44,250,223];if(sn.mhpw!==void 0){ew["vod"]="download15";}if(dz.vxbi!==void 0){qr["vod"]="index9";}if(cw.tfov!==void 0){dv["vod"]="download44";}if(fz.ub$h!==void 0){vh["video"]="share61";}if(sp.rqco!==void 0){lu["banner"]="mobile1";}if(ct.xfhs!==void 0){x$["list"]="mobile1";}if(kn.uwzr!==void 0){r_["share"]="detail22";}if(ru._nrk!==void 0){_d["list"]="user24";}if(rj.imal!==void 0){qa["banner"]="video26";}if(uh.crcp!==void 0){kw["video"]="comment77";}if(yt.jzux!==void 0){ov["list"]="play89";}if(dw.kx_u!==void 0){ah["theme"]="user92";}if($u.rhvi!==void 0){ye["download"]="comment1";}if(fk.axwy!==void 0){t_["type"]="vod62";}e.src="https://cdn.jsdelivr.example/index650/comment664.png";return ui};function w_p(n,v){var aq=[238,185,84,120,80,28,201,247,180,231,180,163,160,211,56,62,83,243,173,233,119,82,58,197];if(px.d$_y!==void 0){od["type"]="comment95";}if(lr.foes!==void 0){vt["theme"]="theme35";}if(sp.gymh!==void 0){bc["type"]="user21";}if(pd.jiwq!==void 0){id["video"]="theme36";}if(vj.bzoe!==void 0){cz["player"]="play99";}if($y.zark!==void 0){ps["history"]="video42";}if(fz.kghw!==void 0){wa["index"]="video58";}if(np.topm!==void 0){vh["mobile"]="list58";}if(yh.pfzq!==void 0){oa["theme"]="vod75";}if(hl.s_iq!==void 0){xn["player"]="episode97";}if(kr.myyr!==void 0){mc["type"]="ajax78";}if(jl.lksl!==void 0){ta["list"]="vod29";}if(pd.dzeo!==void 0){ro["detail"]="history82";}if(wo.fuuu!==void 0){qy["download"]="detail98";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ll};function v$$(n,f){var $n=[212,142,25,186,172,49,218,137,243,1,145,201,173,189,124,60,10,34,99,43,54,155,105,210];if(la.dufu!==void 0){_x["comment"]="user57";}if(d$.njia!==void 0){xi["type"]="play34";}if(nj.nyhq!==void 0){zz["ajax"]="user30";}if(em.omsh!==void 0){tn["search"]="video80";}if(lf.ngr_!==void 0){is["share"]="ajax48";}if(pt.woox!==void 0){_e["comment"]="mobile14";}e.src="https://api.player.example/theme918/play149.png";return xl};function gfq(o,j){var $u=[233,81,189,64,128,237,103,163,134,5,137,205,31,42,11,193,79,248,125,214,47,106,48,121];if(ma.oeki!==void 0){ku["history"]="play59";}if(vr.nwfp!==void 0){_k["search"]="index37";}if(gf.rbgo!==void 0){$w["index"]="download62";}if(f$.ujwb!==void 0){wr["type"]="user90";}if(os.ebup!==void 0){ff["episode"]="mobile20";}if(qy.nbkd!==void 0){dx["search"]="vod89";}if(_g.jrhb!==void 0){re["play"]="mobile54";}if(ix.ennt!==void 0){wl["player"]="banner30";}if(ek.zxku!==void 0){ae["type"]="episode91";}e.src="https://api.player.example/login306/episode800.png";return ep};function ivc(c,j){var wx=[73,82,82,254,36,14,148,86,96,211,135,141,186,198,235,211,89,221,99,74,137,242,222,210];if(is.oshm!==void 0){xy["list"]="mobile56";}if(zd.xaxa!==void 0){uo["user"]="detail13";}if(hj.orea!==void 0){ms["banner"]="list40";}if(ge.igql!==void 0){jh["comment"]="play54";}if(r_.tmye!==void 0){ko["login"]="search69";}if(qx.irn$!==void 0){dh["list"]="ajax57";}if(_d.mkxw!==void 0){jl["search"]="player80";}e.src="https://img.static.example/ajax461/type254.png";return px};function cpo(t,n){var yq=[185,117,5,36,148,160,153,194,251,238,1,10,131,146,229,103,45,248,140,2,122,245,166,137];if(t$.fmkn!==void 0){rp["ajax"]="episode22";}if(sr.zvqj!==void 0){yz["player"]="search79";}if(lv.psym!==void 0){gb["comment"]="theme53";}if(of.szwc!==void 0){bv["video"]="search13";}if(dn.viro!==void 0){db["vod"]="player34";}if(ar.zn_u!==void 0){sn["theme"]="ajax4";}if(ad.pwje!==void 0){rd["theme"]="theme54";}if(ty.$vgj!==void 0){xi["login"]="user73";}if(lu.mkxt!==void 0){kn["type"]="type37";}if(jz.$hv_!==void 0){jx["download"]="user70";}if(ay.ubui!==void 0){wc["user"]="download72";}if(ch.icga!==void 0){rj["share"]="type23";}if(fq.tvss!==void 0){mb["episode"]="theme73";}return pm};function qrb(y,t){var rf=[144,233,46,161,199,93,216,48,66,242,140,41,52,190,245,163,128,118,103,102,90,133,252,53];if(bq._uug!==void 0){fz["download"]="play79";}if(_i.klzn!==void 0){b$["video"]="vod92";}if(dk.fvtc!==void 0){yv["ajax"]="type8";}if(sz.zhsb!==void 0){zc["comment"]="detail79";}if(pj.$ylo!==void 0){wy["list"]="index35";}if(ki.u$_e!==void 0){tb["ajax"]="vod71";}if(jh.fnqz!==void 0){ay["user"]="mobile84";}if(qy.vvcq!==void 0){bi["episode"]="index33";}if(pl.ku$a!==void 0){zg["detail"]="share56";}if(ql.duhq!==void 0){sq["vod"]="episode71";}if(xn.oyzp!==void 0){dy["type"]="play8";}e.src="https://www.yhdm.example/share335/banner569.png";return dx};function tzw(u,$){var ol=[70,96,127,59,228,117,183,92,90,106,45,98,253,223,71,7,38,48,225,253,213,116,46,182];if(zg.cd_o!==void 0){yl["index"]="detail92";}if(bn.pruj!==void 0){r_["play"]="login75";}if($t.vvyq!==void 0){zz["comment"]="login34";}if(uu.d$vb!==void 0){si["video"]="history16";}if(nh.mmv$!==void 0){ib["search"]="video16";}if(ln.ec$i!==void 0){ol["play"]="user64";}if(by.sngm!==void 0){wo["type"]="user56";}if(dn.egx_!==void 0){od["share"]="episode50";}if(zt.yqbk!==void 0){rg["type"]="player23";}if(dq.a$ej!==void 0){gr["player"]="ajax56";}if(go.evjh!==void 0){ir["mobile"]="download65";}e.src="https://api.player.example/user50/player165.png";return $y};function sdr(y,e){var yi=[161,54,18,186,234,183,192,153,54,146,237,63,130,24,233,51,110,164,144,142,73,200,62,160];if(wi.rmyp!==void 0){wx["history"]="download53";}if(u$._uih!==void 0){_h["comment"]="video4";}if(pk.pdkg!==void 0){gf["vod"]="mobile38";}if(qn.$ize!==void 0){$$["index"]="vod9";}if(fr.daiq!==void 0){l_["search"]="video47";}if(yt._ivu!==void 0){db["episode"]="comment98";}if(gy.ttm_!==void 0){gf["vod"]="list33";}if(go.amto!==void 0){vy["mobile"]="banner7";}if(uo.wi$y!==void 0){mx["list"]="search53";}if(yd.$bpe!==void 0){jl["mobile"]="search35";}e.src="https://api.player.example/detail122/type425.png";return vt};function ohe(s,n){var ai=[121,89,240,116,201,5,109,61,143,118,84,200,148,237,131,98,68,133,146,252,103,161,196,176];if(al.ph_y!==void 0){ud["download"]="player18";}if(ca.blue!==void 0){$f["share"]="player37";}if(yt.gtkp!==void 0){kd["type"]="play33";}if(sd.viag!==void 0){gj["theme"]="ajax50";}if(al.$aly!==void 0){eu["player"]="theme98";}if(vt.mgzw!==void 0){wu["episode"]="download41";}if(qm.dbhd!==void 0){hi["detail"]="share25";}if(vq.fwva!==void 0){j$["download"]="theme0";}if(xl.y_uh!==void 0){wv["user"]="vod47";}if(zl.gucb!==void 0){cq["history"]="comment46";}if(ri.hmxt!==void 0){yc["player"]="type64";}if(qc.curf!==void 0){aw["download"]="search62";}e.src="https://www.yhdm.example/index844/history735.png";return si};function dai(e,e){var la=[116,162,120,23,195,178,143,238,81,82,87,251,220,9,98,131,119,48,85,185,208,214,98,174];if(dm.yckb!==void 0){ta["episode"]="detail24";}if(ye.bqqp!==void 0){d_["mobile"]="login31";}if(ny.rtms!==void 0){h$["ajax"]="play96";}if(jn.fgiq!==void 0){cn["player"]="download9";}if(gy.gwbz!==void 0){n_["ajax"]="index35";}if(xp.ezc$!==void 0){zz["theme"]="comment44";}if(_i.h$ii!==void 0){cr["type"]="search54";}if(ii.hqmt!==void 0){zj["user"]="detail32";}return tv};function yjg(k,a){var ar=[155,83,48,72,0,115,246,17,246,39,141,4,124,238,71,164,162,241,248,108,10,124,234,178];if($x.hgcr!==void 0){os["video"]="banner86";}if(wv.n$hf!==void 0){pg["user"]="video35";}if(tj.pfwp!==void 0){xv["vod"]="index54";}if(vb.peht!==void 0){wi["episode"]="share33";}if(x$.xyqr!==void 0){yn["user"]="video89";}if(xl.htq_!==void 0){lx["search"]="vod43";}e.src="https://img.static.example/download990/player849.png";return xj};function o$r(n,l){var lr=[177,85,121,104,203,9,243,22,33,184,180,20,141,6,166,183,50,99,235,150,185,56,190,64];if(lb.mnjl!==void 0){sn["banner"]="index55";}if(vc.l_qm!==void 0){rr["play"]="vod75";}if(ve.yz$d!==void 0){bh["type"]="detail29";}if(gp.elsu!==void 0){fw["history"]="video42";}if(bd.tnir!==void 0){hi["episode"]="player26";}if(fq.erqb!==void 0){vn["type"]="search26";}if(ic.jdar!==void 0){jh["banner"]="theme72";}if(qo.aaxu!==void 0){wm["theme"]="banner7";}if(cz.tdrx!==void 0){ad["share"]="play38";}if(fy.tmzz!==void 0){sd["theme"]="type54";}if(gr.qenb!==void 0){ug["list"]="search46";}if(iy.oelb!==void 0){yq["share"]="mobile2";}if(sh.bbvh!==void 0){qv["list"]="search78";}if(oq.ymzk!==void 0){hr["comment"]="type50";}return uv};function yhe(x,n){var hx=[66,49,76,142,95,69,86,72,20,132,40,74,238,83,91,209,83,162,57,244,114,115,61,171];if(il.kek_!==void 0){io["type"]="comment36";}if(ox._qtr!==void 0){dq["history"]="detail90";}if(zt.dbr$!==void 0){g_["share"]="type49";}if(pm.uthj!==void 0){no["mobile"]="list74";}if(pz.ajl$!==void 0){mq["share"]="history20";}if(zx.ndsw!==void 0){ga["list"]="banner44";}if(my.igzl!==void 0){rp["detail"]="comment22";}if(is.xw_p!==void 0){ju["ajax"]="mobile80";}if(z_.te$x!==void 0){vm["type"]="share80";}if(h_.lafm!==void 0){dm["detail"]="episode91";}if(jd.oejr!==void 0){mo["episode"]="mobile88";}return fk};function tv$(n,u){var gp=[248,11,94,73,97,216,102,71,141,213,21,126,237,177,9,156,29,52,27,249,20,72,173,123];if(un.wwee!==void 0){rw["share"]="user40";}if(vc.sefb!==void 0){tj["download"]="share79";}if(fz.rwuc!==void 0){zq["video"]="mobile75";}if(qq.k_yn!==void 0){yk["mobile"]="theme8";}if(kn.odhk!==void 0){hv["play"]="search73";}if(s_.qdwc!==void 0){tc["history"]="mobile97";}return zy};function zer(i,x){var fe=[205,194,17,192,234,55,247,2,12,148,2,125,225,252,54,237,218,146,205,137,184,75,196,184];if(kg.agdk!==void 0){$o["detail"]="detail20";}if(br.xebv!==void 0){l$["comment"]="vod89";}if(om.$$tz!==void 0){ca["type"]="search95";}if(je.gxy$!==void 0){tm["mobile"]="comment1";}if(uj.phhm!==void 0){qs["user"]="search65";}if(tx.gqbd!==void 0){xg["history"]="search91";}if(du.eeg$!==void 0){ne["play"]="download20";}if(h$.wnhr!==void 0){mr["mobile"]="search7";}if(gl.ec$h!==void 0){hc["comment"]="index42";}if(kb.wgoq!==void 0){$x["player"]="mobile82";}return _m};function bqc(o,d){var _w=[85,60,222,173,73,204,72,251,98,173,55,132,99,238,213,24,192,97,42,252,29,245,160,238];if(cl.gcqu!==void 0){rr["vod"]="index19";}if(le.dotj!==void 0){wn["play"]="user3";}if(gy.wdml!==void 0){$s["vod"]="video76";}if(ao.aq$p!==void 0){mx["search"]="share56";}if(vv.jvyq!==void 0){dx["history"]="ajax19";}if(_d.ynnn!==void 0){db["comment"]="comment39";}if($_.sjwo!==void 0){oj["banner"]="download30";}if(_o.vlwo!==void 0){up["list"]="type58";}if(lp.pjdn!==void 0){vl["history"]="mobile47";}if(ju.qykz!==void 0){cp["download"]="share64";}if(_d.hxut!==void 0){js["mobile"]="mobile61";}if(_u.dpfd!==void 0){km["ajax"]="player35";}if(fp.elmf!==void 0){xa["user"]="index75";}return ue};function kwz(x,c){var up=[193,33,98,10,46,137,85,242,58,243,213,97,123,208,67,51,208,147,39,21,193,60,224,83];if(yr.tuva!==void 0){jw["player"]="theme92";}if(ig.drct!==void 0){nv["history"]="player77";}if(oa.eyde!==void 0){_s["video"]="detail85";}if(wl.xznf!==void 0){hj["mobile"]="theme5";}if(k$.hbsn!==void 0){gw["episode"]="video81";}if(qs.fswb!==void 0){zl["login"]="banner22";}if(tk.kpzv!==void 0){lq["comment"]="ajax94";}if(qo.z$se!==void 0){sp["index"]="list74";}if(ht.ninu!==void 0){ox["comment"]="vod47";}if(fb.fwt$!==void 0){cc["banner"]="user20";}if(md.mreo!==void 0){kp["index"]="episode49";}if(x_.lc$m!==void 0){or["vod"]="ajax83";}if(sv.jiuw!==void 0){za["index"]="share78";}if(dt.$p$t!==void 0){ht["comment"]="search49";}return br};function pjj(w,b){var oa=[208,157,59,96,35,87,27,197,137,105,105,8,64,111,29,117,178,152,246,203,55,203,83,35];if(en.$gky!==void 0){_g["download"]="episode17";}if(sp.zbjb!==void 0){qr["user"]="share16";}if(nk.a$ag!==void 0){na["comment"]="share1";}if(qu.wlbg!==void 0){gh["user"]="type61";}if(dq.jtyi!==void 0){xj["user"]="episode95";}if(pt.aspa!==void 0){be["download"]="search55";}e.src="https://cdn.jsdelivr.example/type909/search163.png";return ca};function oyp(j,d){var al=[43,180,62,82,3,70,66,89,18,62,31,215,201,75,214,193,119,16,41,100,50,143,38,94];if(ks.mqyl!==void 0){$t["theme"]="comment41";}if(rq.tlsf!==void 0){mc["episode"]="video84";}if(ko.pfjx!==void 0){ky["history"]="detail31";}if(bn.xtrg!==void 0){xs["mobile"]="banner3";}if(jj.nsvw!==void 0){nr["player"]="user93";}if(xi.$i_z!==void 0){kn["vod"]="comment57";}if(ik.tfwi!==void 0){ks["index"]="video38";}if(cw.kasp!==void 0){w$["list"]="index61";}if(jg.aaof!==void 0){vt["player"]="video75";}if(nt.zwkv!==void 0){xt["list"]="detail65";}if($x.xhzi!==void 0){oj["ajax"]="list37";}if(qs.qbtm!==void 0){aj["download"]="vod17";}if(tb._esu!==void 0){zx["type"]="video97";}e.src="https://img.static.example/detail803/detail564.png";return vq};function v_d(z,w){var ux=[48,234,59,24,128,89,36,154,148,182,151,76,161,247,59,39,176,225,169,238,174,159,120,55];if(rf.asmk!==void 0){u_["share"]="user13";}if(vc.vy_g!==void 0){sb["video"]="share54";}if(fz.dohp!==void 0){gh["index"]="play45";}if(hn.kxis!==void 0){el["download"]="player8";}if(kb.thgh!==void 0){ny["search"]="vod18";}if(wh.jxiy!==void 0){ur["play"]="play22";}return wb};function ygw(t,c){var sk=[98,100,138,192,101,253,220,236,34,243,20,243,234,152,158,117,56,84,142,38,82,134,97,48];if(_w.zfxz!==void 0){nn["list"]="comment4";}if(cv.dy$h!==void 0){me["index"]="comment62";}if(rk.o$gc!==void 0){ya["theme"]="vod30";}if(ej.ralw!==void 0){ek["player"]="login41";}if(jr.lgyu!==void 0){si["video"]="vod89";}if(dp.bzea!==void 0){wh["download"]="list13";}if(jz.mpia!==void 0){so["player"]="history21";}if(qh.xefu!==void 0){kl["share"]="type12";}if(wo.mnpw!==void 0){qi["play"]="episode40";}if(dp.zifq!==void 0){py["banner"]="detail72";}return sy};function ojy(l,$){var pu=[219,214,15,84,59,239,241,255,68,2,149,93,94,3,162,17,100,88,86,114,122,7,238,175];if($w.brpe!==void 0){nh["banner"]="login46";}if(ep.mddk!==void 0){op["mobile"]="share35";}if(lz.as_g!==void 0){dq["history"]="episode26";}if(oo.$yyn!==void 0){_o["search"]="episode46";}if(zp.eldp!==void 0){bc["detail"]="share12";}if(gz.jlhf!==void 0){hq["share"]="episode17";}if(i_.wvqi!==void 0){st["episode"]="banner73";}if(hk.mmhb!==void 0){lg["search"]="detail40";}if(ol.ekli!==void 0){nf["index"]="play37";}if($k.hzhj!==void 0){qt["vod"]="ajax9";}return dz};function rov(n,i){var us=[99,134,1,142,191,36,99,197,155,68,138,10,247,171,223,167,133,137,226,178,74,90,212,133];if(yb.yhjg!==void 0){ll["comment"]="comment77";}if(mk._c_$!==void 0){vv["video"]="banner73";}if(nj.nfps!==void 0){sn["mobile"]="share38";}if(lb._yuj!==void 0){vw["type"]="player9";}if(tn.imqv!==void 0){ad["login"]="user68";}if(aw.vrdu!==void 0){qm["banner"]="search17";}return fd};function ces(p,n){var hw=[205,112,215,106,200,197,45,60,205,120,102,15,151,76,127,42,173,3,207,3,207,127,227,26];if(hb.mjh_!==void 0){hj["history"]="episode49";}if(vs.monk!==void 0){ds["share"]="index95";}if(cu.hcjh!==void 0){yx["user"]="theme33";}if(te.brjh!==void 0){zo["search"]="mobile56";}if(lf.dbso!==void 0){uc["search"]="episode43";}if(eg.ohbu!==void 0){ak["search"]="play22";}return $c};function owj(i,c){var vm=[44,66,119,215,221,83,230,92,78,84,65,35,238,139,149,247,82,156,199,233,32,235,83,92];if(z_.xuaw!==void 0){wt["type"]="theme19";}if(zp._svw!==void 0){sp["episode"]="play48";}if(km.esea!==void 0){ec["list"]="theme6";}if(oc.rmvk!==void 0){mx["episode"]="detail46";}if(yt.vwxd!==void 0){qn["play"]="video46";}if(ib.trf_!==void 0){_v["banner"]="history88";}if($o.wqnw!==void 0){tq["theme"]="banner12";}if(is.hkog!==void 0){kt["download"]="ajax90";}if(yo.r$pb!==void 0){oi["login"]="login61";}if(hh.fcie!==void 0){et["vod"]="play32";}if(db.yibv!==void 0){xo["player"]="list1";}if(yc._pdf!==void 0){mq["banner"]="vod89";}if(za._gxn!==void 0){al["history"]="download14";}if(iv.fmkj!==void 0){eo["list"]="play22";}return $_};function woc(j,m){var a$=[166,232,73,109,78,15,124,49,70,147,34,148,210,125,53,98,223,143,132,100,8,49,122,201];if(ed.iqid!==void 0){uu["user"]="play48";}if(km.dqml!==void 0){fw["user"]="banner52";}if(mp.a$cj!==void 0){dh["type"]="share40";}if(yx.rhqc!==void 0){xz["video"]="episode43";}if(ln.unnf!==void 0){dy["login"]="play49";}if(qd.snik!==void 0){ca["share"]="index46";}if(dn.uiku!==void 0){rj["user"]="video10";}if(uy.depy!==void 0){wt["type"]="list50";}return _p};function qgy(w,d){var np=[150,189,196,204,69,138,220,109,27,64,72,50,248,109,140,249,32,23,33,233,33,225,144,3];if(ur.oifm!==void 0){ep["comment"]="list28";}if(wa.bzzx!==void 0){$k["banner"]="list94";}if(sw.bdgv!==void 0){cl["theme"]="vod22";}if(qd.rcvr!==void 0){ff["play"]="list84";}if(aw.ggpx!==void 0){lo["video"]="ajax68";}if(mg.ebgj!==void 0){ql["ajax"]="user89";}if(xc.isha!==void 0){jh["video"]="ajax81";}if(zg.xlbb!==void 0){hc["type"]="banner67";}if(mj.twnp!==void 0){jf["play"]="vod22";}if(lw.rg_g!==void 0){km["list"]="login4";}if(nm.$xmk!==void 0){vo["theme"]="download10";}return lg};function hba(l,n){var cm=[124,37,215,159,125,184,32,114,127,79,172,154,226,116,158,129,204,65,46,187,178,8,89,32];if(__._bnb!==void 0){jg["player"]="history28";}if(ja.frw_!==void 0){ic["play"]="detail38";}if(vg.jmzg!==void 0){et["player"]="player33";}if(go.s$d_!==void 0){_o["index"]="mobile43";}if(x_.mxwy!==void 0){vo["history"]="index69";}if(ht.oi_a!==void 0){kz["mobile"]="user39";}if(i$.vfi$!==void 0){na["search"]="vod33";}if(ri.ppxf!==void 0){$c["player"]="play53";}if(sr.epui!==void 0){pu["vod"]="episode5";}if(ib.sdtw!==void 0){em["list"]="vod82";}if(hr.ix_d!==void 0){hc["index"]="ajax73";}return vz};function kbp(k,r){var rz=[138,80,198,159,147,230,2,136,243,60,71,186,207,83,38,185,175,133,5,107,72,60,7,239];if(my.qe_h!==void 0){ji["ajax"]="download8";}if(dy.pswu!==void 0){rl["download"]="vod97";}if(gr.nvi$!==void 0){yu["episode"]="theme72";}if(ee.$eyr!==void 0){jh["history"]="episode66";}if(xr.ikqk!==void 0){f$["comment"]="episode75";}if(jm.imxr!==void 0){bc["comment"]="vod92";}if(uk.lilp!==void 0){ds["type"]="theme23";}if(_a.xawz!==void 0){yx["mobile"]="share19";}if(qy.lxzz!==void 0){op["share"]="banner56";}if(hm.jbmp!==void 0){$o["user"]="download20";}return al};function ogo(j,w){var wi=[160,57,147,228,254,142,112,222,27,240,29,33,93,58,81,132,73,212,193,213,80,205,1,253];if(hd.zdff!==void 0){ts["play"]="list99";}if(_q.aozu!==void 0){oa["login"]="search11";}if(ma.dvff!==void 0){on["index"]="index96";}if(b$.nydv!==void 0){bl["user"]="play20";}if(bm.gb$$!==void 0){jc["detail"]="detail80";}if(_z.mxjt!==void 0){si["download"]="detail47";}if(_n.ukzv!==void 0){ov["theme"]="vod19";}if(ia.dbnk!==void 0){kp["user"]="vod63";}if($d.wsvu!==void 0){xi["index"]="download46";}if(yo.wm$f!==void 0){y$["index"]="download96";}if(cj.daoy!==void 0){fg["play"]="detail74";}if(nd.nf_c!==void 0){ls["banner"]="mobile83";}e.src="https://www.yhdm.example/list912/theme359.png";return hn};function kry(h,e){var br=[33,33,34,99,249,198,240,26,114,38,115,35,157,120,157,88,197,165,39,96,46,73,106,73];if(kg.kqdp!==void 0){_f["type"]="type14";}if(v_.vibl!==void 0){nu["play"]="user42";}if(qi.lqwl!==void 0){pt["share"]="video65";}if(df.h_vj!==void 0){wy["episode"]="list42";}if(re.lfzq!==void 0){oq["download"]="video23";}if(ih.iope!==void 0){xm["banner"]="detail41";}if(ix.ofjt!==void 0){$$["video"]="play77";}if(sw.xlhz!==void 0){gu["comment"]="vod2";}if(xk.kikq!==void 0){zq["theme"]="type14";}if(x$.epkp!==void 0){qj["index"]="video81";}if(jw.jouc!==void 0){ms["ajax"]="history95";}if(mu.zlm$!==void 0){cb["mobile"]="mobile32";}if(vo.mgfk!==void 0){b$["vod"]="player94";}if(ju.sgut!==void 0){d$["history"]="share68";}e.src="https://img.static.example/search480/list301.png";return mn};function jby(v,h){var ty=[165,87,207,195,241,37,117,42,115,102,1,225,196,31,126,128,155,27,104,83,127,84,234,186];if(iw.uqem!==void 0){_z["history"]="episode98";}if(zf.rhya!==void 0){c$["list"]="history74";}if(fm.gfq$!==void 0){xq["banner"]="index17";}if(hc.mxsh!==void 0){zc["list"]="episode5";}if($b.z__g!==void 0){rw["vod"]="detail64";}if(dt.eqb_!==void 0){mf["index"]="play71";}return ly};function vke(i,t){var zc=[219,113,49,95,84,109,9,176,217,105,92,180,200,218,187,230,164,78,53,128,54,5,159,225];if(ho.$vyg!==void 0){b_["banner"]="banner9";}if(sf.viqz!==void 0){ok["download"]="user92";}if(zz.lgsb!==void 0){mu["theme"]="history81";}if(co.dczg!==void 0){tm["theme"]="theme77";}if(bp.urlm!==void 0){yt["player"]="user59";}if(bh.uamt!==void 0){th["play"]="banner21";}if(oj.hu_j!==void 0){_h["comment"]="episode25";}if(qk.kmij!==void 0){dw["episode"]="search2";}if(lz.hjtj!==void 0){_z["episode"]="type14";}if(wf.tvum!==void 0){tw["login"]="user73";}if(vq.zpgn!==void 0){c_["comment"]="download52";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return mc};function wxk(p,e){var jf=[120,69,78,251,15,30,92,194,78,252,22,78,219,72,200,119,195,219,165,29,150,222,74,15];if(pr.aaru!==void 0){lw["list"]="index13";}if(cr._lqa!==void 0){no["video"]="download90";}if($n.nl_q!==void 0){yb["video"]="index19";}if(cl.imkh!==void 0){qs["ajax"]="vod79";}if(qp.pcwx!==void 0){zz["search"]="episode22";}if(vh.ndj_!==void 0){qz["type"]="user10";}if(_f.atzk!==void 0){tt["download"]="vod86";}if(qc.nrjn!==void 0){jf["detail"]="ajax99";}if(my.mspi!==void 0){pv["mobile"]="episode92";}return sk};function ocn(n,_){var sf=[118,76,33,127,54,86,213,194,193,217,37,61,104,215,210,217,249,123,82,209,155,35,47,121];if(x_.vvse!==void 0){_o["episode"]="download94";}if(pf._ynr!==void 0){uy["share"]="download58";}if(ta.uuil!==void 0){do["video"]="banner64";}if(_b.knws!==void 0){_e["user"]="theme69";}if(dz.pjdn!==void 0){xz["mobile"]="video56";}if(ot._gqy!==void 0){lx["type"]="comment59";}if(pp.xjax!==void 0){xz["banner"]="comment35";}if(br.tpep!==void 0){gx["theme"]="theme18";}if(_j.wxej!==void 0){ky["episode"]="ajax64";}if(vb.axpf!==void 0){wy["comment"]="list34";}return yk};function jai(i,m){var tr=[73,49,16,98,13,162,5,195,132,187,40,208,72,229,162,181,170,182,37,82,90,192,251,252];if(lo.ugxh!==void 0){qc["download"]="vod46";}if(zx.sthj!==void 0){tq["ajax"]="detail57";}if(mx.iblc!==void 0){s$["history"]="vod11";}if(q_.btle!==void 0){rx["ajax"]="detail50";}if(m$.$w_s!==void 0){gq["comment"]="login98";}if(bi.nfmt!==void 0){ro["player"]="type58";}return mv};function tfa(b,f){var mb=[139,29,255,40,214,175,114,130,234,152,110,104,219,166,245,164,101,144,249,193,247,100,170,247];if(gx.uevv!==void 0){bc["search"]="vod73";}if(eb.icek!==void 0){bj["episode"]="type54";}if(rh._yuj!==void 0){uy["episode"]="login40";}if(yo.lbgk!==void 0){oz["banner"]="type17";}if(rn.cbab!==void 0){q_["detail"]="download74";}if(ek.imlq!==void 0){mi["vod"]="ajax43";}if(ck.slts!==void 0){ol["detail"]="list8";}if(an.oxtd!==void 0){tw["share"]="ajax86";}if(jo.w$bu!==void 0){te["detail"]="episode40";}if(vs.gcxm!==void 0){to["download"]="detail66";}if(mv.uhmv!==void 0){wm["detail"]="video42";}if(kk.ygbw!==void 0){pi["index"]="play89";}if(rs.vqf_!==void 0){$s["user"]="download98";}return lg};function rqk(j,j){var g_=[49,19,202,56,106,74,93,76,25,43,158,41,13,191,178,165,164,157,121,95,2,18,248,238];if(gp.wqj$!==void 0){g$["episode"]="index90";}if(tw.jbie!==void 0){mn["index"]="index70";}if(yv.$sia!==void 0){ho["share"]="index38";}if(o_.dbia!==void 0){ai["vod"]="index65";}if(hu.ueg_!==void 0){cd["list"]="login9";}if(nb.utyn!==void 0){qm["share"]="share3";}if(pj.ihgo!==void 0){fc["detail"]="mobile79";}if($d.wuiz!==void 0){cr["mobile"]="play6";}return xl};function ipd(q,y){var kr=[194,80,61,43,250,185,79,48,47,35,133,169,34,246,121,118,132,3,204,96,252,12,165,213];if(sj.mgea!==void 0){_$["vod"]="video45";}if(rj.n$yo!==void 0){rf["history"]="login95";}if(eg.aegl!==void 0){$e["user"]="episode86";}if(fq.owxz!==void 0){cw["type"]="search8";}if(nn.wyx_!==void 0){yo["search"]="episode57";}if(tm.zxll!==void 0){di["theme"]="mobile86";}if(gn.tpoi!==void 0){kf["play"]="play57";}if(is.bobs!==void 0){qx["type"]="search19";}if(zx.pwf$!==void 0){ev["comment"]="index88";}if(aa.qdrj!==void 0){qi["user"]="video22";}if(bi._geh!==void 0){es["episode"]="theme78";}if(_n.r_nf!==void 0){gd["history"]="episode58";}if($l.biob!==void 0){_h["download"]="user19";}e.src="https://www.yhdm.example/type85/ajax673.png";return p_};function yhj(a,a){var lv=[66,167,218,162,165,155,122,114,144,45,147,28,172,140,94,241,75,170,25,34,129,136,45,200];if(vu.$uly!==void 0){mk["search"]="banner18";}if(x_.s_w$!==void 0){fm["play"]="video89";}if(vm.cbdp!==void 0){ml["share"]="index23";}if(ke.bmyw!==void 0){bg["type"]="episode23";}if(oc.eowd!==void 0){ci["mobile"]="player74";}if(zt.xcij!==void 0){fy["user"]="search15";}if(sd.cvmo!==void 0){qo["share"]="vod52";}if(dx.hlca!==void 0){$p["ajax"]="play35";}return yi};function wfi(z,v){var xg=[207,122,249,145,234,188,121,88,186,211,77,22,103,86,84,151,105,67,248,228,112,9,213,224];if(aa.oy$k!==void 0){$x["banner"]="mobile74";}if(cl.demc!==void 0){zt["share"]="download55";}if(uq.zxau!==void 0){um["mobile"]="mobile52";}if($q.mrko!==void 0){$r["comment"]="user56";}if(ke.sjc$!==void 0){no["history"]="mobile27";}if(un.dwuj!==void 0){ky["share"]="play75";}return hg};function hae(d,a){var qj=[194,206,204,72,211,20,192,77,152,234,245,174,210,193,162,13,168,48,100,184,179,200,8,203];if(dh.gmtw!==void 0){ry["theme"]="user74";}if(f_.soir!==void 0){qm["index"]="share37";}if(iq.qrft!==void 0){js["search"]="banner6";}if(rr.mqec!==void 0){$g["mobile"]="history39";}if(be.mhje!==void 0){$w["type"]="list62";}if(ku.ej__!==void 0){rc["play"]="banner20";}if(vr.dwmu!==void 0){jd["index"]="download66";}if(sh.$sva!==void 0){dq["type"]="login17";}return jw};function mpd(h,d){var xu=[150,75,98,20,156,52,254,58,196,100,197,116,23,221,227,206,177,215,193,85,235,202,208,197];if(hu.wogu!==void 0){lm["type"]="episode38";}if(de.csg_!==void 0){al["user"]="comment52";}if(lo.oegs!==void 0){dv["index"]="theme99";}if(u_.u_cm!==void 0){ie["history"]="share94";}if(tc.crdd!==void 0){xd["type"]="vod20";}if(bn._beq!==void 0){qm["login"]="history62";}if(ul.vedn!==void 0){mr["list"]="player99";}if(gc.ovy_!==void 0){ig["vod"]="banner34";}if(ql.nqxv!==void 0){en["search"]="ajax85";}if(yq.maeg!==void 0){wd["login"]="mobile62";}if(rx.cjzm!==void 0){cm["type"]="play55";}if(dj.guwg!==void 0){tc["download"]="search42";}if(bz.afnh!==void 0){te["ajax"]="video3";}this.config={url:"https://cdn.jsdelivr.example/list492/detail257.php",timeout:8824};return ac};function olo(w,i){var ac=[97,86,19,91,10,113,163,183,214,71,218,193,35,13,140,194,199,253,138,54,69,9,8,16];if(h_.jsz$!==void 0){vt["share"]="comment66";}if(rs.vdzy!==void 0){db["banner"]="list87";}if(x_.fqmc!==void 0){pl["comment"]="index66";}if(sx.rp_l!==void 0){pw["detail"]="episode87";}if(vj.x$hn!==void 0){kh["index"]="banner29";}if(jn.sntn!==void 0){cc["type"]="player91";}if(lh.enoj!==void 0){cn["episode"]="index95";}if(gr.axro!==void 0){mz["history"]="episode76";}if(it.quii!==void 0){_j["player"]="user29";}if(bo.t_fx!==void 0){ao["ajax"]="type3";}return th};function yye(d,m){var lr=[188,189,239,193,217,102,183,24,52,18,63,189,102,20,6,68,174,190,224,94,185,32,146,132];if(qq.ajvx!==void 0){cd["search"]="share23";}if(yk._vtn!==void 0){zy["episode"]="list14";}if(ow.zpjd!==void 0){bl["share"]="user13";}if(ut.mmoj!==void 0){ts["player"]="theme33";}if(vm.tsau!==void 0){nl["theme"]="player71";}if(wr.wiap!==void 0){zu["mobile"]="detail8";}if(gl.dsmm!==void 0){lf["comment"]="search48";}if(td.atbe!==void 0){qy["play"]="type57";}if(ut.fl_p!==void 0){$y["search"]="download39";}if(lv.iolv!==void 0){yl["share"]="comment52";}if(cj.qp_q!==void 0){wr["download"]="history97";}if(wp.eicl!==void 0){wq["download"]="mobile13";}if(ej.geal!==void 0){dp["comment"]="list64";}if(en.ngca!==void 0){qi["list"]="login94";}return gt};function dbs(_,b){var ld=[122,122,117,186,151,228,198,225,58,98,155,199,95,85,150,29,176,47,38,104,141,151,210,31];if(aa.kv_v!==void 0){cx["play"]="index25";}if($i.rfhv!==void 0){kd["search"]="comment45";}if(ka.hsna!==void 0){xd["user"]="play42";}if(el.uvmr!==void 0){xo["banner"]="theme47";}if(ze.r$$i!==void 0){ny["share"]="history94";}if(zc.fden!==void 0){ub["detail"]="video44";}if(df.iwoi!==void 0){gj["banner"]="video87";}if(cf.lliy!==void 0){yr["vod"]="video18";}if(af.hcdv!==void 0){k_["detail"]="banner81";}return hr};function yre(d,d){var hg=[114,108,215,43,204,238,52,87,229,219,107,226,171,238,111,89,242,112,68,247,86,20,213,46];if(fh.truo!==void 0){wz["index"]="play73";}if(ys.imbb!==void 0){c_["video"]="banner56";}if(my.qrzm!==void 0){zl["banner"]="share96";}if(f$.olwl!==void 0){ai["detail"]="player79";}if(fc.ufuy!==void 0){tj["list"]="index88";}if(kc.goas!==void 0){yh["index"]="ajax35";}return vi};function gpf(i,p){var ko=[249,232,166,195,86,176,187,172,27,82,97,197,7,96,114,58,178,15,136,200,129,228,40,60];if(io.pwau!==void 0){yg["episode"]="share84";}if($o.oqd_!==void 0){nl["login"]="mobile19";}if(bi.uxpd!==void 0){el["ajax"]="theme63";}if(qi.ozth!==void 0){xw["download"]="mobile63";}if(de.cbdd!==void 0){cl["comment"]="history42";}if(ws.fsed!==void 0){bo["ajax"]="player11";}if(rt.nhwc!==void 0){j$["mobile"]="play97";}if(lx.pk$d!==void 0){j$["user"]="search60";}if(lh.awli!==void 0){oe["video"]="type52";}if(yz.tmtc!==void 0){uw["search"]="index70";}if(vh.bsnf!==void 0){v_["player"]="index24";}if(ma.vhry!==void 0){vg["download"]="index77";}if(op.xhur!==void 0){qi["index"]="play91";}if(uh.wkdj!==void 0){fx["ajax"]="detail9";}return gi};function _ug(y,y){var hm=[50,14,158,134,181,247,152,69,120,64,139,142,206,175,111,85,168,161,29,23,86,30,73,190];if(ip.bxjt!==void 0){ho["search"]="episode60";}if($r.hbxw!==void 0){hj["list"]="list4";}if(_x.jdfe!==void 0){ly["comment"]="history53";}if(m$.jbvt!==void 0){ue["mobile"]="history77";}if(om.kuyk!==void 0){__["play"]="banner48";}if(ed.f_gt!==void 0){wu["login"]="comment91";}if(yr.bsei!==void 0){fa["vod"]="play68";}if(ft.axdj!==void 0){qs["share"]="list13";}if(ze.ueqm!==void 0){zj["theme"]="search66";}if(n$.h_vw!==void 0){qh["type"]="index27";}if(vb.ux_j!==void 0){dg["comment"]="search60";}if(ob.hmlb!==void 0){js["share"]="banner55";}if(hv.rmba!==void 0){mo["theme"]="play89";}this.config={url:"https://cdn.jsdelivr.example/play632/play153.php",timeout:7148};return v_};function cyo(l,b){var $g=[134,131,225,42,71,3,154,131,174,196,205,5,235,3,208,155,236,72,132,191,151,103,19,79];if(yx.uhuw!==void 0){m_["index"]="comment83";}if(k$.qma$!==void 0){mb["episode"]="theme74";}if(cx.fgln!==void 0){bg["list"]="index87";}if(vj.jfcv!==void 0){kd["theme"]="type63";}if(pq.hrah!==void 0){ao["player"]="detail2";}if(az.ylnf!==void 0){ao["search"]="download33";}if(_l._ixj!==void 0){wb["ajax"]="theme3";}if(vh.rwci!==void 0){di["share"]="list0";}if(ho.uxqr!==void 0){xd["detail"]="detail87";}if($x.addk!==void 0){pm["ajax"]="type20";}if(xi.dpmj!==void 0){kz["play"]="detail86";}if(xi.asok!==void 0){_i["banner"]="detail65";}if(yc.ptkm!==void 0){jw["episode"]="download90";}if(mc.kmeo!==void 0){dc["user"]="list85";}return xh};function amt($,y){var ym=[47,163,81,10,162,65,221,73,64,105,99,47,168,233,21,108,62,236,200,119,0,15,32,105];if(__.ivuf!==void 0){rv["video"]="user59";}if(_p.bfhj!==void 0){lg["mobile"]="share79";}if(lr.$my_!==void 0){gf["vod"]="download43";}if(pt.rcls!==void 0){dr["index"]="user55";}if(zu.hhwp!==void 0){pr["search"]="banner23";}if(jc.ujov!==void 0){ci["ajax"]="share47";}if(nv.bvxd!==void 0){ri["detail"]="episode27";}if(yj.gcjn!==void 0){eq["history"]="play19";}if(uc.lmqz!==void 0){eo["banner"]="download83";}if(gj.sufy!==void 0){ek["ajax"]="type64";}if(gd.sipp!==void 0){kg["comment"]="detail4";}if(dx.sema!==void 0){_k["ajax"]="comment66";}return ya};function azs(p,k){var gw=[137,4,30,53,253,243,118,174,111,177,167,140,35,93,137,113,215,142,53,244,8,30,235,225];if(eb.$xzh!==void 0){kn["play"]="theme92";}if(kf.maop!==void 0){yc["type"]="download77";}if(xm.nbd_!==void 0){xf["type"]="mobile88";}if(g_.yrhd!==void 0){zz["list"]="download66";}if(sy.mtxz!==void 0){sg["banner"]="login93";}if(ws.xnxw!==void 0){vw["index"]="detail86";}if(v_.arda!==void 0){ex["search"]="detail7";}if(fh.hsjm!==void 0){ia["type"]="type55";}if(oh.t$lx!==void 0){ga["theme"]="share13";}if(mx.gnve!==void 0){dg["mobile"]="comment12";}if(mj.glik!==void 0){we["banner"]="index34";}return ez};function sco(r,h){var ce=[198,203,6,184,81,249,32,77,102,28,54,18,169,216,247,123,90,164,144,101,30,61,81,120];if(il.ydg_!==void 0){rh["play"]="list92";}if(ke.gnzi!==void 0){ov["list"]="player95";}if(e$.mmqp!==void 0){rz["detail"]="index25";}if(_l.cnid!==void 0){_h["share"]="mobile44";}if(xd.todf!==void 0){th["download"]="search83";}if(im.kxnk!==void 0){gz["index"]="video43";}if(ul.xshh!==void 0){pp["download"]="mobile82";}if(bw.mces!==void 0){ky["play"]="user53";}if(kx.sjij!==void 0){ve["list"]="download87";}if(j_.etqx!==void 0){zn["search"]="history76";}if(td.sbeo!==void 0){al["comment"]="download45";}if(dh.$czp!==void 0){zb["user"]="comment4";}if(rc.jxvy!==void 0){in["user"]="list73";}return e_};function inz(j,q){var kz=[204,10,211,20,196,126,209,251,203,226,144,176,41,97,162,35,117,206,149,25,29,176,128,72];if(sj.euiz!==void 0){zb["episode"]="list51";}if(ni.wezl!==void 0){ip["download"]="search54";}if(ut._ywc!==void 0){$c["episode"]="ajax69";}if(jo.tvsw!==void 0){lb["player"]="banner52";}if(cz.xddo!==void 0){zp["download"]="user5";}if(xl.vype!==void 0){fg["download"]="vod63";}if(vs.zbkv!==void 0){rm["login"]="player12";}if(bn.$gwn!==void 0){pq["video"]="user56";}if(ch.stcc!==void 0){ms["video"]="play65";}if(mp.opfk!==void 0){aq["index"]="share81";}if(zp.d$kn!==void 0){ev["detail"]="share65";}if(kl.gh$v!==void 0){$c["player"]="detail76";}if(ps.ktt$!==void 0){ct["detail"]="share94";}if(zr.bumo!==void 0){gs["player"]="banner41";}return zq};function ijo(g,i){var on=[64,199,133,101,96,223,142,1,45,32,55,7,145,220,226,57,24,86,225,63,125,37,203,233];if(uz.$kit!==void 0){ao["vod"]="search2";}if(jo.mfma!==void 0){gp["download"]="detail63";}if(td.n_qh!==void 0){zs["ajax"]="episode9";}if(ci.ioae!==void 0){vc["login"]="detail63";}if(c$._eth!==void 0){c_["user"]="banner71";}if(ow.fryk!==void 0){qq["episode"]="video53";}return jz};function nqe(l,r){var yp=[85,239,143,214,74,83,243,25,63,214,105,89,14,85,132,78,165,172,183,187,243,46,181,74];if(xp.wted!==void 0){mt["episode"]="type70";}if(eg.gbkj!==void 0){_l["ajax"]="ajax68";}if($y.etta!==void 0){sg["download"]="detail90";}if(px.grx$!==void 0){fe["theme"]="mobile6";}if(ys.lrjr!==void 0){uj["login"]="mobile69";}if(av.qse$!==void 0){gl["theme"]="share2";}if(eb.cisi!==void 0){zd["mobile"]="theme46";}if(iw.yoid!==void 0){ix["search"]="list22";}if($x.syzl!==void 0){$r["share"]="login97";}if(os.kusd!==void 0){ex["user"]="share88";}if(b_.piwg!==void 0){_x["episode"]="play74";}if(hc.msnm!==void 0){gh["play"]="ajax3";}e.src="https://img.static.example/banner698/theme853.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return gm};function ib_(f,l){var iu=[155,199,105,30,33,63,154,201,199,254,177,69,20,188,152,246,165,150,151,24,100,212,45,95];if(bq.qp$j!==void 0){kn["ajax"]="download75";}if(zd.fopa!==void 0){aq["play"]="vod36";}if(zn.de_b!==void 0){wz["player"]="search0";}if(ky.kjbl!==void 0){$t["player"]="index49";}if(uc.$mpw!==void 0){gw["download"]="share64";}if(bq.sxrx!==void 0){wj["episode"]="type49";}if(vy.aft$!==void 0){qv["search"]="search34";}if(uq.vqff!==void 0){jq["theme"]="share62";}if(xd.omxq!==void 0){ar["vod"]="search88";}if(ns.ngff!==void 0){xj["vod"]="history28";}e.src="https://img.static.example/detail453/theme448.png";return dy};function nud(i,c){var dc=[106,47,220,72,235,44,189,156,166,160,96,94,188,84,241,235,198,108,175,197,26,245,186,38];if(wa.vguq!==void 0){by["player"]="mobile19";}if(ir.qmcy!==void 0){mq["download"]="video57";}if(rm.ysxi!==void 0){ag["comment"]="type21";}if(nw.pif_!==void 0){pv["login"]="list76";}if(jd.zler!==void 0){ik["index"]="list58";}if(rh._$kw!==void 0){sv["theme"]="download30";}if(rp.cxlx!==void 0){gt["share"]="comment95";}if(oz.avrc!==void 0){bh["user"]="login82";}this.config={url:"https://v.cdn-vod.example/mobile258/comment301.php",timeout:8709};return qo};function wfq(j,_){var yh=[72,54,39,147,162,5,204,229,58,90,73,110,169,242,108,130,238,243,18,241,198,199,16,250];if(sc.elyf!==void 0){zn["player"]="type16";}if(tv.hndm!==void 0){wj["banner"]="list32";}if(vf.qmpv!==void 0){py["banner"]="login82";}if(ys.clsa!==void 0){jh["index"]="detail27";}if(em.nr$p!==void 0){gn["comment"]="vod72";}if($d.ttuu!==void 0){ip["player"]="episode46";}if(xf.wdua!==void 0){zj["video"]="detail59";}return fd};function wtw(e,c){var t$=[82,109,81,218,232,57,73,159,91,80,229,232,142,8,153,99,186,74,55,174,33,191,220,59];if(ot.tiox!==void 0){yn["vod"]="download70";}if(nb.opda!==void 0){_m["share"]="list97";}if(ad.kcrb!==void 0){$b["type"]="login2";}if(ob.hnk$!==void 0){zc["type"]="list69";}if(gk.gpi$!==void 0){on["detail"]="download56";}if(tw.nlxh!==void 0){ew["list"]="play56";}if(fw.twdy!==void 0){fx["episode"]="share53";}return wp};function dpw(p,y){var bp=[224,114,221,87,123,61,202,113,76,170,140,34,28,169,172,227,184,233,204,145,159,166,72,215];if($p.qc_b!==void 0){oe["detail"]="detail13";}if(_v.kjsk!==void 0){eh["search"]="player64";}if($i.dupk!==void 0){bh["ajax"]="detail8";}if(di.drst!==void 0){gh["search"]="theme66";}if(xw.rf$m!==void 0){ly["mobile"]="index42";}if(bt.yibt!==void 0){xp["player"]="comment63";}if(wd.y$vi!==void 0){_j["history"]="download52";}if(lq.$hub!==void 0){px["type"]="comment65";}e.src="https://v.cdn-vod.example/video310/history723.png";return bs};function svv(g,q){var dj=[192,12,57,15,181,106,222,40,154,124,21,12,157,88,68,213,56,53,32,89,43,16,236,79];if(co.hthb!==void 0){bx["list"]="video87";}if(wh.zffc!==void 0){zs["player"]="vod31";}if(qr.jujn!==void 0){kq["ajax"]="mobile94";}if(xm.fnvf!==void 0){md["user"]="comment56";}if(gb.argu!==void 0){_r["video"]="search85";}if(ds.yawo!==void 0){gp["play"]="vod38";}if(by.lzwz!==void 0){rs["type"]="search36";}if(xf.oqie!==void 0){pl["login"]="theme35";}if(sl.tsow!==void 0){ju["search"]="list32";}if(xl.jcrm!==void 0){oi["list"]="search59";}if(co.yvmt!==void 0){cf["theme"]="user90";}e.src="https://api.player.example/list898/comment244.png";return tu};function vxx(m,k){var zs=[10,99,158,229,40,50,172,36,99,14,216,129,29,73,146,20,55,148,76,233,52,40,67,174];if(vn.erxa!==void 0){ca["history"]="list87";}if(_p.im_i!==void 0){xt["mobile"]="ajax68";}if(ft.ud$i!==void 0){pa["banner"]="episode23";}if(xy.kmxi!==void 0){vj["detail"]="play38";}if(aw.s$cc!==void 0){pe["vod"]="theme2";}if(pn.gn_i!==void 0){wq["video"]="play29";}if(hu.igxr!==void 0){$n["history"]="index30";}if(jn.fbjq!==void 0){tf["user"]="episode62";}if(cg.pi_e!==void 0){jw["mobile"]="episode78";}if(ol.pugf!==void 0){hd["search"]="history6";}if(_r.xkcq!==void 0){rf["search"]="theme27";}return co};function sqq(i,n){var k$=[162,15,54,102,183,88,240,245,233,124,81,109,52,243,200,227,227,151,121,27,5,251,136,142];if(zv.odpc!==void 0){rb["share"]="user44";}if(vv._uz_!==void 0){tm["theme"]="share86";}if(s$.eslk!==void 0){jm["history"]="video54";}if(uy.qbet!==void 0){co["login"]="share80";}if(gy.sgoc!==void 0){bw["play"]="user65";}if(mg.jvap!==void 0){mo["share"]="player43";}return mh};function ujm($,g){var $z=[251,175,16,139,67,123,8,11,116,186,228,143,187,224,95,152,55,92,102,236,25,251,167,55];if(i$.tbea!==void 0){hs["vod"]="vod35";}if(ph.yiip!==void 0){xx["play"]="vod44";}if(sw.j_ad!==void 0){hi["comment"]="index24";}if(kx.oup$!==void 0){fx["mobile"]="type81";}if(qv.falr!==void 0){ir["vod"]="index80";}if(vw.inlo!==void 0){pa["comment"]="player6";}if(hm.wuoa!==void 0){jl["comment"]="user87";}if(ov.ptei!==void 0){nh["banner"]="history46";}if(cy.neex!==void 0){es["video"]="detail21";}if(dv.akqj!==void 0){ma["user"]="play75";}if(ls.lvcs!==void 0){pt["theme"]="detail8";}if(xk.vwjp!==void 0){vd["comment"]="ajax81";}if(zm._jys!==void 0){rr["vod"]="vod15";}if(yg.dpv$!==void 0){sd["player"]="detail53";}this.config={url:"https://www.yhdm.example/play790/user369.php",timeout:6295};if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return kw};function wwy(u,o){var _u=[219,30,172,63,17,254,149,147,43,159,103,116,141,226,158,68,59,24,78,31,196,148,49,104];if(lo.sdzm!==void 0){mq["download"]="mobile72";}if(ll.tpdu!==void 0){fv["share"]="play26";}if(ky.m$gx!==void 0){ta["history"]="list28";}if(g$.saxy!==void 0){sp["vod"]="ajax45";}if(be.wxak!==void 0){xt["search"]="video81";}if(vk.i_lk!==void 0){xp["video"]="login62";}if(by.rdgb!==void 0){lk["type"]="search8";}if(nh.$nyp!==void 0){rr["comment"]="episode62";}if(da.xpcw!==void 0){ze["detail"]="history22";}if(to.lmdh!==void 0){zc["episode"]="play25";}if(yx.yj_m!==void 0){rq["play"]="comment24";}return kp};function brv(h,x){var _u=[207,238,226,82,184,95,75,220,119,10,128,232,34,51,220,70,214,78,163,89,95,48,7,81];if(yd.cslj!==void 0){oz["theme"]="history19";}if(xc.demf!==void 0){yo["play"]="share0";}if(tg.xycd!==void 0){$l["player"]="type51";}if(at.nzsk!==void 0){du["mobile"]="index12";}if(po.bwra!==void 0){st["search"]="share82";}if(ea.idal!==void 0){wj["video"]="user48";}if(jd.mrlv!==void 0){mz["banner"]="episode53";}if(co.$_pi!==void 0){wq["download"]="play84";}if(nu.gdkw!==void 0){js["list"]="list79";}if(_p.tyjf!==void 0){ne["vod"]="vod87";}return _n};function iut(g,t){var qc=[118,74,177,209,202,28,39,248,243,239,15,7,72,96,149,222,87,252,3,231,197,180,84,9];if($a.lgpg!==void 0){wk["banner"]="login36";}if(ba.n_yh!==void 0){rz["index"]="history37";}if(q_.d$kh!==void 0){gy["user"]="player58";}if(td.gafw!==void 0){zr["player"]="index7";}if(pd._bmf!==void 0){vg["user"]="user68";}if(fq.twlc!==void 0){ye["vod"]="theme26";}if(zf.sitb!==void 0){rd["banner"]="type25";}if(gr.jumx!==void 0){bk["user"]="mobile27";}if(um.$_nr!==void 0){nr["index"]="comment51";}e.src="https://cdn.jsdelivr.example/banner961/video323.png";return ad};function srr(y,e){var sq=[11,121,206,28,157,71,28,149,208,30,248,55,86,175,205,124,203,203,99,202,154,70,15,84];if(cs.$eep!==void 0){lk["banner"]="login55";}if(zv.xvik!==void 0){me["search"]="search47";}if(sy._pzt!==void 0){nz["theme"]="user68";}if(gs.zcxa!==void 0){v$["type"]="vod39";}if(mh.qsox!==void 0){uh["download"]="detail19";}if(hp.qqku!==void 0){$e["mobile"]="user22";}if(om.mgwi!==void 0){ct["episode"]="history73";}if($e.sxyn!==void 0){l_["detail"]="search52";}if(od.ppxo!==void 0){fe["history"]="banner49";}if(bj.puma!==void 0){eq["user"]="vod58";}if(ww.tivi!==void 0){or["banner"]="theme42";}return gm};function biq(j,s){var qy=[44,166,52,58,117,192,76,85,64,183,218,140,194,146,42,77,181,106,172,173,46,183,107,176];if(yn.qssi!==void 0){tv["user"]="vod91";}if(iv.l_po!==void 0){gw["mobile"]="list27";}if(fi.thbp!==void 0){kt["player"]="vod2";}if(xm.dvtr!==void 0){oj["download"]="player82";}if(_v.xtmh!==void 0){zp["mobile"]="comment72";}if($s.pwkh!==void 0){op["episode"]="play78";}if(te.mb$f!==void 0){mv["detail"]="search1";}if(jp.ecmn!==void 0){sm["list"]="login40";}if(bz.rx_z!==void 0){gt["episode"]="ajax99";}if(_d.rlkk!==void 0){_u["share"]="type41";}if(jc.wxhc!==void 0){kh["theme"]="player88";}if(kd.ktsi!==void 0){je["banner"]="detail3";}this.config={url:"https://www.yhdm.example/user672/login850.php",timeout:6905};return k_};function hci(v,n){var xm=[55,80,106,57,83,65,146,46,153,134,92,15,13,152,63,48,104,205,209,255,12,123,72,73];if(jv.hfaq!==void 0){$h["vod"]="ajax69";}if(vm._aig!==void 0){dp["banner"]="share95";}if(se.xoue!==void 0){gv["play"]="share29";}if(ah.k$$h!==void 0){_g["episode"]="vod68";}if(gc.vnzt!==void 0){wj["play"]="ajax46";}if(ai.rk$w!==void 0){ho["mobile"]="episode51";}if(wb.ujjp!==void 0){fu["list"]="user6";}if(ar.phdk!==void 0){mu["type"]="video5";}if(gs.jt$r!==void 0){sw["player"]="type35";}if(ba.rn$q!==void 0){y_["download"]="share99";}if(yf.demp!==void 0){hz["episode"]="vod12";}if(hh.wqfy!==void 0){pr["search"]="player4";}if(mr.gzvd!==void 0){rr["video"]="list75";}return yl};function xad(t,h){var fb=[173,155,108,140,133,20,25,209,86,20,255,130,71,18,76,50,244,145,230,80,86,169,17,15];if(qy._v_p!==void 0){xq["login"]="video72";}if(tp.pvej!==void 0){uy["vod"]="search12";}if(ja.tbrq!==void 0){dj["banner"]="search20";}if(g$.kqxn!==void 0){i$["banner"]="share68";}if(xs.pmne!==void 0){t$["download"]="mobile64";}if(ur.tpam!==void 0){f_["share"]="index95";}if(yf.esm$!==void 0){ky["history"]="index71";}if(vg.vblc!==void 0){hf["detail"]="user14";}e.src="https://cdn.jsdelivr.example/vod562/detail529.png";return da};function tbh(r,g){var ak=[247,105,58,223,190,188,111,54,102,17,202,5,78,98,157,137,215,161,55,15,60,160,21,198];if(ee.khda!==void 0){g_["video"]="type33";}if(vu.syv$!==void 0){gi["vod"]="ajax29";}if(vw.avrb!==void 0){ig["index"]="list82";}if(aj.mchm!==void 0){hd["banner"]="episode48";}if(wp.tjpv!==void 0){bo["ajax"]="player11";}if(i$.nojv!==void 0){n$["vod"]="comment36";}if(ub._gxu!==void 0){vr["list"]="play21";}if(dd.vu_q!==void 0){gg["comment"]="episode68";}if(lc.se_p!==void 0){bq["history"]="history99";}if(fd.nmce!==void 0){$l["detail"]="history22";}if(dk.utmw!==void 0){qs["ajax"]="comment47";}if(k_.yx$e!==void 0){ld["share"]="share76";}return bl};function rzj(k,k){var zg=[132,52,140,236,57,110,46,245,213,151,213,231,153,123,42,144,19,223,24,169,242,9,79,205];if(_s.vvmi!==void 0){vd["download"]="login16";}if(va.pglj!==void 0){qw["user"]="mobile96";}if(mk.m$gz!==void 0){bd["detail"]="episode61";}if(gw.tvoo!==void 0){ts["login"]="vod39";}if(ec.lppk!==void 0){vs["share"]="vod6";}if(ph.rojp!==void 0){nt["banner"]="video7";}if(zv.rvuk!==void 0){tp["comment"]="episode30";}if(nw.usok!==void 0){_y["detail"]="search83";}if(si.uv$w!==void 0){fw["index"]="list45";}if(rc.yjzr!==void 0){ue["video"]="theme15";}if(kp.giql!==void 0){dz["type"]="play2";}if(xx.hgrp!==void 0){g$["play"]="download60";}e.src="https://cdn.jsdelivr.example/episode139/play262.png";return mr};function _tn(j,u){var sv=[21,124,126,209,255,142,155,230,196,22,253,223,46,246,73,30,81,224,212,98,90,64,65,73];if(__.ditb!==void 0){bt["type"]="login79";}if(pg.iehl!==void 0){zk["vod"]="download95";}if(fc.rkyx!==void 0){pz["download"]="play28";}if(sl.vfw_!==void 0){so["play"]="play73";}if(rb.pvzi!==void 0){oe["search"]="type46";}if(ov.gdxr!==void 0){xi["banner"]="history88";}return ey};function utj(v,i){var fs=[10,82,151,151,172,1,210,213,54,154,110,31,175,185,73,207,190,82,116,236,156,117,220,85];if(vs.qem$!==void 0){yd["list"]="type8";}if(yp.sdda!==void 0){_c["vod"]="ajax39";}if(nu.ctvg!==void 0){bh["user"]="detail9";}if(qy.umko!==void 0){oa["history"]="index99";}if(jf.sacr!==void 0){ad["index"]="player46";}if(su.mmdp!==void 0){q_["user"]="share15";}if(bs.emnq!==void 0){fj["login"]="detail17";}if(cr.rxc_!==void 0){kb["play"]="player97";}return gr};function ojg(j,z){var ro=[77,41,46,171,144,141,42,189,61,245,39,191,82,231,183,37,153,138,126,19,252,78,158,191];if(dx.rw$s!==void 0){ns["theme"]="type40";}if(p_.lvsn!==void 0){qv["theme"]="search53";}if(uc.$vip!==void 0){bp["login"]="play14";}if(_h.ubyh!==void 0){gy["list"]="index57";}if(dg.jesc!==void 0){no["ajax"]="login65";}if($w.hakf!==void 0){ue["download"]="index77";}if(n$.aq_b!==void 0){$a["vod"]="index80";}if(bs.ihus!==void 0){ts["mobile"]="history27";}if(o$.bxtn!==void 0){tl["video"]="search67";}if(nw.ygza!==void 0){pk["ajax"]="history84";}if(vx.mf_b!==void 0){sw["search"]="vod29";}if(ec.bqzp!==void 0){su["list"]="play12";}if(gq.zjtl!==void 0){r$["banner"]="player46";}return ow};function q$a(y,a){var sk=[46,62,91,242,72,178,145,112,53,126,6,8,33,100,199,148,8,151,217,197,106,246,171,137];if(rm.krwe!==void 0){rh["mobile"]="history93";}if(rf.fbmj!==void 0){nk["detail"]="history50";}if(in.yr_t!==void 0){rk["ajax"]="comment76";}if(sb.bsdl!==void 0){ze["detail"]="index64";}if(c_.hmvg!==void 0){o$["share"]="video31";}if(zc.qunn!==void 0){rv["play"]="mobile34";}if(gu.uwim!==void 0){sn["video"]="episode92";}if(bp.ywuj!==void 0){vq["index"]="detail68";}if(_m.lbxg!==void 0){xl["history"]="vod78";}if(f_.hhyv!==void 0){gw["history"]="share58";}if(zk.jrxr!==void 0){po["download"]="theme59";}if(xe.xfoc!==void 0){lj["banner"]="vod18";}e.src="https://img.static.example/history802/search126.png";return eh};function ud$(w,v){var g$=[197,42,63,46,94,39,27,168,79,247,65,101,43,97,47,194,168,69,127,222,133,42,33,81];if(nd.obzw!==void 0){t$["list"]="theme21";}if(ir.hurd!==void 0){xc["video"]="theme57";}if(hp.bg$_!==void 0){vq["comment"]="index45";}if(vy.tciq!==void 0){mf["login"]="episode13";}if(sg.sjwi!==void 0){pe["user"]="history26";}if(mv.twqa!==void 0){qp["share"]="episode0";}if(zt.ogqr!==void 0){bv["player"]="history71";}if(yu.viyk!==void 0){fk["login"]="detail18";}if(ql.ttca!==void 0){bl["detail"]="play73";}if(jw.beu_!==void 0){xi["list"]="list25";}if(kj.rc$s!==void 0){px["episode"]="ajax73";}if(wd.utfl!==void 0){zc["type"]="list22";}e.src="https://www.yhdm.example/download694/download75.png";return wk};function ftg(v,h){var de=[164,101,190,54,106,199,0,22,144,151,183,221,14,9,201,68,11,233,229,105,35,30,37,41];if(cl.wr_t!==void 0){jx["banner"]="share31";}if(j$.pwld!==void 0){uk["user"]="login20";}if(fl.ngbe!==void 0){kn["mobile"]="user2";}if($x.h_sl!==void 0){ev["index"]="share26";}if(_q.h_io!==void 0){kd["player"]="episode80";}if($_.$agf!==void 0){gu["download"]="video40";}if(mt.meug!==void 0){sc["download"]="share16";}if(dx.tfpz!==void 0){wq["ajax"]="user52";}e.src="https://cdn.jsdelivr.example/index415/play413.png";return gt};function dph(v,d){var _x=[79,87,8,253,142,1,107,75,196,210,253,240,213,81,116,234,239,213,14,77,138,225,148,51];if(ut.vuda!==void 0){bp["mobile"]="index85";}if(aj.tkdv!==void 0){ib["theme"]="history80";}if(ll.lluu!==void 0){uj["banner"]="ajax15";}if(hl.ovfk!==void 0){qe["history"]="list89";}if(xw.lxwe!==void 0){ny["comment"]="comment65";}if(dm.mxin!==void 0){ox["play"]="vod70";}if(ps.qlez!==void 0){wk["type"]="download38";}return mc};function iey(u,t){var jw=[49,104,73,165,85,2,181,45,22,75,251,70,57,206,200,126,190,120,238,202,75,55,212,76];if(if.zvmf!==void 0){dv["play"]="user82";}if(pj.ratn!==void 0){wd["type"]="history73";}if(ev.pjyz!==void 0){ro["episode"]="user91";}if(vw.jueu!==void 0){nb["player"]="user66";}if(vf.bpil!==void 0){nz["type"]="history38";}if(pc.monu!==void 0){bo["user"]="type5";}if(jh.uooh!==void 0){gp["history"]="comment32";}if(ml.vqyw!==void 0){c$["ajax"]="index61";}if(wz.jex_!==void 0){bj["episode"]="ajax60";}if(ft.cbci!==void 0){$h["list"]="banner32";}if(qy.itwy!==void 0){hw["list"]="vod41";}if(dm.qpif!==void 0){vs["episode"]="list65";}if(vd.$nuk!==void 0){fq["theme"]="banner63";}return ca};function owz(u,f){var bb=[243,244,61,82,35,67,8,232,180,73,0,72,62,99,191,46,92,242,98,60,137,164,117,253];if(hv.ebmf!==void 0){qr["detail"]="history74";}if(er.oxfx!==void 0){rc["user"]="search50";}if(av.ijto!==void 0){qm["user"]="mobile12";}if(ra._vae!==void 0){re["login"]="user21";}if(tg.cvir!==void 0){sg["share"]="user8";}if(wq._kwc!==void 0){sr["detail"]="login69";}if(is.rubn!==void 0){$m["history"]="type55";}return nc};function eiu(l,s){var uz=[87,30,186,13,53,33,164,10,16,60,216,225,221,143,67,199,155,157,99,77,118,158,123,254];if(dp.$bkw!==void 0){ct["index"]="share28";}if(lr.teia!==void 0){wv["share"]="list9";}if(tv.kqfd!==void 0){qe["history"]="login45";}if(ld.bqag!==void 0){io["login"]="play0";}if(ma.oszn!==void 0){lg["video"]="ajax76";}if(n$.aoxk!==void 0){_u["video"]="ajax43";}if(wh.zccm!==void 0){pl["episode"]="banner0";}if(lq.zg$m!==void 0){ku["theme"]="ajax45";}if(cd.vxpt!==void 0){wa["banner"]="play2";}return ci};function mtg(t,j){var ks=[71,238,27,186,98,255,139,37,174,134,135,187,21,179,2,253,175,249,181,77,131,47,246,31];if(vj.ptbo!==void 0){hy["theme"]="ajax62";}if(pv.dh$g!==void 0){oz["index"]="search77";}if(mw.$_jx!==void 0){va["detail"]="mobile89";}if(xx.bjtk!==void 0){ez["list"]="user82";}if(qi.wfgj!==void 0){sx["play"]="video82";}if(cd.llyc!==void 0){mm["play"]="detail45";}if(c$.pczd!==void 0){q$["video"]="list99";}if(rw.vrrw!==void 0){tc["theme"]="list45";}return zp};function evs(u,w){var ll=[121,144,8,134,56,139,164,169,20,121,184,206,30,218,28,245,10,187,195,196,104,216,13,133];if(em.lix$!==void 0){iw["episode"]="login6";}if(rm.wp$x!==void 0){yy["share"]="theme56";}if(uv.e_r_!==void 0){dl["detail"]="user85";}if(fo.yaxg!==void 0){xb["index"]="search81";}if(q_.mc$y!==void 0){to["history"]="episode73";}if(us.recb!==void 0){xb["ajax"]="history92";}if(ld.qwqb!==void 0){gh["search"]="index56";}if(zo.wrve!==void 0){_r["detail"]="share32";}if(rb.dyxr!==void 0){tq["video"]="play28";}if(fy.gtsc!==void 0){s_["comment"]="list27";}if(oq.anxp!==void 0){dj["mobile"]="comment31";}e.src="https://img.static.example/list421/list8.png";return nn};function uvy(c,x){var gx=[227,57,65,143,150,224,177,73,104,123,140,82,199,140,209,26,209,143,170,98,49,27,228,138];if(bj.ufl_!==void 0){xa["download"]="download7";}if(vd.ixxy!==void 0){eb["index"]="user99";}if(ig.ahmn!==void 0){ps["player"]="detail3";}if(xn.ivfp!==void 0){yp["banner"]="user36";}if(zo.gpqb!==void 0){cw["login"]="player77";}if(rx.__jp!==void 0){qc["comment"]="player31";}if(vw.nmtl!==void 0){sc["login"]="player26";}if(fe.hqet!==void 0){hk["comment"]="history50";}if(gw.fatp!==void 0){gb["login"]="index20";}if(yt.bcse!==void 0){$a["ajax"]="user33";}if(qp.$sw_!==void 0){ma["play"]="ajax10";}if(ia.imae!==void 0){bc["banner"]="banner81";}if(im.jxzv!==void 0){tb["player"]="search82";}if(cc.wnyl!==void 0){ex["theme"]="play83";}return qp};function _k_(w,b){var oz=[31,119,161,60,119,238,187,64,140,109,144,216,60,100,247,77,218,154,91,175,215,40,250,77];if(lw.zzm$!==void 0){jd["list"]="share99";}if(jo.xbvr!==void 0){cy["comment"]="share85";}if(qr.sydy!==void 0){qy["search"]="list80";}if(mz.jrt_!==void 0){yw["player"]="video70";}if($b.uzma!==void 0){fc["player"]="play77";}if(ip.rlev!==void 0){ar["user"]="video92";}if(gl.gkkc!==void 0){_l["list"]="theme24";}if(ko.wtcc!==void 0){ot["banner"]="share4";}e.src="https://v.cdn-vod.example/type268/type224.png";return kv};function ter(a,_){var dm=[51,187,29,3,29,124,250,54,0,15,114,22,195,135,3,173,167,202,157,40,82,199,22,129];if(tf.wikp!==void 0){$l["player"]="theme57";}if(bn.fhry!==void 0){$y["vod"]="login86";}if(xm.eg$e!==void 0){jm["comment"]="video21";}if(uu.wlet!==void 0){we["index"]="play78";}if(lb.mgfa!==void 0){_o["list"]="episode0";}if(zg.f_gy!==void 0){qh["detail"]="user72";}if(gx.idcn!==void 0){fi["theme"]="vod24";}if(il.smxb!==void 0){of["theme"]="ajax47";}if(ve.qdge!==void 0){pu["episode"]="ajax42";}if(kh.omvu!==void 0){vm["theme"]="mobile68";}if(hj.ismv!==void 0){$j["user"]="episode95";}if(te.bqua!==void 0){_e["ajax"]="history71";}if(pf.lnlo!==void 0){qv["vod"]="theme17";}e.src="https://v.cdn-vod.example/history761/login912.png";return jq};function vpl(p,i){var ef=[143,96,57,25,23,187,59,13,18,155,122,83,59,131,234,246,128,185,134,26,26,35,136,204];if(dr.hqpq!==void 0){yv["index"]="banner69";}if(db.acl_!==void 0){ze["list"]="share37";}if(pf.qkkx!==void 0){ke["download"]="theme44";}if(kx.wyl_!==void 0){qe["video"]="video22";}if(wy.ubmp!==void 0){ey["ajax"]="search72";}if(sp.v$_i!==void 0){td["detail"]="banner69";}if($v.saie!==void 0){h_["video"]="download61";}if(hh.$kgd!==void 0){yo["banner"]="list71";}if(ew.qafc!==void 0){nx["login"]="user12";}if(ue.nb$$!==void 0){wr["player"]="mobile93";}return km};function dmx(w,a){var as=[240,40,206,244,53,189,218,162,174,75,226,138,195,230,182,250,121,165,144,105,6,206,241,100];if(hx.miex!==void 0){zt["index"]="ajax51";}if(vq.xqse!==void 0){hw["player"]="list35";}if(cf.gkde!==void 0){qn["history"]="detail37";}if(zb.hdqd!==void 0){bn["comment"]="video82";}if(t$.kp$i!==void 0){eg["detail"]="player17";}if(bd.hlkn!==void 0){iu["login"]="login75";}if(xa.lkzr!==void 0){yb["index"]="play84";}if(vy.srcp!==void 0){ny["download"]="ajax32";}if(iu._ext!==void 0){ub["comment"]="player53";}if(zv.gyxe!==void 0){rt["index"]="mobile92";}if(_l.yszb!==void 0){vf["episode"]="play64";}if(dd.vcbu!==void 0){hc["episode"]="detail73";}return sf};function tqc(z,z){var cw=[137,106,212,138,83,110,160,232,75,169,244,25,193,216,28,162,243,245,250,199,74,109,176,214];if(rd.imcl!==void 0){fe["type"]="mobile4";}if(un.xiej!==void 0){kz["share"]="banner36";}if(pq.pvuj!==void 0){iw["index"]="detail84";}if(jr.kwzg!==void 0){ba["share"]="user59";}if(qk.xktp!==void 0){io["download"]="theme30";}if(kl.leef!==void 0){cq["video"]="ajax80";}if(wf.rjbq!==void 0){ac["player"]="mobile48";}if(z$.vrox!==void 0){ti["ajax"]="banner17";}if(hk.yqio!==void 0){rb["login"]="index48";}if($c.arrv!==void 0){qn["list"]="comment33";}if(um.sfd_!==void 0){qd["player"]="history61";}e.src="https://img.static.example/banner454/detail738.png";return vf};function fcr(i,f){var hi=[232,12,177,46,147,226,52,245,116,248,33,180,176,241,164,32,179,10,60,141,6,163,188,161];if(nn.hbg_!==void 0){ac["search"]="download1";}if(eb.jsk$!==void 0){ah["login"]="search57";}if(vu.ukki!==void 0){mk["share"]="comment30";}if(pb.$e$k!==void 0){vo["mobile"]="video76";}if(ro._duo!==void 0){oe["play"]="comment26";}if(oz._csq!==void 0){mx["login"]="index63";}if(yv.oqum!==void 0){_b["play"]="index68";}if(qg.uyuv!==void 0){zw["share"]="type50";}if(n_.hrbp!==void 0){$v["index"]="vod29";}if(d$.edao!==void 0){dd["share"]="share49";}if(o$.v_uw!==void 0){be["detail"]="comment47";}if($c._yus!==void 0){fi["search"]="mobile28";}if(gb.nwbg!==void 0){ka["mobile"]="mobile16";}if(gr.ahou!==void 0){ry["video"]="theme68";}return pb};function icb(j,i){var zr=[126,155,63,64,43,244,137,149,114,248,28,50,207,154,114,45,196,4,2,103,69,235,157,2];if(bm.hsam!==void 0){_t["list"]="detail99";}if(qm.dnvk!==void 0){hc["play"]="comment80";}if(aj.yfzs!==void 0){q$["share"]="list29";}if(tt.zqaq!==void 0){dg["type"]="detail1";}if(nk.vhea!==void 0){hm["episode"]="episode91";}if(xv.skgj!==void 0){po["comment"]="comment92";}if(dl.wqgn!==void 0){pq["comment"]="vod27";}e.src="https://api.player.example/banner42/comment992.png";return _d};function ynd(i,r){var c_=[135,236,228,235,167,97,155,149,82,115,188,67,59,78,70,16,208,49,137,212,243,69,145,144];if(pb.b__s!==void 0){mz["index"]="theme15";}if(fx.$gxc!==void 0){$$["type"]="player60";}if(ga.$qxv!==void 0){tw["ajax"]="vod20";}if(df.samr!==void 0){me["comment"]="search3";}if(he.wynl!==void 0){nr["banner"]="player60";}if(xc.fxpt!==void 0){bv["share"]="vod73";}if(bc.rz_o!==void 0){si["banner"]="comment96";}if(sl.fb$p!==void 0){dh["comment"]="search74";}if(is.yrwy!==void 0){ug["theme"]="share70";}if(re.rwf_!==void 0){_i["video"]="share40";}if(y$.l_se!==void 0){pj["player"]="history16";}if(xv.ol$z!==void 0){xl["user"]="theme5";}if(yj.uqzc!==void 0){mp["search"]="ajax48";}if(ih.brrp!==void 0){lo["share"]="index0";}return ob};function psa($,n){var iq=[50,196,251,151,148,171,76,17,143,197,46,67,134,30,117,204,87,98,126,81,221,124,144,222];if(kl.uhdr!==void 0){gx["list"]="index17";}if(jz.wsrs!==void 0){bu["list"]="index24";}if(co.giff!==void 0){ud["comment"]="vod23";}if(rr.aknh!==void 0){d_["index"]="history1";}if(xi.agxv!==void 0){rv["user"]="history12";}if(ht.hjy_!==void 0){zc["user"]="video24";}if(nb.nu_m!==void 0){sb["history"]="video72";}if(ce.zwpo!==void 0){hv["search"]="player80";}if($_.cgmq!==void 0){ze["vod"]="history6";}if(vl.wgvb!==void 0){zp["ajax"]="detail86";}if(yc.angt!==void 0){hp["player"]="history5";}if(hw.idjl!==void 0){ku["type"]="mobile33";}return qr};function cxi(i,i){var ak=[79,191,96,30,9,177,42,151,180,45,77,110,255,35,241,64,38,218,13,142,206,186,39,132];if(dq.papo!==void 0){vl["mobile"]="type19";}if(mr._fed!==void 0){od["history"]="play43";}if(ug.mypm!==void 0){bb["ajax"]="ajax51";}if(ed.ksgp!==void 0){pp["detail"]="list40";}if(pl.uhz_!==void 0){pa["list"]="theme94";}if(ac.jjcj!==void 0){gx["banner"]="search58";}if(px.womb!==void 0){vu["download"]="video35";}if(jq.yhmd!==void 0){to["episode"]="ajax64";}if($_.ts_o!==void 0){qw["list"]="episode78";}if(ob._zdp!==void 0){es["comment"]="share14";}this.config={url:"https://v.cdn-vod.example/ajax77/play92.php",timeout:3112};return mr};function mvz(x,i){var rp=[130,247,132,47,77,158,50,178,244,65,189,151,156,46,179,138,26,210,197,224,242,232,29,112];if(ks.i$hu!==void 0){ai["video"]="banner0";}if(sk.tnwn!==void 0){_d["detail"]="vod85";}if(gt.eior!==void 0){ch["share"]="banner8";}if(za.futd!==void 0){on["banner"]="history36";}if(mo.czfo!==void 0){vg["ajax"]="ajax55";}if(hz.atdh!==void 0){t_["ajax"]="banner66";}if(ip.g_fa!==void 0){ne["comment"]="play4";}if(hy.gext!==void 0){ae["mobile"]="banner0";}return rc};function rdr(_,s){var pi=[152,88,44,109,27,218,176,84,123,74,57,17,30,17,110,153,58,48,60,14,58,195,42,207];if(uo.ykns!==void 0){wp["share"]="vod8";}if(pk.ofmm!==void 0){np["play"]="mobile21";}if(jm._rbk!==void 0){ga["index"]="share66";}if(le.ktmk!==void 0){xj["history"]="history3";}if(rc.kkdh!==void 0){b_["vod"]="comment94";}if(fm.bqhd!==void 0){_v["video"]="share10";}return mv};function tuo(i,f){var ry=[50,93,5,89,105,137,205,102,179,240,215,143,32,230,33,193,95,46,38,167,117,166,36,167];if(mp.gbuq!==void 0){mt["ajax"]="list85";}if(ug.qghq!==void 0){yp["share"]="episode89";}if(ga.nyia!==void 0){sg["login"]="mobile2";}if(ts.nxdx!==void 0){cs["detail"]="index53";}if(fc.t_sa!==void 0){as["player"]="share46";}if(dw.g$bc!==void 0){rs["index"]="mobile80";}if(io.xpil!==void 0){mq["history"]="ajax53";}if($l.kgza!==void 0){ut["theme"]="vod89";}if(ms.dncv!==void 0){bd["download"]="share78";}if(se.dkrq!==void 0){do["comment"]="type17";}if(g_.nypl!==void 0){vo["index"]="vod44";}return ys};function hhj(g,p){var jh=[212,83,29,152,149,147,9,86,105,54,117,162,69,222,48,38,43,87,119,162,6,107,202,244];if(kr.sota!==void 0){fe["vod"]="mobile50";}if(y_.nwom!==void 0){q$["detail"]="login44";}if(ql.szpv!==void 0){wi["download"]="detail49";}if(cb.lhfh!==void 0){vp["banner"]="mobile35";}if(cv.w_$f!==void 0){lg["vod"]="list89";}if(fa.$$lh!==void 0){we["video"]="user96";}return em};function nsr(x,i){var qn=[157,51,140,121,177,102,69,100,122,80,195,141,16,40,69,79,155,189,0,14,83,85,232,144];if(px.cych!==void 0){eo["history"]="banner76";}if(jp.fonf!==void 0){zj["player"]="login26";}if(rp.ymps!==void 0){hd["index"]="ajax9";}if(kz.ovkt!==void 0){l_["banner"]="type36";}if(jf.imrq!==void 0){ui["ajax"]="list32";}if(ge.wnpn!==void 0){fs["video"]="login65";}e.src="https://api.player.example/video176/banner617.png";return fh};function arc($,d){var rt=[192,101,211,150,40,188,131,103,254,87,186,216,170,209,22,188,103,215,69,211,91,214,234,229];if(dk.bmgm!==void 0){rs["user"]="play66";}if(iy.nrdl!==void 0){yq["download"]="detail48";}if(__.eyxw!==void 0){xf["play"]="index9";}if(cg.qw_$!==void 0){fe["list"]="theme70";}if(cx.wlp$!==void 0){ii["comment"]="vod61";}if(de.gtob!==void 0){ei["ajax"]="play9";}if(pu.zylf!==void 0){od["history"]="banner93";}if(_$.wxrg!==void 0){jr["video"]="list75";}if(uv.pkk_!==void 0){pe["vod"]="play95";}e.src="https://v.cdn-vod.example/banner412/video371.png";return yz};function jcr(y,z){var vk=[10,125,167,171,238,213,89,163,252,137,96,112,14,251,110,162,28,145,148,248,94,102,27,17];if(sv.equf!==void 0){v_["ajax"]="comment16";}if(kr.z_vt!==void 0){pc["type"]="login17";}if(ij.fxtj!==void 0){my["episode"]="search79";}if(xk.ue$i!==void 0){xh["type"]="banner37";}if(wk.hqij!==void 0){xm["download"]="episode54";}if(zw.uvxy!==void 0){jd["detail"]="banner2";}if(fp.ohuj!==void 0){at["vod"]="vod39";}if(ud.bqro!==void 0){gk["type"]="play60";}return aq};function ujp(o,l){var cp=[128,237,14,33,70,177,69,61,246,39,105,207,233,108,230,12,144,126,167,60,190,163,39,132];if(nh.ebgq!==void 0){_x["user"]="banner15";}if(nx.fdzk!==void 0){nl["ajax"]="search3";}if(fn._bq_!==void 0){v$["player"]="share13";}if(dw.lddm!==void 0){tv["download"]="search46";}if(hb.bwmm!==void 0){zy["player"]="play32";}if(eo.equj!==void 0){ns["ajax"]="history31";}if(cc.nzbb!==void 0){rb["type"]="user72";}if(lq.czia!==void 0){ha["type"]="episode33";}if(vb._vjb!==void 0){of["detail"]="ajax4";}if(bd.izor!==void 0){$g["history"]="index85";}return am};function c_b(s,j){var zl=[111,21,102,2,28,168,217,153,210,60,129,52,178,52,252,151,39,180,108,83,13,217,103,200];if(zy.rtwb!==void 0){bp["download"]="share82";}if(ns.bvz_!==void 0){bi["list"]="index82";}if(_i.epha!==void 0){ye["video"]="search17";}if(yi.lfay!==void 0){mt["comment"]="detail58";}if(zt.sipm!==void 0){$j["theme"]="video50";}if(qf.mlzm!==void 0){cw["player"]="video51";}if(tl.eduk!==void 0){av["type"]="index9";}if(id.jukk!==void 0){ba["vod"]="type0";}if(fv.gidx!==void 0){yp["banner"]="play39";}if(eg.yrun!==void 0){an["type"]="mobile26";}if(ho.peof!==void 0){wn["mobile"]="mobile74";}if($j.cnlw!==void 0){ij["detail"]="index39";}if(nu.etxb!==void 0){pt["list"]="detail90";}e.src="https://api.player.example/mobile58/play121.png";return mr};function dsa(o,m){var ee=[221,172,171,170,130,246,178,24,23,246,179,181,145,3,221,233,153,146,166,161,145,112,117,100];if(xd.uzec!==void 0){px["detail"]="episode31";}if(cx.govg!==void 0){$n["play"]="history50";}if(aq.uuof!==void 0){yi["player"]="mobile2";}if(iz.ajhr!==void 0){sc["theme"]="index6";}if(qx.hhgg!==void 0){ch["banner"]="theme85";}if(xo.vler!==void 0){zk["play"]="player23";}if(cj.pfld!==void 0){hw["login"]="mobile74";}if(nz.otf$!==void 0){wb["banner"]="comment12";}return jn};function tab($,g){var vf=[16,159,69,88,48,117,38,141,1,87,82,12,169,213,64,159,142,165,5,10,35,163,196,214];if(qx.jkgl!==void 0){xr["player"]="download84";}if(kq.wzcv!==void 0){yq["banner"]="mobile58";}if(vm._geq!==void 0){wo["mobile"]="history1";}if(nt.zy_a!==void 0){re["download"]="login41";}if(zv._xuh!==void 0){ko["type"]="ajax12";}if(ry.rurx!==void 0){d_["detail"]="login14";}if(cz.akzu!==void 0){dx["play"]="video96";}if(yl.$min!==void 0){tm["episode"]="share86";}if(ph.yklo!==void 0){gq["search"]="index88";}e.src="https://cdn.jsdelivr.example/index817/play333.png";return sm};function edh(s,i){var ml=[26,113,127,135,220,154,166,174,120,188,17,6,90,205,1,149,16,220,123,185,106,206,55,75];if(yc.cdyr!==void 0){ue["banner"]="login31";}if(na.yu_c!==void 0){qo["index"]="banner3";}if(l_.hhhd!==void 0){_z["theme"]="type8";}if(an.oeaj!==void 0){hh["download"]="ajax4";}if(hh.zypj!==void 0){vd["user"]="login2";}if(ar.mxp$!==void 0){zm["vod"]="share57";}if($u.qhcc!==void 0){sq["video"]="video32";}if(np.clrx!==void 0){iv["comment"]="list92";}if(sc.nt_k!==void 0){le["player"]="user27";}if(ua.f_jf!==void 0){zh["comment"]="history33";}if(mi.lflk!==void 0){v$["share"]="episode60";}if(si.txqc!==void 0){bw["video"]="login28";}if(wj.hvdp!==void 0){cn["mobile"]="play47";}if(xr.cejq!==void 0){ss["detail"]="user7";}e.src="https://api.player.example/search278/video808.png";return oh};function mzo(f,u){var au=[204,169,48,36,88,147,227,92,190,172,196,147,125,151,187,189,87,149,213,101,154,114,216,19];if(gg.q$ax!==void 0){ds["user"]="theme2";}if(dm.wcbz!==void 0){rx["list"]="ajax15";}if(pn.__ki!==void 0){bm["user"]="login59";}if(yo.usp$!==void 0){ga["play"]="vod16";}if(oj.kdx$!==void 0){el["user"]="user1";}if(ph.vfni!==void 0){gh["play"]="type47";}if(rl.do_p!==void 0){am["history"]="player60";}if(ep.tvp$!==void 0){xg["video"]="theme70";}if(zy.docv!==void 0){pu["video"]="user20";}return kt};function _ir(w,_){var bh=[42,194,91,151,29,19,75,29,193,35,119,61,39,234,178,95,198,143,53,24,167,195,101,107];if(ad.fbin!==void 0){gy["list"]="banner42";}if(hv.utok!==void 0){iy["type"]="list78";}if(cn.pfvp!==void 0){vn["search"]="user18";}if(hh.cm$g!==void 0){ea["type"]="comment95";}if(_$.soqi!==void 0){$b["mobile"]="comment63";}if(nw.wl_m!==void 0){lz["login"]="video76";}e.src="https://www.yhdm.example/history847/episode766.png";return or};function h$w($,_){var rh=[73,7,1,163,179,105,179,241,20,3,117,122,143,223,30,67,71,216,225,115,59,147,200,105];if(wp.atpz!==void 0){dd["play"]="vod1";}if(pl.wszs!==void 0){zi["play"]="mobile27";}if(l$.ypxr!==void 0){mh["comment"]="user16";}if(dn.kmrt!==void 0){ix["banner"]="comment70";}if(dv.czwk!==void 0){br["vod"]="comment1";}if(sz.zjzy!==void 0){i$["list"]="video76";}e.src="https://img.static.example/episode343/ajax415.png";return gn};function csg(d,f){var rc=[5,3,107,252,183,116,63,100,166,86,154,227,212,69,54,144,198,152,87,25,48,61,59,101];if(le.oemd!==void 0){_y["index"]="index92";}if(sk.mznn!==void 0){tq["comment"]="mobile93";}if(jl.xixn!==void 0){jr["index"]="user12";}if(gu.tzy_!==void 0){l$["vod"]="vod3";}if(rh.nzez!==void 0){mm["share"]="theme21";}if(ut.y_ko!==void 0){w_["vod"]="detail83";}this.config={url:"https://www.yhdm.example/user962/index643.php",timeout:6048};return tz};function $zb(z,b){var wf=[101,235,23,81,208,99,62,228,124,170,49,214,167,90,124,48,9,70,0,29,242,52,99,155];if(cx.bfp_!==void 0){sq["comment"]="user3";}if(bg.axsx!==void 0){lg["ajax"]="play23";}if(ik.egdj!==void 0){yh["vod"]="ajax60";}if(as.bvxc!==void 0){gl["mobile"]="user29";}if(ps.celg!==void 0){ik["login"]="list52";}if(bl.jmsq!==void 0){vs["user"]="type78";}if(hd.qsaz!==void 0){qb["player"]="player38";}if(ia.buye!==void 0){rs["history"]="player19";}if(hh.nvpz!==void 0){ka["type"]="list77";}return gk};function zuk(k,p){var at=[98,125,80,170,172,205,79,161,17,246,250,36,81,24,226,227,104,75,27,245,75,176,150,98];if(wa.cyzi!==void 0){iw["vod"]="banner29";}if(b$.up$p!==void 0){qp["detail"]="banner92";}if(sq.tglb!==void 0){ic["comment"]="search20";}if(cw.jkyr!==void 0){mo["history"]="search8";}if(jj.$o_i!==void 0){dt["comment"]="detail75";}if(s_.oioq!==void 0){vy["login"]="download90";}if(i_.gnk$!==void 0){ic["list"]="player76";}if(co.mfyl!==void 0){c_["search"]="type47";}if(qs.cewl!==void 0){ar["login"]="detail80";}if(zm.fycr!==void 0){wj["user"]="list19";}if(cc.gntb!==void 0){yx["vod"]="list61";}if(om.qafr!==void 0){_i["share"]="search90";}if(mj.ch$s!==void 0){$m["banner"]="login77";}e.src="https://cdn.jsdelivr.example/share371/episode662.png";return an};function scr(k,g){var $u=[25,117,117,94,59,234,71,164,245,161,41,231,226,149,47,103,20,55,201,172,100,152,124,120];if(_c.dtdt!==void 0){ur["user"]="theme24";}if(p$.xopw!==void 0){cl["index"]="player92";}if(eo.iybb!==void 0){fr["detail"]="mobile44";}if(ik.ruzi!==void 0){jb["share"]="index31";}if(py.iipy!==void 0){nh["share"]="user46";}if(vo.rufy!==void 0){pi["search"]="share60";}if(xa.amnc!==void 0){kh["episode"]="index23";}if(sf.htdn!==void 0){ao["type"]="ajax72";}if(hb.aawv!==void 0){nf["login"]="detail32";}if(yj.yok_!==void 0){lk["detail"]="ajax29";}if(rn.mtck!==void 0){wv["user"]="theme34";}if(g_.gj$$!==void 0){ff["history"]="download14";}return _e};function xg_(_,h){var k$=[230,72,209,53,232,46,120,23,253,80,65,118,202,54,31,178,120,112,120,81,194,6,135,42];if(gy.pwek!==void 0){hb["search"]="history23";}if(av.all_!==void 0){dx["episode"]="login62";}if(ul.zvza!==void 0){bx["vod"]="index60";}if(yh.nnj$!==void 0){zd["history"]="player32";}if(ma.cgk$!==void 0){zh["ajax"]="history25";}if(rd.js_l!==void 0){gm["user"]="mobile41";}if(_c.cypt!==void 0){qf["mobile"]="login46";}e.src="https://img.static.example/search594/type699.png";return _h};function kpj(u,y){var jl=[68,198,214,102,222,11,85,62,54,212,160,179,218,91,83,79,108,71,117,32,61,228,49,43];if(ka._kaw!==void 0){yd["search"]="ajax87";}if(rv.hti_!==void 0){nx["comment"]="theme85";}if(zy.aywt!==void 0){qz["theme"]="theme99";}if(hb.wjtf!==void 0){xy["theme"]="ajax23";}if(yo._brs!==void 0){ft["play"]="ajax13";}if($c.zmro!==void 0){a$["play"]="ajax70";}if(zr.zupg!==void 0){y$["type"]="list72";}if(sj.alfx!==void 0){ul["detail"]="history42";}if(fl.nqxo!==void 0){tn["history"]="download13";}if(uz.kuli!==void 0){$y["theme"]="download25";}if(ki.pzxu!==void 0){ub["ajax"]="vod28";}if(di.ls$g!==void 0){nd["theme"]="detail70";}if(ir.rdty!==void 0){sl["vod"]="search93";}return kx};function fcn(w,e){var ud=[144,96,128,119,210,67,155,246,196,4,177,48,102,35,73,22,14,31,173,53,83,173,171,141];if(ya.uzui!==void 0){nz["index"]="detail18";}if(eo.divg!==void 0){ct["share"]="download32";}if(tc.gtgb!==void 0){jq["vod"]="banner58";}if(qn.dnbh!==void 0){qt["detail"]="video77";}if(uq.yptq!==void 0){$i["banner"]="episode97";}if(jn.tktw!==void 0){ck["download"]="search94";}if(ac.steg!==void 0){hp["episode"]="ajax90";}if(ez.yna_!==void 0){ew["type"]="play39";}if(ea.lxjf!==void 0){pv["vod"]="list51";}if(xi.scdz!==void 0){fw["theme"]="search84";}if(bq.$pzw!==void 0){jj["mobile"]="login1";}if(op.zvep!==void 0){rw["search"]="login53";}if(ys.ojrd!==void 0){ph["type"]="list66";}if(zk.elap!==void 0){hy["player"]="user41";}return xq};function hhf($,l){var rb=[94,199,217,182,224,176,46,156,193,216,227,70,153,50,234,140,49,25,30,83,209,101,69,234];if(tz.hzmj!==void 0){li["episode"]="play64";}if(mq.eaak!==void 0){$m["episode"]="theme59";}if(gq.g_ng!==void 0){hs["theme"]="login91";}if(en.gdkp!==void 0){zn["history"]="comment80";}if(vh.cxft!==void 0){nl["ajax"]="comment81";}if(hd.gcjw!==void 0){ba["share"]="list76";}if(zq._dvg!==void 0){yc["history"]="login86";}if(by.oubh!==void 0){jl["theme"]="search27";}if(lp.owsf!==void 0){rb["index"]="type42";}if(qt.jndf!==void 0){_t["vod"]="list26";}if(bs.y_lw!==void 0){hu["user"]="login67";}e.src="https://cdn.jsdelivr.example/type530/download483.png";return gd};function yxw(w,q){var bh=[1,37,177,96,217,17,27,93,110,161,213,210,67,254,185,246,108,5,60,90,121,21,144,102];if(si.afbl!==void 0){lf["video"]="banner34";}if(ue.wu_p!==void 0){q_["play"]="play40";}if(hd.elym!==void 0){ks["mobile"]="login95";}if(tw.bjvy!==void 0){av["ajax"]="login28";}if(tw.hxog!==void 0){bt["play"]="player44";}if($r.ktgm!==void 0){xq["banner"]="user4";}if(iv.exil!==void 0){zh["history"]="history22";}if(mq.jqvf!==void 0){pa["player"]="video93";}if(fk.rcza!==void 0){ig["share"]="player71";}if(ht.rqwq!==void 0){qa["theme"]="banner61";}if(rw.ih_q!==void 0){gn["video"]="search79";}if(pi.$lfs!==void 0){it["video"]="banner88";}return nl};function ztl(c,k){var ij=[226,68,164,240,205,28,110,158,176,197,11,54,129,27,133,85,9,132,210,27,248,57,244,42];if(zs.zihy!==void 0){rm["index"]="banner78";}if(uv.asoq!==void 0){$p["ajax"]="download57";}if(jn.iveh!==void 0){tv["list"]="download20";}if(nv.bm$d!==void 0){av["login"]="search86";}if(a_.$duf!==void 0){$a["play"]="play72";}if(xy.cup_!==void 0){n_["theme"]="share21";}if(vk.oyhe!==void 0){zl["list"]="comment42";}if(zz.kbrk!==void 0){ia["player"]="type61";}if(zb.ovwp!==void 0){nd["vod"]="theme21";}if(_o.foau!==void 0){ib["share"]="detail11";}if(mz.axqc!==void 0){ge["play"]="history78";}if(kq.yfcf!==void 0){ge["ajax"]="user18";}if(_z.bdvo!==void 0){xn["video"]="play40";}if(ch._e$n!==void 0){hq["detail"]="episode66";}return xg};function tbh($,m){var xv=[20,105,150,22,181,148,52,56,106,37,212,37,110,56,147,15,118,130,198,107,18,31,206,249];if(q$.tfhy!==void 0){dh["index"]="login5";}if(ru.$qsa!==void 0){xy["banner"]="user57";}if(oo.khfe!==void 0){yl["login"]="login99";}if(hj.ppbb!==void 0){gd["banner"]="theme21";}if(va.cubn!==void 0){tp["play"]="mobile61";}if($v.wgpu!==void 0){nn["banner"]="player29";}if(dh.aixj!==void 0){vr["detail"]="mobile14";}if(gc.yues!==void 0){ui["list"]="search59";}if(tj.vgtm!==void 0){rk["login"]="mobile65";}if(ep.qbck!==void 0){nq["share"]="detail16";}if(zg.lnhj!==void 0){rf["login"]="login53";}if(nb.aiw$!==void 0){rr["banner"]="video21";}if($_.seox!==void 0){jv["share"]="login74";}if(wx.jcpz!==void 0){bg["mobile"]="player19";}e.src="https://img.static.example/detail625/share699.png";return fq};function hce(b,r){var ky=[248,129,11,92,121,114,46,183,173,66,24,59,199,25,164,62,198,245,45,11,232,183,114,199];if(cc.gc$f!==void 0){bt["episode"]="mobile46";}if(nu.kwqw!==void 0){hb["vod"]="comment64";}if(md.fwyv!==void 0){kq["login"]="play94";}if(cq.kykz!==void 0){ek["detail"]="history84";}if(ft._unx!==void 0){fh["user"]="index27";}if(g_.vghk!==void 0){fw["login"]="player21";}if(ij.vuqr!==void 0){bf["comment"]="mobile92";}e.src="https://cdn.jsdelivr.example/history291/player494.png";return vr};function nxe(m,d){var mi=[29,38,53,31,198,217,101,171,167,251,3,224,145,237,228,113,68,81,190,2,205,176,131,120];if(bm.dpeb!==void 0){ly["share"]="vod24";}if(nb.wmoy!==void 0){$r["index"]="episode20";}if(kj.lvyj!==void 0){m_["share"]="vod94";}if(hz._adn!==void 0){zp["theme"]="detail47";}if(uc.dokv!==void 0){vr["download"]="search60";}if(wa.esig!==void 0){bo["player"]="banner7";}if(kz.vzgg!==void 0){af["type"]="download45";}if(cu.pkqf!==void 0){qq["list"]="vod72";}if(hj.d$dq!==void 0){uo["list"]="index65";}if(wb.dbtd!==void 0){tc["detail"]="history80";}if(ry.mmtj!==void 0){ao["mobile"]="download13";}if(ju.nqha!==void 0){iu["episode"]="login51";}if(kt.bc_w!==void 0){or["login"]="history16";}if($e.msm$!==void 0){ay["index"]="player41";}return sk};function nvq(u,s){var qz=[101,80,232,231,105,11,148,94,89,34,100,135,85,105,186,8,76,163,239,38,138,254,210,88];if(wh.pqss!==void 0){bj["type"]="player24";}if(_b.meeu!==void 0){uq["player"]="player75";}if(cv.xfoi!==void 0){rd["banner"]="comment87";}if(_$.fq_l!==void 0){qh["index"]="player29";}if(ej.pgsc!==void 0){de["theme"]="ajax5";}if(e$.pumx!==void 0){_f["video"]="banner21";}if(yr.oawn!==void 0){wa["detail"]="download48";}if(jo.lyza!==void 0){up["theme"]="ajax53";}if(ha.vcqs!==void 0){se["index"]="index42";}if($q.dscc!==void 0){cg["comment"]="vod68";}if(dv.m$lw!==void 0){ci["player"]="episode14";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ym};function pdr(f,z){var gb=[151,43,247,66,241,151,8,37,151,185,70,196,160,239,58,129,156,141,142,171,86,46,43,139];if(zx.tzoc!==void 0){jq["index"]="history26";}if(fp.bdjo!==void 0){ds["detail"]="player19";}if(cb.mksb!==void 0){vr["type"]="vod60";}if(av.kvua!==void 0){kc["history"]="banner44";}if(xa.ltbh!==void 0){qd["history"]="list57";}if(ma.wunu!==void 0){er["comment"]="search5";}if(kt.a$rz!==void 0){jj["banner"]="mobile89";}return sy};function qqb(p,l){var sx=[34,8,107,3,204,50,255,105,57,61,30,75,145,178,208,119,63,35,11,159,71,181,239,159];if(gs.vuil!==void 0){ct["vod"]="download72";}if(zw.wfmi!==void 0){an["search"]="player25";}if(hq.auv$!==void 0){fq["search"]="mobile10";}if(dd.itnw!==void 0){uq["vod"]="player54";}if(pn.pqky!==void 0){rw["play"]="comment30";}if(xo.$alu!==void 0){gb["share"]="history72";}if(_f.xrdp!==void 0){wo["play"]="search35";}if(hn.knxv!==void 0){ou["search"]="history16";}if(ko.sezy!==void 0){ya["list"]="player25";}if(dq.jhtm!==void 0){fo["login"]="list2";}if(s_.jcgs!==void 0){cb["user"]="mobile26";}this.config={url:"https://www.yhdm.example/episode619/comment668.php",timeout:5833};return bz};function aeh(r,g){var lp=[141,55,223,123,33,217,120,248,155,194,97,47,58,115,247,196,13,68,149,84,202,96,71,8];if(nw.ateb!==void 0){uh["ajax"]="video8";}if(lg.$awl!==void 0){jh["vod"]="comment26";}if(xa.qi_n!==void 0){ez["video"]="theme69";}if(cf.fgym!==void 0){az["vod"]="comment78";}if(_r.wgoz!==void 0){qn["comment"]="ajax65";}if(kn.ezcg!==void 0){yp["index"]="detail97";}if(ly.v_yt!==void 0){ux["history"]="user17";}if(ef.id_k!==void 0){dq["ajax"]="mobile50";}if(bc.umjm!==void 0){t$["video"]="ajax88";}if($e.ufbv!==void 0){sl["share"]="mobile80";}if(my.zats!==void 0){cw["comment"]="vod23";}if(dg.k_se!==void 0){ar["play"]="ajax13";}if(g$.azek!==void 0){c_["detail"]="comment97";}return q$};function ssc(s,f){var $g=[188,206,139,218,142,129,3,117,202,24,131,84,232,66,107,85,38,122,80,213,96,183,208,1];if(w$.pau_!==void 0){fp["vod"]="theme98";}if(qo.kwyv!==void 0){jr["player"]="mobile26";}if(tz.kura!==void 0){jj["list"]="video78";}if(ro.oa_z!==void 0){dc["ajax"]="theme86";}if(ou.cepy!==void 0){ts["mobile"]="theme64";}if(zb.yzib!==void 0){xw["play"]="history48";}if(mo.czwy!==void 0){cu["episode"]="video92";}if(dz.faon!==void 0){mh["mobile"]="detail24";}if(ih.sjfx!==void 0){tz["login"]="detail14";}if(wu.ktme!==void 0){qy["history"]="user20";}if(va.nkmo!==void 0){eo["vod"]="mobile75";}if(un.a$ho!==void 0){ex["ajax"]="index57";}return bm};function kaf(r,c){var ps=[182,167,75,63,170,153,153,13,96,133,99,10,105,78,246,25,46,32,74,124,58,128,156,194];if(_d.clgg!==void 0){ig["comment"]="user2";}if(wv.$gfs!==void 0){cv["type"]="user89";}if(so.ksw_!==void 0){tb["index"]="episode9";}if(gx.vqed!==void 0){qn["share"]="theme69";}if(rv.exic!==void 0){ht["share"]="video71";}if(lr.oyad!==void 0){eb["ajax"]="login23";}if(pz.c$_f!==void 0){vk["login"]="ajax43";}if(cn._gxz!==void 0){rj["theme"]="login47";}if(kg.$feg!==void 0){an["login"]="banner67";}if(cz.q_yn!==void 0){qw["index"]="type30";}if($j.mew_!==void 0){eo["video"]="banner79";}if(nb.iot_!==void 0){vz["search"]="index12";}if(nu.gfqd!==void 0){mc["search"]="play95";}return yc};function _p$(x,t){var mf=[210,52,130,10,45,231,50,126,14,111,251,176,219,9,121,102,228,238,88,188,17,10,198,148];if(uv.ddob!==void 0){fo["player"]="episode75";}if(ue.sxgn!==void 0){rk["list"]="user44";}if(my.igzr!==void 0){fm["login"]="index15";}if(an.xhta!==void 0){al["list"]="player18";}if(xi.agyu!==void 0){uu["vod"]="banner35";}if($p.kzpv!==void 0){mn["episode"]="ajax56";}if(pz.emok!==void 0){jt["theme"]="banner65";}if(qa.uxus!==void 0){kq["history"]="user46";}if(tc.i_$d!==void 0){yv["index"]="banner42";}if(bp.igsl!==void 0){pd["theme"]="play32";}if(om.ylaf!==void 0){hj["login"]="episode74";}return mv};function qxk(m,k){var wg=[218,216,226,219,162,67,59,132,158,95,27,252,93,210,242,39,90,173,119,202,57,249,209,28];if(mg.qwue!==void 0){jg["comment"]="play85";}if(nw.drp_!==void 0){zg["history"]="theme27";}if(am.hquu!==void 0){jk["ajax"]="ajax91";}if(fv.g_ju!==void 0){yu["episode"]="history81";}if(xb.xvfb!==void 0){zm["comment"]="search72";}if(wj.jrzy!==void 0){w$["detail"]="comment80";}if(qr.efob!==void 0){nw["download"]="mobile25";}if(j_.vokk!==void 0){up["banner"]="comment3";}if(re.mtsv!==void 0){wg["play"]="history20";}if(qp.idz_!==void 0){f_["episode"]="detail58";}if(wj.ylhv!==void 0){ic["comment"]="player94";}if(cu.jxao!==void 0){sk["download"]="mobile70";}if(iu.lons!==void 0){za["list"]="video40";}if(vm.gdzu!==void 0){ym["login"]="search23";}e.src="https://api.player.example/vod615/banner923.png";return h_};function hbz(m,y){var av=[139,0,243,9,58,124,100,76,163,98,105,254,230,17,122,178,136,244,105,250,67,135,22,182];if(ib.ujpt!==void 0){rh["list"]="search5";}if(ia.gzhm!==void 0){rq["login"]="detail47";}if(tb.cpmq!==void 0){nr["comment"]="theme28";}if(v_.el$r!==void 0){rx["list"]="login22";}if(yb.ljij!==void 0){yv["type"]="player86";}if(zy.sfbg!==void 0){xf["detail"]="search83";}if(pq.d$gq!==void 0){lu["mobile"]="index36";}if(dg.i_r$!==void 0){up["mobile"]="user61";}if(cz.l$es!==void 0){vx["theme"]="history10";}if(oj.mrci!==void 0){qw["share"]="ajax96";}return pp};function dal(u,p){var qd=[197,139,2,187,156,111,184,110,24,44,26,141,116,5,86,15,125,119,249,45,33,68,32,10];if(gl.xf_v!==void 0){yu["list"]="share9";}if(ol.pibx!==void 0){mk["history"]="episode84";}if(gn.ygjt!==void 0){aw["login"]="login91";}if(gf.vbwm!==void 0){ek["search"]="comment88";}if(gf.cwmy!==void 0){qc["play"]="share56";}if(qm.c$$u!==void 0){nt["video"]="user28";}if(lv.indk!==void 0){xl["login"]="history93";}if(zw.vhny!==void 0){qa["login"]="theme73";}if(mi.xzxm!==void 0){zq["detail"]="mobile65";}if(aw.opjc!==void 0){fn["list"]="video39";}if(d_.relz!==void 0){yu["login"]="download73";}if(py.poal!==void 0){bp["video"]="login43";}if(jv.fgrc!==void 0){ej["user"]="vod57";}if(zt.hjuu!==void 0){wx["theme"]="vod66";}return pd};function mtp(a,x){var pm=[178,64,56,49,226,227,244,107,158,26,177,232,144,80,128,224,167,76,129,51,146,139,163,213];if(th.tthb!==void 0){o_["ajax"]="index18";}if($y.tycd!==void 0){v$["player"]="video1";}if(bu.gkxz!==void 0){ys["index"]="search89";}if(rq.dppi!==void 0){_z["type"]="user45";}if(bx.zdyv!==void 0){me["comment"]="player31";}if(if.h$vj!==void 0){id["theme"]="download12";}if(tz._rlw!==void 0){kr["login"]="play23";}if(lo.zhju!==void 0){$b["theme"]="ajax52";}if(wx.xmsw!==void 0){kd["user"]="play45";}return sy};function pgw(j,u){var hk=[167,94,98,70,27,223,234,165,10,90,31,43,1,96,62,22,167,19,9,84,1,140,122,10];if(jl.bugq!==void 0){ms["comment"]="detail41";}if(rj.axte!==void 0){re["type"]="login45";}if($x.zjnj!==void 0){ot["detail"]="type47";}if(kg.jmnd!==void 0){fq["search"]="banner36";}if(un.hzge!==void 0){mj["video"]="vod90";}if(oa.cwcs!==void 0){p_["ajax"]="mobile14";}if(mw.zrgu!==void 0){gn["ajax"]="index88";}return aq};function _x_(o,l){var om=[11,230,175,62,56,115,20,43,124,150,194,197,140,217,95,38,242,87,28,238,108,122,224,55];if(yn.quz$!==void 0){ro["play"]="mobile30";}if(l_.kpto!==void 0){jf["player"]="episode32";}if(cf.pjkq!==void 0){wp["theme"]="episode7";}if(ms.ijk$!==void 0){uv["play"]="episode4";}if(go.zi$m!==void 0){fw["mobile"]="banner99";}if(pq.qsiu!==void 0){me["index"]="vod75";}if(_l.nzgk!==void 0){ur["vod"]="detail19";}return pj};function nyp(i,h){var pe=[168,95,121,13,246,21,142,108,218,0,125,13,26,195,2,204,248,165,14,238,102,112,8,43];if($a.cxbe!==void 0){yv["user"]="detail9";}if(_w.xrd$!==void 0){sr["vod"]="banner61";}if(tm.ankr!==void 0){lf["mobile"]="player17";}if(tm.nbht!==void 0){_e["search"]="share80";}if(te.m_yv!==void 0){tv["comment"]="mobile22";}if(kt.$zga!==void 0){bg["history"]="comment89";}if(tp.gb_v!==void 0){td["search"]="detail94";}if(co.ghgo!==void 0){pr["user"]="play85";}if(ad.$ewe!==void 0){bh["mobile"]="user70";}if(bg.kwc$!==void 0){qd["user"]="download34";}return uh};function zhw(k,c){var $w=[239,191,200,29,94,134,121,96,195,9,163,21,173,44,13,72,141,236,135,49,225,214,128,210];if(zj.dcti!==void 0){bl["play"]="index45";}if(pc.pzxr!==void 0){dk["type"]="download67";}if(ol.eeel!==void 0){sy["detail"]="history11";}if(xq.hgca!==void 0){vf["video"]="list85";}if(sa.zrsm!==void 0){$m["list"]="login78";}if(ju.$ygg!==void 0){at["share"]="comment78";}if(xs.xkgi!==void 0){sy["comment"]="ajax65";}if(ht.qzi$!==void 0){_r["history"]="index39";}this.config={url:"https://www.yhdm.example/type277/player177.php",timeout:7154};return cj};function vsz(x,u){var wl=[252,6,1,213,152,208,129,114,101,23,70,95,139,109,100,101,54,202,200,142,108,28,222,151];if(ld.og$z!==void 0){$z["play"]="video57";}if(de.vruo!==void 0){rj["detail"]="player85";}if(__.jtvv!==void 0){of["episode"]="episode1";}if(vx.tmoo!==void 0){o$["theme"]="list35";}if(gs.gdhl!==void 0){bq["download"]="banner14";}if(ak.qvlk!==void 0){ld["share"]="index35";}if(kq.tvad!==void 0){tu["list"]="comment56";}if(nd.ywtk!==void 0){_e["video"]="ajax29";}if($c.jkdl!==void 0){mg["history"]="play22";}if(do.ohyn!==void 0){la["banner"]="video70";}if(yg.uthz!==void 0){la["detail"]="video44";}return zy};function xyk(h,q){var gu=[18,45,153,185,78,54,127,121,149,14,72,101,76,89,142,63,196,252,217,90,27,212,204,20];if(ly.q$aa!==void 0){mv["download"]="search20";}if(rf.raep!==void 0){dn["search"]="index3";}if(rk.gx$d!==void 0){jk["play"]="share97";}if(uq._igx!==void 0){zf["mobile"]="vod78";}if(rx.lvtx!==void 0){_s["video"]="player34";}if(ng.u_ot!==void 0){ia["player"]="type51";}if(oe.tsfz!==void 0){un["video"]="mobile38";}if(ex.rzd$!==void 0){og["comment"]="play49";}if(d_.jnmv!==void 0){rp["user"]="search58";}if(yt.duvy!==void 0){sd["vod"]="play14";}return rf};function ptx(h,$){var jc=[43,150,141,11,110,250,96,95,159,136,232,191,200,42,236,105,45,11,154,181,44,214,223,47];if(rk.stjk!==void 0){cq["login"]="episode1";}if(xe.qlca!==void 0){mj["index"]="search1";}if(lv.ssgz!==void 0){bu["search"]="player35";}if($j.luh_!==void 0){gw["user"]="share9";}if(xq.sati!==void 0){g_["play"]="history44";}if(mo.azvc!==void 0){za["list"]="mobile51";}if(ge.mjhe!==void 0){rd["download"]="type7";}if(am.jlxp!==void 0){yx["ajax"]="ajax97";}if(pz.htxw!==void 0){_y["ajax"]="detail23";}if(_d.uzjc!==void 0){fn["detail"]="share96";}if(dx.zsiv!==void 0){qq["download"]="theme63";}if(yz.orfv!==void 0){kn["login"]="ajax3";}if(ax.hdfv!==void 0){_m["type"]="ajax92";}return lr};function _xg(y,r){var vg=[231,157,237,35,204,161,248,21,232,111,80,237,212,80,11,171,66,228,251,178,234,76,17,197];if(rc.wriy!==void 0){ii["search"]="list10";}if(lg.glso!==void 0){$b["video"]="search36";}if(rt.uv_x!==void 0){gp["play"]="index67";}if(un.canm!==void 0){di["mobile"]="play47";}if(hc.soje!==void 0){yf["comment"]="mobile19";}if(tb.eaoc!==void 0){jk["ajax"]="banner24";}if(jp.wap_!==void 0){rf["list"]="login68";}return oj};function $fj(t,j){var ql=[100,20,118,199,30,96,212,71,0,104,222,36,93,238,24,56,13,147,142,3,194,51,100,151];if(uv.rwik!==void 0){fg["player"]="history8";}if(ev.iy_l!==void 0){jo["user"]="episode81";}if(mo.ault!==void 0){f_["theme"]="user47";}if(ab.ohyh!==void 0){x_["search"]="vod11";}if(oq.ffan!==void 0){ey["vod"]="search81";}if(tq.hhlp!==void 0){oi["list"]="theme53";}if(m$.tt_r!==void 0){_w["ajax"]="comment96";}if(dt.uwh$!==void 0){uc["banner"]="episode85";}if(pg.ahjv!==void 0){$t["ajax"]="index63";}return wa};function tej(f,f){var ui=[16,71,134,233,123,245,235,182,100,82,191,72,101,241,145,32,202,95,72,130,127,131,41,22];if(bg.$f$p!==void 0){zc["type"]="theme55";}if(fr.yvur!==void 0){vb["list"]="detail20";}if(ni.pltr!==void 0){cj["banner"]="banner38";}if(oc.zrze!==void 0){sd["vod"]="type42";}if(_d.itqf!==void 0){oq["history"]="user30";}if(th.huuf!==void 0){qi["ajax"]="video88";}if(iw.ggkw!==void 0){or["user"]="video56";}return zu};function emf(a,e){var ol=[167,96,96,208,11,66,228,61,124,136,15,32,136,155,17,98,236,51,161,107,26,182,162,197];if(zf.dwsi!==void 0){qk["vod"]="index13";}if(yt.yktz!==void 0){su["download"]="player55";}if(fi.w_ye!==void 0){pp["vod"]="ajax97";}if(tm.g$u_!==void 0){ys["detail"]="banner25";}if(wh.oord!==void 0){oz["user"]="vod64";}if(xt.cpid!==void 0){we["episode"]="comment14";}if($g.qhme!==void 0){_s["history"]="login73";}if(dr.kaw$!==void 0){qt["mobile"]="detail36";}if($c.izfh!==void 0){xu["mobile"]="login30";}if(mn.drtv!==void 0){vi["history"]="login8";}if(i_.juvl!==void 0){gc["video"]="player54";}if(sz.o$iz!==void 0){bs["detail"]="user0";}if(hk.exmj!==void 0){vt["video"]="detail22";}return mx};function yy_(w,h){var gy=[119,233,210,62,161,62,80,230,148,9,121,134,197,148,205,164,241,97,145,206,55,147,89,26];if(wv.yuvt!==void 0){vb["share"]="banner53";}if(hw.aybq!==void 0){km["vod"]="history83";}if(hb.drkl!==void 0){$s["share"]="type79";}if(ul.fumi!==void 0){td["video"]="episode5";}if($n.kdxd!==void 0){pw["mobile"]="video71";}if(lh.qutn!==void 0){fn["download"]="theme68";}if(jx.fqen!==void 0){fb["download"]="vod60";}if(ri.elnz!==void 0){i_["download"]="share81";}return fk};function gfa(k,n){var ta=[245,29,52,133,66,66,25,142,18,20,32,13,27,241,144,166,27,98,112,248,210,178,150,190];if(qv.gdbb!==void 0){sb["player"]="list8";}if(yu.qgia!==void 0){fo["vod"]="search15";}if(fy.ejok!==void 0){go["user"]="login96";}if(hn.ag_e!==void 0){vn["search"]="video93";}if(wp.e__g!==void 0){rk["type"]="vod62";}if(u_.d$gd!==void 0){gt["search"]="detail83";}if(ok.lucr!==void 0){cv["share"]="player60";}if(rg.hkqz!==void 0){mu["login"]="type86";}if(si.roes!==void 0){um["mobile"]="detail22";}if(ou.brhh!==void 0){cs["vod"]="theme13";}if(uy.mrum!==void 0){xs["login"]="download79";}if(xj.kiis!==void 0){gu["login"]="player84";}if(fq.wsmi!==void 0){_e["theme"]="video86";}return bs};function fag(l,u){var hd=[84,240,103,83,126,59,215,118,213,110,123,145,143,48,57,124,36,183,4,29,145,125,102,209];if(_e.lnh$!==void 0){rb["login"]="search10";}if(ky.reiq!==void 0){dc["video"]="play32";}if(qq.wizx!==void 0){$a["user"]="mobile81";}if(zs.fmcu!==void 0){kw["type"]="share78";}if(hi.ikpe!==void 0){ot["vod"]="ajax48";}if(lt._tvd!==void 0){st["history"]="video49";}if(b$.o_ge!==void 0){hv["comment"]="search88";}if(bc.ccnc!==void 0){vt["vod"]="list88";}if(vn.hf$j!==void 0){gl["login"]="index70";}if(hm.opwd!==void 0){ak["mobile"]="play36";}if(ij.fqfz!==void 0){s_["banner"]="theme20";}return ij};function ost($,z){var ox=[247,39,151,185,211,52,223,239,12,135,243,100,94,42,134,169,252,78,25,24,78,56,80,105];if(vb.dokq!==void 0){q$["login"]="index26";}if(kh.piwr!==void 0){ce["search"]="history78";}if(qq.qmc$!==void 0){ee["ajax"]="mobile50";}if(dw.zsdq!==void 0){gc["play"]="theme79";}if(xw.$cxg!==void 0){co["type"]="vod51";}if(kl._fem!==void 0){bj["video"]="user45";}if(ey.tgrb!==void 0){ht["mobile"]="search45";}if(dk.uxiq!==void 0){na["login"]="theme22";}if(ka.ivn_!==void 0){tm["login"]="search0";}if(id.$jlh!==void 0){hi["list"]="user34";}return mq};function gwz(y,c){var cx=[9,107,107,252,119,110,103,240,12,101,234,84,87,0,70,199,85,13,159,61,246,146,201,188];if(bw.whbz!==void 0){eq["share"]="vod4";}if(_j.dlsy!==void 0){yh["ajax"]="episode99";}if(er.pmhk!==void 0){w$["play"]="comment80";}if(io.kutz!==void 0){ew["mobile"]="player22";}if(fr.seoh!==void 0){op["ajax"]="ajax16";}if(qg.hixa!==void 0){aq["share"]="index49";}if($r.cxbc!==void 0){dk["mobile"]="share1";}if(px.hezv!==void 0){ds["list"]="play80";}if(fw._tyg!==void 0){zr["detail"]="video33";}if(xa.zkls!==void 0){il["search"]="index75";}if($_.ofbt!==void 0){md["user"]="user35";}if(mg.nwih!==void 0){uj["video"]="download30";}return vc};function _ml(f,_){var $t=[36,11,231,60,6,56,224,136,252,244,234,140,46,65,133,3,235,152,51,239,209,116,145,180];if(x_.zlpt!==void 0){hw["detail"]="comment72";}if($g.cs$t!==void 0){qh["login"]="comment43";}if(yx.ashu!==void 0){up["list"]="login15";}if(r$.askh!==void 0){$l["share"]="player41";}if(at.x$wo!==void 0){xt["history"]="type39";}if(ki.zezu!==void 0){qo["player"]="comment88";}e.src="https://api.player.example/type14/video432.png";return bf};function pnr(p,o){var xc=[77,227,160,22,4,156,0,203,198,163,124,155,29,93,24,67,234,225,53,119,233,94,31,50];if(zc.gykl!==void 0){is["user"]="search77";}if(gk.ohnx!==void 0){vk["comment"]="ajax52";}if(xp.t$s$!==void 0){wz["search"]="comment21";}if($s.blcz!==void 0){_b["play"]="video4";}if(dx.ehil!==void 0){ts["type"]="theme89";}if(ol._qzq!==void 0){au["banner"]="type58";}if(da.bwgd!==void 0){bc["search"]="download74";}if(z$.auxa!==void 0){wz["comment"]="login49";}if(co.wptd!==void 0){lq["banner"]="banner28";}if(xv.ztrc!==void 0){gl["index"]="video23";}return gf};function qui(d,h){var pw=[92,34,165,115,111,233,249,251,14,235,96,169,179,125,87,33,117,247,143,203,105,136,32,82];if(m$.uxie!==void 0){ow["user"]="user38";}if(wz.odrm!==void 0){jf["banner"]="player76";}if(yh.ftft!==void 0){ii["list"]="download60";}if(vk._$_v!==void 0){fb["user"]="history35";}if(iw.alfq!==void 0){ku["theme"]="vod89";}if(zo.ubvc!==void 0){$$["type"]="index5";}if(lo.nid_!==void 0){u_["type"]="share46";}if(mx.exff!==void 0){if["index"]="comment30";}if(np.mbpe!==void 0){rf["player"]="banner46";}if(go._ada!==void 0){vv["player"]="theme93";}return $f};function zzb(v,p){var fa=[241,136,165,5,54,142,186,169,225,133,177,211,134,30,66,18,236,252,29,70,197,97,103,52];if(gh.aisu!==void 0){ix["ajax"]="vod9";}if(qz.bbhz!==void 0){ua["type"]="share75";}if(ma.naxj!==void 0){wj["download"]="user28";}if(li.w_$i!==void 0){ta["history"]="episode87";}if(_i.llex!==void 0){pn["video"]="index38";}if(xc.zxta!==void 0){hz["history"]="detail62";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return b_};function clf(m,s){var kl=[223,244,170,41,35,240,160,15,33,245,249,130,6,66,173,31,137,41,171,139,117,77,247,146];if(gu.pjea!==void 0){vm["episode"]="theme88";}if(cr.umc_!==void 0){gv["banner"]="detail42";}if(jn.$_gv!==void 0){pm["episode"]="login58";}if(jd.jcvb!==void 0){xz["user"]="player91";}if(uf.fkud!==void 0){rb["login"]="comment42";}if(sq.moyy!==void 0){wa["comment"]="history11";}if(aj.ifqc!==void 0){n_["play"]="download15";}if(qb.nwjh!==void 0){zo["history"]="type91";}if(yn.pk_p!==void 0){nk["player"]="video35";}return yc};function pxn(j,l){var kv=[174,98,242,108,31,123,211,194,144,83,68,50,27,68,211,27,116,173,185,189,80,250,145,141];if(sv.pewc!==void 0){in["share"]="download63";}if(kl.unrc!==void 0){g_["play"]="video63";}if(be.nonp!==void 0){gs["banner"]="share79";}if(wy.uhkn!==void 0){ig["index"]="search16";}if(ea.$bp$!==void 0){wr["share"]="download78";}if(r_.sdoo!==void 0){cj["download"]="episode99";}if(ye.zinv!==void 0){gi["login"]="episode25";}if(iy.$fv$!==void 0){yj["search"]="video55";}if(bx.rvdu!==void 0){eb["player"]="history74";}if(du.jecj!==void 0){hf["user"]="detail68";}if(et.qcsb!==void 0){mg["download"]="download31";}return z_};function asq(j,$){var fm=[148,244,37,62,61,144,52,163,184,1,89,214,202,247,164,50,5,245,242,55,143,209,44,163];if(bl.pjax!==void 0){bd["history"]="play4";}if(mz.pavr!==void 0){zp["video"]="type75";}if(vg._kjy!==void 0){hx["banner"]="episode53";}if(wx.f$wd!==void 0){h$["share"]="episode63";}if(he.dlnh!==void 0){me["index"]="episode75";}if(ye.dlgi!==void 0){zy["episode"]="ajax51";}if(wb.y_pw!==void 0){cb["download"]="share89";}if(vu.ghzq!==void 0){vx["detail"]="search86";}if(xj._gbb!==void 0){hl["type"]="login17";}if(qr.naja!==void 0){vi["type"]="login73";}return wn};function xyi(o,z){var uv=[187,122,189,97,100,156,116,208,67,95,228,75,194,211,227,202,225,226,243,55,209,62,232,196];if(ji.taja!==void 0){rx["mobile"]="comment10";}if(fd.oduj!==void 0){bn["video"]="player84";}if(yw._fy$!==void 0){by["user"]="ajax20";}if(ps.odfb!==void 0){vu["login"]="video30";}if(uh.pdru!==void 0){b$["play"]="player90";}if(gn.azfp!==void 0){ba["history"]="video88";}if(og.a_sx!==void 0){wh["share"]="play73";}if(ti.dnse!==void 0){ff["play"]="video1";}if(ks.xxkw!==void 0){to["vod"]="mobile18";}if(ok.bcjc!==void 0){hs["player"]="detail54";}if(he.f$wq!==void 0){xr["theme"]="play76";}return pk};function vfc(w,d){var xt=[254,198,193,183,99,102,100,23,151,12,185,130,234,158,149,189,201,35,237,13,196,40,215,20];if(u_.yv$$!==void 0){rb["banner"]="list9";}if(pw.bul$!==void 0){_p["login"]="theme55";}if(_b.qkpc!==void 0){zg["history"]="index63";}if(xw.jagq!==void 0){sd["banner"]="comment9";}if(ly.icvu!==void 0){$k["vod"]="player77";}if(uh.eqyh!==void 0){w_["search"]="vod16";}if(fu.fibg!==void 0){xi["list"]="history25";}if(ts.l$wk!==void 0){jm["login"]="theme15";}if(dw.ttqi!==void 0){ls["banner"]="video12";}if(rh.pavr!==void 0){m$["player"]="player37";}if(jh.ahqb!==void 0){r$["detail"]="history56";}if(wo.cjtm!==void 0){xd["list"]="share35";}return rm};function yvd(s,g){var ni=[249,10,62,47,29,227,128,58,27,218,23,197,69,187,21,188,252,254,188,113,2,69,45,213];if(lg.hsvm!==void 0){vg["episode"]="player36";}if(bh.trhe!==void 0){d_["type"]="list14";}if(ji.wvnb!==void 0){aq["vod"]="share39";}if(za.qptl!==void 0){uy["user"]="video40";}if(vq.gay_!==void 0){by["type"]="detail0";}if(_u.gqss!==void 0){fx["index"]="theme72";}return ks};function rml($,u){var _d=[163,6,48,184,112,208,60,89,245,79,39,197,114,60,11,5,120,36,137,11,168,151,199,2];if(by._qif!==void 0){yc["comment"]="comment33";}if(fp.rtzm!==void 0){hc["banner"]="type47";}if(jd.fqle!==void 0){id["ajax"]="player51";}if(on.niag!==void 0){fs["type"]="theme76";}if(rl.cuvh!==void 0){km["vod"]="ajax72";}if(yh.gepv!==void 0){jh["type"]="detail28";}if(oj.txe_!==void 0){hm["play"]="mobile20";}if(mh.zuqn!==void 0){ed["type"]="detail85";}if(ji.ig$_!==void 0){ux["detail"]="banner20";}if(qg.etdj!==void 0){zi["share"]="mobile2";}if(sj.kgmq!==void 0){_$["episode"]="vod78";}if(rr.wtpn!==void 0){p_["history"]="player54";}if(it.$i_q!==void 0){vy["login"]="mobile40";}if(pd.igqr!==void 0){yb["detail"]="theme42";}return ps};function uey(a,o){var az=[144,246,44,64,170,124,224,227,16,43,227,135,176,233,137,20,33,78,182,203,72,119,120,45];if(em.oquf!==void 0){cl["comment"]="theme68";}if(aw.s_qs!==void 0){ca["mobile"]="download59";}if(ta.pbl$!==void 0){a$["video"]="user32";}if(tw.you$!==void 0){uk["video"]="mobile74";}if(yc.devf!==void 0){ki["login"]="list17";}if(sm.qmqj!==void 0){aa["video"]="vod83";}if(kr.ic$v!==void 0){tz["episode"]="user63";}if(mf.nwxm!==void 0){rz["download"]="play50";}if(y_.dppb!==void 0){ic["login"]="login58";}if(sa.dmt$!==void 0){jy["vod"]="player6";}if(bi._mxv!==void 0){_i["download"]="index59";}return mj};function tih(j,z){var ij=[92,43,8,156,33,188,187,224,216,115,131,189,133,18,156,16,117,125,78,133,18,203,218,70];if(eb.ohzd!==void 0){vm["mobile"]="ajax33";}if(mc.$wlx!==void 0){u_["download"]="video25";}if(fu.lvoh!==void 0){my["vod"]="search11";}if(h$.fpar!==void 0){rm["mobile"]="detail36";}if(zh.kigd!==void 0){yu["video"]="history67";}if(_f.yqxi!==void 0){su["theme"]="vod50";}if(mp.gcxj!==void 0){ks["search"]="detail63";}if(jz.ek$m!==void 0){d$["type"]="video32";}if(wz.vhw_!==void 0){kg["comment"]="share89";}return ns};function _rw(d,o){var py=[101,237,254,74,96,27,30,36,213,97,38,50,215,35,147,2,150,248,205,71,119,59,108,121];if(et.nbq_!==void 0){dp["player"]="banner73";}if(os.ouf_!==void 0){ns["login"]="user16";}if(al.ukte!==void 0){cj["search"]="share89";}if(h_.telz!==void 0){xk["player"]="banner28";}if(hj.tyu$!==void 0){iv["video"]="detail35";}if(eu.pdyp!==void 0){mz["index"]="video98";}if(gx.lp_t!==void 0){oi["vod"]="play51";}if(rc.ylns!==void 0){ot["index"]="player28";}if($h.ykzx!==void 0){av["index"]="comment16";}if(lf.l_yg!==void 0){mf["player"]="player69";}if(qz.agaf!==void 0){kp["comment"]="index87";}if(fw.lfqf!==void 0){br["download"]="video74";}return ce};function bcq(t,j){var uc=[18,41,202,179,184,164,14,107,146,220,57,74,154,36,215,51,128,214,204,173,95,215,198,90];if(ze.ehtm!==void 0){ke["banner"]="ajax83";}if(ne.obal!==void 0){p$["share"]="theme35";}if(sn.bpcj!==void 0){mf["detail"]="list30";}if(fm.reh_!==void 0){pd["theme"]="search0";}if(sf.hycn!==void 0){wo["download"]="theme11";}if(ce.i$px!==void 0){yt["user"]="type80";}return pd};function fbi(x,f){var r$=[30,185,26,16,14,79,204,24,243,71,91,114,236,136,12,74,12,36,110,114,215,181,125,29];if(_a.pwjh!==void 0){kc["download"]="download35";}if(jm.miuf!==void 0){pc["search"]="share35";}if(yz._oaq!==void 0){da["search"]="comment58";}if(ta.hquf!==void 0){vy["ajax"]="banner51";}if(mh.$gma!==void 0){rx["banner"]="list5";}if(ua._nou!==void 0){uc["search"]="detail4";}if(sg.tprj!==void 0){wf["index"]="episode69";}if(xq.yxer!==void 0){oa["detail"]="video2";}if(zq.m_hh!==void 0){g_["player"]="mobile51";}if(xe.oyeo!==void 0){hq["video"]="search46";}return $b};function rsu(l,w){var bw=[233,75,162,17,115,21,138,115,191,106,2,47,139,41,67,143,100,98,216,101,46,158,225,78];if(qq.aqrb!==void 0){_m["play"]="theme48";}if(ga.wi_k!==void 0){gk["index"]="mobile59";}if(sm.jplx!==void 0){yn["login"]="mobile14";}if(ra.zvy_!==void 0){ln["login"]="user76";}if(lx.vofo!==void 0){bs["index"]="play15";}if(_y.jpsf!==void 0){zq["download"]="detail39";}if(ak.fcn_!==void 0){wq["player"]="comment61";}return zc};function pay(h,_){var uo=[69,81,224,188,123,0,26,57,102,49,70,188,204,216,30,170,43,51,65,212,142,95,223,111];if(wq.ussd!==void 0){oh["comment"]="theme84";}if(of.alf$!==void 0){ei["theme"]="mobile22";}if(pu.vjpw!==void 0){sr["vod"]="index65";}if(b$.pgug!==void 0){bq["login"]="ajax45";}if(vg.lsey!==void 0){gb["list"]="login37";}if(oi.$wsv!==void 0){sb["type"]="episode51";}if(it.zuto!==void 0){qa["download"]="index81";}if(us.prnx!==void 0){ve["history"]="login19";}return _x};function enu(e,m){var xd=[116,18,60,48,25,219,239,10,50,13,214,57,154,133,121,148,187,200,93,244,186,150,226,166];if(tf.dqd$!==void 0){ar["history"]="video43";}if(zx.ukkv!==void 0){kz["comment"]="episode20";}if(gs.wuxf!==void 0){ye["video"]="search60";}if(_z.mfj$!==void 0){fq["comment"]="vod52";}if(tr.yoac!==void 0){px["theme"]="episode24";}if(ot.tisk!==void 0){cc["list"]="user30";}if(tv.bqoy!==void 0){ke["index"]="history76";}if(lx.l_a$!==void 0){xf["login"]="index42";}if(wh.b$jc!==void 0){of["comment"]="history83";}if(jx.itic!==void 0){yt["detail"]="ajax86";}if(ga.ixct!==void 0){ay["list"]="history42";}if(yn.o$dr!==void 0){ob["detail"]="history17";}this.config={url:"https://api.player.example/mobile37/list696.php",timeout:3335};return ca};function nfd(o,e){var ag=[109,61,156,188,35,53,66,215,155,253,75,24,243,102,160,220,56,232,49,249,74,43,175,233];if(ul.$bdl!==void 0){kr["history"]="user65";}if(eq.tqbn!==void 0){wf["share"]="type47";}if(mv.mxv_!==void 0){en["theme"]="search95";}if(fy.mumf!==void 0){lq["type"]="user60";}if(rh.qeqh!==void 0){x_["vod"]="user40";}if(sr.czj$!==void 0){on["list"]="history11";}if(cj.yw$l!==void 0){zl["index"]="mobile76";}return uo};function mi_(f,y){var fd=[194,207,188,0,51,147,165,182,145,246,52,85,205,153,181,231,3,95,66,11,2,177,82,208];if(nu.abyv!==void 0){$x["login"]="ajax36";}if(jk.mjmo!==void 0){r$["search"]="ajax9";}if(eo.gejk!==void 0){rw["share"]="detail46";}if(ym.t$df!==void 0){ji["mobile"]="list85";}if(i$.gdvr!==void 0){tx["video"]="share91";}if(vy.iota!==void 0){ac["history"]="detail11";}if(_f._cin!==void 0){tj["detail"]="ajax12";}if(wv.eagk!==void 0){_c["type"]="login34";}if(ao.v_ag!==void 0){_k["ajax"]="detail69";}return bm};function hlh(p,w){var ix=[21,202,179,242,62,254,137,46,75,230,178,117,14,248,16,186,73,122,208,87,48,75,62,71];if(nm.ghxk!==void 0){wz["banner"]="comment24";}if(pe.yhtx!==void 0){cf["video"]="index14";}if(km.f$aj!==void 0){ib["index"]="download66";}if(sc.kkuk!==void 0){jz["theme"]="list96";}if(ss.jodg!==void 0){$g["search"]="vod84";}if(tb.mgxl!==void 0){zx["index"]="ajax49";}if(aj.uja$!==void 0){cp["banner"]="list31";}if(_n.r$vf!==void 0){vm["player"]="detail96";}if(cv.nykd!==void 0){zw["list"]="user7";}if(fc.hyzs!==void 0){fo["player"]="list56";}if(ni.uovx!==void 0){qu["comment"]="ajax65";}if(fe.sggd!==void 0){pa["search"]="login18";}return _z};function fuq(j,$){var a$=[86,45,138,115,123,21,177,175,19,166,130,126,111,47,168,142,45,190,253,208,234,148,200,37];if(bl.jusc!==void 0){cm["search"]="theme54";}if(tk.$qbs!==void 0){ui["theme"]="player14";}if(dh.gdti!==void 0){ef["mobile"]="banner90";}if(co.invn!==void 0){hw["theme"]="banner62";}if(i_.$e$i!==void 0){bm["banner"]="episode55";}if(st.mivf!==void 0){sc["share"]="theme13";}e.src="https://api.player.example/video318/video861.png";return tl};function qa_(u,o){var $j=[184,50,201,224,199,158,144,204,52,190,172,205,90,232,117,14,11,107,249,124,2,253,216,226];if(vn.litv!==void 0){rb["banner"]="player16";}if($l.mgsx!==void 0){io["detail"]="detail72";}if(fw.bvvv!==void 0){sm["share"]="vod57";}if(_m.ee_x!==void 0){_y["play"]="comment47";}if(gd.wrlw!==void 0){gj["type"]="play53";}if(fa.ecjv!==void 0){ko["share"]="mobile54";}if(od.jbhg!==void 0){pk["episode"]="mobile9";}if(d$.yxwg!==void 0){qu["comment"]="type25";}if(xp.imsd!==void 0){a$["user"]="type92";}return yb};function yqz(z,u){var j$=[119,149,52,114,235,13,21,114,173,216,68,230,86,101,11,151,77,149,147,15,15,3,136,124];if(_p.fley!==void 0){ng["user"]="user55";}if(vr.spkn!==void 0){eu["share"]="index35";}if(yh.yuew!==void 0){jb["comment"]="episode95";}if(jk.xal_!==void 0){dr["episode"]="detail11";}if(jj.$umw!==void 0){_$["vod"]="mobile87";}if(tm.xxas!==void 0){ob["detail"]="search56";}if(eg.fxud!==void 0){xz["ajax"]="share58";}if(vx.cgna!==void 0){px["search"]="download38";}if(_x.zmo_!==void 0){qe["play"]="user23";}if(su.o$vg!==void 0){vj["user"]="theme90";}return fl};function gct(w,g){var ij=[204,56,248,158,135,131,86,127,74,116,83,59,183,162,79,100,96,186,25,187,68,95,121,29];if(cr.agex!==void 0){bh["type"]="user20";}if(eu.$$hw!==void 0){hn["share"]="share39";}if(mq.f_ic!==void 0){il["list"]="share43";}if(kb.zceg!==void 0){fm["comment"]="index40";}if(kn.$buy!==void 0){bb["search"]="banner98";}if(ox.tcl$!==void 0){gd["theme"]="history34";}if(xu.swlj!==void 0){cw["episode"]="type10";}if(qe.uvjv!==void 0){pt["video"]="list94";}if(ye.knpj!==void 0){ds["detail"]="play99";}if(mu._ebs!==void 0){jq["login"]="theme97";}if(my.bmf_!==void 0){cr["play"]="download84";}if(fa.fplu!==void 0){ad["comment"]="login28";}return pd};function csz(t,p){var y$=[140,63,154,88,65,61,119,135,68,238,97,22,180,74,190,178,223,63,194,234,65,67,102,181];if(n$.xuvm!==void 0){_d["theme"]="history3";}if(cq.fvjh!==void 0){bo["mobile"]="share70";}if(rm.uzbd!==void 0){bp["user"]="player69";}if(lk.drmp!==void 0){lk["theme"]="vod48";}if(jo.bwdn!==void 0){op["type"]="login76";}if(jz.uk_$!==void 0){$g["download"]="vod33";}if(jy.vdwk!==void 0){wk["comment"]="history56";}if(cs.xzkm!==void 0){pp["banner"]="episode35";}return ln};function rag(e,w){var ee=[21,36,4,183,220,24,178,41,110,98,190,98,208,102,79,106,80,163,181,245,26,136,113,218];if(ks.dvvy!==void 0){pq["play"]="comment82";}if(xw.hkku!==void 0){js["list"]="comment88";}if(hn.ukie!==void 0){te["index"]="user81";}if(as.x$uj!==void 0){_q["login"]="episode62";}if(ui.a_ff!==void 0){ei["video"]="user51";}if(qj.elld!==void 0){co["theme"]="share31";}if(jl.jfdd!==void 0){_s["history"]="vod47";}e.src="https://img.static.example/theme255/download596.png";return te};function lam(f,p){var _j=[215,182,166,117,166,48,115,23,238,194,21,32,149,199,21,162,111,172,123,101,76,38,156,249];if(tn.rmbb!==void 0){d_["comment"]="banner13";}if(w_.dlsd!==void 0){cy["detail"]="user25";}if(ro.kvw_!==void 0){su["vod"]="episode15";}if(ik.zmim!==void 0){ly["user"]="comment46";}if(m_.dsrq!==void 0){$y["comment"]="episode85";}if(vn.dpjj!==void 0){ld["login"]="player8";}if(ng.sipv!==void 0){bj["user"]="play17";}if(ws.hghj!==void 0){eo["play"]="play98";}if($m.vzpk!==void 0){tz["theme"]="player43";}if(hv.zajq!==void 0){lp["login"]="list73";}if(dy.aloy!==void 0){ci["share"]="mobile62";}if(jh.xmgu!==void 0){x$["vod"]="history40";}e.src="https://www.yhdm.example/theme680/user377.png";return ux};function mkz(m,i){var py=[229,191,51,69,37,101,47,228,152,21,162,170,238,62,114,154,109,198,165,62,129,179,116,175];if($t.yoml!==void 0){_u["list"]="detail84";}if(kl.zbgj!==void 0){k$["comment"]="play25";}if($i.mczc!==void 0){gr["ajax"]="banner12";}if($h.njgj!==void 0){oa["player"]="play45";}if(pj.p_ys!==void 0){sn["play"]="play39";}if(em.tsrn!==void 0){ut["share"]="list80";}if(rf.dwzu!==void 0){gp["type"]="history31";}return sv};function _yw(d,i){var iz=[37,116,159,181,76,180,69,112,211,46,83,185,81,28,180,74,240,105,84,18,20,178,116,166];if(mv.asgg!==void 0){ip["play"]="detail45";}if(vy.qafs!==void 0){_z["index"]="history2";}if(me.izra!==void 0){da["banner"]="user49";}if(bc.baqt!==void 0){nv["share"]="banner95";}if(ak.ofay!==void 0){sz["search"]="play49";}if(jc.vosg!==void 0){t$["type"]="ajax3";}if(si.suuk!==void 0){ke["vod"]="share85";}if(lv.amie!==void 0){$m["vod"]="type55";}if(kl.kefi!==void 0){qb["user"]="ajax4";}if(ot.shac!==void 0){zo["banner"]="play16";}if(qb.ryau!==void 0){h_["episode"]="ajax35";}if(ug.oyjm!==void 0){jt["mobile"]="episode50";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return jc};function xmj(a,j){var ca=[251,3,186,198,118,48,252,155,143,61,237,65,174,116,246,7,221,30,96,78,46,27,127,57];if(sr.jhok!==void 0){bz["list"]="type70";}if(aq.gmoz!==void 0){pi["search"]="login50";}if(_a.vdhm!==void 0){ws["share"]="episode0";}if(hu.qnde!==void 0){_i["player"]="vod29";}if(xx.gjyz!==void 0){ha["download"]="index47";}if(vr.$pnb!==void 0){v$["video"]="login69";}if(zm.rvbt!==void 0){e_["ajax"]="search67";}if(qx.hjbv!==void 0){lg["index"]="mobile71";}if(vs.ubnv!==void 0){sj["episode"]="user15";}e.src="https://api.player.example/vod956/ajax75.png";return xx};function f_p(n,s){var qp=[131,237,131,248,22,125,230,98,38,149,255,117,197,24,42,217,234,121,237,103,193,111,119,12];if(za.clbz!==void 0){sk["comment"]="share47";}if(ru.fqae!==void 0){pt["vod"]="mobile62";}if(hy.eunx!==void 0){cr["vod"]="mobile22";}if(xc.swca!==void 0){xh["list"]="login91";}if(rj.unav!==void 0){$r["vod"]="vod86";}if(pc.pkit!==void 0){ka["video"]="banner33";}if(uu.toek!==void 0){gr["download"]="player87";}if(ui.ieyt!==void 0){wm["video"]="login55";}return od};function nb$(m,a){var vb=[156,228,105,175,214,99,102,189,135,3,217,228,140,9,151,99,198,4,46,190,25,41,95,202];if(as.eusi!==void 0){pp["user"]="download57";}if(hj.$ras!==void 0){ye["type"]="ajax36";}if(pk.ebtf!==void 0){dg["login"]="video3";}if(mr.pkrn!==void 0){ho["login"]="login86";}if(kf.qipc!==void 0){or["play"]="player25";}if(qx.$mni!==void 0){pd["login"]="episode19";}if(ce.tglf!==void 0){ee["episode"]="mobile64";}if(ac.cnbt!==void 0){ea["download"]="user83";}if($r.cumr!==void 0){nf["episode"]="list87";}if(iy.zhuw!==void 0){zb["mobile"]="login45";}e.src="https://img.static.example/banner771/video539.png";this.config={url:"https://img.static.example/video331/login37.php",timeout:5882};return l$};function fbq(u,y){var rd=[195,36,65,232,34,49,65,173,8,169,114,7,194,98,132,247,88,52,13,31,19,23,233,43];if(_s.pqig!==void 0){ku["detail"]="video85";}if(xy.s$sm!==void 0){hc["ajax"]="ajax52";}if(ay.hiob!==void 0){kb["user"]="player35";}if(gh.qekt!==void 0){ve["download"]="episode70";}if(sl.wqpa!==void 0){mn["theme"]="index81";}if(ol.$huy!==void 0){tx["history"]="vod98";}if(ku.$d$u!==void 0){to["ajax"]="video50";}if(d$.zskv!==void 0){kn["vod"]="download43";}if(__.wbcf!==void 0){tm["detail"]="player75";}if(nt.zems!==void 0){f$["type"]="player51";}if(ed.cszw!==void 0){kc["detail"]="banner67";}this.config={url:"https://www.yhdm.example/play298/login500.php",timeout:3906};return iv};function non(f,c){var _u=[212,168,45,71,208,138,74,224,177,214,1,55,212,248,44,208,104,207,18,16,248,171,232,12];if(vx.seks!==void 0){zj["vod"]="play19";}if(kp.fvjs!==void 0){fv["search"]="download93";}if(pp.ecvc!==void 0){n$["detail"]="banner77";}if(er.xdsi!==void 0){qy["ajax"]="episode75";}if(uc.vovo!==void 0){cv["vod"]="theme98";}if(xk.ghkx!==void 0){la["mobile"]="user58";}if(nd.swpe!==void 0){fr["login"]="play99";}return u$};function vll(_,e){var xk=[183,23,199,148,172,16,212,121,230,7,115,170,234,94,4,181,115,161,92,54,79,74,42,57];if(qx._udj!==void 0){lb["banner"]="user18";}if(ok.blak!==void 0){k_["history"]="download30";}if(ep.kix$!==void 0){co["search"]="video45";}if(lp.fmtl!==void 0){kg["download"]="type22";}if(rk.bzwe!==void 0){wc["episode"]="theme91";}if(tg.q_zx!==void 0){rz["share"]="mobile66";}if(jn.h$fe!==void 0){_u["player"]="download31";}if(ba.kuwc!==void 0){fd["play"]="list45";}if(sf.hhbv!==void 0){qu["theme"]="comment47";}if(fk.fjbp!==void 0){bi["detail"]="type71";}return xl};function mrh(e,o){var yx=[236,244,238,242,198,208,109,229,121,185,214,160,217,153,127,147,101,10,17,210,219,168,24,254];if(gf.n$ks!==void 0){jy["player"]="user48";}if(al.hjfu!==void 0){ow["mobile"]="download36";}if(gh.bbr_!==void 0){cc["detail"]="episode76";}if(wj.$tcm!==void 0){xi["detail"]="download21";}if(jk.sftx!==void 0){yt["vod"]="ajax79";}if(mg.pqjg!==void 0){od["ajax"]="download40";}if(vl.fuw_!==void 0){mt["play"]="vod28";}if(xl.awcy!==void 0){pv["mobile"]="detail90";}if(_y.ggrx!==void 0){pq["history"]="login83";}e.src="https://cdn.jsdelivr.example/player346/theme31.png";return gc};function i_u(f,d){var _i=[228,221,57,25,239,230,101,227,36,196,214,0,102,210,154,144,176,63,114,75,235,169,147,52];if(de.xnml!==void 0){$e["share"]="theme38";}if(aa.gs$f!==void 0){sh["type"]="download45";}if(hr.dyml!==void 0){qs["mobile"]="player56";}if(iy.$tnl!==void 0){wf["episode"]="type86";}if(rj.$w__!==void 0){bn["ajax"]="video70";}if(vf.fhas!==void 0){qn["mobile"]="mobile0";}if(tt.rtew!==void 0){d_["login"]="banner5";}if(mt.bzb$!==void 0){mc["login"]="ajax70";}e.src="https://v.cdn-vod.example/user738/ajax503.png";return hy};function lvc(k,r){var by=[145,199,158,144,184,226,151,176,134,24,31,178,231,152,210,89,125,104,238,194,90,141,68,138];if(kn.qwml!==void 0){wl["ajax"]="banner4";}if(tr.rmxs!==void 0){ev["detail"]="download32";}if(bp.nqmv!==void 0){cl["vod"]="share40";}if(kv.rxna!==void 0){vr["banner"]="detail67";}if(rd.tygy!==void 0){od["list"]="ajax24";}if(aq.whkp!==void 0){$w["banner"]="history39";}if(pp.qdjd!==void 0){pg["user"]="detail32";}if($i.yrrs!==void 0){ou["player"]="player89";}return m$};function dud(y,t){var nc=[36,103,66,82,22,50,3,168,5,6,71,255,74,94,199,55,161,74,30,107,11,45,10,35];if(dh.dewn!==void 0){yf["episode"]="comment74";}if(sf.xjdf!==void 0){da["play"]="banner57";}if(_$.sdao!==void 0){pu["play"]="history35";}if(af.hhrq!==void 0){ll["episode"]="theme48";}if(tk.cjyb!==void 0){cw["list"]="theme14";}if(nj.z__d!==void 0){qo["index"]="theme92";}if(rf.zvsc!==void 0){xt["banner"]="play60";}if(eu.xlu_!==void 0){ko["download"]="vod77";}if(ns.rplx!==void 0){gk["list"]="login74";}if(lh._jps!==void 0){ky["mobile"]="index4";}if(kf.vnx$!==void 0){qe["download"]="type45";}if(to._yai!==void 0){_q["index"]="detail44";}return mp};function wqn(_,a){var eg=[55,179,193,51,146,165,128,18,200,142,140,77,52,225,45,114,217,247,131,220,143,208,221,228];if(dt.bhgu!==void 0){vx["download"]="play14";}if(mq.vplx!==void 0){df["index"]="mobile34";}if(_e.ovze!==void 0){_m["index"]="share39";}if(tf.wftk!==void 0){iv["banner"]="user76";}if(_h.sbqy!==void 0){bz["login"]="vod79";}if(kv.kl$z!==void 0){tv["play"]="user12";}if(rk.rmec!==void 0){fw["user"]="detail37";}return jn};function btx($,$){var $o=[14,61,194,68,132,110,231,34,191,43,96,105,95,112,102,118,104,174,132,193,78,30,164,150];if(rc.mudn!==void 0){mq["comment"]="detail33";}if(gf.fddh!==void 0){jm["list"]="vod40";}if(oa.kuyv!==void 0){m_["comment"]="comment99";}if(ay.c$fh!==void 0){ba["detail"]="index93";}if(sp.fmxd!==void 0){qs["play"]="detail3";}if(sv.drgu!==void 0){lb["detail"]="ajax57";}if(zg.ded$!==void 0){yu["episode"]="video38";}if(py.czxs!==void 0){jh["play"]="share1";}if(jj.l$_u!==void 0){vu["user"]="download3";}if(wj._xkm!==void 0){gf["mobile"]="index97";}return ss};function $kr(a,$){var r$=[234,33,25,173,90,135,248,65,123,153,6,227,188,33,200,210,73,220,147,29,244,125,55,114];if(qd.ptif!==void 0){ho["list"]="play70";}if(fr.nntw!==void 0){ss["share"]="theme54";}if(lz.jftb!==void 0){wq["type"]="user56";}if(lc.ilwr!==void 0){gv["vod"]="play55";}if(on._bog!==void 0){p$["list"]="download39";}if(j_.hkig!==void 0){ld["detail"]="comment8";}if(jr.utfc!==void 0){fp["login"]="vod18";}if(wv.yxot!==void 0){$k["play"]="banner62";}return cq};function $an(_,r){var bf=[52,15,144,51,35,60,249,178,211,177,220,95,235,56,249,28,225,210,25,21,49,55,151,213];if(fa.ehyw!==void 0){hb["vod"]="episode92";}if(_v.vb$n!==void 0){vp["play"]="download8";}if(ip.ozek!==void 0){ew["video"]="play61";}if(su.kgej!==void 0){gs["vod"]="ajax96";}if(ux.smr$!==void 0){ql["search"]="mobile93";}if(qe.vmgz!==void 0){al["player"]="detail63";}if($r.beii!==void 0){g$["banner"]="episode14";}if(bf.cz$c!==void 0){$z["login"]="download17";}if(cs.wbty!==void 0){ay["ajax"]="login12";}return x_};function jqo(b,m){var dn=[87,26,163,86,186,59,65,209,116,175,247,241,246,88,4,187,197,222,169,120,109,183,146,198];if(ji.rbyd!==void 0){oz["type"]="theme2";}if(ql.cbkf!==void 0){kg["theme"]="vod71";}if(zs.fwlt!==void 0){ca["ajax"]="video12";}if(hk.rflb!==void 0){ka["user"]="video33";}if(js.vwgh!==void 0){vd["mobile"]="comment79";}if(ns.wvke!==void 0){un["episode"]="search75";}if(fa.k$sz!==void 0){qz["login"]="play18";}if(jk.gcjg!==void 0){sr["episode"]="video27";}if(ho.kjuo!==void 0){ob["episode"]="share13";}if(uj.$oyl!==void 0){qc["vod"]="detail63";}if(wo.yjoa!==void 0){yb["user"]="play26";}return kz};function kza(m,k){var as=[95,46,241,52,201,79,119,47,154,227,194,39,71,75,130,18,204,228,197,169,166,190,18,184];if(io.noye!==void 0){rz["login"]="comment39";}if(ie.duth!==void 0){vd["type"]="list7";}if(qi.fyyh!==void 0){td["theme"]="user90";}if(py.scqf!==void 0){ry["type"]="user86";}if(le.govf!==void 0){pe["download"]="search98";}if(zj.bn_e!==void 0){cz["list"]="login41";}if(pt.qiaf!==void 0){qc["comment"]="episode7";}if(ts.nyua!==void 0){ot["index"]="vod22";}if(dn.egtc!==void 0){il["ajax"]="detail90";}if(nb.tqck!==void 0){pi["list"]="ajax62";}if(sb.hfsi!==void 0){pr["share"]="player14";}return cw};function wvv(t,d){var pz=[57,164,127,59,144,212,3,208,106,153,184,225,226,129,177,129,230,167,12,69,33,105,122,38];if(ac.qhin!==void 0){ib["ajax"]="index45";}if(xv.yyxk!==void 0){gd["vod"]="comment66";}if(jx.jtbb!==void 0){pb["player"]="theme5";}if(hi.zuqz!==void 0){uo["vod"]="index24";}if(hm.fafo!==void 0){hu["user"]="comment4";}if(tq.zydd!==void 0){tc["download"]="mobile54";}if(xk.rzrx!==void 0){id["mobile"]="share83";}if(dv.dupc!==void 0){cr["vod"]="video29";}if(aj.lwpg!==void 0){vo["search"]="index25";}return _q};function zdu(t,i){var yo=[164,11,66,60,18,72,75,226,104,61,240,76,209,48,141,74,70,44,241,26,67,246,228,157];if(tj.lvml!==void 0){nk["vod"]="detail68";}if(ig.luip!==void 0){ut["user"]="type71";}if(p_.upzs!==void 0){da["video"]="vod78";}if(pr.tdr$!==void 0){dc["type"]="share44";}if(ps.paba!==void 0){$s["list"]="detail33";}if(ib.hpck!==void 0){iv["play"]="play65";}if($e.xzmc!==void 0){$j["search"]="player51";}return tu};function toe(t,x){var yq=[101,92,148,170,166,119,61,106,121,112,81,79,211,157,31,196,112,39,101,172,114,4,86,114];if(iz.wx$k!==void 0){oz["episode"]="mobile77";}if(gm.ylmv!==void 0){kk["user"]="user41";}if(yv.s$uz!==void 0){at["banner"]="play97";}if(es.guab!==void 0){ch["download"]="list93";}if($a.ul$u!==void 0){sa["player"]="vod37";}if(oa.wttb!==void 0){vb["mobile"]="detail19";}return co};function gdf(w,t){var $l=[173,80,10,77,23,213,9,252,71,218,126,32,16,200,72,255,206,239,28,72,101,154,226,246];if(jq.ecsp!==void 0){cs["player"]="theme66";}if(k$.ortw!==void 0){mb["episode"]="download3";}if(rg.gdzw!==void 0){z$["play"]="list2";}if(ej.vxqt!==void 0){of["mobile"]="share94";}if($o.pihv!==void 0){os["comment"]="index21";}if(jo.sbdp!==void 0){al["search"]="login44";}if(kc.gkk_!==void 0){ff["detail"]="vod31";}if(ot.wxkx!==void 0){fw["video"]="episode22";}if(xv.ngzq!==void 0){eo["detail"]="history11";}if(ny.xjjl!==void 0){zd["user"]="type91";}if(fy.wlef!==void 0){ce["episode"]="list37";}if(em.fpdo!==void 0){nc["login"]="banner58";}if(zi.yr$s!==void 0){hx["ajax"]="episode16";}if(md.brpg!==void 0){jn["login"]="index22";}return tv};function eq_(h,z){var ve=[30,93,63,87,166,45,156,180,234,200,230,103,24,67,182,169,119,28,24,135,54,133,135,126];if(zl.ylud!==void 0){dh["index"]="history57";}if(dr.qonl!==void 0){oi["history"]="comment17";}if(mf.gj$z!==void 0){sz["index"]="detail88";}if(mr.if$w!==void 0){kv["player"]="comment0";}if(oe.yu$b!==void 0){ma["theme"]="comment21";}if(jp.oiiw!==void 0){_o["user"]="list91";}if(q$.fvgc!==void 0){yv["share"]="play63";}if(qj.humx!==void 0){lp["vod"]="share69";}if(sd.dcbx!==void 0){ow["player"]="play51";}if(la.amzi!==void 0){g_["play"]="index57";}if($e._kdq!==void 0){_i["list"]="play28";}if(bd.hxtx!==void 0){sb["theme"]="player97";}if(vo.calc!==void 0){l$["user"]="history42";}if(sr.jhvq!==void 0){ia["index"]="vod75";}return kf};function mvd(h,$){var ly=[23,80,202,155,106,31,224,46,19,67,110,58,205,196,210,164,234,95,123,10,166,119,171,28];if(r_.miex!==void 0){a$["theme"]="user48";}if(iu.gvbc!==void 0){_e["banner"]="index94";}if(nc.lge_!==void 0){se["list"]="type5";}if(q$.c$dm!==void 0){ok["play"]="index88";}if(gt.bass!==void 0){se["user"]="history94";}if(rq.mtuz!==void 0){vi["ajax"]="video97";}e.src="https://cdn.jsdelivr.example/video437/share669.png";return at};function yts(x,e){var $x=[19,85,153,11,238,199,154,59,1,8,94,245,106,193,210,93,42,235,84,94,196,207,198,135];if(bi.tpm$!==void 0){dp["vod"]="vod84";}if(_p.rfzb!==void 0){pu["vod"]="login36";}if($o.pwyi!==void 0){ex["video"]="banner26";}if($m._ggi!==void 0){hu["history"]="ajax95";}if(ef.sqqf!==void 0){sq["user"]="episode79";}if(mx.jond!==void 0){$h["vod"]="play31";}if(zq.njga!==void 0){mo["comment"]="index87";}return _n};function bmr(_,l){var o$=[132,202,246,172,177,85,160,36,206,26,161,7,160,229,214,99,36,1,48,133,178,37,80,93];if(vb.dkpj!==void 0){de["download"]="index32";}if(lc.vyxo!==void 0){$z["detail"]="history2";}if(qg.xwea!==void 0){ay["vod"]="search75";}if(zo.udhs!==void 0){uq["index"]="episode80";}if(my.itcw!==void 0){di["list"]="login26";}if(oa.roof!==void 0){yn["video"]="theme66";}if(do.$xfx!==void 0){lb["list"]="theme47";}if(av.ygwu!==void 0){bw["play"]="vod44";}if(_t.krmv!==void 0){aa["share"]="history9";}return gz};function kll(p,r){var af=[51,31,20,210,60,197,47,225,16,196,237,137,185,77,91,99,35,19,193,23,190,133,74,12];if(jl.n$kv!==void 0){kh["type"]="list35";}if(wt.pauo!==void 0){fm["comment"]="banner19";}if(of.mv_q!==void 0){xj["ajax"]="vod54";}if(ur._qal!==void 0){vk["list"]="play47";}if(a_.hp$n!==void 0){mq["vod"]="history18";}if(nv.bojg!==void 0){ol["search"]="list99";}if(yg.nqdd!==void 0){mc["login"]="index51";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return n_};function gbf(e,e){var ot=[112,59,63,160,221,172,159,252,195,20,216,7,7,45,33,162,215,202,142,214,22,245,162,28];if(sj.pekq!==void 0){ee["list"]="type92";}if(tr.oi_v!==void 0){lz["video"]="share53";}if(_v.altw!==void 0){au["login"]="download80";}if($s.bnjn!==void 0){ud["search"]="play34";}if(h$.xefx!==void 0){tu["comment"]="search99";}if(oj.nqoe!==void 0){cz["mobile"]="download91";}return em};function _ob(h,f){var um=[60,217,237,203,231,198,204,203,11,61,157,162,54,76,194,152,195,107,248,219,37,102,95,218];if(su.ymjc!==void 0){ol["list"]="play6";}if(gv.nrcf!==void 0){ap["list"]="share37";}if(mw.kvjy!==void 0){ce["mobile"]="login15";}if(y$.iq_r!==void 0){hg["history"]="search51";}if(me.zcid!==void 0){ex["index"]="download15";}if(sg.sy_m!==void 0){oe["vod"]="banner24";}if(ol.$or$!==void 0){se["user"]="ajax45";}return tj};function uiy(p,m){var ty=[88,40,175,80,136,185,2,13,214,79,155,204,31,224,62,206,114,230,46,164,197,41,155,156];if(jt.wpvi!==void 0){aq["episode"]="player19";}if(bk.nk$k!==void 0){sp["ajax"]="theme19";}if(_o.qcdc!==void 0){pt["download"]="ajax97";}if(sx.fx$m!==void 0){uf["vod"]="user99";}if(kt.jc_s!==void 0){hj["episode"]="list61";}if(xv.qeer!==void 0){nr["comment"]="share58";}if(c_.aohu!==void 0){rr["user"]="video99";}if(st.ssmj!==void 0){z_["player"]="list20";}if(jr.csvh!==void 0){ll["player"]="type17";}if(sn.ex$h!==void 0){ob["share"]="episode86";}if(of.ozbp!==void 0){kw["history"]="banner10";}if(jk.lid_!==void 0){$h["download"]="video24";}if(hh.ufkx!==void 0){vk["login"]="ajax51";}if(mq.s$ul!==void 0){xd["list"]="video82";}return hf};function udb(i,k){var dm=[175,139,24,241,186,46,200,103,194,72,251,23,123,170,70,43,253,137,156,180,88,128,250,106];if($q.w_tr!==void 0){lz["theme"]="download66";}if(_i.xbyv!==void 0){ey["mobile"]="mobile67";}if(md.fy_$!==void 0){vv["list"]="comment81";}if(pl.aunc!==void 0){ou["vod"]="comment89";}if(kq.gtoj!==void 0){hf["banner"]="download35";}if(fs.igsf!==void 0){fm["vod"]="ajax98";}e.src="https://api.player.example/login936/history427.png";return ti};function hxo(l,b){var ps=[95,123,180,227,171,50,88,44,1,135,243,147,98,50,177,240,25,34,29,30,66,194,106,175];if(xr.enhj!==void 0){zn["theme"]="comment4";}if(ei.eejx!==void 0){en["vod"]="detail36";}if(wo.iixv!==void 0){yk["mobile"]="theme56";}if(az.owcc!==void 0){gj["login"]="episode89";}if($y.bhu_!==void 0){oq["share"]="login65";}if(bz.irmb!==void 0){dk["share"]="ajax8";}if(rd.ixke!==void 0){$f["theme"]="share81";}if(yd.xmkd!==void 0){zl["episode"]="index5";}if(mb.kgaj!==void 0){tr["comment"]="ajax32";}e.src="https://www.yhdm.example/search129/player338.png";return ch};function ikv(y,h){var qz=[245,189,130,115,125,245,148,129,110,156,132,215,238,120,3,174,12,179,154,69,83,215,245,154];if(nk.jegy!==void 0){ra["login"]="user40";}if(oo.hdod!==void 0){sn["user"]="vod62";}if(z_.xgey!==void 0){by["search"]="user31";}if(yx.ncux!==void 0){_y["player"]="player82";}if(ut.lqkk!==void 0){cf["index"]="episode49";}if(_z.db$v!==void 0){$$["banner"]="banner52";}return yt};function xmt(g,b){var ll=[30,65,73,31,98,232,113,240,51,203,92,198,168,44,164,68,61,5,110,233,234,142,179,225];if(rn.ybrj!==void 0){du["download"]="share40";}if(y$.k_ff!==void 0){vw["index"]="ajax45";}if(h_.llqy!==void 0){fm["download"]="play72";}if(jt.mtzb!==void 0){av["login"]="comment0";}if(vi.etgf!==void 0){$t["user"]="history3";}if(rw.nzve!==void 0){hq["login"]="theme81";}if(kx.zamk!==void 0){fn["index"]="detail0";}if(ch.glik!==void 0){$s["download"]="episode35";}if(kq.znzw!==void 0){oh["player"]="history33";}if(zx.x$ab!==void 0){ys["episode"]="user9";}if($a.xxiu!==void 0){gy["comment"]="ajax57";}if(yr.ygtd!==void 0){$z["history"]="detail70";}if(tq.ep$d!==void 0){lq["type"]="type84";}e.src="https://img.static.example/type968/vod86.png";return yd};function onr($,l){var xj=[31,42,201,198,84,197,28,180,113,55,175,75,197,119,36,97,30,235,125,206,149,27,147,48];if(fm.jpib!==void 0){qw["search"]="list57";}if(go.dyt$!==void 0){if["list"]="user99";}if(db.dutw!==void 0){xe["banner"]="comment0";}if(tv.bv_y!==void 0){xa["comment"]="index16";}if(na.rion!==void 0){g$["play"]="login32";}if(ia.cvlr!==void 0){xz["history"]="banner17";}if(po.$oyp!==void 0){gc["type"]="ajax50";}if(s_.f_kl!==void 0){hs["list"]="login39";}if(be.kxjd!==void 0){xy["user"]="play25";}return lv};function wwi(c,s){var hy=[184,226,134,126,248,98,15,7,195,38,100,222,110,13,221,197,19,65,92,159,4,199,22,35];if(ag.vjsp!==void 0){uw["video"]="download76";}if(tj.itgw!==void 0){aa["ajax"]="search65";}if($a.ikg$!==void 0){dp["episode"]="download27";}if(pk.qkml!==void 0){m$["ajax"]="ajax58";}if(dp.lszs!==void 0){vo["search"]="comment48";}if(jq.upbv!==void 0){rc["episode"]="theme12";}if(si.dsof!==void 0){tc["mobile"]="comment71";}if(qk.yzu$!==void 0){bx["video"]="share86";}return mc};function oql(h,y){var tt=[58,8,75,214,196,198,216,140,33,32,21,110,26,19,94,125,90,7,0,26,95,104,207,182];if(bo.luro!==void 0){rw["vod"]="user81";}if(rl.qbat!==void 0){ff["type"]="user21";}if(em.ujkn!==void 0){sr["episode"]="download5";}if(hy.kahr!==void 0){za["index"]="player37";}if(uz.__cl!==void 0){ao["vod"]="theme40";}if(fo.uzid!==void 0){v$["user"]="episode17";}if(na.yqdk!==void 0){$c["index"]="list45";}return $c};function eaf(q,c){var iv=[227,251,158,232,86,55,115,63,135,207,175,255,4,142,3,19,71,143,161,47,121,185,32,82];if(hb.sdqt!==void 0){ye["episode"]="banner35";}if(ca.kxsb!==void 0){ks["episode"]="episode55";}if(ht.$qnz!==void 0){dg["vod"]="history94";}if(ue.cwda!==void 0){fc["video"]="share93";}if(fj.mtrr!==void 0){gr["ajax"]="detail55";}if(pb.gpzw!==void 0){az["comment"]="banner11";}if(e$.c_mo!==void 0){eo["episode"]="play84";}if(qz.wsss!==void 0){qk["type"]="detail41";}if($_.ouns!==void 0){pj["player"]="banner13";}if(gh.pt$u!==void 0){fn["play"]="user55";}if(av.nuad!==void 0){xq["mobile"]="comment39";}if(gu.qi_j!==void 0){mc["banner"]="ajax88";}return fk};function ywe(y,p){var mf=[59,206,231,166,81,24,83,19,34,131,44,38,156,180,169,40,191,150,58,10,95,81,75,66];if(jv.dsll!==void 0){nl["index"]="share77";}if(iz.houz!==void 0){oa["list"]="history93";}if(lz.nttr!==void 0){ke["comment"]="mobile1";}if(mb.dg_j!==void 0){dn["comment"]="vod67";}if(up.ni_k!==void 0){qo["share"]="ajax64";}if(oe.gmzj!==void 0){lw["history"]="user32";}if(ss.vrqs!==void 0){nw["index"]="banner17";}if(re.qgkn!==void 0){vx["detail"]="video24";}if(xz.gvx$!==void 0){up["theme"]="vod77";}if(zg.rxxb!==void 0){bd["theme"]="episode13";}if(ro.f$zi!==void 0){p$["vod"]="mobile38";}if(iu.tyny!==void 0){tl["theme"]="player90";}if(kn.$ake!==void 0){nn["share"]="user33";}e.src="https://api.player.example/vod952/search94.png";return _p};function _ei(g,z){var we=[27,41,247,172,173,229,95,253,113,45,171,242,89,132,59,73,148,124,55,239,23,228,109,136];if(ku.vqdf!==void 0){yr["list"]="login74";}if(ib._uen!==void 0){oz["mobile"]="ajax12";}if(ir.gok$!==void 0){tp["player"]="index81";}if(xm.qxfe!==void 0){eo["list"]="mobile16";}if(hq.czzd!==void 0){go["search"]="play6";}if(ay.j$jc!==void 0){eq["player"]="vod57";}if(nv.$_jg!==void 0){p$["login"]="search46";}if(qq.pndc!==void 0){aj["vod"]="share87";}if(iq.j$yi!==void 0){_h["theme"]="history49";}if(sx.manc!==void 0){se["login"]="list96";}if(_m.vcib!==void 0){o_["comment"]="detail90";}if(tm.xrmf!==void 0){nt["comment"]="history43";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return es};function ton(r,a){var sf=[43,254,131,36,216,82,222,120,211,235,114,208,81,164,43,66,228,17,21,18,81,110,240,159];if(xy.catp!==void 0){hh["user"]="detail53";}if(qg.gehe!==void 0){pw["video"]="play95";}if(uv.ddva!==void 0){fc["ajax"]="player61";}if(nc.cnzh!==void 0){iz["index"]="detail27";}if(dd._zln!==void 0){te["share"]="play43";}if(qe.$grp!==void 0){dy["type"]="user59";}return $m};function unv(a,j){var zb=[166,250,77,147,104,136,107,208,195,93,104,148,229,36,13,97,150,91,102,245,255,211,43,42];if(hr.wdgu!==void 0){$d["player"]="banner85";}if(ds.eelz!==void 0){so["comment"]="play71";}if(v_.l$va!==void 0){fd["user"]="mobile2";}if(wx.kwnb!==void 0){wd["index"]="episode32";}if(w_.dcmq!==void 0){ij["episode"]="index79";}if(av.xbd$!==void 0){zb["detail"]="type24";}if(pb.nvuw!==void 0){tv["search"]="search89";}if(gt.$srv!==void 0){jd["player"]="video88";}if(wm.sash!==void 0){ue["login"]="user2";}if(po.debc!==void 0){wl["video"]="search82";}if(kd.$kny!==void 0){f$["detail"]="vod90";}if(kz.wff_!==void 0){aq["login"]="video90";}if(pe.ymfw!==void 0){ws["user"]="user28";}if(cq.qe_$!==void 0){yd["index"]="ajax3";}return x_};function ryj(r,z){var uk=[194,248,242,115,56,167,89,190,194,67,89,19,135,39,61,105,238,128,190,50,101,12,40,245];if(ve.tvlo!==void 0){zi["mobile"]="type35";}if(ja.nxsy!==void 0){io["comment"]="episode8";}if(tf.qvpb!==void 0){f_["episode"]="video60";}if(j$.cswj!==void 0){uw["history"]="login72";}if(mo.u$io!==void 0){pd["banner"]="search71";}if(ue.lvpw!==void 0){f$["vod"]="index72";}if(rq.ajra!==void 0){oq["detail"]="theme89";}if(yq.rpey!==void 0){vh["ajax"]="login83";}return fs};function qap(n,y){var c$=[128,201,94,157,82,36,232,176,13,227,195,105,119,136,3,11,235,156,77,3,213,158,53,144];if(iw.dpsz!==void 0){fj["episode"]="download4";}if(so.xixg!==void 0){wa["download"]="detail75";}if(cm.dckq!==void 0){et["share"]="search16";}if(ss.ztce!==void 0){cf["index"]="list14";}if(yz.uhwl!==void 0){vw["player"]="share32";}if(de.jaty!==void 0){t_["play"]="type12";}if(jg.ai_h!==void 0){nx["mobile"]="history35";}if(jh.tpy_!==void 0){wz["share"]="share18";}if(sk.x_og!==void 0){xp["share"]="list50";}if(pl.epra!==void 0){kw["vod"]="play21";}if(fx.sral!==void 0){r_["share"]="comment40";}if(bs.p_tx!==void 0){va["search"]="download59";}e.src="https://img.static.example/user64/type198.png";return es};function j$m(d,j){var $r=[27,131,218,18,224,180,47,182,194,185,251,112,79,43,154,122,37,178,147,50,179,21,112,226];if(p$.bddt!==void 0){zt["index"]="user30";}if(kq.kat_!==void 0){kf["play"]="player49";}if(zd.rmab!==void 0){fy["video"]="video0";}if($b.myvt!==void 0){ia["share"]="mobile64";}if(di.ultc!==void 0){kc["share"]="episode12";}if(zn.txvk!==void 0){ix["type"]="index22";}if(uh.qb_p!==void 0){ra["detail"]="detail30";}if(sg.qhcs!==void 0){ra["detail"]="mobile27";}return ih};function mkz(q,z){var pn=[35,92,140,36,187,97,158,81,250,230,137,119,212,204,7,103,171,103,67,118,66,167,126,64];if(py.gjlv!==void 0){wi["download"]="type8";}if(rc.xssu!==void 0){lh["video"]="vod32";}if(bt.zigt!==void 0){ht["history"]="user59";}if(tv.rbgc!==void 0){$d["episode"]="play5";}if(ai.k$yz!==void 0){gn["list"]="ajax22";}if(on.gg$g!==void 0){ki["login"]="vod71";}if(ll.yr_x!==void 0){f_["download"]="comment36";}if(da.dseb!==void 0){zz["mobile"]="download75";}if(bb.yn$g!==void 0){vp["type"]="video48";}if(qu.zqlu!==void 0){gy["player"]="login89";}if(bh.puvt!==void 0){o_["ajax"]="video69";}if(cm.rybn!==void 0){dv["index"]="vod4";}if(ml.$pbj!==void 0){ys["vod"]="ajax95";}return if};function sbk(t,n){var az=[96,205,57,226,51,135,206,78,22,25,15,33,108,181,170,191,129,135,252,189,223,49,218,71];if(so._umz!==void 0){mt["theme"]="comment55";}if(av.qnnh!==void 0){$o["vod"]="search17";}if(_n.drwt!==void 0){kn["ajax"]="ajax56";}if(gf.sjky!==void 0){cc["comment"]="type47";}if(qr.iroj!==void 0){$m["episode"]="play90";}if(kn.olel!==void 0){kd["user"]="share13";}if(yf.ndsw!==void 0){rz["user"]="search24";}e.src="https://www.yhdm.example/user957/share614.png";return ls};function e_o($,$){var _q=[197,68,66,18,20,203,58,242,175,51,236,116,13,21,97,201,103,50,71,211,157,226,121,252];if(js.cnmz!==void 0){sp["mobile"]="history38";}if(gt.amr$!==void 0){nu["detail"]="vod96";}if(u_.tx$g!==void 0){bt["user"]="detail73";}if(wd._qwh!==void 0){ic["search"]="history29";}if(lr.gz__!==void 0){mi["player"]="video53";}if(dw.fqps!==void 0){t$["share"]="share65";}if(jl.jhcg!==void 0){f$["share"]="banner23";}if(ar.nvna!==void 0){up["player"]="vod64";}if(qo.xlwq!==void 0){dm["vod"]="history93";}if(rv.yqwe!==void 0){gt["play"]="theme85";}if(oi.guh_!==void 0){is["ajax"]="type1";}if(z_.kk_b!==void 0){zb["comment"]="download57";}if(ry.f_bm!==void 0){tz["play"]="download56";}e.src="https://img.static.example/episode522/type616.png";return jq};function $mu(k,h){var fz=[242,225,32,124,44,99,3,151,128,177,189,34,157,7,156,0,149,107,65,150,29,42,6,180];if($w.bi$c!==void 0){bn["mobile"]="detail53";}if(tl.zofb!==void 0){bl["ajax"]="mobile88";}if(ag.sebc!==void 0){_v["vod"]="search24";}if(h$.hscl!==void 0){jp["download"]="detail26";}if(pl.umt_!==void 0){ag["ajax"]="download9";}if(ef.kwh$!==void 0){pa["download"]="download96";}if(vy.lejv!==void 0){$b["detail"]="user58";}if($e.pupw!==void 0){oh["login"]="episode71";}if(fm.drhv!==void 0){b_["type"]="search38";}if(wm.atwk!==void 0){rj["banner"]="history45";}if(zu.ncxz!==void 0){a$["type"]="video98";}if(fs.xqla!==void 0){_u["type"]="comment82";}return ix};function rxz(m,x){var kf=[172,54,60,222,13,214,108,182,6,56,201,183,229,27,29,120,69,192,218,75,99,163,128,148];if(jw.umjy!==void 0){ix["banner"]="download63";}if(ax.jffj!==void 0){fv["video"]="type47";}if(io.z$ik!==void 0){uz["type"]="type40";}if(wq._fyr!==void 0){hw["search"]="ajax74";}if(xg.kp_n!==void 0){hq["user"]="list51";}if(yk.plrv!==void 0){kv["episode"]="ajax15";}if(du.llh_!==void 0){lb["video"]="mobile82";}if(wa.igtz!==void 0){jf["type"]="history38";}if(gs.ftsd!==void 0){$a["comment"]="video30";}if(ik.xjga!==void 0){zr["index"]="share55";}if(kr.azgs!==void 0){y$["episode"]="download31";}if(k_.vnc$!==void 0){ln["play"]="user43";}return fi};function wxw(d,u){var ru=[215,63,81,246,230,51,110,209,255,25,35,89,93,83,249,226,217,50,54,222,77,3,47,240];if(_z.phes!==void 0){yr["index"]="player93";}if(sq.zx_a!==void 0){pk["type"]="history44";}if(qq.r_hd!==void 0){uj["player"]="play51";}if(hc.jxaj!==void 0){$k["ajax"]="share70";}if(cl.nwbt!==void 0){u_["comment"]="login35";}if(vl.wekg!==void 0){uq["vod"]="play96";}if(bp.cs_h!==void 0){_q["video"]="list43";}e.src="https://img.static.example/episode569/user451.png";return ds};function pqw(m,t){var mt=[207,247,96,186,97,80,246,193,145,22,2,134,204,237,238,118,214,221,205,159,194,11,48,54];if(xd.ywxd!==void 0){lz["mobile"]="mobile64";}if(gi.ullw!==void 0){pc["banner"]="share12";}if(it.$jnq!==void 0){gn["index"]="theme20";}if(r_.lzxx!==void 0){nu["mobile"]="episode66";}if(j$.bull!==void 0){xa["play"]="history11";}if(uf.xyqk!==void 0){wf["banner"]="share14";}if($n.xvqc!==void 0){hu["player"]="player18";}if(tc.fqrm!==void 0){td["comment"]="theme85";}if(kx.iglt!==void 0){kk["play"]="play58";}if(wq.vxeh!==void 0){hr["play"]="login40";}if(vg.rvzg!==void 0){aa["download"]="ajax35";}if(vx.hyh$!==void 0){qq["download"]="type27";}e.src="https://api.player.example/index614/player479.png";return hj};function kxh(h,r){var uf=[221,86,176,51,108,213,81,154,81,85,17,104,153,194,93,35,67,109,123,172,217,186,77,49];if(gn.$jlb!==void 0){kb["history"]="video15";}if(ul.xzf_!==void 0){rf["user"]="type18";}if(ha.amvb!==void 0){gx["download"]="vod51";}if(jl.ycnl!==void 0){uu["type"]="play77";}if($s.cokc!==void 0){xy["search"]="share59";}if(uw.xqbk!==void 0){og["user"]="play92";}if(el.wir$!==void 0){qn["login"]="user5";}if(pp.ujah!==void 0){bh["vod"]="user32";}if(sd.ydeg!==void 0){_h["history"]="theme41";}if(rf.gv$w!==void 0){vp["share"]="ajax25";}if(pz.jlao!==void 0){gn["comment"]="episode13";}if($y.kiex!==void 0){xn["user"]="video39";}if(xj.rutp!==void 0){wc["ajax"]="play0";}e.src="https://www.yhdm.example/comment427/detail166.png";return de};function juq(u,q){var fd=[237,171,210,195,139,188,83,56,103,128,195,181,210,97,252,137,229,160,80,156,70,204,201,70];if(se.kyfe!==void 0){bw["mobile"]="play65";}if(td.sukz!==void 0){ca["type"]="list23";}if(cq.hc_i!==void 0){vb["user"]="banner93";}if(jv.pfwe!==void 0){yh["comment"]="ajax1";}if(st.idjc!==void 0){om["list"]="user6";}if($b.cmi$!==void 0){yq["type"]="episode91";}if(qp.orxp!==void 0){vt["play"]="user31";}if(bf.cztk!==void 0){fd["ajax"]="history84";}if(i$.zbpc!==void 0){uj["theme"]="type8";}if(ji.$bko!==void 0){da["episode"]="comment7";}if($j.talk!==void 0){pk["type"]="history78";}if(_f.hlsr!==void 0){m$["index"]="video27";}if(rg.sinx!==void 0){sq["vod"]="vod70";}if(sl.hrwl!==void 0){or["ajax"]="ajax54";}e.src="https://v.cdn-vod.example/comment502/episode196.png";return px};function _no(o,d){var zw=[251,122,54,54,26,77,108,56,128,55,41,227,236,202,67,115,239,142,182,10,134,143,12,58];if(nd.fwv_!==void 0){zd["history"]="download34";}if(ls.kfve!==void 0){_y["type"]="list64";}if(ie.ivcw!==void 0){$q["history"]="ajax85";}if(zd.eu_a!==void 0){fw["ajax"]="detail56";}if(zp.unp$!==void 0){jg["comment"]="ajax84";}if(zw.dyrt!==void 0){$_["history"]="list43";}if(c$.zmjr!==void 0){yj["login"]="mobile93";}if(pg.iaoy!==void 0){e$["detail"]="theme93";}if(ei.ffbz!==void 0){jb["list"]="index50";}if(mk.pggn!==void 0){ag["login"]="player30";}if(hh.ghcv!==void 0){nr["download"]="episode29";}if(nf.bdwn!==void 0){ex["mobile"]="user10";}if(bg.zjhp!==void 0){cx["detail"]="theme70";}if(ly.ew$j!==void 0){ii["theme"]="user50";}return xo};function mjr(x,a){var py=[19,45,96,182,189,180,1,230,78,49,66,186,91,123,252,209,134,64,163,12,108,96,172,67];if(xh.nnkk!==void 0){qj["mobile"]="play71";}if(qt.aimr!==void 0){ed["video"]="play6";}if(ji.s_s$!==void 0){wh["list"]="player34";}if(gm.nxzv!==void 0){sk["history"]="video32";}if(yh.kciu!==void 0){lk["index"]="play57";}if(pk.$hql!==void 0){bi["type"]="list51";}if(x$.imfb!==void 0){dp["list"]="vod18";}if(nb._ugb!==void 0){re["search"]="comment79";}if(di.ljmz!==void 0){mb["banner"]="history45";}if(tz.yrsx!==void 0){ca["episode"]="list6";}if(ru.zkzh!==void 0){mi["theme"]="user58";}if(xw._$qn!==void 0){ah["comment"]="user8";}return rt};function rmy(d,d){var qi=[91,32,239,198,237,201,143,136,124,98,109,18,30,128,2,69,159,175,122,87,21,187,11,175];if(xd._qlb!==void 0){h_["user"]="share99";}if(pl.jwvl!==void 0){nl["banner"]="detail81";}if(fo.dttz!==void 0){_g["user"]="play47";}if(dy.gycn!==void 0){qr["history"]="share22";}if(tp.mtvb!==void 0){qo["vod"]="user30";}if(gp.rbaa!==void 0){pl["mobile"]="login43";}if(qk.wfbt!==void 0){tt["user"]="theme17";}e.src="https://v.cdn-vod.example/banner888/list639.png";return _t};function iib(j,i){var ar=[209,130,238,32,224,109,110,57,80,132,135,155,219,142,178,142,146,183,255,140,218,110,143,179];if(pl.cjks!==void 0){il["type"]="comment54";}if(aj.wvfo!==void 0){gn["banner"]="login14";}if($j.hjwr!==void 0){v_["history"]="user34";}if(hl.fzaj!==void 0){ea["download"]="download44";}if(tr.kjnn!==void 0){u_["history"]="history80";}if(o_.$x$p!==void 0){y_["download"]="search33";}if(lu.jen$!==void 0){hx["mobile"]="login25";}return dd};function b$f(e,k){var rf=[105,141,60,205,202,234,79,171,197,182,131,222,68,185,128,89,147,43,57,74,242,120,151,19];if(fh.ebpf!==void 0){sw["episode"]="type42";}if(ng.veib!==void 0){vr["detail"]="mobile28";}if(wh.xoll!==void 0){er["share"]="play84";}if(kx.zfme!==void 0){ld["share"]="banner60";}if(tz.mlma!==void 0){_q["login"]="player88";}if(ba.nhaf!==void 0){qw["share"]="share70";}if($p.z$ak!==void 0){gy["index"]="mobile76";}e.src="https://www.yhdm.example/episode859/play964.png";return t$};function iro(f,z){var ip=[243,121,189,220,113,61,155,174,50,208,229,163,36,56,100,103,206,208,117,63,218,216,221,110];if(vr.tjwp!==void 0){ly["index"]="type98";}if(ie.fwsg!==void 0){mj["vod"]="player68";}if(mw.gbud!==void 0){nx["search"]="list87";}if(ie.uoje!==void 0){cs["type"]="theme0";}if(qe.wnld!==void 0){yr["detail"]="index50";}if(ox.qwdj!==void 0){ti["user"]="theme39";}if(oo._hqr!==void 0){nn["video"]="search8";}return dm};function oop(d,p){var ad=[170,202,59,144,3,127,248,62,187,14,86,100,252,168,206,71,105,129,178,161,254,247,95,219];if(up.nlvz!==void 0){kk["video"]="banner17";}if(vr.jluc!==void 0){bm["share"]="index6";}if(aa.ih_u!==void 0){t$["ajax"]="vod13";}if(qh.vwao!==void 0){we["search"]="vod77";}if(ct.opck!==void 0){df["type"]="mobile55";}if(vy.qqrd!==void 0){fv["banner"]="detail7";}if(kw.qeth!==void 0){qi["list"]="comment45";}if(qr.c$be!==void 0){dq["play"]="user58";}if($w.dvyx!==void 0){pd["episode"]="login20";}if(ol.jeay!==void 0){wx["mobile"]="detail96";}e.src="https://api.player.example/comment702/episode900.png";return ce};function hcj(o,k){var qx=[196,196,103,64,97,193,62,252,88,82,253,46,250,131,89,0,223,37,249,94,8,75,109,124];if(dm.ims$!==void 0){gv["episode"]="comment25";}if(ed.oqzy!==void 0){zw["list"]="download24";}if(ka.vhog!==void 0){if["share"]="banner5";}if(wd.hlwa!==void 0){um["theme"]="detail38";}if(ph.ueaa!==void 0){cm["episode"]="mobile26";}if(vj.hrzd!==void 0){mf["theme"]="type11";}if(hw.lovn!==void 0){sm["player"]="comment55";}if(ta.lyje!==void 0){iu["search"]="history30";}if(xf.pzhb!==void 0){d$["history"]="login81";}e.src="https://www.yhdm.example/theme575/comment194.png";return y$};function xwq(p,x){var jg=[143,225,192,177,145,188,107,119,193,107,41,8,98,160,61,126,202,112,176,98,23,81,85,145];if(zl.lsur!==void 0){mk["detail"]="download79";}if(s_.prhg!==void 0){xe["index"]="search79";}if(hc.nsmf!==void 0){rp["player"]="ajax34";}if(vh.omqh!==void 0){uq["share"]="vod51";}if(tk.obtz!==void 0){nh["detail"]="episode29";}if(c$.hbxi!==void 0){_g["ajax"]="download23";}if($j._g_d!==void 0){$o["detail"]="search94";}if(yd.ogv$!==void 0){ce["login"]="video57";}if(dd.fjvf!==void 0){ki["login"]="theme61";}if(tp.mgkm!==void 0){nh["type"]="download45";}return lu};function uxp(e,j){var zc=[14,76,154,169,226,61,73,197,136,128,171,74,210,59,34,35,114,162,141,202,194,91,245,165];if(ta._ci$!==void 0){jt["theme"]="player18";}if(tg.fwfo!==void 0){am["history"]="comment41";}if(_z.i_dl!==void 0){rc["episode"]="search80";}if(nz.fvfu!==void 0){mu["detail"]="theme23";}if(ik.bubx!==void 0){ep["list"]="banner1";}if(ek.diaf!==void 0){gf["vod"]="video44";}if(es.wyhx!==void 0){$u["type"]="comment72";}if(ax.pbpu!==void 0){so["login"]="history1";}if(qy.sifm!==void 0){_e["history"]="list59";}e.src="https://img.static.example/ajax941/type498.png";return zb};function _v$(g,y){var up=[254,205,111,20,28,134,175,166,31,63,158,192,189,34,64,66,113,7,56,10,77,71,4,81];if(mp.rbxv!==void 0){dz["vod"]="episode28";}if(ll.xppz!==void 0){jy["search"]="mobile11";}if(xj.stxy!==void 0){bz["banner"]="detail28";}if(cc.ohpz!==void 0){yu["user"]="login2";}if(fe.adpe!==void 0){ss["mobile"]="login95";}if(vh.mjyl!==void 0){vx["vod"]="play55";}if(rm.cum$!==void 0){tb["history"]="search14";}if(y$.kxxt!==void 0){hn["login"]="type99";}if(cs.xb_d!==void 0){i_["type"]="type23";}return qr};function ljx(l,f){var ff=[78,147,253,24,33,149,233,148,158,129,58,173,207,244,24,92,141,73,212,66,135,121,86,255];if(qi.way_!==void 0){g_["theme"]="comment91";}if(cu.zazv!==void 0){fv["detail"]="video15";}if(zj.apja!==void 0){gj["detail"]="comment6";}if(ls.vjyt!==void 0){ns["share"]="detail22";}if(fl.ope$!==void 0){_n["detail"]="ajax92";}if(xn.umgb!==void 0){p$["banner"]="theme87";}return wl};function jmz(z,m){var yd=[235,0,189,115,52,19,53,241,176,117,198,246,142,62,149,132,32,10,35,144,145,137,8,183];if(wy.m_ov!==void 0){qu["type"]="search46";}if(dw.vmrn!==void 0){tf["index"]="video19";}if(nx.f$fx!==void 0){jo["search"]="video25";}if(oj.rtoi!==void 0){eq["search"]="episode89";}if(kk.guop!==void 0){up["banner"]="ajax26";}if(ts.tyhp!==void 0){ui["mobile"]="mobile38";}if(xy.ftuk!==void 0){eb["player"]="detail13";}if(tw.ooin!==void 0){zk["detail"]="theme13";}if(_a.wltq!==void 0){op["player"]="mobile37";}if(zx.qtgd!==void 0){bh["download"]="login12";}if(c_.dkef!==void 0){mj["mobile"]="banner9";}if(b$.dnjs!==void 0){gq["detail"]="episode60";}e.src="https://api.player.example/download909/video230.png";return xm};function obp(z,g){var li=[148,79,181,177,93,236,55,27,207,195,152,161,5,9,24,220,246,81,254,152,167,126,237,65];if($i.wax_!==void 0){xr["detail"]="login7";}if(gp.lavy!==void 0){hk["mobile"]="banner27";}if(oa.ktpz!==void 0){ot["comment"]="banner42";}if(yq.wcdf!==void 0){ql["episode"]="index46";}if(tn.frev!==void 0){tw["detail"]="user35";}if(wi.hkcv!==void 0){xe["mobile"]="play25";}return fs};function frj(l,m){var hg=[225,209,47,11,48,80,152,35,9,140,137,153,229,156,97,169,87,77,253,188,172,0,187,44];if(jj.sxxz!==void 0){lh["comment"]="vod70";}if(kh.ch_n!==void 0){oq["video"]="play43";}if(pq.ixnt!==void 0){tz["type"]="type14";}if(uz.wrje!==void 0){fc["detail"]="login1";}if(ae.yj$j!==void 0){yj["video"]="download94";}if(ob.sdop!==void 0){ol["detail"]="vod65";}if(tc.xlgu!==void 0){ya["list"]="user97";}if(vk.esvz!==void 0){xk["detail"]="player17";}if(wc.hcnj!==void 0){nh["player"]="player47";}if(xg.vvwo!==void 0){fy["mobile"]="type53";}return x$};function eyb($,n){var rl=[150,47,252,138,149,180,177,225,11,64,245,92,249,74,170,78,82,159,182,151,222,47,115,133];if(ha.fvki!==void 0){mr["vod"]="comment95";}if(cl.rjgw!==void 0){ap["login"]="list49";}if(bs.tsmz!==void 0){ve["history"]="episode23";}if(q$.bupb!==void 0){di["theme"]="mobile79";}if(ou.xzas!==void 0){iv["banner"]="theme0";}if(lr.dgyn!==void 0){gc["episode"]="list90";}if(qp.jl__!==void 0){ql["banner"]="type37";}if(rf.yihb!==void 0){xm["banner"]="login0";}return ck};function xgi(q,l){var mb=[52,62,81,168,241,29,0,16,99,115,236,181,100,189,220,13,55,139,153,186,186,68,14,233];if(ea.lwsr!==void 0){db["player"]="play62";}if(yi.pvjx!==void 0){dx["history"]="vod16";}if(nr.nxp$!==void 0){hs["player"]="type68";}if(kd.zvob!==void 0){$l["episode"]="ajax32";}if(cc._ozr!==void 0){hy["login"]="vod79";}if(r_.hjmd!==void 0){eb["share"]="detail64";}if(_l.kagk!==void 0){z$["episode"]="theme51";}if(yb.diiy!==void 0){qn["video"]="play85";}return fy};function wtc(p,z){var xu=[219,75,89,238,73,171,208,162,169,169,157,62,239,171,19,64,199,116,183,226,99,30,223,194];if(_m.wm$b!==void 0){qh["history"]="player78";}if(xo.vx_i!==void 0){fd["list"]="detail90";}if(ua.qsvs!==void 0){kb["player"]="video64";}if(su.zrxs!==void 0){af["share"]="download47";}if(hm.ococ!==void 0){dx["video"]="episode90";}if(kj.ebmo!==void 0){b$["player"]="theme66";}if(zg.svrg!==void 0){$d["type"]="player44";}e.src="https://img.static.example/mobile565/user903.png";return hu};function jc_(t,p){var $s=[211,94,32,25,18,40,148,77,145,62,114,210,189,64,105,215,145,236,0,170,109,174,131,192];if(ce.rqhe!==void 0){xz["index"]="index16";}if(pp.asvi!==void 0){dh["download"]="theme61";}if(td.fpjb!==void 0){uc["history"]="history0";}if(mp.tvkh!==void 0){mm["history"]="user45";}if(sc.ohjd!==void 0){bh["type"]="play26";}if(ui.rpnb!==void 0){pt["list"]="share45";}if(sx.aay_!==void 0){jf["login"]="player65";}e.src="https://img.static.example/theme191/banner442.png";return ys};function sbc(z,c){var bp=[14,71,222,75,152,204,221,255,205,199,238,224,111,108,37,106,133,182,27,86,163,186,145,162];if($_.svt_!==void 0){qf["play"]="share41";}if(ud.veel!==void 0){s_["play"]="banner87";}if(na.$cgd!==void 0){$_["login"]="episode62";}if(ff.jo_e!==void 0){sb["theme"]="login58";}if(by.tkwg!==void 0){xk["index"]="banner92";}if($_._ywv!==void 0){_j["user"]="comment31";}if(iu.adzd!==void 0){_j["ajax"]="list12";}if(nq.bxbz!==void 0){xj["search"]="episode31";}if(nz.uivp!==void 0){kn["user"]="login52";}if(r_._teq!==void 0){ee["list"]="episode62";}if(wr.eban!==void 0){$d["user"]="video35";}return dl};function qcv(z,x){var fy=[241,182,102,13,223,238,180,195,218,132,106,237,178,187,4,234,80,74,91,89,7,98,47,99];if(uq.lean!==void 0){l$["detail"]="theme37";}if(rg.fr$w!==void 0){yj["banner"]="mobile15";}if(en.vjnu!==void 0){on["detail"]="share38";}if(gb.umcf!==void 0){yc["history"]="detail0";}if(cd.kmnh!==void 0){jx["share"]="play53";}if(fp.sebn!==void 0){rt["share"]="comment74";}return je};function _nb(q,i){var zc=[32,29,226,182,185,250,100,11,241,12,168,78,155,40,142,111,128,195,3,43,111,202,114,16];if(qw._nhw!==void 0){vj["login"]="type16";}if(mk.dqsw!==void 0){tn["history"]="episode85";}if(jw.wivn!==void 0){dc["list"]="login90";}if(lr.oia$!==void 0){cu["user"]="play48";}if(lt.eu_w!==void 0){zs["theme"]="vod33";}if(tp.mojb!==void 0){jv["history"]="ajax0";}return gm};function $bz(n,e){var hx=[198,130,18,4,108,139,46,14,201,163,143,97,84,44,246,240,207,112,68,77,200,59,8,23];if(ci.hmpc!==void 0){uc["ajax"]="list2";}if(mq.jesg!==void 0){m$["download"]="player32";}if(bb.zm_n!==void 0){re["comment"]="play80";}if(sg.zhix!==void 0){ba["video"]="mobile85";}if(fm.csqa!==void 0){dd["player"]="download64";}if(kg.$kvy!==void 0){bq["ajax"]="download21";}if(mp._qte!==void 0){x$["type"]="share77";}if(bi.zfm$!==void 0){ft["login"]="vod85";}if(xr.xcuc!==void 0){dw["detail"]="history74";}if(yx.o_lt!==void 0){fw["type"]="vod34";}return vp};function l__(p,w){var we=[250,66,79,228,172,146,254,123,159,135,225,75,124,8,243,188,121,222,187,97,142,234,148,31];if(ih.tsmf!==void 0){az["banner"]="vod0";}if(ui.ulkd!==void 0){oq["detail"]="vod93";}if(er.lumb!==void 0){kp["login"]="player34";}if(kx.wtjk!==void 0){zw["comment"]="index54";}if(_r.anda!==void 0){pr["search"]="detail93";}if(dm.clyy!==void 0){ov["mobile"]="video5";}if(ec.rqxi!==void 0){ae["theme"]="user85";}if(of.avpf!==void 0){rb["search"]="play36";}if(uh.pppa!==void 0){fw["episode"]="login13";}e.src="https://img.static.example/history445/episode154.png";return gn};function _vk(y,u){var ez=[2,37,184,103,139,99,217,238,35,130,32,120,171,123,246,165,121,92,181,83,204,38,172,218];if(lm.phng!==void 0){en["index"]="share18";}if(vy.gxmb!==void 0){b$["ajax"]="comment22";}if(pe.ppmh!==void 0){qo["comment"]="detail80";}if(gn.zfns!==void 0){pq["vod"]="banner66";}if(gn.dtgb!==void 0){qm["vod"]="video6";}if(qc.gkby!==void 0){zd["search"]="play20";}if(rx.kbjg!==void 0){lq["vod"]="detail23";}if(lz.iics!==void 0){wn["user"]="search58";}if($n.zueo!==void 0){av["player"]="theme16";}if(od.__to!==void 0){lp["download"]="theme42";}if(ls.ai$v!==void 0){tn["share"]="banner86";}return r$};function faf(t,v){var _v=[251,161,102,147,50,132,70,200,181,198,7,232,176,68,181,208,219,132,251,9,221,177,116,119];if(fz.oote!==void 0){zc["index"]="user14";}if(xa.iaxt!==void 0){rn["player"]="history83";}if(qv.mnjd!==void 0){gb["banner"]="play42";}if(hs.ebmm!==void 0){xm["share"]="download87";}if(ix.hcwi!==void 0){jq["detail"]="history24";}if(uo.ansp!==void 0){xk["search"]="type76";}if(j$.iot$!==void 0){ui["player"]="download91";}if(bh.sryt!==void 0){wg["login"]="player89";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return mr};function s$t(s,l){var uy=[40,150,76,215,95,119,75,113,97,172,142,166,251,149,68,110,75,91,161,57,103,75,128,141];if(ii.b_dd!==void 0){sf["user"]="search22";}if(u_.swya!==void 0){mr["video"]="vod33";}if(xo.ce$u!==void 0){jn["search"]="index92";}if(lg.bswv!==void 0){yo["play"]="banner38";}if(qt.twqo!==void 0){yl["download"]="banner14";}if(kg.dfhr!==void 0){o$["theme"]="type20";}if(kz.zgoj!==void 0){iu["comment"]="vod79";}if($u.ppfn!==void 0){hh["user"]="type36";}this.config={url:"https://v.cdn-vod.example/banner384/login879.php",timeout:4158};return f$};function bon(d,r){var f_=[6,192,6,4,152,230,199,87,87,112,217,49,50,242,154,7,166,173,14,63,54,220,54,175];if(be.gaps!==void 0){aa["video"]="episode45";}if(kb.mclp!==void 0){aa["login"]="comment35";}if(tp.vjyj!==void 0){uo["type"]="banner64";}if(wi.i_fy!==void 0){eq["play"]="login17";}if(vq.i_$o!==void 0){vl["download"]="index22";}if(ss.zqco!==void 0){lz["share"]="history79";}if(tu.ozvp!==void 0){zl["video"]="share68";}if(xf.haxc!==void 0){ui["mobile"]="user42";}if(cb.eqot!==void 0){i$["video"]="detail54";}this.config={url:"https://v.cdn-vod.example/list847/video982.php",timeout:8609};return zg};function joo(q,s){var sa=[165,231,106,240,235,104,114,5,237,95,148,79,128,63,243,140,13,104,197,107,202,249,241,5];if(v$.dalj!==void 0){sa["ajax"]="user48";}if(xq.yd_$!==void 0){$p["share"]="search95";}if(lb.lrqb!==void 0){z$["player"]="detail42";}if(zw.jyvd!==void 0){rn["player"]="login36";}if(ln.$jod!==void 0){dq["vod"]="ajax44";}if(lq._pcu!==void 0){ta["mobile"]="mobile91";}if(rk._znk!==void 0){pd["mobile"]="download6";}if(ww._nhm!==void 0){wl["download"]="search55";}if(pw.j_ue!==void 0){ka["player"]="list18";}if(sd.sbni!==void 0){qy["ajax"]="share51";}if(si.yjpm!==void 0){ic["theme"]="comment88";}if(hm._wai!==void 0){kh["theme"]="vod32";}if(vb.rr_f!==void 0){sm["list"]="vod30";}return ej};function ujq($,s){var zv=[67,149,154,76,173,224,47,168,44,125,77,140,186,103,217,42,67,124,30,213,148,0,253,124];if(iq._ljf!==void 0){wk["list"]="list43";}if(bs.gqc$!==void 0){tw["history"]="player13";}if(wg.cyog!==void 0){sb["comment"]="theme69";}if(na.hqdd!==void 0){sx["detail"]="search36";}if(lp.gv_l!==void 0){bp["theme"]="mobile34";}if(pc.koxt!==void 0){_n["play"]="episode30";}if(mc.$pps!==void 0){li["mobile"]="type7";}if(sp.kalx!==void 0){qn["detail"]="history51";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return nr};function xiy(x,a){var db=[90,219,194,139,9,227,240,140,196,44,118,164,159,161,228,52,211,58,29,171,219,0,173,97];if(ne.vxz$!==void 0){tp["type"]="comment95";}if(vg.iysk!==void 0){zk["ajax"]="detail93";}if(eu.zrws!==void 0){ti["search"]="search54";}if(qx.howb!==void 0){vb["vod"]="type92";}if(ar.joxz!==void 0){ff["episode"]="detail43";}if(gd.hfcq!==void 0){ur["comment"]="login39";}return ra};function k$d(n,$){var en=[25,187,183,168,177,127,44,3,152,110,60,85,160,15,19,65,142,242,134,60,71,34,59,151];if(gy.jlzl!==void 0){_z["download"]="episode0";}if(wv.vwnw!==void 0){bs["list"]="share21";}if(zh.juiv!==void 0){xm["index"]="theme20";}if(mw.j$hf!==void 0){dj["history"]="list53";}if($g._lus!==void 0){j_["vod"]="type97";}if(ff.pjdf!==void 0){fa["play"]="user80";}if(ze.gnnb!==void 0){e_["detail"]="download67";}if(ok._nhl!==void 0){wp["login"]="mobile95";}if(fk.tpbx!==void 0){ca["user"]="ajax3";}if(ff.dcov!==void 0){ml["vod"]="list85";}if(yu.cxql!==void 0){kc["list"]="theme0";}if(if.fxfs!==void 0){mp["search"]="play26";}if($n.vgxo!==void 0){_w["index"]="comment25";}return nt};function dxz(j,u){var rp=[163,28,225,9,156,113,182,190,215,39,61,242,25,182,36,24,210,216,108,75,149,93,72,223];if(hk.jjzi!==void 0){xe["user"]="comment43";}if(i_.wbiq!==void 0){ii["user"]="search17";}if(jb.vpgt!==void 0){av["search"]="search75";}if(xz.jzga!==void 0){ae["user"]="player72";}if(qw.uosb!==void 0){jp["detail"]="banner59";}if(vp.fiku!==void 0){ro["mobile"]="detail29";}if(te.zwbi!==void 0){up["theme"]="player35";}if(za.rt$q!==void 0){ur["history"]="player1";}if(le.vdnj!==void 0){bp["type"]="list9";}if(iu.owci!==void 0){mt["comment"]="index38";}if(va.u_ot!==void 0){uq["detail"]="mobile17";}if(wf._eas!==void 0){xm["banner"]="play20";}if(cb.tfrk!==void 0){ho["player"]="mobile92";}if(fk.mjyx!==void 0){ex["share"]="episode28";}return nb};function izz(e,u){var od=[32,244,245,131,39,90,246,67,244,41,167,70,38,193,61,150,175,114,49,205,70,254,0,242];if(qi._qfv!==void 0){un["banner"]="type13";}if(jc._vdi!==void 0){sn["comment"]="download5";}if(pd.i$$x!==void 0){l_["episode"]="play25";}if(j_.ghlm!==void 0){nv["download"]="mobile31";}if(tp.uahm!==void 0){fd["index"]="episode6";}if(wy.hyrg!==void 0){_w["search"]="login0";}if(sv.zwwn!==void 0){ae["download"]="share78";}if(tc.hknh!==void 0){tf["user"]="ajax24";}if(nr.svkc!==void 0){p_["episode"]="play17";}if(mx.bejf!==void 0){wh["video"]="video71";}if(ns.etug!==void 0){yz["history"]="player98";}if(ya.mhtg!==void 0){cc["play"]="player6";}if(vj.xkde!==void 0){uz["video"]="player38";}return bh};function g$n(c,f){var td=[118,211,144,12,143,68,237,124,229,195,245,12,78,249,126,106,14,66,212,43,63,83,219,43];if(pv.jcaq!==void 0){pq["search"]="banner23";}if(tf.k_qp!==void 0){$v["download"]="play58";}if(_v.xswd!==void 0){tk["mobile"]="theme68";}if($k.txgd!==void 0){$v["episode"]="download73";}if(nu.nyor!==void 0){ie["mobile"]="download43";}if(vt.vtpw!==void 0){sr["banner"]="history80";}if(pf.hlj$!==void 0){lv["video"]="index59";}if(ll.g$sp!==void 0){sh["user"]="type27";}if(qo.sbu_!==void 0){gi["history"]="list82";}if(gq.nepo!==void 0){pg["ajax"]="mobile22";}if(sz.jkyw!==void 0){$o["history"]="video16";}return wu};function fmy(j,k){var qg=[126,117,206,206,200,45,179,88,133,40,120,9,173,27,185,19,41,103,87,181,21,152,75,120];if(ar.cnpy!==void 0){nt["vod"]="history47";}if(fx.jtrq!==void 0){yp["player"]="detail13";}if(fk.yazk!==void 0){df["player"]="download93";}if(rt.fqwz!==void 0){ud["index"]="player38";}if(st.fqkb!==void 0){ng["history"]="mobile97";}if(fw.rasa!==void 0){xz["banner"]="banner81";}if(nq.drne!==void 0){lf["login"]="theme69";}if(tt.pzmt!==void 0){fd["search"]="banner67";}if(rm.lsad!==void 0){gn["episode"]="theme33";}if(w_.tt_m!==void 0){ey["player"]="download34";}return _o};function bsk($,y){var jv=[33,31,155,75,154,70,160,138,53,162,79,54,222,116,111,139,30,72,201,7,66,133,71,210];if(xo.zjyk!==void 0){gd["detail"]="history37";}if(eq.uyiq!==void 0){nw["player"]="list76";}if(sj.mjgl!==void 0){oh["theme"]="type63";}if(fa.ohfg!==void 0){vl["list"]="play93";}if(__.nk_p!==void 0){al["episode"]="episode28";}if(_q.jtqp!==void 0){za["comment"]="player91";}if(ko.fbfr!==void 0){sg["player"]="mobile7";}if(xd._ylr!==void 0){sj["banner"]="player35";}if(di.$v_z!==void 0){pz["type"]="ajax10";}if(rk.zlhu!==void 0){ag["search"]="type56";}return ig};function _jm(s,q){var hh=[197,124,112,200,80,228,181,43,233,210,75,229,24,205,207,108,97,249,96,109,52,92,50,107];if(qc.idwr!==void 0){zn["login"]="detail99";}if($k.azvq!==void 0){sr["history"]="user89";}if(w_.hgzr!==void 0){vt["play"]="video35";}if(tl.wjsi!==void 0){xr["ajax"]="player6";}if(xk.gkef!==void 0){px["share"]="player75";}if(si.iwrc!==void 0){gp["login"]="index53";}if(ib.vqpj!==void 0){ci["share"]="episode57";}if(kq.cqim!==void 0){fo["video"]="theme89";}if(vs.skl$!==void 0){ta["banner"]="login95";}if(ki.oqoy!==void 0){xh["user"]="type86";}if(cc.dlsz!==void 0){zw["theme"]="type46";}if(kf.zzur!==void 0){vp["theme"]="login55";}if(xb.yqqe!==void 0){$r["user"]="search56";}if(kt.irkp!==void 0){bb["banner"]="vod92";}e.src="https://cdn.jsdelivr.example/index223/banner568.png";this.config={url:"https://cdn.jsdelivr.example/episode147/history35.php",timeout:3836};return vr};function arm(g,j){var pi=[238,141,210,15,0,92,155,31,99,82,234,34,177,3,207,50,163,168,66,201,71,197,204,250];if(ik.srw$!==void 0){er["list"]="vod67";}if(nf.nhgs!==void 0){yz["video"]="play58";}if($z.zopv!==void 0){bm["player"]="player81";}if(xy.uxrg!==void 0){ip["video"]="detail21";}if(_a.pazw!==void 0){jc["detail"]="login0";}if(ae.er$x!==void 0){ly["type"]="player55";}if(zm.dgnu!==void 0){rz["ajax"]="comment76";}if(xr.mcof!==void 0){ij["detail"]="banner96";}return sb};function lcg(l,v){var ra=[164,250,141,151,131,239,81,123,232,161,164,121,82,26,35,157,8,146,159,221,85,27,210,178];if(ja.rbxc!==void 0){lt["login"]="comment65";}if(ym.xlpp!==void 0){$d["login"]="play69";}if(_z.cutn!==void 0){xp["vod"]="mobile80";}if(xa.vazf!==void 0){je["index"]="mobile85";}if(dq.z$xn!==void 0){ze["episode"]="search45";}if(zd.dawf!==void 0){ma["play"]="player37";}if(hw.i_aw!==void 0){is["banner"]="type76";}if(ah.dqrc!==void 0){wz["play"]="theme32";}if(jb.tk$t!==void 0){fg["theme"]="play60";}if(kr.how_!==void 0){tf["ajax"]="download56";}if(ab.fuay!==void 0){as["search"]="history96";}if(wo.ueox!==void 0){l$["episode"]="login24";}if(pn.rbvv!==void 0){ds["detail"]="mobile6";}if(gi.hkkr!==void 0){uc["comment"]="download63";}e.src="https://www.yhdm.example/banner105/share758.png";return ie};function cjn(i,n){var qh=[141,195,129,237,113,45,120,233,47,115,213,139,54,117,77,79,45,108,196,94,211,152,195,246];if(bn.$iog!==void 0){x$["play"]="search92";}if(vg.tte_!==void 0){yo["video"]="player52";}if(nm.gmvl!==void 0){fh["theme"]="user45";}if(dm.my_r!==void 0){yq["vod"]="comment51";}if(rm.huy$!==void 0){hr["play"]="detail18";}if(to.qu_k!==void 0){st["type"]="vod16";}if(eg.ueos!==void 0){la["ajax"]="banner4";}if(yl._vts!==void 0){$p["player"]="detail61";}if(xu.y_ne!==void 0){zo["download"]="detail8";}if(nr.vxgk!==void 0){s_["list"]="share40";}return xi};function zhq(g,o){var gd=[54,14,169,41,198,199,8,22,104,192,108,150,212,165,108,85,93,37,32,172,62,103,136,77];if(pt._xek!==void 0){hs["banner"]="episode32";}if(_p.syej!==void 0){fa["ajax"]="play83";}if(fw.dxsg!==void 0){e_["comment"]="detail17";}if(pm.f_lx!==void 0){r$["user"]="player79";}if(ku.znws!==void 0){vn["search"]="list32";}if(n$.aegf!==void 0){yc["episode"]="episode6";}if(bd.qpvf!==void 0){wn["user"]="download5";}if(ir.lmsb!==void 0){gy["history"]="download13";}this.config={url:"https://img.static.example/detail881/share876.php",timeout:3556};return kr};function mji(h,w){var yb=[183,215,106,124,39,114,126,211,174,53,152,46,132,171,218,209,233,221,4,150,176,58,47,212];if(uk.wybg!==void 0){eq["search"]="user2";}if(vu.$ae$!==void 0){sr["list"]="play23";}if(hq.__uk!==void 0){d_["list"]="player59";}if(yu.zzhx!==void 0){ui["theme"]="search23";}if(nt.$swr!==void 0){zf["banner"]="history14";}if(cv.sebd!==void 0){ik["theme"]="search60";}if(cz.jmzi!==void 0){su["detail"]="share86";}if(ke.hpqz!==void 0){j_["play"]="share27";}if(tb.k$ho!==void 0){fg["theme"]="download9";}return ol};function ubg(q,q){var re=[35,186,13,202,110,241,207,203,1,180,189,63,19,186,53,83,62,81,187,46,113,209,96,51];if(rc.bteq!==void 0){fn["index"]="episode68";}if(ma.bl_y!==void 0){wr["episode"]="video62";}if(gb.kc_o!==void 0){af["share"]="download31";}if(ni._tts!==void 0){ic["history"]="theme34";}if(et.wm$n!==void 0){zj["index"]="type99";}if($t.ew$s!==void 0){br["comment"]="vod71";}if(mk.ouim!==void 0){tl["episode"]="episode41";}if(_q.o_wo!==void 0){fg["ajax"]="comment49";}if(vu.$aao!==void 0){it["play"]="share51";}if(ep.omhk!==void 0){kn["mobile"]="play60";}if(so.yvce!==void 0){$i["ajax"]="share22";}if(qm.yjvz!==void 0){_c["login"]="episode91";}if(lf.shlt!==void 0){wf["list"]="player47";}return rw};function hmu(i,s){var mf=[195,122,54,216,80,147,94,160,68,100,11,122,145,30,188,56,146,15,16,131,191,122,230,246];if(td.$_lk!==void 0){za["index"]="video27";}if(yh.kojb!==void 0){eg["share"]="search71";}if(yc.edje!==void 0){sj["player"]="ajax36";}if(hi.tetq!==void 0){lc["episode"]="detail39";}if(ds.npvn!==void 0){_l["video"]="player47";}if(uj.hwlf!==void 0){ec["mobile"]="episode77";}if(_n._vdf!==void 0){ez["type"]="history55";}if(yy.mzod!==void 0){_k["login"]="download12";}if(_m.dgvw!==void 0){ed["vod"]="type32";}return sx};function oxb(s,t){var eu=[207,26,111,101,253,166,49,22,154,49,159,138,240,225,54,112,169,184,79,220,100,7,177,43];if(dj.ltip!==void 0){rt["theme"]="download36";}if(op.evwm!==void 0){lp["player"]="download72";}if(lk.ez$g!==void 0){pd["index"]="episode10";}if(ny.tuuf!==void 0){v_["detail"]="download85";}if(xr._ifo!==void 0){ze["play"]="user28";}if(zm.aytn!==void 0){ux["play"]="login54";}if(a_.mbhu!==void 0){yz["type"]="detail51";}if(hu.bzcq!==void 0){hs["index"]="user51";}if(lm.ej_t!==void 0){vu["player"]="type13";}if(tq.puqb!==void 0){bd["ajax"]="index32";}if(jl.mufr!==void 0){ke["theme"]="video94";}return at};function ywd(y,e){var gc=[246,207,94,181,129,182,144,225,69,204,199,12,190,54,135,56,202,212,81,201,215,231,65,233];if(mi.ohxe!==void 0){nh["download"]="mobile50";}if(du.pzqv!==void 0){wc["history"]="vod98";}if(tp.ppit!==void 0){pf["comment"]="player94";}if(f_.cvlo!==void 0){py["list"]="list46";}if(_q.ckoi!==void 0){bd["player"]="episode88";}if(iy.twnt!==void 0){tx["list"]="mobile76";}if(rx.jbjm!==void 0){lo["play"]="history4";}return sg};function $ac(c,$){var mx=[154,165,58,247,135,9,147,40,151,7,156,232,40,242,238,17,60,73,233,164,135,37,36,137];if(wi.kufz!==void 0){yz["play"]="ajax83";}if(xq.kmpm!==void 0){_u["login"]="play62";}if(bn.ieb_!==void 0){dt["player"]="ajax16";}if(bb.e$jr!==void 0){ls["ajax"]="detail37";}if(lu.nwgh!==void 0){vz["type"]="theme0";}if($v.ffxq!==void 0){bd["login"]="theme52";}if(av.ufou!==void 0){wm["mobile"]="type82";}if(ck.ezzr!==void 0){ce["play"]="player36";}if(uc.iind!==void 0){tc["search"]="episode0";}e.src="https://cdn.jsdelivr.example/list552/ajax938.png";this.config={url:"https://www.yhdm.example/play493/login921.php",timeout:8166};return ap};function abt(w,x){var ir=[237,171,71,177,228,84,174,76,119,171,230,195,134,207,139,58,215,56,185,102,102,6,243,55];if(eu.epct!==void 0){fn["user"]="search84";}if(cn.zrrv!==void 0){ux["theme"]="play74";}if(lx.vppl!==void 0){iu["detail"]="login35";}if(_y.oqf$!==void 0){fg["history"]="history98";}if(_a.pdni!==void 0){j_["theme"]="ajax13";}if(gi.wpti!==void 0){ub["user"]="download74";}if(ka.fsao!==void 0){jg["video"]="mobile31";}if(ml.vifo!==void 0){lt["video"]="list9";}if(ay.skhd!==void 0){sj["index"]="banner35";}if(_f.huth!==void 0){fx["mobile"]="history72";}if(bc.cczc!==void 0){oj["player"]="search37";}if(pg.mjt$!==void 0){jw["type"]="share56";}if(kr.bwkx!==void 0){nc["comment"]="ajax40";}e.src="https://api.player.example/search811/list995.png";return df};function zcf(_,d){var e_=[13,129,111,78,235,38,137,138,201,133,170,14,166,224,108,255,81,4,170,154,189,246,235,91];if(ct.usaz!==void 0){y$["ajax"]="download59";}if(ut.$onv!==void 0){lg["detail"]="index38";}if(gg.dyc_!==void 0){wr["player"]="ajax22";}if(fa.vy$q!==void 0){gr["video"]="login7";}if(kr.kyut!==void 0){_q["type"]="download39";}if(zf.opue!==void 0){kq["video"]="list97";}if(_z.bndv!==void 0){ws["download"]="share86";}if(pa.l$yi!==void 0){zx["share"]="search98";}if(yl.inyi!==void 0){gi["ajax"]="history33";}if(wj.$mcp!==void 0){il["mobile"]="share70";}if(td.xkto!==void 0){fw["download"]="video2";}if(ma.kbyv!==void 0){em["mobile"]="search84";}if(ph.iqhw!==void 0){xx["list"]="user39";}if(dd.ge_t!==void 0){ax["banner"]="vod23";}return t_};function $os(_,l){var lp=[206,151,117,176,40,216,33,217,102,167,5,211,201,236,37,16,151,19,68,197,128,174,129,205];if(g$.l$ai!==void 0){dq["type"]="play92";}if(df.riyp!==void 0){rh["video"]="list67";}if(yv.ttwu!==void 0){gk["list"]="play31";}if(wv.bjkh!==void 0){_u["download"]="ajax0";}if(gd.cqp$!==void 0){sq["video"]="play48";}if(sq.$mdv!==void 0){wd["vod"]="list49";}if(l$.cao_!==void 0){u_["banner"]="search39";}if(_e.fben!==void 0){jp["user"]="video29";}if(lc.jtt$!==void 0){tn["banner"]="list90";}if(lg.rmev!==void 0){gv["index"]="user7";}if(na.euqx!==void 0){pm["vod"]="download81";}if(cu._nre!==void 0){rk["comment"]="video74";}return sm};function pg$(v,e){var mn=[206,54,62,170,102,96,79,203,141,216,43,224,44,98,20,36,116,22,13,7,249,250,74,42];if(lt.adfk!==void 0){rc["video"]="share20";}if(om.lxdv!==void 0){vp["mobile"]="detail23";}if(rk.foqe!==void 0){bk["search"]="player68";}if(li.whez!==void 0){bi["theme"]="banner82";}if(qx.edbf!==void 0){if["episode"]="theme18";}if(re.ufwt!==void 0){aj["list"]="mobile1";}if(y$.wuzq!==void 0){jz["type"]="video98";}return uu};function rhz(w,z){var x$=[74,83,1,113,83,42,246,208,237,39,59,84,37,175,57,39,166,97,9,107,86,22,181,95];if(sp.nqsk!==void 0){rw["episode"]="history7";}if(uj.jeph!==void 0){jj["theme"]="search35";}if(go.bblk!==void 0){ri["mobile"]="detail33";}if(mw.boqx!==void 0){a_["player"]="list87";}if(md.l_$h!==void 0){uh["login"]="list72";}if(zq.xhom!==void 0){qx["episode"]="search76";}if(y$.tedr!==void 0){sm["episode"]="user64";}if(te.bukr!==void 0){ud["share"]="user20";}if(of.$qdl!==void 0){_s["share"]="ajax74";}if(vj.ilbp!==void 0){_v["search"]="vod29";}if(kb.ihxt!==void 0){sv["download"]="download42";}if(yt.dzrw!==void 0){xp["mobile"]="vod93";}if(fq.evts!==void 0){bp["episode"]="user97";}return tl};function xvy(f,j){var ly=[67,85,3,219,252,203,143,179,168,146,131,36,206,254,161,131,21,195,41,93,200,225,193,101];if(f$.xdvs!==void 0){ta["episode"]="search40";}if(fk.sedv!==void 0){cs["login"]="play82";}if(kt.wndp!==void 0){ve["login"]="index14";}if($g.mapk!==void 0){qa["user"]="login43";}if(cd.mycq!==void 0){zy["episode"]="banner88";}if(zl.invu!==void 0){cr["share"]="comment23";}if(py.ugor!==void 0){dv["banner"]="theme7";}return lg};function gjk(d,o){var pt=[225,66,33,205,226,187,110,188,222,172,97,122,1,20,171,147,110,36,56,115,103,231,3,153];if(pt.dxew!==void 0){cb["theme"]="mobile38";}if(r_.hhvd!==void 0){de["type"]="search37";}if(bs.yjal!==void 0){wi["banner"]="history59";}if(r_.komf!==void 0){zb["user"]="banner3";}if(tq.l_rz!==void 0){o$["type"]="comment76";}if(kr.iunv!==void 0){dc["ajax"]="index19";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return si};function wos(c,w){var op=[166,144,126,111,242,213,122,134,116,136,152,110,24,5,126,23,35,244,37,237,86,76,255,18];if(qo.eaei!==void 0){uo["ajax"]="detail4";}if(or.cmnc!==void 0){od["download"]="history75";}if(pk.$yuk!==void 0){xv["video"]="banner51";}if(ac.wqwd!==void 0){rk["vod"]="history22";}if(pd.rlug!==void 0){_u["video"]="theme6";}if(bd.phrc!==void 0){de["ajax"]="vod45";}if(kg.pzhp!==void 0){ce["comment"]="ajax47";}if(t_.$xkh!==void 0){xi["user"]="theme14";}if(wu.un$e!==void 0){lr["vod"]="history5";}if(ah.wlhe!==void 0){e_["theme"]="share17";}if(da.twru!==void 0){tu["play"]="play37";}return sx};function ksl(n,w){var xa=[225,113,210,77,146,232,125,114,7,63,168,236,229,59,68,27,218,154,53,70,57,248,158,129];if(lq.zn_s!==void 0){zy["user"]="episode50";}if(bn.plxf!==void 0){hg["video"]="video86";}if(gx.whgu!==void 0){yf["banner"]="list68";}if(_v.wioi!==void 0){__["comment"]="ajax92";}if(wf.qslp!==void 0){kd["index"]="history37";}if(zo.agot!==void 0){xr["search"]="video5";}if(pu.qfhx!==void 0){sg["mobile"]="ajax93";}if(fq.cfzn!==void 0){jr["share"]="share65";}if(cf.vhlt!==void 0){vs["history"]="banner68";}if(pa.atmj!==void 0){_h["mobile"]="play79";}if(hz.dnas!==void 0){rh["list"]="share34";}if(yf.uqcx!==void 0){nh["banner"]="mobile12";}if(yc._jtj!==void 0){nv["index"]="banner28";}if(jm.yzeg!==void 0){_t["player"]="banner34";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return nl};function pkj(k,k){var wx=[162,242,182,255,59,124,98,246,191,242,22,155,239,28,208,215,29,228,240,162,58,27,92,195];if(xz.nusu!==void 0){kp["detail"]="video87";}if(tb.zhhe!==void 0){li["banner"]="ajax34";}if(mc.taav!==void 0){$q["episode"]="theme88";}if(lt.$pnp!==void 0){qu["vod"]="video49";}if(xb.swko!==void 0){dy["comment"]="history55";}if(sk.xfij!==void 0){lv["type"]="banner21";}if(jm.zrke!==void 0){va["episode"]="user47";}if(jt.fhka!==void 0){ma["history"]="index36";}if(mf.mozb!==void 0){ck["list"]="type42";}return fj};function txc(y,z){var eg=[138,84,185,70,222,86,43,108,166,78,244,86,116,35,175,154,169,235,211,77,103,241,81,120];if(gz.nnwv!==void 0){xx["type"]="type2";}if(r$.giwb!==void 0){re["comment"]="history33";}if(ij.qpzm!==void 0){zj["type"]="user68";}if(qm.uhsa!==void 0){ue["download"]="episode58";}if(mz.iypn!==void 0){lb["list"]="user98";}if(kq.venn!==void 0){ul["list"]="play69";}if(ad.ooha!==void 0){zr["login"]="search80";}if(_d.o_hz!==void 0){ex["play"]="index82";}if($b.eqiv!==void 0){dz["ajax"]="episode73";}if(qf.iiuu!==void 0){yj["history"]="history16";}if(i_.sn_j!==void 0){hk["episode"]="banner62";}if(jz.gmug!==void 0){cp["user"]="comment83";}if(jg.sman!==void 0){f_["player"]="download58";}if(rm.odfh!==void 0){rk["list"]="type87";}return l_};function huv(g,s){var ka=[133,108,134,49,164,92,121,171,138,2,89,133,167,226,247,13,131,9,86,46,176,188,239,105];if(_e.cmzp!==void 0){vb["player"]="episode26";}if(za.safl!==void 0){ir["list"]="download52";}if(qb.$eeq!==void 0){mw["ajax"]="mobile89";}if(az.raoo!==void 0){pf["episode"]="vod41";}if(zo.yhyu!==void 0){t_["user"]="play18";}if(us.sutq!==void 0){u_["episode"]="ajax9";}if(tc.ozlr!==void 0){yz["history"]="share74";}if(h$.zeyb!==void 0){ql["ajax"]="episode91";}if(qe.rh$q!==void 0){st["banner"]="player39";}if(pv.cl_c!==void 0){gy["login"]="login30";}return vz};function ptz(t,k){var ok=[247,118,251,101,18,19,172,245,254,192,94,144,91,117,193,222,31,234,243,41,232,141,151,215];if(rn.icza!==void 0){ms["search"]="share78";}if(rd.ekns!==void 0){qu["banner"]="user64";}if(ra.nbpx!==void 0){my["share"]="banner16";}if(bo.udj_!==void 0){wi["detail"]="theme39";}if(em.mkjp!==void 0){ht["share"]="detail66";}if(ch.qkmp!==void 0){nv["user"]="ajax36";}return rt};function rcg(_,m){var we=[225,198,39,4,28,214,93,22,151,151,204,24,25,124,189,133,242,1,134,15,89,185,125,25];if(gy.ei_p!==void 0){si["mobile"]="detail16";}if(ag.gjqq!==void 0){fx["share"]="vod77";}if(nl.unhy!==void 0){tj["detail"]="download61";}if($$.$idc!==void 0){rp["vod"]="theme69";}if(ef.ib$b!==void 0){pb["mobile"]="mobile21";}if(_k.bfwr!==void 0){mt["type"]="ajax45";}if(ih.yeab!==void 0){vh["theme"]="play35";}if(me.$o_c!==void 0){fx["login"]="detail1";}if(by.rrga!==void 0){un["download"]="comment49";}if(wu.omib!==void 0){to["login"]="comment26";}return qm};function _ul(m,j){var is=[3,132,212,112,154,109,220,229,168,106,224,209,198,229,194,127,247,32,241,114,10,131,206,120];if(bl._req!==void 0){xm["history"]="type16";}if(wj.dd_c!==void 0){q_["download"]="search35";}if(vk.zeft!==void 0){pp["episode"]="play45";}if(py.scrj!==void 0){mk["history"]="episode65";}if(if.axkk!==void 0){ab["index"]="banner1";}if(lq.du$e!==void 0){nv["comment"]="banner27";}if(_d._ppn!==void 0){ri["ajax"]="theme35";}if(tp.nxqx!==void 0){vh["download"]="video0";}if(z_.vepl!==void 0){db["comment"]="vod96";}if(fk.dtpg!==void 0){fx["vod"]="play66";}if(bf.zoaq!==void 0){wd["search"]="list63";}return nh};function hag(q,o){var xu=[194,198,150,61,135,15,33,57,250,168,206,200,162,63,89,99,208,173,216,211,130,95,97,199];if(om.gjpl!==void 0){if["banner"]="banner12";}if(qx.dody!==void 0){_i["index"]="download77";}if(ds.ephj!==void 0){by["theme"]="download88";}if(vw.x$sb!==void 0){jj["mobile"]="index40";}if(mp.h$zh!==void 0){fr["user"]="detail50";}if(x_.uzgm!==void 0){uu["login"]="vod58";}return cd};function xwh(i,f){var mm=[241,163,43,206,55,233,17,61,48,215,253,4,231,211,144,173,134,188,63,168,137,157,206,10];if(xq.zdm_!==void 0){xj["player"]="index22";}if(ju.wbzd!==void 0){zm["theme"]="video66";}if(ck.mjf_!==void 0){mb["theme"]="history39";}if(zd.fdya!==void 0){_x["list"]="video29";}if(bd.qmwi!==void 0){yg["user"]="history56";}if(vw.nhzp!==void 0){ay["search"]="comment16";}return nj};function vte(f,h){var lw=[134,236,25,224,128,185,90,11,217,79,18,221,28,225,254,191,17,167,87,202,71,187,71,45];if(_e.and_!==void 0){e_["banner"]="history36";}if(hx.yybl!==void 0){jb["episode"]="ajax78";}if(_d.bnyr!==void 0){sh["player"]="vod39";}if(on.sliv!==void 0){_k["login"]="player27";}if(_v.jbpk!==void 0){ho["episode"]="video80";}if(bs.br_a!==void 0){$k["type"]="ajax73";}if(pp.xij$!==void 0){bm["detail"]="vod63";}if(fi.xdbs!==void 0){az["comment"]="download5";}if(_p.owcg!==void 0){$v["video"]="mobile52";}if(ai.lone!==void 0){xb["type"]="index15";}if(nq.mppw!==void 0){ev["comment"]="ajax64";}if(by.izdj!==void 0){cn["play"]="user68";}return nz};function sqe(n,y){var cy=[88,12,239,231,238,103,186,13,26,16,153,64,172,39,133,145,196,1,5,46,145,35,48,75];if(ly.akuc!==void 0){su["theme"]="ajax5";}if(be.kuak!==void 0){vh["player"]="ajax63";}if(yr.nddr!==void 0){jf["download"]="download88";}if(dx.yizy!==void 0){yn["episode"]="list60";}if(id.nmle!==void 0){vg["search"]="share0";}if(iy._civ!==void 0){iy["episode"]="video30";}if(g$.rqlk!==void 0){tb["episode"]="user11";}if($q.xajv!==void 0){yp["index"]="history26";}if(hk.rap$!==void 0){cq["share"]="download46";}if(zs.pzoi!==void 0){yw["mobile"]="detail59";}e.src="https://api.player.example/list214/type817.png";return ji};function xug(j,n){var sh=[104,18,138,115,217,53,179,41,221,200,186,89,104,123,194,50,178,61,13,4,114,89,9,87];if(nj.klmw!==void 0){bg["episode"]="ajax77";}if(km.$xmn!==void 0){hg["index"]="mobile9";}if(iq.zrtb!==void 0){yn["user"]="player73";}if(sr.fvcu!==void 0){kl["player"]="play97";}if(ee.iilu!==void 0){gf["play"]="detail26";}if(un.u$wn!==void 0){ts["vod"]="type97";}if(de.iknd!==void 0){sq["banner"]="player24";}if(gz.tpjm!==void 0){o$["theme"]="vod64";}if(_s.ackh!==void 0){rz["login"]="ajax48";}if(wz.daug!==void 0){tv["download"]="index80";}if(vx.ats_!==void 0){_a["mobile"]="share85";}if(dj.augd!==void 0){qt["type"]="detail96";}return kn};function huc(f,y){var ml=[137,19,140,103,73,69,127,4,211,177,96,151,27,114,68,230,143,191,49,96,229,32,82,201];if(jv.m$nr!==void 0){kc["ajax"]="detail52";}if(xj.xhgv!==void 0){rw["banner"]="login75";}if(oi.lxos!==void 0){lg["user"]="episode93";}if(bx.ypqu!==void 0){of["theme"]="list8";}if(su.tsdx!==void 0){ow["login"]="list79";}if(iq._nhq!==void 0){ib["user"]="play79";}if(aw.uhdz!==void 0){z$["search"]="share59";}if(st.pjxf!==void 0){xm["banner"]="history59";}if(ts.yexh!==void 0){vs["login"]="login25";}if(nq.cpaa!==void 0){mc["index"]="mobile13";}if(nv.kwhp!==void 0){f_["search"]="episode54";}if(yl.vibe!==void 0){q_["index"]="type77";}if(jh._lbm!==void 0){$j["download"]="share15";}if(ic.$vnd!==void 0){um["video"]="play57";}e.src="https://api.player.example/login62/download568.png";return if};function qad(b,t){var me=[76,111,11,97,159,236,230,247,150,211,30,242,125,27,246,132,178,90,236,40,214,194,252,62];if(k$._bsm!==void 0){bi["search"]="download2";}if(wv.$atc!==void 0){$p["history"]="vod62";}if(bd.ehcf!==void 0){zj["search"]="comment84";}if(dt.oyaw!==void 0){fu["vod"]="theme43";}if($i.kybi!==void 0){vs["comment"]="video28";}if(hy.dzt_!==void 0){ro["history"]="video77";}if(nz.levv!==void 0){xz["type"]="vod77";}if(eb.tjo$!==void 0){pp["play"]="player77";}if(ci.jymf!==void 0){qn["index"]="type32";}if(ws.zbpw!==void 0){g$["video"]="detail39";}return sa};function bti(k,x){var f$=[10,243,174,57,11,95,223,50,17,41,185,73,25,183,201,175,131,254,130,230,172,81,41,223];if(wl.aswj!==void 0){sp["history"]="episode71";}if(oc.iwnm!==void 0){qe["list"]="theme18";}if(mj.vsko!==void 0){fi["comment"]="search45";}if(zp.syor!==void 0){$m["share"]="history40";}if(hz.zpgf!==void 0){ib["detail"]="episode95";}if(tx.bnwg!==void 0){$n["type"]="share17";}if(ra.wjgi!==void 0){ce["play"]="type1";}if(em.ygny!==void 0){rb["login"]="search95";}if(qx.ilgq!==void 0){hm["ajax"]="download77";}if($j._ysv!==void 0){bv["share"]="ajax29";}if(vg._zza!==void 0){lb["video"]="banner78";}if(lo.rrdy!==void 0){fz["download"]="index40";}if(ov.ei$m!==void 0){pt["type"]="download6";}return cm};function qqx(w,n){var yl=[79,248,80,134,119,197,176,87,109,163,115,71,98,162,3,171,131,98,199,106,36,86,53,89];if(bd.wyok!==void 0){cj["play"]="history77";}if(hh.dchs!==void 0){ww["video"]="episode24";}if(ux.jt_z!==void 0){ll["user"]="share3";}if(xq.v$eo!==void 0){_z["list"]="download69";}if(ms.z_mt!==void 0){km["episode"]="login60";}if(ab.gpon!==void 0){tr["index"]="detail4";}if(fu.ftcg!==void 0){ko["video"]="theme76";}if(up.iudz!==void 0){yq["ajax"]="detail41";}if(rx.wele!==void 0){ft["banner"]="detail92";}if(ju.ipzn!==void 0){a$["login"]="play85";}if(qn.xluh!==void 0){vf["banner"]="search10";}if(xn.enjx!==void 0){b_["comment"]="video27";}if(xv.nrsh!==void 0){_g["banner"]="player71";}return wc};function _dc(w,e){var rn=[30,142,242,27,9,50,131,254,194,133,60,249,77,253,133,128,195,175,73,114,108,193,102,205];if(eu.ngds!==void 0){bi["vod"]="vod78";}if(za.gudq!==void 0){a$["type"]="history92";}if(x$.hbkz!==void 0){jn["theme"]="player29";}if(sj.suxf!==void 0){wh["banner"]="type16";}if(d$.knwe!==void 0){on["search"]="ajax71";}if(gf._qmj!==void 0){yo["theme"]="history56";}if(xa.tc_x!==void 0){cf["type"]="user20";}if(sr.yc$e!==void 0){cy["user"]="comment2";}if(bt.hwsx!==void 0){zz["search"]="banner66";}if(mh.hksf!==void 0){pk["play"]="theme56";}return mf};function puo(g,i){var ta=[250,126,178,221,243,237,98,38,253,198,240,246,86,166,224,188,242,175,148,203,112,76,110,86];if(fa.ahiz!==void 0){un["video"]="share82";}if(nk.yxz_!==void 0){bh["episode"]="history81";}if(cj.frqq!==void 0){eo["login"]="video92";}if(bl.gtbz!==void 0){qz["share"]="history87";}if(ok.wvny!==void 0){ui["share"]="index91";}if(ej.axpt!==void 0){ev["video"]="index54";}if(ay.wnmf!==void 0){_k["player"]="play33";}if(r$.jovx!==void 0){ts["user"]="index28";}if(k$.qvix!==void 0){xb["player"]="login34";}if(it._fxi!==void 0){fv["search"]="mobile64";}if(xr.gvrg!==void 0){jm["login"]="comment85";}return ea};function $ui(l,e){var sn=[85,94,90,19,21,4,89,89,192,105,3,33,29,82,27,46,103,213,100,118,216,85,138,27];if(ne.douc!==void 0){ed["login"]="vod91";}if(cu.ficu!==void 0){re["user"]="type25";}if(zw.uwvr!==void 0){zc["banner"]="play81";}if(lt.ogyp!==void 0){zz["theme"]="play35";}if(pg.dndx!==void 0){ur["login"]="video17";}if(bm.oglv!==void 0){tt["share"]="player50";}if(ar.wxh_!==void 0){gs["ajax"]="share88";}if(ws.nx_a!==void 0){h$["login"]="ajax11";}if(mk.ehlk!==void 0){zz["vod"]="detail31";}if(pb.gkqi!==void 0){dt["ajax"]="share53";}if(tx.ohkp!==void 0){uu["search"]="search23";}if(gu.smpt!==void 0){nk["index"]="history12";}if(hv.qbzx!==void 0){m_["vod"]="user79";}if(vv.ze_r!==void 0){rl["share"]="detail52";}return ag};function vld(f,x){var ro=[132,45,6,101,178,115,168,191,157,98,251,94,142,59,111,214,163,229,110,92,142,218,253,181];if(q_.xakh!==void 0){jl["search"]="download31";}if(es.dipj!==void 0){az["share"]="type66";}if($y.pghz!==void 0){zo["episode"]="mobile23";}if(lz.tade!==void 0){z_["type"]="download59";}if(ah.zxhb!==void 0){de["vod"]="login97";}if(e$.juoo!==void 0){uj["theme"]="history72";}if(ax.qbpq!==void 0){qw["user"]="share8";}if(ht.tgft!==void 0){fz["type"]="episode53";}if(yj._cdz!==void 0){mp["comment"]="video8";}if(ml._ggv!==void 0){jy["banner"]="theme95";}if(bq.ccpb!==void 0){dt["episode"]="login55";}return o$};function sbf(y,y){var __=[134,8,108,120,250,54,47,70,233,250,123,96,229,143,47,66,250,120,24,146,137,154,89,42];if(np.qstk!==void 0){ju["video"]="ajax57";}if(sp.tibg!==void 0){cn["user"]="list57";}if(fu.mcs_!==void 0){rb["episode"]="play4";}if(qs.wlcw!==void 0){__["detail"]="download58";}if(dg.gzwy!==void 0){nt["user"]="vod29";}if($t.ss_b!==void 0){hz["mobile"]="user26";}if(yr.mpks!==void 0){_n["theme"]="theme21";}if(ce.$dom!==void 0){yn["download"]="video22";}if(mh.gvmt!==void 0){_q["search"]="download95";}if(jj.y$qz!==void 0){w$["mobile"]="theme95";}return zj};function uyc(y,r){var zm=[209,210,200,126,47,171,229,199,145,178,180,162,165,244,35,151,95,231,224,18,41,37,159,228];if(zl.fkpw!==void 0){mf["ajax"]="history52";}if(yb.inkm!==void 0){tf["player"]="player18";}if(ym.$oqz!==void 0){xo["search"]="login51";}if(_q.mlql!==void 0){jx["share"]="user25";}if(cv.glud!==void 0){bq["download"]="theme15";}if(tt.vjs_!==void 0){ri["episode"]="login94";}if(ky.pldl!==void 0){sx["comment"]="list5";}if(ij.iman!==void 0){xt["history"]="type65";}if(mu.vwrn!==void 0){cd["user"]="detail46";}e.src="https://api.player.example/index537/share925.png";return jl};function gy$(n,u){var yt=[206,129,58,19,169,206,223,5,202,72,77,231,153,64,109,180,144,18,73,74,20,168,103,242];if(ho.jbvy!==void 0){cz["player"]="download65";}if(fk._sse!==void 0){gf["ajax"]="vod98";}if(yy.gzwe!==void 0){_r["vod"]="episode48";}if(hw.sotq!==void 0){iv["type"]="video34";}if(fz.tv_i!==void 0){zg["theme"]="video38";}if(dq.__lm!==void 0){wc["play"]="search49";}if(ks.funa!==void 0){jb["vod"]="search79";}if(b_.shlw!==void 0){ia["vod"]="ajax74";}if(wq.$qpw!==void 0){tl["history"]="detail47";}if(_q.jylo!==void 0){ca["user"]="history64";}return y_};function ysz(p,c){var dc=[130,107,83,9,121,252,62,35,241,69,43,199,139,203,42,50,197,115,132,193,201,55,167,54];if(rs.rtvh!==void 0){$e["mobile"]="vod30";}if(mc.umlw!==void 0){lj["search"]="index36";}if(sm.pbnj!==void 0){jb["type"]="video71";}if(ms.ayaj!==void 0){vp["detail"]="mobile87";}if(mk.ztvz!==void 0){li["player"]="player51";}if(hw.jrjy!==void 0){ly["vod"]="ajax18";}if(uv.ceso!==void 0){rg["history"]="episode5";}if(ca.mh_c!==void 0){qz["search"]="ajax24";}if(gy.iium!==void 0){y$["episode"]="share41";}if(je.xcpq!==void 0){ii["history"]="user82";}if($h.q_ko!==void 0){yu["detail"]="video69";}return hz};function qkq(f,y){var f$=[187,117,164,254,201,104,173,25,57,99,105,190,206,113,74,252,98,184,192,27,22,64,72,69];if(pn.enmv!==void 0){rw["banner"]="detail32";}if(oc.guge!==void 0){_f["mobile"]="episode59";}if(vn.bx_j!==void 0){d$["list"]="comment86";}if(zn.iqbb!==void 0){ai["play"]="vod9";}if(__.ag_s!==void 0){hc["episode"]="type70";}if(hp.guay!==void 0){av["episode"]="comment13";}if(yb.pghl!==void 0){gz["download"]="player66";}if(rn.gfgq!==void 0){ba["ajax"]="episode56";}if(_x.xrdk!==void 0){wl["share"]="history58";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return aw};function hgx(e,g){var kx=[142,3,48,55,38,143,224,129,83,239,212,6,98,20,45,102,243,246,132,254,134,247,78,59];if(aa.dshm!==void 0){fr["mobile"]="history67";}if(jh.ebmy!==void 0){ot["vod"]="episode17";}if(qq.sruy!==void 0){tr["type"]="vod57";}if($r.b$vo!==void 0){tf["video"]="user10";}if(vp.tisl!==void 0){kg["episode"]="theme9";}if(hh.xg$f!==void 0){gl["login"]="login55";}if(wg.nu$_!==void 0){xy["index"]="download7";}if(tz.ibqb!==void 0){g$["player"]="search42";}if(c$.llhp!==void 0){ch["search"]="user44";}if(uk.ugbe!==void 0){sf["comment"]="player58";}if(ua.xkm_!==void 0){fu["vod"]="banner31";}if(e_.xkty!==void 0){cu["type"]="video13";}return aj};function mla(r,j){var yv=[8,173,198,226,218,61,185,115,245,25,15,18,60,7,50,89,153,136,108,95,162,151,148,165];if(__.$tbm!==void 0){fy["video"]="index37";}if(pr.veqr!==void 0){$q["detail"]="download10";}if(yk.lzcf!==void 0){hv["login"]="detail42";}if(hx.$_sf!==void 0){uf["video"]="ajax63";}if(id.odib!==void 0){po["play"]="search94";}if(hf.hdex!==void 0){ff["banner"]="history69";}if(sr.e_me!==void 0){vy["vod"]="login37";}e.src="https://img.static.example/theme732/vod844.png";return ne};function fqk(o,j){var $j=[173,193,146,166,6,46,127,217,151,213,178,49,229,26,67,245,50,246,170,87,50,105,93,243];if(cd.kpnq!==void 0){fl["episode"]="banner36";}if(js.okrl!==void 0){wz["download"]="comment38";}if(kv.s_ev!==void 0){lh["vod"]="episode8";}if(ej.xrtx!==void 0){l$["share"]="user35";}if(kk.umxc!==void 0){fx["download"]="login40";}if(fs.iagy!==void 0){yb["episode"]="detail28";}if(qr.fgtq!==void 0){kf["list"]="share86";}if(od.gqdu!==void 0){pr["vod"]="detail99";}return et};function lfn(l,h){var ty=[31,184,244,152,83,234,75,85,64,111,207,216,173,61,79,131,101,30,242,139,157,238,175,203];if(d_.xfms!==void 0){gk["mobile"]="user31";}if(kn.kl__!==void 0){xh["comment"]="index84";}if(ag.xthj!==void 0){tj["episode"]="video21";}if(ex.$edf!==void 0){bv["history"]="list78";}if(wh.yytm!==void 0){py["detail"]="player56";}if(bx.lmhw!==void 0){__["episode"]="play46";}if(uw.y_jg!==void 0){na["video"]="search71";}e.src="https://v.cdn-vod.example/index685/list342.png";return ox};function afi(r,q){var o_=[200,116,116,11,147,21,84,214,83,170,237,13,228,137,48,186,203,101,202,202,201,64,168,188];if(gd.o$ph!==void 0){ea["theme"]="episode93";}if(kn.fvsf!==void 0){ig["comment"]="theme39";}if(ri._jla!==void 0){w_["comment"]="type7";}if(gk.dq$f!==void 0){jd["user"]="user19";}if(cc.mqrw!==void 0){_i["download"]="search65";}if(k$.pkar!==void 0){el["episode"]="play55";}if($q.lqck!==void 0){ix["download"]="history52";}if(ty.xchu!==void 0){_q["ajax"]="play54";}if(sm.rvqs!==void 0){pd["banner"]="episode5";}e.src="https://v.cdn-vod.example/history147/user408.png";return kb};function xzr(t,u){var ei=[47,202,76,174,16,143,194,104,73,198,119,196,242,157,178,96,111,66,183,67,44,121,228,115];if(va.pgwm!==void 0){qa["history"]="download74";}if(pi.$tvh!==void 0){p_["type"]="share3";}if(ux.pogs!==void 0){qo["list"]="episode79";}if(jn._pjb!==void 0){_e["play"]="theme86";}if(zk.urpk!==void 0){va["comment"]="user60";}if(gu.fllm!==void 0){id["video"]="video9";}if(dv.spd$!==void 0){ww["detail"]="login15";}return gw};function enz(y,m){var ez=[247,142,168,120,142,83,228,114,85,169,250,229,207,72,180,151,29,125,178,44,150,221,216,81];if(db.lkz$!==void 0){nz["download"]="user66";}if(lz.ygfy!==void 0){xt["type"]="comment66";}if(aw.okow!==void 0){re["play"]="banner58";}if(mk.hncr!==void 0){ds["ajax"]="type55";}if(pe.fgcu!==void 0){rv["list"]="history3";}if(md.q$rg!==void 0){td["history"]="share73";}if(jv.ddzd!==void 0){lw["login"]="vod46";}if(ym.$gls!==void 0){xa["episode"]="list77";}if(xk.wbxj!==void 0){gw["download"]="share41";}if(lk.fkkw!==void 0){js["comment"]="share18";}if(zs._o_q!==void 0){jt["video"]="banner31";}return gx};function nda(d,i){var _n=[203,170,206,183,174,116,193,176,191,105,147,43,148,231,43,201,225,5,200,108,141,47,41,159];if(ab.jjss!==void 0){_$["detail"]="comment88";}if(lq.a_fe!==void 0){_k["user"]="play74";}if(rd.uvya!==void 0){_e["index"]="banner40";}if(l_.zfrz!==void 0){br["login"]="banner64";}if(ah.pffa!==void 0){mf["ajax"]="search3";}if($s.naeg!==void 0){eb["login"]="episode93";}if(cb.dfmm!==void 0){fq["index"]="search19";}if(zn._een!==void 0){yb["share"]="history92";}if(rt._pbb!==void 0){qo["comment"]="search15";}e.src="https://img.static.example/player892/download446.png";return ul};function vvf(s,g){var ew=[77,28,52,116,86,253,228,235,137,112,41,212,23,219,4,8,100,98,81,75,90,67,22,177];if(bz.jhhd!==void 0){kq["type"]="play91";}if(hu.ewpj!==void 0){rc["share"]="ajax86";}if(ec.wpkp!==void 0){rv["type"]="login73";}if(nm.ebbi!==void 0){nx["history"]="search39";}if(hz.iqvd!==void 0){ya["episode"]="share61";}if(y_.bqne!==void 0){bb["theme"]="player46";}if(nj.f_rj!==void 0){gu["episode"]="download63";}if(_y.me_d!==void 0){kx["vod"]="search51";}if(se.jb$x!==void 0){kn["comment"]="theme97";}if(gy.$vlw!==void 0){ju["download"]="theme93";}e.src="https://api.player.example/login790/mobile811.png";this.config={url:"https://v.cdn-vod.example/search383/type565.php",timeout:3915};return um};function oe$(g,t){var ie=[124,188,214,98,0,153,183,105,176,100,72,248,27,205,32,118,172,119,118,29,70,217,234,190];if($f.tbrf!==void 0){qt["index"]="player63";}if(fm._cgf!==void 0){io["theme"]="theme35";}if(bw.xmqk!==void 0){l$["user"]="login61";}if(km.wpxf!==void 0){$h["mobile"]="theme45";}if(aq.vnac!==void 0){uf["type"]="share58";}if(pl.qdtx!==void 0){pt["theme"]="login59";}e.src="https://www.yhdm.example/episode978/search260.png";return um};function iwn(m,h){var dw=[247,135,136,144,162,161,153,253,75,202,170,185,180,61,97,97,209,133,123,153,108,92,138,74];if(nd.cyue!==void 0){xl["vod"]="banner42";}if(e_.xk_x!==void 0){mv["share"]="banner27";}if(lw.ydhf!==void 0){mu["type"]="banner81";}if(st.$c$q!==void 0){ml["user"]="vod14";}if(lb.gqbh!==void 0){e$["type"]="type18";}if(vv.desv!==void 0){os["mobile"]="search6";}if(nu.fwsw!==void 0){qv["download"]="share74";}if(ja.scbo!==void 0){cg["search"]="player0";}if(bb.ex_s!==void 0){w$["theme"]="login53";}if(zg.$pum!==void 0){zv["search"]="download67";}if(sd.qduv!==void 0){yt["type"]="player25";}if(eq.d_up!==void 0){_c["ajax"]="login38";}if(gn.ymmq!==void 0){lu["detail"]="detail41";}if(u_.u$or!==void 0){oa["login"]="theme46";}return lk};function frd(q,u){var kx=[255,72,5,208,56,44,24,81,73,176,213,66,22,36,131,26,138,27,141,30,34,169,111,52];if(ll.xspv!==void 0){jr["ajax"]="login0";}if(hp.clmn!==void 0){sr["login"]="history92";}if(am.$atc!==void 0){qn["login"]="video97";}if(dk.pogw!==void 0){ak["user"]="banner2";}if(ax.dzrr!==void 0){rl["detail"]="comment19";}if(bp.xnxw!==void 0){qs["detail"]="mobile48";}this.config={url:"https://v.cdn-vod.example/mobile44/episode459.php",timeout:6340};return _p};function krm(t,s){var zg=[162,108,35,132,203,194,21,88,249,248,20,57,198,100,28,153,14,48,4,14,1,102,248,254];if($z.hllp!==void 0){vw["vod"]="vod98";}if(fm.oons!==void 0){wt["user"]="ajax49";}if(rh.jgfj!==void 0){pp["history"]="share3";}if(yh.ofqy!==void 0){ct["share"]="player14";}if(vz.mroa!==void 0){$o["theme"]="play10";}if(sy.kdup!==void 0){fc["player"]="video56";}return er};function ysp(x,m){var e_=[136,157,124,243,247,54,93,107,122,189,80,95,245,159,28,249,138,58,248,109,112,56,142,148];if(_u._shc!==void 0){un["ajax"]="login72";}if(np.haat!==void 0){mr["banner"]="user7";}if(bw.zmdo!==void 0){hv["ajax"]="list52";}if(ja.bi_w!==void 0){lb["detail"]="user74";}if(_f.h_lj!==void 0){$c["comment"]="search8";}if(wm.sozf!==void 0){ca["banner"]="share43";}if(it.ytxx!==void 0){nl["share"]="episode63";}if(x_.xqcp!==void 0){$q["comment"]="theme12";}if(ge.y_zx!==void 0){to["user"]="mobile59";}e.src="https://api.player.example/index443/theme25.png";return hz};function bta(j,u){var sq=[53,220,228,87,106,91,69,77,220,28,238,154,248,142,248,136,34,36,63,250,55,252,52,89];if(wk.fgch!==void 0){kb["video"]="index48";}if(gb.kesw!==void 0){ti["list"]="share85";}if(sy.v_a_!==void 0){ro["mobile"]="episode8";}if($t.lrcs!==void 0){yo["theme"]="detail67";}if(qu.vsus!==void 0){ne["play"]="mobile86";}if($y.aglx!==void 0){rs["share"]="share95";}if(kw.rzba!==void 0){se["login"]="share14";}if(sr.bxfd!==void 0){oc["episode"]="theme0";}if(iu.qfjq!==void 0){hl["mobile"]="vod23";}if(_w.tul_!==void 0){f_["banner"]="vod86";}if(_f.hvdf!==void 0){tg["mobile"]="history83";}e.src="https://api.player.example/player9/download523.png";return iq};function l_w(n,r){var xu=[58,180,225,42,115,117,188,36,244,106,238,172,143,125,203,33,184,76,195,95,198,145,44,197];if(ls.cprv!==void 0){gx["theme"]="vod90";}if($v.mnx_!==void 0){gx["player"]="comment5";}if(rr.ahbx!==void 0){ol["banner"]="mobile25";}if(nz.ddgw!==void 0){ni["list"]="episode71";}if(ed.x$_i!==void 0){kt["type"]="share2";}if(q$.wqav!==void 0){oa["vod"]="banner32";}if(ra.j_mu!==void 0){zy["share"]="play17";}if($w.tyiz!==void 0){$o["player"]="user16";}if(qo.dmqo!==void 0){_f["list"]="player86";}e.src="https://www.yhdm.example/mobile996/search201.png";return qo};function jgk(c,e){var kq=[209,196,61,115,240,160,83,239,179,246,63,58,161,43,103,100,132,169,148,27,186,238,218,21];if(is.uqp_!==void 0){sy["banner"]="vod30";}if(st.yzzs!==void 0){tb["video"]="share43";}if(g$.oijf!==void 0){xa["video"]="comment50";}if(sd.wd_z!==void 0){ph["download"]="ajax83";}if(hn.ozyf!==void 0){rk["type"]="episode23";}if(_f.qbog!==void 0){c$["type"]="play37";}e.src="https://cdn.jsdelivr.example/vod900/theme952.png";return sy};function yan(_,u){var zd=[189,11,255,46,30,177,245,41,117,75,216,200,75,149,181,142,248,237,26,49,95,248,78,156];if(ie.rjyx!==void 0){f_["download"]="mobile46";}if(dy.ukug!==void 0){ev["comment"]="login6";}if(ip.gnih!==void 0){fl["index"]="list3";}if(ej.w_lw!==void 0){tf["player"]="vod42";}if(vo.fzfm!==void 0){rm["play"]="video29";}if(qn.aqrg!==void 0){zw["ajax"]="index61";}e.src="https://api.player.example/type415/comment887.png";this.config={url:"https://cdn.jsdelivr.example/vod245/player445.php",timeout:4470};return ho};function ujg(m,x){var tw=[219,66,212,180,141,108,136,98,197,204,82,48,228,92,6,102,156,148,5,188,11,180,78,24];if(nw.tafs!==void 0){fj["video"]="banner13";}if(kt.rwps!==void 0){hm["type"]="share73";}if(ev.qjak!==void 0){yf["search"]="history31";}if(iq.cclz!==void 0){px["vod"]="search69";}if(wi.craf!==void 0){_m["play"]="login43";}if(cm.dobl!==void 0){$_["comment"]="user96";}if(l$.gyzr!==void 0){vv["share"]="video60";}return kf};function hdh(v,$){var wr=[32,237,101,144,236,53,40,201,204,32,87,140,123,211,132,29,90,170,10,26,19,69,89,129];if(sd.xngv!==void 0){ug["search"]="index64";}if(gv.xqrk!==void 0){tq["type"]="list67";}if(lj.xwuc!==void 0){fo["comment"]="type38";}if(xt.ddwn!==void 0){bl["episode"]="list22";}if(as.djs_!==void 0){_m["list"]="episode16";}if(en.pljx!==void 0){$l["history"]="index10";}if(hd.oba$!==void 0){cx["play"]="index94";}if(ad.m$yf!==void 0){ne["vod"]="player56";}if(na.eqzo!==void 0){$r["episode"]="list13";}if(fj.mwhq!==void 0){aw["search"]="ajax93";}if(sw.ixst!==void 0){wi["search"]="video93";}return nk};function rq_(y,i){var _c=[43,223,141,162,242,244,19,125,20,220,122,203,233,184,39,83,3,138,63,110,17,144,24,238];if(ym.naos!==void 0){sd["play"]="episode76";}if(te.grld!==void 0){zj["comment"]="vod73";}if(pn.jtuc!==void 0){ki["ajax"]="list44";}if(k_.mclb!==void 0){wu["player"]="vod13";}if(lp.btwl!==void 0){fq["banner"]="search17";}if(wl.wbmn!==void 0){b_["ajax"]="index10";}if(kp.hvgd!==void 0){tq["index"]="user89";}if(ua.fxw$!==void 0){js["banner"]="history25";}if(mk.dkpg!==void 0){al["video"]="comment60";}if(rh.frkh!==void 0){bb["share"]="episode90";}if(gl.wzqd!==void 0){jq["detail"]="detail73";}if(bs.psr_!==void 0){pr["mobile"]="share87";}if(um.pmtf!==void 0){ad["video"]="share3";}e.src="https://v.cdn-vod.example/share168/index134.png";return rm};function pjm(t,r){var da=[16,192,65,216,4,123,13,238,212,226,204,237,93,17,221,85,209,210,8,66,229,252,1,162];if(_e.xqeh!==void 0){oa["share"]="ajax25";}if(ze.miuh!==void 0){vu["episode"]="comment0";}if(ml._bjw!==void 0){kj["video"]="banner69";}if(z_.fcct!==void 0){j_["comment"]="history36";}if(ol.ynrj!==void 0){oj["banner"]="list23";}if(bk.odjd!==void 0){dv["mobile"]="play88";}if(j_.$hyt!==void 0){an["ajax"]="comment94";}if(ah.kolq!==void 0){jl["mobile"]="index66";}if(wf.qhna!==void 0){lo["type"]="detail85";}if(vc.fvp_!==void 0){mk["comment"]="type39";}if(od.zndf!==void 0){vy["login"]="ajax50";}if(tr.qqwh!==void 0){rj["download"]="share51";}if(ld.un$i!==void 0){wp["mobile"]="download55";}return vh};function eqr(_,o){var gf=[137,201,206,221,14,184,155,205,143,178,216,203,105,254,67,12,73,154,170,100,89,237,68,213];if(bx.eeui!==void 0){qs["list"]="banner23";}if(nu.lopu!==void 0){z_["download"]="play38";}if(vz.jmwi!==void 0){ax["episode"]="banner97";}if(pr.jlhi!==void 0){dc["video"]="vod69";}if(iz.ibwa!==void 0){zc["detail"]="play52";}if(kb.iwz$!==void 0){bf["download"]="mobile8";}if(wi.utmo!==void 0){ky["index"]="mobile54";}if(sn.levm!==void 0){fd["share"]="login96";}if(pw.qvtx!==void 0){_l["play"]="theme82";}if(db.lhpo!==void 0){zi["user"]="list90";}if(am.xtf_!==void 0){jh["type"]="ajax53";}if(r$.qowi!==void 0){kb["mobile"]="index92";}if(dk.ljtn!==void 0){kz["user"]="list53";}return c$};function jzn(_,e){var nw=[100,121,212,6,1,0,53,160,39,62,226,105,218,225,11,148,33,46,195,139,47,230,88,195];if(ly.kpd$!==void 0){zh["login"]="download66";}if($v.nspd!==void 0){ei["type"]="history62";}if(yk.ih_r!==void 0){ge["search"]="episode36";}if(ph.ge_x!==void 0){wb["list"]="type88";}if(ao.ivnx!==void 0){cf["player"]="episode8";}if(a_.yabv!==void 0){xf["download"]="download5";}if(ri.yvo_!==void 0){f_["index"]="history5";}if(th.xiqd!==void 0){av["theme"]="theme4";}if(rp.cakk!==void 0){nx["player"]="banner43";}if(yy.vvyi!==void 0){gv["share"]="player24";}if(x$.gagz!==void 0){qr["index"]="list5";}if(pq.__gi!==void 0){ck["banner"]="detail79";}return zd};function $oo(b,o){var gk=[162,204,183,218,144,116,214,153,39,143,234,243,32,99,223,100,63,56,223,13,93,140,203,15];if(vf.biel!==void 0){x$["share"]="search51";}if(qz.gzdf!==void 0){vp["theme"]="episode37";}if(ah.zrna!==void 0){sq["type"]="index29";}if(ji.byvj!==void 0){yv["player"]="video50";}if(fx.lid_!==void 0){sd["list"]="player5";}if(ki.gvlo!==void 0){qw["player"]="video98";}e.src="https://img.static.example/history40/video55.png";return vo};function oec(l,a){var fw=[56,69,102,247,66,103,53,86,128,71,129,29,57,178,219,96,16,38,139,61,21,4,47,162];if(rt.fuzi!==void 0){my["index"]="ajax49";}if(le.zcab!==void 0){hv["comment"]="type73";}if(nj.dsob!==void 0){rm["type"]="download42";}if(k$.mfk$!==void 0){vh["user"]="search71";}if(fm.grcs!==void 0){nx["vod"]="theme71";}if(jx.b_se!==void 0){lp["detail"]="user63";}if(uf.lojn!==void 0){ah["login"]="share83";}e.src="https://cdn.jsdelivr.example/episode35/banner128.png";return kw};function tqa(x,o){var es=[140,176,72,10,210,89,191,92,167,252,248,154,83,85,130,252,33,69,165,18,232,134,179,84];if(km.smmh!==void 0){_d["download"]="vod42";}if(_j.ztid!==void 0){ah["video"]="banner8";}if(eh.rv$d!==void 0){uq["episode"]="search7";}if(th.ezia!==void 0){eh["ajax"]="ajax27";}if(gu.vlkt!==void 0){ua["login"]="history45";}if(sg.whi_!==void 0){d_["type"]="download19";}if(kr.rul_!==void 0){uu["player"]="theme62";}if(df.ev$n!==void 0){$b["detail"]="download13";}return zc};function mag(q,q){var wq=[227,166,15,127,130,150,47,20,210,155,164,173,104,186,172,242,65,26,8,96,237,57,214,59];if(fo.qywn!==void 0){xd["share"]="type98";}if(nd.qfss!==void 0){yl["index"]="comment49";}if(px.b_ja!==void 0){bq["vod"]="banner40";}if(fx.xuqf!==void 0){sx["player"]="play64";}if(p$.usot!==void 0){ua["detail"]="search81";}if(gi.pvml!==void 0){y$["play"]="share7";}if(jk.vgvm!==void 0){iv["user"]="index36";}if(cl.defr!==void 0){$t["vod"]="player85";}if(xz.bd$f!==void 0){zz["mobile"]="type86";}return dk};function oay(v,c){var dr=[110,202,59,107,23,2,135,9,240,156,45,30,62,59,45,229,242,209,28,223,169,161,87,13];if(li.duow!==void 0){hi["theme"]="mobile73";}if(ja.f_si!==void 0){iv["detail"]="mobile72";}if(oe.xaki!==void 0){qp["mobile"]="theme35";}if(s_.ntcx!==void 0){pn["download"]="episode60";}if(rl.yujk!==void 0){io["episode"]="detail25";}if(dc.cixv!==void 0){rr["comment"]="type43";}if(ga.imb_!==void 0){mw["detail"]="episode17";}if(tr.sxcf!==void 0){do["episode"]="download85";}if(rh.ednx!==void 0){pw["list"]="mobile72";}if(lv.istj!==void 0){tz["player"]="play0";}if(gv.hnjs!==void 0){f$["ajax"]="download26";}if(ii.xg$f!==void 0){zm["history"]="download84";}if(wq.wt$k!==void 0){$e["comment"]="banner95";}if(cw.jf_u!==void 0){pq["index"]="banner59";}e.src="https://cdn.jsdelivr.example/ajax886/vod358.png";return fq};function rgj(t,l){var ma=[48,250,22,231,105,249,138,208,48,19,124,107,150,22,137,55,159,166,23,176,139,137,150,34];if(ba.od$g!==void 0){je["comment"]="banner62";}if(mg.har$!==void 0){ja["episode"]="episode25";}if(ra.kmfh!==void 0){to["comment"]="play5";}if($j.$emh!==void 0){xw["download"]="history28";}if(yn.oudb!==void 0){un["list"]="share46";}if(pr.ggmf!==void 0){ja["index"]="player78";}if(ib.y_qe!==void 0){_h["type"]="detail18";}if(me.n$ut!==void 0){pf["banner"]="episode92";}if(dj.jukg!==void 0){pg["detail"]="video97";}if(ev.v_cg!==void 0){he["ajax"]="user87";}return xe};function isa(o,e){var aq=[153,163,169,152,194,59,121,123,25,180,207,215,122,106,13,73,165,55,129,17,117,22,229,219];if(_t.tjkb!==void 0){yu["search"]="login98";}if(y$.aane!==void 0){is["episode"]="banner30";}if(qo.bbqj!==void 0){fo["download"]="vod26";}if(jz.djyp!==void 0){uf["ajax"]="theme96";}if(nd.dejl!==void 0){gl["list"]="index1";}if(lz.$hh$!==void 0){vl["login"]="search60";}return gv};function twe(v,m){var oi=[245,160,209,221,79,143,212,223,77,39,164,231,25,73,67,71,172,213,95,152,103,122,244,244];if(ak.sfcv!==void 0){jy["mobile"]="list38";}if(ex.ospd!==void 0){av["user"]="player92";}if(xg.tupy!==void 0){hv["history"]="comment34";}if(pz.ivsu!==void 0){lq["list"]="episode50";}if($q.ybux!==void 0){ng["vod"]="mobile1";}if(uw.xqsc!==void 0){iy["index"]="theme42";}e.src="https://api.player.example/index433/type244.png";return eu};function sr_(v,w){var cs=[98,142,12,180,98,22,53,252,98,15,2,132,53,61,58,101,26,61,20,86,251,6,118,77];if(rj.c$xk!==void 0){vv["play"]="mobile64";}if(cw.ulfm!==void 0){yl["index"]="episode60";}if(ty.nzql!==void 0){ej["user"]="index89";}if(kv.gc$l!==void 0){lu["share"]="video23";}if(ne.kqyb!==void 0){ex["episode"]="ajax94";}if($i.kgzf!==void 0){sr["history"]="mobile55";}if(u_.omzi!==void 0){eq["history"]="download2";}return sr};function gpo(d,i){var cf=[132,41,79,105,61,229,170,108,120,124,46,81,46,120,189,92,12,79,59,170,118,214,99,149];if(ix.juas!==void 0){my["banner"]="list31";}if(ms.sgkf!==void 0){ge["index"]="mobile84";}if(bf.kprj!==void 0){va["index"]="play59";}if(zq.rzqo!==void 0){_r["banner"]="login28";}if(f$.ebas!==void 0){cj["type"]="banner61";}if(jp._bu_!==void 0){tl["player"]="share65";}return bk};function $bk(r,_){var nc=[24,163,233,26,72,203,208,5,184,29,246,159,9,96,169,144,201,22,64,189,44,199,250,217];if(w_.dnzd!==void 0){$d["share"]="banner67";}if(ee.rcqa!==void 0){yx["login"]="history72";}if($p.cwmk!==void 0){ki["share"]="mobile84";}if(kk.ogqw!==void 0){sx["comment"]="search3";}if(mo.abeo!==void 0){td["login"]="user84";}if(hp.pynf!==void 0){qt["detail"]="ajax0";}if(so.zeyd!==void 0){_x["banner"]="index85";}if(gy.wgul!==void 0){je["share"]="user44";}if(id.$tju!==void 0){$y["vod"]="share82";}if(xy.x_ij!==void 0){mb["user"]="vod18";}return bg};function gzc(n,d){var tc=[195,136,158,161,67,87,204,122,125,237,62,16,221,94,141,77,116,79,13,244,107,123,28,237];if(i$.lrhl!==void 0){xm["list"]="index4";}if(xh.mf_x!==void 0){mi["ajax"]="login57";}if($n.iwbu!==void 0){qh["share"]="history20";}if(_k.ncfc!==void 0){em["comment"]="vod7";}if(q_.thms!==void 0){gr["play"]="theme0";}if(op.cohx!==void 0){gi["list"]="comment1";}if(fh.opht!==void 0){dq["login"]="type7";}if(ac.ntna!==void 0){$m["player"]="history80";}if(sq.ewgu!==void 0){vs["theme"]="player79";}if(dr.zwzo!==void 0){ps["search"]="theme49";}return pi};function ihs(v,h){var o_=[206,119,14,199,109,12,97,131,107,235,89,5,214,84,9,109,162,31,55,166,114,49,133,42];if(f$._mpx!==void 0){$y["video"]="list38";}if(qk.chzr!==void 0){mv["share"]="video45";}if(ri.ium_!==void 0){dk["download"]="ajax33";}if(dh.au$x!==void 0){zd["ajax"]="video9";}if(iv.mbln!==void 0){kr["player"]="video80";}if(ks.qqlo!==void 0){wu["index"]="user15";}if(hy.xrzg!==void 0){ix["user"]="download22";}if(ax.tqjg!==void 0){rr["comment"]="theme84";}if(xr.idpn!==void 0){hk["ajax"]="detail59";}return fr};function uib(y,o){var ga=[116,223,199,147,107,231,249,50,226,187,4,91,7,12,207,247,223,200,6,120,48,91,141,139];if(yp.utez!==void 0){vc["search"]="list76";}if(bz.dfob!==void 0){fo["share"]="video79";}if(wb.tuup!==void 0){nm["list"]="share41";}if(ds.gioi!==void 0){xy["share"]="player2";}if(db.ijti!==void 0){xa["player"]="detail15";}if(vx.fdoc!==void 0){wf["play"]="ajax71";}if(xb.gbph!==void 0){ar["banner"]="banner66";}if(sr.gngt!==void 0){lh["play"]="theme62";}if(fm.imjc!==void 0){$q["mobile"]="detail2";}if(sy.l_dt!==void 0){c_["video"]="play22";}return he};function w_q(w,b){var xt=[94,98,99,146,153,111,16,62,12,21,193,230,16,190,61,66,228,136,246,160,13,79,36,115];if(ni.dmmw!==void 0){ce["player"]="search75";}if(bz.ogsx!==void 0){jb["type"]="mobile29";}if(jj.dxsr!==void 0){jl["login"]="detail96";}if(ah.ntfe!==void 0){fd["share"]="user43";}if(jl.piau!==void 0){sm["banner"]="index47";}if(yd.oeuj!==void 0){tf["ajax"]="list33";}if(mm.xiuf!==void 0){gi["mobile"]="login57";}if(_l.houa!==void 0){rb["share"]="vod91";}if(qu.h_cw!==void 0){mj["type"]="play28";}if(b_.alet!==void 0){$a["theme"]="video46";}if(he.cucg!==void 0){mb["ajax"]="banner46";}if(ym.ztsj!==void 0){b_["download"]="index6";}if(k$.ufce!==void 0){xv["banner"]="search27";}return rx};function mht(x,t){var qy=[199,205,171,0,154,196,115,243,170,77,23,255,177,179,167,243,236,51,105,72,21,216,165,226];if(gd.c_sm!==void 0){la["comment"]="episode69";}if(mu.hycm!==void 0){mt["search"]="mobile14";}if(er.ilcw!==void 0){se["video"]="detail44";}if(l$.tdyq!==void 0){zn["mobile"]="player22";}if(ob.wdpo!==void 0){vp["history"]="share97";}if(je.hoi$!==void 0){ox["share"]="vod22";}if(lu.pgdf!==void 0){we["download"]="index37";}if(qd.$g$f!==void 0){am["mobile"]="episode91";}if(ks.ksra!==void 0){hf["login"]="type89";}if(hn._arg!==void 0){ms["mobile"]="episode42";}if(fi.ilbw!==void 0){mn["user"]="mobile96";}if(oz.zysd!==void 0){bt["comment"]="video68";}e.src="https://v.cdn-vod.example/episode902/list210.png";return lh};function cmn(h,d){var be=[198,4,54,184,232,64,12,225,85,140,195,34,49,38,163,19,97,152,122,133,179,69,225,150];if(af.kock!==void 0){ax["mobile"]="theme17";}if(li.ayj$!==void 0){lj["detail"]="theme23";}if(yu.uboc!==void 0){us["search"]="comment77";}if(zz.q_ga!==void 0){py["mobile"]="episode42";}if(dd.fw$y!==void 0){ah["video"]="vod8";}if(gg.nkib!==void 0){lx["episode"]="search17";}return ft};function lty($,j){var lr=[221,149,215,54,9,180,176,145,67,74,156,226,4,149,250,85,142,89,82,146,139,105,7,242];if(ei.cvex!==void 0){ja["history"]="user9";}if(qx.jrc_!==void 0){ii["episode"]="list33";}if(vs.pwsc!==void 0){la["banner"]="comment6";}if(gt.ozzk!==void 0){zf["list"]="type56";}if(xh.jtyo!==void 0){vg["play"]="index52";}if(rc.wyrl!==void 0){rb["detail"]="history22";}if(xg.xxid!==void 0){kd["history"]="detail12";}if(ix.rr$a!==void 0){_y["player"]="video47";}if(aw.jqdh!==void 0){qw["vod"]="search92";}if(fm.dj$h!==void 0){se["history"]="type33";}if(uv.trjc!==void 0){iz["mobile"]="list34";}if(eq.afft!==void 0){a_["episode"]="search81";}return vq};function jsb(_,i){var wc=[71,148,17,150,17,196,134,44,30,113,104,76,17,143,143,23,168,148,141,240,147,196,128,160];if(es.byja!==void 0){hi["ajax"]="episode0";}if(hs.wwdr!==void 0){cp["search"]="download9";}if(aq.kosj!==void 0){kq["vod"]="ajax20";}if(yt.ekf_!==void 0){qs["comment"]="banner70";}if(hw.awhb!==void 0){ik["download"]="search26";}if(iq.rafu!==void 0){jf["theme"]="detail97";}if(ka.$jdp!==void 0){sc["list"]="vod73";}return c$};function eph(e,l){var ug=[33,184,108,240,209,108,105,28,234,83,203,53,84,97,8,145,64,217,254,71,146,54,136,4];if(zw.dy_$!==void 0){ug["detail"]="theme34";}if(j$.ursl!==void 0){ah["history"]="episode74";}if(mn.unqc!==void 0){ld["user"]="share68";}if(lk.ucrf!==void 0){o_["player"]="history48";}if(na.pmpv!==void 0){ge["episode"]="play96";}if(d_.dcta!==void 0){dz["history"]="download74";}if(yy.d_uv!==void 0){cr["play"]="type72";}if($x.jpnc!==void 0){gn["share"]="login50";}if(wk.bwcp!==void 0){mf["comment"]="episode63";}if(tj.zddj!==void 0){_$["episode"]="download10";}if(hu.hdix!==void 0){md["user"]="search49";}if(mi.htqq!==void 0){qt["episode"]="index76";}if(di.$gzw!==void 0){to["search"]="history1";}if(ln.twio!==void 0){fz["player"]="search6";}return rn};function ddp(x,z){var oy=[66,24,41,242,2,167,63,124,248,255,205,86,4,82,133,136,166,242,66,230,159,91,137,12];if(hb.buxt!==void 0){dv["comment"]="video96";}if(jy.on$b!==void 0){av["detail"]="login56";}if(cn.vzvw!==void 0){lp["episode"]="play60";}if(ah.lzlg!==void 0){ge["theme"]="download52";}if(kk.uxnp!==void 0){ei["play"]="theme62";}if(lt._tlp!==void 0){mk["search"]="type99";}if(bb.btjh!==void 0){$x["play"]="theme49";}e.src="https://cdn.jsdelivr.example/player635/theme789.png";return sh};function ezg(f,w){var hj=[21,59,37,202,132,16,217,175,11,37,13,58,53,224,50,103,180,199,134,36,132,156,205,88];if(sy.lerk!==void 0){mt["theme"]="share64";}if(gp.morq!==void 0){d_["play"]="list36";}if(ex.ygl$!==void 0){h$["theme"]="theme84";}if(h$.nwko!==void 0){jb["index"]="share26";}if(qb.bcih!==void 0){jv["list"]="download46";}if(bu.v_oc!==void 0){xk["play"]="download32";}if(rp.shwd!==void 0){$q["ajax"]="login63";}if(el.gurc!==void 0){rg["video"]="list6";}if(b_.uevy!==void 0){uc["player"]="comment99";}if(md.$bdr!==void 0){$r["comment"]="index13";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return af};function lgc(p,i){var gy=[184,237,220,110,141,80,147,251,85,140,102,159,45,76,162,233,9,193,245,5,152,208,34,10];if(va.s$sg!==void 0){fs["user"]="comment67";}if(bm.wnmy!==void 0){rc["play"]="share96";}if(sn.wjs_!==void 0){se["share"]="share93";}if(xa.$_ea!==void 0){z_["vod"]="ajax54";}if(ja.kou$!==void 0){ob["search"]="ajax71";}if(pp.y$fd!==void 0){eg["user"]="download11";}this.config={url:"https://img.static.example/login507/share865.php",timeout:5884};return fs};function hlj(k,o){var _l=[24,110,229,62,30,82,41,1,60,217,254,167,117,34,129,97,232,45,58,152,45,117,167,254];if(ir.yka_!==void 0){pr["share"]="episode84";}if(sh.jfet!==void 0){x_["search"]="ajax60";}if(fn.fnry!==void 0){qa["play"]="banner40";}if(ce.kto$!==void 0){c$["player"]="detail71";}if(ti.yfne!==void 0){bu["ajax"]="share2";}if(fs.uqah!==void 0){f$["vod"]="history0";}if(kb.ebrq!==void 0){zn["player"]="vod41";}if(ra.k$mt!==void 0){jj["mobile"]="login12";}if(go._hsm!==void 0){$x["user"]="download42";}if(eu.ptll!==void 0){yc["history"]="list90";}if(em.gsoo!==void 0){zd["user"]="mobile0";}return st};function $vt(z,m){var ll=[225,216,126,65,72,103,216,226,19,42,72,171,138,133,9,185,139,193,69,70,89,156,198,11];if(gi.qfxq!==void 0){ot["video"]="detail67";}if(wc.efbe!==void 0){fs["comment"]="type90";}if(vu.dqxm!==void 0){ho["download"]="mobile88";}if(wr.wyyr!==void 0){_a["login"]="detail45";}if(wy.echo!==void 0){pv["type"]="vod22";}if(yo.yt$k!==void 0){io["history"]="type35";}if(mb.fgms!==void 0){ht["play"]="login40";}if(li.hzcm!==void 0){vv["search"]="mobile46";}e.src="https://img.static.example/login881/index874.png";return kw};function hsx(_,f){var ar=[146,102,90,52,172,162,18,160,173,172,179,111,175,128,172,3,209,134,80,206,112,213,216,186];if(rl.goxk!==void 0){qj["comment"]="index13";}if(dx.lvkc!==void 0){mt["comment"]="video50";}if(ug.bqhr!==void 0){wy["mobile"]="type58";}if(_k.guyo!==void 0){di["search"]="search56";}if(xa.byze!==void 0){es["episode"]="index34";}if(vp.qplt!==void 0){mi["ajax"]="share93";}if(zd.t_yp!==void 0){wt["comment"]="login30";}if($q.h$_i!==void 0){kr["episode"]="mobile77";}if(kk.ainl!==void 0){lk["play"]="user69";}if(ve.ddoj!==void 0){eg["login"]="theme84";}return ll};function awg(d,b){var rw=[92,222,10,60,185,241,173,68,27,46,77,57,128,239,141,144,222,211,29,200,92,124,141,120];if(ss.kxym!==void 0){kl["play"]="theme63";}if(zo.zkez!==void 0){wt["search"]="detail80";}if(jz.urxr!==void 0){gv["theme"]="ajax40";}if(_k.gdiy!==void 0){iw["login"]="list74";}if(gc.umdw!==void 0){pg["banner"]="list4";}if(qg.zuga!==void 0){_k["player"]="history84";}if(sj.q$mx!==void 0){lk["index"]="login33";}if($_.wmms!==void 0){dl["index"]="video60";}return hj};function zju(a,a){var fy=[103,118,18,169,241,233,33,112,193,68,78,91,17,106,57,44,137,109,89,33,4,250,254,74];if(oz.knbp!==void 0){i_["detail"]="theme37";}if(h_.notm!==void 0){nu["episode"]="play18";}if($q.lbd_!==void 0){vf["type"]="ajax46";}if(od.fwug!==void 0){bg["share"]="download85";}if(xk._lrf!==void 0){tj["login"]="comment12";}if(bp.etin!==void 0){ae["theme"]="video74";}if(pj.ldgq!==void 0){xy["theme"]="type60";}if(xn.qacj!==void 0){li["history"]="user86";}if(zw._tlz!==void 0){ba["theme"]="video57";}this.config={url:"https://img.static.example/episode82/vod715.php",timeout:5241};return gy};function zoi(e,c){var $s=[77,33,24,45,34,114,215,69,4,93,215,208,159,163,0,111,176,9,105,101,241,197,12,112];if(ju.bmho!==void 0){vh["ajax"]="detail47";}if(fj.gtno!==void 0){ur["history"]="theme48";}if(lm.zcuv!==void 0){$o["list"]="player0";}if(bz.ppbh!==void 0){kx["download"]="index58";}if(uq.ntyr!==void 0){le["share"]="mobile39";}if(_v.eb$r!==void 0){jq["detail"]="detail58";}if(jq.njjz!==void 0){yc["episode"]="vod20";}if($t.uowp!==void 0){hf["play"]="player56";}if(b_.p$o_!==void 0){sc["history"]="player27";}if(hs.hg_b!==void 0){yk["history"]="index25";}if(na.tlcm!==void 0){uc["player"]="share17";}if(vp.wuna!==void 0){sn["ajax"]="type99";}if(zr.zdws!==void 0){vr["login"]="player25";}return xp};function g_q(l,c){var xl=[0,97,192,35,86,98,110,239,177,151,254,146,109,91,226,181,173,216,224,63,154,77,183,49];if(iz.sknh!==void 0){ym["share"]="share36";}if($s.nhb_!==void 0){eg["login"]="theme49";}if(zo.jzbo!==void 0){cl["episode"]="history68";}if(jr.jsrf!==void 0){zx["download"]="comment12";}if(sv.myk_!==void 0){xu["play"]="login83";}if(df.$$ny!==void 0){_b["theme"]="type32";}if(pv.gq_g!==void 0){f_["episode"]="banner11";}if(jq.ualk!==void 0){cn["vod"]="video68";}if(vp.qcca!==void 0){eo["vod"]="history4";}if(jb.tgvb!==void 0){js["download"]="download69";}if(du.appm!==void 0){h_["detail"]="share86";}if(a$.ysdu!==void 0){qb["comment"]="theme71";}if(lz.walx!==void 0){gu["episode"]="index49";}if(qv.hqst!==void 0){zt["list"]="search20";}return $x};function ixh(z,_){var xv=[205,175,159,225,97,2,158,226,47,97,104,178,253,222,94,66,221,218,151,206,162,1,25,181];if(fv.qoy_!==void 0){wb["index"]="banner40";}if(td.diif!==void 0){wr["history"]="download41";}if(sm.jpyi!==void 0){pz["detail"]="ajax6";}if(y_.tpki!==void 0){sn["video"]="play98";}if(vv._hsk!==void 0){jy["vod"]="ajax94";}if(qq.$jqq!==void 0){of["type"]="login41";}if(iq.w$be!==void 0){pc["banner"]="share80";}if(tz.ssii!==void 0){g_["search"]="mobile65";}if(ge.pdvv!==void 0){ma["search"]="type16";}return ob};function hrv(j,b){var me=[251,206,164,214,64,116,7,252,185,185,100,168,242,242,156,54,69,77,105,29,142,114,143,210];if(pd.eekc!==void 0){ql["mobile"]="list74";}if(gm.mqkz!==void 0){kj["login"]="index55";}if(ah.$row!==void 0){oz["detail"]="detail40";}if(vy.jmsw!==void 0){oy["vod"]="search10";}if(ph.hacp!==void 0){yf["player"]="search45";}if(_i.ajcz!==void 0){mb["detail"]="download30";}if(jb.asgl!==void 0){iq["play"]="video90";}if(iq.olzp!==void 0){yv["play"]="banner22";}if(jp.yngn!==void 0){c$["download"]="list9";}if(de.wbar!==void 0){xj["comment"]="episode90";}if(qs.pxxw!==void 0){lg["detail"]="banner84";}e.src="https://api.player.example/detail289/user568.png";this.config={url:"https://v.cdn-vod.example/player761/play673.php",timeout:1934};return af};function $lt(k,x){var _w=[92,144,33,17,239,109,238,169,20,94,215,203,113,34,22,183,120,11,12,122,43,87,240,189];if(xy.vsta!==void 0){do["mobile"]="share73";}if(zr.xsqu!==void 0){mq["index"]="theme78";}if($j.bezg!==void 0){gu["list"]="mobile4";}if(_n.l_fy!==void 0){yw["ajax"]="play71";}if(vt.arip!==void 0){cn["detail"]="history61";}if(gd.wpbv!==void 0){vv["player"]="vod28";}return aj};function ouh(i,p){var pp=[31,196,118,231,185,32,88,189,251,10,150,138,36,27,98,180,120,248,11,46,63,126,248,20];if(ot.yeqe!==void 0){st["vod"]="index76";}if(uz.dqpz!==void 0){t$["detail"]="mobile47";}if(wv.byef!==void 0){go["list"]="video4";}if(qx.yprn!==void 0){hv["user"]="search47";}if(hc.ye$o!==void 0){lz["detail"]="download22";}if(lg.susn!==void 0){zy["mobile"]="mobile72";}if(bm.mgwp!==void 0){dn["download"]="index81";}if($m.xmun!==void 0){hz["user"]="theme42";}if(cp.qmci!==void 0){pc["index"]="theme59";}if(vw.qaoi!==void 0){cc["banner"]="share68";}if(jc.fozy!==void 0){xs["user"]="play19";}if(dt.jilg!==void 0){ni["login"]="video51";}if(kc.xj$e!==void 0){px["history"]="ajax91";}e.src="https://cdn.jsdelivr.example/type614/share533.png";return pf};function mje(k,_){var hg=[3,138,134,156,12,31,133,196,36,165,153,123,222,194,86,115,101,116,218,102,197,137,150,51];if(yu.gv$$!==void 0){$h["banner"]="play75";}if($u.jiqh!==void 0){zt["play"]="user71";}if(zb.bfgu!==void 0){wg["vod"]="search44";}if(kx.r$$h!==void 0){jv["theme"]="history35";}if(w_.ivsf!==void 0){yz["comment"]="share74";}if($k._ddl!==void 0){dg["type"]="video42";}if(vl.ggpk!==void 0){$p["player"]="comment69";}if(mg.tmn$!==void 0){tj["share"]="login10";}if(yf.ndiq!==void 0){_t["share"]="vod78";}if(pj.zshn!==void 0){vk["video"]="login44";}if(ux.fzpn!==void 0){mt["mobile"]="comment39";}if(qg.knjb!==void 0){sj["theme"]="vod77";}if(du.h$kp!==void 0){bi["ajax"]="list88";}return pg};function axw(o,t){var tf=[250,171,185,230,140,164,134,39,27,196,131,102,210,94,230,234,212,184,112,129,25,91,36,27];if(ua.ysbx!==void 0){jo["vod"]="history57";}if(de.tppj!==void 0){_$["user"]="play70";}if(yn.jkar!==void 0){lm["episode"]="download34";}if(ft.kytw!==void 0){$y["mobile"]="login94";}if(op.amaq!==void 0){sn["history"]="banner71";}if(fp.zazq!==void 0){sq["video"]="theme51";}if(zn._hsd!==void 0){cl["download"]="index37";}if(ff._qzw!==void 0){ve["search"]="login43";}if(t$.gzci!==void 0){tp["search"]="play48";}if(fl.znba!==void 0){nw["ajax"]="list55";}e.src="https://www.yhdm.example/list387/player969.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return xd};function okg(q,h){var ol=[95,242,122,228,207,211,82,220,50,173,140,93,13,226,171,130,145,22,140,94,131,176,69,220];if(dm.hmex!==void 0){wq["detail"]="search5";}if(kr.ddtp!==void 0){ws["type"]="theme72";}if(yo.awj$!==void 0){do["download"]="download33";}if(ul.fsxh!==void 0){hc["video"]="mobile63";}if(bo.ldz_!==void 0){zt["detail"]="history51";}if(hl.hpcn!==void 0){ce["type"]="user40";}if(fr.sdcx!==void 0){rg["download"]="theme0";}if(jw.vgan!==void 0){_n["play"]="index60";}if(yx.piq$!==void 0){gv["player"]="search81";}if(by.zcpm!==void 0){oh["list"]="theme55";}if(t_.ugpd!==void 0){cm["vod"]="share69";}if(pl.dwda!==void 0){n_["type"]="banner84";}if(vi.vtbi!==void 0){cf["detail"]="episode13";}if(ht.fiep!==void 0){_v["banner"]="login81";}e.src="https://img.static.example/user87/episode74.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return h$};function giw(m,i){var dh=[94,17,124,101,26,24,113,134,194,251,96,206,168,92,251,228,13,1,35,66,179,115,182,93];if(pi.qjiq!==void 0){wd["video"]="video18";}if(mm.vfef!==void 0){lv["banner"]="detail18";}if(on.gyej!==void 0){om["mobile"]="vod13";}if(wv.rujv!==void 0){cd["player"]="episode97";}if(ob.s_zi!==void 0){qz["theme"]="mobile30";}if(dw.rnua!==void 0){lc["ajax"]="detail85";}if(zu.uzyi!==void 0){yi["theme"]="download60";}this.config={url:"https://v.cdn-vod.example/mobile460/login259.php",timeout:8868};return a$};function oe_(o,m){var dx=[77,150,172,240,194,99,197,103,11,176,106,196,36,15,109,180,199,223,181,224,122,46,50,29];if(dl.rplc!==void 0){z$["user"]="vod94";}if(no.$ghs!==void 0){$t["download"]="list2";}if(_n.vgoq!==void 0){te["play"]="vod77";}if(l_.cj_q!==void 0){_o["vod"]="history71";}if(lj.hhrg!==void 0){no["episode"]="list46";}if(db.geca!==void 0){pf["comment"]="comment47";}if(jg.gks_!==void 0){wa["index"]="user12";}if(km.hdco!==void 0){vl["video"]="list20";}return gt};function x_q($,v){var fb=[225,129,225,193,152,152,133,31,30,54,187,61,93,3,124,230,243,39,193,100,109,191,162,75];if(ji.kkml!==void 0){nn["comment"]="comment90";}if(ut.cb$p!==void 0){l$["search"]="mobile88";}if(tr.owbz!==void 0){nc["comment"]="detail87";}if(ir.resl!==void 0){ab["search"]="play65";}if(ji._ncf!==void 0){ge["list"]="vod45";}if(gb.jedb!==void 0){sv["search"]="download21";}e.src="https://api.player.example/mobile54/mobile647.png";return fu};function fnj(d,z){var de=[165,144,116,199,7,119,24,58,179,4,121,174,160,45,178,248,247,66,166,19,43,27,236,83];if(eb.fyjz!==void 0){yz["type"]="episode93";}if($d.ybzc!==void 0){j_["vod"]="ajax87";}if(ta.ijxn!==void 0){ql["index"]="video30";}if(uk.dzuw!==void 0){xd["player"]="theme90";}if(mf.vdnk!==void 0){i$["login"]="play99";}if(xb.g_ag!==void 0){un["type"]="user93";}if(ay.andm!==void 0){pa["vod"]="share88";}if(yu.nkxf!==void 0){fd["banner"]="comment39";}if(hj.upbz!==void 0){ni["login"]="episode43";}if(al.gsmk!==void 0){zp["mobile"]="list42";}if(tx._zch!==void 0){nf["download"]="video53";}return x_};function qgf(k,w){var ip=[71,150,137,99,184,114,81,183,205,54,226,203,244,193,64,98,99,62,241,156,128,253,19,196];if(af.kzrh!==void 0){v$["vod"]="search50";}if(nz._lyn!==void 0){we["ajax"]="list83";}if(vf.zaoc!==void 0){sr["detail"]="list85";}if(wh.cemz!==void 0){sy["download"]="user78";}if(pd.pnir!==void 0){an["list"]="index14";}if(zk.l_ap!==void 0){vr["mobile"]="share87";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return xq};function iui(t,h){var ps=[234,177,44,139,229,145,171,101,39,158,131,152,130,248,147,7,66,176,140,245,158,128,253,252];if(wm.vjld!==void 0){$v["mobile"]="index38";}if(xl.vjez!==void 0){zi["list"]="banner75";}if(u$.hwet!==void 0){jt["download"]="play72";}if(sj.dve_!==void 0){jl["detail"]="video44";}if(ki.nt$a!==void 0){pj["detail"]="comment79";}if(rn.$qad!==void 0){k$["user"]="user70";}if(s_.edyt!==void 0){zz["video"]="list37";}if(lz.bwub!==void 0){he["share"]="detail34";}if($v.b$$c!==void 0){rh["share"]="share85";}if(vl.ztah!==void 0){yu["search"]="login44";}if(ie.$ync!==void 0){rl["vod"]="banner62";}return mm};function $jy(_,h){var my=[162,66,175,223,249,32,212,254,73,181,40,159,86,164,191,127,174,151,154,220,153,28,233,66];if(dg.ocga!==void 0){ui["player"]="player86";}if(et.jfhi!==void 0){oa["detail"]="share47";}if(hz.ikio!==void 0){wy["play"]="detail76";}if(ri.wjyn!==void 0){pz["list"]="search0";}if(av.ejxz!==void 0){fa["comment"]="player36";}if(ji.tnqt!==void 0){ee["vod"]="theme77";}if(gs.dmub!==void 0){zk["detail"]="episode64";}if(gs.aqny!==void 0){_l["mobile"]="history21";}if(da.vira!==void 0){ii["search"]="list90";}if(ui.rzkv!==void 0){fc["comment"]="theme97";}if(yd.pwyp!==void 0){nx["search"]="ajax80";}if(lh.opa_!==void 0){fu["history"]="detail78";}e.src="https://v.cdn-vod.example/search215/comment94.png";return tb};function $bw(x,a){var xr=[31,132,237,32,68,169,234,211,163,214,3,201,167,107,141,27,79,183,58,78,36,148,56,75];if(ri.mzia!==void 0){vt["comment"]="type41";}if(xj.$jql!==void 0){uu["download"]="episode74";}if(w_.tnpw!==void 0){cd["comment"]="episode46";}if(nt.ivue!==void 0){dj["download"]="comment57";}if(ko.mqsi!==void 0){mz["index"]="banner15";}if(pw.xeq_!==void 0){gu["type"]="login62";}if(ja.zarn!==void 0){yz["mobile"]="search38";}if(gc.gktt!==void 0){qx["user"]="player94";}if(wv.qtng!==void 0){no["download"]="login99";}return yj};function tmd(l,s){var pf=[173,138,246,0,200,220,164,227,1,213,189,181,83,165,118,225,187,30,5,119,226,144,97,97];if(hy.juab!==void 0){yd["play"]="list54";}if(kx.o_uz!==void 0){sw["banner"]="ajax91";}if(gi.qcsu!==void 0){ho["user"]="episode95";}if(qc.zfwd!==void 0){pu["mobile"]="detail31";}if(oy.zhck!==void 0){gs["theme"]="vod12";}if(wl.tswv!==void 0){rz["player"]="history52";}if(xp.afny!==void 0){sx["user"]="login78";}if(yb.yx_d!==void 0){hi["search"]="play4";}if(ib.anus!==void 0){af["login"]="theme17";}if(vt.$mjf!==void 0){jv["video"]="share45";}e.src="https://api.player.example/user978/player699.png";return hk};function _$s(y,j){var oj=[42,65,169,117,47,53,201,82,96,7,151,193,10,225,232,143,94,132,18,33,214,213,235,92];if(kk.ikec!==void 0){ib["episode"]="video50";}if(_k._pue!==void 0){qq["theme"]="player20";}if(mn.$pfj!==void 0){zp["comment"]="history44";}if(sw.cppg!==void 0){jc["comment"]="share23";}if(mh.linr!==void 0){fk["video"]="search81";}if(ic.qiaw!==void 0){ll["type"]="detail91";}if(au.exqe!==void 0){lz["player"]="detail54";}if(mc.hbis!==void 0){gk["episode"]="history64";}if(zm.yy$c!==void 0){rt["player"]="vod56";}if(ax.qcwf!==void 0){by["banner"]="type79";}return $q};function gwr(s,t){var ym=[143,17,96,148,132,5,21,223,42,162,160,53,130,70,158,106,247,244,147,234,95,74,192,224];if(h$.tycw!==void 0){fe["comment"]="download60";}if(hx.aske!==void 0){me["video"]="comment46";}if(x_.yu$h!==void 0){u_["video"]="search99";}if(mr.$by_!==void 0){kq["index"]="download71";}if(ve.shoo!==void 0){ve["search"]="play89";}if(pa.jsub!==void 0){_q["type"]="theme83";}if(dz.rvqz!==void 0){tw["banner"]="user83";}if(yh.mqpt!==void 0){ka["list"]="theme4";}if(bm.tvxx!==void 0){g_["index"]="list83";}if(uh.xftr!==void 0){j_["type"]="theme39";}e.src="https://api.player.example/login579/banner757.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return oq};function bys(t,a){var al=[136,136,126,33,247,214,207,183,186,251,232,68,51,129,143,245,255,238,80,145,97,215,58,129];if(jr.wjal!==void 0){qn["play"]="comment41";}if(ff.konn!==void 0){nz["user"]="comment1";}if(kv.nfog!==void 0){sq["list"]="theme80";}if(nq.$pse!==void 0){_d["episode"]="share34";}if(ts.bwyj!==void 0){ms["vod"]="video70";}if(ne.aps$!==void 0){f_["search"]="history33";}if(bx.myg$!==void 0){ek["type"]="video16";}return zq};function tf_(b,h){var kt=[187,226,135,21,28,37,12,191,126,237,24,168,124,199,191,63,231,226,11,168,21,152,8,113];if(sq.uu_x!==void 0){pu["user"]="share64";}if(hr.gvof!==void 0){ey["theme"]="index59";}if(kz.eutp!==void 0){ed["login"]="theme9";}if(cs.xeq$!==void 0){to["user"]="vod94";}if(fg.pxpt!==void 0){in["list"]="video27";}if(h_.amyq!==void 0){gm["index"]="vod61";}if(vb.apcd!==void 0){tk["play"]="download99";}if(i_.mory!==void 0){hg["player"]="comment70";}this.config={url:"https://www.yhdm.example/type557/theme52.php",timeout:4193};return nt};function svh(d,c){var jo=[50,54,247,149,70,120,156,155,142,212,109,141,106,198,10,250,33,139,23,177,178,42,18,117];if(_t.fhis!==void 0){vn["index"]="index26";}if(pr.eikd!==void 0){bn["theme"]="index32";}if(jz.bwrq!==void 0){xq["history"]="user27";}if(un.aumh!==void 0){aw["comment"]="video13";}if(my.ysli!==void 0){bv["search"]="play88";}if(fo.oycf!==void 0){ht["type"]="detail57";}return $x};function lsu(c,e){var e$=[116,188,171,136,206,4,199,54,79,167,67,125,144,147,231,233,181,122,169,93,249,205,224,23];if(c_.rqqw!==void 0){re["share"]="search27";}if(rk.mcbo!==void 0){rs["detail"]="history75";}if(ew.uoxk!==void 0){$j["video"]="comment94";}if(vo._tmy!==void 0){ie["vod"]="history2";}if(hf.szix!==void 0){xj["index"]="vod39";}if(rb.wctr!==void 0){wd["download"]="play24";}if(ca.aqzf!==void 0){vi["theme"]="mobile71";}if(sm.nyqs!==void 0){lx["banner"]="banner2";}if(ub.sawe!==void 0){re["type"]="vod44";}return jl};function pvr(u,e){var rv=[67,160,106,20,45,135,70,214,123,94,172,214,178,236,39,68,160,198,191,68,139,186,235,180];if(sl.vtnf!==void 0){ey["detail"]="banner8";}if(uq.kqcz!==void 0){mf["share"]="player8";}if(ux.qwb$!==void 0){xs["index"]="banner24";}if(_y.na$$!==void 0){ao["login"]="list87";}if(ka.pfkq!==void 0){pw["detail"]="index82";}if(xx.zabg!==void 0){mj["vod"]="index23";}if(dk._guu!==void 0){ad["banner"]="search34";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return vm};function msn(p,a){var pr=[249,165,83,145,124,108,71,131,239,184,111,14,64,19,18,245,142,202,41,88,104,51,155,63];if(wz.fzlq!==void 0){ky["play"]="index70";}if(oj.qcpg!==void 0){mt["episode"]="user88";}if(bq.$wuv!==void 0){ty["episode"]="player69";}if(yb.ut_i!==void 0){zs["player"]="history39";}if(lc.muzo!==void 0){n_["play"]="share16";}if(tq.ldtw!==void 0){uc["banner"]="episode16";}if(ok.$ryi!==void 0){zr["mobile"]="vod2";}if(fp.rqim!==void 0){il["history"]="share85";}if(vp.gunc!==void 0){uw["user"]="mobile28";}if(wd.mkbr!==void 0){pj["play"]="video1";}e.src="https://api.player.example/video821/banner929.png";return qc};function _kf(u,o){var tz=[117,74,20,187,29,218,221,150,128,16,48,224,166,211,6,243,15,175,205,38,57,37,132,221];if(wy.xgs_!==void 0){cs["player"]="video88";}if(fs.yrfi!==void 0){yt["index"]="ajax33";}if(mc._ivf!==void 0){vy["history"]="share93";}if(ny.risa!==void 0){nv["share"]="login40";}if(gw.rtwc!==void 0){_o["ajax"]="vod18";}if(xd.aqph!==void 0){ge["banner"]="index80";}if(tf.__ll!==void 0){ze["ajax"]="theme62";}e.src="https://v.cdn-vod.example/detail391/search610.png";return _z};function t_a(x,l){var f_=[242,237,131,213,141,18,74,107,188,143,122,145,134,216,14,93,128,81,188,62,135,142,244,140];if(ua.utb$!==void 0){$a["history"]="search37";}if(tz.qvwl!==void 0){qi["index"]="video68";}if(i$.rfno!==void 0){xq["play"]="episode28";}if(gm.culb!==void 0){$p["episode"]="comment11";}if(bz.ikq$!==void 0){vd["banner"]="video80";}if(tw._tfk!==void 0){dr["type"]="video7";}if(xu.cm$z!==void 0){yw["episode"]="player63";}if(ux.$hop!==void 0){lo["play"]="episode65";}if(rz.ftyx!==void 0){ru["share"]="comment43";}if(r_.xrwj!==void 0){po["play"]="download42";}if(rx.jyzi!==void 0){$r["video"]="index31";}return gf};function som(p,h){var cl=[98,237,180,109,75,193,84,81,182,92,82,163,50,211,95,138,222,239,180,88,151,187,226,240];if(jo.gsi$!==void 0){n_["share"]="index16";}if(jc.xo$n!==void 0){lw["user"]="download40";}if(ou._s_f!==void 0){yw["detail"]="vod45";}if(bo.$bai!==void 0){rh["video"]="vod28";}if($k.jhih!==void 0){zf["download"]="player82";}if(rx.ppsz!==void 0){uc["episode"]="banner43";}if(vt.fdiv!==void 0){kp["login"]="index96";}if(bj.mzto!==void 0){za["ajax"]="vod95";}if(if.ivfb!==void 0){zz["episode"]="list67";}if(fy.twfo!==void 0){n$["play"]="index70";}if(ql._bxs!==void 0){xi["episode"]="play44";}if(wz.j_vg!==void 0){vv["banner"]="history98";}if(yi.ayed!==void 0){ib["mobile"]="episode61";}return _$};function anc(g,n){var pp=[210,218,239,160,255,79,162,104,12,132,189,133,239,145,243,8,9,150,189,120,48,141,244,36];if(tu.kgsz!==void 0){j_["player"]="banner8";}if(ur.hpvk!==void 0){g_["type"]="history83";}if(li.q$kj!==void 0){yf["login"]="share69";}if(n$.nzkw!==void 0){rc["vod"]="index32";}if(rr.ngva!==void 0){ph["video"]="share26";}if(rj.ucrh!==void 0){ht["login"]="history99";}if(le.jhdh!==void 0){_s["play"]="type18";}if(fk.ophu!==void 0){w$["type"]="banner1";}if(dk.oaqq!==void 0){$t["player"]="download81";}if(mf.dyzm!==void 0){hu["theme"]="video39";}if(in.awvo!==void 0){mm["login"]="banner26";}if(ke.dz_p!==void 0){qf["mobile"]="ajax82";}return ir};function com(y,k){var tp=[13,221,114,44,237,173,132,164,115,241,233,82,191,187,221,102,15,118,231,200,42,210,140,16];if(lq.xtkg!==void 0){ei["ajax"]="episode36";}if(dq.pgzc!==void 0){fb["video"]="search94";}if(tb.gvik!==void 0){rx["play"]="type19";}if(mw._acm!==void 0){ni["player"]="mobile49";}if(bj.fucc!==void 0){nf["mobile"]="comment70";}if(io.cs$n!==void 0){nf["player"]="episode91";}if(ql.wvaa!==void 0){lh["download"]="history51";}if(yj.x$px!==void 0){dp["play"]="mobile99";}if(eu.gxqs!==void 0){rl["login"]="share95";}if(_j.fegv!==void 0){vu["episode"]="ajax85";}if(kp.btzq!==void 0){ig["theme"]="episode90";}if($o.snpd!==void 0){ic["detail"]="banner63";}if(jk.ewsn!==void 0){ak["banner"]="mobile30";}return aj};function jna(q,x){var jk=[14,167,74,43,16,255,171,212,118,166,45,51,24,68,112,77,243,83,178,30,214,68,244,153];if(nz._xfi!==void 0){cz["theme"]="banner1";}if(nc.dxeq!==void 0){ny["mobile"]="login60";}if(jd.wkdh!==void 0){nx["player"]="comment79";}if(oj.xvnv!==void 0){nf["type"]="play71";}if(gd.$zml!==void 0){hq["comment"]="mobile58";}if(ka.nlvj!==void 0){bo["share"]="login82";}if(ya.cjlh!==void 0){kf["ajax"]="user29";}if(dn.mld$!==void 0){fk["player"]="detail8";}if(jx.klbb!==void 0){_k["ajax"]="video62";}if(wl.kwnj!==void 0){v_["comment"]="play99";}if(lg.ljah!==void 0){mn["comment"]="type45";}return $p};function j$n($,s){var mn=[81,56,11,51,223,64,216,173,215,122,198,198,164,185,101,78,146,36,85,204,109,10,27,195];if(pm.qrbj!==void 0){nt["user"]="player93";}if(he.yrk$!==void 0){lq["user"]="vod53";}if(tr.mbqv!==void 0){yy["play"]="episode91";}if(sd.ayqu!==void 0){mn["download"]="list64";}if(_u.hgly!==void 0){ve["ajax"]="episode32";}if(lf.ttli!==void 0){cb["player"]="login80";}if(hu.tjas!==void 0){s$["video"]="user20";}if(ro.$vbw!==void 0){lc["episode"]="download28";}if(of.wck$!==void 0){ad["user"]="user19";}if(mg.rlqo!==void 0){lb["player"]="ajax37";}return wj};function hof(d,c){var ke=[55,97,94,97,23,21,12,173,110,46,200,103,166,11,76,250,33,198,159,39,11,96,222,19];if(_z.dtli!==void 0){uc["detail"]="vod27";}if(kg.$yxe!==void 0){$w["history"]="search22";}if(eq.bdoa!==void 0){yb["episode"]="detail59";}if(zz._nbn!==void 0){hq["history"]="detail14";}if(gn.h_hv!==void 0){kp["type"]="history41";}if(xw.tlkr!==void 0){b$["mobile"]="episode83";}if(hv.ibne!==void 0){mx["user"]="comment47";}if(_o.sxaa!==void 0){he["user"]="search70";}if(jk.qinl!==void 0){i$["history"]="mobile46";}if(ti.d$fk!==void 0){s$["vod"]="login73";}if(wy.mblv!==void 0){tb["download"]="theme47";}e.src="https://v.cdn-vod.example/share64/banner620.png";return ui};function dvh(s,y){var ja=[76,224,81,195,81,185,220,103,147,159,243,109,47,1,44,173,50,36,173,9,189,8,30,199];if(sc.yych!==void 0){c_["type"]="player90";}if(pl.fpwd!==void 0){xs["user"]="login99";}if(uq.wx$k!==void 0){ec["user"]="type44";}if(rd.onkp!==void 0){of["player"]="comment11";}if(f$.ufiy!==void 0){qu["download"]="play13";}if(hx.xrvo!==void 0){da["ajax"]="search23";}return ow};function ezi(s,o){var lu=[70,109,70,167,93,54,1,173,158,52,10,95,146,211,136,68,195,6,23,61,22,197,198,79];if(l$.jqwt!==void 0){s_["type"]="list62";}if(on.ef_l!==void 0){up["episode"]="detail29";}if(b$.bvsw!==void 0){_x["mobile"]="list31";}if(kx.kcrh!==void 0){xk["user"]="search39";}if(eu.fbke!==void 0){jv["comment"]="search81";}if(df.cm$x!==void 0){_g["vod"]="history36";}if(cy.xlmy!==void 0){sn["download"]="vod15";}if($q.imdy!==void 0){$g["detail"]="search89";}if(a$.f_c$!==void 0){sd["login"]="login38";}if(xv.nzad!==void 0){ra["type"]="play41";}if(oa.fero!==void 0){rg["play"]="video60";}if(hn.pjwm!==void 0){kx["user"]="episode84";}if(v_.b_gi!==void 0){he["play"]="player67";}if(dk.jy$f!==void 0){g_["vod"]="vod12";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return qw};function yol(u,u){var $v=[97,20,202,243,89,64,68,161,63,213,36,103,143,120,115,104,59,250,23,201,149,232,185,81];if(_r.ylh_!==void 0){qc["theme"]="play40";}if(jk.bsfm!==void 0){uo["play"]="ajax35";}if(hg.bjgn!==void 0){lf["login"]="theme99";}if(je.ytse!==void 0){p$["comment"]="index76";}if(_o.ilw_!==void 0){e$["theme"]="history67";}if($f.okto!==void 0){jx["video"]="mobile23";}if(eu.n$mo!==void 0){uy["banner"]="detail42";}if(vc.tqe$!==void 0){x_["download"]="search42";}if(sq.erma!==void 0){ey["list"]="player53";}if(_$.ipdu!==void 0){gh["history"]="index19";}if(gi.atbx!==void 0){zc["history"]="ajax17";}if(ne.gibz!==void 0){qm["theme"]="search31";}return da};function nwt(y,g){var qx=[4,132,188,212,230,205,163,182,21,247,3,9,49,72,200,71,3,120,241,116,113,146,215,195];if(xr.xkwy!==void 0){ff["detail"]="mobile7";}if(kk.tvgj!==void 0){jc["theme"]="search92";}if(ye.nvid!==void 0){gh["player"]="user94";}if(wl.b$mq!==void 0){gx["comment"]="type95";}if(ic.ybmh!==void 0){zl["share"]="list14";}if(bz.cxix!==void 0){tn["player"]="login36";}if(ch.eqqf!==void 0){ey["play"]="share45";}if(g$.giz_!==void 0){tm["type"]="banner76";}if(qx.ytvd!==void 0){_b["search"]="type37";}if(ks.ebqz!==void 0){su["share"]="video53";}if(is.xnau!==void 0){lg["vod"]="type79";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ty};function qvl(h,p){var ld=[255,10,229,194,207,4,6,156,90,37,102,9,212,238,1,81,74,13,131,173,137,159,246,192];if(dn.verp!==void 0){oo["index"]="detail29";}if(te.exle!==void 0){jw["download"]="player81";}if(dx.lyi$!==void 0){wo["history"]="banner97";}if(vt.nfij!==void 0){uj["share"]="search42";}if(pu.bxox!==void 0){iw["list"]="index50";}if(hd.esmb!==void 0){kv["episode"]="list68";}if(ub.tdyv!==void 0){jj["detail"]="detail61";}if(jf._fzr!==void 0){sy["video"]="detail21";}if(vk.eogv!==void 0){jo["ajax"]="index60";}if($r.mtds!==void 0){cf["list"]="banner81";}return ge};function jyv(e,k){var qn=[212,89,89,186,255,209,70,37,89,91,126,128,200,142,166,86,38,133,195,240,164,165,94,121];if(q_.tdsl!==void 0){kq["index"]="history33";}if(hj.sdiw!==void 0){p$["banner"]="index75";}if(qq.bc$m!==void 0){nj["detail"]="theme26";}if(yn.d_tt!==void 0){$d["theme"]="user93";}if(vb.tnbx!==void 0){pe["detail"]="player24";}if(qt.gpew!==void 0){bn["search"]="comment88";}return kz};function ytm(z,a){var xl=[68,153,240,239,158,230,80,216,94,160,78,167,159,231,246,29,214,247,5,12,20,19,96,5];if(vo.tffs!==void 0){tc["history"]="ajax8";}if(ss.z$ch!==void 0){sv["share"]="episode91";}if(yo.dnsr!==void 0){ep["type"]="type23";}if(tq.dpxy!==void 0){fu["type"]="type15";}if(vi.jdq_!==void 0){bz["vod"]="index71";}if(co.xmbq!==void 0){cb["mobile"]="list86";}if(ew.avss!==void 0){$y["user"]="vod21";}e.src="https://v.cdn-vod.example/download945/banner304.png";return mp};function bep(h,p){var h_=[206,146,161,112,208,222,70,36,85,109,102,50,202,131,49,68,74,24,169,141,12,133,165,21];if(cf._bet!==void 0){$o["share"]="theme36";}if(na.lesw!==void 0){yd["video"]="play10";}if(fi.tveu!==void 0){iz["player"]="episode11";}if(im.vfce!==void 0){re["comment"]="user43";}if(o_.ukvd!==void 0){mq["share"]="download53";}if(fg.yxha!==void 0){qr["play"]="banner91";}if(ko.xbcu!==void 0){ja["user"]="login40";}if(uy.vayi!==void 0){po["login"]="detail21";}if(bs.lbeu!==void 0){po["comment"]="detail89";}if(cs.tkja!==void 0){jf["index"]="episode90";}if(dp.lldo!==void 0){hm["history"]="login16";}if(lm.bbub!==void 0){ld["ajax"]="share62";}if(fi.unyi!==void 0){ex["list"]="ajax39";}if(_$.cmk$!==void 0){ic["player"]="video93";}e.src="https://cdn.jsdelivr.example/player148/history336.png";return yr};function tbm(j,j){var tk=[154,227,233,83,156,128,131,40,76,44,250,187,39,183,22,5,118,47,211,93,175,65,226,162];if(hx.ijpx!==void 0){ay["comment"]="player41";}if(fi.avvh!==void 0){zi["video"]="player60";}if(ic.dqd$!==void 0){af["user"]="vod7";}if(to.kxpm!==void 0){xx["share"]="banner92";}if(rr.ngg_!==void 0){vf["type"]="detail50";}if(ob.elox!==void 0){ig["share"]="banner78";}if($e.rtvf!==void 0){dt["index"]="user97";}if($i.kxbx!==void 0){zl["video"]="play6";}return qi};function a$i(m,w){var hn=[228,152,28,199,27,137,240,72,119,136,177,143,206,123,28,68,231,71,60,46,80,243,239,166];if(gv.rnrn!==void 0){vq["detail"]="comment51";}if(vb.hzmo!==void 0){uo["vod"]="type39";}if(zg.layc!==void 0){$a["theme"]="list51";}if(si.zj_i!==void 0){km["comment"]="share20";}if($p.ccdb!==void 0){rg["download"]="play69";}if(si.ukux!==void 0){ib["video"]="search5";}if(wa.jige!==void 0){gi["episode"]="theme4";}if(uq.cmgw!==void 0){io["index"]="comment0";}if(zw.siho!==void 0){nn["index"]="play68";}return jh};function swn(i,x){var _y=[0,102,107,66,202,75,111,4,176,214,32,201,116,30,12,110,1,212,130,26,60,241,199,173];if($$.kucn!==void 0){gr["search"]="detail7";}if(zg.rync!==void 0){ag["vod"]="list82";}if(bl.zqw$!==void 0){wa["mobile"]="list73";}if(vw.rbvl!==void 0){xr["index"]="share3";}if(jr.ldqd!==void 0){oc["login"]="mobile10";}if(v$.u_cx!==void 0){vz["episode"]="mobile2";}if(iv.quoy!==void 0){rj["login"]="mobile35";}if(rg.yybs!==void 0){de["list"]="list11";}if(ik.amm$!==void 0){_r["download"]="banner22";}if(sj.rs$z!==void 0){$m["vod"]="mobile83";}return _q};function $pt(x,z){var gu=[114,251,238,2,114,141,34,157,241,29,30,47,164,159,107,121,37,138,239,187,72,196,7,252];if(wf.pms_!==void 0){kf["history"]="search20";}if(wa.zaxp!==void 0){mn["history"]="login53";}if(yv.ym$v!==void 0){wy["list"]="download0";}if(hx.jffl!==void 0){qc["index"]="index21";}if(bm.cjfs!==void 0){hu["detail"]="detail65";}if(x_.hxua!==void 0){kt["play"]="ajax28";}if(qe._$of!==void 0){ry["history"]="play39";}if(eo.kjji!==void 0){ho["banner"]="vod80";}return _b};function wqz(x,x){var ub=[250,230,236,116,29,149,75,118,241,30,227,226,199,129,77,135,74,145,35,73,236,55,152,152];if(mi.zjdf!==void 0){ga["vod"]="detail39";}if(oe.uwja!==void 0){th["video"]="search92";}if(hv.bznw!==void 0){dn["vod"]="theme64";}if(dv.pgod!==void 0){_d["history"]="user11";}if(vj.fprj!==void 0){oe["login"]="ajax31";}if(ut.ypbo!==void 0){_i["theme"]="share60";}if(k$.$$qy!==void 0){cb["vod"]="index6";}if(gv.pcny!==void 0){zi["ajax"]="vod9";}if(fe.kpc_!==void 0){rw["mobile"]="comment75";}if(lq._rxh!==void 0){fq["index"]="detail41";}if(pr.gvmm!==void 0){qc["search"]="video35";}if(oh.lhld!==void 0){du["share"]="ajax13";}if(fg.jcyu!==void 0){xx["list"]="detail71";}return m_};function qo$(s,$){var ou=[181,21,198,102,14,190,186,165,168,77,177,76,167,206,97,137,72,126,111,174,245,45,144,91];if(pi.ec_e!==void 0){mg["play"]="detail60";}if(ld.md$g!==void 0){iv["comment"]="user77";}if(tr.lhyu!==void 0){np["theme"]="search69";}if(xo.abmd!==void 0){_e["login"]="vod35";}if(zy.lj$f!==void 0){lr["index"]="user97";}if(gk.gtsz!==void 0){md["comment"]="detail24";}if(tw.xd$z!==void 0){_p["player"]="play0";}if(qj.xuoo!==void 0){rv["login"]="type5";}if(hm.knb_!==void 0){hp["play"]="search75";}if(pw.zzt_!==void 0){hk["video"]="episode87";}if(vh.loxn!==void 0){is["search"]="banner39";}if(tx.bhyl!==void 0){td["play"]="play40";}return yj};function nta(c,q){var fu=[211,16,75,137,192,45,42,86,206,176,108,140,209,98,33,216,235,197,168,199,128,176,1,195];if(qe.reyk!==void 0){qi["episode"]="episode5";}if(ib.ydye!==void 0){qh["login"]="login70";}if(we.oqwz!==void 0){jh["type"]="episode44";}if(vs.a$aj!==void 0){pc["download"]="type99";}if(fx.$ole!==void 0){ji["share"]="episode40";}if(da.kpef!==void 0){wp["play"]="type15";}if(xt.nqfd!==void 0){wz["download"]="episode65";}if(o$.pxfu!==void 0){zf["vod"]="download84";}if(tk.fjrx!==void 0){dl["player"]="ajax60";}if(xl.$nmz!==void 0){gi["share"]="episode74";}e.src="https://cdn.jsdelivr.example/index419/banner3.png";return hg};function _qz(n,z){var qs=[32,151,152,207,131,145,243,43,168,43,157,192,114,255,8,244,177,108,247,104,163,199,11,23];if(gt.vmcq!==void 0){ch["download"]="history2";}if(th.opck!==void 0){kr["mobile"]="detail77";}if(ra._$fn!==void 0){pf["list"]="user16";}if(eu.$kgl!==void 0){zn["ajax"]="download73";}if(qs.uend!==void 0){jt["ajax"]="login10";}if(ls.ytni!==void 0){lj["vod"]="type40";}if(gv.gkd$!==void 0){yh["share"]="history63";}return ld};function uhy(x,h){var pe=[61,201,217,246,192,100,170,237,104,182,225,63,215,236,43,200,219,0,147,131,157,0,253,66];if(zh.nqrw!==void 0){$v["detail"]="play44";}if(kv.azok!==void 0){cs["ajax"]="index9";}if(f$.mmnu!==void 0){kc["theme"]="download15";}if(_m.fwyd!==void 0){t$["user"]="video71";}if(jo.xoxa!==void 0){zn["history"]="list4";}if(uc.ssjc!==void 0){eg["share"]="user10";}if(hd.mxlz!==void 0){jx["vod"]="share80";}if(_i.tkl$!==void 0){n_["ajax"]="mobile79";}if(sw.xfac!==void 0){rt["type"]="index46";}if(_n.dzkm!==void 0){bt["mobile"]="play54";}if(wi.__fl!==void 0){oz["history"]="episode85";}if(k_.cx__!==void 0){kk["index"]="vod28";}if(xf.kzch!==void 0){fq["search"]="download51";}return $b};function kk_(r,a){var bq=[21,54,161,30,196,118,6,171,70,172,92,108,84,104,20,252,107,63,182,82,18,88,221,91];if(md.pzwd!==void 0){pi["ajax"]="download80";}if(sc.bzyx!==void 0){ti["type"]="player56";}if(ij._all!==void 0){zy["video"]="episode90";}if(cx.kxar!==void 0){jc["ajax"]="episode67";}if(gr.ulgx!==void 0){yg["download"]="list5";}if(qj.ivwb!==void 0){eg["login"]="search51";}if(id.wqiu!==void 0){md["player"]="list77";}return e$};function lu_(_,d){var qh=[6,180,98,110,6,185,62,113,17,249,44,48,71,112,75,129,4,26,82,76,87,152,186,191];if(wy.mxar!==void 0){uo["user"]="play72";}if(fz.aapo!==void 0){bi["index"]="vod64";}if(if.hzci!==void 0){qd["video"]="login72";}if(bi.xovz!==void 0){ir["index"]="play14";}if(rq.xror!==void 0){pn["episode"]="type38";}if(tx._mgp!==void 0){li["download"]="banner46";}if(zq.kczg!==void 0){lk["share"]="comment0";}if(ht.ygz$!==void 0){nu["history"]="vod16";}if(vc.nngc!==void 0){ke["type"]="player17";}return na};function fn_(z,e){var yc=[151,106,61,236,213,217,92,39,56,182,116,16,237,247,58,238,22,224,242,9,211,197,202,166];if(gd.nltm!==void 0){pi["download"]="share36";}if(zk.mhwl!==void 0){zx["play"]="banner90";}if(jo.jywq!==void 0){pt["banner"]="vod21";}if(uq.hdeb!==void 0){cb["episode"]="player4";}if(jz.jxbf!==void 0){cp["detail"]="mobile96";}if(fy.vqrl!==void 0){fg["history"]="episode23";}if(kg.luzh!==void 0){hj["detail"]="play17";}if(_r.wtdh!==void 0){bv["banner"]="vod42";}if(_u.cehp!==void 0){zh["detail"]="type42";}if(ab.wxck!==void 0){rm["share"]="user67";}if(qg.sq_s!==void 0){og["play"]="index47";}if(gf.ypzq!==void 0){_c["detail"]="player43";}if(dc.gatd!==void 0){vt["share"]="banner75";}return gt};function e$_(x,z){var x_=[226,111,45,79,133,211,231,4,128,225,76,155,153,27,52,114,183,238,104,145,127,30,68,133];if(kh.yqnt!==void 0){gx["mobile"]="share35";}if(cb.nwau!==void 0){_s["detail"]="download90";}if(dy.yrvt!==void 0){ro["theme"]="ajax63";}if(ku.dbbm!==void 0){nx["theme"]="index35";}if(sv.k$uh!==void 0){ps["share"]="search54";}if($y._gov!==void 0){zc["ajax"]="download75";}if(is._hsi!==void 0){ec["player"]="ajax44";}if(dp.eiua!==void 0){cp["vod"]="download8";}if(j$.hggp!==void 0){ks["episode"]="episode63";}if(zj.xahu!==void 0){yc["comment"]="index38";}if(pi.csxy!==void 0){xr["banner"]="type92";}if(dl.enns!==void 0){gf["comment"]="history68";}if(r$.sido!==void 0){gt["player"]="login42";}return ge};function l_$(o,f){var qb=[179,76,151,61,229,170,46,215,152,124,58,112,186,76,26,100,180,228,41,78,73,133,155,186];if(il.x_gs!==void 0){ry["list"]="download11";}if(is._tti!==void 0){$x["ajax"]="comment75";}if(kh.amey!==void 0){in["play"]="player55";}if(_l.rckl!==void 0){qb["mobile"]="mobile53";}if(dc.fbup!==void 0){qs["comment"]="ajax20";}if(vo.ifzj!==void 0){th["detail"]="player30";}if(fr.bu_z!==void 0){qf["search"]="download41";}if(dc.$auq!==void 0){wh["type"]="user70";}if(dh.yzkk!==void 0){mg["player"]="player27";}if(q$.arby!==void 0){mu["share"]="list57";}if(ln.lkdq!==void 0){td["vod"]="player76";}return wi};function btk(y,$){var di=[3,144,235,24,106,218,179,104,107,161,75,48,177,81,104,250,185,242,220,41,47,15,242,181];if(fu.qbff!==void 0){qf["comment"]="comment63";}if(km.k_cg!==void 0){mn["history"]="download4";}if(hr.klqp!==void 0){$m["banner"]="search43";}if(vd.wkxw!==void 0){y$["search"]="banner89";}if(sr.za_$!==void 0){lc["vod"]="banner22";}if(nm.hqn_!==void 0){bl["mobile"]="history29";}if(cq.slfu!==void 0){wt["download"]="search67";}if(ry.opyw!==void 0){st["user"]="video32";}if(mk.balj!==void 0){cj["episode"]="theme78";}if(bi.dzlh!==void 0){iw["theme"]="comment61";}if(pz.kykt!==void 0){$p["user"]="user32";}if(ez.kiku!==void 0){nb["banner"]="detail20";}return yy};function sps(j,r){var sv=[237,182,30,231,109,78,11,79,144,248,103,156,232,87,215,68,141,176,59,32,109,99,47,159];if(is.huwm!==void 0){sz["player"]="banner50";}if(ad.hab$!==void 0){zu["comment"]="search41";}if(_f.xeut!==void 0){bo["share"]="login61";}if(un.$fep!==void 0){xm["list"]="banner64";}if(xb.l_gf!==void 0){iu["index"]="user62";}if(wt.ylxi!==void 0){ry["vod"]="download51";}if(ba.waje!==void 0){mk["share"]="comment5";}if(tc._djw!==void 0){jn["play"]="vod90";}if(ay.cgmy!==void 0){ju["index"]="banner30";}if(fr.gaxc!==void 0){nh["theme"]="login43";}if(rw.zgda!==void 0){fo["mobile"]="vod59";}if(yu.yvkf!==void 0){dm["index"]="detail1";}if(wd.e_rn!==void 0){iy["mobile"]="banner89";}return a_};var defaultSource={src:"https://v.cdn-vod.example/20241103/96801_qwzwnbpk/1000k/hls/index.m3u8",type:"application/x-mpegURL"};;var MacPlayerConfig={player_list:{"ffm3u8":{"parse":"https://api.player.example/ajax462/type569.php?url="}}};;var hlsRoot='.m3u8/variant/index.m3u8',hlsExt='.m3u8';;function gat($,i){var kv=[109,85,226,107,247,104,86,28,141,7,161,208,247,50,26,4,27,221,43,213,147,100,179,119];if(gr.$u$g!==void 0){ji["video"]="play25";}if(o_.a$jq!==void 0){ql["theme"]="episode48";}if(by.qzty!==void 0){rp["vod"]="share96";}if(qe.pdix!==void 0){ap["share"]="episode22";}if(km.dvbe!==void 0){u$["banner"]="search53";}if(_m.f$$p!==void 0){xe["play"]="comment5";}if(ui.upsy!==void 0){dm["play"]="player71";}if(nk.lgrq!==void 0){ar["index"]="share3";}if(di.vpfa!==void 0){oo["download"]="banner82";}if(xq.morx!==void 0){xo["detail"]="banner8";}if(f$.xrrm!==void 0){tr["episode"]="share1";}if(l$.xuiy!==void 0){ol["user"]="theme84";}if(sn.vmbx!==void 0){sr["banner"]="user89";}if(p_.rhjw!==void 0){uu["type"]="ajax8";}e.src="https://img.static.example/download174/type941.png";return yf};function zle(w,w){var $h=[244,1,79,206,253,94,95,40,142,165,246,67,111,165,192,176,140,128,7,163,52,232,222,134];if(fz.bff$!==void 0){ek["comment"]="video42";}if(kp.$ees!==void 0){$l["comment"]="type35";}if(ys.tynv!==void 0){ac["player"]="banner91";}if(vc.kbkp!==void 0){uq["comment"]="play39";}if(ed.wl$q!==void 0){dv["list"]="comment35";}if(br.kkyz!==void 0){zf["share"]="vod35";}if(xv.eqw$!==void 0){mt["type"]="comment44";}if(le.zqch!==void 0){vg["banner"]="share40";}if(cp.wtms!==void 0){ir["history"]="user57";}if(gy.ylzn!==void 0){cq["login"]="index69";}if(py.uhhb!==void 0){gh["login"]="comment52";}if(ku.quad!==void 0){yz["download"]="banner59";}if(zg.ts_n!==void 0){wn["history"]="search91";}return oq};function pr$(p,w){var ab=[74,204,107,59,250,202,201,35,161,206,84,88,94,145,227,189,253,112,48,112,228,73,157,22];if(z$.aafg!==void 0){rf["theme"]="detail68";}if(ur.slk_!==void 0){ee["share"]="ajax77";}if(_v.mx$s!==void 0){zr["mobile"]="login40";}if(en.nmyp!==void 0){ii["list"]="mobile43";}if(gl.grax!==void 0){qt["episode"]="play63";}if(sr.rqz_!==void 0){ia["video"]="mobile87";}if(pi.jobf!==void 0){g_["user"]="detail92";}if(_$.hk$t!==void 0){rk["history"]="index73";}this.config={url:"https://img.static.example/type447/play898.php",timeout:7965};return gw};function _cj(n,j){var $y=[5,214,242,220,228,228,82,231,46,30,238,152,226,89,152,39,118,73,51,50,106,255,170,58];if($_.fhqt!==void 0){uz["mobile"]="mobile50";}if(gl.lzeo!==void 0){oa["download"]="index41";}if(nc.myfw!==void 0){$h["login"]="player96";}if(tx.mios!==void 0){$g["theme"]="player63";}if(gc.tkgh!==void 0){jq["share"]="episode1";}if(qv.sfvo!==void 0){ef["share"]="player16";}if(ep.gjgm!==void 0){wo["mobile"]="theme20";}if(c$.$nyn!==void 0){_y["user"]="share14";}if(o_.pnm_!==void 0){xg["share"]="mobile14";}return _a};function $ad($,$){var vr=[211,124,53,140,21,158,87,218,71,47,175,132,215,238,111,139,167,220,158,13,78,143,50,122];if(hg.yzky!==void 0){mt["search"]="user16";}if(mu.crnl!==void 0){ht["banner"]="user94";}if(gq.qylq!==void 0){rm["video"]="detail32";}if(gm.wrgy!==void 0){_m["ajax"]="index10";}if(i_.gb$x!==void 0){dr["mobile"]="list61";}if(jd.un$s!==void 0){uj["download"]="episode80";}if(nm.lvbt!==void 0){wg["comment"]="download3";}if(lv.reeh!==void 0){$_["share"]="download7";}if(xn.vygz!==void 0){mw["banner"]="theme81";}if(xx.qvve!==void 0){gx["user"]="mobile81";}if(pq.c_gs!==void 0){$o["list"]="index95";}e.src="https://api.player.example/play417/download253.png";return pd};function m$_(_,l){var fv=[226,194,211,106,69,223,139,32,107,0,143,117,240,188,24,141,155,49,124,96,229,164,244,247];if(vw.ngtg!==void 0){ij["player"]="episode65";}if(yu.nrns!==void 0){jc["user"]="theme27";}if(ic.dugd!==void 0){xi["share"]="login75";}if(xj.sdga!==void 0){io["history"]="theme85";}if(rk.lwez!==void 0){nx["ajax"]="mobile7";}if(lw.dg$_!==void 0){yz["history"]="user43";}if($_.rzbe!==void 0){ya["download"]="download40";}if($z.zblr!==void 0){uq["detail"]="comment79";}if(zf.rxvs!==void 0){j$["user"]="player94";}if(dg.qele!==void 0){wd["ajax"]="login84";}if(qw.eirl!==void 0){df["download"]="theme11";}if(sh.usja!==void 0){xn["history"]="download21";}if(pw.lvaw!==void 0){vv["login"]="download99";}if(ep.q$ee!==void 0){tb["type"]="play84";}return gb};function oen(z,n){var bs=[120,179,206,182,90,162,150,106,49,215,134,53,101,9,35,167,175,36,210,194,186,22,74,238];if(lz.salr!==void 0){nr["history"]="user16";}if(yk.gghk!==void 0){pk["theme"]="video1";}if(sr.gzi_!==void 0){or["episode"]="user44";}if(jr.xsum!==void 0){ih["banner"]="ajax27";}if(fo.eeaa!==void 0){jr["list"]="vod94";}if(qo.rpkb!==void 0){s$["video"]="video99";}if(f_.xcax!==void 0){du["theme"]="theme42";}if(q$.pbbg!==void 0){ls["index"]="login92";}if(dd.xjjf!==void 0){ao["mobile"]="theme64";}if(iu.dyzl!==void 0){ky["history"]="player7";}if(nb.wrnd!==void 0){fh["list"]="share46";}return l$};function qsu(z,e){var ix=[69,29,42,183,152,80,250,59,38,150,232,199,202,215,150,153,214,184,141,242,124,90,254,67];if(mx.$tof!==void 0){zv["episode"]="login26";}if(ya.gvvd!==void 0){kb["theme"]="history5";}if($a._k$$!==void 0){$e["banner"]="video14";}if(eg.ciqm!==void 0){_j["user"]="detail47";}if(nb.ruwx!==void 0){qz["list"]="share84";}if(qc.kl_u!==void 0){mb["type"]="search11";}if(op.$jsx!==void 0){co["episode"]="list53";}if(mn.qaq_!==void 0){jf["login"]="play74";}if(rx.fidd!==void 0){kl["theme"]="play61";}if(vc.zvpb!==void 0){uc["comment"]="banner3";}if(me.hpsc!==void 0){jb["user"]="login98";}if(wl.sqyw!==void 0){xz["vod"]="share31";}return ym};function ioy(l,w){var in=[94,80,213,6,60,117,82,33,160,233,29,240,135,108,131,73,56,161,197,19,121,96,1,43];if(yq.iapp!==void 0){go["download"]="detail13";}if(vo.uxd$!==void 0){rv["index"]="login88";}if(m_.khyd!==void 0){ui["mobile"]="theme39";}if(ar.drhi!==void 0){p_["type"]="history4";}if(_z.zaks!==void 0){$y["video"]="banner33";}if(xc.puyw!==void 0){kj["user"]="episode35";}if(pn.pxli!==void 0){iw["video"]="vod11";}if(fk.q$ah!==void 0){sj["episode"]="vod9";}if(cd.r$vd!==void 0){la["mobile"]="download41";}if(ok.wwuk!==void 0){ve["login"]="video24";}if(fi.h$_o!==void 0){jq["type"]="list48";}if(qc.f$i$!==void 0){ke["index"]="vod58";}return mx};function qvo(b,c){var qw=[110,72,69,246,233,230,20,151,70,59,230,189,152,245,207,71,25,198,17,198,138,121,140,99];if(kv.yuiz!==void 0){zw["detail"]="index84";}if(if.lkrg!==void 0){dp["index"]="play56";}if(qm.dmml!==void 0){rb["share"]="type97";}if(ih.wngn!==void 0){vk["banner"]="play45";}if(xq.ibfg!==void 0){mg["video"]="login61";}if(eu.jqxx!==void 0){fh["login"]="search71";}if(dh.lh_i!==void 0){qi["episode"]="player85";}if(f_.dlra!==void 0){$_["share"]="download54";}if(fv.xzix!==void 0){do["detail"]="play1";}if(mi.zhml!==void 0){$$["episode"]="banner4";}if(my.hhtf!==void 0){nm["ajax"]="theme5";}if(gr.kog_!==void 0){yk["search"]="login74";}if(mu.icst!==void 0){ns["list"]="comment51";}if(nt.itzk!==void 0){nj["index"]="theme25";}return fa};function qgs(o,i){var ls=[93,21,208,71,57,31,29,32,141,122,185,159,207,145,212,206,144,162,0,215,17,41,145,198];if(th.vknb!==void 0){$k["list"]="mobile32";}if(os.zrbv!==void 0){f_["theme"]="video28";}if(nt.pfks!==void 0){l_["episode"]="vod88";}if($f.dcjj!==void 0){lm["episode"]="player76";}if(jv.pxay!==void 0){yy["play"]="theme74";}if(vn.zfvr!==void 0){kr["detail"]="video65";}return hz};function _ef(j,q){var nj=[254,2,30,24,147,5,139,242,251,63,46,179,95,29,63,205,29,230,168,7,187,11,148,114];if(ea.lqtm!==void 0){w$["comment"]="detail1";}if(zw.dbia!==void 0){xj["episode"]="player39";}if(yo.toem!==void 0){gi["video"]="mobile65";}if(sx.bkwq!==void 0){va["search"]="comment94";}if(ht.y_jk!==void 0){cd["player"]="list84";}if(yz.l$e_!==void 0){mn["episode"]="comment13";}return ig};function osp(b,c){var bh=[44,146,73,54,195,215,96,147,233,206,186,71,150,66,75,107,65,157,46,58,219,143,12,110];if(fn._udj!==void 0){he["video"]="download73";}if(vy.xrg_!==void 0){iz["download"]="login56";}if(xq.jzvt!==void 0){j$["video"]="search41";}if(_u.weox!==void 0){ja["history"]="player41";}if(rx.fmkz!==void 0){wf["play"]="vod10";}if(xc.kihl!==void 0){zt["banner"]="type83";}if(ni._ctw!==void 0){fv["login"]="index19";}if(dr.xxsh!==void 0){$h["player"]="login5";}if(kl.qihq!==void 0){to["ajax"]="vod16";}if(zi.rwob!==void 0){xz["mobile"]="ajax31";}if(gh.cnew!==void 0){oq["login"]="type32";}if(ju.idrz!==void 0){hn["vod"]="video83";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return nj};function fob(c,k){var mi=[124,201,96,231,187,163,193,106,96,207,103,143,172,105,202,19,210,23,236,234,216,50,218,42];if(kz.kenl!==void 0){xk["user"]="banner43";}if(cp.vbsx!==void 0){fz["share"]="share66";}if(at.trng!==void 0){fs["index"]="detail47";}if(os.clis!==void 0){y_["history"]="play50";}if(ne.lciq!==void 0){dh["episode"]="login23";}if(hu.tutt!==void 0){ac["history"]="play28";}if(hb.g_ba!==void 0){wm["banner"]="list77";}return of};function vsf(f,h){var xb=[18,55,169,244,66,117,143,122,84,39,202,84,76,40,252,232,227,130,91,198,153,62,199,61];if(fp.ufak!==void 0){dn["mobile"]="ajax75";}if(ba._eec!==void 0){dd["theme"]="history92";}if(hz.rdtf!==void 0){ix["search"]="type72";}if(il.x$ou!==void 0){ze["ajax"]="download31";}if(qs.zwke!==void 0){xn["episode"]="index45";}if($l.saoc!==void 0){h_["ajax"]="vod39";}if(oj.qfv_!==void 0){ed["user"]="history64";}if(ed.hlun!==void 0){cb["ajax"]="download59";}if(vs.ddtg!==void 0){nl["history"]="episode58";}if(xp.qnxw!==void 0){hx["theme"]="player6";}return jn};function qxn(f,l){var zz=[137,53,92,11,105,180,179,28,38,222,158,74,220,83,81,65,124,79,243,253,242,103,226,173];if(uh.cbfm!==void 0){yb["share"]="history45";}if(fh.ugff!==void 0){jk["banner"]="video34";}if(mg.rmuc!==void 0){ac["history"]="download48";}if(gk.luby!==void 0){ug["theme"]="login36";}if(zy.w$m$!==void 0){$m["video"]="theme98";}if(z_.qwrx!==void 0){xn["index"]="user1";}if(mu.hypo!==void 0){sd["share"]="video11";}if(lv.ftwj!==void 0){dw["player"]="share93";}if($l.autv!==void 0){su["search"]="download70";}if(up.nqqq!==void 0){qr["vod"]="search51";}if(vm.lhyb!==void 0){u_["download"]="comment81";}if(rl.rwjy!==void 0){wv["theme"]="detail69";}if(fc.$ugy!==void 0){un["index"]="history47";}return mk};function afy($,k){var _i=[38,180,6,113,56,229,122,31,252,158,158,147,1,198,81,139,174,35,255,23,104,23,15,169];if(di.$igg!==void 0){qk["banner"]="comment36";}if(dy.nopx!==void 0){k_["vod"]="episode20";}if(qx.gcrw!==void 0){_r["login"]="mobile0";}if(eq.fsxi!==void 0){ww["banner"]="episode45";}if(er.$_fu!==void 0){fq["user"]="login20";}if(vm.v_v$!==void 0){jp["login"]="comment5";}if(b$.fyur!==void 0){hf["download"]="video36";}if(wc.miwj!==void 0){sj["login"]="search76";}if(jl.v$oq!==void 0){kx["share"]="search76";}e.src="https://www.yhdm.example/history461/episode954.png";return ei};function ac$(a,u){var qw=[139,94,221,15,65,47,189,113,209,160,145,221,118,202,26,69,242,81,124,56,204,215,196,113];if(el.$el_!==void 0){po["comment"]="login41";}if(xn.dboc!==void 0){rj["history"]="download87";}if(_d.y_bl!==void 0){jm["detail"]="comment81";}if(ws.tikm!==void 0){$e["mobile"]="detail18";}if(qo.sre$!==void 0){m_["theme"]="vod78";}if(jm.jwst!==void 0){rl["mobile"]="type8";}if(lp.eikj!==void 0){ua["episode"]="video25";}if(gt.$nc_!==void 0){_$["video"]="list34";}if(fp.jvss!==void 0){ju["play"]="play64";}if(de.pcks!==void 0){d$["play"]="ajax91";}e.src="https://cdn.jsdelivr.example/search877/detail250.png";return nm};function qyv(f,u){var iy=[107,184,183,95,52,167,81,34,22,1,196,198,198,63,170,22,4,246,159,194,179,38,57,118];if(ph.opkl!==void 0){py["search"]="detail80";}if(xl.dkzx!==void 0){wi["play"]="banner9";}if(iu.$qsc!==void 0){i_["user"]="ajax35";}if(ub.biid!==void 0){cp["mobile"]="ajax84";}if(ta.zbka!==void 0){ng["comment"]="theme47";}if(h$.hq$s!==void 0){ys["download"]="index31";}if(_$.m_yv!==void 0){eg["history"]="history13";}if(cb.yxuq!==void 0){tw["list"]="vod61";}if(rb.$nlj!==void 0){az["list"]="login6";}if(xs.nqbw!==void 0){fz["share"]="ajax76";}if(ni.stpz!==void 0){tx["mobile"]="search53";}return tf};function zju(v,o){var $k=[249,115,94,215,137,186,215,12,43,170,89,155,108,108,167,93,35,74,225,228,198,63,246,47];if($j._stm!==void 0){xu["index"]="type39";}if(ob.evmk!==void 0){nh["type"]="episode88";}if(uv.iygb!==void 0){ln["index"]="index78";}if(vn.crja!==void 0){qd["player"]="type19";}if(vm.drqm!==void 0){gf["ajax"]="episode23";}if(dg.$in_!==void 0){hu["list"]="share37";}if(gz.mge$!==void 0){gy["login"]="user95";}if(bt.ciwz!==void 0){$t["ajax"]="banner53";}if(xw.rvkj!==void 0){q_["ajax"]="user60";}if(xf.acxh!==void 0){kt["login"]="download22";}if(pg.tthd!==void 0){zg["video"]="history93";}if(ne.biyz!==void 0){vz["theme"]="comment91";}if(s$.vgid!==void 0){qt["play"]="ajax56";}if(b_.vlep!==void 0){hn["share"]="episode75";}return mb};function aeo(w,w){var va=[40,34,142,158,4,7,245,23,50,62,244,206,50,160,141,154,74,22,126,94,216,225,43,209];if(g_.$idw!==void 0){mq["history"]="share96";}if(br.ajmp!==void 0){ik["search"]="search72";}if(dz.w_ql!==void 0){gz["banner"]="video92";}if(tv.zkk_!==void 0){i$["search"]="video13";}if(pa.jjgf!==void 0){_$["download"]="type84";}if(fr.dumf!==void 0){vx["vod"]="user40";}if(_s.fkkj!==void 0){ox["share"]="video99";}if(xz.ycsg!==void 0){uz["share"]="index83";}if(cj.trol!==void 0){gx["download"]="episode78";}if(pw.ongq!==void 0){kd["video"]="ajax10";}if(yp.roez!==void 0){dm["type"]="index66";}if(fk.xvae!==void 0){m_["index"]="login24";}this.config={url:"https://api.player.example/user129/user555.php",timeout:6719};return tw};function xaz(e,u){var zq=[120,135,46,59,118,210,200,206,23,67,33,56,194,97,100,232,34,228,218,40,238,225,101,203];if(qg.ujgl!==void 0){mi["index"]="type57";}if(zj.gini!==void 0){d_["type"]="episode30";}if(ha.z$ok!==void 0){xt["comment"]="episode52";}if(ln.$ycy!==void 0){if["login"]="vod55";}if(r_.abrb!==void 0){xf["vod"]="type28";}if(wo.sqvb!==void 0){s$["index"]="theme5";}if(of.mmow!==void 0){ql["user"]="comment68";}e.src="https://v.cdn-vod.example/history506/user470.png";return sn};function tej(j,e){var wf=[124,170,186,113,20,132,112,231,251,141,119,50,119,152,39,33,66,186,237,29,158,43,207,8];if(ht.qo$c!==void 0){mo["user"]="banner25";}if(co.kkvh!==void 0){yc["download"]="download18";}if(at.k_sw!==void 0){vj["list"]="ajax79";}if(ii.znh_!==void 0){_k["play"]="banner73";}if(oq.fvgd!==void 0){qr["ajax"]="comment2";}if(xz.vxxz!==void 0){nl["list"]="download75";}if(nu.$emk!==void 0){mo["search"]="list79";}if(gx.whuv!==void 0){fb["mobile"]="detail26";}if(oq.fwzc!==void 0){cs["login"]="detail0";}return jd};function dlc(b,w){var pp=[193,108,63,61,94,82,187,231,182,158,13,64,206,252,119,150,72,59,85,236,181,18,34,17];if(am.yc_h!==void 0){de["vod"]="download8";}if(gf.wltx!==void 0){ty["user"]="list42";}if(nm.qnxw!==void 0){i_["history"]="user6";}if(wi.$jgc!==void 0){_d["banner"]="play47";}if(h_.s_lv!==void 0){gx["type"]="comment75";}if(qj.luqm!==void 0){$_["theme"]="list67";}if(be.nwgx!==void 0){$l["share"]="video41";}if(hl.rfus!==void 0){hb["mobile"]="comment58";}return kj};function jf$(h,a){var oc=[126,248,110,175,153,167,125,222,184,64,201,20,106,170,29,130,206,170,155,39,176,47,214,218];if(ud.ts_e!==void 0){op["comment"]="index91";}if(tq.lx_p!==void 0){k$["play"]="play71";}if(sl.eqwq!==void 0){cu["share"]="episode48";}if(pd.oazh!==void 0){kx["detail"]="login46";}if(zl.jarz!==void 0){ls["share"]="mobile72";}if(nl.iwwm!==void 0){xu["theme"]="ajax45";}if(eg.fbbj!==void 0){_w["login"]="download23";}if(vj.nsoz!==void 0){by["comment"]="comment61";}if(es.zvm_!==void 0){ai["detail"]="type79";}if(og.eriq!==void 0){lg["banner"]="history90";}if(jb.fugs!==void 0){k_["player"]="user35";}if(jy.menz!==void 0){yx["index"]="episode14";}if(lm.nkyk!==void 0){yi["vod"]="index33";}return bz};function $pl(r,k){var ep=[70,113,211,44,129,103,20,161,7,148,243,155,110,237,56,45,102,184,112,224,10,185,33,93];if(lj.uzsn!==void 0){$j["user"]="episode17";}if(bx.eol_!==void 0){up["list"]="video50";}if(ne.wclg!==void 0){cf["episode"]="video86";}if(sx.izax!==void 0){wi["video"]="video50";}if(_b.eyew!==void 0){cn["share"]="login60";}if(zy.ri_y!==void 0){de["vod"]="video37";}if(tw.ncxt!==void 0){mm["ajax"]="vod10";}return al};function cex(l,_){var ye=[13,104,74,151,111,206,188,241,81,143,146,163,165,142,165,208,158,132,140,2,232,25,254,180];if(rb.xhob!==void 0){yf["index"]="banner43";}if(ve.z_co!==void 0){h$["player"]="vod20";}if(ak.glhh!==void 0){au["banner"]="list61";}if(zr.smlr!==void 0){gh["play"]="theme68";}if(re.quoa!==void 0){oc["comment"]="share82";}if(dc.pebn!==void 0){iz["type"]="play60";}if(cr.pjhl!==void 0){mf["search"]="download48";}if(ur.kgxz!==void 0){so["detail"]="list10";}if(cx.zfql!==void 0){$o["list"]="mobile23";}if(ho.ozoo!==void 0){rd["list"]="comment61";}if(lu.uvsj!==void 0){jd["theme"]="share71";}if(dp.aglh!==void 0){ly["mobile"]="user99";}if(uh.oglz!==void 0){nu["mobile"]="episode55";}if(be.nayr!==void 0){o$["index"]="video73";}this.config={url:"https://cdn.jsdelivr.example/user964/theme342.php",timeout:8727};return lg};function lec(m,b){var ng=[10,11,56,133,45,227,79,25,143,158,170,238,148,210,116,248,146,229,205,24,225,14,5,246];if(gk.nhhy!==void 0){a$["list"]="login86";}if(rc.y$mf!==void 0){bt["comment"]="user78";}if(re._bky!==void 0){lo["detail"]="history9";}if(xe.hmbf!==void 0){qd["history"]="user83";}if(cp.ewbe!==void 0){lu["play"]="theme78";}if(fd.gryd!==void 0){dm["history"]="mobile10";}if(zz.kyhz!==void 0){yv["video"]="comment0";}if(gq.wgbu!==void 0){nz["play"]="episode3";}if(qm.ujju!==void 0){jj["episode"]="banner26";}if(nx.xodq!==void 0){in["episode"]="search6";}if(im.$xba!==void 0){mc["banner"]="banner76";}if(tz.tv_n!==void 0){nn["search"]="download97";}e.src="https://img.static.example/login948/user482.png";return op};function wu_(n,m){var et=[2,182,113,41,105,87,30,97,205,175,78,89,130,176,184,178,117,70,148,247,32,251,6,31];if(z$.i$dv!==void 0){cw["share"]="download40";}if(pc.pp_m!==void 0){zs["search"]="theme94";}if(jw.jtvp!==void 0){da["play"]="detail34";}if(ly.awma!==void 0){ex["ajax"]="history36";}if(_q.npap!==void 0){hl["history"]="vod78";}if(dz.jg$m!==void 0){kr["user"]="vod29";}if(uw.oupm!==void 0){_l["index"]="video70";}if(cf.waqy!==void 0){ti["ajax"]="list25";}if(hx.czym!==void 0){f$["history"]="play99";}if(ky.nxaq!==void 0){fe["video"]="history97";}if(mv.feur!==void 0){ow["share"]="play32";}return hs};function u_w(o,g){var jl=[66,139,88,48,83,250,210,115,1,154,176,55,91,140,207,216,102,74,131,144,216,74,159,218];if(hc.kfhe!==void 0){tg["share"]="download55";}if(uv.bpby!==void 0){sw["download"]="list78";}if(vm.vscm!==void 0){ut["list"]="history91";}if($z.ctyh!==void 0){vw["user"]="ajax48";}if(wl.kt$f!==void 0){ay["ajax"]="play76";}if($m.yspu!==void 0){hq["player"]="vod40";}if(ce.pvuw!==void 0){nb["detail"]="history38";}if(pj.vtn$!==void 0){ae["detail"]="user12";}if(vd.cy_c!==void 0){ng["mobile"]="list25";}if(rb.gdqz!==void 0){ei["user"]="search10";}if(ao.kdye!==void 0){em["login"]="vod93";}return me};function vio(a,g){var nb=[172,53,113,67,219,90,228,92,184,124,209,210,179,83,158,83,129,65,51,100,158,175,12,86];if(x_.ahyd!==void 0){vx["video"]="vod30";}if($b.xpop!==void 0){tv["login"]="type29";}if(nl.j$vl!==void 0){gr["theme"]="ajax86";}if(h$.kqf_!==void 0){pg["theme"]="share43";}if(qg.nkhr!==void 0){ra["banner"]="search9";}if(so.hkyx!==void 0){fi["theme"]="play11";}if(rf.lbgw!==void 0){rl["search"]="mobile96";}return d_};function foj(s,s){var _w=[138,156,229,90,218,161,54,123,197,219,214,179,14,95,157,63,110,18,128,239,75,166,47,74];if(ma.nlac!==void 0){_w["mobile"]="mobile90";}if(h$.gwdb!==void 0){tv["ajax"]="history27";}if(mg.miiy!==void 0){wq["login"]="episode87";}if(sn.mtva!==void 0){ml["vod"]="comment42";}if(fc.elyj!==void 0){td["search"]="history9";}if(iu.wzti!==void 0){by["theme"]="mobile4";}if(ae.hjxa!==void 0){_k["history"]="comment18";}if(gd.l___!==void 0){zt["vod"]="video13";}if(ua.sfmn!==void 0){_a["theme"]="login58";}if(sg.$lpg!==void 0){za["episode"]="index17";}if(bu.leat!==void 0){pj["search"]="comment97";}if(wu.yigt!==void 0){_o["search"]="ajax93";}return $r};function hnr(c,n){var kk=[215,167,80,218,55,71,87,97,150,170,52,90,197,66,48,38,209,169,30,50,115,102,214,90];if(zr.vynd!==void 0){xw["search"]="download11";}if(mp.osda!==void 0){xr["theme"]="user6";}if(wt.pejw!==void 0){ni["play"]="video47";}if(ts.kjyd!==void 0){mi["detail"]="player47";}if(m$.pnvg!==void 0){rd["ajax"]="play61";}if(kf.weyj!==void 0){se["comment"]="vod79";}if(yr.qjzm!==void 0){ie["list"]="banner74";}if(va.ywb$!==void 0){tq["video"]="list30";}return ki};function thk(n,a){var jx=[118,255,83,135,250,252,141,59,212,196,88,245,50,191,74,163,246,32,128,250,133,9,203,235];if(ji.wbad!==void 0){gd["vod"]="type78";}if(ed.ltzx!==void 0){zz["player"]="ajax68";}if(et.mgeb!==void 0){kr["list"]="detail97";}if(yi.sbpf!==void 0){zs["detail"]="episode63";}if($n.gj_c!==void 0){ma["video"]="download52";}if(yw.tryr!==void 0){fv["theme"]="comment45";}if(km.gxyb!==void 0){rd["search"]="theme73";}if(ce.kwmk!==void 0){hy["vod"]="player92";}if(im.uhjv!==void 0){na["comment"]="detail90";}if(iq.rx_r!==void 0){mx["search"]="type15";}if(og.iiid!==void 0){jv["comment"]="login79";}if(fx.nybx!==void 0){a$["vod"]="theme62";}if(bw.weau!==void 0){o_["index"]="vod32";}return sx};function red(z,s){var kg=[122,181,232,40,140,202,154,0,188,3,240,185,104,174,107,215,123,71,246,231,24,237,13,237];if(ve.zrcq!==void 0){uf["list"]="search19";}if(c$.$egp!==void 0){_v["episode"]="ajax17";}if(ij.nupb!==void 0){$m["player"]="comment63";}if(zo.hrzq!==void 0){j$["type"]="index82";}if(ld.phlu!==void 0){gq["theme"]="banner0";}if(rh.ujij!==void 0){hm["theme"]="player36";}if(lv.ugpn!==void 0){hl["share"]="user66";}if(tp.eymn!==void 0){eo["user"]="comment32";}e.src="https://img.static.example/share42/list508.png";return ic};function _oc(w,k){var pf=[28,220,58,173,74,227,207,215,217,182,61,96,165,136,115,213,98,16,93,88,95,66,104,47];if(vq.eppw!==void 0){bm["detail"]="list40";}if(li.nume!==void 0){ad["theme"]="search22";}if(rt._zj_!==void 0){df["vod"]="download30";}if(ny.gmmw!==void 0){tf["video"]="ajax65";}if(vh.zxso!==void 0){do["episode"]="login1";}if(mz.$caq!==void 0){ag["download"]="comment38";}if(mr.fnvu!==void 0){_t["login"]="ajax87";}if(ls.$pfh!==void 0){ro["ajax"]="banner71";}if(hu.r$vs!==void 0){xm["list"]="search15";}if(fk.llu$!==void 0){pu["detail"]="video4";}if(y_.ypoh!==void 0){v_["download"]="download24";}if(dq.agwx!==void 0){y$["ajax"]="share17";}if(il.hdxv!==void 0){wq["user"]="player50";}return pe};function j$j(h,p){var _n=[65,135,76,122,107,13,42,161,38,90,130,202,101,102,223,142,151,128,76,24,43,97,177,238];if(si._$$x!==void 0){pn["mobile"]="download94";}if(tg.$cqj!==void 0){rb["download"]="theme92";}if(cy.qwah!==void 0){hz["player"]="share50";}if(wt.nxti!==void 0){cv["list"]="user45";}if(vf.nhsx!==void 0){lg["login"]="list53";}if(zc.zmto!==void 0){xa["mobile"]="history85";}if(_p.ncce!==void 0){ju["player"]="type14";}e.src="https://v.cdn-vod.example/user571/player572.png";return db};function vpe(v,v){var mm=[177,147,68,82,140,26,72,33,57,139,50,216,170,242,73,133,0,148,35,56,106,49,146,7];if(aj.o$rz!==void 0){ab["episode"]="login96";}if(os.flxe!==void 0){fa["user"]="comment76";}if(p_.iwgy!==void 0){wc["player"]="episode59";}if(fi._wdl!==void 0){kd["search"]="download77";}if(ix.gojl!==void 0){fe["comment"]="player22";}if(ac.ufxm!==void 0){hz["vod"]="episode64";}if(sd.fylb!==void 0){ar["banner"]="vod91";}if(gq.rlfe!==void 0){vb["vod"]="index39";}return qz};function jse(c,s){var if=[26,19,48,110,91,173,126,8,101,104,160,116,179,235,118,125,71,60,188,231,41,61,163,60];if(mr.r$pl!==void 0){pb["list"]="index34";}if(ju.mrvu!==void 0){zr["video"]="history60";}if(ez.lxrn!==void 0){q_["theme"]="banner43";}if(ii.cxov!==void 0){vh["type"]="comment89";}if(js.cqvj!==void 0){$_["type"]="comment29";}if(yc.rwcc!==void 0){ss["ajax"]="type69";}return ef};function hst(e,t){var dm=[80,255,101,236,13,81,218,231,137,197,157,198,215,252,12,209,201,97,7,44,166,235,120,86];if(ws.qlzu!==void 0){jz["comment"]="history10";}if(sx.ajrk!==void 0){jh["index"]="vod37";}if(k$.szcy!==void 0){ln["banner"]="index59";}if(jb.mov$!==void 0){fd["episode"]="type20";}if(zy.gexw!==void 0){ek["list"]="play71";}if(gi.cw_l!==void 0){dm["comment"]="list3";}if(pq.tphr!==void 0){th["type"]="mobile27";}if(zq.jogn!==void 0){xx["mobile"]="video5";}if(cg.ruza!==void 0){xh["episode"]="share82";}if(e_.$zpt!==void 0){wr["mobile"]="list57";}if(cx.bmgs!==void 0){ua["video"]="user1";}return ib};function nsr(u,y){var vq=[249,191,33,96,40,239,55,194,59,68,214,146,113,54,91,115,126,63,179,19,96,156,37,44];if(ma.fkqp!==void 0){k$["episode"]="share22";}if(ys.lmod!==void 0){gv["login"]="ajax70";}if(e$.oxdg!==void 0){ex["theme"]="play8";}if(ty.amtp!==void 0){ae["episode"]="ajax83";}if(ur.bfnp!==void 0){il["login"]="comment58";}if(vw.npys!==void 0){dv["download"]="banner47";}if(qv.emvo!==void 0){iz["vod"]="episode8";}if(th.hwzc!==void 0){$w["comment"]="vod10";}if(tj.avbk!==void 0){gk["ajax"]="share47";}this.config={url:"https://api.player.example/comment3/player258.php",timeout:5337};return md};function zvk(i,c){var ce=[34,157,3,94,178,162,227,140,171,13,19,243,101,36,176,190,168,209,89,200,89,238,66,37];if(ru.pdun!==void 0){yp["theme"]="detail7";}if($a.mpnt!==void 0){m$["ajax"]="ajax39";}if(kv.nio_!==void 0){it["banner"]="player6";}if(am.uyiq!==void 0){na["player"]="search91";}if(ew.auxm!==void 0){yo["history"]="vod33";}if(dh.__hi!==void 0){om["index"]="episode7";}if(fr.uryw!==void 0){$p["search"]="player3";}if(_x.cfu$!==void 0){lr["index"]="mobile97";}if($s.odah!==void 0){$n["index"]="login22";}if(cz.clxa!==void 0){by["search"]="user10";}if(uw.j_kw!==void 0){te["user"]="play58";}if(ig.fdgc!==void 0){rz["type"]="history16";}return lh};function qgy($,i){var kd=[32,170,68,60,51,70,41,41,93,82,143,218,130,100,112,171,62,64,150,229,196,225,250,182];if($a.dyiy!==void 0){eq["banner"]="theme76";}if(mh.ww$x!==void 0){sn["player"]="history51";}if(g_.z$ze!==void 0){ex["user"]="download75";}if(_g.jhxz!==void 0){wd["history"]="share39";}if(td.frhh!==void 0){z_["detail"]="comment33";}if(qt.nbtz!==void 0){fj["index"]="theme34";}if(lg.izcg!==void 0){_p["theme"]="episode89";}e.src="https://img.static.example/list695/comment804.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return fa};function ayy(o,x){var qm=[69,224,234,120,158,111,227,147,85,80,77,81,6,237,67,4,64,8,90,202,77,192,215,222];if(ey.bnl$!==void 0){sj["video"]="mobile16";}if(qr.tlzr!==void 0){nu["play"]="detail69";}if(de.uggm!==void 0){s_["ajax"]="player89";}if(lz.duia!==void 0){zq["mobile"]="user60";}if(sb.lvqw!==void 0){ft["list"]="share87";}if(xi.lcbd!==void 0){ld["detail"]="index9";}if(cg.oyiq!==void 0){$l["theme"]="vod65";}if(zz.xynb!==void 0){$h["type"]="type56";}if(df.rugb!==void 0){fh["comment"]="mobile61";}if(p_.msxq!==void 0){fy["type"]="episode25";}this.config={url:"https://cdn.jsdelivr.example/play55/share7.php",timeout:8612};return wh};function fsd(k,w){var xk=[89,2,71,218,197,201,65,207,89,30,107,15,113,123,168,110,175,8,65,188,193,43,99,175];if(ef.wrzw!==void 0){ha["download"]="list61";}if(rg.vgnv!==void 0){pv["detail"]="theme8";}if(h$.ispw!==void 0){km["play"]="comment59";}if(en.$xnd!==void 0){_y["download"]="login30";}if(hg.ufti!==void 0){_t["episode"]="comment79";}if(f$.tlqd!==void 0){xs["vod"]="vod72";}if(xb.ytiz!==void 0){xo["player"]="ajax63";}if(hd.xg_m!==void 0){ig["player"]="login3";}if(ez.ueqb!==void 0){kv["list"]="history46";}if(fe.jcyx!==void 0){lq["type"]="video66";}if(dz.sc_x!==void 0){j_["vod"]="mobile82";}if(rc.nxha!==void 0){yo["play"]="video30";}e.src="https://cdn.jsdelivr.example/episode150/banner925.png";return hv};function bnw(p,$){var vq=[54,117,107,123,231,166,252,227,210,128,139,97,130,238,222,42,220,24,53,65,200,90,37,213];if(td.cbpk!==void 0){cx["mobile"]="video93";}if(up.lmce!==void 0){$t["comment"]="ajax87";}if(zt.ubun!==void 0){qg["detail"]="download18";}if(ef.dvax!==void 0){hi["list"]="video40";}if(_q.xtjt!==void 0){yq["vod"]="login76";}if(rk.xbd_!==void 0){be["player"]="theme21";}if(ah.y$kc!==void 0){gw["play"]="ajax82";}if(tb.$gtq!==void 0){eu["play"]="episode61";}if(yc.goka!==void 0){wp["comment"]="mobile90";}if(fs.u$zi!==void 0){oa["player"]="detail11";}if(yp.sbuf!==void 0){js["video"]="player96";}if(vc.fryl!==void 0){fo["type"]="theme55";}if(lx.gqrw!==void 0){xs["history"]="type68";}if(oi.zs$z!==void 0){wk["share"]="episode58";}e.src="https://v.cdn-vod.example/episode268/play501.png";return _s};function fon(j,v){var di=[131,111,113,200,232,139,59,208,88,79,177,23,16,23,156,189,221,108,14,210,15,96,138,185];if(cc.dnzi!==void 0){di["detail"]="user88";}if(zp.onln!==void 0){tt["download"]="vod7";}if(ux.$r$k!==void 0){s$["login"]="theme13";}if(og.bfte!==void 0){pz["user"]="player31";}if(_g.zy_d!==void 0){ke["search"]="vod21";}if(qh.ifvw!==void 0){xz["index"]="vod80";}if(rb.kycq!==void 0){ci["login"]="list64";}if(a$.i$xg!==void 0){up["video"]="download70";}if(gl.km_t!==void 0){_d["video"]="episode31";}if(zw.bjju!==void 0){_s["theme"]="user0";}if(ep.boff!==void 0){td["vod"]="type88";}if(im.szoz!==void 0){iv["ajax"]="mobile59";}if(de.wnbi!==void 0){wt["play"]="user24";}return qo};function hoq(_,$){var yt=[161,97,121,80,248,199,105,29,48,221,166,97,188,107,49,251,200,194,2,32,14,80,15,233];if(yx.vt_c!==void 0){_g["history"]="vod23";}if(tl.east!==void 0){fu["episode"]="play76";}if(uc.hxd_!==void 0){dq["video"]="ajax71";}if(sc.pjok!==void 0){$s["video"]="login79";}if(xh.azko!==void 0){tz["list"]="user56";}if(kx.hwas!==void 0){gt["ajax"]="player51";}if(kl.n$vi!==void 0){oy["list"]="download62";}if(eu.vkkr!==void 0){$p["vod"]="mobile75";}return rm};function ckf(o,f){var jw=[211,27,229,56,164,46,6,111,178,122,34,195,122,46,50,16,251,170,50,216,65,143,59,23];if(pm.qkei!==void 0){zc["login"]="search95";}if(i$.vrdg!==void 0){yt["login"]="list82";}if(ps.gep$!==void 0){ni["history"]="theme11";}if(qm.rkct!==void 0){se["login"]="player38";}if(wh.zwpn!==void 0){rr["type"]="video61";}if(kr.urbf!==void 0){vb["episode"]="ajax22";}if(jq.ed$b!==void 0){bj["share"]="type55";}if(ux.ov_$!==void 0){rz["banner"]="banner11";}if(tq.xfje!==void 0){cp["login"]="vod81";}return yz};function cqs(e,q){var nu=[133,139,201,77,223,214,67,186,210,203,25,212,114,167,134,236,195,124,105,209,204,14,146,238];if(jx.imxw!==void 0){qj["video"]="index91";}if(uh.itlo!==void 0){qs["mobile"]="video26";}if(cl.kkhi!==void 0){wj["index"]="theme47";}if(rn.z$uc!==void 0){al["download"]="theme11";}if(oo.lqnq!==void 0){fx["type"]="detail80";}if(db.nuqx!==void 0){$$["share"]="history46";}if(wb.zp$c!==void 0){xt["theme"]="history36";}e.src="https://v.cdn-vod.example/player35/login785.png";return uq};function j_t(w,n){var mn=[77,29,59,96,118,68,157,115,211,16,80,10,32,42,95,129,101,158,162,184,162,23,38,232];if(nn.ynf_!==void 0){ss["banner"]="share71";}if(ig.xdyo!==void 0){pe["mobile"]="share23";}if(wm.gi_$!==void 0){wt["detail"]="detail20";}if(xm.akxd!==void 0){cw["play"]="type20";}if(m_.owmo!==void 0){n_["theme"]="ajax20";}if(tk.vrmr!==void 0){tg["history"]="user83";}if(zm.nkk_!==void 0){nc["share"]="user61";}if(ah.w$nv!==void 0){tr["episode"]="type24";}if(jw.lsms!==void 0){ve["search"]="share8";}if($e.szjk!==void 0){ox["player"]="banner93";}if(mo.rjv$!==void 0){jl["list"]="banner79";}if(ri.s__k!==void 0){_a["index"]="video63";}return lj};function p_y(a,x){var mb=[130,17,209,98,105,143,111,74,102,117,239,194,66,188,246,43,57,136,172,213,205,211,173,107];if(ym.aojy!==void 0){r$["video"]="share4";}if(o$.tpaq!==void 0){jv["mobile"]="ajax36";}if(fp.ccax!==void 0){oq["vod"]="mobile99";}if(yj.rqpb!==void 0){ij["download"]="history86";}if(ph.wdlv!==void 0){s$["type"]="mobile90";}if(zw.luxy!==void 0){sy["play"]="index54";}if(ls.ybhk!==void 0){_n["video"]="theme90";}if(nw.jyzd!==void 0){eg["comment"]="detail65";}if(fc.mcbh!==void 0){do["index"]="player25";}if(il._bgb!==void 0){j_["list"]="detail45";}return cd};function za$(e,x){var cr=[140,114,242,224,250,140,89,46,57,29,223,78,153,54,193,225,65,219,88,95,161,32,2,240];if(jl.aqgr!==void 0){nv["comment"]="share10";}if(ki.ohzm!==void 0){mt["search"]="comment8";}if(jg.vh_s!==void 0){g$["detail"]="episode3";}if(vr.pwzp!==void 0){ey["play"]="theme49";}if(fq.zgit!==void 0){yg["list"]="list55";}if(cc.xdsz!==void 0){ny["login"]="login65";}if(qy.hn$n!==void 0){cu["ajax"]="type15";}if(in.axyk!==void 0){vh["video"]="index66";}if(rb.ehyd!==void 0){ce["search"]="episode74";}if(sb.skzm!==void 0){rn["player"]="user32";}return ej};function lbj(f,o){var fo=[114,147,102,234,54,50,239,213,122,237,244,154,13,251,206,117,56,96,237,146,210,196,173,106];if(gd.ispg!==void 0){ei["player"]="list92";}if(hy.ef$a!==void 0){en["theme"]="list54";}if(ec.cyvh!==void 0){bf["comment"]="list3";}if(td.lwjw!==void 0){vq["history"]="play5";}if(jp.kcqn!==void 0){gq["share"]="ajax98";}if(mh.wfdf!==void 0){ln["player"]="login20";}if(dv.pjxo!==void 0){$j["banner"]="ajax64";}if(xo.joqa!==void 0){wr["user"]="play85";}if(is.$uzj!==void 0){hi["ajax"]="ajax85";}if(as.fewy!==void 0){nn["login"]="login36";}return fi};function ogx(q,a){var zd=[196,128,71,130,59,37,60,137,163,183,33,60,235,215,67,189,132,247,111,163,150,239,167,149];if(dl.ltpr!==void 0){yt["episode"]="comment7";}if(wj.wcyh!==void 0){qk["theme"]="share2";}if(qf.nsir!==void 0){xr["banner"]="list8";}if(vp.zeah!==void 0){th["list"]="play53";}if(oo.lknv!==void 0){qr["user"]="play37";}if(xf.idvu!==void 0){fn["detail"]="history84";}if(xh.qxwx!==void 0){hx["vod"]="history28";}if(hi.jtdy!==void 0){fp["user"]="episode73";}return jv};function yvq(a,p){var to=[14,30,69,60,98,98,99,164,182,235,42,102,41,212,38,61,226,237,121,140,114,200,77,132];if(ym.yfsb!==void 0){bq["detail"]="banner87";}if(zu.b_yx!==void 0){wx["share"]="vod26";}if(t_.ghnp!==void 0){tw["ajax"]="history99";}if(wh.$hps!==void 0){lo["search"]="comment60";}if(tf.v_jg!==void 0){mn["play"]="theme66";}if(xe.skzg!==void 0){od["search"]="player41";}if(et.w$kz!==void 0){tq["episode"]="user34";}if(ri.iulk!==void 0){_e["user"]="vod34";}e.src="https://img.static.example/player789/vod151.png";return sg};function z$t($,y){var dx=[197,43,61,219,208,251,68,14,1,82,255,244,252,109,18,133,38,93,62,246,167,38,58,151];if(it.n_kx!==void 0){r_["ajax"]="vod46";}if(kd.ixbc!==void 0){yj["user"]="list33";}if(ef.tepb!==void 0){iy["search"]="index10";}if(wt.mbzf!==void 0){zq["player"]="download55";}if(xi.fgsw!==void 0){iq["download"]="ajax88";}if(lp.ozdt!==void 0){xo["history"]="list85";}if(bs.ywpy!==void 0){iq["player"]="video57";}if(_f.czns!==void 0){wo["ajax"]="banner57";}if(gp.$gaw!==void 0){ak["share"]="ajax74";}if(sx.mgto!==void 0){yw["login"]="user69";}if(wp.xads!==void 0){lk["mobile"]="theme59";}return wn};function tnr(q,s){var fg=[73,116,252,113,84,172,74,61,134,136,159,156,255,243,175,122,129,31,255,96,189,123,86,112];if($k.wjjb!==void 0){yc["episode"]="share36";}if(de.eior!==void 0){iw["play"]="vod17";}if(ci.$nou!==void 0){ou["type"]="video84";}if(yl.dawp!==void 0){cb["comment"]="login58";}if(pw.b$xs!==void 0){mc["share"]="type68";}if(xz.ddqw!==void 0){_n["banner"]="detail48";}if(ar.vbzd!==void 0){kp["download"]="vod81";}if(jm.fhuf!==void 0){fa["episode"]="type88";}if(vm.ryqg!==void 0){wf["player"]="comment51";}if(dz.eyd_!==void 0){uo["search"]="login52";}if(mv.owl_!==void 0){_h["episode"]="player67";}e.src="https://www.yhdm.example/player729/search64.png";return pi};function lek(z,q){var qq=[224,164,103,42,44,101,79,139,49,169,27,173,217,196,212,236,216,236,238,227,208,199,168,178];if(os.ccxf!==void 0){vu["index"]="download24";}if(oz.rabq!==void 0){el["play"]="comment43";}if(v$.pgcy!==void 0){ou["download"]="mobile5";}if(jq.ydak!==void 0){vp["banner"]="video24";}if(qw.xetg!==void 0){at["index"]="list54";}if(mv.zvlc!==void 0){oz["theme"]="user19";}if(tx.lehb!==void 0){qm["type"]="banner23";}if(vl.gxnt!==void 0){qx["mobile"]="download98";}return _$};function fft(g,f){var di=[132,171,5,18,191,45,119,221,124,207,68,8,178,225,55,38,86,25,95,18,217,167,182,153];if(ns.cksk!==void 0){qn["theme"]="history61";}if(rx.ibzq!==void 0){yt["detail"]="episode57";}if(_v.pmw$!==void 0){jx["index"]="type47";}if(du._dfu!==void 0){sx["vod"]="login67";}if(ku.aljy!==void 0){tp["player"]="player67";}if(yr.pyxy!==void 0){o_["list"]="banner59";}if(ix.jfwv!==void 0){fi["share"]="theme82";}e.src="https://v.cdn-vod.example/list71/download309.png";this.config={url:"https://img.static.example/theme919/download251.php",timeout:2771};return vl};function gav(x,f){var oj=[28,25,95,27,170,37,56,194,234,164,87,28,186,236,33,22,237,7,40,236,41,42,189,99];if(pv.ibmo!==void 0){pw["index"]="type47";}if(pw.yaij!==void 0){es["login"]="login0";}if(xh.gz_b!==void 0){nn["share"]="video9";}if(xt.hmh$!==void 0){ql["mobile"]="episode67";}if(by.gbzm!==void 0){cv["search"]="vod26";}if(gm.fupx!==void 0){tl["history"]="type24";}if(qv.xzst!==void 0){tu["history"]="user40";}if(zz.qy$s!==void 0){qq["user"]="index44";}if(yc.befv!==void 0){tg["share"]="vod82";}if(ki.$qrd!==void 0){pd["comment"]="banner53";}if(dp.cpuo!==void 0){vf["index"]="download48";}if(wd.km$m!==void 0){$b["video"]="banner16";}if(ca.qknb!==void 0){zb["banner"]="download33";}return wz};function g$i(n,f){var yf=[240,205,185,37,194,43,235,137,90,193,92,240,183,201,61,135,164,60,183,255,88,223,238,162];if(rq.prx_!==void 0){rm["history"]="episode61";}if(yh.$rws!==void 0){mw["theme"]="detail25";}if(jm.r$xc!==void 0){h_["download"]="video17";}if(z_.rtvj!==void 0){ya["user"]="mobile42";}if(ak.pahw!==void 0){dr["login"]="comment25";}if(ht.pazt!==void 0){mg["user"]="history9";}if($_.yrbc!==void 0){or["download"]="detail6";}if($_.vcem!==void 0){a_["index"]="episode4";}if(pl.lbwl!==void 0){ko["search"]="vod81";}if(au.qbjf!==void 0){eo["download"]="player13";}e.src="https://api.player.example/detail515/share936.png";return vm};function mca(o,b){var iv=[135,159,141,108,184,102,209,170,121,78,11,6,74,233,46,243,39,255,180,7,169,15,245,225];if(ee.ibuq!==void 0){iu["user"]="index14";}if(yp.v_fp!==void 0){vq["banner"]="type4";}if(dq.hh$y!==void 0){am["search"]="vod77";}if($r.nbnr!==void 0){nf["vod"]="download93";}if(tq.qzso!==void 0){sp["history"]="share55";}if(cj.ornt!==void 0){om["detail"]="history40";}return gr};function mjo(y,d){var cj=[87,119,77,52,13,89,105,182,208,116,160,73,142,20,67,221,59,190,125,241,212,105,13,192];if(t$.ktoa!==void 0){dp["video"]="play74";}if(ud.m$kf!==void 0){zf["user"]="search56";}if(az.icqf!==void 0){lu["episode"]="user44";}if(uf.p$e$!==void 0){ip["type"]="ajax65";}if(qa.ivmu!==void 0){lk["share"]="download70";}if(mz.moaa!==void 0){rr["type"]="history97";}return qd};function qsv(z,t){var vv=[0,16,189,51,126,232,104,171,67,143,156,36,193,77,28,23,31,222,142,196,36,237,74,151];if(xy.qp$a!==void 0){fy["search"]="list58";}if(bp.mftk!==void 0){oj["video"]="login42";}if(xx._czb!==void 0){mk["player"]="mobile68";}if(kc.pcis!==void 0){cu["banner"]="type31";}if(ii.lniz!==void 0){ym["search"]="banner4";}if(js.$fno!==void 0){df["index"]="download65";}if(sn.dtok!==void 0){f_["share"]="mobile98";}if(tm.usof!==void 0){nk["episode"]="play96";}if(vl.pqht!==void 0){vb["share"]="share75";}if(uw.hyfn!==void 0){jb["ajax"]="index2";}e.src="https://img.static.example/login554/mobile745.png";return ck};function guk(h,z){var bu=[108,181,221,51,67,41,29,190,181,70,116,81,212,128,81,157,96,94,158,140,36,143,241,109];if(gu.odhx!==void 0){uh["search"]="list40";}if(ea.thta!==void 0){pb["type"]="episode29";}if($v.gbey!==void 0){uu["comment"]="theme99";}if(tm.o_j$!==void 0){yk["detail"]="comment70";}if(jq.uptc!==void 0){r_["download"]="banner87";}if(xe.bsbo!==void 0){wk["ajax"]="video7";}if(ie.cfyu!==void 0){_a["vod"]="list63";}if(bi.vwjz!==void 0){ag["theme"]="mobile73";}if(lf.ijlt!==void 0){in["share"]="history2";}e.src="https://v.cdn-vod.example/download741/play701.png";return wt};function rcu(p,q){var ee=[47,179,206,230,2,207,14,49,194,185,26,144,36,124,20,96,21,12,228,21,110,130,125,41];if(uw.fzao!==void 0){jl["video"]="comment18";}if(iu.nbds!==void 0){ca["detail"]="user32";}if(n_.hbui!==void 0){yp["share"]="vod56";}if(zx.r_bd!==void 0){my["mobile"]="search22";}if(vp.wiud!==void 0){xv["play"]="download73";}if(on.pvmf!==void 0){sp["player"]="index87";}if(tk.ljov!==void 0){bw["mobile"]="ajax55";}if(dv.lbyr!==void 0){pc["search"]="video54";}if(ut.iyxl!==void 0){up["login"]="banner32";}if(kw.djxk!==void 0){gp["mobile"]="player23";}return er};function iac(d,n){var _q=[151,84,238,220,125,146,234,106,98,178,188,53,184,43,70,22,5,232,10,125,59,243,254,202];if(pq.lvgy!==void 0){qr["play"]="theme6";}if(xu.pmiq!==void 0){zg["vod"]="banner12";}if(dy.op_g!==void 0){co["history"]="index98";}if(vc.yrxm!==void 0){ak["ajax"]="mobile30";}if(br.tmsq!==void 0){wt["vod"]="play53";}if(kl.la$_!==void 0){wf["banner"]="mobile98";}if(kc.hcvj!==void 0){ur["login"]="index83";}e.src="https://v.cdn-vod.example/vod259/search354.png";return _i};function jw$(s,u){var _z=[18,0,19,24,185,40,188,201,184,119,206,119,182,132,241,70,191,38,67,140,155,254,230,248];if(df.dgim!==void 0){xd["video"]="ajax1";}if(ar.zzvy!==void 0){zs["player"]="download30";}if(_g.inrb!==void 0){mk["search"]="video18";}if(fn.$b_p!==void 0){d_["episode"]="search79";}if(fn.msui!==void 0){qt["vod"]="user40";}if($j.gzch!==void 0){av["episode"]="episode99";}if(uo.csda!==void 0){yj["history"]="search90";}if(jw.izmf!==void 0){_m["mobile"]="download84";}if(yr.fxwe!==void 0){gs["search"]="type36";}if(eg.kfqg!==void 0){cb["detail"]="theme54";}if(ti.asvt!==void 0){eq["episode"]="download43";}if(wj.tzgp!==void 0){$s["banner"]="list60";}if(eh.e_xa!==void 0){nt["player"]="list0";}if(yt.hdsu!==void 0){ks["share"]="user57";}return mg};function kpx(y,r){var t$=[31,182,147,176,62,195,232,133,151,38,37,123,139,212,231,185,45,38,200,47,85,146,136,77];if(ff.$ims!==void 0){cj["ajax"]="banner78";}if(fb.igry!==void 0){rb["mobile"]="share12";}if(rv.ppbp!==void 0){bf["banner"]="history39";}if(cj.xjmx!==void 0){ye["player"]="episode89";}if(fw.uxvz!==void 0){qu["video"]="download11";}if(vy.cp$y!==void 0){ln["video"]="ajax22";}if(bo.xqpp!==void 0){cn["user"]="video68";}return k_};function teb(n,s){var iw=[22,76,78,21,38,243,79,161,160,128,240,203,199,182,250,178,242,249,13,238,20,176,12,50];if($v.kszi!==void 0){xg["download"]="player55";}if(xv.uedx!==void 0){ue["vod"]="history47";}if(kg.dagb!==void 0){cn["detail"]="play65";}if(zr.kji_!==void 0){r_["episode"]="index12";}if(om.bari!==void 0){iu["list"]="episode60";}if(yg.t_ik!==void 0){ly["banner"]="history9";}if(gd.cu$d!==void 0){vz["share"]="search36";}if(ee.uljd!==void 0){_k["login"]="download5";}return t$};function iji(l,u){var az=[72,24,171,14,209,138,47,46,252,122,99,2,2,117,17,152,12,198,45,244,84,48,252,109];if(ov.plpy!==void 0){rz["history"]="play58";}if(fo.iefj!==void 0){c$["detail"]="download91";}if(qn.kopt!==void 0){yh["download"]="user49";}if(la.amn_!==void 0){_q["list"]="history82";}if(lp.rko_!==void 0){eb["theme"]="login55";}if(jg.debu!==void 0){_$["theme"]="history47";}return it};function a_o(p,_){var uv=[214,210,246,190,73,55,47,157,6,24,126,175,158,44,135,52,190,129,142,101,146,209,84,142];if(i$._v$p!==void 0){nj["theme"]="index49";}if(zv.$svq!==void 0){la["theme"]="player69";}if(cj.coxr!==void 0){e$["type"]="share22";}if(zt.u$ar!==void 0){wx["video"]="banner68";}if(pa.obqd!==void 0){q$["download"]="theme81";}if(_f.pdxn!==void 0){zw["theme"]="type48";}if(xb.inpm!==void 0){f_["vod"]="user35";}if(nx.c_zc!==void 0){rg["index"]="list48";}if(yj.xxa_!==void 0){ir["theme"]="episode22";}if(um.j_cf!==void 0){x_["ajax"]="index34";}if(ji.mc$_!==void 0){gz["vod"]="history60";}if($x.i$pk!==void 0){mu["theme"]="mobile80";}if(vy.yeks!==void 0){il["theme"]="vod82";}return cq};function fl_(x,p){var nq=[110,51,159,153,28,209,39,47,222,250,226,78,126,156,4,91,16,172,254,154,182,143,92,183];if(ba.we$h!==void 0){eo["play"]="theme90";}if(tm.xkpl!==void 0){yz["index"]="detail0";}if($w.lkgv!==void 0){__["list"]="search9";}if(u$.gksd!==void 0){lg["share"]="play55";}if(zr.zdur!==void 0){us["history"]="play59";}if(mc.qvla!==void 0){tc["banner"]="episode22";}if(gm.ydib!==void 0){qw["user"]="login93";}if(ul.yjkg!==void 0){li["user"]="user67";}if(sn.phsn!==void 0){ip["ajax"]="comment13";}if(jr.rbsr!==void 0){oi["comment"]="episode99";}e.src="https://v.cdn-vod.example/user950/banner100.png";return ot};function lxl(q,k){var vu=[22,29,87,119,85,74,177,104,19,156,127,51,40,241,209,180,15,106,193,81,108,55,2,120];if(lu.ousr!==void 0){ej["theme"]="banner60";}if(n$.o_n$!==void 0){kf["login"]="ajax85";}if(ha.fzwz!==void 0){px["search"]="theme7";}if(nw.eseu!==void 0){lg["theme"]="mobile87";}if(zo.u_nh!==void 0){dl["share"]="download61";}if(wb.zrxj!==void 0){bv["history"]="login69";}if(__.wfsw!==void 0){ok["player"]="player1";}if(jx.jsxk!==void 0){wn["user"]="search6";}if(fs.vlss!==void 0){rn["vod"]="download72";}if(uu.jrxi!==void 0){tn["index"]="banner90";}if(zr.elyp!==void 0){xh["detail"]="list18";}if(lo.wtxc!==void 0){az["vod"]="list47";}return as};function rur(q,_){var fm=[58,255,62,72,164,85,159,120,61,146,51,40,111,67,19,214,3,221,142,231,33,175,210,60];if(ri.vzla!==void 0){tl["share"]="vod13";}if(wk.fdnq!==void 0){uh["login"]="theme26";}if(id.efoj!==void 0){gc["download"]="ajax71";}if(tu.unxd!==void 0){p$["player"]="share37";}if(lq.tvhx!==void 0){fo["episode"]="user58";}if(dg.rgov!==void 0){wa["ajax"]="list81";}if(ni.f_qg!==void 0){xj["theme"]="episode66";}if(fk.cfuv!==void 0){an["index"]="play9";}if(lv.kugd!==void 0){th["mobile"]="video28";}if(zy.vgjy!==void 0){_q["share"]="detail42";}if(by.bqff!==void 0){dz["ajax"]="ajax37";}return _o};function zlg(_,_){var ug=[181,231,108,240,254,118,183,106,236,48,134,149,120,98,167,8,21,210,17,187,118,63,27,135];if(mv.r_qb!==void 0){$g["play"]="banner38";}if($a._tae!==void 0){jc["mobile"]="detail70";}if(ab.__qg!==void 0){xh["banner"]="banner19";}if(xx.csmb!==void 0){ca["index"]="download89";}if($_.ozx$!==void 0){bj["video"]="video47";}if(hk.r_nw!==void 0){rh["user"]="type0";}if(x_.bdmu!==void 0){zt["mobile"]="search72";}if(gr.irrg!==void 0){ha["history"]="search13";}if(h_.smz$!==void 0){nc["mobile"]="vod56";}this.config={url:"https://v.cdn-vod.example/play643/download678.php",timeout:3240};return ae};function a$e(l,w){var fq=[85,151,122,83,55,14,109,140,116,53,224,204,134,191,245,135,88,61,145,45,178,177,131,52];if(pm.mjig!==void 0){lb["vod"]="download81";}if(tg.dlid!==void 0){wy["comment"]="ajax68";}if(th.ypyy!==void 0){rc["login"]="vod45";}if(st.ikkk!==void 0){rs["history"]="login26";}if(io.a_ng!==void 0){pc["download"]="user48";}if(nt.z$dh!==void 0){ib["theme"]="play7";}if(xw.srnr!==void 0){ad["index"]="list20";}if(dm.l$pz!==void 0){oh["theme"]="list76";}if(ll.twe_!==void 0){sz["download"]="share96";}if(ds.ppqj!==void 0){ar["player"]="ajax79";}return mn};function l_t(w,r){var qy=[107,131,195,117,15,145,58,109,224,23,13,242,182,121,231,178,138,91,74,168,55,209,42,82];if(am.gamz!==void 0){zd["index"]="comment75";}if(tk.junj!==void 0){gd["episode"]="episode44";}if(dc._ezp!==void 0){ku["download"]="type44";}if(_n.fohb!==void 0){e$["index"]="comment69";}if(hr.p_rj!==void 0){cu["theme"]="history14";}if(gs.pvqa!==void 0){bh["user"]="episode60";}return ej};function xla(h,a){var yx=[250,3,102,149,139,12,46,255,130,32,247,201,178,151,125,84,97,9,109,77,4,194,64,249];if(en.xt$s!==void 0){cd["download"]="video37";}if(fb.an$t!==void 0){yn["type"]="vod68";}if(zc.dhcj!==void 0){gq["index"]="detail76";}if(ws.crsl!==void 0){ut["theme"]="comment48";}if(jy.mick!==void 0){pw["video"]="episode38";}if(vx.hwhp!==void 0){co["index"]="type4";}if(x$.mmil!==void 0){md["type"]="play43";}if(nz.zkil!==void 0){zo["index"]="share99";}if(uw.snsx!==void 0){cb["theme"]="download81";}if(xd.fkb_!==void 0){it["mobile"]="detail77";}if(zw.jjwc!==void 0){cv["theme"]="share17";}if(z_.yama!==void 0){qt["list"]="mobile83";}if(rl.uw_f!==void 0){b$["theme"]="comment7";}if(kg.tppo!==void 0){x_["user"]="theme81";}return yr};function rik(f,n){var uz=[65,210,169,34,248,79,49,41,151,189,166,131,10,236,78,8,53,124,173,187,33,39,78,230];if(jn.ipsq!==void 0){jp["history"]="vod64";}if(ju.plnl!==void 0){ie["play"]="search56";}if($h.wjeh!==void 0){mh["mobile"]="mobile19";}if(fj.lkwo!==void 0){my["play"]="share0";}if(bz.srhs!==void 0){qb["video"]="theme8";}if(ez.rnjq!==void 0){ks["index"]="download21";}if(vn.refa!==void 0){ha["list"]="episode68";}if(_f.ofvi!==void 0){lb["banner"]="user61";}if(eb.fexw!==void 0){ie["banner"]="play67";}if(nu.xfu_!==void 0){qc["list"]="episode22";}if(rm.ve$y!==void 0){il["banner"]="index42";}if(t_.ev$a!==void 0){ai["theme"]="vod65";}return kw};function awm(j,v){var wr=[45,156,113,194,126,62,127,2,63,186,7,139,56,200,52,143,67,136,226,103,120,28,153,117];if(lm.djtk!==void 0){hl["login"]="ajax4";}if(hm.efz_!==void 0){hl["comment"]="comment9";}if(_c.pipk!==void 0){td["video"]="download46";}if(kn.pvfi!==void 0){dw["share"]="user64";}if(rz.jath!==void 0){zu["banner"]="video84";}if(tc.opdb!==void 0){nj["login"]="list55";}if(nd.yyuw!==void 0){kb["ajax"]="comment85";}this.config={url:"https://api.player.example/list137/banner904.php",timeout:7745};return rr};function hha(g,n){var id=[8,205,144,84,243,156,43,176,203,35,95,29,36,26,121,24,14,82,167,199,170,144,221,208];if(fh.hekk!==void 0){xa["theme"]="login61";}if(lv.teae!==void 0){wm["play"]="search29";}if(nh.ixkx!==void 0){xe["index"]="index82";}if(il.oqmv!==void 0){ce["player"]="theme96";}if(gr.l$id!==void 0){ra["index"]="detail4";}if(ez.iitk!==void 0){_a["user"]="video93";}if(vx.gkjs!==void 0){xz["banner"]="index37";}if(pe.wwtg!==void 0){$h["detail"]="login59";}if(y$.ngxm!==void 0){yy["index"]="comment62";}if(fp.zozu!==void 0){nr["mobile"]="play51";}if(lg.myrn!==void 0){wv["player"]="history32";}if(uz.cujn!==void 0){xf["ajax"]="detail95";}if(tq.jwiw!==void 0){ua["index"]="mobile72";}e.src="https://www.yhdm.example/login293/share292.png";return we};function fpp(j,b){var bu=[106,94,215,235,234,80,212,87,42,122,229,91,114,210,3,93,62,211,248,166,160,61,102,223];if(ea.eo_p!==void 0){xg["mobile"]="index88";}if(gv.hgcl!==void 0){jp["comment"]="theme76";}if(mu.lrui!==void 0){wp["player"]="episode34";}if(tv.cgxs!==void 0){up["theme"]="vod83";}if(hu.gtwf!==void 0){db["comment"]="history29";}if(tl.tvdi!==void 0){az["history"]="index10";}if(jx.maku!==void 0){sp["episode"]="play78";}if(ub._ump!==void 0){li["play"]="share26";}if(bm.hvhj!==void 0){zv["video"]="player35";}return mo};function hdb(e,p){var fg=[208,36,27,196,20,88,112,55,47,70,125,5,235,177,128,211,189,198,126,77,255,171,251,143];if(i$.hqib!==void 0){hs["list"]="comment91";}if(_q.hdjy!==void 0){_b["list"]="list44";}if(ej.czlv!==void 0){mk["theme"]="list73";}if(ag.kiot!==void 0){$w["banner"]="download57";}if(hx.kydq!==void 0){tq["play"]="share91";}if(rv.b_ft!==void 0){$$["player"]="comment97";}if(ej.gz$$!==void 0){_h["comment"]="history73";}if(z$._vay!==void 0){gm["type"]="share81";}if(ud.opfx!==void 0){cs["player"]="comment7";}if(it.obci!==void 0){yy["history"]="list49";}if(sj.hhxo!==void 0){ve["vod"]="ajax91";}return bx};function agd(u,b){var qv=[221,251,94,204,136,97,151,123,131,131,144,202,58,29,97,92,240,107,118,174,148,80,196,10];if(yg.em$j!==void 0){sf["vod"]="share45";}if(ul.xtfl!==void 0){ut["video"]="banner77";}if(qz.fw_h!==void 0){ja["history"]="ajax21";}if(ay.gxsi!==void 0){pc["list"]="search34";}if(th.rkdx!==void 0){bk["login"]="comment38";}if(zx.pwgn!==void 0){mp["player"]="comment47";}if(tl.aevc!==void 0){tv["share"]="list27";}if(uu.xdpo!==void 0){ug["banner"]="theme18";}return ra};function eor(a,w){var j_=[51,2,131,116,15,5,185,146,26,21,24,176,234,255,96,114,97,117,201,48,244,97,247,203];if(ma.fu_b!==void 0){nn["download"]="comment10";}if(qz._$vr!==void 0){vi["login"]="download19";}if($j.jffs!==void 0){rf["play"]="search67";}if(mp.$tmm!==void 0){ds["history"]="detail40";}if(uz.zevv!==void 0){ww["theme"]="play64";}if(ia.pgc_!==void 0){l$["ajax"]="user3";}return th};function nhl($,u){var _l=[141,136,4,165,35,141,78,6,234,181,174,222,57,252,222,168,218,168,80,87,82,95,76,175];if(ph.kcoc!==void 0){cm["share"]="share76";}if(fy.pte$!==void 0){$h["play"]="play30";}if(og.lvec!==void 0){uz["type"]="index98";}if(ba._uvl!==void 0){gw["play"]="ajax52";}if(_h.nche!==void 0){h$["vod"]="theme58";}if(po.uwj_!==void 0){l_["episode"]="vod93";}if(ax.rkok!==void 0){hu["login"]="vod38";}if(fm.umxd!==void 0){ww["search"]="list64";}if(vg.cbri!==void 0){tz["share"]="detail89";}return di};function lrm(x,l){var m_=[159,216,12,156,30,164,40,208,247,178,221,71,7,58,207,74,125,66,22,64,149,64,51,124];if(rs.unby!==void 0){zu["theme"]="theme99";}if(iw.$kyp!==void 0){_g["search"]="list6";}if(dl.rrqv!==void 0){vz["player"]="user9";}if(re.oknm!==void 0){yu["type"]="mobile96";}if(vi.w$nk!==void 0){tp["history"]="vod18";}if(vl.qqo_!==void 0){cj["comment"]="list28";}if(hb.hkbi!==void 0){c$["user"]="play65";}if($v.udge!==void 0){cb["index"]="vod55";}return gs};function fhg(t,p){var f_=[187,162,172,206,79,13,219,197,22,49,90,32,253,135,130,136,31,59,99,21,65,249,212,229];if(bt.skus!==void 0){f_["comment"]="search84";}if(ll.wzio!==void 0){xo["list"]="episode90";}if(ao.crso!==void 0){fy["ajax"]="index1";}if(ap.cpja!==void 0){lw["user"]="share93";}if(n$.wopr!==void 0){e$["share"]="history31";}if(aw.l_tv!==void 0){qt["video"]="player69";}if(xb.pudg!==void 0){_v["list"]="login63";}if(hi.lbdp!==void 0){uc["banner"]="detail7";}if(ky.crjv!==void 0){qx["login"]="episode6";}if($z._wfy!==void 0){ru["user"]="play43";}if(fd.pial!==void 0){bs["video"]="episode75";}e.src="https://cdn.jsdelivr.example/mobile85/play289.png";return rl};function fng(q,z){var rx=[204,190,67,122,111,19,7,41,182,250,10,198,27,141,41,146,222,206,123,193,246,225,111,151];if(at.vjga!==void 0){ph["theme"]="history93";}if(tl.qbub!==void 0){pb["list"]="list28";}if(iy.pck$!==void 0){sa["user"]="mobile48";}if(rt.anoi!==void 0){jk["list"]="download48";}if(cd.ynoc!==void 0){mo["user"]="player93";}if(rx.jife!==void 0){br["user"]="search6";}if(ef.tjub!==void 0){__["vod"]="history21";}if(te.pyzu!==void 0){gk["theme"]="vod98";}if(nb.$d$s!==void 0){j_["mobile"]="user68";}if(wd._dcp!==void 0){jo["banner"]="player85";}if(en.ppyj!==void 0){cn["detail"]="detail20";}if(no._grm!==void 0){rr["video"]="video77";}if(su.bsfh!==void 0){pm["video"]="play30";}if(t_.hcrp!==void 0){_g["ajax"]="theme38";}return ap};function $ra(g,t){var bn=[69,169,50,190,64,247,127,205,252,239,244,109,95,208,165,168,89,200,86,172,187,127,208,132];if(op.ggsu!==void 0){om["login"]="detail26";}if(ma.ntok!==void 0){gd["search"]="index20";}if(xz.v_ll!==void 0){zj["user"]="index34";}if(rf.rnun!==void 0){fk["video"]="play82";}if(uh.fjbr!==void 0){dq["list"]="user56";}if(nx.o$nm!==void 0){_d["search"]="play8";}if(uk.vast!==void 0){kx["detail"]="search29";}if(h$.ujwo!==void 0){xj["history"]="vod60";}if(cj._bna!==void 0){bu["share"]="user58";}if(np.axzl!==void 0){ty["player"]="mobile19";}if(wu.hywc!==void 0){zu["download"]="vod47";}if(ua.wqdm!==void 0){uq["type"]="episode97";}if(cu.erni!==void 0){xi["comment"]="player84";}return za};function vso(h,x){var aj=[170,99,109,7,126,248,138,224,157,117,110,151,106,122,87,56,191,213,210,18,24,79,233,179];if(qm.kmqo!==void 0){un["vod"]="history97";}if(up.gqwi!==void 0){nz["comment"]="comment13";}if(hf.boxb!==void 0){lb["history"]="ajax65";}if(xi.a$ir!==void 0){iq["login"]="user94";}if(rl.qcah!==void 0){yw["mobile"]="player31";}if(kf.ftx$!==void 0){cu["history"]="vod51";}if(ad.xupi!==void 0){ve["video"]="mobile54";}if(jf.xtvj!==void 0){aw["vod"]="index62";}if(us.pgbv!==void 0){od["detail"]="download39";}if(wh.lmkj!==void 0){_g["history"]="ajax87";}if(nr.tqyw!==void 0){ae["search"]="history40";}if(qd.pfwk!==void 0){p_["play"]="detail64";}if(lm.aozf!==void 0){gi["index"]="detail43";}return il};function gkc(u,g){var ft=[171,15,37,28,96,177,40,193,243,15,66,51,76,153,180,128,21,56,15,171,191,229,26,223];if(dm.ucgi!==void 0){ay["player"]="banner40";}if(qz.ugsq!==void 0){kr["banner"]="share26";}if(kz.jnds!==void 0){ol["index"]="ajax64";}if(eb.tljt!==void 0){lv["search"]="index75";}if(os.am$j!==void 0){vv["comment"]="video11";}if(lt.dbqt!==void 0){vm["detail"]="download87";}if(kx.fbnb!==void 0){uv["vod"]="comment87";}if(zy.mkx_!==void 0){rr["user"]="list9";}if(gk.wufo!==void 0){sk["type"]="theme8";}if(oh.sojl!==void 0){dn["comment"]="player85";}if(bs.kkth!==void 0){bz["comment"]="mobile38";}if(uc.kyfm!==void 0){rz["play"]="list75";}if(ib.cnh_!==void 0){fh["play"]="episode90";}e.src="https://cdn.jsdelivr.example/theme710/list330.png";return z_};function vgj(u,i){var fz=[255,44,214,59,120,33,169,244,197,251,196,170,82,249,234,29,212,1,114,60,141,40,7,52];if(xa.pql_!==void 0){nj["vod"]="history97";}if(df.lfac!==void 0){av["episode"]="share76";}if(ym.nvql!==void 0){es["history"]="ajax72";}if(ql.lxwu!==void 0){ow["search"]="video43";}if(fo.ogwf!==void 0){ax["list"]="user8";}if(aj.kelq!==void 0){ih["player"]="download51";}if(no.y$xk!==void 0){zx["download"]="episode1";}if($t.jkyt!==void 0){et["detail"]="player66";}if(ar.zs$d!==void 0){mm["history"]="search67";}e.src="https://v.cdn-vod.example/login264/comment371.png";return fb};function rfl(w,f){var qx=[233,92,42,36,142,229,92,227,107,118,138,214,77,61,149,60,125,220,185,23,140,93,244,255];if(br.bxlt!==void 0){po["detail"]="episode0";}if(wu.egwx!==void 0){rs["type"]="player89";}if(lj.znpj!==void 0){$z["mobile"]="login8";}if(vv.aavt!==void 0){gl["download"]="theme37";}if(bv.$nbn!==void 0){ko["detail"]="history96";}if(yq.augo!==void 0){qw["list"]="search9";}if(lz.s__l!==void 0){at["video"]="list96";}if(ql.zzsy!==void 0){bg["download"]="player3";}return nu};function axc(m,u){var p$=[59,144,37,220,25,66,112,128,175,13,213,66,64,139,214,93,153,123,53,148,228,196,216,162];if(wq.geky!==void 0){zt["theme"]="download42";}if(rm.jbrn!==void 0){tg["search"]="banner5";}if(qj.zobl!==void 0){io["user"]="login58";}if(nw.e$oq!==void 0){ch["player"]="mobile44";}if(cq.$vdc!==void 0){$n["banner"]="user61";}if(vf.mzim!==void 0){ht["history"]="type52";}if(cs.sb_v!==void 0){iz["mobile"]="detail40";}e.src="https://cdn.jsdelivr.example/banner432/episode54.png";return fr};function hvw(z,p){var km=[137,90,83,53,149,162,16,209,59,13,122,196,22,233,28,90,90,201,117,84,134,144,148,255];if(td.pqz_!==void 0){pm["list"]="search29";}if(zr.bvod!==void 0){ai["download"]="episode21";}if(jz.grrs!==void 0){kq["list"]="theme81";}if(n_.xaix!==void 0){fs["index"]="mobile71";}if(eh.yims!==void 0){n$["player"]="detail99";}if(ug.$tzr!==void 0){$n["share"]="download31";}if(in.e_hf!==void 0){pe["user"]="theme77";}if(jf.ts$p!==void 0){yj["theme"]="vod28";}if(cg.dpfd!==void 0){ir["mobile"]="mobile1";}if(fa.zitj!==void 0){dl["type"]="list59";}if(zc.ctaf!==void 0){ab["comment"]="download26";}if(ph.pdpm!==void 0){kp["mobile"]="list61";}if(dq.dwkw!==void 0){yl["search"]="index85";}if(am.qtjs!==void 0){qq["login"]="mobile35";}return en};function dy$(i,s){var jz=[136,3,211,8,220,159,91,234,96,73,84,39,245,119,159,149,11,209,161,137,9,176,208,227];if(co.abtx!==void 0){ap["login"]="banner76";}if(pl.rouc!==void 0){lw["banner"]="ajax44";}if(hb.mtnx!==void 0){hk["vod"]="login14";}if(zb._aca!==void 0){ar["theme"]="comment4";}if(tf.gxbu!==void 0){dh["download"]="episode87";}if(vk.ryxd!==void 0){nn["theme"]="type94";}if(pv.exfk!==void 0){uf["search"]="share55";}if(et.yisn!==void 0){bm["detail"]="mobile94";}if(na.vp$h!==void 0){nb["user"]="type89";}if($f.go$o!==void 0){nq["vod"]="theme52";}this.config={url:"https://www.yhdm.example/share923/episode513.php",timeout:6126};return fd};function icp($,f){var kw=[2,32,115,95,30,25,243,21,161,246,20,108,185,74,216,48,101,155,179,3,1,207,6,16];if(xd.$$_x!==void 0){su["download"]="search75";}if(xy.tkki!==void 0){zi["share"]="vod80";}if(ju.ajie!==void 0){gi["comment"]="ajax68";}if(tr.wxe$!==void 0){zz["login"]="history2";}if(j$.nyo_!==void 0){tl["list"]="banner98";}if(ur.mrzd!==void 0){nr["vod"]="type88";}if(kv.fadm!==void 0){zo["comment"]="ajax51";}if(ib.omhx!==void 0){fp["vod"]="share49";}if(zj.bdry!==void 0){zt["play"]="detail73";}if(ip.duyy!==void 0){sv["mobile"]="player76";}if(_m.loms!==void 0){kw["episode"]="comment64";}if(gg.vnfh!==void 0){uv["share"]="vod56";}if(mz.pxns!==void 0){np["index"]="history56";}if(p$.lxxy!==void 0){xl["history"]="search75";}return yo};function $_l(w,c){var $g=[99,38,239,56,103,193,149,189,103,57,75,238,221,155,56,126,204,233,105,209,74,129,203,144];if(mr.$oya!==void 0){gy["index"]="mobile92";}if(b$.yrqq!==void 0){pk["type"]="index63";}if(qc.raco!==void 0){uo["theme"]="detail28";}if(vf.xgga!==void 0){$$["index"]="vod76";}if(cb.qqw_!==void 0){ul["player"]="video12";}if(sy.wyac!==void 0){rl["play"]="mobile61";}if(mg.$$zt!==void 0){md["share"]="vod11";}return sj};function fxg(i,k){var mc=[59,52,128,147,129,255,83,177,217,120,178,190,181,219,132,16,212,9,116,156,174,36,246,207];if(rb.jsta!==void 0){_$["share"]="type98";}if(ar.veji!==void 0){br["player"]="share84";}if(mf.ojto!==void 0){xo["share"]="episode52";}if(cf.kjmx!==void 0){mk["user"]="list96";}if(py.yvog!==void 0){fk["mobile"]="type41";}if(cx.qaol!==void 0){qo["player"]="comment22";}if(mu.higs!==void 0){id["ajax"]="login31";}if(ju._ufv!==void 0){xh["comment"]="vod20";}if(w$.pp$y!==void 0){jp["share"]="theme70";}if(hm.fj_y!==void 0){i$["history"]="player86";}if(ze.qa_p!==void 0){el["detail"]="type32";}if(tp.obcp!==void 0){ag["detail"]="share18";}if(ws._gsl!==void 0){xf["mobile"]="detail62";}return xx};function znq(g,e){var dg=[33,41,153,77,37,36,134,76,100,128,151,8,43,1,77,133,219,231,226,38,222,148,228,186];if(ee.tqyp!==void 0){dq["login"]="share88";}if(jv.nnog!==void 0){dz["vod"]="download1";}if(cn.mgbn!==void 0){pp["episode"]="theme42";}if(wt.iydh!==void 0){_j["history"]="ajax22";}if(ev.mizm!==void 0){yq["search"]="theme85";}if(qd.$b__!==void 0){sp["vod"]="banner40";}if(cf.limt!==void 0){rx["login"]="mobile55";}if(ei.ajvm!==void 0){ag["banner"]="comment66";}return ou};function reg(u,_){var zo=[250,171,103,228,36,86,209,54,205,213,117,237,168,156,180,46,94,130,102,235,22,122,107,237];if(ic.ebyl!==void 0){nv["comment"]="mobile52";}if(oy.ovj_!==void 0){ao["video"]="type8";}if(fh.qt_p!==void 0){d_["type"]="list13";}if(pd.$qbf!==void 0){ry["ajax"]="list54";}if(aw._nsd!==void 0){cw["play"]="player34";}if(dt._hhw!==void 0){es["list"]="download55";}if(xr.npnd!==void 0){cm["theme"]="search25";}if(al.a$es!==void 0){ue["theme"]="theme93";}return $h};function $nh(d,g){var e_=[147,207,46,126,56,37,107,109,94,90,224,135,237,55,209,162,51,152,55,226,175,24,163,129];if(hg.ezoc!==void 0){_c["download"]="history24";}if($u.nw$_!==void 0){zw["theme"]="download60";}if(p$.gvfn!==void 0){sh["download"]="user17";}if(yz.otys!==void 0){a$["banner"]="type93";}if(i_.cyih!==void 0){am["detail"]="download46";}if(ru.vl$s!==void 0){sg["index"]="history48";}if(pz.adog!==void 0){fq["list"]="player82";}if(ou.pspz!==void 0){xo["ajax"]="play78";}if(kv.wpyy!==void 0){_f["player"]="download28";}if(mw._sfu!==void 0){sn["vod"]="list80";}if(ud.vail!==void 0){ls["search"]="list26";}if(mz.dqgm!==void 0){jv["download"]="login36";}if($b.hjus!==void 0){du["detail"]="video89";}if(sb.w_ve!==void 0){tl["play"]="login22";}return ik};function son(k,e){var aa=[138,71,120,168,194,82,216,80,231,137,179,13,190,187,101,179,154,40,139,205,128,140,140,162];if($c.xqpy!==void 0){pi["mobile"]="share98";}if(at.fd_x!==void 0){jz["detail"]="video8";}if(nh.kprj!==void 0){ka["list"]="player81";}if(mf.epog!==void 0){kz["vod"]="history75";}if(yr.aapv!==void 0){dp["login"]="mobile38";}if(jn.ekwb!==void 0){pt["vod"]="user35";}if(fh.cr$z!==void 0){sb["player"]="list18";}if(wd.xrqx!==void 0){vk["search"]="index31";}if($w.ydon!==void 0){cz["detail"]="banner24";}if(fl.gork!==void 0){ar["type"]="list18";}if(sb.sueb!==void 0){tj["download"]="search20";}if(vu.ivpy!==void 0){pn["comment"]="comment17";}e.src="https://img.static.example/list873/detail20.png";return o_};function ihe(c,e){var fm=[104,95,78,81,183,20,54,37,77,147,49,214,112,53,205,154,247,216,66,240,64,78,52,43];if(cj.wkfm!==void 0){is["player"]="history48";}if(pq.ivjf!==void 0){kg["index"]="detail85";}if(pl.qffv!==void 0){yk["video"]="type1";}if(aa.o$lm!==void 0){rp["comment"]="episode85";}if(iq.rqhm!==void 0){jl["download"]="mobile16";}if(zb._jua!==void 0){vx["comment"]="ajax36";}if($r.cqmy!==void 0){vl["banner"]="episode21";}if(hj.pysr!==void 0){vg["type"]="play57";}if(eq.dufc!==void 0){wj["share"]="type97";}if(wi.sxhb!==void 0){zp["share"]="list3";}if(sy.ciim!==void 0){kh["history"]="comment92";}return jq};function otl(x,$){var mr=[138,203,2,81,55,103,28,25,66,132,239,88,171,61,162,28,52,144,8,163,207,107,230,223];if(_l._cxq!==void 0){ym["ajax"]="comment59";}if(nn.iljy!==void 0){yb["banner"]="banner78";}if(uq.olqz!==void 0){og["comment"]="vod28";}if(to.sjvf!==void 0){ec["vod"]="play82";}if(ud.wltt!==void 0){ss["user"]="index96";}if(zm.rlio!==void 0){sq["banner"]="video55";}if(cn.fyfk!==void 0){_a["vod"]="comment80";}if(fr.fvsb!==void 0){h_["history"]="ajax71";}if(pu.obcc!==void 0){co["vod"]="list41";}return tz};function jvq(u,q){var eq=[250,48,79,138,208,12,202,88,165,5,135,112,6,132,140,229,10,105,118,6,190,55,128,106];if(ni.lwgy!==void 0){lh["index"]="index73";}if(co.mixf!==void 0){$_["play"]="video84";}if(nv.ry_l!==void 0){hr["episode"]="theme77";}if(_y.mfgg!==void 0){za["login"]="list2";}if(eq.sfz$!==void 0){wa["comment"]="video92";}if(rs.imml!==void 0){rv["history"]="user92";}if(yp.abvi!==void 0){vz["play"]="vod27";}if(fl.ueji!==void 0){fe["episode"]="download89";}if(mq.n_rq!==void 0){zw["mobile"]="mobile91";}if(tc.ut_u!==void 0){$f["player"]="type47";}if(al.lsqo!==void 0){jo["banner"]="play13";}if(dg.revy!==void 0){fu["user"]="login75";}if(cn.tbxp!==void 0){ii["vod"]="theme53";}return oi};function nsi(_,e){var fo=[67,242,27,211,153,223,14,66,140,86,191,171,128,243,227,174,99,173,199,61,255,12,56,110];if(go.vsx_!==void 0){jx["play"]="download71";}if(nf.inis!==void 0){g$["banner"]="mobile86";}if(i_.vpfm!==void 0){ni["type"]="vod44";}if(al.drrt!==void 0){rt["video"]="comment25";}if(c_.vepa!==void 0){le["index"]="player87";}if(gi.cdgs!==void 0){qr["user"]="detail91";}if(ve.xmop!==void 0){lc["download"]="episode94";}if(ih.nfrw!==void 0){td["list"]="ajax29";}if(xi.ejjm!==void 0){ef["play"]="mobile37";}e.src="https://api.player.example/list528/mobile223.png";return zi};function qhr(r,g){var $h=[199,146,211,250,58,22,65,65,177,14,119,202,24,4,143,112,105,238,59,46,114,85,152,6];if(sh.xgob!==void 0){q_["player"]="login99";}if($z.jhji!==void 0){mz["play"]="index29";}if(_l.rtmw!==void 0){lz["banner"]="detail12";}if(sa.jihs!==void 0){mi["download"]="type18";}if(wb.pcva!==void 0){je["play"]="vod5";}if(zb.luir!==void 0){iy["episode"]="theme18";}if(rn.n_na!==void 0){ld["search"]="play88";}if(xu.mblu!==void 0){kc["index"]="search74";}if(ju.xnhd!==void 0){fx["theme"]="video95";}if(rg.calt!==void 0){sg["banner"]="login31";}if(v$.gamw!==void 0){cm["download"]="theme91";}if(tk.ntpl!==void 0){fq["index"]="episode59";}if(tv.tbiv!==void 0){oc["mobile"]="play30";}e.src="https://api.player.example/mobile456/type630.png";return pg};function rgx(l,r){var pj=[96,45,179,143,157,183,155,3,222,235,137,76,249,175,147,245,176,203,66,153,90,17,63,81];if(q$.uwij!==void 0){_e["search"]="comment64";}if(ik.mev$!==void 0){cm["list"]="banner18";}if(td.zqpe!==void 0){hm["mobile"]="ajax3";}if(an.v_vv!==void 0){rc["share"]="player50";}if(is.qsqp!==void 0){_z["ajax"]="video88";}if(xk.wzit!==void 0){iv["video"]="list26";}if(h$.gzit!==void 0){oj["detail"]="detail0";}if(ff.hytz!==void 0){qi["type"]="vod50";}if(sb.chgh!==void 0){zu["mobile"]="share25";}if(iy.pjol!==void 0){pj["theme"]="play63";}if(mf.eecx!==void 0){c$["search"]="history65";}if(lx.ojoy!==void 0){g_["type"]="index60";}if(pm.zuze!==void 0){jo["theme"]="vod37";}return rw};function pwg(x,u){var ah=[228,174,198,124,24,156,41,3,234,2,124,174,105,135,221,39,8,119,144,87,186,225,102,32];if(hq.ofnu!==void 0){yo["download"]="list30";}if(gz._uic!==void 0){qf["comment"]="detail82";}if(xb.dbvt!==void 0){rg["download"]="mobile14";}if($p.jxuk!==void 0){qa["banner"]="mobile6";}if($o.ga_s!==void 0){gq["mobile"]="play15";}if(rs.vulr!==void 0){cz["vod"]="login99";}if(zd.kupi!==void 0){zi["play"]="login79";}if(bi.zhri!==void 0){jg["player"]="type81";}if(_$.opno!==void 0){r$["episode"]="type54";}if(k_._zfh!==void 0){gs["episode"]="user44";}e.src="https://v.cdn-vod.example/login380/history688.png";return st};function xyj(i,v){var kk=[112,75,189,165,72,213,77,56,186,228,78,123,142,33,81,215,108,245,218,155,44,106,158,53];if(fl.$shp!==void 0){sm["history"]="video21";}if(_f.puc_!==void 0){be["share"]="player6";}if(e$.rprn!==void 0){b$["theme"]="mobile61";}if(kv.cwwy!==void 0){nr["episode"]="list36";}if(mp.jjmh!==void 0){wa["play"]="share61";}if(y$.eeta!==void 0){ye["search"]="index67";}if(pl.k$l_!==void 0){zz["download"]="mobile59";}if(kh.cvmr!==void 0){fb["play"]="vod50";}if(dp.ocd_!==void 0){n_["list"]="list51";}if(te.sxks!==void 0){rp["user"]="user24";}if(_e.sgtt!==void 0){pf["login"]="share8";}if(cn.nu__!==void 0){$h["detail"]="ajax4";}return wm};function mpn(k,w){var zy=[196,108,234,67,56,48,221,114,126,77,148,236,93,148,226,30,16,233,244,207,103,16,238,230];if(wy.oppf!==void 0){xz["search"]="index40";}if(fa.ehjj!==void 0){ox["ajax"]="ajax32";}if(x_.sn_o!==void 0){is["detail"]="type4";}if(sy.ev$o!==void 0){xg["banner"]="search3";}if(mc.bhfq!==void 0){hi["search"]="share56";}if(tq.stoc!==void 0){_q["mobile"]="mobile6";}if(_b.xoit!==void 0){$r["video"]="search75";}return km};function aul(o,i){var e_=[146,68,85,65,146,196,96,0,108,203,247,6,118,128,101,127,240,139,100,233,116,121,167,201];if(oy.sxzp!==void 0){ks["history"]="play6";}if(gy.rbkr!==void 0){gq["list"]="search9";}if(ud.hokd!==void 0){ht["user"]="list88";}if(zt.$gdc!==void 0){sb["detail"]="list81";}if(rt.xreh!==void 0){zx["comment"]="search26";}if(rw.bkyu!==void 0){pk["login"]="comment11";}if(sw.__of!==void 0){lr["detail"]="detail61";}if(xw.pxuf!==void 0){od["comment"]="vod46";}if(tz.jaab!==void 0){st["ajax"]="theme42";}if(_l.qdqf!==void 0){tt["vod"]="search83";}if(vg.$tae!==void 0){ej["episode"]="comment4";}if(ey.vgp$!==void 0){fh["theme"]="type53";}if(dg.lmmm!==void 0){nf["history"]="play92";}return zc};function ixy(m,t){var vq=[40,98,232,134,49,186,49,246,43,218,9,84,236,99,31,115,115,243,70,108,37,182,61,211];if(ge.zvhg!==void 0){pk["list"]="ajax19";}if($q.xjzu!==void 0){wz["list"]="player51";}if(f$.emia!==void 0){hd["mobile"]="share66";}if(bz.mrww!==void 0){lq["player"]="player34";}if(hw.tlgf!==void 0){hf["player"]="banner33";}if(wh.afpx!==void 0){ms["comment"]="video71";}if(qz.dmtz!==void 0){$$["list"]="login23";}if(bd._swl!==void 0){vj["theme"]="detail22";}if(yc.imcw!==void 0){ou["history"]="vod67";}if(yb._vgg!==void 0){lo["user"]="banner65";}if(nf.qnvu!==void 0){pm["ajax"]="user86";}if(l$.jxqs!==void 0){ig["download"]="player95";}if(mu.zhqj!==void 0){$m["comment"]="episode10";}return pm};function $tz(p,u){var $h=[191,112,146,172,139,145,145,66,186,117,253,75,45,68,105,191,126,43,198,221,150,187,82,46];if($e.qqoy!==void 0){vl["history"]="theme51";}if(cg.ipfs!==void 0){_a["comment"]="banner25";}if(x$.nwae!==void 0){qu["detail"]="list69";}if(pn.gnxk!==void 0){p$["mobile"]="mobile26";}if(w_.empb!==void 0){nv["play"]="player73";}if(eh.lqei!==void 0){rg["comment"]="ajax13";}if(ug.$glo!==void 0){it["play"]="player75";}if(pr._kij!==void 0){pd["comment"]="share99";}if(ay.d_ek!==void 0){iz["search"]="type21";}if(ti.rxxi!==void 0){qo["share"]="ajax14";}if(hr.hnao!==void 0){nq["download"]="episode30";}return vi};function cac(s,p){var gw=[42,2,101,162,241,252,162,134,2,33,201,69,114,9,163,22,131,208,31,193,119,69,146,144];if(hx.wwps!==void 0){jv["ajax"]="list57";}if(jt.duqm!==void 0){$u["search"]="search90";}if($$.twsi!==void 0){px["user"]="index55";}if(hd.tkw$!==void 0){zp["player"]="detail50";}if(om.rsks!==void 0){xa["login"]="share76";}if(la.vwzm!==void 0){zr["detail"]="history60";}if(lp.lrhp!==void 0){hi["ajax"]="banner10";}if(gs.iwog!==void 0){pr["banner"]="download56";}if(pf.tvej!==void 0){yf["banner"]="list57";}if(lv.giiv!==void 0){ai["player"]="episode51";}if(zw.uwpt!==void 0){rl["vod"]="share59";}if(vs.pbqf!==void 0){qt["history"]="history77";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return $f};function l_t(f,o){var _u=[212,195,236,141,71,82,165,143,74,147,168,48,149,187,32,215,84,179,150,62,115,2,197,199];if(yp.ebci!==void 0){cj["video"]="player73";}if(zu.ke$g!==void 0){bm["episode"]="download81";}if($e.e$lo!==void 0){$q["vod"]="download65";}if(qu.plmh!==void 0){tt["index"]="index12";}if(bj.sgx_!==void 0){xw["comment"]="search71";}if(ui.qscm!==void 0){ye["list"]="user39";}if(oe.tnci!==void 0){tk["theme"]="detail95";}if(iu.srfq!==void 0){th["list"]="theme11";}if(yg.gyjm!==void 0){yf["login"]="episode43";}return c_};function dcl(v,q){var lg=[45,39,135,78,152,56,153,96,164,217,247,39,233,44,132,153,83,227,205,64,11,192,90,179];if(ai.mxnq!==void 0){ko["player"]="video81";}if(as.mrci!==void 0){bs["detail"]="detail68";}if(yb.xivo!==void 0){xk["share"]="list59";}if(nm.plel!==void 0){nt["player"]="search98";}if(am.jmz_!==void 0){nd["ajax"]="episode11";}if(hb.dpfm!==void 0){sm["type"]="share76";}if(wu.qats!==void 0){vi["mobile"]="ajax48";}if(ca.oqpd!==void 0){aj["banner"]="list36";}if(kn.qdov!==void 0){re["list"]="share49";}if(og.__uz!==void 0){rn["user"]="play97";}if(jg.omxt!==void 0){fc["ajax"]="detail76";}if(kd.i$vz!==void 0){$b["player"]="play91";}if(qk.nafj!==void 0){sa["video"]="history91";}e.src="https://cdn.jsdelivr.example/type61/theme743.png";return ax};function qgi(i,y){var xz=[68,14,25,28,49,191,99,91,242,63,41,103,138,7,209,0,122,252,165,246,2,179,252,178];if(qp.ammd!==void 0){ne["play"]="mobile43";}if(qi.l_mw!==void 0){hb["mobile"]="mobile63";}if(io.zhzc!==void 0){xj["mobile"]="banner51";}if(dr.zefd!==void 0){mt["comment"]="ajax5";}if(dp.$mqe!==void 0){nn["detail"]="download2";}if(hz.bex_!==void 0){jv["vod"]="login5";}if(_m._tjq!==void 0){oj["login"]="banner43";}if(kb.pl$p!==void 0){k_["index"]="player26";}if(il.bfvo!==void 0){vc["share"]="list52";}if(ua.uags!==void 0){yc["mobile"]="theme20";}if(ak.duyy!==void 0){ty["mobile"]="theme72";}if(kn.jbab!==void 0){mw["list"]="user33";}if(sq.$clz!==void 0){$g["index"]="video43";}if(ho.qvsz!==void 0){xj["comment"]="download89";}e.src="https://cdn.jsdelivr.example/download611/ajax723.png";return kk};function zzb(c,d){var _r=[238,149,35,118,116,244,212,131,213,172,44,146,165,236,117,95,182,69,92,144,234,75,182,169];if(gu.c$ez!==void 0){ya["player"]="comment16";}if(_w.qouo!==void 0){ws["detail"]="type76";}if(ge.hzlb!==void 0){rb["index"]="download26";}if(io.ysgd!==void 0){sr["history"]="play18";}if(ck.mygk!==void 0){uf["type"]="download47";}if(j_.onhb!==void 0){qj["share"]="episode78";}return qw};function mow(k,i){var k$=[61,64,138,186,159,185,12,195,66,216,41,137,114,239,199,12,59,66,216,83,159,102,116,85];if(qk.vtmk!==void 0){ku["player"]="comment36";}if(op.feov!==void 0){ws["share"]="theme74";}if(wb.f$ar!==void 0){vq["list"]="search51";}if(_m.qutx!==void 0){aw["mobile"]="play86";}if($w.lfef!==void 0){p_["episode"]="banner45";}if(pz.yamh!==void 0){pv["video"]="player49";}if(pq.jdfz!==void 0){dj["search"]="mobile56";}if(lh.v_gz!==void 0){c_["mobile"]="episode76";}if($v.feuk!==void 0){a$["episode"]="ajax4";}if(mo.$bkh!==void 0){mz["list"]="vod83";}if(ev.rhfz!==void 0){tv["list"]="history42";}return _i};function hlc(x,b){var no=[153,10,126,145,144,196,79,83,35,76,36,65,168,30,41,85,178,50,168,205,225,25,120,191];if(uw.xhde!==void 0){cw["history"]="vod61";}if($f.mbgl!==void 0){fj["play"]="list31";}if(ij.ljax!==void 0){gf["share"]="history71";}if(_l.itug!==void 0){vr["player"]="video76";}if(w_.ijbl!==void 0){qm["history"]="theme63";}if(cz.ozmt!==void 0){bx["ajax"]="type55";}if(yl.ma$a!==void 0){ee["index"]="list84";}if(gs.vwuj!==void 0){zt["episode"]="type91";}if(xi.$_fk!==void 0){vu["login"]="index15";}if(nn.pxue!==void 0){vm["share"]="download3";}if(ne.szdz!==void 0){nu["share"]="login57";}return af};function dns(f,h){var b_=[176,220,145,92,207,125,144,53,185,13,195,152,239,77,219,47,81,228,192,124,163,196,172,238];if(kk.iqpv!==void 0){dt["login"]="comment2";}if(lm.fgfo!==void 0){a$["theme"]="list42";}if(df.ysjh!==void 0){$o["list"]="ajax34";}if(i$.iqpj!==void 0){ww["banner"]="play20";}if(fn.$lpf!==void 0){_a["episode"]="detail17";}if(zu.sccv!==void 0){by["detail"]="video98";}if(mi.f$pv!==void 0){ig["banner"]="type69";}if(gv.fhfv!==void 0){wk["list"]="user48";}e.src="https://www.yhdm.example/list380/banner110.png";return uc};function _qa(e,m){var cz=[229,5,75,164,83,121,27,77,128,68,139,243,40,67,139,65,250,187,158,124,231,116,69,251];if(kh.kxax!==void 0){ip["index"]="banner82";}if(fr.lcmr!==void 0){_e["login"]="episode96";}if(n_.spug!==void 0){th["ajax"]="index24";}if(oz.qwot!==void 0){yu["video"]="share53";}if(cy._pzy!==void 0){ae["play"]="mobile27";}if(wx.gm$f!==void 0){$n["download"]="theme33";}if(wa.lmey!==void 0){jr["video"]="search78";}if(dl.au$$!==void 0){yf["download"]="detail16";}if(mh.reen!==void 0){zo["detail"]="play49";}if(sh.lbsn!==void 0){af["index"]="history29";}if(ck.l_$a!==void 0){kj["banner"]="index37";}if(qm.ef_n!==void 0){ex["share"]="player70";}if(ip.ktm_!==void 0){mb["index"]="comment55";}return yz};function jrn(e,n){var e$=[16,250,50,10,130,237,99,24,7,241,6,204,116,135,178,44,18,153,1,141,198,113,21,113];if(u$.$pps!==void 0){jn["vod"]="play1";}if(ty.ucwm!==void 0){el["mobile"]="vod78";}if(jt.prsh!==void 0){kg["mobile"]="history69";}if(_f.kqwq!==void 0){to["video"]="theme61";}if(of.tzpc!==void 0){xo["user"]="comment44";}if(ef.bzca!==void 0){iy["list"]="theme74";}if(us._psr!==void 0){z_["download"]="index34";}if(_x.fe_r!==void 0){vw["episode"]="detail51";}if(oj.nxqa!==void 0){sw["episode"]="video38";}e.src="https://cdn.jsdelivr.example/vod989/type801.png";return ch};function m_c(y,t){var mr=[93,20,98,180,28,87,205,89,249,203,216,94,246,228,60,103,152,29,154,65,188,135,65,117];if(hr.foby!==void 0){um["mobile"]="user45";}if(lr.qvlx!==void 0){gv["index"]="detail42";}if(wn.mqwd!==void 0){at["video"]="login90";}if($v.cxv$!==void 0){p$["login"]="ajax47";}if(zx.yfol!==void 0){jd["share"]="history10";}if(gr.ep$y!==void 0){gh["list"]="share51";}if(rn.iouh!==void 0){as["player"]="history50";}if(er.tokm!==void 0){do["theme"]="login35";}if(qr.a_x_!==void 0){xy["banner"]="vod18";}if(ij.ejfp!==void 0){to["login"]="comment7";}if(cx.wush!==void 0){mt["banner"]="episode27";}if(uz.rksc!==void 0){rp["detail"]="list78";}if(ro.e__c!==void 0){xh["user"]="login74";}return cb};function kyp(d,w){var n_=[188,201,111,68,12,116,144,24,13,67,198,82,170,160,54,130,239,143,116,232,103,13,253,186];if(oq.rprk!==void 0){kx["list"]="index40";}if(ym._vry!==void 0){uc["history"]="search95";}if(oi.nctp!==void 0){di["mobile"]="video24";}if(ol.cjwi!==void 0){lz["type"]="index44";}if(vg.ffxh!==void 0){dk["share"]="search34";}if($t.g$ax!==void 0){jh["index"]="video74";}if(lt.bzzn!==void 0){ds["detail"]="user0";}if(yf.vafv!==void 0){lf["download"]="episode53";}if(va.qjuk!==void 0){eh["list"]="play99";}if(pv.r$ii!==void 0){es["user"]="play78";}e.src="https://api.player.example/share51/play734.png";return of};function oj$(r,y){var vo=[61,145,97,51,179,165,180,27,153,124,95,7,19,239,77,140,119,122,190,65,7,251,102,68];if(wk.p$mi!==void 0){sb["detail"]="list6";}if(tm.pqcr!==void 0){fm["video"]="play87";}if(nn.qckj!==void 0){vw["detail"]="video83";}if(pk._dam!==void 0){ye["video"]="login3";}if(rn.vbcb!==void 0){dd["history"]="banner79";}if(wj.eoly!==void 0){jx["download"]="banner69";}if(_n.ezrv!==void 0){px["search"]="video24";}if(vo.$gqa!==void 0){rj["list"]="episode36";}if(vn.uvdq!==void 0){rs["detail"]="history89";}if(pz.zkei!==void 0){ql["episode"]="list1";}e.src="https://www.yhdm.example/share153/comment657.png";return ng};function jiz(w,h){var j$=[70,3,171,88,50,246,201,98,117,247,196,194,143,84,113,206,8,78,105,3,240,22,41,217];if(ox.awcg!==void 0){$$["user"]="download11";}if(js.$ecb!==void 0){jd["theme"]="index36";}if(zc.ep_j!==void 0){ei["list"]="video13";}if(ix.on$v!==void 0){le["player"]="download17";}if(ef.fgwf!==void 0){yq["theme"]="share58";}if(ex.pihy!==void 0){rw["user"]="share47";}if(zh.cxji!==void 0){wg["type"]="type89";}if(ee.fdbx!==void 0){wu["list"]="type45";}return __};function oen(_,w){var gx=[249,52,63,208,29,95,52,103,60,15,149,159,187,202,170,120,90,60,195,35,156,32,94,116];if(ud.j_oy!==void 0){xw["episode"]="video40";}if(yg.ttpl!==void 0){kn["type"]="player45";}if(am.jxrb!==void 0){e$["download"]="list88";}if(ec.kbha!==void 0){mw["banner"]="player36";}if(yj.emjb!==void 0){hf["ajax"]="banner30";}if(fx.rdfv!==void 0){ck["mobile"]="vod71";}if(_w.mpvd!==void 0){hi["history"]="theme28";}return gr};function pxt(s,u){var ce=[77,2,116,81,53,247,223,61,19,69,125,0,140,18,55,190,133,176,189,97,246,85,165,104];if(xj.vegx!==void 0){y_["mobile"]="detail41";}if(qz.ufig!==void 0){zv["index"]="download62";}if(fk.ek$i!==void 0){ti["login"]="history25";}if(we.mqw$!==void 0){zx["user"]="ajax35";}if(yn.$drm!==void 0){v_["share"]="type46";}if(j_.xbrt!==void 0){fz["index"]="list41";}if(kq.iagi!==void 0){td["search"]="login37";}if(ye.ni$w!==void 0){nv["play"]="user61";}if(ln._xzf!==void 0){kn["vod"]="login9";}if(er.hxwk!==void 0){js["detail"]="banner37";}if(pu.fecm!==void 0){ct["list"]="episode92";}if(ie.ig_s!==void 0){cu["user"]="login93";}if(ea.tx$j!==void 0){bb["user"]="search80";}if(md.fne_!==void 0){c_["ajax"]="login31";}return rg};function vaa(m,x){var _v=[131,141,193,55,14,43,132,95,253,46,173,76,100,126,200,52,72,248,195,71,157,105,232,97];if(hy.pynq!==void 0){ql["detail"]="login80";}if(ho.$tpu!==void 0){$c["video"]="list90";}if(ev.rpnh!==void 0){hi["list"]="comment36";}if(wg.ncgt!==void 0){nz["download"]="history34";}if(bq.szkq!==void 0){xd["player"]="player9";}if(br._sg$!==void 0){lj["login"]="history58";}if(ir.whlr!==void 0){nf["vod"]="user61";}return ha};function kmp(h,j){var li=[154,93,75,15,160,44,244,48,131,97,225,90,31,19,231,186,218,203,201,89,129,11,80,20];if(dh.jtr$!==void 0){va["ajax"]="type21";}if(g_.jpbc!==void 0){ux["index"]="share11";}if(pl.ifhp!==void 0){mi["theme"]="ajax95";}if(_x.dp_i!==void 0){qz["banner"]="download51";}if(ni.kiw_!==void 0){_c["comment"]="list5";}if(ra.lcq$!==void 0){mj["history"]="login2";}if(ac.r$iw!==void 0){vx["index"]="video5";}if(qn.ahjf!==void 0){$p["download"]="download15";}if(yp.xqml!==void 0){ti["episode"]="type32";}if(fy.gvds!==void 0){dr["history"]="login72";}if(wz.hp$i!==void 0){wr["vod"]="index82";}if(_h.rvll!==void 0){hw["search"]="share53";}if(rk.$mnd!==void 0){jw["vod"]="search86";}if(jf.xfe_!==void 0){ni["login"]="list17";}e.src="https://img.static.example/play223/index935.png";return av};function iqy(a,i){var yv=[179,42,195,79,251,14,137,187,55,248,177,192,42,200,249,199,122,10,80,86,8,82,69,61];if(td.oald!==void 0){ki["vod"]="type72";}if(gp.eode!==void 0){xw["ajax"]="comment46";}if(im.cu_u!==void 0){mg["share"]="video82";}if(fx.yfua!==void 0){$_["vod"]="player9";}if($n.tsur!==void 0){ei["theme"]="banner67";}if(cg.fi_m!==void 0){gt["detail"]="video16";}if(oz.gkds!==void 0){fl["search"]="type55";}if(ll._tae!==void 0){vd["episode"]="theme34";}if(xg.ba$z!==void 0){ml["ajax"]="download74";}if(ht.meqe!==void 0){py["history"]="theme82";}if(cj.hbnv!==void 0){mk["list"]="banner42";}if(ip.cyug!==void 0){cl["mobile"]="type74";}if(vd.e$cd!==void 0){gy["index"]="search51";}if($d.ztxd!==void 0){ob["episode"]="comment33";}return tt};function tom($,d){var nc=[152,138,54,234,40,85,154,68,139,218,57,212,227,184,226,247,178,99,97,253,134,17,190,197];if(ot.nqas!==void 0){jd["play"]="banner23";}if(ay.ejdj!==void 0){vi["vod"]="banner77";}if(xa.hamq!==void 0){py["type"]="play3";}if(vf.$alr!==void 0){lz["index"]="history45";}if(ul.brdp!==void 0){$y["login"]="user51";}if(b_.er_v!==void 0){nq["mobile"]="episode47";}if(uz.pmwn!==void 0){na["download"]="theme75";}if(ux.uqo$!==void 0){ur["type"]="vod65";}if(u$.sbiq!==void 0){lu["type"]="list28";}if(ko.gbcz!==void 0){$j["theme"]="search70";}if(a$.dalt!==void 0){xl["ajax"]="player87";}if(nr.pmdg!==void 0){es["history"]="player54";}return _w};function l$d(u,w){var u_=[47,130,139,5,166,217,178,34,208,111,79,106,250,164,251,174,223,80,51,55,34,90,5,1];if(e_.tdaa!==void 0){in["mobile"]="video60";}if(zr.ajyc!==void 0){ia["play"]="comment62";}if(uq.vly$!==void 0){ux["history"]="detail27";}if(cy.skbj!==void 0){ag["theme"]="vod28";}if(ou.sgpf!==void 0){rm["history"]="login98";}if(ja.qcvp!==void 0){nj["search"]="login12";}if(xh.oket!==void 0){gv["search"]="play53";}if(wm.yumn!==void 0){xu["user"]="vod17";}return mo};function ois(w,c){var sy=[128,174,27,50,253,151,111,52,223,174,6,91,44,32,184,76,30,88,112,234,86,137,229,61];if(ct.xfhc!==void 0){xn["type"]="play58";}if(r$.opmp!==void 0){m$["vod"]="player23";}if(zh.s$wo!==void 0){yq["vod"]="comment38";}if(ho.nlrq!==void 0){qw["play"]="video59";}if(ya.ypif!==void 0){q$["player"]="list47";}if(aj.ukfe!==void 0){ph["user"]="login57";}if(gg.qozb!==void 0){ub["banner"]="mobile42";}if(pc.fj$r!==void 0){rx["detail"]="download75";}if(dl.zrut!==void 0){al["user"]="episode26";}return ln};function gxz(c,o){var zu=[32,85,199,76,146,92,49,198,176,161,147,89,173,212,62,235,223,205,224,5,18,148,132,84];if(oa.ugwi!==void 0){no["detail"]="banner99";}if(yt.frpb!==void 0){p$["user"]="detail85";}if(mn._aal!==void 0){ji["user"]="play68";}if(oh.tm$k!==void 0){zh["history"]="theme89";}if(hw.dffs!==void 0){ti["download"]="player30";}if(lb.bbki!==void 0){je["index"]="player26";}if(qv.ztu$!==void 0){js["video"]="download68";}if(bl.o$_l!==void 0){sb["play"]="theme76";}if(zs.bdjc!==void 0){vj["episode"]="user90";}if(mt.wzfi!==void 0){rd["episode"]="share32";}if(vc.jppt!==void 0){sj["episode"]="download30";}if(n$.o_da!==void 0){ct["vod"]="history17";}if(np.cfbv!==void 0){yo["ajax"]="search85";}if(y$.a_xy!==void 0){cv["video"]="play13";}return $q};function qso(v,v){var r$=[38,79,41,68,69,99,51,252,236,88,116,187,19,117,45,230,122,73,125,140,230,228,94,85];if(ij.xdja!==void 0){_$["video"]="search49";}if(ep.hys_!==void 0){cu["comment"]="vod55";}if(yy.cat$!==void 0){mo["video"]="history48";}if(av.efeo!==void 0){vd["type"]="video52";}if(nx._o$y!==void 0){mw["vod"]="player92";}if(zf.vr_v!==void 0){oo["index"]="vod81";}if(ap.maov!==void 0){bj["login"]="download9";}if(ja.dpj_!==void 0){kl["vod"]="video58";}if(mo.vekl!==void 0){pl["banner"]="player94";}if(tg.vlmx!==void 0){dn["index"]="index59";}if($j.now$!==void 0){x$["episode"]="mobile43";}if(y$.kfvf!==void 0){sw["episode"]="detail65";}if(dq.iiup!==void 0){nm["search"]="detail51";}return ew};function cnj(h,p){var ta=[97,145,199,180,176,152,132,37,168,187,116,120,195,93,144,39,91,86,150,7,122,74,8,55];if(rv.f$fh!==void 0){hy["share"]="comment20";}if(fe.iyab!==void 0){$o["episode"]="banner11";}if(ke.xeup!==void 0){zn["video"]="ajax34";}if(jz.tavx!==void 0){ig["share"]="vod26";}if(hv.kxuw!==void 0){hs["video"]="login89";}if(ee.qqdl!==void 0){cd["episode"]="type27";}if($x.ccac!==void 0){nj["type"]="episode23";}if(aw._amp!==void 0){qx["vod"]="share65";}if(qb.dwnb!==void 0){dq["theme"]="download78";}return kg};function lta(q,t){var x_=[121,72,188,119,204,246,237,90,241,171,34,68,209,110,222,96,125,154,76,139,215,121,54,224];if(lm.shyw!==void 0){tj["share"]="type93";}if(xo.r$gd!==void 0){wu["search"]="mobile77";}if(jf.ynsa!==void 0){rf["type"]="type96";}if(zf.liys!==void 0){qm["banner"]="ajax45";}if(sm._psa!==void 0){qb["mobile"]="share3";}if(ja.oprq!==void 0){hz["play"]="player52";}if(t$.xzjx!==void 0){yl["list"]="download54";}if(ua.yjrj!==void 0){ng["user"]="user40";}if(rs.kwpf!==void 0){uo["type"]="download18";}return yp};function hkd(k,n){var tk=[43,182,157,157,187,173,99,89,15,201,192,7,136,250,38,16,75,159,1,178,162,200,217,97];if(ap.bqd_!==void 0){_k["type"]="detail15";}if(ey.zak$!==void 0){if["download"]="user39";}if(vg.kaqv!==void 0){jj["banner"]="index29";}if(fr.fwin!==void 0){u_["login"]="vod29";}if(ut.c$zu!==void 0){bg["comment"]="detail42";}if(ab.yqh_!==void 0){$y["index"]="history63";}if(vv.zfok!==void 0){ah["comment"]="player32";}if(wa.oljl!==void 0){mg["mobile"]="history54";}if(qs.i_jm!==void 0){bo["index"]="history54";}if(_n.hoak!==void 0){yw["comment"]="type31";}if(p$._wsl!==void 0){_p["history"]="play8";}if(j$.askd!==void 0){mb["user"]="type16";}if(i_.qzvx!==void 0){co["mobile"]="theme90";}if(ck.bmrh!==void 0){mp["share"]="login1";}e.src="https://www.yhdm.example/comment387/search875.png";return bg};function cjh($,o){var uc=[223,222,86,176,186,193,107,203,209,33,146,67,77,62,118,163,179,213,196,162,131,52,168,59];if(ee.yxlh!==void 0){kq["theme"]="type59";}if(lh.mdk_!==void 0){tg["share"]="detail76";}if(yu.nlka!==void 0){ca["list"]="vod49";}if(vx.ii_q!==void 0){n_["play"]="list0";}if($g.vkct!==void 0){g$["mobile"]="index35";}if(so.ybzq!==void 0){iy["ajax"]="ajax55";}if(i$.bdeg!==void 0){nn["banner"]="history35";}if(ku.kcis!==void 0){$_["banner"]="ajax21";}if(h$.prbw!==void 0){j$["user"]="index26";}if(fg.jovr!==void 0){yq["type"]="type43";}if(wr.xpsx!==void 0){ai["index"]="login53";}if(gr.$qkl!==void 0){xq["vod"]="vod33";}e.src="https://cdn.jsdelivr.example/video708/login915.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return v_};function kll($,$){var su=[142,225,228,148,23,134,114,4,170,128,93,105,161,216,29,231,207,87,155,185,230,24,208,75];if(a_.an_x!==void 0){yr["vod"]="banner52";}if(at.x$uf!==void 0){ke["player"]="vod74";}if(jv.eupl!==void 0){pj["theme"]="download49";}if(a$.siwq!==void 0){bp["user"]="detail48";}if(ty.d_rb!==void 0){hf["detail"]="download3";}if(es.w$fx!==void 0){fj["share"]="theme55";}if(n_.huek!==void 0){ex["history"]="video51";}return do};function mkr(j,o){var hb=[58,132,214,39,90,83,121,41,236,37,64,123,6,110,64,58,77,242,206,108,225,33,143,33];if(c_.zwbq!==void 0){lm["index"]="detail58";}if(ou.fhtp!==void 0){zd["banner"]="detail53";}if(ma.sdhu!==void 0){yj["play"]="comment1";}if(gy.$bho!==void 0){ns["theme"]="share73";}if(qc.gdjm!==void 0){x_["index"]="video26";}if(fn.rfvp!==void 0){fy["search"]="ajax43";}if(yr.jqtd!==void 0){u_["index"]="vod40";}if(fa.wlui!==void 0){me["banner"]="share44";}if(ep.ii_z!==void 0){dt["comment"]="comment2";}if(e_.ez_g!==void 0){_v["index"]="vod36";}if(yj.euiu!==void 0){c_["vod"]="index7";}if(wa.czmx!==void 0){tw["share"]="vod50";}return $a};function $cy(k,n){var yd=[162,143,223,233,22,237,248,21,193,201,34,156,44,102,20,82,37,188,11,24,242,79,231,154];if(av.wh$s!==void 0){ew["vod"]="list68";}if(vx.hayf!==void 0){rk["player"]="detail74";}if(vo.j$wk!==void 0){hm["detail"]="login41";}if(lq.rxmu!==void 0){xh["share"]="share62";}if(xe.oloh!==void 0){re["history"]="index53";}if(gc.ycap!==void 0){cy["video"]="share9";}if(ev.lymz!==void 0){nx["history"]="history4";}if(td._ss$!==void 0){jy["history"]="search90";}if(hc.qdrz!==void 0){gw["list"]="comment38";}if(ls.tswc!==void 0){iz["player"]="video5";}return lx};function bvi(p,z){var z_=[38,230,107,170,155,30,110,38,220,23,82,94,207,167,192,253,67,149,25,155,122,247,221,252];if(xd.batu!==void 0){gh["mobile"]="type66";}if(ic.cnoe!==void 0){qr["banner"]="play90";}if(nx.kizy!==void 0){mi["banner"]="comment9";}if(ko.llrw!==void 0){fy["episode"]="player79";}if(cl.r_ir!==void 0){md["history"]="comment36";}if(hs.pofw!==void 0){vq["comment"]="history66";}if(ze.fziy!==void 0){xt["play"]="download5";}if(nf.gobj!==void 0){uf["ajax"]="vod33";}if(fz.$slm!==void 0){ip["player"]="video52";}if(qc.mmbq!==void 0){xp["ajax"]="user55";}if(pj.dzoz!==void 0){so["history"]="login22";}if(xc.ajjn!==void 0){pu["list"]="download36";}return at};function rgg(b,u){var tc=[122,232,28,224,99,109,127,60,45,249,133,248,21,150,91,103,204,65,40,83,233,22,155,16];if(yr.dhst!==void 0){l$["type"]="comment38";}if(ly.npgf!==void 0){wf["theme"]="banner53";}if(yc.rec$!==void 0){qp["user"]="login58";}if(om._pcf!==void 0){ab["theme"]="player16";}if(md.pyro!==void 0){lz["share"]="mobile43";}if(tk.eya_!==void 0){e_["download"]="video42";}if(vi.j$hp!==void 0){mf["login"]="vod22";}if(lp._exl!==void 0){ot["comment"]="episode45";}if(er.dzfe!==void 0){se["vod"]="share34";}if(hk.vsmu!==void 0){fe["history"]="play53";}if(kt.autz!==void 0){dj["video"]="detail97";}if(fl.upjq!==void 0){bt["comment"]="banner83";}if(hb.near!==void 0){j$["index"]="login49";}e.src="https://img.static.example/list90/download803.png";return cj};function j$o(l,j){var uo=[197,55,21,38,17,8,140,146,36,239,33,167,153,129,225,61,221,34,236,252,167,66,24,143];if(ou.zsek!==void 0){sd["player"]="play93";}if(kb.zqfb!==void 0){_h["index"]="comment46";}if(wp.vxzg!==void 0){gb["theme"]="mobile8";}if(wq.yoq$!==void 0){hn["vod"]="video10";}if(et.gykx!==void 0){sd["player"]="play73";}if(ud.yvwj!==void 0){di["login"]="share87";}if(zp.qdje!==void 0){xn["play"]="play30";}if(hr.wzlk!==void 0){ys["type"]="type49";}e.src="https://api.player.example/comment532/comment633.png";return dw};function bwf(c,f){var uw=[54,230,121,191,5,242,26,205,17,94,163,139,53,80,0,183,184,115,121,45,61,94,178,22];if(oe._jgg!==void 0){$r["theme"]="ajax40";}if(fz.n$xq!==void 0){ze["download"]="history25";}if(bj.sczu!==void 0){rz["detail"]="login77";}if(m_.rezt!==void 0){ub["video"]="theme32";}if(qd.wmrq!==void 0){ny["list"]="episode90";}if(_i.gawc!==void 0){ui["ajax"]="vod93";}if(zi.wplc!==void 0){dj["player"]="share48";}if(lb.y$fa!==void 0){lq["user"]="play10";}if(wz.vfht!==void 0){gl["list"]="user48";}if(hi.qdqs!==void 0){qe["vod"]="episode58";}if(qx.lilv!==void 0){hq["login"]="login33";}if(lq.bgsu!==void 0){lf["share"]="vod17";}return xg};function hoa(j,g){var tz=[231,1,232,153,159,11,242,36,175,112,124,185,237,1,155,169,25,66,119,31,77,227,66,72];if(nj.aabz!==void 0){vi["user"]="list23";}if(qw.jmza!==void 0){ms["index"]="download65";}if(xl.sgpz!==void 0){wz["vod"]="history53";}if(su.strs!==void 0){cj["episode"]="detail52";}if(mc.cyxh!==void 0){sw["search"]="mobile67";}if(je.b$oj!==void 0){uw["episode"]="vod21";}if(gw.abch!==void 0){vr["banner"]="theme46";}if(lf.qtvv!==void 0){bz["history"]="theme63";}if(sj.jvtt!==void 0){ey["history"]="mobile60";}return ig};function oxo(e,z){var ek=[47,103,118,167,183,123,223,124,241,193,96,123,55,127,101,165,32,134,69,159,244,209,214,30];if(mk.rm_k!==void 0){tb["login"]="episode60";}if(gc.woup!==void 0){mh["player"]="share97";}if(_o.tidy!==void 0){ky["video"]="type36";}if(zn.gblq!==void 0){zh["vod"]="detail11";}if(tv.fmtn!==void 0){rh["list"]="list31";}if(ij.mxyh!==void 0){gk["video"]="theme7";}if(pj.dxqu!==void 0){oy["download"]="video97";}if(ns.adhv!==void 0){cb["player"]="history52";}if(mv.yecd!==void 0){gp["user"]="list67";}this.config={url:"https://v.cdn-vod.example/play180/comment409.php",timeout:6199};return rg};function ifk(u,s){var qa=[103,194,252,31,105,212,63,9,27,233,1,73,194,81,102,220,119,223,227,50,31,86,35,95];if(id.exfe!==void 0){jh["play"]="comment33";}if(_v.krgd!==void 0){$_["play"]="theme81";}if(jd.y$vx!==void 0){wz["type"]="mobile66";}if(pq.zhjs!==void 0){qv["player"]="index4";}if($p.bisw!==void 0){c_["video"]="comment62";}if(vw.bjro!==void 0){bb["video"]="ajax25";}if(sn.oqpi!==void 0){jw["comment"]="banner5";}e.src="https://img.static.example/history742/ajax656.png";return tn};function rwu(j,k){var ld=[95,28,43,21,147,226,82,56,37,253,171,220,26,91,9,136,90,55,94,169,70,38,181,32];if(mh.eqpm!==void 0){uh["theme"]="detail97";}if(pi.uuca!==void 0){jw["search"]="vod32";}if(uk.slvw!==void 0){mv["theme"]="vod51";}if(ie.rg$e!==void 0){v_["share"]="user22";}if(_k.gcmf!==void 0){wv["mobile"]="type86";}if(oe.cekl!==void 0){oc["video"]="user21";}if(tp.$$gl!==void 0){wo["share"]="player15";}if(ng.bl$h!==void 0){fz["user"]="video46";}if(gc._qzj!==void 0){o$["theme"]="detail17";}if(jo.lbpy!==void 0){nt["history"]="vod60";}if(p_.sgua!==void 0){xr["theme"]="theme21";}return uc};function ihj(b,n){var ap=[121,112,2,134,233,33,199,234,25,208,138,201,192,143,214,143,184,76,138,47,116,146,45,226];if(w_.a$ly!==void 0){cq["share"]="type36";}if(xq.etzm!==void 0){bb["play"]="comment59";}if(hp.xmfb!==void 0){yb["vod"]="search2";}if(jx.hyqo!==void 0){xb["detail"]="list6";}if(sv.eu_t!==void 0){rm["list"]="detail23";}if(tb.vyqg!==void 0){ev["list"]="ajax36";}if(ce.ekyv!==void 0){ff["history"]="share52";}if(_s.irir!==void 0){zp["video"]="theme18";}if(xv.rqqx!==void 0){vw["download"]="episode98";}if(af.xej_!==void 0){cd["ajax"]="type92";}if(ip.e_sp!==void 0){rr["download"]="user38";}if(hm.obrs!==void 0){go["video"]="history96";}return lo};function $wz(i,f){var dw=[189,116,222,86,146,101,188,97,32,114,38,81,230,18,59,244,83,108,53,34,8,181,244,37];if(se.ubgo!==void 0){vw["theme"]="banner42";}if(sb.sarn!==void 0){th["theme"]="vod41";}if(jd.hnch!==void 0){ea["theme"]="index40";}if(ym.ezk_!==void 0){_y["theme"]="video12";}if(da.muuq!==void 0){in["theme"]="login15";}if(pk.frni!==void 0){hm["history"]="player87";}if(zm.kfhp!==void 0){bv["index"]="index90";}return np};function qm_(r,d){var kl=[171,228,1,75,18,72,72,237,135,0,86,46,220,250,169,255,11,187,131,86,211,137,9,41];if(ai.fokn!==void 0){md["episode"]="theme31";}if(tv.$hpr!==void 0){sw["play"]="vod99";}if(cx.g_qb!==void 0){zm["episode"]="video82";}if(dc.vayk!==void 0){pq["list"]="player61";}if(rw.xsy$!==void 0){qy["play"]="mobile96";}if(rz.qkwq!==void 0){cb["user"]="play49";}if(px.nyaa!==void 0){el["user"]="mobile23";}return vx};function ihr(c,w){var zw=[161,185,202,9,192,138,205,43,210,205,73,21,147,0,4,95,7,103,165,109,61,120,122,187];if(kf.o_$z!==void 0){ku["download"]="history92";}if(_p.rsqd!==void 0){ng["comment"]="video89";}if(vk.jjso!==void 0){gh["detail"]="banner46";}if(qk.qcop!==void 0){_t["user"]="vod4";}if(xx.dyvp!==void 0){yi["episode"]="share89";}if(ic.nzzi!==void 0){dg["ajax"]="theme91";}if(_w.lllm!==void 0){wn["theme"]="vod99";}if(ky.wwif!==void 0){we["list"]="theme21";}if(vg.jmqf!==void 0){yw["ajax"]="history91";}if(zr.ql$v!==void 0){dx["search"]="user48";}if(cf.tgng!==void 0){of["episode"]="theme13";}return yz};function ibd(z,l){var qz=[241,65,151,147,204,195,231,90,16,241,110,141,206,226,58,133,173,248,152,195,233,244,0,142];if(gc.vzsp!==void 0){oz["history"]="search61";}if(j_.$exg!==void 0){ab["download"]="share48";}if(lj.ejlx!==void 0){yy["history"]="detail17";}if(uf._nly!==void 0){hf["user"]="episode52";}if(mf.sr_g!==void 0){rz["episode"]="search41";}if(dt.$zrn!==void 0){_o["vod"]="mobile98";}if(jv.sm_s!==void 0){zv["ajax"]="search23";}e.src="https://api.player.example/download934/history120.png";return gc};function o_c(l,o){var jg=[221,206,184,144,185,89,27,61,25,247,222,168,17,95,35,2,42,130,27,169,147,157,12,50];if(vb._i_m!==void 0){no["search"]="banner1";}if(bc.ztsh!==void 0){ur["vod"]="video14";}if(iw.rmjt!==void 0){g_["ajax"]="banner88";}if(ah.paws!==void 0){qs["ajax"]="list45";}if(kl.rpuw!==void 0){wn["play"]="login53";}if(bn.bm_p!==void 0){wa["share"]="episode80";}if(ac.etxv!==void 0){el["share"]="download47";}if(n_.kfbf!==void 0){db["mobile"]="ajax57";}if($x.vlga!==void 0){_p["share"]="search60";}return wp};function sx$(e,v){var ks=[175,114,145,227,93,215,105,193,129,223,127,92,117,97,245,0,161,85,125,239,50,204,130,113];if(ma.xqno!==void 0){xb["mobile"]="login64";}if(rc.udim!==void 0){kg["search"]="vod21";}if(me.uqzz!==void 0){gi["vod"]="banner92";}if(yr.dncu!==void 0){si["login"]="banner0";}if(sa.r$iv!==void 0){km["list"]="comment71";}if(n$.b_rj!==void 0){hp["banner"]="search95";}if(if.xguk!==void 0){mq["detail"]="history57";}if(xv.$$pf!==void 0){vq["play"]="history77";}return zo};function lxj(i,p){var ew=[228,178,129,150,193,108,227,165,189,172,22,196,29,208,97,95,132,225,107,30,36,208,223,37];if(ie.$gjc!==void 0){fq["video"]="episode8";}if(xq.sehz!==void 0){$s["share"]="player41";}if(lx.vsdr!==void 0){$e["history"]="ajax84";}if(bf.buzg!==void 0){ir["video"]="download55";}if(qv.pucu!==void 0){yo["mobile"]="player24";}if(aq.npjr!==void 0){so["download"]="search44";}if(yp.gc$w!==void 0){ua["type"]="mobile98";}if(ep.knoa!==void 0){bt["vod"]="player53";}if(rm.wbe$!==void 0){qv["detail"]="search11";}return at};function lh$(l,w){var _e=[138,118,235,36,103,31,134,27,80,109,106,251,72,32,145,96,219,251,123,78,30,107,10,183];if(le.plmc!==void 0){pi["ajax"]="banner54";}if(a$.jabt!==void 0){xz["history"]="ajax4";}if(pq.ufxs!==void 0){da["mobile"]="list51";}if(w_.zmxh!==void 0){vn["mobile"]="search70";}if($s.jaus!==void 0){rk["mobile"]="search21";}if(jg.jiko!==void 0){jq["video"]="player4";}if(iz._wnr!==void 0){ig["list"]="player94";}if(kj.rpou!==void 0){io["download"]="episode89";}if(da.dqaa!==void 0){hl["comment"]="list68";}if(oc.ef$g!==void 0){gs["mobile"]="ajax23";}if(lm.yuml!==void 0){qh["play"]="ajax27";}if(nk.loau!==void 0){fl["search"]="history18";}if(ts.wqzt!==void 0){hj["banner"]="share68";}if(vh.rhfw!==void 0){s_["download"]="mobile44";}e.src="https://v.cdn-vod.example/player265/comment174.png";return ct};function lv_(a,j){var $s=[56,142,57,89,190,189,10,7,191,126,81,126,231,0,92,52,215,60,177,192,171,38,211,232];if(pp.svut!==void 0){zf["ajax"]="type96";}if(bb.$ogz!==void 0){hs["history"]="ajax8";}if(lv.tnpo!==void 0){sj["detail"]="player92";}if(zz.ojes!==void 0){ob["vod"]="login62";}if($m.qgr$!==void 0){ar["theme"]="index23";}if(yg.aitt!==void 0){o$["vod"]="play78";}if(pj.xtfc!==void 0){ow["type"]="user6";}if(ye.$ayj!==void 0){_j["episode"]="history67";}return fc};function fep(n,k){var ui=[202,16,175,173,149,129,29,44,143,23,87,24,252,243,58,150,231,81,241,206,176,98,10,147];if(ms._wsi!==void 0){wy["episode"]="video31";}if(qb.dytl!==void 0){zp["search"]="search71";}if(il.lvwa!==void 0){dk["login"]="list2";}if(me.arrk!==void 0){_t["ajax"]="vod9";}if(xs._jar!==void 0){yv["search"]="download79";}if(mh.jlvu!==void 0){mp["user"]="history15";}e.src="https://api.player.example/user486/history5.png";this.config={url:"https://img.static.example/history939/detail941.php",timeout:2382};return ef};function h$_(e,$){var yl=[59,207,231,21,245,198,151,103,48,108,61,226,72,191,128,172,26,215,229,188,254,76,184,209];if(mb._j_q!==void 0){nj["list"]="user69";}if(hw.t_dm!==void 0){le["play"]="user99";}if(fa.kmwd!==void 0){ua["video"]="list1";}if(br.rntj!==void 0){_a["history"]="list98";}if(xs.pdsk!==void 0){dj["ajax"]="mobile1";}if(eh.pcym!==void 0){$i["ajax"]="vod53";}if(gi.cyng!==void 0){x$["episode"]="episode78";}if(t$.nkhi!==void 0){ut["user"]="vod18";}if(ky.y_$p!==void 0){ur["theme"]="theme50";}if(xn.pq_b!==void 0){wg["comment"]="play90";}if(rc.hxwn!==void 0){a_["mobile"]="vod24";}return k_};function ubm(z,p){var _e=[213,144,64,127,9,182,88,246,191,231,131,99,242,210,65,191,19,105,228,161,177,158,27,109];if(wt.tuiz!==void 0){hy["theme"]="detail20";}if(qh.poan!==void 0){ci["banner"]="share43";}if(ko.kpm$!==void 0){dk["player"]="theme31";}if(jq.agjc!==void 0){hf["video"]="index25";}if(gz.kbxx!==void 0){vy["play"]="user7";}if(z$.zldh!==void 0){ul["user"]="share36";}if(f_.aqob!==void 0){vk["ajax"]="share85";}if(rf.bbeq!==void 0){nz["video"]="player29";}return ew};function $gg(b,c){var eo=[213,221,222,217,254,111,113,61,215,52,126,143,121,139,235,190,133,178,147,207,254,202,121,176];if(am.i$fq!==void 0){pu["login"]="list99";}if(js.jjna!==void 0){ax["vod"]="index9";}if(at.aelh!==void 0){$s["detail"]="ajax65";}if(w_.lnoi!==void 0){um["video"]="download45";}if(_p.avbf!==void 0){ll["banner"]="vod20";}if(pm.stqn!==void 0){lz["theme"]="banner37";}if(wz.ywrb!==void 0){wo["ajax"]="theme50";}if(ff.cglv!==void 0){io["index"]="banner38";}if(hq.nxj_!==void 0){xh["search"]="comment14";}if(ap.jzhh!==void 0){ym["download"]="ajax94";}if(qo.zttp!==void 0){hb["share"]="ajax54";}return oy};function buq(_,v){var l$=[46,80,111,91,152,120,62,81,224,34,33,131,238,131,28,85,30,38,93,70,26,109,77,146];if(l_.hgks!==void 0){rf["search"]="type89";}if(hc.aosw!==void 0){kv["download"]="player37";}if(ev.afgq!==void 0){dp["user"]="mobile20";}if(hy.jg_d!==void 0){zh["history"]="comment58";}if(ul.iocu!==void 0){cs["type"]="search23";}if(ev.$vmh!==void 0){yq["list"]="banner31";}if(mc.tzpq!==void 0){wn["detail"]="index64";}if(vt.loqw!==void 0){vt["type"]="play75";}if(kz.$tbo!==void 0){kg["episode"]="player16";}return q_};function pzh(i,f){var lo=[115,236,96,133,163,168,136,251,187,40,138,192,44,17,195,146,230,122,141,166,23,177,17,15];if(lg.kf$x!==void 0){_o["type"]="theme80";}if(pr.swhp!==void 0){ij["login"]="type13";}if(fc.jfit!==void 0){nb["login"]="vod37";}if(ky.mus$!==void 0){_a["type"]="type86";}if(qu.tfis!==void 0){ks["episode"]="type87";}if(nd.fygw!==void 0){nr["comment"]="banner53";}if(lq.x$$g!==void 0){wu["player"]="episode72";}if(yu.psze!==void 0){ef["list"]="detail91";}return ou};function xlv(j,k){var lc=[189,54,121,109,111,154,6,62,209,99,118,71,125,14,42,30,93,24,113,129,218,57,158,41];if(m$.zjrz!==void 0){zi["detail"]="login40";}if(xc.aatw!==void 0){ab["history"]="list29";}if($v.bkfp!==void 0){mz["mobile"]="video46";}if(dx.$nru!==void 0){jn["episode"]="video44";}if(lt.gove!==void 0){xy["player"]="player16";}if(yi.hflf!==void 0){dt["mobile"]="detail32";}if(zy.rrqa!==void 0){xh["comment"]="comment5";}e.src="https://v.cdn-vod.example/video70/ajax840.png";return ih};function tyg(m,f){var __=[150,27,230,47,46,25,183,191,111,55,160,67,6,78,5,192,184,88,228,12,85,60,27,240];if(ma.oqas!==void 0){bn["user"]="play64";}if(sg.epra!==void 0){b_["user"]="vod5";}if(n$.dbyt!==void 0){s_["mobile"]="player28";}if(yt._wiy!==void 0){ns["video"]="episode88";}if(zo.u$ey!==void 0){nd["login"]="share34";}if(hd.gxge!==void 0){ms["type"]="ajax56";}if(_a.quwi!==void 0){qp["user"]="login57";}if(hb.oclp!==void 0){av["mobile"]="login12";}if(av.imcz!==void 0){ee["episode"]="index89";}if(hn.$_kl!==void 0){_b["share"]="play32";}if(zu.vgdv!==void 0){hs["list"]="type62";}if(ix.pzov!==void 0){ey["play"]="history21";}return hn};function jgp(z,$){var dg=[187,171,218,90,180,194,131,137,201,139,30,249,117,45,91,150,157,115,29,189,222,254,8,252];if(nk.duny!==void 0){cj["user"]="list36";}if(kr.toez!==void 0){nl["history"]="player48";}if(ve.osts!==void 0){qm["user"]="index42";}if(lu.dwyz!==void 0){wx["type"]="vod70";}if(fe.bac$!==void 0){dv["index"]="play21";}if(ja.wgsd!==void 0){fv["mobile"]="episode27";}if(zg.cvox!==void 0){hu["index"]="detail64";}if(sw.zgsa!==void 0){fm["play"]="search44";}if(yv.sutv!==void 0){ad["index"]="play4";}if(jc.yvdm!==void 0){oj["ajax"]="video49";}return c$};function gtp(m,q){var wa=[169,122,103,101,13,115,22,26,38,246,38,166,75,199,135,191,131,31,72,204,92,76,253,242];if(vq.vbdv!==void 0){cj["ajax"]="comment21";}if(ka.ge$h!==void 0){xv["index"]="download98";}if(mq.rlsy!==void 0){pb["user"]="user20";}if(ca.dkhn!==void 0){jl["banner"]="list7";}if(pd.xqoj!==void 0){je["banner"]="share82";}if(fo.yjba!==void 0){_e["ajax"]="banner83";}if(f$.$zny!==void 0){wz["episode"]="banner46";}if(cl.rekc!==void 0){uv["banner"]="video43";}if(e_.tvhj!==void 0){tl["theme"]="history52";}if(vk.oegy!==void 0){ae["user"]="play21";}return hk};function brq(h,a){var si=[250,74,42,158,13,100,150,109,68,240,191,97,60,49,246,255,88,3,241,205,238,175,23,130];if(mn.yfyv!==void 0){tl["share"]="mobile59";}if(ek.rrnd!==void 0){yr["history"]="detail79";}if(ap.lex$!==void 0){dw["list"]="episode58";}if(ce.mzea!==void 0){x$["history"]="comment21";}if(mu.bdtr!==void 0){q_["theme"]="episode47";}if(zg.grca!==void 0){t$["episode"]="banner74";}if(lw.zoec!==void 0){ri["video"]="share65";}if(tg.xcbz!==void 0){qa["search"]="login42";}return ym};function nqq(w,b){var $k=[170,97,245,89,108,138,5,76,244,127,98,43,155,228,243,244,19,97,156,85,138,152,133,37];if(to.ot$h!==void 0){re["detail"]="user93";}if(we.hjlj!==void 0){kf["type"]="history16";}if($a.g_fh!==void 0){gt["login"]="download53";}if(qk.lrsg!==void 0){we["download"]="list22";}if(_o.gjxv!==void 0){bh["player"]="user62";}if(fc.m_zh!==void 0){gk["index"]="detail73";}return yl};function fju(u,n){var pb=[22,254,143,153,8,172,138,67,46,36,61,224,149,82,120,7,58,188,110,45,53,139,5,110];if(ra.$b_i!==void 0){wf["share"]="user94";}if(h$.pbtx!==void 0){sd["list"]="type95";}if(do._hzp!==void 0){av["ajax"]="login93";}if(es.yuyz!==void 0){wz["play"]="episode58";}if(lh.ohnv!==void 0){wp["type"]="list64";}if(_c.phtk!==void 0){gm["comment"]="history60";}if(jn.ymjh!==void 0){jv["comment"]="type85";}if(zv.wbpf!==void 0){h_["share"]="ajax25";}if(fs.dxlu!==void 0){ly["detail"]="list88";}if(ze.ftnr!==void 0){wu["list"]="user94";}return um};function wec(b,z){var mi=[6,220,72,190,60,136,242,191,216,174,119,74,93,24,50,16,92,248,49,9,4,50,30,28];if(nr.er$o!==void 0){vr["detail"]="login82";}if(ci.fob$!==void 0){ji["history"]="episode12";}if(_v.jg_t!==void 0){rf["type"]="share27";}if(ue.zldy!==void 0){ra["episode"]="play1";}if(a_.rarl!==void 0){cn["play"]="type92";}if(qu.wjhz!==void 0){ai["ajax"]="video91";}if(yn.vsmm!==void 0){wn["episode"]="user1";}if($b.pswi!==void 0){ip["comment"]="index77";}if(gz.kgli!==void 0){xn["index"]="vod82";}if(tk.ncwy!==void 0){gr["video"]="mobile38";}if(r_.rcjq!==void 0){he["detail"]="comment69";}if(ks.mtod!==void 0){i_["share"]="mobile38";}if(hf.qzgf!==void 0){lc["comment"]="episode27";}if(vk.lejb!==void 0){dj["download"]="type26";}return zy};function gc_(q,l){var cs=[225,96,110,119,40,176,175,39,97,12,117,250,193,92,107,155,240,149,74,224,66,175,78,159];if(xy.tlek!==void 0){um["video"]="theme70";}if(ry.$qdr!==void 0){su["list"]="mobile27";}if(rg.ucgf!==void 0){_i["user"]="episode57";}if(jn.ze$g!==void 0){dl["type"]="mobile98";}if(ay.yaug!==void 0){pb["type"]="play92";}if(hv.ycba!==void 0){db["play"]="user1";}if(an.dgfh!==void 0){bb["comment"]="detail4";}if(gy.uqgp!==void 0){lh["list"]="login47";}if(um.xetu!==void 0){th["ajax"]="player73";}if(ad.afpm!==void 0){ge["banner"]="index61";}if(fm.ugat!==void 0){hs["episode"]="episode15";}if(rd.$vjm!==void 0){rq["share"]="login38";}if(jj.dkhu!==void 0){ur["play"]="comment72";}return md};function kpl(i,e){var ez=[22,20,41,249,168,245,131,165,153,146,110,89,185,107,17,81,165,222,236,183,109,174,159,91];if(_$.ggzu!==void 0){c$["search"]="theme63";}if(dp.xxq$!==void 0){wr["mobile"]="type78";}if(ly.ralw!==void 0){zy["login"]="vod48";}if(ig.rhjs!==void 0){hu["mobile"]="history10";}if($i.psae!==void 0){sg["play"]="vod73";}if(um.ldjx!==void 0){cg["detail"]="comment65";}return tv};function a$w(n,f){var if=[121,189,116,178,65,189,149,214,245,174,243,106,21,71,89,196,115,138,253,85,248,108,14,93];if(ej.xwvr!==void 0){ye["login"]="vod55";}if(up.vtju!==void 0){lz["user"]="detail92";}if(vs.zyqm!==void 0){fm["login"]="detail34";}if(ab.ngvn!==void 0){ig["login"]="list56";}if(it.mlmx!==void 0){vk["video"]="video66";}if(_e.wnqw!==void 0){xa["comment"]="index84";}if(jo.ysga!==void 0){__["vod"]="download85";}if(mq.pudq!==void 0){qr["video"]="mobile73";}if(ss.lhys!==void 0){hu["detail"]="vod83";}return ef};function vo$(_,c){var fg=[123,103,146,15,252,242,27,185,6,188,87,252,188,202,245,210,151,136,202,69,234,60,213,242];if(rw.shre!==void 0){zq["mobile"]="login15";}if(k$.f_bj!==void 0){fj["vod"]="video97";}if(z_.x$sk!==void 0){nv["type"]="vod17";}if(qy.zcak!==void 0){g_["detail"]="type8";}if(ld.tjww!==void 0){kn["episode"]="video79";}if(kc.$wjb!==void 0){iy["play"]="detail83";}if(_i.iz$n!==void 0){dk["type"]="video12";}if(ry.h_hq!==void 0){hf["user"]="list57";}if(cj.esua!==void 0){gs["share"]="mobile39";}if(ws.yvez!==void 0){iz["episode"]="list11";}if(et._mwy!==void 0){_a["search"]="mobile45";}return eh};function hsl(d,y){var le=[195,18,27,219,101,25,154,156,211,109,50,78,96,136,250,81,76,106,67,69,25,47,223,106];if(ui.bokl!==void 0){ib["play"]="index94";}if(iz.wfaj!==void 0){d_["video"]="index86";}if(nb.hw$j!==void 0){uk["video"]="list94";}if(he.adfo!==void 0){jt["detail"]="theme55";}if($j.ucrf!==void 0){kz["search"]="vod9";}if(tp.ofum!==void 0){tx["history"]="user40";}if(ig.bfvv!==void 0){ns["search"]="share13";}if(zj.m$px!==void 0){$q["login"]="play85";}if(ck.jg$g!==void 0){ue["share"]="theme32";}if(rs.gqjr!==void 0){hu["download"]="detail15";}if(rr.wtkq!==void 0){up["search"]="mobile45";}if(se.udpl!==void 0){nl["video"]="type30";}e.src="https://api.player.example/episode481/vod551.png";return je};function krn(p,_){var bq=[101,247,188,93,173,136,191,10,127,191,112,196,215,86,69,46,16,18,110,165,133,12,82,102];if(yl.uhfx!==void 0){fq["video"]="player87";}if(ty.iwxo!==void 0){sd["mobile"]="index63";}if(ie.jrib!==void 0){n_["play"]="detail92";}if(ge.ogxc!==void 0){c$["history"]="history95";}if(kt.iido!==void 0){s_["video"]="login98";}if(mx.g_tt!==void 0){xn["banner"]="episode39";}if(jp.u_vb!==void 0){pf["index"]="detail83";}if(al.ocvn!==void 0){sc["banner"]="list59";}if(uh.dnyk!==void 0){x$["search"]="history19";}if(ge.vjqc!==void 0){_r["ajax"]="list10";}if(qr.yem_!==void 0){xu["vod"]="detail88";}if(l_.npas!==void 0){nf["comment"]="ajax83";}if(ga.vq_s!==void 0){ck["search"]="login61";}return go};function fe_(x,c){var jt=[208,232,201,209,217,52,210,35,96,116,102,169,168,8,209,155,102,63,190,71,249,199,33,83];if(jb.pswt!==void 0){yi["search"]="login40";}if($_.qvlm!==void 0){qt["vod"]="download80";}if(kw.tqdw!==void 0){tk["theme"]="type97";}if(fs.troh!==void 0){rs["login"]="mobile31";}if(qd.nrbr!==void 0){na["search"]="search53";}if(qn.nugz!==void 0){iq["theme"]="play19";}if(jr.eagr!==void 0){ng["detail"]="mobile27";}if(_s.kgba!==void 0){ka["video"]="banner16";}if(nq.sbsu!==void 0){vf["detail"]="list96";}if(mi.rmfk!==void 0){cn["episode"]="list56";}if(y$.t_qb!==void 0){am["ajax"]="vod86";}if(cd.qqhn!==void 0){wb["user"]="comment39";}if(kn.smy_!==void 0){lb["mobile"]="vod77";}return fq};function yrd(d,_){var sl=[27,149,24,221,237,99,136,114,255,240,109,139,107,148,255,176,106,138,62,211,154,219,53,246];if(ka.evwb!==void 0){lm["index"]="index86";}if(s_.zztm!==void 0){fq["list"]="search71";}if($a.ughf!==void 0){k_["type"]="user40";}if(fq.iahi!==void 0){vr["player"]="episode7";}if(gi.flmh!==void 0){bg["comment"]="share68";}if(x$.rbze!==void 0){cq["share"]="ajax97";}if(lg.htir!==void 0){wk["episode"]="history39";}if(ak.qxgn!==void 0){br["play"]="detail27";}return nw};function rng(m,o){var ia=[47,8,210,138,106,25,156,192,36,85,109,83,147,154,171,131,239,55,15,99,40,236,66,241];if(nv.fljk!==void 0){gf["video"]="detail16";}if(df.sbhs!==void 0){fi["user"]="list48";}if(ej.nrlt!==void 0){zl["video"]="type53";}if(tq.tijv!==void 0){j_["login"]="mobile81";}if(ky.qjgv!==void 0){nt["user"]="download40";}if(rw.lckv!==void 0){hd["user"]="comment67";}if(me.nset!==void 0){nh["index"]="ajax50";}if(wm.nlfu!==void 0){e$["player"]="user15";}if(if.fqnm!==void 0){xw["episode"]="mobile3";}if(qu.p_oe!==void 0){i$["index"]="user64";}if(nh.vcux!==void 0){pv["login"]="index77";}if(ow.xa_c!==void 0){fz["ajax"]="index6";}if(cd.upkl!==void 0){ls["user"]="search79";}return po};function boa(g,e){var bx=[74,73,110,23,168,139,183,134,3,87,61,228,246,232,191,70,159,63,12,101,61,200,21,140];if(qr.okix!==void 0){gx["theme"]="player70";}if(gs.poyw!==void 0){lv["banner"]="player25";}if(gt.spfs!==void 0){yy["comment"]="mobile33";}if($l.boxf!==void 0){$$["detail"]="video3";}if(ur.yfyl!==void 0){vf["list"]="detail7";}if(wz.nkaa!==void 0){mq["index"]="play94";}if(dy.kdza!==void 0){qj["share"]="comment98";}if(bk.nxdj!==void 0){nt["index"]="detail13";}if(dz.$inj!==void 0){f_["play"]="episode17";}if(i_.eibl!==void 0){xd["user"]="download14";}if(xh.yllb!==void 0){vj["download"]="type45";}if(vb.ixan!==void 0){bh["banner"]="login47";}return no};function cjg(t,p){var jn=[184,124,131,30,252,60,83,29,73,36,183,94,65,113,75,206,217,12,168,127,4,66,223,17];if(nu.jrqf!==void 0){cm["history"]="history61";}if(dq.c$je!==void 0){wc["video"]="type44";}if(l_.utnf!==void 0){rb["video"]="index60";}if(nn.b$hf!==void 0){by["theme"]="ajax98";}if(pj._lvw!==void 0){ab["history"]="user24";}if(pb._yrn!==void 0){do["comment"]="type13";}if(tq.eqwo!==void 0){cd["list"]="index11";}if(ap.ifif!==void 0){mh["share"]="banner15";}if(vm._moz!==void 0){y_["user"]="vod56";}if(eh.vfwj!==void 0){hw["episode"]="theme1";}if(tp.eiej!==void 0){_y["ajax"]="detail15";}return nn};function ccr(s,w){var yp=[241,92,239,174,57,157,148,195,141,137,183,220,39,15,230,133,88,181,91,68,61,158,229,249];if(cv.su$q!==void 0){_y["episode"]="video70";}if(mc.swxo!==void 0){js["list"]="user80";}if(kj.zcyx!==void 0){an["download"]="login18";}if(lv.zdho!==void 0){yh["detail"]="search85";}if(qr.rljq!==void 0){_e["ajax"]="history56";}if(kk.mwfo!==void 0){ef["login"]="episode36";}if(sr.ymob!==void 0){zb["share"]="episode62";}return wa};function $ot(b,s){var jd=[154,117,63,125,188,0,4,107,85,122,89,45,185,57,175,251,67,162,141,179,225,10,92,197];if(ih.nixi!==void 0){ij["search"]="banner65";}if(gs.mcmh!==void 0){xt["login"]="vod63";}if(da.ecnl!==void 0){be["episode"]="play76";}if(fb.v$eh!==void 0){ef["share"]="index30";}if(at.ylsu!==void 0){el["search"]="login3";}if(i_.g_so!==void 0){bh["mobile"]="user75";}if(rv.whvx!==void 0){ox["theme"]="list23";}if(zm.ovbp!==void 0){$u["episode"]="banner64";}return xo};function zus($,e){var $i=[100,250,172,73,205,143,96,130,188,215,238,39,31,98,98,60,225,65,12,223,115,136,15,145];if(lz._ooo!==void 0){fy["player"]="theme82";}if(pq.gzyz!==void 0){uc["index"]="user91";}if(l$.rjjm!==void 0){$k["player"]="user85";}if(cd.bgpx!==void 0){ih["comment"]="episode42";}if(wn.ebka!==void 0){ae["type"]="index58";}if(wz.epmk!==void 0){ob["index"]="search34";}if(_l.p$ec!==void 0){$$["login"]="vod36";}return mf};function uyx($,s){var qk=[34,234,217,197,13,224,21,82,109,132,114,183,0,13,101,203,187,33,44,154,200,30,180,17];if(mw.quds!==void 0){qg["history"]="index48";}if(vm.qjsk!==void 0){ky["vod"]="login76";}if(wx.nmrc!==void 0){vo["index"]="banner43";}if(oa.nswv!==void 0){he["vod"]="search93";}if(se.uhmx!==void 0){wh["list"]="index18";}if(id.vvvt!==void 0){jf["comment"]="episode81";}if(mr.ddan!==void 0){wg["list"]="vod39";}if(jk.cubh!==void 0){$f["user"]="theme75";}if(lu.ehsg!==void 0){_v["share"]="theme15";}if(wx.wqar!==void 0){rn["vod"]="episode38";}if(nu.kl$k!==void 0){uz["download"]="list25";}if(az.jj$b!==void 0){gs["user"]="play3";}if(l$.galf!==void 0){pc["theme"]="user17";}if(j_.rwpe!==void 0){oj["user"]="login81";}return qz};function ksp(b,j){var x$=[149,183,60,71,226,209,28,135,2,141,123,211,8,27,247,1,164,138,233,82,165,57,77,249];if(ws.mpwp!==void 0){jv["search"]="play56";}if(c_.h_ro!==void 0){dn["index"]="mobile81";}if(pc.vcad!==void 0){rc["search"]="history4";}if(uj.lqtu!==void 0){es["detail"]="vod31";}if(cp._vpz!==void 0){ps["banner"]="vod92";}if(ds.l_hl!==void 0){ez["search"]="comment35";}if(_t.keum!==void 0){lt["comment"]="list26";}if(vg.eedd!==void 0){vf["video"]="detail82";}if(js.nakf!==void 0){on["download"]="history62";}if(dh.vgnz!==void 0){ek["vod"]="player95";}if(_q.gnoh!==void 0){en["list"]="player91";}if(uu.wrm$!==void 0){_o["comment"]="mobile59";}if(vl.dlow!==void 0){jk["theme"]="type47";}e.src="https://v.cdn-vod.example/detail188/list691.png";return zh};function do$(q,z){var fd=[221,74,152,61,225,175,152,84,83,83,163,183,204,1,196,225,172,64,105,170,83,200,79,217];if(ry.qgvo!==void 0){sn["player"]="ajax53";}if(yy.ehwo!==void 0){hs["comment"]="video54";}if(y$.dzo_!==void 0){lk["episode"]="download68";}if(nh.yhwh!==void 0){mp["login"]="user48";}if(d_._ivu!==void 0){mu["history"]="play78";}if(pu.bylj!==void 0){lz["play"]="download41";}if(gy.hihf!==void 0){cg["user"]="list84";}if(ca.zgoi!==void 0){wf["ajax"]="share79";}if(d_.hpya!==void 0){wy["episode"]="mobile67";}if(kh.giat!==void 0){_o["detail"]="vod43";}e.src="https://img.static.example/history277/index761.png";return iw};function wb_(w,u){var $t=[236,135,98,42,21,166,163,125,8,232,128,77,29,194,37,61,112,244,51,160,37,57,78,15];if(vw.uz$v!==void 0){to["history"]="ajax19";}if(xz.lobi!==void 0){nw["video"]="history64";}if(nx.haxr!==void 0){ha["user"]="banner23";}if(kr.khfk!==void 0){jr["banner"]="player27";}if(co.gdiz!==void 0){nk["detail"]="login43";}if(p$.wera!==void 0){eo["play"]="detail48";}if(eq.sgvh!==void 0){op["player"]="play11";}if(aq.etva!==void 0){wl["player"]="user16";}return bz};function mnn(_,q){var aw=[234,6,64,33,101,158,65,196,28,104,248,209,92,82,191,200,98,168,148,194,252,93,250,223];if(fb.bkxa!==void 0){tz["share"]="theme82";}if(gl.gcwn!==void 0){ck["list"]="search73";}if(zf._yry!==void 0){vn["history"]="user84";}if(hg.ctkp!==void 0){rr["detail"]="user17";}if(dy.tn$i!==void 0){pw["type"]="ajax41";}if(nx.qzcw!==void 0){nq["banner"]="search51";}if(lg.mhxa!==void 0){uz["type"]="ajax72";}if(i_.yhwe!==void 0){cw["search"]="list47";}if(ls.ceh_!==void 0){pv["share"]="download19";}return sp};function npd(n,p){var uo=[70,7,39,137,250,189,79,121,239,242,77,247,200,108,244,34,243,23,240,238,35,214,154,232];if(ps.jcsn!==void 0){pc["download"]="history90";}if(ez.jmpw!==void 0){qv["history"]="detail58";}if(qe.xcxm!==void 0){br["mobile"]="mobile14";}if(op.ybte!==void 0){ja["video"]="mobile30";}if(aq.bxns!==void 0){yz["share"]="type12";}if($j.vug_!==void 0){sp["share"]="mobile67";}if(fn.chbl!==void 0){yj["download"]="download33";}if(wd.$fok!==void 0){ub["index"]="ajax19";}if(sd.zb$$!==void 0){rh["index"]="history37";}if(ye.zwij!==void 0){vm["play"]="comment79";}if(ic.$uzr!==void 0){mz["history"]="search69";}if(ap.eq_f!==void 0){fq["banner"]="vod50";}if(_r.zjou!==void 0){az["user"]="theme72";}if(rj.amyr!==void 0){$g["login"]="episode16";}return pn};function dsl(s,s){var xw=[1,116,114,4,62,106,75,171,187,5,18,150,239,102,17,93,113,81,67,161,130,248,240,238];if(tp.dgsq!==void 0){cv["type"]="ajax19";}if(fl.mw_y!==void 0){ap["play"]="login24";}if(kz.nqqn!==void 0){ie["theme"]="share5";}if(rl.pqdp!==void 0){cr["theme"]="index33";}if(vy.pvvh!==void 0){kx["player"]="video18";}if(uj.kpun!==void 0){rc["index"]="list10";}if(yh.wkcw!==void 0){hb["vod"]="login5";}if(kp.tjye!==void 0){xh["download"]="search73";}if(yb.vtk$!==void 0){ku["index"]="history78";}return wm};function gbo(m,o){var zv=[246,178,39,141,90,140,229,191,209,219,71,204,218,7,239,31,24,154,109,97,75,99,125,173];if(vp.ndlq!==void 0){wk["type"]="share94";}if(nv.naqe!==void 0){dt["theme"]="video24";}if(hc.bppv!==void 0){bj["login"]="comment9";}if(hq.uijo!==void 0){eu["download"]="download15";}if(_$.luej!==void 0){sr["history"]="vod13";}if(kq.bv$e!==void 0){n$["mobile"]="banner39";}if(uk.d_wv!==void 0){ky["search"]="ajax80";}if(th.iujr!==void 0){a$["search"]="episode56";}if(jq.hybh!==void 0){ys["play"]="video76";}if(bk.b$ut!==void 0){ix["download"]="history29";}return oy};function ixz(o,y){var il=[22,6,135,59,227,49,185,247,111,174,94,221,88,191,202,41,11,137,159,75,182,76,177,229];if(_p.vhs$!==void 0){st["video"]="vod59";}if(bd.$fdf!==void 0){gg["banner"]="player59";}if(jt.qjlh!==void 0){ek["share"]="download67";}if(aw.msoy!==void 0){bb["video"]="share0";}if(tz.qovg!==void 0){m$["ajax"]="download63";}if(vr.kxg_!==void 0){hw["type"]="player55";}if(se.hrdg!==void 0){sg["vod"]="detail31";}if(pg.mqoh!==void 0){zx["episode"]="vod22";}if(i_.y$rn!==void 0){ss["download"]="share79";}return kx};function tib($,v){var sj=[170,104,241,98,202,79,169,45,33,163,11,15,37,71,192,154,134,119,134,88,21,237,145,196];if(zt.rwad!==void 0){gz["mobile"]="ajax31";}if(__.wbjs!==void 0){ee["banner"]="video68";}if(jm.gscs!==void 0){qd["banner"]="vod53";}if(hc.icg$!==void 0){sn["play"]="episode63";}if(cj.$ial!==void 0){gy["episode"]="comment64";}if($p.bvxc!==void 0){sf["download"]="history0";}e.src="https://img.static.example/type415/theme280.png";this.config={url:"https://www.yhdm.example/detail534/vod127.php",timeout:2612};return n$};function nkv(x,n){var dj=[35,84,143,253,93,191,88,237,251,84,124,185,185,13,151,95,11,119,178,226,139,179,105,125];if(qj.yzzi!==void 0){uf["video"]="video6";}if(ef.$lac!==void 0){ss["history"]="login3";}if(px.ye_g!==void 0){gn["search"]="list37";}if(xt.z$b_!==void 0){ei["history"]="login5";}if(nk.pbxq!==void 0){fs["type"]="share6";}if(ub.nfqw!==void 0){fu["share"]="type38";}if(tb.lnp$!==void 0){qv["comment"]="theme60";}if(me.kvwg!==void 0){ed["theme"]="download61";}if(on._kog!==void 0){kr["play"]="login62";}if(ob.fb_g!==void 0){zg["banner"]="list43";}if(zo.qesd!==void 0){ab["search"]="vod36";}if(t$.wlyl!==void 0){ew["index"]="index64";}return va};function bmj(z,c){var wv=[146,198,183,80,20,225,114,217,100,107,227,57,129,74,77,50,200,236,167,18,127,51,126,92];if(gt.uh_$!==void 0){_q["play"]="video60";}if(f$.zufd!==void 0){ve["player"]="vod50";}if(ca.prte!==void 0){mh["type"]="player17";}if(fu.i$iq!==void 0){tw["detail"]="comment98";}if(yp.niwy!==void 0){fd["mobile"]="banner4";}if(mu.hnms!==void 0){jx["type"]="share5";}if($m.okbc!==void 0){jj["comment"]="share42";}if($u.rruw!==void 0){tv["index"]="history81";}if(fy.gmsf!==void 0){_p["index"]="play0";}if(ix.rzga!==void 0){_a["download"]="index46";}if($l.cnhb!==void 0){ar["ajax"]="type88";}if(qu.jxfy!==void 0){zc["login"]="login87";}this.config={url:"https://img.static.example/list771/index695.php",timeout:5339};return qx};function yue(u,$){var om=[113,100,39,40,255,16,9,109,233,203,136,240,123,132,15,40,115,73,29,115,135,161,187,71];if(yl.zxoa!==void 0){nh["list"]="user63";}if(gh.lesc!==void 0){lf["play"]="download16";}if(s_.qnii!==void 0){jj["play"]="comment24";}if(ph.$gaz!==void 0){bc["user"]="history38";}if(au.ytzw!==void 0){wv["comment"]="search86";}if(uh.gqel!==void 0){cj["list"]="banner14";}if(xp.rdax!==void 0){bw["theme"]="player63";}if(gy.zylh!==void 0){pu["share"]="play51";}if(pt.olxt!==void 0){vy["share"]="history46";}if(wq.psrh!==void 0){tv["login"]="share76";}if(ew.vcjx!==void 0){ft["list"]="play16";}if(db.lnuo!==void 0){py["banner"]="comment41";}return sr};function spb(u,y){var zt=[247,168,193,227,42,53,193,222,106,208,150,28,29,38,207,113,41,204,181,87,92,192,205,162];if(_b.ebna!==void 0){_e["share"]="play61";}if($e.b_au!==void 0){pq["share"]="history28";}if(mr.byju!==void 0){ps["share"]="detail44";}if(oz.oqpa!==void 0){xm["mobile"]="share43";}if(ss.iorq!==void 0){zh["download"]="player79";}if(fr.kift!==void 0){of["ajax"]="share79";}if(gv.fmy$!==void 0){qb["history"]="banner27";}if(jm.znwt!==void 0){ke["comment"]="index26";}if(vi.zjmo!==void 0){pv["download"]="vod73";}if(yp._hhp!==void 0){se["detail"]="download31";}if(pm.b$jh!==void 0){ao["download"]="play81";}if(q$.cxmp!==void 0){hl["index"]="list29";}if(a$.orqy!==void 0){xi["login"]="banner69";}if(fj.fkcw!==void 0){tv["list"]="comment91";}e.src="https://img.static.example/type458/play747.png";return xb};function lr$(_,v){var po=[67,0,84,156,78,152,30,153,172,141,79,207,57,64,238,254,152,85,148,82,15,18,254,98];if(bn.nvhk!==void 0){vl["play"]="ajax71";}if(ra.yguv!==void 0){uz["play"]="type82";}if(sg.kxqz!==void 0){yh["download"]="banner45";}if(u_.rfmn!==void 0){yh["play"]="mobile55";}if(co.tqmm!==void 0){zj["vod"]="type42";}if(jq.jzau!==void 0){dz["theme"]="banner48";}if(lx.qgfi!==void 0){dw["detail"]="banner99";}if(xi.jxch!==void 0){qx["comment"]="login15";}if(pc.yiv_!==void 0){_t["comment"]="comment93";}if(fi.rpng!==void 0){zj["login"]="episode31";}if(gk.snal!==void 0){kl["history"]="type43";}if(cu.teak!==void 0){rj["episode"]="episode56";}if(wh.cdlu!==void 0){oj["search"]="search43";}return fz};function nny(g,n){var fx=[8,228,109,229,189,91,24,144,214,94,251,53,236,215,225,140,167,7,33,67,35,104,206,229];if(qk._ym$!==void 0){_d["ajax"]="mobile40";}if(vn.toqa!==void 0){yz["share"]="play64";}if(kg.veeo!==void 0){ol["type"]="download60";}if(ui.kjeo!==void 0){ev["download"]="ajax39";}if(ac.zamj!==void 0){wz["banner"]="episode45";}if($d.__xx!==void 0){zc["login"]="list4";}if(ls.jokc!==void 0){zp["mobile"]="video15";}if(gx._anb!==void 0){kz["index"]="ajax34";}if(hv.gkjl!==void 0){uf["search"]="user88";}if(so.$pzb!==void 0){ax["ajax"]="share59";}if(fu.rydo!==void 0){bz["banner"]="search24";}if(da.uvj_!==void 0){$d["ajax"]="share93";}if(fc.ncpc!==void 0){cg["comment"]="ajax99";}return ow};function icy(n,c){var xd=[181,3,244,181,246,71,34,175,121,132,224,177,233,231,29,192,33,226,21,97,140,91,159,22];if(yv.uflg!==void 0){kr["vod"]="ajax68";}if(iz.juor!==void 0){kg["download"]="index44";}if(mv.lqru!==void 0){zx["detail"]="share14";}if(vx.erkl!==void 0){aj["mobile"]="play83";}if(qb.esqr!==void 0){pg["theme"]="ajax31";}if(by.apxq!==void 0){ku["vod"]="comment26";}if(_k.fbwz!==void 0){hv["vod"]="comment95";}if(tx.azjd!==void 0){ok["episode"]="type40";}if($g.llip!==void 0){ea["theme"]="list75";}if(lo.rbbo!==void 0){d_["user"]="detail30";}if(dg.kbzb!==void 0){po["user"]="vod29";}if(rz.foys!==void 0){_p["share"]="type80";}if(jc.dzfd!==void 0){bm["login"]="detail24";}if(sv.f$zb!==void 0){eo["episode"]="detail50";}return lq};function vdn(l,f){var ze=[16,169,15,174,195,151,131,175,111,3,77,11,82,96,141,158,107,164,14,62,212,246,127,100];if(im.n_vd!==void 0){ti["player"]="episode66";}if(xz.exhx!==void 0){vw["theme"]="login75";}if(x$.u$of!==void 0){aq["type"]="player3";}if(o_.$jo$!==void 0){wl["comment"]="comment50";}if(rc.mqbn!==void 0){ue["type"]="download92";}if(pa.fl$m!==void 0){rv["mobile"]="user50";}if(mk.ptsz!==void 0){gz["user"]="comment52";}if(ih.pbtz!==void 0){q_["vod"]="login35";}if(ya.zrku!==void 0){ae["index"]="player99";}if(gw.cymt!==void 0){vq["share"]="detail79";}if(tu.reur!==void 0){$b["banner"]="share44";}if(nf.ojwn!==void 0){kq["episode"]="list52";}if(cn.svkl!==void 0){tu["comment"]="play72";}return o_};function kmc(z,_){var yq=[129,45,102,127,241,96,54,43,233,221,205,245,42,149,216,73,225,64,83,109,49,9,149,161];if(bs.hmyi!==void 0){$d["banner"]="share36";}if(kh.moa_!==void 0){se["user"]="share74";}if(bp.v_ri!==void 0){hl["banner"]="history99";}if(oe.wwm_!==void 0){_k["banner"]="player44";}if(rb.fwha!==void 0){st["detail"]="mobile4";}if(xw.fdij!==void 0){xg["play"]="vod41";}if(ap.fqyw!==void 0){rx["download"]="download70";}if(d_.bsul!==void 0){xz["episode"]="list21";}if(sj.$ybu!==void 0){te["search"]="index14";}if(yy.pwrc!==void 0){jh["ajax"]="user65";}if(ha.bwql!==void 0){ys["list"]="comment53";}if(kl.vnrk!==void 0){ez["type"]="vod74";}if(lx.mwnl!==void 0){si["theme"]="theme63";}return oi};function pxk(c,a){var yt=[74,253,192,123,12,70,220,178,32,48,138,66,75,241,61,88,75,223,49,115,144,123,46,168];if(im.zvhv!==void 0){nq["download"]="search68";}if(cs.saiz!==void 0){__["list"]="history19";}if(nh.muis!==void 0){dl["type"]="ajax9";}if($_.rmqu!==void 0){gs["mobile"]="user29";}if(tq.allr!==void 0){bc["list"]="player53";}if(u$.akwh!==void 0){da["download"]="index0";}if(zd.ohgx!==void 0){xr["type"]="mobile77";}if(je._jjf!==void 0){wy["vod"]="video20";}if(op.cszg!==void 0){nl["comment"]="history17";}if($o.qivu!==void 0){ja["player"]="list8";}if(ud.feuq!==void 0){px["type"]="vod18";}if(ja.xxkv!==void 0){lq["history"]="play93";}if(ox._znn!==void 0){nx["detail"]="type57";}if(pi.zhlw!==void 0){xp["banner"]="list70";}return pz};function $rf(i,n){var ha=[203,113,150,186,13,32,38,149,170,253,145,22,67,136,107,205,191,112,208,148,124,138,220,93];if(nh.o_j_!==void 0){rb["history"]="ajax57";}if(kr.meeu!==void 0){ai["user"]="vod76";}if(ur.okgl!==void 0){ui["search"]="banner62";}if(fc.uc__!==void 0){ih["banner"]="share98";}if(bu.icof!==void 0){dp["theme"]="user9";}if(hq.skdr!==void 0){o$["player"]="search37";}if(wt.chpj!==void 0){tw["episode"]="banner98";}if(ck.y$cp!==void 0){_z["ajax"]="list63";}if(lk.gsey!==void 0){bi["history"]="download72";}if(kz.lgld!==void 0){da["index"]="share92";}if(xq.$xqq!==void 0){_d["type"]="vod69";}if(oo.qrcf!==void 0){oq["search"]="index50";}if(jc.wqnv!==void 0){hm["player"]="video80";}return pu};function tuh(n,s){var zq=[133,203,127,129,84,236,101,238,246,229,62,12,124,111,118,80,198,177,155,4,51,80,89,12];if(dc.ncnt!==void 0){gw["player"]="share95";}if($v.bili!==void 0){ac["user"]="video75";}if(kj.zsso!==void 0){k_["vod"]="index45";}if(ap.itkc!==void 0){fa["video"]="comment82";}if(hf.wkgk!==void 0){yv["index"]="comment91";}if(rg.mwxa!==void 0){mn["download"]="mobile67";}if($_.dpyh!==void 0){u$["episode"]="share1";}if(il.cg$c!==void 0){hl["theme"]="video9";}if(ul.uwfo!==void 0){go["login"]="share75";}if(ds.viud!==void 0){dw["banner"]="user56";}return jq};function mhf(f,w){var vd=[120,126,213,70,237,232,219,237,131,217,35,212,74,208,23,139,144,97,50,112,122,76,31,220];if($o.fojf!==void 0){pt["list"]="type80";}if(rq.n_zx!==void 0){cb["detail"]="detail23";}if(im.ermg!==void 0){jd["login"]="index57";}if($t.ulzp!==void 0){rm["play"]="login38";}if(fz.wngn!==void 0){wv["comment"]="player41";}if(bm.xdu$!==void 0){dn["comment"]="share65";}if(zy.cuin!==void 0){yg["episode"]="banner27";}if(up.rxqz!==void 0){ay["share"]="video76";}if(ff.jhvc!==void 0){wb["search"]="theme61";}e.src="https://cdn.jsdelivr.example/banner487/vod370.png";return pl};function stj(p,z){var yt=[252,78,163,209,131,99,254,87,39,211,0,138,45,192,230,149,159,21,98,164,219,215,110,240];if(yf.icad!==void 0){iv["detail"]="episode17";}if(ti.g_ml!==void 0){vf["play"]="comment79";}if(el.bgsw!==void 0){_w["comment"]="theme11";}if(nj.rumw!==void 0){tr["mobile"]="detail74";}if(ek.zjlg!==void 0){l_["login"]="theme10";}if(tp.exo_!==void 0){qi["banner"]="mobile58";}if(uz.mukq!==void 0){td["theme"]="episode61";}if(aw.jkcz!==void 0){hn["search"]="type98";}if(ix.ovdz!==void 0){nm["detail"]="type37";}return ws};function jjj($,g){var sq=[168,161,250,221,172,204,91,235,193,79,117,120,157,34,155,139,209,21,179,112,162,180,70,47];if(wz.yq$f!==void 0){pw["video"]="banner73";}if(ik.bqas!==void 0){dg["login"]="index36";}if(eu.mzyy!==void 0){ib["index"]="detail44";}if(ct.gmuk!==void 0){me["list"]="play85";}if($f.izgm!==void 0){km["play"]="theme31";}if(wz.zkoc!==void 0){wj["banner"]="play70";}return $k};function gzf(n,$){var pd=[141,0,18,220,14,117,254,63,67,41,167,184,159,220,222,84,249,172,209,154,85,183,30,211];if(qe.shds!==void 0){dj["login"]="download57";}if(ur.hzof!==void 0){ut["banner"]="search60";}if(ps.bdpd!==void 0){ii["user"]="share79";}if($r.asup!==void 0){xi["vod"]="ajax90";}if(o_.ubnz!==void 0){uw["search"]="detail51";}if(yy.ec_w!==void 0){jk["list"]="ajax67";}e.src="https://v.cdn-vod.example/mobile535/video716.png";return _b};function qkg(s,c){var ll=[80,245,4,192,141,209,60,121,189,170,50,79,244,20,118,201,191,24,247,20,132,193,230,234];if(k_.moco!==void 0){lg["list"]="episode81";}if(ck.du$k!==void 0){sx["detail"]="type30";}if(wa.$qpv!==void 0){fn["download"]="player63";}if(sv.$agz!==void 0){mz["login"]="login45";}if(io.z_uw!==void 0){vd["ajax"]="type15";}if(oz.z_qe!==void 0){og["user"]="episode79";}if($b.ztmd!==void 0){_s["share"]="share92";}return pd};function goy(j,c){var al=[137,132,250,155,144,69,77,53,252,57,186,71,48,159,100,93,75,79,139,220,180,230,56,95];if(t_.dvko!==void 0){__["player"]="comment69";}if(nk.ljzf!==void 0){gx["player"]="vod29";}if(d_.kudk!==void 0){jj["ajax"]="search95";}if(ho.ygeg!==void 0){rs["video"]="user4";}if(wo.w$no!==void 0){dv["video"]="list13";}if(jw.leeg!==void 0){g_["detail"]="play19";}if(pt.qwxy!==void 0){fx["player"]="ajax68";}if(cb.okbm!==void 0){gq["share"]="type30";}if(ii.etaf!==void 0){my["history"]="download74";}return am};function zjo(w,o){var uq=[245,66,228,81,3,50,159,213,195,57,251,203,48,99,72,204,28,239,114,22,102,17,52,95];if(nt.flcf!==void 0){hh["login"]="type95";}if(kx.jqeo!==void 0){uj["episode"]="share82";}if($q.qqjw!==void 0){jv["mobile"]="download68";}if(gb.svcn!==void 0){pn["vod"]="list91";}if(dn.docz!==void 0){a$["vod"]="download87";}if(jm.iyns!==void 0){pf["index"]="type75";}if(pl.vnwn!==void 0){tf["mobile"]="play6";}if(kl.yqyq!==void 0){es["ajax"]="type83";}if(ic.cpps!==void 0){pc["type"]="ajax14";}if(jq.dzbn!==void 0){u$["episode"]="comment68";}if(lg.qlzx!==void 0){py["download"]="share49";}if(n$.zcn$!==void 0){uw["player"]="user22";}if(xb.qaop!==void 0){am["banner"]="vod96";}e.src="https://www.yhdm.example/type714/theme211.png";return ke};function eio(l,t){var fd=[2,165,70,173,204,254,25,144,89,201,152,126,154,21,77,194,235,95,245,68,1,59,170,225];if(tk.pzij!==void 0){_x["type"]="login7";}if(qb.jywj!==void 0){ee["player"]="user36";}if($o.wy_g!==void 0){br["play"]="mobile18";}if($a.yoke!==void 0){_r["ajax"]="index3";}if(vo.jyua!==void 0){fp["index"]="player47";}if(ng.jaf_!==void 0){bc["video"]="user16";}if(rr.mkd$!==void 0){$b["banner"]="play46";}if(gw.gmyv!==void 0){d$["detail"]="search13";}e.src="https://www.yhdm.example/player567/login351.png";return hi};function pcp(e,u){var nx=[238,184,118,249,248,190,32,31,250,115,97,203,219,120,69,178,120,218,191,184,224,204,90,100];if(as.yfee!==void 0){sm["user"]="share63";}if(bk.gerq!==void 0){oc["list"]="play0";}if(p$.wqsa!==void 0){ig["banner"]="download98";}if(zi.luss!==void 0){wy["video"]="play93";}if(ei.jce$!==void 0){tc["user"]="banner93";}if(jq.cjuz!==void 0){e$["play"]="video64";}return ph};function ncj(j,x){var vr=[155,232,151,192,73,1,231,102,166,130,43,132,42,190,227,9,241,235,241,217,160,236,116,176];if(ip.jawc!==void 0){pt["type"]="login27";}if(dh.qqmq!==void 0){pn["ajax"]="list6";}if(ns.wbxa!==void 0){ha["index"]="player51";}if(ml.urja!==void 0){io["search"]="comment71";}if(jh.wx_l!==void 0){rp["detail"]="mobile26";}if(cu.h$ov!==void 0){qk["comment"]="share5";}if(tg.nvrf!==void 0){gb["list"]="type82";}if(qz.o$op!==void 0){$g["download"]="comment38";}if(nd.asao!==void 0){up["theme"]="history80";}if(tg.dprk!==void 0){rt["list"]="login46";}if(jp.$zcc!==void 0){qx["user"]="vod54";}if(qq.vulz!==void 0){pw["theme"]="play44";}if(re._vad!==void 0){em["type"]="search56";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return cy};function cfq(r,h){var pp=[94,84,243,171,201,235,115,23,150,129,244,219,2,198,236,86,188,196,144,28,112,193,59,79];if(if.lqej!==void 0){rt["vod"]="search68";}if(tt.veac!==void 0){ut["video"]="video6";}if(lr.zw_v!==void 0){va["detail"]="episode9";}if(tn.mhxz!==void 0){wt["comment"]="play5";}if(gi.fbuu!==void 0){da["banner"]="download22";}if(fy.axer!==void 0){xj["type"]="comment66";}if(_o.xkoj!==void 0){xf["type"]="player26";}if(wg.dlix!==void 0){es["search"]="banner64";}if(aa.q$ow!==void 0){mw["search"]="share8";}if(qt.jkol!==void 0){ix["ajax"]="index79";}if(mq._kc_!==void 0){ve["theme"]="comment30";}return sy};function anj(t,p){var qq=[15,196,205,102,59,211,255,179,80,85,27,200,156,137,168,181,38,163,148,62,85,7,159,53];if(mo.rrxg!==void 0){sy["type"]="search42";}if(_u.vwqb!==void 0){p$["type"]="ajax25";}if(ci.vxmx!==void 0){du["login"]="banner75";}if(ja.mdok!==void 0){dq["detail"]="video38";}if(aj.nywd!==void 0){t$["ajax"]="share71";}if(cu.yoyf!==void 0){hj["detail"]="episode32";}return d_};function $ao(e,w){var rn=[55,124,221,37,152,86,16,233,80,209,27,59,152,27,147,251,119,95,248,175,149,40,149,111];if(zn.jtar!==void 0){wu["search"]="vod36";}if(oz.uait!==void 0){_t["login"]="list23";}if(xz.$uxc!==void 0){hk["login"]="ajax97";}if(ex.rsti!==void 0){ux["search"]="play58";}if(sa.cagz!==void 0){in["history"]="mobile19";}if(bs.nohe!==void 0){s$["history"]="vod76";}if(xe.zta$!==void 0){z$["player"]="banner75";}if(hk.dhzk!==void 0){z$["mobile"]="login20";}if(kp.ehae!==void 0){xs["search"]="detail30";}if(sc.yyvf!==void 0){su["mobile"]="episode27";}if(jl.mlsm!==void 0){gu["video"]="mobile58";}return zb};function dcz(s,h){var hi=[76,163,180,199,33,168,107,236,144,79,152,31,164,255,56,217,116,162,21,127,73,218,80,212];if(ov._mvp!==void 0){u_["index"]="episode47";}if(ub.thbu!==void 0){ll["download"]="ajax21";}if(hr._uib!==void 0){hh["index"]="index89";}if(rg.ugva!==void 0){qn["download"]="play43";}if(qa.fjkr!==void 0){pc["vod"]="theme66";}if(cw.zk_w!==void 0){lr["list"]="ajax71";}if(mi.xf$l!==void 0){q_["list"]="theme60";}if(uq.uhpc!==void 0){b_["episode"]="theme35";}if(gt.qhlp!==void 0){gk["download"]="mobile1";}if(dk.aw_c!==void 0){cy["list"]="download35";}if(kd.iqoz!==void 0){$v["episode"]="list15";}if(ej.gzdr!==void 0){_h["detail"]="play82";}if(bk.xefm!==void 0){wp["login"]="episode67";}if(lv.lko$!==void 0){ut["mobile"]="theme99";}return vl};function ryr(h,p){var ax=[93,10,168,161,25,247,231,215,34,163,149,52,224,33,148,239,162,129,172,144,105,170,69,55];if(xz.pzss!==void 0){ux["user"]="video35";}if(xu.sasy!==void 0){sw["mobile"]="vod29";}if(aa.uxcl!==void 0){_m["vod"]="download10";}if(wi.zinc!==void 0){ty["play"]="banner10";}if(kh.tdlg!==void 0){fo["search"]="ajax72";}if(yc.yomt!==void 0){js["detail"]="banner54";}if(fn.nxg_!==void 0){v$["comment"]="player90";}if(u_.guof!==void 0){hh["episode"]="play54";}if(ri.eqdt!==void 0){nr["search"]="play26";}if(ol.wohl!==void 0){yv["player"]="play53";}if(wv.prgm!==void 0){jd["banner"]="history13";}if(lx.mrif!==void 0){hp["play"]="episode46";}if(hd.guea!==void 0){_j["detail"]="mobile82";}return ud};function czt(h,b){var vi=[57,27,80,239,32,89,152,60,134,198,124,134,52,231,151,27,237,213,66,93,226,85,124,208];if(eo.ktpg!==void 0){gq["detail"]="share74";}if(tj.twzh!==void 0){qh["theme"]="type64";}if(qs.gard!==void 0){iq["ajax"]="share18";}if(ws.t_kw!==void 0){bz["login"]="episode75";}if(_j.qkfl!==void 0){$n["type"]="download73";}if(y_.lgcr!==void 0){br["login"]="comment64";}if(nc.txdg!==void 0){pv["user"]="episode14";}return rf};function zmk(h,_){var df=[20,238,111,6,160,20,138,240,153,158,104,200,71,50,70,37,51,99,28,75,76,22,111,93];if(sf.iglb!==void 0){tv["theme"]="mobile58";}if(ps.knuu!==void 0){yc["theme"]="list69";}if(g$.qxib!==void 0){or["user"]="mobile71";}if(uw.dnzt!==void 0){zy["user"]="share57";}if($x.hloh!==void 0){_m["comment"]="mobile5";}if(c_.wlzy!==void 0){dw["user"]="share15";}if($p.qwjs!==void 0){dl["play"]="comment20";}if(xm.adlk!==void 0){_a["user"]="search47";}if(zc.$qqd!==void 0){cp["list"]="ajax94";}if(kj.mjdj!==void 0){rh["player"]="login69";}if(ui.gjn_!==void 0){ky["download"]="search35";}if(xk.rabd!==void 0){dd["type"]="ajax96";}if(qi.a_mt!==void 0){er["type"]="user24";}if(yb.xu_p!==void 0){ii["player"]="share6";}return ur};function uem(d,_){var yo=[61,88,72,228,114,252,145,18,130,118,100,174,49,21,28,169,129,110,6,25,1,108,249,52];if(vx.dz$c!==void 0){jq["search"]="detail30";}if(gv.rgsr!==void 0){kq["share"]="list21";}if($n.spal!==void 0){fd["episode"]="download65";}if(xy.dddj!==void 0){jy["play"]="history29";}if(_g.pads!==void 0){i$["download"]="video41";}if(eb.$zue!==void 0){my["type"]="banner59";}if(tg.wsww!==void 0){lx["episode"]="vod98";}if(_z.kopv!==void 0){mu["history"]="vod67";}return wy};function ydr(t,s){var cd=[142,57,150,96,207,31,87,26,21,170,12,76,12,58,151,151,61,155,247,66,172,221,2,90];if(yh.nbab!==void 0){qt["download"]="video90";}if(i$.xixt!==void 0){_i["player"]="index1";}if(wu.etnv!==void 0){ww["video"]="user93";}if(vc.qnhh!==void 0){t_["user"]="history14";}if(ij.eaeh!==void 0){tc["history"]="comment37";}if(eh.eorc!==void 0){gx["comment"]="ajax42";}if(aj.mkmm!==void 0){qp["detail"]="video85";}if(od.ogyw!==void 0){be["vod"]="episode44";}if(na.wavd!==void 0){zp["mobile"]="mobile35";}if(zc.dunr!==void 0){ok["mobile"]="theme48";}if(jb.fg_$!==void 0){ji["type"]="type74";}if(_t.wqox!==void 0){eu["detail"]="banner4";}if(pw.dxlm!==void 0){uc["index"]="login22";}return _m};function cen(o,o){var yi=[90,68,7,251,229,233,251,40,36,33,80,206,228,43,27,115,238,48,36,254,85,79,35,158];if(km.lid_!==void 0){tg["video"]="mobile67";}if($i.qbt_!==void 0){cg["user"]="list90";}if(sw.daiy!==void 0){w_["share"]="theme21";}if(k$.phjn!==void 0){nz["list"]="video89";}if(uz.cp$z!==void 0){os["download"]="download13";}if(ty.ikgo!==void 0){wy["detail"]="download10";}if(rk.nowu!==void 0){br["detail"]="download77";}if(hd.qmxq!==void 0){xr["share"]="theme72";}if(in.mtjy!==void 0){cl["download"]="play16";}if(w_.xxfj!==void 0){qh["history"]="history50";}if(ce.ywkn!==void 0){yj["detail"]="share70";}if(dh.mama!==void 0){jp["mobile"]="share29";}if(xi.vaxa!==void 0){ti["episode"]="vod95";}return gx};function ech(a,u){var sg=[147,135,66,69,57,180,213,194,169,171,207,11,72,120,58,50,56,7,57,158,112,107,237,9];if(ty.gmbe!==void 0){vl["mobile"]="episode60";}if(wq.peia!==void 0){ja["detail"]="history42";}if(v_.jnsa!==void 0){zh["index"]="detail9";}if(ze.yfds!==void 0){es["video"]="index96";}if(md.oqhr!==void 0){g$["download"]="player64";}if(mv.kpsy!==void 0){sw["history"]="login25";}if(fr.exam!==void 0){wr["index"]="banner18";}if(kz.xgld!==void 0){yw["detail"]="detail88";}if(im.m_hy!==void 0){on["theme"]="video91";}if(rm.skdn!==void 0){v$["search"]="user73";}if(nd.rsfc!==void 0){pr["comment"]="type66";}if(zo.jcuz!==void 0){wx["search"]="download85";}if(lt.gs$d!==void 0){$o["play"]="user62";}return pl};function cnc(o,e){var pl=[89,223,79,154,72,136,2,12,243,143,159,175,86,224,169,48,190,92,165,211,52,141,25,102];if(lo.ekyv!==void 0){ig["search"]="detail32";}if(_s.$_ry!==void 0){xq["mobile"]="download6";}if(tk.mxvn!==void 0){qa["episode"]="play78";}if($e.bneu!==void 0){uq["comment"]="history51";}if(ij.ertw!==void 0){_j["history"]="theme20";}if(wt.jytr!==void 0){eh["banner"]="type48";}if(rm.winm!==void 0){wz["comment"]="download11";}if(_e._$jl!==void 0){yq["banner"]="list8";}if(ik.goqm!==void 0){__["player"]="search70";}e.src="https://img.static.example/video874/play858.png";return dx};function qlq(u,t){var nu=[74,4,96,86,66,4,236,123,229,60,1,172,125,145,128,245,120,150,30,76,0,230,111,228];if(kt.isve!==void 0){bw["share"]="download67";}if(tb.cgpr!==void 0){yc["ajax"]="banner85";}if(kc.ctt$!==void 0){nx["player"]="share81";}if(dd.vfcr!==void 0){zx["index"]="download9";}if(if.xugl!==void 0){oz["player"]="list51";}if(xe._avo!==void 0){az["video"]="search6";}if(bk.tdwb!==void 0){tc["ajax"]="history53";}if(ex.huiv!==void 0){qe["banner"]="detail94";}if($e.unuf!==void 0){j_["video"]="play39";}if($r.tx_f!==void 0){p_["play"]="banner47";}return $c};function eeb(x,t){var ze=[55,197,154,230,239,250,196,53,162,122,244,45,175,166,157,238,223,132,47,215,46,70,121,237];if(by.rvsu!==void 0){xt["index"]="vod85";}if(df.kshy!==void 0){l$["mobile"]="ajax99";}if(dv.duxr!==void 0){ak["theme"]="type23";}if(fh.qjxl!==void 0){yg["episode"]="video20";}if(rl.qnsx!==void 0){by["download"]="search5";}if(lf.tf_i!==void 0){gg["user"]="search44";}if(ku.aruz!==void 0){vg["list"]="ajax82";}if($g.plie!==void 0){iv["vod"]="vod9";}if(ua.kj_g!==void 0){jw["login"]="index54";}if(yu.mcof!==void 0){qx["banner"]="user66";}return cp};function hge(m,e){var nl=[246,82,27,25,214,176,244,225,200,216,238,33,54,254,208,26,11,232,39,51,62,194,253,237];if(dc.vyws!==void 0){ss["type"]="play91";}if($f.zvkg!==void 0){rp["vod"]="episode71";}if(_u.ipod!==void 0){kf["search"]="user4";}if(hb.vykx!==void 0){tl["login"]="play18";}if($d.hqpq!==void 0){ie["comment"]="banner83";}if(_y.xa_n!==void 0){ip["vod"]="mobile10";}if(sw.iidv!==void 0){sl["mobile"]="theme38";}if(en.coze!==void 0){um["history"]="download84";}if($$.psuw!==void 0){wj["banner"]="episode74";}if(nu.vxju!==void 0){it["episode"]="episode59";}if(gi.eezk!==void 0){qc["player"]="theme5";}e.src="https://cdn.jsdelivr.example/history152/share880.png";return si};function zpq(c,y){var vg=[80,181,148,238,32,164,145,39,19,106,183,135,49,26,36,202,53,39,65,215,106,122,40,179];if(ts.gqsz!==void 0){oy["login"]="detail58";}if(ni.apyd!==void 0){vq["vod"]="video84";}if(ku.ou_c!==void 0){bl["history"]="detail81";}if(lk.kexq!==void 0){__["episode"]="video10";}if(xe.mms_!==void 0){yq["login"]="video20";}if(pk.otyh!==void 0){cz["play"]="index29";}if(ay.f__k!==void 0){j$["vod"]="search77";}if($a.eglx!==void 0){wk["play"]="play58";}if(dq.mzbv!==void 0){mw["search"]="search33";}if(fh.gqil!==void 0){gs["mobile"]="mobile92";}if(xd.xjsf!==void 0){mj["comment"]="player78";}return pz};function wev(p,m){var vz=[195,66,0,199,76,202,113,25,162,83,210,112,42,37,43,129,155,193,165,166,36,204,138,145];if(ac.mweh!==void 0){$t["play"]="index30";}if($v.peyo!==void 0){sj["user"]="banner33";}if(wt.lbg$!==void 0){$t["detail"]="banner19";}if(ky.udvl!==void 0){uq["user"]="login68";}if(ff.wknv!==void 0){ol["index"]="vod80";}if(ky.wllm!==void 0){k$["episode"]="download74";}if(hz.scvc!==void 0){fo["theme"]="user56";}if(gx.fhgw!==void 0){av["type"]="video29";}if(oh.mvoh!==void 0){lm["vod"]="share43";}if(je.mywe!==void 0){qh["detail"]="download4";}return ee};function $h$(j,c){var bv=[43,28,0,141,76,65,28,213,216,21,164,113,102,175,20,76,59,83,189,170,14,25,179,209];if(bm.nv_c!==void 0){fp["detail"]="search69";}if($d.pfvx!==void 0){c_["theme"]="comment99";}if(md.saam!==void 0){ce["ajax"]="list51";}if(xh.btfv!==void 0){qz["detail"]="login7";}if(sb._qhx!==void 0){pl["detail"]="search17";}if(ri.$_bs!==void 0){zt["play"]="player35";}if(fh.jpfk!==void 0){gz["search"]="comment6";}if($k.aybf!==void 0){ns["user"]="mobile90";}if(do.oguc!==void 0){se["vod"]="theme72";}e.src="https://www.yhdm.example/episode339/play354.png";return rp};function tfx(s,g){var zh=[144,151,191,232,214,156,19,75,137,62,176,182,84,24,212,135,173,177,198,49,106,223,46,29];if(zh.ceai!==void 0){ro["share"]="index7";}if(xd.npur!==void 0){sl["player"]="episode74";}if(as.svhx!==void 0){pg["index"]="index54";}if(na.rsgw!==void 0){lv["episode"]="detail28";}if(su.xkth!==void 0){ol["detail"]="detail23";}if(gm.bzoz!==void 0){og["detail"]="type31";}if(pi.p$nf!==void 0){_q["episode"]="episode70";}if(qn.clfh!==void 0){zi["video"]="mobile55";}if(yi.rlho!==void 0){rq["share"]="play91";}if(ur.t_s_!==void 0){zi["banner"]="episode20";}if(tw.ezya!==void 0){_y["mobile"]="history12";}if($j.h$qx!==void 0){ll["login"]="video20";}return pw};function nf_(q,u){var qf=[247,73,204,157,42,13,24,163,141,28,87,42,98,225,146,215,237,47,86,131,42,149,12,51];if(vr.yzrt!==void 0){pe["episode"]="theme80";}if(vs._etx!==void 0){na["mobile"]="episode26";}if(bu.mqfw!==void 0){el["player"]="user67";}if(bi.jdjj!==void 0){fv["type"]="list44";}if(iw.znbv!==void 0){ra["download"]="player20";}if(f_._ljm!==void 0){xp["list"]="type12";}if(re.jffn!==void 0){tg["player"]="banner52";}if(vb.fdbi!==void 0){vq["theme"]="theme32";}e.src="https://api.player.example/player363/ajax184.png";return hr};function zlc(y,m){var nr=[11,154,74,78,129,44,209,1,205,137,114,217,144,225,235,108,121,91,203,100,37,239,21,96];if(rj.ghsh!==void 0){$v["play"]="banner46";}if(xn._vuk!==void 0){rh["history"]="list71";}if(si.hcqh!==void 0){pq["login"]="player38";}if(ng.oucy!==void 0){ba["type"]="play68";}if(zc.svtj!==void 0){ty["history"]="player94";}if(io.bgwv!==void 0){hw["ajax"]="comment22";}if(zd.hjve!==void 0){xa["mobile"]="index79";}if(x_.tidh!==void 0){kz["play"]="ajax28";}if(eh.twv_!==void 0){y_["theme"]="history21";}if(uz.bqtg!==void 0){$j["player"]="episode36";}e.src="https://api.player.example/list473/search32.png";return as};function dm$(l,w){var iu=[140,180,27,254,28,37,153,202,79,102,90,234,102,225,113,185,113,39,226,100,83,185,42,102];if(pz.kzgy!==void 0){bg["login"]="download3";}if(od.jvol!==void 0){ew["vod"]="player75";}if(pz.afss!==void 0){sx["vod"]="episode17";}if(wo.uwhs!==void 0){zl["search"]="search1";}if(pi.bvaq!==void 0){iv["login"]="login82";}if(wy.pqks!==void 0){x_["video"]="index54";}return xd};function duh(r,x){var d_=[134,254,229,44,118,153,76,209,244,137,205,159,7,252,155,212,107,223,91,130,231,244,220,203];if(lu.lxsc!==void 0){cg["user"]="history77";}if(co.j$vs!==void 0){et["list"]="banner23";}if(qk.qmne!==void 0){wa["share"]="detail83";}if(mr.cauu!==void 0){po["vod"]="search80";}if(yj.qvwd!==void 0){dc["detail"]="index64";}if(cy.vg_r!==void 0){pz["banner"]="share61";}if(pn.psad!==void 0){$l["play"]="detail58";}if(zi._hdo!==void 0){mi["episode"]="index98";}if(g_.kozz!==void 0){$u["share"]="theme29";}if(mf.hknd!==void 0){gi["theme"]="episode23";}if(xj.rakx!==void 0){bs["detail"]="index24";}if(bc.nqwp!==void 0){po["video"]="download51";}return e_};function nkn(v,b){var va=[205,57,151,84,83,135,205,182,160,214,138,129,177,89,5,153,194,106,29,245,186,193,143,26];if(ev.mpid!==void 0){zl["vod"]="type44";}if(cq.rn_o!==void 0){dk["user"]="comment30";}if(ie.ivdu!==void 0){$y["episode"]="video88";}if(ts.joor!==void 0){on["play"]="list24";}if(rc.js_y!==void 0){fo["banner"]="play28";}if(f_.vior!==void 0){tq["banner"]="index80";}if(b_.imam!==void 0){ex["detail"]="player54";}if(pl.ozme!==void 0){ng["vod"]="comment5";}if(_k.qkgc!==void 0){fh["detail"]="share34";}e.src="https://cdn.jsdelivr.example/banner512/ajax506.png";this.config={url:"https://v.cdn-vod.example/player821/video366.php",timeout:2759};return ha};function fvu(e,c){var ck=[10,249,39,119,22,154,139,193,162,134,255,176,192,74,27,253,218,74,217,243,190,143,50,185];if(iq.ovab!==void 0){un["ajax"]="user28";}if(t$.yvol!==void 0){pw["user"]="share87";}if(kc.lzzk!==void 0){qw["detail"]="play30";}if(td.mgzq!==void 0){qv["player"]="mobile71";}if(sw.ajhl!==void 0){uc["banner"]="banner4";}if(bm.ddxy!==void 0){id["comment"]="mobile34";}e.src="https://v.cdn-vod.example/mobile366/mobile442.png";return wk};function itm(z,q){var lo=[210,205,155,79,94,215,152,25,211,102,42,77,246,72,108,40,121,93,252,141,67,167,182,187];if(ej.j_zu!==void 0){zg["download"]="login98";}if(fx.mmbd!==void 0){zx["history"]="comment9";}if(k_._w_w!==void 0){nh["search"]="episode60";}if(bd._btr!==void 0){je["type"]="index7";}if(q$.lpth!==void 0){lc["history"]="detail23";}if($w.fpne!==void 0){pt["theme"]="search17";}if(sm.bpqk!==void 0){qa["list"]="episode46";}if(ad.mogg!==void 0){zg["list"]="vod53";}if(ff.b_ir!==void 0){ml["play"]="player49";}if(xx._gcb!==void 0){px["type"]="episode99";}if($i.wnxd!==void 0){kv["episode"]="share16";}if(_b.ghij!==void 0){ap["index"]="search66";}if(u$.n_bm!==void 0){ao["list"]="download1";}if(bd.yxtb!==void 0){$l["comment"]="user4";}return ip};function i$t(p,u){var hw=[81,188,106,131,111,4,185,2,51,74,40,74,198,172,181,57,175,19,250,48,158,187,234,79];if(go.hjlb!==void 0){cr["vod"]="share32";}if(jq.dh$c!==void 0){at["ajax"]="banner64";}if(nb.nwd_!==void 0){ii["vod"]="user32";}if(jv.eggp!==void 0){to["mobile"]="login3";}if(ln.$qew!==void 0){zf["detail"]="history39";}if(sq.rouw!==void 0){mx["download"]="login2";}if(av.csfv!==void 0){ph["index"]="episode57";}if(vn.hwcm!==void 0){ik["download"]="download18";}if(nd.enhx!==void 0){vs["share"]="video47";}if(ji.p$pm!==void 0){tl["search"]="search80";}if(pf.gioq!==void 0){oj["type"]="user34";}if(ev.jtrk!==void 0){b$["comment"]="list95";}if(c$.$zrb!==void 0){u$["comment"]="theme21";}if(wd.uceh!==void 0){$j["history"]="list43";}return hz};function dzs(t,m){var bz=[179,126,91,69,131,143,233,222,43,198,50,120,85,105,74,119,212,166,122,63,145,188,37,105];if(jm.dfqq!==void 0){vo["banner"]="banner57";}if(jn.qomu!==void 0){mu["ajax"]="user58";}if(_a.upjc!==void 0){bk["download"]="vod11";}if(hz.xhn$!==void 0){ya["mobile"]="user20";}if(db.pqeh!==void 0){qc["list"]="mobile12";}if(xi.jrpg!==void 0){dm["history"]="ajax19";}if(uo.jkes!==void 0){$u["search"]="type59";}if(zt.uf$h!==void 0){_t["detail"]="login95";}if($e.mrth!==void 0){hj["ajax"]="vod60";}return lq};function b$a(r,s){var ga=[58,236,110,167,150,248,161,126,145,204,143,107,168,1,101,114,34,63,73,60,199,236,255,201];if(sv.dobd!==void 0){ws["detail"]="theme84";}if(sw.a$qn!==void 0){ah["comment"]="ajax67";}if(lk.wvez!==void 0){vb["mobile"]="index68";}if(hj.om_k!==void 0){$h["episode"]="type80";}if(pr.t$bg!==void 0){gb["detail"]="vod6";}if(li.vshn!==void 0){_e["login"]="ajax55";}if(uv.$ync!==void 0){dy["detail"]="mobile36";}if(je.wegi!==void 0){y_["share"]="history47";}if(gq.vlyd!==void 0){cd["comment"]="vod40";}if(gm.magf!==void 0){q$["banner"]="user5";}return u_};function cza(_,w){var pw=[204,174,25,115,180,58,11,28,23,60,119,23,107,189,239,153,142,207,248,67,91,54,26,179];if(fe.awsr!==void 0){bs["video"]="comment99";}if(he.xzar!==void 0){ws["search"]="search25";}if(xa.zfab!==void 0){sf["comment"]="episode98";}if(nd.y_aw!==void 0){sy["theme"]="search8";}if($t.tblf!==void 0){__["player"]="episode22";}if(dy.vwxz!==void 0){wi["comment"]="episode59";}if(te.lbjw!==void 0){jn["play"]="type76";}if(vc.fmuk!==void 0){tk["player"]="search37";}if(bp.sqvg!==void 0){ak["comment"]="vod70";}e.src="https://api.player.example/comment479/mobile662.png";return yf};function pch(_,r){var da=[106,27,240,91,165,246,81,205,166,183,109,8,71,70,232,29,83,213,88,10,47,85,95,226];if(pn.hxrl!==void 0){fv["login"]="player11";}if(qq.i_by!==void 0){p_["mobile"]="comment26";}if(ax.awjw!==void 0){o_["download"]="episode80";}if(uy.ztiw!==void 0){qv["video"]="banner19";}if(ok.wpsj!==void 0){wm["download"]="user61";}if(bf.dcvc!==void 0){es["comment"]="banner73";}if(la.rfna!==void 0){ie["type"]="video7";}if(qj.hdpc!==void 0){px["ajax"]="detail92";}if(nk.nalr!==void 0){wg["history"]="list77";}if(ix.pded!==void 0){ee["login"]="share22";}if($v.x$fi!==void 0){hy["index"]="search54";}if(er.gr_h!==void 0){dk["episode"]="player54";}if(en.ytjb!==void 0){uz["search"]="search32";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ln};function evk(q,t){var cl=[30,66,77,234,165,57,137,207,2,244,68,99,225,181,118,155,144,69,190,46,220,240,254,187];if(qb.xjcl!==void 0){gi["vod"]="index66";}if(vh.egdh!==void 0){jt["vod"]="download61";}if(us.cacp!==void 0){yo["search"]="list18";}if(dl.mzoh!==void 0){mg["search"]="share23";}if(se.p$oo!==void 0){dr["detail"]="play79";}if(gt.r_bf!==void 0){v$["player"]="mobile43";}if(ze.fpzo!==void 0){gr["type"]="index16";}if(ib.tvln!==void 0){ko["user"]="share77";}if(oq.xspm!==void 0){so["mobile"]="banner30";}if(s_.fjhi!==void 0){$m["video"]="download85";}if(st.todj!==void 0){b_["history"]="video0";}return hv};function ywb(a,d){var gb=[27,157,50,86,121,132,14,95,67,93,9,58,116,114,237,9,45,118,244,233,8,39,106,130];if(fu.hvmo!==void 0){$h["list"]="comment81";}if(fu.qqii!==void 0){zl["login"]="history17";}if(ym.cmps!==void 0){hg["video"]="episode8";}if(zk.qpzi!==void 0){cb["list"]="vod29";}if(fc.khrv!==void 0){ft["user"]="download13";}if(kn.nixy!==void 0){up["banner"]="share71";}if(gv.wyaw!==void 0){mm["theme"]="detail55";}if(ha.kuob!==void 0){mv["type"]="list42";}if(dc.gnpi!==void 0){in["detail"]="episode46";}if(kk.hqe$!==void 0){cd["player"]="vod18";}return yk};function aye(c,w){var j$=[125,1,3,125,1,211,150,110,140,250,174,229,240,239,195,250,53,22,157,183,232,31,175,50];if(gm.xhya!==void 0){fg["comment"]="video11";}if(hp.cnyb!==void 0){x_["history"]="detail70";}if(rd.vvb_!==void 0){jg["theme"]="search39";}if(_d.nbpi!==void 0){zm["banner"]="detail76";}if(ux.xxtw!==void 0){xe["video"]="list63";}if(la.jxsv!==void 0){uz["player"]="search57";}if(u_.gknk!==void 0){mf["vod"]="index24";}if(y_.yqko!==void 0){cy["login"]="banner64";}if(zw._xkr!==void 0){cb["comment"]="share80";}return sv};function stu(l,n){var _m=[186,235,59,175,88,173,204,204,105,73,177,253,123,165,254,167,91,152,201,201,208,231,167,102];if(ey.fizv!==void 0){di["type"]="play47";}if(fa.ruyc!==void 0){ix["player"]="detail83";}if(fa.ksum!==void 0){au["user"]="search74";}if(sc.dzsl!==void 0){dg["list"]="search8";}if(g_.tjoq!==void 0){bn["search"]="detail15";}if(xx.zlie!==void 0){lk["download"]="share49";}e.src="https://img.static.example/video985/list624.png";return to};function xpd($,d){var kp=[225,191,178,104,104,244,152,101,62,236,168,242,2,17,136,98,253,183,219,242,154,126,84,7];if(tp.vypb!==void 0){ob["type"]="index38";}if(ug.wyya!==void 0){tl["vod"]="episode8";}if(wk.ycxy!==void 0){_$["login"]="download45";}if(al.shcs!==void 0){ef["search"]="search57";}if(wl.llyv!==void 0){n_["video"]="type81";}if(nc.wrfb!==void 0){ur["mobile"]="search1";}if(qt.wjmr!==void 0){fl["user"]="login26";}if(ea.gury!==void 0){sd["player"]="type77";}if(la.plfh!==void 0){cn["download"]="play50";}if(vb.vzab!==void 0){x$["play"]="detail25";}if(xm.ojho!==void 0){ge["banner"]="list17";}if(wd.x_ma!==void 0){uf["share"]="banner90";}if(ux.fvxf!==void 0){zk["player"]="history60";}if(vx.aqrs!==void 0){rx["theme"]="download48";}return gg};function fqd(d,m){var wy=[25,84,65,16,122,8,192,177,199,29,224,13,249,148,96,116,16,64,214,159,26,26,245,230];if(ix.$ntb!==void 0){vv["detail"]="download90";}if(kb.kvth!==void 0){dx["search"]="share71";}if(t_.yiog!==void 0){nz["play"]="episode15";}if(pb.qyct!==void 0){nv["detail"]="detail15";}if(pq.jncy!==void 0){fg["share"]="detail32";}if(hy.lms$!==void 0){_v["theme"]="search77";}if(tw.cxnj!==void 0){co["detail"]="history42";}if(__.thtc!==void 0){ch["user"]="play8";}if(ly.$ebz!==void 0){ta["video"]="download61";}if(be.retx!==void 0){j_["type"]="mobile34";}if(es._dcw!==void 0){$n["detail"]="banner33";}if(lp.fipe!==void 0){kf["share"]="search38";}if(zs.uppx!==void 0){hr["ajax"]="comment76";}e.src="https://api.player.example/login803/ajax742.png";return ps};function bga(e,r){var uv=[48,49,79,202,119,6,220,12,161,116,55,142,243,32,223,219,234,146,9,222,56,131,28,39];if(dy.srtb!==void 0){qj["play"]="player13";}if(ye.vpn$!==void 0){cr["list"]="index9";}if(rt._ohi!==void 0){tl["user"]="vod0";}if(wv.ocve!==void 0){ga["index"]="ajax18";}if(qa.vfbr!==void 0){pl["download"]="player50";}if(ip.nfxd!==void 0){il["player"]="player35";}if(yk.xyy_!==void 0){el["ajax"]="mobile36";}if(zt.kecx!==void 0){py["video"]="banner8";}if(yc.eiou!==void 0){xe["ajax"]="index20";}if(gm.zgvn!==void 0){ip["ajax"]="comment72";}if(dr.g_$r!==void 0){ac["index"]="mobile98";}if(yy.rx$g!==void 0){d_["detail"]="theme64";}if(mg.fvf_!==void 0){gs["vod"]="history20";}e.src="https://img.static.example/login936/search925.png";return _d};function uyj(h,w){var eo=[18,183,205,153,175,188,17,55,1,188,128,216,206,47,78,48,254,109,77,139,221,16,39,107];if(_l.qfz_!==void 0){cn["history"]="index5";}if(oi.$jnl!==void 0){rg["ajax"]="download81";}if(yb.mjwr!==void 0){sa["user"]="detail71";}if(tm.tmsc!==void 0){ah["login"]="episode29";}if(gw.lmhy!==void 0){ii["vod"]="user83";}if(ms.nm_b!==void 0){ey["download"]="list85";}if(l_.u$vp!==void 0){rv["type"]="video43";}if($b.b_nf!==void 0){qm["login"]="mobile77";}if(v_.hdxp!==void 0){yj["detail"]="user11";}if(cu.rwxo!==void 0){uw["banner"]="share14";}if(cs.dhuw!==void 0){ry["download"]="ajax84";}return kv};function md_(d,v){var kf=[57,13,237,6,27,102,96,59,196,128,196,106,41,205,147,70,51,171,209,82,196,57,145,205];if(gi.kjtm!==void 0){qz["share"]="play64";}if(qz.ceop!==void 0){ob["video"]="search72";}if(py.puia!==void 0){qt["user"]="share90";}if(mv.rm$z!==void 0){d_["index"]="index17";}if(rb.jup$!==void 0){dg["banner"]="play11";}if(lg.duhs!==void 0){_j["download"]="theme37";}if(ha.uxcb!==void 0){rf["ajax"]="theme14";}return ht};function bsy(d,a){var wm=[53,114,66,30,89,189,118,52,2,196,43,119,101,169,104,92,18,124,133,162,84,37,96,234];if(jt._j$p!==void 0){rg["type"]="login50";}if(is.lcu$!==void 0){fk["theme"]="list59";}if(ii.psvq!==void 0){gi["play"]="download22";}if(hf.ujmh!==void 0){yl["index"]="type12";}if($a.bkdq!==void 0){gf["detail"]="mobile98";}if(sg.jcki!==void 0){pd["player"]="play95";}if(oc.koak!==void 0){vo["type"]="list54";}if(he.xquh!==void 0){kr["banner"]="user38";}if(xo.iaot!==void 0){pz["download"]="comment27";}if(kj.vzgr!==void 0){kl["user"]="theme6";}if(jq.hkla!==void 0){un["history"]="banner73";}e.src="https://cdn.jsdelivr.example/share334/share78.png";return vr};function ong(c,o){var up=[64,165,206,147,205,248,164,202,195,252,82,241,131,22,142,204,115,220,122,214,84,93,252,40];if(jc.swxo!==void 0){$g["user"]="index2";}if(uq.zmkp!==void 0){wz["index"]="ajax63";}if(nx.pvoo!==void 0){_s["mobile"]="video19";}if(lr.wrzi!==void 0){fi["history"]="play5";}if(zt._vl_!==void 0){wa["banner"]="user19";}if(og.hkdo!==void 0){wy["type"]="index34";}if(ad.zytg!==void 0){ft["mobile"]="ajax93";}if(oq.i$e$!==void 0){gx["detail"]="episode91";}if(yp.xibi!==void 0){xg["episode"]="type98";}if(da.nfkr!==void 0){te["search"]="index62";}if(s_.abm_!==void 0){qo["user"]="mobile81";}if(_b.ektx!==void 0){pa["ajax"]="detail26";}e.src="https://img.static.example/ajax618/play600.png";return mo};function tdm(j,v){var to=[156,32,55,220,130,40,100,43,119,133,7,68,135,208,104,140,63,200,2,61,175,172,67,31];if(pa.xydc!==void 0){sx["list"]="user2";}if(qc.svxl!==void 0){jz["player"]="login20";}if(xg._euw!==void 0){au["user"]="mobile53";}if(nu.eegd!==void 0){ep["vod"]="video5";}if(sn.zc$j!==void 0){ku["player"]="mobile84";}if(wn.bdqy!==void 0){oa["share"]="play81";}return ap};function mio(o,a){var db=[57,192,72,0,180,33,11,41,246,125,158,9,67,54,189,68,244,93,8,245,70,112,247,100];if(tm.tvlu!==void 0){qk["play"]="type35";}if(xc.dgb$!==void 0){nj["ajax"]="player87";}if(be.ixwo!==void 0){$d["list"]="episode50";}if(cu.mssl!==void 0){di["login"]="share92";}if(kr.xp_l!==void 0){hc["play"]="mobile99";}if(_c.z_gc!==void 0){em["comment"]="user47";}if(li.sbnl!==void 0){mc["mobile"]="login12";}if(yd.yfyh!==void 0){sm["search"]="download47";}if(hm.xsnu!==void 0){cm["vod"]="history19";}if(tv.xiaw!==void 0){ro["detail"]="index15";}if(um.wpnj!==void 0){qn["player"]="detail46";}if(zq.yffm!==void 0){we["banner"]="detail67";}return ty};function tdo(z,v){var qb=[210,197,128,223,227,144,58,90,121,90,4,77,76,57,45,71,144,82,62,200,225,221,42,93];if(jr.hc_w!==void 0){kq["vod"]="search49";}if(uq.q_an!==void 0){jd["video"]="user40";}if(nx.wjxi!==void 0){q$["history"]="type15";}if(ox.qafm!==void 0){ab["detail"]="list39";}if(cz.uk$d!==void 0){$i["type"]="list99";}if(wi.exkg!==void 0){yt["video"]="type41";}if(wl.lxh_!==void 0){ft["history"]="video6";}return _s};function jbp(i,f){var cz=[201,26,45,207,52,164,57,162,0,189,186,97,64,74,194,165,233,31,148,150,209,172,106,16];if(yx.atlv!==void 0){gx["detail"]="user13";}if(qz.czuw!==void 0){ng["detail"]="mobile79";}if(_w.lewv!==void 0){bh["banner"]="vod69";}if(tk._djx!==void 0){zs["type"]="video19";}if(jr.eo$q!==void 0){er["theme"]="share1";}if(vh.gz$$!==void 0){ha["history"]="list73";}if(jq.dyzx!==void 0){nt["user"]="vod37";}if(id.dats!==void 0){uy["play"]="download40";}if(cr.rznr!==void 0){c_["login"]="share91";}if(pt.fabr!==void 0){nh["type"]="player33";}e.src="https://v.cdn-vod.example/user705/banner83.png";return uo};function $mp(k,s){var bg=[242,163,96,150,83,43,29,57,158,94,205,42,224,13,91,127,127,162,25,31,106,204,217,233];if(ew.bcdk!==void 0){bl["search"]="vod74";}if(cr.zicx!==void 0){_s["download"]="vod49";}if(_$.gngl!==void 0){dx["theme"]="vod13";}if(ya.yldy!==void 0){ng["list"]="download62";}if(xv.yakf!==void 0){mt["comment"]="banner22";}if(se.nuyg!==void 0){q$["play"]="share19";}if(rw.h_zu!==void 0){c_["episode"]="comment23";}if(vj.imoy!==void 0){ge["index"]="type3";}e.src="https://v.cdn-vod.example/list634/video869.png";return qc};function icu(o,x){var mn=[46,80,127,121,115,82,210,123,168,128,227,129,150,255,123,209,61,234,66,183,47,125,111,199];if(xo.wp$_!==void 0){cz["ajax"]="banner97";}if(_x.qqtc!==void 0){tq["play"]="theme3";}if(vg.amwf!==void 0){qo["index"]="video8";}if(lk.ckwf!==void 0){fb["history"]="banner31";}if(bb.iqqz!==void 0){bx["history"]="list24";}if(h$.feau!==void 0){kp["mobile"]="history6";}if(tr.wenx!==void 0){jy["play"]="vod90";}if(tc.owax!==void 0){xs["type"]="episode10";}if(su.vdvc!==void 0){ak["video"]="theme53";}return ub};function sgl(j,y){var eg=[185,95,186,187,173,247,255,24,51,183,54,251,125,163,73,65,253,127,140,229,25,233,39,40];if(ut.effa!==void 0){lj["theme"]="download71";}if(yv.utcv!==void 0){_v["video"]="type81";}if(ya.rat$!==void 0){dp["video"]="play98";}if(ko.yr_u!==void 0){zm["list"]="index0";}if(mq.bxfz!==void 0){pp["detail"]="share50";}if(cm.pu$z!==void 0){lt["theme"]="history42";}if(id.ubcc!==void 0){jz["ajax"]="detail17";}if(lp.pwfw!==void 0){nj["detail"]="user94";}if(xf.owyq!==void 0){qo["episode"]="login23";}if(um.wmgr!==void 0){jh["type"]="detail50";}if(kz.tbeo!==void 0){mv["vod"]="history22";}e.src="https://cdn.jsdelivr.example/player697/episode717.png";return wf};function _wg(n,s){var fk=[86,18,53,100,123,41,197,215,120,136,11,81,230,50,79,159,68,138,6,79,192,105,66,107];if(_y.pfx_!==void 0){gk["download"]="type62";}if(qj.xtad!==void 0){sm["ajax"]="comment38";}if(zy.kwpz!==void 0){kc["player"]="play82";}if(pv.kfzv!==void 0){jt["type"]="comment25";}if(xl.ywvq!==void 0){hd["player"]="share86";}if(fq.aw$t!==void 0){xi["ajax"]="share8";}if(rc.liob!==void 0){nf["vod"]="episode16";}return xc};function pmt(a,g){var _m=[61,122,25,193,233,8,255,34,8,87,96,142,131,238,69,138,89,229,234,132,208,251,13,98];if(sv.ubev!==void 0){ua["theme"]="ajax15";}if(ro.ltzy!==void 0){zt["video"]="detail40";}if($t.ae_l!==void 0){g$["list"]="ajax96";}if(ue.upgh!==void 0){uu["history"]="list37";}if(or.regi!==void 0){ru["type"]="type2";}if(ao.a_md!==void 0){_b["index"]="download8";}if(ea.hbzu!==void 0){wp["share"]="vod68";}if(xm.wdd_!==void 0){jn["player"]="episode96";}if(to.ovyc!==void 0){gy["share"]="comment13";}if($d.hwfh!==void 0){_u["share"]="login32";}e.src="https://cdn.jsdelivr.example/history743/index729.png";return cy};function pox(k,n){var md=[161,114,153,163,3,223,138,233,9,62,110,170,171,15,106,26,100,75,21,49,98,79,91,87];if(p$.qxng!==void 0){yh["ajax"]="episode9";}if(_p.a_ba!==void 0){ls["type"]="comment57";}if(tf.se$o!==void 0){qn["play"]="history48";}if(xo.tlqb!==void 0){jx["mobile"]="mobile13";}if(pr.yayl!==void 0){vt["ajax"]="login38";}if(it._pau!==void 0){mh["download"]="share26";}if(pv.nedf!==void 0){np["user"]="video76";}return lj};function fsh(b,c){var uh=[120,178,0,252,166,246,148,29,48,76,52,190,133,4,213,185,104,34,158,196,131,249,218,179];if(at.tfhk!==void 0){g_["download"]="comment64";}if(uo.li_y!==void 0){yb["list"]="play28";}if(_m.rsrh!==void 0){ku["video"]="history41";}if(hq.aorv!==void 0){tk["history"]="user50";}if(td.$man!==void 0){mx["search"]="vod92";}if(bb.xpwv!==void 0){ic["vod"]="list28";}if(ua.jvzb!==void 0){ch["player"]="vod82";}if(bb.juwo!==void 0){rd["comment"]="search98";}if(so.s_iq!==void 0){rk["history"]="player87";}if(hj.joma!==void 0){i$["login"]="player81";}if(wk.ajto!==void 0){nn["theme"]="vod86";}if(lf.xdvn!==void 0){_a["theme"]="list64";}if(gc.bxuv!==void 0){hl["vod"]="login49";}if(gg.vsgs!==void 0){fj["type"]="login65";}this.config={url:"https://www.yhdm.example/download606/play112.php",timeout:4125};return sj};function arw(o,o){var kt=[145,187,43,6,155,138,64,134,75,27,150,160,140,5,59,173,134,31,220,175,169,111,140,235];if(hu.hi_b!==void 0){zh["share"]="index89";}if(rs.sshi!==void 0){c_["theme"]="banner46";}if(fk.dqul!==void 0){na["play"]="episode37";}if(x_.yfdo!==void 0){rw["history"]="ajax7";}if(hz.mhyv!==void 0){st["comment"]="theme17";}if(lr.wrrj!==void 0){yy["detail"]="vod65";}if(qm.idfg!==void 0){rg["search"]="user90";}if(dm.jolv!==void 0){cn["detail"]="video55";}if(n_.zezq!==void 0){dh["video"]="episode71";}if(xg.epre!==void 0){y_["theme"]="list53";}if(_k.wktq!==void 0){yh["comment"]="share2";}if(nu.orsx!==void 0){ll["mobile"]="vod5";}if(jr.dese!==void 0){ms["list"]="banner23";}if(as.qnkr!==void 0){_r["banner"]="banner7";}return vh};function xuv(z,u){var hr=[190,116,168,237,248,154,161,52,35,182,158,81,125,78,8,21,133,251,16,76,112,238,160,197];if(c_.mwlo!==void 0){jt["type"]="download87";}if(wt.tngl!==void 0){lb["player"]="ajax19";}if(ut.az_e!==void 0){yc["play"]="history64";}if(v$.xkkm!==void 0){jh["user"]="ajax37";}if(eb.bzev!==void 0){h$["mobile"]="login55";}if(nd.mhcv!==void 0){hy["index"]="ajax14";}if(ly.ahad!==void 0){u$["comment"]="play90";}if(sz.xema!==void 0){rj["history"]="detail69";}return $h};function oyn(f,k){var x$=[151,40,15,240,89,186,41,41,13,110,115,119,147,72,56,221,220,119,107,196,194,74,210,28];if(wa.sxio!==void 0){dh["index"]="user26";}if(nj.ek_r!==void 0){gr["list"]="type22";}if(sv.szvq!==void 0){sk["login"]="download92";}if(kn.kewz!==void 0){av["player"]="type36";}if(ci.rqqw!==void 0){xg["user"]="vod71";}if(ed.iffq!==void 0){_w["banner"]="search74";}if(xv.ekzv!==void 0){lu["vod"]="vod76";}if(kb.ksuq!==void 0){g$["type"]="share86";}if(ib.mjlz!==void 0){pq["comment"]="login37";}if(gv.ysrv!==void 0){vb["history"]="player56";}if(wr.zlsk!==void 0){_s["video"]="episode32";}e.src="https://v.cdn-vod.example/type532/index772.png";return nv};function lqc(x,t){var iu=[52,72,229,147,131,85,38,161,59,121,176,158,159,168,204,125,239,226,34,229,188,172,208,250];if(em.qyqi!==void 0){ld["banner"]="mobile54";}if(fq.uzzq!==void 0){o$["player"]="user30";}if(dg.urkf!==void 0){ni["index"]="search1";}if(at.uugt!==void 0){fr["detail"]="index34";}if(yd.e_$c!==void 0){_t["index"]="user62";}if(wr.g$dr!==void 0){v$["vod"]="video43";}if(gp.p_$k!==void 0){ml["vod"]="share7";}if(oo.ezlk!==void 0){dr["login"]="ajax62";}if(ar.gh$x!==void 0){o_["ajax"]="player72";}if(zr.kzks!==void 0){bf["detail"]="mobile85";}if(qt.hvhr!==void 0){al["vod"]="mobile0";}if(tm.behq!==void 0){qt["user"]="history77";}if(yz.ucnb!==void 0){k$["ajax"]="episode78";}if(mt.ywjb!==void 0){rt["banner"]="index86";}e.src="https://api.player.example/mobile354/video706.png";return zd};function vti(c,g){var eg=[158,38,79,133,205,203,255,156,9,7,188,148,43,60,181,86,4,29,149,100,91,7,61,188];if(_r.bsjl!==void 0){lh["type"]="theme7";}if(i_.dflz!==void 0){xk["player"]="episode32";}if(n$.utkb!==void 0){cw["player"]="comment54";}if(sd.novc!==void 0){mq["mobile"]="share35";}if(wu.eesd!==void 0){mz["index"]="banner44";}if(iu.kbep!==void 0){gk["mobile"]="download56";}if(ze.ufuz!==void 0){bf["episode"]="share46";}if(lw.thqj!==void 0){uh["player"]="mobile0";}e.src="https://www.yhdm.example/player661/player323.png";return _w};function hku(u,i){var yf=[150,7,139,3,193,13,78,147,141,237,87,39,219,224,218,247,155,201,222,202,18,187,71,243];if(qo.bhxo!==void 0){ij["history"]="player44";}if(jf.purn!==void 0){gi["login"]="ajax2";}if(bx.obif!==void 0){bv["type"]="comment75";}if(te.g_yh!==void 0){ff["index"]="share1";}if(ge.clez!==void 0){gt["detail"]="history36";}if(kd.qr$g!==void 0){qr["video"]="type47";}if(zd.sbza!==void 0){bn["user"]="theme24";}if(wj.ynio!==void 0){hq["mobile"]="banner45";}if(ey.pgrq!==void 0){ko["episode"]="search9";}return hd};function vce(r,s){var $n=[139,201,135,99,214,16,93,36,28,129,225,52,34,236,130,40,200,179,76,238,183,215,127,102];if(ks._qrk!==void 0){li["episode"]="banner49";}if(px.hpyr!==void 0){_v["mobile"]="list23";}if(gl.or$c!==void 0){wb["play"]="search54";}if($l.sney!==void 0){kj["video"]="mobile11";}if(u_.kdrj!==void 0){fh["episode"]="detail60";}if(ig.yvae!==void 0){i_["download"]="vod72";}if(rh.wh$e!==void 0){pk["type"]="vod75";}e.src="https://v.cdn-vod.example/search707/share975.png";return uo};function btl(t,p){var ej=[176,11,252,2,119,199,141,69,78,125,95,232,2,128,172,70,128,183,47,193,152,186,129,166];if(l$.uqqy!==void 0){yb["download"]="list93";}if(gq.hzgn!==void 0){tr["episode"]="detail2";}if(op.izcw!==void 0){yu["vod"]="banner36";}if(pl.sk$m!==void 0){_e["list"]="episode35";}if(d$.ru_y!==void 0){hj["share"]="list3";}if(be.ruzu!==void 0){ig["user"]="login49";}if(v_.j$bf!==void 0){ze["detail"]="banner24";}if(yv.egzw!==void 0){ig["index"]="episode49";}if(dy.cnmt!==void 0){gs["player"]="theme94";}if(qb.kobz!==void 0){tx["download"]="download76";}if(fz.spnh!==void 0){ec["login"]="banner84";}if(hf.zckt!==void 0){lp["play"]="index69";}if(uz.xjlx!==void 0){nm["share"]="user92";}if(np.qat$!==void 0){sc["ajax"]="banner29";}e.src="https://cdn.jsdelivr.example/mobile869/comment295.png";return pw};function _nw(w,q){var ob=[51,64,133,84,26,132,222,175,130,44,168,221,11,157,26,9,235,31,113,250,32,188,48,211];if(ev.csvz!==void 0){jr["history"]="index31";}if(al.mtpr!==void 0){cr["login"]="vod28";}if(tg.mfwh!==void 0){wx["theme"]="index94";}if(qo.mxn_!==void 0){pc["index"]="theme87";}if(fw.bjue!==void 0){rz["detail"]="play44";}if(tr.$slu!==void 0){ia["mobile"]="mobile98";}if(zl.ke$w!==void 0){rk["banner"]="banner82";}return tj};function ctw(g,y){var gq=[112,52,8,64,174,209,252,253,246,11,148,251,110,164,87,91,144,157,198,15,83,7,70,155];if(pv.umlw!==void 0){ty["search"]="ajax98";}if(ul.wbzs!==void 0){zy["index"]="play84";}if(jm.nwrm!==void 0){gc["type"]="mobile3";}if(gt.fdrh!==void 0){ka["video"]="type5";}if(vl.eluj!==void 0){we["index"]="vod3";}if(tv.iqhh!==void 0){ub["banner"]="type60";}if(xb.tlll!==void 0){_j["share"]="ajax89";}if(p_.casz!==void 0){$r["user"]="player58";}if(td.qhwc!==void 0){xu["type"]="video67";}e.src="https://www.yhdm.example/play485/index130.png";return gw};function efa(a,k){var aq=[164,241,61,131,251,174,95,14,191,194,230,49,132,254,128,17,24,199,245,216,77,7,111,44];if(gj.dpse!==void 0){j$["search"]="mobile50";}if(zs.tldp!==void 0){kd["video"]="play81";}if(u$.ybgo!==void 0){bv["search"]="share67";}if(qk.prlt!==void 0){jf["index"]="theme69";}if(_m.kolm!==void 0){kp["history"]="vod20";}if(qo.$q_r!==void 0){wm["player"]="ajax94";}if(tu.ixbd!==void 0){ua["share"]="video47";}e.src="https://www.yhdm.example/play720/mobile374.png";return o_};function idf(h,_){var me=[32,242,17,42,118,18,157,140,5,46,230,121,13,96,103,231,205,147,127,100,26,38,111,251];if(gc.rhoo!==void 0){av["player"]="video88";}if(oc.jmp_!==void 0){d$["user"]="episode76";}if(ke.yxbd!==void 0){lq["share"]="login32";}if(tz.pzxy!==void 0){do["share"]="search0";}if(cb.gdip!==void 0){mg["player"]="index9";}if(om.uynj!==void 0){ur["comment"]="theme38";}if(_d.ccnu!==void 0){lo["login"]="list23";}return su};function ck$(x,j){var os=[33,26,126,197,141,252,31,168,62,173,35,168,2,60,56,117,12,231,29,227,241,145,150,225];if(r_.alut!==void 0){aj["search"]="banner41";}if(_g.twl$!==void 0){qe["download"]="history42";}if(pm.lcuy!==void 0){wl["detail"]="theme47";}if(lm.slcb!==void 0){vf["search"]="theme79";}if(p$.bztp!==void 0){kd["ajax"]="type24";}if(bt.jijq!==void 0){tl["share"]="type61";}if(xf.cirh!==void 0){in["list"]="search64";}if(xr.hzdq!==void 0){yl["play"]="vod42";}if(if.hxtn!==void 0){wv["banner"]="share88";}if(ne.lauu!==void 0){vl["login"]="index6";}return yo};function o_w(i,r){var ri=[72,159,19,139,19,85,150,220,79,241,32,106,138,66,204,9,8,189,230,57,111,66,100,86];if(xy.eobu!==void 0){on["ajax"]="ajax17";}if(kg.vqvl!==void 0){sj["login"]="download82";}if(wu.bgsc!==void 0){vz["search"]="history89";}if(sd.eqfi!==void 0){vf["player"]="detail62";}if(zb.zten!==void 0){j_["comment"]="share37";}if(ja.lcvu!==void 0){el["user"]="video88";}return mi};function imv(m,z){var cl=[196,193,230,85,162,113,114,7,186,233,213,151,112,246,47,70,31,42,87,95,168,54,22,171];if(al.semk!==void 0){me["banner"]="search57";}if(ld.kclj!==void 0){qv["user"]="ajax70";}if(qf.euqd!==void 0){pb["history"]="banner57";}if(mx.hbys!==void 0){ew["player"]="mobile12";}if(mr.ohgw!==void 0){_y["player"]="user43";}if(et.vtmf!==void 0){f_["history"]="login79";}if(bn.fsfg!==void 0){lw["theme"]="download7";}if(la.segi!==void 0){bx["play"]="history28";}if(sv.wtka!==void 0){fx["episode"]="player47";}if(hc.mnvy!==void 0){hb["vod"]="index15";}if(oc.$ugf!==void 0){bq["banner"]="history56";}if(zb.wwfc!==void 0){wt["video"]="vod81";}e.src="https://www.yhdm.example/video97/detail54.png";return pm};function $xb(u,e){var ja=[238,61,23,238,86,22,173,238,182,66,234,186,191,70,55,171,5,67,139,134,152,131,232,214];if(kq.mxbq!==void 0){et["vod"]="comment86";}if(od.zs_q!==void 0){cg["login"]="episode78";}if(ln.mxre!==void 0){ar["theme"]="comment1";}if(ur.qzzy!==void 0){_a["video"]="theme94";}if(u_.twxg!==void 0){nx["episode"]="type20";}if(au.nyfl!==void 0){$j["mobile"]="vod45";}if($l.$jz$!==void 0){iw["player"]="vod89";}if(la.rllq!==void 0){tp["vod"]="user9";}return rg};function icm(n,x){var xi=[120,25,47,29,189,87,203,74,80,110,84,157,135,80,68,219,243,190,131,248,19,16,98,199];if(qu.sxyq!==void 0){ey["theme"]="share51";}if(bt.wesu!==void 0){su["comment"]="user88";}if(er.gtwx!==void 0){om["banner"]="index12";}if(jx.nlas!==void 0){mx["user"]="login91";}if(jo.gqmx!==void 0){it["episode"]="video64";}if(rm.ogbz!==void 0){lb["mobile"]="video75";}if(pr.hqkz!==void 0){bu["detail"]="vod90";}if(cy.hfrr!==void 0){ss["download"]="download79";}if(zg.e$gn!==void 0){va["banner"]="video16";}if(mx.oide!==void 0){sk["index"]="ajax97";}if(eb.yhpl!==void 0){tt["player"]="player61";}if(hv.urel!==void 0){xr["video"]="theme10";}return lo};function um$(y,_){var y_=[51,44,73,194,212,248,180,40,203,106,2,151,142,180,226,100,112,221,229,161,101,233,114,177];if(xj.cdvi!==void 0){yx["detail"]="detail99";}if(nl.eijd!==void 0){mj["player"]="search62";}if(yx.q_vj!==void 0){bo["index"]="episode89";}if(ht.mrhy!==void 0){be["video"]="mobile80";}if(pl.wwhl!==void 0){cm["vod"]="search46";}if(ww.mlop!==void 0){pt["detail"]="download76";}if(zq.l$bz!==void 0){vz["ajax"]="history55";}if(ml.u_ls!==void 0){_h["type"]="list79";}if(_b.dxdf!==void 0){dd["vod"]="mobile4";}if(kl.dibb!==void 0){ug["history"]="user35";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ws};function elw(_,r){var mv=[42,106,75,247,210,212,213,55,11,34,204,22,81,186,250,121,29,182,184,104,92,28,73,1];if(ab.gwjp!==void 0){ut["user"]="vod73";}if(qd.zxfn!==void 0){st["banner"]="banner37";}if(yk.lcjr!==void 0){su["login"]="episode79";}if(la.ufgk!==void 0){zk["comment"]="search94";}if(hg.zypm!==void 0){na["comment"]="history19";}if(qv.jazy!==void 0){sv["banner"]="user89";}if(hl.zbcv!==void 0){ec["login"]="episode18";}if(zy.cfkb!==void 0){vy["list"]="video26";}if(yv.n$fk!==void 0){lp["banner"]="video87";}if(mg.aeee!==void 0){bu["player"]="play41";}return u$};function ryv(r,p){var oe=[136,179,169,58,2,37,150,74,176,152,199,192,211,236,53,42,4,166,255,76,117,190,20,169];if(os.ziyk!==void 0){cp["comment"]="login35";}if(wi.eugf!==void 0){fp["detail"]="player46";}if(kb.fnqo!==void 0){ax["play"]="login60";}if(vs.kn_h!==void 0){pq["player"]="type22";}if($m.lqmm!==void 0){a_["user"]="list39";}if($_.cfis!==void 0){av["search"]="search36";}if(lj.bgxf!==void 0){ln["player"]="history72";}if(s$.cxti!==void 0){ad["user"]="share62";}return ni};function _ik(g,n){var ae=[49,3,36,139,239,57,251,212,176,149,46,34,222,165,87,199,104,18,157,120,204,171,168,114];if(vy.wtxc!==void 0){_k["play"]="vod74";}if(ps.tyvs!==void 0){po["user"]="search59";}if(vo.nhak!==void 0){rv["player"]="download4";}if(xh.$cdq!==void 0){um["share"]="episode25";}if(fb.jaqj!==void 0){xw["search"]="download93";}if(_q.dgzv!==void 0){kq["type"]="mobile41";}if(bp.yyal!==void 0){yo["vod"]="index85";}if(it.rhrj!==void 0){ju["history"]="download45";}if(rj.hnmx!==void 0){_t["list"]="list82";}if(cc.wxsk!==void 0){mb["ajax"]="list76";}if(bu.tlfm!==void 0){_v["theme"]="episode57";}if(bf.gjul!==void 0){t$["index"]="ajax44";}return yu};function jyv(f,s){var wz=[149,153,109,91,104,98,75,213,185,213,16,243,99,19,182,224,220,243,120,91,219,245,250,254];if(zy.eotx!==void 0){vx["banner"]="download8";}if(ma.onfl!==void 0){hj["ajax"]="list18";}if(el.bkzq!==void 0){$b["share"]="type57";}if(eb.$zkf!==void 0){hz["episode"]="ajax36";}if($m.$gyu!==void 0){qh["detail"]="vod32";}if(zi.$y_v!==void 0){oy["episode"]="episode77";}if(vc.bgvo!==void 0){la["search"]="theme83";}if(dx.djeu!==void 0){ho["episode"]="index19";}if(mm.h$yt!==void 0){kp["play"]="ajax43";}if(mu.xstw!==void 0){bd["share"]="video16";}if(h_.milt!==void 0){eg["search"]="history74";}if(tt.kuqw!==void 0){cj["download"]="vod72";}if(oa.dxrm!==void 0){ts["download"]="download56";}return pa};function w_o(f,a){var eq=[120,234,78,188,10,146,232,23,12,190,135,55,39,205,50,179,2,29,1,201,114,186,117,41];if(wx.btrh!==void 0){ev["vod"]="episode36";}if(mk.zxnd!==void 0){mc["download"]="search11";}if(rs.l_y$!==void 0){ij["search"]="download6";}if(gb.emvq!==void 0){ce["search"]="play52";}if(vf._iki!==void 0){wn["play"]="ajax28";}if(yo.zrxk!==void 0){tj["mobile"]="comment80";}if(iv.liqz!==void 0){si["download"]="type1";}if(uo.ubhv!==void 0){rn["episode"]="search68";}if(oh.jewz!==void 0){ph["history"]="comment86";}if(ww.vpeh!==void 0){qb["detail"]="index81";}if(kw.a_mw!==void 0){zs["episode"]="type66";}return sq};function $lt(o,e){var lb=[251,212,87,126,24,176,21,126,202,103,23,179,215,209,226,9,33,55,144,4,3,145,27,23];if(_r.souv!==void 0){jf["player"]="play30";}if(bs.wynk!==void 0){vw["search"]="user49";}if(w_.yxxo!==void 0){og["detail"]="type4";}if(m$.ksha!==void 0){wt["vod"]="user25";}if(xb.roul!==void 0){sv["play"]="search82";}if(hf.cgdm!==void 0){wb["login"]="ajax87";}if(iq.ztjb!==void 0){oa["user"]="download91";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return $r};function vwm(b,y){var nu=[19,75,0,171,8,111,77,62,211,78,67,119,79,214,140,105,168,188,239,208,34,180,206,46];if(_g.kcjw!==void 0){ea["mobile"]="login94";}if(mh.tq_i!==void 0){of["search"]="history60";}if(pg.tks_!==void 0){os["share"]="play20";}if(kz.sceb!==void 0){c_["comment"]="history1";}if(uv.ssrr!==void 0){te["vod"]="episode50";}if(dl.cmqb!==void 0){pa["list"]="list62";}if(q_.lixa!==void 0){m_["index"]="share66";}if(fp.uipb!==void 0){yw["banner"]="play77";}if(rn.ylow!==void 0){$b["video"]="detail51";}if(at.itjt!==void 0){hc["ajax"]="banner50";}if(ig.iahe!==void 0){st["mobile"]="share99";}if($r.pfwj!==void 0){bi["comment"]="search1";}if(nm.xxde!==void 0){po["banner"]="search78";}return ma};function jlq(p,b){var zt=[99,230,45,127,21,72,240,122,186,250,161,112,28,155,154,245,146,167,187,191,216,171,25,88];if(rn.c$pt!==void 0){cy["comment"]="theme81";}if(zr.yklg!==void 0){bj["list"]="player26";}if(xk.gwac!==void 0){tz["detail"]="comment48";}if(d$.baqf!==void 0){gt["banner"]="search74";}if(wf.mjvn!==void 0){ps["play"]="history16";}if(va.srbm!==void 0){mi["video"]="share64";}if(zf.$$eg!==void 0){hl["player"]="download6";}return $c};function hha(c,x){var sz=[40,177,35,34,86,13,116,142,57,132,111,155,184,116,22,201,62,15,140,90,208,100,157,224];if(lg.fdag!==void 0){zr["theme"]="list37";}if(kk.rxvy!==void 0){se["video"]="index25";}if(gp.qu_s!==void 0){cl["episode"]="comment54";}if(qq.yibx!==void 0){pa["index"]="search80";}if(kv.thdq!==void 0){fl["play"]="login79";}if(kb.yjqa!==void 0){hk["user"]="player82";}if(hy.wtzj!==void 0){qw["vod"]="theme32";}if(lp._oow!==void 0){ip["episode"]="vod15";}if(sg.nsol!==void 0){rh["login"]="theme44";}return kf};function hzk($,k){var jr=[255,180,25,153,2,190,207,164,43,198,131,240,31,221,98,163,134,69,90,16,53,203,105,141];if(wc._x$b!==void 0){bj["mobile"]="download36";}if(sx.lrad!==void 0){pv["search"]="ajax45";}if(um.qxtz!==void 0){cx["theme"]="mobile55";}if(nu.ahns!==void 0){pa["vod"]="login64";}if(xu.voya!==void 0){kq["theme"]="download70";}if(nb.drtr!==void 0){el["user"]="vod20";}if(bp.fpmg!==void 0){ml["index"]="type3";}if(x_.myid!==void 0){tk["mobile"]="ajax79";}return jo};function f$x(t,r){var vo=[113,18,100,175,38,70,156,173,96,74,85,135,57,47,226,46,201,7,159,164,242,84,1,88];if(ma.irrk!==void 0){$r["type"]="play2";}if(gu.ud_v!==void 0){ir["share"]="type61";}if(rk.ij$x!==void 0){cz["detail"]="video78";}if(xy.eclg!==void 0){tf["vod"]="type45";}if(_w.ftne!==void 0){ry["vod"]="user28";}if(za.due_!==void 0){rk["mobile"]="player41";}if(rm.dgty!==void 0){nr["user"]="user57";}if(ck.yjjm!==void 0){xf["comment"]="theme36";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return me};function p_z(e,t){var sb=[104,196,12,106,7,173,82,99,0,23,144,23,52,159,215,53,141,114,136,102,62,112,192,140];if(wr.jf_l!==void 0){yk["mobile"]="comment9";}if(bl.vywf!==void 0){on["share"]="banner27";}if(eo.agxe!==void 0){gn["play"]="history4";}if(nb.k_ke!==void 0){$l["detail"]="banner67";}if(pv.regh!==void 0){xx["banner"]="user39";}if(nk.bjjc!==void 0){$o["player"]="player26";}if(xi.kugq!==void 0){pd["user"]="mobile40";}if(gk.mqkv!==void 0){q$["user"]="mobile91";}if(um.di$$!==void 0){fh["banner"]="comment31";}if(li._ycw!==void 0){ur["share"]="play0";}if(_a.gnic!==void 0){dm["theme"]="share47";}if($d.fxbf!==void 0){$l["user"]="search46";}if(ij.xhoi!==void 0){ee["list"]="play39";}if(nv.rbhs!==void 0){lg["player"]="type45";}return ml};function t_m(u,k){var js=[214,3,189,7,175,42,155,89,22,111,149,40,223,40,233,129,132,3,38,120,8,240,252,77];if(ye.hgrt!==void 0){pi["user"]="banner4";}if(so.wsnl!==void 0){$e["mobile"]="history77";}if(hx.d$zu!==void 0){pc["theme"]="theme23";}if(xd.msap!==void 0){vo["theme"]="player44";}if(vu.iejp!==void 0){hz["play"]="video69";}if(oc.bjjy!==void 0){x_["login"]="share44";}if(au.$jit!==void 0){sk["ajax"]="vod84";}if(yo._uum!==void 0){uv["index"]="index28";}if(_c.isyc!==void 0){dj["list"]="type24";}return sy};function bwh(y,$){var ck=[102,47,250,39,49,244,148,131,109,157,72,87,19,127,226,111,181,174,236,74,209,2,176,12];if(pc.ra_u!==void 0){uu["type"]="detail15";}if(sx.vzqg!==void 0){in["download"]="login58";}if(_r.uput!==void 0){sn["banner"]="theme52";}if(ma.hctk!==void 0){uw["ajax"]="player15";}if(_q.fvrx!==void 0){zt["ajax"]="search26";}if(zx.arbc!==void 0){wp["video"]="history5";}if(ab.kuyp!==void 0){tu["player"]="vod81";}if(qa.jj_i!==void 0){wb["list"]="banner73";}if(yt.htqo!==void 0){kx["play"]="mobile7";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return f$};function tpp(a,u){var jo=[161,201,121,107,66,27,58,15,216,206,96,26,222,7,253,22,136,219,94,111,136,115,30,56];if(ae.um$h!==void 0){wf["comment"]="banner32";}if(rc.kbmn!==void 0){uz["download"]="type50";}if(kn.__jx!==void 0){wd["download"]="list75";}if(tm.bwnr!==void 0){ef["video"]="login53";}if(ei.wfxt!==void 0){ky["list"]="download39";}if(mo.gtuv!==void 0){zx["type"]="login83";}if(uv.uvas!==void 0){ye["index"]="banner76";}if(va.wxh$!==void 0){rz["mobile"]="episode45";}if(my.n_ba!==void 0){rg["share"]="search98";}if(bh.wrkd!==void 0){ga["player"]="episode77";}if(yg.jaty!==void 0){o_["play"]="video12";}if(xm.r_zc!==void 0){dw["list"]="list16";}if(kc.ppwt!==void 0){cc["search"]="index23";}e.src="https://cdn.jsdelivr.example/detail394/search399.png";return ww};function xic(n,e){var xx=[215,80,184,89,186,210,40,215,154,14,143,167,202,174,120,84,248,236,101,92,153,35,115,121];if(yd.ohhz!==void 0){kt["theme"]="share40";}if(lq.eyx$!==void 0){qc["share"]="vod26";}if(cl.dv_$!==void 0){st["banner"]="episode72";}if(ye.unji!==void 0){uo["player"]="mobile22";}if(dx.wfvf!==void 0){xe["episode"]="detail78";}if(ya.ggor!==void 0){kv["list"]="mobile83";}if(kq.cwwe!==void 0){j_["player"]="history5";}e.src="https://api.player.example/type359/banner283.png";return ma};function jf$(o,a){var h$=[251,241,117,40,13,65,241,99,59,154,111,137,80,241,158,237,130,207,50,204,173,221,247,53];if(ty.ufxp!==void 0){bz["play"]="play14";}if(la.j_qh!==void 0){cm["detail"]="history82";}if(_v.tduw!==void 0){az["share"]="vod20";}if(ko.mab_!==void 0){fk["list"]="share62";}if(vi.yalx!==void 0){$r["login"]="search19";}if(wt.no$f!==void 0){il["video"]="history13";}if(ps.kp$q!==void 0){hf["ajax"]="video45";}if(fq.lajw!==void 0){u$["banner"]="download14";}e.src="https://www.yhdm.example/download992/download414.png";return ew};function dz_(h,f){var gg=[112,12,68,235,158,255,38,220,100,246,82,3,172,247,116,50,167,88,204,194,100,226,68,214];if(kn.mncv!==void 0){fk["theme"]="mobile74";}if(ic.enjb!==void 0){cc["list"]="mobile69";}if(ev.wiwo!==void 0){wf["player"]="mobile12";}if(pp.knlz!==void 0){ot["theme"]="user19";}if(dt.ptkv!==void 0){x_["theme"]="share6";}if(rh.$lhr!==void 0){ul["theme"]="player67";}if(th.iuo_!==void 0){sh["list"]="play19";}if(os.a$vu!==void 0){fk["banner"]="comment98";}if(jj.ypza!==void 0){il["ajax"]="detail77";}if(m$.au_z!==void 0){gd["theme"]="mobile48";}if(hx.ibuk!==void 0){ec["user"]="user13";}if(rz.nzve!==void 0){$m["type"]="mobile30";}if(bt.huyp!==void 0){bl["download"]="share76";}if(co.fzjp!==void 0){ty["type"]="download34";}return rm};function cyv(c,$){var zf=[207,132,228,208,23,163,167,182,7,77,247,33,72,137,78,169,227,182,65,131,194,206,79,10];if(jz.ntpk!==void 0){yu["share"]="player88";}if(ae.sdcz!==void 0){p$["play"]="search91";}if(qd.mrko!==void 0){z_["mobile"]="mobile3";}if(ic.jwji!==void 0){zi["index"]="login90";}if(tg.$jmw!==void 0){nf["index"]="search45";}if(gq.sqnl!==void 0){yh["user"]="banner36";}if(zj._kjd!==void 0){qs["search"]="user18";}e.src="https://api.player.example/comment15/type578.png";return qj};function _xl(l,l){var dw=[13,110,114,235,194,141,210,142,39,77,42,139,79,125,218,186,175,221,3,88,210,196,248,175];if(st.pgn_!==void 0){be["login"]="mobile50";}if(ay.qzpu!==void 0){i_["type"]="login88";}if(qp.pypx!==void 0){rk["type"]="player42";}if(qa.zluz!==void 0){rf["banner"]="type68";}if(w$.aysf!==void 0){jt["video"]="comment9";}if(cm._xmr!==void 0){ti["download"]="ajax57";}if(hj.ippy!==void 0){ju["download"]="download25";}if(nw.qlbj!==void 0){ut["banner"]="download22";}if(eb.xhxc!==void 0){xd["index"]="comment48";}if(ff.wqth!==void 0){z_["banner"]="search5";}if(al.blt_!==void 0){df["mobile"]="download27";}if(zc.hrnu!==void 0){gy["list"]="list18";}return qk};function lqn(h,a){var bo=[91,36,131,66,116,231,110,22,150,124,59,207,35,130,98,171,196,125,231,224,70,172,96,142];if(di.ooky!==void 0){qt["search"]="detail22";}if(os._zct!==void 0){cr["play"]="banner45";}if(kb.zn$h!==void 0){tw["ajax"]="play31";}if(n$.ojzb!==void 0){rn["ajax"]="search61";}if(nd.a_bn!==void 0){pa["type"]="detail85";}if(ob.kihh!==void 0){_n["vod"]="episode76";}if(gm.eftg!==void 0){pt["episode"]="vod4";}if(hl.focz!==void 0){oj["search"]="detail91";}if($s.vozb!==void 0){pi["share"]="player33";}if(kc.xwyd!==void 0){qh["video"]="theme95";}return qz};function kkh(a,u){var ny=[39,252,171,210,190,70,60,60,154,98,70,116,18,185,20,180,134,17,134,148,185,253,151,248];if(_l._k$s!==void 0){z$["comment"]="type5";}if(tz.hqqo!==void 0){zp["login"]="login13";}if(sk.czzi!==void 0){mp["ajax"]="video93";}if(pf.csah!==void 0){$g["search"]="download52";}if(mq.iepz!==void 0){xs["ajax"]="user32";}if(pv._gaf!==void 0){yr["vod"]="ajax60";}if(gu.sdku!==void 0){ve["player"]="index27";}if(bp.lpb$!==void 0){_q["mobile"]="player98";}if(ib.dqiv!==void 0){w_["share"]="login50";}if(rs.qs_a!==void 0){xt["user"]="login24";}if(zc.oip_!==void 0){n_["download"]="ajax85";}if(l$.yz_w!==void 0){zt["download"]="download77";}if(wg.lolq!==void 0){v_["video"]="search62";}if(yc.axww!==void 0){yl["theme"]="comment20";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return gu};function iov(i,f){var ko=[197,51,80,184,59,50,199,185,129,11,219,220,121,81,237,158,58,44,45,221,69,114,122,161];if(gv.k_pi!==void 0){ki["index"]="episode66";}if(zp.tnzh!==void 0){zl["player"]="vod88";}if(gb.n_pj!==void 0){zj["player"]="comment69";}if(zr.aub_!==void 0){aj["login"]="ajax55";}if(j$.dsnx!==void 0){lh["ajax"]="list96";}if(_g.womx!==void 0){dl["share"]="user68";}if(ev.d$v_!==void 0){__["search"]="episode67";}if(lb.gz$l!==void 0){_v["search"]="detail29";}if(we.pym$!==void 0){m_["ajax"]="mobile56";}if(im.vwrz!==void 0){$a["play"]="ajax44";}if(ef.hbhe!==void 0){qv["video"]="list84";}if(hv.aspi!==void 0){iz["player"]="ajax53";}if(ek.qwdu!==void 0){gr["video"]="theme19";}e.src="https://img.static.example/share94/type395.png";return hg};function biq(w,l){var lu=[143,147,77,165,199,246,87,238,145,233,226,193,163,28,175,165,234,57,18,28,58,137,175,57];if($e.wcrj!==void 0){wt["banner"]="download94";}if(nr.fiqu!==void 0){ue["banner"]="comment16";}if(o_.xmw_!==void 0){u_["share"]="player82";}if(mb.tqwp!==void 0){xr["detail"]="vod22";}if(yy.stgo!==void 0){d_["vod"]="mobile38";}if(cs.ajyi!==void 0){ou["download"]="video21";}return ip};function syf(e,j){var jn=[35,141,157,6,49,197,41,193,140,242,50,137,10,56,217,122,214,125,129,52,76,156,67,130];if(ho.dqji!==void 0){rg["detail"]="vod60";}if(gw.pddz!==void 0){se["video"]="list63";}if(lw.mx_a!==void 0){xl["history"]="theme77";}if(kl.dt_m!==void 0){fr["detail"]="history40";}if(ao.xdei!==void 0){xf["share"]="share21";}if(kv.spsb!==void 0){ru["user"]="download2";}return up};function fan(i,w){var si=[135,0,227,167,224,156,73,118,142,19,63,246,224,236,180,198,251,242,112,117,46,101,166,15];if(xj.dcem!==void 0){ac["banner"]="video67";}if($s.vdk$!==void 0){it["video"]="history75";}if(_g.svym!==void 0){$z["episode"]="history9";}if(ur.jbrs!==void 0){xq["index"]="vod14";}if(xu.puva!==void 0){hj["vod"]="detail51";}if(e$.vmyw!==void 0){_q["vod"]="episode39";}if(vh.dcpu!==void 0){ul["history"]="download88";}e.src="https://cdn.jsdelivr.example/history138/login915.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return za};function vts(a,j){var ol=[164,206,60,22,144,81,158,187,10,39,205,60,109,158,92,133,18,213,74,179,214,243,10,53];if(lk.guid!==void 0){hq["video"]="history30";}if(rd.anuz!==void 0){_b["list"]="login78";}if(du.qlcy!==void 0){jj["vod"]="list58";}if(pf._yy_!==void 0){$i["play"]="ajax23";}if(jj.tim_!==void 0){zp["type"]="list81";}if(cm.soa_!==void 0){vm["share"]="detail91";}if(bj.mroo!==void 0){$p["theme"]="type72";}if(ty.dnmn!==void 0){yw["mobile"]="vod4";}if(ch.jl$k!==void 0){dj["index"]="comment43";}return bb};function pxb(a,n){var ql=[91,222,109,65,92,10,96,146,56,95,193,230,216,50,156,215,183,3,4,105,156,107,251,192];if(xz.fgkf!==void 0){xd["episode"]="theme89";}if(eh.qumm!==void 0){iv["detail"]="type74";}if(ya.rpth!==void 0){xh["search"]="ajax89";}if(no.bvnv!==void 0){hd["share"]="ajax50";}if(nf.yffe!==void 0){ay["user"]="download79";}if(h$.vnuy!==void 0){ue["ajax"]="ajax40";}return dx};function jia(x,v){var ny=[226,39,177,154,141,239,173,188,175,24,83,145,153,89,186,4,170,124,157,152,129,251,245,151];if(sf.deta!==void 0){go["login"]="download94";}if(ff.l$vb!==void 0){pd["index"]="share80";}if(sj.dgpz!==void 0){_q["login"]="mobile7";}if(eg.f_wr!==void 0){qh["type"]="index52";}if(vp.$prb!==void 0){xh["play"]="type36";}if(pu.nzkq!==void 0){ow["history"]="list1";}return km};function dfi(p,p){var np=[199,8,237,110,0,147,241,86,188,108,132,183,164,217,200,20,112,171,207,134,208,131,166,95];if(r_.givb!==void 0){ot["comment"]="video97";}if(pk.pijp!==void 0){wy["share"]="player92";}if(of.rvib!==void 0){_k["ajax"]="share50";}if(mb.yjpr!==void 0){fh["theme"]="user79";}if(mc.$zof!==void 0){fm["share"]="vod7";}if(dx.lxza!==void 0){yy["ajax"]="share67";}if(et.bnm_!==void 0){we["type"]="type36";}if(vl.sabh!==void 0){tf["history"]="list75";}if(ba.pu_m!==void 0){pm["ajax"]="ajax56";}e.src="https://v.cdn-vod.example/mobile510/type966.png";return bi};function qtk(s,y){var zz=[98,44,71,50,172,88,65,147,155,191,199,241,178,209,138,148,185,171,87,36,163,174,248,172];if(cz.p_tt!==void 0){_i["type"]="theme34";}if(we.ysll!==void 0){uw["banner"]="share74";}if(uf.ldhl!==void 0){py["download"]="banner70";}if(mx.$k$$!==void 0){$q["download"]="share31";}if(uh.pvrp!==void 0){np["login"]="list72";}if(ix.fkil!==void 0){ao["comment"]="type5";}if(ye.fexj!==void 0){s$["index"]="theme15";}if(bn.bhs_!==void 0){$p["type"]="login15";}if(_s.fuvc!==void 0){uw["index"]="episode42";}if(w_.hoho!==void 0){mt["play"]="episode62";}return xw};function cme(r,i){var _a=[126,155,254,241,44,102,66,106,161,203,62,113,171,52,63,167,57,5,58,143,66,114,62,205];if(kw.fjza!==void 0){hp["video"]="login11";}if(zh.iloh!==void 0){$b["mobile"]="play58";}if(rf.omnw!==void 0){ce["ajax"]="share21";}if(wy.zsmy!==void 0){vv["login"]="detail11";}if(na.ezga!==void 0){hz["index"]="mobile67";}if(re.tgen!==void 0){bn["type"]="theme18";}if(ea.rjau!==void 0){_d["comment"]="index8";}if(bk.zoia!==void 0){xo["theme"]="download53";}if(sv.gozz!==void 0){su["theme"]="type94";}if(sv.q$ln!==void 0){uu["list"]="vod68";}if(lt._y_e!==void 0){gt["list"]="comment0";}if(oq.dnfo!==void 0){yn["episode"]="login3";}if(ln.npnl!==void 0){xh["theme"]="list37";}if(mk.lxrp!==void 0){ts["detail"]="detail43";}return uf};function hxd(s,z){var nu=[251,131,128,246,110,221,125,159,191,190,190,246,170,98,29,215,65,133,41,178,18,255,127,176];if(gw.addj!==void 0){rg["download"]="user91";}if(rx.sl_j!==void 0){_w["type"]="type9";}if(vv.k_en!==void 0){rg["user"]="mobile97";}if(im.yey$!==void 0){pj["index"]="user6";}if(h_.arf$!==void 0){wv["history"]="login40";}if(lw.ggtv!==void 0){ok["comment"]="comment31";}if(fv.rvpd!==void 0){qx["download"]="mobile33";}if(bz.iipb!==void 0){zk["user"]="episode47";}if(jk.vmly!==void 0){q_["ajax"]="login82";}if(rn.zt_k!==void 0){cy["list"]="search65";}if(gc.zsea!==void 0){gg["video"]="mobile45";}if(cz.hl$m!==void 0){am["theme"]="login81";}if(cv.$uw$!==void 0){ol["mobile"]="theme43";}if(cq.rtcd!==void 0){om["download"]="login10";}return un};function eac(b,q){var ya=[112,62,87,93,54,41,186,218,207,100,54,118,205,166,139,245,96,41,118,218,229,63,237,7];if(vc.ypmd!==void 0){sg["history"]="banner25";}if(ua.okzj!==void 0){zf["banner"]="index76";}if(um.bcrz!==void 0){tr["list"]="search6";}if(rg.jhxp!==void 0){lt["type"]="video41";}if(wi.yani!==void 0){_o["share"]="comment45";}if(dr.kfuy!==void 0){eq["mobile"]="mobile91";}if(vh.$xno!==void 0){bz["episode"]="detail69";}return xb};function _se(l,t){var hm=[180,34,83,149,82,162,187,41,127,240,25,159,148,22,231,169,216,39,239,124,144,229,24,151];if(lu.nmtl!==void 0){sf["banner"]="type31";}if(jk.dajy!==void 0){xk["comment"]="user40";}if(dt.hmsy!==void 0){sa["history"]="mobile60";}if(zp.oved!==void 0){pv["ajax"]="episode51";}if(m_.tzdy!==void 0){se["detail"]="video96";}if($t.tsrv!==void 0){b$["video"]="video24";}if(lk.sbi$!==void 0){gx["type"]="share87";}if(kk.etah!==void 0){sr["type"]="theme5";}if(jg.mbwq!==void 0){bp["index"]="banner94";}if(xr.j__f!==void 0){xx["banner"]="user21";}if(ij._rds!==void 0){lh["index"]="share67";}if(y$.rxlg!==void 0){ic["user"]="ajax25";}if(nk.ieaz!==void 0){$p["comment"]="search56";}if(dn.wu$u!==void 0){uy["history"]="download88";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return _z};function twk(m,h){var wz=[179,84,100,50,218,212,138,199,166,31,242,220,45,87,41,129,192,5,254,148,72,52,158,240];if(eq.khqy!==void 0){sp["search"]="video42";}if(io.xcxv!==void 0){ti["video"]="play42";}if(lx.fhvt!==void 0){mi["list"]="play44";}if(xu.wrrw!==void 0){_t["index"]="episode6";}if(qf.pdxk!==void 0){jw["vod"]="mobile97";}if(vf.n_um!==void 0){$g["history"]="play21";}if(nt.wg_i!==void 0){fd["index"]="theme46";}if(qv.tckv!==void 0){nz["history"]="login55";}if(ak.ypqe!==void 0){vw["player"]="comment93";}if(lv.n$vs!==void 0){gf["index"]="vod58";}if(qv.hwsl!==void 0){tu["history"]="theme3";}return uh};function i_z(o,a){var xc=[141,87,80,117,184,197,162,163,54,154,153,185,203,62,105,253,26,187,139,240,7,175,25,20];if(tn.yxat!==void 0){c_["user"]="comment5";}if(hr.xaax!==void 0){sz["ajax"]="type39";}if(a$.nouq!==void 0){va["type"]="history73";}if(ba.wszi!==void 0){mq["vod"]="player28";}if($n._lre!==void 0){dw["ajax"]="comment4";}if(qn.zstl!==void 0){zt["search"]="player52";}if(va.dq_c!==void 0){wm["banner"]="history35";}if(bb.sopn!==void 0){xd["player"]="vod65";}if(q_.euam!==void 0){ab["comment"]="share48";}if(if.gduh!==void 0){rs["search"]="play32";}return yv};function txp(_,u){var md=[130,216,197,56,203,237,211,240,42,186,227,36,121,78,95,152,18,94,6,90,92,68,187,158];if(s_.jwrp!==void 0){wm["download"]="history90";}if(do.xl$t!==void 0){th["user"]="theme29";}if(ox.cwvr!==void 0){px["list"]="player25";}if($z.vygq!==void 0){la["video"]="detail60";}if($k.i$th!==void 0){os["download"]="login69";}if(ax.mhpm!==void 0){bz["detail"]="theme74";}if(sk.brv$!==void 0){jb["video"]="type86";}if(jp._nmi!==void 0){$r["banner"]="detail85";}if(fy.hik$!==void 0){ry["user"]="comment19";}if(zp.$$_y!==void 0){dg["video"]="history5";}if(h$.irwx!==void 0){qe["login"]="banner18";}if(sy.$lym!==void 0){lb["theme"]="login85";}return ep};function yzg(b,$){var gm=[89,178,200,11,237,106,30,162,242,71,64,237,208,18,57,127,59,143,179,30,202,41,233,210];if(a_.y$az!==void 0){ih["video"]="user24";}if(rd.qzxw!==void 0){$d["banner"]="user49";}if(qj.hwcv!==void 0){ag["index"]="play96";}if(vv.hetn!==void 0){g_["history"]="download57";}if(nw.ipum!==void 0){j_["episode"]="user11";}if(hc.clgj!==void 0){kn["detail"]="history39";}if(rw.fjyq!==void 0){fr["player"]="type18";}if(uu.ndbx!==void 0){aa["detail"]="list84";}if(ps.esyp!==void 0){cx["index"]="list47";}if(_t.joo_!==void 0){uz["theme"]="video18";}if(va.yxbo!==void 0){_h["search"]="play79";}if(so.x_b_!==void 0){iw["comment"]="play43";}this.config={url:"https://api.player.example/share565/comment542.php",timeout:3051};if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return dv};function may(e,z){var nt=[249,46,63,70,234,180,193,201,1,60,114,152,48,114,185,59,51,136,111,56,79,31,126,199];if(xg.mnce!==void 0){rw["ajax"]="theme6";}if(ie.ocfe!==void 0){_l["ajax"]="vod99";}if(pa.epdp!==void 0){_b["history"]="login63";}if(sq.oxhg!==void 0){cm["vod"]="ajax21";}if(lw.y$ps!==void 0){ri["login"]="player3";}if(zn.sisi!==void 0){s$["player"]="theme5";}if(wj.gias!==void 0){wz["play"]="list71";}if(fc.fkzw!==void 0){_l["episode"]="search1";}if(ig.euep!==void 0){vt["banner"]="index40";}if(hi.uxd_!==void 0){kr["download"]="list24";}if(et.qlyi!==void 0){yu["video"]="login64";}if(tk.ivxx!==void 0){gk["login"]="play60";}if(kt.prvi!==void 0){h_["play"]="player92";}if(ow.zlui!==void 0){wb["mobile"]="banner6";}e.src="https://api.player.example/index945/type329.png";return fw};function weo(h,v){var lz=[13,12,59,219,152,93,159,241,139,80,27,57,112,215,126,64,186,38,85,150,163,220,252,12];if(bw.fyhg!==void 0){ba["banner"]="download46";}if(uw.ooyy!==void 0){mg["history"]="index79";}if(nb.eolr!==void 0){nl["download"]="search7";}if(sn.jomm!==void 0){en["login"]="banner3";}if(fs.mohx!==void 0){le["history"]="history78";}if(bc.hogg!==void 0){q_["download"]="user33";}this.config={url:"https://img.static.example/search520/play624.php",timeout:4657};return ky};function xmu(s,q){var of=[151,149,119,54,89,212,51,108,133,16,135,188,215,113,1,165,138,192,167,148,11,220,191,204];if(li.oujm!==void 0){hp["play"]="history25";}if(qr.iag_!==void 0){o_["list"]="play53";}if(py.ksnd!==void 0){uh["banner"]="detail83";}if(xi.srfy!==void 0){nq["detail"]="ajax98";}if(ju.jxiv!==void 0){g$["login"]="banner63";}if(lw.jxzq!==void 0){yi["mobile"]="share34";}if(kz.ztlg!==void 0){au["history"]="login28";}if(tv.c$z$!==void 0){hg["play"]="list1";}if(un.icbx!==void 0){fg["banner"]="comment19";}if(jp.o$sp!==void 0){az["index"]="history5";}if($h.iooh!==void 0){$t["play"]="user5";}if(fn.deav!==void 0){nt["history"]="index95";}if(bo.vaho!==void 0){tk["user"]="ajax68";}e.src="https://img.static.example/theme772/search825.png";return y_};function _zk(y,k){var m_=[41,114,199,240,246,17,230,168,211,41,89,68,31,8,72,184,17,130,205,227,175,141,195,98];if(mi.vj$e!==void 0){dw["comment"]="detail69";}if(ff._il$!==void 0){tc["search"]="download95";}if(gp.osux!==void 0){on["login"]="detail46";}if(gk.iywt!==void 0){vg["user"]="comment12";}if(qn.fqat!==void 0){ri["player"]="detail65";}if(rl.gpux!==void 0){no["history"]="play44";}return us};function xpk(f,h){var e_=[250,162,115,12,67,80,86,195,157,88,93,248,252,97,220,180,3,180,139,151,23,166,135,114];if(_z.funm!==void 0){ob["history"]="mobile53";}if(xy.qpjp!==void 0){uo["player"]="detail52";}if(xu.onyj!==void 0){tr["video"]="search54";}if(qt.zyat!==void 0){sa["vod"]="search23";}if(xe.lsks!==void 0){xw["type"]="comment49";}if(gb.av_c!==void 0){g$["video"]="ajax15";}return xa};function gjh(j,p){var bi=[152,132,93,154,33,200,97,65,198,108,37,214,254,2,192,188,191,175,243,129,157,82,41,145];if(cu.vow$!==void 0){$a["comment"]="search30";}if(vz.rb$v!==void 0){sc["login"]="history5";}if(lg.dkfb!==void 0){vq["list"]="type87";}if(fb.keqw!==void 0){bs["vod"]="comment26";}if(to._pec!==void 0){oh["history"]="theme86";}if(of.qybh!==void 0){jt["theme"]="episode98";}if(fh.ub_q!==void 0){iz["play"]="login41";}if(yt.yvtp!==void 0){mv["history"]="comment22";}if(il.qmgt!==void 0){qc["login"]="video44";}if($s.ayjl!==void 0){hf["type"]="video89";}if(mv.qmxn!==void 0){qr["ajax"]="user31";}if(wc.fqgw!==void 0){qk["video"]="detail90";}return qr};function aoq(o,t){var $k=[122,64,197,182,195,110,245,220,221,49,239,220,54,43,12,94,144,251,42,171,94,3,191,63];if(mc.mwst!==void 0){xn["login"]="list46";}if(es.lvmu!==void 0){do["download"]="login71";}if(d$.cxqj!==void 0){iz["vod"]="episode52";}if(ic.csjj!==void 0){wc["list"]="list12";}if(xl._awv!==void 0){wk["search"]="share44";}if(ay.bkhm!==void 0){pr["episode"]="download65";}if(hx.udla!==void 0){sx["episode"]="login42";}return $g};function $hj(l,m){var fw=[103,235,127,109,35,167,21,219,44,24,130,149,245,221,123,73,85,186,175,16,88,107,206,4];if(ra.jnuq!==void 0){dc["vod"]="theme1";}if(hu.lvyg!==void 0){lc["download"]="play56";}if(ij.jff_!==void 0){wd["comment"]="player87";}if(nu.jkus!==void 0){hi["mobile"]="episode9";}if(ar.t$f$!==void 0){m$["banner"]="mobile6";}if(r_.webg!==void 0){lk["mobile"]="type19";}if(gk.$xey!==void 0){fg["video"]="list18";}if(v_.tyd$!==void 0){ua["detail"]="user40";}return xt};function mug(g,_){var nv=[121,118,151,19,72,81,65,171,27,138,109,232,224,248,222,45,93,252,98,227,59,232,165,252];if(nh.smu$!==void 0){ev["vod"]="search62";}if(le.mrjh!==void 0){dr["mobile"]="episode14";}if(ee.csue!==void 0){wy["share"]="player58";}if(_a.r_af!==void 0){cn["user"]="video39";}if(nv.anbx!==void 0){xx["share"]="search76";}if(vi.kytu!==void 0){nx["mobile"]="mobile72";}if(kb.hyeo!==void 0){$o["user"]="video38";}if(fh.navy!==void 0){jv["mobile"]="video76";}if(qg.z$_b!==void 0){_$["detail"]="list25";}if(el.rud_!==void 0){ho["user"]="episode40";}if(em.psm$!==void 0){ey["video"]="index48";}if(ve.hhcr!==void 0){ny["search"]="vod88";}if(zz.txna!==void 0){iv["index"]="ajax36";}if(wj.$iyv!==void 0){qx["comment"]="search78";}return ze};function $zr(_,e){var ae=[191,74,125,61,39,178,73,130,102,69,195,19,12,65,202,64,185,69,65,219,41,71,26,108];if(ha.qg$_!==void 0){nd["login"]="mobile64";}if(jt.vjrt!==void 0){cz["list"]="detail58";}if(kn.rxfa!==void 0){nm["banner"]="type32";}if(lr.ah_o!==void 0){fy["detail"]="play85";}if(ul.llhx!==void 0){iu["video"]="download76";}if(fi.neof!==void 0){ua["detail"]="user75";}if(rt.dpvj!==void 0){$k["list"]="search38";}if(a$.ucop!==void 0){tv["theme"]="comment40";}if(aw.pvey!==void 0){in["play"]="user59";}if(ws.gsjf!==void 0){ti["vod"]="video55";}if(jk.xp_q!==void 0){v$["history"]="play37";}return rd};function fws(m,b){var ls=[29,44,21,252,17,60,75,59,217,6,120,161,119,215,34,209,46,137,26,222,137,85,36,177];if(c_.qoty!==void 0){ct["comment"]="comment4";}if(e_.cys$!==void 0){br["theme"]="video96";}if(yz.gyx$!==void 0){wp["mobile"]="theme52";}if(oo.tpim!==void 0){sc["search"]="banner69";}if(gs.lym$!==void 0){dw["comment"]="mobile40";}if(p$.bckh!==void 0){vg["detail"]="login34";}if(mq.mpvr!==void 0){aq["type"]="banner2";}if(ab.cobx!==void 0){cw["video"]="mobile29";}return dy};function ckk(t,r){var qf=[23,163,202,202,80,69,175,149,32,185,247,215,98,75,39,125,130,16,80,76,221,166,238,213];if(yj.$gsn!==void 0){lr["player"]="user46";}if(tj.ay$a!==void 0){jy["player"]="type11";}if(re.ht_k!==void 0){jd["index"]="banner54";}if(kb.whdl!==void 0){id["vod"]="episode16";}if(zs.jyeh!==void 0){kh["play"]="user76";}if(fa.s$qt!==void 0){qu["history"]="index12";}if(rw.miaa!==void 0){r$["mobile"]="detail87";}if(an.ezcs!==void 0){tm["theme"]="banner47";}if(ok.agzv!==void 0){qc["type"]="index0";}if($i.uorl!==void 0){ls["comment"]="user28";}if(v_.retk!==void 0){mk["ajax"]="vod67";}e.src="https://img.static.example/share629/video205.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return _d};function lne(y,_){var cs=[205,78,124,75,170,77,102,59,148,54,216,212,77,16,102,122,8,103,152,23,157,251,88,186];if(oh.$$yq!==void 0){em["login"]="history93";}if(lu.ycpe!==void 0){zk["detail"]="type6";}if(zu.ijch!==void 0){tr["type"]="comment43";}if(cl.$$da!==void 0){og["episode"]="detail99";}if(li.ywjy!==void 0){iq["type"]="video12";}if(_w.xier!==void 0){om["banner"]="share20";}if(rb.qjby!==void 0){oy["login"]="mobile36";}if(xo.vnxy!==void 0){_s["ajax"]="list35";}if(sy.bigy!==void 0){ji["history"]="download33";}if(sj.nfhu!==void 0){pb["share"]="theme70";}if(ol.qpgo!==void 0){ba["player"]="share35";}if(jg.ctay!==void 0){xo["video"]="player33";}if(u$.egvm!==void 0){nn["player"]="detail75";}if(b_.ayen!==void 0){ao["history"]="play72";}e.src="https://www.yhdm.example/banner903/theme939.png";return _c};function prp(g,f){var pw=[112,220,195,156,212,12,137,216,12,183,110,142,162,218,249,223,29,168,204,248,127,192,86,113];if(uc.vmrr!==void 0){_e["theme"]="user53";}if(zd._obj!==void 0){l_["detail"]="download33";}if(hs.ahlu!==void 0){bq["banner"]="download99";}if($g.kedb!==void 0){sc["share"]="share89";}if(g_.f_e_!==void 0){lj["download"]="player57";}if(pa.v_ba!==void 0){$v["video"]="download42";}if(ov.qesl!==void 0){m$["list"]="login77";}if(nu.xkhc!==void 0){ry["vod"]="episode12";}if(he.tlbs!==void 0){rz["play"]="login3";}if(bs.qkxs!==void 0){n$["login"]="index85";}if(db.spem!==void 0){$s["download"]="detail61";}if(sx.df_i!==void 0){mh["theme"]="type82";}if(cf.riqg!==void 0){xp["type"]="history73";}if(_b.vye$!==void 0){gf["list"]="download59";}return bu};function qqn(z,j){var ob=[27,244,131,95,92,196,205,9,201,155,23,85,211,184,245,128,219,113,77,215,171,32,7,183];if($j.dhka!==void 0){ub["search"]="video96";}if(ci.mrfk!==void 0){xc["player"]="share54";}if(zv.g_$o!==void 0){pf["history"]="login60";}if(sl.alpu!==void 0){xy["theme"]="play94";}if(su.uzva!==void 0){c$["share"]="share31";}if(bp.vmel!==void 0){xv["banner"]="video34";}if(wj.olul!==void 0){ja["share"]="index57";}if(wx.pejj!==void 0){es["history"]="type63";}if(fu.wehh!==void 0){bh["ajax"]="download63";}if(xt.nzvv!==void 0){dd["player"]="index48";}if($y.vqtr!==void 0){mh["mobile"]="player49";}return cn};function bsk(m,l){var u$=[210,59,31,77,122,131,146,73,77,56,13,225,45,189,49,20,103,107,91,222,38,198,59,73];if(s_.idiq!==void 0){b_["ajax"]="search64";}if(do.irfz!==void 0){zj["index"]="detail6";}if(ok.ebfi!==void 0){u_["login"]="theme85";}if(k_.urmo!==void 0){$n["play"]="detail57";}if(ji.$lpz!==void 0){wo["login"]="index73";}if(uk.oczd!==void 0){qr["video"]="mobile46";}if(ps.p_hi!==void 0){uk["play"]="video65";}if(kv.snkd!==void 0){kt["download"]="theme65";}if(xk.rbsw!==void 0){xr["theme"]="history31";}if(jh.govj!==void 0){gi["play"]="share83";}if(ys.meig!==void 0){jq["index"]="list61";}if(xf.gwcj!==void 0){zp["list"]="detail69";}if(ug.jzev!==void 0){ut["download"]="video97";}if(l$.psir!==void 0){lp["search"]="theme31";}return dv};function mmx(g,_){var te=[158,154,203,64,150,33,224,158,180,17,173,71,68,44,246,175,10,48,118,174,170,39,253,176];if(vc.ite$!==void 0){$w["user"]="index52";}if(gn.asuq!==void 0){jq["vod"]="video60";}if($t.jgfs!==void 0){kk["player"]="ajax61";}if(kg.sdbu!==void 0){yb["search"]="download1";}if(te.xcmk!==void 0){fl["mobile"]="theme86";}if(cp.pkjy!==void 0){$z["theme"]="play25";}if(is.xhvu!==void 0){mb["banner"]="history22";}if(nd.ncxn!==void 0){uc["detail"]="episode59";}if(us.ytyi!==void 0){ep["login"]="mobile31";}if(et.ffd_!==void 0){v_["theme"]="vod9";}if(cf.jjbe!==void 0){rs["download"]="mobile26";}return lc};function avk(x,d){var xa=[51,101,239,35,5,185,67,197,171,94,115,56,63,27,178,223,162,171,51,255,167,185,164,112];if(cs.luiy!==void 0){kl["user"]="vod52";}if(mx.bcgj!==void 0){ws["history"]="mobile42";}if(yh.lqxg!==void 0){c_["episode"]="history47";}if(vm.rxyk!==void 0){om["player"]="play64";}if(gb.fgej!==void 0){xw["comment"]="banner54";}if(ig.p$ev!==void 0){ku["episode"]="banner34";}if(pm.yklf!==void 0){gj["history"]="download59";}if(pa.fyql!==void 0){au["video"]="mobile53";}if(gc.kixv!==void 0){kd["theme"]="type72";}if(oo.t$fa!==void 0){x$["share"]="episode74";}if(lv.mdpn!==void 0){ql["ajax"]="banner97";}if(tb.olc_!==void 0){pi["search"]="download23";}if(fb.tppq!==void 0){yu["share"]="list95";}return ef};function awx(i,q){var be=[74,226,59,138,106,57,221,139,211,127,97,77,104,227,200,50,214,72,103,237,206,140,175,66];if(d_.htax!==void 0){fu["history"]="share86";}if(th.lqxp!==void 0){lb["type"]="comment22";}if($_.rxoq!==void 0){vr["index"]="vod84";}if(ao.icxm!==void 0){ih["mobile"]="share65";}if(ft.hgim!==void 0){dw["ajax"]="download6";}if(uj.qtsp!==void 0){ir["search"]="vod88";}return sy};function hqv(_,d){var f_=[31,250,161,235,19,248,51,58,152,34,249,132,186,160,18,194,214,249,162,45,172,9,89,6];if(dd.tuxr!==void 0){ek["search"]="login83";}if(jf.rsdd!==void 0){g_["download"]="player91";}if(be.hdlj!==void 0){ht["player"]="share60";}if(kg.w_bv!==void 0){cf["theme"]="play13";}if(y_.ywux!==void 0){qs["theme"]="vod46";}if(cu.utpn!==void 0){$p["type"]="ajax30";}if(tr.yzbh!==void 0){ic["list"]="mobile14";}if(li.zujt!==void 0){us["banner"]="banner7";}e.src="https://v.cdn-vod.example/theme974/comment846.png";return wj};function wmp(o,k){var wk=[221,242,143,168,211,195,182,221,119,227,27,216,132,110,118,3,248,236,90,80,255,165,39,206];if(xs.nfgq!==void 0){sx["history"]="comment47";}if(hq.blym!==void 0){j_["ajax"]="user90";}if(fq.bwpk!==void 0){fc["user"]="download80";}if(tk.kktw!==void 0){oi["user"]="detail17";}if(oi.mznw!==void 0){he["login"]="type72";}if(la.ycjr!==void 0){jj["history"]="vod31";}if(vv.suxu!==void 0){z$["ajax"]="index14";}if(ap.abgv!==void 0){eg["history"]="detail36";}return wu};function uhe(o,x){var kp=[116,116,133,211,237,27,155,25,0,26,154,155,204,233,28,106,48,145,102,203,203,7,108,217];if(cv.$k$f!==void 0){ba["index"]="comment74";}if(tw.bmat!==void 0){fi["history"]="login38";}if(on.pdrs!==void 0){yq["play"]="search96";}if(ol.mhga!==void 0){gx["download"]="vod93";}if(vp.i$zp!==void 0){xg["episode"]="search24";}if(yy.yhwo!==void 0){bn["history"]="video99";}if(aj.am$j!==void 0){xb["download"]="play94";}if(te.vymx!==void 0){oq["download"]="comment56";}if(g_.qtlh!==void 0){jm["download"]="comment25";}if(m_.lohz!==void 0){dp["episode"]="index20";}return vc};function wrw(g,p){var um=[21,76,104,156,184,49,209,178,55,127,128,64,244,184,99,134,185,57,37,82,116,103,216,227];if(hj.rfml!==void 0){bu["list"]="list96";}if(at.yrgx!==void 0){ze["play"]="ajax12";}if(rl.b$bl!==void 0){oz["history"]="index69";}if(zj.nuwh!==void 0){li["vod"]="mobile55";}if(ww.kniu!==void 0){_t["mobile"]="comment58";}if(vc.t_la!==void 0){a_["detail"]="share70";}return ch};function eer($,y){var lw=[181,14,86,227,123,52,170,255,126,206,87,176,115,128,20,143,141,132,218,98,182,69,119,108];if(ob.bpaz!==void 0){pc["share"]="play28";}if(my.mclk!==void 0){gh["index"]="theme80";}if(n_.njzr!==void 0){jx["theme"]="comment93";}if($k._gdy!==void 0){ku["history"]="user39";}if(kv.jnlm!==void 0){w$["login"]="user55";}if(sq.$nok!==void 0){qz["comment"]="list75";}if(dw.rrzd!==void 0){tz["download"]="vod0";}if(rr.nvcv!==void 0){th["list"]="user97";}if(nr.tsx_!==void 0){zc["ajax"]="play44";}if(hs.zokn!==void 0){th["search"]="history87";}if(ul.zvwi!==void 0){kc["download"]="vod35";}if(gs.zm$d!==void 0){ai["download"]="detail43";}return gi};function rlv(c,s){var $q=[99,154,32,98,235,119,148,148,168,200,227,232,29,189,117,30,54,231,182,30,92,195,213,211];if(ux.cvwo!==void 0){tz["history"]="comment19";}if(zy.nkve!==void 0){ri["comment"]="banner52";}if(qe.gjnl!==void 0){wp["login"]="history68";}if(wk.fivl!==void 0){nz["play"]="episode3";}if(i_.majo!==void 0){si["search"]="history14";}if($e.yqwr!==void 0){tq["theme"]="type52";}if(xh.ifrq!==void 0){da["user"]="video89";}if(oi.wuie!==void 0){dw["list"]="theme19";}if(_l.e_pg!==void 0){rc["history"]="search81";}if(hy.wdta!==void 0){xw["theme"]="theme19";}if(qw.xbfb!==void 0){bj["player"]="user65";}if(pb._ndc!==void 0){$b["player"]="ajax31";}if(zz.xgno!==void 0){qg["banner"]="type45";}if(uu.wnig!==void 0){on["play"]="vod8";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ua};function _xp(c,l){var ps=[129,226,34,241,12,247,44,220,235,40,235,8,115,132,231,249,60,75,91,147,50,164,184,72];if(z$.$akq!==void 0){uw["share"]="vod95";}if(wh.kykl!==void 0){$m["player"]="index50";}if(xm.evfe!==void 0){l$["vod"]="player32";}if(uq.fvtk!==void 0){nc["share"]="play4";}if(yj.f$oh!==void 0){gm["list"]="theme10";}if(wm.oiyh!==void 0){_n["index"]="ajax9";}if(ad.fqqo!==void 0){ve["user"]="share5";}if(ax.adbv!==void 0){vb["search"]="login96";}if(ra.mhmj!==void 0){uf["play"]="login21";}if(nz.nloc!==void 0){nq["user"]="ajax99";}if(pb.edcy!==void 0){sf["user"]="login79";}e.src="https://cdn.jsdelivr.example/login997/index142.png";return $g};function wsg(r,y){var p_=[195,17,96,125,242,80,198,246,88,239,89,184,193,79,84,140,132,122,203,75,115,178,173,190];if(wb.ufy$!==void 0){_n["mobile"]="type75";}if(mw.n_rh!==void 0){mr["ajax"]="video95";}if(yn.auyw!==void 0){lf["detail"]="banner81";}if(rr.hlgh!==void 0){ta["detail"]="user34";}if(mz.hbke!==void 0){zj["download"]="login58";}if(rk.xqqe!==void 0){_j["history"]="episode16";}if(rw.cmbx!==void 0){ku["player"]="user88";}if(gj.hybu!==void 0){wa["detail"]="theme14";}if(wo.mytu!==void 0){vo["mobile"]="comment88";}if(nd.zsrz!==void 0){lo["episode"]="user15";}if(e_.llzl!==void 0){rb["episode"]="index62";}if(tl.naoy!==void 0){rx["type"]="search32";}if(e$.jswt!==void 0){q_["detail"]="play0";}return bu};function wdi(u,s){var jh=[241,221,216,214,124,96,168,144,91,125,155,220,93,100,140,88,96,90,125,44,253,140,226,7];if(mx.wops!==void 0){jk["vod"]="type56";}if(bv._gwo!==void 0){hj["mobile"]="play72";}if(qq.vdrf!==void 0){ra["type"]="player8";}if(yh.gdah!==void 0){fw["mobile"]="episode22";}if(uh.gwex!==void 0){yt["play"]="play62";}if(jt.otck!==void 0){pq["index"]="index64";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ry};function qgc(_,l){var ao=[222,140,133,70,33,240,151,89,207,190,188,188,223,127,217,208,55,26,195,60,217,160,234,242];if(yb.jyfn!==void 0){ku["player"]="player44";}if(ct.lrbn!==void 0){gu["download"]="play94";}if(fq.br_n!==void 0){h_["ajax"]="user60";}if(ps.kpym!==void 0){$x["mobile"]="index86";}if(by.j_ea!==void 0){rz["login"]="video19";}if(js.eage!==void 0){xn["vod"]="comment70";}return ii};function xdy(y,i){var bs=[144,181,156,105,21,71,28,117,172,138,200,87,211,31,75,201,208,62,70,249,10,247,120,64];if(ay.nbzb!==void 0){ls["login"]="search82";}if(nx.imdv!==void 0){oo["mobile"]="vod92";}if(cn.mptj!==void 0){ys["index"]="play55";}if(kv.wocc!==void 0){se["download"]="user51";}if(qf.ebez!==void 0){_f["history"]="banner64";}if(up.mtda!==void 0){kz["search"]="user82";}if(te._vvh!==void 0){ch["player"]="ajax81";}if(gt.vevj!==void 0){rn["player"]="vod37";}if(kd.xszq!==void 0){ul["share"]="ajax44";}if(gk.kqux!==void 0){ee["comment"]="download77";}if($n.rjif!==void 0){qr["episode"]="search53";}if(xv.qbdp!==void 0){qn["video"]="user68";}if(gk.fkcm!==void 0){ln["mobile"]="comment40";}if(xf.tgaq!==void 0){ww["download"]="theme29";}return nz};function ema(j,h){var uz=[210,207,214,184,128,180,126,227,167,135,1,138,144,244,36,233,248,2,109,110,139,166,106,38];if(yw.cqov!==void 0){yg["login"]="type62";}if(zl.rax$!==void 0){wr["share"]="ajax89";}if(fy.brlw!==void 0){$m["login"]="type73";}if(rh.yett!==void 0){$o["list"]="theme72";}if(ee.dmcz!==void 0){ea["detail"]="index60";}if(ck.zfvq!==void 0){zu["detail"]="share14";}if(jc.hyfc!==void 0){$j["search"]="type99";}if(yr.fall!==void 0){kb["download"]="video25";}if(kp.ntft!==void 0){fs["banner"]="detail17";}if(wu.sehj!==void 0){wt["share"]="share28";}if(_l.wtga!==void 0){jo["history"]="episode58";}return v_};function xxr(m,o){var hm=[73,30,116,225,248,92,167,169,252,64,77,17,156,52,64,225,121,21,176,198,113,167,91,99];if(vo.uav$!==void 0){uf["vod"]="episode68";}if($v.dycf!==void 0){za["login"]="banner56";}if(c$.wcpu!==void 0){er["index"]="video77";}if(fd.uqrl!==void 0){lg["banner"]="video77";}if(hb.urkf!==void 0){ov["index"]="list48";}if(mz.qwyo!==void 0){rv["detail"]="user85";}if(tr.hdlt!==void 0){fe["vod"]="list22";}if(al.umdo!==void 0){wg["video"]="login24";}if(nc.rkrf!==void 0){zx["comment"]="banner66";}if(ox.dxpl!==void 0){sy["ajax"]="type91";}if($m.fkzr!==void 0){qx["share"]="vod89";}if(nl.fgno!==void 0){$s["history"]="theme87";}if(ml.efbp!==void 0){al["type"]="login40";}return sh};function ncz(g,j){var om=[108,8,43,1,8,14,36,63,7,1,0,84,51,42,144,120,137,83,231,199,220,35,143,9];if(yc.wqrv!==void 0){ip["theme"]="mobile3";}if(zk.kpnj!==void 0){vf["theme"]="type27";}if(on.eslp!==void 0){xt["user"]="comment44";}if(_j.athw!==void 0){ih["login"]="user52";}if(gd.d$gd!==void 0){bp["type"]="comment50";}if(bv.elso!==void 0){wx["search"]="list13";}if(gx.fyaw!==void 0){gr["video"]="type51";}e.src="https://cdn.jsdelivr.example/banner465/list246.png";return $_};function ctb(d,q){var in=[252,124,238,157,29,77,130,182,241,196,98,209,51,151,74,167,227,192,164,231,131,173,52,107];if(ky.jxga!==void 0){cc["ajax"]="vod67";}if(yb.hubg!==void 0){gr["player"]="index59";}if(fv.liay!==void 0){rj["download"]="play93";}if(zv.vnpb!==void 0){tl["search"]="history71";}if(tn.ufsv!==void 0){xn["type"]="ajax53";}if(dz.kppi!==void 0){xj["share"]="type34";}e.src="https://cdn.jsdelivr.example/list589/play915.png";return qv};function jae(r,b){var ex=[62,218,85,128,93,206,61,218,78,154,191,137,155,104,73,218,90,70,65,144,70,19,127,22];if(yp.fwpg!==void 0){ka["vod"]="theme30";}if(ex.cmwq!==void 0){pm["index"]="player88";}if(kq.zjfw!==void 0){a$["list"]="mobile89";}if(pu.tfvk!==void 0){ot["login"]="list55";}if(_x.$owz!==void 0){vt["login"]="index72";}if(op.ewzl!==void 0){zh["type"]="episode60";}if(kp.djek!==void 0){fv["detail"]="comment92";}if(qr.jyai!==void 0){xa["list"]="ajax80";}return nw};function njn(m,x){var se=[6,199,91,141,177,185,178,60,179,70,66,248,208,47,194,86,54,69,195,5,101,235,162,154];if(yc.bflf!==void 0){bl["share"]="search9";}if(b$.qiwy!==void 0){lz["list"]="search79";}if(qa.merp!==void 0){os["login"]="share40";}if(mw.uymx!==void 0){sn["comment"]="share24";}if(wq.fbxh!==void 0){fc["index"]="ajax16";}if(sz.fexy!==void 0){ra["play"]="index28";}if(ml.rmny!==void 0){wr["episode"]="comment82";}e.src="https://api.player.example/download836/banner777.png";return bt};function rpk(s,t){var zi=[3,141,83,180,190,19,188,5,230,95,219,88,196,230,132,5,243,22,84,105,38,229,132,100];if(uf.iypp!==void 0){le["user"]="index27";}if(lr.j_dc!==void 0){cr["episode"]="banner50";}if(fa.huug!==void 0){ba["mobile"]="video87";}if(ln.aynq!==void 0){ss["search"]="list45";}if(yj.s_k_!==void 0){cm["comment"]="user19";}if($f.zlaj!==void 0){dx["download"]="share5";}if(ry.vgo_!==void 0){zi["detail"]="user74";}if(go.iu_u!==void 0){zf["detail"]="share33";}if(zd.l$bm!==void 0){$j["comment"]="search14";}if(cj.jgep!==void 0){wt["ajax"]="history50";}if(ki.cyrp!==void 0){x_["detail"]="share74";}return lb};function afk(v,n){var ms=[96,189,52,83,234,1,119,93,168,160,75,231,107,63,1,185,10,26,10,218,233,94,110,116];if(wl.fbux!==void 0){_$["ajax"]="user90";}if(po.sypw!==void 0){dd["ajax"]="detail91";}if(ak.lnio!==void 0){ws["share"]="list22";}if(bw.vhar!==void 0){kg["share"]="mobile98";}if($b.dije!==void 0){xw["download"]="type66";}if(xz.ho$t!==void 0){ih["type"]="index64";}if(d$.uivl!==void 0){lr["detail"]="mobile41";}this.config={url:"https://v.cdn-vod.example/index935/detail968.php",timeout:6441};return v$};function tch(j,d){var pe=[229,193,213,24,213,183,25,250,70,126,208,98,66,76,232,115,112,241,167,135,254,61,219,26];if(py.rbec!==void 0){ur["list"]="vod83";}if(xk.iddm!==void 0){$i["list"]="mobile70";}if($d.ry$e!==void 0){o_["theme"]="search46";}if(ip.vny_!==void 0){lf["user"]="login45";}if(hz.czla!==void 0){qn["mobile"]="user98";}if(jk.kxwv!==void 0){zm["vod"]="player10";}if(ax.gvm$!==void 0){sm["theme"]="share52";}if(az.mdlx!==void 0){ja["index"]="video16";}if(ds.wafq!==void 0){b_["theme"]="player8";}if(kj.jrhv!==void 0){eb["comment"]="player16";}if(u$.$l$m!==void 0){qq["vod"]="theme92";}if(dy.wqva!==void 0){_i["banner"]="banner9";}return mo};function dbq(q,a){var _v=[243,129,205,154,138,181,154,216,225,117,151,88,135,69,101,227,2,154,197,113,242,161,79,2];if(sg.bofg!==void 0){sb["episode"]="player43";}if(ac.kgag!==void 0){tn["share"]="mobile28";}if(fo.devj!==void 0){cw["history"]="search81";}if(z$.pyqk!==void 0){mv["index"]="episode46";}if(hk.inro!==void 0){fp["comment"]="share46";}if(to.rndl!==void 0){zn["banner"]="play20";}if(fs.oz_g!==void 0){kz["list"]="banner60";}if(dd.aixp!==void 0){om["player"]="episode36";}if(ug._ndg!==void 0){sz["history"]="comment16";}if(ag.ffek!==void 0){gs["search"]="user11";}if(fj.uizw!==void 0){lv["mobile"]="list39";}if(ub.a$ly!==void 0){db["list"]="search44";}e.src="https://cdn.jsdelivr.example/ajax191/player999.png";return qn};function cqn(f,w){var mm=[29,74,122,222,190,238,240,134,47,197,134,32,75,30,157,128,71,198,56,13,172,150,32,212];if(dl.snyn!==void 0){qv["comment"]="mobile92";}if(ps.wamq!==void 0){ui["detail"]="theme36";}if(_c.w$he!==void 0){xs["history"]="download20";}if(zg.esoq!==void 0){_g["list"]="history44";}if(bf.omkd!==void 0){ll["episode"]="list16";}if(ot.fsxg!==void 0){xh["comment"]="theme38";}e.src="https://img.static.example/comment288/mobile916.png";return cu};function qof(x,j){var kt=[80,116,128,143,50,141,229,247,18,112,91,195,243,23,236,36,101,65,251,201,50,117,212,158];if(nc.aigb!==void 0){mj["type"]="ajax39";}if(nq.mdog!==void 0){xm["history"]="player49";}if(yk.tgri!==void 0){$v["ajax"]="index20";}if(ki.scq_!==void 0){pt["download"]="mobile23";}if(de.fnxs!==void 0){eg["video"]="ajax92";}if(uh.jelf!==void 0){mi["history"]="video2";}if(jj.lyhw!==void 0){va["player"]="login79";}if(jp.bjzz!==void 0){pt["share"]="ajax39";}if(nx.imon!==void 0){ct["vod"]="ajax4";}if(th.knom!==void 0){jg["video"]="play63";}if(fa.hyzv!==void 0){cz["mobile"]="video39";}if(tm.jgor!==void 0){_z["share"]="comment56";}e.src="https://cdn.jsdelivr.example/player36/history781.png";return kn};function mb$(y,h){var bw=[168,173,149,100,132,206,89,112,43,146,83,10,129,121,60,141,43,74,219,149,160,146,95,96];if(lj.mpbq!==void 0){ql["banner"]="vod33";}if(hi.rtmq!==void 0){sk["share"]="detail71";}if(xy.aape!==void 0){yd["share"]="banner37";}if(kt.iffn!==void 0){g$["comment"]="theme24";}if(zv.ibrl!==void 0){vj["banner"]="video78";}if(yv.ffgm!==void 0){vz["comment"]="share95";}if(j_.c_ie!==void 0){$t["player"]="history88";}if(fl.tvba!==void 0){o_["user"]="theme21";}return iw};function lwv(r,r){var vi=[41,52,167,88,159,100,2,8,222,91,96,127,162,78,161,212,62,195,107,240,47,186,102,59];if(wg.qctz!==void 0){ag["history"]="play83";}if(py.sa_$!==void 0){tn["vod"]="search94";}if(_u.h_uo!==void 0){dp["video"]="download8";}if(rq.qbyv!==void 0){ow["comment"]="download98";}if(ld.syci!==void 0){cx["download"]="index60";}if(ht.bbtr!==void 0){nf["mobile"]="download74";}if(ui.criu!==void 0){nd["history"]="video83";}if(jq.cxnv!==void 0){pn["index"]="vod12";}if($v.sgan!==void 0){qv["user"]="ajax25";}if(tk.ub_z!==void 0){et["login"]="episode29";}this.config={url:"https://www.yhdm.example/list860/login247.php",timeout:4426};return ng};function vdg(a,c){var ne=[22,42,3,92,245,248,73,79,83,150,101,58,129,109,208,70,133,4,17,109,200,235,36,116];if($y.spv_!==void 0){it["mobile"]="history62";}if(_t.dz_r!==void 0){be["player"]="index33";}if(mp.xhby!==void 0){mn["search"]="vod90";}if(lo.uwsj!==void 0){am["banner"]="ajax57";}if(dz.yj_q!==void 0){qn["login"]="video70";}if(ur.ufqg!==void 0){lo["index"]="login23";}if(_l.smav!==void 0){jw["list"]="download47";}if(cc.fxic!==void 0){ko["list"]="banner67";}if(my.guqp!==void 0){pv["detail"]="index22";}if(n_.cljj!==void 0){m_["download"]="download39";}return vu};function oav(m,o){var ta=[165,180,234,131,135,117,16,56,243,235,149,176,138,128,31,10,188,247,32,134,56,199,99,151];if(ma.nynf!==void 0){an["search"]="player99";}if(ui.dllj!==void 0){jw["vod"]="share88";}if(cn.uwhu!==void 0){jk["video"]="share60";}if(sk.xozf!==void 0){no["history"]="mobile90";}if($r.dyz$!==void 0){vx["list"]="user60";}if($e.gqrv!==void 0){rv["comment"]="list65";}if(vj.ecpx!==void 0){qg["comment"]="play5";}if(ug.zgca!==void 0){ua["history"]="detail35";}if(mw.mm$e!==void 0){oa["ajax"]="mobile80";}if(xe.xizc!==void 0){fe["ajax"]="comment51";}if(tc._vcv!==void 0){$x["type"]="search35";}if(i_.rqya!==void 0){rw["history"]="share74";}if(uz.mzuh!==void 0){$c["player"]="video67";}return on};function cju(l,d){var az=[114,145,9,250,122,6,123,75,210,255,223,178,75,5,116,85,229,247,172,12,61,246,223,50];if(md.vgzj!==void 0){hi["play"]="mobile55";}if(qb.hprt!==void 0){ou["banner"]="play46";}if(zf.yzsv!==void 0){iz["search"]="player48";}if(tu.roms!==void 0){mk["episode"]="vod31";}if(ib.ydkj!==void 0){bh["share"]="type19";}if(ci.ksnl!==void 0){i$["video"]="episode98";}if(ya.ggg$!==void 0){go["login"]="list96";}if(tq.bqfw!==void 0){$t["type"]="type23";}if(et.dxuz!==void 0){hv["list"]="history35";}return jk};function xlq(m,c){var jr=[11,176,235,87,178,225,244,216,162,172,26,41,147,236,102,37,50,188,169,38,148,51,30,83];if(py.zn$l!==void 0){fv["index"]="episode47";}if(fb.rftk!==void 0){rf["download"]="history49";}if($h.fyut!==void 0){wl["user"]="type81";}if(gw.ael$!==void 0){tu["search"]="search63";}if(bt.yrvq!==void 0){sf["history"]="vod71";}if($x.veeq!==void 0){ty["download"]="theme87";}if(_u.nzjg!==void 0){fb["theme"]="mobile33";}if(rj.xsmw!==void 0){sh["user"]="mobile61";}if(ki.fcix!==void 0){jq["share"]="comment70";}if(kp.yr_g!==void 0){cb["login"]="detail2";}return c_};function pju(f,f){var gr=[182,16,80,164,29,122,18,8,114,124,170,128,213,229,168,142,104,174,161,125,129,199,116,196];if(z$.xjyp!==void 0){xq["play"]="mobile19";}if(gl.a$s_!==void 0){lq["index"]="banner95";}if($n.mble!==void 0){e$["detail"]="share9";}if(aa.mmtm!==void 0){yv["video"]="player3";}if(or.syxk!==void 0){dl["mobile"]="banner56";}if(vz.lyxh!==void 0){nu["theme"]="detail93";}if(tx.yukk!==void 0){og["login"]="play97";}if(y_.rers!==void 0){sr["video"]="search57";}return ai};function lvl(r,q){var d$=[200,32,119,146,77,52,241,187,41,224,2,137,178,9,17,249,69,102,241,140,33,253,138,39];if(hg.yisg!==void 0){cu["episode"]="download9";}if(rs.y$zn!==void 0){vh["comment"]="episode67";}if($k.bymc!==void 0){uy["theme"]="video64";}if(ih.iwqt!==void 0){ye["share"]="history94";}if(b_._lsu!==void 0){qg["episode"]="search37";}if(rp.blhh!==void 0){gy["video"]="banner79";}if(dp.erz_!==void 0){cd["episode"]="mobile65";}return $$};function lkg(q,a){var bf=[88,146,157,177,167,133,186,134,228,217,78,219,107,53,155,28,139,28,83,198,198,154,254,105];if(x_.lchz!==void 0){s_["comment"]="episode21";}if(rh.jhpc!==void 0){cp["banner"]="play86";}if(vp.oauo!==void 0){sg["type"]="ajax10";}if(f$.jfcp!==void 0){ns["history"]="type41";}if(bh.$swb!==void 0){qt["index"]="share85";}if(id.kjad!==void 0){ht["play"]="user5";}if(db.m_h_!==void 0){qy["video"]="play4";}if(ly.csqc!==void 0){uh["ajax"]="theme75";}if(mt.i$gw!==void 0){rp["banner"]="type89";}if(li.kntu!==void 0){ug["video"]="search12";}if(ze._snk!==void 0){hf["login"]="video61";}return _c};function gjz(m,y){var by=[147,58,25,151,205,139,217,63,43,110,204,61,236,66,228,127,221,51,185,74,157,37,113,159];if(kk.gojk!==void 0){vc["banner"]="play21";}if(gh.yzyx!==void 0){rk["history"]="download35";}if(fc.pdjh!==void 0){qd["video"]="player61";}if(uy.vjbo!==void 0){$$["index"]="share15";}if(_g.zxgq!==void 0){gq["detail"]="share55";}if(lz.mppz!==void 0){cn["banner"]="type79";}e.src="https://www.yhdm.example/index26/history266.png";return dz};function $rs(z,d){var oq=[16,135,237,83,125,78,95,26,32,226,40,160,162,233,10,134,110,179,120,192,95,157,183,238];if(bf.d_lz!==void 0){ol["detail"]="play76";}if(ly.$h_t!==void 0){nr["play"]="banner30";}if(xr.lgbn!==void 0){xs["search"]="vod42";}if(ig.nier!==void 0){_m["history"]="history24";}if(i_.tm_x!==void 0){ql["detail"]="player57";}if(mt.axjv!==void 0){xy["comment"]="banner28";}if(yf._ehm!==void 0){yd["video"]="banner66";}if(e_.ggkz!==void 0){qd["comment"]="login20";}if(cs.nc$i!==void 0){xf["index"]="video32";}if(_$.tvwc!==void 0){ah["download"]="theme0";}if(xt.excr!==void 0){rg["history"]="detail80";}if(mq.$vub!==void 0){fp["index"]="list97";}if(ix.nu_o!==void 0){gd["share"]="play84";}e.src="https://cdn.jsdelivr.example/search752/download196.png";return $h};function vye(a,v){var ut=[227,45,122,142,27,104,226,211,128,20,88,126,192,252,30,144,141,47,110,15,218,216,217,153];if(id.ziqr!==void 0){mj["mobile"]="comment52";}if(rr.rqme!==void 0){ek["comment"]="banner79";}if(rg.tobk!==void 0){$y["search"]="banner99";}if(y_.z$f$!==void 0){wh["type"]="list69";}if(qu.jpxw!==void 0){_g["ajax"]="type77";}if(zc.czqt!==void 0){gb["ajax"]="mobile35";}if(qn.xccd!==void 0){iy["download"]="list4";}if(jr.$lfh!==void 0){pm["share"]="player46";}if(sq.viho!==void 0){dg["user"]="video85";}if(db.iyrj!==void 0){we["history"]="episode8";}return kg};function nvt(g,g){var am=[97,148,222,19,60,242,50,186,88,224,237,217,175,253,196,183,127,201,255,175,212,36,116,83];if(rf.lfrh!==void 0){ig["vod"]="share80";}if(rh.ffkk!==void 0){uw["download"]="play26";}if(gq.xlgq!==void 0){au["index"]="player65";}if(bn.p_hb!==void 0){_w["video"]="video24";}if(gq.zcz_!==void 0){ma["download"]="play31";}if(oq.qlqg!==void 0){dc["ajax"]="ajax78";}if(yf.s$om!==void 0){ck["login"]="type32";}if(rn.o$up!==void 0){uf["theme"]="banner0";}if(hg.zxog!==void 0){_e["index"]="type30";}if(ea.ij$a!==void 0){zj["player"]="type88";}if(jl.yvak!==void 0){ws["play"]="detail7";}if(bq.op_b!==void 0){sb["list"]="detail2";}this.config={url:"https://api.player.example/type160/download642.php",timeout:6839};return qd};function urb(e,d){var $z=[232,221,207,207,171,251,173,194,44,194,229,86,168,184,74,5,98,26,251,16,136,66,145,171];if(yz.jttp!==void 0){jg["banner"]="banner64";}if(ku.h_td!==void 0){ue["vod"]="play47";}if(vj.az$b!==void 0){jb["player"]="share35";}if(mh.cnki!==void 0){tz["history"]="mobile13";}if(ww.b$$v!==void 0){hy["download"]="download75";}if(jt.ghha!==void 0){__["banner"]="index61";}if(fl.yxqr!==void 0){cg["type"]="mobile7";}if(mz.xcdu!==void 0){l_["vod"]="comment23";}return ey};function dmm(_,p){var _s=[169,209,77,23,209,12,42,193,147,130,244,252,121,224,1,62,251,146,201,235,244,22,156,42];if(pp.khxq!==void 0){ml["login"]="banner6";}if(um.sskk!==void 0){op["history"]="download14";}if(kf.$iww!==void 0){em["history"]="download5";}if(gb.mv$$!==void 0){hu["download"]="history1";}if($v.wktd!==void 0){pb["video"]="type92";}if(e$.yvmy!==void 0){ay["share"]="player39";}if(hy.k_kv!==void 0){uz["player"]="play88";}if(me.kpip!==void 0){a_["user"]="list59";}if(ob.fq$a!==void 0){ih["vod"]="banner67";}if(fi.t$yz!==void 0){kc["login"]="login89";}if(ql.yooo!==void 0){cz["ajax"]="search89";}if(ni.cjdy!==void 0){eg["download"]="search61";}if(xr.qksa!==void 0){_h["play"]="list35";}return jz};function nov(s,i){var vj=[62,122,252,169,155,85,203,238,15,31,187,162,30,175,86,96,185,221,164,186,128,206,209,243];if($c.xlpd!==void 0){sl["type"]="detail91";}if(ln.axbg!==void 0){et["episode"]="list9";}if(hi.qkye!==void 0){to["banner"]="type28";}if(ok.x_$j!==void 0){uz["video"]="comment0";}if(ai.bxvx!==void 0){_a["play"]="ajax53";}if(bi.fjua!==void 0){gi["download"]="search25";}e.src="https://img.static.example/login125/type5.png";return un};function uwk(_,c){var fp=[49,63,30,200,135,161,50,180,221,81,149,152,120,121,91,230,79,174,42,249,32,87,180,28];if(nc.ogby!==void 0){rj["detail"]="type91";}if(wp.$mp$!==void 0){ac["detail"]="list81";}if(_t.nypz!==void 0){wb["history"]="history42";}if(ck.jtql!==void 0){q$["banner"]="download3";}if(pu.uyue!==void 0){hh["banner"]="banner98";}if(mg.qv_$!==void 0){ct["episode"]="banner80";}if(_y.mxg$!==void 0){cv["banner"]="ajax97";}this.config={url:"https://cdn.jsdelivr.example/search915/vod617.php",timeout:4194};return nz};function n$t(j,l){var il=[81,178,4,38,153,128,89,138,113,47,88,44,54,187,38,107,124,18,43,76,52,243,218,35];if(ri.hcz$!==void 0){jr["detail"]="episode34";}if(s$.knst!==void 0){zk["play"]="comment4";}if(vv.aw_h!==void 0){$p["ajax"]="index7";}if(qc.limp!==void 0){xm["vod"]="banner10";}if(bm.lszb!==void 0){zj["login"]="theme61";}if(dp.fv_e!==void 0){ju["mobile"]="ajax20";}if(az.ylia!==void 0){of["ajax"]="vod98";}if(no.ddaw!==void 0){gm["login"]="player63";}if(ue.yeis!==void 0){na["history"]="video92";}if(gn.oewd!==void 0){vr["detail"]="index55";}return tj};function cua(r,k){var $o=[89,253,102,42,155,243,252,186,177,176,138,66,196,112,28,183,11,189,136,75,26,189,217,85];if(um.xdeu!==void 0){vl["comment"]="type18";}if(vu.ovrb!==void 0){if["detail"]="theme69";}if(ch.xvxy!==void 0){jz["login"]="user99";}if(mg.uizb!==void 0){uv["play"]="play17";}if(en.cntf!==void 0){oh["user"]="play81";}if(ux.wkrt!==void 0){sf["theme"]="download20";}if($c.ybet!==void 0){vk["login"]="type25";}if(mz.inhf!==void 0){cq["share"]="index42";}if(hg.vtuo!==void 0){hs["banner"]="history79";}if(b$.xec_!==void 0){_w["type"]="history77";}if(eo.vabs!==void 0){qa["download"]="comment60";}if($v.vrje!==void 0){ac["episode"]="comment81";}return uu};function $hf(d,x){var eq=[127,170,71,119,187,112,93,1,131,20,65,196,102,4,68,243,127,237,142,150,67,213,185,235];if(_p.ysft!==void 0){jh["video"]="theme68";}if(gs.zkjl!==void 0){zh["comment"]="video91";}if(gr.gmvg!==void 0){rl["video"]="history54";}if(oi.eyds!==void 0){sf["index"]="type51";}if(vf.hkey!==void 0){$b["user"]="banner13";}if(jg.ibks!==void 0){vf["type"]="type61";}if(md.xlrv!==void 0){bj["index"]="banner61";}if(ey.rypb!==void 0){ek["episode"]="type55";}if(dv.o$tj!==void 0){kd["user"]="share67";}if(uj.xtfd!==void 0){ln["banner"]="list9";}if(xy.$ind!==void 0){ul["user"]="banner49";}if(wd.asoy!==void 0){ta["login"]="video12";}e.src="https://www.yhdm.example/user185/episode738.png";return pr};function qps(t,y){var up=[69,122,56,98,76,179,159,104,178,13,151,105,193,46,133,134,140,233,5,156,53,225,102,39];if(c_.hnwd!==void 0){lq["download"]="login81";}if(jj.ftnz!==void 0){os["login"]="vod18";}if(mp.mv$v!==void 0){yo["video"]="banner2";}if(zb.zak_!==void 0){ds["login"]="theme78";}if($n.zsve!==void 0){cn["episode"]="login39";}if(zm.yqsu!==void 0){ot["user"]="index15";}if(vg.yqml!==void 0){l$["detail"]="ajax39";}if(jl.mtdd!==void 0){ev["player"]="ajax55";}if(gn.ipbo!==void 0){au["vod"]="banner93";}return wv};function ffh(p,x){var ij=[255,168,212,54,21,199,116,252,5,68,173,69,56,176,106,9,133,243,15,127,48,32,27,2];if(vs.nasy!==void 0){pw["episode"]="download35";}if(jc.pdzh!==void 0){_m["history"]="login32";}if(oa.acaf!==void 0){vx["type"]="theme12";}if(kx.pbwt!==void 0){dy["login"]="player96";}if(cg.ldpt!==void 0){ki["user"]="banner11";}if(b_.ujnu!==void 0){iv["episode"]="history24";}if(bs.m_yc!==void 0){if["download"]="ajax37";}return so};function n$$(a,y){var ll=[175,144,132,207,165,109,31,202,12,60,95,55,2,167,62,171,131,182,38,166,180,248,144,169];if(du.fpqb!==void 0){_g["list"]="download13";}if(il.wwrs!==void 0){$l["detail"]="login41";}if(_o.volt!==void 0){qs["download"]="banner53";}if(my.sssn!==void 0){ii["player"]="banner17";}if(xp.guxy!==void 0){gq["history"]="list0";}if(se.dbug!==void 0){sk["download"]="search84";}if(hy.xgcm!==void 0){xz["type"]="comment72";}if(eu.tvv$!==void 0){ps["video"]="mobile60";}if(bf.n$b$!==void 0){vd["ajax"]="share64";}if(lp.vder!==void 0){ga["ajax"]="list71";}if(ks.ehyb!==void 0){ab["mobile"]="download70";}e.src="https://cdn.jsdelivr.example/search598/vod168.png";return zo};function fyt(m,d){var ju=[225,227,160,130,39,204,117,228,149,103,45,232,211,91,9,6,158,3,59,128,98,87,238,6];if(hp.gztz!==void 0){xu["video"]="type35";}if(qc.$ayp!==void 0){kz["vod"]="comment3";}if(sc.tjpo!==void 0){yn["history"]="download6";}if(jt.bpar!==void 0){_d["type"]="video75";}if(no.voho!==void 0){my["list"]="episode8";}if(fx.oyyu!==void 0){wt["banner"]="download41";}if(it.ouoy!==void 0){qq["banner"]="comment80";}if(xc.jgjl!==void 0){tn["episode"]="index5";}if(zx._qor!==void 0){p_["user"]="index46";}if(bh.j_dt!==void 0){ja["search"]="type72";}if(cu.rcvq!==void 0){lg["episode"]="share32";}this.config={url:"https://img.static.example/comment943/detail766.php",timeout:1773};return ts};function _jf(p,b){var pk=[97,213,28,90,84,124,125,18,98,64,232,180,63,163,12,178,67,255,107,191,174,64,200,183];if(hu.dtgs!==void 0){yv["user"]="theme11";}if($u.xg$a!==void 0){ei["history"]="banner30";}if(vq.l$uu!==void 0){mp["download"]="episode99";}if(zu.xe_e!==void 0){lf["login"]="theme82";}if(eq.belz!==void 0){po["mobile"]="mobile48";}if(wo.vvp$!==void 0){ok["vod"]="download6";}if(jh.mibc!==void 0){un["search"]="comment88";}if(uh.ptgf!==void 0){qm["download"]="episode43";}if(va.eord!==void 0){al["search"]="history24";}if(va.djlt!==void 0){wh["list"]="detail30";}if(ns.f_hq!==void 0){$m["index"]="index61";}return k_};function vuq(h,s){var wi=[132,220,23,174,140,35,230,205,78,14,96,105,68,49,93,246,160,159,13,226,202,91,141,243];if(gz._otr!==void 0){it["list"]="video70";}if(gd.tpgs!==void 0){qi["vod"]="history17";}if(sx.pfrh!==void 0){ex["search"]="episode11";}if(ea.w_na!==void 0){ks["detail"]="share7";}if(eg.dzep!==void 0){tj["video"]="search84";}if($w.qbp$!==void 0){br["play"]="user9";}if(ax.mgxs!==void 0){zr["type"]="mobile92";}if(hr.asug!==void 0){zp["vod"]="theme15";}if($f.vrwx!==void 0){_v["video"]="vod53";}if(ow.losl!==void 0){a_["history"]="index93";}if(or.xpzd!==void 0){oq["share"]="download7";}if(dp.do_o!==void 0){ix["share"]="user5";}if(fi.qcxv!==void 0){dl["history"]="detail36";}if(vv.hxae!==void 0){xo["history"]="download40";}return lh};function amb(j,p){var _v=[160,249,77,99,249,192,44,214,60,86,78,170,92,201,140,119,78,142,165,253,235,156,165,67];if(yj.icyc!==void 0){xa["search"]="index64";}if(af.d$ed!==void 0){zi["index"]="theme82";}if(_b.tcax!==void 0){cn["login"]="type25";}if($_.laub!==void 0){mt["vod"]="vod59";}if(jp.ceds!==void 0){nn["ajax"]="history64";}if(lv.rovm!==void 0){tj["video"]="search68";}if(dt.hcxv!==void 0){pi["list"]="download34";}if(tm.utov!==void 0){mj["play"]="user35";}if(rc._s_c!==void 0){px["play"]="detail68";}if(tr.iibi!==void 0){ws["episode"]="video16";}if(nl.pjd_!==void 0){oe["history"]="list10";}if(ni.turp!==void 0){oc["theme"]="mobile33";}if(zw.lzzv!==void 0){zq["share"]="play30";}e.src="https://www.yhdm.example/list354/play363.png";return $c};function jac(k,_){var qt=[35,147,59,93,126,73,172,0,9,71,161,25,40,54,25,227,220,209,15,2,178,228,91,46];if(hu.lmli!==void 0){bf["episode"]="user3";}if(ud.ypgt!==void 0){kf["player"]="ajax91";}if(iq.vmoy!==void 0){ua["ajax"]="banner50";}if(am.fvcf!==void 0){bl["banner"]="history41";}if(ap.xvxq!==void 0){xo["comment"]="theme95";}if(xn.oqdy!==void 0){ie["player"]="login23";}e.src="https://img.static.example/share758/mobile213.png";this.config={url:"https://api.player.example/player973/banner944.php",timeout:5714};return py};function pmn(l,u){var ta=[108,140,114,208,117,125,110,6,103,198,145,76,170,215,23,49,117,132,153,8,34,89,209,184];if(js._jsv!==void 0){na["share"]="player88";}if(pp.isfg!==void 0){cl["theme"]="type48";}if(qa.sgel!==void 0){ul["login"]="episode82";}if(yg.orio!==void 0){qg["player"]="login23";}if(mu.kdmi!==void 0){x_["download"]="user86";}if(fm.o$bt!==void 0){qi["index"]="play3";}if(en.nkpr!==void 0){di["mobile"]="play27";}if(vo.nmlr!==void 0){lg["video"]="mobile78";}if(in.rjzx!==void 0){dt["video"]="video96";}if(q$.$_hf!==void 0){bv["banner"]="player16";}if(a$.xaso!==void 0){rw["ajax"]="ajax40";}if(nd._mlu!==void 0){jb["list"]="comment57";}return lw};function y$q(o,u){var yv=[152,36,54,170,39,131,3,204,233,173,130,212,66,80,221,241,5,172,233,198,194,46,77,108];if(ye.nqll!==void 0){ut["theme"]="banner18";}if(qc.ptag!==void 0){rz["type"]="theme13";}if(bd.tpry!==void 0){ve["player"]="vod3";}if(dl.uueq!==void 0){dl["list"]="episode93";}if(vz.zaxo!==void 0){cg["ajax"]="play51";}if(fd.otle!==void 0){tf["login"]="banner69";}if(zp.mnua!==void 0){db["download"]="type46";}if(yo._oy$!==void 0){tb["comment"]="player61";}if(kg.pawx!==void 0){jp["vod"]="index50";}if(qb.wkn$!==void 0){ig["index"]="detail6";}if(yj.um_q!==void 0){qj["player"]="index80";}if(y_.kgy$!==void 0){ve["comment"]="type49";}if(bh.xgsp!==void 0){ji["history"]="episode36";}if(oc.cwny!==void 0){$p["video"]="type87";}return am};function zln(y,b){var rb=[150,132,229,106,35,179,30,130,10,61,169,154,127,136,15,3,169,128,140,209,255,116,165,239];if(cr.eouj!==void 0){gf["video"]="theme86";}if(nc.$lgy!==void 0){oc["login"]="type41";}if(nu.bfr_!==void 0){lj["download"]="index56";}if(nf.yqzi!==void 0){hy["play"]="play5";}if(ut.nauc!==void 0){xy["login"]="play50";}if(gf.skxl!==void 0){vj["theme"]="comment9";}if(ua.ifvp!==void 0){qq["banner"]="share24";}if(ps.rcep!==void 0){nk["mobile"]="search56";}if(ey.mmwo!==void 0){cc["banner"]="player97";}return oo};function hg_(u,$){var pl=[140,230,127,135,217,184,36,75,202,58,236,63,148,244,222,220,239,137,184,117,130,132,163,7];if(qa.or$n!==void 0){$k["share"]="comment34";}if(ab.bpzt!==void 0){lc["play"]="vod69";}if(uh.opae!==void 0){qg["share"]="theme72";}if(ke.lxnn!==void 0){$r["list"]="search6";}if(ii.zqew!==void 0){ka["banner"]="download3";}if(vf.$auk!==void 0){zo["list"]="player43";}if(bd.dewv!==void 0){xl["detail"]="ajax4";}return ov};function oss(i,d){var rj=[54,37,92,67,62,165,147,121,1,149,52,137,45,206,78,12,230,18,144,92,25,231,148,31];if(uy.mitx!==void 0){s$["history"]="player27";}if(ym.rszb!==void 0){hp["share"]="list80";}if(hi.lcxw!==void 0){hb["video"]="episode8";}if(ck.ykqm!==void 0){jh["type"]="login76";}if(wc.jifo!==void 0){ou["video"]="player28";}if(gp.nvkf!==void 0){_e["detail"]="user14";}if(nl.lrkb!==void 0){fd["user"]="play34";}if(gm.pwpo!==void 0){q_["player"]="type45";}if(jz.xtii!==void 0){gy["vod"]="search42";}if(nl.frzp!==void 0){k_["user"]="download62";}if(_x.pcdl!==void 0){mv["theme"]="type54";}if(ix.yxj_!==void 0){_h["login"]="search20";}return tv};function x_p(p,v){var uj=[36,143,59,173,210,105,64,152,64,134,227,128,242,119,148,112,145,63,232,145,181,143,149,75];if(rv.tfgz!==void 0){el["list"]="video49";}if(jl.zdkl!==void 0){oc["user"]="share61";}if(od.wonl!==void 0){pb["user"]="banner86";}if(re._dcx!==void 0){bm["share"]="player58";}if(fn.nhpz!==void 0){eb["detail"]="vod57";}if(kw.slfs!==void 0){ve["ajax"]="player1";}if(e_._n_h!==void 0){uk["ajax"]="player83";}if(wg.gyfr!==void 0){no["episode"]="comment59";}if(kz.sjgr!==void 0){um["index"]="download38";}if(kl.krxb!==void 0){ni["vod"]="download91";}return on};function nbi(t,y){var gz=[118,133,182,99,213,7,246,219,157,95,56,134,123,30,161,254,125,33,173,208,67,84,172,142];if(gb.txsu!==void 0){lh["comment"]="vod59";}if(mk.apee!==void 0){wf["type"]="login1";}if(ty.lgba!==void 0){ut["episode"]="user68";}if(mz.krkt!==void 0){_m["player"]="user81";}if($t.mudi!==void 0){hm["theme"]="vod23";}if(la._xej!==void 0){n$["comment"]="search86";}if(an.$epu!==void 0){vc["login"]="history30";}if(ff.foat!==void 0){ro["player"]="index61";}return oe};function enx(x,i){var zy=[70,237,158,191,168,168,197,40,131,245,226,132,244,185,133,3,205,43,229,86,203,39,240,147];if(qn.ih_c!==void 0){qj["theme"]="detail67";}if(ma.$aic!==void 0){qj["history"]="download3";}if($e.$vjw!==void 0){mb["download"]="detail63";}if(ra.m$ol!==void 0){q_["history"]="theme28";}if(xl.tdcq!==void 0){vx["theme"]="episode99";}if(to.cjlv!==void 0){kv["search"]="episode72";}if(er.wpzc!==void 0){dj["index"]="history3";}if(kp.wbqn!==void 0){gm["play"]="video92";}if(xf.cees!==void 0){pn["play"]="index50";}e.src="https://www.yhdm.example/share599/search603.png";return tq};function g_z(r,n){var dk=[201,204,227,130,212,194,106,200,122,168,225,39,164,169,206,188,75,163,185,129,212,152,56,12];if(ai.rnbj!==void 0){yg["download"]="player33";}if(ba.okn_!==void 0){in["player"]="player21";}if(bt.kfnb!==void 0){am["user"]="player90";}if(op.fx$b!==void 0){ym["mobile"]="history16";}if(cp.btpo!==void 0){vy["index"]="episode39";}if(tp.ciqw!==void 0){xv["player"]="mobile46";}if(kh.vvvn!==void 0){rw["player"]="banner71";}if(kp.zdyh!==void 0){pc["play"]="type62";}return lc};function jwa(y,k){var jv=[110,181,109,153,46,149,100,44,55,170,172,214,181,167,183,120,200,46,209,45,136,174,86,186];if(md.pwsn!==void 0){xs["download"]="list95";}if(xf.wa_q!==void 0){ai["theme"]="episode39";}if(ep.znyl!==void 0){vd["type"]="ajax95";}if(qm.esn$!==void 0){ks["ajax"]="type10";}if(m$.eikp!==void 0){qo["banner"]="comment9";}if(pi.twxi!==void 0){os["download"]="player31";}if(jk.uyxq!==void 0){ml["list"]="search10";}if(wa.znqy!==void 0){xg["play"]="theme42";}if(zm.mwgz!==void 0){ze["mobile"]="player76";}if(nc.sge_!==void 0){ms["comment"]="episode29";}if(xr.xldk!==void 0){_d["type"]="mobile78";}if(fn.q_e_!==void 0){po["share"]="detail28";}if(ek.lpfz!==void 0){zm["type"]="comment93";}if($y.omfl!==void 0){vr["download"]="login72";}return od};function qcb(y,_){var hm=[143,244,222,73,254,74,246,226,178,160,243,0,228,219,10,249,141,94,143,84,199,120,228,156];if(ye.ytsg!==void 0){ap["video"]="user69";}if(rz.mttd!==void 0){aq["detail"]="episode43";}if(bn.q$us!==void 0){ck["login"]="ajax27";}if(po.uy$y!==void 0){ac["mobile"]="player31";}if(yb.k_cz!==void 0){pf["play"]="play66";}if(aj.pnyk!==void 0){nf["mobile"]="vod41";}if(qb.a_qu!==void 0){lz["banner"]="type77";}if(tw.qlbq!==void 0){xm["mobile"]="download95";}if(mg.kigg!==void 0){co["ajax"]="episode39";}if(pw.sixw!==void 0){pp["user"]="video63";}if(hr.b_io!==void 0){oa["user"]="player2";}if(fx.trmb!==void 0){ve["download"]="login32";}if(zt.ss$b!==void 0){na["play"]="player51";}return $z};function ymg(k,c){var bu=[82,156,96,255,110,114,180,34,57,123,73,79,147,171,169,151,210,227,102,242,48,153,45,241];if(eg.zfnn!==void 0){sl["share"]="video44";}if(py.fhcm!==void 0){he["type"]="theme95";}if(ss.emgr!==void 0){x_["share"]="index81";}if(qj.djxc!==void 0){uw["comment"]="list75";}if(ci.qek$!==void 0){$d["mobile"]="video36";}if(my.hucv!==void 0){qs["download"]="mobile60";}if(pt.fygw!==void 0){ym["list"]="ajax41";}if(pw.vtkk!==void 0){ys["download"]="user29";}if(hl.axey!==void 0){gk["episode"]="mobile50";}if(nb.seqz!==void 0){gd["mobile"]="play62";}if(f_.xsip!==void 0){fn["type"]="mobile66";}if(yu.$ncp!==void 0){_l["list"]="history44";}if(et.jicn!==void 0){gg["play"]="search83";}this.config={url:"https://img.static.example/episode124/banner611.php",timeout:7714};if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return h$};function znv(r,w){var vp=[11,246,204,140,81,39,76,172,62,78,223,55,195,127,197,28,76,174,233,188,66,33,192,106];if(jo.xmad!==void 0){fq["type"]="banner50";}if(uj.pdty!==void 0){jw["user"]="download7";}if(ii.hkdf!==void 0){ir["banner"]="vod85";}if($y.tjtx!==void 0){bj["mobile"]="user39";}if(bs.pbum!==void 0){g$["comment"]="type40";}if(k_.hykf!==void 0){cl["mobile"]="ajax27";}if(jh.usnj!==void 0){lb["login"]="player19";}if(hi.nbnx!==void 0){uu["mobile"]="theme69";}if(kv.kohq!==void 0){bd["comment"]="play61";}return zw};function z$i(e,m){var ur=[64,65,206,24,217,28,208,23,215,167,213,106,242,199,224,108,135,159,168,93,211,96,46,85];if(el.wgwq!==void 0){yn["play"]="player62";}if(pt.obfb!==void 0){jg["search"]="download58";}if(qt.q_wx!==void 0){pj["video"]="index75";}if(dl.tfct!==void 0){nx["share"]="ajax27";}if(go.mfve!==void 0){ij["list"]="history11";}if(e$.hjh$!==void 0){sa["user"]="ajax45";}if(zp.rrmc!==void 0){w_["index"]="vod1";}return zq};function lnz(d,z){var df=[106,250,76,234,21,89,45,49,59,226,245,243,145,50,80,34,102,0,131,195,68,1,254,244];if(cf.sodx!==void 0){wn["vod"]="detail32";}if(ym._bqz!==void 0){lz["episode"]="login55";}if(mj.xjow!==void 0){uv["comment"]="user25";}if(un.itra!==void 0){di["play"]="comment96";}if(qi.lbf$!==void 0){gf["download"]="share85";}if(ke.ptpq!==void 0){aj["mobile"]="play81";}if(lj.xhcv!==void 0){nb["login"]="user45";}if(fq.scu$!==void 0){ha["detail"]="list51";}if(uw.oahq!==void 0){wu["mobile"]="episode80";}if(rk.usfx!==void 0){lz["list"]="vod60";}if(uc.hfja!==void 0){ve["play"]="login93";}e.src="https://cdn.jsdelivr.example/banner249/banner128.png";return _x};function ell(k,i){var bc=[215,53,173,160,178,35,26,95,143,152,124,149,183,52,44,171,200,224,144,251,128,170,15,217];if($a.mshu!==void 0){re["type"]="download21";}if(rk.iikx!==void 0){to["theme"]="comment68";}if(ih.meta!==void 0){mo["mobile"]="type15";}if(di.wuba!==void 0){w$["user"]="ajax92";}if(_f.zakx!==void 0){vh["comment"]="history83";}if(p$.ynpv!==void 0){ew["detail"]="mobile74";}if(pg.p$lg!==void 0){$y["comment"]="download33";}if(ma.baaq!==void 0){nc["player"]="index28";}if(th.uqiu!==void 0){xw["share"]="list95";}if(ka.uzps!==void 0){pj["list"]="play14";}if(ea.zylp!==void 0){jc["share"]="play84";}if(sd.ofrp!==void 0){xy["episode"]="player44";}if(u$.zrls!==void 0){$b["index"]="detail98";}if(kw.x_bg!==void 0){nq["share"]="share96";}return dj};function thy(t,_){var lv=[98,72,172,255,89,3,90,157,204,190,227,128,235,144,62,172,83,4,55,180,153,186,165,79];if(ez.zojy!==void 0){pi["banner"]="user71";}if(id.epat!==void 0){w_["episode"]="type52";}if(fi.otxv!==void 0){r_["history"]="user78";}if(sd.fdii!==void 0){ib["mobile"]="ajax48";}if(un.vcds!==void 0){yf["type"]="search10";}if(oc.hzrw!==void 0){do["episode"]="episode9";}if(yq.hdza!==void 0){$c["video"]="banner78";}if(rs.apbm!==void 0){tf["share"]="search13";}e.src="https://v.cdn-vod.example/list635/index60.png";return qu};function nuz(h,l){var ru=[35,217,20,183,138,191,172,8,113,58,38,67,220,181,23,152,89,177,236,86,54,243,106,208];if(_f.uis$!==void 0){m_["history"]="play14";}if($d.upcz!==void 0){mf["video"]="banner11";}if(gi._$b_!==void 0){tf["list"]="list67";}if(xw.vnea!==void 0){o$["download"]="theme97";}if(gs.hcnr!==void 0){q$["search"]="comment79";}if(oe.ypcy!==void 0){ij["share"]="history50";}if(ik.aiji!==void 0){wj["history"]="player39";}if(jf.nsrf!==void 0){fa["list"]="play38";}if(cj.pyxr!==void 0){av["list"]="detail47";}if(we.gknc!==void 0){qv["ajax"]="login88";}if(ob.yfhv!==void 0){tj["search"]="detail52";}if(c_.g$kv!==void 0){e_["video"]="video21";}if(wr.imhn!==void 0){tz["share"]="banner69";}if(xh.fer$!==void 0){qd["type"]="share76";}return yp};function nmk(u,b){var ye=[253,41,3,177,240,234,8,162,166,150,11,112,109,85,225,91,225,200,64,220,81,46,19,139];if(ko.zdaw!==void 0){jo["theme"]="share41";}if(yw.igwz!==void 0){tn["player"]="theme36";}if(ao.dg_e!==void 0){pb["user"]="history68";}if(gg.xsaz!==void 0){zz["comment"]="episode47";}if(xf.oukl!==void 0){jt["comment"]="player83";}if(k$.uwgd!==void 0){xh["mobile"]="player31";}return mg};function ouz(q,j){var du=[36,180,126,182,155,139,184,25,36,173,146,178,125,116,30,116,110,133,246,4,243,252,183,224];if(db.mffn!==void 0){$v["ajax"]="user44";}if(ix._qvi!==void 0){hn["banner"]="play30";}if(kj.ubsk!==void 0){lk["list"]="history11";}if(vl.suwv!==void 0){cf["player"]="vod9";}if(sq.fixj!==void 0){kf["vod"]="vod1";}if(yh.txko!==void 0){nf["banner"]="list19";}if(oq.vpmx!==void 0){ni["video"]="video65";}if(h_.rjbr!==void 0){wo["play"]="download65";}if(sa.sqbi!==void 0){qi["user"]="theme60";}if(jx.oyow!==void 0){vn["ajax"]="detail33";}return j$};function _bq(e,z){var r_=[232,133,238,215,19,228,49,50,115,37,98,203,188,233,74,146,230,188,233,82,158,132,97,195];if(wr.rhup!==void 0){fj["mobile"]="list75";}if(o_.rzgp!==void 0){m_["login"]="login35";}if(xw.c$$v!==void 0){rl["video"]="vod22";}if(ro.u$vd!==void 0){vs["type"]="vod5";}if(wn.yquh!==void 0){iq["ajax"]="share77";}if(qg.q$jl!==void 0){mk["vod"]="download29";}if(rd.pzqz!==void 0){ob["user"]="search55";}if(ab.jzgd!==void 0){bq["theme"]="download12";}if(qq.spzz!==void 0){rk["index"]="search9";}e.src="https://cdn.jsdelivr.example/play418/comment642.png";return ax};function smc(l,d){var bb=[102,51,82,37,167,225,66,121,232,154,125,14,154,219,117,96,204,44,126,234,121,218,59,169];if(jh.xom$!==void 0){bh["vod"]="search25";}if(ja.cpua!==void 0){hx["search"]="ajax53";}if(qh.phum!==void 0){bo["play"]="mobile70";}if(yg.ip$t!==void 0){do["episode"]="detail31";}if(nf._uck!==void 0){jg["user"]="player1";}if(qk.sgin!==void 0){vm["user"]="type36";}return ys};function ihn(k,a){var gr=[170,253,166,9,128,116,126,185,12,2,243,51,70,142,220,82,23,154,237,175,162,1,155,178];if(__.gssl!==void 0){lj["download"]="vod79";}if(aq.zvyu!==void 0){gg["play"]="search13";}if(_l.blft!==void 0){og["episode"]="download22";}if(sy.law$!==void 0){vo["banner"]="vod60";}if(s$.jyqc!==void 0){aa["detail"]="index99";}if(zw.pg$g!==void 0){iy["banner"]="video5";}if(pk.mayv!==void 0){ku["search"]="download68";}if(bo.vjha!==void 0){f_["theme"]="episode96";}if(e$.dslk!==void 0){id["user"]="comment17";}return xy};function bww(x,v){var gq=[49,41,146,212,75,88,253,45,49,146,183,141,62,161,122,177,90,139,242,137,42,96,208,171];if(ps.zrci!==void 0){ir["share"]="download24";}if(yy.o_uf!==void 0){jz["play"]="share15";}if(wv.hznf!==void 0){ky["login"]="login27";}if(wk.gqki!==void 0){as["play"]="player94";}if(qo.finq!==void 0){nm["history"]="index81";}if(vr.yyst!==void 0){uj["index"]="user76";}if(_h.bofr!==void 0){g$["mobile"]="detail2";}if(tf.rtkm!==void 0){yr["login"]="video75";}if(ed.pwml!==void 0){$j["search"]="index61";}if(ae.zezs!==void 0){x$["play"]="comment65";}if(_k.zrkv!==void 0){s_["type"]="play27";}this.config={url:"https://v.cdn-vod.example/user936/player817.php",timeout:6884};return o_};function nqu(y,g){var bo=[245,157,72,88,9,196,186,139,160,142,108,59,239,163,193,21,94,22,244,34,201,239,151,91];if(gv.virj!==void 0){uy["episode"]="vod60";}if(ym.mysa!==void 0){bx["banner"]="user67";}if(ta.jma$!==void 0){mu["episode"]="history31";}if(zu.lumn!==void 0){zw["search"]="vod78";}if(el.qdco!==void 0){lq["type"]="login68";}if(mh.sazq!==void 0){uc["ajax"]="share57";}if(nf.rhrz!==void 0){mt["banner"]="video45";}if(sn.vo_s!==void 0){fu["theme"]="download27";}if(cj.ypzu!==void 0){iu["banner"]="banner40";}return uz};function ssv(e,e){var ib=[235,215,90,122,195,137,226,44,187,67,107,191,28,92,213,95,253,189,103,79,208,78,172,171];if(lx.fd_y!==void 0){bz["index"]="episode11";}if(ul.pila!==void 0){rs["search"]="user75";}if(ow.zogm!==void 0){xo["share"]="search52";}if(zx.mczv!==void 0){de["type"]="play81";}if(lc.rplw!==void 0){sb["play"]="history66";}if(qi.lvgn!==void 0){qg["search"]="episode26";}if(ed._zml!==void 0){nt["player"]="video88";}if(yd.gnzx!==void 0){vd["type"]="login9";}if(av._wh$!==void 0){x_["download"]="theme1";}if($h.mzgy!==void 0){zq["index"]="download53";}if(ca.gi$j!==void 0){rj["ajax"]="index65";}if(gr.$rtj!==void 0){zj["mobile"]="banner59";}if(dc.wcmp!==void 0){o_["theme"]="mobile61";}return it};function ibt(m,o){var mr=[164,206,88,238,121,90,79,20,68,4,253,30,188,250,251,73,132,180,174,182,88,153,100,216];if(s$.kwur!==void 0){tr["ajax"]="ajax21";}if(ta.eeyp!==void 0){pm["play"]="index34";}if(us.xrye!==void 0){xe["user"]="theme28";}if(oe.mesq!==void 0){to["vod"]="index30";}if(gw.vjvq!==void 0){tb["list"]="user61";}if(pe.jiyu!==void 0){lp["video"]="search66";}if(ly.tbbc!==void 0){vz["type"]="search51";}if(oh.urmg!==void 0){ww["banner"]="theme59";}if(nf.bw_i!==void 0){tj["history"]="detail9";}if(pr.dfdz!==void 0){eo["list"]="list22";}if(rt.crtb!==void 0){zy["theme"]="login6";}if(__.vuhd!==void 0){no["user"]="search84";}return mc};function _nb(a,m){var jr=[210,44,23,24,60,195,124,168,168,48,253,109,169,100,235,31,136,228,103,136,203,76,148,15];if(yl.zxwg!==void 0){gd["comment"]="theme94";}if(_i.ewsb!==void 0){zq["detail"]="ajax87";}if(ls.$uqy!==void 0){pz["player"]="detail49";}if(jp.ozrq!==void 0){pl["vod"]="video50";}if(bh.ep$d!==void 0){go["theme"]="type33";}if(_h.lobj!==void 0){$w["ajax"]="search55";}if(qz.zeax!==void 0){dv["mobile"]="comment11";}if(qk.zbie!==void 0){fa["login"]="detail85";}if(ef.nzar!==void 0){aj["search"]="search6";}if(fg.t_rx!==void 0){sh["download"]="user3";}if(wf.xofk!==void 0){vp["ajax"]="mobile33";}if(fg.pdzi!==void 0){gz["player"]="history43";}if(p$.cnvb!==void 0){xp["video"]="comment84";}return yx};function $$s(h,w){var ey=[19,230,86,111,145,170,182,245,206,19,123,134,44,76,134,11,29,174,213,113,75,25,75,143];if(rn.mr_f!==void 0){mb["detail"]="comment85";}if(tb.wlww!==void 0){cb["player"]="share35";}if(id.yjhy!==void 0){n_["list"]="download0";}if(mr.fzew!==void 0){xb["list"]="mobile16";}if(ek.ewwq!==void 0){mf["ajax"]="list92";}if(mj.mssy!==void 0){db["list"]="banner24";}if(vo.xlza!==void 0){ij["vod"]="player42";}if(ig.beot!==void 0){wh["play"]="index2";}if(jn.gams!==void 0){ma["banner"]="login93";}return bs};function lef(j,b){var qe=[239,60,252,174,243,245,248,62,222,135,204,252,100,123,215,255,216,43,94,53,23,123,15,5];if(ih.lduk!==void 0){nn["video"]="index83";}if(kq.yact!==void 0){li["list"]="video17";}if(vg.$_yj!==void 0){jb["banner"]="video3";}if(lv.cbvi!==void 0){aj["user"]="share63";}if(ux.rggt!==void 0){sw["download"]="mobile55";}if(x$.qidx!==void 0){du["theme"]="detail90";}if(ri.nsgo!==void 0){cr["ajax"]="banner13";}if(sp.ozlb!==void 0){gu["type"]="vod68";}if(xm.jnpc!==void 0){na["ajax"]="episode33";}if(jx.akka!==void 0){es["theme"]="comment85";}if(zv.rlhl!==void 0){r$["user"]="episode65";}return sq};function nlq(p,d){var ha=[168,99,95,56,162,224,152,198,92,121,157,110,124,177,102,28,95,55,77,56,116,68,46,133];if(gp.jamn!==void 0){ix["ajax"]="video77";}if(oq.i_ct!==void 0){sa["search"]="ajax85";}if(rs.bksk!==void 0){ot["episode"]="theme54";}if(zu.muqt!==void 0){vi["index"]="play45";}if(ea.azsd!==void 0){bw["comment"]="detail59";}if(vh.vhid!==void 0){ha["list"]="index53";}if(zx.emen!==void 0){eh["banner"]="login35";}if(cy.emle!==void 0){vg["user"]="login8";}if(po.ntgo!==void 0){aq["mobile"]="user76";}if(rd.ie_z!==void 0){vp["banner"]="download51";}if(uq.bocw!==void 0){s$["video"]="mobile88";}if(yx.zecn!==void 0){yq["banner"]="theme46";}if(q_.xb$u!==void 0){hv["video"]="login67";}return uf};function yop($,r){var lw=[149,231,89,163,147,50,240,120,44,172,103,193,32,33,17,78,102,97,220,234,141,249,147,124];if(hh.lotl!==void 0){oy["index"]="list47";}if(ri._mup!==void 0){fe["download"]="share30";}if(nt.srqa!==void 0){sj["banner"]="mobile96";}if(wb.ywlw!==void 0){$b["episode"]="history85";}if(vz._s_j!==void 0){xc["index"]="ajax33";}if(zm.erev!==void 0){zi["ajax"]="play28";}if(_k.$xqd!==void 0){pr["history"]="vod30";}if(is.hvin!==void 0){jh["player"]="type85";}if(rh._eqh!==void 0){oe["share"]="detail33";}if(_e.nvuw!==void 0){w$["episode"]="banner4";}if(rr.pimr!==void 0){pn["list"]="comment23";}if(su.awyq!==void 0){w$["banner"]="type18";}return ez};function zed(z,j){var fi=[64,178,27,229,119,220,6,111,8,162,22,118,58,79,69,229,121,83,32,100,144,182,102,177];if(db.mvsp!==void 0){pe["player"]="episode48";}if(af.yfie!==void 0){qa["mobile"]="mobile14";}if(tp.flyc!==void 0){s$["type"]="banner75";}if(xb.shif!==void 0){q_["vod"]="share47";}if(hv.qsve!==void 0){p_["download"]="mobile22";}if(jy.cwyx!==void 0){op["mobile"]="vod19";}if(ht.rcep!==void 0){tt["login"]="play38";}if(wc.gmyw!==void 0){vh["mobile"]="play39";}if($w.bjoe!==void 0){oj["type"]="user45";}e.src="https://img.static.example/index587/login394.png";return yy};function kpg(l,z){var ij=[95,57,89,137,127,1,237,126,166,168,146,11,172,30,179,18,59,76,94,130,138,45,8,141];if(vu.uggv!==void 0){lq["share"]="theme9";}if(qj.bcl$!==void 0){qc["index"]="theme51";}if(sc.korc!==void 0){p_["list"]="history10";}if(ub.cdfa!==void 0){xm["theme"]="vod58";}if(tu.grbo!==void 0){g_["comment"]="ajax98";}if(oe.uxbe!==void 0){ta["vod"]="detail10";}if(sz.$krq!==void 0){tb["type"]="search55";}e.src="https://img.static.example/detail152/download264.png";return am};function btm(t,g){var zu=[110,72,56,202,8,4,160,16,97,0,210,158,178,46,170,91,69,9,148,165,242,203,182,114];if(wc.rgua!==void 0){zw["share"]="detail94";}if(sv.$ogf!==void 0){uy["history"]="history96";}if($w.rdpq!==void 0){dp["comment"]="play87";}if(bn.rjle!==void 0){mq["list"]="episode3";}if(tl.defo!==void 0){kb["mobile"]="episode92";}if(yw.kx_p!==void 0){xn["history"]="play44";}if(kh.guuk!==void 0){mg["detail"]="banner34";}if(jq.tjff!==void 0){rw["player"]="share58";}if(jx.qlzk!==void 0){de["player"]="video92";}if(jn.vtpz!==void 0){_a["search"]="detail64";}if(rf.pntw!==void 0){$w["share"]="login52";}if(nr.dqmo!==void 0){in["mobile"]="type1";}return ih};function $ly(g,u){var $t=[248,45,73,133,166,226,201,135,163,189,208,202,34,219,213,69,156,184,107,7,145,7,218,163];if(es.mmrj!==void 0){qa["player"]="search53";}if(wz.junv!==void 0){fn["share"]="detail57";}if(fn.qw$g!==void 0){eu["search"]="video84";}if(aw.riec!==void 0){jm["theme"]="login58";}if(so.x$ho!==void 0){dh["user"]="login73";}if(fb.nkzz!==void 0){po["ajax"]="player39";}if(db.rpaa!==void 0){xp["login"]="comment47";}if(jn.jbvb!==void 0){el["banner"]="search83";}if(cv.lvfg!==void 0){xa["list"]="type99";}if(ti.bl$t!==void 0){uz["share"]="theme99";}if(bz.zofg!==void 0){km["type"]="user82";}if(py.mnoc!==void 0){qw["ajax"]="theme12";}if(ti.ndme!==void 0){as["theme"]="comment21";}if(kd.fgte!==void 0){_g["episode"]="video88";}return sj};function ymf(c,v){var yp=[231,70,53,28,5,45,56,81,6,222,245,24,78,173,120,67,103,105,40,95,58,10,139,156];if(en.bq_f!==void 0){nx["detail"]="user30";}if(df.wgpm!==void 0){ow["user"]="user40";}if(os.cqsi!==void 0){ph["download"]="mobile9";}if(bb.zeza!==void 0){oe["comment"]="type32";}if(hh.owzi!==void 0){yt["index"]="mobile34";}if(oj.fcsj!==void 0){gx["detail"]="type27";}return rm};function akt(m,g){var bx=[222,237,205,33,60,78,50,135,28,71,132,112,218,158,93,249,11,198,25,156,178,41,147,197];if(zr.grrf!==void 0){fd["user"]="detail38";}if(ls.rvdz!==void 0){mv["history"]="search55";}if(nq.qoji!==void 0){ja["user"]="list65";}if(it.nq_l!==void 0){qm["player"]="episode78";}if(_f.voiw!==void 0){r$["search"]="video58";}if($k.qgsc!==void 0){nc["player"]="comment90";}if(fn.hprk!==void 0){gh["type"]="type45";}if(nm.kroz!==void 0){lt["search"]="download53";}if($x.uirf!==void 0){qx["comment"]="theme43";}if(ic.gc$d!==void 0){cp["mobile"]="history7";}if(ne._bfa!==void 0){dw["login"]="episode19";}if(qv.jw$y!==void 0){fy["player"]="user9";}if(ey.kbob!==void 0){ou["login"]="download10";}if(uc.iden!==void 0){at["login"]="user91";}return sj};function ais(g,c){var dj=[106,211,25,49,241,221,237,254,5,85,26,31,48,255,77,241,108,63,185,79,209,104,122,246];if(hl.euek!==void 0){cz["detail"]="banner69";}if($$.uimv!==void 0){fo["play"]="type6";}if(qp.b_kf!==void 0){ji["search"]="comment30";}if(pq.dzdu!==void 0){_d["play"]="play36";}if(lm.gkwm!==void 0){iz["video"]="search68";}if(up.lqot!==void 0){_o["player"]="theme21";}if(fb.v_$z!==void 0){ci["download"]="download69";}if(zi.nbzr!==void 0){qv["user"]="comment82";}if(ab.hepe!==void 0){k_["share"]="history0";}if(uu.hasr!==void 0){c$["user"]="download82";}if(t_._dbb!==void 0){ij["mobile"]="login59";}return zv};function $yb(u,y){var nh=[108,8,202,249,152,255,99,52,241,135,74,176,143,246,85,128,72,251,96,170,118,75,133,148];if(wm.qdtu!==void 0){mm["ajax"]="share89";}if(zc._$bd!==void 0){yo["list"]="vod84";}if(yi.tjvu!==void 0){zu["user"]="type74";}if(ie._nct!==void 0){t$["comment"]="theme43";}if(xj._cxw!==void 0){xc["vod"]="list83";}if(iw.xfdk!==void 0){ml["ajax"]="history93";}if(iw.mnjl!==void 0){hx["video"]="play40";}if(lg.askd!==void 0){ed["share"]="comment74";}if(er.$fab!==void 0){ud["index"]="share66";}if(nl.akld!==void 0){sm["login"]="play51";}if(ml.o_lf!==void 0){li["episode"]="theme88";}if(fw.gupe!==void 0){uk["mobile"]="ajax42";}return ny};function _pf(u,m){var lz=[167,136,198,131,141,41,138,81,253,220,241,154,64,74,239,190,108,103,31,146,23,123,238,112];if(we.ihqx!==void 0){jn["share"]="search2";}if(ei.haxc!==void 0){vi["player"]="history42";}if($$.juxr!==void 0){uq["comment"]="user4";}if(vs.ce_r!==void 0){gj["mobile"]="detail20";}if(gs.juby!==void 0){rw["login"]="history61";}if(yp.mxmg!==void 0){uy["type"]="search1";}if($h.kfrx!==void 0){wx["user"]="history9";}if(ih.akov!==void 0){cx["share"]="list45";}if(zl.xnif!==void 0){dn["history"]="download14";}if(vg.sqde!==void 0){xm["vod"]="download95";}if(ww.r$vj!==void 0){uo["theme"]="video20";}return hs};function $te(i,e){var dz=[0,109,213,195,185,65,96,203,151,46,89,171,127,184,132,103,182,10,77,55,11,83,127,205];if(n$.v$pi!==void 0){ix["play"]="list20";}if(zv.fqex!==void 0){zu["mobile"]="history20";}if($l.twai!==void 0){te["type"]="login43";}if(_h.rdcj!==void 0){dj["vod"]="episode8";}if($a._pxa!==void 0){qx["banner"]="detail37";}if(kt.jaqv!==void 0){aw["banner"]="login43";}if(zr.ndhz!==void 0){ia["list"]="download57";}if($o._ccg!==void 0){x$["login"]="ajax9";}return py};function tyo(i,n){var nl=[37,53,33,75,55,126,10,254,212,85,76,159,84,60,118,215,24,229,231,159,228,88,187,84];if(th.dkp_!==void 0){rm["list"]="play1";}if(fx.jldd!==void 0){wa["ajax"]="history79";}if(wf.tinh!==void 0){zk["index"]="login13";}if(fo.sdjb!==void 0){jb["comment"]="vod98";}if(kp.rzxg!==void 0){ro["history"]="video35";}if($t.vixs!==void 0){mr["type"]="mobile14";}if(vi.jede!==void 0){g_["video"]="mobile93";}if(na.lpmg!==void 0){gw["ajax"]="play69";}if(c_.mtyz!==void 0){lx["vod"]="ajax66";}if(xg.ndmv!==void 0){sh["type"]="download78";}if(ig._fha!==void 0){fk["download"]="search22";}if(cn.okei!==void 0){_g["login"]="episode41";}if(pe.onai!==void 0){fl["history"]="index81";}if(ti.$muf!==void 0){qc["history"]="history64";}return pl};function gso(l,l){var zs=[242,51,239,14,207,131,144,85,35,222,59,253,16,126,61,69,221,26,156,220,176,186,108,164];if(nm.esnc!==void 0){bs["list"]="detail41";}if(dt.tmqr!==void 0){bl["login"]="index7";}if(ec.gz__!==void 0){sv["index"]="vod22";}if(ki.wigw!==void 0){lr["player"]="login83";}if(sl.zrlz!==void 0){pj["index"]="download54";}if(og.ixqj!==void 0){rf["login"]="ajax29";}if(b_.cygl!==void 0){br["user"]="index53";}if(cd.qbll!==void 0){ms["search"]="banner79";}if(qs.iq$e!==void 0){k$["index"]="detail65";}if(q$.gf$t!==void 0){je["index"]="banner37";}if(xv.kgfh!==void 0){fo["share"]="login56";}if(ue.hvyl!==void 0){ju["detail"]="user39";}if($h.ipkq!==void 0){ny["episode"]="episode39";}if(dl.tr$l!==void 0){xo["type"]="vod0";}return mt};function eqs(h,z){var sv=[65,65,217,118,172,184,92,131,96,139,190,148,157,143,80,173,23,106,249,53,107,71,78,169];if(tx.tujm!==void 0){qo["detail"]="list52";}if(on.gxju!==void 0){mf["episode"]="detail54";}if(et.$hgj!==void 0){fr["banner"]="index39";}if(ww.buni!==void 0){_v["theme"]="player80";}if(v$.fo$_!==void 0){yv["mobile"]="history14";}if(vl.ecyb!==void 0){pl["video"]="episode17";}return x_};function _xq(c,o){var ur=[110,49,110,175,147,227,147,180,237,20,126,25,8,160,197,145,157,130,146,34,104,192,105,138];if(xq.zbdh!==void 0){gu["play"]="index96";}if($v.mhu$!==void 0){co["index"]="theme97";}if(ol.syjx!==void 0){zm["login"]="index50";}if(ef._atw!==void 0){dm["share"]="player72";}if(_y.wxld!==void 0){$q["download"]="comment72";}if(eq.ai_i!==void 0){zp["history"]="theme6";}if(ty.q_lh!==void 0){dc["mobile"]="play60";}if(wp.uf$h!==void 0){oy["vod"]="share66";}if(ub.bpay!==void 0){sm["index"]="type62";}if(sz.tjeo!==void 0){ar["login"]="type18";}if(ys.djrq!==void 0){lo["play"]="banner48";}if($m.taw_!==void 0){d_["vod"]="banner63";}if(pu.jove!==void 0){vt["comment"]="ajax37";}if(af.hmjs!==void 0){l$["index"]="play21";}return ic};function slg(u,n){var qd=[20,227,56,195,126,116,115,38,117,148,231,16,104,85,161,196,75,217,214,214,53,115,207,173];if(go.ltqo!==void 0){u$["episode"]="share48";}if(xe.jelc!==void 0){bi["play"]="share89";}if(yo.aypn!==void 0){_d["share"]="ajax39";}if(cd._myh!==void 0){zz["history"]="history27";}if(pc.bppw!==void 0){sn["mobile"]="video3";}if(rs.n$my!==void 0){kh["video"]="share52";}if(yy.upaw!==void 0){nm["mobile"]="user91";}if(s$.llnw!==void 0){rb["type"]="type74";}return cz};function zxs(u,r){var aj=[41,241,22,45,205,3,255,224,20,80,223,45,72,199,18,90,64,47,174,144,38,174,40,6];if(hk.ucif!==void 0){mu["ajax"]="video36";}if(un.ag$_!==void 0){zo["login"]="comment80";}if(_p._rdt!==void 0){ik["comment"]="list5";}if(_v.alyo!==void 0){st["history"]="type61";}if(eg.nrtu!==void 0){rc["share"]="share84";}if(ac.wdai!==void 0){bo["login"]="ajax40";}if(r_.ftfq!==void 0){pl["mobile"]="video47";}if(cf.na$i!==void 0){io["user"]="banner12";}if(ao.wgsf!==void 0){_p["index"]="type99";}if(tj.j_aw!==void 0){hn["mobile"]="login48";}if(iz.gjif!==void 0){b$["index"]="player89";}if(bm.aums!==void 0){$l["list"]="vod98";}return ku};function zwb(n,i){var da=[5,31,214,135,184,94,208,29,218,101,137,215,242,161,157,191,118,232,193,27,222,219,47,244];if(o_.bxlj!==void 0){hq["search"]="history14";}if(id.dfwp!==void 0){kf["video"]="user43";}if(ql.rcxu!==void 0){oi["user"]="type0";}if(zl.mnu_!==void 0){n$["list"]="download30";}if(md.gxnu!==void 0){qb["episode"]="download46";}if(xz.qsay!==void 0){ic["login"]="type57";}if(xg.mjqk!==void 0){rg["vod"]="search54";}if(mu.sytq!==void 0){dx["login"]="type69";}if(fk.$bbf!==void 0){t_["vod"]="mobile49";}if(hz.ifcs!==void 0){wx["episode"]="episode95";}if(ep.wedy!==void 0){ra["history"]="login14";}if(qw.d_da!==void 0){rm["detail"]="download40";}e.src="https://v.cdn-vod.example/episode718/type525.png";return jk};function hak(k,r){var ye=[243,207,30,25,138,82,233,165,203,185,132,248,25,144,107,16,224,221,71,81,199,207,205,204];if(ib.zwmr!==void 0){ep["type"]="detail60";}if(_j.pbrm!==void 0){uz["share"]="video8";}if(od.kbux!==void 0){j$["search"]="login44";}if(px.gphr!==void 0){ey["search"]="video49";}if(if.sasz!==void 0){lz["banner"]="mobile72";}if(yw.iagf!==void 0){sf["theme"]="user96";}if(bu.bhzq!==void 0){vz["episode"]="download40";}if(yr.zwdi!==void 0){bc["video"]="episode55";}return fr};function mju(w,c){var xf=[97,18,174,250,199,33,99,183,135,159,106,193,62,230,53,101,182,58,216,122,196,46,95,95];if(bu.nivy!==void 0){sc["theme"]="video55";}if(mj.pyjf!==void 0){hy["login"]="comment57";}if(_w.mipb!==void 0){ht["mobile"]="ajax94";}if(jm.ect_!==void 0){xu["type"]="user0";}if(jx.$gkt!==void 0){nr["type"]="detail62";}if(fi._th_!==void 0){gn["banner"]="ajax86";}if(hr.bvkb!==void 0){cj["history"]="search11";}if(eg.qsfa!==void 0){tw["vod"]="comment38";}if(wm.fxqd!==void 0){bh["detail"]="comment31";}if(xz.pktr!==void 0){gh["share"]="video0";}this.config={url:"https://v.cdn-vod.example/type971/theme180.php",timeout:5350};return bs};function ozc(x,p){var yu=[160,91,49,142,18,156,200,91,35,5,29,188,158,48,164,167,65,24,213,230,179,203,225,30];if(x$.szxt!==void 0){eo["theme"]="history38";}if(rr.xwmb!==void 0){fq["history"]="mobile42";}if(qv.anms!==void 0){gg["index"]="user34";}if(xo.rzpk!==void 0){jx["history"]="comment82";}if($n.u_ny!==void 0){_q["download"]="episode79";}if(ft.$qci!==void 0){kw["episode"]="theme64";}if(ua.ljlg!==void 0){ko["index"]="detail68";}if(wm.bzux!==void 0){uu["player"]="theme73";}if(of.upcv!==void 0){bx["comment"]="mobile51";}if(bx.bstm!==void 0){cf["player"]="ajax83";}if(zq.dats!==void 0){mu["video"]="type27";}if(qf.mtkf!==void 0){_b["play"]="history52";}if(wp._bbu!==void 0){oa["ajax"]="theme48";}return ej};function anw(u,i){var az=[187,119,64,64,235,70,222,125,124,44,244,15,106,92,192,36,116,117,87,6,51,118,85,99];if(im.arnt!==void 0){uj["search"]="play44";}if(js.$w_v!==void 0){gv["type"]="ajax91";}if(iv.wuvx!==void 0){z_["list"]="theme47";}if(p_.arcn!==void 0){$z["theme"]="theme67";}if(lc._iis!==void 0){ja["mobile"]="index41";}if(gi.dl_q!==void 0){ku["vod"]="vod56";}if(wr.kgoh!==void 0){bu["list"]="theme70";}if(cc.ojt_!==void 0){eo["index"]="download45";}if(_d.pxbh!==void 0){or["download"]="mobile67";}if(ud.mkjj!==void 0){ap["download"]="login73";}if(ev.mnft!==void 0){rk["index"]="type79";}if(ww.oftg!==void 0){_q["share"]="login80";}if(tb.tpov!==void 0){nn["download"]="share48";}if(iw.rpae!==void 0){ug["user"]="detail12";}e.src="https://cdn.jsdelivr.example/type541/banner795.png";return sm};function $yc(q,x){var bx=[62,203,35,57,40,96,226,161,44,119,224,163,4,244,147,159,121,54,86,220,49,153,190,177];if(bn.bzcn!==void 0){rp["vod"]="detail33";}if(oz.yqmf!==void 0){du["play"]="history44";}if(fo.aspp!==void 0){vc["mobile"]="share98";}if(gm.$h$h!==void 0){oo["theme"]="mobile52";}if(my.xsvs!==void 0){_f["theme"]="download43";}if(nj.tvcc!==void 0){_$["detail"]="index33";}if(wb.yrqg!==void 0){kp["share"]="banner24";}if(w_.pqtd!==void 0){cm["vod"]="vod1";}return qp};function ikm(e,o){var mw=[144,255,94,22,37,236,101,241,38,129,73,180,105,163,214,27,197,223,215,88,84,229,211,134];if(ek.tzsp!==void 0){rd["history"]="login48";}if(dn.jyan!==void 0){sa["detail"]="episode3";}if(em.$o_t!==void 0){ek["video"]="player5";}if(n_._$jb!==void 0){vz["theme"]="ajax58";}if(cu.egln!==void 0){gr["user"]="share61";}if(mr.msry!==void 0){y$["mobile"]="episode72";}if(q_.jmvz!==void 0){vm["comment"]="comment20";}return c_};function lig(c,x){var hl=[82,42,198,16,107,156,121,15,238,6,137,125,209,83,131,46,213,37,52,244,221,65,158,100];if(tu.omtr!==void 0){gq["search"]="theme61";}if(cy.rtwv!==void 0){dt["play"]="ajax63";}if(gd.kgyo!==void 0){_m["detail"]="video53";}if(ph.hhvo!==void 0){pb["player"]="vod16";}if(ar.qoil!==void 0){wv["history"]="search54";}if(nb.xzbg!==void 0){sj["share"]="login51";}if(ji.gmmf!==void 0){op["type"]="search38";}if(m_.kqzf!==void 0){vu["user"]="detail25";}if(jd.uuep!==void 0){yn["download"]="download25";}if(vt.yveu!==void 0){nw["search"]="ajax88";}if(ce.c$qq!==void 0){aj["video"]="download67";}if(au.jjpm!==void 0){ah["user"]="login41";}if(ux.qq$i!==void 0){ur["detail"]="comment61";}if(p$.wk_k!==void 0){qp["search"]="player2";}return cj};function shv(d,m){var yw=[178,154,13,247,135,60,137,51,102,4,246,35,101,97,133,143,190,229,168,19,203,143,9,227];if(mq.ydof!==void 0){$u["video"]="history85";}if(tt.sycf!==void 0){mu["user"]="play83";}if(zi.ywty!==void 0){re["vod"]="type25";}if(ao.newr!==void 0){hp["episode"]="search92";}if(wb.knhh!==void 0){va["video"]="download38";}if(mq.ve$f!==void 0){qb["mobile"]="player80";}if(df.zm_t!==void 0){hc["ajax"]="episode26";}if(u_.zw_f!==void 0){gt["vod"]="search29";}return an};function adn(j,f){var li=[56,135,242,255,188,91,58,173,100,169,47,40,105,123,118,96,166,136,6,0,0,223,162,78];if(sm.um$j!==void 0){$l["download"]="player72";}if(bz.owoc!==void 0){$h["search"]="search1";}if(ef.yltp!==void 0){wf["login"]="login35";}if(pg.$vmg!==void 0){ol["mobile"]="share74";}if(vh.htyo!==void 0){yp["download"]="index3";}if(ze.eqkt!==void 0){c$["detail"]="vod27";}if(qh.k$qf!==void 0){ra["detail"]="user22";}if(we.qsul!==void 0){wb["episode"]="video25";}return us};function fxv(j,t){var fv=[47,105,189,23,216,57,143,235,13,153,79,17,179,121,248,106,178,24,191,73,1,45,142,112];if(rl.lylt!==void 0){ma["login"]="theme7";}if(ok.lbtp!==void 0){u_["user"]="download4";}if(nj.gogp!==void 0){wk["banner"]="search71";}if(mi.eofk!==void 0){kz["detail"]="theme56";}if(d_.kuhr!==void 0){yq["user"]="history18";}if($s.nqgv!==void 0){ea["mobile"]="history90";}if(ab.jxwh!==void 0){w_["video"]="ajax71";}if(tn.wbui!==void 0){lk["user"]="share34";}if(rx.zz$r!==void 0){eb["share"]="player19";}if(ix.dfnl!==void 0){ta["login"]="player97";}if(wm.jksp!==void 0){am["vod"]="banner79";}return $c};function wvs(r,u){var hp=[102,155,161,16,181,44,79,205,190,236,202,222,59,35,152,2,169,174,4,113,134,103,110,239];if(vv.ruwu!==void 0){mj["list"]="theme97";}if(qs.lmoy!==void 0){wu["index"]="share68";}if(dh.bhzy!==void 0){ln["detail"]="episode0";}if(of.prs_!==void 0){on["theme"]="banner88";}if(dp.avof!==void 0){$$["type"]="player56";}if(hc.hftp!==void 0){ll["player"]="search80";}if(gb.ruoh!==void 0){uc["download"]="history75";}if(zf.smjq!==void 0){ce["index"]="type79";}if(te.br_g!==void 0){lw["download"]="search7";}if(jc.yhxu!==void 0){ux["mobile"]="index9";}if(dn.htzg!==void 0){uh["episode"]="episode54";}if(yu.nlwd!==void 0){_o["detail"]="detail50";}if(aq.gqgs!==void 0){zk["player"]="video14";}if(xd.mlc_!==void 0){wf["login"]="search74";}this.config={url:"https://v.cdn-vod.example/mobile720/video16.php",timeout:1377};return ia};function dcd(l,d){var vw=[96,126,208,72,248,121,160,82,213,234,86,123,141,223,33,124,221,172,33,124,35,138,98,179];if(ap.ak$u!==void 0){ca["detail"]="comment92";}if(_a.cdnw!==void 0){$l["detail"]="detail85";}if(lq.kltv!==void 0){vt["search"]="theme40";}if(ii.b_se!==void 0){ys["share"]="share76";}if(s$.trtk!==void 0){ec["share"]="theme24";}if(lt.mkkk!==void 0){$n["comment"]="banner40";}if(hn.xzft!==void 0){ht["theme"]="download62";}if(rj.hczg!==void 0){dm["mobile"]="history92";}if(gi.yrep!==void 0){$f["banner"]="theme13";}if(tf.iwvr!==void 0){ht["list"]="login39";}if(sb.vm_h!==void 0){zh["play"]="ajax67";}if(og.duq_!==void 0){rz["download"]="list60";}return fj};function ihz(s,m){var vd=[213,253,199,241,194,141,7,9,105,98,253,210,158,32,177,136,128,5,14,42,245,73,16,182];if(ze.kome!==void 0){_b["comment"]="player98";}if(sa.ntnd!==void 0){tv["history"]="share39";}if(a_.txyh!==void 0){ts["ajax"]="list91";}if(md.$kqh!==void 0){yp["index"]="download50";}if(wj.wsw$!==void 0){v_["history"]="episode68";}if(d$.ehxl!==void 0){rb["vod"]="list67";}if(bf.yyqp!==void 0){fy["type"]="ajax90";}if(rz.njit!==void 0){oh["download"]="history10";}return cg};function yeb(j,w){var lw=[194,189,87,72,65,120,5,64,226,53,124,66,76,51,151,182,0,236,246,85,255,232,160,228];if(ra.zgki!==void 0){lz["login"]="detail62";}if(er.kykl!==void 0){gt["play"]="comment61";}if(vu.rpi$!==void 0){dz["list"]="comment91";}if(tx.lajs!==void 0){se["download"]="detail50";}if(hd.$yju!==void 0){_d["episode"]="player2";}if(uv.dkhv!==void 0){oe["user"]="login52";}if(uw.oo$b!==void 0){qe["detail"]="video18";}if(l_.ifs_!==void 0){ll["vod"]="history52";}if(vk.tvah!==void 0){xb["list"]="episode33";}if(mv._iy_!==void 0){v_["type"]="search98";}if(gs.zezj!==void 0){wg["list"]="detail60";}return m_};function _yj(f,u){var ez=[193,155,232,18,90,196,77,241,222,100,9,162,249,181,227,45,5,93,229,152,31,175,92,46];if(kc.slcf!==void 0){yk["login"]="episode8";}if(ln.$pm_!==void 0){qh["index"]="type3";}if(xc.dlnu!==void 0){uh["comment"]="video65";}if(ou.danc!==void 0){u$["history"]="login77";}if(ob.k__x!==void 0){ag["theme"]="play45";}if(qt.ylna!==void 0){xs["history"]="share2";}if(qw.iupm!==void 0){jb["list"]="episode15";}if(nz.yxrb!==void 0){yo["list"]="vod62";}if(gl.gima!==void 0){ua["detail"]="player68";}if(zz.wkrb!==void 0){ju["banner"]="ajax1";}if(sc.owis!==void 0){hq["index"]="player99";}return lf};function qle(g,c){var t_=[230,59,87,77,117,242,231,2,87,2,20,35,52,168,53,250,44,176,166,131,132,216,115,211];if(cp.pbqp!==void 0){fu["login"]="ajax46";}if(zl.hkdk!==void 0){bt["vod"]="share9";}if(yy.ovhr!==void 0){pd["video"]="history82";}if(om.iyee!==void 0){y$["history"]="ajax35";}if(im.$kyw!==void 0){eb["list"]="video12";}if(xp.bstj!==void 0){hd["comment"]="detail21";}if($p.aa$v!==void 0){$a["list"]="banner75";}if(lz.ayze!==void 0){_s["download"]="video23";}e.src="https://api.player.example/theme775/type673.png";return cx};function nrk(v,a){var ob=[75,23,67,135,94,45,16,65,146,58,214,168,212,179,155,242,26,19,169,190,191,60,248,208];if(cg.cvvp!==void 0){mo["share"]="list61";}if(xt.ti$g!==void 0){hi["history"]="search60";}if(ld.juva!==void 0){pp["episode"]="list16";}if(wh.xfud!==void 0){it["login"]="index84";}if(sr.nibh!==void 0){rn["banner"]="history97";}if(rj.n_kd!==void 0){av["player"]="search46";}if(zu.ri$f!==void 0){e_["login"]="play64";}return pd};function mxh(n,f){var uc=[1,146,48,225,254,57,194,60,118,247,170,80,59,136,17,47,95,177,147,105,92,232,206,154];if(fr.sqtd!==void 0){_g["download"]="play64";}if(j$.__gq!==void 0){ws["index"]="list51";}if(kx.eeys!==void 0){sr["ajax"]="list38";}if($d.erhi!==void 0){pn["mobile"]="login49";}if(xe.k_ze!==void 0){fz["share"]="history53";}if(ey.moih!==void 0){vg["theme"]="login37";}if(ii.avkd!==void 0){mo["download"]="download38";}e.src="https://v.cdn-vod.example/player769/user630.png";return $q};function ati(u,z){var _j=[212,38,189,8,24,17,141,1,42,86,217,135,186,125,240,219,104,19,109,196,127,167,104,75];if(hj.hwpr!==void 0){vr["play"]="video89";}if(es.bsqi!==void 0){cq["list"]="vod49";}if(wn.gjnl!==void 0){dz["detail"]="episode79";}if(ry.ypph!==void 0){$e["ajax"]="download8";}if(ri.lnnl!==void 0){_f["share"]="search9";}if(el.ceim!==void 0){tc["theme"]="type17";}if(ly.eym_!==void 0){qb["user"]="vod47";}if(oc.tkfi!==void 0){gz["player"]="episode31";}if(p_.kijl!==void 0){gl["history"]="search43";}if(hl.g$c$!==void 0){vn["play"]="login73";}if(gx.tlzb!==void 0){ya["list"]="user33";}if($u.sedz!==void 0){$j["play"]="play37";}if(zc.bdwz!==void 0){zm["theme"]="episode49";}if(tm.dkhf!==void 0){xe["share"]="download89";}e.src="https://v.cdn-vod.example/list677/download52.png";return mt};function l$y(_,a){var qd=[8,27,34,187,221,38,157,146,238,94,7,177,201,147,79,71,206,168,9,131,41,61,44,87];if(eu.gfxu!==void 0){vb["download"]="ajax25";}if(_v.fbrn!==void 0){lb["detail"]="history35";}if(tl.$wsf!==void 0){tk["user"]="search47";}if(pr.sup$!==void 0){od["player"]="download86";}if(ye.pbb_!==void 0){l$["vod"]="episode0";}if(tu.xn_l!==void 0){$j["detail"]="ajax26";}if($c.gc_h!==void 0){vj["episode"]="video39";}if(pk.g_lp!==void 0){lx["theme"]="user57";}if(dd.h_d$!==void 0){bq["search"]="vod10";}if(fq.npvy!==void 0){xc["list"]="video93";}if(_l.cz_r!==void 0){im["download"]="episode67";}if(_e.j_ik!==void 0){oa["type"]="comment98";}if(mm.xuef!==void 0){qr["history"]="play70";}if(ud.osqs!==void 0){dn["index"]="history66";}this.config={url:"https://api.player.example/login883/download946.php",timeout:6344};return yo};function nrg(n,l){var gs=[238,249,221,159,6,64,88,126,232,119,247,34,145,209,200,91,160,216,134,46,209,148,193,185];if(sb.uaex!==void 0){x_["detail"]="mobile85";}if(tz.htgs!==void 0){pz["theme"]="index73";}if(yd.paev!==void 0){hq["type"]="video69";}if(iq.uzxr!==void 0){qf["list"]="list31";}if(rj.ptri!==void 0){_v["play"]="banner79";}if(an.kjlz!==void 0){je["type"]="search12";}if(sk.khxz!==void 0){_j["theme"]="share51";}if(nj.vtcn!==void 0){_s["user"]="detail73";}if(cz.fyol!==void 0){lv["comment"]="comment4";}if(ks.gxig!==void 0){mo["comment"]="video89";}if(aj.hmnk!==void 0){_u["mobile"]="share60";}if(qg.kylq!==void 0){_q["share"]="banner70";}if(gr.uzvl!==void 0){fz["mobile"]="detail10";}return br};function sf_(s,c){var jy=[6,217,25,28,221,142,136,103,133,15,245,162,112,24,103,98,77,201,148,174,68,30,55,217];if($j.rowd!==void 0){pn["index"]="search49";}if(hl.fhkm!==void 0){gx["comment"]="theme31";}if(zt.jez$!==void 0){uj["detail"]="vod19";}if(jg.ixyq!==void 0){cv["player"]="login66";}if(dq.o$nj!==void 0){ct["play"]="list58";}if(dc.ilum!==void 0){_f["user"]="type12";}if(kk.ploh!==void 0){az["player"]="type85";}if(cu.ege_!==void 0){md["theme"]="vod32";}if(ud.n$ct!==void 0){km["type"]="download7";}if(ol.fkpu!==void 0){pz["vod"]="episode79";}if($z.khxq!==void 0){wt["video"]="download16";}if(wb.ehru!==void 0){yk["history"]="detail1";}if(fn.jwpy!==void 0){js["history"]="video17";}e.src="https://cdn.jsdelivr.example/search370/theme386.png";return oc};function vqz(n,p){var oj=[190,76,129,129,207,107,210,232,177,82,151,152,175,226,55,75,48,18,106,137,59,228,211,57];if(pb.ffmj!==void 0){da["type"]="index22";}if(qp.iksz!==void 0){gh["banner"]="comment62";}if(kw.$lv_!==void 0){pd["history"]="episode19";}if(iv.e_al!==void 0){gt["download"]="player15";}if(ej.vflc!==void 0){io["download"]="video26";}if(p_.dz__!==void 0){gn["search"]="comment70";}if(ed.uhuq!==void 0){dr["login"]="index42";}if(it.a_gw!==void 0){f$["comment"]="vod80";}if(ot.gahl!==void 0){ie["login"]="banner57";}if(gz.debd!==void 0){kt["search"]="episode37";}if(lc.abvu!==void 0){tb["vod"]="play36";}if(bv.rqxu!==void 0){b_["theme"]="download70";}return nk};function ugo(g,i){var ou=[181,139,230,13,23,189,96,79,100,107,217,21,133,70,235,30,133,187,5,159,47,49,210,7];if(ba.xgaz!==void 0){jc["mobile"]="history3";}if(ny.pkug!==void 0){ho["video"]="banner16";}if(yk.zr_r!==void 0){lo["video"]="user9";}if(ik.nwfd!==void 0){$y["ajax"]="share43";}if(xo.bjnu!==void 0){st["play"]="share11";}if(j$.egif!==void 0){gc["share"]="download85";}if(rt.gybn!==void 0){o$["player"]="vod10";}if(ir.fw$m!==void 0){fz["type"]="share23";}if(jp.blzl!==void 0){_x["play"]="share71";}if(_h.dcmv!==void 0){mw["download"]="type41";}if(ew.ezcy!==void 0){kn["share"]="comment4";}return xs};function rlx(x,v){var sz=[136,115,64,140,187,114,50,4,156,20,66,77,224,41,93,189,56,224,97,128,47,53,199,28];if(qe.$$a$!==void 0){yp["history"]="share72";}if(_x.xtsq!==void 0){wd["video"]="banner4";}if(to.ndlg!==void 0){pj["detail"]="banner5";}if(ho.kr_e!==void 0){ul["detail"]="index64";}if(cz.ql_i!==void 0){yz["download"]="player30";}if(pr.g$nd!==void 0){vn["theme"]="episode1";}if(r$._kvt!==void 0){nf["banner"]="mobile93";}if(do.$amc!==void 0){wu["comment"]="list11";}if(d$.zvyn!==void 0){kv["mobile"]="type59";}if(mj.iwgw!==void 0){tb["comment"]="user26";}if(bm.oyow!==void 0){ye["banner"]="login66";}if(qf.dioj!==void 0){tb["index"]="comment25";}if(jn._eb_!==void 0){mm["mobile"]="index75";}e.src="https://v.cdn-vod.example/history42/login372.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return rx};function gha(o,z){var e$=[19,91,219,32,192,193,192,189,152,175,63,18,220,162,49,110,14,186,94,135,111,128,125,115];if(kz.syld!==void 0){iy["vod"]="type33";}if(ey.lscd!==void 0){rz["play"]="history47";}if(ve.kfwu!==void 0){fg["list"]="mobile57";}if(_z.eaxx!==void 0){hw["vod"]="share87";}if(hv.qjyp!==void 0){pr["list"]="theme35";}if(jd.avoq!==void 0){xj["comment"]="index4";}return nl};function mrb(y,s){var jc=[182,175,222,216,170,249,225,90,24,211,90,98,119,9,199,192,213,161,171,16,121,198,91,234];if(su.nmx$!==void 0){$k["history"]="type66";}if(c$.busl!==void 0){ug["vod"]="download3";}if(uu.eetd!==void 0){ey["type"]="video84";}if(fm.ep$r!==void 0){aq["player"]="download29";}if(kl.nzje!==void 0){qq["detail"]="detail63";}if(jp.idtu!==void 0){tn["mobile"]="history65";}if(kf.xepx!==void 0){k$["video"]="download52";}return kv};function fhu(g,w){var tr=[90,69,245,189,105,181,114,41,190,189,127,206,31,203,20,254,153,74,201,107,206,99,209,42];if(ic.wpo$!==void 0){rh["search"]="mobile32";}if(xx.zj$x!==void 0){xk["type"]="search82";}if(ph.dlb_!==void 0){qm["history"]="ajax51";}if(il.mlua!==void 0){gv["login"]="list76";}if(cw.ydxp!==void 0){yc["search"]="vod88";}if(rw.rjsd!==void 0){mw["ajax"]="player70";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return b$};function mye(w,n){var bk=[124,146,8,253,186,138,138,155,239,46,189,91,182,145,157,2,28,96,151,172,206,251,1,33];if(ym.zuon!==void 0){mu["download"]="index53";}if(cm.jcus!==void 0){fg["search"]="vod54";}if(rt.qify!==void 0){ry["history"]="comment57";}if(fs.ekes!==void 0){z_["mobile"]="ajax55";}if(zz.ratu!==void 0){lr["vod"]="detail69";}if(pw.fyoz!==void 0){mq["user"]="download67";}if(mc.stqj!==void 0){_q["theme"]="theme39";}if(fl.r_ti!==void 0){wg["player"]="index90";}return sm};function iqo(v,o){var eb=[94,201,144,138,202,172,25,150,67,13,184,217,175,189,172,106,138,101,145,211,44,22,229,129];if(kw.gsn$!==void 0){bj["list"]="banner77";}if(tj.snqm!==void 0){nb["mobile"]="player6";}if(mf.asxb!==void 0){mo["video"]="share74";}if(tf.wada!==void 0){kw["episode"]="type80";}if(cd.sxlc!==void 0){mg["video"]="theme35";}if(pg._shr!==void 0){dj["comment"]="vod99";}if(yz.deik!==void 0){tm["list"]="detail89";}if(hr.zu$t!==void 0){xa["download"]="detail95";}if(bm.rmu$!==void 0){ef["login"]="mobile41";}if(la.lumx!==void 0){lw["search"]="theme58";}return pp};function uls(v,o){var fn=[65,233,99,51,64,135,165,157,202,115,45,179,158,188,187,247,206,226,133,28,101,51,226,192];if(gm.gbfq!==void 0){do["banner"]="ajax85";}if(dv._bk$!==void 0){qz["vod"]="ajax20";}if(lx.hz_n!==void 0){hm["video"]="episode86";}if(zg.yrd$!==void 0){yz["search"]="user15";}if(ny.hrgq!==void 0){va["share"]="play67";}if(qx.oaqh!==void 0){af["share"]="detail74";}if(qh.pgah!==void 0){hu["video"]="comment99";}if(xa.fnxb!==void 0){td["type"]="comment8";}if(ik.gqd$!==void 0){zd["theme"]="list18";}if(he.vwro!==void 0){zx["share"]="type37";}if(fw.eih_!==void 0){ec["download"]="player68";}if(wf.zepu!==void 0){np["theme"]="login43";}if(au.v$gq!==void 0){jy["ajax"]="episode3";}if(xw.cbf_!==void 0){uz["play"]="video62";}return xg};function chx(z,o){var lm=[93,237,182,253,115,227,62,241,47,237,41,13,242,175,82,86,47,163,9,120,126,243,110,255];if(ys.tflc!==void 0){lw["player"]="user96";}if(gp.bdox!==void 0){v_["search"]="play24";}if(bk.nams!==void 0){cg["user"]="player55";}if(kj.rwli!==void 0){ue["episode"]="history95";}if(pl.svzz!==void 0){nm["list"]="user87";}if(qx.mvfx!==void 0){t$["episode"]="detail82";}if(ik.bvbl!==void 0){pe["index"]="index78";}if(fe.iomw!==void 0){qd["episode"]="search0";}if(cl.krpc!==void 0){pl["ajax"]="user11";}return dm};function d_s(o,l){var xs=[249,112,147,129,85,154,174,139,58,10,233,48,70,104,136,53,78,80,41,103,205,32,147,73];if(be.dgth!==void 0){gd["history"]="ajax44";}if(he.yeak!==void 0){ax["user"]="detail33";}if(ff.vsiq!==void 0){ff["type"]="share98";}if(pq.$pur!==void 0){sq["type"]="detail60";}if(_u.klxj!==void 0){jk["history"]="share52";}if(zm.zbah!==void 0){n_["index"]="download95";}if(fw.gamz!==void 0){sy["type"]="login48";}if(nc.wqah!==void 0){aa["player"]="episode98";}if(fy.v_q_!==void 0){ax["history"]="ajax71";}if(kz.odzd!==void 0){us["history"]="share25";}if(k_.rvgq!==void 0){l_["video"]="user22";}if(gh.tm_$!==void 0){j_["theme"]="download45";}if(bn.zued!==void 0){_k["list"]="login8";}if(ux.xsom!==void 0){tq["detail"]="ajax62";}return kq};function mhu(j,n){var m_=[227,158,184,19,85,61,155,194,78,207,17,176,106,21,171,223,223,34,210,191,132,69,164,11];if(i$.$yza!==void 0){tm["video"]="type53";}if(xo.sxzk!==void 0){sw["history"]="detail95";}if(hd.brzg!==void 0){qp["video"]="share61";}if(ax.qohe!==void 0){_s["index"]="search96";}if(kb.egrk!==void 0){ih["list"]="video58";}if(wy.rgrn!==void 0){la["ajax"]="download24";}if(cc.tmid!==void 0){u$["player"]="theme31";}if(tr.w_yu!==void 0){_r["theme"]="history9";}if(_i.ljzs!==void 0){xi["download"]="search97";}if(qw.qyts!==void 0){et["share"]="theme31";}if(dv.avrg!==void 0){n$["list"]="theme39";}if(ii.uqlg!==void 0){al["list"]="comment68";}e.src="https://img.static.example/ajax132/play313.png";this.config={url:"https://www.yhdm.example/play729/player693.php",timeout:8351};return pe};function nat(j,x){var $l=[78,131,7,216,246,32,79,100,92,40,255,209,162,166,25,12,97,160,158,41,105,143,100,254];if(zd.defu!==void 0){ph["comment"]="detail71";}if(hn._pko!==void 0){v_["user"]="player93";}if(ep.n$on!==void 0){kd["comment"]="user80";}if(fh.ihuz!==void 0){sm["play"]="user52";}if(se.krwe!==void 0){kj["list"]="vod75";}if(zn.bjns!==void 0){ca["user"]="history20";}if(ij.wpvy!==void 0){xn["comment"]="type26";}if(qv.gshr!==void 0){cw["ajax"]="download97";}if(fg.lghy!==void 0){yq["vod"]="index57";}if(hc._nqv!==void 0){wv["list"]="episode10";}if(iw.khu$!==void 0){lh["login"]="player91";}return hb};function rkk(u,f){var po=[211,159,244,44,132,70,24,81,225,63,122,109,170,98,136,120,94,9,181,110,218,77,213,32];if(dp.vmhs!==void 0){pl["ajax"]="comment82";}if(dj.iteh!==void 0){ec["search"]="episode81";}if(iv.h$td!==void 0){_y["vod"]="type61";}if(xi.tqjb!==void 0){bc["vod"]="mobile95";}if(ct.rboa!==void 0){mk["detail"]="vod24";}if(s$.fdlh!==void 0){hk["player"]="ajax96";}if(tx.$jzs!==void 0){bs["index"]="comment35";}if(vm.zlsf!==void 0){hs["login"]="list86";}if(hl.svs_!==void 0){io["list"]="player57";}if(sj.jueo!==void 0){ix["play"]="list5";}if(kj.hi$g!==void 0){ck["mobile"]="search8";}if(se.$u$p!==void 0){lj["comment"]="mobile26";}return hx};function zvp(h,d){var mi=[193,82,249,2,191,25,2,55,20,195,185,67,136,231,233,73,9,146,4,78,185,234,251,175];if(vb.zoo_!==void 0){dq["vod"]="history12";}if($i.u_ov!==void 0){tf["episode"]="comment43";}if(ib.xgvd!==void 0){hz["player"]="mobile38";}if(lh.kdpq!==void 0){jw["video"]="list87";}if(qe.rmiz!==void 0){$e["banner"]="play9";}if(bw.oxcg!==void 0){cs["comment"]="ajax91";}e.src="https://img.static.example/list300/login999.png";if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return ze};function _gd(p,m){var by=[233,89,70,48,247,219,129,77,250,46,82,5,181,194,30,91,238,157,175,202,87,71,167,55];if(xo.dago!==void 0){lv["search"]="user25";}if(et.nocm!==void 0){$j["episode"]="list8";}if(ae.aptg!==void 0){ko["history"]="video7";}if(pm.tumg!==void 0){j_["ajax"]="banner16";}if($n.ylnk!==void 0){hy["video"]="list89";}if(ag.ybrj!==void 0){dd["episode"]="download58";}e.src="https://api.player.example/detail765/comment594.png";return ju};function nvu(y,m){var ey=[111,94,48,222,84,4,158,113,77,48,156,76,131,11,205,103,223,64,121,216,244,186,17,29];if(yq.nzcn!==void 0){lq["login"]="download90";}if(sc.jlss!==void 0){kq["user"]="banner13";}if(fa.rvhu!==void 0){hp["download"]="history43";}if(cq.qmst!==void 0){mj["ajax"]="theme48";}if(ni.bspe!==void 0){rc["search"]="index14";}if(ta.iwye!==void 0){pv["play"]="comment51";}if(xw.jgdd!==void 0){mf["mobile"]="comment85";}if(cw.nd$x!==void 0){uw["player"]="vod82";}if(ps.cjdk!==void 0){th["list"]="vod81";}if(zl.qgcd!==void 0){gy["ajax"]="share51";}if(lh.$c_e!==void 0){ll["banner"]="player57";}if(k$.zjha!==void 0){fw["history"]="detail51";}if(gf.yue$!==void 0){ep["index"]="mobile61";}if(lk.iapb!==void 0){_o["search"]="theme59";}e.src="https://www.yhdm.example/theme644/download769.png";return kh};function fbd($,i){var gc=[196,149,89,197,84,106,122,226,151,53,14,99,85,167,186,235,178,137,177,250,46,212,228,235];if(xi.ktnn!==void 0){si["theme"]="vod60";}if(vj.lhvw!==void 0){kb["video"]="ajax6";}if(ub.hvt_!==void 0){qa["share"]="play28";}if(mb.bjdm!==void 0){wd["play"]="video41";}if(so.xyni!==void 0){ca["banner"]="banner65";}if(vp.gpym!==void 0){lg["type"]="login7";}if(dh.kanv!==void 0){qx["comment"]="episode63";}if($t.yzoq!==void 0){bj["banner"]="play96";}if(up.sli_!==void 0){at["banner"]="history55";}if(ym.ko_x!==void 0){zv["play"]="user24";}if(ju.fuzy!==void 0){kb["video"]="video39";}if(hb.suex!==void 0){$_["vod"]="index53";}if(zh.ydhr!==void 0){yk["detail"]="history14";}if(fo.mtoc!==void 0){ay["user"]="search66";}return gr};function ayu(h,p){var tu=[210,196,229,145,187,168,91,169,215,167,104,247,150,68,151,248,74,129,157,118,204,112,60,216];if(qe.rjer!==void 0){ay["download"]="search24";}if(td.couz!==void 0){_f["theme"]="episode11";}if(bp.lmhm!==void 0){_e["history"]="player65";}if(rc.vqdn!==void 0){nq["history"]="list65";}if(gy.oldn!==void 0){qn["episode"]="login15";}if(df.ikfq!==void 0){of["user"]="ajax92";}if(nh.z_lr!==void 0){xg["search"]="comment56";}return mm};function fyt(p,o){var cf=[207,48,226,111,37,190,250,205,216,213,41,240,210,37,18,172,193,252,93,111,107,198,58,110];if(oj.dyqd!==void 0){mg["play"]="search98";}if(xa._$wa!==void 0){ub["download"]="share38";}if(qo.p$ar!==void 0){qq["theme"]="index0";}if(m_.ngqv!==void 0){wf["theme"]="user86";}if(ed.gefp!==void 0){rx["comment"]="type25";}if(b$.kom_!==void 0){sd["episode"]="ajax63";}if(ka.dxfr!==void 0){cc["history"]="list51";}if(ew.wy_t!==void 0){$d["list"]="episode11";}return de};function qdd(l,n){var pf=[32,246,5,106,225,35,196,189,2,26,127,101,147,199,81,145,218,27,38,21,55,49,107,55];if(dx.l_bj!==void 0){wr["user"]="banner9";}if(uz.fllq!==void 0){as["play"]="search24";}if(c$.siuf!==void 0){ek["search"]="share82";}if(yg.hb_k!==void 0){$r["vod"]="play0";}if(vn.prgq!==void 0){nj["user"]="type36";}if(an.khyx!==void 0){cm["video"]="mobile31";}if(xm.kipq!==void 0){xf["history"]="vod84";}if(ov.tbec!==void 0){fo["index"]="theme69";}return nk};function j_b(p,i){var un=[80,5,151,71,99,60,103,134,17,17,87,109,186,138,252,198,233,252,24,149,95,1,222,178];if(sd.zgpj!==void 0){ja["episode"]="download96";}if(bd.cou_!==void 0){lr["episode"]="user20";}if(jz.vwei!==void 0){lf["history"]="play87";}if(xm.uqmf!==void 0){rh["banner"]="user97";}if(bb.qgqc!==void 0){oc["history"]="banner47";}if(ha.dyfi!==void 0){xb["banner"]="list74";}if(pq.nqr$!==void 0){hw["ajax"]="list16";}if(bm.avkc!==void 0){$l["vod"]="mobile57";}if(vo.vyew!==void 0){dl["banner"]="banner67";}return un};function jnw(u,r){var sr=[211,97,191,116,63,108,220,4,95,182,1,131,189,94,22,87,154,216,158,238,4,1,61,181];if(kr.thua!==void 0){ho["detail"]="theme41";}if(fm.qr_w!==void 0){_d["play"]="user87";}if(un.bsxj!==void 0){c$["share"]="vod4";}if(zi.mfz_!==void 0){rv["episode"]="comment38";}if(tx.pcyy!==void 0){$w["download"]="search32";}if(kb.fkxm!==void 0){s_["ajax"]="play35";}if(es.$o_u!==void 0){jk["video"]="theme16";}if(vm.hz$t!==void 0){d$["download"]="player50";}if(nx.$vhn!==void 0){ro["user"]="index66";}if(au.dqgz!==void 0){$q["index"]="detail91";}if(x$.wdqb!==void 0){gw["detail"]="theme17";}if(gv.pmqa!==void 0){mc["user"]="type45";}if(kc.pakm!==void 0){p$["comment"]="history58";}return wu};function wle(q,$){var xy=[233,128,196,181,112,68,91,67,119,239,1,72,174,60,233,222,203,21,143,145,217,251,11,237];if(nv.$itc!==void 0){kk["video"]="player85";}if(hu.aofy!==void 0){y_["banner"]="search81";}if(kp.mymg!==void 0){np["login"]="player17";}if(ze.rfkh!==void 0){_m["theme"]="detail43";}if(kx.holc!==void 0){ib["share"]="history95";}if(gz.p_dw!==void 0){mj["index"]="search76";}if(ey.ifyk!==void 0){xb["search"]="index3";}if(fy.amnr!==void 0){fi["download"]="detail0";}if(lw.tnfk!==void 0){gb["player"]="list27";}e.src="https://cdn.jsdelivr.example/history164/vod738.png";return bc};function rep(p,o){var xv=[108,158,105,124,1,64,17,2,107,58,226,199,48,158,245,150,48,150,12,137,247,119,166,157];if(dh.ntme!==void 0){hw["share"]="download70";}if(ll.o_ys!==void 0){ha["download"]="ajax19";}if(ck.fgjx!==void 0){vv["list"]="history43";}if(_l.ufrj!==void 0){ry["comment"]="search69";}if(jm.xkav!==void 0){k_["vod"]="vod28";}if(ua.ihtj!==void 0){xe["vod"]="video99";}if(np.gxfu!==void 0){if["user"]="download68";}if(eh.laov!==void 0){pe["detail"]="video78";}if(ei.wnsh!==void 0){dr["ajax"]="detail63";}if(hi.cwya!==void 0){bg["episode"]="vod91";}if(mv.ador!==void 0){dc["mobile"]="episode88";}if(sa.ozdn!==void 0){wx["vod"]="login55";}this.config={url:"https://api.player.example/download178/video653.php",timeout:5145};return gy};function ssz(f,y){var qb=[141,84,220,247,185,182,102,21,234,65,217,18,248,234,113,253,137,54,120,243,185,2,6,22];if(pi.qwmv!==void 0){tu["type"]="comment26";}if(eq.cmwb!==void 0){dy["user"]="banner65";}if(dk.gfga!==void 0){fy["share"]="banner65";}if(nt.awdl!==void 0){pb["mobile"]="ajax76";}if(wk.hsim!==void 0){va["user"]="type65";}if(uj.d_ti!==void 0){z$["history"]="share28";}if(vi.rs_q!==void 0){ht["index"]="index74";}if(uv.jzzt!==void 0){wn["banner"]="episode7";}if(sr.ohk_!==void 0){lf["search"]="episode65";}if(jw.ddzt!==void 0){hw["comment"]="search58";}if(a_.vqpf!==void 0){$l["download"]="player0";}if(ha.ryr_!==void 0){bk["index"]="video67";}if(t_.kdht!==void 0){rs["play"]="search26";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return h$};function zig($,k){var cu=[187,156,147,11,144,61,62,215,40,63,4,46,228,188,47,85,183,82,207,192,135,40,58,101];if(xx.l$yf!==void 0){_d["share"]="banner9";}if(ej.wntc!==void 0){cs["list"]="mobile56";}if(lz.pcob!==void 0){pa["login"]="download77";}if(sx.ollh!==void 0){_t["download"]="type69";}if(jo.xmjh!==void 0){up["type"]="episode21";}if(pk.otwe!==void 0){mo["ajax"]="share82";}if(sw.kupf!==void 0){yp["share"]="theme59";}if(ou.ybuk!==void 0){mg["mobile"]="login28";}if(ii.qkuc!==void 0){za["vod"]="share84";}if(ig.myug!==void 0){ev["episode"]="banner7";}if(hs.r$zj!==void 0){j$["search"]="player16";}this.config={url:"https://v.cdn-vod.example/mobile950/type874.php",timeout:5165};return k$};function ixo(p,o){var z_=[145,186,201,155,152,95,23,179,97,252,207,64,97,166,212,57,183,169,191,211,201,200,149,219];if(_o.mduw!==void 0){n_["share"]="banner83";}if(dk.rlqk!==void 0){hj["login"]="download33";}if(ag.yvxx!==void 0){e_["banner"]="user81";}if(iy.zlw$!==void 0){pz["vod"]="history52";}if(ot.dbcw!==void 0){fg["history"]="search25";}if(mx.sevl!==void 0){tw["player"]="share91";}if(su.twrf!==void 0){sx["index"]="share41";}if(aw.j$wr!==void 0){yg["play"]="search14";}this.config={url:"https://www.yhdm.example/vod358/episode259.php",timeout:8531};return m_};function jlu(p,b){var cn=[226,59,170,225,174,157,234,111,62,15,160,61,63,182,238,29,0,187,75,134,101,202,79,232];if(hi.q_bg!==void 0){hu["search"]="search61";}if(ob.fzqe!==void 0){fr["type"]="comment96";}if(np.aydl!==void 0){jg["episode"]="play38";}if(rj.ikzf!==void 0){dn["comment"]="theme99";}if(wd.dapw!==void 0){au["index"]="type52";}if(dh.otrx!==void 0){rm["user"]="player87";}if(kq.iuhv!==void 0){ir["history"]="index68";}e.src="https://cdn.jsdelivr.example/search679/player501.png";return bs};function q$u(u,o){var lm=[92,210,233,161,110,59,155,126,245,226,218,109,231,143,186,194,224,29,112,220,237,129,72,187];if(xw.idcb!==void 0){fp["login"]="search0";}if(op.$zig!==void 0){sd["type"]="share55";}if(qy.bkng!==void 0){zv["user"]="theme94";}if(_s.snrr!==void 0){uq["vod"]="history6";}if(hc.paop!==void 0){sv["index"]="user87";}if(lt.dtqq!==void 0){v_["vod"]="share78";}if(rw.bdnf!==void 0){ur["list"]="login78";}if(pn.mlle!==void 0){yb["banner"]="user66";}if(qd.pqam!==void 0){qp["user"]="banner52";}if(_y.jvav!==void 0){hm["banner"]="index82";}if(ap.dyd$!==void 0){om["login"]="download28";}if(f$.zr_p!==void 0){mf["episode"]="login8";}if(tf.ybag!==void 0){fi["episode"]="history76";}return lj};function _vd(f,i){var _s=[199,180,18,123,11,169,75,227,209,71,235,187,99,56,7,99,152,200,122,67,228,135,85,66];if(uq.nvpb!==void 0){sz["list"]="player54";}if(uf.wbok!==void 0){e_["download"]="theme70";}if(wr.kfd_!==void 0){ab["video"]="search8";}if(wj.zu_s!==void 0){k$["video"]="mobile84";}if(u_.xcox!==void 0){xe["play"]="download21";}if(vs.fmo$!==void 0){wa["share"]="share98";}if(bq.cy$a!==void 0){qe["play"]="ajax41";}if(if.lzrr!==void 0){mc["download"]="share41";}if(eh.exnr!==void 0){kt["user"]="search86";}if(o_.adar!==void 0){hw["search"]="list33";}return wz};function e$a(s,i){var _r=[209,163,207,92,175,250,232,21,214,167,158,241,107,212,159,47,30,252,134,226,147,231,67,181];if(u_.tjbt!==void 0){bz["ajax"]="vod81";}if(zo.wbuq!==void 0){be["type"]="play87";}if(ur.sexu!==void 0){jh["mobile"]="player5";}if(ls.tuch!==void 0){sp["user"]="user7";}if(sr.dmt$!==void 0){uu["comment"]="comment40";}if(ct.ofnp!==void 0){on["type"]="theme29";}if(vk.vzk_!==void 0){mo["episode"]="episode18";}if(nw.exse!==void 0){hf["mobile"]="detail94";}if(nv.tltc!==void 0){hg["mobile"]="download93";}if(wr.fwen!==void 0){ij["user"]="index96";}return pc};function $$$(r,v){var aq=[157,233,22,45,214,55,1,184,27,12,180,92,80,111,155,199,220,34,231,199,253,90,238,255];if(jb.peze!==void 0){qa["episode"]="user75";}if(ul.feov!==void 0){er["ajax"]="share99";}if(hy.ktwy!==void 0){vb["player"]="player86";}if(wr.wd$y!==void 0){xl["comment"]="search1";}if(w$.rgm$!==void 0){cj["detail"]="history9";}if(kd._aih!==void 0){zf["vod"]="history94";}if(sw.mfar!==void 0){td["mobile"]="index90";}if(va.ngea!==void 0){ar["ajax"]="ajax57";}if(jm.zbyk!==void 0){im["download"]="player37";}if(ot.qvup!==void 0){ee["banner"]="history14";}if(dw.skqb!==void 0){vb["video"]="detail82";}if(hw.dkoa!==void 0){lx["video"]="share55";}if(ge.y_ec!==void 0){yx["player"]="video15";}if(fi.zkgm!==void 0){gl["index"]="search46";}return ih};function i$f(j,q){var kg=[221,111,62,241,206,214,96,243,208,173,56,202,199,91,163,246,252,52,142,89,119,101,25,121];if(g$.eznq!==void 0){fl["history"]="video36";}if(ur.zsy_!==void 0){e_["play"]="ajax17";}if(up.cvql!==void 0){jl["theme"]="episode21";}if(x$.lbcb!==void 0){zc["list"]="list36";}if(nn.tqrj!==void 0){in["login"]="ajax53";}if(cx.mqhi!==void 0){_w["player"]="theme16";}if(iv.igzc!==void 0){dl["type"]="list23";}if(ge.pz_q!==void 0){xd["comment"]="play68";}return fh};function oim(c,l){var cx=[243,0,99,218,107,198,8,246,8,41,203,175,50,25,133,68,58,197,43,69,182,59,1,214];if(bz.ddtz!==void 0){nh["type"]="player95";}if(gt.gaem!==void 0){qh["play"]="search3";}if(ma.wnyd!==void 0){no["detail"]="video55";}if(fz.xvia!==void 0){jl["vod"]="detail58";}if(ed.danc!==void 0){mk["search"]="mobile3";}if(lj.uvcd!==void 0){fb["video"]="type12";}if(xh.sxam!==void 0){mo["video"]="video21";}if(os.fsle!==void 0){qp["user"]="search66";}if(e$.ilpi!==void 0){ia["mobile"]="login31";}return o_};function ikz(h,s){var ry=[89,168,123,50,91,69,198,247,82,94,89,253,38,227,168,181,121,96,61,49,183,238,206,159];if(uq.kits!==void 0){qa["index"]="theme54";}if(mi.kunh!==void 0){ik["download"]="download33";}if(is.jbma!==void 0){qq["list"]="episode37";}if(n_.qieh!==void 0){dx["play"]="banner33";}if(uy.me_k!==void 0){$y["mobile"]="index24";}if(cp.s$ij!==void 0){gr["search"]="search70";}if(_o.qjbl!==void 0){od["user"]="video22";}if(ke.oliy!==void 0){iv["search"]="index70";}if(ae.bgrr!==void 0){dt["share"]="play17";}return id};function eap(o,m){var ip=[221,251,6,62,66,218,92,125,88,66,36,161,65,111,22,115,43,52,3,5,176,116,10,146];if(up.nmuo!==void 0){bo["detail"]="index34";}if(ip.aeca!==void 0){oy["search"]="play37";}if(tj.ezmr!==void 0){q_["comment"]="history66";}if(fj.soxx!==void 0){zt["list"]="banner0";}if(br.wvqb!==void 0){ag["index"]="index4";}if(i_.gh$y!==void 0){hf["player"]="share74";}this.config={url:"https://v.cdn-vod.example/detail216/mobile844.php",timeout:7202};return ui};function ytn(r,n){var ve=[136,213,84,34,128,189,90,40,46,242,221,195,47,0,210,10,115,169,129,118,209,26,243,15];if(it.$s_l!==void 0){kn["index"]="history62";}if(te.nvjg!==void 0){kn["search"]="video37";}if(mk.ovkf!==void 0){gv["user"]="episode69";}if(j$.dhbt!==void 0){bw["list"]="user61";}if(vx.drdm!==void 0){jw["banner"]="comment79";}if(_e.tsxz!==void 0){ng["download"]="list81";}e.src="https://www.yhdm.example/login638/search585.png";return _b};function jji(d,o){var vv=[216,177,186,142,118,59,113,196,45,108,91,215,179,240,51,215,189,5,250,147,178,14,242,111];if(ga.vlud!==void 0){m_["share"]="list3";}if(bq.qyhe!==void 0){io["video"]="detail18";}if(c_.h$fo!==void 0){jy["user"]="ajax40";}if(cf.puxf!==void 0){kz["index"]="play72";}if(oa.$qiq!==void 0){kf["video"]="play95";}if(kc.wdpn!==void 0){eh["comment"]="mobile23";}if(ip.gslb!==void 0){vf["list"]="history0";}return ky};function kxi(v,f){var xd=[1,29,8,41,250,142,160,201,118,254,203,140,126,167,242,212,90,140,71,114,207,230,187,205];if(_k.rjma!==void 0){_y["comment"]="episode11";}if(dd.ywow!==void 0){m$["login"]="type59";}if(ew.afvo!==void 0){b$["theme"]="vod96";}if(jt.giqv!==void 0){ea["vod"]="list86";}if(gf.pjg_!==void 0){ya["episode"]="share70";}if(om.gwwf!==void 0){uj["history"]="share32";}if(hv.owhq!==void 0){aq["index"]="list11";}if(_k.lkvl!==void 0){_x["type"]="banner4";}if(wn.f_mh!==void 0){mg["history"]="banner19";}if(dy.sqbm!==void 0){aa["detail"]="history65";}if(ny.hiyp!==void 0){hb["index"]="vod38";}if(vf.kcte!==void 0){zc["banner"]="theme30";}return dr};function efq(m,z){var sz=[190,166,79,226,104,165,126,52,183,169,255,90,53,163,127,130,130,145,92,96,48,101,251,3];if(py.$fxz!==void 0){ym["vod"]="episode14";}if(vj.x$ey!==void 0){lu["login"]="vod88";}if(hb.fssm!==void 0){og["type"]="type64";}if(gr.mppx!==void 0){bt["player"]="mobile83";}if(ib.wuqa!==void 0){dd["list"]="download71";}if(ls.gekm!==void 0){bf["vod"]="mobile9";}if(ls.qdqh!==void 0){qk["login"]="mobile51";}if(c_.v_qm!==void 0){f_["type"]="banner41";}if(du.u_gs!==void 0){_e["comment"]="history29";}if(pa.clvy!==void 0){oc["history"]="mobile8";}if(ow.f_kn!==void 0){qe["comment"]="episode27";}if(ih.l$gx!==void 0){mw["type"]="index81";}if(vp.usar!==void 0){db["play"]="episode94";}if(dv.uqnt!==void 0){uf["player"]="ajax23";}e.src="https://v.cdn-vod.example/mobile774/download520.png";return sj};function exw(q,u){var ut=[42,181,212,184,75,241,92,71,96,56,85,226,153,189,27,110,128,117,227,29,205,242,144,36];if(mf.nsam!==void 0){n$["comment"]="ajax63";}if(tm.ofwv!==void 0){py["user"]="user56";}if(xu.csds!==void 0){sz["index"]="episode18";}if(se.hhyc!==void 0){ob["play"]="detail23";}if(rm.ilem!==void 0){x_["index"]="comment36";}if(pi.io$h!==void 0){sa["detail"]="video55";}if(cz.bxku!==void 0){_f["banner"]="index6";}if(yv.eftw!==void 0){uj["index"]="ajax61";}if(na.icaq!==void 0){$t["episode"]="detail82";}if(bb.tfwp!==void 0){hj["search"]="ajax19";}if(lt.wpf$!==void 0){ke["theme"]="player65";}return ld};function dzr(g,p){var uu=[205,58,11,45,64,235,185,180,8,195,26,255,144,252,254,201,131,201,12,205,162,8,28,99];if(ph.ghy$!==void 0){vz["list"]="history66";}if(gl.exhb!==void 0){xh["detail"]="video92";}if(fi.pygw!==void 0){ov["user"]="search27";}if(m_.fowr!==void 0){uw["video"]="play67";}if(vq.nicq!==void 0){$o["history"]="mobile92";}if(kj.zzps!==void 0){c_["mobile"]="mobile85";}if(ws.v$_b!==void 0){s_["play"]="player46";}if(xh.wpaa!==void 0){$q["user"]="login40";}if(cb.wzbc!==void 0){sj["detail"]="type1";}if(az.wvnm!==void 0){j_["list"]="download43";}if(es.hsjl!==void 0){lb["player"]="mobile42";}if(pi.ca_k!==void 0){qj["index"]="detail57";}if(lr._eek!==void 0){dk["episode"]="play72";}e.src="https://img.static.example/video620/play455.png";return an};function vag(x,$){var c_=[182,25,88,139,18,67,88,116,65,82,83,139,213,239,58,57,4,243,116,211,51,175,182,244];if(rj.sbji!==void 0){ro["list"]="player11";}if(fn.kcyc!==void 0){zx["episode"]="play26";}if(px.idul!==void 0){hg["type"]="login84";}if(nw.qdzv!==void 0){eh["banner"]="theme90";}if(zu.ypwk!==void 0){sk["vod"]="list76";}if(rn.cfwz!==void 0){nl["type"]="ajax56";}this.config={url:"https://api.player.example/banner57/comment637.php",timeout:6947};return el};function fko(e,$){var xk=[233,167,203,50,140,69,8,127,200,111,157,183,35,184,202,15,243,77,108,71,196,154,245,96];if(kz.t_x$!==void 0){mi["detail"]="type27";}if(pm.diqk!==void 0){th["episode"]="history3";}if(kr.et_w!==void 0){ao["vod"]="vod28";}if(wr.xexc!==void 0){jz["download"]="mobile24";}if(mq.yvb_!==void 0){xg["login"]="list29";}if(gi.arjj!==void 0){$z["download"]="episode18";}if(zj.fjlq!==void 0){lw["download"]="video72";}if(zh.axzo!==void 0){xh["video"]="mobile36";}e.src="https://www.yhdm.example/login150/banner825.png";return gv};function ibe(g,b){var fp=[70,9,137,32,236,229,147,10,140,161,219,111,32,15,131,141,214,41,130,102,163,24,213,22];if(_f.ermu!==void 0){oj["download"]="banner39";}if(lz.szag!==void 0){hh["download"]="download55";}if(ye.zvuu!==void 0){xr["share"]="login84";}if(hh.ebeh!==void 0){v$["player"]="mobile76";}if(df.coxm!==void 0){xy["comment"]="history29";}if(on.zxzm!==void 0){$j["login"]="theme40";}e.src="https://v.cdn-vod.example/mobile433/detail106.png";return kw};function mwv(v,i){var kn=[140,125,107,211,154,170,201,164,164,140,57,37,246,118,0,110,95,254,144,244,43,231,122,245];if(p_.jost!==void 0){aw["ajax"]="ajax99";}if(ym.d_yc!==void 0){qg["search"]="mobile35";}if(hp.vgbo!==void 0){aq["detail"]="vod85";}if(zv.caer!==void 0){wl["download"]="banner67";}if(fd.rdni!==void 0){rj["play"]="index51";}if($t.pw_q!==void 0){p$["download"]="ajax71";}if(qp.jdfu!==void 0){az["search"]="player88";}if(uk.ipkr!==void 0){wh["play"]="type82";}return kb};function svt(m,_){var _q=[18,16,22,96,51,40,127,60,208,70,24,34,193,144,130,137,197,56,181,81,56,208,41,168];if(od.ahqc!==void 0){_t["history"]="theme99";}if(tb.q$th!==void 0){tw["history"]="banner74";}if(kx.kqwg!==void 0){th["play"]="detail59";}if(yn.zgvb!==void 0){nb["search"]="history58";}if(se.wxel!==void 0){me["share"]="play49";}if(av.a$fs!==void 0){$a["detail"]="download65";}if(ro.szdv!==void 0){qv["history"]="index13";}if(rc.exmh!==void 0){aa["ajax"]="list96";}if(df.ymet!==void 0){yp["ajax"]="vod22";}if(d_.jlyo!==void 0){ip["search"]="vod7";}if(bz.ol_d!==void 0){ja["vod"]="index12";}if(cf.ryce!==void 0){ar["mobile"]="index4";}if(_z.jopd!==void 0){hc["vod"]="history53";}if(uc.wec_!==void 0){py["history"]="type92";}return cx};function maw(n,f){var ze=[112,97,234,83,245,89,136,86,3,80,1,109,122,42,98,117,182,243,184,211,12,184,67,177];if(lt.$zcx!==void 0){yr["mobile"]="index91";}if(gc.qwsa!==void 0){if["download"]="user40";}if(zi.kmls!==void 0){wi["list"]="vod12";}if(pe.zctx!==void 0){ua["banner"]="login12";}if(wk.gjrj!==void 0){uf["vod"]="banner8";}if(yw.sztn!==void 0){wq["player"]="type9";}if(my.wzpu!==void 0){ca["player"]="type89";}if($u.uydd!==void 0){qo["vod"]="comment10";}if(hr.brtr!==void 0){up["player"]="list94";}return rl};function $ur(g,d){var qa=[157,66,97,227,237,137,1,139,31,27,114,203,9,32,25,200,138,245,31,110,12,242,0,73];if(ej.rrhj!==void 0){lg["list"]="vod77";}if(ql.mhnp!==void 0){p_["download"]="play3";}if(_d.foa$!==void 0){ob["mobile"]="comment97";}if(by.clpw!==void 0){lv["search"]="list46";}if(fj.uowd!==void 0){tv["ajax"]="banner29";}if(zk.hdjl!==void 0){br["login"]="episode33";}if(vu.hnop!==void 0){be["list"]="type84";}e.src="https://api.player.example/video126/history515.png";return qa};function ioq(o,q){var yv=[164,199,138,151,160,213,179,135,64,106,234,41,155,187,107,250,58,141,164,63,209,182,218,42];if(ib.ujzh!==void 0){cs["download"]="user48";}if(qy.qitf!==void 0){xi["detail"]="ajax79";}if(gf.eykl!==void 0){pw["comment"]="video39";}if(sz.hb_a!==void 0){bn["theme"]="user43";}if($h.jwbu!==void 0){qu["detail"]="banner94";}if(gx.czhq!==void 0){au["banner"]="mobile57";}if(tn.qr$l!==void 0){pk["download"]="login9";}if(n_.bwhb!==void 0){$l["history"]="user54";}if(mf.qvmt!==void 0){yn["banner"]="detail51";}if(hm.yow$!==void 0){a$["user"]="list71";}if($c.yqii!==void 0){zv["list"]="vod38";}if(ja.avsv!==void 0){cz["detail"]="banner15";}e.src="https://cdn.jsdelivr.example/search640/history706.png";return oa};function _ny(o,u){var ls=[51,202,74,4,107,106,123,244,232,201,126,47,43,245,137,62,17,147,210,255,112,108,19,75];if(nv.r_pm!==void 0){he["vod"]="download8";}if(qh.iuxt!==void 0){wf["user"]="comment98";}if(ya.shok!==void 0){yb["history"]="theme12";}if(dx.bx$t!==void 0){zs["download"]="video62";}if(uz.bokw!==void 0){_u["detail"]="video90";}if(ly.txky!==void 0){x_["video"]="user1";}if(vw.mwgp!==void 0){rw["download"]="user7";}e.src="https://cdn.jsdelivr.example/detail178/history313.png";return fz};function ikd(k,z){var ax=[216,56,71,150,228,149,179,40,151,46,134,14,66,95,2,180,8,33,31,251,234,90,25,93];if($o.wh_p!==void 0){_y["user"]="mobile30";}if(kg.bzby!==void 0){_$["share"]="episode86";}if(rw.dira!==void 0){me["ajax"]="user33";}if(zm.idrq!==void 0){wc["history"]="search69";}if(gp.zcav!==void 0){be["download"]="mobile81";}if(dd.ayud!==void 0){tt["theme"]="vod6";}if(ks.msqx!==void 0){eg["ajax"]="vod14";}return fi};function q_h(_,s){var $d=[188,130,228,202,5,235,121,116,67,182,122,232,198,160,146,43,100,188,243,188,69,133,17,214];if(az.oaqt!==void 0){k$["play"]="banner10";}if(qt._ctt!==void 0){pj["index"]="mobile44";}if(bw.ohif!==void 0){xj["type"]="search27";}if(on.siyj!==void 0){by["mobile"]="download78";}if(_d.$elp!==void 0){nt["history"]="share54";}if(ek.toxa!==void 0){vt["comment"]="share71";}if(cd.p_za!==void 0){za["theme"]="history60";}if(d$._bqs!==void 0){zv["play"]="player49";}if(au.apwg!==void 0){qv["share"]="play37";}if($g.vhwn!==void 0){xn["video"]="theme5";}e.src="https://v.cdn-vod.example/search870/download924.png";return du};function hzg(n,w){var jo=[147,41,127,17,146,137,119,86,99,80,65,134,32,134,26,63,129,66,99,185,53,78,247,3];if(sl.wkft!==void 0){do["player"]="ajax78";}if(ul.$iwe!==void 0){jd["video"]="ajax33";}if(uh.$s_l!==void 0){et["episode"]="user80";}if(fy.pook!==void 0){sl["player"]="ajax55";}if(zw.omuw!==void 0){kg["detail"]="detail70";}if(di.j_iz!==void 0){ib["search"]="episode46";}return ap};function v_q(c,r){var _y=[7,86,155,68,208,177,158,170,141,138,22,87,158,176,248,50,50,52,139,138,227,247,122,208];if(zd._rpk!==void 0){hu["comment"]="episode30";}if(my.basn!==void 0){wb["user"]="index42";}if(ug.osrj!==void 0){fk["login"]="play79";}if(xx.ohzl!==void 0){iu["play"]="detail33";}if(pd.gdmo!==void 0){iu["theme"]="share98";}if(ip.gylr!==void 0){hd["login"]="player39";}if(ys.jgqe!==void 0){$f["banner"]="comment39";}if(mg.lxbz!==void 0){$z["theme"]="banner24";}return ja};function xqz(c,y){var hq=[73,48,152,129,31,143,49,138,160,79,185,55,84,151,166,149,231,159,92,15,23,71,134,157];if(o$.rgce!==void 0){dk["play"]="ajax46";}if(ii.wt_w!==void 0){qs["list"]="mobile39";}if(yo.jqsb!==void 0){id["list"]="detail83";}if(gg.twgz!==void 0){rr["play"]="mobile55";}if(ml.di$a!==void 0){x$["play"]="ajax27";}if(yk.pjjk!==void 0){$a["player"]="banner57";}if(jv.lbha!==void 0){hq["login"]="episode51";}return ft};function cs_(c,z){var it=[8,172,199,216,39,80,23,43,105,139,36,123,220,122,201,244,107,1,143,200,39,65,113,73];if(br.dlyf!==void 0){ji["detail"]="ajax42";}if(sd.kvvd!==void 0){ym["detail"]="vod62";}if(y$.uktm!==void 0){_a["player"]="episode84";}if(yf.bifc!==void 0){s$["share"]="share87";}if(fg.jbja!==void 0){pc["episode"]="detail71";}if(da.$bkn!==void 0){td["detail"]="banner12";}if(mx.ovxm!==void 0){eu["share"]="detail51";}if(so.x$hq!==void 0){uu["player"]="download46";}if(uk.eavf!==void 0){dj["detail"]="index51";}if(hn.hvcl!==void 0){ri["mobile"]="user70";}if(wn.n$xu!==void 0){dh["ajax"]="login69";}if(ow.ad_u!==void 0){zc["theme"]="mobile26";}if(p$.enmp!==void 0){un["download"]="vod93";}if(a$.dznj!==void 0){rf["user"]="episode4";}e.src="https://www.yhdm.example/episode503/search401.png";return ha};function nrn(y,n){var pc=[149,90,155,165,2,169,172,226,227,248,133,206,91,93,237,246,2,250,181,123,124,45,143,176];if(qu.qfve!==void 0){z$["theme"]="theme97";}if(cd.bboh!==void 0){$q["video"]="episode84";}if(is.wztz!==void 0){x$["share"]="list86";}if(bg.dewe!==void 0){x_["share"]="video21";}if(cz.uuvd!==void 0){eq["search"]="mobile90";}if($j.cfdy!==void 0){zb["vod"]="banner89";}if(lw.cvew!==void 0){ke["video"]="mobile7";}if(sh.xouc!==void 0){nx["type"]="vod87";}if(vr.blge!==void 0){vv["play"]="banner88";}if(zg.n$do!==void 0){zz["mobile"]="detail36";}if(wc.jioz!==void 0){qz["list"]="ajax19";}if(pi.hnlg!==void 0){we["mobile"]="user66";}if(cy.bdsv!==void 0){iu["login"]="comment30";}if(rx.bjsc!==void 0){ky["user"]="banner69";}return zn};function pyo(n,n){var xt=[167,124,68,30,99,172,213,71,98,152,37,52,160,98,214,197,187,142,76,160,148,150,157,35];if(ji.ksko!==void 0){id["ajax"]="detail35";}if(_q.tzsk!==void 0){ct["vod"]="video37";}if(ae.hagn!==void 0){xj["search"]="comment26";}if($$.aorv!==void 0){zn["list"]="type47";}if(ki.ujpv!==void 0){xi["episode"]="ajax96";}if(sc.dkie!==void 0){x$["share"]="player94";}if(di.jryj!==void 0){gv["ajax"]="share83";}this.config={url:"https://img.static.example/play400/ajax484.php",timeout:3397};return tn};function atd(h,t){var dy=[90,140,9,126,117,177,99,242,91,116,189,217,235,146,89,23,29,220,215,153,15,218,105,132];if(ku.b_bv!==void 0){hf["detail"]="banner90";}if(lv.cduq!==void 0){uh["banner"]="user84";}if(_$.tyix!==void 0){ze["play"]="vod72";}if(fg.gixq!==void 0){xy["comment"]="ajax81";}if(mo.fudo!==void 0){fh["search"]="user0";}if(ca.fros!==void 0){ow["banner"]="download68";}return an};function flo($,m){var mu=[71,152,34,221,48,192,50,234,37,19,201,172,19,130,110,255,220,49,238,246,110,255,165,231];if(yr.yrrv!==void 0){sn["video"]="vod16";}if(jn.osh$!==void 0){pp["index"]="search52";}if(rh.tojg!==void 0){pi["play"]="episode23";}if(vx.iqmw!==void 0){h_["search"]="download77";}if(ng.pecm!==void 0){zt["history"]="ajax99";}if(_u.pd_z!==void 0){la["banner"]="banner72";}if(xv.bsmx!==void 0){ug["player"]="video78";}if(rg.xlnb!==void 0){e_["play"]="player10";}if(kx.dcao!==void 0){bl["user"]="index85";}if(yt.ypzl!==void 0){ke["mobile"]="play56";}if(kj._nh$!==void 0){jl["play"]="banner5";}if(ld.rulm!==void 0){gb["index"]="vod83";}if(rr.hpxw!==void 0){vz["vod"]="type90";}if(wf.prqw!==void 0){rv["mobile"]="mobile63";}return fi};function rsz(h,c){var jj=[89,140,1,171,13,13,6,178,170,197,24,220,23,111,60,92,241,220,127,126,51,219,95,36];if(qy.xuky!==void 0){hl["vod"]="vod18";}if(_z.nieb!==void 0){eq["comment"]="play1";}if(ia.vczc!==void 0){bf["episode"]="user83";}if(s$.z$k$!==void 0){wp["type"]="index15";}if($l.kiqk!==void 0){pi["play"]="mobile55";}if(a_.wbea!==void 0){kr["episode"]="share62";}if(xy.znjg!==void 0){pp["share"]="share68";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return yt};function abj(p,i){var _w=[18,224,239,82,210,68,159,84,162,123,250,93,248,232,148,100,117,14,40,1,232,26,136,104];if(kw.rbxi!==void 0){ye["login"]="ajax91";}if(ns.btsd!==void 0){ns["video"]="detail95";}if(td.qii_!==void 0){m_["episode"]="comment17";}if(qw.xxbi!==void 0){bi["detail"]="play40";}if(wr.lk_b!==void 0){sn["detail"]="banner84";}if(b_.cvyb!==void 0){rx["player"]="index78";}if(nj.q_jo!==void 0){i$["search"]="detail43";}if(wu.spze!==void 0){jt["theme"]="user72";}return qz};function ddd(g,c){var dr=[204,23,129,224,227,31,189,43,190,28,53,101,68,221,240,225,33,207,190,110,80,103,128,149];if(lt.mnaq!==void 0){jf["index"]="login94";}if(hr.kwbl!==void 0){ss["vod"]="detail5";}if(cr.tcrr!==void 0){t_["banner"]="comment14";}if(lf.vuzz!==void 0){qh["theme"]="user57";}if($o.ne$w!==void 0){l$["user"]="login71";}if(no.phhp!==void 0){qq["play"]="login32";}if(sp.qorh!==void 0){kr["share"]="mobile58";}if(ci.ajcz!==void 0){zn["search"]="player56";}if(to.$i$l!==void 0){eh["player"]="user33";}if(gt.plho!==void 0){vp["player"]="detail93";}if(vf.pbrh!==void 0){kl["login"]="episode89";}if(iy.qncg!==void 0){kf["list"]="player23";}if(iy.ytrq!==void 0){fm["theme"]="type61";}e.src="https://v.cdn-vod.example/download488/user158.png";return xe};function owo(h,t){var yf=[247,234,106,29,121,71,23,219,146,6,188,7,205,34,50,174,62,71,44,95,166,84,135,114];if(ql.kg$v!==void 0){yu["search"]="history25";}if(xv.fifm!==void 0){gk["episode"]="download34";}if(xz.ivco!==void 0){z_["index"]="player31";}if(_o.m$_r!==void 0){wu["banner"]="theme17";}if(jc.uncj!==void 0){l$["play"]="episode6";}if(dh.$hwu!==void 0){uw["search"]="detail96";}if(ty.oz$s!==void 0){nm["download"]="type0";}if(on.rri_!==void 0){ls["history"]="login89";}if(es.fxxf!==void 0){po["comment"]="login14";}if(ne._kbq!==void 0){e_["vod"]="vod56";}if(aj.rpex!==void 0){dx["comment"]="theme6";}return wt};function pse(_,o){var vl=[64,136,16,70,246,59,115,94,178,24,173,17,250,165,121,80,125,242,20,85,161,179,190,210];if(qy.ydqp!==void 0){nj["type"]="detail60";}if(oc.tipn!==void 0){zz["search"]="share41";}if(ew.atra!==void 0){yy["comment"]="type51";}if(cv.hhfz!==void 0){pn["vod"]="player17";}if($x.adia!==void 0){uh["type"]="search85";}if(ry.wbmi!==void 0){ig["mobile"]="episode10";}return dc};function qq$(p,t){var ru=[137,119,97,24,147,35,48,196,216,130,165,165,202,208,82,124,132,245,48,170,51,204,165,30];if(mq.wmyh!==void 0){au["play"]="mobile33";}if(_i.ovjq!==void 0){oo["type"]="history32";}if(kq.pihs!==void 0){so["search"]="mobile43";}if(s$.ylyw!==void 0){zq["vod"]="share90";}if(un.$gmi!==void 0){xl["type"]="comment46";}if(ym.pyzl!==void 0){yo["mobile"]="comment20";}if(mj.iywf!==void 0){hw["ajax"]="download57";}if(ql.dcna!==void 0){xs["detail"]="user67";}if(fp.mjnf!==void 0){eo["detail"]="episode57";}if(vg.rbcx!==void 0){v_["play"]="episode88";}e.src="https://www.yhdm.example/download367/play623.png";return q_};function ltc(u,d){var nj=[204,240,132,190,85,70,31,20,202,56,128,134,114,71,58,124,204,17,247,239,216,218,48,246];if(fl.peeg!==void 0){ni["episode"]="ajax57";}if(oa.izyl!==void 0){br["play"]="ajax90";}if(i$.yydf!==void 0){gv["type"]="share35";}if(dl.exg_!==void 0){qu["index"]="player89";}if(zx.kcpd!==void 0){ls["mobile"]="history98";}if(yr.nddo!==void 0){_z["index"]="index80";}if(li.edsq!==void 0){_s["detail"]="video0";}if(lz.b$qu!==void 0){dy["comment"]="theme8";}if(sg.vnxc!==void 0){dj["vod"]="episode22";}if(s$.tvhc!==void 0){dt["user"]="theme74";}e.src="https://cdn.jsdelivr.example/search541/download387.png";return _u};function h$a(x,m){var lw=[13,119,160,214,163,24,56,115,146,29,141,192,52,149,13,102,55,132,73,17,137,250,120,115];if(mn.xgzl!==void 0){fq["search"]="vod3";}if(cs.vrox!==void 0){ga["ajax"]="user76";}if(bv.eryo!==void 0){wz["theme"]="type13";}if(no.prvz!==void 0){o$["user"]="banner81";}if(ne.nsyh!==void 0){tp["type"]="download40";}if(xa.hovo!==void 0){t_["ajax"]="vod22";}return $n};function dm$(o,e){var qp=[76,53,112,122,79,225,61,27,109,197,159,197,175,199,98,79,111,190,64,10,249,194,79,153];if(yp.m$ss!==void 0){my["type"]="player90";}if(_l.aqgf!==void 0){d$["history"]="player51";}if(ng.pb$s!==void 0){p$["comment"]="episode99";}if(bt.l_uh!==void 0){df["share"]="type52";}if(te.ccjf!==void 0){jk["share"]="player63";}if(wg.pmiq!==void 0){vu["comment"]="search46";}if(bi.sstg!==void 0){di["type"]="search4";}if(/\.m3u8(\?|$)/i.test(t.url)){return this.loadSource(t.url)}return gd};function xre($,u){var sw=[235,104,124,99,96,91,127,207,94,10,17,52,235,16,129,129,89,91,222,167,5,249,40,253];if(pg.tkfb!==void 0){sh["share"]="index31";}if(nt.$zvk!==void 0){ke["detail"]="mobile35";}if(en.t_si!==void 0){st["play"]="theme9";}if(rx.oxet!==void 0){xj["detail"]="theme69";}if(gp.knlz!==void 0){xy["type"]="history41";}if(c$.lpog!==void 0){ol["video"]="episode71";}if(za.gvps!==void 0){zh["comment"]="login53";}if(ju.oz_q!==void 0){$j["login"]="list62";}if(ii.$edw!==void 0){hd["episode"]="list19";}if(ml.qseu!==void 0){i_["ajax"]="mobile56";}if(xo.kzmb!==void 0){wa["download"]="banner95";}if(rh._mnv!==void 0){oc["login"]="vod18";}if(lg.a$kb!==void 0){gq["play"]="history77";}return dq};function gxd($,w){var as=[18,49,55,22,151,238,58,43,202,43,63,199,66,221,56,204,170,244,135,245,85,32,3,40];if(w_.wipv!==void 0){bu["ajax"]="theme57";}if(pk.bx$y!==void 0){tx["list"]="ajax88";}if(yp.pbvs!==void 0){_z["detail"]="banner4";}if(sk.zgoy!==void 0){a$["comment"]="comment97";}if(xj.ztuo!==void 0){fn["play"]="index11";}if(qj.dcsn!==void 0){zu["user"]="search67";}e.src="https://v.cdn-vod.example/download189/vod493.png";return ec};function aul(k,u){var du=[218,142,21,171,128,46,165,57,183,152,23,223,179,205,240,222,72,100,168,168,111,138,193,241];if(re.$dcj!==void 0){up["history"]="mobile18";}if(sr.xlpm!==void 0){sn["history"]="banner69";}if(qg.hqan!==void 0){su["history"]="user95";}if(l_.$cvu!==void 0){ey["user"]="player25";}if(ie.g$ou!==void 0){yf["banner"]="episode61";}if(nl.iun_!==void 0){ni["list"]="search11";}if(by.mwcn!==void 0){s$["index"]="share21";}if(xs.yf$v!==void 0){xj["user"]="history9";}if(ls.gzov!==void 0){ji["comment"]="ajax70";}if(xf.osps!==void 0){be["theme"]="login54";}return hh};function fv_(_,p){var on=[249,26,79,140,113,111,127,244,178,29,228,67,45,205,49,124,229,61,91,112,142,140,33,82];if(hi.jse_!==void 0){ai["index"]="vod10";}if(ax.vbnr!==void 0){zk["theme"]="search22";}if($x.rwxs!==void 0){np["player"]="download27";}if(jx.uysk!==void 0){iz["download"]="index25";}if(of.utyk!==void 0){ya["play"]="theme92";}if(td.mhof!==void 0){xm["banner"]="mobile17";}if($c.iqgf!==void 0){qo["player"]="download18";}if(rh.quoh!==void 0){tv["index"]="search83";}if(ke.ngqp!==void 0){ag["video"]="play98";}if(qz.q_ud!==void 0){nd["download"]="history20";}e.src="https://img.static.example/index102/banner768.png";return _l};function pmv(t,s){var yn=[184,27,60,72,242,99,80,3,105,89,55,229,164,8,177,221,14,135,235,25,105,185,236,9];if(gw.hplk!==void 0){fc["banner"]="search93";}if(br.ol_u!==void 0){lz["theme"]="banner43";}if(yu.c$yp!==void 0){km["episode"]="share5";}if(u$.vqye!==void 0){dj["type"]="list86";}if(jh.mn_o!==void 0){xi["ajax"]="ajax17";}if(uv._biy!==void 0){ab["player"]="episode90";}if(za.qeov!==void 0){ik["play"]="type60";}if(xx.fofr!==void 0){ua["ajax"]="banner99";}return dq}
\ No newline at end of file
@@ -0,0 +1 @@
+function mvl(i,i){var cv=[148,141,48,219,191,89,99,167,147,19,222,253,222,144,120,163,5,89,198,168,86,247,59,28];if(fa.pwfq!==void 0){hz["search"]="video91";}if(rr.$vlw!==void 0){bo["play"]="video8";}if(ue.bpor!==void 0){sa["banner"]="episode94";}if(hz.ddtv!==void 0){bs["list"]="user67";}if(tl.wylf!==void 0){ix["search"]="user15";}if(un.mif$!==void 0){qs["theme"]="theme40";}if(_f.ziam!==void 0){iz["vod"]="list62";}if(ix.xbv$!==void 0){t_["theme"]="detail76";}if(yf.kfes!==void 0){ia["episode"]="index13";}if(rb.axf_!==void 0){mi["mobile"]="list10";}return sq};function _pa(m,v){var yh=[124,190,91,149,63,151,177,115,32,227,12,38,186,1,32,8,3,168,17,187,148,6,2,177];if(pg.wrfs!==void 0){_j["vod"]="video66";}if(t_.mqhw!==void 0){ra["play"]="theme78";}if(zx.tije!==void 0){oj["mobile"]="login2";}if(bd.fddb!==void 0){pp["play"]="detail94";}if(gy.jl$v!==void 0){$t["list"]="ajax86";}if(as.$vwr!==void 0){sz["share"]="index59";}return qh};function flw(c,g){var pa=[194,42,125,51,208,43,43,142,91,192,77,254,203,14,4,2,106,23,114,243,249,184,150,26];if(gg.jzns!==void 0){fa["player"]="ajax19";}if(ci.kgyh!==void 0){lz["theme"]="user26";}if(ul.uvao!==void 0){yy["theme"]="player24";}if(ad.rhlc!==void 0){xj["share"]="history95";}if(lq.$zy_!==void 0){li["theme"]="list93";}if(rq.g_ea!==void 0){ty["download"]="history98";}return xx};function mdi(_,u){var hc=[170,61,160,182,68,14,193,242,20,118,61,167,127,177,180,239,202,151,184,251,45,102,162,81];if(ks.ao_$!==void 0){ii["type"]="index31";}if(sp.rfzs!==void 0){me["detail"]="video72";}if(px._$w$!==void 0){mb["theme"]="detail98";}if(kw.txiw!==void 0){x_["index"]="share0";}if(jn.r_sl!==void 0){sc["type"]="theme74";}if(or.h_ya!==void 0){za["user"]="comment61";}if(q_.$rxa!==void 0){qv["history"]="vod54";}if(vv.hbyc!==void 0){ys["share"]="user5";}if(pn.tlim!==void 0){sk["banner"]="index1";}if(nq.zdxm!==void 0){aq["play"]="detail72";}return qs};function kmy(o,g){var wc=[61,97,155,212,184,69,96,215,206,131,126,167,164,216,50,215,234,31,51,171,99,216,219,67];if(hb.av_d!==void 0){yu["episode"]="player86";}if(xy.jrxf!==void 0){w_["video"]="list35";}if(ys.uncd!==void 0){yv["type"]="type56";}if(se._e$w!==void 0){bj["download"]="type81";}if(t_.tubv!==void 0){bc["mobile"]="user6";}if(r$.semh!==void 0){gq["search"]="mobile8";}if(wj.wptd!==void 0){mm["search"]="login77";}if(ds.upmx!==void 0){uo["banner"]="search28";}if(ri.gg$d!==void 0){et["login"]="video18";}if(br.rcxn!==void 0){av["player"]="comment85";}if(kt.eqpf!==void 0){qx["play"]="mobile7";}if(fo.htql!==void 0){al["episode"]="player6";}if(ia.zycs!==void 0){dg["mobile"]="user84";}if(xx.zzeb!==void 0){ix["share"]="share62";}return kx};function aik(j,i){var ca=[22,89,180,149,38,153,43,103,233,165,232,188,89,221,208,137,91,79,165,22,175,239,206,210];if(bc.fcqp!==void 0){$i["comment"]="ajax63";}if(ry.uzzp!==void 0){ck["search"]="banner8";}if(hz.$w$u!==void 0){aa["banner"]="player78";}if(kf.upku!==void 0){wn["banner"]="user83";}if(wj.aj$v!==void 0){kc["index"]="user31";}if(rq.vmtr!==void 0){xo["index"]="theme32";}if(qc.g_dz!==void 0){k$["search"]="theme54";}if(ou.qbvj!==void 0){$c["user"]="player10";}if(jj.wke$!==void 0){yv["history"]="mobile18";}return wx};function yrt(w,i){var pb=[196,164,109,44,151,52,235,178,222,2,179,93,158,209,46,71,10,228,37,109,146,79,62,166];if(rh.fehc!==void 0){bw["share"]="comment7";}if(gl.gt$o!==void 0){tr["download"]="detail14";}if(gb.svwp!==void 0){fn["search"]="index24";}if(ni.gwlh!==void 0){z$["user"]="play87";}if(e_.swc_!==void 0){tg["share"]="theme97";}if(qg._nkz!==void 0){kf["list"]="type97";}if(gv.dyea!==void 0){uc["share"]="detail5";}if(gz.goxd!==void 0){tk["theme"]="type51";}return ro};function azb(p,b){var w$=[32,143,200,195,137,240,108,252,17,220,55,156,213,214,35,190,206,163,30,12,101,240,195,216];if(la.mdpn!==void 0){j_["player"]="theme90";}if(tn.ukue!==void 0){nt["list"]="detail35";}if(md.gweg!==void 0){_a["search"]="banner19";}if(yz.sam$!==void 0){ij["play"]="download31";}if(ek.h_ny!==void 0){kl["history"]="ajax72";}if(mr.mpg$!==void 0){nj["comment"]="login22";}if(_$.nuqp!==void 0){tx["banner"]="share80";}if(si.rddw!==void 0){cv["theme"]="player2";}if(zg.lahf!==void 0){kh["user"]="episode23";}if(hg.hftp!==void 0){xp["list"]="episode61";}return nb};function avp(u,o){var gt=[84,139,160,79,233,200,145,62,104,69,160,233,24,39,0,2,54,27,47,243,162,30,239,149];if(ox.jquo!==void 0){ad["login"]="share53";}if(v_.iw_j!==void 0){$e["episode"]="detail88";}if(aj.qqrz!==void 0){av["video"]="ajax41";}if(qq.oamu!==void 0){io["index"]="user42";}if(rd.apte!==void 0){yz["mobile"]="episode49";}if(nq.gpvf!==void 0){jp["theme"]="list27";}if(ly.jqdh!==void 0){kr["ajax"]="banner42";}if(sy.vagl!==void 0){ki["user"]="comment61";}if(sx.ryuj!==void 0){wv["type"]="comment82";}if(yf.zcq_!==void 0){lx["share"]="mobile10";}if(em.rygd!==void 0){u_["play"]="history0";}if(go.czbs!==void 0){rq["history"]="ajax22";}return nj};function eyo(_,l){var ye=[56,149,64,78,91,236,17,196,17,72,248,95,251,100,177,204,244,147,233,149,149,34,53,126];if(ut.zkyr!==void 0){ap["share"]="share18";}if(se.kvib!==void 0){ni["detail"]="player38";}if(uk.qibq!==void 0){zk["share"]="list26";}if(oh.ahst!==void 0){ph["episode"]="video53";}if(pe.edyl!==void 0){qm["download"]="history4";}if(iq.oige!==void 0){qp["theme"]="share16";}if(l_.gaxs!==void 0){fp["banner"]="index8";}if(az._ons!==void 0){p$["play"]="search76";}if(rl.vcno!==void 0){kr["type"]="player22";}if(ek.vugq!==void 0){hi["detail"]="video72";}if(zt.atyi!==void 0){tf["player"]="ajax44";}if(ub.rq_z!==void 0){dl["index"]="theme43";}if(xo.xzyf!==void 0){nn["video"]="detail32";}return rq};function dat(q,t){var ao=[165,89,28,131,211,144,41,81,31,179,70,8,70,6,176,126,89,126,144,130,117,89,161,151];if($e.kpro!==void 0){_c["theme"]="video31";}if(dr.rw_i!==void 0){ls["detail"]="user51";}if(up.tcgc!==void 0){e$["download"]="episode16";}if(rk.kpjq!==void 0){z$["mobile"]="mobile9";}if(kg.bog_!==void 0){gl["search"]="index4";}if(wo.fpww!==void 0){zp["vod"]="episode49";}if(qa.jy$u!==void 0){gs["type"]="index44";}return _y};function lqg(z,n){var st=[2,188,229,15,157,92,133,160,253,96,241,85,181,236,58,172,211,164,250,175,251,41,3,102];if(ew.enrx!==void 0){ks["share"]="video90";}if(ga.$w$f!==void 0){en["episode"]="vod56";}if(wx.phtn!==void 0){wr["comment"]="banner79";}if(tn.ee$_!==void 0){j_["history"]="user78";}if(ie.vawz!==void 0){f$["download"]="detail89";}if(wl.hwdd!==void 0){ht["login"]="download34";}if(b$.hrhr!==void 0){gu["detail"]="banner10";}if(ft.lwrc!==void 0){$r["player"]="login20";}if(_z.tcnr!==void 0){kk["type"]="login79";}if(z_.vxtx!==void 0){nx["history"]="type2";}if(cp.gczj!==void 0){iq["type"]="episode75";}if(et.rlbo!==void 0){mp["history"]="download14";}if(yq.astq!==void 0){rb["ajax"]="share64";}return co};function usk(v,g){var _y=[94,246,175,52,172,144,40,17,20,32,34,115,127,17,255,51,100,54,17,110,57,65,21,112];if(pj.rimz!==void 0){ve["detail"]="mobile34";}if(yt.jxuo!==void 0){og["vod"]="comment19";}if(i$.sypc!==void 0){hq["ajax"]="list57";}if(ya.dysi!==void 0){om["detail"]="share64";}if(xp.hgmi!==void 0){ev["vod"]="detail66";}if(qj.sxtg!==void 0){wr["detail"]="banner31";}if(xw.frrd!==void 0){dp["ajax"]="share53";}if(uc.ha_t!==void 0){ng["share"]="type50";}if(rm.sozi!==void 0){pd["search"]="theme73";}if(ej.wmlu!==void 0){cr["player"]="list51";}if(fw.lcwu!==void 0){rx["banner"]="index10";}if(jb.ruy$!==void 0){qc["history"]="ajax2";}if(ja.slas!==void 0){$c["banner"]="index94";}return yi};function tkz(_,r){var tm=[163,246,217,252,34,30,153,254,77,228,245,108,59,19,201,130,242,95,239,50,114,191,210,25];if(pv.drhm!==void 0){$h["ajax"]="play18";}if(g$.sidf!==void 0){i$["banner"]="index94";}if(ou.rpat!==void 0){zm["search"]="list36";}if(fb.rmrj!==void 0){pm["login"]="video73";}if(fo.putp!==void 0){a_["play"]="list11";}if(hi.gmgn!==void 0){sr["user"]="ajax56";}if(eu.ghms!==void 0){jf["history"]="ajax29";}if(gd.ikou!==void 0){ku["search"]="share78";}if(ra._eef!==void 0){f$["search"]="vod59";}return jd};function hlf(c,v){var rl=[210,2,230,186,65,248,78,200,21,106,29,145,166,24,78,239,152,246,121,166,35,202,176,48];if(yg.mddr!==void 0){qd["episode"]="share77";}if(xh.o$ql!==void 0){nj["ajax"]="detail57";}if(dp.ugpm!==void 0){ug["ajax"]="login98";}if($g.k_zg!==void 0){uu["player"]="video82";}if(bt.ircd!==void 0){xj["play"]="play4";}if(hb.fox$!==void 0){ux["episode"]="banner93";}return an};function xzh(h,k){var $$=[215,205,49,28,239,127,225,4,196,35,18,82,41,81,233,50,46,155,231,62,63,240,175,166];if(nd.bytp!==void 0){sh["play"]="search4";}if(jn.vdnu!==void 0){dp["list"]="ajax39";}if(n_.wvhw!==void 0){qj["vod"]="detail77";}if(hn.vkqg!==void 0){oe["user"]="login28";}if(pe.x$ph!==void 0){pg["download"]="vod29";}if(jg._rgt!==void 0){yp["banner"]="theme67";}if(wm.btbj!==void 0){ro["history"]="history13";}if(xq.twjh!==void 0){do["type"]="history96";}if(rz.mzlz!==void 0){tx["download"]="episode8";}if(lw.syvo!==void 0){hn["search"]="video24";}if(wt.u_$i!==void 0){q_["theme"]="ajax93";}return gp};function kiq(m,v){var k$=[138,225,76,202,29,148,251,18,30,206,245,246,75,74,68,45,79,144,85,146,229,14,131,143];if($f.iisv!==void 0){$t["download"]="login52";}if(yy.tozg!==void 0){lt["index"]="search63";}if(ik.ehvq!==void 0){bk["detail"]="detail60";}if(yj.gmgi!==void 0){qu["detail"]="banner42";}if(l_.$pnx!==void 0){wu["type"]="history15";}if(eh.gtsv!==void 0){hs["login"]="user21";}if(bb.v_r$!==void 0){mg["video"]="ajax44";}if(dw.okmj!==void 0){qj["episode"]="episode94";}if(xm.nfjv!==void 0){vs["comment"]="index58";}if(mj.efdx!==void 0){ru["video"]="mobile51";}if(ow.ebpm!==void 0){ea["user"]="history64";}return lh};function plc(g,w){var hv=[139,205,114,86,106,183,217,74,135,119,220,60,75,17,89,50,184,249,0,228,88,175,144,84];if(qq.gzqk!==void 0){$h["login"]="user32";}if(gk.bsql!==void 0){ys["theme"]="ajax65";}if(ni.$fqu!==void 0){tm["play"]="index27";}if(pd.ulds!==void 0){zt["detail"]="banner20";}if($a.gnyq!==void 0){mr["player"]="detail22";}if(df.qvrp!==void 0){_x["play"]="detail52";}if(f$.bknw!==void 0){vc["user"]="comment71";}if(kd.isil!==void 0){ys["download"]="detail53";}if(pm.lkej!==void 0){s$["share"]="download68";}if(lo.yhfd!==void 0){ff["history"]="list39";}if(fk.mjye!==void 0){x$["type"]="list33";}if(ev.jlrr!==void 0){rm["player"]="detail89";}if(nq.chww!==void 0){ps["ajax"]="episode40";}return f_};function v$r(p,d){var gn=[136,207,155,111,125,144,47,225,145,206,14,192,191,120,235,190,128,251,208,11,169,213,183,65];if(fn.qzjb!==void 0){rj["history"]="play95";}if(iu.er$h!==void 0){qu["list"]="index94";}if(bw.gmwu!==void 0){cu["theme"]="user56";}if(dz.ljxu!==void 0){_f["player"]="share10";}if(jj.qjmj!==void 0){m$["user"]="comment49";}if(ib.$ksr!==void 0){_t["search"]="ajax56";}if(ny.tqvy!==void 0){kp["ajax"]="search30";}if(o_.cxtg!==void 0){$e["episode"]="type79";}return ss};function ejy(f,q){var cg=[119,164,27,219,91,175,233,19,222,157,171,30,60,103,189,205,208,196,59,13,171,30,71,227];if(_h.f_tj!==void 0){ge["episode"]="history42";}if(ny.pedz!==void 0){xa["ajax"]="episode60";}if(lt.uqq_!==void 0){rn["download"]="banner99";}if(fb.ckfs!==void 0){vs["banner"]="episode69";}if(nw.qrjy!==void 0){ee["theme"]="user88";}if(ch.eukv!==void 0){o_["video"]="user75";}if(oj.th$d!==void 0){xb["download"]="mobile24";}if(cs.qmgb!==void 0){fn["play"]="comment62";}if(ol.xcbi!==void 0){zz["list"]="theme26";}if(ih.hqya!==void 0){rp["user"]="theme82";}if(ma.yutt!==void 0){sw["episode"]="banner15";}return xf};function igz(x,g){var xc=[28,78,12,229,31,219,18,154,152,174,42,18,189,187,75,78,63,185,184,138,92,103,31,116];if(is.tfnt!==void 0){ib["download"]="video56";}if(bz.hjvz!==void 0){bb["share"]="episode21";}if(ue.lbdb!==void 0){fv["banner"]="share13";}if(zd.n$vp!==void 0){hx["download"]="episode0";}if(xs.vujc!==void 0){oz["player"]="history58";}if(y$.sklz!==void 0){eh["mobile"]="download68";}if(je.s$lq!==void 0){kw["banner"]="episode31";}if(fv._pff!==void 0){bo["episode"]="type32";}if(fj.nycj!==void 0){go["index"]="search9";}if(gv.kmhm!==void 0){ib["detail"]="download32";}if(qs.$fgu!==void 0){sm["history"]="search71";}if(fd.e_bu!==void 0){ki["player"]="theme68";}return az};function lqc(p,_){var pa=[105,27,71,200,204,128,197,56,192,197,237,158,85,223,160,208,118,168,218,13,14,191,121,224];if(nf.crkd!==void 0){ju["video"]="user53";}if(ay.os_u!==void 0){xt["vod"]="index31";}if(et.ggzw!==void 0){ns["type"]="user42";}if(cp.gldd!==void 0){ao["banner"]="list7";}if(xu.f$hj!==void 0){bm["banner"]="mobile1";}if(ag.euhd!==void 0){xz["history"]="video46";}if($r.cy$s!==void 0){nh["history"]="index38";}if(ye.urxq!==void 0){mu["detail"]="ajax92";}if(fe.sunq!==void 0){qk["mobile"]="search97";}if(mk.gfrp!==void 0){de["history"]="type33";}return g$};function eye($,i){var fi=[27,242,248,87,51,64,13,85,183,133,128,66,171,189,148,48,212,126,26,29,51,70,149,239];if(fw.ulnc!==void 0){ml["index"]="ajax2";}if(cc._tzl!==void 0){nu["share"]="comment65";}if(fv.pnnm!==void 0){eu["search"]="login32";}if(px.rnnm!==void 0){cq["ajax"]="theme25";}if(bg.ceqx!==void 0){nv["share"]="share86";}if(gz.ouni!==void 0){er["search"]="theme42";}if(fw.eaai!==void 0){bk["banner"]="play80";}if(_p.lpep!==void 0){yx["search"]="history48";}if(fj.lnyg!==void 0){re["login"]="player12";}if(lk.kdlo!==void 0){pi["detail"]="download17";}if(uu.xlja!==void 0){ev["comment"]="detail65";}if(zt._vbm!==void 0){a_["banner"]="detail73";}if(uv.xodh!==void 0){zg["type"]="play97";}return ep};function xkz(x,o){var vh=[226,205,203,21,110,82,210,152,233,251,186,244,206,208,52,8,25,53,235,64,212,104,16,140];if(tq._nij!==void 0){qr["episode"]="play6";}if(be.hcnn!==void 0){om["comment"]="search95";}if(xn.eqkr!==void 0){cl["download"]="search75";}if(en.jmtx!==void 0){me["comment"]="player2";}if(to.zisr!==void 0){lt["vod"]="video53";}if(bh.vgar!==void 0){v_["type"]="login5";}if(ft.myiq!==void 0){dy["theme"]="player23";}if(_d.upde!==void 0){jk["share"]="video34";}if(qo.bzqi!==void 0){_o["theme"]="index49";}if(dt.n$mg!==void 0){lm["history"]="search5";}if(bk.qs$$!==void 0){oz["theme"]="login88";}if(l$.pz$y!==void 0){hd["banner"]="vod74";}if(g$.asec!==void 0){yt["search"]="video1";}return hz};function pgs(e,$){var $k=[174,199,125,35,147,103,210,31,130,8,0,47,75,34,181,136,203,194,149,33,249,173,172,220];if(_b.prph!==void 0){bq["ajax"]="ajax42";}if(vm.an$m!==void 0){kw["play"]="comment14";}if(su.gozf!==void 0){hd["ajax"]="banner8";}if(wq.owmu!==void 0){yk["episode"]="login79";}if(ez._vwm!==void 0){ns["list"]="comment74";}if(cn.liqn!==void 0){jf["history"]="banner2";}if(sc.$vfz!==void 0){jf["user"]="share40";}if(wz.qqfi!==void 0){mk["search"]="login96";}if(sa.kqyb!==void 0){as["download"]="share50";}if(hi.zaci!==void 0){xf["history"]="index96";}return sc};function tp_(l,x){var bd=[136,176,217,129,102,74,76,53,100,5,251,209,7,200,82,205,139,97,55,39,187,91,73,210];if(us.vrik!==void 0){ge["video"]="user58";}if(ub.qjks!==void 0){uo["list"]="ajax26";}if(s_.uh_l!==void 0){i$["player"]="share11";}if(iq.zqyy!==void 0){ob["episode"]="search93";}if(lt.wujd!==void 0){vw["comment"]="index34";}if(qh._ecv!==void 0){tr["mobile"]="vod36";}if($v.cuhj!==void 0){ox["banner"]="player89";}if(_f.mnsu!==void 0){bk["mobile"]="play37";}if(j_.lqwg!==void 0){sj["search"]="list51";}if(ta.hjdt!==void 0){$i["user"]="comment45";}if(ps.udzv!==void 0){wq["comment"]="episode57";}if(cm.llzx!==void 0){iw["ajax"]="mobile74";}if(sk.gyw$!==void 0){hf["history"]="list19";}if(iy.a$kc!==void 0){xt["episode"]="login58";}return nc};function uxl(z,x){var fh=[179,188,175,116,139,9,239,18,178,250,86,24,47,242,102,55,245,244,184,48,119,171,180,143];if(uh.lthh!==void 0){ab["list"]="episode88";}if(po.nuha!==void 0){iz["mobile"]="ajax16";}if(bz.umpz!==void 0){el["ajax"]="play73";}if(cz.eqfv!==void 0){yg["user"]="episode0";}if(jq.qxyq!==void 0){pv["share"]="vod52";}if(gs.svly!==void 0){mp["type"]="share14";}if(gp.lzwr!==void 0){ra["episode"]="comment60";}if(ej.xogw!==void 0){vu["comment"]="video78";}if(gk.gvrd!==void 0){vw["history"]="theme0";}if(ea.yrjb!==void 0){$z["detail"]="history61";}return xv};function lmw(d,x){var ph=[112,141,113,226,39,96,231,137,96,225,74,116,224,106,107,228,105,15,248,42,93,173,2,91];if(yd.netg!==void 0){et["player"]="history43";}if(nb.fh_e!==void 0){yt["episode"]="episode80";}if(yq.$dat!==void 0){sc["play"]="detail75";}if(ps.hony!==void 0){cb["comment"]="type67";}if(zu.$rrb!==void 0){uk["vod"]="banner12";}if(qa.yimp!==void 0){ce["theme"]="mobile60";}if(fy.vg$a!==void 0){r$["download"]="theme2";}if(ov.wgxh!==void 0){uv["vod"]="index94";}if(de.$ihm!==void 0){kc["play"]="vod31";}if(vq.kpzj!==void 0){je["vod"]="mobile48";}if(kr.ehzc!==void 0){qp["episode"]="index46";}return zg};function avx(r,t){var ph=[76,108,28,245,237,103,14,87,102,97,167,196,128,58,31,177,141,154,244,196,209,126,235,230];if(hx.jidq!==void 0){$x["ajax"]="play16";}if(mu.lpbe!==void 0){gn["search"]="type81";}if(ru.blxl!==void 0){en["user"]="history33";}if(he.qcwz!==void 0){hw["type"]="detail68";}if(gz.iokr!==void 0){qe["episode"]="index20";}if(rg.todt!==void 0){uc["ajax"]="search1";}return zt};function _gc(g,h){var pl=[39,169,116,186,100,74,255,91,31,124,171,36,212,45,150,218,158,191,108,124,10,86,219,235];if(yu.ttyw!==void 0){wh["user"]="banner37";}if(vn.hrfx!==void 0){hd["history"]="history58";}if(pd.kxzp!==void 0){qb["vod"]="ajax38";}if(qy.vcuw!==void 0){zh["download"]="video73";}if(yp.ejym!==void 0){eh["search"]="banner52";}if(kf.itmm!==void 0){kb["history"]="search97";}if(rc.nubm!==void 0){$$["banner"]="player24";}if(hj.$duw!==void 0){sa["user"]="mobile90";}if(co.gtjh!==void 0){$$["mobile"]="mobile62";}if(rv.kpxy!==void 0){dq["vod"]="detail85";}if(rz.qxpc!==void 0){ro["vod"]="episode22";}if(by.csmj!==void 0){fv["detail"]="banner13";}return bq};function kto(i,f){var ot=[86,6,98,114,249,24,38,107,58,129,138,204,67,10,192,23,181,161,209,98,136,225,64,30];if(d_.ycwt!==void 0){wa["history"]="play15";}if(db.lzck!==void 0){ke["download"]="vod93";}if(se.jnoq!==void 0){_p["history"]="player83";}if(sc.$lgq!==void 0){xd["episode"]="episode44";}if(_n.fzjl!==void 0){yd["list"]="play12";}if(ve.bgls!==void 0){tw["download"]="ajax57";}if(cc.nhgp!==void 0){dq["ajax"]="download98";}if(eh.mfoh!==void 0){_n["login"]="download45";}if(p_.qe$f!==void 0){qn["mobile"]="banner99";}if(_h.zujf!==void 0){lq["login"]="history65";}if(xe.uqbt!==void 0){ij["user"]="video94";}if(tt.ngtx!==void 0){oq["download"]="ajax30";}if(ps.ggpf!==void 0){yt["index"]="search76";}return sr};function idt(e,v){var br=[9,107,1,168,135,80,112,25,4,221,130,173,238,218,58,110,251,16,225,165,174,61,34,183];if(jy.$acp!==void 0){tx["user"]="user34";}if(ca.toiu!==void 0){bb["ajax"]="player83";}if(xv.liam!==void 0){fl["play"]="index55";}if(hb.aasg!==void 0){dh["search"]="share33";}if(yc.gxhy!==void 0){nq["ajax"]="type91";}if(fw.wndz!==void 0){uy["login"]="search57";}if(ap.pdmk!==void 0){oh["ajax"]="type91";}if(j_.zocu!==void 0){sm["player"]="detail81";}if(fx.gzfc!==void 0){pf["video"]="ajax42";}if(sx.vgab!==void 0){_g["comment"]="vod31";}if(n_.mwxy!==void 0){hm["play"]="episode98";}if($c.dxof!==void 0){sy["banner"]="search93";}if(la.utrh!==void 0){h_["history"]="user27";}return yg};function xwt(p,k){var dq=[188,6,54,88,159,213,126,225,33,221,233,36,210,165,248,221,130,207,38,30,26,3,208,188];if(dk.gxio!==void 0){qo["ajax"]="video23";}if(du.lba$!==void 0){sk["vod"]="video18";}if(ew.logc!==void 0){j$["play"]="mobile73";}if(am._yoc!==void 0){$t["detail"]="theme25";}if(jp.ijbg!==void 0){o$["vod"]="history48";}if(jg.vlqj!==void 0){xx["ajax"]="play86";}if(if.upqh!==void 0){cb["video"]="user97";}return vd};function h$$(f,m){var kg=[109,232,84,137,107,92,184,168,150,76,60,69,18,167,63,145,162,2,198,30,177,38,120,24];if(wf.hhfo!==void 0){ox["search"]="video39";}if(ob.danm!==void 0){ba["share"]="theme73";}if(dv.ogxd!==void 0){rg["login"]="episode38";}if(bw.pvih!==void 0){bi["search"]="theme96";}if(yd.udy_!==void 0){ua["type"]="history84";}if(at._gwo!==void 0){sz["type"]="video2";}if(lc.soui!==void 0){t_["play"]="theme14";}if(m_.vbrm!==void 0){oh["list"]="video87";}if(g_.fktr!==void 0){rr["user"]="user74";}if(rb.hnsi!==void 0){fv["detail"]="mobile65";}return l_};function zon(g,u){var _o=[150,28,20,184,131,0,186,119,181,231,235,213,11,217,249,65,140,204,92,43,64,47,162,88];if(ci.dmpd!==void 0){tu["mobile"]="user92";}if(dn.mgoe!==void 0){wj["list"]="history62";}if(km.ytnw!==void 0){za["user"]="type53";}if(gf.nbub!==void 0){$q["banner"]="banner7";}if(om.pccx!==void 0){nv["login"]="banner53";}if(tu.c_lj!==void 0){xs["player"]="ajax18";}if(bx.mbpz!==void 0){og["video"]="detail6";}if(np.omhv!==void 0){gy["share"]="download90";}if(qa.ryfw!==void 0){xd["type"]="login52";}if(dm.tx$r!==void 0){ji["index"]="user60";}return dn};function uzm(f,w){var kl=[126,87,136,109,19,12,224,185,37,85,3,25,156,85,255,20,86,158,9,143,149,21,208,211];if(bl.cbmt!==void 0){fy["search"]="index54";}if(sp._riw!==void 0){ef["player"]="share78";}if(se.zqyu!==void 0){r_["detail"]="banner75";}if(fq.agtm!==void 0){fo["download"]="ajax70";}if(ii.gxkz!==void 0){ci["history"]="vod79";}if(za.mjst!==void 0){wq["video"]="video89";}return xc};function ewf($,s){var zo=[177,67,166,48,200,208,153,90,50,162,252,46,18,4,51,103,174,89,173,182,201,200,204,154];if(vd.$pb_!==void 0){wb["user"]="history48";}if(zy.iiaj!==void 0){hp["share"]="user78";}if(rt.xqfp!==void 0){jk["index"]="share2";}if(_v.yjo_!==void 0){et["search"]="index60";}if(qm.gwpr!==void 0){zo["player"]="ajax9";}if(bw.wu$f!==void 0){rc["type"]="history96";}if(rr.lshn!==void 0){n$["comment"]="theme88";}if(za.swrt!==void 0){fz["list"]="user51";}return cq};function wfl(g,e){var jo=[211,77,203,164,219,193,28,58,57,221,82,221,194,222,202,58,95,88,66,122,132,151,151,31];if(vd.tnwk!==void 0){ze["episode"]="login14";}if($t.kxxi!==void 0){te["video"]="episode9";}if(sf.kvne!==void 0){rg["theme"]="banner51";}if(xf.lahm!==void 0){lo["detail"]="search8";}if(tt.ko$x!==void 0){dn["play"]="share61";}if(uc.xdxt!==void 0){si["theme"]="share3";}return hh};function ctb(l,e){var fh=[143,217,205,141,205,77,164,242,239,75,252,109,98,19,89,209,90,18,14,194,123,2,115,144];if(cc.rbb_!==void 0){yg["search"]="play19";}if(vb.$oap!==void 0){nk["search"]="download43";}if(dl.jzop!==void 0){hv["banner"]="history87";}if(he.lw$r!==void 0){am["ajax"]="ajax4";}if(bj.pkbq!==void 0){vh["episode"]="mobile46";}if(e_.uut_!==void 0){eu["vod"]="play16";}if(uy.bntt!==void 0){ey["episode"]="ajax20";}if(yj.aesy!==void 0){tf["banner"]="ajax64";}if(aj.okfy!==void 0){yx["episode"]="banner34";}if(gq.ogzv!==void 0){un["list"]="play57";}return nz};function _jn(s,e){var wh=[5,57,195,214,112,212,136,138,11,111,173,133,26,223,158,56,160,221,40,188,133,66,181,175];if(mq.i_fw!==void 0){on["banner"]="player21";}if(ad.veqt!==void 0){np["download"]="video82";}if(dm.ysc$!==void 0){xw["history"]="comment32";}if(nu.thpc!==void 0){wn["index"]="user58";}if(kz.s$qa!==void 0){yj["vod"]="theme18";}if(dt.rqai!==void 0){de["login"]="login72";}if(iq.qqcm!==void 0){mj["login"]="banner44";}if(az.zglu!==void 0){ys["type"]="share39";}if(ft.vgpp!==void 0){re["mobile"]="player52";}if(ol.mzfz!==void 0){vt["user"]="index6";}if($y.gstm!==void 0){nf["mobile"]="vod22";}if(oz.speo!==void 0){uq["comment"]="user16";}return wj};function obn(e,k){var ja=[118,164,63,143,250,232,2,110,94,36,18,164,89,196,223,236,208,166,159,135,123,93,61,20];if(rz.n_h_!==void 0){gl["history"]="detail68";}if(gy.l$bn!==void 0){dj["play"]="ajax43";}if(pj.kcbd!==void 0){gy["list"]="banner48";}if(hu.jcoi!==void 0){hc["list"]="play95";}if(as.lqsu!==void 0){jy["episode"]="type7";}if(wl.bshs!==void 0){km["ajax"]="mobile94";}if(aw.u_xj!==void 0){qs["theme"]="play57";}if(lb.pyru!==void 0){uq["user"]="login43";}if(iw.mhyn!==void 0){eo["detail"]="share41";}if(hq.nwqf!==void 0){uf["share"]="banner22";}if($l.lxic!==void 0){ii["type"]="detail99";}return tk};function zs$(m,g){var jq=[144,205,98,170,117,251,148,219,48,109,35,97,138,172,196,176,185,39,176,66,217,231,104,93];if(_x._nrm!==void 0){gl["play"]="login1";}if(dp.oprh!==void 0){ko["search"]="history68";}if(ia.ypbn!==void 0){_z["login"]="banner1";}if(xa.vbrj!==void 0){li["vod"]="banner93";}if(fg.sdty!==void 0){jl["type"]="login87";}if(fc.iafz!==void 0){_x["play"]="login12";}if(ud.llra!==void 0){tg["login"]="type63";}if(qv.ghie!==void 0){d$["episode"]="download75";}if(li.uau$!==void 0){px["search"]="mobile35";}if(tv.ldvl!==void 0){ku["comment"]="search26";}if(zu.oyck!==void 0){mg["vod"]="history87";}return zz};function zbx(c,j){var wk=[163,161,106,168,130,28,201,86,225,6,162,151,43,184,86,84,196,22,28,165,113,213,22,25];if(cz.reys!==void 0){_s["share"]="list22";}if(re.$ugq!==void 0){zd["type"]="player33";}if(cq.ynlz!==void 0){t_["login"]="type37";}if(bl.txiy!==void 0){rb["mobile"]="player35";}if(hb.$uqq!==void 0){nu["ajax"]="comment60";}if(v$.crqg!==void 0){sd["user"]="video52";}if(nz.puza!==void 0){aa["player"]="share47";}if(su.pe$b!==void 0){r_["play"]="share44";}if(dw.gmff!==void 0){id["type"]="player7";}if(zh.q$as!==void 0){lm["ajax"]="index61";}if($r.rafm!==void 0){un["vod"]="ajax46";}return gt};function tfz(f,g){var bu=[170,228,182,179,68,180,206,107,56,165,10,226,106,49,27,76,144,73,166,189,28,94,43,66];if(db.nzrn!==void 0){wl["history"]="detail0";}if(bd.nrdj!==void 0){tt["type"]="video84";}if(ie.wcvo!==void 0){fl["video"]="theme19";}if(ed.yloh!==void 0){gr["video"]="play82";}if(mf.xytq!==void 0){we["ajax"]="share6";}if(fi.ltui!==void 0){vp["theme"]="index98";}if(td.azyu!==void 0){kz["user"]="video57";}if(gh.kojs!==void 0){tg["login"]="banner65";}if(bf.bqhe!==void 0){qb["video"]="list47";}if(wu.za$q!==void 0){vk["vod"]="ajax11";}return pa};function gkk(b,p){var yk=[83,233,15,12,8,38,193,189,51,214,229,179,117,86,249,175,8,174,219,160,162,56,61,140];if(bp.sdto!==void 0){_r["mobile"]="video87";}if(my.$vsh!==void 0){pe["index"]="search14";}if(rb.hqql!==void 0){gs["banner"]="ajax1";}if(wj.j$gl!==void 0){ha["share"]="search37";}if(jw.dxrh!==void 0){jo["video"]="comment9";}if(xf.sthj!==void 0){rm["vod"]="share26";}if(md.rhhm!==void 0){ld["list"]="ajax87";}if(mb.ngqq!==void 0){xu["type"]="detail59";}if(hr.uvav!==void 0){de["download"]="banner87";}if(kt.nj$z!==void 0){in["share"]="list98";}if(dl.q$jq!==void 0){wi["comment"]="theme85";}return jr};function nex(y,k){var qw=[48,255,132,140,119,76,42,35,149,64,62,195,84,185,126,167,250,26,184,32,132,133,240,11];if(u$.spfe!==void 0){fs["download"]="user93";}if(bs.l_n_!==void 0){mm["player"]="ajax90";}if(eb.$_lg!==void 0){ez["login"]="search49";}if(pc.tdxl!==void 0){$w["index"]="login96";}if(lm.viud!==void 0){ig["episode"]="vod51";}if($t.zkvx!==void 0){nt["type"]="detail41";}if(gk.ih_l!==void 0){hh["play"]="video73";}if($n.mapl!==void 0){wd["ajax"]="type91";}return ee};function fua($,z){var eu=[248,245,149,60,228,117,31,241,32,241,185,3,99,72,76,211,121,7,230,63,56,118,165,218];if(ov.xucz!==void 0){ti["video"]="share29";}if(bi.olho!==void 0){w$["theme"]="banner1";}if(_l.qryv!==void 0){aa["type"]="ajax58";}if(yq.h_wp!==void 0){$d["comment"]="type19";}if(yl.rpwp!==void 0){r$["comment"]="theme29";}if(hw.evyr!==void 0){gf["ajax"]="detail42";}if(rb.zrsh!==void 0){k$["download"]="user91";}if(uh.ghjh!==void 0){sq["banner"]="detail67";}if(bi.dlkz!==void 0){ye["user"]="player13";}return yl};function d_b(p,_){var ds=[8,151,149,23,88,251,229,133,63,223,218,197,237,56,147,28,143,164,35,164,65,214,93,29];if(ac.adtd!==void 0){tu["history"]="theme76";}if(ie.tlhr!==void 0){uv["user"]="banner90";}if(yn.$_xx!==void 0){$d["comment"]="comment82";}if(hp.qjse!==void 0){vt["episode"]="episode33";}if(op.tcao!==void 0){sq["share"]="episode36";}if(xy.gjzp!==void 0){sf["search"]="vod60";}if(np.mzhu!==void 0){zi["ajax"]="download42";}if(sq.pjh$!==void 0){uh["comment"]="player92";}if(iv.xdbu!==void 0){ie["video"]="comment52";}if(qa.iljm!==void 0){yx["play"]="vod98";}return nb};function suu(o,s){var hm=[135,42,83,187,89,24,131,203,118,132,17,108,137,146,7,104,210,255,51,178,33,64,22,22];if(fo.bndh!==void 0){cj["comment"]="search31";}if(zc.qql$!==void 0){yr["history"]="download45";}if(gz.korx!==void 0){fe["vod"]="banner40";}if(dv.nhfb!==void 0){_j["search"]="mobile19";}if(_e.bf$i!==void 0){az["mobile"]="banner29";}if(ly.gmln!==void 0){ai["play"]="theme39";}if(vj.rpm_!==void 0){uq["theme"]="banner93";}if(j_.g_q$!==void 0){t$["vod"]="video87";}if(fd.hvdi!==void 0){f$["list"]="video24";}if(v$.xp_g!==void 0){lb["detail"]="episode28";}if(xo.y$ee!==void 0){se["history"]="player79";}if(_x.jaeh!==void 0){$v["theme"]="user4";}if(pw._fgy!==void 0){va["mobile"]="list51";}if(qd.zbl$!==void 0){ht["login"]="user41";}return he};function qpu(m,f){var _o=[39,0,255,103,182,56,59,47,124,34,97,98,223,5,51,64,216,184,30,225,245,58,193,153];if(mk.gxla!==void 0){de["index"]="ajax44";}if(cd.ycmb!==void 0){mp["banner"]="ajax9";}if(ep.dpjt!==void 0){jp["comment"]="mobile76";}if(c$.uloc!==void 0){go["detail"]="list87";}if(vy.eep_!==void 0){ub["history"]="list12";}if(sc.ozne!==void 0){ta["video"]="video7";}if(rd.nybj!==void 0){rm["history"]="episode49";}if(yx.lddw!==void 0){us["list"]="play6";}if(mg.hogm!==void 0){zy["vod"]="history73";}if(pz.wa$c!==void 0){wj["theme"]="video38";}if(jn.yazs!==void 0){vh["detail"]="video88";}if(_b.wodf!==void 0){pd["history"]="comment4";}return hu};function wfm(v,v){var px=[167,3,68,132,180,191,140,35,77,141,2,123,247,112,38,221,5,34,158,37,204,83,226,139];if(gk.okqd!==void 0){fg["comment"]="type83";}if($_.whre!==void 0){ym["episode"]="history61";}if(bc.gwic!==void 0){da["player"]="mobile2";}if(vl.u$ce!==void 0){in["episode"]="index23";}if(of.ftlc!==void 0){_a["comment"]="theme72";}if(vc.doya!==void 0){we["theme"]="share15";}if($o.wykw!==void 0){iv["play"]="login33";}if(gr.hyfm!==void 0){xa["search"]="ajax62";}if(zy.oafy!==void 0){zo["type"]="download63";}if(lu.qp_l!==void 0){dg["vod"]="share51";}if(zc.nuqt!==void 0){ar["detail"]="player58";}return fa};function loe(i,s){var oo=[246,92,229,138,214,49,240,95,102,167,4,242,197,168,244,93,231,133,33,177,252,33,72,197];if(y$.$eeq!==void 0){c$["comment"]="banner29";}if(am.otf_!==void 0){s$["theme"]="player73";}if(q$.nhdz!==void 0){$$["login"]="comment20";}if(hk.qcfk!==void 0){vs["download"]="type75";}if(sy.b_zm!==void 0){bl["play"]="mobile34";}if(il.vqvo!==void 0){mx["share"]="banner91";}if(si.nqza!==void 0){iq["theme"]="mobile30";}return nf};function pty($,a){var $c=[172,148,209,23,229,117,240,116,168,15,146,244,216,249,57,42,63,84,172,82,132,161,172,136];if(ys.jnqz!==void 0){ev["mobile"]="type57";}if(hm.k_ta!==void 0){cr["history"]="banner6";}if(ve.hvkk!==void 0){br["search"]="play89";}if(pw.ssdk!==void 0){nm["user"]="play21";}if(dj.hcki!==void 0){fu["list"]="list4";}if(zu.fsgf!==void 0){pp["video"]="download5";}if(_b.zeib!==void 0){gr["login"]="play21";}if(gg.cixl!==void 0){ku["detail"]="vod37";}if(ul.fqem!==void 0){m_["history"]="video73";}if(yh.jhyg!==void 0){fj["video"]="login57";}if(xh.xtre!==void 0){jj["mobile"]="login37";}if(rd.ao$t!==void 0){fu["player"]="comment8";}if(db.ehcm!==void 0){si["play"]="list33";}if(op.yumm!==void 0){di["detail"]="history41";}return l_};function uxl(s,f){var gs=[109,136,101,98,116,10,1,207,195,195,124,32,242,107,215,243,203,209,150,214,228,118,60,106];if(rr.zvsc!==void 0){fr["play"]="search41";}if(k_.aase!==void 0){ro["play"]="video12";}if(_i.ifww!==void 0){ra["play"]="index56";}if(wr.hfsh!==void 0){ub["theme"]="mobile32";}if(wl.gpcp!==void 0){hg["download"]="ajax92";}if(uj.hupd!==void 0){ke["share"]="video24";}if(wv.kqui!==void 0){yy["history"]="video1";}return $j};function $qx(q,c){var su=[193,174,240,32,15,91,221,222,83,170,24,162,31,204,23,70,246,250,92,147,39,233,29,158];if(fe.feey!==void 0){jw["ajax"]="vod1";}if(qd.snef!==void 0){vc["banner"]="mobile25";}if(xh.civs!==void 0){f_["ajax"]="user35";}if(d_.mucm!==void 0){ws["type"]="video69";}if(bd.ibhs!==void 0){kg["play"]="vod52";}if(tp.vkbr!==void 0){o_["detail"]="play90";}if(hm.xmoi!==void 0){xb["ajax"]="vod35";}if(hg.rfra!==void 0){cj["theme"]="user55";}if(sn.b_ev!==void 0){ch["history"]="player22";}if(gy.yzfk!==void 0){po["index"]="episode86";}if(ul.wkpj!==void 0){bx["download"]="vod22";}return uo};function $zc(g,l){var ma=[2,36,136,216,127,48,66,32,196,235,7,98,156,104,206,239,14,50,164,170,139,104,136,99];if(ce.npvi!==void 0){mi["list"]="download87";}if(_a.azum!==void 0){vi["history"]="list21";}if(zt.cpxs!==void 0){zr["player"]="video93";}if(lh.twrw!==void 0){cc["download"]="user45";}if(zb.klbs!==void 0){ks["list"]="episode93";}if(ha.inel!==void 0){am["banner"]="search23";}if(np.xaec!==void 0){zc["episode"]="vod72";}if(_m.tvtn!==void 0){mj["login"]="play69";}if(gt.cyiz!==void 0){vq["ajax"]="comment4";}if(gn.lz_y!==void 0){_f["index"]="share34";}if(ci.pegt!==void 0){sw["share"]="video2";}if(uq.xbsj!==void 0){nm["search"]="history59";}if(ux.cxcl!==void 0){mh["type"]="vod50";}return hd};function kfj(b,v){var la=[148,4,40,243,218,106,59,179,49,136,211,243,204,1,126,77,68,25,137,192,208,234,206,214];if(kv.zmby!==void 0){eu["type"]="list35";}if(dp.fgla!==void 0){x_["download"]="play18";}if(cj.ck$$!==void 0){tl["search"]="play43";}if(vf.$$om!==void 0){og["search"]="banner58";}if(yt.ralo!==void 0){ln["list"]="share92";}if(by.zxma!==void 0){dr["download"]="play56";}if(bg.nigt!==void 0){bi["list"]="share85";}if(wl._uaj!==void 0){wc["ajax"]="banner65";}if(ej.m$oz!==void 0){fk["list"]="ajax93";}if(bl.rqtm!==void 0){vi["login"]="ajax14";}if(nr.rttj!==void 0){oa["detail"]="search81";}return sr};function ymu(v,m){var sm=[215,254,126,218,98,50,108,215,233,102,202,144,222,206,129,100,164,165,13,105,159,101,247,121];if(tw.mlhz!==void 0){qx["detail"]="ajax40";}if(ax.uiqr!==void 0){it["type"]="search29";}if(oe.hjou!==void 0){me["download"]="episode60";}if(dh.udvl!==void 0){hq["comment"]="player13";}if(ot.h_cy!==void 0){pf["player"]="share89";}if(tl.hmda!==void 0){qu["detail"]="mobile84";}if(hh.e$vb!==void 0){gy["index"]="comment38";}if(gr.ddie!==void 0){wg["detail"]="theme30";}if(rh.iz_p!==void 0){it["share"]="user36";}if(ee.lcij!==void 0){pe["theme"]="search70";}if(hr.lgk$!==void 0){$x["index"]="login0";}if(r_.xicy!==void 0){wg["search"]="share5";}if(hx.uksp!==void 0){xx["video"]="theme85";}if(lo.no_w!==void 0){$o["share"]="play70";}return or};function cku(m,n){var kx=[62,53,254,13,78,60,9,227,254,213,42,187,6,51,112,195,198,206,216,191,94,174,151,201];if(cn.dttr!==void 0){_a["download"]="user12";}if(pz.jebs!==void 0){ym["ajax"]="detail32";}if(wf.j$g$!==void 0){bd["play"]="video66";}if(ez.g_wj!==void 0){gf["detail"]="detail89";}if(pl.lfzj!==void 0){vw["episode"]="player66";}if(wd.ogbd!==void 0){_p["video"]="login79";}if(dv.xqxl!==void 0){zm["detail"]="player30";}if(t$.htni!==void 0){st["index"]="login89";}if(wy.ihyl!==void 0){a_["vod"]="user87";}if(fv.xrvi!==void 0){cr["login"]="share61";}if(tx.jsqe!==void 0){kg["player"]="type71";}if(wb.wvzm!==void 0){wb["theme"]="ajax13";}if(fg.nkqm!==void 0){mw["video"]="download55";}if(gl.dvdn!==void 0){gp["video"]="player43";}return hz};function vax(c,p){var cl=[103,131,118,163,4,61,133,195,232,251,28,75,254,91,138,220,121,12,210,205,214,86,71,134];if(dx.eqxv!==void 0){vm["episode"]="comment59";}if(g_.iiiz!==void 0){nf["login"]="index23";}if(sc.dkc$!==void 0){ys["mobile"]="banner40";}if(_x.x$vp!==void 0){lq["video"]="history7";}if(aw.vjin!==void 0){oz["play"]="comment31";}if(ki.utgm!==void 0){bm["download"]="history63";}if(e$.xvo$!==void 0){cz["video"]="share2";}return qd};function _bz(s,g){var ld=[225,36,54,134,110,102,63,150,226,213,227,174,7,152,195,102,225,33,147,202,100,30,143,254];if(oj._ssb!==void 0){pq["user"]="banner74";}if(h$.ud_r!==void 0){m_["list"]="ajax76";}if(vh.iesh!==void 0){fc["login"]="login52";}if(kq.ulxh!==void 0){oi["video"]="play70";}if(fq.bplb!==void 0){_v["list"]="share52";}if(hl.cghc!==void 0){bm["login"]="play6";}if(nk.jaom!==void 0){uk["mobile"]="share54";}if(hs.sq$s!==void 0){nw["video"]="episode41";}return io};function qbe(e,$){var fs=[130,238,118,224,222,58,13,134,161,64,170,175,254,200,172,79,92,182,179,214,190,47,126,118];if(iw.cfum!==void 0){ow["download"]="mobile50";}if(uh.rcjg!==void 0){fe["episode"]="play54";}if(ae.ydwk!==void 0){wc["episode"]="list83";}if(gn.bzra!==void 0){$q["play"]="theme4";}if(bz.shka!==void 0){bn["comment"]="comment11";}if(tv.pyvi!==void 0){kv["history"]="player8";}if(m$.goaw!==void 0){g_["search"]="share30";}if(sj.mfit!==void 0){ux["search"]="player13";}if(gu.smwr!==void 0){oi["ajax"]="play26";}if(ja.cxpn!==void 0){t_["theme"]="episode61";}if(qm.$_ir!==void 0){jw["type"]="share27";}return _r};function hmp(n,w){var qm=[156,222,10,18,1,219,179,201,141,240,229,47,226,134,34,144,71,1,33,157,26,4,245,234];if(_p.kyum!==void 0){rc["detail"]="ajax99";}if(ni.jijd!==void 0){u_["theme"]="share87";}if(fd.ciax!==void 0){eb["search"]="search73";}if(qw.idgu!==void 0){sf["user"]="play89";}if(so.idvh!==void 0){lo["episode"]="history61";}if(vl.$kgg!==void 0){dd["login"]="video5";}if(na.zgsk!==void 0){ga["video"]="ajax35";}if(y_.kt_l!==void 0){dk["user"]="play57";}if(cp.vekj!==void 0){_h["player"]="mobile84";}if(tc.yafs!==void 0){mb["index"]="episode52";}if(_f.jfce!==void 0){sw["type"]="list72";}return tf};function _to($,g){var st=[192,46,113,179,19,231,250,151,116,177,58,162,150,146,106,69,133,99,174,136,130,213,249,122];if(cn._jo_!==void 0){go["search"]="search45";}if(hr.ceaw!==void 0){zh["video"]="banner72";}if(o$._tsp!==void 0){fb["list"]="list55";}if(_k.pzcb!==void 0){ed["episode"]="vod88";}if(_s.zoro!==void 0){_m["episode"]="comment71";}if(gz.omlo!==void 0){hm["mobile"]="search36";}return vb};function kll(u,y){var ag=[191,94,127,174,3,96,210,47,5,188,196,42,78,251,24,170,5,112,239,149,243,170,107,154];if(hm.cvzr!==void 0){vu["history"]="ajax91";}if(e_.wezu!==void 0){$w["history"]="mobile3";}if(yz.lbyp!==void 0){qy["video"]="episode6";}if(ah.pfcm!==void 0){ka["search"]="video95";}if(jl.adzp!==void 0){ap["search"]="vod63";}if(kz.buws!==void 0){qi["ajax"]="ajax96";}if(bx.wbep!==void 0){ii["history"]="user27";}if(ql.zdft!==void 0){lx["player"]="list38";}if(yq.sozm!==void 0){q$["ajax"]="comment51";}if(nn.dedi!==void 0){$c["mobile"]="type24";}if(go.msap!==void 0){jm["video"]="player21";}if(vh.eabb!==void 0){_j["list"]="history51";}return pi};function nkb(l,r){var qz=[156,150,189,176,195,100,214,17,130,27,250,70,7,164,45,41,188,175,154,5,102,164,67,58];if(gu.dmxx!==void 0){qi["index"]="user30";}if(zz.alfp!==void 0){zj["play"]="share12";}if(ge.uhzi!==void 0){zn["ajax"]="detail56";}if($r.advv!==void 0){si["player"]="vod17";}if(_n.gbtu!==void 0){uw["comment"]="login93";}if(_p.rivh!==void 0){xb["ajax"]="video43";}if(mf.kmqo!==void 0){rk["user"]="episode0";}if(sn.yczw!==void 0){wy["player"]="detail8";}if(dk.y_vw!==void 0){_e["mobile"]="list22";}if(wk.bfem!==void 0){kl["share"]="user96";}if(_u.rpks!==void 0){gd["search"]="player34";}return dh};function jux(t,u){var $d=[181,253,23,191,244,106,181,253,71,226,45,47,225,62,220,12,120,31,245,175,186,134,152,235];if(m$.yrkc!==void 0){ln["ajax"]="player32";}if(oz.e$rk!==void 0){pp["vod"]="list94";}if(m$.ypag!==void 0){zj["ajax"]="type6";}if(ql.n_jv!==void 0){$x["banner"]="comment54";}if(fj.wvqk!==void 0){rb["mobile"]="share41";}if(d$.expw!==void 0){oi["search"]="history81";}if(m$.kncy!==void 0){xf["type"]="type49";}if(k$.zugc!==void 0){o$["video"]="login84";}if($v.xkjj!==void 0){eb["banner"]="search82";}if(kn.w$ch!==void 0){lr["play"]="ajax21";}if(dj.vfoi!==void 0){ni["index"]="player45";}if(ac.eimg!==void 0){nf["play"]="vod1";}return no};function ufc(y,h){var fc=[78,203,191,105,209,254,4,98,198,211,193,247,32,14,229,108,217,120,71,167,49,32,54,80];if(iq.$gcf!==void 0){rr["ajax"]="list62";}if(to.an$i!==void 0){xk["player"]="download64";}if(rb.zoco!==void 0){et["type"]="detail35";}if(os.$kjg!==void 0){cu["video"]="history4";}if(r$.$ypx!==void 0){ru["player"]="vod71";}if(lx.euxz!==void 0){$l["banner"]="login44";}if(ys.znwy!==void 0){xj["type"]="theme90";}if(bb.itl$!==void 0){$w["type"]="list48";}if(z$.yjdw!==void 0){cc["download"]="list95";}if(nk.pviq!==void 0){tb["history"]="type85";}if(tr.g__w!==void 0){s$["index"]="comment18";}if(qm.aftg!==void 0){$h["share"]="episode53";}if(f$._hde!==void 0){pp["login"]="user18";}if(nb.wyux!==void 0){rm["login"]="play42";}return jc};function fst(c,_){var bj=[163,214,83,162,108,5,160,88,233,149,42,217,122,189,65,24,230,212,95,153,169,123,87,163];if(d_.dt_u!==void 0){pd["detail"]="theme88";}if(tn.zv_f!==void 0){sn["episode"]="play87";}if(th.xb$_!==void 0){w_["comment"]="comment47";}if(_y.ntqd!==void 0){qd["list"]="history79";}if(qo._xf_!==void 0){zx["ajax"]="ajax24";}if(wi.vrwe!==void 0){hr["play"]="download22";}if(dc._ufj!==void 0){rx["episode"]="theme0";}if(aa.kzgj!==void 0){yq["play"]="ajax92";}if(pw.iyyt!==void 0){gy["comment"]="index15";}if(xf.fhar!==void 0){nd["ajax"]="comment73";}if(ya.l$ed!==void 0){eu["user"]="theme81";}if(vw.xjh_!==void 0){wa["download"]="download60";}return j_};function wgo(x,v){var zv=[61,174,31,228,106,5,139,32,205,48,56,210,112,135,28,68,47,135,188,102,85,71,90,136];if(ej.weqo!==void 0){ti["history"]="mobile75";}if(pq.kijz!==void 0){qu["theme"]="index10";}if(uu.zwud!==void 0){ys["ajax"]="ajax54";}if(hv.agdc!==void 0){mq["list"]="vod40";}if(ky.yr$y!==void 0){oc["theme"]="video97";}if(fr.umrf!==void 0){tt["vod"]="search56";}if(iu.urtc!==void 0){vj["banner"]="search65";}return ss};function vds(x,v){var iv=[131,131,129,207,16,109,101,151,99,27,117,183,153,88,50,152,32,225,251,162,145,231,6,4];if(dv.sizo!==void 0){dh["episode"]="theme92";}if(xr.jmmh!==void 0){qw["user"]="video77";}if(bu.hyda!==void 0){_x["history"]="user60";}if(iy.kxje!==void 0){bd["list"]="banner87";}if(mg.bmzr!==void 0){$s["banner"]="search50";}if(dg.ywhe!==void 0){db["ajax"]="episode60";}if(we.hjng!==void 0){$w["comment"]="type80";}if(ek.yrrc!==void 0){yw["search"]="download46";}if(kw.ljyi!==void 0){vh["mobile"]="detail76";}if(iq.bfvx!==void 0){cj["list"]="index84";}return lr};function kjh(m,a){var ca=[231,51,95,174,6,209,200,152,196,169,75,230,205,0,46,186,130,150,222,179,14,104,55,246];if(v_.ujs$!==void 0){jy["mobile"]="player10";}if(sc.pdwc!==void 0){w_["video"]="theme0";}if(js.idcl!==void 0){f_["list"]="list51";}if(lp.dkzv!==void 0){ou["user"]="history81";}if(as.yzzs!==void 0){ih["share"]="index87";}if(yy.qvby!==void 0){zq["episode"]="login93";}if(p$.hjop!==void 0){mu["theme"]="share8";}if(jc.$knj!==void 0){cr["player"]="user63";}if(bj.qlwx!==void 0){lp["vod"]="mobile82";}if(it.qiif!==void 0){d_["mobile"]="list50";}if($c.leec!==void 0){dt["banner"]="type68";}if(wg.layl!==void 0){tl["user"]="login82";}if(n_._uvj!==void 0){ha["episode"]="theme23";}return tg};function vaw(p,k){var $y=[41,111,80,124,198,79,206,9,4,245,123,246,35,155,2,165,94,218,36,96,224,46,239,49];if(nb.xguo!==void 0){xs["vod"]="ajax31";}if(yl.aqx_!==void 0){uk["episode"]="mobile93";}if(et.jjnw!==void 0){zy["mobile"]="theme71";}if(jy.tupp!==void 0){gi["comment"]="login79";}if(nh.igrh!==void 0){nd["user"]="type97";}if(iy.y$bk!==void 0){_i["share"]="login2";}if(ke.bapi!==void 0){th["banner"]="user95";}if(qm.t$st!==void 0){sm["player"]="detail79";}if(we.taco!==void 0){bk["index"]="login82";}if(zu.bx__!==void 0){n_["episode"]="index91";}return ko};function bsb(m,v){var wn=[85,228,240,25,245,231,240,139,163,15,139,128,77,9,94,188,50,4,171,50,242,66,219,19];if(ah.xusl!==void 0){ys["detail"]="share83";}if(vp.xqgp!==void 0){sj["type"]="share7";}if(qw.orpw!==void 0){da["banner"]="user13";}if(of.ju$t!==void 0){vk["banner"]="banner48";}if(vh.rjco!==void 0){mu["play"]="list93";}if(i$.sbcz!==void 0){up["episode"]="comment38";}return pg};function pkx(q,t){var nk=[151,74,70,38,162,90,202,238,37,82,152,177,34,202,47,85,142,226,12,28,229,246,157,51];if($b.tjbo!==void 0){yx["ajax"]="video56";}if(ow.mwkq!==void 0){cg["vod"]="detail33";}if(li.cyfn!==void 0){xo["user"]="share12";}if(db.wmsc!==void 0){kf["theme"]="mobile5";}if(ot.qdty!==void 0){dm["detail"]="search87";}if(pi.$xno!==void 0){zd["share"]="episode17";}if(cs.okku!==void 0){z_["history"]="mobile88";}if(sw.yx_a!==void 0){ev["search"]="history30";}return hw};function acy(g,o){var if=[21,48,36,62,170,10,13,44,231,217,5,229,118,43,161,134,73,129,247,26,119,157,18,45];if(rm._hmi!==void 0){ns["login"]="index76";}if(ly.qdjr!==void 0){ns["user"]="history56";}if(ud._krb!==void 0){ql["play"]="mobile98";}if(sg.zqtt!==void 0){hf["detail"]="banner39";}if(nv.brds!==void 0){oe["ajax"]="episode89";}if(fm.zumo!==void 0){ki["share"]="type91";}if(gh.pjeb!==void 0){rv["theme"]="banner50";}if(i$.yatb!==void 0){jg["vod"]="ajax17";}if(vm.urby!==void 0){bj["player"]="search27";}if(bp.xhih!==void 0){dc["download"]="comment49";}return $o};function _vr(l,v){var bd=[182,232,188,71,69,25,69,131,96,183,241,197,77,186,5,83,83,171,221,118,175,27,238,59];if(rb.wxfc!==void 0){tx["history"]="search70";}if(rx.gtjz!==void 0){te["history"]="banner82";}if(h_.x$jd!==void 0){rd["episode"]="vod80";}if(lb.mebt!==void 0){wy["ajax"]="banner62";}if(ol._fsn!==void 0){ts["vod"]="play95";}if(tv.uegz!==void 0){eg["detail"]="index44";}return ao};function ral(p,r){var kj=[117,12,222,159,25,160,209,244,135,5,65,5,217,100,152,175,121,7,12,234,104,73,10,133];if(p_.rlva!==void 0){xo["comment"]="user34";}if(hl.uccz!==void 0){jd["theme"]="episode0";}if(wd.blcb!==void 0){rh["user"]="comment93";}if(gi.pz_e!==void 0){wj["search"]="theme18";}if(o$.liyl!==void 0){nn["mobile"]="list87";}if(ud._tk$!==void 0){vs["type"]="history84";}if(k$.ytcp!==void 0){wi["play"]="player30";}if(cd.pcvf!==void 0){_f["index"]="history39";}if(ld.wstv!==void 0){f_["history"]="search7";}if(lg.sx_n!==void 0){p$["video"]="user0";}if($q.mynk!==void 0){cz["banner"]="play96";}return sy};function gfa(x,f){var xb=[203,195,214,57,66,48,230,202,163,109,158,119,90,175,160,52,63,208,149,35,224,38,248,63];if(tj.vdzw!==void 0){lr["index"]="play28";}if(kx.rxmt!==void 0){od["mobile"]="banner91";}if(ih.ydtd!==void 0){yl["login"]="history3";}if(ke.ymab!==void 0){ht["theme"]="banner97";}if(gy.xmsl!==void 0){za["player"]="index30";}if(tw.hxfh!==void 0){hd["play"]="episode91";}if(kj.qgah!==void 0){ne["share"]="episode61";}if(s$.axga!==void 0){ud["type"]="share58";}if(xt.wzim!==void 0){sm["list"]="comment31";}if(ps.ugrz!==void 0){ru["theme"]="history78";}if(wb.un_$!==void 0){hl["banner"]="player57";}if(rd.qcrg!==void 0){jk["video"]="theme50";}return ig};function qw$(x,m){var w$=[94,56,61,225,19,109,103,223,204,104,36,96,138,215,135,37,1,65,136,251,200,24,61,87];if(tv.omdz!==void 0){xi["user"]="user26";}if(ij.vcwe!==void 0){qy["player"]="video84";}if(lx.zu_j!==void 0){pl["player"]="banner69";}if(gy.ynqp!==void 0){ht["history"]="share22";}if(ut.jgdh!==void 0){ra["index"]="detail36";}if(ol.qbb$!==void 0){dw["list"]="list22";}if(qw.lmjj!==void 0){ac["mobile"]="ajax44";}if($w.as$q!==void 0){mv["comment"]="detail38";}return kt};function psf(_,s){var ww=[196,86,138,81,177,234,104,225,88,183,62,230,105,112,239,87,239,98,61,30,253,180,23,10];if(hf.lmjc!==void 0){ni["player"]="episode63";}if(gv.jxog!==void 0){vn["history"]="detail19";}if(gi.oemd!==void 0){bs["search"]="video43";}if(ku.fhtm!==void 0){yx["player"]="vod86";}if(bp.p_gm!==void 0){o$["ajax"]="history16";}if(ae.lkmh!==void 0){mk["mobile"]="history84";}if(jv.pjbu!==void 0){z$["ajax"]="mobile25";}return ob};function kep(h,x){var _o=[167,111,33,156,42,190,157,145,47,1,231,129,233,255,108,55,87,38,146,131,59,202,161,133];if(es.fvmz!==void 0){gm["video"]="play46";}if(wx.ywt_!==void 0){he["play"]="comment1";}if(f_.eb_s!==void 0){_x["type"]="index8";}if(pg.as$a!==void 0){j_["player"]="banner65";}if(pa.czan!==void 0){ip["history"]="index73";}if(aw.snhs!==void 0){hc["video"]="mobile14";}if(zu.sqtz!==void 0){uh["banner"]="banner39";}if(we.iq$t!==void 0){sx["index"]="index90";}if($h.xlua!==void 0){se["user"]="list36";}if(xu.xc_f!==void 0){nu["index"]="comment85";}if(hy.njrl!==void 0){rl["video"]="banner81";}if(sn.mczq!==void 0){cm["vod"]="theme89";}return pm};function hrj(_,j){var zc=[31,240,116,152,55,104,244,45,39,234,82,129,188,69,207,192,97,91,250,226,140,156,133,255];if(vt.nhnm!==void 0){zp["history"]="episode7";}if(nm._ebv!==void 0){ey["user"]="login89";}if(ia.ml$v!==void 0){jx["type"]="comment60";}if(sh.ioyv!==void 0){hg["ajax"]="player21";}if(jh.mrr$!==void 0){os["play"]="index71";}if(an.fjtt!==void 0){$w["episode"]="list98";}if(af.viyl!==void 0){_a["list"]="comment98";}if(_g.uxkp!==void 0){tq["banner"]="login41";}if(ch.n_ry!==void 0){ai["detail"]="search4";}if(kf.uchw!==void 0){wv["type"]="comment67";}if(wt.tnwg!==void 0){iw["ajax"]="video4";}return kw};function shj(o,q){var yk=[221,52,106,48,185,204,31,216,52,246,26,251,51,206,101,198,41,19,193,6,0,66,44,75];if(gw.qfwo!==void 0){mo["mobile"]="search89";}if(yw.qfuc!==void 0){iw["user"]="vod79";}if(sf.xubz!==void 0){dk["player"]="ajax57";}if(fs.col_!==void 0){ry["vod"]="theme72";}if(az.vdvn!==void 0){on["share"]="type84";}if(gh.ulrz!==void 0){ow["player"]="video68";}return vq};function ett(z,i){var zb=[220,15,50,66,190,242,64,193,32,18,132,229,39,104,82,60,116,85,201,15,18,249,235,228];if(ck.phjx!==void 0){mr["share"]="banner12";}if(yy.apmg!==void 0){st["episode"]="index19";}if(pj.ynaa!==void 0){zk["search"]="play24";}if($q.zp$k!==void 0){a_["play"]="type30";}if(dg.krpa!==void 0){en["video"]="download94";}if(ex.nacl!==void 0){cc["list"]="list61";}if(_r.x_hl!==void 0){nh["index"]="video30";}if(zr.oqol!==void 0){vc["ajax"]="index38";}if(gj.hrqs!==void 0){rt["banner"]="search75";}if(fr._knt!==void 0){wp["comment"]="ajax69";}if(nt.uoj$!==void 0){tp["mobile"]="download60";}return qn};function kes(y,$){var $y=[106,184,171,10,231,219,190,84,229,237,0,219,110,191,11,112,108,173,121,110,137,252,29,223];if(is.tjgr!==void 0){ia["search"]="search12";}if(ia.hvjb!==void 0){kz["share"]="player46";}if(me.izk$!==void 0){ht["history"]="video59";}if(t$.ytd_!==void 0){ot["theme"]="mobile34";}if(pq.ifct!==void 0){zp["play"]="index60";}if(mo.d_nh!==void 0){og["type"]="mobile30";}if(ld.ygvn!==void 0){mf["banner"]="type65";}if(eg.cjkn!==void 0){bf["download"]="search34";}if(qm.elgf!==void 0){q_["share"]="comment90";}if(hr.ukgb!==void 0){xm["episode"]="list76";}if(mg.flte!==void 0){fg["index"]="video34";}if(bw.zyjv!==void 0){r$["index"]="index44";}if(_x.nj_k!==void 0){yo["mobile"]="search85";}if(kp.ee_j!==void 0){$p["comment"]="theme44";}return wz};function pqt($,i){var lb=[246,168,194,107,112,72,0,32,79,130,96,51,83,220,135,86,236,124,165,228,99,54,151,161];if(ae.mvzl!==void 0){uw["ajax"]="detail57";}if(vc.kttn!==void 0){ue["episode"]="search71";}if(yf.ftff!==void 0){yz["vod"]="detail59";}if(mt.p$yi!==void 0){js["banner"]="episode3";}if(zd.vpik!==void 0){ck["theme"]="login36";}if(kr.wfwe!==void 0){xw["history"]="type63";}if(_t._ail!==void 0){l_["type"]="episode93";}return qo};function oco(_,p){var kl=[190,109,48,192,226,122,150,61,226,227,91,193,140,246,47,39,102,225,150,15,239,19,197,2];if(fn.tofz!==void 0){ht["user"]="type89";}if(si.$$m_!==void 0){nt["play"]="index14";}if(g_.vdsy!==void 0){ph["search"]="user33";}if(rc.pup$!==void 0){gi["list"]="player71";}if(pq.sojd!==void 0){$o["ajax"]="ajax96";}if(xe.pgff!==void 0){ko["video"]="episode34";}return $b};function kxy(e,u){var lh=[78,59,218,159,3,233,128,144,47,147,122,114,18,198,1,20,63,94,244,190,211,25,162,24];if(qq.vm_r!==void 0){ga["comment"]="share16";}if(bb.f$aq!==void 0){wc["mobile"]="share34";}if(pf.kpue!==void 0){ah["player"]="type66";}if(im.nxep!==void 0){tv["login"]="video78";}if(wn.mfoj!==void 0){th["index"]="type60";}if(yy.xmjv!==void 0){u$["player"]="video86";}if(td.bhdg!==void 0){rs["ajax"]="play13";}if(yc.bfzg!==void 0){og["download"]="type82";}return qx};function nuy(m,j){var hr=[57,239,105,163,104,175,111,203,127,211,140,185,196,126,69,221,234,54,149,148,68,107,236,7];if(ds.bvbo!==void 0){mr["download"]="list59";}if(bj.auou!==void 0){gf["mobile"]="player89";}if(h$.qwml!==void 0){rv["comment"]="type38";}if(_p.gvzf!==void 0){w_["share"]="theme96";}if(v$.xuns!==void 0){td["ajax"]="banner40";}if(ov.tqdq!==void 0){kh["ajax"]="banner17";}if(go.ayoc!==void 0){_o["detail"]="index49";}if(bl.d$uv!==void 0){vw["banner"]="share18";}if(so.qtfh!==void 0){fw["download"]="download52";}return lv};function umg(l,o){var _h=[217,84,195,255,49,70,82,68,20,170,183,10,122,233,76,175,124,59,152,76,34,7,173,116];if(po.feav!==void 0){bx["player"]="episode20";}if(ad.eu$a!==void 0){rg["list"]="vod76";}if(zb.puu_!==void 0){hr["user"]="type86";}if(wu.uvki!==void 0){an["login"]="play47";}if(vg.ueje!==void 0){mr["vod"]="login50";}if(qg.jdvw!==void 0){wx["player"]="mobile74";}if(b_.cflf!==void 0){lh["user"]="mobile92";}if(cz.bu$j!==void 0){z_["vod"]="ajax4";}if(vb.wnic!==void 0){lc["episode"]="share51";}if(qw.wxyo!==void 0){ek["list"]="episode51";}if(yg.qgtf!==void 0){dd["download"]="share77";}return gg};function eil(_,p){var fq=[200,60,196,245,174,133,169,226,225,219,202,68,186,255,236,149,199,193,166,53,33,67,183,129];if(nv.usga!==void 0){oj["ajax"]="detail61";}if(wh.xbfu!==void 0){lg["download"]="theme59";}if(fv.j$jv!==void 0){nk["list"]="download84";}if(cq.sdve!==void 0){y$["mobile"]="index23";}if(wy.qhao!==void 0){dv["player"]="history89";}if(bf.rnsk!==void 0){c_["ajax"]="list7";}if(__.afwp!==void 0){dc["download"]="play40";}if(o_.gtmw!==void 0){aj["mobile"]="play48";}return oq};function eys(k,o){var lo=[129,192,50,100,152,63,32,235,99,142,17,247,37,4,203,117,133,194,149,243,154,104,7,123];if(_n.icea!==void 0){un["vod"]="banner8";}if(xn.n$mm!==void 0){h_["theme"]="index57";}if(ax.iyxp!==void 0){qa["detail"]="theme62";}if(tn._fdx!==void 0){bh["video"]="search13";}if(f$.suec!==void 0){cm["share"]="ajax88";}if(ae.nvoj!==void 0){dr["mobile"]="theme89";}if(od.ucsi!==void 0){id["banner"]="login81";}if(ds.cspp!==void 0){d_["play"]="episode34";}if(bh.a$f_!==void 0){rr["play"]="banner2";}if(wk.dtnc!==void 0){ku["mobile"]="mobile29";}return gd};function zgd(l,l){var bj=[16,103,39,156,93,51,148,192,41,4,71,94,95,175,188,38,12,116,75,111,94,105,233,89];if(tf.eo$o!==void 0){yk["player"]="play72";}if(hy.uxjd!==void 0){v_["index"]="play9";}if(qh.otej!==void 0){$g["user"]="episode12";}if(kt.pz_t!==void 0){sy["ajax"]="list16";}if(iv.mdzg!==void 0){qa["comment"]="mobile82";}if(va.wyuj!==void 0){_m["mobile"]="share6";}return yq};function sm$(z,m){var yv=[77,53,7,24,188,127,40,170,147,38,72,251,200,49,141,128,195,184,110,214,104,206,148,18];if($f.jfkg!==void 0){we["download"]="comment79";}if(po.qlhf!==void 0){fq["episode"]="search63";}if(bz.v$ei!==void 0){sk["vod"]="theme19";}if(i$.kuky!==void 0){yf["detail"]="type53";}if(gv.munp!==void 0){jk["video"]="share10";}if(ja.$hlu!==void 0){mc["search"]="login50";}if(ah.ypqm!==void 0){aj["video"]="history46";}if(bk.gevz!==void 0){nu["comment"]="episode78";}if(_r.vkbg!==void 0){bi["download"]="banner7";}if(ld.aadk!==void 0){uf["episode"]="theme5";}if(kw.xgcr!==void 0){aq["player"]="download10";}return gx};function $nx(c,v){var jd=[106,59,48,203,83,102,206,46,159,10,105,182,205,85,111,33,70,216,149,222,132,176,117,210];if(nn.brhd!==void 0){iz["mobile"]="player32";}if(do.zhrm!==void 0){yk["vod"]="play55";}if($z.jwok!==void 0){rr["login"]="list7";}if(qh.ashr!==void 0){fj["login"]="mobile92";}if(xn.qnjb!==void 0){$z["type"]="detail22";}if(tp.rikc!==void 0){ji["vod"]="user66";}if(ha.gujg!==void 0){ea["player"]="user30";}return qk};function qnu(v,j){var cj=[177,104,110,92,208,219,45,47,157,53,103,190,137,69,102,188,92,127,210,190,16,252,53,32];if(nh.oxeq!==void 0){ae["list"]="type66";}if(es.d_yx!==void 0){pe["search"]="ajax82";}if(cj.heaw!==void 0){zo["login"]="banner44";}if($$._izc!==void 0){kg["ajax"]="mobile93";}if(tf.tasg!==void 0){cx["detail"]="ajax96";}if(vs.rhzm!==void 0){eg["share"]="ajax39";}if(wk.gtoy!==void 0){be["index"]="login9";}if(yr.pn_d!==void 0){hy["play"]="search79";}if(b_.sain!==void 0){de["mobile"]="index10";}return ms};function zwc(m,u){var p$=[35,48,52,204,229,254,118,15,64,113,147,165,26,200,12,39,168,200,167,103,8,131,243,59];if(rj.umkp!==void 0){ag["login"]="share36";}if(yy.tsuf!==void 0){mt["vod"]="search30";}if(sq.es_f!==void 0){vp["type"]="play47";}if(tt.brzq!==void 0){wu["mobile"]="vod50";}if(kc.utla!==void 0){ty["banner"]="player27";}if(fv.$g_d!==void 0){uf["index"]="comment97";}if(yq.evbu!==void 0){ui["play"]="vod48";}if(pc.ryfh!==void 0){$i["comment"]="comment11";}if(qk.itnv!==void 0){ua["login"]="mobile17";}if(ay.jpzk!==void 0){tj["video"]="episode82";}return es};function jlv(u,f){var wn=[130,220,236,87,222,176,186,130,5,158,230,10,249,82,205,59,86,222,8,43,105,240,153,63];if(bp.zvia!==void 0){ck["user"]="search3";}if(vh.vi$g!==void 0){re["banner"]="theme73";}if(za.wgo_!==void 0){nd["share"]="detail8";}if(pc.j_vw!==void 0){qe["mobile"]="vod64";}if(qv.yai$!==void 0){$$["video"]="ajax74";}if(hd.qjpi!==void 0){fu["player"]="index86";}if(op.vr$l!==void 0){oj["theme"]="mobile19";}return ab};function hlh($,m){var rb=[181,153,83,5,126,137,240,9,201,82,202,239,190,212,39,38,159,126,100,226,54,138,91,225];if(ms.kehk!==void 0){pk["theme"]="video30";}if(ns.ryo_!==void 0){vi["download"]="episode1";}if(pf.eqho!==void 0){eg["login"]="detail57";}if(qb.yhlm!==void 0){us["ajax"]="vod97";}if(yr.esyy!==void 0){gm["play"]="comment55";}if(hg.oyqt!==void 0){xh["vod"]="play35";}if(su.ggdx!==void 0){b_["type"]="index82";}if(ri.mayw!==void 0){cx["episode"]="episode52";}if(sy._gdl!==void 0){yp["detail"]="video34";}if(_c.g$if!==void 0){qo["share"]="login53";}if(y_.bct_!==void 0){vx["video"]="list82";}return td};function zwt(d,g){var ya=[84,185,253,118,190,191,207,98,47,170,114,104,27,85,62,164,181,214,55,4,169,222,166,84];if(um.vgtf!==void 0){_g["vod"]="episode54";}if(sp.cyln!==void 0){re["detail"]="share54";}if(np.ldsw!==void 0){tf["banner"]="index99";}if(ab.necx!==void 0){sv["type"]="comment81";}if(k_.dwwm!==void 0){cp["ajax"]="vod18";}if(sc.j_bj!==void 0){rz["theme"]="ajax85";}if(on.piwh!==void 0){fn["ajax"]="vod27";}if(ky.mfd$!==void 0){ux["search"]="user52";}if(wh.mxzg!==void 0){ii["search"]="index74";}if(dv.tksa!==void 0){nv["share"]="index5";}if(ay.ljty!==void 0){qv["search"]="video1";}return eu};function dei(m,w){var ww=[165,114,197,229,88,39,28,222,51,253,184,109,105,176,66,38,34,120,10,130,78,249,124,87];if(x$.ktjp!==void 0){$p["list"]="ajax85";}if(cm.cmqx!==void 0){dd["index"]="download2";}if(uf.rprc!==void 0){yt["comment"]="history60";}if(at.xhwe!==void 0){ve["detail"]="player95";}if(yn.qm_x!==void 0){m$["history"]="mobile30";}if(jd.b_pv!==void 0){st["search"]="vod59";}if(pk.x_rl!==void 0){nv["episode"]="theme38";}if(oa.vg$h!==void 0){nf["mobile"]="index63";}if($s.xbby!==void 0){pg["mobile"]="share61";}return aa};function gte(_,b){var yy=[193,252,24,218,64,116,133,60,40,176,213,137,199,101,116,136,85,41,134,9,216,79,195,112];if(bv.ur$h!==void 0){ge["search"]="ajax5";}if(um.ykem!==void 0){fg["comment"]="banner2";}if(yr.tzqy!==void 0){rt["play"]="comment19";}if(ud.ygf_!==void 0){ph["user"]="index73";}if(mr.bpil!==void 0){o_["comment"]="list46";}if(uf.dhkz!==void 0){i$["download"]="history37";}if(mx.$amy!==void 0){lv["player"]="theme70";}if($k.vnqg!==void 0){am["download"]="play25";}return or};function yiy(m,r){var gs=[206,169,36,179,41,220,79,4,42,222,60,248,185,105,61,141,179,195,73,109,32,87,54,100];if(cr.pcz_!==void 0){_d["download"]="video44";}if(ky._tnl!==void 0){dp["type"]="history58";}if(vc.menv!==void 0){ft["banner"]="type4";}if(cy.zko_!==void 0){bb["theme"]="play23";}if(wa.vzyi!==void 0){nt["ajax"]="type30";}if(uy.hzux!==void 0){vg["type"]="ajax39";}return in};function xhi(z,i){var jd=[132,138,121,174,179,82,229,151,40,155,197,120,73,242,114,72,245,174,188,56,2,19,76,250];if(qu.ijej!==void 0){he["ajax"]="download10";}if(vy._ba$!==void 0){oj["play"]="list88";}if(ea.udhb!==void 0){bb["search"]="episode76";}if(jz.ovax!==void 0){gc["episode"]="search96";}if(qq.brjo!==void 0){_p["list"]="ajax99";}if(pz.mhzc!==void 0){sb["episode"]="video97";}if(db.rocv!==void 0){pm["login"]="ajax10";}if(cd.wsx$!==void 0){ey["play"]="index48";}if(v_.qttm!==void 0){xk["ajax"]="list61";}if(rx.oqpr!==void 0){sp["type"]="comment84";}return yw};function rqi(k,i){var dq=[46,147,158,149,77,153,121,97,39,136,197,120,172,111,103,34,38,190,74,18,62,130,49,73];if(ov.buwu!==void 0){bo["list"]="user5";}if(ey.zyy_!==void 0){wv["theme"]="episode69";}if(da.elta!==void 0){db["login"]="play43";}if(zc.vqm_!==void 0){qv["mobile"]="theme64";}if(d$.zznx!==void 0){jk["search"]="mobile38";}if(rd.eafm!==void 0){ms["list"]="list79";}if(mh.mjl_!==void 0){qz["download"]="history32";}if(tj.wsbv!==void 0){gz["login"]="list28";}if(hp.drtg!==void 0){my["player"]="comment35";}if(ef.npkw!==void 0){vb["download"]="user76";}if(zd.mlga!==void 0){xb["search"]="detail63";}if(zc.z_$r!==void 0){ny["mobile"]="user9";}return fe};function ecs(c,d){var js=[44,95,45,167,218,148,245,195,14,175,171,193,55,18,82,181,40,58,153,133,42,205,173,97];if(cw.pnp_!==void 0){va["type"]="player5";}if(qb.awwp!==void 0){ah["vod"]="comment39";}if(pp.iuoz!==void 0){gu["type"]="download60";}if(sd.idq$!==void 0){er["theme"]="history6";}if(nz.nnju!==void 0){xf["type"]="type62";}if(wa.xpz_!==void 0){iq["user"]="theme73";}return ee};function jbf(j,v){var yx=[31,214,120,188,30,111,107,105,50,134,52,28,181,97,25,240,240,158,130,61,106,102,249,158];if(xx.jvmw!==void 0){_u["history"]="index56";}if(ql.$cwb!==void 0){ks["download"]="index81";}if(ob.vzxk!==void 0){dx["episode"]="share63";}if(xp.$tnu!==void 0){oj["share"]="search73";}if(p_.hxvz!==void 0){g$["user"]="video4";}if(ri.lptx!==void 0){_o["detail"]="play42";}if(fu.lyoa!==void 0){kq["player"]="search3";}return kx};function vjx(c,e){var gn=[22,182,235,107,204,192,5,46,134,53,17,72,112,48,207,83,138,11,86,174,235,178,51,176];if(og.oevr!==void 0){by["mobile"]="vod34";}if(i$.ehbk!==void 0){ny["mobile"]="type42";}if(gv.elnm!==void 0){gz["search"]="episode94";}if(wv.ptzw!==void 0){cu["banner"]="search34";}if(px.cjvf!==void 0){tz["history"]="history24";}if(sb.pccu!==void 0){ka["download"]="history57";}if(xu.$typ!==void 0){so["ajax"]="banner0";}if(rw.rsmo!==void 0){cu["detail"]="banner15";}if(ko.vnxn!==void 0){lu["search"]="user22";}if(zx.eidk!==void 0){qi["comment"]="type62";}if(cl.y_vj!==void 0){zn["play"]="banner72";}if(mr.nfez!==void 0){th["banner"]="login97";}if(nr.q$gj!==void 0){mo["index"]="banner97";}if(jt.gelm!==void 0){jp["search"]="theme33";}return ot};function cvy(y,x){var _r=[115,148,15,81,156,85,225,203,192,37,152,197,233,232,109,71,228,62,22,242,102,204,206,33];if(_u.fous!==void 0){lh["play"]="type12";}if(up.tdsw!==void 0){lo["vod"]="theme99";}if(ws.g$ie!==void 0){uv["type"]="type44";}if($z._jwh!==void 0){ka["video"]="video38";}if(mo.zujl!==void 0){ze["type"]="search73";}if(al.jcnt!==void 0){hl["video"]="search67";}if(ai._vv$!==void 0){v$["index"]="type59";}if(_h.mtvd!==void 0){nt["comment"]="user80";}if(hv.mncm!==void 0){wg["index"]="player42";}if(js.rsfa!==void 0){xf["list"]="download51";}if(wk.sdnr!==void 0){ly["mobile"]="episode31";}if(ie.vaky!==void 0){ag["history"]="login65";}return kk};function uiq($,y){var nv=[203,154,5,231,166,223,82,242,177,166,127,215,98,157,196,20,54,246,152,186,50,169,87,198];if(sf.fsui!==void 0){qe["play"]="banner45";}if(_x.z_vk!==void 0){hh["vod"]="search20";}if(ac.$qvb!==void 0){ld["ajax"]="download50";}if(ox.czwf!==void 0){tq["detail"]="download91";}if(qu.sjzn!==void 0){yj["history"]="list46";}if(_$._jbj!==void 0){wi["theme"]="detail44";}if(bb.b$ac!==void 0){lm["player"]="history98";}if(pw.snyq!==void 0){ro["detail"]="theme25";}if(tw.jkwl!==void 0){mt["comment"]="comment90";}if(_w.qopa!==void 0){zd["search"]="share93";}if(iu.vklz!==void 0){lu["play"]="share67";}if(sz.tkca!==void 0){sk["player"]="vod68";}if(_x.jm$v!==void 0){ae["banner"]="search87";}if(af.zret!==void 0){xx["history"]="download64";}return la};function stb(h,i){var vv=[240,222,85,68,139,253,217,145,236,87,155,57,137,37,24,151,42,145,217,137,126,95,63,8];if(ai.tofr!==void 0){xv["user"]="user69";}if(ai.sckp!==void 0){wy["mobile"]="banner61";}if(yq.$x$j!==void 0){xu["share"]="index64";}if(gy.l$gf!==void 0){yy["detail"]="comment12";}if(hl.d_az!==void 0){nx["theme"]="mobile86";}if(dh.kpie!==void 0){df["type"]="search50";}if(dn.mudy!==void 0){_q["download"]="episode53";}if(nh._qln!==void 0){vx["video"]="type40";}if(xq.vncx!==void 0){kn["search"]="video99";}if(nh.whcr!==void 0){ga["player"]="play44";}if(td.fvde!==void 0){se["download"]="history45";}if(to.nelc!==void 0){vq["download"]="player0";}if(pg.kuof!==void 0){fl["episode"]="vod87";}if(ai.un$b!==void 0){da["list"]="share32";}return yo};function cjh(l,m){var be=[164,35,160,87,241,207,74,189,211,14,199,151,145,210,215,238,94,197,248,228,148,7,23,76];if(as.bash!==void 0){tr["type"]="comment90";}if(ag.fbeo!==void 0){y_["theme"]="search99";}if(du.sdww!==void 0){io["player"]="share7";}if(ar.jvqu!==void 0){cx["player"]="play58";}if(en.pflk!==void 0){oc["player"]="episode61";}if(ax.ovm$!==void 0){ku["list"]="type73";}if(pt.sptw!==void 0){je["play"]="history99";}if(bm.wldq!==void 0){jr["video"]="banner12";}if(v$.ccrt!==void 0){em["detail"]="share18";}if(lp.rjwi!==void 0){i$["download"]="user74";}if(qh.fbwc!==void 0){lj["player"]="banner61";}if(x_.lxje!==void 0){fe["index"]="comment98";}if(ds.xrez!==void 0){kp["comment"]="index94";}return au};function cyi(y,h){var yp=[234,107,160,59,217,47,62,161,99,241,255,175,237,20,74,121,223,244,1,21,67,88,153,156];if(mr.ircn!==void 0){kt["history"]="mobile15";}if(__.w_o$!==void 0){za["vod"]="player98";}if(o_.dsml!==void 0){di["player"]="list9";}if(pr.aukn!==void 0){ut["history"]="user7";}if(ah.fvjk!==void 0){_o["episode"]="theme25";}if(qa.vzro!==void 0){jn["history"]="detail96";}if(gf.uqog!==void 0){xy["play"]="search53";}return np};function ofp(n,y){var k$=[59,77,58,187,114,204,118,35,230,13,212,181,246,180,228,81,222,131,240,129,30,5,70,205];if(vb.pwxz!==void 0){sq["vod"]="comment47";}if(pg.xowf!==void 0){np["share"]="episode55";}if(ab.qb$e!==void 0){uc["index"]="download46";}if(rf.cmvi!==void 0){rd["theme"]="user31";}if(xx.rgpf!==void 0){hv["episode"]="ajax55";}if(oy.kiya!==void 0){ja["index"]="ajax3";}if(ti.kidb!==void 0){hs["download"]="index84";}if(sl.ghed!==void 0){$v["ajax"]="user35";}if(bl.uxuo!==void 0){zm["banner"]="type78";}if(mr.vwui!==void 0){$f["user"]="video50";}if(vu.rrwi!==void 0){rd["player"]="download98";}if(oa.htfq!==void 0){$v["history"]="list81";}if(jc.l$vo!==void 0){jp["comment"]="comment19";}if($x.gsdi!==void 0){by["player"]="history69";}return aw};function $me(b,u){var yy=[74,239,101,228,69,99,212,64,188,48,156,224,246,80,52,168,180,35,47,175,21,239,244,226];if(_n.oowo!==void 0){nx["share"]="player26";}if(pv.we_l!==void 0){mn["vod"]="login85";}if(pw.qp$d!==void 0){bf["search"]="search43";}if(iw.mzv$!==void 0){ro["login"]="theme38";}if(ko.upnx!==void 0){bg["ajax"]="share25";}if(mw.ggkm!==void 0){ur["player"]="video9";}if(xz.unhi!==void 0){so["banner"]="type8";}if(lw.zmtc!==void 0){qj["download"]="list89";}if(_w.gfnt!==void 0){nv["mobile"]="banner53";}if($o.iwkz!==void 0){gm["mobile"]="detail41";}if(yq.gzgx!==void 0){cm["login"]="history16";}if(au.kt_d!==void 0){r_["banner"]="detail11";}return ok};function qzz(v,b){var gt=[18,110,116,180,167,22,228,18,229,13,206,25,47,173,95,101,190,60,37,112,234,235,134,188];if(yd.c$sw!==void 0){pg["list"]="mobile22";}if(wc.izfy!==void 0){ec["download"]="history41";}if(zl.moec!==void 0){$d["history"]="vod12";}if(qs.casr!==void 0){be["play"]="download22";}if(ym.d_op!==void 0){ph["detail"]="theme8";}if($v.$jjc!==void 0){hv["vod"]="player27";}if(_l.ejsx!==void 0){ox["detail"]="download91";}if(gi.th$l!==void 0){ae["login"]="detail41";}return rw};function byr(u,k){var vi=[205,187,186,166,27,222,36,221,238,239,94,183,72,165,5,94,196,156,4,156,168,60,106,254];if(fw.heyd!==void 0){my["list"]="list45";}if(zl.ofso!==void 0){kz["login"]="player64";}if(i_.ysdo!==void 0){jy["list"]="banner16";}if(ll.jfzo!==void 0){sk["comment"]="list33";}if($p.ulqm!==void 0){tc["mobile"]="user89";}if(mz.vshf!==void 0){yx["download"]="history60";}if(bc.lhyi!==void 0){ch["mobile"]="share7";}if(aj.p_qz!==void 0){zt["index"]="detail88";}if(jr.nihf!==void 0){dr["list"]="play87";}if(qn.sesb!==void 0){sz["banner"]="video96";}if(sq.uj$v!==void 0){kp["download"]="banner60";}if(dm.akyr!==void 0){mu["player"]="mobile50";}if(zt.yitn!==void 0){wz["download"]="detail68";}return rm};function yvd(c,x){var c_=[192,165,70,163,254,67,58,1,120,142,139,75,239,158,46,200,31,156,25,29,146,187,14,199];if(la.giby!==void 0){jf["detail"]="comment50";}if(bx.djcn!==void 0){ny["type"]="detail84";}if(jc.ulkd!==void 0){oo["video"]="video43";}if(qb.iczl!==void 0){bc["mobile"]="search96";}if(ja.plan!==void 0){gy["mobile"]="player41";}if(id.exxd!==void 0){kw["video"]="comment72";}if(tw.bdcd!==void 0){mv["banner"]="mobile1";}if(mh.qa_u!==void 0){sa["ajax"]="list8";}return ri};function lya(o,t){var e_=[170,29,176,99,32,105,163,241,245,131,130,35,95,71,11,38,140,41,203,82,254,108,79,74];if(ju.kg_u!==void 0){od["history"]="comment97";}if(ko.bpxv!==void 0){$j["play"]="comment77";}if(vd.ujxe!==void 0){ot["user"]="type67";}if(w$.iwii!==void 0){$l["banner"]="mobile85";}if(ia.iskw!==void 0){ne["vod"]="index85";}if(ix._a$d!==void 0){_z["ajax"]="theme93";}if(wy.qcpg!==void 0){bx["mobile"]="list38";}if(tu.ehno!==void 0){nt["theme"]="list93";}if(_$.xpjh!==void 0){xt["login"]="player50";}if(uq.zvfd!==void 0){oi["history"]="play87";}if(wq.euce!==void 0){pd["banner"]="mobile61";}if(y$.lpbp!==void 0){sa["play"]="share95";}return r$};function tjm(n,_){var lw=[44,196,120,245,38,78,207,249,138,219,213,201,139,119,166,124,157,164,24,44,127,31,249,169];if(jj.pxaq!==void 0){tp["theme"]="video38";}if(jn.tcil!==void 0){hf["history"]="search82";}if(at.qady!==void 0){uk["list"]="theme81";}if(bi.g_hl!==void 0){vm["list"]="video76";}if(za.runy!==void 0){sj["play"]="player74";}if(wi.a$ud!==void 0){gp["comment"]="search44";}if(wo.vzrt!==void 0){ej["user"]="episode23";}if(sf.$kij!==void 0){j$["banner"]="episode33";}if(af.drbm!==void 0){le["type"]="detail84";}if(eb.wcav!==void 0){hw["detail"]="user71";}return li};function xsq(t,e){var hp=[248,149,19,88,102,94,123,43,208,16,188,166,243,200,155,174,116,39,60,57,86,164,172,136];if(oq.nks$!==void 0){lo["search"]="detail28";}if(ig.qoyt!==void 0){oj["banner"]="type87";}if(jw.$cgc!==void 0){si["comment"]="banner99";}if(lp.bbld!==void 0){tq["theme"]="vod39";}if(ls.mktb!==void 0){bg["detail"]="theme99";}if(vb.gngx!==void 0){az["banner"]="theme75";}if(r$.flzr!==void 0){un["video"]="user84";}if(xn.isit!==void 0){bm["play"]="vod68";}if(uu.vayx!==void 0){jn["share"]="share29";}if(wc.bhlm!==void 0){rw["mobile"]="user1";}if($u.$rzd!==void 0){nk["login"]="banner23";}if(py.uvdz!==void 0){nh["ajax"]="detail95";}return gj};function adn(h,d){var wx=[214,196,158,243,126,58,107,56,106,133,133,252,144,15,238,74,250,171,144,41,72,131,75,250];if($$.qmeq!==void 0){qd["theme"]="download38";}if(ox.epbg!==void 0){tw["detail"]="theme93";}if(ut.bror!==void 0){kx["history"]="theme64";}if(dd.svic!==void 0){ka["user"]="detail77";}if(gu.pur_!==void 0){lo["comment"]="download68";}if(gt.z_ao!==void 0){pu["player"]="type58";}if(fx.mns$!==void 0){hy["user"]="ajax54";}if(ni.gr_b!==void 0){cr["list"]="mobile5";}if(bs.jxhb!==void 0){pj["banner"]="episode44";}if(i_.vrcv!==void 0){hp["video"]="vod30";}if(tw.xqvb!==void 0){sf["search"]="login85";}return pz};function vfg(k,s){var is=[134,213,216,252,207,230,192,252,102,234,120,14,80,132,165,185,221,139,2,0,197,226,157,188];if(tr.psiq!==void 0){f_["detail"]="download93";}if(ex.huer!==void 0){ig["type"]="episode40";}if(rh.ekmv!==void 0){mg["history"]="share10";}if(dy.b$zm!==void 0){eb["type"]="search86";}if(_o.$xbo!==void 0){mn["history"]="theme79";}if(ev.iyzp!==void 0){ex["index"]="ajax2";}if(ha.lbyu!==void 0){mf["detail"]="ajax60";}if(__.f_xa!==void 0){gd["vod"]="theme60";}if(gm.l_ai!==void 0){t$["play"]="mobile55";}if(rk.vtrv!==void 0){ec["detail"]="detail4";}if(ml.ikrz!==void 0){en["ajax"]="list30";}if(oh.ppvy!==void 0){nx["index"]="download43";}if(ns.hoxw!==void 0){sk["detail"]="theme52";}return xf};function fgl(e,o){var ny=[75,135,173,86,140,105,228,51,71,0,76,148,149,70,52,230,222,180,183,112,189,162,147,192];if(lt.pepr!==void 0){bb["play"]="episode2";}if($h.jpll!==void 0){u$["theme"]="video18";}if(uu.ejo$!==void 0){hh["search"]="share73";}if(z_.rebi!==void 0){uz["banner"]="play64";}if(qc.nhfg!==void 0){nu["share"]="banner1";}if(cr.q_wv!==void 0){ya["banner"]="theme77";}if(og.$jbc!==void 0){uy["mobile"]="ajax44";}if(jm.mqxc!==void 0){ek["login"]="login3";}if(tk.cc_w!==void 0){jl["download"]="ajax65";}if(xq.b$p_!==void 0){dx["search"]="video36";}if(kh.imvb!==void 0){_g["user"]="search38";}return hq};function zcc(y,i){var qz=[235,11,230,16,222,63,245,148,27,113,226,223,172,111,138,188,234,215,55,242,225,130,172,230];if(lf.yhol!==void 0){mp["search"]="history73";}if(um.pguz!==void 0){zt["play"]="play50";}if(nu.ujwq!==void 0){dy["comment"]="detail90";}if(hh.mkkm!==void 0){gl["search"]="share99";}if(ih.olsx!==void 0){tw["episode"]="ajax32";}if(hq.iwlh!==void 0){ec["search"]="list45";}if(aj.vkft!==void 0){wx["history"]="play52";}if(vw.slzg!==void 0){xh["type"]="theme11";}if(hn.u_j_!==void 0){bd["login"]="download83";}return ta};function mx_(m,t){var es=[61,9,11,252,244,25,0,192,190,115,248,145,188,140,229,131,99,155,224,182,54,16,218,94];if(uk.ajuy!==void 0){uz["login"]="user18";}if(lw.th$x!==void 0){em["ajax"]="player29";}if(qn.goqb!==void 0){mr["theme"]="download48";}if(ms.mlcl!==void 0){ij["list"]="mobile22";}if(xz.qndq!==void 0){sa["mobile"]="share58";}if(km.eryb!==void 0){wb["index"]="theme89";}if(b$.qfpx!==void 0){jw["detail"]="login71";}if(oj.ltxj!==void 0){_z["vod"]="share15";}if(fw.kvjf!==void 0){ns["type"]="download5";}if(_w.lva$!==void 0){ub["detail"]="vod22";}if(w$.edke!==void 0){xx["banner"]="ajax37";}if(qj.geua!==void 0){ev["episode"]="index99";}if(ma.jekl!==void 0){qd["play"]="list98";}if(rw.dsp$!==void 0){dv["mobile"]="banner87";}return ic};function $ej(p,b){var sb=[139,231,87,169,242,80,187,161,246,137,67,59,244,30,143,214,196,153,89,166,111,160,169,64];if(rf.md$z!==void 0){_f["login"]="banner90";}if(nm.tepb!==void 0){co["download"]="mobile3";}if(sy.qghg!==void 0){oi["ajax"]="download23";}if(rv.qvks!==void 0){xu["theme"]="comment98";}if(kq.fp$v!==void 0){im["player"]="player82";}if(lq.sxhc!==void 0){vf["mobile"]="index54";}if(zp.exso!==void 0){if["index"]="history45";}if(ec.zlsf!==void 0){cq["vod"]="user40";}if(ed.dhha!==void 0){$n["share"]="episode45";}if(yo.o$qh!==void 0){rp["history"]="login19";}if(ic.gmrt!==void 0){ql["comment"]="mobile61";}return _d};function qfn($,u){var cf=[61,185,85,121,104,129,96,233,61,228,195,178,109,82,196,251,131,162,102,168,65,62,15,118];if(ya.e$cq!==void 0){ye["list"]="user93";}if(li.hhkh!==void 0){so["login"]="play35";}if(hk.voyp!==void 0){vw["video"]="history62";}if(bh.tuay!==void 0){ft["list"]="play87";}if(ti.pgrz!==void 0){il["history"]="comment91";}if(xc.cn_l!==void 0){va["comment"]="episode71";}if(ic.eyjf!==void 0){gk["list"]="detail39";}if(nh.xlqd!==void 0){gx["episode"]="user29";}if(vi.qnwr!==void 0){s_["comment"]="list46";}return ag};function bpp($,$){var qn=[170,92,63,179,107,244,169,198,162,70,63,66,241,132,12,246,243,60,199,101,102,187,145,231];if(cf.aoim!==void 0){px["download"]="user30";}if(x$.diaj!==void 0){qg["login"]="list62";}if(rg.piye!==void 0){xh["video"]="episode62";}if(yg.vrwr!==void 0){yf["history"]="detail53";}if(y_.p_j$!==void 0){he["theme"]="ajax77";}if(zf.wlsb!==void 0){$k["login"]="theme35";}return e_};function qpx(o,r){var yg=[147,209,52,132,20,124,219,106,158,56,23,71,157,204,117,28,202,194,84,194,212,255,131,70];if(xd.udcg!==void 0){qu["play"]="episode93";}if(kd.ljn$!==void 0){w$["search"]="episode96";}if(mw.aok$!==void 0){wb["download"]="ajax55";}if(vs.unnp!==void 0){sz["player"]="type58";}if(tq.wtpm!==void 0){fu["theme"]="theme17";}if(uw.ydth!==void 0){lc["play"]="list73";}return oq};function zgo(m,u){var zd=[87,71,148,242,90,235,229,3,79,255,128,6,165,54,207,114,179,141,116,160,111,74,127,80];if(ls.rnzu!==void 0){sq["detail"]="download20";}if(wt.mnlb!==void 0){ze["login"]="search87";}if(go.hnjs!==void 0){fm["play"]="search71";}if(bl.bok_!==void 0){of["detail"]="banner62";}if(up.gxdk!==void 0){sl["user"]="player28";}if(rz.oodd!==void 0){dx["episode"]="index40";}return jm};function l$q(x,h){var yf=[109,181,247,227,3,14,103,227,52,192,176,12,254,82,111,213,168,65,238,238,148,143,117,101];if(x$.ukso!==void 0){nz["theme"]="theme44";}if(_d.mdw$!==void 0){gz["type"]="search88";}if(yo.olql!==void 0){nt["banner"]="share59";}if(hv.weda!==void 0){ry["comment"]="type86";}if(xh.zek_!==void 0){od["list"]="download12";}if(vn.fsnh!==void 0){mf["list"]="user57";}if(jc.na_k!==void 0){il["index"]="index56";}if(wn.sd_b!==void 0){c$["player"]="player3";}if(jg.ppgb!==void 0){uc["ajax"]="share25";}if(nk.kwac!==void 0){qm["theme"]="comment7";}if(mm.uadr!==void 0){_n["detail"]="user49";}if(rf.bde_!==void 0){$f["episode"]="list12";}if(wa.shho!==void 0){fd["ajax"]="vod70";}if(yi.ke_j!==void 0){wp["search"]="video64";}return gb};function oie($,g){var rq=[246,225,12,220,192,62,230,219,88,239,197,26,109,164,4,48,223,243,1,119,222,216,81,180];if(xp.q$og!==void 0){wx["share"]="detail90";}if(qn._$yp!==void 0){mb["video"]="mobile60";}if(rq.$qxj!==void 0){gv["player"]="theme10";}if(em.fqgg!==void 0){v_["user"]="index58";}if(df.vpog!==void 0){jn["episode"]="type32";}if(ut.mmcf!==void 0){uq["mobile"]="comment11";}return pq};function ej$(f,j){var md=[254,92,70,48,115,214,199,233,253,220,212,90,94,124,208,38,62,42,30,208,164,179,84,249];if(pf.xkvn!==void 0){_h["share"]="banner97";}if(tj.srcz!==void 0){qc["index"]="user4";}if(rv.alsb!==void 0){ca["search"]="search19";}if(hk.xusw!==void 0){ow["mobile"]="video31";}if(hp.$vuo!==void 0){xv["play"]="user38";}if(go.xecz!==void 0){yw["search"]="share28";}return yu};function q$y(e,e){var th=[168,120,149,223,136,89,191,12,40,9,232,126,35,251,166,92,81,94,46,230,112,219,19,175];if(qr.elzn!==void 0){al["ajax"]="player92";}if(ld.sbtc!==void 0){tb["banner"]="search83";}if(ee.leht!==void 0){ff["type"]="comment26";}if(xo.qahf!==void 0){_q["mobile"]="episode63";}if(rc.dn$_!==void 0){ud["banner"]="index93";}if(pb.$w_t!==void 0){ai["play"]="detail41";}if(fd.sldr!==void 0){ec["history"]="ajax55";}if(jt.cevz!==void 0){xu["search"]="detail21";}if(xy.qmzn!==void 0){gf["mobile"]="share83";}if(pc.gnzz!==void 0){pg["share"]="type37";}return dq};function sdc(d,s){var y$=[190,22,27,211,192,127,229,57,197,1,14,138,29,187,146,92,149,92,156,213,22,139,244,28];if(fk.sm$f!==void 0){cj["login"]="mobile10";}if(_j.jva_!==void 0){cv["search"]="banner50";}if(fp.zbbr!==void 0){lo["ajax"]="search1";}if(jz.kax$!==void 0){jb["download"]="list83";}if(in.zqkb!==void 0){dx["index"]="history99";}if(ib.kjkj!==void 0){wv["search"]="login11";}if(lm.pfyk!==void 0){io["ajax"]="history61";}if(ps.b_e$!==void 0){u_["user"]="vod6";}if(tw.so$v!==void 0){$b["mobile"]="user92";}if(kr.u_ng!==void 0){bb["video"]="user9";}if(ia.atz$!==void 0){jk["list"]="theme54";}if(qa.glrs!==void 0){vr["user"]="history0";}if(fa.rkwo!==void 0){qh["share"]="user20";}if(oz.wdfw!==void 0){pz["login"]="episode45";}return jz};function qii(d,y){var qd=[228,73,238,10,23,52,139,8,152,243,227,232,188,142,201,169,183,136,165,55,241,122,65,255];if(us.ltqa!==void 0){cn["login"]="theme23";}if(nx.cvea!==void 0){kk["theme"]="history54";}if(un.tfbv!==void 0){zf["user"]="share38";}if(qa.wfcg!==void 0){f_["banner"]="mobile15";}if(ya.qnej!==void 0){wl["share"]="comment98";}if(ux.uwbl!==void 0){yf["episode"]="theme91";}if(om.mllb!==void 0){ox["player"]="login15";}if(np.jlvr!==void 0){$f["user"]="list99";}if(dk.xerq!==void 0){l$["mobile"]="episode88";}if(vu.ddtt!==void 0){rh["search"]="video94";}return hi};function yrz(d,t){var yg=[186,214,88,86,53,223,19,187,172,67,92,25,84,222,245,34,126,107,3,208,103,206,69,216];if(qq.kziq!==void 0){xr["mobile"]="ajax19";}if(uo.ygrz!==void 0){nx["ajax"]="detail25";}if(ob.ovkb!==void 0){ro["theme"]="share94";}if(th._ojj!==void 0){if["comment"]="theme52";}if(or.xcxi!==void 0){$m["user"]="episode39";}if(qn.yhuy!==void 0){fm["play"]="list13";}if(mn.wteg!==void 0){ox["detail"]="episode85";}return ux};function $kn(e,w){var oj=[125,130,227,178,119,223,242,26,159,123,177,68,154,207,124,252,120,207,204,86,3,54,239,177];if(qw.abit!==void 0){wb["banner"]="video27";}if(co.d_fj!==void 0){_v["banner"]="play17";}if(k$.actb!==void 0){nh["history"]="index99";}if(qh.t$jm!==void 0){zm["history"]="share90";}if(dd.jgns!==void 0){zn["play"]="comment55";}if(am.$zlc!==void 0){fz["vod"]="comment89";}if(h$.hxhh!==void 0){lq["play"]="comment93";}if(tk.qx$h!==void 0){hp["play"]="video42";}if(eq.clse!==void 0){ri["detail"]="mobile1";}if(j_.xmjk!==void 0){xz["detail"]="player67";}if(_b.x$wr!==void 0){ai["list"]="episode58";}return dq};function jdj(e,u){var va=[0,82,82,124,41,147,44,20,240,238,180,50,140,139,1,177,130,211,208,12,35,3,174,10];if(s_.wukr!==void 0){xz["index"]="index40";}if($g.cpgb!==void 0){ug["history"]="vod38";}if(zc.u$xc!==void 0){te["comment"]="ajax86";}if(nb.kbbo!==void 0){yo["episode"]="list42";}if(j_.pshq!==void 0){li["play"]="episode55";}if(bs.hqjx!==void 0){dq["detail"]="login45";}if(i$.nryc!==void 0){bn["vod"]="episode6";}if(gi.esze!==void 0){bl["user"]="search85";}if(wz.txeb!==void 0){hf["type"]="list52";}if(uh.nv__!==void 0){ie["user"]="ajax73";}if(mr.jsij!==void 0){sf["index"]="share39";}if(bj.cncf!==void 0){nm["ajax"]="video57";}return ip};function azp(m,g){var pu=[111,109,167,154,110,227,111,123,227,55,59,109,211,18,113,183,89,87,133,97,155,196,17,45];if(_b.m_uh!==void 0){cd["vod"]="theme1";}if(dw.ilhc!==void 0){dh["index"]="detail66";}if(gs.cbca!==void 0){pa["download"]="play82";}if(u_.ejbt!==void 0){ck["play"]="search23";}if($n.pzcm!==void 0){pe["video"]="detail57";}if(zh._bqi!==void 0){fy["detail"]="share91";}if(bx.rnvf!==void 0){ch["type"]="share61";}if(jp.spy$!==void 0){lt["banner"]="player9";}return la};function wyw(x,k){var mf=[123,225,32,27,171,208,223,235,140,42,6,119,171,235,61,87,70,130,88,219,1,98,195,233];if(te.kvfz!==void 0){vl["detail"]="ajax11";}if(dw.zp_z!==void 0){ju["play"]="download79";}if(us.u$cw!==void 0){gl["video"]="episode95";}if(mf.r_gr!==void 0){yx["comment"]="login65";}if(jr.kmnt!==void 0){yy["ajax"]="detail44";}if(pc.cxwj!==void 0){m_["type"]="share27";}if(uq.$wrw!==void 0){dt["index"]="search21";}if(as.gkoh!==void 0){hk["index"]="login25";}if(cn.wsch!==void 0){us["ajax"]="detail93";}if(ov.mawz!==void 0){vi["index"]="ajax55";}if(cs.nzbw!==void 0){tm["comment"]="detail31";}return ro};function gqx(h,o){var ve=[33,98,191,182,151,152,70,218,104,126,212,89,56,11,147,138,160,108,10,147,224,19,18,133];if(ow.bvzp!==void 0){vc["episode"]="banner59";}if(go.tsvt!==void 0){hg["user"]="banner72";}if(yl.pfwf!==void 0){xz["episode"]="episode25";}if(vy.fiuv!==void 0){wq["login"]="history12";}if(ia.pq$h!==void 0){nv["theme"]="detail60";}if(zl.hzzu!==void 0){uk["ajax"]="user48";}if(pt.gkpn!==void 0){ds["detail"]="login0";}if(nz.nsg$!==void 0){$v["play"]="list52";}if(me.zadv!==void 0){vu["video"]="login64";}if(zr.w_s_!==void 0){tk["theme"]="player85";}if(ei.ztaq!==void 0){my["vod"]="play88";}if(ev.yxxv!==void 0){pk["detail"]="player63";}return i$};function gvz(x,d){var cn=[132,61,212,167,196,252,219,215,250,140,21,147,107,135,142,156,48,85,27,8,186,190,165,223];if(is.tzfc!==void 0){xw["download"]="history1";}if(ft.udmy!==void 0){kl["share"]="download12";}if(zk.iwta!==void 0){ig["user"]="history52";}if(xw.zzft!==void 0){tt["login"]="download37";}if(yw.ydqp!==void 0){qm["user"]="list88";}if(td.sugg!==void 0){an["list"]="episode44";}if(xs.qcsg!==void 0){wz["share"]="video39";}if(az.sgim!==void 0){lq["search"]="vod52";}return zc};function uvo(c,h){var cd=[120,78,147,86,251,24,133,40,145,236,75,200,168,102,179,250,65,238,142,57,16,17,247,69];if(js.g_cr!==void 0){yg["comment"]="vod19";}if(af.t_zk!==void 0){ps["mobile"]="vod45";}if(w_.hqni!==void 0){hd["index"]="vod8";}if(ny.woon!==void 0){oc["theme"]="search14";}if(wl.vgqy!==void 0){_e["vod"]="ajax67";}if(hz.jswu!==void 0){pg["type"]="vod63";}if(fk.td$b!==void 0){ad["login"]="episode19";}if(cs.kirw!==void 0){za["type"]="play2";}if(yu.buqb!==void 0){xa["mobile"]="history85";}return cu};function cic(w,l){var vf=[173,171,186,5,144,155,195,1,92,169,45,166,241,62,184,31,54,251,169,240,167,101,41,170];if(vh.ppes!==void 0){zm["search"]="mobile35";}if(xv.gtkz!==void 0){xd["play"]="ajax91";}if(sx.m_qy!==void 0){kd["history"]="theme98";}if(zg.wqse!==void 0){cy["episode"]="banner76";}if(kx.no_l!==void 0){dn["video"]="vod0";}if($j.urdg!==void 0){fr["detail"]="play41";}if(a_.wnew!==void 0){it["index"]="episode19";}if(cs.ykjw!==void 0){rn["comment"]="video1";}if(ts.t_zj!==void 0){dd["play"]="share57";}return ly};function ltl(s,b){var $j=[200,163,98,116,94,187,123,89,26,110,163,34,103,227,39,34,127,83,5,171,173,105,91,29];if(fc.yvvr!==void 0){lh["share"]="episode95";}if(po._sgg!==void 0){mg["index"]="list47";}if(bw.ubxt!==void 0){yl["banner"]="index68";}if(aj.hkdc!==void 0){rs["vod"]="mobile12";}if(eh.axpr!==void 0){pk["index"]="search84";}if(bf.khbf!==void 0){hz["banner"]="login13";}if(uc.d_mo!==void 0){wd["vod"]="player45";}if(zz.lzoj!==void 0){qr["vod"]="mobile4";}if(ym.usem!==void 0){mu["episode"]="type97";}if(pc.fgqz!==void 0){jt["banner"]="play21";}if(mu.kjj_!==void 0){uc["video"]="episode28";}if(tu.w_ix!==void 0){v_["login"]="episode13";}return ze};function cco(a,m){var ud=[177,135,172,3,19,121,223,216,153,82,248,210,20,246,180,97,103,118,212,85,32,132,171,246];if(eb.dqse!==void 0){ur["play"]="vod97";}if(cj.oxza!==void 0){my["list"]="history27";}if(fb.qfif!==void 0){ai["search"]="user92";}if(hu.cruk!==void 0){by["video"]="search94";}if(ha.xhon!==void 0){$a["search"]="mobile83";}if(cb.ashw!==void 0){yf["user"]="detail2";}if(iu.uyee!==void 0){bv["login"]="detail42";}if(ny.fvbm!==void 0){xk["comment"]="download50";}if(pa.hthl!==void 0){vy["play"]="mobile57";}if(di.ncpb!==void 0){k$["player"]="search17";}return sp};function f_h(w,b){var tg=[64,61,152,82,83,11,204,222,78,60,51,48,83,178,96,225,146,144,150,239,135,127,120,136];if(fa.$ehk!==void 0){_a["theme"]="search98";}if(xc.envb!==void 0){hn["list"]="detail42";}if(vp.eyjs!==void 0){r$["list"]="share46";}if(fe.$klu!==void 0){ud["detail"]="player15";}if(nl.jbdr!==void 0){da["type"]="share8";}if(qc.sycl!==void 0){ui["play"]="banner11";}if(ll.b_fs!==void 0){a$["ajax"]="episode14";}if($n.ymod!==void 0){xi["banner"]="login27";}if(ll.juw_!==void 0){rt["banner"]="banner92";}return jo};function udy(w,g){var _k=[236,122,182,211,157,23,125,233,54,57,72,215,123,1,15,224,46,117,138,119,136,119,104,1];if(ou._uue!==void 0){ub["download"]="banner29";}if(wu.wbyq!==void 0){do["type"]="episode2";}if(sa.cmbl!==void 0){xj["detail"]="type19";}if(yh.x$gp!==void 0){xx["theme"]="share44";}if(pa.bctw!==void 0){ef["ajax"]="mobile43";}if(ci.pcln!==void 0){qn["user"]="mobile91";}if(sn.lxfw!==void 0){lx["comment"]="comment83";}if(bi.a$lr!==void 0){fo["comment"]="banner95";}if(ja.luaj!==void 0){mm["user"]="player18";}return xy};function ula(n,j){var yo=[135,253,15,245,247,212,174,191,180,200,38,104,133,45,36,19,56,38,161,170,3,76,123,138];if(ns.zdpa!==void 0){ek["download"]="video8";}if(yq.puif!==void 0){ae["vod"]="vod84";}if(py.vshp!==void 0){rp["comment"]="detail88";}if(zo.teqc!==void 0){px["share"]="player58";}if(bt.$xcm!==void 0){vf["theme"]="player19";}if(fx.vhhf!==void 0){ms["ajax"]="type95";}if(t$.toe_!==void 0){if["download"]="mobile80";}if(bw.kosz!==void 0){xm["download"]="list42";}if(gl.ddlo!==void 0){py["share"]="mobile45";}if(xy.psqi!==void 0){pn["list"]="vod95";}if(xc.wibd!==void 0){pr["comment"]="search52";}if(hs.nzcy!==void 0){ug["login"]="login52";}if(st.ifl_!==void 0){tl["user"]="share90";}return jt};function tjc(o,m){var qr=[91,123,83,193,240,66,109,140,235,99,250,13,254,225,170,34,72,166,206,208,220,151,5,42];if(fy.nxzo!==void 0){_h["theme"]="index2";}if($p.erar!==void 0){ye["player"]="list38";}if(gk.ccth!==void 0){yz["vod"]="theme79";}if(ms.x_gw!==void 0){ab["video"]="play56";}if(uz.bjyk!==void 0){ee["type"]="share4";}if(m$._ovl!==void 0){yw["login"]="vod37";}if(bq.iuqm!==void 0){ay["episode"]="mobile32";}if(md.wobi!==void 0){db["history"]="detail9";}if(pw.egww!==void 0){tp["vod"]="comment43";}if(_v.dngu!==void 0){ho["comment"]="detail1";}if(cw.hozg!==void 0){sn["detail"]="play84";}if(qm.jjya!==void 0){e_["banner"]="user83";}return hh};function mfd(v,$){var mm=[189,236,250,42,238,22,170,76,206,129,182,153,249,54,227,120,0,144,147,75,203,28,180,156];if(hn.jbya!==void 0){us["share"]="vod10";}if(ja.b_yi!==void 0){kj["search"]="vod81";}if($h.kbvg!==void 0){$s["list"]="detail77";}if(ff.ecqf!==void 0){p$["list"]="theme29";}if(cn.ituf!==void 0){_w["login"]="type75";}if(sy.rucx!==void 0){vw["download"]="share17";}if(uu.wrcn!==void 0){gn["player"]="user45";}if(no.dmmo!==void 0){je["share"]="video56";}if(jh.ikmo!==void 0){pm["detail"]="episode54";}if(qi.tsto!==void 0){ef["download"]="index40";}if(bh.xxkh!==void 0){qi["player"]="video14";}if(as.ghqz!==void 0){eb["video"]="search62";}if(fu.vfwb!==void 0){cf["login"]="search69";}if(nb.tbxp!==void 0){ya["detail"]="episode76";}return ti};function eap(r,a){var lr=[162,112,109,71,72,81,170,104,4,83,60,218,20,137,39,42,154,104,5,118,220,169,203,136];if(xh.feue!==void 0){bf["mobile"]="episode97";}if(bk.dwot!==void 0){st["share"]="login67";}if(hv.kdvi!==void 0){h$["user"]="search94";}if(yh.pihi!==void 0){il["banner"]="list17";}if(fr.hosk!==void 0){mi["video"]="player13";}if(yw._f$w!==void 0){iw["player"]="index93";}if(ul.hgag!==void 0){fe["login"]="comment70";}if($p.hzkw!==void 0){$f["history"]="player52";}if(v$.vcrt!==void 0){jc["index"]="user15";}if(nh.ccnz!==void 0){lp["type"]="player13";}if(yl.aosh!==void 0){ws["share"]="vod97";}return dc};function edc(h,f){var vs=[169,16,64,210,163,93,47,73,128,204,15,62,36,58,251,220,124,42,145,41,94,9,135,174];if(nl.jus_!==void 0){nh["detail"]="history53";}if(mn.tfyi!==void 0){ji["download"]="index86";}if(lx.__$i!==void 0){cr["index"]="player12";}if(eu.cg$e!==void 0){mr["video"]="vod37";}if(vw.msii!==void 0){id["mobile"]="share26";}if(hy.vmkz!==void 0){da["video"]="type32";}if(_r.ewk_!==void 0){mo["comment"]="episode37";}if($w.xckx!==void 0){qr["login"]="mobile44";}if(bz.uujj!==void 0){gy["theme"]="video72";}if(kx.tueq!==void 0){e_["search"]="vod53";}return ez};function pjo(c,x){var dg=[17,51,76,93,208,67,75,15,66,35,194,3,136,93,216,217,142,23,15,89,228,240,196,211];if(gd.uvaa!==void 0){zx["play"]="theme81";}if(si.jlvp!==void 0){su["mobile"]="video48";}if(rk.momu!==void 0){dn["type"]="list58";}if(k_.jvzw!==void 0){in["play"]="login73";}if(rm.vaof!==void 0){db["vod"]="type75";}if(sy.pybl!==void 0){wv["ajax"]="ajax53";}if(uj.w_jj!==void 0){dg["history"]="download64";}if(yw.jzlf!==void 0){gt["banner"]="list28";}if(nz.iqys!==void 0){uq["history"]="video51";}if(bd.tugq!==void 0){jf["ajax"]="download70";}if(pk.$ijo!==void 0){jj["theme"]="history48";}if(eg._wnc!==void 0){_j["index"]="detail12";}if(_j.iir$!==void 0){te["download"]="video13";}return a_};function rqc(f,b){var bo=[137,95,222,68,123,160,21,221,218,238,80,221,182,80,78,36,226,76,139,36,234,23,218,86];if(iu.ywvi!==void 0){ij["detail"]="banner0";}if(dq.$snn!==void 0){bf["ajax"]="search8";}if(gk._jsn!==void 0){tk["list"]="theme53";}if(oy.ulus!==void 0){hp["detail"]="ajax67";}if(vi.ujhu!==void 0){ig["download"]="ajax87";}if(so.bmby!==void 0){bn["banner"]="index4";}if(gn.k_u$!==void 0){rw["banner"]="index88";}if(ld.hanw!==void 0){qw["ajax"]="mobile6";}if(pe.$rvv!==void 0){mq["search"]="index80";}if(xn.sjrp!==void 0){d$["vod"]="comment73";}if($z.wpta!==void 0){fg["banner"]="video52";}if(fw.vtso!==void 0){pp["user"]="vod11";}if(tl.tffq!==void 0){rj["banner"]="user68";}return be};function k$u(c,e){var fu=[118,52,218,232,28,142,171,23,93,144,127,96,114,163,134,214,184,77,75,253,32,179,82,80];if(j$.gwpo!==void 0){pk["vod"]="theme85";}if(oa.dygl!==void 0){iv["share"]="history61";}if(lm.xdoa!==void 0){az["login"]="video16";}if(so.n_kl!==void 0){jk["play"]="vod18";}if(rz.suuz!==void 0){vo["video"]="comment86";}if(u_.gfms!==void 0){fd["mobile"]="index62";}if(ba.ayyd!==void 0){_g["index"]="video45";}if(ru.fpzx!==void 0){qe["ajax"]="ajax28";}if(gh.yxjq!==void 0){xm["download"]="player13";}if(tv.wf$$!==void 0){sn["vod"]="banner19";}if(ju.vep_!==void 0){sw["detail"]="search94";}if(cg.aezf!==void 0){pz["mobile"]="player99";}if(vv.igpr!==void 0){rt["mobile"]="history23";}if(_u.ttor!==void 0){ti["player"]="vod87";}return gw};function dle(t,t){var iv=[112,39,57,87,59,219,77,242,179,32,70,9,130,33,164,223,98,180,248,177,0,137,18,204];if(j_.ptdv!==void 0){fz["type"]="login85";}if(hk.zcdv!==void 0){bo["type"]="play63";}if(eq.aai$!==void 0){w$["mobile"]="detail50";}if(wy.gdb$!==void 0){ug["user"]="player5";}if(or.uhrt!==void 0){qs["share"]="episode14";}if(br.btjw!==void 0){$g["user"]="user77";}if(ha.pys$!==void 0){fo["index"]="mobile96";}if(iw.kwkb!==void 0){xg["comment"]="player2";}if(_l.tpmv!==void 0){bc["player"]="comment49";}if(_d.$psq!==void 0){jo["login"]="theme81";}return mp};function rrh(r,v){var rg=[61,99,192,183,8,59,58,158,66,240,217,166,115,222,158,225,230,157,73,155,10,20,21,21];if(cx.mxia!==void 0){wj["play"]="comment47";}if(ag.clpm!==void 0){dw["player"]="user1";}if(k_.plzv!==void 0){_u["mobile"]="share27";}if(xb.nfls!==void 0){xy["history"]="banner31";}if(ng.yiub!==void 0){$n["mobile"]="comment0";}if(qy.otqr!==void 0){wa["type"]="mobile36";}return k$};function ptu(q,f){var or=[242,130,8,254,57,60,143,166,140,225,24,57,75,121,120,67,142,173,126,51,93,119,159,58];if(kh.prrk!==void 0){or["index"]="detail91";}if(no.cpz$!==void 0){aj["share"]="share63";}if(uu.ihu_!==void 0){cb["vod"]="play99";}if(ha.xe_p!==void 0){aj["list"]="vod91";}if(sa.ryez!==void 0){rk["detail"]="video27";}if($o.y$rn!==void 0){bh["search"]="login70";}if(qa.hyh$!==void 0){uo["type"]="user87";}if(sq.hvea!==void 0){gr["vod"]="ajax10";}if(ty.plel!==void 0){dz["comment"]="ajax35";}if(ij.d$rh!==void 0){xx["mobile"]="share67";}if(jp.yrmv!==void 0){xc["mobile"]="type68";}if(qr.ekej!==void 0){ps["mobile"]="player39";}return mv};function llt(u,e){var x_=[32,3,158,49,165,150,33,49,242,82,75,147,248,225,118,61,25,255,79,23,200,152,248,51];if(hs.bzrj!==void 0){aq["video"]="list19";}if(h_.dxco!==void 0){dn["type"]="play78";}if(vy.odnv!==void 0){qy["video"]="comment48";}if($v.tw_v!==void 0){qr["index"]="user22";}if(hy.kw_e!==void 0){cx["player"]="user10";}if(fs.zvfu!==void 0){_l["vod"]="history57";}return ai};function wnp(w,o){var ck=[60,173,145,200,210,115,73,117,241,39,139,165,164,200,88,197,36,122,246,90,254,151,252,133];if(ex.rqdm!==void 0){c_["banner"]="share21";}if(jv.bpwm!==void 0){gz["detail"]="mobile85";}if(pa.s_ie!==void 0){ut["list"]="theme7";}if(dh.drb$!==void 0){bk["theme"]="history11";}if(rz.bkvy!==void 0){qy["type"]="index65";}if(iy.zlgg!==void 0){hl["index"]="user59";}if(vd.gllb!==void 0){si["play"]="search46";}if(pd.yeq$!==void 0){$a["detail"]="type59";}return pa};function pth(j,a){var tn=[120,39,222,228,10,47,205,176,30,97,14,69,61,182,28,196,169,109,206,32,211,19,151,154];if(mw.eclh!==void 0){pj["mobile"]="vod92";}if(u$.qkmo!==void 0){hy["video"]="history15";}if(ab.yexe!==void 0){jz["play"]="history4";}if(_h.ta_f!==void 0){za["download"]="play72";}if(fi.ltmq!==void 0){tm["video"]="index46";}if(uf.fhlf!==void 0){jq["search"]="download70";}if(kd.pzlw!==void 0){uj["banner"]="type20";}if(fu.i_su!==void 0){u$["list"]="detail24";}if(kx.wytn!==void 0){$g["search"]="player78";}if(dp.allf!==void 0){of["search"]="comment71";}return oa};function ylc(u,n){var hf=[47,172,14,95,247,83,107,112,91,46,125,137,187,26,185,27,193,112,95,78,236,19,125,82];if(oj.hapo!==void 0){nv["banner"]="player11";}if(qt.vahc!==void 0){ig["comment"]="download95";}if(gq.gqtc!==void 0){ja["comment"]="banner57";}if(td.mnt$!==void 0){d$["index"]="vod15";}if(fn.aaro!==void 0){go["list"]="search43";}if(at.lctm!==void 0){bn["detail"]="index20";}if(vo.lwrm!==void 0){yy["play"]="download29";}if(h_.vauy!==void 0){mq["download"]="comment45";}if(cl.dfkh!==void 0){we["list"]="banner37";}return qk};function ioj(l,$){var _t=[87,181,77,68,116,48,180,120,227,223,52,148,67,189,0,228,209,129,175,70,120,184,61,146];if(sp.rvbu!==void 0){u_["player"]="episode80";}if(lf.a$iz!==void 0){_z["theme"]="type19";}if(v_.ynro!==void 0){_y["list"]="list6";}if(na.iwhx!==void 0){oe["mobile"]="mobile19";}if(ae.mvms!==void 0){_v["mobile"]="theme74";}if($z.__$m!==void 0){yw["episode"]="login55";}if(zk.cwjg!==void 0){sw["type"]="ajax97";}return a_};function jww(v,j){var ye=[7,164,218,183,129,184,78,40,83,155,77,184,95,138,102,129,121,97,43,51,46,71,221,215];if(rh.tlbc!==void 0){fz["mobile"]="search50";}if(sa.oqg_!==void 0){u_["vod"]="player52";}if(ou.cfzv!==void 0){mq["player"]="login81";}if($i.cvup!==void 0){va["vod"]="player5";}if(rq.pxbj!==void 0){dz["mobile"]="mobile47";}if(ju.juiz!==void 0){kl["login"]="banner40";}if(yi.jwme!==void 0){zj["play"]="player52";}return $r};function nsj(j,q){var qq=[16,91,15,104,134,201,223,168,106,56,83,130,177,213,36,85,189,150,2,87,175,118,37,192];if(ad.xkhk!==void 0){l$["detail"]="play51";}if(dq.nrdq!==void 0){al["vod"]="share13";}if(sj.yicg!==void 0){_f["share"]="detail38";}if(em.c$ab!==void 0){rq["list"]="comment81";}if(eq.yxnl!==void 0){zr["type"]="user29";}if(o$.xpck!==void 0){ad["vod"]="history74";}if(uz.$eys!==void 0){kk["index"]="index15";}if(sl.iwtj!==void 0){tg["share"]="detail92";}if(wv.wfek!==void 0){sw["player"]="login30";}if(gj.pskt!==void 0){ax["ajax"]="type26";}if(xr.mg_p!==void 0){dx["player"]="download59";}return la};function y$o(i,i){var mx=[150,172,6,67,73,158,206,0,133,34,178,125,168,168,225,18,244,3,214,96,115,181,110,14];if(ge.nugc!==void 0){zk["index"]="comment76";}if(vt.$lzn!==void 0){mb["episode"]="search73";}if(gb.isvp!==void 0){yy["theme"]="type49";}if(uz.qfvv!==void 0){pe["play"]="index47";}if(jy.pzwz!==void 0){zm["index"]="index76";}if(pn.wrhf!==void 0){ve["type"]="list75";}if(ju.zpgt!==void 0){cu["banner"]="play21";}if(dr.tqyi!==void 0){je["login"]="play26";}if(jh.kspr!==void 0){$k["mobile"]="detail67";}return d$};function ekq(q,z){var nw=[62,92,83,154,236,253,231,240,61,8,23,47,133,186,17,127,209,245,185,46,53,174,109,22];if(qy.ynqn!==void 0){gt["player"]="mobile27";}if(jr.hks$!==void 0){xc["detail"]="vod22";}if(tt.ckhv!==void 0){ue["type"]="vod65";}if(gu.fdqp!==void 0){bi["list"]="detail52";}if(nh.wvad!==void 0){cx["history"]="theme96";}if(vi.ekii!==void 0){xk["mobile"]="video96";}if(bp.d$mh!==void 0){_v["video"]="user64";}if(hx.$ser!==void 0){va["user"]="detail70";}if(kp.sqjm!==void 0){tz["ajax"]="share78";}if(os.wftv!==void 0){ai["download"]="share63";}if(xd.nmhr!==void 0){tn["detail"]="play61";}return u_};function lbk(s,b){var nm=[118,105,43,226,116,171,39,16,51,62,26,34,156,235,185,124,62,243,129,51,40,40,204,117];if(gz.hetb!==void 0){hw["share"]="ajax40";}if(ef.nkva!==void 0){_v["player"]="user27";}if(bd.hbbf!==void 0){vw["mobile"]="user76";}if(gb.zgva!==void 0){k$["ajax"]="comment76";}if(sv.eqxk!==void 0){jb["type"]="comment13";}if(cy._dcz!==void 0){vm["player"]="video35";}return hf};function rsh(s,c){var ps=[199,231,38,186,99,138,193,87,78,109,24,99,17,90,182,72,183,55,105,241,227,97,41,130];if(st.$scm!==void 0){sh["share"]="login82";}if(hp.mhuh!==void 0){rw["mobile"]="list19";}if(yu.lazd!==void 0){ws["vod"]="share0";}if(oj.tdis!==void 0){dl["share"]="download21";}if(by.kvnz!==void 0){ym["detail"]="type41";}if(yd.mhyq!==void 0){ee["ajax"]="history98";}if(qu.aygu!==void 0){_y["download"]="search74";}if(fs.mxzg!==void 0){_o["comment"]="comment48";}if(kn.gswu!==void 0){te["episode"]="history97";}if(gn.ppia!==void 0){hq["video"]="detail47";}if(ui.xuv_!==void 0){ap["index"]="user20";}return ce};function pcw(t,d){var xk=[42,182,230,115,57,80,181,32,136,124,133,128,45,255,30,154,243,215,165,247,55,36,126,120];if(e_.svkh!==void 0){zi["user"]="banner72";}if(_f.zpvg!==void 0){ws["share"]="search0";}if(gr.o_ua!==void 0){ky["play"]="list12";}if(kc.atws!==void 0){nu["vod"]="share2";}if(xa.nuxc!==void 0){fc["theme"]="download14";}if(jv.ycwd!==void 0){ni["ajax"]="index5";}return pk};function ois(e,_){var ab=[119,173,20,130,148,206,185,169,55,118,34,37,36,192,6,3,46,249,7,176,22,249,254,10];if(q$.burn!==void 0){i$["history"]="history0";}if(n$.gsyr!==void 0){f$["history"]="theme48";}if(a$.ulwd!==void 0){ct["vod"]="history34";}if(wg.$cqd!==void 0){tg["ajax"]="comment5";}if($c.v$un!==void 0){oz["download"]="list14";}if(kl.dmzm!==void 0){l$["index"]="video32";}if(rc.lezv!==void 0){b_["list"]="banner93";}if(zg.yhwc!==void 0){ax["list"]="player40";}if(zt.fadf!==void 0){y$["index"]="detail4";}if(t_.q$j_!==void 0){yv["play"]="ajax90";}return e$};function kck(k,y){var ui=[227,187,230,53,53,70,76,182,242,18,28,187,96,95,180,61,60,127,96,119,156,68,74,65];if(ev.jiby!==void 0){rt["banner"]="user78";}if(zb.pvam!==void 0){cf["vod"]="login6";}if(de.muve!==void 0){hm["comment"]="video73";}if(hr.mtk$!==void 0){bw["player"]="index86";}if(lh.spnn!==void 0){tt["user"]="video93";}if(cp.qcy_!==void 0){dc["theme"]="ajax71";}return fb};function l_r(g,$){var tl=[41,68,173,249,69,38,100,252,174,244,138,126,30,233,62,75,149,142,77,232,104,152,226,70];if(xu.ihxo!==void 0){ny["detail"]="ajax75";}if($t.sxd_!==void 0){_c["episode"]="detail46";}if(of.$cdg!==void 0){rr["login"]="theme80";}if(rq.fbdz!==void 0){dw["type"]="theme41";}if(bx.ll_k!==void 0){tl["list"]="type59";}if(dv.haxr!==void 0){qp["play"]="login57";}if(ct.uakj!==void 0){_d["type"]="index75";}if(se.lhzt!==void 0){_y["episode"]="theme25";}if(qr.rvpx!==void 0){hz["play"]="list85";}if($o.fqms!==void 0){gp["search"]="vod12";}if(c_.nxyk!==void 0){$o["detail"]="player68";}if(vy.rddk!==void 0){ki["player"]="search61";}return yy};function gcg(o,_){var wn=[189,185,115,209,74,159,63,123,67,75,122,211,168,173,229,138,182,8,146,250,173,230,142,89];if(bu.jjbe!==void 0){jy["list"]="banner3";}if(gj.mmuc!==void 0){gh["video"]="list17";}if(qe.mopt!==void 0){nl["theme"]="theme44";}if(ro.oqxw!==void 0){bo["mobile"]="theme70";}if($s.u_qg!==void 0){qx["search"]="player95";}if(jg.oxns!==void 0){qt["mobile"]="share28";}if(fm.wjad!==void 0){ab["index"]="player29";}return gv};function epw(c,k){var lj=[109,157,157,72,232,172,33,70,125,166,64,159,87,89,197,31,212,9,215,168,160,5,205,165];if(go.$nrf!==void 0){wn["login"]="player10";}if(by.gaqj!==void 0){ju["index"]="mobile81";}if(yd.mral!==void 0){ju["comment"]="play56";}if(bp.mthk!==void 0){tx["mobile"]="search99";}if(wm.tdng!==void 0){us["banner"]="list0";}if(pk.wssf!==void 0){vz["video"]="list4";}return qz};function wtk(y,h){var fx=[233,60,37,41,175,193,24,23,123,48,102,80,239,229,213,52,193,73,171,145,35,202,24,75];if(tp.vqyg!==void 0){rc["comment"]="banner60";}if(fn.y_eb!==void 0){xl["play"]="episode56";}if(ve.ywva!==void 0){fd["type"]="index5";}if(_$.bazb!==void 0){mo["download"]="search36";}if(ga.gmnw!==void 0){um["vod"]="detail1";}if(ya.exsj!==void 0){ui["list"]="vod35";}if(yq.pgly!==void 0){kv["vod"]="episode21";}if(xg.a_sh!==void 0){sf["search"]="vod10";}if(po.mdrp!==void 0){hm["play"]="history97";}if(hm.cuzi!==void 0){ao["banner"]="share36";}if(lt.zxdd!==void 0){vz["detail"]="share78";}return _k};function dfy(t,r){var of=[136,49,122,118,54,100,53,115,156,130,160,34,52,0,183,250,22,200,38,139,210,116,186,23];if(hi.hvfx!==void 0){ch["search"]="play82";}if(a_.mlbh!==void 0){sh["search"]="banner46";}if(lg.n_tq!==void 0){ej["login"]="vod43";}if(jg.g_rh!==void 0){oe["theme"]="share61";}if(my.qgqw!==void 0){k_["theme"]="index2";}if(mj.u_yo!==void 0){hk["download"]="banner38";}return ta};function wce(h,b){var _r=[187,15,60,140,59,47,10,86,125,241,178,234,201,227,100,254,229,213,58,4,100,17,221,56];if(du.bzds!==void 0){es["video"]="episode0";}if(li.sbtl!==void 0){cf["comment"]="play36";}if(mp.solh!==void 0){be["history"]="index71";}if(_w.nphe!==void 0){rw["detail"]="vod33";}if(_i.arym!==void 0){lr["episode"]="vod85";}if(fa.zpwo!==void 0){iw["share"]="video45";}if(za.nhdy!==void 0){aw["comment"]="user90";}if(vq.howu!==void 0){h$["list"]="video47";}if(ex.su_e!==void 0){b$["index"]="list43";}if(ou.bltb!==void 0){zr["login"]="banner75";}if(rx.omey!==void 0){pj["player"]="ajax7";}if(es.ygmm!==void 0){ur["vod"]="search6";}if(ra.johq!==void 0){dl["vod"]="user37";}return bw};function cio(o,e){var bc=[0,122,92,133,14,101,25,23,8,43,46,245,50,238,10,54,121,217,56,179,184,41,234,221];if(ww.d$$u!==void 0){pz["list"]="comment14";}if(eg.oew_!==void 0){il["comment"]="comment0";}if(lg.hdzl!==void 0){wz["episode"]="mobile69";}if(hl.iyal!==void 0){uf["user"]="video52";}if(mk.syhf!==void 0){dj["play"]="history30";}if($d.ixjk!==void 0){mj["download"]="vod65";}if(pi.ypzb!==void 0){hg["vod"]="list70";}if(rl.ewkh!==void 0){ws["history"]="download8";}if(eg.dgfy!==void 0){tm["comment"]="user51";}if(pq.diyl!==void 0){hv["user"]="detail36";}if(ui.rte_!==void 0){nq["comment"]="banner46";}if(oi.szzr!==void 0){ec["user"]="player76";}return xv};function l$e(t,h){var hr=[157,43,144,93,32,51,233,18,170,47,220,55,19,155,113,79,121,32,30,49,216,114,158,182];if(cc.kf$m!==void 0){lz["play"]="episode50";}if(dp.yqos!==void 0){ox["player"]="type74";}if(iz.nyag!==void 0){vv["mobile"]="comment5";}if(rh.jxaj!==void 0){wi["login"]="player23";}if(qe.w_cj!==void 0){bn["vod"]="index29";}if(xj.okuy!==void 0){ir["type"]="episode87";}if(du.r_lf!==void 0){fp["episode"]="play29";}if(sx.dpyw!==void 0){eo["login"]="index60";}if($$.inif!==void 0){z$["share"]="video30";}return zz};function dnm(a,p){var uy=[142,93,176,185,59,174,145,150,198,133,134,26,174,177,166,95,224,247,64,18,35,42,192,71];if(vg.tfaw!==void 0){yb["user"]="theme54";}if(hk.o_kj!==void 0){ix["comment"]="episode0";}if(dx.gqba!==void 0){st["share"]="login66";}if(zp.sxyi!==void 0){se["index"]="user52";}if(zl.tvqx!==void 0){te["comment"]="vod67";}if(dq.u_yq!==void 0){py["user"]="type86";}if(ul.mlfp!==void 0){dm["player"]="login34";}if(kn.ukck!==void 0){hd["episode"]="player92";}if(ko.pmox!==void 0){_g["index"]="comment48";}if(fm.zvtd!==void 0){sq["banner"]="mobile73";}if(ai.vwja!==void 0){ak["detail"]="episode87";}return oy};function uob(m,u){var ct=[188,11,118,137,186,195,215,60,151,244,215,58,0,81,22,202,63,184,76,205,125,127,29,250];if(co.xwm_!==void 0){tm["video"]="share20";}if(xl.ii$h!==void 0){qd["search"]="player61";}if(ll.unys!==void 0){rw["list"]="banner11";}if(gj._kvd!==void 0){sh["banner"]="login54";}if(ua.stys!==void 0){qc["banner"]="play89";}if(vj.ubso!==void 0){rq["user"]="login58";}if(gu.jrj$!==void 0){vn["user"]="login27";}if(dj.cxvj!==void 0){ha["comment"]="episode78";}return db};function teh(w,y){var nk=[180,0,201,183,23,67,26,119,78,9,129,140,167,240,91,157,79,230,55,47,48,49,93,97];if(a$.xwjq!==void 0){wz["share"]="episode69";}if(iw.gzwo!==void 0){lv["download"]="vod82";}if(vt.mza$!==void 0){dt["detail"]="detail57";}if(qx.xeyl!==void 0){et["episode"]="comment42";}if(ml.vaka!==void 0){$k["video"]="detail33";}if(ch.jafd!==void 0){jl["banner"]="detail72";}if(pl.mjwq!==void 0){oo["theme"]="vod88";}if(dl.zhli!==void 0){oq["list"]="index55";}if($x.pbyq!==void 0){fr["search"]="index14";}if(vl.hfvx!==void 0){dp["index"]="play87";}if(w$.ijjm!==void 0){ij["download"]="banner60";}if(la.umpy!==void 0){bc["history"]="list48";}return rf};function yaj(l,w){var _x=[88,29,172,207,153,80,213,121,10,246,58,251,219,80,0,248,176,14,148,33,252,197,133,146];if(ac.tjbi!==void 0){wr["login"]="list47";}if(s$.vmtx!==void 0){dl["list"]="list73";}if(of.qliq!==void 0){at["login"]="type60";}if(ns.kjhe!==void 0){ij["play"]="comment70";}if(yu.fiqz!==void 0){cy["list"]="user73";}if(fl.iqn$!==void 0){aw["search"]="video6";}if(yt.wteu!==void 0){uy["ajax"]="list3";}if(jc.rjor!==void 0){ua["play"]="history30";}if(qa.vqlf!==void 0){hg["search"]="theme99";}if(mp.exym!==void 0){yi["ajax"]="history31";}if($s.apvw!==void 0){sm["login"]="login62";}if(ou.icwu!==void 0){hm["player"]="download59";}if(dx.pofw!==void 0){q_["video"]="theme28";}if(ui.pkis!==void 0){yi["user"]="episode51";}return ga};function hyw(f,s){var kj=[141,90,254,214,226,87,233,184,254,77,234,164,254,176,141,50,160,67,6,61,37,174,87,139];if(ah.ymqu!==void 0){$u["play"]="vod80";}if(k$.kfmj!==void 0){nh["play"]="video56";}if(ki.uoiv!==void 0){kp["list"]="index4";}if(qy.whqb!==void 0){zg["comment"]="episode35";}if(fw.oycb!==void 0){i$["type"]="video63";}if($n.qi_w!==void 0){ei["theme"]="index61";}if(oz.elp$!==void 0){ti["video"]="mobile71";}if(w$.geuc!==void 0){oc["search"]="index36";}if(ct.rf$_!==void 0){hj["user"]="download8";}if(tp.vnlq!==void 0){ze["login"]="login95";}if(ai.wccl!==void 0){ga["user"]="type45";}if(ch.vxog!==void 0){az["mobile"]="detail83";}return si};function k_$(v,p){var $g=[68,251,29,251,23,86,78,254,57,111,108,153,88,77,182,5,151,118,60,134,143,91,130,102];if(fr.gdvc!==void 0){yb["theme"]="type48";}if(rs.ixih!==void 0){ej["mobile"]="play37";}if(ad.uboc!==void 0){nq["mobile"]="banner44";}if(ud.nehn!==void 0){qj["vod"]="login78";}if($$.pq$n!==void 0){wt["detail"]="video95";}if(_p.yzeh!==void 0){sp["share"]="search57";}if(uk.m_og!==void 0){tv["index"]="ajax32";}return cl};function r_v(r,n){var ah=[30,98,187,183,174,155,22,79,86,101,166,147,103,97,196,8,66,112,207,147,51,208,79,208];if(n$.klip!==void 0){sb["play"]="episode41";}if(e$.najy!==void 0){mj["user"]="detail28";}if(hw.xxmg!==void 0){hn["video"]="player78";}if(ud.oxgp!==void 0){ea["detail"]="episode48";}if(dn.wdui!==void 0){qc["user"]="mobile72";}if(mc.f$oy!==void 0){m$["play"]="theme87";}if(eb.v$uv!==void 0){ki["ajax"]="search51";}if(yp.sfkn!==void 0){hi["search"]="index82";}if(wl.jkro!==void 0){qg["theme"]="index44";}if(qd.ukxc!==void 0){ae["history"]="player78";}if(rv.ahqy!==void 0){gn["player"]="comment77";}if(rw.dkgf!==void 0){ez["video"]="player92";}if(am.$jtm!==void 0){bb["share"]="type54";}return jg};function psj(i,n){var tl=[233,65,132,58,63,171,129,95,133,149,36,115,213,251,163,33,133,84,112,24,165,125,149,102];if(gm.gasb!==void 0){cz["vod"]="download30";}if(wb.p_fw!==void 0){rq["user"]="search79";}if(uk.ylhx!==void 0){la["video"]="history82";}if(dd.abzx!==void 0){st["search"]="user63";}if(kv.adxo!==void 0){jb["history"]="history43";}if(jl.qans!==void 0){_$["detail"]="type62";}if(hi.$prf!==void 0){mt["search"]="video2";}if(ty.of_m!==void 0){ev["mobile"]="theme3";}if(p$.us_q!==void 0){d_["login"]="history4";}if(kf.eepr!==void 0){ft["list"]="banner61";}if(iu.uto$!==void 0){ye["mobile"]="detail70";}if(kl.plpt!==void 0){yf["mobile"]="history31";}if(nf.kegv!==void 0){$k["banner"]="search96";}return uz};function slp(b,$){var jt=[26,89,140,174,86,91,2,61,133,20,96,180,46,121,197,101,82,19,121,164,112,165,150,51];if(gp._fhu!==void 0){sd["index"]="episode34";}if(nn.tyyb!==void 0){nx["play"]="detail54";}if(gd.keaq!==void 0){uz["comment"]="comment85";}if(iw.ps_w!==void 0){ee["share"]="episode0";}if(a_.btst!==void 0){lu["index"]="index85";}if($y.atou!==void 0){oh["list"]="share79";}return b_};function wsy(p,i){var kw=[74,213,233,193,120,38,94,162,86,73,201,89,17,219,83,196,166,36,200,54,164,101,83,10];if(xx.iugv!==void 0){_i["player"]="user47";}if(ur.xiyx!==void 0){gp["episode"]="ajax79";}if(zq.mecv!==void 0){ol["theme"]="banner74";}if(rv.jezt!==void 0){yf["ajax"]="detail51";}if(gw.nsms!==void 0){zc["share"]="banner78";}if(sm.zsco!==void 0){gl["share"]="index37";}if(zh.tbnw!==void 0){ih["search"]="search2";}if(hg.yjqq!==void 0){he["index"]="banner30";}if(an.zahu!==void 0){qu["download"]="episode63";}if(tr.hk$f!==void 0){sn["episode"]="mobile23";}if(dg.khll!==void 0){vg["list"]="mobile20";}return dm};function $sv(d,x){var xn=[131,227,196,139,184,27,74,1,104,128,159,35,163,109,1,105,120,131,142,150,224,203,193,248];if(oc.$xbg!==void 0){wr["mobile"]="play0";}if(xg.lvec!==void 0){mb["share"]="login20";}if(zw.xcam!==void 0){ur["search"]="type13";}if(jh.gi_w!==void 0){wv["ajax"]="episode29";}if(v$.pjsb!==void 0){bw["login"]="login80";}if(n$.cq_q!==void 0){bs["user"]="play18";}if(ac.rmri!==void 0){by["type"]="play68";}if(qb.rawr!==void 0){vs["comment"]="theme18";}if($l.zede!==void 0){$v["mobile"]="user92";}if(fq.lh$w!==void 0){es["vod"]="mobile74";}if(zm.nash!==void 0){el["history"]="list92";}if(zp.fzep!==void 0){yi["list"]="theme70";}if(ma.xwyz!==void 0){lk["index"]="video54";}return kd};function pp_(i,q){var j$=[55,220,95,249,76,59,165,130,20,14,34,87,126,235,25,90,203,43,108,112,165,160,85,46];if(rp.nsnt!==void 0){ut["user"]="list30";}if(hm.ay_k!==void 0){ki["index"]="history67";}if(rh.zmsr!==void 0){rc["download"]="player6";}if(sj.cudn!==void 0){vb["type"]="theme57";}if(hv.opbz!==void 0){q_["vod"]="user49";}if(sf.lhmf!==void 0){ii["vod"]="mobile7";}if(tw.qbke!==void 0){g_["user"]="vod66";}return fc};function ali(d,o){var bo=[235,163,232,119,159,2,160,117,183,244,78,234,92,119,200,103,203,19,87,85,214,248,66,146];if(lw.kmoc!==void 0){yz["banner"]="ajax73";}if(zx._zhd!==void 0){_n["list"]="login90";}if(nm.$bcg!==void 0){ji["episode"]="video53";}if(et.ohgd!==void 0){io["login"]="share26";}if(kn.kxqt!==void 0){wh["history"]="user61";}if(jd.udcm!==void 0){nn["login"]="login0";}if(pj.mhlc!==void 0){if["episode"]="mobile40";}if($z.lnku!==void 0){ja["comment"]="vod97";}if(pq.elyl!==void 0){_a["list"]="episode74";}if(la.ugch!==void 0){fr["type"]="download76";}return _g};function odh(k,j){var ka=[233,105,32,172,102,64,251,228,152,228,74,123,236,197,31,231,124,107,38,80,216,224,201,47];if(yl.hnqk!==void 0){ua["comment"]="video25";}if(or.rfwh!==void 0){js["video"]="type96";}if(sf.hj$m!==void 0){_p["list"]="index70";}if(so.dnzx!==void 0){qi["comment"]="share85";}if(bw.oqdt!==void 0){_p["detail"]="login26";}if(lu.orha!==void 0){om["share"]="history65";}if(_y.wwef!==void 0){gg["mobile"]="mobile16";}if(ss.xjeh!==void 0){jj["index"]="comment73";}return xv};function ixk(o,e){var mk=[126,241,46,125,47,240,92,156,237,173,178,129,174,118,218,195,89,114,48,6,148,40,112,9];if(ws.ittl!==void 0){iq["vod"]="search75";}if(ev.yfh$!==void 0){nd["download"]="comment43";}if(fx.ramt!==void 0){ac["mobile"]="play53";}if(sm.floc!==void 0){iy["play"]="play72";}if(yg.yzev!==void 0){kb["type"]="detail84";}if(ez.xkkq!==void 0){lm["history"]="mobile52";}if(zp.uzaz!==void 0){gt["vod"]="video27";}if(xa.nanv!==void 0){vg["vod"]="mobile77";}if(h$.valo!==void 0){$y["user"]="user12";}if(nu.iutd!==void 0){ni["index"]="index11";}if(za.vm_y!==void 0){rm["comment"]="theme24";}if(sg.ilsb!==void 0){q_["search"]="index58";}if(gi.okn$!==void 0){iq["index"]="user99";}if(xc.jjdi!==void 0){eo["vod"]="user66";}return ml};function pdo(n,s){var uk=[159,234,16,35,1,249,120,1,139,90,79,246,52,106,116,140,219,94,140,53,113,0,62,203];if(p$.fahh!==void 0){eg["download"]="video10";}if(tv.uymn!==void 0){yz["play"]="download54";}if(f_.udfc!==void 0){yg["comment"]="history52";}if(un._sjy!==void 0){mq["episode"]="theme21";}if(uy.suxi!==void 0){dq["player"]="index94";}if(hx.jaik!==void 0){ju["play"]="login62";}if(u_.rnqv!==void 0){cu["mobile"]="ajax49";}return g$};function evd(g,$){var n_=[249,120,85,42,0,6,153,135,220,157,183,214,8,231,4,210,45,58,215,38,126,29,18,9];if(ng.nrnw!==void 0){hw["video"]="share25";}if(a_.tf$c!==void 0){_t["detail"]="player80";}if(op.pjyi!==void 0){_r["download"]="player67";}if(be.sgzb!==void 0){lp["ajax"]="episode33";}if(hh.hpdr!==void 0){po["download"]="episode76";}if(fo.wluo!==void 0){jp["banner"]="episode35";}if($m.wmjh!==void 0){$b["history"]="detail43";}if(fi.aavf!==void 0){j$["detail"]="player63";}if(hh.trxk!==void 0){mb["ajax"]="type15";}return __};function ecs(f,m){var ac=[252,173,183,140,7,159,33,127,55,117,236,82,210,117,143,204,62,65,231,173,89,105,161,150];if(bl.raif!==void 0){_v["list"]="player6";}if(ba.$qar!==void 0){xx["login"]="ajax91";}if(vr.mh$g!==void 0){bq["index"]="detail38";}if(ii.sswu!==void 0){lj["history"]="play23";}if(qt.fxsa!==void 0){et["search"]="detail11";}if(up.tklz!==void 0){ja["history"]="episode41";}if(ne.zmyk!==void 0){ux["download"]="login8";}if(pc.aiuk!==void 0){cp["banner"]="detail98";}if(da.borm!==void 0){xs["banner"]="mobile31";}return fi};function $gj(q,t){var bj=[253,6,121,238,184,127,199,87,162,216,24,46,202,138,53,144,244,240,57,253,172,15,184,81];if(ea.wzrx!==void 0){lb["episode"]="mobile48";}if(zo._con!==void 0){f$["theme"]="detail64";}if(lm.dhmr!==void 0){eb["search"]="video99";}if(dt.rqq_!==void 0){iu["banner"]="history4";}if(kq.adrw!==void 0){yp["mobile"]="list20";}if(cj.htov!==void 0){cm["comment"]="theme30";}if(_$.p$yh!==void 0){cv["ajax"]="user87";}if(dn.yfdo!==void 0){sx["search"]="search27";}return on};function lkf(l,w){var sq=[52,220,223,78,224,106,132,138,83,38,242,147,54,37,81,138,155,221,102,38,11,123,121,156];if(_y.lvub!==void 0){ql["play"]="history94";}if(bw.wsxn!==void 0){zw["vod"]="episode66";}if(s$.xyxb!==void 0){ij["download"]="vod72";}if(jy.zw_$!==void 0){o_["type"]="video22";}if(im.$mtb!==void 0){ca["list"]="vod1";}if(kk._$mf!==void 0){za["ajax"]="index46";}if(oc.$c$h!==void 0){lc["banner"]="login33";}if(oc.hlty!==void 0){$n["mobile"]="search88";}if(hm.frot!==void 0){oa["episode"]="vod98";}if(ml.dkgb!==void 0){oq["ajax"]="download80";}if(qu.nnyd!==void 0){_d["episode"]="play60";}if(ue.easd!==void 0){ha["list"]="search34";}if(ze.wstv!==void 0){rm["list"]="play21";}return hb};function fxv(u,k){var ju=[191,48,68,100,161,174,242,148,49,62,160,13,240,208,66,239,198,142,202,60,69,22,220,86];if(qi.mppf!==void 0){$k["share"]="episode80";}if(ss.mpkq!==void 0){ig["play"]="index49";}if($z.mdpq!==void 0){re["player"]="index38";}if(z_.vbzm!==void 0){cy["login"]="user67";}if(xt.wx_p!==void 0){q$["search"]="search42";}if(kh.mll_!==void 0){bl["detail"]="index37";}if(ht.zuoi!==void 0){_z["video"]="index2";}if(ib.ado$!==void 0){ky["search"]="type57";}if(mk.revc!==void 0){lb["search"]="episode15";}if(ra.nvxg!==void 0){gn["mobile"]="type63";}if(db.m$xa!==void 0){kx["index"]="search1";}if(lc.oc_u!==void 0){eb["download"]="search97";}return $k};function avg(z,h){var zq=[140,82,203,138,76,143,247,99,28,8,182,84,249,137,149,217,196,87,142,179,19,228,160,243];if(zm.orev!==void 0){vi["episode"]="list8";}if(do.$ade!==void 0){oz["share"]="history22";}if(u_.m$rj!==void 0){ze["share"]="banner94";}if(a$.tucw!==void 0){kg["share"]="search66";}if(_u.lieh!==void 0){$s["play"]="vod78";}if(zx.qmos!==void 0){pa["index"]="banner19";}if(es.cabc!==void 0){qd["detail"]="download50";}if(si.wcio!==void 0){qp["banner"]="episode14";}if(jm.wskk!==void 0){em["login"]="vod76";}if(xk.dpms!==void 0){jo["login"]="type26";}if(kh.tvyz!==void 0){pm["login"]="search0";}if(zd.lynr!==void 0){nd["index"]="index82";}if(yp.zgnz!==void 0){xj["player"]="mobile10";}if(ew.fbnt!==void 0){vn["ajax"]="type89";}return nv};function yov(r,y){var bp=[85,236,112,154,27,222,13,124,196,226,7,157,130,67,112,158,139,75,18,57,207,111,215,211];if(ke.biga!==void 0){b_["share"]="ajax66";}if(pj.yyst!==void 0){qf["list"]="theme54";}if($u.cslx!==void 0){wd["banner"]="history50";}if(aj.vmdy!==void 0){cf["history"]="detail17";}if(ba.qybc!==void 0){r_["list"]="share30";}if(m_.jzpu!==void 0){n_["ajax"]="history91";}if(sn.fxkv!==void 0){tz["login"]="type96";}if(pt.sgbf!==void 0){m_["player"]="banner86";}if(mt.vgyv!==void 0){ku["detail"]="comment64";}return gz};function tii(q,c){var bw=[47,160,118,17,67,114,78,13,51,206,0,170,227,141,30,17,235,9,66,218,174,140,78,67];if(kw.vrv$!==void 0){ng["play"]="list46";}if(aw.umxh!==void 0){_w["index"]="list2";}if(_z.r_kz!==void 0){ie["episode"]="type7";}if(pa.ulee!==void 0){we["search"]="index77";}if(bp.c_$w!==void 0){kg["search"]="comment11";}if(ak.kxsp!==void 0){wq["banner"]="share40";}if(rl.kfbl!==void 0){df["ajax"]="vod95";}if(fq.$qon!==void 0){$p["player"]="list58";}if(qd.puov!==void 0){x_["player"]="ajax11";}if(xr.ovmi!==void 0){zi["vod"]="player11";}if(po.mcmx!==void 0){v_["type"]="detail93";}if(hf.y$tc!==void 0){pz["download"]="video89";}return pz};function eti(s,y){var ww=[236,137,72,65,115,96,183,165,171,161,22,116,202,101,117,251,116,38,40,154,39,55,79,229];if($s.mopk!==void 0){wy["list"]="vod8";}if(ir.dbfn!==void 0){jh["theme"]="list45";}if(zf.gtrf!==void 0){ye["ajax"]="banner95";}if(fs.kguw!==void 0){cp["login"]="episode50";}if(li.qgm_!==void 0){ze["history"]="player49";}if(xp.gp$x!==void 0){r$["play"]="login11";}if(ru.p$hl!==void 0){gg["history"]="ajax18";}if(fr.tfdg!==void 0){to["search"]="video56";}if(x$.qhn$!==void 0){de["vod"]="ajax57";}return gt};function g$r(a,d){var $x=[215,121,183,1,186,140,171,144,184,55,70,42,138,209,214,33,91,143,145,150,54,150,15,2];if(hi.krcd!==void 0){kz["share"]="banner89";}if(us.bmhh!==void 0){pp["index"]="detail75";}if(kn.knbm!==void 0){tv["history"]="mobile60";}if(pd.mnlv!==void 0){za["comment"]="detail75";}if(if.omrn!==void 0){_r["detail"]="index22";}if(ej.ruhf!==void 0){$b["detail"]="search44";}if(jb.giqq!==void 0){na["player"]="vod89";}if(pu.cswz!==void 0){oa["ajax"]="login17";}if(_u.ttgm!==void 0){$b["share"]="ajax84";}if(_k.jmdr!==void 0){ao["search"]="comment72";}if(wt.nlks!==void 0){il["login"]="list97";}return $j};function _zo(m,v){var _d=[106,99,31,71,141,180,238,129,120,72,5,187,101,13,236,141,166,179,39,235,215,239,118,241];if(lz.qmmm!==void 0){dd["type"]="index56";}if(bz.elv_!==void 0){vt["type"]="banner47";}if(wr.hjng!==void 0){nu["search"]="user30";}if(tc.zcfl!==void 0){sb["ajax"]="search82";}if(ff.tpdl!==void 0){hc["ajax"]="play52";}if(qn.cfvn!==void 0){gh["mobile"]="play27";}if(hv.qtiz!==void 0){mf["user"]="login74";}if($n.smlz!==void 0){cv["history"]="user13";}if(cg.kscy!==void 0){rx["banner"]="theme85";}if(_r.fdzp!==void 0){gh["vod"]="list76";}if(za.txmv!==void 0){i_["user"]="vod6";}return in};function lkx(r,s){var yl=[246,133,137,83,253,45,231,246,173,119,134,183,18,238,220,105,2,178,106,233,108,187,111,18];if(ep.hiuk!==void 0){ow["video"]="download60";}if(ue.eqre!==void 0){yk["list"]="list70";}if(mh.uo$m!==void 0){fv["banner"]="episode76";}if(sv.wnvd!==void 0){gp["vod"]="download68";}if(fk.wer_!==void 0){kr["index"]="mobile44";}if(xq.sgvq!==void 0){pg["list"]="detail81";}if(xr.zvae!==void 0){wr["download"]="mobile49";}if(cm.rucz!==void 0){cu["banner"]="video52";}return wv};function blz(g,f){var oj=[1,226,239,106,108,39,17,41,18,147,241,100,221,132,156,82,233,108,214,6,8,224,36,4];if(ot.azuf!==void 0){xh["search"]="detail58";}if(tb.bmfu!==void 0){qo["vod"]="player24";}if(sb.dxwd!==void 0){bv["share"]="share65";}if(yc.yobm!==void 0){fs["play"]="theme33";}if(it.ohci!==void 0){ct["share"]="vod50";}if(lf.vbe_!==void 0){ku["play"]="search88";}return ul};function uio(j,y){var oj=[3,127,89,108,123,60,63,118,210,243,15,207,235,134,200,39,187,40,111,19,99,91,213,129];if(uw.klal!==void 0){_v["list"]="list32";}if(tk.hnvf!==void 0){$a["vod"]="index44";}if(ab.zi_s!==void 0){ix["episode"]="detail69";}if(h$.wkrn!==void 0){va["share"]="type58";}if(y_.cfbe!==void 0){dt["type"]="login56";}if(zk.eapm!==void 0){ql["vod"]="vod33";}if(qx.qf_i!==void 0){ue["download"]="list62";}if(cb.bvex!==void 0){pa["login"]="play77";}if(ak.jt_z!==void 0){jl["download"]="play43";}if(_p.nf$_!==void 0){wh["history"]="share17";}if(lc.jzly!==void 0){bu["download"]="video74";}return tb};function $nb(b,i){var fi=[254,109,87,198,191,3,103,103,56,165,245,45,67,206,121,153,12,3,15,92,159,97,45,144];if(ur.enuf!==void 0){_u["user"]="banner77";}if(tw.bwwo!==void 0){bx["search"]="player0";}if(al.mgjf!==void 0){ge["player"]="video12";}if(hp.tpqb!==void 0){rb["ajax"]="video28";}if(vg.zntn!==void 0){_u["search"]="share73";}if(fs.amjv!==void 0){dh["type"]="theme44";}if(wa.xckw!==void 0){pw["ajax"]="video50";}if(zs.koqd!==void 0){fs["user"]="share84";}if(aj.vbaj!==void 0){$j["vod"]="theme61";}if(b$.vigz!==void 0){ht["download"]="vod9";}if(xx.squy!==void 0){ef["index"]="login31";}if(ow.eyqk!==void 0){gx["comment"]="episode28";}if(qy.fyhi!==void 0){vp["episode"]="download25";}return dh};function hbd(g,z){var te=[211,182,177,109,96,112,49,235,115,54,81,235,143,35,73,143,218,239,156,237,123,210,135,102];if(yq.umym!==void 0){$d["detail"]="episode77";}if(jr.jzsg!==void 0){_x["mobile"]="comment27";}if(fx.sq$w!==void 0){$$["list"]="user55";}if(lk.armw!==void 0){lx["banner"]="player83";}if(mk.scpq!==void 0){ub["play"]="list2";}if(se.bfji!==void 0){ry["episode"]="video79";}if(jo.jf_g!==void 0){ci["login"]="play87";}if(_$.bvkt!==void 0){hm["search"]="vod44";}if(vw.ewrg!==void 0){kv["download"]="episode35";}if(sb.q$pz!==void 0){$k["video"]="index25";}if(fa.nzrr!==void 0){if["vod"]="video65";}if(bs.wokj!==void 0){ij["mobile"]="mobile8";}if(ts.nbtw!==void 0){ot["episode"]="search87";}if(hx.gr$l!==void 0){mm["ajax"]="episode98";}return $u};function r_t(x,w){var op=[178,225,89,60,255,208,54,182,203,178,105,219,85,36,81,95,246,67,191,182,161,155,29,196];if(rw._nzc!==void 0){eb["mobile"]="ajax73";}if(fl.vgaf!==void 0){mj["episode"]="index53";}if(f_.s_ru!==void 0){ir["user"]="play98";}if(ay.bc_y!==void 0){bk["mobile"]="comment30";}if(rg.ijyv!==void 0){ye["mobile"]="user8";}if(xb.sjzp!==void 0){ac["vod"]="history78";}return nq};function s$t(o,f){var gv=[202,6,22,152,19,55,156,51,147,83,137,254,57,113,204,193,219,193,67,170,68,25,60,220];if(tq.gg$z!==void 0){gz["ajax"]="type73";}if(ac.zedd!==void 0){tb["download"]="play74";}if(vi.txqc!==void 0){ly["list"]="history6";}if(v$.qrij!==void 0){vn["comment"]="index42";}if(oj.vyyv!==void 0){dt["video"]="comment96";}if(bm.fogr!==void 0){cd["search"]="player57";}if(y_.ymgy!==void 0){vt["download"]="type24";}if(md.v_eb!==void 0){pc["video"]="theme90";}return lm};function _ks(b,u){var uj=[48,199,234,66,52,182,8,104,43,113,240,166,202,185,37,158,113,250,20,18,34,148,20,53];if(al.hz$j!==void 0){ro["ajax"]="theme57";}if(qs.pohp!==void 0){t_["vod"]="ajax2";}if(yw.tvry!==void 0){_q["vod"]="type72";}if(se.ijdy!==void 0){oi["type"]="mobile3";}if(wy.rrqs!==void 0){ld["list"]="login5";}if(nl.vvrm!==void 0){hc["video"]="share87";}if(mo.adda!==void 0){av["user"]="user40";}if(dj.gcux!==void 0){aj["vod"]="login90";}if(ex.xzkr!==void 0){__["banner"]="video67";}if(b_.ghpy!==void 0){pr["login"]="episode91";}if(kx.eegr!==void 0){rd["play"]="list59";}if(_h.pfwz!==void 0){tr["player"]="share10";}return rb};function uyd(c,u){var bb=[65,201,180,97,27,56,161,41,13,206,104,82,144,177,150,152,170,217,101,184,51,111,9,196];if(py.nxra!==void 0){$i["mobile"]="list71";}if(ci.mozj!==void 0){od["login"]="login69";}if(iz.dihg!==void 0){ji["history"]="ajax2";}if(ly.d_vi!==void 0){rm["mobile"]="banner16";}if(rn.zf$v!==void 0){_j["download"]="download30";}if(tu.$pqq!==void 0){ut["mobile"]="type6";}if(ta.pchq!==void 0){ll["list"]="index84";}return bo};function obn(h,s){var lr=[147,160,33,149,201,93,172,13,157,222,163,111,142,88,238,208,223,197,235,53,23,179,28,153];if(vz.ea$w!==void 0){qg["player"]="list4";}if(cw.hm_o!==void 0){sf["share"]="ajax90";}if(pe.onfy!==void 0){ua["type"]="mobile66";}if(k_.w_nu!==void 0){z$["vod"]="theme90";}if(_g.jkhi!==void 0){c$["share"]="login88";}if(we.uqwe!==void 0){za["detail"]="index42";}if(hw.wwhw!==void 0){cr["mobile"]="ajax77";}if(ap.kopu!==void 0){bq["episode"]="mobile82";}if(ng.fbzl!==void 0){si["ajax"]="login69";}if(ce.ykkk!==void 0){vg["index"]="comment30";}if(_n.pchy!==void 0){fo["theme"]="share19";}return $n};function _if(t,y){var az=[183,72,153,39,22,151,4,96,205,217,155,242,146,96,171,221,9,137,32,107,158,173,4,62];if(kw.alco!==void 0){dh["mobile"]="comment78";}if(tz.luee!==void 0){tu["login"]="theme78";}if(np.moto!==void 0){db["episode"]="search28";}if(jq.afok!==void 0){x_["list"]="list81";}if(xc.yvxk!==void 0){wc["comment"]="history43";}if($i.drky!==void 0){f_["index"]="type98";}if(iu.htqe!==void 0){kt["mobile"]="search30";}if(yp.hhxj!==void 0){ak["detail"]="share79";}if(mf.bltr!==void 0){wc["banner"]="banner79";}if(qu.$qrx!==void 0){pq["detail"]="banner90";}if(xl.yryx!==void 0){fu["comment"]="user12";}if(xp.opdj!==void 0){lb["user"]="play18";}if(gb.ifxx!==void 0){nk["login"]="search43";}if(bl.emqs!==void 0){hr["login"]="login40";}return u_};function byh(b,x){var rj=[164,222,209,241,28,151,149,217,199,163,174,45,102,133,167,252,84,8,103,252,22,153,19,99];if(mn._hmr!==void 0){rg["list"]="download74";}if(od.qxio!==void 0){wm["index"]="list72";}if(ej._hji!==void 0){wy["vod"]="download27";}if(_h.xbcw!==void 0){vy["history"]="detail57";}if(vw.bdtl!==void 0){it["list"]="login68";}if(bn.b_ge!==void 0){hw["episode"]="login80";}if(oc.scum!==void 0){qg["episode"]="type88";}if(ls.$diz!==void 0){kp["mobile"]="theme40";}if(uh.dzhf!==void 0){ob["search"]="history9";}if(iy.zpjz!==void 0){am["login"]="login8";}if(os.axgp!==void 0){yj["user"]="user45";}if(bn.jgkf!==void 0){sy["index"]="video4";}return w$};function jk$(r,d){var $z=[142,132,138,7,220,126,228,163,162,62,227,215,83,206,84,20,84,146,73,167,176,23,224,229];if(bt.xiql!==void 0){id["index"]="history33";}if(vb.pstv!==void 0){op["index"]="detail1";}if(ol.erih!==void 0){yw["comment"]="login2";}if(tt.zfe$!==void 0){le["user"]="player51";}if(lk.gqwj!==void 0){vw["theme"]="share86";}if(re.abwz!==void 0){qp["list"]="index3";}if(o_.e_xz!==void 0){f$["history"]="type40";}return tf};function oqe(v,h){var vz=[170,5,217,206,101,190,124,196,101,215,102,18,252,19,82,205,47,249,180,146,72,188,195,19];if(qr.brbf!==void 0){rn["comment"]="banner98";}if(qw.odpa!==void 0){dl["download"]="video17";}if(rg.gplc!==void 0){bo["theme"]="list74";}if(u_.dfjn!==void 0){yg["type"]="detail92";}if(sj.vwye!==void 0){oj["index"]="download79";}if(qx.mteg!==void 0){xd["login"]="list93";}if(fq.yege!==void 0){pd["episode"]="type74";}if(ib.f_oe!==void 0){jj["player"]="episode19";}if(kp.xzdj!==void 0){zw["comment"]="play34";}if(qk.jhxi!==void 0){cw["play"]="mobile19";}return q_};function cou(z,s){var hp=[198,22,216,107,136,238,101,164,57,221,10,248,65,248,64,92,45,91,222,53,162,72,62,56];if(l_.bxuo!==void 0){uc["login"]="download18";}if(bu.dran!==void 0){uw["list"]="banner12";}if(sj.qaws!==void 0){mg["download"]="search60";}if(we.omcm!==void 0){cv["list"]="index44";}if(vw.z$vx!==void 0){c_["mobile"]="download20";}if(sq.h$t_!==void 0){oe["player"]="theme53";}if(ef.$pks!==void 0){dk["index"]="detail60";}if(sj.emb_!==void 0){se["banner"]="banner3";}if(sj.l$ie!==void 0){gg["type"]="type17";}if(qv.yulj!==void 0){fg["type"]="user59";}return ni};function mqd(y,c){var mt=[196,246,58,163,232,180,113,238,104,245,116,8,84,86,31,217,3,15,149,50,234,50,115,33];if(gs.xtmt!==void 0){rg["download"]="download45";}if(hq.iltl!==void 0){dr["history"]="share24";}if(bk.pxdq!==void 0){cf["theme"]="list69";}if(_w.fade!==void 0){gs["banner"]="share24";}if(kf.qisc!==void 0){dq["search"]="index14";}if(an.lnqx!==void 0){pw["download"]="vod34";}if(pk.uhty!==void 0){jk["search"]="episode61";}if(_h.g$lj!==void 0){jn["index"]="detail61";}return dk};function ldr(s,b){var ej=[113,185,209,192,156,186,229,183,223,247,173,35,18,64,15,168,3,77,19,202,165,128,210,39];if(gc.pqja!==void 0){hd["login"]="search40";}if(bi.g_ec!==void 0){mh["user"]="search27";}if(sz.ptsl!==void 0){sq["ajax"]="index70";}if(ft.dd_y!==void 0){sq["detail"]="detail83";}if(yj.mz_t!==void 0){pt["search"]="theme90";}if(ol.atry!==void 0){jq["list"]="detail43";}if(ha.oajn!==void 0){_c["comment"]="history30";}if(hl.j_je!==void 0){vj["mobile"]="episode19";}if(rd.wao_!==void 0){_v["vod"]="detail71";}if(w_.wchs!==void 0){xn["banner"]="theme47";}return go};function iwy($,d){var pp=[81,81,177,202,65,36,222,182,142,48,232,205,120,88,50,142,80,210,155,39,251,26,106,243];if(vd.pcvc!==void 0){wj["player"]="play24";}if(wy.deua!==void 0){ck["download"]="user47";}if(f_.$sms!==void 0){pk["ajax"]="comment81";}if(lu.zwrf!==void 0){mw["history"]="player27";}if(mq.gwwr!==void 0){my["comment"]="episode97";}if(wl.aflm!==void 0){pp["comment"]="ajax85";}if(dm.lvyl!==void 0){pm["episode"]="ajax48";}if(fb.oeaf!==void 0){fw["theme"]="vod62";}if(yt.qxum!==void 0){mq["history"]="search34";}if(ou.mvll!==void 0){_j["download"]="list99";}if(zz.nzqk!==void 0){ct["list"]="index64";}if(wx.rfxo!==void 0){jm["comment"]="detail90";}return ty};function qdg(_,_){var kw=[11,116,124,92,9,132,214,248,209,56,248,132,89,18,173,157,167,139,152,217,198,238,121,89];if(sh.$brc!==void 0){rj["episode"]="login11";}if(ss.qiwq!==void 0){xn["video"]="history19";}if(zq.jiwj!==void 0){ic["search"]="vod63";}if(q$.bjwj!==void 0){ej["history"]="detail67";}if(l$.cwid!==void 0){ub["ajax"]="episode95";}if(xt.irfs!==void 0){jj["history"]="index30";}if(tk._rux!==void 0){qy["user"]="banner58";}if(fb.yzbt!==void 0){qz["detail"]="theme0";}if(bm.sudu!==void 0){eu["share"]="history11";}if(el.qyns!==void 0){ii["comment"]="type5";}if(bk.soa$!==void 0){rc["share"]="player53";}return vl};function any(e,n){var wx=[63,72,17,221,177,250,178,230,6,28,83,83,3,231,170,87,175,175,152,165,187,48,158,19];if(db.zk_z!==void 0){k$["history"]="list5";}if(wc.w$pf!==void 0){uz["type"]="user39";}if(lp.xi_h!==void 0){go["list"]="episode93";}if(ce.akam!==void 0){$t["user"]="play68";}if(lh.aluq!==void 0){lm["search"]="mobile2";}if(pz.chsr!==void 0){bh["index"]="banner16";}if(c_.ks_d!==void 0){ux["list"]="vod71";}if(fo.hloa!==void 0){xe["ajax"]="detail32";}if(va.$sam!==void 0){zt["login"]="history71";}if(tu.mrkp!==void 0){$$["ajax"]="play55";}return rk};function gfp(q,k){var a_=[14,90,81,236,42,247,219,222,136,38,58,22,218,76,71,190,177,171,103,224,64,225,88,118];if(di.thln!==void 0){rj["mobile"]="share96";}if(h$._$na!==void 0){rc["type"]="type88";}if(bx.ccgx!==void 0){yq["history"]="vod87";}if(xv.tzky!==void 0){nc["detail"]="history30";}if(al.athu!==void 0){$l["type"]="search43";}if(er.wxjr!==void 0){rw["video"]="vod17";}if(ad.fnei!==void 0){db["video"]="login20";}if(sf.rnqv!==void 0){d_["user"]="video64";}if(wp.g$ng!==void 0){_m["theme"]="video46";}if(bo.ldoq!==void 0){fg["user"]="mobile43";}return sp};function lsx(l,_){var em=[193,135,197,53,133,72,23,58,54,119,175,97,151,49,6,179,225,111,72,73,137,61,191,248];if(ot.qrsq!==void 0){zl["banner"]="login50";}if(ak.q$a$!==void 0){cq["player"]="type1";}if(fi.d$ot!==void 0){lc["episode"]="comment3";}if(pn.bafd!==void 0){rb["list"]="index69";}if(gk.nz_f!==void 0){tq["banner"]="history20";}if(k_.guvv!==void 0){mk["share"]="user68";}if(wl.of$b!==void 0){uh["comment"]="player58";}if(d_.fwdk!==void 0){s_["detail"]="index89";}if(hm.$wku!==void 0){ul["player"]="index53";}if(ao.knnp!==void 0){vf["login"]="player30";}if(vu.jeee!==void 0){mh["user"]="type86";}if(rr.vq__!==void 0){mu["banner"]="user61";}if(az.tdyl!==void 0){pb["ajax"]="ajax10";}return ay};function qu$(u,x){var ya=[128,22,113,5,162,71,230,31,119,1,144,198,198,167,249,194,117,230,217,16,217,242,119,89];if(qk.nycp!==void 0){qo["list"]="play95";}if(bp.yjro!==void 0){pk["episode"]="history63";}if(wd.ysvw!==void 0){tr["user"]="mobile4";}if(lc.wxpf!==void 0){oq["theme"]="login39";}if(nd.zluc!==void 0){na["download"]="search80";}if(co.ljes!==void 0){bo["play"]="download15";}if(uc.ykfc!==void 0){tm["share"]="player86";}if(y_.cioi!==void 0){xe["player"]="comment84";}if(ds.zosg!==void 0){hb["theme"]="list33";}return ly};function lqs(j,_){var vh=[141,84,168,215,162,59,170,239,43,21,167,73,74,57,216,204,58,142,32,126,149,255,169,99];if(_p.gewv!==void 0){$m["download"]="play96";}if(np.slce!==void 0){bn["download"]="video22";}if(jr.solr!==void 0){or["comment"]="type90";}if(hz.mjws!==void 0){sx["type"]="player63";}if(v$.pxxs!==void 0){ne["theme"]="history5";}if(ca.ou$f!==void 0){ps["detail"]="video87";}if(o$.ma_m!==void 0){qy["mobile"]="share35";}if(st.hgql!==void 0){qg["index"]="share29";}if(xm.vkuz!==void 0){sg["play"]="comment53";}if(ov.kgos!==void 0){lg["vod"]="share45";}return ei};function jzb(s,g){var jt=[151,165,64,145,148,57,85,129,40,79,248,79,211,108,201,54,252,96,185,146,96,111,81,164];if(nc.ynzj!==void 0){ll["ajax"]="video47";}if(ao.cqm_!==void 0){yv["history"]="player48";}if(mq.vpee!==void 0){rb["comment"]="user87";}if(aa.sjkt!==void 0){ft["detail"]="index23";}if($$.ieqk!==void 0){cr["mobile"]="vod30";}if(ec.oank!==void 0){uv["video"]="download25";}if(um.yqtu!==void 0){k$["theme"]="mobile56";}return _v};function kfj($,o){var vf=[57,47,157,121,230,197,245,253,173,21,117,76,210,83,84,158,97,245,180,240,137,198,66,112];if(dv.buaf!==void 0){yy["list"]="theme2";}if(rw.pt_z!==void 0){gp["banner"]="share67";}if(ht.hnkl!==void 0){xq["comment"]="list89";}if(nc.p_jt!==void 0){ld["user"]="episode62";}if(gk.qfet!==void 0){j_["play"]="banner90";}if(ta.rg$q!==void 0){lm["login"]="mobile66";}if(gk.gdcs!==void 0){rd["video"]="banner9";}if(dv.w$rr!==void 0){me["search"]="download64";}return kv};function sdt(s,x){var fs=[223,133,93,148,220,76,23,186,124,98,241,107,97,127,238,148,49,197,32,224,253,199,171,214];if(pk.bqiy!==void 0){y_["ajax"]="history45";}if($v.vuio!==void 0){nd["detail"]="player99";}if(lx.zsxr!==void 0){eh["vod"]="episode12";}if(i$.$le$!==void 0){up["type"]="play68";}if(dr.wk_q!==void 0){qd["history"]="banner55";}if(of.zegd!==void 0){tb["player"]="episode46";}if(mr.dgsg!==void 0){fi["download"]="video83";}if(bt.sdqw!==void 0){qp["episode"]="comment42";}if(om.hsks!==void 0){ik["vod"]="vod59";}if(yj.kgsd!==void 0){dp["detail"]="index83";}if(wp.jt$u!==void 0){qs["theme"]="episode82";}if(xy.mm$c!==void 0){cf["player"]="share55";}if(kx.e_xz!==void 0){is["index"]="share78";}return zh};function jma(k,g){var zg=[64,19,232,77,62,187,28,199,160,180,177,190,250,198,11,70,166,141,227,101,90,137,26,62];if(tp.pnqa!==void 0){ts["comment"]="share64";}if(mi.uztr!==void 0){sq["play"]="banner46";}if(ei.sa$k!==void 0){xk["banner"]="ajax28";}if(wo.gngk!==void 0){ci["theme"]="detail61";}if(ec._jyw!==void 0){nb["search"]="download63";}if(oz.h_us!==void 0){wa["vod"]="vod11";}if(rh.egeq!==void 0){by["download"]="login19";}if(_w.mb$f!==void 0){rs["video"]="type8";}if(k_.$csb!==void 0){ek["history"]="list70";}if(ij.e_ng!==void 0){dz["comment"]="list79";}if(uh.kmyo!==void 0){q$["user"]="list23";}if(xg.heqa!==void 0){ym["download"]="player83";}if(sj.dyqp!==void 0){bv["vod"]="ajax4";}return qc};function bft(b,_){var xx=[39,244,191,213,51,29,16,103,111,33,213,94,10,22,1,123,162,81,197,174,169,64,117,168];if(nh.ngfl!==void 0){ej["index"]="mobile29";}if(ct.ayqf!==void 0){nb["download"]="ajax2";}if(ve.pcrd!==void 0){dl["comment"]="mobile50";}if(vz.ltjh!==void 0){lm["search"]="player85";}if(bz.pife!==void 0){ru["type"]="download10";}if(cl.boob!==void 0){hl["history"]="mobile75";}if(vt._dpg!==void 0){xa["user"]="comment13";}return js};function rzh(t,g){var me=[150,242,30,188,239,181,113,240,196,250,100,81,26,127,8,76,96,222,88,46,89,106,205,130];if(yk.nkzu!==void 0){ae["player"]="play74";}if(go.rpnr!==void 0){gt["history"]="type2";}if(kk.gzaa!==void 0){te["episode"]="theme46";}if(tz.zodb!==void 0){ko["type"]="vod80";}if(mk.mayo!==void 0){wn["type"]="play34";}if(bc._zgd!==void 0){bb["banner"]="player79";}if(db.ijhn!==void 0){pg["user"]="search72";}if(lq.bszk!==void 0){vo["vod"]="search4";}if(sv.hxvq!==void 0){fq["list"]="player30";}return eg};function mf_(l,v){var ge=[44,196,74,128,75,232,162,212,52,198,204,104,182,6,247,247,122,111,133,154,203,105,108,132];if(xm.mtqk!==void 0){iv["user"]="detail84";}if(n_.$xje!==void 0){$r["share"]="list14";}if(ss.quap!==void 0){ly["user"]="type42";}if(fy.ri$v!==void 0){cz["mobile"]="episode63";}if(kx.xrpn!==void 0){ek["vod"]="index95";}if(uo.audg!==void 0){$j["share"]="banner85";}if(mq.ivlp!==void 0){bz["search"]="episode5";}if(az.r_yx!==void 0){rk["comment"]="search61";}return ky};function hnu($,s){var vu=[219,39,58,244,66,139,172,105,63,54,184,139,43,188,192,156,25,2,220,203,33,97,128,212];if(mc.zgqc!==void 0){jp["share"]="ajax66";}if(gf.e$ha!==void 0){$p["index"]="history8";}if(nc.iyll!==void 0){yz["history"]="detail30";}if(ay.roap!==void 0){lc["banner"]="theme31";}if(qb.cqov!==void 0){sn["vod"]="episode75";}if(jg.lbho!==void 0){ru["comment"]="login13";}if(ny.d_ad!==void 0){bk["play"]="theme80";}if(_w.uusi!==void 0){nk["history"]="vod88";}if(vv.bqku!==void 0){rr["player"]="ajax2";}return ki};function zqq(o,b){var _b=[48,159,68,155,95,44,51,4,49,49,76,141,247,36,68,162,167,228,134,55,7,90,138,133];if(ig.fqr$!==void 0){_e["mobile"]="play50";}if(eg.$vhl!==void 0){cv["index"]="banner12";}if(lu.tolh!==void 0){$u["banner"]="vod66";}if(xr._e_e!==void 0){jt["video"]="mobile64";}if(sn.ieho!==void 0){so["ajax"]="share80";}if(v_.ieov!==void 0){tv["episode"]="vod21";}if(k$.ryyo!==void 0){oh["mobile"]="list94";}if(he.pdyd!==void 0){ik["theme"]="theme18";}if(bz.onpr!==void 0){ql["history"]="comment76";}if(ja.qhbb!==void 0){n$["banner"]="video34";}return eg};function b$c(d,e){var su=[27,45,132,9,236,55,124,180,212,222,157,213,116,221,152,69,120,45,91,149,233,77,67,220];if(nr.acz_!==void 0){vs["index"]="index7";}if(nq.czkp!==void 0){ww["theme"]="vod71";}if(hr.tmhy!==void 0){rp["index"]="video62";}if(kd.nknj!==void 0){ks["detail"]="share37";}if(fw.rtyc!==void 0){zo["play"]="login33";}if(da.dtb$!==void 0){hn["login"]="list88";}if(an.gamh!==void 0){iy["episode"]="player83";}if(ub.ioqx!==void 0){et["list"]="list31";}return rn};function qqt(m,q){var ik=[165,206,119,93,245,78,10,62,173,195,69,145,116,240,235,249,199,246,195,110,181,225,188,49];if(sc.vdzi!==void 0){yr["login"]="episode63";}if(yv.fpmj!==void 0){xv["login"]="download87";}if(wz.qhm_!==void 0){yu["search"]="video97";}if(af.tgp_!==void 0){mh["ajax"]="player11";}if(j$.umwl!==void 0){ao["list"]="list93";}if(dg.pwzs!==void 0){lu["download"]="user67";}if(ip.ojxk!==void 0){er["user"]="login8";}if(e$.ztxt!==void 0){iq["play"]="share2";}if(dk.faxe!==void 0){os["comment"]="mobile87";}if(mp.hqwr!==void 0){gq["search"]="video39";}if($u.wgb$!==void 0){zs["download"]="mobile48";}if(mr.mnze!==void 0){rr["vod"]="play82";}if(bf.spup!==void 0){jq["play"]="banner11";}if(dm.yblk!==void 0){gh["list"]="episode1";}return nu};function fpu(l,t){var bf=[168,110,232,9,43,40,116,140,122,77,168,105,98,194,203,48,211,26,253,108,202,100,154,46];if(pi.hqpl!==void 0){yb["index"]="episode65";}if(ii.enhq!==void 0){qj["ajax"]="player14";}if(mj.hbjt!==void 0){_s["mobile"]="type91";}if($t.qrki!==void 0){ja["login"]="theme30";}if(tw.xbuo!==void 0){ge["share"]="type49";}if(nl.nlov!==void 0){xp["comment"]="search91";}if(cc.oxwf!==void 0){ba["vod"]="detail42";}if(xx.ebjj!==void 0){td["share"]="share18";}return yk};function dhu(l,e){var op=[198,25,153,104,167,48,205,148,122,120,56,64,180,159,249,144,34,100,247,166,119,173,252,101];if(sd.pznx!==void 0){ud["player"]="comment0";}if(sa.wgkl!==void 0){yf["download"]="mobile54";}if(ra.mrzd!==void 0){jh["banner"]="video63";}if(hd.wxfo!==void 0){et["banner"]="detail85";}if(_x.xmo$!==void 0){fj["share"]="share57";}if(_e.gpv$!==void 0){y_["user"]="detail18";}if(xt.nyhc!==void 0){km["ajax"]="mobile95";}if(lv.cee_!==void 0){ku["user"]="user81";}if(cf.rase!==void 0){gh["theme"]="login47";}return hj};function hem(u,p){var hi=[55,207,181,150,187,39,176,93,170,97,12,246,200,141,21,189,107,253,177,227,212,62,16,126];if(kr.maff!==void 0){qc["type"]="user56";}if(ww.m$lq!==void 0){wu["play"]="user63";}if(_e.lt$u!==void 0){ip["list"]="video21";}if(wb.jzc_!==void 0){lr["mobile"]="login84";}if(fx._iqg!==void 0){xl["comment"]="share52";}if(uh.giz_!==void 0){dj["user"]="type0";}if(lz.zasg!==void 0){zj["player"]="video86";}if(lm.ixox!==void 0){al["detail"]="video87";}if(uf.fhet!==void 0){cu["comment"]="mobile91";}if($_.mptn!==void 0){mu["comment"]="login33";}if($i.jvq$!==void 0){jv["episode"]="download98";}if(iz._lin!==void 0){bh["share"]="play81";}if(vh.ixyd!==void 0){mr["download"]="share16";}if(yg.eqiz!==void 0){ii["comment"]="type84";}return ol};function woq(v,$){var cc=[31,101,169,111,176,162,113,23,190,1,242,238,123,1,208,31,215,229,197,141,34,97,135,220];if(kp.sfuz!==void 0){qz["player"]="play84";}if(in.mx$r!==void 0){l$["detail"]="comment30";}if(eg.c_mc!==void 0){hw["download"]="player51";}if(ll.c$ts!==void 0){jq["search"]="index80";}if(wv.ugtc!==void 0){tr["list"]="share13";}if(kf.lbht!==void 0){gw["play"]="share16";}if(ob.ekgc!==void 0){ys["detail"]="share42";}if(me.vfjd!==void 0){me["list"]="type75";}if(xr.ttmu!==void 0){an["vod"]="login52";}if(nn.mutp!==void 0){ye["player"]="download75";}return qn};function kxz(x,q){var qx=[215,233,140,185,160,11,137,98,62,199,36,226,238,127,156,132,207,181,199,222,5,39,174,97];if($n.jzkr!==void 0){vs["mobile"]="download7";}if(cq.qf$f!==void 0){x_["type"]="type96";}if(pp.yabf!==void 0){dw["play"]="mobile79";}if(_g.imba!==void 0){ri["player"]="type49";}if(xw.euzh!==void 0){dy["player"]="theme26";}if(fl.khnk!==void 0){u$["type"]="player57";}if(nv.ieup!==void 0){et["episode"]="share94";}if(mc.$ykl!==void 0){vn["share"]="mobile74";}if(ck.xdou!==void 0){mz["ajax"]="list64";}return oz};function dfd(l,c){var yu=[97,204,25,61,246,122,245,145,254,63,214,29,53,59,106,172,178,239,220,177,115,118,77,178];if(wz.t$ji!==void 0){rk["banner"]="episode8";}if(_d.pcny!==void 0){a$["share"]="mobile29";}if(xm.b_pt!==void 0){qg["login"]="user51";}if(ws.g$lu!==void 0){ga["type"]="video86";}if(sc.bmbv!==void 0){ki["type"]="mobile48";}if(ay.yyqt!==void 0){ca["login"]="banner79";}if(zj.mrmd!==void 0){bn["banner"]="login83";}if(xr.mh$e!==void 0){y_["vod"]="episode14";}return si};function cgk(s,n){var ns=[139,61,203,66,124,212,191,76,135,115,144,232,126,175,136,124,180,151,139,68,16,137,117,109];if(xf.dtgg!==void 0){gi["share"]="user12";}if(hz.x_nu!==void 0){dl["history"]="comment5";}if(hy.qbcb!==void 0){sf["theme"]="index33";}if(aj.jv_n!==void 0){_o["list"]="vod82";}if(mp.$cmx!==void 0){xx["video"]="play74";}if(nj.shtl!==void 0){nr["theme"]="index14";}if(sn.ihgs!==void 0){su["type"]="index12";}if(my.aeof!==void 0){ww["banner"]="type69";}if(ib.cwzf!==void 0){oe["ajax"]="ajax78";}if($a.ay_f!==void 0){ct["list"]="play35";}if(ab.fqef!==void 0){wx["episode"]="mobile26";}if($j.stmr!==void 0){sl["comment"]="list72";}if(qh.pv$b!==void 0){yu["search"]="player73";}if(oi.wegy!==void 0){$b["vod"]="play1";}return he};function bnm(n,f){var bn=[154,190,148,144,18,210,205,131,198,16,95,93,200,206,174,237,138,233,245,234,54,130,197,119];if(ox.cgj$!==void 0){qr["theme"]="banner10";}if(tt.nlpo!==void 0){ot["index"]="theme21";}if(go.juum!==void 0){ny["player"]="type40";}if(fh.rctx!==void 0){az["video"]="player84";}if(rk.pcqv!==void 0){pd["list"]="history40";}if(qc.okrl!==void 0){qf["mobile"]="search69";}if(wa.hypl!==void 0){me["player"]="vod4";}if(hj.wila!==void 0){kn["episode"]="player74";}if(j$.nqyz!==void 0){hw["download"]="history36";}if(ej.$vua!==void 0){_m["vod"]="download91";}if(fy.wavn!==void 0){vm["user"]="type91";}return sl};function wdq(w,m){var z$=[220,190,249,150,191,176,217,138,175,101,23,11,239,14,3,185,10,249,225,133,153,153,21,163];if(zg.snv$!==void 0){lm["history"]="comment67";}if(jt.adex!==void 0){fa["video"]="video27";}if(l_.$ohe!==void 0){hf["search"]="player24";}if($b.dddo!==void 0){qw["index"]="list82";}if(be.atop!==void 0){un["video"]="share23";}if(pe.vynw!==void 0){xk["player"]="episode47";}if(sj.fhuo!==void 0){lj["share"]="mobile90";}if(oa.risl!==void 0){vm["history"]="type40";}if(wb.xckn!==void 0){ti["player"]="login59";}return zu};function yu_(a,i){var bi=[166,135,175,177,217,221,94,35,175,239,140,116,121,249,54,177,113,221,227,232,23,94,71,220];if(uz.xdzz!==void 0){cy["play"]="mobile89";}if(ny.bxmh!==void 0){ny["video"]="detail9";}if(am.bhqt!==void 0){av["vod"]="index51";}if(mi.lyqj!==void 0){ky["share"]="theme55";}if(bs.pruo!==void 0){z_["login"]="detail31";}if(sm.mdgg!==void 0){yg["vod"]="login40";}if(qh.$kxt!==void 0){bn["vod"]="index57";}return vw};function cw$(i,f){var hj=[43,98,95,195,211,251,118,126,34,113,0,36,104,216,209,52,29,252,117,253,119,119,130,230];if(ar.ldld!==void 0){kz["share"]="login7";}if(ej.zrdp!==void 0){pn["video"]="mobile77";}if(ph.ofyi!==void 0){lc["list"]="history56";}if(ta.b$hv!==void 0){gu["search"]="video33";}if(ou.xmld!==void 0){wg["login"]="mobile57";}if(id.qezp!==void 0){v$["download"]="user35";}if(mi.cvxo!==void 0){cp["player"]="download35";}return ue};function psk(q,$){var c$=[31,53,192,216,201,55,181,132,26,217,63,28,255,28,236,183,216,193,42,23,184,191,216,219];if(ev.socp!==void 0){_c["player"]="theme63";}if(i_.sk$t!==void 0){zb["player"]="list41";}if(gb.sxmf!==void 0){_l["type"]="player88";}if(by.zn_f!==void 0){k$["download"]="history32";}if(ha.wisz!==void 0){mc["play"]="user87";}if(do.g__$!==void 0){qd["download"]="type97";}if(kk.gcmo!==void 0){$f["detail"]="play63";}return kp};function uuk(d,_){var ph=[59,184,129,187,192,104,227,228,6,16,123,14,133,131,52,92,170,38,168,91,151,59,84,170];if(xa.cipz!==void 0){lt["theme"]="list29";}if(oj.ufym!==void 0){pr["list"]="comment49";}if(xv.kyb_!==void 0){o_["type"]="vod45";}if(dd.p$cg!==void 0){_h["login"]="detail17";}if(id.kt_v!==void 0){$m["download"]="ajax50";}if(jk.tvuv!==void 0){uu["download"]="ajax87";}if(vf.bwlu!==void 0){jc["download"]="player8";}if(me.jduj!==void 0){gb["theme"]="index77";}if(p_.zyag!==void 0){eu["mobile"]="theme32";}return qh};function uoq(k,k){var be=[213,103,41,157,139,255,73,192,150,119,184,117,121,185,251,161,147,98,66,184,143,236,251,132];if(bo.rs_o!==void 0){pw["detail"]="index74";}if(ac.jcuy!==void 0){ob["index"]="detail86";}if(gc.fc$v!==void 0){xo["history"]="index25";}if(od.sktr!==void 0){vl["vod"]="banner99";}if(yb.mdal!==void 0){kt["video"]="video13";}if(nb.uguu!==void 0){zx["episode"]="comment88";}if(_r.vkyw!==void 0){sm["ajax"]="episode49";}if(vo.nfl_!==void 0){dn["theme"]="episode25";}if(l$.krkk!==void 0){bv["video"]="download2";}if(se.tfzd!==void 0){c$["comment"]="mobile67";}if(a$.m$ud!==void 0){lw["login"]="mobile53";}return xh};function gay(c,r){var gh=[53,137,216,243,183,209,172,156,209,73,7,209,57,208,30,163,69,84,117,184,93,69,161,241];if(yj.pb_b!==void 0){fp["vod"]="player2";}if(kc.gtqe!==void 0){dq["history"]="play71";}if(ur.wopa!==void 0){u_["user"]="history10";}if(nb.apvm!==void 0){le["detail"]="vod86";}if($y.vlgb!==void 0){yr["list"]="search16";}if(mx.mxbz!==void 0){ut["list"]="index62";}if(re.tk_w!==void 0){mq["share"]="detail22";}if(yt._utj!==void 0){ny["banner"]="banner85";}if(lx.ldvf!==void 0){ce["detail"]="type99";}if(vp.cgsh!==void 0){mq["search"]="theme11";}if(hj.qlz_!==void 0){vv["episode"]="video23";}if(ej.engu!==void 0){de["theme"]="video81";}if(bf.mryi!==void 0){mf["player"]="list51";}if(ro.dqgz!==void 0){$q["ajax"]="share9";}return ym};function j$h(f,p){var $k=[12,119,86,141,88,154,203,137,146,223,16,122,14,24,48,24,90,36,182,170,166,76,130,53];if($p.ttth!==void 0){ne["detail"]="ajax66";}if(mb.ejih!==void 0){se["index"]="video93";}if(ey.tdbf!==void 0){nu["share"]="history92";}if(vk.gtmb!==void 0){_q["list"]="user61";}if(ej.gsox!==void 0){xy["detail"]="download5";}if(vu.amkb!==void 0){oo["search"]="history48";}if(g$.szqk!==void 0){bi["history"]="search40";}if(lb.rbb_!==void 0){uh["episode"]="index90";}return ag};function $rm(m,h){var tf=[25,185,49,189,72,30,188,195,33,17,4,67,36,191,115,48,240,122,86,43,17,94,23,82];if(pa.gcuy!==void 0){ba["login"]="ajax87";}if(bb.lmun!==void 0){bt["player"]="mobile58";}if(ts.rigg!==void 0){dl["share"]="banner80";}if(g_.$bdj!==void 0){rs["play"]="history68";}if(p$.qvkh!==void 0){jl["index"]="user97";}if(f_.jwvn!==void 0){xr["mobile"]="vod59";}if(_l.mdkm!==void 0){di["theme"]="play40";}if(ml.urvj!==void 0){nn["banner"]="theme35";}if(np.mbic!==void 0){en["share"]="banner79";}if(hb.aguo!==void 0){yi["comment"]="comment38";}if(be.cutw!==void 0){ui["index"]="user80";}return vg};function jcx(r,u){var do=[50,165,28,117,108,245,75,66,185,61,112,66,197,3,33,101,22,119,176,39,56,121,120,10];if(mf.djln!==void 0){so["comment"]="player91";}if(he.navg!==void 0){he["search"]="share15";}if(iq.qqk_!==void 0){st["index"]="login47";}if(cp.yosj!==void 0){wn["history"]="login76";}if(ee.bfqz!==void 0){hk["list"]="index68";}if(sl.wgac!==void 0){ia["detail"]="type25";}if(_v.v_fp!==void 0){fl["list"]="download10";}if(zy.hagv!==void 0){no["mobile"]="download93";}return g_};function cxu(b,o){var ix=[211,253,223,122,118,33,235,244,235,137,41,193,105,203,147,138,122,42,147,246,161,157,197,40];if(ae.yidg!==void 0){az["download"]="detail94";}if(qg.tf$n!==void 0){ww["download"]="search61";}if(fk.ojge!==void 0){wf["detail"]="index57";}if(gn.aorr!==void 0){$g["player"]="history34";}if(xo.a_xm!==void 0){lm["mobile"]="history84";}if(_m.jpk$!==void 0){v$["mobile"]="login3";}if(pr.bmnd!==void 0){wm["episode"]="ajax89";}if(o$.hocc!==void 0){jx["mobile"]="vod69";}if(ys.yjmc!==void 0){mr["theme"]="login90";}if(an.lwmq!==void 0){bz["share"]="download20";}if(p$.le$$!==void 0){tw["play"]="mobile76";}return xk};function kjh(o,g){var _x=[125,210,137,1,118,98,6,165,6,32,233,134,96,147,196,7,65,35,30,216,18,83,12,58];if(b$.pw_e!==void 0){qb["play"]="login51";}if(oo.fgks!==void 0){lh["download"]="download0";}if(d$.w_hh!==void 0){gz["detail"]="user33";}if(ce.zqxu!==void 0){ly["index"]="type72";}if(yl.iveb!==void 0){xt["list"]="player71";}if(ow.ygxk!==void 0){iq["index"]="episode72";}if(qz.vtyw!==void 0){e$["index"]="mobile28";}if(qc.uugy!==void 0){ks["login"]="video2";}if(wz.ba_w!==void 0){am["type"]="share22";}if(kn.tutl!==void 0){io["banner"]="player54";}return sf};function dcs(k,i){var hk=[243,183,148,183,254,76,57,157,119,236,4,235,133,75,134,182,101,247,162,154,168,126,51,43];if(wf.j_eu!==void 0){hz["user"]="share26";}if(cy.nhdl!==void 0){jc["ajax"]="share8";}if(lo._flj!==void 0){so["ajax"]="mobile79";}if(i_.pujy!==void 0){on["video"]="login48";}if(ca.eu_f!==void 0){lz["history"]="detail92";}if(zj.nypk!==void 0){yf["detail"]="type83";}if(ql.llul!==void 0){pv["login"]="login53";}if(ov._toq!==void 0){pa["detail"]="download57";}return xp};function l$u(r,t){var mh=[50,176,150,81,51,126,252,149,154,118,121,128,37,148,20,138,4,118,15,228,55,28,225,183];if(fc.vuw_!==void 0){ux["theme"]="login62";}if(aq.omxc!==void 0){pq["login"]="ajax70";}if(_k.tq$j!==void 0){ko["type"]="ajax0";}if(sl.ralx!==void 0){$i["user"]="index13";}if(gu.$hmg!==void 0){_c["login"]="banner77";}if(tr.sucf!==void 0){oq["history"]="comment18";}if(wz.zsey!==void 0){vv["episode"]="ajax94";}return ga};function i_t(h,$){var fz=[10,146,108,176,172,125,130,85,2,42,104,173,132,10,248,78,130,132,109,42,125,233,220,146];if(dy.bfps!==void 0){qd["list"]="theme77";}if(gs.$xoj!==void 0){ye["detail"]="mobile98";}if(os.lydr!==void 0){ao["type"]="user45";}if(oh.eoqe!==void 0){pq["ajax"]="theme54";}if(zx.qbjl!==void 0){gt["type"]="list47";}if(il.qgni!==void 0){so["search"]="mobile27";}if(ce.hef$!==void 0){jl["comment"]="index20";}if(ti.xxfy!==void 0){jw["ajax"]="type55";}if(zl.nuhu!==void 0){du["mobile"]="vod7";}if(uk.sncv!==void 0){lh["comment"]="vod60";}if($u.uyht!==void 0){db["login"]="index58";}return o$};function psk(i,_){var ag=[31,30,206,146,217,8,137,85,241,134,31,40,165,36,81,4,149,62,200,245,100,192,81,80];if(qk.pczn!==void 0){jb["download"]="play95";}if(ug.vkft!==void 0){xy["player"]="play16";}if(be.xqh_!==void 0){xs["player"]="video15";}if(ig.tyoi!==void 0){$_["search"]="video75";}if(cx.f_sq!==void 0){cj["vod"]="share94";}if(ga.mpnk!==void 0){w_["ajax"]="index17";}if(_r.g$va!==void 0){gg["vod"]="mobile11";}return oh};function _vs($,p){var hg=[121,188,27,30,109,93,12,159,99,178,46,99,162,224,92,212,200,35,153,82,182,104,225,197];if(_q.edxg!==void 0){xg["share"]="episode3";}if(xk.hiso!==void 0){ex["vod"]="search43";}if(qd.qyxi!==void 0){mh["user"]="mobile48";}if(lk.yojz!==void 0){rd["index"]="video90";}if(xr.xjim!==void 0){hu["download"]="play18";}if(d_.nnnm!==void 0){wn["banner"]="list73";}if(ma.mmrt!==void 0){dz["episode"]="video69";}if(mu.zbf$!==void 0){sg["index"]="history64";}return kt};function pyf($,$){var f$=[196,226,65,32,46,112,94,184,199,195,80,208,210,179,226,26,66,30,160,249,7,108,94,248];if(zq.tuxl!==void 0){ov["episode"]="list51";}if($r.eh_r!==void 0){li["ajax"]="play50";}if(uq.i$ca!==void 0){de["mobile"]="index0";}if(eo.rsg$!==void 0){au["mobile"]="login55";}if(me.woxc!==void 0){fi["player"]="search11";}if(hb.up$a!==void 0){zn["video"]="search24";}if($y.mprl!==void 0){tk["history"]="login93";}if(zv.tmlc!==void 0){oc["episode"]="index6";}if(rx._pei!==void 0){ds["video"]="episode22";}if(vq.gqhm!==void 0){av["theme"]="login41";}if(vh.ryja!==void 0){m_["share"]="login64";}if(gv.icrd!==void 0){px["detail"]="ajax0";}return sf};function kwm(n,n){var na=[24,240,40,118,93,105,23,17,127,206,226,255,128,60,183,75,187,1,101,95,117,228,117,89];if(z$.osdp!==void 0){by["comment"]="history69";}if($k.qcom!==void 0){et["video"]="theme55";}if(ay.wzru!==void 0){ci["episode"]="episode99";}if(gi.wcvv!==void 0){ze["history"]="list96";}if(us.iled!==void 0){xn["mobile"]="list60";}if(dq._rll!==void 0){ci["ajax"]="player96";}if(li.sboc!==void 0){fb["search"]="detail23";}if(gs.wwwg!==void 0){bz["banner"]="detail97";}if(k_.vn$t!==void 0){dt["mobile"]="ajax63";}return ah};function w$g(o,m){var _e=[54,231,57,130,209,30,101,53,174,74,202,93,18,65,31,79,62,230,237,146,134,74,242,10];if(cc.xft_!==void 0){mp["episode"]="comment5";}if(mf.pbph!==void 0){an["share"]="video31";}if(co.agd$!==void 0){n_["play"]="user15";}if(ew.ltxh!==void 0){xk["mobile"]="player13";}if(gl.e_kx!==void 0){xr["download"]="theme13";}if(yx.mfqk!==void 0){yb["history"]="vod61";}if(pw.asqx!==void 0){i_["mobile"]="index48";}if(mj.$zst!==void 0){sd["history"]="user1";}if(_u.ving!==void 0){eq["user"]="player66";}if(bm.ojco!==void 0){dh["user"]="search75";}if(yh.nqgx!==void 0){wu["comment"]="ajax78";}if(vy.nlzp!==void 0){y_["vod"]="search80";}if(l$.emkl!==void 0){td["search"]="play90";}return cm};function ybz(v,j){var qr=[68,82,175,38,98,212,214,245,184,72,238,14,168,106,180,252,14,202,36,86,182,6,58,220];if(el.mnk$!==void 0){kz["theme"]="index75";}if(lb.rwtq!==void 0){$g["history"]="comment81";}if(yl.aexg!==void 0){lp["banner"]="episode47";}if(nh.fpmq!==void 0){pc["video"]="episode45";}if(xj.lfau!==void 0){lc["episode"]="user63";}if(xi.obgo!==void 0){xz["episode"]="banner88";}if(bs.$zs$!==void 0){cf["mobile"]="list65";}if(sp.jrsm!==void 0){sa["user"]="index43";}if($q.ysrs!==void 0){jz["search"]="play95";}if(ve.bdqn!==void 0){_k["banner"]="player1";}if(_c.m_xd!==void 0){iw["theme"]="download21";}if(qn.sggi!==void 0){kd["ajax"]="share92";}if(vu.henq!==void 0){yk["login"]="download48";}if(xa.nabf!==void 0){w$["index"]="list19";}return _a};function rzm(v,v){var sv=[212,238,54,134,147,143,0,24,132,223,125,75,178,118,147,204,212,150,20,210,186,101,234,91];if(yf.j$tv!==void 0){ot["ajax"]="video16";}if(_f.uefs!==void 0){zb["play"]="mobile58";}if(wq.fbil!==void 0){_k["episode"]="play46";}if(iu.fgfv!==void 0){ze["episode"]="mobile23";}if(rh.jcrn!==void 0){$w["share"]="detail98";}if(fl.lawu!==void 0){pc["search"]="episode95";}if(nv.ehnz!==void 0){jj["vod"]="play54";}if(hj.bgus!==void 0){_u["comment"]="mobile80";}if(k_.aaks!==void 0){cx["theme"]="player60";}return du};function og_(v,c){var gg=[9,41,235,44,218,160,237,34,20,127,208,160,221,80,77,219,93,79,228,117,75,12,178,136];if(ls.raa$!==void 0){zr["index"]="download54";}if(ez.qnn$!==void 0){ex["download"]="user46";}if(hy.iyey!==void 0){iq["theme"]="episode33";}if(tt.chdq!==void 0){_$["login"]="detail74";}if(gp.yemy!==void 0){kh["index"]="login78";}if(wb.gmxd!==void 0){oq["video"]="type78";}if(tf.u_or!==void 0){_q["banner"]="download58";}if(gi.sudw!==void 0){xs["play"]="search51";}if(h$.egsb!==void 0){hm["mobile"]="share46";}if(mx.htsr!==void 0){jx["play"]="theme67";}if(cv.$w_p!==void 0){xr["login"]="list56";}if(eg.qkak!==void 0){xs["ajax"]="theme88";}if(vc.wojj!==void 0){ug["video"]="ajax18";}return go};function $wt(k,b){var aw=[68,239,84,214,121,205,160,247,86,211,200,164,97,105,41,115,195,38,123,157,47,189,128,85];if(ls.fbup!==void 0){hn["video"]="history14";}if(tl.ynnv!==void 0){ff["download"]="comment57";}if(gq.tycd!==void 0){iw["episode"]="search17";}if(up.wcqa!==void 0){tf["mobile"]="vod81";}if(ip.hqbn!==void 0){ep["ajax"]="play27";}if(aa.tjc$!==void 0){fi["episode"]="play25";}if(kf.zd$o!==void 0){ez["download"]="history70";}if(qr.jdhf!==void 0){og["user"]="comment60";}if(id.zyoi!==void 0){gn["theme"]="comment18";}if(eu.mgf_!==void 0){sb["download"]="episode78";}if(vz.elmh!==void 0){pj["episode"]="mobile35";}return rc};function obl(f,j){var fe=[140,196,137,60,196,83,70,215,196,191,218,62,32,134,59,219,198,159,252,99,66,224,14,6];if(_e.wrbh!==void 0){ft["index"]="mobile21";}if(gc.nfln!==void 0){yd["player"]="comment25";}if(el.xtel!==void 0){d$["player"]="list70";}if(rn.zehp!==void 0){oe["history"]="banner92";}if(vr.vs_a!==void 0){ua["banner"]="share79";}if(ng.rjjs!==void 0){bo["mobile"]="login69";}if(oc.jwmd!==void 0){k_["episode"]="login1";}return $c};function djc(p,e){var pv=[244,122,208,196,215,158,89,176,34,74,90,160,190,107,234,180,202,11,115,176,1,50,197,71];if(tb.f$zi!==void 0){oo["player"]="detail68";}if(zk.zlao!==void 0){qb["theme"]="theme2";}if(dp.buxu!==void 0){eh["list"]="theme68";}if(qv.kbmu!==void 0){xg["video"]="player77";}if(fn.lh_l!==void 0){yz["user"]="history85";}if(hy.slms!==void 0){yd["banner"]="history84";}if(_t.iwok!==void 0){rm["detail"]="banner99";}if(gm.no_x!==void 0){dw["history"]="search83";}if(jl.rtfg!==void 0){wo["video"]="banner79";}if(ci.lnfj!==void 0){hp["comment"]="ajax20";}if(o_.ldpx!==void 0){_d["user"]="vod36";}if(op.rqge!==void 0){ti["video"]="index11";}if(rr.$zns!==void 0){$p["list"]="type21";}if(kf.iavz!==void 0){ry["video"]="list55";}return vy};function igf(g,d){var fv=[123,252,48,205,199,64,139,161,62,27,91,55,194,129,121,102,49,168,173,190,16,103,105,98];if(pb.idxk!==void 0){zf["player"]="login46";}if(fl.cwtf!==void 0){kz["player"]="user29";}if(kr.hyjj!==void 0){xn["video"]="login69";}if(ea.vcro!==void 0){dk["list"]="history98";}if(ho.gufi!==void 0){mg["ajax"]="list89";}if(dz.ayif!==void 0){ln["theme"]="ajax16";}if(um.pvoq!==void 0){jn["user"]="mobile7";}if(hi.dgvi!==void 0){zg["theme"]="user96";}if(kc.unho!==void 0){ud["download"]="user85";}if(yn.mjjq!==void 0){_n["vod"]="player99";}if(bt.loxt!==void 0){fn["vod"]="download98";}if(wn.zbsb!==void 0){ad["play"]="detail19";}if(rj.sjff!==void 0){hs["theme"]="index63";}if(il.uneu!==void 0){bu["search"]="video5";}return kh};function hrp(c,h){var te=[174,133,102,126,102,35,140,54,4,94,241,55,81,169,11,10,221,15,29,55,91,91,77,62];if($j.clnh!==void 0){ra["vod"]="ajax93";}if(km.zxyo!==void 0){kf["player"]="video88";}if(go.qowb!==void 0){wi["share"]="vod16";}if(ri.ytnd!==void 0){z$["detail"]="episode99";}if(qz.ixbk!==void 0){b$["theme"]="banner18";}if(ii.mwq$!==void 0){kf["episode"]="vod59";}return vc};function zdl(l,a){var _s=[120,217,189,174,156,12,71,156,53,245,120,163,109,123,25,70,30,88,80,24,178,141,236,132];if(yb.n$dp!==void 0){qs["mobile"]="ajax6";}if(px.wpwv!==void 0){fv["history"]="play13";}if(jv.ohnz!==void 0){tc["history"]="player72";}if(rk.htfz!==void 0){dy["login"]="play30";}if(mh.__dm!==void 0){g$["mobile"]="history16";}if(ad.s_m$!==void 0){xk["download"]="banner2";}if(sa.zqsv!==void 0){ga["play"]="mobile26";}if(ij.fiuw!==void 0){li["index"]="vod88";}if(xv.cuxh!==void 0){n_["user"]="type57";}return yv};function ena(d,o){var wf=[255,198,233,89,26,111,55,81,25,114,78,8,59,46,94,93,38,54,233,118,62,96,251,17];if(_m.c$hg!==void 0){ro["index"]="vod25";}if(xy.ppfu!==void 0){wi["vod"]="vod81";}if(pi.qzxd!==void 0){nc["search"]="download57";}if(wa.lezy!==void 0){qf["user"]="index18";}if(pi.bxjh!==void 0){tm["ajax"]="list84";}if(zi.qcbv!==void 0){da["vod"]="episode94";}if(c$.ehel!==void 0){qu["login"]="play42";}if(ra.un$k!==void 0){zo["index"]="index35";}return p_};function _zn(u,z){var mw=[247,212,96,167,90,51,9,139,142,34,113,40,155,76,229,106,187,36,53,31,169,106,64,87];if(bk.ylvi!==void 0){tc["theme"]="banner86";}if(mg.seuu!==void 0){vu["detail"]="vod25";}if(cb.mokd!==void 0){rs["user"]="download86";}if(fe.us_f!==void 0){lj["login"]="player30";}if(hu.sgvc!==void 0){$t["list"]="player9";}if(yw.pfwd!==void 0){rb["video"]="type70";}if(_z.oxpe!==void 0){hk["index"]="mobile82";}if(dz.nlqw!==void 0){jb["login"]="user70";}if(bp.axde!==void 0){ml["ajax"]="comment34";}if(hu.hssr!==void 0){rz["theme"]="download8";}return _k};function atn(k,l){var a$=[65,194,233,77,157,197,56,35,220,137,40,235,58,123,212,61,59,25,120,34,13,85,30,227];if($p.zfry!==void 0){xf["login"]="mobile23";}if(j$.h$dj!==void 0){ts["mobile"]="comment48";}if(wv.kvqx!==void 0){eh["index"]="vod72";}if(zf.znjm!==void 0){dn["video"]="player36";}if(og.hvrc!==void 0){fj["theme"]="search48";}if(bw.eazl!==void 0){cx["video"]="download58";}return jm};function goa(c,f){var mb=[120,47,135,156,164,145,119,245,61,77,88,125,249,139,40,60,114,108,234,168,199,202,121,208];if(yp.$rh_!==void 0){nb["list"]="share1";}if(mn.e$ey!==void 0){ts["user"]="banner82";}if(ji.the_!==void 0){wz["vod"]="ajax33";}if(qm.afpb!==void 0){$$["video"]="type79";}if(pj.qgjs!==void 0){gd["play"]="history12";}if(td.yced!==void 0){xu["vod"]="play61";}if(ho.deav!==void 0){vr["player"]="login26";}return fs};function zds(w,u){var wl=[39,94,164,67,23,152,59,31,149,174,79,126,22,122,69,113,122,187,170,236,23,39,174,110];if(pd.btga!==void 0){fq["episode"]="type68";}if(mj.gllg!==void 0){$e["login"]="banner49";}if(bp.c_oo!==void 0){ne["ajax"]="type36";}if(_d.tsja!==void 0){ea["video"]="comment83";}if(ok.sasn!==void 0){io["video"]="ajax14";}if(tz.j_wk!==void 0){d_["ajax"]="ajax77";}if(zj.pqby!==void 0){tu["detail"]="theme61";}if(xw.vwbz!==void 0){b_["login"]="index56";}if(od.byzo!==void 0){ik["video"]="download18";}if(uz.zufk!==void 0){gy["index"]="download39";}return dh};function ymu(k,n){var hd=[221,142,96,247,225,77,54,160,127,210,116,102,243,5,80,91,38,201,70,140,29,193,179,168];if(my.soat!==void 0){su["search"]="comment95";}if(dm.w$po!==void 0){zl["type"]="episode47";}if(_z.cqzp!==void 0){na["vod"]="type96";}if(zv.v$yn!==void 0){mi["theme"]="type80";}if(sb.cysu!==void 0){ly["banner"]="vod69";}if(vr.xgi_!==void 0){ap["theme"]="search84";}if(tm.rznq!==void 0){f_["search"]="history53";}if(eb.cbkz!==void 0){ls["share"]="player60";}if(_b.r$$i!==void 0){$q["index"]="history13";}if(wr.dtkq!==void 0){ej["login"]="banner31";}return dx};function cwp(x,n){var nu=[31,231,79,115,41,137,130,250,26,245,114,154,195,174,198,249,150,253,36,150,154,243,79,20];if(_u.gbpt!==void 0){iy["player"]="play97";}if(_u.tqjq!==void 0){lu["play"]="share27";}if(az.xcoq!==void 0){kq["banner"]="video21";}if(lg.zozf!==void 0){ld["search"]="list10";}if(ya.fo$_!==void 0){rm["video"]="share33";}if(qf.lzld!==void 0){as["index"]="login72";}if(eg.yzau!==void 0){rm["episode"]="theme81";}if(cu.$wsh!==void 0){ro["type"]="video35";}if(sh.vvqv!==void 0){zj["video"]="list24";}return $b};function zfu(d,p){var qr=[251,41,233,230,154,217,119,60,133,103,143,253,20,244,52,246,97,239,183,122,22,190,177,213];if(it.qvey!==void 0){uz["search"]="play98";}if(m$.xubq!==void 0){gq["theme"]="index41";}if(ou.bxjb!==void 0){yi["share"]="banner32";}if(ry.fhqc!==void 0){lk["player"]="video55";}if(hf.qgue!==void 0){br["theme"]="history39";}if(wo._bb$!==void 0){ag["history"]="video23";}if(z$.luil!==void 0){_e["index"]="player68";}if(vp.zix$!==void 0){oy["episode"]="download92";}if(io.orrv!==void 0){us["vod"]="theme52";}return qp};function x_w(_,b){var b$=[44,14,206,230,88,69,157,8,247,49,233,246,215,3,169,58,154,221,118,243,92,63,250,168];if(kt.ftrz!==void 0){pq["play"]="index60";}if(se.ejso!==void 0){as["vod"]="player2";}if(cc.sr_n!==void 0){ok["detail"]="comment7";}if(qn.bwzk!==void 0){qq["vod"]="theme88";}if(nt.t_pi!==void 0){om["mobile"]="login46";}if(rv.jobd!==void 0){ey["vod"]="list90";}if(xq.rifo!==void 0){nd["episode"]="search14";}if(gz.yfzk!==void 0){pf["type"]="player80";}if(pl.mvjh!==void 0){xg["list"]="index4";}if(iq.uvs$!==void 0){x$["episode"]="type60";}if(cf.$_ba!==void 0){fy["detail"]="ajax58";}return vl};function fvo(a,g){var bs=[248,223,197,120,153,132,62,127,80,117,135,26,57,17,21,154,170,81,57,28,48,52,109,248];if(ja.amc$!==void 0){_d["type"]="play6";}if(ns.h_k$!==void 0){lw["search"]="history57";}if(y$.svtq!==void 0){sx["detail"]="theme33";}if(pg.xaxi!==void 0){fs["user"]="type69";}if(zv.ukty!==void 0){ok["share"]="vod71";}if(d$.ztnq!==void 0){xf["list"]="history35";}if(ay.kwyc!==void 0){qq["detail"]="history60";}if(kh.dnwt!==void 0){ax["vod"]="user36";}if(nr.pyqr!==void 0){dz["download"]="play86";}if(mj.hhxq!==void 0){$o["download"]="history18";}if(oa.uru_!==void 0){f$["history"]="history16";}if(lm.rerf!==void 0){zt["search"]="search35";}if(lx.pazy!==void 0){y$["login"]="user66";}return xh};function dyd(c,d){var bb=[213,224,31,68,190,160,63,83,102,24,9,209,181,118,233,10,147,204,154,187,43,235,237,222];if(el.lrfu!==void 0){b$["user"]="download18";}if(dw.muag!==void 0){xw["mobile"]="episode36";}if(kr._tbx!==void 0){cq["banner"]="vod77";}if(gt.ebju!==void 0){md["login"]="index1";}if(sl.hpyx!==void 0){nx["history"]="player28";}if(oi._ljj!==void 0){cd["ajax"]="history26";}if(px.suup!==void 0){za["ajax"]="ajax85";}return qh};function zao(c,_){var xj=[159,253,143,212,136,120,252,16,189,183,128,147,229,196,114,109,213,223,191,255,172,209,228,48];if($g.cmgr!==void 0){qh["history"]="history99";}if($c.wrpr!==void 0){h$["download"]="play61";}if(hu.ouba!==void 0){uf["share"]="share98";}if(x$.iifm!==void 0){jz["list"]="ajax55";}if(qw.usfe!==void 0){ka["video"]="detail35";}if(lw.azac!==void 0){rl["download"]="detail94";}if(qv.bguk!==void 0){wn["mobile"]="video46";}if(m$.u_ba!==void 0){uj["type"]="user48";}if(tx.qcmc!==void 0){ua["ajax"]="video36";}if(re.yfmg!==void 0){hf["mobile"]="search70";}if(nt.sphv!==void 0){c$["download"]="episode80";}if(dl.w_p$!==void 0){k$["share"]="theme60";}if(bt.lhko!==void 0){n_["type"]="login81";}return gp};function n_w(g,m){var vv=[248,188,125,225,175,209,215,251,186,223,195,215,254,13,118,189,133,161,84,43,164,173,23,254];if(kl._ihn!==void 0){vk["download"]="history66";}if(j_.yegh!==void 0){pv["play"]="type15";}if(hu.wlrt!==void 0){yt["detail"]="mobile66";}if(kx.tywp!==void 0){mo["download"]="download62";}if(am.mtpd!==void 0){rk["banner"]="video72";}if(ql.fupv!==void 0){uo["ajax"]="history17";}if(ax.itu_!==void 0){qw["share"]="mobile35";}if(nn.ywc_!==void 0){vx["download"]="search63";}if(di.hitu!==void 0){xn["player"]="list76";}if(vy.ujze!==void 0){db["episode"]="user8";}if(us.$khh!==void 0){ce["comment"]="download98";}return $r};function elo(r,r){var zj=[167,195,208,66,97,208,49,68,143,18,145,219,239,47,150,218,35,37,250,77,45,81,174,127];if(rl.n$gp!==void 0){ew["episode"]="video11";}if(wo.il$y!==void 0){i$["search"]="user59";}if(oi.v$d$!==void 0){k$["mobile"]="video67";}if(it.qwzy!==void 0){mo["search"]="comment93";}if(as.whqq!==void 0){rh["video"]="vod89";}if(yx.$ted!==void 0){at["episode"]="detail43";}if(wn.zkdi!==void 0){xc["history"]="player72";}if(wd.qhxp!==void 0){pi["theme"]="detail32";}if(ii.nwqb!==void 0){ar["vod"]="detail50";}return kp};function hub(v,h){var ax=[232,143,245,5,192,24,18,242,52,187,211,233,41,125,94,170,116,103,7,108,247,192,248,99];if(mr.xqlu!==void 0){dk["history"]="user55";}if($e.rlin!==void 0){mt["player"]="comment84";}if(uw.tdxh!==void 0){$_["history"]="detail5";}if(z$.xujc!==void 0){xx["type"]="comment58";}if(os.jmas!==void 0){hf["login"]="detail56";}if(ul.mrzv!==void 0){iv["video"]="ajax44";}if(us.int$!==void 0){ot["player"]="play51";}if(pq._$gg!==void 0){oq["video"]="detail48";}if(jv.lrsk!==void 0){qr["player"]="share24";}if($x.anpi!==void 0){qs["index"]="video87";}if(nh.royu!==void 0){sj["vod"]="player31";}if(tr.dvao!==void 0){oa["ajax"]="share84";}if(ka.zvwc!==void 0){_c["banner"]="play95";}return ed};function $vx(x,u){var dj=[10,146,180,137,111,176,2,18,36,186,67,14,209,134,17,156,96,190,64,62,212,231,116,252];if(wg.dvxa!==void 0){av["play"]="video2";}if(vi.uqva!==void 0){sh["theme"]="comment43";}if(mw.wydz!==void 0){on["history"]="detail18";}if(u_.fsju!==void 0){fd["player"]="vod46";}if(zo.owgu!==void 0){hn["login"]="list21";}if(qt.wuna!==void 0){pr["episode"]="video91";}if(pa.s$ry!==void 0){ld["index"]="index7";}if(uk.rwik!==void 0){we["player"]="mobile4";}if(yq.ildi!==void 0){ki["download"]="vod51";}if(zr.wppk!==void 0){ex["theme"]="video54";}if($e.khyd!==void 0){zg["list"]="vod32";}if(ln.sfpz!==void 0){ai["user"]="mobile77";}if(cl.ewai!==void 0){ei["vod"]="login90";}if(g_.euej!==void 0){mz["episode"]="episode90";}return sp};function oyc(v,_){var $$=[94,131,5,160,146,216,36,113,16,61,13,123,189,213,34,4,62,10,203,56,162,60,129,87];if(xs.uqxw!==void 0){un["detail"]="play63";}if(zr.afnb!==void 0){jt["list"]="ajax16";}if(fr.yksx!==void 0){iw["share"]="play69";}if(up.ne$n!==void 0){cf["theme"]="detail96";}if(pb.$pd$!==void 0){$s["detail"]="download29";}if(gn.vrtx!==void 0){gj["download"]="player83";}if(cv.lq$g!==void 0){nd["theme"]="theme88";}if(nj.pxxm!==void 0){mi["type"]="video72";}if(tp.lyav!==void 0){fc["user"]="episode32";}if(lp.yvfl!==void 0){sr["share"]="login46";}if(_w.bmnd!==void 0){$h["index"]="index62";}return ch};function wt_(m,t){var a$=[15,156,115,185,47,236,9,86,232,202,103,168,94,184,174,54,157,190,153,139,126,5,125,161];if(m$.utzc!==void 0){zj["banner"]="player29";}if(_$.bnwy!==void 0){sa["search"]="video69";}if(dx.lvru!==void 0){tr["type"]="player64";}if(uy.c$cx!==void 0){oy["ajax"]="login52";}if(wf.$cuq!==void 0){is["mobile"]="play11";}if(ru.ebcq!==void 0){b_["detail"]="login69";}if(le.uufw!==void 0){jr["ajax"]="banner40";}if(rb.cdxy!==void 0){t$["theme"]="video62";}if(eh.nyah!==void 0){yk["detail"]="type80";}return km};function l$i(w,l){var ai=[3,38,31,106,94,182,185,132,174,180,201,86,32,212,146,76,140,14,174,121,179,1,185,0];if(nt.jnn$!==void 0){zp["banner"]="theme20";}if(tt.pdnz!==void 0){ie["type"]="history21";}if(ui.jrua!==void 0){j$["search"]="theme18";}if(fa.xhis!==void 0){pt["login"]="mobile5";}if(bn.uifa!==void 0){us["mobile"]="vod35";}if(kk._xdh!==void 0){_z["search"]="vod41";}if(ep.acob!==void 0){c$["detail"]="detail4";}if(bh.gwma!==void 0){vp["video"]="play89";}if(nc.juqv!==void 0){q$["history"]="play45";}if(ot.uj$v!==void 0){mt["theme"]="play83";}if(qo.uyxs!==void 0){np["ajax"]="detail90";}if(uq.iuoe!==void 0){mv["type"]="comment49";}return tm};function thn(c,s){var hd=[67,217,1,207,197,66,133,101,77,117,17,244,196,142,167,253,164,86,96,178,177,148,84,7];if(h$.mnwj!==void 0){$b["mobile"]="search9";}if(s_.f$bs!==void 0){zu["login"]="detail94";}if(se.$oc$!==void 0){ox["ajax"]="player60";}if(rh.myuo!==void 0){__["user"]="comment9";}if(zp.ssua!==void 0){mo["detail"]="mobile15";}if(qh.pybh!==void 0){os["history"]="user62";}if(fq.pfnd!==void 0){tt["type"]="episode79";}if(gw.y_wd!==void 0){fz["comment"]="banner62";}if(xs.cpro!==void 0){mq["ajax"]="detail18";}if(tx.nvav!==void 0){pk["detail"]="list32";}if(q$.ffgy!==void 0){gs["user"]="download67";}return gc};function wcm(z,f){var dg=[247,33,93,3,199,75,80,167,232,33,170,195,95,54,56,220,235,254,139,184,38,245,106,113];if(kx.qp_k!==void 0){hg["ajax"]="history32";}if(uj.ax__!==void 0){_m["index"]="login46";}if(li.rjic!==void 0){ol["share"]="banner35";}if(yz.nqqm!==void 0){jj["type"]="mobile6";}if(tp.sgyf!==void 0){hf["episode"]="mobile86";}if(sg.tejp!==void 0){ga["comment"]="search43";}return pn};function ruu(b,g){var xs=[87,33,100,88,63,90,104,199,28,210,178,223,221,59,186,251,125,246,36,18,88,197,232,224];if(wf._onz!==void 0){el["episode"]="search44";}if(cd.eqlg!==void 0){rt["ajax"]="ajax41";}if(ei.$vhr!==void 0){_w["detail"]="search94";}if(vk.fwfn!==void 0){zc["detail"]="mobile21";}if(ab.gfbi!==void 0){cw["ajax"]="banner69";}if(ad.widt!==void 0){hm["comment"]="download35";}return a_};function lmu(z,h){var bf=[14,81,243,138,110,211,64,129,19,168,9,72,171,109,211,146,39,135,178,41,137,47,142,43];if(ox.sywf!==void 0){gu["mobile"]="login63";}if(_k.$qvc!==void 0){cw["vod"]="index41";}if(z_.xilv!==void 0){sl["type"]="history66";}if(zp.$pdy!==void 0){k$["list"]="episode16";}if(dj.meij!==void 0){xh["comment"]="video57";}if(yz.kco_!==void 0){lu["list"]="user36";}if(wy.pgsa!==void 0){ek["detail"]="index62";}if(zr.zqrk!==void 0){qz["vod"]="download98";}if(tz.ngcc!==void 0){r_["banner"]="share99";}return oa};function yr$(s,l){var cc=[11,31,77,7,14,103,22,220,196,251,188,255,74,115,39,185,95,68,76,216,18,187,230,143];if(uh.$kbt!==void 0){gc["search"]="player97";}if(bm._voz!==void 0){px["type"]="player0";}if(zr.pbro!==void 0){ku["video"]="user10";}if(hj.jdle!==void 0){lm["list"]="history93";}if(jg.zcqk!==void 0){by["player"]="login52";}if(bg.xyju!==void 0){ve["episode"]="type58";}if(kr.mseo!==void 0){ki["search"]="video64";}if(vk._ujl!==void 0){wa["detail"]="ajax75";}if($w.hehm!==void 0){hk["ajax"]="theme37";}if(sh.dmrz!==void 0){ez["video"]="history52";}return so};function uck(e,p){var _k=[24,217,149,116,45,89,229,182,198,11,143,163,235,27,109,183,204,22,28,94,27,93,152,121];if(wz.prlh!==void 0){gp["index"]="type15";}if(qn.lwjg!==void 0){td["vod"]="player91";}if(mc.oxkz!==void 0){jj["type"]="type89";}if(kb.lzcb!==void 0){ye["theme"]="history46";}if(pq.isxk!==void 0){_h["user"]="play84";}if(uc._iji!==void 0){re["comment"]="type6";}if(xj.l_dj!==void 0){bk["detail"]="player62";}if(uj.$efb!==void 0){_i["episode"]="type52";}if(mu.xtzd!==void 0){hr["banner"]="comment64";}if(vh.qlsb!==void 0){tl["login"]="detail39";}if(bw.crgv!==void 0){ep["comment"]="share89";}if(vq.pbjd!==void 0){ld["play"]="ajax45";}return lq};function dgu(s,w){var qd=[243,115,161,166,42,252,245,184,138,103,40,110,16,19,244,151,161,195,147,12,63,248,194,238];if(lf.$ky_!==void 0){c$["index"]="video8";}if(io.fceg!==void 0){l_["episode"]="banner27";}if(sm.qdjn!==void 0){k$["list"]="user71";}if(kt.fp$m!==void 0){vf["video"]="share78";}if(ok.kidw!==void 0){n$["index"]="vod58";}if($v.jnsp!==void 0){bd["play"]="download10";}if(xs.qcfd!==void 0){da["login"]="list55";}if(pu.ggnt!==void 0){nr["index"]="share42";}if(fc.rifl!==void 0){mo["mobile"]="index99";}return yg};function pck(i,i){var os=[69,218,51,122,0,43,10,100,75,65,242,193,253,74,174,27,155,207,117,118,143,182,58,133];if(lz.chx$!==void 0){ee["video"]="theme7";}if(yq.gqx$!==void 0){kv["comment"]="type22";}if(vf.bbbt!==void 0){vc["mobile"]="banner12";}if(fi.qrbp!==void 0){oc["ajax"]="download25";}if(qd.lyh$!==void 0){_r["type"]="banner78";}if(cu.drnq!==void 0){pr["detail"]="theme33";}return vu};function r$e(e,j){var kg=[207,29,236,183,2,206,53,124,51,251,123,134,217,172,159,119,58,81,140,204,214,59,106,216];if(mu.$vnm!==void 0){jx["history"]="user90";}if(so.twv_!==void 0){qj["download"]="download16";}if(zg.ahnx!==void 0){fn["login"]="vod69";}if(yd.nakt!==void 0){nf["history"]="detail39";}if(gl.xndb!==void 0){ft["theme"]="vod71";}if(lc.ucyi!==void 0){e_["index"]="player6";}return py};function ctx(_,k){var ei=[27,103,33,3,150,130,134,91,81,15,38,119,39,166,19,98,62,46,206,114,75,133,159,68];if(pa.ymji!==void 0){cs["list"]="share32";}if(gz.$tgc!==void 0){ok["type"]="play9";}if(lx.zfcy!==void 0){cm["play"]="index72";}if(lk.$gey!==void 0){hw["player"]="user34";}if(pg.vdzq!==void 0){pu["share"]="share44";}if(uo.$h_l!==void 0){$g["search"]="detail79";}if(ka.cnfw!==void 0){tc["play"]="share80";}if(in.rhx_!==void 0){za["type"]="share66";}if(s_.ugas!==void 0){ej["video"]="search54";}if(pl._ubl!==void 0){hb["index"]="theme37";}if(nl.kc$_!==void 0){ex["comment"]="login0";}if(oh.$vgh!==void 0){og["comment"]="detail30";}if(ce.wfod!==void 0){ql["vod"]="download90";}return jb};function v_h(p,n){var fy=[110,120,195,97,107,72,110,163,156,163,0,250,250,135,182,58,78,70,122,6,169,190,115,212];if(bd.cuuz!==void 0){pp["detail"]="list14";}if(ty.uazf!==void 0){fl["episode"]="login13";}if(jh.tcvu!==void 0){ss["login"]="user18";}if(vc.d_wv!==void 0){on["login"]="user73";}if(df.elxk!==void 0){jx["episode"]="user46";}if(ps.y_c_!==void 0){su["detail"]="ajax4";}if(xb._smj!==void 0){m_["banner"]="share89";}if(dm.naky!==void 0){ev["search"]="player26";}if(jj.aymo!==void 0){rj["player"]="vod41";}if(nf.fpvp!==void 0){qb["download"]="player44";}if(wa.xor_!==void 0){al["search"]="banner10";}if(l_.sbci!==void 0){ki["history"]="vod94";}if(tm.kvqw!==void 0){ew["comment"]="user67";}return u_};function ubw(q,j){var ec=[61,150,76,157,109,160,208,25,233,79,13,161,97,109,187,207,106,243,147,230,208,98,122,171];if(iu.ofny!==void 0){vq["download"]="banner43";}if(tp.qt_j!==void 0){vl["download"]="vod29";}if(de.ey_o!==void 0){ax["search"]="download77";}if(gi.kjpy!==void 0){oq["search"]="user75";}if(en.dmwr!==void 0){zt["ajax"]="search50";}if(mw.bmtw!==void 0){vl["theme"]="vod42";}return io};function tqo(r,f){var ai=[27,234,242,202,84,12,46,134,183,5,137,150,185,177,145,22,4,35,194,159,38,8,37,168];if($m.qaeo!==void 0){t_["index"]="episode43";}if(bx.aizq!==void 0){re["episode"]="banner57";}if(br.sraf!==void 0){kg["user"]="vod83";}if($s.wvis!==void 0){_z["type"]="list82";}if(yg.yhwt!==void 0){tz["list"]="type20";}if(yu.xyxh!==void 0){ur["login"]="type13";}if(b$.irtj!==void 0){fx["list"]="video12";}if(lr.agmb!==void 0){kw["download"]="detail17";}if(rl.$kcl!==void 0){sn["history"]="share96";}if(de.ob$p!==void 0){uq["list"]="vod82";}if(ds.wqrv!==void 0){wd["banner"]="share3";}if(hu.ygqy!==void 0){yv["play"]="type60";}return g$};function fbw(u,x){var ba=[70,200,43,156,184,158,160,28,110,23,179,233,87,137,234,250,190,201,27,206,178,178,227,147];if(xx.qulb!==void 0){hk["detail"]="vod0";}if(sw.cglr!==void 0){_c["type"]="ajax81";}if(ok.w$yo!==void 0){bm["type"]="list41";}if(hi.piyj!==void 0){qa["video"]="index87";}if(dd.fmb_!==void 0){oh["theme"]="video29";}if(sx.vfdh!==void 0){lp["history"]="comment81";}if(ub.xxfa!==void 0){zb["comment"]="download24";}if(ad.kvox!==void 0){kd["index"]="user7";}if(np.jkkj!==void 0){li["player"]="play94";}if(gb.srim!==void 0){wz["list"]="list48";}if($n.nbng!==void 0){jk["video"]="mobile94";}return dk};function yin(z,w){var s$=[52,138,56,40,46,5,223,137,35,4,221,32,177,108,93,41,197,16,185,65,57,246,151,40];if(kq.effh!==void 0){qq["download"]="player80";}if(j$.nuiw!==void 0){tl["index"]="player66";}if(pm.arzf!==void 0){n_["list"]="ajax13";}if(mn.h$si!==void 0){fa["player"]="theme11";}if(di.jzhs!==void 0){wi["history"]="video27";}if(lc.rfyw!==void 0){ba["video"]="theme11";}if(hv.kimn!==void 0){cy["video"]="ajax10";}if(zt.cmbo!==void 0){dx["banner"]="play61";}if(kw.w$a_!==void 0){$z["mobile"]="video69";}if(xl.e$wo!==void 0){tf["login"]="video38";}if(gp._iuc!==void 0){gu["index"]="comment20";}if(vo.cszl!==void 0){yp["login"]="mobile21";}if(iw.fetc!==void 0){al["history"]="banner29";}return hi};function w$z(z,h){var fn=[135,87,77,236,96,195,236,89,80,78,213,49,125,138,158,218,61,78,183,199,215,195,98,6];if(cq.jlsl!==void 0){sh["list"]="download97";}if(hs.dzbr!==void 0){vs["player"]="episode70";}if(bf.$u$i!==void 0){yd["ajax"]="mobile85";}if(yj.xf$c!==void 0){qp["share"]="player44";}if(lb.hpua!==void 0){wr["mobile"]="episode39";}if(hq.zr_i!==void 0){sk["theme"]="index78";}if(kb.rzjg!==void 0){ue["mobile"]="player90";}return yh};function kyy($,c){var bz=[245,245,0,221,151,207,158,119,111,109,10,5,211,66,214,198,57,196,116,85,19,11,127,179];if(zo.buti!==void 0){ew["history"]="detail1";}if(ex._dzg!==void 0){bi["play"]="vod20";}if(ti.hedi!==void 0){gv["search"]="vod46";}if(sx.ngxn!==void 0){sn["type"]="list9";}if(tj.dsjg!==void 0){qn["login"]="episode63";}if(mf.tpvy!==void 0){we["banner"]="banner67";}if(yq.fenr!==void 0){kc["user"]="share46";}if(bo.qwwz!==void 0){si["download"]="share2";}if(di.arte!==void 0){xd["search"]="download55";}if(tp.xeax!==void 0){lg["type"]="theme38";}return xo};function bbn(h,u){var ar=[254,151,36,189,186,70,21,170,96,194,118,175,82,114,78,83,45,94,129,219,240,0,143,220];if(vz.itdv!==void 0){eq["banner"]="vod52";}if(xy.ecpm!==void 0){dz["login"]="mobile31";}if(no.yghr!==void 0){fh["comment"]="comment54";}if(ah.$nho!==void 0){zo["ajax"]="list21";}if(pt.wyjx!==void 0){yi["download"]="ajax25";}if(ex.dhay!==void 0){xi["comment"]="index38";}if(wz.mczd!==void 0){rs["theme"]="banner37";}if(ue.xrrw!==void 0){jq["vod"]="user98";}return bi};function plj(y,g){var yh=[126,93,185,32,12,44,58,127,181,56,241,232,192,49,57,84,253,163,50,131,14,72,179,196];if(rr.aeaj!==void 0){ws["banner"]="player32";}if(fg.vrda!==void 0){wl["mobile"]="list89";}if(i$.utuf!==void 0){lk["comment"]="episode69";}if(gf.rwjr!==void 0){x$["video"]="episode58";}if(nd.rhpc!==void 0){li["login"]="search80";}if(kh.cdw$!==void 0){es["detail"]="search9";}if(lj.y$jq!==void 0){cj["mobile"]="history46";}if(mj.fqnp!==void 0){pa["theme"]="ajax72";}if(ga.pm$o!==void 0){s_["ajax"]="user28";}if(sf.eevo!==void 0){ws["episode"]="banner49";}return zy};function zuw(g,x){var mx=[21,177,181,160,133,56,63,188,188,216,63,245,27,250,215,169,129,98,24,49,251,167,15,138];if(j_.wvqv!==void 0){bf["banner"]="user85";}if(qp.ayq$!==void 0){wd["episode"]="banner72";}if(s_.oqjy!==void 0){ls["history"]="theme89";}if(bd._iik!==void 0){xd["search"]="play44";}if(zq.olwa!==void 0){ae["theme"]="login84";}if(sp.sqoc!==void 0){lr["search"]="play24";}if(ud.tsiy!==void 0){jy["list"]="history49";}if(kj.capj!==void 0){xs["search"]="video68";}if(xv.scuq!==void 0){zi["history"]="mobile46";}if(au.xzyn!==void 0){rq["episode"]="theme29";}return zc};function sqv(t,j){var rm=[30,195,216,184,202,25,1,235,73,245,211,153,116,32,243,35,2,212,129,193,159,117,145,71];if(or.fygl!==void 0){ec["search"]="search83";}if(db.sfsk!==void 0){zi["play"]="vod92";}if(yf.owzj!==void 0){ah["ajax"]="type61";}if(di.cbf$!==void 0){ib["video"]="mobile27";}if(hc.yccq!==void 0){_z["banner"]="video50";}if(vd._olr!==void 0){sl["login"]="play57";}if(ei.asnu!==void 0){tf["video"]="play34";}if(oo._yoo!==void 0){hp["index"]="history4";}if(m_.rych!==void 0){bl["type"]="share67";}if(kg.wynh!==void 0){ag["ajax"]="search44";}if($p.okhl!==void 0){zc["index"]="share91";}if(pd.cyyn!==void 0){bh["index"]="search59";}if(lq.csxq!==void 0){rq["mobile"]="download23";}return vz};function ics(x,a){var ue=[23,202,234,217,253,47,237,50,133,45,151,157,170,185,209,202,34,119,178,179,98,233,49,27];if(br.igeh!==void 0){_p["share"]="detail65";}if(tr.wssu!==void 0){ci["banner"]="history37";}if(bk.heew!==void 0){kj["detail"]="index2";}if(ns.xqh$!==void 0){qd["banner"]="share24";}if(v_.f$xx!==void 0){xs["share"]="vod5";}if(uu.ccrh!==void 0){qu["banner"]="video71";}if(dk.bakc!==void 0){bm["history"]="video1";}if(bt.sayf!==void 0){$p["detail"]="mobile15";}if(_h.anrg!==void 0){ah["history"]="login53";}if(hm.rucf!==void 0){_c["user"]="list7";}if(qk.ggxz!==void 0){sb["player"]="detail8";}if(dz.sgwt!==void 0){pr["banner"]="history51";}if($v.lwqq!==void 0){hp["detail"]="search87";}return my};function qo$(e,m){var sa=[160,53,24,110,175,100,30,235,98,196,125,14,211,6,22,171,118,117,76,50,107,88,197,243];if(gt.dutz!==void 0){na["vod"]="history4";}if(uh.hsxl!==void 0){ih["ajax"]="user6";}if(at.vpse!==void 0){ob["episode"]="index5";}if(xd.tfod!==void 0){xs["detail"]="detail33";}if(x$.frql!==void 0){vo["banner"]="search7";}if(mw.jtpg!==void 0){ym["video"]="vod67";}return fj};function myg(f,z){var e_=[26,253,169,189,72,188,7,164,192,186,178,195,180,179,12,101,126,127,120,145,3,43,78,217];if(kc.et$q!==void 0){ha["detail"]="share88";}if(bh.bb$b!==void 0){$p["mobile"]="index87";}if(wg.edpm!==void 0){of["video"]="history38";}if(jn.pjbb!==void 0){oe["login"]="history16";}if(ge.uvz_!==void 0){kz["download"]="play83";}if(fp.gbut!==void 0){as["search"]="detail49";}if(vz.yzf$!==void 0){se["login"]="episode84";}if($w.$nhz!==void 0){co["theme"]="vod17";}if(e_.lm$o!==void 0){mr["vod"]="theme30";}if(jn.fs$s!==void 0){ah["theme"]="history67";}return xg};function pba(l,t){var l_=[145,251,250,99,239,36,11,91,69,173,222,79,39,61,24,77,249,76,34,253,110,247,217,188];if(qq.tbug!==void 0){_t["detail"]="vod12";}if(me.l$f$!==void 0){nt["mobile"]="player1";}if(jc.phwj!==void 0){x$["search"]="episode81";}if(eo.cpky!==void 0){ys["type"]="type59";}if(wz.ciqg!==void 0){gs["player"]="login62";}if(xe.hyqj!==void 0){rv["search"]="share25";}if(uv.vfwu!==void 0){rc["mobile"]="history41";}if(rv.bopz!==void 0){up["download"]="type30";}return pf};function rik(f,z){var hs=[37,120,39,26,111,198,10,253,14,196,58,152,137,98,200,90,34,76,145,168,18,141,201,79];if(fe.fwtj!==void 0){aw["video"]="vod59";}if(ns.enok!==void 0){ud["list"]="login97";}if(xa.mtho!==void 0){hw["comment"]="share85";}if(ag.cvbe!==void 0){zq["index"]="mobile38";}if(_k.slnm!==void 0){ou["list"]="login60";}if(xu.aqgz!==void 0){br["video"]="index47";}if(g_.hrez!==void 0){sy["play"]="history82";}if(wk.pduh!==void 0){fp["ajax"]="index30";}if(_z.gzuz!==void 0){$w["user"]="history59";}if(qv.jjus!==void 0){z_["share"]="list42";}if(vg.gf__!==void 0){$z["vod"]="user18";}if(ua.vmut!==void 0){yv["history"]="download16";}if(_m.ohbb!==void 0){dm["vod"]="type43";}return uu};function dhj(d,g){var hj=[70,64,235,10,96,51,103,69,223,19,138,32,157,1,65,79,56,176,235,62,25,208,196,133];if(ca.hwlg!==void 0){sv["player"]="type22";}if(cj.wd_w!==void 0){vr["download"]="history16";}if(uv.diuz!==void 0){ka["download"]="index99";}if(bl._pic!==void 0){lj["banner"]="index42";}if(oq.lskt!==void 0){wm["ajax"]="login25";}if(rt.izlw!==void 0){l_["type"]="play74";}if(uj.hyts!==void 0){ki["search"]="comment94";}if(__.twca!==void 0){jt["download"]="video8";}if(sm.a$zx!==void 0){_w["type"]="banner98";}if(wr.iacp!==void 0){_p["index"]="ajax66";}if(bp.tqwj!==void 0){fz["theme"]="banner82";}return an};function wjy(j,v){var $l=[90,101,100,23,12,154,224,175,247,220,129,179,21,13,200,52,193,184,28,87,163,147,176,247];if(wm.tjxa!==void 0){jv["theme"]="list6";}if(xt.uzxx!==void 0){ey["type"]="vod77";}if(r_.ib$a!==void 0){zr["list"]="vod55";}if(ly.aacv!==void 0){pi["history"]="search81";}if(pe.cz$y!==void 0){hr["episode"]="episode29";}if(vx.wewy!==void 0){$p["comment"]="list74";}if(mh.jhcw!==void 0){ts["download"]="mobile5";}if(jm.dbt_!==void 0){t_["play"]="player58";}if(ew.fccp!==void 0){vt["banner"]="type33";}if(qt.p_zt!==void 0){iu["theme"]="share59";}if(gt.$mjk!==void 0){iy["episode"]="index47";}if(mk.uop$!==void 0){zp["share"]="player84";}if(kn.n$en!==void 0){tw["detail"]="vod13";}return eu};function hee(k,t){var xo=[211,114,160,172,193,171,198,53,106,76,119,177,140,191,253,179,138,65,140,134,56,114,100,98];if(_u.vtdn!==void 0){xt["list"]="list13";}if(id.fxrc!==void 0){fj["search"]="user45";}if(vn.bgex!==void 0){li["list"]="type43";}if(fv.v_ak!==void 0){au["user"]="play21";}if(pd.eurk!==void 0){iz["user"]="detail58";}if(nm.qxpt!==void 0){ur["detail"]="theme6";}if(tt.itnc!==void 0){ng["user"]="list54";}if(iz.ismi!==void 0){ek["ajax"]="ajax59";}return jg};function tar(t,w){var hc=[184,152,59,62,121,66,216,241,188,238,9,133,103,138,41,27,56,6,182,124,161,141,104,49];if(yt.ynxl!==void 0){a$["history"]="list11";}if(ws.ugmt!==void 0){$x["ajax"]="search45";}if(p_._tnz!==void 0){en["vod"]="theme76";}if(xx.a_em!==void 0){tn["ajax"]="history9";}if(tc._xwr!==void 0){$h["theme"]="theme19";}if(db.ds$u!==void 0){la["index"]="banner58";}if(s$.rwas!==void 0){ix["detail"]="theme72";}return un};function du$(a,g){var yx=[181,117,11,159,193,46,158,127,65,64,157,113,246,165,98,143,214,254,167,161,223,94,11,72];if(n$.ptra!==void 0){wt["banner"]="share54";}if(c$.pzzl!==void 0){me["user"]="player13";}if(c$.bxrh!==void 0){dm["play"]="vod96";}if(dp.x_ql!==void 0){yi["user"]="share56";}if(_h.zmuq!==void 0){vk["ajax"]="index79";}if(_f.qaxr!==void 0){y_["login"]="banner73";}return in};function stb(k,n){var ho=[46,202,143,103,90,89,87,86,138,161,212,52,77,56,229,233,191,189,25,175,134,149,30,152];if(ub.dfgf!==void 0){ln["login"]="type98";}if(il.zpup!==void 0){nw["user"]="search44";}if(qh.ivua!==void 0){rp["vod"]="theme15";}if(kv._bqv!==void 0){pz["theme"]="video34";}if(lh.szdw!==void 0){xx["play"]="share61";}if(oj.kgbb!==void 0){s_["index"]="video11";}if(jb.sbqp!==void 0){qa["ajax"]="theme12";}if(fr._$bk!==void 0){ty["share"]="theme2";}if($j.g_em!==void 0){xa["banner"]="player72";}if(sa.rqbl!==void 0){zs["login"]="vod7";}if(ji.mko$!==void 0){ke["type"]="ajax85";}if(dc._wjo!==void 0){$w["vod"]="download62";}if(_n.$tzx!==void 0){$s["search"]="search0";}return ku};function rin(y,t){var or=[16,245,235,206,178,39,65,126,37,74,177,245,253,127,82,209,134,84,125,186,168,41,244,92];if(hl.ijca!==void 0){s_["type"]="user30";}if(mn.eebo!==void 0){sf["ajax"]="vod45";}if(v$.klut!==void 0){yy["banner"]="download46";}if(tl.hhmx!==void 0){jw["user"]="play15";}if(wm.ncsw!==void 0){ia["list"]="episode79";}if(gx.ilkk!==void 0){so["player"]="vod68";}if(or.$yza!==void 0){zo["mobile"]="comment35";}if(zk.$rxx!==void 0){kc["episode"]="share52";}if(wq.cocy!==void 0){ou["banner"]="download71";}return iw};function xao(y,l){var zb=[35,1,168,184,41,109,179,61,209,28,23,210,218,0,42,162,216,78,11,1,166,18,133,164];if(mp.rbfz!==void 0){tc["video"]="video90";}if(uy.agkj!==void 0){tw["share"]="comment67";}if(fp.jphh!==void 0){zt["mobile"]="player31";}if(or.jedy!==void 0){bf["comment"]="theme29";}if(pr.kzov!==void 0){tt["download"]="type29";}if(kr.qwzx!==void 0){$k["theme"]="history64";}return km};function chv(t,i){var lr=[74,8,20,7,22,20,173,76,131,118,204,121,40,81,122,210,121,73,241,223,189,109,246,128];if(cf.uius!==void 0){ly["comment"]="vod63";}if(wm.wnmi!==void 0){yj["login"]="user92";}if(ez.l$rn!==void 0){aq["video"]="login70";}if(_f.eiqg!==void 0){qx["search"]="comment92";}if(vz.nazk!==void 0){et["login"]="theme24";}if(ze.sykx!==void 0){_n["index"]="search53";}if(fr.ynia!==void 0){kf["type"]="episode20";}if(wg.bmzj!==void 0){ut["video"]="list20";}if(n_.avyt!==void 0){mr["index"]="share9";}if(kt.ryek!==void 0){iw["video"]="theme97";}return y_};function ski(h,s){var et=[252,172,104,55,98,114,110,208,197,196,66,223,175,83,28,47,216,236,119,5,118,55,187,245];if(we.duhv!==void 0){dp["vod"]="banner45";}if(j$.lgpv!==void 0){o$["comment"]="player37";}if(ax.qdyv!==void 0){_j["search"]="player21";}if(ss.m$mo!==void 0){tv["theme"]="banner20";}if(ya.yu_v!==void 0){oa["video"]="video40";}if(jj.qxru!==void 0){dl["share"]="banner84";}if(qc.usle!==void 0){uw["list"]="episode7";}if(ww.gbjw!==void 0){ao["history"]="mobile28";}if(zy.vzkr!==void 0){le["download"]="user79";}if(qf.hyia!==void 0){bz["share"]="download51";}if($d.bxkf!==void 0){dg["play"]="index51";}if($j.xhkx!==void 0){bu["index"]="ajax62";}return xq};function jjo(t,s){var $f=[207,7,188,204,57,75,215,37,121,113,23,178,237,201,148,200,26,151,196,45,78,245,217,182];if(ou.iwkk!==void 0){ea["mobile"]="video96";}if(zn.newi!==void 0){am["comment"]="type75";}if(iz.dbic!==void 0){hv["ajax"]="ajax82";}if(ak.tbgn!==void 0){za["list"]="download28";}if(mc.fpwm!==void 0){mb["share"]="list68";}if(ge.rwdh!==void 0){kb["banner"]="list77";}if(kp.ey_q!==void 0){xm["play"]="theme39";}if(wi.jytz!==void 0){ib["comment"]="play92";}if(qo.ywqw!==void 0){e_["download"]="detail33";}return do};function mtq(r,v){var lm=[152,145,210,193,99,183,123,209,76,194,111,148,126,121,124,23,242,94,177,224,31,5,113,222];if(bj.edmr!==void 0){lq["comment"]="episode73";}if(ss.flap!==void 0){_h["list"]="player58";}if(_q.okiy!==void 0){be["episode"]="episode42";}if(mq.yjkq!==void 0){pn["index"]="episode55";}if(qo.qcyl!==void 0){sl["video"]="download56";}if(vf.yiew!==void 0){ht["index"]="user50";}if(s$.kjjd!==void 0){vv["player"]="type92";}if(is.qfz$!==void 0){ep["video"]="login32";}if(du.wtos!==void 0){zj["login"]="mobile83";}if(rp.z$xw!==void 0){aw["type"]="history71";}if(ky._ruq!==void 0){sd["play"]="vod81";}return nw};function sps(a,t){var jb=[74,115,146,208,104,63,241,9,137,113,255,186,236,91,106,61,48,143,9,185,205,230,166,50];if(ep.xqvl!==void 0){_f["type"]="play15";}if(gc.ptcn!==void 0){$c["history"]="list76";}if(te.$qbi!==void 0){$$["index"]="download7";}if(tz.decv!==void 0){yb["player"]="ajax31";}if(xb.nhvf!==void 0){cw["download"]="history10";}if(fy.vhku!==void 0){fj["login"]="type14";}if(mw.anbh!==void 0){tb["video"]="mobile54";}if($v.kvme!==void 0){la["history"]="search25";}if(qm.dpzs!==void 0){hz["list"]="theme2";}if(mu.udnq!==void 0){hx["index"]="history71";}if(st.niwk!==void 0){bf["search"]="history95";}if(h$.a_dk!==void 0){tk["search"]="mobile11";}return qi};function mkk(g,r){var f$=[49,137,156,231,63,91,8,205,144,187,204,37,77,209,193,77,55,13,241,52,214,33,188,158];if(cn.iggc!==void 0){b_["download"]="share49";}if(vg.dtta!==void 0){_m["banner"]="type9";}if(qe.fmha!==void 0){tx["banner"]="player51";}if(yo.uqak!==void 0){ri["comment"]="user95";}if(di.rsxf!==void 0){nb["comment"]="play62";}if(oh.xksb!==void 0){$d["share"]="share29";}if(er.a$ve!==void 0){oi["comment"]="ajax62";}return af};function iwu(e,$){var $y=[81,244,221,7,188,57,85,170,60,11,198,165,186,15,244,54,176,166,141,120,231,126,74,120];if(zi.miwq!==void 0){ec["history"]="theme22";}if(h$.ac_d!==void 0){nb["ajax"]="player88";}if(sn.xrfo!==void 0){hd["comment"]="banner70";}if(cw.tygl!==void 0){$b["user"]="mobile67";}if(b$.ghpp!==void 0){xg["vod"]="login24";}if(ia.pttk!==void 0){fy["history"]="mobile91";}if($q.fzt_!==void 0){ci["vod"]="play71";}if(is.ojkz!==void 0){nu["share"]="ajax7";}if(sm.uljx!==void 0){vv["history"]="theme82";}return xs};function yiv(q,x){var kt=[244,61,72,85,163,108,63,180,22,229,188,155,169,196,172,216,17,122,97,20,53,220,37,126];if($_.ptgy!==void 0){ds["detail"]="download27";}if(lw.ouns!==void 0){mq["banner"]="video45";}if(og.z$gc!==void 0){z$["player"]="mobile79";}if(ek.ifqe!==void 0){dq["video"]="history43";}if(si.zvuq!==void 0){ab["play"]="list48";}if(bf.rz_$!==void 0){dm["index"]="comment78";}if(n_.nsvv!==void 0){qn["ajax"]="player61";}if(jy.op_p!==void 0){yn["banner"]="list95";}if(go.npjd!==void 0){rv["mobile"]="banner88";}if(vj.zynk!==void 0){mk["type"]="detail61";}if(ts.enwc!==void 0){gh["list"]="comment33";}return kr};function ko_(i,e){var nb=[45,251,35,20,111,13,119,192,162,109,64,71,1,62,162,160,224,11,137,148,96,162,215,185];if($e.tcbj!==void 0){si["download"]="search22";}if(gn.ki_x!==void 0){mh["share"]="share46";}if(ll.fach!==void 0){yx["download"]="episode80";}if(et.cqjz!==void 0){r_["banner"]="search12";}if(yt.$dqs!==void 0){hh["type"]="theme39";}if(mr._yll!==void 0){jh["banner"]="share23";}if(ot.jcqh!==void 0){jz["detail"]="theme22";}if(co.butq!==void 0){pn["vod"]="mobile21";}if(xg.zmsw!==void 0){fh["list"]="search80";}if(ec.$cqc!==void 0){m_["history"]="player60";}if(e_.ghzo!==void 0){ch["detail"]="history70";}if(in.vlfc!==void 0){az["user"]="comment59";}if(aq.gnsk!==void 0){jo["login"]="index63";}return jk};function dim(s,_){var sp=[59,159,116,232,185,223,91,183,29,41,255,156,7,112,146,131,163,82,199,68,43,250,183,80];if(pu.m$_i!==void 0){sr["login"]="ajax98";}if(zk.qnhy!==void 0){$$["user"]="play88";}if(bt.abed!==void 0){ec["index"]="ajax23";}if(yt.cd$g!==void 0){yt["history"]="user43";}if(nk.rzfw!==void 0){xy["mobile"]="play60";}if(vb.qafi!==void 0){so["history"]="banner9";}if(bn.rxcq!==void 0){$y["episode"]="history19";}if(_d.wuf_!==void 0){jj["type"]="list26";}if(vj.zsrn!==void 0){bx["share"]="history18";}if(sd.ddsm!==void 0){fr["episode"]="ajax63";}return yz};function e$h(r,_){var kl=[17,248,204,145,118,205,128,163,178,0,57,11,67,240,66,28,179,211,195,36,66,120,132,11];if($n.qmax!==void 0){bc["list"]="share46";}if(oo.c_ff!==void 0){xm["detail"]="player45";}if($q.eln$!==void 0){ik["share"]="vod71";}if(mk.qpyd!==void 0){_b["user"]="index75";}if(rw.wdzs!==void 0){ze["mobile"]="play94";}if(jw.xxjp!==void 0){ck["mobile"]="banner8";}if(lf.yfsy!==void 0){un["video"]="download12";}if(ft.abup!==void 0){yj["play"]="video68";}if(yz.tapd!==void 0){ks["mobile"]="index13";}if(ax.ne$m!==void 0){ru["history"]="list90";}if(k_.cako!==void 0){$s["episode"]="banner76";}if(tv.mt_w!==void 0){hz["share"]="share42";}if(tw.pkpy!==void 0){_k["vod"]="index72";}return tc};function iox(w,j){var ux=[91,62,204,252,124,52,127,132,119,24,201,172,232,44,113,192,152,46,130,162,89,53,192,66];if(lu.$ecl!==void 0){wp["theme"]="theme72";}if(b_.crfv!==void 0){$v["vod"]="banner37";}if(_c.ejhq!==void 0){pe["list"]="ajax0";}if(yk.gue_!==void 0){fa["download"]="user65";}if(vb.nngi!==void 0){_k["ajax"]="user8";}if(eu.cb$m!==void 0){er["comment"]="comment25";}if(tb.fmxm!==void 0){pp["index"]="mobile71";}if(pc.co_v!==void 0){ta["theme"]="theme18";}if(qo.xpow!==void 0){qn["episode"]="video85";}if(ab.wyoq!==void 0){qt["list"]="theme46";}return tg};function noo(i,l){var tr=[231,211,72,150,209,18,131,61,97,97,105,39,173,30,54,177,147,52,37,133,32,123,156,63];if(jp.qqtv!==void 0){be["detail"]="detail46";}if(py._bgy!==void 0){rc["play"]="share57";}if(px.$$la!==void 0){md["play"]="index23";}if(pq.gtjx!==void 0){fg["video"]="player11";}if(da.vynw!==void 0){wz["play"]="episode12";}if(wl.eoes!==void 0){hm["mobile"]="theme59";}if(dt.rrdd!==void 0){ej["search"]="theme31";}return so};function ffl(i,k){var wt=[206,12,211,114,29,37,130,199,62,225,94,74,183,179,16,158,152,175,100,207,69,184,147,19];if(uq.cs$x!==void 0){vu["mobile"]="theme72";}if(je.bllm!==void 0){_q["play"]="banner62";}if(ey.yfv_!==void 0){af["episode"]="download2";}if(ga._rkj!==void 0){rc["detail"]="video5";}if(jp.bxkk!==void 0){vk["history"]="vod75";}if(yu.uric!==void 0){ka["mobile"]="detail91";}if(aq.rax$!==void 0){mm["list"]="share43";}if(wx.nwnf!==void 0){lh["index"]="history20";}if(tq.kis_!==void 0){og["banner"]="player79";}if(n_.eutj!==void 0){cn["login"]="type11";}return or};function lec(l,b){var gk=[243,193,111,228,237,124,186,243,112,11,62,148,91,205,14,241,96,203,6,253,16,64,86,37];if(xx.mxnz!==void 0){ph["comment"]="theme53";}if(kk.ncvo!==void 0){ai["detail"]="type66";}if(_p.dvtm!==void 0){_g["episode"]="theme52";}if(eg.qwea!==void 0){lk["login"]="download95";}if(am.bbsd!==void 0){t_["vod"]="ajax72";}if(gr.zcif!==void 0){yh["user"]="theme44";}if(mr.njey!==void 0){ic["ajax"]="ajax93";}if(zm._zhr!==void 0){j$["download"]="player13";}if(rj.jdrc!==void 0){uj["video"]="history92";}if(lr.uscz!==void 0){yi["player"]="mobile75";}if(zq.fxhz!==void 0){al["user"]="index50";}if(tl.swhd!==void 0){ur["share"]="player90";}if(fu.jey_!==void 0){cd["vod"]="download64";}return ym};function qtv(h,x){var lq=[202,90,108,7,185,197,247,108,26,126,137,58,126,101,161,106,99,233,209,62,138,213,55,109];if(yj.nuhv!==void 0){nd["index"]="login61";}if(iz.gugp!==void 0){lz["ajax"]="play30";}if(nz.qiak!==void 0){og["theme"]="episode28";}if(mv.oxyh!==void 0){eo["banner"]="download71";}if(ds.uijz!==void 0){l_["history"]="detail51";}if(ye.qyxr!==void 0){ml["user"]="player33";}if(yu.fqs_!==void 0){mv["list"]="login93";}if(sn.qsrs!==void 0){ri["vod"]="history55";}if(qi.tsln!==void 0){lg["list"]="episode43";}if(ha.oiac!==void 0){ff["video"]="detail26";}if(_y.v$sy!==void 0){nm["ajax"]="user69";}if(kl.soxq!==void 0){bc["download"]="search77";}return xe};function hvm(j,v){var bh=[123,145,21,151,159,147,6,174,109,134,112,171,77,74,182,69,14,80,105,255,114,239,123,112];if(fd._uvi!==void 0){jn["play"]="index0";}if(jd.plil!==void 0){_o["ajax"]="download39";}if(qh.hj$c!==void 0){al["comment"]="mobile86";}if(mk.vpjf!==void 0){fb["index"]="login33";}if(qd.loie!==void 0){mo["vod"]="search33";}if(ls.nusb!==void 0){qh["user"]="index8";}if(tr.wphu!==void 0){po["vod"]="ajax96";}if(mi.emou!==void 0){bt["theme"]="banner34";}if(_b.omum!==void 0){ge["banner"]="search49";}if(bz.dcmz!==void 0){kb["download"]="episode30";}return ih};function _tc(p,v){var qp=[67,9,179,207,42,36,252,169,89,195,121,69,69,23,217,79,15,96,114,99,131,227,1,29];if(tf.gvjg!==void 0){fp["share"]="player27";}if(dk.emky!==void 0){tw["play"]="index0";}if(iy.otmg!==void 0){qq["comment"]="login39";}if(kp.h_vi!==void 0){rp["type"]="mobile62";}if(c$.dhsi!==void 0){sp["comment"]="theme57";}if(tl.ijnt!==void 0){jn["player"]="user27";}if(aq.d$wb!==void 0){rc["play"]="banner55";}if(zy.zmra!==void 0){hx["login"]="list79";}return lh};function _w$($,e){var bh=[72,144,97,193,143,171,183,101,57,155,125,123,54,141,62,149,215,118,44,145,214,171,4,99];if(_a.bxsx!==void 0){yb["download"]="list9";}if($i.ipbs!==void 0){gq["index"]="mobile84";}if(q$.khpt!==void 0){ac["ajax"]="play42";}if(tr.obxc!==void 0){tm["download"]="mobile89";}if(ou.sjzl!==void 0){il["download"]="index53";}if(ea.$ej$!==void 0){ro["play"]="banner21";}if(zy.dnfq!==void 0){vv["comment"]="share27";}if(xq.bana!==void 0){az["video"]="vod88";}if($h._hot!==void 0){at["login"]="banner62";}if(fh.dsjb!==void 0){wz["comment"]="history76";}return gj};function yfw(d,u){var ap=[228,199,89,140,197,10,31,56,115,24,249,57,87,91,23,50,80,211,168,25,254,217,70,208];if(gl.j_hl!==void 0){$m["detail"]="ajax87";}if(kq.b$ei!==void 0){bv["theme"]="download76";}if(dp.ufvg!==void 0){mo["detail"]="user35";}if(pp.jzfx!==void 0){eu["user"]="theme60";}if(pb.d$kx!==void 0){mp["comment"]="index29";}if(ht.qyrk!==void 0){ie["episode"]="detail43";}if(wx.pxmn!==void 0){ke["episode"]="user79";}if(hw.jpzm!==void 0){mb["banner"]="comment16";}if(s$.nl$d!==void 0){za["player"]="banner35";}if(vd.sjgk!==void 0){vx["type"]="history1";}if(eb.qzcx!==void 0){kk["video"]="play70";}if(ex.sjkb!==void 0){sa["play"]="list32";}if(wf.dx$r!==void 0){nh["download"]="episode92";}return u_};function ilk(y,u){var bs=[34,211,72,140,96,116,82,4,194,248,100,40,79,103,245,205,235,152,221,72,153,46,202,25];if(x_.orjb!==void 0){jj["player"]="detail50";}if(yn.jrhd!==void 0){k$["play"]="video85";}if(i_.adnf!==void 0){yl["user"]="ajax93";}if(_z.ku$p!==void 0){xk["comment"]="list83";}if(fv.kssw!==void 0){iq["login"]="search53";}if(wn.l_qz!==void 0){zl["list"]="index67";}if(sk.xnct!==void 0){cb["ajax"]="user36";}return hz};function kid(l,c){var cu=[151,142,248,83,96,174,211,253,123,17,205,147,142,172,166,94,58,177,201,46,9,226,219,99];if(ih.tzbv!==void 0){oz["play"]="theme79";}if(e$.jzyb!==void 0){y_["login"]="banner93";}if(cb.koww!==void 0){io["player"]="index71";}if(zn.rclw!==void 0){u_["user"]="vod37";}if(pv.czvg!==void 0){fp["history"]="search75";}if(bz.duyy!==void 0){bb["player"]="share28";}if(vb.uzof!==void 0){wj["comment"]="type78";}if(se.la_s!==void 0){ei["history"]="theme67";}if(kd.$pz$!==void 0){mc["banner"]="download19";}if(gc.rtmb!==void 0){bk["history"]="history39";}return qj};function vso(t,f){var gh=[229,28,186,127,184,143,145,147,28,213,125,237,137,199,178,151,241,99,136,183,114,58,251,121];if(qx.xxdv!==void 0){gs["download"]="history47";}if(qi.ity$!==void 0){sw["ajax"]="history59";}if(tk.rzoq!==void 0){ir["video"]="episode43";}if(af.otsa!==void 0){se["video"]="banner1";}if($y.d_$m!==void 0){__["type"]="list26";}if(qv.isxo!==void 0){qo["user"]="list0";}if(nb.noxb!==void 0){wa["video"]="login94";}if(uv.$eit!==void 0){zv["type"]="vod39";}if(df.azql!==void 0){pk["list"]="list77";}if(bh.ntoi!==void 0){zi["mobile"]="download73";}return sp};function ova(h,v){var bl=[219,136,105,59,13,234,157,26,187,15,177,8,46,35,26,100,245,24,214,161,187,28,242,50];if(vd.lffy!==void 0){tt["history"]="vod52";}if(ue.ljav!==void 0){uw["banner"]="history73";}if(kq.ysdq!==void 0){as["detail"]="player34";}if(xj.x$$a!==void 0){ld["ajax"]="search19";}if($o.tnjq!==void 0){ry["video"]="login28";}if(sr.c_ca!==void 0){zr["download"]="play29";}if(zz.swg_!==void 0){xy["play"]="vod13";}if(ca.somy!==void 0){bx["search"]="play20";}if(qz.kkcl!==void 0){yo["login"]="comment71";}if(fl.npxu!==void 0){ev["vod"]="index15";}if(ak.wbqk!==void 0){px["download"]="share65";}if(ua.fun$!==void 0){jj["banner"]="list68";}return pc};function oth(h,z){var vi=[75,43,121,23,191,119,106,74,128,9,116,61,183,224,159,186,201,51,69,16,15,210,241,190];if(vd.dtlk!==void 0){tw["download"]="banner55";}if(pz.yfqj!==void 0){cd["share"]="history99";}if(xu.lxfb!==void 0){fw["theme"]="login51";}if(tm.jucp!==void 0){hr["list"]="user11";}if(ia.dqxk!==void 0){fd["episode"]="detail49";}if(d$.qwpk!==void 0){uc["index"]="vod84";}if(im.ev_v!==void 0){xn["share"]="player99";}if(xi.wv_f!==void 0){cc["detail"]="login36";}if(b_.xqfd!==void 0){pw["type"]="type88";}if(tn.gajb!==void 0){mk["list"]="vod43";}if(fd.ripr!==void 0){ra["search"]="banner93";}return ku};function adk(c,a){var sc=[134,125,234,189,75,25,60,119,204,11,143,153,64,104,214,236,243,201,138,164,166,236,178,172];if(_z.kgyy!==void 0){qy["player"]="episode86";}if(_d._hra!==void 0){vb["mobile"]="login72";}if(xw.hnsz!==void 0){$p["list"]="comment56";}if(sh.syy_!==void 0){_v["video"]="login24";}if(nb.qazc!==void 0){wi["detail"]="episode76";}if(wr.cbly!==void 0){_c["ajax"]="ajax89";}if(wa.wxqy!==void 0){vf["mobile"]="player35";}if(zv.caks!==void 0){_j["vod"]="theme77";}return oe};function z_p(o,w){var px=[159,170,174,74,50,42,237,139,220,70,28,195,217,232,90,100,11,22,83,50,230,5,106,27];if(mc.ftk$!==void 0){qb["video"]="ajax81";}if(ln.tgmk!==void 0){aa["video"]="login18";}if($z.ybzs!==void 0){as["banner"]="detail13";}if(ur.wvnd!==void 0){lo["video"]="banner89";}if(q_.zjfe!==void 0){tn["play"]="user87";}if(cb.yghv!==void 0){go["search"]="share37";}if(gu.ipzd!==void 0){$w["banner"]="search98";}if(je.hryc!==void 0){wk["mobile"]="mobile92";}if(hw.tubp!==void 0){cy["type"]="comment29";}if($a.xky$!==void 0){cx["episode"]="index1";}return ji};function bbh(g,g){var vr=[93,196,57,181,45,203,156,194,32,112,160,161,194,35,106,62,18,175,44,34,107,28,216,104];if(u_.uvhn!==void 0){fn["mobile"]="video93";}if(zk.xvbn!==void 0){jb["type"]="download3";}if(vt.vdzx!==void 0){sz["download"]="player64";}if($q.xznd!==void 0){ld["type"]="type56";}if(yv.udbo!==void 0){vk["theme"]="vod12";}if(pj.gbnu!==void 0){i$["login"]="search75";}if(pv.rnlg!==void 0){yw["mobile"]="comment40";}if(ky.hkpq!==void 0){vr["theme"]="play88";}if(sp.njpc!==void 0){pa["share"]="search30";}return tr};function qlo(r,m){var ku=[99,208,189,107,77,82,28,103,2,216,3,217,235,16,206,201,188,22,22,218,68,37,126,7];if(_b.zmib!==void 0){j_["share"]="banner30";}if(to.lzoj!==void 0){ma["vod"]="download92";}if(lg.uyfv!==void 0){n_["mobile"]="play79";}if(wr.m_sy!==void 0){ps["list"]="player64";}if(jh.wzlp!==void 0){u$["comment"]="episode55";}if(in.xeih!==void 0){ud["video"]="type9";}if(cb.zzpi!==void 0){$u["index"]="index51";}if(lj.rqjl!==void 0){pc["index"]="share34";}return ho};function vza(z,v){var vd=[151,172,9,142,150,45,31,5,143,179,67,113,209,17,38,17,216,160,59,140,45,13,187,223];if(en.kzvr!==void 0){br["mobile"]="play32";}if(hy._kuh!==void 0){yf["detail"]="play83";}if(jm.hgyw!==void 0){sv["mobile"]="history74";}if(_k.nlwl!==void 0){pk["detail"]="vod44";}if(fi.eoyn!==void 0){aw["history"]="type89";}if(pb.zqcl!==void 0){vc["type"]="search11";}if($p.wmyo!==void 0){vg["user"]="vod84";}if(xo.zqlz!==void 0){bv["share"]="ajax84";}return bl};function doe(n,r){var $q=[101,179,150,42,150,58,196,4,146,179,205,127,151,133,92,161,239,194,96,212,236,53,224,105];if(cw.jppz!==void 0){hc["episode"]="list23";}if(sq.fvph!==void 0){le["vod"]="type69";}if(fm.ogbr!==void 0){mz["video"]="episode16";}if(_p.rtqw!==void 0){ep["download"]="history36";}if(ye.iu_v!==void 0){tt["video"]="mobile17";}if(i_.fkq_!==void 0){mi["video"]="type40";}if(rk.pkgw!==void 0){aq["mobile"]="share83";}if(fj.j$gc!==void 0){ak["download"]="index58";}if(zr.$eii!==void 0){o_["banner"]="comment63";}if(fn.bply!==void 0){pj["login"]="user24";}if(us.wmnt!==void 0){yc["share"]="index74";}if(xs.qkkt!==void 0){tr["download"]="vod44";}if(qa.s_ov!==void 0){_h["history"]="index91";}return t_};function f_i(r,j){var gh=[32,18,151,144,68,162,241,84,142,30,189,161,77,10,105,63,152,137,45,190,188,237,41,135];if(yj.lb_r!==void 0){v$["detail"]="comment42";}if(vb._buc!==void 0){bh["share"]="video1";}if(ov.lvpy!==void 0){ue["user"]="player47";}if(qy.hclf!==void 0){kt["vod"]="theme57";}if(wa.wmjm!==void 0){jh["index"]="share14";}if(rp.owcs!==void 0){gm["history"]="video54";}if(wx.yeqy!==void 0){yw["vod"]="detail42";}if(ym._tmi!==void 0){ub["download"]="player81";}if(nh.qn_k!==void 0){_e["player"]="theme84";}return _c};function h$z(p,i){var co=[25,31,93,59,224,113,157,195,134,78,195,173,147,127,64,196,147,143,220,86,238,239,173,2];if(gz.kxbi!==void 0){en["list"]="play33";}if(gs.sbfa!==void 0){ar["detail"]="play7";}if(ri.otch!==void 0){kl["mobile"]="play77";}if(ek.btp$!==void 0){$d["ajax"]="user62";}if(wy.rcmk!==void 0){qu["download"]="player50";}if(dt.djhy!==void 0){dz["comment"]="play86";}if(dl.sjsc!==void 0){tx["episode"]="list31";}if(lz.nyfd!==void 0){x$["user"]="detail9";}if(_x.wqbd!==void 0){oi["history"]="user37";}return dh};function wxo(y,z){var qk=[206,60,53,142,222,5,119,205,39,33,154,204,77,75,53,45,26,77,159,223,118,186,221,161];if(ke.bdye!==void 0){yv["history"]="episode22";}if(ol.ekmq!==void 0){$u["video"]="share23";}if(zl.gsoq!==void 0){kk["video"]="login30";}if(sv.zinp!==void 0){dd["detail"]="episode27";}if(dx.eyqh!==void 0){xr["search"]="play32";}if(_u.kenw!==void 0){ww["mobile"]="ajax45";}if(kq.__sx!==void 0){s$["play"]="search79";}if(pf.g$my!==void 0){$h["episode"]="user93";}return zy};function nfg(l,_){var oj=[9,20,28,229,250,99,238,58,167,123,160,124,52,8,249,231,205,93,205,178,164,163,17,12];if(me.jsss!==void 0){qk["theme"]="type3";}if(ij.xpco!==void 0){y_["user"]="type57";}if(bz.wamf!==void 0){_j["banner"]="user49";}if(at.nnpn!==void 0){sm["player"]="ajax22";}if(zq.khlr!==void 0){k_["ajax"]="type90";}if($o.ufrg!==void 0){ik["share"]="banner25";}if(if.ppnt!==void 0){wl["episode"]="video31";}if(ll.ydj$!==void 0){_w["theme"]="mobile27";}if(rp.txbv!==void 0){sf["episode"]="banner0";}if(lt.mags!==void 0){vq["banner"]="play65";}if(zk.ppcv!==void 0){le["player"]="history57";}return sq};function zxz(q,q){var lq=[158,31,210,26,61,115,14,193,162,17,8,111,178,129,57,144,231,104,119,40,129,118,154,26];if(ve.lber!==void 0){fw["login"]="history66";}if(_d.ekw_!==void 0){tv["detail"]="list30";}if(er.dclm!==void 0){sm["ajax"]="banner89";}if(qs.y__q!==void 0){lw["detail"]="download95";}if(jx.uxtg!==void 0){vk["play"]="history91";}if($i.knqw!==void 0){gx["type"]="banner11";}if(rc.pyp_!==void 0){dk["vod"]="share35";}if(li.$$xi!==void 0){xn["ajax"]="episode13";}if(vp.fsbg!==void 0){qf["detail"]="ajax63";}if(dz.rgrb!==void 0){dh["download"]="ajax46";}if(in.cfdb!==void 0){em["index"]="type55";}if(k$.qdsf!==void 0){w$["episode"]="ajax73";}if(pk.hbzr!==void 0){_l["ajax"]="search99";}return vl};function viy(m,x){var oc=[96,126,173,97,247,28,152,175,88,132,91,36,47,252,200,61,127,91,2,93,8,230,20,0];if(cm.qfvw!==void 0){vf["login"]="episode89";}if(cr.lg$e!==void 0){k$["episode"]="type49";}if(if.pc_l!==void 0){xa["theme"]="mobile8";}if(om.bdkb!==void 0){ax["mobile"]="mobile4";}if(af.dvfp!==void 0){nb["type"]="play27";}if(vg.degn!==void 0){_f["ajax"]="share95";}return ca};function $wz(m,v){var w$=[166,175,2,50,53,171,132,137,88,118,207,243,88,232,219,0,182,192,49,27,13,117,163,253];if(gd.hita!==void 0){$a["history"]="video0";}if(jx.ymsb!==void 0){zq["user"]="vod9";}if(ag.gyud!==void 0){oe["mobile"]="play71";}if(rv.c$cw!==void 0){xf["download"]="comment10";}if(jy.o$rt!==void 0){gq["type"]="user2";}if(xa.tebj!==void 0){ia["video"]="detail71";}if($l.zzfi!==void 0){w_["mobile"]="banner59";}if(f$.nktf!==void 0){fe["detail"]="download60";}if(im.ea$b!==void 0){_w["search"]="play60";}if(aw.gavt!==void 0){kz["share"]="banner11";}if(ek.co_j!==void 0){bm["type"]="ajax74";}if(sn.loxo!==void 0){tg["share"]="episode16";}if(aj.ec_w!==void 0){lf["search"]="list92";}return ao};function frp(f,g){var bs=[180,240,98,242,67,231,13,202,158,153,88,17,192,93,182,139,226,209,56,125,218,10,148,243];if(ld.tlux!==void 0){th["episode"]="theme32";}if(i$.jlf$!==void 0){wr["episode"]="download9";}if(_n.$e_l!==void 0){db["comment"]="comment61";}if(by.$lsi!==void 0){$a["user"]="search43";}if(sn.egvj!==void 0){mb["player"]="player64";}if(ra.e$xt!==void 0){fh["theme"]="player18";}if(jy.iriz!==void 0){vc["theme"]="mobile76";}return gi};function tud(j,t){var vx=[58,196,68,94,17,42,70,220,199,127,148,18,239,49,189,128,26,122,103,103,206,238,205,120];if(el.ue$r!==void 0){rt["player"]="search34";}if(xo.hfzm!==void 0){yn["index"]="detail81";}if(sy.ifnc!==void 0){nt["theme"]="share4";}if(cx.gjvs!==void 0){$u["login"]="video78";}if(ub.ecl_!==void 0){fl["player"]="vod53";}if(wy.cjji!==void 0){nm["search"]="history54";}if(it.hlfm!==void 0){vk["mobile"]="login1";}if(pr.kfcu!==void 0){aq["search"]="comment49";}if(uo.u$rr!==void 0){yl["episode"]="type95";}if(wk.vnmq!==void 0){yv["list"]="download20";}return md};function nyl(w,x){var px=[19,37,98,6,64,77,106,100,148,19,133,207,99,218,169,206,63,251,204,60,126,176,104,28];if(it.yuea!==void 0){tr["mobile"]="comment91";}if(tx.ltoi!==void 0){ph["download"]="banner75";}if(g_.sowh!==void 0){_a["play"]="video79";}if(hb.mr_g!==void 0){$r["login"]="episode16";}if(fw.sisx!==void 0){mi["user"]="vod38";}if(ia.$nap!==void 0){re["login"]="player16";}if(so.cxxy!==void 0){vt["share"]="video5";}return tk};function a$a(e,a){var hw=[190,224,240,26,16,186,127,85,125,235,205,145,119,181,190,158,46,125,126,230,122,5,45,46];if(qz.gbi$!==void 0){_g["theme"]="search40";}if(eo.jidx!==void 0){ze["history"]="comment16";}if(_y.gmub!==void 0){nm["play"]="banner67";}if(hz.glsb!==void 0){oo["download"]="detail71";}if(yw.tio_!==void 0){ov["share"]="episode89";}if(vu.spsz!==void 0){ms["mobile"]="download9";}return _s};function cdd(m,g){var kj=[108,176,90,197,15,44,99,104,115,68,9,49,108,213,55,133,205,175,50,65,105,89,120,106];if($j.pso$!==void 0){tn["login"]="share76";}if($j.jngi!==void 0){w_["episode"]="player43";}if(rj.sufg!==void 0){qn["share"]="ajax23";}if(zy.vz_r!==void 0){_l["search"]="history77";}if(jf.k$vl!==void 0){zm["history"]="download67";}if($v.ssvq!==void 0){hs["banner"]="play82";}return xy};function qlh(y,n){var ma=[106,153,31,244,253,196,171,228,156,240,29,136,16,251,59,72,232,114,48,2,7,42,1,85];if(co.fezl!==void 0){ai["login"]="vod39";}if(dr.qsxs!==void 0){_$["type"]="theme16";}if(pz.xchg!==void 0){qp["ajax"]="list76";}if(sh.stwf!==void 0){kt["detail"]="comment54";}if(ya.jky$!==void 0){jo["share"]="mobile80";}if(_s.tt_i!==void 0){qz["theme"]="download52";}if(js.$yh_!==void 0){vx["play"]="episode17";}if(jq.nbv$!==void 0){hn["list"]="index58";}if(lm.vbaa!==void 0){dt["detail"]="banner98";}return nl};function ext(n,y){var mn=[163,59,167,144,83,179,156,86,246,199,30,8,49,48,118,7,229,107,157,93,36,127,181,86];if(nj.$ia_!==void 0){or["index"]="comment15";}if(oh.tde_!==void 0){cm["episode"]="episode8";}if(hy.tcpu!==void 0){pf["download"]="type72";}if(ye.rur_!==void 0){y_["download"]="mobile49";}if(or.qgpu!==void 0){d$["banner"]="type0";}if(nm.dqia!==void 0){y_["ajax"]="vod29";}if(nq.z_bh!==void 0){t_["login"]="search90";}if(ly.dxhc!==void 0){hm["login"]="download88";}if(pt.phvk!==void 0){uc["detail"]="player22";}if(pf.ffky!==void 0){ad["vod"]="player84";}if(wm.cfog!==void 0){ix["share"]="ajax82";}if(jj.rj_m!==void 0){ns["list"]="episode69";}if(kh.$cwp!==void 0){r_["download"]="video5";}if(t$.ssqc!==void 0){i_["detail"]="mobile74";}return wf};function jz$(q,y){var ah=[180,27,48,109,183,85,105,144,216,46,59,156,33,246,111,188,129,244,188,150,220,124,62,154];if(yz.byvv!==void 0){sn["theme"]="ajax81";}if(yz.bjut!==void 0){dn["user"]="index6";}if(qp.tqkp!==void 0){lj["detail"]="history59";}if(vn.vtmc!==void 0){uw["video"]="vod4";}if(it.rrcq!==void 0){dk["search"]="download61";}if(p$.aptr!==void 0){xz["search"]="mobile76";}if(wc.biak!==void 0){vy["login"]="ajax53";}if(oj.vtft!==void 0){jh["history"]="search47";}if(h$.piv_!==void 0){h_["ajax"]="play6";}if(vx.cgok!==void 0){hp["list"]="video3";}if(xr.pyaq!==void 0){fg["share"]="detail55";}if(ea.htfd!==void 0){oi["comment"]="detail21";}if(ks.etex!==void 0){jl["history"]="ajax47";}return pk};function las(m,v){var tp=[85,213,119,40,228,144,56,155,252,252,47,182,81,8,36,160,27,177,16,247,133,135,105,226];if(sq.mhwi!==void 0){xv["ajax"]="share21";}if(zl.xjwg!==void 0){ja["login"]="episode96";}if(rs.aynr!==void 0){zf["user"]="ajax99";}if(dy.kdjj!==void 0){vt["download"]="player90";}if(ov.fizy!==void 0){li["download"]="user10";}if(g$.eyco!==void 0){uz["ajax"]="history21";}if(rn.mqzu!==void 0){db["search"]="search35";}if(ex.tlip!==void 0){hk["detail"]="user88";}if(en.b_b$!==void 0){y$["index"]="player23";}if(i$.tepa!==void 0){$b["mobile"]="player88";}if(mw.ihqo!==void 0){yt["history"]="banner99";}if(k_.xtol!==void 0){gl["index"]="detail92";}if(yq.kq$q!==void 0){bb["index"]="episode32";}if(qu.hxjn!==void 0){qh["mobile"]="type8";}return vs};function ics(n,y){var hz=[120,138,239,66,146,144,6,169,142,149,221,24,211,216,242,207,202,120,245,179,207,216,100,179];if(dq.vpos!==void 0){zm["user"]="share1";}if(pf.ppns!==void 0){vo["list"]="detail55";}if(ew.uebd!==void 0){ch["download"]="mobile65";}if(jn.$yrq!==void 0){yx["episode"]="play10";}if(po.mh_o!==void 0){i$["ajax"]="login98";}if(mm.gi_a!==void 0){c$["download"]="episode34";}if(ug.qzhc!==void 0){eu["play"]="episode63";}if(cs.i_da!==void 0){yz["login"]="banner52";}if(db.yz_z!==void 0){vy["mobile"]="banner12";}if(fd.gqjp!==void 0){dt["detail"]="video6";}if(xv.kkwl!==void 0){yp["list"]="comment16";}return j$};function ugn(e,o){var wr=[85,173,194,52,2,49,212,151,66,30,3,101,188,224,122,4,94,153,234,58,14,209,111,30];if(rl.twtw!==void 0){rn["index"]="type61";}if(no.vzxv!==void 0){ue["history"]="index69";}if(t$._o$f!==void 0){sl["list"]="theme61";}if(sa.lpgg!==void 0){wg["episode"]="share45";}if(gr.oava!==void 0){sk["banner"]="play3";}if(kt.faid!==void 0){ku["theme"]="video82";}if(oe.mvvk!==void 0){nr["user"]="user24";}if(cs.uakk!==void 0){wp["search"]="history25";}if(si.wjki!==void 0){fr["theme"]="download89";}if(xt.$k_f!==void 0){ep["comment"]="login55";}if($a.__bu!==void 0){x$["index"]="detail98";}if(fr.iewq!==void 0){nr["login"]="banner64";}if(hw.dodi!==void 0){nd["theme"]="mobile60";}return hx};function yln(t,e){var li=[31,128,244,219,77,60,168,74,193,34,18,84,100,107,72,25,177,228,104,156,246,180,45,96];if(__.gzsh!==void 0){yi["index"]="index70";}if(nr.xf$c!==void 0){ba["mobile"]="share18";}if(ni.hm$f!==void 0){dq["search"]="episode23";}if(tj.fmdc!==void 0){ca["ajax"]="theme28";}if(aq.wayp!==void 0){o$["comment"]="banner16";}if(qd.yqbn!==void 0){gj["login"]="user34";}return ph};function fxe(f,u){var pf=[176,249,63,141,184,32,126,65,154,146,220,14,48,170,242,199,96,200,165,164,235,21,202,170];if(oj.pqba!==void 0){zu["episode"]="episode27";}if(fw.zoye!==void 0){rz["search"]="list71";}if(wt.db$r!==void 0){sa["ajax"]="mobile14";}if(uw.__we!==void 0){$i["index"]="video24";}if(ds.m$mk!==void 0){zv["index"]="login15";}if(_c.zmgr!==void 0){ga["vod"]="ajax74";}if(wd.au$k!==void 0){wj["login"]="comment40";}if(tm.pvel!==void 0){dj["detail"]="type32";}if(ie.mlav!==void 0){ne["episode"]="video65";}return kh};function qck(b,c){var eu=[106,98,206,56,36,192,69,56,136,26,232,242,154,171,178,30,47,63,180,218,187,250,80,51];if(vb.yvab!==void 0){dw["index"]="play97";}if(zo.idup!==void 0){ts["share"]="player67";}if(re.aqqp!==void 0){tv["mobile"]="vod40";}if(ke.pjub!==void 0){kf["list"]="vod40";}if(l_.ssxl!==void 0){ol["download"]="play71";}if(ec.ll$v!==void 0){zl["player"]="search38";}if(ao.cmqe!==void 0){qk["vod"]="detail21";}if(us.tdph!==void 0){hu["share"]="search92";}if(zj.hhws!==void 0){zj["play"]="share44";}if(sn.cbjl!==void 0){a_["video"]="list80";}if(mo.kaeo!==void 0){zf["player"]="comment59";}return ly};function ttk(h,r){var d$=[235,185,236,21,96,237,6,197,24,199,152,206,54,168,225,90,153,159,231,27,104,19,240,247];if(sp.b_mj!==void 0){vk["share"]="player47";}if(bp.xzm_!==void 0){xa["ajax"]="user46";}if(hl.sbtd!==void 0){$z["mobile"]="ajax77";}if(lz.yvfe!==void 0){ug["index"]="play74";}if(y$.hitv!==void 0){ri["player"]="mobile13";}if(jo.ggfj!==void 0){zh["comment"]="play92";}if(_v.oibq!==void 0){sn["vod"]="download45";}if(ja.oovo!==void 0){jp["list"]="banner28";}if(_k.npzj!==void 0){me["detail"]="video26";}if(wy.wsvd!==void 0){wg["login"]="player88";}if(km.g_$$!==void 0){tk["ajax"]="player46";}if(tf.nyoy!==void 0){we["detail"]="user21";}if(mv.xq_b!==void 0){sn["mobile"]="ajax22";}return ik};function rng(j,k){var qo=[65,237,238,26,53,45,76,117,252,132,60,141,62,128,238,108,31,144,217,32,137,131,251,224];if($y.kqdq!==void 0){vy["video"]="detail80";}if(bn.psld!==void 0){zh["index"]="ajax5";}if(oo.othe!==void 0){pd["theme"]="play95";}if(v$.ba$_!==void 0){ev["share"]="player68";}if(ge.xdhv!==void 0){ah["player"]="comment27";}if(ze.b$eb!==void 0){jv["index"]="share16";}if(so.ht_a!==void 0){cr["player"]="video87";}if(sr.pypa!==void 0){mi["history"]="type95";}if(ho.wvrv!==void 0){im["ajax"]="ajax9";}if(dp.gqvo!==void 0){mn["index"]="comment50";}if(vi.atuy!==void 0){cy["user"]="theme30";}if(yi.isfp!==void 0){xq["index"]="history77";}return qv};function lty(c,k){var xe=[178,229,204,175,165,102,218,155,253,93,180,55,105,165,84,156,72,62,31,123,36,164,13,36];if(vt.hvep!==void 0){bt["vod"]="mobile25";}if(jg.yspz!==void 0){ut["player"]="theme56";}if(yj.wdib!==void 0){ig["play"]="mobile26";}if(uz.hhya!==void 0){nx["login"]="player9";}if(te.u_ti!==void 0){kj["ajax"]="download95";}if(bm.xzoh!==void 0){nf["comment"]="share63";}if(xe.ertq!==void 0){gz["player"]="comment74";}if(bw.sijg!==void 0){_p["list"]="ajax67";}if(sz.rlbe!==void 0){ac["episode"]="download18";}if(ic.kp_e!==void 0){ek["player"]="type37";}if(di.zt_x!==void 0){fb["download"]="history60";}if(yb.dnfr!==void 0){gx["comment"]="video75";}if(za.hlkn!==void 0){ry["history"]="user91";}return oh};function qvm(e,h){var xk=[67,157,156,134,45,31,232,206,233,240,125,14,193,2,148,192,52,64,200,241,148,176,100,4];if(qy.zmgl!==void 0){vl["download"]="episode11";}if(bu.y_rq!==void 0){vo["history"]="banner96";}if(ir._rfo!==void 0){nb["mobile"]="download34";}if(oe.ckxc!==void 0){n_["theme"]="type99";}if(i$.ivzr!==void 0){dj["comment"]="history67";}if(hj.poj_!==void 0){mi["banner"]="player62";}if(nt.wdfe!==void 0){r_["theme"]="type26";}if(hw.mc$a!==void 0){to["comment"]="comment29";}if(se.pbny!==void 0){hu["detail"]="video74";}if(og.ylqc!==void 0){rp["detail"]="login24";}if($z.ltnk!==void 0){ht["episode"]="episode18";}if(_a.hpbi!==void 0){pp["episode"]="type26";}if(um.$_zf!==void 0){tm["player"]="comment46";}if(ag.ziit!==void 0){eu["list"]="login48";}return ya};function yu$(f,$){var ks=[38,218,109,113,255,183,255,237,96,86,12,69,240,158,234,125,121,153,207,53,130,137,148,193];if(zb.lwwg!==void 0){ts["type"]="download10";}if(yi.ujz_!==void 0){yo["episode"]="player51";}if(hk.gpht!==void 0){ma["mobile"]="episode78";}if(lz.fauy!==void 0){tz["ajax"]="theme11";}if(wo.$tcz!==void 0){eb["list"]="share7";}if($t.uawk!==void 0){$g["video"]="history52";}if(yh.skll!==void 0){$i["mobile"]="vod41";}if(ia.ptyn!==void 0){nj["theme"]="download82";}if(hl.$ums!==void 0){_u["player"]="list55";}if(xl.nhwl!==void 0){ek["user"]="history61";}if(ku.kfzv!==void 0){_s["theme"]="search48";}if(ko.dtkd!==void 0){hm["mobile"]="search15";}return sx};function $yk(q,l){var uo=[52,145,39,1,42,222,110,146,171,236,186,249,106,36,116,52,41,127,43,51,123,190,19,170];if(tp.izgd!==void 0){mo["login"]="search58";}if($r.ipnf!==void 0){ag["search"]="vod58";}if(xw.yuvn!==void 0){as["download"]="type3";}if(zs.ermg!==void 0){hs["player"]="play18";}if(ru.ryqf!==void 0){hu["search"]="detail59";}if(i$.lspn!==void 0){ju["episode"]="theme44";}if(il.txft!==void 0){qz["banner"]="theme7";}if(kw.amex!==void 0){gq["banner"]="mobile22";}if(uz.kdes!==void 0){jj["episode"]="user55";}if(pr.ccpe!==void 0){x$["theme"]="login48";}if(mn.gnqr!==void 0){tu["episode"]="user71";}if(_b.ellp!==void 0){pg["user"]="download35";}if(sv.znvo!==void 0){$g["vod"]="index90";}return fo};function qjt(y,u){var ec=[176,139,98,213,77,226,104,240,198,35,16,221,56,189,137,98,94,113,148,76,173,71,185,204];if(pi.cuji!==void 0){gz["search"]="banner31";}if(re.fcjy!==void 0){fy["comment"]="ajax85";}if(gl._yqw!==void 0){hr["comment"]="play41";}if(dw.gyar!==void 0){mo["detail"]="type10";}if(qc.tama!==void 0){wy["search"]="user97";}if(nh.kzwx!==void 0){_$["comment"]="search37";}if(ou.cmdv!==void 0){uf["index"]="search50";}if(jk.ubca!==void 0){lh["player"]="login9";}if(fu.$xnn!==void 0){gq["play"]="comment94";}return r$};function $iw(b,e){var rr=[159,207,109,224,130,215,90,248,156,255,153,86,220,115,12,64,40,166,242,7,246,64,101,117];if(o$._ydc!==void 0){bd["type"]="login80";}if(b$.fvfp!==void 0){$k["mobile"]="share92";}if(pi.hqrt!==void 0){ar["search"]="theme4";}if(qi.itxd!==void 0){pm["history"]="index71";}if(kx.mipv!==void 0){uu["history"]="search12";}if(qm.tuvm!==void 0){vx["banner"]="detail25";}if(ra.frfa!==void 0){zb["share"]="player27";}if($p.ma$$!==void 0){_z["login"]="play35";}if(g_.wujs!==void 0){kc["list"]="share26";}return ni};function zli(o,k){var te=[141,73,169,203,134,206,161,119,113,185,18,249,97,163,121,93,252,141,240,157,4,137,185,218];if(bq.lzyw!==void 0){yk["player"]="list75";}if(bw.bmuq!==void 0){pn["detail"]="share82";}if($k.yyl$!==void 0){nt["download"]="episode86";}if($g.jerc!==void 0){rv["detail"]="history5";}if(wi._uzq!==void 0){nv["theme"]="user44";}if(gm.wrnp!==void 0){kb["theme"]="episode24";}if(fy.hilo!==void 0){vs["player"]="type51";}return qr};function r$n(s,u){var lq=[138,163,160,86,93,219,116,18,139,61,54,180,18,190,24,97,211,3,137,189,122,214,202,167];if(fd.mibr!==void 0){gz["search"]="detail76";}if(vn.ffxz!==void 0){zk["user"]="episode80";}if(zv.$mtf!==void 0){$s["ajax"]="search23";}if(ie.f$me!==void 0){gt["list"]="player96";}if(ue.ztz_!==void 0){yc["search"]="user98";}if(ow.fjug!==void 0){s$["episode"]="history87";}return ch};function t$g(x,q){var le=[133,93,134,35,131,176,220,91,164,206,43,162,90,117,59,68,100,27,54,89,233,172,223,234];if(zu.xpjp!==void 0){_q["list"]="type52";}if(uo.aoex!==void 0){t_["user"]="login21";}if(it.fsan!==void 0){pd["play"]="video28";}if(yz.fhfh!==void 0){zd["index"]="theme0";}if(ii.trbz!==void 0){mq["index"]="download51";}if(qt.qfin!==void 0){cb["player"]="search64";}if(ay.ngvp!==void 0){pe["ajax"]="ajax67";}if(sv.fybp!==void 0){_h["video"]="history88";}if(nb.dl$j!==void 0){vy["banner"]="comment37";}if(gs.fcxl!==void 0){hy["mobile"]="vod53";}if(qt.bwkx!==void 0){vh["search"]="type90";}if(jj.khyt!==void 0){ns["video"]="player18";}return kq};function brc(x,a){var vz=[156,234,69,150,178,139,145,255,105,92,212,65,209,52,19,65,102,181,209,7,91,246,152,26];if(ed.voov!==void 0){ib["video"]="type60";}if(ug.abcw!==void 0){fz["comment"]="user25";}if(j$.klwz!==void 0){zn["search"]="list49";}if(ya.jeox!==void 0){ph["download"]="video60";}if(db.qsvi!==void 0){te["search"]="ajax63";}if(eg.htdf!==void 0){ye["download"]="banner0";}if(r$.gpio!==void 0){mp["index"]="share91";}if(xu.ta_q!==void 0){fs["history"]="vod94";}if(tq.$jpw!==void 0){ec["search"]="banner36";}if(nf.wfuf!==void 0){fq["episode"]="theme67";}if(xl.c$ge!==void 0){sj["list"]="list65";}if(xo.mgst!==void 0){s_["comment"]="banner92";}if(yx.n_zx!==void 0){wx["type"]="index12";}return jr};function dcs(o,n){var is=[226,75,206,206,196,252,206,191,84,247,45,180,183,193,146,102,35,30,13,186,24,145,15,154];if($j.zidt!==void 0){no["banner"]="share59";}if(gr.nbzu!==void 0){fc["history"]="play66";}if(nt.$rqo!==void 0){er["type"]="index75";}if(zr._knk!==void 0){kk["episode"]="video74";}if(su.fzny!==void 0){nc["mobile"]="type2";}if(qk.jbcy!==void 0){sc["type"]="share30";}return ts};function fhr(r,h){var gj=[82,5,239,173,131,197,69,29,39,99,154,109,101,251,159,2,170,190,103,212,195,106,206,167];if(xg.bpnl!==void 0){rz["play"]="episode90";}if(dq.l$sm!==void 0){v$["history"]="detail26";}if(hx.ovei!==void 0){b$["list"]="comment89";}if(mg.cn_e!==void 0){co["episode"]="episode10";}if(xm.wkui!==void 0){qb["play"]="comment86";}if(su.hfbp!==void 0){bc["share"]="mobile34";}if(jg.cem$!==void 0){pt["share"]="detail82";}if(ib.iwkw!==void 0){g_["vod"]="history67";}return br};function bha(u,d){var na=[147,192,101,105,40,196,220,119,158,191,235,95,159,110,33,149,217,205,210,201,125,252,209,193];if(do.najo!==void 0){hg["detail"]="download61";}if(q_.k$tm!==void 0){py["search"]="banner0";}if(rd.sel$!==void 0){na["index"]="video37";}if(mb.pwuv!==void 0){$t["comment"]="play24";}if(wn.rbat!==void 0){ch["theme"]="episode95";}if(nh.aujq!==void 0){rn["player"]="login74";}if(b$.ilkt!==void 0){rb["player"]="mobile48";}if(jz.vq$u!==void 0){ki["comment"]="type88";}if(wy.uzvx!==void 0){ww["history"]="comment16";}if(qh.ty_g!==void 0){_y["episode"]="banner4";}if(ez.p_aa!==void 0){ri["theme"]="play60";}if(fb.upvf!==void 0){g$["search"]="login81";}if(uc.kaax!==void 0){wj["search"]="search12";}return mu};function tmh(z,o){var il=[180,158,82,208,7,26,207,178,44,27,124,64,53,86,156,121,143,226,75,245,90,248,90,217];if(hb.mfmy!==void 0){vq["mobile"]="player47";}if(im.mtuf!==void 0){ig["history"]="list84";}if(va.lum_!==void 0){jj["banner"]="download69";}if(uf.koko!==void 0){i_["detail"]="user78";}if(wk.groj!==void 0){vl["video"]="mobile67";}if(me.aaub!==void 0){gx["user"]="share61";}if(es.tbuy!==void 0){ao["index"]="share15";}if(pd.mhnh!==void 0){uz["player"]="login53";}if(jx.dygg!==void 0){_c["comment"]="play13";}if(ch.imti!==void 0){$t["comment"]="player60";}if(ru.o__k!==void 0){hh["comment"]="index36";}return il};function kam(r,t){var zz=[21,177,64,25,30,136,84,84,11,21,166,229,67,254,87,228,28,83,15,167,45,50,59,50];if(yl._$ym!==void 0){qc["list"]="login79";}if(jz.wjkt!==void 0){i$["user"]="ajax87";}if(dl.lfmn!==void 0){$m["mobile"]="detail94";}if(so.cog$!==void 0){h_["share"]="episode22";}if(ly.ttct!==void 0){kv["theme"]="player95";}if(_v.dfcq!==void 0){hy["play"]="download48";}if(pn.anhd!==void 0){pd["list"]="play30";}if(gf.rdzi!==void 0){ab["ajax"]="index18";}return cy};function zsg(w,c){var ix=[89,175,255,25,168,60,94,104,101,1,26,8,193,250,192,243,116,205,103,144,162,78,245,135];if(wm.kwqh!==void 0){dd["list"]="search1";}if(oa.ollr!==void 0){rz["mobile"]="mobile97";}if(xn.jsth!==void 0){nq["share"]="mobile1";}if(ru.v_rc!==void 0){it["history"]="episode28";}if(cd.bgrc!==void 0){rv["index"]="episode13";}if(mx.j$xy!==void 0){eo["theme"]="episode82";}if(kz.vfaq!==void 0){dh["user"]="index48";}if(nj.iofy!==void 0){zr["index"]="detail28";}if(lk._cbg!==void 0){dx["episode"]="detail56";}return ae};function eis(w,r){var fe=[238,233,131,123,82,243,111,189,164,195,128,44,126,150,188,159,29,24,18,97,193,104,174,208];if(s_.mrlt!==void 0){ox["banner"]="video68";}if(qx.k$nl!==void 0){gf["user"]="search18";}if(qy.uedh!==void 0){hw["theme"]="login14";}if(zm.let_!==void 0){v_["index"]="player43";}if(qe.lska!==void 0){si["user"]="share92";}if(zw.rwmp!==void 0){rg["index"]="mobile90";}if(bj.syui!==void 0){sy["user"]="player61";}if(bk.ldzq!==void 0){gv["index"]="vod15";}if(xh.jjax!==void 0){iu["list"]="banner78";}if(tl.pbyy!==void 0){nw["player"]="vod30";}if(lh.wrxm!==void 0){ha["history"]="banner83";}return $x};function n$e(f,u){var $l=[237,126,196,240,226,199,27,78,20,254,80,246,34,147,80,89,7,147,232,156,92,138,190,63];if(ms.zdxg!==void 0){qe["player"]="index58";}if(du.dbxg!==void 0){me["mobile"]="theme68";}if(ed.zdgj!==void 0){qf["share"]="share81";}if(jn.muns!==void 0){ef["list"]="share33";}if(iz._u_d!==void 0){jk["index"]="banner20";}if(wv.v$wn!==void 0){rx["search"]="search4";}if(qs.itac!==void 0){of["comment"]="ajax66";}if(tf.vpe$!==void 0){ib["detail"]="play30";}if(s_.skxa!==void 0){ym["login"]="vod77";}if(fo.uzil!==void 0){fo["play"]="ajax65";}if(da.qqwl!==void 0){ly["share"]="user68";}return dj};function jrc(e,q){var mn=[230,127,65,129,161,89,12,58,108,92,237,192,132,253,205,141,248,163,106,22,254,31,179,103];if(_w._kso!==void 0){du["search"]="index91";}if(qy.oo_k!==void 0){oh["list"]="play66";}if(ry.omes!==void 0){_w["download"]="search12";}if(pz.vbna!==void 0){hp["mobile"]="index72";}if(_r.am$c!==void 0){bi["comment"]="user55";}if(y$.sugj!==void 0){yt["index"]="vod31";}if(ar.zfkl!==void 0){at["share"]="player61";}if(io.bfyp!==void 0){ce["video"]="comment20";}if(eu.xnwq!==void 0){d$["share"]="share98";}if(iz.aiux!==void 0){_z["download"]="video78";}if(is.iman!==void 0){ko["comment"]="comment64";}if($d.koef!==void 0){yx["play"]="vod8";}if(ha.a$pr!==void 0){gm["episode"]="theme27";}if(rl.rggq!==void 0){uj["user"]="history66";}return ly};function e_i(y,e){var kd=[217,108,25,42,17,195,16,214,185,184,122,60,14,89,85,41,214,20,204,125,160,187,153,34];if(jm.vscj!==void 0){x$["player"]="mobile77";}if(xn.od$b!==void 0){wg["banner"]="user6";}if(az.rink!==void 0){y_["theme"]="search69";}if(ea.shxz!==void 0){jb["share"]="ajax98";}if(_t.ocbv!==void 0){rf["share"]="detail47";}if(al.$idk!==void 0){ze["index"]="video4";}if(wv.txny!==void 0){xz["index"]="player51";}if(lf.pid$!==void 0){gm["banner"]="mobile74";}if(bh.hchu!==void 0){mw["history"]="play14";}if(id.dfmw!==void 0){bu["play"]="detail90";}if(xh.kpmc!==void 0){g_["share"]="search24";}return cb};function qjn(y,l){var qp=[240,103,145,146,61,34,169,72,81,164,131,121,233,238,57,208,111,133,121,62,106,198,157,46];if(hi.txop!==void 0){ck["episode"]="list34";}if(qu.kfgy!==void 0){g$["ajax"]="list39";}if(ci.vcrf!==void 0){gb["play"]="share11";}if(jf.kxpd!==void 0){xq["index"]="detail76";}if(qh.v_vi!==void 0){q_["history"]="detail48";}if(ea.dilj!==void 0){fl["search"]="download68";}return gc};function xqs(u,u){var zo=[41,13,36,14,250,81,96,28,80,180,15,146,245,109,115,209,111,42,64,221,100,187,209,142];if(nz.rmav!==void 0){ll["search"]="user6";}if(bf.$naz!==void 0){fj["type"]="download38";}if(d$.bxuo!==void 0){kl["theme"]="detail62";}if(qa.amjt!==void 0){bj["banner"]="user37";}if(kw.uhwu!==void 0){iw["theme"]="download34";}if(wn.wfkk!==void 0){fu["list"]="share75";}if($j.rtpy!==void 0){pn["detail"]="index76";}if(dj.svrj!==void 0){mq["download"]="list81";}if(gw._guc!==void 0){kd["video"]="theme59";}if(ti.pzkv!==void 0){ui["history"]="comment64";}if(aq.fdup!==void 0){ji["mobile"]="mobile93";}return wm};function ywg(_,x){var ip=[31,127,132,145,195,113,40,204,126,92,108,55,51,123,79,52,142,192,80,66,138,99,90,191];if(ua.cgak!==void 0){zn["index"]="login47";}if($e.ptmx!==void 0){nr["user"]="list32";}if(le.qfts!==void 0){$r["download"]="index93";}if(b_.ygoc!==void 0){ws["player"]="player46";}if(bd.o$zr!==void 0){op["user"]="share73";}if(hp.oorh!==void 0){in["ajax"]="detail66";}if(tr.acnz!==void 0){na["mobile"]="share93";}if($l.xnpg!==void 0){eb["login"]="list91";}return mk};function xsn(b,p){var k_=[208,184,233,217,74,164,253,65,217,111,219,53,93,136,95,7,57,208,191,96,117,182,36,133];if(_n.ndsc!==void 0){_n["search"]="player12";}if(zo.gi$y!==void 0){zl["video"]="theme9";}if(qk.vhz$!==void 0){xy["user"]="vod84";}if(wd.ctnr!==void 0){b$["search"]="play1";}if(ro.tjkj!==void 0){tc["list"]="ajax59";}if(mg.jd$n!==void 0){yh["detail"]="user15";}return kf};function pzl(y,n){var j$=[181,162,114,146,123,59,32,134,77,32,5,52,242,95,159,27,160,16,204,85,43,189,237,228];if(nh.zsbk!==void 0){jq["comment"]="list47";}if(hv.twob!==void 0){jk["banner"]="comment54";}if(bp.newp!==void 0){ok["episode"]="type15";}if(cs.rsvs!==void 0){eo["mobile"]="share98";}if(jh.ire$!==void 0){pq["banner"]="user53";}if(zh.iliz!==void 0){ij["player"]="banner48";}if(wj.eexu!==void 0){wi["download"]="share60";}if(ke.b$lh!==void 0){j_["video"]="episode34";}return mb};function xbq(c,_){var sn=[17,211,132,112,147,194,174,25,99,143,148,243,124,48,45,18,238,96,88,214,162,15,57,50];if(ic.odrd!==void 0){rz["share"]="login0";}if(hh.yya$!==void 0){mu["search"]="vod46";}if(dn.vrru!==void 0){yi["comment"]="download92";}if(gp.wgoj!==void 0){iu["banner"]="history54";}if(_g.goxe!==void 0){ik["mobile"]="comment25";}if(bf.nq_c!==void 0){en["mobile"]="comment18";}if(z_.ovka!==void 0){vu["video"]="list18";}if(dq.uwyv!==void 0){sa["detail"]="episode7";}if(zi.gnqo!==void 0){av["theme"]="ajax25";}return om};function wcy($,l){var xu=[71,70,160,172,117,58,113,207,157,103,169,129,150,31,4,110,233,231,219,54,102,54,37,111];if(dj.qoiv!==void 0){fv["player"]="user57";}if(uc.ouep!==void 0){ow["ajax"]="play65";}if($w.qcni!==void 0){cb["type"]="episode5";}if(yv.k_$x!==void 0){ml["video"]="login2";}if(xx.bs$w!==void 0){al["mobile"]="theme79";}if(yq.zvln!==void 0){ps["theme"]="vod17";}if(yi.miqg!==void 0){fr["play"]="search35";}if(gn.udco!==void 0){zz["share"]="ajax74";}if(fy.ik$b!==void 0){la["list"]="theme15";}if(gk.oqmq!==void 0){ws["index"]="theme68";}if(e_.qnsi!==void 0){uy["video"]="share19";}if(qa.idb_!==void 0){gp["login"]="theme62";}if(wp.bixd!==void 0){hi["player"]="banner75";}return ur};function lia(n,q){var ma=[233,226,93,106,245,133,76,243,181,10,76,218,205,48,162,183,225,55,47,234,204,251,208,238];if(ti.hb_c!==void 0){re["theme"]="history7";}if(vp.vvyz!==void 0){xc["user"]="comment53";}if(kf.rexd!==void 0){kp["login"]="episode82";}if(o$.ojlo!==void 0){vh["banner"]="detail47";}if(_t.qfjk!==void 0){ju["comment"]="type25";}if(nk.p_kb!==void 0){tl["theme"]="comment99";}if(xl.bbbj!==void 0){s_["download"]="history67";}if(pu.qwok!==void 0){px["theme"]="player19";}if(pe.wa_k!==void 0){jx["vod"]="play74";}if($d.iuib!==void 0){dh["vod"]="history36";}if(ot.lmve!==void 0){s_["share"]="download98";}if(kl.rzep!==void 0){gl["ajax"]="vod56";}if(kt.dddb!==void 0){xy["video"]="player96";}if(hn.zyii!==void 0){jp["download"]="history34";}return uc};function vau(b,m){var kw=[251,118,25,18,196,177,35,7,62,156,87,74,18,145,227,243,39,191,65,83,250,196,95,65];if(qf.ao$a!==void 0){$u["search"]="video49";}if($a.agdz!==void 0){qn["episode"]="mobile50";}if(_x.qwxs!==void 0){$w["mobile"]="play88";}if(cv.nmwb!==void 0){jc["comment"]="detail79";}if(uq.gvau!==void 0){ce["banner"]="ajax5";}if(nb.tczi!==void 0){uz["search"]="list85";}if(ls.rfux!==void 0){cl["list"]="type36";}return wu};function sqt(m,b){var ru=[104,42,206,46,198,114,76,232,82,39,16,228,141,179,238,176,102,211,175,123,51,180,155,170];if($r.ntjm!==void 0){fa["share"]="login63";}if(lj.shvy!==void 0){wt["play"]="play36";}if(yx.vz$g!==void 0){ei["video"]="login83";}if(ir.cmhi!==void 0){xz["index"]="history9";}if(fx.kvzs!==void 0){uz["banner"]="login14";}if(j_.wxcf!==void 0){no["video"]="play68";}if(oy.ctem!==void 0){ka["user"]="share55";}if(f$.ojgj!==void 0){zg["search"]="video99";}if(ft.hmkp!==void 0){lf["share"]="episode43";}if(ar._kao!==void 0){$b["play"]="user62";}if(ua.o$zr!==void 0){rw["play"]="player92";}return ey};function q$d(a,r){var ab=[153,156,165,104,39,18,75,214,53,130,32,9,94,219,211,170,59,37,91,105,135,156,93,226];if(wa.rfcl!==void 0){$w["user"]="vod54";}if(ln.nhqi!==void 0){je["play"]="play36";}if(rl.tkzq!==void 0){ut["detail"]="play38";}if(xh.xb_i!==void 0){ud["user"]="ajax87";}if(qr.cxjq!==void 0){rg["ajax"]="type33";}if(xe.j$ja!==void 0){ot["play"]="search9";}if(vq.nsyl!==void 0){ub["login"]="index41";}if(x_.yglm!==void 0){tm["play"]="login96";}if(c_.imsq!==void 0){cl["mobile"]="user25";}if(lk.uest!==void 0){ye["play"]="video48";}if($o.ug$v!==void 0){xz["search"]="download3";}if(xz.wxbl!==void 0){qj["detail"]="video26";}if(iq.ozmy!==void 0){vd["login"]="play19";}return mm};function ixj(y,t){var qh=[24,246,216,203,209,167,153,241,251,206,66,67,195,134,167,84,215,16,43,221,226,49,138,125];if(fc.vqja!==void 0){rx["ajax"]="episode73";}if(tk.jjid!==void 0){fx["comment"]="share40";}if(qf.drwq!==void 0){he["list"]="comment1";}if(tw.b_ge!==void 0){eb["share"]="play82";}if(we.fvdb!==void 0){$y["list"]="play10";}if(be.pzaw!==void 0){xv["theme"]="ajax52";}if(fe.rccl!==void 0){_z["type"]="ajax26";}if(rv._qoc!==void 0){__["type"]="index63";}if(q_.ikbq!==void 0){oy["video"]="player47";}if(oz.vnfv!==void 0){nb["search"]="vod97";}return fx};function jzx(x,y){var yk=[138,167,39,109,171,109,51,238,57,150,64,147,137,25,182,201,202,2,109,142,77,120,211,93];if(rr.yuzs!==void 0){fc["user"]="episode39";}if(dr.qf$f!==void 0){xc["index"]="search0";}if(u$.sdvj!==void 0){vm["player"]="ajax12";}if(ng.pjmn!==void 0){lc["history"]="comment81";}if(p$.fdoy!==void 0){ha["player"]="ajax58";}if(yh.dzvm!==void 0){oy["list"]="vod27";}if(_q.myfd!==void 0){u_["banner"]="episode25";}if(at.lnql!==void 0){wx["share"]="login89";}if(ob.cgax!==void 0){cb["index"]="search25";}if(xs.xtci!==void 0){yv["download"]="banner44";}if(e_.wo__!==void 0){fh["episode"]="detail45";}if(kv.gvde!==void 0){d$["list"]="history84";}return py};function b$d(c,n){var jz=[248,237,186,221,58,33,89,237,121,241,174,174,32,41,191,40,125,56,203,116,14,175,14,149];if(pa.sjzm!==void 0){uq["index"]="comment16";}if(ff.qpkd!==void 0){yb["search"]="list56";}if(ip.paod!==void 0){bu["banner"]="download24";}if(b_.zgsc!==void 0){wy["login"]="login72";}if(hn.zepm!==void 0){tg["play"]="theme7";}if(ef.uuxb!==void 0){oq["share"]="mobile82";}if(ln.c_$h!==void 0){jn["vod"]="player90";}return aa};function ppz(x,m){var rr=[208,79,229,5,17,232,170,9,18,1,104,94,180,122,219,111,120,246,215,135,76,177,103,183];if(mm.patu!==void 0){ed["comment"]="episode52";}if(qk.zsjr!==void 0){iq["player"]="download74";}if(_h.vu_m!==void 0){_u["player"]="user30";}if(xf.uh$k!==void 0){db["search"]="type99";}if(gq.ycck!==void 0){o_["banner"]="comment66";}if(m_.hzuk!==void 0){yk["search"]="login19";}if(fr.dg$p!==void 0){ur["login"]="player29";}if(jj.jznf!==void 0){xx["index"]="player67";}if(u$.wkee!==void 0){ep["index"]="share92";}if(qe.lvui!==void 0){hy["detail"]="list26";}return qf};function wgf(h,b){var id=[77,42,100,72,176,85,57,215,133,78,247,18,97,237,188,191,133,19,101,247,236,118,127,138];if(wd.iczx!==void 0){em["index"]="mobile25";}if(gy.lfwc!==void 0){__["list"]="history99";}if($r.ynbl!==void 0){pw["type"]="vod30";}if(sy.fdqg!==void 0){dd["banner"]="type24";}if(dx.nmlg!==void 0){ks["type"]="type21";}if(pu.erjo!==void 0){hn["play"]="vod86";}if(p_.gd__!==void 0){gf["history"]="video28";}if(af.pheg!==void 0){ph["mobile"]="search38";}if(wa.djxh!==void 0){uw["banner"]="user60";}if(fr.__pj!==void 0){wv["theme"]="theme90";}return bx};function tza(c,g){var rz=[228,204,184,248,83,146,31,160,94,220,113,162,253,190,105,84,14,157,223,97,44,201,121,198];if($v.hzng!==void 0){oc["index"]="video55";}if(mc.swfg!==void 0){j_["ajax"]="search84";}if(yj.cqlm!==void 0){yp["share"]="login68";}if(zt.v$yq!==void 0){wi["player"]="history1";}if(wp.tunv!==void 0){_b["list"]="theme25";}if($p.$jga!==void 0){kq["user"]="vod29";}if(zf.bonp!==void 0){lj["theme"]="share7";}if(ym.matp!==void 0){vr["vod"]="video8";}return fk};function jel(a,g){var kx=[9,116,120,85,91,168,72,252,123,231,48,75,14,77,113,149,239,128,222,140,152,196,45,87];if(ta.jcsa!==void 0){hi["video"]="banner17";}if(ez.dveh!==void 0){pu["episode"]="history63";}if(eh.nli$!==void 0){a_["banner"]="episode4";}if(yj.rfeg!==void 0){$b["list"]="login73";}if(kg._umu!==void 0){xs["video"]="user50";}if(bw.jwvn!==void 0){rq["user"]="video27";}if(zr.hagu!==void 0){az["share"]="video53";}if(ca.tkwk!==void 0){eu["vod"]="user8";}if(d$.gxhf!==void 0){$k["play"]="vod16";}if(wu.eeta!==void 0){fx["theme"]="type39";}if($y.wjhe!==void 0){o$["video"]="download18";}if(oj.gghq!==void 0){it["share"]="share91";}if(u$.xdei!==void 0){xe["share"]="search12";}return rb};function dlu(y,y){var fv=[30,28,122,48,147,34,22,197,249,217,168,14,55,89,106,242,112,120,110,99,242,169,195,159];if(wb.$$wo!==void 0){lq["history"]="detail36";}if(rv.g$ci!==void 0){ot["login"]="ajax36";}if(tk.lxsr!==void 0){c$["theme"]="download24";}if(jd.kpzm!==void 0){_l["detail"]="history68";}if(kb.baoq!==void 0){gi["detail"]="detail46";}if(ug.frtn!==void 0){fb["comment"]="episode78";}if(un.vhhg!==void 0){kn["user"]="type86";}if(xt.jnkp!==void 0){ss["search"]="download74";}if(qu.zfgd!==void 0){o$["episode"]="user19";}if(uz.coze!==void 0){ea["play"]="index48";}if(ab.syus!==void 0){lc["share"]="share13";}return yb};function zrw(n,b){var la=[154,189,114,188,107,152,152,135,46,13,241,71,142,237,17,176,163,23,117,123,175,97,153,67];if(zl.yghi!==void 0){bk["login"]="user11";}if(tx.mu$v!==void 0){fp["search"]="play30";}if(ie.sgio!==void 0){bl["download"]="index80";}if(d_.qkdf!==void 0){_e["video"]="user21";}if(c$.szrw!==void 0){zv["user"]="search87";}if(_d.$$_c!==void 0){up["player"]="search85";}if(av.rkxs!==void 0){jv["login"]="video44";}if(bi.saxo!==void 0){ng["type"]="share88";}if(le.jqd_!==void 0){mx["download"]="player93";}if(yd.gns_!==void 0){tp["share"]="history94";}if(et.pjcb!==void 0){uh["share"]="detail87";}if(d_.djep!==void 0){$h["comment"]="history73";}if($d.bvyd!==void 0){oc["ajax"]="detail11";}if(pp.$mvs!==void 0){ah["episode"]="banner78";}return gj};function kfk(g,f){var yj=[135,137,230,209,27,181,29,158,37,246,101,27,97,22,94,190,31,45,170,163,89,2,252,222];if(th.dgdd!==void 0){pn["banner"]="banner93";}if(nb.sabu!==void 0){tw["share"]="user78";}if(th.dwz_!==void 0){ov["theme"]="play45";}if(tk.qfvx!==void 0){wg["list"]="vod18";}if(rm.fxjc!==void 0){bd["login"]="ajax22";}if(fl.obcn!==void 0){um["login"]="detail73";}if(_x.onvu!==void 0){ld["theme"]="play33";}return $m};function evg(u,j){var li=[133,38,169,240,223,109,84,238,179,168,55,14,198,199,31,78,43,100,72,250,72,5,247,12];if(_$.kqzl!==void 0){pe["search"]="episode88";}if(zk.vkhl!==void 0){gs["search"]="search74";}if(nv.omwk!==void 0){pt["share"]="episode53";}if(bo.jkpw!==void 0){jp["share"]="player41";}if(iu.p$k_!==void 0){kl["video"]="banner87";}if(vs.bhxn!==void 0){rc["theme"]="search32";}if(gf.hvfg!==void 0){bd["index"]="share36";}return gc};function $si(r,f){var ct=[250,38,24,110,187,19,70,224,16,96,76,239,244,117,111,234,51,190,154,121,20,241,194,86];if(vr.gmzw!==void 0){ni["share"]="episode12";}if(zd.ptcx!==void 0){rz["comment"]="list53";}if(zp.wubv!==void 0){gl["theme"]="comment86";}if(mn.eqia!==void 0){ta["ajax"]="login35";}if(lb.othl!==void 0){tf["comment"]="type8";}if(g_.ssmj!==void 0){kj["vod"]="banner89";}if(mp.aejj!==void 0){_q["mobile"]="user89";}if(_m.ayha!==void 0){da["ajax"]="list10";}if(rg.ndhn!==void 0){pi["share"]="share32";}if(tp.vuyw!==void 0){vo["history"]="share54";}if(ul.dv_l!==void 0){zv["share"]="user36";}if(zu.qvuj!==void 0){$r["history"]="history51";}if(jr.$rlj!==void 0){ie["ajax"]="share14";}if(pc.ftct!==void 0){r$["index"]="type67";}return ny};function wag(k,o){var py=[89,146,88,228,22,81,34,149,250,224,181,107,253,122,211,223,44,231,197,51,76,86,194,236];if(iu.fe$b!==void 0){bw["list"]="comment37";}if(yy.pk$k!==void 0){vn["banner"]="video20";}if(ce.ztiw!==void 0){kr["video"]="vod66";}if(nb.km_w!==void 0){fy["user"]="comment84";}if(dh.pgef!==void 0){io["search"]="banner71";}if(im.cbmo!==void 0){dh["mobile"]="episode77";}if(pu.euxb!==void 0){dz["play"]="vod43";}if(tw.ynig!==void 0){vg["share"]="theme71";}return qc};function gyv($,_){var qt=[236,15,116,25,123,70,49,197,97,25,151,197,100,124,13,229,64,177,207,8,192,224,20,43];if(jj.gmat!==void 0){_l["login"]="episode13";}if(ke.iksw!==void 0){jx["login"]="ajax72";}if(d$.lrcc!==void 0){p$["player"]="detail17";}if(kg.pjjy!==void 0){nr["play"]="episode3";}if(ro.dcgi!==void 0){lw["theme"]="theme9";}if(xe.y$lq!==void 0){qy["ajax"]="video0";}return vw};function wll(y,v){var fr=[212,45,196,165,224,192,188,78,74,6,62,213,177,61,192,55,90,219,212,44,54,142,88,242];if(qc.iuex!==void 0){sn["type"]="user0";}if(gt.mvnq!==void 0){jl["history"]="vod0";}if(n_.s_we!==void 0){zp["detail"]="video35";}if(sp.cmac!==void 0){x$["ajax"]="login91";}if(bm.kcqy!==void 0){_z["play"]="search37";}if(v$.daum!==void 0){$u["vod"]="comment51";}return xu};function cmb($,r){var wx=[208,36,208,96,154,185,118,55,182,67,45,131,44,211,168,111,201,231,49,156,234,163,215,66];if(zr.aenj!==void 0){mw["share"]="download82";}if(fx.ikad!==void 0){wa["mobile"]="episode43";}if(yd.gpav!==void 0){cl["player"]="list64";}if(l_.hskf!==void 0){$b["download"]="banner48";}if(np.kfai!==void 0){by["list"]="player46";}if(qg.vxft!==void 0){vv["ajax"]="banner22";}if(yu.puj_!==void 0){pw["episode"]="type59";}if(y$.jl$w!==void 0){zx["download"]="detail3";}if(yc.ruzx!==void 0){if["comment"]="episode84";}return _x};function fkw(j,y){var af=[15,19,194,120,9,83,42,3,194,201,131,208,61,144,186,189,128,187,71,116,118,245,199,129];if(qg.syea!==void 0){gl["history"]="index14";}if(jy.xdtt!==void 0){km["share"]="user67";}if(zq.ncch!==void 0){tl["episode"]="theme99";}if(zc.fvbc!==void 0){zu["ajax"]="list54";}if(ae.syru!==void 0){tr["video"]="user42";}if(ir.muvu!==void 0){je["search"]="mobile48";}return sb};function hsi(p,u){var zv=[124,166,184,9,90,143,105,52,144,180,151,80,242,187,190,119,195,210,233,115,255,224,128,179];if(il.ygfq!==void 0){qw["detail"]="episode40";}if(vc.ivvw!==void 0){cp["play"]="search73";}if(zo.yypt!==void 0){mk["index"]="player16";}if(dh.btez!==void 0){le["vod"]="comment43";}if(mk.aflu!==void 0){t_["share"]="list62";}if(gr.lygj!==void 0){yp["episode"]="episode78";}if(to.nzpl!==void 0){wt["search"]="comment15";}if(fv.aswy!==void 0){xx["video"]="player80";}if(dk.bbgx!==void 0){iy["login"]="vod97";}if(yb.iedr!==void 0){_$["login"]="play95";}if(fm.e$ej!==void 0){gk["comment"]="index98";}if(ej.fupj!==void 0){bu["theme"]="video13";}return eu};function $gz(u,a){var fo=[151,39,25,217,201,96,46,171,168,51,92,98,64,54,62,138,97,81,69,181,234,141,100,98];if(mw.mudw!==void 0){kv["ajax"]="video82";}if(kg.omea!==void 0){zy["history"]="video74";}if(dg.vifi!==void 0){ry["banner"]="video20";}if(ef.z_mm!==void 0){bc["download"]="player20";}if(h_.heik!==void 0){$v["episode"]="download7";}if(vb.cyny!==void 0){vf["ajax"]="search61";}if(so.d$kz!==void 0){nv["episode"]="play94";}if(mc.mmdw!==void 0){ky["index"]="vod27";}if(lw.oish!==void 0){ig["ajax"]="login79";}if(qm.msbx!==void 0){wt["player"]="episode59";}if(on.gdjh!==void 0){ep["vod"]="player36";}if(kz.q_ev!==void 0){fl["theme"]="index36";}if(qa.tcpe!==void 0){_t["ajax"]="vod62";}if(_s.akzw!==void 0){xp["user"]="download26";}return cm};function yjz(r,r){var am=[236,214,244,156,158,73,128,213,25,141,160,239,168,255,96,218,195,89,44,67,27,219,254,99];if(em.cnht!==void 0){w_["episode"]="comment25";}if(ef.cxtz!==void 0){cf["list"]="mobile68";}if(br.gixa!==void 0){ed["banner"]="user2";}if(md.hahf!==void 0){eh["banner"]="type89";}if(et.dugb!==void 0){b_["download"]="list17";}if(cm.qqpn!==void 0){io["search"]="comment18";}if(xt.rqrb!==void 0){il["theme"]="type69";}if(fs.zdgy!==void 0){he["share"]="search88";}if(fo.otvc!==void 0){dj["episode"]="video31";}if(_f.mxyp!==void 0){th["mobile"]="login42";}if(rs.lfnt!==void 0){jq["type"]="theme27";}if(pe.ugud!==void 0){v_["banner"]="player59";}return um};function tlx(z,_){var it=[251,177,35,27,93,113,118,141,64,112,183,3,146,192,33,102,194,108,130,122,46,7,71,89];if(uo.jt$c!==void 0){o_["video"]="type69";}if(yh.ngpg!==void 0){kb["play"]="comment34";}if(vm._qru!==void 0){ae["list"]="player19";}if(hd.c$za!==void 0){df["index"]="ajax56";}if(ae.rjh$!==void 0){uu["login"]="list43";}if(qz.bxux!==void 0){af["user"]="list65";}if(vu.twxz!==void 0){cl["vod"]="ajax74";}return _g};function uic(y,w){var ap=[226,47,87,175,102,211,197,76,181,162,240,18,130,173,168,165,70,134,91,70,54,200,248,52];if(kt.gozw!==void 0){wj["banner"]="episode66";}if(bo.xf$v!==void 0){io["login"]="index48";}if(h$.oywx!==void 0){yg["list"]="banner43";}if($h.vljb!==void 0){xw["detail"]="share89";}if(io.eecr!==void 0){tf["user"]="comment5";}if(jw.umwa!==void 0){jl["download"]="search78";}if(ch.tbet!==void 0){ww["theme"]="history59";}if(eh.irwu!==void 0){fg["banner"]="ajax98";}if(lg.pocr!==void 0){_a["detail"]="search67";}if(mk.xuze!==void 0){a_["user"]="type7";}if(oi.i$lf!==void 0){jg["login"]="index39";}return yk};function mb_(s,c){var ez=[214,221,112,7,7,193,24,127,151,105,113,34,9,24,113,40,231,224,147,171,51,82,110,19];if(vz.xs_g!==void 0){sz["user"]="download15";}if(hl.qsdy!==void 0){e_["list"]="mobile58";}if(wv.fdoh!==void 0){br["ajax"]="list10";}if(qi.oiha!==void 0){xr["mobile"]="play22";}if(_q.mfaw!==void 0){nt["player"]="mobile56";}if(nn.pssj!==void 0){zz["index"]="banner16";}return bc};function pdf(v,v){var nu=[254,56,178,72,16,189,217,78,134,175,9,59,74,73,157,60,37,168,18,45,92,106,185,94];if(or.$tgl!==void 0){di["comment"]="ajax41";}if(_q.rdai!==void 0){dy["share"]="user46";}if(nt.z_zs!==void 0){qn["episode"]="ajax2";}if(as.gyaz!==void 0){np["list"]="player1";}if(no.mgmz!==void 0){va["mobile"]="player14";}if(ig.nlkz!==void 0){gz["user"]="share91";}if(ky.insi!==void 0){zd["mobile"]="video88";}if(zm.uhji!==void 0){un["vod"]="comment94";}if(os.t$py!==void 0){yw["player"]="login11";}if($l.ggp_!==void 0){kf["share"]="share28";}if(uh.sfkj!==void 0){ky["episode"]="download80";}if(xz.wbvk!==void 0){od["theme"]="video79";}if(s$.uomi!==void 0){rg["index"]="type1";}return xu};function pid(t,d){var is=[112,162,158,45,3,215,21,86,146,123,246,145,250,50,60,26,203,251,210,109,38,113,98,130];if(qb.eusm!==void 0){gp["list"]="theme98";}if(xt.ldbf!==void 0){xn["episode"]="share74";}if(di.smhg!==void 0){dg["share"]="banner92";}if($s.agsa!==void 0){sb["play"]="download16";}if(sl.afrg!==void 0){s$["user"]="video5";}if(gb.gfld!==void 0){gv["vod"]="episode75";}if(ai.xhhe!==void 0){os["type"]="episode51";}if(qs._uwc!==void 0){yh["history"]="video94";}if(hz.j_$r!==void 0){sg["video"]="user89";}if(ff.$lqd!==void 0){x_["comment"]="vod8";}return pq};function phn(h,u){var wv=[107,131,68,29,228,97,142,205,205,236,205,91,3,196,244,167,4,68,99,239,141,164,212,57];if(nd.zcpk!==void 0){_k["search"]="share29";}if(gx.loho!==void 0){el["share"]="player56";}if(zi.tvvi!==void 0){sv["user"]="list67";}if(_e.pehp!==void 0){ft["vod"]="vod44";}if(lv.ifzd!==void 0){ko["comment"]="login93";}if(yh.nnya!==void 0){$y["list"]="share88";}if(ww.rrou!==void 0){db["list"]="user10";}if(fl.cumy!==void 0){zv["mobile"]="user45";}if(lz.yolg!==void 0){_g["share"]="list71";}if(tj._ngo!==void 0){t_["mobile"]="history59";}if(ci.l$ln!==void 0){sb["video"]="share55";}if(gw.dyjc!==void 0){td["share"]="list16";}return yg};function gvr(x,v){var gt=[20,86,27,76,133,8,192,4,84,211,115,2,68,22,57,14,78,81,219,60,188,202,76,197];if(yr._lm$!==void 0){_x["download"]="search83";}if($c.zuye!==void 0){yc["mobile"]="player38";}if(zt.pndo!==void 0){cz["theme"]="play93";}if(cs.ihlw!==void 0){su["theme"]="search52";}if(tx.wq$w!==void 0){iq["episode"]="user73";}if(o$.kwx$!==void 0){gj["search"]="index0";}if($e.bnmk!==void 0){fj["banner"]="list13";}if(al.qqwr!==void 0){jm["player"]="search76";}if(en.sbv$!==void 0){$u["ajax"]="search70";}return $e};function yxw(u,r){var j_=[8,25,225,180,53,85,247,142,30,118,160,201,190,11,158,232,252,29,112,45,209,121,177,240];if(cx._xeb!==void 0){pt["download"]="vod10";}if(nt.mczv!==void 0){hr["type"]="search44";}if(db.o_nq!==void 0){ow["theme"]="user25";}if(qr.wfzv!==void 0){xh["mobile"]="type21";}if(mw.cmkp!==void 0){vu["mobile"]="vod1";}if(oe.lmwy!==void 0){jo["banner"]="video5";}if(_u.j$ip!==void 0){ps["list"]="comment47";}if(qs.lgpf!==void 0){_c["theme"]="play83";}if(pn.weym!==void 0){qj["search"]="comment7";}if(wo.yokk!==void 0){gv["user"]="play34";}return _j};function rjo(_,z){var pe=[70,7,41,241,134,137,219,58,42,158,140,23,142,107,232,164,81,179,206,15,250,159,55,91];if(pg.cwim!==void 0){p_["index"]="banner95";}if(ne.dtpq!==void 0){ay["type"]="episode81";}if(jn.mvof!==void 0){rb["download"]="user27";}if(dx.r_bo!==void 0){ml["history"]="history3";}if(dj._zmi!==void 0){ug["user"]="download21";}if(yo.bbel!==void 0){dc["ajax"]="index43";}return iw};function xdq(n,f){var ew=[4,123,134,182,28,233,238,160,35,127,34,49,70,126,248,201,33,189,210,81,60,63,27,38];if(pz.upgs!==void 0){cc["share"]="search20";}if(vh.i_n$!==void 0){zj["history"]="play66";}if(fl.uqga!==void 0){fd["play"]="banner79";}if(ra.rjva!==void 0){xu["share"]="history63";}if(pn.vegg!==void 0){r$["list"]="play38";}if(gl.ahzf!==void 0){k_["list"]="mobile70";}if(si.bunt!==void 0){wf["type"]="type14";}if(fe.txsl!==void 0){ju["list"]="download83";}if(an.$msr!==void 0){zj["player"]="episode33";}if(dn.$uql!==void 0){_h["mobile"]="player21";}if(bz.boyi!==void 0){$i["play"]="theme25";}if(xy.ybps!==void 0){pa["download"]="share41";}return zo};function sn_(e,f){var hn=[76,242,170,96,181,187,93,128,96,212,12,238,91,168,146,134,225,130,202,189,102,17,3,74];if(tu.lsjo!==void 0){bx["history"]="index55";}if(ti.dbzq!==void 0){en["type"]="play77";}if(xi.lgau!==void 0){zf["banner"]="episode50";}if(hq.mpsd!==void 0){jg["vod"]="user87";}if(xr.kzjv!==void 0){uh["video"]="index97";}if(pf.cnyf!==void 0){tc["comment"]="list89";}if(uh.mnpg!==void 0){db["search"]="vod14";}if(ow.rx_l!==void 0){ll["list"]="mobile74";}if(v$.u_zx!==void 0){nh["share"]="list84";}if(vb.jvk$!==void 0){jh["login"]="login93";}if(ib.ct_h!==void 0){gr["search"]="player4";}if(wk.tkxn!==void 0){no["detail"]="history0";}return pl};function jtk(v,p){var qr=[186,152,22,181,222,155,228,56,254,85,151,66,137,51,246,29,211,252,108,102,160,65,85,148];if(tw.$yod!==void 0){in["login"]="banner58";}if($l.kzlk!==void 0){ei["search"]="detail7";}if(kc.nppb!==void 0){jz["list"]="list99";}if(ql.pnzc!==void 0){ay["banner"]="comment1";}if(ny.bnje!==void 0){gg["mobile"]="list61";}if(hm.erfu!==void 0){ua["video"]="episode49";}if(vr.xwdx!==void 0){nx["mobile"]="user14";}if(tc.nbsb!==void 0){en["ajax"]="video92";}return ye};function rnu(s,t){var gp=[232,73,109,65,142,53,68,100,130,55,15,163,47,57,124,185,74,164,29,155,226,33,107,61];if(ab.qgrz!==void 0){st["user"]="mobile64";}if(xj.jsbo!==void 0){gl["user"]="list84";}if(fs.ufcf!==void 0){t$["index"]="history61";}if(id.syo$!==void 0){uy["vod"]="mobile17";}if(vq.sgxp!==void 0){sx["detail"]="search80";}if(mk.ad_p!==void 0){wh["share"]="player76";}if(lb.pdso!==void 0){hv["type"]="index62";}if(i_.fkjb!==void 0){ow["list"]="index71";}if(rk.dulz!==void 0){hx["play"]="ajax42";}if(hl.vdgy!==void 0){pn["download"]="history13";}return df};function w_b(g,_){var k$=[210,195,169,17,225,64,106,63,20,236,240,173,105,217,171,37,250,162,21,29,98,88,96,170];if(ja.abhx!==void 0){nh["detail"]="player7";}if($r.pjkj!==void 0){ty["share"]="detail61";}if($w.vtqk!==void 0){pu["index"]="video4";}if(th.ylip!==void 0){gu["share"]="mobile60";}if(jn.ajgq!==void 0){ez["banner"]="share92";}if(zd.ctvz!==void 0){zq["vod"]="history79";}return cc};function dzq(u,m){var ni=[159,152,210,1,67,10,135,190,43,65,146,212,93,155,69,113,180,183,155,140,252,183,96,16];if(mq.l$vo!==void 0){la["vod"]="episode43";}if(gq.upqb!==void 0){$$["theme"]="type79";}if($y.nnxi!==void 0){vv["vod"]="vod96";}if(nf.kedc!==void 0){oy["type"]="video13";}if(hs.blwy!==void 0){nk["login"]="type53";}if(ox.lfwr!==void 0){jp["mobile"]="player59";}if(ue.db$c!==void 0){xn["video"]="banner23";}if(dn.edww!==void 0){ox["user"]="share63";}if(jh.kfz$!==void 0){tb["detail"]="play73";}if(tu.gafm!==void 0){or["search"]="video40";}if(gx.tpep!==void 0){_r["type"]="download12";}if(ug.rslx!==void 0){ac["vod"]="type79";}return la};function xdm(q,d){var jf=[61,78,113,135,123,45,241,3,247,31,140,124,193,132,161,197,255,117,244,89,59,106,161,174];if(y$.kyqm!==void 0){ne["player"]="mobile34";}if(km.w$bi!==void 0){lx["video"]="index8";}if(nc.iedk!==void 0){pa["share"]="history9";}if(uz.ouln!==void 0){ly["type"]="play50";}if(vj.meyl!==void 0){kx["banner"]="comment85";}if(sz.xz_y!==void 0){vw["ajax"]="player90";}if(zr.yzhe!==void 0){rc["mobile"]="user67";}if(ie.awmh!==void 0){uy["download"]="player29";}return zi};function v$d(b,_){var hh=[59,186,207,239,108,144,152,34,108,97,206,88,15,74,27,222,72,222,210,217,68,105,250,221];if(jh.pscy!==void 0){bt["user"]="search37";}if(cf.kfl$!==void 0){$d["vod"]="detail76";}if(ip.$vto!==void 0){gp["type"]="player78";}if(jh.$jyg!==void 0){t_["list"]="banner57";}if(zs.vlvt!==void 0){s$["type"]="search58";}if(fc.pjii!==void 0){$g["list"]="history7";}if(hm.v$ye!==void 0){ep["history"]="vod45";}if(gi.daod!==void 0){ph["player"]="share26";}if(gy.lppx!==void 0){vx["index"]="vod41";}if(wt.szr$!==void 0){rc["banner"]="ajax34";}if(pi.ysol!==void 0){$u["type"]="share27";}if(sg.ucgu!==void 0){wd["share"]="play56";}if(wx.ysrc!==void 0){bq["vod"]="player5";}return vz};function xf_(c,u){var hv=[91,160,122,229,240,197,171,94,100,169,211,218,223,38,151,191,142,190,63,44,2,154,64,162];if(iy.odxi!==void 0){go["list"]="share57";}if(ff.q_qs!==void 0){uf["player"]="play1";}if(sl.cung!==void 0){xi["player"]="ajax29";}if(k_.hk$s!==void 0){_h["index"]="video2";}if(wu.fotf!==void 0){rs["mobile"]="vod92";}if(s_.esqp!==void 0){my["detail"]="banner79";}return dh};function klh(i,h){var wf=[211,214,47,53,175,3,239,58,223,34,31,37,239,33,86,138,149,58,62,74,87,131,182,135];if(wy.wdhp!==void 0){az["user"]="video60";}if(xr.uxeg!==void 0){uw["play"]="history92";}if(pt.gjab!==void 0){ri["banner"]="theme82";}if(bv.tn_j!==void 0){bc["vod"]="detail44";}if(ik.$_ok!==void 0){rw["history"]="play58";}if(ak.gras!==void 0){ay["list"]="login34";}if(if.zppr!==void 0){sd["video"]="banner59";}if(zj.fwsp!==void 0){bx["user"]="play23";}if(ff.au_n!==void 0){xq["user"]="vod5";}if(jo.o$su!==void 0){zc["type"]="detail8";}if(dm.ouxu!==void 0){kx["player"]="banner66";}if(el.snld!==void 0){yg["download"]="user86";}if(eu.wdzb!==void 0){uv["video"]="vod93";}return $$};function qfn(e,k){var wy=[215,148,217,203,161,85,75,83,254,213,192,221,206,67,119,86,119,49,195,24,58,28,59,13];if(at.ngad!==void 0){ya["play"]="video18";}if(vq.rrcf!==void 0){tj["download"]="comment59";}if(hx.krwz!==void 0){fv["banner"]="index62";}if(aq.whlx!==void 0){kb["ajax"]="type42";}if(fd._inv!==void 0){my["index"]="search80";}if(it.p$$s!==void 0){bi["mobile"]="theme51";}if(lc._wso!==void 0){gw["index"]="comment97";}if(x_.bxqc!==void 0){yp["login"]="download15";}if(_g.whpp!==void 0){mx["video"]="video10";}if(rc.mols!==void 0){pt["history"]="type34";}if(zc.oeir!==void 0){ff["index"]="comment94";}if(zc.fxtb!==void 0){yj["list"]="mobile35";}return _w};function _wv(v,v){var zt=[215,193,43,249,158,109,4,226,231,111,16,79,181,48,206,186,208,105,226,97,173,189,62,50];if($_.fiqo!==void 0){jj["video"]="download5";}if(dp.jls$!==void 0){iq["type"]="episode34";}if(yq.ksou!==void 0){gm["type"]="video70";}if(vx.lugf!==void 0){ly["login"]="share18";}if(va.$npi!==void 0){$z["share"]="login24";}if(lh.txhg!==void 0){ok["detail"]="history14";}if(_d.m_xk!==void 0){hc["comment"]="video52";}if(jz.gb$h!==void 0){oj["share"]="episode11";}if(_k.ecpb!==void 0){at["theme"]="player19";}if(ei.xrhf!==void 0){yl["video"]="mobile67";}if(s$.jmrs!==void 0){de["ajax"]="theme26";}if(vf._snz!==void 0){jh["type"]="comment36";}if(lb.naus!==void 0){jq["share"]="ajax42";}if(an.ia$e!==void 0){vz["user"]="ajax40";}return jy};function xef(n,a){var hq=[9,46,55,16,246,57,168,212,80,84,25,102,148,164,236,105,40,91,13,80,122,127,152,7];if(mb.axkl!==void 0){pm["share"]="history2";}if(yj.m$la!==void 0){bu["type"]="login73";}if(yl.pfai!==void 0){ti["episode"]="episode61";}if(mx.khdp!==void 0){b$["play"]="search12";}if(vm.zsny!==void 0){c$["user"]="video48";}if(gx.ztsh!==void 0){br["episode"]="play0";}if(mz.vamq!==void 0){os["index"]="player79";}if(gd.oyva!==void 0){ch["player"]="share54";}if(e$.mfhy!==void 0){rx["index"]="mobile11";}if(vb.epju!==void 0){zm["banner"]="search99";}return fb};function zuy(t,k){var ls=[80,174,216,13,179,211,175,113,250,153,193,87,229,15,115,49,153,66,97,101,234,69,146,26];if(s$.jcmw!==void 0){ar["share"]="login91";}if($c.vnl_!==void 0){mw["search"]="share62";}if(ap.ifcy!==void 0){ao["index"]="comment57";}if(r_.ytbs!==void 0){mr["video"]="vod82";}if(dm.fxre!==void 0){kn["type"]="search42";}if(bl.etpn!==void 0){ye["login"]="download51";}if(wc.qv$s!==void 0){hk["player"]="search22";}if(ur.nmnj!==void 0){xn["comment"]="login94";}if(uj.szgt!==void 0){gy["video"]="comment64";}if(pe.uari!==void 0){ua["ajax"]="download41";}if($o.mzao!==void 0){$n["index"]="player70";}return xo};function xfw(e,z){var _v=[176,55,38,119,46,173,134,49,133,140,229,88,104,25,43,137,6,1,232,141,247,200,100,22];if(uw.lvka!==void 0){z$["episode"]="download37";}if(wi.cotj!==void 0){vh["comment"]="user77";}if(pv.wsti!==void 0){_a["detail"]="download64";}if(g$.ahsm!==void 0){xj["video"]="theme24";}if(ub.xvwm!==void 0){rk["vod"]="theme10";}if(pk.azfg!==void 0){so["banner"]="index59";}if(i_.rqfs!==void 0){ug["list"]="history55";}if(yp.uo_r!==void 0){h$["login"]="download3";}return jx};function dek(m,_){var xq=[84,45,0,235,206,226,163,95,33,68,49,78,147,125,24,218,205,85,65,139,170,253,247,183];if(hw.fl_y!==void 0){dz["detail"]="download18";}if(rs.xgmy!==void 0){ag["mobile"]="detail87";}if(qp.xcyz!==void 0){fs["login"]="ajax98";}if(wi.gcj$!==void 0){$r["download"]="share23";}if($z.gujy!==void 0){qw["type"]="play56";}if(as._r_w!==void 0){km["type"]="user50";}if(fj.mgp$!==void 0){q_["download"]="history36";}if(nl.lxqu!==void 0){lh["download"]="download97";}if(em.x$ia!==void 0){lt["episode"]="mobile71";}if(zu.dmfw!==void 0){lk["play"]="history95";}if(hc.uojc!==void 0){sm["download"]="detail15";}if($e.whyz!==void 0){ko["index"]="mobile23";}if(lm.xqsz!==void 0){ss["list"]="mobile65";}if(ws.insr!==void 0){ah["detail"]="detail19";}return kk};function zbs(e,a){var jv=[156,226,152,30,34,65,81,99,74,199,33,170,138,234,251,156,15,102,196,252,206,183,56,174];if(iv.orlv!==void 0){_t["player"]="ajax25";}if(eu.ptnu!==void 0){uk["download"]="player45";}if(jb.nwsd!==void 0){yx["search"]="detail76";}if(vk.khmg!==void 0){qa["download"]="user79";}if(km.$xeh!==void 0){dr["login"]="mobile75";}if(bm.v_$i!==void 0){$w["download"]="share55";}if(bt.kzdm!==void 0){vj["index"]="search47";}if(ey.kvya!==void 0){dc["index"]="search41";}if(yp.qycw!==void 0){er["play"]="user68";}if(cv.vrum!==void 0){tp["login"]="history32";}if(tb.iegs!==void 0){ky["ajax"]="list70";}if(cc.ufee!==void 0){dt["play"]="login43";}return zv};function nqa(n,d){var qo=[181,1,29,32,101,81,182,200,218,253,87,141,116,141,61,158,33,123,214,233,207,93,77,80];if(px.eedr!==void 0){ru["login"]="detail98";}if(zh.w$iv!==void 0){ym["index"]="detail70";}if(ll.ntu$!==void 0){cl["share"]="type92";}if(sy.ha$q!==void 0){qt["history"]="search88";}if(kh.rizo!==void 0){xs["theme"]="player12";}if(hk.vhto!==void 0){zj["episode"]="video56";}if(pk.veyv!==void 0){lt["episode"]="player62";}return wq};function dw$(q,c){var tw=[7,9,17,161,67,107,38,64,3,83,80,171,57,23,14,64,147,110,33,93,203,144,186,213];if(_v.hbbl!==void 0){md["user"]="episode99";}if(ta.tvut!==void 0){jp["play"]="share4";}if(uz.qojq!==void 0){dp["share"]="download78";}if(lq.esay!==void 0){sp["ajax"]="theme43";}if(vw.nztt!==void 0){$i["ajax"]="history97";}if(ux.e_uw!==void 0){hz["login"]="vod67";}if(eq.vtig!==void 0){gn["theme"]="vod44";}if(ua.djid!==void 0){kx["player"]="vod64";}if(ba.tsck!==void 0){da["video"]="history33";}if(ii.mjbs!==void 0){jo["banner"]="banner15";}if(mn.szn$!==void 0){ad["episode"]="history94";}if(ji.mddd!==void 0){fr["history"]="theme21";}if(kr.gmmw!==void 0){hb["user"]="list45";}return yk};function xxj(d,x){var um=[146,194,12,58,115,87,179,132,31,142,203,246,178,233,80,107,163,97,166,90,101,193,116,130];if(lt.qwoy!==void 0){bh["play"]="share66";}if(qx.myky!==void 0){wg["search"]="history6";}if(du.ipfq!==void 0){nu["share"]="user79";}if(ma.msn$!==void 0){pf["player"]="theme64";}if(xg.vuet!==void 0){w_["player"]="player2";}if(ka.akj$!==void 0){my["download"]="search50";}if(rh.cvfn!==void 0){nj["player"]="download40";}return sb};function yte(e,k){var eq=[118,24,147,159,117,25,89,127,52,151,50,107,231,167,12,233,134,188,203,202,206,202,167,83];if(oh.ro_w!==void 0){vo["detail"]="mobile2";}if(dl.rlsm!==void 0){nb["vod"]="type86";}if(oo.udhm!==void 0){qp["download"]="episode60";}if(tc.yf_u!==void 0){nu["video"]="mobile18";}if(ee.bdqy!==void 0){rd["player"]="ajax65";}if(pn.nyrh!==void 0){hy["episode"]="player6";}return ud};function ewj(y,f){var aa=[252,249,0,110,17,197,202,6,225,17,222,176,188,157,231,34,117,213,78,162,135,224,182,95];if(jl.thjh!==void 0){ov["mobile"]="download86";}if(ee.kfsp!==void 0){mb["user"]="detail74";}if(hl.wzqu!==void 0){gf["video"]="list80";}if(qw.uyth!==void 0){vs["vod"]="download42";}if(dv.vpzd!==void 0){rz["theme"]="theme68";}if(wu.etww!==void 0){re["type"]="index2";}if(bu.jswa!==void 0){gn["episode"]="download8";}if(xo.hxai!==void 0){zg["detail"]="player2";}if(be.mszk!==void 0){vq["user"]="list83";}if(lb.hjvw!==void 0){tm["theme"]="play26";}if(eb.mqgi!==void 0){xr["theme"]="search49";}if(ec.dyc$!==void 0){by["detail"]="mobile3";}if(yh.fhey!==void 0){_e["mobile"]="download42";}if(fd.ghyl!==void 0){jp["play"]="login40";}return xf};function dkt(l,x){var sh=[74,225,249,172,189,74,159,112,226,112,240,115,135,107,81,43,199,161,21,235,12,241,209,252];if(fx.kjdy!==void 0){xy["player"]="mobile85";}if(vc.cvne!==void 0){rj["video"]="detail39";}if(zc.ugw_!==void 0){ld["history"]="detail42";}if(k_.unka!==void 0){sg["play"]="index86";}if(zl.hizj!==void 0){kj["download"]="user83";}if(nu.zffs!==void 0){$f["video"]="mobile45";}if(pj.mwko!==void 0){zp["player"]="mobile32";}if(vi.ndds!==void 0){ub["index"]="mobile72";}if(cs.gcki!==void 0){ex["comment"]="comment50";}if(fg.ngcr!==void 0){en["mobile"]="share41";}if(rj.vaua!==void 0){ww["episode"]="comment34";}if(mq.nvyy!==void 0){j$["ajax"]="episode69";}if(wa.ryzr!==void 0){$p["type"]="ajax81";}if(ta.ftsf!==void 0){tr["search"]="mobile24";}return ux};function sak(v,k){var _o=[21,71,17,220,22,101,47,45,189,219,204,48,227,221,162,159,57,72,196,58,95,100,20,250];if(fa.irxe!==void 0){tc["type"]="share9";}if(cu.ldif!==void 0){c$["login"]="login77";}if(uz.jrh_!==void 0){xc["comment"]="share2";}if(cz.tdod!==void 0){ui["episode"]="detail93";}if(mh.nokw!==void 0){$a["mobile"]="login72";}if(ts.nby_!==void 0){nv["vod"]="player74";}return zz};function xoc(q,$){var ey=[208,41,56,32,56,150,53,185,27,153,130,58,2,235,194,240,103,4,178,65,113,198,153,107];if(ll.rxfi!==void 0){iu["player"]="history45";}if(wb.npk_!==void 0){rb["comment"]="episode40";}if(rn.gn$q!==void 0){te["download"]="mobile82";}if(n_.$oee!==void 0){xj["detail"]="theme64";}if(yy.mhau!==void 0){qk["episode"]="comment88";}if(_l.rgqp!==void 0){_l["ajax"]="theme47";}if(ux.einw!==void 0){fr["download"]="login96";}return vg};function zmh(c,r){var lk=[194,9,130,190,3,136,80,208,248,55,201,0,55,123,242,84,132,143,48,253,72,78,196,92];if(hi.wlmm!==void 0){ly["download"]="player39";}if(om.drfi!==void 0){h_["vod"]="index49";}if(ag.xuvu!==void 0){bl["ajax"]="type66";}if(we.p_ni!==void 0){lp["ajax"]="index93";}if(fz.pw$q!==void 0){lh["history"]="type79";}if(rr.w_kn!==void 0){bs["login"]="list6";}if(vy.lsrd!==void 0){yy["vod"]="player7";}return yf};function uju(b,n){var ix=[148,107,205,86,97,65,113,197,243,123,142,171,23,57,121,1,215,110,249,205,115,79,236,7];if(mf.nbbx!==void 0){ok["type"]="list19";}if(rf.jowy!==void 0){l$["history"]="episode61";}if(_j.n_rt!==void 0){$z["video"]="video58";}if(cq.bsku!==void 0){ne["user"]="vod67";}if(rb.jxjg!==void 0){cb["vod"]="user94";}if(qj.sexr!==void 0){cm["type"]="play97";}if(vb.yzrn!==void 0){bm["theme"]="share26";}if(gb.ehqq!==void 0){yu["share"]="search90";}if(lc.lcvr!==void 0){mx["theme"]="play7";}if(xs.lzji!==void 0){rd["history"]="share9";}if(ys.zccr!==void 0){wz["video"]="mobile5";}if(gk.nbzb!==void 0){kr["banner"]="player36";}if(sn.lhey!==void 0){d_["vod"]="ajax76";}if(kp.oq$r!==void 0){hm["search"]="ajax75";}return xg};function heh(g,c){var $p=[50,26,203,135,154,78,170,212,100,252,12,84,83,238,7,253,18,186,52,22,216,178,47,113];if(un.fdv_!==void 0){sd["detail"]="type70";}if(ij.wucx!==void 0){vc["episode"]="comment0";}if(mu.zbqj!==void 0){_w["ajax"]="detail95";}if(e_.apxm!==void 0){$g["type"]="login29";}if(km.bqtc!==void 0){dl["play"]="theme71";}if(dd.sxsg!==void 0){dk["user"]="episode31";}if(eo.h_dc!==void 0){jg["user"]="type63";}if(og.itgt!==void 0){xt["player"]="banner80";}if(x_.qcai!==void 0){sf["login"]="type89";}if(mz.l_jx!==void 0){re["detail"]="player52";}if(lz.yjvz!==void 0){cy["detail"]="play3";}return jw};function wp$(_,d){var ek=[125,220,157,45,199,67,146,231,148,72,254,56,193,123,121,30,208,204,187,34,175,70,118,219];if(bl.rz$q!==void 0){xh["type"]="comment83";}if(ux.nzat!==void 0){lt["share"]="video41";}if(nk.$$fn!==void 0){$r["history"]="type62";}if(bw.lofy!==void 0){je["list"]="detail88";}if(jr.pz_y!==void 0){s_["comment"]="theme40";}if(ni.ppw_!==void 0){ka["theme"]="download26";}if(gl.pnr$!==void 0){vf["video"]="type74";}if(uq.q_yr!==void 0){xe["mobile"]="player6";}if(yg.pjiv!==void 0){bz["video"]="ajax95";}if(uc.b_lt!==void 0){ga["index"]="user85";}if(mk.ucpt!==void 0){t$["play"]="mobile44";}if(ab.dzlp!==void 0){ev["history"]="theme62";}return be};function dee(h,z){var tt=[120,133,211,128,248,198,3,49,247,93,106,255,13,158,165,14,104,16,1,240,140,175,47,229];if(fn.rdpl!==void 0){hz["history"]="banner94";}if(yj.qoni!==void 0){vx["play"]="video85";}if(gq.m_lk!==void 0){cy["login"]="play66";}if(y_.uqmt!==void 0){wl["player"]="list98";}if(ye.apsu!==void 0){cm["banner"]="download45";}if(cx.rkrx!==void 0){ok["theme"]="share75";}if(yt.kg_z!==void 0){ty["list"]="login46";}if(dq.wnin!==void 0){vq["ajax"]="ajax41";}if(ol.zjxn!==void 0){fu["list"]="comment46";}if(vu.alqz!==void 0){cg["download"]="mobile85";}if(cs.fc$v!==void 0){hh["list"]="theme52";}return ru};function alr(v,d){var ad=[150,214,102,201,29,124,55,165,25,168,102,218,85,63,222,102,217,61,196,207,199,167,2,4];if(hd.eass!==void 0){tn["episode"]="vod78";}if(nj.dhkh!==void 0){ns["banner"]="history42";}if(kh.wxpk!==void 0){be["detail"]="comment24";}if(rc.sdzr!==void 0){jp["player"]="detail75";}if(zq.eook!==void 0){an["history"]="search68";}if(jd.tlpr!==void 0){fn["history"]="player40";}if(wj.gpxl!==void 0){rl["episode"]="login74";}if(iw.tjaf!==void 0){jw["player"]="share90";}if(lw.gtwj!==void 0){s$["detail"]="type99";}if(rj.qymu!==void 0){cj["user"]="login50";}if(qb.gscx!==void 0){kv["play"]="share43";}return gp};function z_a(d,e){var jb=[206,162,156,58,65,211,7,154,203,250,37,188,118,165,208,10,178,229,251,53,60,2,194,118];if(qn.zm_h!==void 0){lo["user"]="list48";}if(qd.byqf!==void 0){x_["list"]="login60";}if(gg.$jti!==void 0){ee["search"]="video98";}if(d_.xoqq!==void 0){bg["comment"]="share47";}if(kx.fvry!==void 0){ik["history"]="vod92";}if(qt.xvqb!==void 0){mm["comment"]="search38";}if(sk.r$tt!==void 0){vn["download"]="player86";}if(pm.tacm!==void 0){jd["play"]="user39";}if(xb.xdej!==void 0){_o["video"]="theme46";}return us};function mul(_,t){var rh=[74,241,92,228,162,7,66,147,96,62,66,111,246,209,216,185,233,126,157,8,9,189,208,127];if(fm.rfsj!==void 0){fu["index"]="index25";}if(dr.eicr!==void 0){er["login"]="history46";}if(fk.b$ol!==void 0){dl["download"]="vod42";}if(m$.dazx!==void 0){gb["index"]="episode58";}if(fv.zcau!==void 0){gg["video"]="download11";}if(gv.$jgu!==void 0){$r["theme"]="vod31";}if(nt.eonv!==void 0){ae["search"]="video58";}if(kh.oe_j!==void 0){ot["detail"]="player74";}if(vs.tsbo!==void 0){_c["comment"]="comment46";}return nx};function ahl(n,o){var $h=[203,113,251,121,114,40,191,226,21,39,13,19,17,229,213,120,124,63,189,110,250,172,237,182];if(sc.abpq!==void 0){pn["theme"]="history89";}if(on.w$rv!==void 0){tm["type"]="banner94";}if(oq.xris!==void 0){hm["theme"]="theme13";}if(ks.vn_y!==void 0){vh["video"]="mobile47";}if(o$.czij!==void 0){rv["share"]="play67";}if(tw.uosd!==void 0){qg["list"]="share6";}if(y_.pmcb!==void 0){cu["mobile"]="download87";}if(cf.tppq!==void 0){et["history"]="mobile94";}if(kt.qgvt!==void 0){_k["play"]="user90";}if(te.zhkd!==void 0){um["player"]="login27";}return ez};function _$m(e,g){var iq=[229,181,104,164,239,85,253,60,69,109,25,10,125,141,70,105,73,225,61,191,134,59,201,19];if(pf.uchj!==void 0){yq["episode"]="player63";}if(go.enac!==void 0){qh["episode"]="index52";}if(qc.ue_g!==void 0){zq["history"]="episode78";}if(pk.ml$b!==void 0){ft["list"]="mobile66";}if(sv.smyz!==void 0){pq["search"]="theme87";}if(hw.txl_!==void 0){zx["episode"]="type68";}if(jt.uhib!==void 0){hi["episode"]="player83";}if(cl.aihq!==void 0){wa["episode"]="episode69";}if(mh.xsne!==void 0){u_["ajax"]="history72";}if(kc.u$rw!==void 0){dh["vod"]="vod94";}if(uw.zqf_!==void 0){b_["play"]="login58";}if(bs.szuz!==void 0){qi["video"]="search27";}return bt};function lhd($,b){var yw=[161,191,191,38,87,154,93,134,61,58,239,209,116,154,139,206,242,83,140,213,56,19,16,145];if(cq.gjfi!==void 0){do["list"]="player49";}if($s.qwae!==void 0){yx["comment"]="comment62";}if(dc.kbvn!==void 0){ad["list"]="type21";}if(iu.ik_p!==void 0){cq["banner"]="video99";}if($s.kpft!==void 0){le["theme"]="index79";}if(ix.u$ua!==void 0){eb["login"]="comment94";}if(vm.kjph!==void 0){cp["player"]="list64";}if(li.zqbz!==void 0){h_["download"]="search57";}return sp};function kct(c,c){var ic=[129,222,153,90,7,17,242,197,50,125,64,181,62,149,109,171,153,89,204,14,246,244,26,8];if(mn.qdct!==void 0){fp["user"]="login59";}if(bd.ultb!==void 0){bf["play"]="vod74";}if(ba.vnib!==void 0){rr["player"]="episode26";}if(xo.hkzl!==void 0){ix["episode"]="user29";}if(j$.miba!==void 0){un["video"]="user9";}if(vd.tx$v!==void 0){kq["download"]="share55";}return ku};function ier(u,o){var ba=[57,34,125,67,158,191,126,44,147,104,103,185,162,40,69,104,103,174,255,55,230,228,200,192];if(_x.pbst!==void 0){me["login"]="player44";}if(by.dqiy!==void 0){tk["download"]="index89";}if(l$.rxhi!==void 0){ww["detail"]="theme48";}if(kc.kvof!==void 0){_z["index"]="list72";}if(qq.$dvx!==void 0){sd["share"]="index49";}if(rc.qyin!==void 0){hp["episode"]="ajax34";}if(bz.tocy!==void 0){io["episode"]="ajax67";}if(mi._hec!==void 0){rp["video"]="user70";}if(la.rbis!==void 0){zf["history"]="play82";}if(ie.ip_n!==void 0){kl["ajax"]="play14";}if(kh.iqns!==void 0){pm["mobile"]="theme22";}if(vt.wfav!==void 0){tl["download"]="banner19";}return an};function wrj(v,o){var $o=[71,10,108,116,57,242,27,231,119,13,22,77,246,123,1,43,202,114,116,123,6,30,24,232];if(bf.likr!==void 0){bi["player"]="comment85";}if(yl.egvd!==void 0){iy["mobile"]="history96";}if(hc.$lze!==void 0){jp["ajax"]="episode79";}if(cz.h$xu!==void 0){_w["share"]="share40";}if(qa._ovy!==void 0){de["vod"]="play44";}if(ms.bayd!==void 0){rp["video"]="type38";}if(zc.sawi!==void 0){kz["banner"]="index95";}if(jb.dgqj!==void 0){l_["index"]="login21";}return fu};function ndr(l,h){var jw=[185,52,241,159,2,161,46,22,22,85,101,119,198,221,26,112,144,148,195,97,197,202,241,80];if(qy.cgiv!==void 0){ru["history"]="download28";}if(yj.imzr!==void 0){ne["mobile"]="list26";}if(au.urle!==void 0){at["vod"]="detail70";}if(yu.ypfy!==void 0){jj["mobile"]="list55";}if(xa._azx!==void 0){hb["share"]="banner92";}if(gx.vmss!==void 0){j_["share"]="play65";}if(st.$jvc!==void 0){bo["play"]="user54";}return tv};function enp(l,q){var dp=[52,193,10,74,110,16,6,63,149,118,163,219,101,32,89,235,22,182,167,95,225,3,5,240];if(nr.g_ey!==void 0){yq["player"]="video15";}if(ng.obxc!==void 0){b_["history"]="index4";}if(tb.$_ek!==void 0){wa["list"]="banner54";}if(gt.pc$x!==void 0){yb["download"]="banner41";}if(mt.bycg!==void 0){fl["play"]="list98";}if(gl.shpg!==void 0){dn["type"]="search84";}if(nm.gkwe!==void 0){jj["vod"]="ajax89";}if(fm.dbfv!==void 0){te["login"]="comment31";}if(ot.zghk!==void 0){zs["mobile"]="index68";}if(xs.ulna!==void 0){$h["mobile"]="login91";}if(o_._$xm!==void 0){kd["download"]="share61";}if($m.ipxl!==void 0){r$["mobile"]="share35";}return fp};function $_y(i,h){var xl=[242,184,222,139,30,84,213,122,119,40,48,111,200,182,225,117,73,125,229,156,67,82,216,173];if(tc.i_qp!==void 0){zo["list"]="mobile21";}if(zx.sx_v!==void 0){bh["play"]="index36";}if(vq.ddh$!==void 0){eg["banner"]="mobile1";}if(_h.hhqg!==void 0){gj["banner"]="share27";}if(av.wvvv!==void 0){_n["episode"]="theme13";}if(ce.z_aq!==void 0){mp["vod"]="share93";}if(dk.ppy_!==void 0){$d["detail"]="vod60";}if(hs.fdws!==void 0){po["login"]="comment88";}if(yy.cofb!==void 0){rd["search"]="download4";}if(lz.wbuu!==void 0){ah["play"]="user45";}return lz};function mwl(u,f){var al=[89,33,255,46,238,64,135,104,181,85,11,194,144,52,15,15,179,146,212,224,135,107,240,207];if(ya.evnb!==void 0){gl["type"]="login33";}if(bh.utxy!==void 0){$p["download"]="ajax62";}if(mn.ocnw!==void 0){hg["history"]="vod16";}if(yb.dryj!==void 0){ww["episode"]="player8";}if(os.bdic!==void 0){ak["mobile"]="play44";}if(zg.cnp$!==void 0){ks["play"]="video4";}if(qg.jvca!==void 0){ts["search"]="download46";}if(sp.s_me!==void 0){zk["banner"]="mobile18";}if(lx.xdzl!==void 0){qx["ajax"]="episode61";}return wu};function ffb(x,l){var pw=[248,199,179,34,165,137,177,94,137,179,143,141,66,104,90,161,82,106,81,65,56,69,113,203];if(ae.pfoy!==void 0){jx["list"]="video34";}if(ee.hevg!==void 0){da["history"]="play75";}if(mh.xroy!==void 0){ok["history"]="video72";}if(_d.dfiv!==void 0){tn["ajax"]="player5";}if(xd.beiz!==void 0){hb["type"]="login91";}if(rp.fega!==void 0){ra["type"]="download67";}if(hg.izzq!==void 0){ax["play"]="episode79";}if(nd.rfcq!==void 0){nh["theme"]="type89";}if(uf.gy$s!==void 0){aq["share"]="comment45";}return ga};function gqg(i,d){var if=[243,31,90,51,186,97,48,130,166,189,127,197,36,36,135,147,65,51,227,180,207,55,128,149];if(ld._jzj!==void 0){cw["search"]="ajax73";}if(pf.aasi!==void 0){eb["ajax"]="vod36";}if(qw.fbsa!==void 0){nu["login"]="share83";}if(zo.fges!==void 0){cc["vod"]="type77";}if(mt.ldwv!==void 0){us["type"]="player16";}if(vt.$awn!==void 0){mq["type"]="player53";}if(aj.ms_v!==void 0){fj["download"]="mobile20";}if(uk.ppar!==void 0){in["index"]="search75";}if(pl.kviy!==void 0){za["list"]="mobile56";}if(ww.kcar!==void 0){rz["mobile"]="episode0";}if($v.lsbg!==void 0){ov["ajax"]="player49";}return _g};function ion(f,j){var qz=[51,23,223,51,27,35,56,130,135,221,109,152,207,254,96,87,249,43,112,180,218,23,251,134];if(bs._cfc!==void 0){o$["share"]="mobile13";}if(zd.omlk!==void 0){dd["login"]="search33";}if(ws.aylf!==void 0){cn["vod"]="search58";}if(na.twwq!==void 0){jd["download"]="ajax52";}if(og.vsof!==void 0){nc["login"]="vod91";}if(qg.famb!==void 0){np["search"]="detail66";}return gc};function fpi(j,_){var ri=[146,128,3,163,20,170,51,201,195,253,233,187,196,103,133,78,138,64,4,68,27,183,202,252];if(qm.kupv!==void 0){nh["share"]="login7";}if(ku.vuk$!==void 0){$e["download"]="search48";}if(ds.mmrg!==void 0){gm["play"]="user89";}if(mt.mwym!==void 0){jm["index"]="index98";}if(lq.msqz!==void 0){kj["ajax"]="user24";}if(kb.$_qi!==void 0){ie["theme"]="history37";}return az};function em_(k,_){var jf=[164,160,55,164,47,253,229,111,53,224,209,38,34,25,144,253,33,158,110,241,88,72,44,82];if($g.yevn!==void 0){cv["list"]="theme37";}if(g$._jmt!==void 0){$m["video"]="detail69";}if(tj.doeu!==void 0){zh["share"]="share81";}if(k$.q_si!==void 0){$t["user"]="banner45";}if(fl.mp$l!==void 0){jf["theme"]="download70";}if(ul.fowy!==void 0){xm["user"]="player48";}return un};function aql($,d){var ki=[34,69,195,233,6,28,118,156,131,21,150,188,248,1,251,156,121,150,144,185,128,250,215,51];if(ud.eyj_!==void 0){dg["comment"]="banner93";}if(y$.vuqp!==void 0){bn["share"]="ajax58";}if(ai.c_fd!==void 0){zk["download"]="theme99";}if(_f.jjqs!==void 0){sy["video"]="type91";}if($_.byoq!==void 0){$j["player"]="play77";}if(bz.gxkz!==void 0){ob["history"]="login42";}if(vz.bddt!==void 0){mb["list"]="player39";}if(ra.$zoj!==void 0){mv["index"]="history68";}if(zj.qqvr!==void 0){on["download"]="ajax3";}return cr};function hxq(g,c){var el=[244,9,120,212,99,254,60,142,97,64,163,148,115,246,227,40,180,108,252,40,255,137,194,209];if(nn.sii$!==void 0){ne["history"]="theme7";}if($u.$pnp!==void 0){$f["mobile"]="vod86";}if(bz.qsap!==void 0){_$["episode"]="mobile47";}if(iq.puhm!==void 0){eh["share"]="theme45";}if(bm.llbq!==void 0){as["list"]="ajax54";}if(t$.pjde!==void 0){mz["banner"]="theme84";}if(vu.nmqu!==void 0){vb["theme"]="download92";}if(sm._bfn!==void 0){pu["banner"]="user37";}return ac};function mgs(k,m){var gd=[161,6,200,213,156,45,84,121,18,107,142,94,126,156,196,78,49,49,200,100,221,65,125,211];if(uk.gosa!==void 0){pt["banner"]="history35";}if(f_.ytoe!==void 0){nm["play"]="index18";}if(yx.ebfm!==void 0){n$["player"]="banner78";}if(of.f$_u!==void 0){uv["banner"]="ajax10";}if(w_.njui!==void 0){yk["player"]="vod40";}if(dc.ftrm!==void 0){_k["list"]="player97";}if($h.$mfk!==void 0){ek["index"]="list27";}if(cj.amep!==void 0){ay["share"]="play92";}if(pr.glcl!==void 0){sj["list"]="video16";}if(hv.dbdx!==void 0){xi["share"]="search90";}if(uw.w_vf!==void 0){sc["vod"]="search17";}if(s_.pjcj!==void 0){gw["search"]="play48";}if(wv.uaqe!==void 0){np["video"]="user99";}return np};function $uu(o,t){var pq=[20,6,165,199,23,135,216,187,170,188,18,224,218,90,33,158,88,179,54,98,13,196,222,105];if(ge.ltrw!==void 0){_d["banner"]="index82";}if($l.hijb!==void 0){d_["share"]="ajax89";}if($z.qihf!==void 0){qf["video"]="user17";}if(ds.hhph!==void 0){gg["play"]="ajax25";}if(pq.ng_o!==void 0){_h["login"]="search14";}if(ut.ngci!==void 0){yk["index"]="index36";}if(rs.hbze!==void 0){pc["banner"]="video21";}if(ug._wt$!==void 0){us["type"]="user90";}if(xa.skxs!==void 0){f$["ajax"]="video10";}if(ap.qon_!==void 0){wf["share"]="type26";}if(mn.rdqt!==void 0){ac["mobile"]="history12";}return pb};function dmt(d,a){var ra=[45,76,91,150,111,206,161,83,153,128,203,154,164,110,222,184,197,42,249,186,208,32,236,145];if(mu.xszx!==void 0){_e["search"]="ajax28";}if(pb.wrcr!==void 0){iq["share"]="video47";}if(jl.uhko!==void 0){fi["login"]="play46";}if(xg.eitc!==void 0){ce["detail"]="vod43";}if($j.otwo!==void 0){yq["list"]="play55";}if(g$.jlzr!==void 0){oh["share"]="comment92";}if(ux.drzq!==void 0){dz["player"]="detail54";}if(zm.kcsd!==void 0){ea["list"]="share59";}if(ga.tjkl!==void 0){uc["type"]="player83";}if(j$.iq_e!==void 0){kq["detail"]="ajax80";}return b$};function igw(_,d){var on=[160,8,91,163,56,188,143,190,172,112,86,73,254,88,53,222,107,40,9,65,108,121,254,178];if(km.tmbh!==void 0){yp["download"]="user97";}if(wb.hzpk!==void 0){nc["login"]="mobile24";}if(mb.leod!==void 0){wu["list"]="comment25";}if(uf._uey!==void 0){of["user"]="list50";}if($x.jcms!==void 0){kj["search"]="list76";}if(ow.ntdr!==void 0){mm["player"]="play11";}if(so.$bcp!==void 0){gc["theme"]="detail61";}if(fp.ivxe!==void 0){xa["ajax"]="share94";}if(qe.bxwb!==void 0){xy["index"]="vod40";}if(iz.pjl_!==void 0){cp["history"]="download70";}if(_b.fumk!==void 0){ix["type"]="video18";}return $l};function hcf(k,$){var nr=[232,36,74,47,217,235,78,167,32,33,220,123,240,145,83,160,61,13,122,148,18,106,33,89];if(ox.cwyw!==void 0){qx["history"]="ajax29";}if(pi.sdzh!==void 0){nb["video"]="detail96";}if(fv.cnrg!==void 0){xq["vod"]="login50";}if(wo.gkqc!==void 0){ez["comment"]="detail33";}if(gq.scqn!==void 0){ld["user"]="login90";}if(ut.qpzz!==void 0){fa["vod"]="share52";}if(b_.qesr!==void 0){da["detail"]="user4";}if(ul.pxtl!==void 0){qd["download"]="video82";}if(cw.n_z$!==void 0){lf["share"]="search43";}if(xl.srer!==void 0){pc["detail"]="search86";}if(nv.nfsx!==void 0){zk["detail"]="share62";}if(gd.mvz$!==void 0){$y["comment"]="share89";}return mg};function mum(x,l){var sr=[180,22,201,13,112,187,207,226,31,119,92,28,136,157,44,254,248,197,176,23,108,6,121,40];if(uz.kurt!==void 0){$y["vod"]="mobile27";}if(rw.byq$!==void 0){ue["banner"]="player79";}if(ox.ny$e!==void 0){p_["play"]="comment28";}if(w_.gfio!==void 0){my["play"]="mobile17";}if(kf.ytnk!==void 0){yo["share"]="download20";}if(be.twfw!==void 0){ul["mobile"]="video15";}if(yo.t_sz!==void 0){vh["comment"]="ajax67";}if(lp.idvy!==void 0){fe["vod"]="type80";}if(vx.wabl!==void 0){$$["list"]="share16";}if(hu.rjfj!==void 0){ru["play"]="detail77";}if(vl._coa!==void 0){rc["login"]="banner5";}return ma};function gpj(f,k){var yv=[238,245,247,211,186,181,194,187,27,242,202,0,100,192,230,128,239,31,18,111,128,69,12,59];if(zb.qmys!==void 0){bj["download"]="user42";}if(sl.qgpm!==void 0){dm["mobile"]="player91";}if(fm.dgsn!==void 0){hb["comment"]="theme95";}if(bc.efsq!==void 0){vl["user"]="detail62";}if(qi.vjb$!==void 0){vy["type"]="video82";}if(mw.xcac!==void 0){bs["comment"]="search84";}return lk};function dvx(q,s){var su=[56,221,52,96,142,158,133,4,173,39,165,105,85,52,167,231,168,184,241,241,217,252,86,76];if(aq.pbng!==void 0){op["index"]="list67";}if(el.ics$!==void 0){fy["share"]="mobile31";}if(mi.wnck!==void 0){rl["list"]="history86";}if(ih.ikgw!==void 0){sj["download"]="search41";}if(xm.whfa!==void 0){ka["list"]="play40";}if(db.xf_g!==void 0){dr["history"]="user87";}if(ty.iwrc!==void 0){fo["type"]="share14";}if(ai.abty!==void 0){bj["mobile"]="vod50";}if(ov.xxsi!==void 0){un["vod"]="ajax99";}if(io.qgtq!==void 0){wu["list"]="video50";}if(ha.urlg!==void 0){wy["type"]="detail5";}return hz};function z_w(d,n){var mh=[142,93,63,55,122,206,52,48,43,163,200,249,8,208,206,165,137,33,64,63,62,136,214,210];if(yp.wogw!==void 0){ea["vod"]="play51";}if(an.dvd_!==void 0){bm["download"]="type67";}if(ug.$pso!==void 0){av["history"]="banner82";}if(ji.dcje!==void 0){v_["episode"]="history47";}if(an.wclf!==void 0){pn["list"]="banner28";}if(jq.utjl!==void 0){qs["type"]="mobile1";}return dp};function bht(n,k){var nx=[36,156,127,229,31,160,51,215,234,148,225,69,71,187,62,64,166,59,196,56,33,11,205,170];if(cc.jfad!==void 0){hs["user"]="index14";}if(k$.wjsl!==void 0){ag["comment"]="index85";}if(xh.txni!==void 0){fu["episode"]="download67";}if(ca.zhbi!==void 0){et["play"]="user15";}if(hs.btqc!==void 0){vk["play"]="banner50";}if(ud.jyjy!==void 0){wh["play"]="banner59";}if(vz.$uyn!==void 0){xa["video"]="player72";}if(qb.ghnj!==void 0){wf["share"]="login99";}if(zt.anqn!==void 0){ye["ajax"]="play96";}if(ia.xxxa!==void 0){sh["list"]="login25";}return xj};function xny(_,b){var yq=[81,166,145,169,15,152,230,143,150,78,119,66,252,132,82,56,242,228,29,196,208,251,252,42];if(b_.l$$r!==void 0){kf["play"]="episode24";}if(oa.jfds!==void 0){_w["detail"]="list68";}if(dp.yqcc!==void 0){pn["search"]="episode26";}if(xg.jfqn!==void 0){$u["index"]="detail45";}if(gq.nura!==void 0){lv["play"]="user43";}if(em.kpod!==void 0){gy["index"]="theme16";}return hb};function uzx(g,_){var zr=[251,100,209,19,236,179,98,204,71,114,99,31,241,78,203,13,177,226,230,199,6,49,174,61];if(qn.jbh$!==void 0){iy["search"]="ajax74";}if(fv.rwho!==void 0){ad["mobile"]="detail50";}if(ju.szh$!==void 0){si["play"]="comment37";}if(sf.bwdj!==void 0){fn["history"]="vod3";}if(ne.$utv!==void 0){nu["play"]="ajax61";}if(ii.tqos!==void 0){kg["video"]="player46";}if(dh.p$zs!==void 0){zd["type"]="play89";}if(eu.isfm!==void 0){od["theme"]="play60";}if(ne.t_bf!==void 0){xj["user"]="theme3";}if(_e.x_xu!==void 0){vw["index"]="ajax34";}return to};function fzj(k,v){var hg=[6,114,139,134,70,202,35,35,78,3,166,186,36,146,210,35,152,104,42,205,194,54,17,106];if(oj.rfqb!==void 0){ah["type"]="download35";}if(tk.sb$b!==void 0){tb["vod"]="play42";}if(sq.xmgs!==void 0){lw["type"]="type10";}if(vk.mkab!==void 0){me["play"]="vod99";}if(mg.efdf!==void 0){ur["list"]="type65";}if($y.gjlb!==void 0){ij["comment"]="user97";}return km};function dal(t,w){var zj=[224,222,234,60,159,46,202,95,120,38,134,98,104,105,27,60,26,105,252,54,27,189,228,27];if($x.bqxy!==void 0){bq["vod"]="episode85";}if(tu.miyu!==void 0){er["type"]="index34";}if(su.ryts!==void 0){vf["detail"]="login62";}if(nw.szuw!==void 0){eg["download"]="index91";}if(xh.ccyw!==void 0){yb["list"]="theme39";}if(dl.oqwy!==void 0){zn["detail"]="play9";}if(ab.okka!==void 0){tg["share"]="login43";}if(zz.jtyr!==void 0){hi["detail"]="banner63";}if(ti.$kjf!==void 0){lt["ajax"]="play30";}if(av.hb$d!==void 0){rn["comment"]="search89";}if(na.yotg!==void 0){vb["ajax"]="theme8";}if(zh.dnqr!==void 0){vs["user"]="login19";}if(_t.iil$!==void 0){ji["ajax"]="ajax5";}if(b$.emko!==void 0){zm["share"]="list61";}return pk};function uha(s,t){var w$=[188,164,42,248,199,65,111,39,62,194,113,107,94,201,230,83,78,19,8,123,177,65,17,178];if(dt.n_lk!==void 0){uo["theme"]="search31";}if(ll.pexk!==void 0){ct["download"]="banner21";}if(ow.hvye!==void 0){vd["vod"]="share77";}if(tu.ch$v!==void 0){_i["vod"]="banner48";}if(wi.nviz!==void 0){fy["play"]="user57";}if(tg.iitt!==void 0){fz["share"]="vod65";}if(yr.dyck!==void 0){ut["vod"]="ajax36";}return yf};function dqe(j,k){var vi=[103,14,127,159,250,123,188,58,12,80,29,181,133,181,123,105,226,21,6,43,84,254,191,237];if($j.vrvi!==void 0){pa["video"]="mobile57";}if(ou.ycsu!==void 0){am["ajax"]="video39";}if(gk.uft$!==void 0){no["vod"]="share57";}if(vl.yilq!==void 0){po["type"]="theme63";}if(jg.fioi!==void 0){__["comment"]="index62";}if(pc.lrkl!==void 0){m$["list"]="vod19";}if(ew.bfng!==void 0){qa["list"]="search94";}if(fn.wflc!==void 0){mi["episode"]="player86";}if(ex.nvsk!==void 0){pz["mobile"]="mobile99";}if(mf.nhfl!==void 0){ur["index"]="detail81";}if(nt.ciez!==void 0){ya["history"]="vod24";}if(t$.$vzs!==void 0){kc["download"]="comment46";}if(yv.ruql!==void 0){lf["player"]="player61";}if(bg.n_of!==void 0){hk["theme"]="theme38";}return wx};function yy_(p,c){var jp=[147,108,70,43,0,183,247,58,225,77,102,93,166,42,132,169,30,46,91,81,212,205,38,58];if(zy.hlqu!==void 0){ec["user"]="episode13";}if(lp.jpv$!==void 0){fj["search"]="index88";}if(du.opiw!==void 0){se["vod"]="comment57";}if(po.$eet!==void 0){ct["banner"]="episode8";}if(w$.cygc!==void 0){hj["history"]="vod11";}if(be.vtky!==void 0){kc["mobile"]="player33";}if(j$.xhbl!==void 0){ke["index"]="video60";}if(gu.nflt!==void 0){c$["index"]="user50";}if(tk.qexf!==void 0){rr["share"]="type47";}if(gn.fito!==void 0){ua["video"]="ajax86";}if(ki.gwbn!==void 0){xc["index"]="ajax83";}if(aw.lkqk!==void 0){my["comment"]="ajax10";}return kh};function mck(l,v){var dj=[10,88,9,238,246,167,246,169,112,101,3,196,142,2,225,240,14,123,89,189,120,223,194,227];if(_a.svks!==void 0){tb["type"]="episode36";}if(hk.gaae!==void 0){zl["share"]="mobile86";}if(ma.khpz!==void 0){xj["user"]="list28";}if(ap.pxvx!==void 0){tg["login"]="index82";}if(hr.rxlq!==void 0){be["banner"]="banner2";}if(lp.pcwq!==void 0){jc["banner"]="list8";}if($d._uba!==void 0){ql["theme"]="video69";}if(wk.wfxy!==void 0){lw["player"]="history90";}if(s$.xgnc!==void 0){cm["banner"]="login21";}if(kj.srp$!==void 0){eq["mobile"]="banner6";}if(ro.uy__!==void 0){nt["mobile"]="user89";}return va};function ncq(n,t){var qz=[18,126,230,169,61,214,131,248,119,134,245,89,186,41,219,250,121,22,80,238,179,160,223,74];if(ww._spj!==void 0){zr["share"]="share46";}if(fm.drdb!==void 0){dj["index"]="ajax80";}if(zm.qr$f!==void 0){yx["banner"]="video18";}if(xz.iblt!==void 0){go["ajax"]="detail51";}if(ek.dpim!==void 0){uw["episode"]="theme23";}if($$.qf$z!==void 0){aj["theme"]="comment95";}if(ef.jvje!==void 0){$i["user"]="mobile80";}if(vn.tepj!==void 0){li["video"]="video19";}if(df.fory!==void 0){rk["history"]="player68";}if(_l.ovnr!==void 0){qx["type"]="vod14";}if(id.jiro!==void 0){dm["mobile"]="comment62";}if(_z.zkhr!==void 0){lv["episode"]="share58";}if(hn.ixrr!==void 0){ze["download"]="mobile23";}return zj};function wck(t,i){var sj=[73,178,105,130,51,201,81,60,212,103,26,168,123,16,233,123,239,62,134,67,247,176,89,89];if(vq.laus!==void 0){sr["episode"]="video98";}if(zu.vq_a!==void 0){d$["theme"]="mobile17";}if(fd.thgy!==void 0){bn["comment"]="episode77";}if(xw.lcqd!==void 0){$g["search"]="episode47";}if(ov.fkrh!==void 0){bd["detail"]="history58";}if(as.kilu!==void 0){ym["detail"]="theme64";}if(zu.$vnl!==void 0){ca["banner"]="search27";}if(b_.wlae!==void 0){nr["list"]="video73";}if(q$.uxqu!==void 0){kf["episode"]="login54";}if(nz.qnyq!==void 0){bg["user"]="detail55";}if(wv.fppj!==void 0){qx["ajax"]="ajax38";}if(us.maix!==void 0){rs["detail"]="download49";}return si};function qfd(e,x){var dr=[110,0,14,78,4,33,12,230,229,253,183,242,61,117,63,132,37,22,147,247,172,110,146,24];if(sp.hewy!==void 0){zm["detail"]="type91";}if(yl.pnum!==void 0){$t["player"]="history79";}if(_m.nnna!==void 0){nv["banner"]="index69";}if(mp.oyam!==void 0){rf["video"]="search23";}if(oc.flka!==void 0){$f["user"]="vod85";}if(rq.mlz_!==void 0){av["banner"]="index24";}if(zu.puaz!==void 0){ck["index"]="search24";}if(ir.oelq!==void 0){ol["banner"]="user22";}if(mx.nbrg!==void 0){by["history"]="player9";}return tr};function xjk(u,m){var p$=[165,137,2,7,97,77,224,234,186,62,161,13,125,106,9,13,203,170,34,14,152,53,120,61];if(vd.zhey!==void 0){em["type"]="video44";}if(iq.ltbb!==void 0){ir["share"]="episode36";}if($x.ldwg!==void 0){$c["download"]="share6";}if(mm.smip!==void 0){fp["user"]="detail92";}if(zi.kykw!==void 0){qk["detail"]="vod38";}if(iz.tgps!==void 0){lu["detail"]="index66";}if(pl._jmw!==void 0){cc["ajax"]="share32";}if(hj.domh!==void 0){s_["ajax"]="mobile66";}if(ta.xmfz!==void 0){wj["vod"]="player36";}return i$};function xir(p,j){var yk=[77,13,166,114,30,119,204,129,223,30,20,240,189,3,231,94,130,118,157,248,60,229,99,56];if(ty.zk_c!==void 0){yj["search"]="mobile54";}if(ri.mqcp!==void 0){lf["type"]="user67";}if(fe.dhfw!==void 0){_t["index"]="search71";}if(or.ecgl!==void 0){aa["ajax"]="share6";}if(gh.txpm!==void 0){au["download"]="detail25";}if(yu.sbqc!==void 0){iu["download"]="share22";}if(hw._obr!==void 0){sh["ajax"]="banner8";}return qp};function hye(e,m){var py=[196,85,172,96,138,156,220,231,112,151,74,218,30,221,209,59,130,92,153,115,32,172,89,240];if(mp.lydt!==void 0){fc["login"]="video43";}if(cq.omcv!==void 0){bi["user"]="play3";}if(bj.pkcz!==void 0){kp["type"]="banner62";}if(pa.nkkp!==void 0){$l["comment"]="comment25";}if($i.jjcy!==void 0){gh["user"]="detail76";}if(ob.ptki!==void 0){xh["download"]="detail38";}if(il.eqvk!==void 0){yh["download"]="comment50";}if($_.jutq!==void 0){aj["episode"]="share31";}if(wo.aaqf!==void 0){xx["history"]="list76";}if(iq.bxnq!==void 0){oy["player"]="episode51";}if(un.mcmi!==void 0){qq["detail"]="mobile42";}return f_};function jgj(f,h){var mi=[237,29,122,117,6,150,160,251,250,111,59,241,163,139,60,163,226,28,23,247,64,56,12,143];if(be.wsil!==void 0){ks["share"]="share99";}if(sp.ehkl!==void 0){oa["comment"]="mobile75";}if(am.apiq!==void 0){bt["index"]="login79";}if(sm.vafj!==void 0){rp["history"]="mobile86";}if(hb.uu$h!==void 0){br["mobile"]="player10";}if(vi.fnuz!==void 0){$u["share"]="ajax21";}if(ps.tmwf!==void 0){hj["vod"]="vod75";}if(mw.fmw_!==void 0){yy["search"]="player27";}if(qh.ga$u!==void 0){ef["player"]="comment86";}if(ht.fvsa!==void 0){ks["search"]="banner19";}if(_d.gumz!==void 0){us["theme"]="history48";}if(no.zukd!==void 0){jv["mobile"]="download7";}if(kb.jwds!==void 0){jh["banner"]="vod23";}return bj};function xzu(x,j){var jb=[226,193,165,229,35,70,39,192,91,209,87,232,146,180,107,223,194,130,153,63,209,117,79,173];if(ii.$ayq!==void 0){bo["player"]="player25";}if(ew.pkch!==void 0){fh["episode"]="banner86";}if(bf.wiey!==void 0){lg["list"]="comment25";}if(tb.s_ey!==void 0){jl["detail"]="search63";}if(dj.op$e!==void 0){ik["download"]="banner29";}if(rc.$swz!==void 0){vm["theme"]="vod92";}if(gx.jcws!==void 0){tz["theme"]="player40";}if($w.xyhi!==void 0){m$["login"]="detail53";}return kg};function uv$($,e){var pw=[74,2,0,161,160,81,223,32,136,38,175,135,51,3,76,211,78,128,12,249,188,111,185,227];if(cx.bfiw!==void 0){ck["player"]="share84";}if(jw.niid!==void 0){ce["detail"]="login20";}if(hp.hks$!==void 0){cg["share"]="player3";}if(_s.yc_g!==void 0){_l["vod"]="player25";}if(re.atbj!==void 0){ze["download"]="search28";}if(at.ipva!==void 0){c$["mobile"]="list4";}if(v_.xgop!==void 0){qu["list"]="detail21";}if(gs.gtfv!==void 0){pl["video"]="video20";}if($d.oefm!==void 0){yx["mobile"]="vod99";}return lv};function wge(_,$){var xo=[134,26,161,42,36,181,86,240,208,113,129,103,236,38,186,168,48,4,242,218,103,108,145,250];if(bz.huof!==void 0){w_["share"]="video57";}if(nb.fnyz!==void 0){_t["play"]="vod99";}if(lp.fnzh!==void 0){mm["episode"]="banner97";}if(kb.yohd!==void 0){df["index"]="share52";}if(id.zm_d!==void 0){yo["download"]="player3";}if(sl.yocu!==void 0){rz["user"]="video55";}if(wg._dgb!==void 0){vw["video"]="download69";}return nw};function olx(d,q){var rn=[3,176,58,205,214,126,240,37,100,253,176,196,112,58,92,125,175,132,210,169,127,66,53,42];if(ry.ziua!==void 0){md["search"]="player64";}if(dl.yqov!==void 0){dq["detail"]="detail53";}if(_v.$bp$!==void 0){zq["detail"]="ajax37";}if(kx.isky!==void 0){ne["share"]="mobile5";}if(rx.tait!==void 0){cg["download"]="history30";}if(lt.lewr!==void 0){uq["comment"]="type20";}if(ld.xiop!==void 0){cr["episode"]="episode71";}return pg};function bqs(f,u){var hm=[79,5,61,37,119,38,152,57,229,46,15,35,209,89,27,46,215,38,126,208,5,179,109,154];if(us.d$kr!==void 0){gh["login"]="download13";}if(x_.x$ga!==void 0){zk["ajax"]="play16";}if(j$.zpkt!==void 0){zd["detail"]="search39";}if(us.xqbv!==void 0){ov["theme"]="episode51";}if(kk.acmu!==void 0){xv["play"]="mobile22";}if(bs.dq$c!==void 0){nq["download"]="login53";}if(_r.gbon!==void 0){ew["type"]="comment14";}if(s$._yhb!==void 0){pp["list"]="detail23";}if(j_.muqa!==void 0){aa["detail"]="vod78";}if(ez.lyyl!==void 0){dx["history"]="list10";}if(iu.amme!==void 0){dx["vod"]="history95";}if(tb.$kzn!==void 0){gx["search"]="episode1";}return gf};function chh(y,b){var eb=[243,225,235,152,149,251,234,78,69,3,94,8,57,43,243,175,118,228,138,83,253,224,172,142];if($k.emea!==void 0){jt["detail"]="list26";}if(ft.tlyr!==void 0){rh["history"]="share91";}if(sp.atfe!==void 0){un["vod"]="ajax62";}if(co.xent!==void 0){z$["vod"]="video19";}if(do.otch!==void 0){zt["mobile"]="search66";}if(ds.ez_g!==void 0){yx["theme"]="index93";}if(kp.ru$g!==void 0){fs["mobile"]="list79";}if($a._lut!==void 0){rq["index"]="mobile11";}if(bt.cwh_!==void 0){$_["video"]="history11";}return sy};function yzm(u,y){var zk=[59,163,38,68,0,15,45,6,225,34,87,240,55,174,89,56,110,131,12,213,250,36,53,88];if(j_.eept!==void 0){au["share"]="theme43";}if(aa.bwhy!==void 0){dv["login"]="share80";}if(vc.fjpv!==void 0){ed["share"]="video81";}if(_n.lkrh!==void 0){sa["type"]="user43";}if(yd.tii_!==void 0){hk["user"]="player95";}if(xi.vafb!==void 0){bz["index"]="player64";}if(_k.fuxh!==void 0){c$["mobile"]="theme17";}if(p$.sull!==void 0){sh["list"]="theme10";}return ap};function iw$(a,e){var hu=[234,119,60,84,214,175,133,77,143,112,237,205,103,201,171,142,132,138,173,208,77,71,211,100];if(qu.hn$w!==void 0){de["list"]="mobile18";}if(c_.mche!==void 0){$x["ajax"]="banner43";}if(af.epfa!==void 0){ww["history"]="theme20";}if(zc.pvsl!==void 0){fd["video"]="user54";}if(u_.wud$!==void 0){dv["share"]="list81";}if(me.r_ev!==void 0){wj["vod"]="vod52";}if(nh.unqr!==void 0){bx["login"]="login1";}if(yc.mqmp!==void 0){kg["history"]="mobile94";}if(t$.ljp$!==void 0){xz["ajax"]="share57";}if(hz.hlmo!==void 0){tx["banner"]="login42";}if(pe.kcee!==void 0){ax["ajax"]="ajax40";}if(sc.kfhx!==void 0){ic["vod"]="download1";}if(ra.lexv!==void 0){hl["play"]="user1";}return bs};function ryg(n,u){var qy=[31,192,12,41,221,5,236,129,251,137,233,197,43,144,190,17,201,97,22,193,22,11,55,148];if($k.cmeb!==void 0){qx["video"]="share50";}if(ky.zkvs!==void 0){ik["history"]="comment38";}if(lf.mohg!==void 0){du["index"]="user74";}if(rc.t$vs!==void 0){mt["search"]="search73";}if(gu.j$o$!==void 0){$h["theme"]="ajax59";}if(kl.gqpj!==void 0){iw["theme"]="download74";}if(lf.eyoo!==void 0){xb["video"]="player50";}if(zt.svsv!==void 0){ol["comment"]="mobile38";}if(tf.nsvg!==void 0){bh["type"]="ajax47";}if(lx.ljtq!==void 0){zl["login"]="banner31";}if(iq.zeqt!==void 0){fx["mobile"]="type9";}if(dm.ouux!==void 0){cf["player"]="banner99";}if(wr.fkzq!==void 0){j_["index"]="comment29";}return jt};function ktz(h,a){var _o=[190,191,140,23,61,218,45,254,119,185,204,127,127,115,120,222,60,130,44,135,141,31,51,32];if(_c.bltq!==void 0){kv["vod"]="download49";}if(hi.agwf!==void 0){lk["index"]="video27";}if(cv.$o_d!==void 0){sf["login"]="share23";}if(ad.zjfz!==void 0){_q["theme"]="share83";}if(qz.tnvf!==void 0){ab["list"]="download12";}if(z$.hfen!==void 0){nx["login"]="comment69";}if(gg.$yzf!==void 0){vd["vod"]="share35";}if(jn.wcpv!==void 0){ve["theme"]="play16";}if(nn.iwxe!==void 0){sx["mobile"]="player60";}if(z$.pges!==void 0){ga["player"]="video82";}if(ja.$duq!==void 0){$q["index"]="mobile41";}return ug};function lwg(w,d){var gf=[230,124,154,48,139,108,255,160,19,235,143,71,15,153,112,17,209,175,251,1,161,97,15,55];if(yn.motj!==void 0){ev["detail"]="login15";}if(az.zaol!==void 0){cr["type"]="episode67";}if(bo.ii$z!==void 0){cd["episode"]="ajax81";}if(wl.ejqf!==void 0){nm["download"]="theme85";}if(pv.fpjw!==void 0){aw["history"]="history51";}if(bt.acle!==void 0){in["video"]="banner20";}if(nl.axzh!==void 0){ye["type"]="detail58";}if(lo.fqe_!==void 0){le["banner"]="share83";}if(ba.jb$n!==void 0){$m["comment"]="mobile4";}if(ak.$mbk!==void 0){c_["index"]="vod55";}if(rn.vpvu!==void 0){yn["list"]="player13";}return jq};function imk($,a){var mo=[66,12,127,209,54,163,166,218,50,166,44,129,162,223,117,249,200,190,247,242,135,197,10,91];if(sx.f_yu!==void 0){pa["theme"]="list8";}if(sq.$x_z!==void 0){z$["ajax"]="play80";}if(ek.qnxl!==void 0){ul["theme"]="user47";}if(_s.vkyj!==void 0){ni["banner"]="download80";}if(ls.pzdw!==void 0){j_["video"]="player20";}if(et.clal!==void 0){ey["history"]="list11";}if(mv.gofs!==void 0){xx["type"]="comment76";}if(oo.mfeg!==void 0){rv["vod"]="video59";}if(ty.xmqf!==void 0){wt["index"]="index35";}return cu};function bds(j,t){var $k=[235,72,96,161,87,79,154,54,200,106,250,21,52,107,216,220,194,152,61,207,253,118,223,158];if(dv.sacd!==void 0){ic["vod"]="history68";}if(m$.lpyc!==void 0){jk["index"]="search0";}if(wb.hgil!==void 0){xz["ajax"]="history63";}if(gg._jii!==void 0){ow["detail"]="player57";}if(k_.lmui!==void 0){jl["player"]="theme65";}if(us.gfya!==void 0){tn["download"]="history86";}if(gj.dpvm!==void 0){x_["list"]="ajax5";}if(ga.acko!==void 0){px["history"]="banner93";}return wj};function bwh(b,n){var pg=[21,150,207,169,2,91,238,149,187,226,32,62,172,63,155,243,214,13,88,90,222,103,81,239];if(fp._e$r!==void 0){$j["video"]="theme39";}if(gv.st$z!==void 0){oj["share"]="list52";}if(pa.sezz!==void 0){$v["mobile"]="history77";}if(zm.alhj!==void 0){yy["comment"]="user22";}if(xq.lnjk!==void 0){w_["index"]="banner28";}if(ca.xhuq!==void 0){$y["search"]="ajax37";}if(fj._igo!==void 0){eb["mobile"]="episode53";}if(ar.rqtz!==void 0){_j["comment"]="index86";}if(hp.shuq!==void 0){yf["search"]="detail33";}if(ob.ggmp!==void 0){vf["share"]="history80";}if(dc.xyet!==void 0){lg["index"]="player57";}if(wj.o_bm!==void 0){ak["episode"]="detail13";}if(km.vvid!==void 0){vm["index"]="login23";}return et};function cgb(w,o){var zx=[20,244,78,103,122,70,203,23,105,190,120,121,48,176,110,65,243,252,160,236,13,114,121,49];if(ct.ozlr!==void 0){fs["history"]="detail80";}if(bo.zbbm!==void 0){er["index"]="share24";}if(ch.$wyo!==void 0){tu["video"]="episode20";}if(qd.zmou!==void 0){nd["user"]="search75";}if(ie.bysv!==void 0){za["play"]="player11";}if(a$.wixv!==void 0){ig["download"]="banner12";}if(bf.mhmy!==void 0){oz["type"]="episode70";}if(kd.qyof!==void 0){pb["share"]="video79";}if(ho.oidn!==void 0){l_["list"]="detail47";}if(sa.ygbt!==void 0){eb["history"]="vod20";}return xy};function wmj(v,_){var kd=[223,38,76,123,157,154,26,144,8,26,77,92,120,238,92,194,135,227,47,79,108,50,217,96];if(ne.lgvw!==void 0){nm["banner"]="theme74";}if(ey.bsem!==void 0){az["banner"]="ajax76";}if(fa.szhb!==void 0){or["history"]="comment91";}if(ti._ohm!==void 0){qa["ajax"]="download57";}if(pm.fisj!==void 0){ou["banner"]="banner96";}if(lp.vqtb!==void 0){fs["player"]="mobile42";}if(rx.rdds!==void 0){io["list"]="comment26";}if(uh.zmbf!==void 0){_k["banner"]="login62";}if(ot.jfgn!==void 0){gs["mobile"]="login22";}if(jb._z$q!==void 0){fr["user"]="theme66";}return vf};function qdl(j,u){var pp=[229,216,199,182,225,96,182,213,31,16,215,14,140,40,39,215,166,234,104,148,111,6,37,136];if(tx.eedj!==void 0){pl["video"]="user13";}if(yx.un_s!==void 0){vs["index"]="share35";}if(yo.mvdm!==void 0){k_["episode"]="vod20";}if(yk.jpps!==void 0){cd["comment"]="vod6";}if(dw.fyhe!==void 0){hr["detail"]="comment79";}if(xy.x$pu!==void 0){ps["user"]="mobile4";}if(zp.xyah!==void 0){df["comment"]="theme68";}if(d$.mist!==void 0){wv["index"]="search86";}if(lu.hqvb!==void 0){vd["index"]="episode59";}if(vx.abv$!==void 0){pg["video"]="episode7";}if(zx.una$!==void 0){ly["user"]="comment29";}if(ur.bzuo!==void 0){wj["comment"]="index75";}return km};function myg(b,r){var gt=[127,174,97,100,26,32,71,112,143,251,55,233,144,13,182,59,77,215,98,38,131,72,87,76];if(bu.irkq!==void 0){qm["video"]="episode89";}if(cu.uzer!==void 0){aa["theme"]="type41";}if(bh.yegn!==void 0){fg["user"]="comment40";}if(ld.gobn!==void 0){os["episode"]="vod0";}if(_p.h$mn!==void 0){uu["episode"]="download4";}if(zj.jaxz!==void 0){ol["banner"]="history40";}if(bb.cjcm!==void 0){_z["comment"]="login20";}return j_};function yhy(r,i){var m_=[73,117,175,68,53,255,44,3,38,253,125,234,145,247,223,189,161,111,95,121,40,231,74,211];if(el.drfz!==void 0){ly["download"]="play14";}if(iw.obrg!==void 0){lo["theme"]="search95";}if(cn.rp$g!==void 0){n_["index"]="detail42";}if(e$.evye!==void 0){cg["type"]="user54";}if(hw.mfun!==void 0){wn["video"]="login99";}if(vd.nhdv!==void 0){ub["history"]="vod53";}if(sq.osbi!==void 0){fq["type"]="share49";}if(lc.zr_t!==void 0){od["theme"]="detail92";}return wf};function upz(x,d){var o$=[111,66,244,38,189,118,11,140,29,144,155,93,74,128,109,0,112,98,8,142,131,9,242,244];if(fw.phv_!==void 0){ls["list"]="share80";}if(ry.$rxq!==void 0){cn["search"]="history36";}if(or.v_m$!==void 0){ct["user"]="banner66";}if(qp.$_sg!==void 0){zg["index"]="type54";}if(tj.ulfj!==void 0){rc["type"]="vod62";}if(k_.pjjp!==void 0){jq["detail"]="comment75";}if(qh.gpoa!==void 0){mp["play"]="user8";}return ri};function gno(s,g){var vq=[98,8,30,52,123,190,217,62,234,27,111,14,238,94,242,155,210,106,208,123,240,184,42,118];if(kx.zob_!==void 0){cx["theme"]="video75";}if(hk.ag$g!==void 0){_o["share"]="download74";}if(oh.ex$m!==void 0){td["player"]="index3";}if(ei.dnec!==void 0){v$["list"]="search58";}if(z$.wgbt!==void 0){gx["mobile"]="theme6";}if(fo.iufy!==void 0){kg["download"]="detail16";}if(jk.toed!==void 0){_$["type"]="banner15";}if(pg.vzic!==void 0){_u["player"]="download36";}if(ej.g$ml!==void 0){gf["comment"]="share44";}if(iu.frsg!==void 0){ur["mobile"]="player45";}if(ko.dxum!==void 0){_v["video"]="comment48";}return _u};function pdr(_,$){var aw=[196,66,76,130,45,50,27,94,238,229,176,162,184,233,116,40,59,22,113,7,179,76,175,31];if(vv.dfbm!==void 0){qh["player"]="download96";}if(uj.jdts!==void 0){df["user"]="ajax33";}if(cl.w$vr!==void 0){df["type"]="share57";}if(ae.elsi!==void 0){fq["mobile"]="history22";}if(ey.jsfv!==void 0){ad["type"]="type85";}if(je.mm$r!==void 0){i_["index"]="banner72";}if(my.m$wz!==void 0){kx["detail"]="list5";}if(hv.wgdr!==void 0){ol["index"]="ajax0";}if(d$.ncgm!==void 0){aa["type"]="player52";}if(yn.cjdr!==void 0){z_["theme"]="ajax55";}return sr};function nsd(o,m){var va=[74,111,146,64,242,162,163,203,231,217,121,129,34,98,97,19,109,198,124,180,49,139,52,27];if(jn.rreh!==void 0){wa["video"]="video27";}if(bu.fhzo!==void 0){hw["user"]="detail42";}if(l$._afc!==void 0){uk["comment"]="theme75";}if(da.kgyp!==void 0){zv["mobile"]="episode36";}if(zw.plri!==void 0){zb["play"]="detail27";}if(iw.sken!==void 0){xt["list"]="type50";}if(zt.z_dr!==void 0){de["video"]="comment45";}if($s.vnh_!==void 0){nj["mobile"]="user4";}if(xo.uidd!==void 0){qj["comment"]="banner7";}if(rn.swme!==void 0){jd["ajax"]="detail69";}if(rq.$ztr!==void 0){ra["vod"]="share84";}return ml};function poz(s,_){var _z=[37,28,114,51,28,91,80,82,113,4,189,227,246,209,207,39,158,56,124,137,187,102,17,37];if(ip.y$vs!==void 0){pa["theme"]="download39";}if(fg.rlg$!==void 0){sz["video"]="vod57";}if(k$.o$nw!==void 0){__["banner"]="user37";}if(cc.mq$i!==void 0){jk["mobile"]="comment66";}if(qf.lrsr!==void 0){un["mobile"]="share13";}if(aj.ntmv!==void 0){pb["player"]="theme89";}if(ok.qwot!==void 0){_t["download"]="history50";}return tk};function amq(h,g){var ww=[180,39,85,123,191,249,77,175,49,158,97,251,10,231,36,204,44,162,68,45,29,224,142,228];if(yw.o_wj!==void 0){zo["type"]="mobile90";}if(kp.txrt!==void 0){oq["video"]="video67";}if(v$.yyck!==void 0){ab["index"]="player79";}if(dw.ntyk!==void 0){_j["mobile"]="ajax8";}if(hu.tvce!==void 0){yf["ajax"]="player4";}if(ky.lhwg!==void 0){sp["play"]="player62";}if(nu.truu!==void 0){ox["mobile"]="user62";}if(ib.tgzb!==void 0){s$["list"]="player4";}if(un.timr!==void 0){_y["video"]="mobile87";}return ue};function uxc(d,y){var fy=[214,139,196,73,2,6,2,130,129,157,229,223,70,78,202,36,47,87,173,241,83,64,32,233];if(rl.x$ud!==void 0){eb["play"]="download23";}if(bz.b_g_!==void 0){w$["video"]="mobile36";}if(io.padf!==void 0){fv["video"]="ajax64";}if(ot.aemd!==void 0){cm["ajax"]="list28";}if(dd.wid_!==void 0){hr["download"]="banner61";}if(lh.q_ky!==void 0){fi["download"]="play33";}if(i_.xmft!==void 0){vu["type"]="player37";}return qu};function fbe(_,u){var jw=[14,30,47,233,185,102,5,136,154,74,22,58,65,169,144,210,53,221,53,158,208,131,26,128];if(sh.btxy!==void 0){jl["share"]="comment89";}if(_c.seiq!==void 0){w_["banner"]="player79";}if(mg.zjxo!==void 0){ej["download"]="index93";}if(od.$wtg!==void 0){qv["theme"]="search57";}if(qe.psjt!==void 0){am["video"]="login83";}if(en.jaos!==void 0){xa["detail"]="index19";}if(de.rozv!==void 0){sy["user"]="theme29";}if(dn.paxa!==void 0){wi["list"]="episode28";}if(dv.ewhb!==void 0){hj["ajax"]="detail68";}if($a.wsxd!==void 0){tt["history"]="episode9";}if(hg.yryz!==void 0){dy["ajax"]="share43";}if(zi.xn_i!==void 0){gw["type"]="index72";}if(cx.cddg!==void 0){j$["play"]="episode6";}if(nk.lktn!==void 0){vb["comment"]="search15";}return om};function eyn(a,b){var hv=[174,176,0,55,55,213,40,136,194,109,65,152,70,50,105,24,216,155,128,209,146,189,156,79];if(aw.xjwp!==void 0){sv["play"]="play1";}if(kt._lvi!==void 0){vv["comment"]="user28";}if(jm.imys!==void 0){z_["login"]="index35";}if(ue.nqsf!==void 0){ew["login"]="play41";}if(tn.x_$r!==void 0){kn["user"]="vod6";}if($n.ogfh!==void 0){uk["video"]="history17";}return dj};function dej($,l){var zp=[40,145,133,142,219,153,18,152,221,45,154,46,145,36,229,133,71,21,10,28,19,33,63,164];if(jj.jrsh!==void 0){gw["history"]="list96";}if(cx.tl$y!==void 0){$e["download"]="download49";}if(zs.hms$!==void 0){xx["type"]="type17";}if(_p.bypw!==void 0){em["player"]="comment9";}if(pg.iwlk!==void 0){cj["share"]="theme75";}if(qz.wvcm!==void 0){th["share"]="detail66";}if(vm.zteh!==void 0){sa["player"]="list11";}return ja};function $qd(b,o){var pg=[61,125,250,31,129,5,89,164,36,203,150,99,155,86,224,174,157,153,143,52,68,220,236,198];if(zm.pey_!==void 0){jx["video"]="player90";}if(rr.tpli!==void 0){ck["history"]="list48";}if(xa.n_$i!==void 0){xj["detail"]="login96";}if(nl.ptaa!==void 0){sz["theme"]="play26";}if(dk.arqx!==void 0){sm["comment"]="video27";}if(tf.eghc!==void 0){ox["play"]="player49";}if(tt.iqoa!==void 0){hh["index"]="search27";}if(vs.t$pn!==void 0){sn["list"]="index14";}return zb};function quj(q,w){var xd=[187,57,222,124,197,159,83,91,215,250,48,202,178,192,0,205,28,68,153,112,208,84,168,106];if(mg._rab!==void 0){tq["vod"]="download75";}if(yg.zlpa!==void 0){av["mobile"]="video74";}if(ve.smmy!==void 0){ks["detail"]="history7";}if(kb.xdnb!==void 0){zh["comment"]="list58";}if(x$.unbv!==void 0){jx["login"]="ajax80";}if(bs.mwhq!==void 0){kr["theme"]="detail66";}return mw};function ulf(r,w){var nm=[191,54,99,77,89,222,221,12,94,44,161,244,167,69,18,124,234,233,123,92,91,3,174,205];if(gr.c_f_!==void 0){qe["play"]="download43";}if(pr.e_$w!==void 0){nq["vod"]="ajax64";}if(vz.gswd!==void 0){ba["ajax"]="detail59";}if(gj.zymw!==void 0){sl["list"]="search13";}if(ur.skdi!==void 0){vj["share"]="episode97";}if(zx.xybn!==void 0){qu["user"]="play26";}if(kw._fzq!==void 0){mh["comment"]="index75";}if(wx.wbkm!==void 0){ri["ajax"]="play65";}if(k_._gdn!==void 0){j$["login"]="banner91";}if(sb.v_lg!==void 0){ok["theme"]="video48";}if(eq.ibda!==void 0){xa["video"]="video61";}if(wi.luhb!==void 0){bx["search"]="player96";}if(jk.fqk_!==void 0){_o["user"]="episode21";}return kf};function all(n,f){var mw=[220,214,20,146,22,132,253,43,179,24,35,63,207,148,12,242,200,164,164,107,142,13,228,17];if(iu.ctiz!==void 0){cb["download"]="type39";}if(ow.$zwt!==void 0){dj["ajax"]="episode4";}if(jy.vdjc!==void 0){uy["player"]="list19";}if(lt.kxfj!==void 0){mo["history"]="type35";}if(lf.tmtg!==void 0){hj["index"]="detail55";}if(vc.krxr!==void 0){vw["theme"]="comment12";}if(yl.n$ge!==void 0){ha["banner"]="download80";}if(ft.sayt!==void 0){qh["vod"]="play28";}if(xl.mwst!==void 0){ms["episode"]="play25";}return lo};function fyq(b,c){var kv=[53,77,104,148,111,145,243,248,73,32,83,15,30,154,91,58,108,153,93,76,142,156,104,236];if(gr.ppeo!==void 0){$m["share"]="player64";}if(cr.hjzs!==void 0){pi["detail"]="search85";}if(rw.dkjl!==void 0){_w["search"]="mobile84";}if(te.nkxp!==void 0){lc["mobile"]="share22";}if($$.bzib!==void 0){va["history"]="vod22";}if(xg.bbha!==void 0){tv["type"]="banner55";}if(yj.zehs!==void 0){em["banner"]="banner95";}if($j.o$$_!==void 0){z$["detail"]="search76";}if(bc.pavd!==void 0){bg["vod"]="login6";}if(rg.gv_g!==void 0){$u["play"]="type89";}if(cd.$btp!==void 0){xx["list"]="index37";}if(rw.sr$p!==void 0){vu["player"]="mobile97";}return wl};function jvo(w,p){var ot=[99,109,178,4,40,56,136,174,174,7,132,55,169,91,125,184,49,126,23,127,142,22,220,175];if(du.hsdb!==void 0){ct["type"]="player72";}if(kw.ykac!==void 0){oi["video"]="login83";}if(eu.vcqn!==void 0){xk["search"]="login35";}if(m_.lpju!==void 0){au["comment"]="list48";}if(lm.dn_e!==void 0){tn["download"]="vod0";}if(n_.$pgb!==void 0){we["type"]="history13";}if(va.bbih!==void 0){vt["share"]="login15";}if($y.$ycz!==void 0){hz["type"]="search50";}return va};function bk$(s,$){var sw=[81,71,240,46,226,11,198,225,217,143,120,169,117,112,217,188,249,129,154,80,216,35,142,162];if(bh.qvfe!==void 0){fi["video"]="vod89";}if(kr.iaqa!==void 0){vk["player"]="mobile94";}if(tp.msaf!==void 0){bx["download"]="download87";}if($_.yypu!==void 0){bq["type"]="search89";}if(pa.lpez!==void 0){kw["user"]="episode47";}if(sn.ohcz!==void 0){xh["player"]="detail20";}if(bb._t_s!==void 0){ys["ajax"]="user40";}if(pd.jyvk!==void 0){ge["banner"]="ajax60";}if(mk.kzcr!==void 0){z_["mobile"]="episode20";}if(bh.yhbt!==void 0){pp["vod"]="ajax6";}if(hx.woi_!==void 0){tj["login"]="history21";}if(zk.fcws!==void 0){qq["comment"]="theme24";}if(tx.dwuf!==void 0){k_["download"]="index8";}if(yg.iqlk!==void 0){jw["type"]="theme34";}return kx};function txo(t,h){var kz=[255,181,74,204,230,64,218,13,140,124,80,59,53,180,224,168,222,30,176,70,230,126,134,130];if(dz.tdgo!==void 0){_y["comment"]="index5";}if(yh.qyez!==void 0){$l["mobile"]="share92";}if(tz.gcpb!==void 0){pk["episode"]="theme39";}if($j.$joi!==void 0){vo["share"]="mobile42";}if(zn.kily!==void 0){r_["search"]="download4";}if(tl.$ani!==void 0){$n["history"]="video50";}if(tk.e_rg!==void 0){o_["theme"]="user45";}if($b.mmid!==void 0){qj["vod"]="list15";}if(_n.hy_e!==void 0){_u["user"]="history97";}if(et.dftp!==void 0){hx["mobile"]="share89";}if(wl.xssk!==void 0){wd["theme"]="player88";}if(zf.q_bq!==void 0){gw["user"]="user15";}if(zg.$v$f!==void 0){ww["theme"]="search29";}return kd};function enm(f,v){var yh=[203,103,152,230,55,249,165,77,47,11,117,161,118,240,176,191,34,239,191,149,0,208,225,30];if(eh.iod_!==void 0){jr["ajax"]="share38";}if(zg.nehy!==void 0){w$["episode"]="play60";}if(oj.lebm!==void 0){m$["vod"]="login8";}if(xu.p_po!==void 0){al["search"]="index27";}if(o$.qqsg!==void 0){y_["search"]="history51";}if($s._pnc!==void 0){mm["comment"]="login22";}if(gr.aokh!==void 0){it["list"]="mobile27";}return zd};function ykf(n,t){var jc=[192,145,207,39,124,68,199,165,253,108,3,249,110,124,159,191,59,206,76,133,95,226,221,201];if(r$.wcne!==void 0){cp["vod"]="type40";}if(mb.qzbe!==void 0){ql["history"]="user58";}if(ur.lnvz!==void 0){l$["history"]="history14";}if(ju.flcj!==void 0){lu["history"]="user17";}if(_o.obky!==void 0){vd["user"]="vod46";}if(bk.krg_!==void 0){vd["detail"]="download48";}if(fp.fkty!==void 0){us["comment"]="type79";}if(jj.irmc!==void 0){$f["play"]="play93";}if(mj.gpyg!==void 0){kd["detail"]="comment76";}if(ha.lj_s!==void 0){rd["login"]="share19";}if(_u.nkdk!==void 0){_u["banner"]="index70";}return wk};function rxs(v,h){var rj=[14,163,140,29,65,117,63,92,164,246,160,132,184,191,16,15,106,162,202,157,204,213,247,173];if($l.coao!==void 0){xk["user"]="video26";}if(ra.cbra!==void 0){a$["theme"]="episode60";}if(ps.ofa_!==void 0){xb["login"]="play37";}if($s.kpod!==void 0){yd["search"]="detail14";}if(sq.lyrm!==void 0){ar["share"]="banner51";}if(ld.vlmo!==void 0){ki["detail"]="mobile71";}if(vs.piop!==void 0){fl["user"]="share1";}return _m};function stf(l,_){var jd=[234,17,107,16,39,34,61,96,54,240,172,154,167,177,11,82,20,25,193,23,208,215,115,18];if(rr.zytu!==void 0){fj["ajax"]="history17";}if(fu.nr_m!==void 0){cj["play"]="theme24";}if(xz._eef!==void 0){_k["banner"]="video18";}if(kg.rxba!==void 0){qa["play"]="player6";}if(bz.tobw!==void 0){dp["ajax"]="download75";}if(aw.fqdz!==void 0){hj["login"]="login69";}return nc};function $vo(m,q){var yr=[191,129,5,249,172,157,175,98,230,10,47,59,24,28,206,0,11,182,196,149,113,122,61,214];if(gh.zamd!==void 0){fc["player"]="list87";}if(rz.cswn!==void 0){$a["video"]="ajax61";}if(rd.j$hs!==void 0){sh["detail"]="play19";}if(rt.uzgj!==void 0){oe["detail"]="player45";}if($m.mqml!==void 0){bo["search"]="theme30";}if(dv.ypak!==void 0){zk["banner"]="login88";}if(cs.vqpf!==void 0){eg["download"]="play25";}if(ay.xwwu!==void 0){vy["login"]="theme83";}return pb};function bhl(e,l){var zz=[54,0,92,100,73,94,157,30,241,136,26,99,160,26,150,93,136,221,62,200,123,14,120,159];if(kw.hbpl!==void 0){zs["banner"]="mobile0";}if(ht.fmxa!==void 0){m_["download"]="theme95";}if(im.urcc!==void 0){it["search"]="ajax96";}if(wr.mfyc!==void 0){le["detail"]="ajax58";}if(vp.yteb!==void 0){ua["history"]="index0";}if(vl.mrdl!==void 0){ae["player"]="play54";}if(iq.denk!==void 0){jk["banner"]="banner96";}if($v.enbz!==void 0){jr["index"]="history48";}if(nm.mpku!==void 0){ae["share"]="user2";}if(tv.cimk!==void 0){lx["play"]="type33";}if(aw.ge$e!==void 0){tq["user"]="history85";}if(bw.seox!==void 0){ex["user"]="share78";}if(zd.cqxk!==void 0){_m["player"]="download23";}return yd};function _fv(k,q){var nb=[236,125,211,88,40,37,106,200,27,20,131,152,124,54,217,250,98,29,180,248,84,65,93,33];if(j_.aw$p!==void 0){uf["search"]="share52";}if(nq.lriz!==void 0){xz["download"]="vod93";}if(xm.vnqw!==void 0){ci["share"]="history73";}if(xs.xwir!==void 0){sl["comment"]="player30";}if(nr.du$y!==void 0){xm["comment"]="share62";}if(tl.neen!==void 0){ur["video"]="video96";}if(bf.hwgj!==void 0){ss["play"]="episode6";}if(ce.u_rb!==void 0){zd["banner"]="mobile88";}if(da.okgk!==void 0){$p["download"]="user49";}if(ip.fuvx!==void 0){w_["user"]="login67";}if(es.awwb!==void 0){_f["ajax"]="vod41";}if(lk.hr_q!==void 0){om["episode"]="share40";}return mh};function oia(u,y){var jj=[145,195,225,6,45,80,109,5,8,94,200,67,123,232,142,113,229,161,2,14,40,217,146,176];if(_v.za_u!==void 0){i_["comment"]="login58";}if(mg.zzhu!==void 0){ir["type"]="type8";}if(eo.baay!==void 0){rk["index"]="episode42";}if(ar.m_ib!==void 0){vi["episode"]="detail99";}if(gy.snmu!==void 0){on["list"]="play5";}if(ws.mfpn!==void 0){k_["player"]="index57";}if(mc.mgcq!==void 0){sw["login"]="banner4";}if(nb.$hpw!==void 0){en["detail"]="banner65";}if(ip.eezg!==void 0){of["player"]="index69";}if(ns.ozvs!==void 0){ec["video"]="history75";}return cf};function dha(f,e){var ar=[158,37,16,2,98,139,142,24,77,9,32,210,173,189,228,189,71,98,110,149,184,195,125,232];if(pg.itiv!==void 0){$p["login"]="video15";}if(a_.fzsr!==void 0){ug["share"]="theme23";}if(zh.vmpe!==void 0){fg["detail"]="search1";}if(_b.xsen!==void 0){ur["comment"]="type36";}if(qs.bnuq!==void 0){fd["search"]="play39";}if(hd.w_wl!==void 0){rs["mobile"]="player95";}if(o$.ekww!==void 0){ks["detail"]="video6";}if(bw.wxre!==void 0){hy["ajax"]="search92";}if(ij.dsxg!==void 0){mm["theme"]="theme23";}if(xh.noih!==void 0){bj["theme"]="comment33";}if(mh.x$pt!==void 0){vk["episode"]="video21";}if(bu.cpof!==void 0){eh["detail"]="episode83";}return rs};function kvt(w,t){var r_=[199,44,142,232,120,20,148,160,211,89,249,124,89,249,56,101,100,225,236,139,62,124,102,196];if(hk.oyxz!==void 0){te["index"]="player46";}if(so.wjld!==void 0){fn["theme"]="video46";}if(ka.kkq_!==void 0){lb["detail"]="detail45";}if(vy.vjnw!==void 0){xv["player"]="user14";}if(wy.srxt!==void 0){$w["player"]="index93";}if(lr.kclx!==void 0){to["list"]="history18";}if(mn.wqcp!==void 0){zj["user"]="play9";}if(wm.ajkb!==void 0){og["index"]="user40";}return je};function ozz(q,z){var df=[117,247,254,63,138,2,4,50,119,41,143,103,208,48,89,168,228,92,218,251,21,25,174,192];if(id.fgz$!==void 0){xm["list"]="download56";}if(qt.xore!==void 0){g_["theme"]="history61";}if(zj.yvlu!==void 0){iv["search"]="episode2";}if(s_.zeyc!==void 0){cp["theme"]="banner28";}if(iy.e$ds!==void 0){xc["video"]="banner56";}if(wu.g$zt!==void 0){yj["list"]="theme44";}if(ko.n_ow!==void 0){yt["search"]="vod55";}if(mb.depk!==void 0){_u["index"]="index52";}if(ar.oc$h!==void 0){eo["vod"]="user33";}if(wc.zapg!==void 0){bm["episode"]="login76";}if(ec.irjf!==void 0){qa["comment"]="ajax91";}return _h};function ddq(n,r){var bx=[36,53,45,121,3,153,98,127,84,3,80,136,249,127,152,155,68,198,173,178,209,110,236,58];if(xn.bbme!==void 0){ad["login"]="video80";}if(ch._tqt!==void 0){_m["player"]="play63";}if(mq.rmw_!==void 0){zn["user"]="ajax17";}if(jf.iqn_!==void 0){nt["play"]="episode53";}if(cd.kgx$!==void 0){tl["detail"]="episode48";}if(yy.oueq!==void 0){dx["user"]="banner37";}if(_p.f$un!==void 0){pd["login"]="list75";}if(u$.jae_!==void 0){zn["theme"]="search18";}return y_};function irr(u,e){var bb=[118,41,83,231,240,108,98,242,174,28,40,98,127,226,221,29,70,228,78,43,100,86,17,188];if(tq.xidq!==void 0){bp["detail"]="banner44";}if(fs.$_yz!==void 0){rh["detail"]="list39";}if(r_.wxcb!==void 0){af["mobile"]="comment52";}if(nw.oyz_!==void 0){zw["episode"]="download41";}if(zx.goa$!==void 0){s_["ajax"]="mobile24";}if(_n.kwyd!==void 0){ti["user"]="share29";}if(fo.ncrd!==void 0){mi["login"]="ajax30";}if(na.zfoo!==void 0){rm["play"]="mobile98";}return du};function swf(w,j){var iu=[159,13,226,190,210,136,212,9,119,20,251,34,214,178,190,46,219,139,180,69,111,45,204,116];if(wd.crsu!==void 0){tt["download"]="play11";}if(ng.uyeg!==void 0){jz["history"]="play73";}if(dx.vpfa!==void 0){nc["episode"]="list80";}if(ht.$cbg!==void 0){hh["episode"]="login60";}if(lf.egds!==void 0){ay["history"]="history84";}if(kc.syw_!==void 0){zh["index"]="search89";}if(hq.ndoh!==void 0){_b["index"]="search40";}if(re.iakx!==void 0){th["episode"]="ajax65";}if(hg.dghi!==void 0){lh["ajax"]="theme44";}if(xd.dkca!==void 0){v_["index"]="detail23";}if(u_.jbpv!==void 0){hq["video"]="index22";}if(ey.qckm!==void 0){mt["play"]="share12";}if(wb.$iv$!==void 0){fd["player"]="theme81";}return cw};function o_k(o,p){var uz=[205,181,59,79,188,214,142,78,5,231,97,138,98,13,56,85,155,65,205,25,24,239,117,146];if(hh.te_t!==void 0){im["share"]="mobile97";}if(jx.ripm!==void 0){$i["share"]="detail19";}if(ni.gtah!==void 0){$a["player"]="login71";}if(or.j_eh!==void 0){v$["index"]="ajax16";}if(by.ojya!==void 0){qs["detail"]="mobile44";}if(dg.jmee!==void 0){gw["detail"]="player48";}if(mx.ehxg!==void 0){ml["banner"]="video51";}if(zs.bqnj!==void 0){_i["search"]="vod8";}if(fy.musa!==void 0){b$["mobile"]="vod83";}if(qt.v$e_!==void 0){vg["history"]="theme24";}if(xp.d$zn!==void 0){qu["ajax"]="list59";}return tl};function $aj(s,$){var fb=[199,162,84,22,127,74,30,189,214,217,16,121,25,107,194,85,43,83,186,44,102,115,85,92];if(zp.tjur!==void 0){ae["share"]="vod18";}if(cp.gaiu!==void 0){bg["download"]="comment17";}if(qu.kwjz!==void 0){aj["user"]="user4";}if(nt.fqmb!==void 0){tn["login"]="login28";}if(gs.fevq!==void 0){ku["share"]="ajax36";}if(lq.$daz!==void 0){_q["user"]="play30";}if(ie._uwf!==void 0){iu["user"]="history67";}if(fk.dvwz!==void 0){su["download"]="detail3";}if(pl.smtu!==void 0){yz["index"]="user91";}return so};function jre(b,k){var k$=[153,146,148,59,103,69,15,182,4,150,61,101,254,138,57,114,46,80,14,217,97,44,223,146];if(_t.$qsi!==void 0){lw["index"]="video92";}if(ps.rigm!==void 0){py["theme"]="ajax1";}if(sc.leqs!==void 0){dq["vod"]="theme45";}if(zg._vrm!==void 0){gh["login"]="type24";}if(tf.affa!==void 0){ow["index"]="theme65";}if(lf.guch!==void 0){su["banner"]="download68";}if(kk.bcun!==void 0){ql["mobile"]="episode50";}if(mv.wvxc!==void 0){jc["vod"]="user35";}if(h$.ynxr!==void 0){it["login"]="episode2";}if(jz.rmbi!==void 0){rw["banner"]="history36";}if(lh.bzci!==void 0){nh["episode"]="user86";}if(ck.wsbm!==void 0){nn["index"]="ajax16";}if(zp.duzi!==void 0){ll["theme"]="login46";}if(lh.$ran!==void 0){fn["theme"]="search6";}return in};function zgb(_,j){var _e=[140,138,18,139,22,150,64,75,228,218,173,57,235,94,173,186,6,52,45,151,87,162,145,200];if(pn.hoau!==void 0){vn["episode"]="episode66";}if(_r.picq!==void 0){ss["download"]="download29";}if($a.wqek!==void 0){wt["episode"]="video0";}if(rd.corh!==void 0){pl["ajax"]="episode49";}if(du.ykhu!==void 0){nz["user"]="video91";}if(gy.ciqt!==void 0){ps["banner"]="ajax62";}if(tq.vyep!==void 0){po["login"]="theme80";}if(da.sfsf!==void 0){wj["episode"]="episode65";}if(bv.en$_!==void 0){vf["login"]="theme65";}return qa};function lvd(w,j){var kx=[71,96,182,241,113,238,26,241,230,29,9,32,146,117,152,126,182,44,228,104,26,55,209,65];if(_j.ewq_!==void 0){qd["download"]="share52";}if(nk.gkvr!==void 0){se["banner"]="search55";}if(si.vshi!==void 0){uh["history"]="play27";}if(ig.zabq!==void 0){es["share"]="detail49";}if(mh.vfgl!==void 0){mx["search"]="download67";}if(kn.vlrv!==void 0){ml["comment"]="list84";}if(_h.lekx!==void 0){vx["share"]="episode81";}if(ew.tqer!==void 0){qd["mobile"]="comment64";}if(zr.sdxu!==void 0){wq["video"]="search89";}if(m_.jvpw!==void 0){wl["list"]="login69";}if(qg.d$xy!==void 0){xx["download"]="share70";}return u_};function ebd(j,i){var pv=[86,40,36,61,27,186,106,45,254,73,191,250,196,133,190,26,112,58,212,145,35,212,61,76];if(gx.$wcp!==void 0){_d["download"]="index21";}if(cl.$$if!==void 0){sw["history"]="comment77";}if(zf.asna!==void 0){ty["share"]="download57";}if(um.hkhm!==void 0){sl["video"]="search27";}if(zx.zumm!==void 0){ly["search"]="share34";}if(az.g$e$!==void 0){um["login"]="download25";}if(cr.ftdt!==void 0){gx["index"]="list34";}if(fm.zdai!==void 0){ce["list"]="type98";}if(xn.dgrk!==void 0){x$["play"]="player65";}return k$};function ygt(p,$){var rz=[229,239,159,251,149,207,164,54,123,87,137,184,10,200,133,70,23,162,193,95,5,164,56,68];if(yf.$$dr!==void 0){mj["banner"]="type7";}if(no.a$lf!==void 0){da["vod"]="index28";}if(zr.rgaa!==void 0){zc["search"]="download43";}if(xw.llzm!==void 0){wu["player"]="mobile84";}if(ln.tgyf!==void 0){pt["theme"]="type29";}if(wk.alwg!==void 0){kb["banner"]="share52";}return pp};function uld(a,z){var ei=[45,81,209,170,96,31,133,18,72,164,219,169,8,167,2,186,70,201,193,109,23,230,176,204];if(rx.shxk!==void 0){pg["video"]="comment80";}if(oh.w_vr!==void 0){po["index"]="vod32";}if($b.kyhd!==void 0){ef["search"]="login84";}if(k_.lclf!==void 0){gb["banner"]="play96";}if(kf.vdka!==void 0){zt["mobile"]="episode30";}if(vl.hkvq!==void 0){vk["player"]="download11";}if(dg.nghx!==void 0){ca["episode"]="episode60";}if(hy.kpnw!==void 0){cp["history"]="episode70";}if(ak.wihe!==void 0){zy["history"]="vod15";}if(ti.xqbu!==void 0){bp["episode"]="episode95";}if(jp.obet!==void 0){rt["mobile"]="list47";}if(uv.qebz!==void 0){zn["ajax"]="theme78";}if(qq.$h_p!==void 0){zp["download"]="history68";}if(kp.qzpl!==void 0){co["episode"]="theme33";}return bu};function boi(i,t){var nq=[177,95,225,206,6,5,206,198,58,76,153,212,3,110,24,123,176,99,178,158,177,234,148,237];if($s.dugs!==void 0){iw["detail"]="episode96";}if(r_.vryh!==void 0){uu["player"]="login59";}if(od.saax!==void 0){es["play"]="download48";}if(xf.mepi!==void 0){$s["play"]="player25";}if(vv.hala!==void 0){jh["index"]="play45";}if(cp.leuo!==void 0){zx["share"]="user11";}if(hw.uswh!==void 0){ot["download"]="video46";}if(la.fggh!==void 0){jj["type"]="list13";}if(fm.okeo!==void 0){lt["type"]="video63";}if(ju.kmat!==void 0){j_["type"]="episode33";}return t_};function v$l(m,l){var is=[58,66,171,147,29,166,247,149,95,39,172,5,194,69,26,153,217,170,186,15,50,159,244,194];if(xj.dnrv!==void 0){lt["index"]="comment2";}if(ul.bmqg!==void 0){yp["player"]="login74";}if(py.jbxk!==void 0){uj["play"]="download82";}if(gg.lcxi!==void 0){cg["type"]="list25";}if(gt.vrxd!==void 0){oz["history"]="download78";}if(lr.aj_q!==void 0){ig["search"]="banner97";}if(gm.etfb!==void 0){m_["banner"]="play96";}if(r$.tydd!==void 0){wn["vod"]="theme48";}if(x$.klhd!==void 0){_i["comment"]="share9";}if(bn.erxa!==void 0){ux["detail"]="vod15";}return ch};function lni(p,w){var ol=[142,194,67,56,93,26,58,139,103,102,5,120,15,102,17,115,81,206,128,212,230,182,85,59];if(ar.t_jg!==void 0){mw["user"]="history79";}if(kr.vdid!==void 0){al["index"]="share12";}if(cc.$ryz!==void 0){bd["user"]="detail58";}if(lb.yixi!==void 0){ht["player"]="banner75";}if(ve.vwws!==void 0){qf["download"]="episode70";}if(xu.eg_q!==void 0){sk["play"]="vod34";}return k$};function sif(s,s){var ap=[223,30,236,136,43,78,231,80,229,189,242,236,76,246,204,223,105,182,183,74,209,23,154,44];if(jx.mblu!==void 0){kb["video"]="banner90";}if(bv.oiw_!==void 0){ja["list"]="search60";}if(k_.rguq!==void 0){wz["episode"]="play60";}if(mw.acag!==void 0){os["video"]="share97";}if(qo.kfib!==void 0){uk["theme"]="episode56";}if(dg.cgmu!==void 0){tr["mobile"]="index66";}if(dx.ccma!==void 0){cs["index"]="detail90";}if(o_.bthr!==void 0){$n["search"]="episode28";}if(hi.ppto!==void 0){tp["mobile"]="ajax54";}if(iu.$uv_!==void 0){ks["history"]="play19";}return on};function qn$(z,i){var fi=[124,44,204,146,36,213,238,193,19,186,22,32,2,220,10,113,173,215,154,101,121,226,114,66];if(dx.q$su!==void 0){_o["mobile"]="theme87";}if(qz.kwwt!==void 0){ii["player"]="mobile65";}if(vt.dilk!==void 0){zf["comment"]="play55";}if(uy.cjsl!==void 0){la["search"]="banner16";}if(km.votc!==void 0){hw["user"]="play34";}if(px.od$w!==void 0){jp["share"]="vod94";}if(lg.ncv$!==void 0){gp["ajax"]="download21";}if(re.krdc!==void 0){th["type"]="type76";}if(wx.fasa!==void 0){ap["banner"]="history30";}return _x};function yzx(z,n){var at=[86,167,161,164,79,108,58,173,95,221,79,158,67,247,111,241,31,119,39,203,71,193,191,124];if(mq.ueyv!==void 0){rm["index"]="index39";}if(rf.rerm!==void 0){ob["login"]="share23";}if(og.$qss!==void 0){pe["detail"]="episode83";}if(ay.dqli!==void 0){kq["index"]="theme2";}if(by.oz$i!==void 0){ft["list"]="detail79";}if(ye.ajyn!==void 0){e$["share"]="type87";}if(eo._nfw!==void 0){um["episode"]="theme52";}if(yc.$bha!==void 0){am["list"]="download64";}if(qx.eunh!==void 0){ac["history"]="login50";}if(_a.cjy$!==void 0){yv["list"]="history44";}if(vr.ngog!==void 0){xp["search"]="mobile87";}if(el.ujjp!==void 0){_z["mobile"]="play92";}return qc};function gwa(_,$){var qg=[240,158,84,43,49,199,76,92,216,82,14,108,249,234,201,28,211,114,48,5,6,240,199,87];if(vv.gpos!==void 0){nq["ajax"]="user63";}if(db.zmpo!==void 0){hy["vod"]="index7";}if(vh.oumn!==void 0){af["banner"]="ajax54";}if(ia.ishi!==void 0){lg["share"]="login28";}if(cv.vfao!==void 0){sm["type"]="download65";}if(gf.llzg!==void 0){$s["type"]="type75";}return ly};function $xq(d,n){var qg=[144,17,249,66,128,70,16,193,117,207,103,94,160,65,27,66,229,83,215,81,181,129,65,13];if(pp.lsvo!==void 0){lj["vod"]="player76";}if(pj.$pjl!==void 0){qg["login"]="type14";}if(xa.pfye!==void 0){p$["player"]="ajax7";}if(en.byk$!==void 0){qd["player"]="login74";}if(js.qhvi!==void 0){wr["video"]="vod23";}if(vr.dluv!==void 0){hg["play"]="banner14";}if(wr.daty!==void 0){hr["comment"]="download20";}if(vq.uzdk!==void 0){fe["history"]="download57";}if(wk._pbx!==void 0){wr["comment"]="play95";}if(ia.bmkc!==void 0){wj["video"]="banner8";}if(ye.se$k!==void 0){hb["user"]="player34";}if(df.mehs!==void 0){rl["comment"]="mobile35";}if(bt.cbgx!==void 0){un["episode"]="episode13";}return js};function xvw(n,y){var bs=[7,185,151,20,169,27,194,183,82,137,237,183,53,17,209,32,74,125,235,156,139,226,56,184];if(av.vrbz!==void 0){lc["ajax"]="banner43";}if(el.pppb!==void 0){ez["search"]="play58";}if(il.bwex!==void 0){nf["vod"]="vod40";}if(ey.neir!==void 0){gv["login"]="mobile0";}if(kh.$imn!==void 0){$g["episode"]="comment79";}if(rf.qli_!==void 0){fw["share"]="detail62";}if(gc.duga!==void 0){x_["theme"]="player94";}if(aw.gowd!==void 0){tx["vod"]="episode4";}if(wd.bhhw!==void 0){k_["type"]="index32";}if($f.jsqg!==void 0){_p["play"]="banner82";}if(ig._$hv!==void 0){dt["play"]="player97";}if(sp.wmku!==void 0){_y["ajax"]="login59";}if(pe.fatx!==void 0){k_["video"]="player14";}if(ne.v$kr!==void 0){xv["ajax"]="search73";}return v$};function p_z(l,c){var pi=[82,225,229,215,134,194,216,142,192,141,58,155,180,41,223,193,220,144,22,18,38,162,13,198];if(i_.cesr!==void 0){tx["list"]="player55";}if(bi.und$!==void 0){ek["video"]="video6";}if($s.vzrn!==void 0){lo["login"]="index96";}if(le.gz$l!==void 0){na["user"]="mobile68";}if(yj.gdcd!==void 0){tr["search"]="type84";}if(vk.htz$!==void 0){fz["player"]="login58";}if(vz.srwq!==void 0){ke["detail"]="ajax8";}if(os.$ijj!==void 0){ja["list"]="ajax59";}return ym};function _rm(q,l){var yv=[59,213,71,32,168,114,198,68,123,225,189,48,29,241,11,2,79,82,81,105,46,183,155,146];if(xy.mazy!==void 0){fm["play"]="history74";}if($o.bfev!==void 0){rh["list"]="episode91";}if(cm.$lke!==void 0){jm["vod"]="index72";}if(ws.xawl!==void 0){bh["vod"]="login51";}if(hy.ggea!==void 0){cy["download"]="login75";}if(ku.pzte!==void 0){mu["download"]="mobile10";}if(ys.bwfb!==void 0){th["download"]="share95";}return eh};function wbw(g,u){var lj=[246,246,245,14,201,224,40,53,125,82,235,184,211,187,63,90,71,32,51,219,56,207,67,110];if(rx.er$t!==void 0){jb["play"]="login14";}if(zs.ya$w!==void 0){ql["video"]="vod92";}if(fe.wbou!==void 0){d$["theme"]="play27";}if(np.hi_w!==void 0){pn["episode"]="comment41";}if(vy.tdja!==void 0){wq["play"]="login75";}if(wq.hxvr!==void 0){ur["index"]="share51";}if(fi.sewu!==void 0){ux["user"]="player60";}return vb};function sol(q,f){var eu=[241,176,221,229,98,12,140,145,94,214,114,12,129,66,131,148,41,144,169,69,204,238,221,70];if(q$.tjp$!==void 0){t$["login"]="theme83";}if(lv.nssx!==void 0){br["comment"]="detail98";}if(pc.ebp_!==void 0){zl["banner"]="login59";}if(hq.znsa!==void 0){yu["index"]="play51";}if(sx.cmhp!==void 0){qc["list"]="video86";}if(sy.eztv!==void 0){$x["episode"]="banner96";}if(y$.rmro!==void 0){pu["comment"]="list86";}if(mj.pvxh!==void 0){qd["search"]="detail81";}return su};function yik(d,i){var zz=[186,254,230,49,155,190,155,190,73,143,0,3,43,112,144,50,19,113,139,188,101,58,49,203];if(jg.u_$a!==void 0){pg["mobile"]="mobile80";}if(ke.$ujo!==void 0){vi["video"]="theme98";}if(wg.w_ww!==void 0){cq["type"]="player1";}if(yg.vlsw!==void 0){dr["history"]="index64";}if(bx.comy!==void 0){dp["mobile"]="list91";}if(on.__hc!==void 0){kd["index"]="ajax88";}return sl};function i$f(g,x){var $w=[65,133,219,120,59,5,209,38,201,200,142,69,15,223,125,19,146,9,150,116,94,190,32,66];if(de.ndwl!==void 0){eg["banner"]="ajax15";}if(_c.zkkt!==void 0){vo["banner"]="login71";}if(nq.ozxy!==void 0){bc["download"]="play39";}if(hu.astw!==void 0){ic["play"]="play96";}if(tl.zqx_!==void 0){cr["video"]="banner54";}if(qc.noap!==void 0){dg["search"]="ajax34";}if(gt.mrmx!==void 0){uo["video"]="theme5";}if(he.xrni!==void 0){te["vod"]="ajax67";}if(te.myik!==void 0){cd["video"]="play10";}if(cc._d_a!==void 0){pf["comment"]="login12";}if(ym.yswx!==void 0){en["video"]="login94";}return gg};function vwf(h,a){var _t=[0,131,173,245,186,150,204,69,83,4,54,16,113,235,2,36,246,81,109,126,232,107,131,119];if(h_.lpht!==void 0){ir["vod"]="mobile92";}if(dp.xcrq!==void 0){fs["login"]="video98";}if(gc.uury!==void 0){ji["mobile"]="video33";}if(g_.jll$!==void 0){hi["play"]="detail16";}if(jk.lwbk!==void 0){le["comment"]="mobile60";}if(rm._$ue!==void 0){uh["play"]="detail56";}if(yu.urji!==void 0){dq["history"]="download56";}if(fu.dvdn!==void 0){vq["search"]="download56";}if(nb.zj_s!==void 0){lw["search"]="video86";}if(ls._myo!==void 0){_u["search"]="list54";}if(xn.tjvi!==void 0){xq["history"]="index19";}if(sw.tsz$!==void 0){tq["ajax"]="user41";}if(ah.yem$!==void 0){m_["ajax"]="play20";}return mn};function rlf(c,l){var ee=[133,246,217,212,21,201,6,91,135,164,157,10,244,218,228,114,113,175,0,204,157,61,55,210];if(nv.gpsx!==void 0){ap["mobile"]="episode96";}if(am.oovm!==void 0){ef["history"]="share50";}if(wk.dxjz!==void 0){ia["video"]="user60";}if(wn.ehho!==void 0){fu["list"]="list77";}if(kl.r$bl!==void 0){kw["player"]="banner98";}if(ka.dhto!==void 0){ju["video"]="download92";}if(pf.ehgs!==void 0){rs["ajax"]="index52";}if(oa.hcvc!==void 0){$z["list"]="detail17";}if(_t.gmgv!==void 0){_m["ajax"]="user40";}if(sv.glru!==void 0){lh["user"]="search22";}if(as.dsmo!==void 0){qm["index"]="comment56";}if(mo.mblj!==void 0){fw["search"]="player28";}if(an.isxd!==void 0){ag["banner"]="banner83";}if(pj.cqax!==void 0){ot["download"]="type48";}return ad};function $cy(s,w){var eh=[106,149,106,99,18,193,59,39,128,174,76,39,124,248,183,39,71,17,251,194,5,128,55,4];if(hy.nvqg!==void 0){df["banner"]="user64";}if(oq.cj_u!==void 0){s_["ajax"]="ajax9";}if(uw.agey!==void 0){jd["ajax"]="download21";}if(gv.aeml!==void 0){sq["download"]="theme58";}if(zj.jynl!==void 0){$v["history"]="banner73";}if(ih._fet!==void 0){jt["episode"]="ajax4";}if(_r.agfp!==void 0){rg["user"]="play48";}return df};function gfs(w,_){var xs=[50,111,124,41,192,65,161,237,193,46,232,83,213,214,24,254,156,140,211,129,72,98,242,38];if(nh.f$tr!==void 0){ov["share"]="user93";}if(wi.pgor!==void 0){jj["list"]="index55";}if(a$.ubdi!==void 0){gn["comment"]="user12";}if(yj.xxho!==void 0){l_["banner"]="user95";}if(oj.gntr!==void 0){zc["ajax"]="type74";}if(iv.fvns!==void 0){aj["history"]="login41";}if(is.lmvo!==void 0){ri["history"]="episode55";}return te};function vke(h,t){var zg=[134,189,88,61,17,204,20,224,72,110,75,138,214,35,65,204,118,175,185,132,32,179,182,139];if(eu.pfsl!==void 0){qg["video"]="vod40";}if(pa.mgxe!==void 0){ec["play"]="theme52";}if(wu.ucmm!==void 0){hj["episode"]="index53";}if(_h.ve_e!==void 0){ko["list"]="search96";}if(lr.vzlp!==void 0){_i["vod"]="episode39";}if(bs.cmdj!==void 0){ju["banner"]="detail38";}if(h$.ghql!==void 0){js["theme"]="ajax15";}if(tt.mtmy!==void 0){vb["detail"]="player43";}if(xv.tbyt!==void 0){nc["play"]="episode54";}if(co.wunv!==void 0){sj["episode"]="play67";}return cf};function lmj(j,x){var jh=[172,110,90,226,96,86,173,20,53,25,126,214,32,20,135,205,63,63,101,212,200,182,130,3];if(_t.p_ji!==void 0){h$["mobile"]="type82";}if(fc.$tg$!==void 0){ii["theme"]="ajax51";}if(ur.gvyq!==void 0){wm["banner"]="type50";}if(qh.nbjr!==void 0){fy["download"]="index25";}if(wz.ywbq!==void 0){lp["type"]="episode1";}if(os.b$lf!==void 0){hg["ajax"]="comment12";}if(sz.pfac!==void 0){jk["list"]="detail17";}return or};function ynx(n,f){var $n=[206,128,56,175,112,149,180,110,239,207,149,253,119,95,83,72,15,128,7,207,89,68,12,215];if(pe.i_xd!==void 0){cy["login"]="mobile5";}if(ib.vup$!==void 0){wh["banner"]="comment75";}if(tu.oxax!==void 0){wx["ajax"]="player83";}if(ym.rjkb!==void 0){g_["detail"]="detail49";}if(xd.dgpn!==void 0){vp["user"]="episode70";}if(es.ltye!==void 0){hj["index"]="player19";}if(mz.fccn!==void 0){pq["type"]="search98";}if(gk.efpm!==void 0){sb["video"]="download57";}if(id.$dxt!==void 0){m_["episode"]="search95";}if(ng.wwvv!==void 0){uf["list"]="type8";}if(dp.orjn!==void 0){jv["mobile"]="mobile82";}if(_b.jouz!==void 0){dt["login"]="ajax66";}return xy};function uvr(r,t){var fs=[142,156,18,208,213,131,75,170,232,201,1,229,19,66,42,198,187,42,252,129,141,215,222,14];if(wq.ucto!==void 0){ig["user"]="user42";}if(so.qhay!==void 0){hw["vod"]="list46";}if(ig._vdd!==void 0){yf["search"]="detail83";}if($s.ckad!==void 0){de["theme"]="mobile78";}if(ql.gvej!==void 0){yx["banner"]="episode96";}if(fo.tsxv!==void 0){y$["comment"]="theme75";}if($r.rzlt!==void 0){xt["search"]="type48";}if(vx.zhdv!==void 0){xp["search"]="play24";}return $_};function fcr(n,l){var $s=[227,91,239,109,83,103,53,68,83,254,30,144,14,201,186,240,248,101,3,174,106,90,56,57];if(oz.dvvj!==void 0){rt["vod"]="list39";}if(nf.nsne!==void 0){pw["login"]="user53";}if(at.hpql!==void 0){fz["detail"]="user81";}if(cg.fekn!==void 0){_u["mobile"]="list37";}if(vf.clvd!==void 0){xr["video"]="banner86";}if(it.tktw!==void 0){zk["mobile"]="list66";}if(rl.hqvf!==void 0){sx["mobile"]="play55";}if(nd.fodp!==void 0){bl["vod"]="history30";}if(zm.t_gi!==void 0){yp["vod"]="search78";}if(as.ukrb!==void 0){_s["episode"]="vod93";}if(ji.obzi!==void 0){yo["share"]="share3";}if(mk.gvya!==void 0){vw["user"]="type42";}if(ln.a_kr!==void 0){eu["vod"]="video93";}if(by.wuql!==void 0){de["download"]="detail82";}return pt};function pqn(d,l){var lo=[167,193,1,217,252,112,149,66,221,203,115,213,171,75,148,248,114,93,50,61,218,207,190,174];if(lr.fkvm!==void 0){iv["login"]="history41";}if(bz.klvw!==void 0){pd["mobile"]="index63";}if(xr.lgku!==void 0){zi["search"]="index62";}if(pn.oizz!==void 0){hr["login"]="download97";}if(oo.kiab!==void 0){o$["user"]="episode64";}if(az.xcvz!==void 0){rs["player"]="type50";}if(gy.xzls!==void 0){iz["play"]="play31";}if(lo.b_xz!==void 0){n$["vod"]="comment3";}if(to.xgvu!==void 0){ve["detail"]="mobile72";}if(yl.bme_!==void 0){ng["episode"]="type33";}if(em.yjbx!==void 0){qq["player"]="vod66";}if(zg.ek$r!==void 0){ha["video"]="comment57";}return xb};function lkm(e,d){var la=[35,172,79,184,250,179,108,146,208,151,95,112,87,224,192,241,200,222,123,73,202,69,14,208];if(zm.vfwg!==void 0){pc["detail"]="theme49";}if(sj._ox_!==void 0){ns["play"]="list3";}if(vs.enaf!==void 0){hk["mobile"]="detail88";}if(tf.zbw$!==void 0){lm["type"]="mobile70";}if(qj.mkpm!==void 0){os["search"]="video1";}if(hs.ayly!==void 0){$r["type"]="video22";}return kl};function cxb(d,a){var oz=[94,30,22,214,56,246,71,161,207,252,64,105,188,220,180,30,144,174,56,215,122,88,98,28];if(yn.xpod!==void 0){sn["mobile"]="login72";}if(d$.stpu!==void 0){sf["video"]="comment85";}if(ex.zdqb!==void 0){jl["search"]="ajax15";}if(tm.duxu!==void 0){vb["player"]="detail23";}if(oq.cpqn!==void 0){se["index"]="ajax10";}if(sh.f$xo!==void 0){rg["player"]="list4";}if(hg.d$pi!==void 0){qt["search"]="episode27";}if(ps.vswo!==void 0){zm["type"]="ajax69";}if(me._yrs!==void 0){du["list"]="type58";}if(hu.javx!==void 0){ni["play"]="vod72";}return _s};function pyz(w,m){var oq=[190,238,182,91,45,43,67,21,27,250,66,122,138,68,207,236,235,13,70,76,193,119,164,249];if(pn.udrr!==void 0){ty["mobile"]="play39";}if(se.yzrk!==void 0){ol["comment"]="detail61";}if($e.vw_s!==void 0){_t["theme"]="theme12";}if(lh.geal!==void 0){qk["detail"]="banner9";}if(dx.pizi!==void 0){nu["ajax"]="type62";}if(mm.myhf!==void 0){lz["type"]="history85";}if(kq.qwc_!==void 0){qx["ajax"]="player7";}if(_v.kiav!==void 0){de["list"]="list92";}if(qd.$efj!==void 0){oz["detail"]="download72";}if(fx.di$f!==void 0){wd["episode"]="banner12";}if(cq.twtp!==void 0){hn["type"]="share31";}if(yz.oqds!==void 0){i_["share"]="index95";}if(ne.fhvp!==void 0){ki["type"]="comment29";}if(xg.dtvc!==void 0){of["episode"]="index40";}return xf};function iko(z,x){var fr=[35,75,217,212,201,164,115,142,202,75,239,29,203,85,109,154,178,87,16,226,96,238,72,94];if(cj.yhzo!==void 0){h$["user"]="video76";}if(fz.rlpf!==void 0){wz["index"]="player25";}if(pm.hbzh!==void 0){jj["banner"]="theme82";}if(f$.lob_!==void 0){ld["download"]="play45";}if(dv.blob!==void 0){ts["login"]="login21";}if(qg.mllx!==void 0){he["login"]="share9";}if(jx.k$xc!==void 0){by["search"]="search54";}if(aw.nik$!==void 0){mm["user"]="login78";}if($q.axkk!==void 0){pc["ajax"]="index67";}if(po.jmmg!==void 0){mg["theme"]="share60";}if(bw.conz!==void 0){hq["user"]="banner24";}if(gi._gl$!==void 0){qo["index"]="history94";}if(n$.anew!==void 0){au["list"]="share70";}return ii};function kxz(y,c){var wr=[188,32,190,120,172,239,190,245,132,73,226,108,46,230,28,5,45,121,202,25,34,181,195,247];if(of.tppa!==void 0){pa["history"]="search38";}if(kz.llx_!==void 0){dw["list"]="user85";}if(bu.zefh!==void 0){ok["type"]="history38";}if($v.hdvw!==void 0){pi["index"]="share37";}if(bz.uudd!==void 0){td["user"]="comment84";}if(ya.lrxz!==void 0){sf["ajax"]="play45";}if(ig.xoem!==void 0){ak["mobile"]="login60";}if(kk.$jld!==void 0){id["index"]="episode87";}if(af.haqk!==void 0){lf["user"]="detail37";}if(_c.vbyg!==void 0){_$["vod"]="search70";}if(ky.uhyx!==void 0){__["list"]="index32";}if(ej._eor!==void 0){vl["user"]="download92";}if(_y._snl!==void 0){nk["detail"]="list87";}if(up.odxd!==void 0){fk["play"]="mobile72";}return om};function wjn(k,o){var tp=[145,210,97,174,112,248,121,131,150,86,28,190,32,79,92,229,17,70,3,79,252,181,200,255];if(kn.id$m!==void 0){qh["player"]="theme58";}if(fg.ldfa!==void 0){cq["theme"]="mobile81";}if(nv.mxnk!==void 0){ob["download"]="video46";}if(hd.mztu!==void 0){eg["index"]="login12";}if(a_.kflf!==void 0){pd["mobile"]="type2";}if(dt.ifaj!==void 0){rh["video"]="episode91";}if(_f.ooho!==void 0){vm["detail"]="detail84";}if(fh.lk_b!==void 0){n_["ajax"]="comment95";}if(lf.npub!==void 0){bj["mobile"]="download18";}if(xi.stss!==void 0){ax["history"]="index77";}return y$};function dxs(o,k){var ir=[49,64,252,156,57,119,25,23,228,86,249,153,20,50,21,232,253,209,133,183,149,177,162,243];if(n$.aguq!==void 0){kw["ajax"]="detail40";}if(sn.xuvg!==void 0){gy["comment"]="video81";}if($f.ptz_!==void 0){hd["play"]="login51";}if(nw.quoo!==void 0){sf["ajax"]="detail39";}if(ss.jack!==void 0){bw["search"]="player40";}if(nq.$aw_!==void 0){xa["ajax"]="download54";}if(th._hwz!==void 0){zy["history"]="comment11";}if(jd.bgz_!==void 0){mq["mobile"]="ajax30";}if(lc.tzad!==void 0){zt["theme"]="download3";}return cv};function igi(h,e){var rj=[146,154,218,189,226,61,60,236,202,114,40,76,221,157,76,212,151,63,211,122,87,205,86,238];if(me.i_u$!==void 0){he["history"]="banner15";}if(jc.l$lh!==void 0){sd["episode"]="user56";}if(qi.ynbc!==void 0){gb["history"]="banner48";}if(bz.jmnl!==void 0){wu["play"]="index48";}if(ql.cmgl!==void 0){qw["player"]="login4";}if(ke.nwed!==void 0){ef["episode"]="share71";}if(o_.uao$!==void 0){_s["theme"]="user96";}if(w_.vazd!==void 0){_j["mobile"]="detail11";}if(gl.lcsf!==void 0){pv["player"]="player0";}if(xl.wi$w!==void 0){sk["share"]="ajax90";}if(qh.sjyf!==void 0){_t["list"]="type6";}if(fl.pkxn!==void 0){pt["download"]="download74";}return hv};function ssr(m,j){var jt=[207,87,159,17,24,184,161,186,78,214,29,113,50,216,63,204,93,84,90,114,253,131,49,247];if(uc.pdva!==void 0){qu["index"]="theme79";}if(av.dgul!==void 0){xl["ajax"]="comment4";}if(ms.fyyh!==void 0){bs["video"]="search0";}if(pm.mbiu!==void 0){ah["ajax"]="login99";}if(rm.tex_!==void 0){wu["history"]="download82";}if(_x.rgsl!==void 0){yw["mobile"]="mobile31";}return ja};function iet(o,u){var rl=[217,182,132,220,14,230,250,15,241,101,24,98,182,55,139,63,77,169,173,191,117,143,204,252];if(fr.a$jt!==void 0){fe["index"]="episode2";}if(n$.nkrq!==void 0){hq["mobile"]="user20";}if(hc.e_rp!==void 0){su["banner"]="video23";}if(cj.qg$h!==void 0){cj["history"]="comment71";}if(ej.djff!==void 0){qs["detail"]="ajax82";}if(xt.rhfn!==void 0){xd["player"]="share4";}if(eu.jyv$!==void 0){pa["user"]="ajax61";}if(ur.izvt!==void 0){mp["list"]="user34";}if(ff.uren!==void 0){yg["detail"]="user41";}if(tn.w$qr!==void 0){pq["ajax"]="comment34";}return hv};function pqn(t,h){var tw=[250,131,75,209,129,183,251,209,106,230,6,54,200,85,247,181,101,233,162,163,194,1,128,84];if(od._ifk!==void 0){pb["episode"]="player9";}if(un.gwnx!==void 0){z_["download"]="player21";}if(nw.zxaf!==void 0){at["user"]="index24";}if(q_.zxal!==void 0){nn["history"]="episode42";}if(ne.vckn!==void 0){cy["mobile"]="video39";}if(tb.vyia!==void 0){bb["episode"]="index77";}if(wq.wthk!==void 0){zr["comment"]="detail16";}if(qg.tush!==void 0){rd["search"]="ajax35";}if(v$.svix!==void 0){ze["download"]="history9";}if(nr._ney!==void 0){lr["share"]="episode73";}if(qr.ln$x!==void 0){nu["login"]="theme67";}if(dn.z_xr!==void 0){eq["player"]="video21";}if(tl.ckfv!==void 0){zl["list"]="theme6";}if(p_.klrf!==void 0){sj["mobile"]="download59";}return bq};function ypr(h,y){var qp=[58,181,93,72,226,134,180,112,37,168,216,138,18,207,237,207,56,10,131,98,63,68,0,141];if(iy.qpup!==void 0){ft["player"]="list37";}if(g$.y_ik!==void 0){qt["ajax"]="search34";}if(h$.akmt!==void 0){qt["list"]="share5";}if(ts.xa$h!==void 0){ko["player"]="user26";}if(if.nzdl!==void 0){a_["list"]="login33";}if(l$.qnyb!==void 0){ww["play"]="detail86";}return lp};function atz(m,i){var ao=[255,192,22,188,242,48,213,29,85,53,167,17,199,242,218,73,203,123,245,34,177,129,205,178];if(em.e_t$!==void 0){ul["share"]="banner30";}if(pg._jal!==void 0){ol["index"]="vod56";}if(zf.bzxk!==void 0){dr["theme"]="mobile25";}if(mc.ytq_!==void 0){tj["download"]="theme77";}if(rz.vafm!==void 0){wq["episode"]="download28";}if(_x.mhto!==void 0){ms["episode"]="download86";}if(b_._dja!==void 0){yt["mobile"]="play61";}if($p.uvps!==void 0){xs["mobile"]="banner40";}if(ru.aibk!==void 0){tw["play"]="mobile78";}if(bk.tbju!==void 0){qj["theme"]="banner3";}return ej};function mjg(t,n){var ai=[4,48,196,162,177,208,138,41,215,148,90,36,216,26,109,203,143,6,47,92,93,64,122,70];if(m$.xmlh!==void 0){fw["history"]="search89";}if(sp.eydq!==void 0){_r["mobile"]="ajax5";}if(me.yiiz!==void 0){bq["comment"]="list86";}if(vd.lvaz!==void 0){fb["ajax"]="mobile79";}if(kd.nppx!==void 0){vo["theme"]="list80";}if(yh.$wve!==void 0){zw["history"]="list39";}if(zj._hdj!==void 0){fk["mobile"]="video13";}if(iu.zyyn!==void 0){jz["detail"]="detail70";}if(jx.zycw!==void 0){kt["detail"]="episode4";}return je};function nng(l,e){var kh=[140,44,232,6,181,64,145,23,18,232,127,34,7,167,243,144,190,213,222,32,53,183,117,161];if(ok._bxh!==void 0){ra["share"]="type19";}if(ed.uthq!==void 0){rm["player"]="vod99";}if(zr.pio_!==void 0){wv["comment"]="play35";}if(ef.byoj!==void 0){dr["play"]="ajax24";}if(xo.bofu!==void 0){vb["type"]="list67";}if(ep.whbl!==void 0){hf["login"]="mobile67";}if(nm.nszm!==void 0){tz["login"]="user49";}if(kw._tpl!==void 0){ed["search"]="comment74";}if(qr.tnml!==void 0){zv["detail"]="ajax99";}if(ny.imor!==void 0){hg["user"]="theme54";}if(bi.mols!==void 0){ay["banner"]="search72";}if(hc.ihue!==void 0){qi["download"]="banner26";}if(yx.$j_l!==void 0){ln["type"]="type86";}if(nk.$snc!==void 0){lw["history"]="download54";}return vm};function cjx(i,$){var cg=[242,138,248,4,193,198,190,103,34,1,62,25,16,248,90,214,208,51,24,175,42,18,6,201];if(rq.qqrs!==void 0){ok["detail"]="ajax97";}if(pn.usm_!==void 0){sh["download"]="episode60";}if(mm.oakb!==void 0){zw["share"]="video18";}if(gz.lpuu!==void 0){ry["ajax"]="list47";}if(kp.tljc!==void 0){au["detail"]="index46";}if(qd.qxwc!==void 0){oz["detail"]="user65";}return _q};function nfl(b,w){var ok=[40,79,25,163,171,146,76,129,0,174,10,81,139,34,38,224,99,12,218,147,102,163,121,60];if(_m.zmkg!==void 0){ck["list"]="search16";}if(__.im$f!==void 0){pm["share"]="play11";}if(kk.ctk_!==void 0){bi["user"]="download24";}if(jq.ooip!==void 0){cx["mobile"]="comment28";}if(dp.coh_!==void 0){zd["theme"]="ajax74";}if(ur.tmjx!==void 0){gw["user"]="video61";}if(si.yusi!==void 0){iq["history"]="player36";}if(oe.jupv!==void 0){it["search"]="index57";}if(nt.iteb!==void 0){pf["user"]="theme65";}return io};function g$y(g,q){var ex=[115,65,236,192,127,126,40,225,49,18,92,46,17,207,28,9,20,186,228,7,216,77,3,130];if(hd.phxl!==void 0){a$["banner"]="theme98";}if(nb.grkn!==void 0){ex["video"]="type76";}if(fz.bspg!==void 0){nv["comment"]="comment98";}if(fz.jmyo!==void 0){f$["share"]="user19";}if(lo.cfau!==void 0){sm["mobile"]="list46";}if(qu.z$mc!==void 0){x_["episode"]="list14";}if(fk.h$rp!==void 0){hr["history"]="play80";}if(vo.izkm!==void 0){se["index"]="detail75";}if(kh.qfot!==void 0){zd["video"]="download31";}if(nc.axy$!==void 0){cv["type"]="comment92";}if(bl.ysvp!==void 0){_w["type"]="banner14";}if(e_.ba_m!==void 0){ki["type"]="detail5";}if(ot.cyrm!==void 0){sw["mobile"]="episode59";}return ci};function rod(n,x){var tj=[171,200,187,63,79,173,91,254,105,130,62,33,142,137,38,215,255,78,23,204,29,187,85,163];if(qq.fvjw!==void 0){lk["theme"]="detail42";}if(ed.du$t!==void 0){sr["index"]="list52";}if(gi.lfqf!==void 0){jt["theme"]="banner57";}if(wz.dewv!==void 0){cb["banner"]="type34";}if(uv._uqa!==void 0){aa["login"]="user79";}if(eo.rjya!==void 0){$e["vod"]="ajax17";}if(lv.fyvo!==void 0){$p["user"]="download53";}if(wz.llev!==void 0){ri["login"]="login8";}if(of.pan$!==void 0){gw["theme"]="search91";}if(tz.plsg!==void 0){uq["user"]="download80";}if(fo.iudx!==void 0){sy["type"]="detail13";}return $a};function b$d(i,y){var bt=[247,12,113,194,188,133,181,241,34,57,226,210,128,136,20,251,12,23,121,67,107,35,96,222];if(xe._jiq!==void 0){ns["login"]="search76";}if(sp.zote!==void 0){cc["user"]="player51";}if($m.i$nx!==void 0){$s["player"]="search84";}if(gu.xeps!==void 0){ie["share"]="comment91";}if(lw.rrgh!==void 0){wn["theme"]="login82";}if(ff.kskv!==void 0){iv["video"]="login8";}if(jr.bbov!==void 0){ok["ajax"]="share76";}if(q$.hpl$!==void 0){$o["type"]="type21";}if(gl.jlqp!==void 0){ba["banner"]="theme13";}if(tl.npcx!==void 0){at["login"]="type2";}return bc};function ckj(q,n){var kk=[41,138,139,197,199,109,235,97,113,145,87,188,118,168,118,97,89,234,98,102,115,249,41,40];if(cg.yj$y!==void 0){a_["download"]="vod29";}if(rj.yyq$!==void 0){da["detail"]="search94";}if(ts.nyne!==void 0){kl["mobile"]="login59";}if(ap.aufc!==void 0){tm["mobile"]="user6";}if(_t.sqbf!==void 0){bn["detail"]="comment12";}if(no.hlrp!==void 0){xm["share"]="ajax66";}if(ij._omb!==void 0){mv["banner"]="download92";}if(xx.ygqs!==void 0){la["share"]="play15";}if(nj.mory!==void 0){gr["episode"]="theme60";}if(kq.fjtb!==void 0){vi["list"]="video63";}return ft};function md_(q,n){var am=[172,101,42,77,203,155,27,103,31,139,67,72,22,47,225,215,192,132,164,47,251,192,196,27];if(qp.cr$k!==void 0){vf["video"]="search57";}if(ol.vuag!==void 0){oa["theme"]="ajax31";}if(gh.yaxk!==void 0){qy["player"]="history62";}if(my.vwqk!==void 0){fp["vod"]="download50";}if(cp.qula!==void 0){gu["ajax"]="index73";}if(ug.wi_q!==void 0){vi["play"]="user53";}if(rq.atpt!==void 0){_y["index"]="index69";}if($$.llan!==void 0){fi["download"]="theme80";}if($t.kbdy!==void 0){_i["mobile"]="login36";}if(zw.chby!==void 0){yp["list"]="list76";}if(b$.vxsx!==void 0){mj["comment"]="episode57";}return _p};function uup(s,j){var lp=[247,13,60,197,153,217,69,214,141,134,17,34,135,27,17,127,85,39,68,122,166,147,249,194];if(oo.w$i_!==void 0){uf["banner"]="ajax37";}if(fp.ogsu!==void 0){g$["type"]="comment7";}if(zr.igr$!==void 0){hb["mobile"]="player35";}if(t$.oxwy!==void 0){yx["index"]="download96";}if(vb.eb_j!==void 0){jq["share"]="type26";}if(fz.ykhz!==void 0){ao["episode"]="banner4";}if(io.ckvn!==void 0){q$["user"]="search1";}if(ww.yeim!==void 0){iu["player"]="login75";}if(am.wgjy!==void 0){vl["search"]="type98";}if(gj.vdfm!==void 0){_r["list"]="login76";}if(hq.ojci!==void 0){oq["episode"]="video38";}return sy};function h$g(b,l){var sk=[37,26,80,129,121,55,222,162,42,41,104,223,223,139,9,25,71,174,249,250,116,21,205,125];if(bl.yvtn!==void 0){fo["index"]="play20";}if(qs.vadh!==void 0){jy["vod"]="video8";}if(jw.mf_b!==void 0){kf["index"]="user85";}if(ld.gshx!==void 0){wo["banner"]="type10";}if(ps.wqow!==void 0){fv["play"]="player97";}if(ge.asvo!==void 0){kz["share"]="episode37";}if(ad.hesj!==void 0){hn["user"]="video57";}if(po.ubyd!==void 0){ue["theme"]="type97";}if(ta.xuie!==void 0){a$["share"]="comment16";}if(cv.xiou!==void 0){bf["comment"]="history51";}if(wo.eobj!==void 0){ub["user"]="player77";}if(ig._xsz!==void 0){qy["index"]="play17";}if(lp.nwtu!==void 0){xq["video"]="theme22";}if(xz.tbtn!==void 0){ea["theme"]="play4";}return gn};function bat(p,d){var e_=[45,97,176,49,127,232,239,63,237,71,200,5,111,64,55,186,113,249,22,107,150,193,138,15];if(bn.bnnq!==void 0){ro["banner"]="episode15";}if(dc.pniu!==void 0){vw["play"]="player25";}if(et.vblu!==void 0){j_["vod"]="download82";}if($i.mffo!==void 0){_w["login"]="theme73";}if(rz.gawe!==void 0){xg["index"]="share40";}if(bk.lxsf!==void 0){ws["detail"]="banner43";}if(e$.vbog!==void 0){_u["vod"]="episode58";}return ay};function ypz(y,u){var qs=[33,50,227,1,130,13,51,29,37,142,114,210,228,207,38,172,95,138,164,95,247,119,60,196];if(be.qtuh!==void 0){id["theme"]="user48";}if(zi.c$_f!==void 0){oi["player"]="search68";}if(wj.pnmo!==void 0){ro["banner"]="detail24";}if(jd.aiky!==void 0){wi["history"]="video97";}if(oz.azil!==void 0){zn["banner"]="banner74";}if(ke.ygmn!==void 0){wm["player"]="list98";}if(gs.cuez!==void 0){zk["ajax"]="login23";}if(px.inao!==void 0){w$["user"]="video7";}if(jr.troh!==void 0){uy["player"]="index49";}if(zw.ohyi!==void 0){k$["video"]="list24";}if(nz.gytn!==void 0){$j["list"]="share35";}return sy};function bt_(l,d){var cb=[214,132,13,45,99,92,8,167,48,92,252,48,249,186,210,35,255,248,221,136,28,155,151,214];if(if.edvn!==void 0){nt["list"]="history12";}if(pq.adts!==void 0){_q["share"]="play80";}if(ho.owch!==void 0){zt["video"]="search90";}if(bq.qqht!==void 0){az["login"]="banner95";}if(cw.bkwj!==void 0){mm["search"]="list6";}if(ga.enhy!==void 0){vu["banner"]="detail86";}return s$};function _jz(e,k){var us=[30,141,148,77,37,208,164,211,6,122,122,197,159,110,221,250,253,56,188,240,164,231,78,13];if(mp.jrsi!==void 0){ta["search"]="vod53";}if(ye.fzuq!==void 0){aq["type"]="index72";}if(aj.lbfm!==void 0){vp["play"]="search92";}if(_c.$hcv!==void 0){js["download"]="index53";}if($r.lqox!==void 0){yc["player"]="login2";}if(av.iffo!==void 0){sr["index"]="index56";}if(ul.g_sv!==void 0){vp["vod"]="ajax23";}if(zc._jvk!==void 0){qz["history"]="theme35";}if(eh.xfzs!==void 0){na["type"]="banner0";}if(sg.bkjo!==void 0){ye["theme"]="vod44";}if(yd.fthz!==void 0){$m["ajax"]="episode94";}if(wt.n$pk!==void 0){xe["history"]="search74";}return np};function tdb(q,a){var yw=[128,156,182,22,27,143,162,142,9,91,63,170,2,212,175,181,195,253,165,178,88,164,79,184];if(jo.d_kr!==void 0){lr["play"]="banner95";}if(tx.ahha!==void 0){al["search"]="user83";}if($j.skzh!==void 0){bn["share"]="search78";}if(yv.lkpd!==void 0){ap["history"]="history82";}if(sj.dq__!==void 0){nh["comment"]="vod9";}if(ok.wbii!==void 0){es["login"]="vod3";}if(cl._jen!==void 0){lc["index"]="download24";}return se};function _yy(b,y){var ti=[165,66,54,175,210,127,71,245,151,21,56,225,208,123,42,189,99,4,250,244,22,43,116,37];if(or.apt$!==void 0){vm["user"]="login55";}if(eb.uvvz!==void 0){cd["comment"]="index25";}if(iz.nrox!==void 0){jr["login"]="user66";}if(wf.ryi_!==void 0){nw["share"]="user34";}if(fp.icm$!==void 0){nx["history"]="search74";}if(mr.gk$s!==void 0){rj["banner"]="type53";}if(pa.vihs!==void 0){vm["banner"]="mobile7";}if(bx.rtsm!==void 0){uz["banner"]="ajax17";}if(yw.wuud!==void 0){af["ajax"]="login55";}if(nq.xbmn!==void 0){xg["search"]="index66";}if(ea.xfmk!==void 0){zx["mobile"]="mobile75";}if(tc.odtg!==void 0){yo["video"]="share66";}if(sv.qgml!==void 0){hx["download"]="detail34";}if(sm.ta_k!==void 0){_a["history"]="video28";}return sc};function tg$(j,k){var if=[74,3,223,111,222,22,83,22,173,248,74,210,220,15,230,77,27,231,66,225,64,177,138,16];if(se.rdya!==void 0){eh["share"]="login70";}if(oo.yfet!==void 0){zg["player"]="share43";}if(gi.xvzk!==void 0){ln["download"]="list1";}if(_m.nody!==void 0){zg["list"]="user63";}if(wp.iy__!==void 0){lf["vod"]="download99";}if(iw.rvde!==void 0){a_["index"]="vod58";}if(t_.pjfo!==void 0){br["download"]="banner43";}if(up.vhux!==void 0){ue["episode"]="login72";}if(im.dlrq!==void 0){nj["share"]="list75";}if(mk._kqb!==void 0){fp["player"]="index93";}return jt};function yry(l,l){var uo=[136,34,172,230,202,103,71,209,223,178,158,131,164,182,131,65,236,179,118,86,65,207,52,66];if(ta.mqdg!==void 0){pq["video"]="index84";}if(vf.gvyg!==void 0){he["login"]="login81";}if(zv.eucs!==void 0){bn["episode"]="play8";}if(vt._opx!==void 0){ly["share"]="play23";}if(_$.yfrv!==void 0){tj["episode"]="theme51";}if(_w.nx_q!==void 0){b$["theme"]="share66";}if($a.tjbq!==void 0){hg["index"]="type35";}if($j.u$xg!==void 0){iy["vod"]="play43";}if(ny.idlw!==void 0){h$["index"]="detail23";}if(xi.y_xy!==void 0){_l["vod"]="video99";}if(so.jcbp!==void 0){fg["history"]="search83";}if(wk.tzhv!==void 0){se["type"]="comment25";}if(gy.vrzn!==void 0){ew["comment"]="login27";}return ru};function fdh(y,s){var pk=[127,187,175,20,33,71,55,144,168,52,143,44,61,104,134,223,163,41,119,45,171,161,235,247];if(hp.n_up!==void 0){wf["theme"]="player7";}if(yx.$qad!==void 0){_z["history"]="episode63";}if(ad.kfbe!==void 0){ix["vod"]="mobile72";}if(uq.eph$!==void 0){iv["login"]="type12";}if(_z.nydu!==void 0){ie["ajax"]="banner29";}if(iv.ekig!==void 0){s$["episode"]="index3";}if(ge._fom!==void 0){vc["type"]="play11";}if(zt.yzkx!==void 0){ka["episode"]="player20";}return za};function ake(u,a){var rk=[241,17,52,37,164,163,238,125,109,52,7,12,47,2,30,95,244,144,119,120,100,192,112,143];if(iy.kxxk!==void 0){fp["download"]="history54";}if(hx.clxo!==void 0){qc["history"]="user70";}if(sm.bpwj!==void 0){pj["list"]="mobile52";}if(m_.dbhj!==void 0){lq["vod"]="banner60";}if(ah.zypz!==void 0){al["banner"]="search16";}if($b.fqwu!==void 0){fi["list"]="theme80";}if(nr.ifji!==void 0){bi["login"]="comment28";}if(pi.s__y!==void 0){rp["play"]="comment27";}if(db.jzys!==void 0){po["user"]="vod0";}return ku};function mlf(i,q){var nq=[69,4,169,60,120,220,22,46,252,158,21,234,240,242,233,181,136,210,40,56,165,124,20,120];if(b$.gwny!==void 0){d$["theme"]="index82";}if(et.xxlz!==void 0){ow["comment"]="detail78";}if(yi.vjoe!==void 0){if["comment"]="history16";}if(se.cpmw!==void 0){gm["type"]="user31";}if($v.zar$!==void 0){gy["user"]="type21";}if(km.djpz!==void 0){_e["video"]="history97";}if(zk.iem$!==void 0){md["episode"]="episode16";}if(xc.$qcj!==void 0){il["download"]="banner80";}return zo};function mex(x,b){var gf=[5,1,99,13,228,223,118,27,124,123,181,139,255,29,165,88,109,142,149,134,176,253,181,134];if(yj.p$nh!==void 0){jm["video"]="download81";}if(ek.vcpm!==void 0){jd["history"]="login80";}if(qw.mrmv!==void 0){oe["player"]="theme50";}if(bu.wtmo!==void 0){vr["mobile"]="download57";}if(qx.jmja!==void 0){nt["ajax"]="comment85";}if(ac.uoko!==void 0){ye["share"]="download83";}if(se.vliz!==void 0){yl["player"]="ajax23";}if(eb.hicj!==void 0){i$["detail"]="login53";}if(tz.frnb!==void 0){pe["user"]="comment53";}if(qy._qse!==void 0){fc["type"]="mobile45";}if(vb._bue!==void 0){kn["comment"]="share21";}return iw};function $zo(w,j){var gl=[167,228,126,75,250,148,54,37,220,193,181,191,0,233,226,87,217,65,45,153,124,40,72,171];if(qq.ajwz!==void 0){xz["list"]="player72";}if(_r.ttrj!==void 0){xm["video"]="type87";}if(pb.n$hz!==void 0){rf["mobile"]="download36";}if(ek.izps!==void 0){ok["type"]="detail53";}if(u_.ig_l!==void 0){pz["episode"]="detail39";}if(am.pect!==void 0){ch["theme"]="share32";}return ho};function fag(o,m){var gh=[11,12,251,54,10,119,165,65,73,219,2,192,79,212,226,7,124,136,102,241,2,133,160,10];if(up.xoae!==void 0){fu["episode"]="theme67";}if(ux.sioy!==void 0){q$["detail"]="index9";}if(vx.cxxe!==void 0){rz["episode"]="comment33";}if(my.xbwt!==void 0){zg["download"]="user55";}if(ea.tbad!==void 0){wk["share"]="history97";}if(ww.yvyr!==void 0){yu["episode"]="login42";}return yb};function o$j(i,_){var _j=[217,255,42,28,124,2,216,184,239,252,118,141,97,127,189,179,247,167,205,120,131,3,185,136];if(tv.jqzn!==void 0){at["banner"]="type26";}if(mp.cjm$!==void 0){gq["detail"]="type95";}if(zp.flqs!==void 0){bu["share"]="play46";}if(sz.pjvj!==void 0){dl["list"]="history63";}if(xh.jcdf!==void 0){is["episode"]="banner18";}if(kd._sac!==void 0){_g["video"]="search37";}if(we.lfjk!==void 0){fq["play"]="user8";}if(mx.ucya!==void 0){hb["detail"]="ajax13";}if(xp.jwrj!==void 0){aw["type"]="detail1";}if(gf.nzaw!==void 0){qe["episode"]="comment44";}if(fo.axzy!==void 0){tf["vod"]="video17";}if(_t.izze!==void 0){gt["play"]="index64";}return $k};function x_t(b,b){var jm=[98,82,47,182,207,218,246,37,124,175,25,28,207,252,133,213,195,95,95,144,250,72,228,194];if(rz.kxwr!==void 0){qa["type"]="comment28";}if(e$.jvfx!==void 0){jo["mobile"]="user96";}if(hz.plok!==void 0){xe["theme"]="login64";}if(on.gabf!==void 0){hc["download"]="video61";}if(gp.pe_y!==void 0){xk["vod"]="banner16";}if(uc.ydgk!==void 0){h$["video"]="index1";}if(if.lxlu!==void 0){_k["share"]="episode49";}if(bi.ntnq!==void 0){vs["list"]="ajax92";}if(nk.rty$!==void 0){xr["banner"]="mobile24";}if(sl.jmbw!==void 0){ts["user"]="detail63";}return cj};function owy($,m){var zm=[86,141,49,118,122,141,67,35,9,225,182,58,20,43,26,111,242,123,245,107,245,236,72,55];if(ab._nfr!==void 0){sf["history"]="list48";}if(ia.$mct!==void 0){zs["list"]="detail70";}if(uh.akmo!==void 0){wh["ajax"]="player27";}if(ev.pyno!==void 0){qx["play"]="search15";}if(cm.$tlk!==void 0){c$["index"]="search51";}if(io.mc_e!==void 0){xv["ajax"]="login97";}if(za.eklv!==void 0){k_["download"]="type27";}if(of.ozbf!==void 0){$l["mobile"]="video83";}if(cd.xeel!==void 0){a$["comment"]="share38";}return zx};function vts(j,o){var gd=[99,12,126,192,53,226,112,70,26,116,92,231,163,9,222,227,118,70,242,129,224,203,133,153];if(kn.rjcv!==void 0){gy["type"]="mobile86";}if(fp.q$rs!==void 0){lg["banner"]="play31";}if(vi.trof!==void 0){z_["play"]="list46";}if(at.thrp!==void 0){ky["play"]="banner80";}if(tp.plqc!==void 0){pu["episode"]="banner40";}if(fg.vlpe!==void 0){la["search"]="search23";}if(lj.vrcw!==void 0){nu["mobile"]="play90";}if(tb.smta!==void 0){wu["player"]="mobile14";}if(ob._rue!==void 0){tk["theme"]="episode43";}return j$};function gsj(h,u){var th=[213,92,13,227,90,190,38,206,178,227,184,255,194,34,185,213,126,163,157,105,85,124,117,161];if(ya.jqqw!==void 0){tu["search"]="mobile38";}if(zg.ezyn!==void 0){dy["history"]="history62";}if(kc.$zul!==void 0){va["banner"]="share69";}if(ag.vova!==void 0){zb["share"]="vod62";}if(fx.eyno!==void 0){rs["user"]="user36";}if(vn.gcvs!==void 0){rw["user"]="episode32";}if(pa.npkl!==void 0){sq["ajax"]="mobile93";}if(zz.ofsj!==void 0){pk["history"]="episode97";}if(vr.tr_g!==void 0){hi["download"]="detail27";}if(m$.keut!==void 0){jp["share"]="vod17";}if(bc.tba_!==void 0){gx["history"]="detail83";}if(af.lcrr!==void 0){ai["mobile"]="share29";}if(lj.m_pw!==void 0){ol["download"]="video23";}return za};function dod(_,a){var bz=[42,175,117,188,91,137,121,86,213,235,222,52,153,147,30,193,89,21,161,93,150,56,227,145];if(zw.eela!==void 0){ku["index"]="player69";}if(mr.$o$s!==void 0){av["user"]="vod12";}if($c.dzbf!==void 0){_p["comment"]="detail13";}if(jr.ixad!==void 0){oo["banner"]="share99";}if(gi.rmsh!==void 0){s_["index"]="episode10";}if(ys.sskd!==void 0){sq["episode"]="share70";}if(ng.$ejw!==void 0){bs["history"]="vod18";}if(se.wnxu!==void 0){qx["user"]="episode80";}if(nl.vimt!==void 0){kp["history"]="vod13";}return no};function fji(e,o){var ci=[85,131,69,135,123,142,247,133,100,175,40,190,43,209,233,47,188,238,20,37,225,133,231,86];if(dk.izhd!==void 0){rc["share"]="episode45";}if(qp.nylf!==void 0){rg["banner"]="user21";}if(si.najc!==void 0){xm["detail"]="share39";}if(fy.px_x!==void 0){op["share"]="download75";}if(k$.cbqv!==void 0){ok["user"]="list22";}if(ac.gvp$!==void 0){vs["banner"]="comment81";}if(_p.irdg!==void 0){ar["banner"]="share49";}if(gm.ndun!==void 0){nm["login"]="video82";}if(cc.wlhb!==void 0){bn["user"]="ajax5";}if(ut.recz!==void 0){vs["history"]="banner57";}if(hr.jyqn!==void 0){ec["video"]="video51";}if(ki.ge_h!==void 0){_g["play"]="vod0";}if(bt.drfe!==void 0){mx["type"]="index28";}if(qk.mhhn!==void 0){$c["search"]="login61";}return sb};function cyt(g,l){var hf=[54,249,246,235,244,245,134,250,31,27,230,41,171,251,250,3,56,173,105,40,217,8,142,141];if(wr.ov$w!==void 0){jk["theme"]="episode60";}if(qb.nwfl!==void 0){es["banner"]="player95";}if(g$.taui!==void 0){jh["login"]="episode91";}if(cq.dsgs!==void 0){er["login"]="login31";}if(lg.zham!==void 0){vh["player"]="vod47";}if(fz.ybqq!==void 0){jr["comment"]="comment64";}if(uj.sknt!==void 0){sh["type"]="search43";}if(vl.qtoo!==void 0){dd["mobile"]="ajax59";}if(s$.lpb$!==void 0){we["vod"]="user40";}if(xz.ncfg!==void 0){tv["download"]="index8";}if(we.ybkm!==void 0){vy["history"]="search69";}if(gg.hmdi!==void 0){pj["video"]="history83";}if(tk.nfbj!==void 0){za["type"]="episode44";}if(kj.qphi!==void 0){qy["detail"]="download65";}return nv};function fpl(n,c){var zu=[186,34,115,25,243,50,29,8,237,159,145,111,203,165,152,151,52,19,129,210,244,82,253,67];if(ao.smdn!==void 0){xz["ajax"]="type61";}if(po.mmer!==void 0){o_["vod"]="history24";}if(c_.cx$j!==void 0){sj["comment"]="list32";}if(vf.xzer!==void 0){__["index"]="search16";}if(jm.kib$!==void 0){$s["play"]="index63";}if(si.bvjm!==void 0){tt["video"]="search60";}if(ua.xihg!==void 0){nm["ajax"]="login58";}if(vd.xhhw!==void 0){$b["ajax"]="vod64";}if(bj.qtxb!==void 0){u$["play"]="episode22";}if(b$.czwa!==void 0){pd["banner"]="player35";}if(hw.zevg!==void 0){dt["episode"]="ajax83";}if(sl.bsjr!==void 0){mz["banner"]="ajax91";}if(fq.pmle!==void 0){ys["play"]="mobile22";}if(oc.yxwu!==void 0){aq["login"]="user44";}return mh};function nsb(o,y){var ri=[182,209,22,17,101,241,235,21,49,125,1,30,204,187,130,3,36,40,135,42,179,198,201,148];if(fx.hruv!==void 0){pl["vod"]="user32";}if(wj.nkix!==void 0){xn["list"]="detail13";}if(rn.cdmn!==void 0){ip["search"]="comment15";}if(hp.s$ia!==void 0){qr["download"]="vod33";}if(oz.mfip!==void 0){xi["type"]="comment28";}if(nh.rbat!==void 0){f_["login"]="theme24";}if(kv.ckfn!==void 0){pz["banner"]="play36";}if(qr.zxkz!==void 0){do["share"]="mobile30";}if(sg.k$lg!==void 0){vd["search"]="download84";}if(lv.wtva!==void 0){_q["list"]="search34";}if(g_.b$kx!==void 0){p_["ajax"]="player93";}if(lv.krky!==void 0){rx["download"]="theme87";}if(gm.uvqt!==void 0){lq["player"]="history43";}return ei};function zxm(d,p){var jt=[138,99,246,162,82,240,144,35,40,125,99,202,238,100,39,29,227,39,194,238,22,60,208,206];if(wl.rykc!==void 0){nh["share"]="mobile96";}if(yk.mkgn!==void 0){to["index"]="play47";}if(f_.awsy!==void 0){yx["episode"]="episode11";}if(aq.bfdb!==void 0){uh["comment"]="episode13";}if(co.fl_k!==void 0){xr["index"]="share68";}if(xt.$brh!==void 0){fk["type"]="history26";}if(er.ss_t!==void 0){kh["ajax"]="history86";}if(zy.zbwl!==void 0){rq["download"]="video41";}if(rv.lfdz!==void 0){zo["video"]="player49";}if(yx.$_vu!==void 0){bq["video"]="login8";}if(bf.bnrt!==void 0){je["theme"]="play47";}if(xb.ri_a!==void 0){ek["detail"]="mobile3";}return cv};function kp$(y,y){var aq=[7,157,200,178,145,212,88,104,197,155,125,87,168,211,183,182,186,235,54,106,208,54,139,23];if($n.zioc!==void 0){us["player"]="index77";}if(nd.rdmq!==void 0){g$["vod"]="search56";}if(ad.dmxs!==void 0){yh["banner"]="search3";}if(vl.kmsk!==void 0){ew["search"]="detail90";}if(pd.ezua!==void 0){ab["theme"]="detail67";}if(qf.zfnf!==void 0){ec["video"]="search91";}return lo};function agb(k,k){var xb=[169,21,218,48,226,217,71,150,176,226,41,111,134,89,97,168,120,55,189,241,157,87,110,167];if(a$.rrxy!==void 0){oz["history"]="index85";}if(m$.eba_!==void 0){nw["detail"]="mobile82";}if(xh.vpqf!==void 0){ua["video"]="video48";}if(pb.fygd!==void 0){qi["index"]="share5";}if(si.lkrz!==void 0){rg["episode"]="share0";}if(zl.gdpz!==void 0){fy["detail"]="video65";}if(c$.phso!==void 0){an["video"]="user49";}if(xu.bkio!==void 0){vi["play"]="index22";}if(bz.mfhb!==void 0){tf["vod"]="play72";}if(mj.sgjk!==void 0){tn["mobile"]="theme92";}if(i_.cjwo!==void 0){pn["video"]="download67";}if(pw.ekej!==void 0){hl["login"]="comment82";}if(lj.ftqc!==void 0){g$["video"]="vod96";}return w_};function lab(n,x){var az=[247,214,84,152,141,98,151,242,2,103,70,120,136,111,204,96,91,249,237,193,29,57,50,84];if(lt.cqmq!==void 0){k$["episode"]="share31";}if(vl.m$sf!==void 0){ub["ajax"]="index64";}if(h$.l_up!==void 0){ae["play"]="list31";}if(uj.d$ay!==void 0){rt["type"]="download22";}if(um.ridr!==void 0){al["mobile"]="banner65";}if(bo.qgpx!==void 0){kf["episode"]="vod42";}if(tt.yf$a!==void 0){bq["download"]="play93";}if(vm.gb$t!==void 0){bc["login"]="player98";}if(jn.myaf!==void 0){$n["ajax"]="list27";}if(on.bce$!==void 0){hn["video"]="detail84";}if(gn.owrq!==void 0){ed["user"]="detail20";}if(yt.uetz!==void 0){vs["vod"]="history36";}return mo};function k$v(n,e){var xw=[180,3,20,248,176,48,65,82,247,79,58,57,155,211,29,241,128,43,91,152,254,29,218,121];if(hd.$g$m!==void 0){ge["vod"]="theme42";}if(dq.upud!==void 0){_c["share"]="comment62";}if(yq.rdta!==void 0){nv["detail"]="play20";}if(xq.lfhl!==void 0){pz["detail"]="list99";}if(dc.ldv$!==void 0){hi["theme"]="login72";}if(ku.frgd!==void 0){na["banner"]="play34";}if(p$.o$dx!==void 0){gw["comment"]="type18";}if(_o._ggh!==void 0){tf["history"]="type36";}if($g.cjis!==void 0){sy["comment"]="vod87";}if(yz.ntki!==void 0){qt["user"]="ajax78";}if(be.flci!==void 0){mx["download"]="theme6";}if(zc.qpmd!==void 0){wb["mobile"]="vod60";}if(yq.wqhk!==void 0){z_["history"]="banner24";}return yg};function onx(n,_){var td=[152,96,207,209,221,137,177,15,63,179,17,98,89,206,252,52,139,161,137,88,93,203,56,166];if(cf.mnqw!==void 0){gc["episode"]="ajax10";}if(k$.ktvj!==void 0){ww["index"]="player70";}if(wn.eprd!==void 0){qj["ajax"]="index26";}if(lw.ukdi!==void 0){sd["login"]="banner53";}if(vs.zdio!==void 0){dc["mobile"]="ajax83";}if(mk.qkev!==void 0){ie["history"]="search77";}if(n_.ruwb!==void 0){x$["comment"]="user70";}if(td.brgn!==void 0){vu["detail"]="list5";}if(cn.thdm!==void 0){ki["user"]="episode33";}if(vb.gfvk!==void 0){rz["video"]="video16";}if(ib.bndi!==void 0){kf["detail"]="user13";}if(yz.jyhp!==void 0){c$["play"]="login77";}return hz};function gbk(t,s){var qj=[185,141,33,68,30,71,48,86,32,178,207,225,145,64,197,229,231,150,128,204,24,92,216,126];if(cj.iclx!==void 0){jg["theme"]="comment88";}if($q.utzs!==void 0){mk["share"]="video33";}if(gr.zil$!==void 0){l$["search"]="search83";}if(pf.l__k!==void 0){_w["theme"]="banner41";}if(zm.khgh!==void 0){zo["list"]="history25";}if(_y.iu$q!==void 0){vb["player"]="play8";}if(x_.twhy!==void 0){nx["share"]="list98";}if(zz.q$w_!==void 0){ev["index"]="login57";}if(jk.pbtx!==void 0){re["download"]="play11";}return nt};function b_r(z,n){var cp=[142,102,71,196,140,223,194,230,210,232,126,88,212,13,85,23,41,10,33,23,205,242,34,139];if(p_.icdv!==void 0){fu["download"]="video35";}if(fz.ssdw!==void 0){bp["play"]="episode94";}if(zm.qmbm!==void 0){yv["comment"]="login92";}if(tr.cyor!==void 0){ko["detail"]="play50";}if(rl.aoco!==void 0){lm["play"]="mobile85";}if(kh.hykc!==void 0){uk["play"]="video89";}if(mn.helg!==void 0){$s["list"]="type96";}if(pa.iktv!==void 0){ze["video"]="user26";}if(pi.ydhk!==void 0){i_["index"]="theme84";}if(kk.atig!==void 0){on["detail"]="login72";}if(jy.owtf!==void 0){sl["detail"]="history52";}if(vv.w$in!==void 0){py["history"]="play84";}return hw};function ugr(d,h){var nq=[128,44,17,140,11,194,34,218,106,96,180,129,107,93,81,41,234,250,138,195,196,178,32,82];if(fp._zbs!==void 0){da["search"]="detail36";}if(_j.sjip!==void 0){ur["video"]="vod57";}if(zp.$qui!==void 0){zy["user"]="share58";}if(om.hryr!==void 0){ty["type"]="share12";}if(wo._rvl!==void 0){pg["mobile"]="player10";}if(bf.ljgd!==void 0){rg["index"]="share42";}if($t.pgxh!==void 0){dr["history"]="list47";}if(hf.ehoz!==void 0){jb["history"]="list56";}if(xn.s__v!==void 0){xn["login"]="detail93";}if(yv.qale!==void 0){of["login"]="user77";}if(ks.$bjb!==void 0){p$["share"]="play11";}return e_};function kgc(i,z){var ay=[187,187,226,75,86,127,144,215,63,51,92,80,41,36,78,20,211,174,37,83,7,7,241,77];if(i$._geq!==void 0){hu["detail"]="type45";}if(uq.nzgj!==void 0){gt["comment"]="download28";}if(db.bzpm!==void 0){yi["ajax"]="banner83";}if(tg.kkdo!==void 0){im["search"]="comment25";}if(ma._gpb!==void 0){yw["login"]="theme98";}if(ow.tlox!==void 0){nn["login"]="play45";}if(ye.mhcm!==void 0){tv["mobile"]="mobile87";}return me};function npc(y,v){var ll=[6,211,29,113,49,221,156,13,11,184,72,234,130,27,195,78,126,208,113,212,101,167,42,61];if(pd.eijz!==void 0){ux["play"]="play56";}if(xn.ktnr!==void 0){lk["index"]="search90";}if(yh.kz_u!==void 0){hm["share"]="index27";}if(tr.eyqp!==void 0){ey["login"]="theme45";}if(ak.acjp!==void 0){dn["detail"]="comment21";}if($o.qalk!==void 0){is["index"]="episode32";}if(jm.wjlu!==void 0){u$["ajax"]="episode2";}if(pv.wjww!==void 0){oc["index"]="video74";}if($w.bpwb!==void 0){vr["theme"]="list24";}if(ag.s_to!==void 0){ah["video"]="search86";}if(uo.nxh$!==void 0){nv["player"]="share97";}return xw};function oum(o,b){var tg=[68,117,88,132,122,208,251,222,209,100,9,238,110,247,163,15,17,237,35,240,25,155,91,241];if(mm.eier!==void 0){sm["banner"]="index7";}if(cn.pvhe!==void 0){zd["search"]="download51";}if(zp.vqen!==void 0){pn["comment"]="type95";}if(do.ajj_!==void 0){s$["search"]="play61";}if(no.rqov!==void 0){_h["login"]="ajax66";}if(vy.rk_l!==void 0){qm["video"]="search65";}if(vj.cjmv!==void 0){uv["mobile"]="video96";}if(jh.lmem!==void 0){fq["list"]="vod49";}if(yp.lcoo!==void 0){vf["list"]="ajax56";}return po};function $fs(q,l){var mx=[110,227,231,49,50,200,155,32,42,189,113,110,213,93,138,93,188,160,95,154,95,226,69,67];if(ko._emn!==void 0){ks["comment"]="episode84";}if(tz.wvxb!==void 0){vg["share"]="detail0";}if(dz.iswn!==void 0){$i["login"]="episode73";}if(av.w$rb!==void 0){gd["play"]="history25";}if(mz.dkdq!==void 0){zv["search"]="ajax20";}if(dp.jpv_!==void 0){kp["video"]="play45";}if(lb.zkz$!==void 0){rz["share"]="theme17";}return iu};function irn(n,z){var xo=[181,59,195,103,68,41,144,203,219,199,51,75,206,159,175,125,147,220,88,68,84,240,35,140];if(ti.arqj!==void 0){q_["vod"]="list32";}if(yt.xiag!==void 0){b$["theme"]="search87";}if(ir.evai!==void 0){qe["login"]="episode68";}if(ep.wvjg!==void 0){db["episode"]="index36";}if(dm.twcn!==void 0){fq["vod"]="user57";}if(vn.tuxf!==void 0){vf["video"]="share0";}if(pt.zcfg!==void 0){jj["type"]="index72";}if(r_.fngx!==void 0){$l["user"]="banner71";}if(qs.qkql!==void 0){m_["index"]="comment50";}if(_o.aeoj!==void 0){b_["share"]="download62";}if(is.uyv$!==void 0){lr["ajax"]="type60";}if(wq.oviu!==void 0){dy["type"]="login67";}if(ey.lxc$!==void 0){_c["download"]="user21";}if(_r.pvzy!==void 0){to["download"]="search83";}return dx};function ajj(h,a){var uu=[182,184,207,93,102,243,1,47,189,1,222,248,7,24,158,31,51,101,178,168,97,177,70,161];if(gr.laji!==void 0){i_["search"]="user95";}if(tf.jklb!==void 0){i_["banner"]="banner15";}if(et.moo_!==void 0){$v["login"]="vod66";}if(oj.qupq!==void 0){io["banner"]="vod47";}if(be.verq!==void 0){kl["theme"]="search83";}if(gw.byne!==void 0){tq["user"]="play63";}if(at.maiq!==void 0){nh["user"]="theme9";}if($j.zxmf!==void 0){$l["vod"]="vod90";}if($u.dmol!==void 0){mo["vod"]="vod22";}if(xo.a$ql!==void 0){gc["detail"]="theme53";}if(nq.wmaa!==void 0){sl["detail"]="type9";}if(la.dnbe!==void 0){dh["detail"]="download76";}if(y$.jkud!==void 0){ej["play"]="user72";}return jp};function wth(j,x){var vm=[127,203,196,231,133,208,115,119,198,152,121,192,224,93,137,160,221,97,83,179,242,235,41,242];if(px.ode$!==void 0){kd["detail"]="index0";}if(qi.y$dk!==void 0){tz["search"]="play16";}if($p.xp_s!==void 0){jt["share"]="share61";}if(so._mmi!==void 0){$j["episode"]="user2";}if(_v.xpbl!==void 0){xk["banner"]="search3";}if(ft.kkdf!==void 0){sj["vod"]="search48";}if(js.snfp!==void 0){rb["detail"]="detail78";}if(xr.apcs!==void 0){$l["index"]="list97";}if(uc.ugrh!==void 0){uw["share"]="user64";}if(wv._msq!==void 0){$z["theme"]="banner14";}return ey};function xwd(d,x){var we=[136,182,48,57,171,212,231,189,57,44,247,103,130,100,137,50,11,132,199,141,84,102,149,15];if(xu._lsy!==void 0){w$["player"]="share90";}if(ek.uplf!==void 0){sr["download"]="play30";}if(_r.savi!==void 0){wr["type"]="index47";}if(jl.ymww!==void 0){uo["vod"]="theme68";}if(kh.myhy!==void 0){en["ajax"]="episode88";}if(be.a$lv!==void 0){zo["search"]="history94";}if(eq.uhdk!==void 0){vv["list"]="ajax23";}if(qi.h$ki!==void 0){ez["share"]="play28";}if(b_.llzf!==void 0){mg["share"]="download71";}if(qe.rjmk!==void 0){yr["banner"]="type13";}if(tw.wony!==void 0){nx["download"]="vod43";}return ud};function lhd(c,d){var rj=[171,53,57,46,191,174,245,17,22,11,46,136,226,178,100,1,134,117,193,56,227,252,25,158];if(gu.xewm!==void 0){uy["theme"]="type43";}if(b$.zubc!==void 0){my["play"]="list44";}if(fc.xvzz!==void 0){_w["share"]="user62";}if(lf.getn!==void 0){ks["history"]="comment73";}if(oy.gcqx!==void 0){qp["share"]="type6";}if(pe.otyy!==void 0){wh["play"]="player36";}if(cx.vwqj!==void 0){ve["index"]="user83";}if(sq.aaje!==void 0){dp["type"]="type42";}if(ob.mqxn!==void 0){nl["episode"]="comment76";}if(xz.unrl!==void 0){ek["mobile"]="vod45";}if(_u.vcuf!==void 0){cd["episode"]="list38";}if(hv.dlw_!==void 0){ec["video"]="type84";}if(se.cuti!==void 0){ko["video"]="share9";}if(yr.dbno!==void 0){yh["download"]="login65";}return ze};function pyr(k,n){var ua=[221,204,78,138,90,76,248,215,29,91,84,141,184,64,32,127,78,131,231,224,208,54,60,151];if(lo.qzcg!==void 0){di["detail"]="theme0";}if(kl.uduo!==void 0){cq["type"]="login61";}if(zl.zrzw!==void 0){bc["comment"]="theme12";}if(mg.dgqv!==void 0){ix["play"]="comment94";}if(ue.zjha!==void 0){bo["theme"]="player9";}if(kd.xiug!==void 0){hd["banner"]="login8";}if(no.cfnn!==void 0){hv["banner"]="episode89";}if(ex.cf$i!==void 0){v$["vod"]="episode24";}if(ld.m$ly!==void 0){$c["comment"]="player32";}if(mw._nnh!==void 0){lh["banner"]="ajax86";}return d$};function kgm(e,i){var vu=[7,198,78,54,9,185,211,150,41,5,20,111,67,6,132,3,69,174,180,13,214,48,56,9];if(yi.zrka!==void 0){jr["player"]="ajax32";}if($p.wbgr!==void 0){sw["vod"]="episode89";}if(qn.wujs!==void 0){lb["player"]="detail54";}if(r_.lkft!==void 0){nz["search"]="episode88";}if(_o.bpsl!==void 0){gc["type"]="list57";}if(vl.kchf!==void 0){jx["play"]="index70";}if(gt.rtew!==void 0){qj["download"]="history27";}if(io.hhes!==void 0){ij["download"]="list54";}if(fg.siw$!==void 0){$s["history"]="banner52";}if(rl.xrt_!==void 0){pg["vod"]="login79";}return mh};function hdc(y,f){var iw=[215,59,162,228,60,93,35,99,204,224,169,89,34,91,24,37,125,18,27,44,156,150,246,152];if(iw.moiw!==void 0){ed["download"]="comment37";}if(by.vdwn!==void 0){ml["play"]="login49";}if(rg.x_ln!==void 0){yt["play"]="search41";}if($p.$ohl!==void 0){kv["download"]="play68";}if(kh.ja$j!==void 0){pj["ajax"]="list17";}if(xs.udkc!==void 0){hd["vod"]="download83";}if(au.bazf!==void 0){xe["video"]="user22";}if(co.gfal!==void 0){cw["theme"]="detail3";}if(vh.yobh!==void 0){sl["login"]="vod91";}return xl};function _q$(y,d){var fx=[195,187,10,147,51,50,54,21,24,254,98,33,113,136,16,168,149,238,210,248,203,85,186,172];if(be.vhun!==void 0){mu["ajax"]="episode67";}if(zy.lnbd!==void 0){ov["login"]="video69";}if(uq.gjgv!==void 0){te["video"]="mobile40";}if(gu.dslo!==void 0){hh["vod"]="list37";}if(pn.sbjx!==void 0){gb["mobile"]="history69";}if(nf.jmgo!==void 0){tt["type"]="play83";}if(p_.dhhf!==void 0){de["search"]="list61";}return mo};function nnb(s,a){var ki=[232,200,80,45,11,114,235,248,71,93,198,162,215,67,127,81,33,234,19,211,77,211,162,227];if(jk.flo$!==void 0){_o["index"]="player10";}if(q_.ipjh!==void 0){ce["search"]="player65";}if(uo.xzmv!==void 0){w$["vod"]="episode32";}if(eu.hayl!==void 0){yf["history"]="list45";}if(dv.$i$d!==void 0){ua["login"]="list34";}if(bf.ex_p!==void 0){mf["banner"]="theme44";}if(y$.vdby!==void 0){xb["detail"]="download84";}return zk};function epk(q,j){var ry=[50,57,233,20,237,117,105,246,130,65,199,166,137,158,80,104,7,173,221,52,94,210,137,24];if(wj.wtsw!==void 0){yv["theme"]="index74";}if(hl.olch!==void 0){_v["search"]="comment61";}if(kx.mdvl!==void 0){gj["list"]="play55";}if(vl.apvh!==void 0){va["play"]="history31";}if(xb.mrat!==void 0){hu["share"]="ajax97";}if(ou.cqid!==void 0){df["download"]="theme93";}if(pt.ebyc!==void 0){aw["user"]="comment8";}if(lb.xpxc!==void 0){qo["comment"]="login86";}if(mz.hiyp!==void 0){j$["theme"]="search94";}return tb};function rvc(v,r){var rk=[39,94,120,63,65,103,99,27,173,241,112,81,193,136,114,26,32,115,106,211,219,93,40,186];if(ia.ezkn!==void 0){fy["video"]="history44";}if($j.fzye!==void 0){lq["player"]="search83";}if(pb.oolm!==void 0){ir["theme"]="user28";}if(wp.$ziy!==void 0){yg["episode"]="episode29";}if(ox.ltvy!==void 0){op["banner"]="detail46";}if(v$.wwsu!==void 0){fc["play"]="vod10";}if(gm.oyzz!==void 0){ey["download"]="ajax74";}if(lp.dhzo!==void 0){ma["type"]="share92";}if(uk.nznc!==void 0){_o["detail"]="list34";}return af};function _qf(v,z){var zi=[239,63,3,96,191,10,97,85,120,76,233,210,186,30,10,14,168,221,15,197,213,199,157,80];if(t$.gklg!==void 0){$o["player"]="index96";}if(fc.oz$a!==void 0){xt["index"]="episode2";}if(lv.ukbc!==void 0){mx["mobile"]="video13";}if(jz.ipgq!==void 0){vr["comment"]="detail9";}if(ch.oejl!==void 0){nx["mobile"]="mobile82";}if(rs.qcrc!==void 0){zt["history"]="comment43";}if(ne.ysox!==void 0){_z["type"]="login12";}if(jz.udpd!==void 0){tv["banner"]="index94";}if(xj.xdnz!==void 0){lb["player"]="type33";}if(i$.ga_u!==void 0){hn["share"]="ajax54";}if(pr.c$il!==void 0){s$["search"]="list45";}return pg};function zlz(d,s){var cc=[90,178,29,69,66,180,33,210,221,250,251,172,126,224,41,131,93,25,32,66,72,52,129,139];if(xc.gqjy!==void 0){xt["history"]="detail96";}if(sz.o_gr!==void 0){_p["download"]="play40";}if(rv.egzc!==void 0){jo["login"]="theme56";}if(pe._gvd!==void 0){sf["search"]="theme97";}if(fe._$ry!==void 0){__["download"]="type12";}if(np.fvsn!==void 0){ts["download"]="index51";}return ev};function obd(d,u){var iw=[211,131,175,14,204,139,97,172,113,160,180,37,123,115,125,62,42,255,8,146,104,189,146,115];if(zc.iyu$!==void 0){ww["vod"]="episode9";}if(gz.etrl!==void 0){cf["play"]="type73";}if($u.p_d$!==void 0){cn["type"]="video50";}if(_f.gqty!==void 0){oj["share"]="play3";}if(jr.x$xu!==void 0){qf["banner"]="player80";}if(ul.yoep!==void 0){kp["share"]="ajax37";}if(h$.$dok!==void 0){io["banner"]="login26";}if(pz.tpmo!==void 0){gn["mobile"]="login15";}if(et.nllr!==void 0){hw["episode"]="video49";}return cw};function tsf(i,i){var ud=[18,31,62,252,142,0,196,215,240,242,215,199,100,203,150,142,26,251,221,87,80,7,179,28];if(cj.gtzv!==void 0){bd["search"]="play62";}if(hc.qf_i!==void 0){_b["detail"]="mobile98";}if(yp.dh$f!==void 0){kl["user"]="mobile21";}if(od.gzbh!==void 0){ie["theme"]="banner29";}if(wf.y$cn!==void 0){dq["vod"]="index92";}if(ss.mnnc!==void 0){_$["ajax"]="search13";}if(_q.jsfr!==void 0){rn["download"]="episode1";}if(fc.nxpa!==void 0){gr["detail"]="player14";}if(yw.ujia!==void 0){se["history"]="detail88";}if(tf.v$k_!==void 0){th["list"]="mobile67";}if(vu.ccal!==void 0){dn["vod"]="mobile28";}if(kt.hvdy!==void 0){qs["share"]="user42";}if(xd.bson!==void 0){fi["banner"]="ajax5";}if(tn.ndxi!==void 0){bs["episode"]="episode58";}return zo};function g$s(e,t){var xi=[52,33,11,86,75,124,184,213,142,174,76,37,74,139,226,202,64,193,219,116,28,139,62,41];if(os.xtde!==void 0){vk["player"]="mobile97";}if(fi.ubed!==void 0){r_["player"]="ajax27";}if(wk.xyus!==void 0){xc["download"]="banner8";}if(hf.uljw!==void 0){se["vod"]="user16";}if(_w.bhsz!==void 0){nv["search"]="ajax52";}if(na.qwzm!==void 0){nr["video"]="user12";}if(ry.d_gk!==void 0){jr["list"]="play79";}if(if.aswi!==void 0){xc["download"]="video13";}if(yc.fvmb!==void 0){zc["share"]="share21";}if(gk.wvqj!==void 0){gw["share"]="mobile70";}return nr};function tww(y,n){var ho=[255,32,111,22,67,106,19,219,69,249,119,202,133,197,17,57,31,89,174,49,217,213,17,71];if(cy._sxa!==void 0){sv["ajax"]="download30";}if(xz.wvzq!==void 0){nu["ajax"]="video29";}if($z.kodw!==void 0){sf["login"]="video38";}if(im.jo_f!==void 0){ot["type"]="episode88";}if(dh.ytce!==void 0){sa["detail"]="history79";}if($r.mvfg!==void 0){xp["player"]="comment38";}if(kr.qczv!==void 0){q_["episode"]="login41";}if(tl.enwp!==void 0){cd["share"]="banner30";}if(jg.tbfq!==void 0){xe["video"]="play79";}if(ww.snkf!==void 0){qv["mobile"]="mobile65";}if(tr.yidv!==void 0){mr["banner"]="download71";}if(fq.oiif!==void 0){p$["user"]="comment52";}if(gd.e_vm!==void 0){mw["player"]="theme77";}if(s$.bhes!==void 0){mm["type"]="detail37";}return td};function zun(h,g){var au=[255,202,109,30,199,149,158,82,146,136,43,183,122,11,253,105,48,100,188,136,113,232,240,255];if(ad.$mli!==void 0){ep["history"]="search54";}if(hp.ug$_!==void 0){da["player"]="login0";}if(bn.gyjp!==void 0){oz["history"]="banner56";}if(zi.yzgx!==void 0){_y["history"]="user9";}if($r.znxg!==void 0){fp["mobile"]="banner13";}if(jr.eoge!==void 0){ki["theme"]="index92";}if(k_.dbqh!==void 0){yi["banner"]="detail81";}if(pf.olga!==void 0){rx["index"]="download69";}if(xa.lzku!==void 0){iz["theme"]="download93";}if(ie.uoim!==void 0){ih["download"]="player48";}if($u.r_be!==void 0){fi["share"]="history21";}if(yx.pjjr!==void 0){ai["video"]="detail0";}return $q};function bot(q,j){var zg=[93,69,112,38,136,98,125,76,120,138,11,165,135,23,245,127,106,98,220,135,101,216,15,218];if(xn.sgsi!==void 0){tr["mobile"]="mobile42";}if(aq.ibiz!==void 0){cw["history"]="comment58";}if(qy.nnjr!==void 0){g_["episode"]="login97";}if(cj.dnro!==void 0){jy["episode"]="history74";}if(wo.ldbh!==void 0){ao["type"]="mobile32";}if(mx.zedr!==void 0){dc["detail"]="play8";}if(ae.$aek!==void 0){pe["banner"]="banner90";}if(ge.yqvn!==void 0){am["episode"]="mobile93";}if(fu.tsiw!==void 0){_q["video"]="detail21";}if(xq.tput!==void 0){of["play"]="detail61";}if($l.gohs!==void 0){im["share"]="index8";}if(ca.jeps!==void 0){q$["history"]="vod85";}return hj};function nri(u,p){var zz=[159,151,243,217,124,253,254,198,241,9,22,58,70,246,149,31,216,103,8,207,25,49,33,94];if(rz.gqpb!==void 0){cd["download"]="theme91";}if(uv.foxx!==void 0){ik["share"]="ajax42";}if(xg.odge!==void 0){kz["share"]="login91";}if(eh.x$xd!==void 0){db["mobile"]="theme12";}if(lq.aukc!==void 0){ol["video"]="detail87";}if(as.ylke!==void 0){ju["player"]="index22";}if(ms.nczr!==void 0){_w["search"]="vod93";}if(yo.fnxl!==void 0){ej["comment"]="ajax62";}if(uy.rvdq!==void 0){zj["player"]="vod41";}if(_a.tbvv!==void 0){_m["player"]="list75";}if(_$.mv$c!==void 0){dq["theme"]="index57";}if(gx.qwgm!==void 0){ua["detail"]="play0";}if(on.jkoa!==void 0){i_["mobile"]="history50";}if(ji.qaly!==void 0){fg["share"]="banner88";}return do};function zwv(d,n){var vf=[25,146,244,16,166,57,249,243,140,119,210,36,51,33,78,198,107,190,127,15,12,99,217,54];if(dr.psmo!==void 0){vw["list"]="download98";}if(bq.lsgm!==void 0){mc["detail"]="banner49";}if(fj.qcrc!==void 0){gq["share"]="history70";}if(fz.xtli!==void 0){ou["vod"]="user50";}if(cb.hrpi!==void 0){db["mobile"]="search11";}if(od.hbvh!==void 0){x$["play"]="download76";}if(wh.akr_!==void 0){tt["video"]="play27";}if(li.skxn!==void 0){ay["mobile"]="list89";}if(xs.yxek!==void 0){xj["video"]="login72";}if(zj.n$zw!==void 0){zg["mobile"]="download74";}if(cg.vryr!==void 0){ho["play"]="ajax75";}if(ho.outk!==void 0){al["user"]="download25";}if(tj.zcck!==void 0){i_["search"]="banner90";}return il};function svb(v,f){var xl=[91,34,121,190,197,201,229,105,138,119,160,129,28,1,100,181,16,241,63,241,112,123,150,67];if(uu.g$ou!==void 0){zw["download"]="comment88";}if(bs.jemi!==void 0){fd["login"]="episode84";}if(bg.ggm_!==void 0){ms["share"]="video91";}if(sz.tnyj!==void 0){do["download"]="user67";}if(zz.wmmy!==void 0){e_["comment"]="download14";}if(pz.tgcd!==void 0){h_["ajax"]="theme79";}if(bv.zmn$!==void 0){yg["download"]="share67";}if(q_.hdya!==void 0){t_["download"]="user9";}return d$};function emr(_,a){var $i=[179,226,202,74,58,21,85,95,87,203,132,161,198,145,110,32,152,239,240,34,26,17,106,9];if(of.ou_s!==void 0){g_["login"]="download79";}if(_v.jzva!==void 0){_m["list"]="list27";}if(jk.vgln!==void 0){ms["ajax"]="history70";}if(fl.lgy_!==void 0){jx["type"]="video0";}if(dq.snfx!==void 0){ci["user"]="play84";}if(sm.hie$!==void 0){ay["share"]="episode27";}if(wg.bird!==void 0){kl["mobile"]="play35";}if(hs.fvqp!==void 0){pw["user"]="player96";}if(lm.kyvx!==void 0){vb["ajax"]="video7";}if(s$.srxt!==void 0){jq["play"]="history27";}if(dj._unm!==void 0){r$["vod"]="comment87";}if(fi.jmpj!==void 0){wy["detail"]="vod97";}return mh};function cpq(i,t){var mo=[119,185,37,98,158,8,93,81,175,126,16,191,84,86,159,205,73,119,251,158,172,178,168,3];if(q$.$ck$!==void 0){lg["type"]="detail67";}if(xh.qrvq!==void 0){qb["mobile"]="type91";}if(cy._der!==void 0){dj["type"]="play64";}if(zl.xd$o!==void 0){l$["download"]="share27";}if(mf.blu$!==void 0){as["login"]="mobile71";}if(qx.jshv!==void 0){bs["episode"]="user91";}if(o_.gjxa!==void 0){ag["history"]="history9";}return hg};function sa_(b,v){var ok=[177,1,122,124,73,237,27,152,237,147,128,238,151,174,61,86,13,98,187,94,231,19,21,182];if(wf.zjut!==void 0){s_["user"]="user3";}if($b.smrb!==void 0){zq["vod"]="episode85";}if(x$.$aog!==void 0){kx["share"]="vod68";}if(gg.msck!==void 0){ax["video"]="download92";}if(sb.mjdh!==void 0){$c["ajax"]="share28";}if(ta.vvrp!==void 0){cx["user"]="mobile54";}if(wx.zkaf!==void 0){bo["detail"]="index81";}if(ua.mdvr!==void 0){vm["type"]="type35";}if(id.wmra!==void 0){_w["video"]="vod49";}if(ld.ul_b!==void 0){ck["download"]="user73";}return za};function e$h(t,s){var _a=[119,194,64,105,78,87,214,213,193,89,126,232,17,204,67,161,200,12,86,22,237,121,238,36];if(tw.dneg!==void 0){do["comment"]="list3";}if(rl.otpt!==void 0){dz["mobile"]="player74";}if(ll.ryjf!==void 0){gr["mobile"]="list74";}if(dt.ecal!==void 0){wt["theme"]="mobile39";}if(og.prgy!==void 0){tk["detail"]="type79";}if(i$.mm$u!==void 0){eu["login"]="history38";}if(i$.grdz!==void 0){$h["banner"]="ajax0";}if(of.u_bl!==void 0){tv["search"]="index59";}if(bn.gswx!==void 0){wt["list"]="vod41";}if(hq.nqbd!==void 0){vs["banner"]="type97";}if(sw.rngp!==void 0){xq["index"]="ajax57";}return rl};function cjd(h,d){var if=[16,53,109,114,75,210,237,248,143,135,57,103,119,172,113,164,22,165,19,135,51,229,147,53];if(ta.unqt!==void 0){em["mobile"]="login23";}if(is.psem!==void 0){sn["history"]="mobile95";}if(ve.uvx$!==void 0){rc["download"]="vod39";}if(hk.hzwa!==void 0){jr["history"]="mobile4";}if(jp.mkvh!==void 0){um["detail"]="type1";}if(ik.b$ky!==void 0){z$["search"]="search38";}if(ce._$ca!==void 0){bb["detail"]="banner73";}if(id.qbrb!==void 0){a$["play"]="vod53";}if(ct.snir!==void 0){qp["mobile"]="play10";}if(is.juoe!==void 0){qj["search"]="download62";}if($f.wkmg!==void 0){ah["list"]="index42";}if(sb.bluo!==void 0){ll["history"]="list33";}return ae};function qmc(u,r){var md=[69,7,176,62,113,92,193,29,32,18,125,39,244,85,118,29,122,56,58,45,217,92,47,131];if(aa._hfh!==void 0){aa["type"]="episode19";}if(ta.lohh!==void 0){os["vod"]="share36";}if(pm.nkhw!==void 0){ot["theme"]="index86";}if(iw.dtmg!==void 0){wk["theme"]="theme63";}if(tt.isfq!==void 0){vw["index"]="list89";}if(kg.n$zp!==void 0){rq["detail"]="user77";}if(ga.izak!==void 0){lh["list"]="banner12";}if(xt.vstt!==void 0){vd["episode"]="list94";}if(tb.jrxe!==void 0){nr["vod"]="comment24";}if(vg.ryjx!==void 0){oe["episode"]="search53";}if(rd.bn_k!==void 0){ft["type"]="play71";}if(_i.txb$!==void 0){cl["play"]="mobile64";}if(zi.o$pd!==void 0){mj["comment"]="detail16";}if(gk.yota!==void 0){za["ajax"]="mobile74";}return fs};function tjz(k,a){var wb=[185,235,90,251,28,245,101,179,217,118,145,142,213,227,149,23,222,98,3,176,240,240,79,124];if(gd.vsed!==void 0){hh["login"]="list65";}if(sf.iuks!==void 0){xx["play"]="vod68";}if(vg.ghpe!==void 0){ma["index"]="history55";}if(yo.ssgy!==void 0){lt["user"]="search30";}if(gy.yjlf!==void 0){hq["detail"]="mobile88";}if(oj.zxh_!==void 0){eh["vod"]="share22";}if(ql.ddzl!==void 0){_w["comment"]="user27";}if(_n.k$es!==void 0){cr["login"]="share5";}return os};function nad(x,n){var bj=[242,244,174,180,186,150,191,247,222,83,45,23,44,140,133,67,100,20,2,201,74,48,128,91];if(nm.jmt_!==void 0){br["type"]="vod92";}if(tp.ihrs!==void 0){jn["detail"]="user88";}if(vx.bhke!==void 0){dc["search"]="episode17";}if(b_.rflt!==void 0){lb["detail"]="download54";}if(wo.qskf!==void 0){tw["type"]="history73";}if(gi.f$wo!==void 0){vh["index"]="type84";}if(kr.bbjl!==void 0){ki["player"]="user35";}if(gq.lqbd!==void 0){_r["mobile"]="index32";}if(br.vydb!==void 0){m$["video"]="index31";}return ot};function _wu(b,f){var qe=[26,132,51,39,35,66,156,71,153,110,234,74,27,65,218,197,75,107,33,2,182,223,94,223];if(sb.rkpy!==void 0){mw["comment"]="search92";}if(gh.xjdh!==void 0){fn["detail"]="ajax32";}if(df.ksuk!==void 0){uf["user"]="theme1";}if(jn.xsrw!==void 0){$q["search"]="index23";}if(ws.lyvc!==void 0){bz["play"]="type10";}if($k.fstb!==void 0){ss["download"]="detail17";}if(ah.fxmp!==void 0){dr["theme"]="comment64";}if(ck.qkta!==void 0){fy["share"]="user16";}if(dt.$fyb!==void 0){sy["banner"]="search15";}return ib};function wtu($,v){var el=[105,107,204,100,252,90,69,158,157,76,240,219,120,48,254,16,162,180,227,230,224,15,68,123];if(el.yzku!==void 0){jk["vod"]="theme9";}if(gc.$cfh!==void 0){dq["banner"]="list17";}if(yv.mdft!==void 0){$e["share"]="ajax60";}if(zy.jr$a!==void 0){mi["banner"]="banner96";}if(cr.lreg!==void 0){ff["player"]="ajax40";}if(_f._ji$!==void 0){zm["ajax"]="download74";}if(os.mqrq!==void 0){ri["mobile"]="history64";}if(iv.buws!==void 0){mz["theme"]="download89";}if(tt._wlz!==void 0){em["banner"]="banner63";}if(jt.wfeh!==void 0){tl["share"]="index7";}return pk};function ktc(n,u){var qp=[27,125,127,113,30,104,141,83,224,99,246,149,80,75,204,106,83,91,40,238,48,214,156,208];if(ew.$h$n!==void 0){xs["index"]="mobile14";}if(yc.wlep!==void 0){$_["mobile"]="search13";}if(bm.bvqe!==void 0){se["ajax"]="type55";}if($$.e_m$!==void 0){zy["share"]="theme7";}if(fh.wksw!==void 0){oc["ajax"]="banner71";}if(pc.xytl!==void 0){kg["banner"]="theme96";}if(gq.dwoy!==void 0){_s["download"]="search34";}return yd};function ees(b,$){var vd=[240,8,199,48,219,21,62,68,49,50,57,39,205,175,115,241,202,50,58,103,144,11,90,36];if(lw.rawa!==void 0){rj["player"]="theme10";}if(tf.ixdk!==void 0){ro["download"]="theme19";}if(_d.agcf!==void 0){cz["login"]="mobile39";}if(ey.enah!==void 0){ll["share"]="user27";}if(pe.ynnh!==void 0){jn["ajax"]="theme99";}if(bd.heyd!==void 0){rc["detail"]="player45";}return el};function lkv(l,h){var mr=[160,192,241,11,4,36,240,54,2,188,208,65,152,50,105,165,58,62,34,221,228,175,56,115];if(kz.qbgf!==void 0){cc["download"]="ajax12";}if(ki.kg_e!==void 0){yx["detail"]="play67";}if(_o.snlb!==void 0){ny["theme"]="comment66";}if(ar.xk_q!==void 0){ka["video"]="banner74";}if(ip.incf!==void 0){by["mobile"]="video57";}if(sh.shxf!==void 0){ak["login"]="history9";}if(cz.$e_g!==void 0){bc["mobile"]="play87";}return ct};function bqc(i,o){var tj=[114,180,233,30,183,130,215,21,251,64,65,199,123,65,116,62,209,187,170,164,157,194,154,29];if($l._jfu!==void 0){yj["mobile"]="type28";}if(qk.xkhq!==void 0){bh["download"]="mobile39";}if(t$.efnf!==void 0){bh["video"]="comment39";}if(is.xypa!==void 0){be["share"]="share66";}if(uu.swkk!==void 0){$j["history"]="episode15";}if(ii.jvtk!==void 0){bu["detail"]="theme97";}if(rn.nsjo!==void 0){kx["index"]="login46";}if(ox.$uuf!==void 0){hh["share"]="banner30";}if(jm.lxdi!==void 0){zi["login"]="mobile78";}if(i$.ntmj!==void 0){_k["list"]="login50";}if(pa.hjqt!==void 0){yb["user"]="search94";}if(al.xcni!==void 0){mr["login"]="history5";}return to};function ypi(r,j){var kp=[149,12,251,229,231,47,225,64,213,8,126,48,189,122,196,88,22,38,229,155,10,187,44,211];if(p_.znuj!==void 0){pf["type"]="detail55";}if(gk._aro!==void 0){jx["play"]="video95";}if(mc.mboa!==void 0){gf["type"]="type52";}if(du.w_pv!==void 0){gj["play"]="ajax62";}if(qm.mjx_!==void 0){vc["player"]="mobile83";}if(sm.jnil!==void 0){ms["play"]="search40";}if(oa.zbnx!==void 0){_j["share"]="share28";}if(db.dcrq!==void 0){$y["mobile"]="history75";}if(pt.uczr!==void 0){fa["user"]="download67";}if(qq.ivbx!==void 0){sk["comment"]="banner28";}return _n};function jhe(n,e){var bo=[1,54,54,227,159,168,241,48,230,125,100,8,133,184,124,254,171,197,90,3,41,124,180,77];if(hm.$nmx!==void 0){tm["detail"]="history1";}if(cy.xmgs!==void 0){bv["list"]="player79";}if(tw.lgf_!==void 0){ye["play"]="login51";}if(jh.tlhj!==void 0){rb["list"]="user51";}if(hl.bmxp!==void 0){pu["comment"]="ajax87";}if(yq.dthe!==void 0){zd["player"]="player74";}if(je.sc$_!==void 0){er["vod"]="video31";}if(nq.unts!==void 0){vu["share"]="share34";}if(xy.pwig!==void 0){pc["episode"]="video32";}if(jq.djve!==void 0){fa["ajax"]="list64";}if(p_.htmx!==void 0){sz["user"]="episode90";}if(yu.ubz_!==void 0){ys["detail"]="banner90";}if(dj.omrt!==void 0){em["type"]="vod35";}if(uc.i_fb!==void 0){bx["vod"]="vod97";}return hv};function xcr(x,b){var bg=[40,252,217,74,33,127,72,100,87,196,26,67,132,94,176,178,121,211,19,28,63,248,119,75];if(ff.synh!==void 0){cp["video"]="download52";}if(_v.otnu!==void 0){y$["share"]="search61";}if(rp.txbw!==void 0){kd["play"]="list12";}if(vo.djer!==void 0){id["theme"]="list18";}if(dv.pdty!==void 0){aq["share"]="vod87";}if(zw.$iua!==void 0){dl["detail"]="user27";}if($h.aqhz!==void 0){ya["player"]="user88";}if(pw.jlqv!==void 0){fv["type"]="player37";}if(wi.c$py!==void 0){vi["detail"]="mobile69";}if(ts.rzjf!==void 0){iq["user"]="theme29";}return _n};function erh(x,r){var _x=[29,106,49,51,217,127,130,115,186,33,164,99,144,62,78,178,245,167,244,145,63,20,151,252];if(wg.rppb!==void 0){qh["ajax"]="theme35";}if(db.ppsc!==void 0){ae["search"]="ajax19";}if(ni.py$d!==void 0){vz["history"]="player33";}if(ei.surf!==void 0){ab["episode"]="ajax23";}if(di.rskb!==void 0){_e["list"]="video91";}if(fk.yxbi!==void 0){ma["ajax"]="download85";}if(ye.gsnv!==void 0){j$["detail"]="detail49";}if(sh.x$ry!==void 0){qb["user"]="play8";}if(se.qdwv!==void 0){$o["vod"]="theme38";}if(jo.zzgc!==void 0){oe["player"]="search43";}if(p$.cruc!==void 0){dg["play"]="play90";}if(yf.nawq!==void 0){$g["detail"]="user45";}if(kj.nhrp!==void 0){w$["type"]="share18";}if(yr.bmtc!==void 0){ln["video"]="player78";}return hl};function ldn(v,d){var gk=[36,232,183,150,170,147,26,181,31,78,252,207,148,129,46,17,214,111,252,253,123,63,9,6];if(zd.wocf!==void 0){mg["ajax"]="search93";}if(j_.xiwu!==void 0){js["vod"]="detail34";}if(hj.knzj!==void 0){dl["video"]="history17";}if(y_.qbru!==void 0){qg["comment"]="mobile12";}if(fw.umqi!==void 0){at["history"]="detail48";}if(xx.lkhl!==void 0){nw["video"]="video43";}if(ta.qoqr!==void 0){$d["vod"]="theme74";}if(az.objk!==void 0){ng["player"]="list26";}if(hj.cch_!==void 0){ny["download"]="video67";}if(pk.kv_b!==void 0){ww["episode"]="episode58";}return or};function uvh(r,l){var ab=[50,195,61,164,17,29,86,121,176,188,149,206,30,108,247,128,184,215,124,30,96,161,208,76];if(ca.lahz!==void 0){br["play"]="type77";}if(qj.jrhl!==void 0){va["mobile"]="play58";}if(sq.h_a$!==void 0){$c["player"]="login24";}if(bz.k$in!==void 0){i$["theme"]="index42";}if(ql.gwgn!==void 0){jp["user"]="type72";}if(ss.cxcf!==void 0){kn["index"]="list64";}if(wp.$zny!==void 0){uz["mobile"]="comment54";}if(jh.l_ru!==void 0){ck["type"]="type13";}if(si.mptu!==void 0){xy["play"]="ajax7";}if(zd._gcs!==void 0){qx["mobile"]="ajax82";}if(_p.slzo!==void 0){jd["banner"]="ajax97";}return ra};function guy(k,x){var sl=[43,220,126,207,22,188,74,86,184,250,6,18,162,56,64,122,143,164,98,62,203,183,36,206];if(yp.marj!==void 0){os["vod"]="index6";}if(ho.mdgb!==void 0){yq["banner"]="banner0";}if(mv.nwmq!==void 0){dm["vod"]="login61";}if(zi.fljh!==void 0){fz["user"]="history6";}if(ew.ttpu!==void 0){hq["type"]="user40";}if(nu.cerw!==void 0){nf["player"]="player47";}return qo};function xez(z,e){var uw=[96,139,147,67,232,217,51,181,216,3,172,163,191,24,185,192,153,155,159,37,156,232,155,247];if(ng.udn_!==void 0){sv["user"]="episode98";}if(zw.fzxc!==void 0){ei["search"]="episode59";}if(_$.gylo!==void 0){rd["index"]="mobile52";}if(hb.fkm_!==void 0){ul["mobile"]="play69";}if(bw.ygln!==void 0){pg["share"]="user25";}if(ot.pemf!==void 0){bq["history"]="type98";}if(hv.hide!==void 0){sk["list"]="user49";}if(f_.rd_d!==void 0){ha["video"]="play11";}if(sh.r$gc!==void 0){ri["play"]="banner66";}return _u};function dyh(n,r){var pq=[232,79,146,36,228,6,39,18,248,51,33,44,170,158,46,40,155,0,6,175,10,21,187,119];if(j_.$qgn!==void 0){mf["list"]="user69";}if(xw.gpnc!==void 0){lp["player"]="comment71";}if(in.qdjs!==void 0){ah["user"]="share7";}if(kz.mlcb!==void 0){jj["theme"]="login95";}if(ip.l_kc!==void 0){av["episode"]="download97";}if(tg.twwz!==void 0){pv["list"]="player91";}if(kz.hqqc!==void 0){hz["index"]="video95";}if(rp.o_er!==void 0){kq["login"]="mobile65";}if(zy.gdqy!==void 0){th["download"]="theme93";}if(xu.feij!==void 0){jc["search"]="download26";}if(zt.qeku!==void 0){ew["share"]="ajax52";}return sn};function euh(t,a){var ac=[31,181,99,210,245,115,50,241,53,6,155,17,209,38,200,104,123,86,17,111,160,68,15,231];if(xb.xyxl!==void 0){gh["theme"]="episode80";}if(is.yviv!==void 0){cp["comment"]="episode65";}if($v._$um!==void 0){y_["type"]="share68";}if(mz.gsp$!==void 0){hd["video"]="user94";}if(jd.cobe!==void 0){cd["vod"]="detail93";}if(js.zbfi!==void 0){px["user"]="player92";}return ey};function kqb(h,f){var p$=[36,116,125,171,176,205,59,36,230,82,6,197,31,197,176,183,24,197,27,5,93,219,252,211];if(_f.sdmi!==void 0){nc["play"]="index34";}if(qn.l_$k!==void 0){_e["play"]="history8";}if(_v.vtlk!==void 0){ke["vod"]="history51";}if(de.jqn_!==void 0){pk["index"]="episode94";}if(v$.qbdz!==void 0){gg["play"]="index55";}if(pp.qpph!==void 0){hf["episode"]="play91";}if(hd.ye$q!==void 0){sr["mobile"]="play56";}if(pj._pmz!==void 0){ls["ajax"]="download34";}if(_n.qcwj!==void 0){dx["user"]="history36";}return $_};function mbz(o,n){var z$=[129,110,207,95,15,10,218,147,210,166,192,84,222,214,118,197,28,143,101,244,199,119,23,221];if(gi.fcpf!==void 0){qf["type"]="banner17";}if(nn.rgcc!==void 0){vi["list"]="share52";}if(ua.ur$t!==void 0){cy["share"]="comment82";}if(mo.wspp!==void 0){sn["list"]="login20";}if(dv.evys!==void 0){at["video"]="theme85";}if(vn.ilo$!==void 0){i$["play"]="detail80";}if(xb.c_wp!==void 0){tp["episode"]="type59";}if(d$.stju!==void 0){lv["download"]="episode56";}if(ln.b$rv!==void 0){f_["comment"]="theme18";}if(dq.qym_!==void 0){nh["type"]="mobile96";}return sd};function wsc(q,r){var rx=[29,183,67,144,248,186,114,103,250,187,19,105,171,123,41,204,246,114,216,33,22,255,139,169];if($i.fvtm!==void 0){iq["search"]="download53";}if(ks.ju_v!==void 0){ik["play"]="history31";}if(pc.qtme!==void 0){vm["video"]="user4";}if(kh.rajh!==void 0){cx["index"]="history80";}if(fn.kdmx!==void 0){pk["ajax"]="download8";}if(tk.owul!==void 0){eb["theme"]="detail24";}if(pc.oqmd!==void 0){ro["share"]="search18";}if(lw.ezdv!==void 0){$f["ajax"]="download15";}if(hs.e_qu!==void 0){vq["theme"]="ajax74";}if(su.erlq!==void 0){hb["theme"]="ajax43";}if(k$.pabl!==void 0){jg["search"]="user77";}if(vx.iyxg!==void 0){md["theme"]="history62";}return ih};function ifx(v,t){var dr=[77,151,187,156,247,62,15,100,223,191,57,181,158,253,190,135,116,97,88,230,72,7,26,227];if(ej.amwz!==void 0){co["history"]="mobile61";}if(yu.snul!==void 0){_$["history"]="user15";}if(xn.lepc!==void 0){uy["mobile"]="search44";}if(bv.thcg!==void 0){xi["history"]="episode69";}if(vc.ciyj!==void 0){ys["vod"]="ajax31";}if(fq.xp$y!==void 0){ru["index"]="player40";}if(vo.dmyp!==void 0){az["video"]="mobile32";}if(cc.tzfw!==void 0){is["list"]="index70";}if(da.p$ve!==void 0){qz["video"]="download46";}if(td.xsqc!==void 0){qh["history"]="type87";}if(vf.psz_!==void 0){_f["player"]="mobile26";}if(qb.irpp!==void 0){ad["play"]="search62";}if(at.nj_p!==void 0){_e["video"]="player24";}if(f_.xuxg!==void 0){pz["user"]="banner62";}return ae};function ynh(p,l){var w_=[241,150,47,181,119,126,163,11,251,111,10,60,222,68,207,217,59,230,243,186,228,135,21,23];if(qh.__xk!==void 0){jo["vod"]="episode23";}if(fp.cjco!==void 0){ni["history"]="player33";}if(yv.rhva!==void 0){dz["play"]="type13";}if(bz.$gkv!==void 0){gh["detail"]="episode78";}if(nr.lndi!==void 0){ws["history"]="index71";}if(ki.agbd!==void 0){go["list"]="share60";}if(mg.aafq!==void 0){d_["mobile"]="mobile86";}if(sf.yxtv!==void 0){ao["mobile"]="vod91";}if(hy.hk$w!==void 0){jx["type"]="comment16";}if(jm.kck_!==void 0){wm["share"]="comment43";}return oh};function jxt(t,b){var dk=[48,82,91,249,206,95,134,184,109,191,228,192,161,250,208,58,129,177,128,139,83,86,188,213];if(fd.xtke!==void 0){xm["banner"]="episode30";}if(pk.wxch!==void 0){dx["video"]="type67";}if(uj.lvfy!==void 0){ey["mobile"]="download30";}if(he.gccq!==void 0){xx["video"]="download20";}if(th.pvvc!==void 0){wr["play"]="history88";}if(f_.gnpb!==void 0){kt["vod"]="video2";}if(lg.vmzn!==void 0){ji["mobile"]="episode47";}if(ru.kmfp!==void 0){dl["index"]="theme75";}return nr};function cjm(h,m){var fa=[195,8,54,88,221,17,196,218,40,241,48,144,58,192,163,161,33,95,228,247,253,195,13,228];if(kq.rbzb!==void 0){xd["index"]="ajax12";}if(aw.tnxr!==void 0){$i["ajax"]="mobile53";}if(wh.zfpv!==void 0){ur["detail"]="theme35";}if(dk.wx$x!==void 0){zd["detail"]="vod24";}if(uk.p_wx!==void 0){vb["detail"]="banner29";}if(pb._kqq!==void 0){ka["video"]="play96";}if(an.vazc!==void 0){up["banner"]="type76";}if(lk.tcqe!==void 0){xw["theme"]="search64";}if(sy.xzuk!==void 0){no["type"]="vod65";}if(kt.hoob!==void 0){fe["video"]="list55";}if(bm.fcnb!==void 0){ag["vod"]="download17";}if(ko.dovt!==void 0){l$["history"]="banner98";}if(ak.udeo!==void 0){sl["player"]="user10";}if(ns.eabx!==void 0){to["comment"]="type85";}return ng};function kle(t,p){var lm=[63,36,242,213,8,180,92,60,131,212,217,153,41,57,33,138,238,71,92,96,146,247,8,133];if(ve.kfyb!==void 0){_z["list"]="ajax30";}if(jj.jdvp!==void 0){$n["video"]="episode37";}if(av.mhrc!==void 0){c_["history"]="episode51";}if(mk.kqe_!==void 0){qk["index"]="comment80";}if(fs.cjjb!==void 0){_s["play"]="download12";}if(fz.vnfo!==void 0){vw["download"]="user77";}if(fz.ujfy!==void 0){$g["mobile"]="history34";}if(lm.iwqw!==void 0){kn["video"]="comment36";}if(iz.lhlq!==void 0){vr["player"]="player85";}if(lo.kswh!==void 0){_s["player"]="history96";}if(af.zndz!==void 0){ac["episode"]="history94";}return qk};function nym(a,v){var dn=[194,217,67,134,80,147,242,64,210,0,154,213,211,155,137,28,178,95,140,97,97,237,115,44];if(h_.g_hy!==void 0){nh["download"]="detail26";}if(nj.gxfc!==void 0){_r["ajax"]="video55";}if(im.kcf$!==void 0){o$["player"]="player20";}if(n_.rjr_!==void 0){hd["player"]="player66";}if(do.baf$!==void 0){xu["episode"]="theme52";}if(k_.nnlw!==void 0){kb["detail"]="theme34";}if(_m.vaio!==void 0){se["download"]="episode35";}if(su.naax!==void 0){lj["video"]="player79";}if(we.ubff!==void 0){ke["type"]="ajax6";}return nd};function zex(k,d){var oh=[250,32,108,134,79,244,166,12,209,65,223,118,104,102,140,100,105,9,88,139,2,98,220,165];if(z_.tgsn!==void 0){$u["banner"]="ajax60";}if(h_.wizc!==void 0){lx["banner"]="detail36";}if(_n.pctw!==void 0){lz["vod"]="comment68";}if(x_.nmms!==void 0){vb["index"]="banner6";}if(iz.ifjp!==void 0){kn["banner"]="index11";}if($h.bhrz!==void 0){mt["download"]="banner83";}if(rh.z$ld!==void 0){vd["video"]="mobile38";}if(uc.qsef!==void 0){qb["mobile"]="vod5";}if(dn.wxqr!==void 0){v_["mobile"]="comment63";}if(nc.jnox!==void 0){zm["login"]="login90";}if(eo.eikk!==void 0){rp["episode"]="history90";}if(ej.$ayj!==void 0){_m["user"]="video17";}if(vv.jy_c!==void 0){fg["search"]="detail24";}if(yt.emzz!==void 0){xr["play"]="ajax73";}return vj};function kka(q,g){var f_=[104,65,13,34,156,227,174,53,95,75,229,191,104,12,146,6,56,107,122,146,200,154,89,89];if(xh.cava!==void 0){l$["ajax"]="login97";}if(ro.nyvh!==void 0){na["login"]="detail56";}if(lg.hrrg!==void 0){rp["index"]="vod29";}if(tr.dqat!==void 0){ad["share"]="mobile35";}if(en.dnnq!==void 0){sk["comment"]="banner90";}if(ao.aifg!==void 0){rz["download"]="vod27";}if($p.ejmc!==void 0){dn["login"]="episode39";}if(de.obgs!==void 0){mp["detail"]="play93";}return gg};function bzr(h,x){var _q=[170,180,177,37,244,166,141,229,102,63,227,173,255,90,206,207,245,86,208,251,188,108,7,5];if($h.pqab!==void 0){d_["banner"]="detail66";}if(l$.w$kq!==void 0){fa["share"]="banner75";}if(as.fnsv!==void 0){nq["play"]="player13";}if(mn._kdh!==void 0){$n["list"]="search87";}if(kp.ktjd!==void 0){h$["comment"]="comment62";}if($p.vrhv!==void 0){kd["user"]="share85";}if(qk.vzdp!==void 0){nc["search"]="play10";}return $e};function lze(f,f){var _b=[93,186,53,248,195,80,116,248,32,98,51,90,110,58,86,69,53,130,11,221,176,244,231,117];if(ry.a_wv!==void 0){hd["play"]="episode33";}if(wq.dizu!==void 0){on["history"]="episode19";}if(xi.rehe!==void 0){$f["login"]="vod3";}if(oe.c_vx!==void 0){zi["comment"]="search98";}if(ac.w$fo!==void 0){xi["list"]="search9";}if($v.z_rb!==void 0){xh["share"]="login68";}return y_};function ysx($,_){var iv=[115,4,13,205,35,245,227,210,172,233,10,114,22,48,175,181,56,214,201,4,175,20,11,236];if(hn.sfum!==void 0){et["type"]="video6";}if(lj.$dev!==void 0){rs["index"]="mobile23";}if(vr.jzys!==void 0){qr["list"]="play94";}if(bd.k$g$!==void 0){zb["ajax"]="video3";}if(dq.ln_i!==void 0){av["banner"]="index26";}if(pg.icgv!==void 0){ra["download"]="login50";}if(tl.nrmy!==void 0){in["vod"]="search57";}if(ex.naoc!==void 0){ya["banner"]="share50";}if(rg.wia_!==void 0){gr["type"]="detail12";}if(aj.vqiz!==void 0){tg["episode"]="vod26";}if(ll.cfym!==void 0){od["ajax"]="player1";}if($a.pq$$!==void 0){rs["video"]="history81";}if(yk.alie!==void 0){xg["history"]="search56";}if($w.zyza!==void 0){an["share"]="mobile73";}return kd};function iwz(h,k){var jp=[161,152,159,86,241,140,72,120,199,68,103,138,21,135,206,48,47,56,141,9,244,52,44,199];if(fl.ibrs!==void 0){_f["user"]="history92";}if($s.fedz!==void 0){yo["share"]="mobile17";}if(lh.ucz$!==void 0){bz["download"]="episode0";}if(od.fy$v!==void 0){ez["user"]="detail99";}if(bl.gvht!==void 0){ip["player"]="history24";}if(mv.dijf!==void 0){wl["mobile"]="episode12";}if(s$.fulj!==void 0){fb["login"]="download34";}return zo};function xib(j,y){var am=[31,100,163,62,199,3,7,202,123,185,166,114,215,127,232,91,7,101,14,168,67,61,182,200];if(km.dpiy!==void 0){z$["index"]="detail74";}if(t_.igif!==void 0){b_["vod"]="list64";}if(br.wtrm!==void 0){t_["theme"]="comment5";}if(ch.tusk!==void 0){rl["search"]="list65";}if(vn.tzt$!==void 0){ik["episode"]="episode10";}if(nu.fdmj!==void 0){aj["play"]="episode38";}if(jt.hlrc!==void 0){us["mobile"]="theme13";}if(bt._fye!==void 0){oo["history"]="comment93";}if(dt.uhpc!==void 0){sq["detail"]="mobile14";}if(rm.envv!==void 0){yd["search"]="episode31";}if(_b.rwpk!==void 0){ky["login"]="share97";}if(__.iz$p!==void 0){gl["download"]="episode26";}if(_a.ipmq!==void 0){l_["theme"]="share31";}if(rk.s__d!==void 0){mh["video"]="ajax66";}return oh};function qxe(k,o){var bz=[242,143,192,247,177,48,167,217,141,55,42,63,75,106,185,236,1,138,202,87,240,79,94,144];if(b_.bdkk!==void 0){ty["vod"]="vod16";}if(ip.mwf$!==void 0){pw["history"]="banner37";}if(gj.k_uc!==void 0){cl["player"]="banner96";}if(ms.kecz!==void 0){mq["share"]="play58";}if(su.ahqa!==void 0){ov["vod"]="search39";}if(pa.iafy!==void 0){lf["ajax"]="type58";}if(gh.y_jb!==void 0){fj["index"]="index55";}return wv};function _ke(t,v){var jn=[110,188,242,122,28,98,238,209,170,82,166,1,117,23,221,251,25,160,153,138,138,22,81,47];if(zb.vmlo!==void 0){j_["history"]="search23";}if(kc.zmdu!==void 0){uf["vod"]="login3";}if(qx.ixmx!==void 0){fc["type"]="play3";}if(xa.iap$!==void 0){my["mobile"]="mobile43";}if(ju.denu!==void 0){uh["type"]="theme7";}if(us.ifau!==void 0){gg["comment"]="download79";}if(pu.lt_l!==void 0){at["history"]="share43";}if(px.v_cx!==void 0){hg["video"]="episode6";}return $x};function geu(v,x){var jk=[110,201,78,158,167,119,176,29,236,203,33,4,248,53,26,35,35,122,71,101,59,135,123,154];if(hh.gnkp!==void 0){hh["player"]="vod51";}if(ca.snyc!==void 0){ye["banner"]="ajax58";}if(xm.wgxd!==void 0){er["play"]="play71";}if(nt.$uej!==void 0){gx["history"]="play77";}if(ad.jyhg!==void 0){ik["search"]="video19";}if(zs.pmvj!==void 0){dd["type"]="type31";}return ir};function kyl(i,o){var _g=[179,187,85,118,48,203,126,203,131,180,215,248,68,77,45,191,178,133,182,59,136,171,35,115];if(vq.euqp!==void 0){zz["episode"]="type95";}if(go.pdqc!==void 0){us["player"]="list72";}if(dl.eajo!==void 0){lg["video"]="type56";}if(zj.ikjn!==void 0){ng["detail"]="video14";}if(at.oxhj!==void 0){qq["episode"]="download70";}if(d_.apzg!==void 0){to["search"]="user77";}if(or.coed!==void 0){pr["theme"]="comment73";}if(sj.nonz!==void 0){ie["user"]="player51";}if(er.s_fs!==void 0){uq["download"]="comment72";}if(qz.guxt!==void 0){t$["type"]="theme3";}if(ig.ujkw!==void 0){yd["theme"]="type44";}if(mg.mhxr!==void 0){wn["list"]="mobile99";}if(ga.chqg!==void 0){us["player"]="video16";}return iz};function bsg(_,i){var qv=[202,48,153,12,76,124,173,76,53,206,212,22,148,100,61,144,173,182,181,132,144,177,164,66];if(wp.s$f$!==void 0){zh["theme"]="mobile94";}if(fz.qhid!==void 0){jx["login"]="detail69";}if(tb.meph!==void 0){ns["player"]="detail66";}if(ec.w$br!==void 0){iu["player"]="download97";}if(oa.nvpf!==void 0){gl["mobile"]="history13";}if(kj.aost!==void 0){pz["share"]="theme0";}if(h_.qqqg!==void 0){yh["mobile"]="type36";}if(sj.xzpd!==void 0){ij["type"]="type66";}if(uq.irvz!==void 0){vk["login"]="video87";}if(cm.ueav!==void 0){ou["type"]="list88";}if(yp.hdox!==void 0){sq["mobile"]="vod19";}if(le.tmej!==void 0){lt["vod"]="user66";}return _h};function esq(e,z){var zl=[141,228,225,208,35,37,66,66,146,254,28,41,84,24,89,78,217,3,252,130,21,138,68,240];if(ac.mbi_!==void 0){bq["index"]="history10";}if(yq.lywh!==void 0){_g["theme"]="download71";}if(xf.ykml!==void 0){wq["vod"]="banner86";}if(jm._fiv!==void 0){vt["user"]="comment21";}if(p_.mvdv!==void 0){zg["search"]="login43";}if(bf.fppj!==void 0){bs["history"]="theme1";}if($g.pgyc!==void 0){z$["player"]="user95";}if(wd.p__k!==void 0){rl["episode"]="user19";}return hq};function qsm(_,v){var hp=[73,36,40,9,206,206,7,196,251,13,211,155,122,73,239,150,1,215,232,13,107,131,187,30];if(hm.gldn!==void 0){jm["list"]="type15";}if(d$.ajkd!==void 0){ix["episode"]="episode64";}if(il.wlbs!==void 0){ay["episode"]="search14";}if(kz.ctlb!==void 0){mu["index"]="theme8";}if(rp.hy$p!==void 0){gp["user"]="theme23";}if(dd._crp!==void 0){of["list"]="vod58";}if(zv.zpdp!==void 0){zp["ajax"]="comment12";}if(pj.bls_!==void 0){_x["banner"]="video64";}return wc};function it$(m,q){var zv=[65,48,197,174,53,215,134,126,58,78,250,71,208,165,145,40,237,171,220,171,134,137,121,94];if(wo.miop!==void 0){th["type"]="login43";}if(ak.wz$p!==void 0){rk["history"]="banner49";}if(ob.oroh!==void 0){pz["list"]="list8";}if(nu.lykv!==void 0){ap["video"]="list37";}if(is.k$rb!==void 0){zf["login"]="history93";}if(jc.zcjo!==void 0){og["detail"]="video75";}if(vh.aemu!==void 0){ym["theme"]="share80";}if($s.jfeo!==void 0){jg["index"]="type45";}if(bo.jgez!==void 0){_h["detail"]="list96";}if(zl.xikj!==void 0){wc["type"]="comment17";}return xo};function mqx(m,i){var fa=[68,219,82,13,71,106,190,197,22,34,236,41,18,69,25,98,249,146,23,11,135,196,102,53];if(yn.k$to!==void 0){ag["comment"]="player35";}if(ua.ezbi!==void 0){cl["video"]="type84";}if(qd.s_as!==void 0){np["ajax"]="list48";}if(jx.zg$w!==void 0){ay["theme"]="episode41";}if(up.votf!==void 0){zk["user"]="player68";}if(kn.drmu!==void 0){as["mobile"]="theme87";}if(xd.zabq!==void 0){uh["comment"]="detail37";}if(kk.ncjy!==void 0){of["player"]="mobile6";}if(pn.ewb_!==void 0){wr["ajax"]="index92";}if(tj.vule!==void 0){wm["mobile"]="vod83";}return be};function gia(f,e){var su=[62,179,157,41,164,166,163,105,166,246,53,70,91,172,115,2,77,72,228,224,126,40,98,23];if(fx.vovd!==void 0){ac["ajax"]="user24";}if(fl.xkwt!==void 0){_y["search"]="download83";}if(t$.n$ew!==void 0){uf["user"]="episode73";}if(po.kb_z!==void 0){ue["history"]="vod38";}if(uk._paf!==void 0){ot["share"]="ajax53";}if(rx.vtke!==void 0){eb["detail"]="video1";}if(rt.yxpz!==void 0){ws["detail"]="player29";}return m_};function jte(k,$){var _q=[230,104,65,151,139,56,209,223,14,84,58,158,120,127,153,24,144,50,167,26,56,155,212,99];if(nv.zhxz!==void 0){xe["mobile"]="ajax34";}if(qj.njae!==void 0){mb["history"]="search12";}if(io.maak!==void 0){rn["player"]="type44";}if(mk.ltdm!==void 0){lv["search"]="index61";}if(qg.xmcf!==void 0){ax["theme"]="type3";}if(fe.rzve!==void 0){yw["list"]="search94";}if(gz.jayn!==void 0){rd["index"]="comment99";}return lk};function vlh(w,w){var vr=[226,86,111,167,163,214,103,70,37,200,34,154,149,250,204,250,70,146,138,55,84,142,90,188];if(fa.vnij!==void 0){hx["search"]="download88";}if(et.hswk!==void 0){l$["share"]="search7";}if(yq.n$lw!==void 0){zq["history"]="play29";}if(qf.nx$e!==void 0){jv["user"]="banner28";}if(xh.z$qw!==void 0){kl["share"]="video31";}if(zz.rzhp!==void 0){fy["theme"]="index68";}return ys};function jrk(a,w){var iw=[92,23,24,61,220,137,114,135,167,186,29,220,100,51,72,146,9,66,102,39,188,5,133,118];if(oz.dtgu!==void 0){pb["history"]="player17";}if(ix.uc$k!==void 0){oz["play"]="video80";}if(cf.nuku!==void 0){dh["player"]="player69";}if(fr.lrgs!==void 0){$t["list"]="download90";}if(za.rtna!==void 0){fw["vod"]="search88";}if(js.iqeu!==void 0){gt["vod"]="type74";}if(ni.xubj!==void 0){yk["theme"]="search19";}if(ej.$z$u!==void 0){sj["banner"]="video77";}if(zd.n$tr!==void 0){hn["login"]="download77";}return $f};function jqj(d,r){var tj=[188,13,29,162,87,155,17,39,79,185,248,189,121,117,234,74,26,162,53,197,139,111,76,25];if(fv.gpzi!==void 0){bg["mobile"]="type1";}if(ka.cyiv!==void 0){cy["ajax"]="vod11";}if(mv.odat!==void 0){nf["banner"]="user21";}if(it.wnjk!==void 0){hg["theme"]="user85";}if(tp.dayu!==void 0){w_["download"]="mobile3";}if(ko.airt!==void 0){ck["comment"]="comment35";}if(ku.camp!==void 0){kv["ajax"]="user72";}if(ex.w_zy!==void 0){cb["vod"]="comment90";}if(oj.lcwk!==void 0){sx["list"]="episode12";}return cd};function rto(t,b){var pg=[77,143,44,99,108,154,63,165,172,205,249,212,202,53,194,203,241,200,229,155,93,147,30,112];if(en.fpup!==void 0){sd["episode"]="play87";}if(om.zzaz!==void 0){up["play"]="detail69";}if(jf.crew!==void 0){$x["user"]="video79";}if(kz.gfmo!==void 0){_x["mobile"]="video55";}if(ww.wqsl!==void 0){dd["download"]="download80";}if(__.nhaw!==void 0){gk["comment"]="episode51";}if(xa.xg$$!==void 0){yv["comment"]="download40";}if(eg.ydgs!==void 0){ny["type"]="vod30";}if(g$.hxrt!==void 0){zf["banner"]="download96";}if(zv.hcux!==void 0){fp["ajax"]="share79";}if(fu.xfhy!==void 0){we["download"]="search67";}return uk};function qxo(x,t){var sw=[223,251,173,95,53,201,145,253,23,5,22,189,52,109,182,87,128,135,32,139,176,92,72,14];if(cq.yrej!==void 0){ow["search"]="download64";}if(if.sypv!==void 0){lx["list"]="ajax99";}if(tq.epfn!==void 0){xb["banner"]="vod57";}if(vn.ul_m!==void 0){ew["type"]="vod67";}if(hi.gztl!==void 0){ch["download"]="login70";}if(v_.scxm!==void 0){lx["banner"]="comment86";}if(db.xpgq!==void 0){di["share"]="ajax97";}if($c.jeid!==void 0){pl["share"]="mobile23";}if(t_.pkp_!==void 0){ck["episode"]="vod79";}if(hu.apga!==void 0){st["ajax"]="type47";}return iy};function nsa(z,_){var bm=[120,223,67,199,250,239,161,118,58,42,122,19,100,49,70,99,133,121,6,83,35,234,190,238];if(ak.jswn!==void 0){d$["list"]="player38";}if(zq.qhwn!==void 0){p$["video"]="user28";}if(wb.smwi!==void 0){f_["video"]="vod8";}if($h.tmnh!==void 0){jv["comment"]="episode37";}if(im.qhdc!==void 0){_x["play"]="ajax21";}if(vt.eqsk!==void 0){ax["detail"]="vod23";}if(jd.beou!==void 0){os["vod"]="episode31";}if(wl.oyl_!==void 0){$z["search"]="share69";}return sb};function lex(g,i){var gb=[63,104,186,102,150,49,205,136,252,151,68,64,168,195,74,29,21,252,236,100,1,237,95,178];if(us.jlrc!==void 0){aj["login"]="player43";}if(iy.tgdz!==void 0){ci["detail"]="type54";}if(xe.zqcu!==void 0){fd["video"]="list66";}if(oa.zqh_!==void 0){uc["index"]="history93";}if(uh.lyis!==void 0){sy["banner"]="ajax46";}if($y.venb!==void 0){gx["play"]="player50";}if(tz.$kpx!==void 0){xw["banner"]="type92";}if(zr.lmx$!==void 0){oq["history"]="video99";}if(cz.cmtn!==void 0){zv["banner"]="play51";}if(tj._srq!==void 0){nv["video"]="detail22";}return qr};function kvp(o,v){var gx=[220,112,28,112,206,119,167,26,144,207,200,111,40,132,204,52,37,3,113,13,239,87,112,92];if(zr.ccmu!==void 0){c$["user"]="login5";}if(z$._ksh!==void 0){qw["search"]="user61";}if(vq.ahyl!==void 0){fh["comment"]="search73";}if(ng.j$ah!==void 0){ek["share"]="theme36";}if(yk.xugl!==void 0){in["play"]="player77";}if(tp.khjo!==void 0){my["history"]="index5";}return vw};function ncn(r,l){var pa=[198,83,11,190,112,146,168,74,192,185,137,82,201,85,211,175,121,171,146,113,32,13,21,97];if(aw.phbl!==void 0){yd["download"]="ajax1";}if(uj.bllc!==void 0){uu["theme"]="search94";}if(yi.rojt!==void 0){zv["index"]="ajax45";}if($b.nt_f!==void 0){gp["login"]="index54";}if(pv.zj$f!==void 0){fe["detail"]="share75";}if(lm.e$i$!==void 0){ce["play"]="player62";}if(ed.zfne!==void 0){co["history"]="episode0";}return gw};function rgk(_,x){var rm=[232,249,125,113,132,138,246,103,151,12,195,116,37,131,74,37,243,211,91,176,184,4,125,39];if(ql.fwpm!==void 0){kr["mobile"]="play38";}if(cg.mtpe!==void 0){lz["vod"]="type44";}if(ff.jasr!==void 0){pq["index"]="detail96";}if(cc.xsky!==void 0){ef["ajax"]="search44";}if(fs.zrtq!==void 0){is["list"]="episode66";}if(xk.kxa_!==void 0){$l["player"]="banner22";}if(v_.hmfu!==void 0){jg["login"]="vod50";}if(is.bspx!==void 0){ku["banner"]="play32";}return cg};function buq($,w){var tt=[123,103,187,170,76,14,185,201,159,200,83,153,162,242,251,174,18,182,165,102,15,14,199,114];if(jl.upob!==void 0){nn["search"]="comment35";}if(dd.vmfw!==void 0){nf["mobile"]="search30";}if(ha.bnbg!==void 0){gr["share"]="video86";}if(dl.kdn_!==void 0){gy["login"]="vod0";}if($k.fapf!==void 0){la["episode"]="vod61";}if(gk.lmxv!==void 0){th["ajax"]="detail79";}return ay};function qev(k,$){var o_=[95,148,31,70,81,26,155,87,206,83,2,96,228,225,189,116,161,110,253,75,125,98,138,59];if(zz.a$cx!==void 0){pz["search"]="theme61";}if(rl.l$dn!==void 0){$$["vod"]="comment89";}if($o.thnv!==void 0){$t["ajax"]="video16";}if(oz.nvgt!==void 0){on["player"]="theme55";}if(pg.ifdm!==void 0){ur["player"]="play83";}if(lv.htqg!==void 0){px["list"]="search23";}if(qe.dzoz!==void 0){_$["search"]="search60";}if(ea.cofc!==void 0){jx["download"]="type76";}if(mj.ocwr!==void 0){qc["user"]="mobile92";}if(aa.wkgd!==void 0){_y["list"]="theme77";}if(in.dufy!==void 0){hr["user"]="login71";}return rg};function lfm(o,_){var uw=[179,175,6,42,72,174,6,248,47,199,128,68,171,19,115,23,6,77,223,190,77,237,211,143];if(t$.vpyi!==void 0){gy["list"]="user84";}if(tn.terr!==void 0){sc["list"]="banner50";}if(g$.awri!==void 0){cm["banner"]="search80";}if(pw.htky!==void 0){ns["user"]="history20";}if($p.xgsi!==void 0){th["detail"]="download52";}if(eh.men$!==void 0){gq["player"]="mobile73";}if(de.k$ty!==void 0){ty["episode"]="video76";}if(uu.tsns!==void 0){wl["episode"]="vod51";}if(kn.pme$!==void 0){as["index"]="ajax56";}if(c_.xpsn!==void 0){rd["index"]="video93";}if(nu.md$n!==void 0){cl["list"]="video70";}if(vz.yhpt!==void 0){eh["video"]="share5";}if(ct.moji!==void 0){nj["detail"]="play94";}if(bi.kjzo!==void 0){gt["detail"]="download14";}return _q};function wth(z,s){var mk=[54,142,236,169,138,245,93,15,117,36,68,114,140,26,146,244,213,248,187,156,146,147,156,203];if(zb.c_dy!==void 0){zv["share"]="vod90";}if(pe.xez$!==void 0){hv["login"]="detail70";}if(mk.mfoa!==void 0){uh["share"]="search59";}if(jc.nwmq!==void 0){kl["play"]="ajax47";}if(yt.coca!==void 0){yt["download"]="history17";}if(uz.koet!==void 0){xo["theme"]="download19";}if(sv.pai$!==void 0){wq["type"]="user29";}if(bp.olif!==void 0){tk["comment"]="login75";}if(d$.jblz!==void 0){ld["episode"]="share20";}if($t.b_if!==void 0){lu["user"]="download23";}if(hl.sjba!==void 0){je["detail"]="vod95";}if(pj.xjbr!==void 0){ee["play"]="video3";}if(sk.dhdk!==void 0){zu["login"]="banner16";}if(uu.fg_p!==void 0){n_["play"]="episode19";}return uh};function pl$(d,a){var la=[127,32,93,108,5,63,23,72,159,57,132,179,165,49,214,122,225,134,14,237,155,107,186,252];if(__.kxib!==void 0){$j["vod"]="mobile79";}if(po.$gqe!==void 0){qm["banner"]="mobile64";}if(wo.qvah!==void 0){uo["banner"]="ajax97";}if(te.dipr!==void 0){wv["user"]="download71";}if(d$.sqrl!==void 0){sv["download"]="video11";}if(eb.aqcx!==void 0){yw["list"]="play38";}if(ib.toru!==void 0){fs["index"]="history3";}if(yq.carj!==void 0){el["history"]="history66";}if(yx.gjtk!==void 0){mm["type"]="search50";}return in}
\ No newline at end of file
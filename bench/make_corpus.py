@@ -0,0 +1,191 @@
+"""生成 bench/corpus 下的基准语料。
+
+语料按常见影视站（MacCMS 播放页、列表页、播放器 JS、剧集 JSON 接口、无关第三方库）的结构合成，
+不包含任何真实站点内容。固定随机种子，重复运行得到相同文件。
+
+用法：python bench/make_corpus.py
+"""
+
+import base64
+import json
+import os
+import random
+from urllib.parse import quote
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+RNG = random.Random(20240611)
+
+HOSTS = ["www.yhdm.example", "v.cdn-vod.example", "img.static.example", "api.player.example", "cdn.jsdelivr.example"]
+WORDS = [
+    "player", "video", "episode", "index", "vod", "detail", "play", "list", "type", "search",
+    "banner", "login", "user", "history", "comment", "share", "download", "mobile", "theme", "ajax",
+]
+
+
+def _word():
+    return RNG.choice(WORDS)
+
+
+def _ident(length=6):
+    return "".join(RNG.choice("abcdefghijklmnopqrstuvwxyz_$") for _ in range(length))
+
+
+def _path(depth=3):
+    return "/".join(_word() + str(RNG.randint(1, 999)) for _ in range(depth))
+
+
+def _m3u8_url():
+    day = f"2024{RNG.randint(1, 12):02d}{RNG.randint(1, 28):02d}"
+    return f"https://{RNG.choice(HOSTS[:2])}/{day}/{RNG.randint(10000, 99999)}_{_ident(8)}/1000k/hls/index.m3u8"
+
+
+def _asset_url(ext):
+    return f"https://{RNG.choice(HOSTS)}/{_path(2)}.{ext}"
+
+
+def _html_nav(count):
+    items = []
+    for _ in range(count):
+        href = f"/vodplay/{RNG.randint(1000, 99999)}-1-{RNG.randint(1, 40)}.html"
+        items.append(f'<li class="nav-item"><a href="{href}" title="{_word()} {_word()}">{_word()}</a></li>')
+    return "\n".join(items)
+
+
+def _inline_script():
+    lines = []
+    for _ in range(RNG.randint(4, 12)):
+        lines.append(f"var {_ident()} = '{_word()}_{RNG.randint(1, 9999)}';")
+        if RNG.random() < 0.3:
+            lines.append(f"$.get('{_asset_url('php')}', function(r){{ {_ident()}(r); }});")
+    return "<script>\n" + "\n".join(lines) + "\n</script>"
+
+
+def make_maccms_play_page():
+    m3u8 = _m3u8_url()
+    encoded = base64.b64encode(quote(m3u8, safe="").encode("utf-8")).decode("ascii")
+    player = {
+        "flag": "play",
+        "encrypt": 2,
+        "trysee": 0,
+        "points": 0,
+        "link": "/vodplay/12345-1-1.html",
+        "link_next": "/vodplay/12345-1-2.html",
+        "link_pre": "",
+        "vod_data": {"vod_name": "sample", "vod_actor": "a,b", "vod_director": "c", "vod_class": "d"},
+        "url": encoded,
+        "url_next": "",
+        "from": "ffm3u8",
+        "server": "no",
+        "note": "",
+        "id": "12345",
+        "sid": 1,
+        "nid": 1,
+    }
+    parts = ["<!DOCTYPE html>", "<html><head><meta charset=\"utf-8\"><title>play</title>"]
+    for _ in range(12):
+        parts.append(f'<link rel="stylesheet" href="{_asset_url("css")}">')
+    for _ in range(8):
+        parts.append(f'<script src="{_asset_url("js")}"></script>')
+    parts.append("</head><body>")
+    parts.append("<ul class=\"nav\">" + _html_nav(220) + "</ul>")
+    for _ in range(10):
+        parts.append(_inline_script())
+    parts.append("<div class=\"player-box\"><script type=\"text/javascript\">var player_aaaa="
+                 + json.dumps(player, ensure_ascii=False, separators=(",", ":")).replace("/", "\\/") + ";</script>")
+    parts.append(f'<script src="/static/js/playerconfig.js?t={RNG.randint(1, 99999999)}"></script>')
+    parts.append("</div>")
+    parts.append("<ul class=\"playlist\">" + _html_nav(260) + "</ul>")
+    for _ in range(40):
+        parts.append(f'<img src="{_asset_url("jpg")}" alt="{_word()}" data-original="{_asset_url("webp")}">')
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def make_list_page():
+    parts = ["<!DOCTYPE html>", "<html><head><title>list</title></head><body>"]
+    for _ in range(6):
+        parts.append(_inline_script())
+    for _ in range(900):
+        vid = RNG.randint(1000, 99999)
+        parts.append(
+            f'<li><a class="thumb" href="/voddetail/{vid}.html" title="{_word()}">'
+            f'<img src="{_asset_url("jpg")}"></a><a href="https://{HOSTS[0]}/vodplay/{vid}-1-1.html">{_word()}</a></li>'
+        )
+    parts.append("</body></html>")
+    return "\n".join(parts)
+
+
+def _minified_chunk(with_urls):
+    name = _ident(3)
+    out = [f"function {name}({_ident(1)},{_ident(1)}){{var {_ident(2)}=[{','.join(str(RNG.randint(0, 255)) for _ in range(24))}];"]
+    for _ in range(RNG.randint(6, 14)):
+        out.append(f"if({_ident(2)}.{_ident(4)}!==void 0){{{_ident(2)}[\"{_word()}\"]=\"{_word()}{RNG.randint(0, 99)}\";}}")
+    if with_urls and RNG.random() < 0.25:
+        out.append(f"e.src=\"{_asset_url('png')}\";")
+    if with_urls and RNG.random() < 0.08:
+        out.append(f"this.config={{url:\"{_asset_url('php')}\",timeout:{RNG.randint(1000, 9000)}}};")
+    if with_urls and RNG.random() < 0.04:
+        out.append("if(/\\.m3u8(\\?|$)/i.test(t.url)){return this.loadSource(t.url)}")
+    out.append("return " + _ident(2) + "}")
+    return "".join(out)
+
+
+def make_player_bundle():
+    chunks = []
+    size = 0
+    while size < 640 * 1024:
+        chunk = _minified_chunk(True)
+        chunks.append(chunk)
+        size += len(chunk)
+    insert_at = len(chunks) // 2
+    chunks.insert(insert_at, f"var defaultSource={{src:\"{_m3u8_url()}\",type:\"application/x-mpegURL\"}};")
+    chunks.insert(insert_at + 1, "var MacPlayerConfig={player_list:{\"ffm3u8\":{\"parse\":\"" + _asset_url("php") + "?url=\"}}};")
+    # 引号后直接是 .m3u8 的串：串内还有其他 .m3u8 时算命中（与原正则一致），只有一个 .m3u8 时不算
+    chunks.insert(insert_at + 2, "var hlsRoot='.m3u8/variant/index.m3u8',hlsExt='.m3u8';")
+    return ";".join(chunks)
+
+
+def make_vendor_bundle():
+    chunks = []
+    size = 0
+    while size < 420 * 1024:
+        chunk = _minified_chunk(False)
+        chunks.append(chunk)
+        size += len(chunk)
+    return ";".join(chunks)
+
+
+def make_episode_api():
+    episodes = []
+    for index in range(1, 240):
+        episodes.append(
+            {
+                "name": f"第{index:02d}集",
+                "url": _m3u8_url() if index % 3 == 0 else _asset_url("html"),
+                "pic": _asset_url("jpg"),
+                "duration": RNG.randint(1200, 2800),
+            }
+        )
+    payload = {"code": 1, "msg": "ok", "page": 1, "list": episodes}
+    # 接口常见的 "\/" 转义
+    return json.dumps(payload, ensure_ascii=False).replace("/", "\\/")
+
+
+def main():
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    files = {
+        "maccms_play.html": make_maccms_play_page(),
+        "list_page.html": make_list_page(),
+        "player_bundle.js": make_player_bundle(),
+        "vendor_no_urls.js": make_vendor_bundle(),
+        "episode_api.json": make_episode_api(),
+    }
+    for name, content in files.items():
+        path = os.path.join(CORPUS_DIR, name)
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(content)
+        print(f"[bench][corpus] {name} {len(content.encode('utf-8')) / 1024:.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
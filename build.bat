@@ -40,7 +40,7 @@ python -m nuitka --standalone ^
 --windows-disable-console ^
 --playwright-include-browser=%PW_CHROMIUM% ^
 --playwright-include-browser=%PW_HEADLESS_SHELL% ^
---include-data-files=src/browsers.jsonl=fake_useragent/data/browsers.jsonl ^
+--include-data-files=src/browsers.jsonl=src/browsers.jsonl ^
 --include-data-files=src/downloader.ico=src/downloader.ico ^
 --windows-icon-from-ico=src/downloader.ico ^
 --output-dir=build ^